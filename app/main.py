@@ -3,18 +3,22 @@
 import asyncio
 import base64
 import json
+import logging
+import os
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, Optional
 
 from dotenv import load_dotenv
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import FileResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi import FastAPI, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import PlainTextResponse
 from google.adk.agents.live_request_queue import LiveRequestQueue
 from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.events import Event
 from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
 from google.genai import types
 
 # Suppress noisy warnings
@@ -25,22 +29,146 @@ warnings.filterwarnings("ignore", category=UserWarning, module="pydantic")
 load_dotenv(Path(__file__).parent / ".env")
 
 from my_agent.agent import image_agent, voice_agent  # noqa: E402
+from session_store.bounded import BoundedSessionService  # noqa: E402
+from session_store.sqlite import SqliteBackedSessionService  # noqa: E402
+from streaming import metrics  # noqa: E402
+from streaming.background import SessionTaskGroup  # noqa: E402
+from streaming.downstream import (  # noqa: E402
+    FIELDS_FULL,
+    DownstreamProfile,
+    PartialCoalescer,
+)
+from streaming.frames import (  # noqa: E402
+    FRAME_KIND_AUDIO,
+    FRAME_KIND_IMAGE,
+    BinaryAudioEncoder,
+    decode_frame,
+    event_has_audio,
+)
+from streaming.images import FramePreprocessor, ImagePreprocessConfig  # noqa: E402
+from streaming.ingest import AudioIngest, IngestConfig  # noqa: E402
+from streaming.logs import LogSampler, configure_logging, sample_every  # noqa: E402
+from streaming.resumption import ResumptionStore, resumption_handle  # noqa: E402
+from web.static import EntryFile, PrecompressedStaticFiles  # noqa: E402
 
 APP_NAME = "bidi-workshop"
 
+# ログはキュー経由で別スレッドから出力する (LOG_LEVEL / LOG_SAMPLE_EVERY で制御)
+configure_logging()
+logger = logging.getLogger(APP_NAME)
+event_log_sampler = LogSampler(sample_every())
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    yield
+    # SQLiteモードでは未書き込みのセッションを書き出してから終了する
+    if isinstance(session_service, SqliteBackedSessionService):
+        await session_service.close()
+
+
 # FastAPIインスタンス化
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 # 静的アセットの設定
+# ビルド時に生成した .br/.gz を優先して返す。ハッシュ付きの assets/ は immutable、それ以外はETagで再検証
 static_dir = Path(__file__).parent / "static"
-app.mount("/static", StaticFiles(directory=static_dir), name="static")
-
-# メモリセッション用の機能を設定
-session_service = InMemorySessionService()
+app.mount("/static", PrecompressedStaticFiles(directory=static_dir), name="static")
+# 小さなエントリファイルはメモリに保持する (更新されたら読み直す)
+index_html = EntryFile(static_dir / "index.html")
+manifest_file = EntryFile(
+    static_dir / "manifest.webmanifest", media_type="application/manifest+json"
+)
+service_worker_file = EntryFile(
+    static_dir / "service-worker.js",
+    media_type="application/javascript",
+    headers={"Service-Worker-Allowed": "/"},
+)
+
+# セッション管理 (SESSION_* 環境変数で変更可)
+# memory: アイドルセッションをTTL/メモリ上限で破棄 / sqlite: SQLiteに永続化し、直近のセッションのみメモリに保持
+SESSION_STORE = os.getenv("SESSION_STORE", "memory")
+SESSION_TTL_SECONDS = float(os.getenv("SESSION_TTL_SECONDS", "1800"))
+SESSION_MAX_BYTES = int(os.getenv("SESSION_MAX_BYTES", str(256 * 1024 * 1024)))
+if SESSION_STORE == "sqlite":
+    session_service = SqliteBackedSessionService(
+        os.getenv("SESSION_SQLITE_PATH", str(Path(__file__).parent / "sessions.db")),
+        ttl_seconds=SESSION_TTL_SECONDS,
+        max_bytes=SESSION_MAX_BYTES,
+        flush_interval=float(os.getenv("SESSION_FLUSH_INTERVAL_MS", "500")) / 1000,
+        batch_size=int(os.getenv("SESSION_FLUSH_BATCH", "200")),
+    )
+else:
+    session_service = BoundedSessionService(
+        ttl_seconds=SESSION_TTL_SECONDS, max_bytes=SESSION_MAX_BYTES
+    )
 IMAGE_PROMPT_PREFIXES = ("画像生成:", "画像生成：", "画像:", "画像：", "/image ", "image:")
+# `?audio=binary` で音声をバイナリフレーム、それ以外をJSONで受け取る
+AUDIO_MODE_JSON = "json"
+AUDIO_MODE_BINARY = "binary"
+# `?upload=framed` でバイナリ送信にヘッダを付け、音声とカメラ画像を同じ経路で送る
+UPLOAD_MODE_RAW = "raw"
+UPLOAD_MODE_FRAMED = "framed"
+# `?events=` で受け取るイベント種別、`?fields=lean` で送信フィールドを絞り、
+# `?partial_ms=` で途中経過の文字起こしをまとめて送る (既定値は DOWNSTREAM_PARTIAL_MS)
+DOWNSTREAM_PARTIAL_MS = int(os.getenv("DOWNSTREAM_PARTIAL_MS", "0"))
+# 音声入力の結合フレーム長・バッファ上限 (AUDIO_INGEST_* 環境変数で変更可)
+INGEST_CONFIG = IngestConfig.from_env()
+# カメラ画像の縮小・再エンコード・フレームレート制限 (CAMERA_* 環境変数で変更可)
+CAMERA_CONFIG = ImagePreprocessConfig.from_env()
+# 画像生成はプロセス共通のスレッドプールで実行し、セッションごとの同時実行数も制限する
+IMAGE_MAX_WORKERS = int(os.getenv("IMAGE_MAX_WORKERS", "4"))
+IMAGE_MAX_PER_SESSION = int(os.getenv("IMAGE_MAX_PER_SESSION", "2"))
+image_executor = ThreadPoolExecutor(
+    max_workers=IMAGE_MAX_WORKERS, thread_name_prefix="image-gen"
+)
+
+# 切断後も猶予期間中はLiveセッションの再開ハンドルを保持し、再接続時に再開する
+RESUMPTION_ENABLED = os.getenv("RESUMPTION_ENABLED", "true").lower() == "true"
+RESUMPTION_GRACE_SECONDS = float(os.getenv("RESUMPTION_GRACE_SECONDS", "120"))
+# transparent な再開は Vertex AI バックエンドのみ対応
+RESUMPTION_TRANSPARENT = os.getenv("GOOGLE_GENAI_USE_VERTEXAI", "").upper() in ("TRUE", "1")
+resumption_store = ResumptionStore(RESUMPTION_GRACE_SECONDS)
 
 # Runnerインスタンスの初期化
 runner = Runner(app_name=APP_NAME, agent=voice_agent, session_service=session_service)
 
+# 接続中セッションの音声入力 (キュー深さのメトリクス算出用)
+active_ingests: set[AudioIngest] = set()
+metrics.QUEUE_DEPTH.set_function(
+    lambda: sum(ingest.queue_depth for ingest in active_ingests)
+)
+metrics.QUEUE_DEPTH_MAX.set_function(
+    lambda: max((ingest.queue_depth for ingest in active_ingests), default=0)
+)
+metrics.STORED_SESSIONS.set_function(lambda: session_service.session_count)
+metrics.STORED_SESSION_BYTES.set_function(lambda: session_service.total_bytes)
+metrics.SESSION_EVICTIONS.set_function(lambda: session_service.evictions)
+metrics.RESUMPTION_HANDLES.set_function(lambda: len(resumption_store))
+if image_agent.cache is not None:
+    image_cache = image_agent.cache
+    metrics.IMAGE_CACHE_HITS.set_function(lambda: image_cache.hits)
+    metrics.IMAGE_CACHE_DISK_HITS.set_function(lambda: image_cache.disk_hits)
+    metrics.IMAGE_CACHE_MISSES.set_function(lambda: image_cache.misses)
+    metrics.IMAGE_CACHE_SHARED.set_function(lambda: image_cache.shared)
+    metrics.IMAGE_CACHE_BYTES.set_function(lambda: image_cache.size)
+    metrics.IMAGE_CACHE_DISK_BYTES.set_function(lambda: image_cache.disk_size)
+
+
+def build_run_config(resume_handle: Optional[str]) -> RunConfig:
+    session_resumption = None
+    if RESUMPTION_ENABLED:
+        session_resumption = types.SessionResumptionConfig(
+            handle=resume_handle,
+            transparent=True if RESUMPTION_TRANSPARENT else None,
+        )
+    return RunConfig(
+        streaming_mode=StreamingMode.BIDI,
+        response_modalities=["AUDIO"],
+        input_audio_transcription=types.AudioTranscriptionConfig(),
+        output_audio_transcription=types.AudioTranscriptionConfig(),
+        session_resumption=session_resumption,
+    )
+
 
 def extract_image_prompt(text: str) -> Optional[str]:
     stripped = text.strip()
@@ -55,7 +183,9 @@ def extract_image_prompt(text: str) -> Optional[str]:
 
 
 async def build_image_event(prompt: str) -> dict[str, Any]:
-    base64_data, mime_type = await asyncio.to_thread(image_agent.generate_image, prompt)
+    started = time.perf_counter()
+    base64_data, mime_type = await image_agent.generate_image(prompt, image_executor)
+    metrics.IMAGE_GENERATION.observe(time.perf_counter() - started)
     return {
         "author": "image_agent",
         "turnComplete": True,
@@ -82,25 +212,23 @@ def build_image_error_event(message: str) -> dict[str, Any]:
 
 # デフォルトのエンドポイント
 @app.get("/")
-async def root():
-    return FileResponse(Path(__file__).parent / "static" / "index.html")
+async def root(request: Request):
+    return index_html.response(request)
 
 
 @app.get("/manifest.webmanifest")
-async def manifest():
-    return FileResponse(
-        Path(__file__).parent / "static" / "manifest.webmanifest",
-        media_type="application/manifest+json",
-    )
+async def manifest(request: Request):
+    return manifest_file.response(request)
 
 
 @app.get("/service-worker.js")
-async def service_worker():
-    return FileResponse(
-        Path(__file__).parent / "static" / "service-worker.js",
-        media_type="application/javascript",
-        headers={"Service-Worker-Allowed": "/"},
-    )
+async def service_worker(request: Request):
+    return service_worker_file.response(request)
+
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    return PlainTextResponse(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
 
 # WebSocket用のAPI
 @app.websocket("/ws/{user_id}/{session_id}")
@@ -108,15 +236,20 @@ async def websocket_endpoint(
     websocket: WebSocket,
     user_id: str,
     session_id: str,
+    audio: str = Query(AUDIO_MODE_JSON),
+    upload: str = Query(UPLOAD_MODE_RAW),
+    events: Optional[str] = Query(None),
+    fields: str = Query(FIELDS_FULL),
+    partial_ms: int = Query(DOWNSTREAM_PARTIAL_MS),
 ) -> None:
     await websocket.accept()
-    print("Connection open")
+    logger.info("Connection open: user=%s session=%s", user_id, session_id)
+    metrics.SESSIONS.inc()
+    metrics.ACTIVE_SESSIONS.inc()
 
-    run_config = RunConfig(
-        streaming_mode=StreamingMode.BIDI,
-        response_modalities=["AUDIO"],
-        input_audio_transcription=types.AudioTranscriptionConfig(),
-        output_audio_transcription=types.AudioTranscriptionConfig(),
+    connected_at = time.monotonic()
+    resume_handle = (
+        resumption_store.handle_for(user_id, session_id) if RESUMPTION_ENABLED else None
     )
 
     session = await session_service.get_session(
@@ -126,8 +259,45 @@ async def websocket_endpoint(
         await session_service.create_session(
             app_name=APP_NAME, user_id=user_id, session_id=session_id
         )
+    session_service.acquire(app_name=APP_NAME, user_id=user_id, session_id=session_id)
 
     live_request_queue = LiveRequestQueue()
+    audio_encoder = BinaryAudioEncoder() if audio == AUDIO_MODE_BINARY else None
+    downstream_profile = DownstreamProfile.from_query(events, fields, partial_ms)
+    partial_coalescer = PartialCoalescer(downstream_profile.partial_window_ms)
+    audio_ingest = AudioIngest(live_request_queue, INGEST_CONFIG)
+    image_jobs = SessionTaskGroup("IMAGE", IMAGE_MAX_PER_SESSION)
+    # カメラ画像の前処理は受信ループの外で行い、処理中に届いたフレームは捨てる
+    camera_jobs = SessionTaskGroup("CAMERA", 1)
+    camera_frames = FramePreprocessor(CAMERA_CONFIG)
+    turn_timer = metrics.TurnTimer()
+    active_ingests.add(audio_ingest)
+
+    async def image_job(prompt: str) -> None:
+        """Generates an image in the background and pushes the result."""
+        try:
+            image_event = await build_image_event(prompt)
+        except Exception as error:
+            metrics.ERRORS.labels("image").inc()
+            error_message = str(error) or "unknown error"
+            image_event = build_image_error_event(error_message)
+        await send_json(image_event)
+
+    async def send_json(payload: dict[str, Any]) -> None:
+        text = json.dumps(payload)
+        metrics.DOWNSTREAM_JSON_MESSAGES.inc()
+        metrics.DOWNSTREAM_JSON_BYTES.inc(len(text))
+        await websocket.send_text(text)
+
+    async def send_camera_frame(image_data: bytes, mime_type: str) -> None:
+        """Preprocesses a camera frame and sends it unless it is dropped."""
+        processed = await camera_frames.process(image_data, mime_type)
+        if processed is None:
+            return
+        frame_data, frame_mime_type = processed
+        image_blob = types.Blob(mime_type=frame_mime_type, data=frame_data)
+        audio_ingest.flush()
+        live_request_queue.send_realtime(image_blob)
 
     async def upstream_task() -> None:
         """Receives messages from WebSocket and sends to LiveRequestQueue."""
@@ -141,65 +311,132 @@ async def websocket_endpoint(
                 # Handle text messages
                 if json_message.get("type") == "text":
                     user_text = json_message["text"]
-                    print(f"[UPSTREAM] Text: {user_text}")
+                    metrics.UPSTREAM_TEXT_MESSAGES.inc()
+                    metrics.UPSTREAM_TEXT_BYTES.inc(len(message["text"]))
+                    logger.debug("[UPSTREAM] Text: %s", user_text)
 
                     image_prompt = extract_image_prompt(user_text)
                     if image_prompt:
-                        try:
-                            image_event = await build_image_event(image_prompt)
-                            await websocket.send_text(json.dumps(image_event))
-                        except Exception as error:
-                            error_message = str(error) or "unknown error"
-                            error_event = build_image_error_event(error_message)
-                            await websocket.send_text(json.dumps(error_event))
+                        if not image_jobs.start(image_job, image_prompt):
+                            busy_event = build_image_error_event(
+                                "too many image requests in progress"
+                            )
+                            await send_json(busy_event)
                         continue
 
                     content = types.Content(
                         parts=[types.Part(text=user_text)]
                     )
+                    audio_ingest.flush()
                     live_request_queue.send_content(content)
+                    turn_timer.user_input()
 
                 # Handle image messages
                 elif json_message.get("type") == "image":
-                    print("[UPSTREAM] Image received")
-
                     # Decode base64 image data
                     image_data = base64.b64decode(json_message["data"])
                     mime_type = json_message.get("mimeType", "image/jpeg")
-
-                    print(f"[UPSTREAM] Image: {len(image_data)} bytes, {mime_type}")
-
-                    # Create image blob and send
-                    image_blob = types.Blob(
-                        mime_type=mime_type,
-                        data=image_data
-                    )
-                    live_request_queue.send_realtime(image_blob)
-
-            # Handle binary messages (audio)
+                    metrics.UPSTREAM_IMAGE_MESSAGES.inc()
+                    metrics.UPSTREAM_IMAGE_BYTES.inc(len(image_data))
+                    if not camera_jobs.start(send_camera_frame, image_data, mime_type):
+                        camera_frames.drop_busy(image_data)
+
+            # Handle framed binary messages (audio or camera images)
+            elif "bytes" in message and upload == UPLOAD_MODE_FRAMED:
+                try:
+                    kind, mime_type, payload = decode_frame(message["bytes"])
+                except ValueError as error:
+                    metrics.ERRORS.labels("upstream").inc()
+                    logger.warning("[UPSTREAM] Invalid binary frame: %s", error)
+                    continue
+                if kind == FRAME_KIND_AUDIO:
+                    metrics.UPSTREAM_AUDIO_MESSAGES.inc()
+                    metrics.UPSTREAM_AUDIO_BYTES.inc(len(payload))
+                    await audio_ingest.push(payload)
+                elif kind == FRAME_KIND_IMAGE:
+                    metrics.UPSTREAM_IMAGE_MESSAGES.inc()
+                    metrics.UPSTREAM_IMAGE_BYTES.inc(len(payload))
+                    if not camera_jobs.start(send_camera_frame, payload, mime_type):
+                        camera_frames.drop_busy(payload)
+
+            # Handle binary messages (audio), coalesced into fixed-size frames
             elif "bytes" in message:
                 audio_data = message["bytes"]
-                print(f"[UPSTREAM] Audio chunk: {len(audio_data)} bytes")
-
-                audio_blob = types.Blob(
-                    mime_type="audio/pcm;rate=16000",
-                    data=audio_data
+                metrics.UPSTREAM_AUDIO_MESSAGES.inc()
+                metrics.UPSTREAM_AUDIO_BYTES.inc(len(audio_data))
+                await audio_ingest.push(audio_data)
+
+    async def send_event(event: Event) -> None:
+        if event.input_transcription is not None:
+            turn_timer.user_input()
+        if event_has_audio(event):
+            turn_timer.model_audio()
+        if event.turn_complete or event.interrupted:
+            turn_timer.end_turn()
+
+        if audio_encoder is not None:
+            frames, event = audio_encoder.split(event)
+            if "audio" in downstream_profile.kinds:
+                for frame in frames:
+                    metrics.DOWNSTREAM_BINARY_MESSAGES.inc()
+                    metrics.DOWNSTREAM_BINARY_BYTES.inc(len(frame))
+                    await websocket.send_bytes(frame)
+            if event is None:
+                return
+        event = downstream_profile.filter(event)
+        if event is None:
+            return
+        for ready in partial_coalescer.push(event):
+            await send_event_json(ready)
+
+    async def send_event_json(event: Event) -> None:
+        event_json = downstream_profile.encode(event)
+        if logger.isEnabledFor(logging.DEBUG) and event_log_sampler():
+            logger.debug("[DOWNSTREAM] Event: %.100s...", event_json)
+        metrics.DOWNSTREAM_JSON_MESSAGES.inc()
+        metrics.DOWNSTREAM_JSON_BYTES.inc(len(event_json))
+        await websocket.send_text(event_json)
+
+    live_started = False
+
+    async def forward_events(handle: Optional[str]) -> None:
+        """Runs run_live(), resuming from ``handle`` if given."""
+        nonlocal live_started
+        async for event in runner.run_live(
+            user_id=user_id,
+            session_id=session_id,
+            live_request_queue=live_request_queue,
+            run_config=build_run_config(handle),
+        ):
+            if not live_started:
+                live_started = True
+                metrics.LIVE_SESSION_START.labels("resumed" if handle else "cold").observe(
+                    time.monotonic() - connected_at
                 )
-                live_request_queue.send_realtime(audio_blob)
+                if handle:
+                    metrics.RESUMPTIONS_SUCCEEDED.inc()
+            new_handle = resumption_handle(event)
+            if new_handle and RESUMPTION_ENABLED:
+                resumption_store.update(user_id, session_id, new_handle)
+            await send_event(event)
 
     async def downstream_task() -> None:
         """Receives Events from run_live() and sends to WebSocket."""
-        print("[DOWNSTREAM] Starting run_live()")
+        logger.debug("[DOWNSTREAM] Starting run_live()")
         try:
-            async for event in runner.run_live(
-                user_id=user_id,
-                session_id=session_id,
-                live_request_queue=live_request_queue,
-                run_config=run_config,
-            ):
-                event_json = event.model_dump_json(exclude_none=True, by_alias=True)
-                print(f"[DOWNSTREAM] Event: {event_json[:100]}...")
-                await websocket.send_text(event_json)
+            try:
+                await forward_events(resume_handle)
+            except Exception as error:
+                if not resume_handle or live_started:
+                    raise
+                # The handle may have expired on the model side; start fresh.
+                metrics.RESUMPTIONS_FAILED.inc()
+                resumption_store.discard(user_id, session_id)
+                logger.warning("[DOWNSTREAM] Resumption failed, starting new session: %s", error)
+                await forward_events(None)
+            pending = partial_coalescer.flush()
+            if pending is not None:
+                await send_event_json(pending)
         except Exception as error:
             # Surface backend failures to the client and avoid noisy ASGI tracebacks.
             error_payload = json.dumps(
@@ -209,20 +446,50 @@ async def websocket_endpoint(
                     }
                 }
             )
-            print(f"[DOWNSTREAM] Fatal error: {error}")
+            metrics.ERRORS.labels("downstream").inc()
+            logger.error("[DOWNSTREAM] Fatal error: %s", error)
             try:
                 await websocket.send_text(error_payload)
             except Exception:
                 pass
+        finally:
+            # run_live() no longer drains the queue, so a paused push() would
+            # otherwise block upstream_task from ever seeing the disconnect.
+            audio_ingest.close()
 
-        print("[DOWNSTREAM] run_live() completed")
+        logger.debug("[DOWNSTREAM] run_live() completed")
 
+    downstream = asyncio.ensure_future(downstream_task())
     try:
-        await asyncio.gather(upstream_task(), downstream_task())
+        await asyncio.gather(
+            upstream_task(),
+            downstream,
+            audio_ingest.run_flusher(),
+            partial_coalescer.run_flusher(send_event_json),
+        )
     except (WebSocketDisconnect, RuntimeError):
-        print("Client disconnected")
+        logger.info("Client disconnected: user=%s session=%s", user_id, session_id)
     except Exception as error:
-        print(f"Session failed: {error}")
+        metrics.ERRORS.labels("session").inc()
+        logger.error("Session failed: %s", error)
     finally:
+        # gather() は残りのタスクを止めないため、run_live() を止めてからハンドルの期限を設定する
+        # (キャンセル後の downstream_task はハンドルを更新しない。待つのは後片付けの最後)
+        downstream.cancel()
+        resumption_store.disconnected(user_id, session_id)
+        session_service.release(app_name=APP_NAME, user_id=user_id, session_id=session_id)
+        active_ingests.discard(audio_ingest)
+        metrics.ACTIVE_SESSIONS.dec()
+        audio_ingest.close()
+        partial_coalescer.close()
         live_request_queue.close()
-        print("Session terminated")
+        await image_jobs.cancel_all()
+        await camera_jobs.cancel_all()
+        await asyncio.wait([downstream])
+        logger.info(
+            "Session terminated: user=%s session=%s ingest=%s camera=%s",
+            user_id,
+            session_id,
+            audio_ingest.stats(),
+            camera_frames.stats(),
+        )
@@ -1,29 +1,60 @@
 """Agent definition for the bidi-workshop."""
 
+import asyncio
 import base64
+import os
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Optional
 
 from google import genai
 from google.adk.agents import Agent
 from google.adk.tools import google_search
 from google.genai import types as genai_types
 
+from .image_cache import ImageCache, cache_key
+
 IMAGE_MODEL_ID = "imagen-3.0-generate-002"
 DEFAULT_IMAGE_MIME_TYPE = "image/png"
+IMAGE_CACHE_MAX_BYTES = int(os.getenv("IMAGE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+IMAGE_CACHE_DIR = os.getenv("IMAGE_CACHE_DIR")
+IMAGE_CACHE_DISK_MAX_BYTES = int(
+    os.getenv("IMAGE_CACHE_DISK_MAX_BYTES", str(256 * 1024 * 1024))
+)
 
 
 class ImageGenerationAgent:
-    def __init__(self, model_id: str) -> None:
+    def __init__(self, model_id: str, cache: Optional[ImageCache] = None) -> None:
         self._model_id = model_id
         self._client = genai.Client()
+        self._cache = cache
+        self._config = genai_types.GenerateImagesConfig(
+            number_of_images=1,
+            output_mime_type=DEFAULT_IMAGE_MIME_TYPE,
+        )
+        self._config_key = self._config.model_dump(mode="json", exclude_none=True)
+
+    @property
+    def cache(self) -> Optional[ImageCache]:
+        return self._cache
 
-    def generate_image(self, prompt: str) -> tuple[str, str]:
+    async def generate_image(
+        self, prompt: str, executor: Optional[Executor] = None
+    ) -> tuple[str, str]:
+        """Generates (or looks up) an image; the blocking API call runs in ``executor``."""
+        if self._cache is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, self._generate_uncached, prompt)
+        key = cache_key(prompt, self._model_id, self._config_key)
+        return await self._cache.get_or_create(
+            key, lambda: self._generate_uncached(prompt), executor
+        )
+
+    def _generate_uncached(self, prompt: str) -> tuple[str, str]:
         result = self._client.models.generate_images(
             model=self._model_id,
             prompt=prompt,
-            config=genai_types.GenerateImagesConfig(
-                number_of_images=1,
-                output_mime_type=DEFAULT_IMAGE_MIME_TYPE,
-            ),
+            config=self._config,
         )
         if not result.generated_images:
             raise ValueError("image generation failed")
@@ -46,6 +77,13 @@ voice_agent = Agent(
     tools=[google_search],
 )
 
-image_agent = ImageGenerationAgent(IMAGE_MODEL_ID)
+image_agent = ImageGenerationAgent(
+    IMAGE_MODEL_ID,
+    cache=ImageCache(
+        max_bytes=IMAGE_CACHE_MAX_BYTES,
+        directory=Path(IMAGE_CACHE_DIR) if IMAGE_CACHE_DIR else None,
+        max_disk_bytes=IMAGE_CACHE_DISK_MAX_BYTES,
+    ),
+)
 
 agent = voice_agent
@@ -0,0 +1,206 @@
+"""Prompt-keyed cache for generated images.
+
+Entries hold the already base64-encoded payload so a hit can be sent to the
+client as-is. The in-memory tier is an LRU bounded by bytes; an optional
+directory adds a disk tier, also LRU and bounded by bytes, that survives
+restarts. Concurrent requests for the same key share one upstream call
+(single-flight).
+
+Lookups and single-flight bookkeeping run on the event loop; only the
+blocking work (disk I/O and ``create``) goes to the executor, so duplicate
+requests wait on a shared asyncio task instead of holding worker threads.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+CachedImage = tuple[str, str]
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_prompt(prompt: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", prompt).split()).casefold()
+
+
+def cache_key(prompt: str, model_id: str, config: dict[str, Any]) -> str:
+    payload = json.dumps(
+        {"prompt": normalize_prompt(prompt), "model": model_id, "config": config},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ImageCache:
+    def __init__(
+        self,
+        max_bytes: int,
+        directory: Optional[Path] = None,
+        max_disk_bytes: int = 0,
+    ) -> None:
+        self._max_bytes = max_bytes
+        self._directory = directory
+        self._max_disk_bytes = max_disk_bytes
+        self._entries: OrderedDict[str, CachedImage] = OrderedDict()
+        self._size = 0
+        self._in_flight: dict[str, asyncio.Task] = {}
+        # The disk index is touched from executor threads.
+        self._disk_lock = threading.Lock()
+        self._disk_entries: OrderedDict[str, int] = OrderedDict()
+        self._disk_size = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.shared = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+        if directory is not None:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._scan_directory()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def disk_size(self) -> int:
+        return self._disk_size
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "diskEntries": len(self._disk_entries),
+            "diskBytes": self._disk_size,
+            "hits": self.hits,
+            "diskHits": self.disk_hits,
+            "misses": self.misses,
+            "shared": self.shared,
+            "evictions": self.evictions,
+            "diskEvictions": self.disk_evictions,
+        }
+
+    async def get_or_create(
+        self, key: str, create: Callable[[], CachedImage], executor: Optional[Executor] = None
+    ) -> CachedImage:
+        """Returns the cached image for ``key``, running ``create`` in ``executor`` on a miss."""
+        cached = self._entries.get(key)
+        if cached is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cached
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fill(key, create, executor))
+            # Keep the result retrieved even if every waiter was cancelled.
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            self._in_flight[key] = task
+        else:
+            self.shared += 1
+        # A waiter going away (e.g. its session closed) must not cancel the
+        # call the other waiters share.
+        return await asyncio.shield(task)
+
+    async def _fill(
+        self, key: str, create: Callable[[], CachedImage], executor: Optional[Executor]
+    ) -> CachedImage:
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(executor, self._load, key)
+            if result is not None:
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+                result = await loop.run_in_executor(executor, create)
+                await loop.run_in_executor(executor, self._store, key, result)
+            self._remember(key, result)
+            return result
+        finally:
+            self._in_flight.pop(key, None)
+
+    def _remember(self, key: str, value: CachedImage) -> None:
+        size = len(value[0])
+        if size > self._max_bytes:
+            return
+        self._entries[key] = value
+        self._size += size
+        while self._size > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted[0])
+            self.evictions += 1
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f"{key}.json"
+
+    def _scan_directory(self) -> None:
+        """Rebuilds the disk index, oldest first, and trims it to the budget."""
+        files = []
+        for path in self._directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, path.stem, stat.st_size))
+        for _, key, size in sorted(files):
+            self._disk_entries[key] = size
+            self._disk_size += size
+        with self._disk_lock:
+            self._trim_disk()
+
+    def _load(self, key: str) -> Optional[CachedImage]:
+        if self._directory is None:
+            return None
+        path = self._path(key)
+        try:
+            record = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        with self._disk_lock:
+            if key in self._disk_entries:
+                self._disk_entries.move_to_end(key)
+        try:
+            return record["data"], record["mimeType"]
+        except KeyError:
+            return None
+
+    def _store(self, key: str, value: CachedImage) -> None:
+        if self._directory is None:
+            return
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        payload = json.dumps({"data": value[0], "mimeType": value[1]})
+        if self._max_disk_bytes and len(payload) > self._max_disk_bytes:
+            return
+        try:
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as error:
+            logger.warning("Failed to write image cache entry: %s", error)
+            return
+        with self._disk_lock:
+            self._disk_size += len(payload) - self._disk_entries.pop(key, 0)
+            self._disk_entries[key] = len(payload)
+            self._trim_disk()
+
+    def _trim_disk(self) -> None:
+        if not self._max_disk_bytes:
+            return
+        while self._disk_size > self._max_disk_bytes and self._disk_entries:
+            key, size = self._disk_entries.popitem(last=False)
+            self._disk_size -= size
+            self.disk_evictions += 1
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
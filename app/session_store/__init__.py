@@ -0,0 +1 @@
+"""Session services for the bidi-workshop."""
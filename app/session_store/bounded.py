@@ -0,0 +1,173 @@
+"""In-memory session service with TTL and memory-budget eviction."""
+
+import logging
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Optional
+
+from google.adk.events import Event
+from google.adk.sessions import InMemorySessionService, Session
+from google.adk.sessions.base_session_service import GetSessionConfig
+
+from .compaction import compact_event, estimate_event_size
+
+logger = logging.getLogger(__name__)
+
+SessionKey = tuple[str, str, str]
+
+
+class BoundedSessionService(InMemorySessionService):
+    """``InMemorySessionService`` that forgets idle sessions.
+
+    Sessions idle for longer than ``ttl_seconds`` are evicted, and the least
+    recently used ones are evicted while the estimated size of all stored
+    sessions exceeds ``max_bytes``. Sessions with a connected client are
+    pinned with ``acquire``/``release`` and never evicted. Inline audio is
+    removed from events before they are kept in history.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_bytes: int,
+        compact_audio: bool = True,
+    ) -> None:
+        super().__init__()
+        self._ttl_seconds = ttl_seconds
+        self._max_bytes = max_bytes
+        self._compact_audio = compact_audio
+        self._sizes: dict[SessionKey, int] = {}
+        self._last_access: OrderedDict[SessionKey, float] = OrderedDict()
+        self._pins: Counter[SessionKey] = Counter()
+        self._total_bytes = 0
+        self.evictions = 0
+
+    @property
+    def session_count(self) -> int:
+        return len(self._sizes)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def acquire(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        """Pins a session while a client is connected to it."""
+        key = (app_name, user_id, session_id)
+        self._pins[key] += 1
+        self._touch(key)
+
+    def release(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        key = (app_name, user_id, session_id)
+        self._pins[key] -= 1
+        if self._pins[key] <= 0:
+            del self._pins[key]
+        self._touch(key)
+        self._evict()
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> Session:
+        session = await super().create_session(
+            app_name=app_name, user_id=user_id, state=state, session_id=session_id
+        )
+        key = (app_name, user_id, session.id)
+        self._resize(key, 0)
+        self._touch(key)
+        self._on_session_stored(key, self.sessions[app_name][user_id][session.id], None)
+        self._evict()
+        return session
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[Session]:
+        key = (app_name, user_id, session_id)
+        self._evict(keep=key)
+        session = await super().get_session(
+            app_name=app_name, user_id=user_id, session_id=session_id, config=config
+        )
+        if session is not None:
+            self._touch(key)
+        return session
+
+    async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        await super().delete_session(
+            app_name=app_name, user_id=user_id, session_id=session_id
+        )
+        self._forget((app_name, user_id, session_id))
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        event = await super().append_event(session=session, event=event)
+        if event.partial:
+            return event
+        key = (session.app_name, session.user_id, session.id)
+        stored = self.sessions.get(key[0], {}).get(key[1], {}).get(key[2])
+        if stored is None:
+            return event
+
+        kept = compact_event(event) if self._compact_audio else event
+        for history in (stored.events, session.events):
+            if history and history[-1] is event:
+                if kept is None:
+                    history.pop()
+                else:
+                    history[-1] = kept
+        if kept is not None:
+            self._resize(key, self._sizes.get(key, 0) + estimate_event_size(kept))
+        self._touch(key)
+        self._on_session_stored(key, stored, kept)
+        self._evict()
+        return event
+
+    def _touch(self, key: SessionKey) -> None:
+        if key in self._sizes:
+            self._last_access[key] = time.monotonic()
+            self._last_access.move_to_end(key)
+
+    def _resize(self, key: SessionKey, size: int) -> None:
+        self._total_bytes += size - self._sizes.get(key, 0)
+        self._sizes[key] = size
+
+    def _forget(self, key: SessionKey) -> None:
+        self._total_bytes -= self._sizes.pop(key, 0)
+        self._last_access.pop(key, None)
+
+    def _evict(self, keep: Optional[SessionKey] = None) -> None:
+        """Evicts expired and least recently used sessions; ``keep`` is spared like a pinned one."""
+        expires_before = time.monotonic() - self._ttl_seconds
+        for key, last_access in list(self._last_access.items()):
+            over_budget = self._total_bytes > self._max_bytes
+            if last_access >= expires_before and not over_budget:
+                break
+            if key not in self._pins and key != keep:
+                self._evict_session(key)
+
+    def _evict_session(self, key: SessionKey) -> None:
+        app_name, user_id, session_id = key
+        user_sessions = self.sessions.get(app_name, {}).get(user_id, {})
+        session = user_sessions.pop(session_id, None)
+        if not user_sessions:
+            self.sessions.get(app_name, {}).pop(user_id, None)
+        self._forget(key)
+        self.evictions += 1
+        if session is not None:
+            self._on_evicted(key, session)
+
+    def _on_session_stored(
+        self, key: SessionKey, session: Session, event: Optional[Event]
+    ) -> None:
+        """Hook called after a session is created or an event is kept."""
+
+    def _on_evicted(self, key: SessionKey, session: Session) -> None:
+        """Hook for subclasses that keep evicted sessions elsewhere."""
+        logger.debug("Evicted idle session %s", key)
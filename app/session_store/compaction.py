@@ -0,0 +1,37 @@
+"""Shrinking events before they are kept in session history."""
+
+from typing import Optional
+
+from google.adk.events import Event
+
+from streaming.frames import event_has_audio, event_has_metadata, strip_audio
+
+# Rough per-event overhead of the pydantic model and its envelope fields.
+EVENT_OVERHEAD_BYTES = 512
+
+
+def compact_event(event: Event) -> Optional[Event]:
+    """Drops inline audio from an event.
+
+    Returns the event unchanged when it has no audio, a stripped copy when
+    something else (text, transcription, turn signals) remains, and ``None``
+    when the event was only audio.
+    """
+    if not event_has_audio(event):
+        return event
+    stripped = strip_audio(event)
+    return stripped if event_has_metadata(stripped) else None
+
+
+def estimate_event_size(event: Event) -> int:
+    size = EVENT_OVERHEAD_BYTES
+    if event.content and event.content.parts:
+        for part in event.content.parts:
+            if part.text:
+                size += len(part.text)
+            if part.inline_data and part.inline_data.data:
+                size += len(part.inline_data.data)
+    for transcription in (event.input_transcription, event.output_transcription):
+        if transcription is not None and transcription.text:
+            size += len(transcription.text)
+    return size
@@ -0,0 +1,312 @@
+"""SQLite persistence behind ``BoundedSessionService``.
+
+Memory only holds recently used sessions; everything else lives in a local
+SQLite file and is loaded back on ``get_session``. Writes are buffered and
+committed in batches by a background task (every ``flush_interval`` seconds
+or once ``batch_size`` events are pending), so the streaming loop never
+waits on disk.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+from typing import Any, Optional
+
+from google.adk.errors.already_exists_error import AlreadyExistsError
+from google.adk.events import Event
+from google.adk.sessions import Session
+from google.adk.sessions.base_session_service import GetSessionConfig, ListSessionsResponse
+from google.adk.sessions.state import State
+
+from .bounded import BoundedSessionService, SessionKey
+from .compaction import estimate_event_size
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    state TEXT NOT NULL,
+    last_update_time REAL NOT NULL,
+    PRIMARY KEY (app_name, user_id, id)
+);
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    event_data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_by_session ON events (app_name, user_id, session_id, seq);
+CREATE TABLE IF NOT EXISTS app_states (
+    app_name TEXT PRIMARY KEY,
+    state TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS user_states (
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    state TEXT NOT NULL,
+    PRIMARY KEY (app_name, user_id)
+);
+"""
+
+
+class SqliteBackedSessionService(BoundedSessionService):
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        ttl_seconds: float,
+        max_bytes: int,
+        flush_interval: float = 0.5,
+        batch_size: int = 200,
+    ) -> None:
+        super().__init__(ttl_seconds=ttl_seconds, max_bytes=max_bytes)
+        self._flush_interval = flush_interval
+        self._batch_size = batch_size
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db_lock = threading.Lock()
+        self._flush_lock = asyncio.Lock()
+        self._pending_deletes: set[SessionKey] = set()
+        self._pending_sessions: dict[SessionKey, tuple[str, float]] = {}
+        self._pending_events: list[tuple[str, str, str, str]] = []
+        self._pending_app_states: dict[str, str] = {}
+        self._pending_user_states: dict[tuple[str, str], str] = {}
+        self._flush_requested: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+        with self._db_lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(SCHEMA)
+            self._load_scoped_state()
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> Session:
+        if session_id and await self._hydrate((app_name, user_id, session_id.strip())):
+            raise AlreadyExistsError(f"Session with id {session_id} already exists.")
+        return await super().create_session(
+            app_name=app_name, user_id=user_id, state=state, session_id=session_id
+        )
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[Session]:
+        await self._hydrate((app_name, user_id, session_id))
+        return await super().get_session(
+            app_name=app_name, user_id=user_id, session_id=session_id, config=config
+        )
+
+    async def list_sessions(
+        self, *, app_name: str, user_id: Optional[str] = None
+    ) -> ListSessionsResponse:
+        await self.flush()
+        query = "SELECT user_id, id, state, last_update_time FROM sessions WHERE app_name = ?"
+        params: tuple = (app_name,)
+        if user_id is not None:
+            query += " AND user_id = ?"
+            params += (user_id,)
+        rows = await asyncio.to_thread(self._fetch_all, query, params)
+        sessions = []
+        for row_user_id, row_id, state, last_update_time in rows:
+            merged = json.loads(state)
+            for key, value in self.app_state.get(app_name, {}).items():
+                merged[State.APP_PREFIX + key] = value
+            for key, value in self.user_state.get(app_name, {}).get(row_user_id, {}).items():
+                merged[State.USER_PREFIX + key] = value
+            sessions.append(
+                Session(
+                    app_name=app_name,
+                    user_id=row_user_id,
+                    id=row_id,
+                    state=merged,
+                    last_update_time=last_update_time,
+                )
+            )
+        sessions.sort(key=lambda s: (s.last_update_time, s.user_id, s.id))
+        return ListSessionsResponse(sessions=sessions)
+
+    async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        await super().delete_session(
+            app_name=app_name, user_id=user_id, session_id=session_id
+        )
+        key = (app_name, user_id, session_id)
+        self._pending_sessions.pop(key, None)
+        self._pending_events = [row for row in self._pending_events if row[:3] != key]
+        self._pending_deletes.add(key)
+        self._request_flush()
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            batch = self._take_pending()
+            if any(batch):
+                await asyncio.to_thread(self._write_batch, *batch)
+
+    async def close(self) -> None:
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        await self.flush()
+        with self._db_lock:
+            self._db.close()
+
+    def _on_session_stored(
+        self, key: SessionKey, session: Session, event: Optional[Event]
+    ) -> None:
+        app_name, user_id, _ = key
+        self._pending_deletes.discard(key)
+        self._pending_sessions[key] = (json.dumps(session.state), session.last_update_time)
+        if event is not None:
+            self._pending_events.append((*key, event.model_dump_json(exclude_none=True)))
+        if event is None or (event.actions and event.actions.state_delta):
+            if app_name in self.app_state:
+                self._pending_app_states[app_name] = json.dumps(self.app_state[app_name])
+            user_state = self.user_state.get(app_name, {}).get(user_id)
+            if user_state is not None:
+                self._pending_user_states[(app_name, user_id)] = json.dumps(user_state)
+        if len(self._pending_events) >= self._batch_size:
+            self._request_flush()
+        else:
+            self._ensure_flusher()
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is None or self._flusher.done():
+            self._flush_requested = asyncio.Event()
+            self._flusher = asyncio.create_task(self._run_flusher())
+
+    def _request_flush(self) -> None:
+        self._ensure_flusher()
+        self._flush_requested.set()
+
+    async def _run_flusher(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            try:
+                await self.flush()
+            except sqlite3.Error as error:
+                logger.error("Failed to write sessions to SQLite: %s", error)
+
+    def _take_pending(self) -> tuple[list, list, list, list, list]:
+        batch = (
+            list(self._pending_deletes),
+            [(*key, state, ts) for key, (state, ts) in self._pending_sessions.items()],
+            self._pending_events,
+            list(self._pending_app_states.items()),
+            [(*key, state) for key, state in self._pending_user_states.items()],
+        )
+        self._pending_deletes = set()
+        self._pending_sessions = {}
+        self._pending_events = []
+        self._pending_app_states = {}
+        self._pending_user_states = {}
+        return batch
+
+    def _write_batch(
+        self,
+        deletes: list,
+        sessions: list,
+        events: list,
+        app_states: list,
+        user_states: list,
+    ) -> None:
+        with self._db_lock, self._db:
+            for key in deletes:
+                self._db.execute(
+                    "DELETE FROM events WHERE app_name = ? AND user_id = ? AND session_id = ?", key
+                )
+                self._db.execute(
+                    "DELETE FROM sessions WHERE app_name = ? AND user_id = ? AND id = ?", key
+                )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO sessions (app_name, user_id, id, state, last_update_time)"
+                " VALUES (?, ?, ?, ?, ?)",
+                sessions,
+            )
+            self._db.executemany(
+                "INSERT INTO events (app_name, user_id, session_id, event_data) VALUES (?, ?, ?, ?)",
+                events,
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO app_states (app_name, state) VALUES (?, ?)", app_states
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO user_states (app_name, user_id, state) VALUES (?, ?, ?)",
+                user_states,
+            )
+
+    def _fetch_all(self, query: str, params: tuple) -> list[tuple]:
+        with self._db_lock:
+            return self._db.execute(query, params).fetchall()
+
+    def _load_scoped_state(self) -> None:
+        for app_name, state in self._db.execute("SELECT app_name, state FROM app_states"):
+            self.app_state[app_name] = json.loads(state)
+        for app_name, user_id, state in self._db.execute(
+            "SELECT app_name, user_id, state FROM user_states"
+        ):
+            self.user_state.setdefault(app_name, {})[user_id] = json.loads(state)
+
+    async def _hydrate(self, key: SessionKey) -> bool:
+        """Loads a session from SQLite into memory; returns whether it exists."""
+        app_name, user_id, session_id = key
+        if session_id in self.sessions.get(app_name, {}).get(user_id, {}):
+            return True
+        if key in self._pending_deletes:
+            return False
+        if key in self._pending_sessions:
+            await self.flush()
+        rows = await asyncio.to_thread(
+            self._fetch_all,
+            "SELECT state, last_update_time FROM sessions"
+            " WHERE app_name = ? AND user_id = ? AND id = ?",
+            key,
+        )
+        if not rows:
+            return False
+        event_rows = await asyncio.to_thread(
+            self._fetch_all,
+            "SELECT event_data FROM events"
+            " WHERE app_name = ? AND user_id = ? AND session_id = ? ORDER BY seq",
+            key,
+        )
+        # Another coroutine may have loaded it while we were reading.
+        if session_id in self.sessions.get(app_name, {}).get(user_id, {}):
+            return True
+        state, last_update_time = rows[0]
+        events = [Event.model_validate_json(data) for (data,) in event_rows]
+        session = Session(
+            app_name=app_name,
+            user_id=user_id,
+            id=session_id,
+            state=json.loads(state),
+            events=events,
+            last_update_time=last_update_time,
+        )
+        self.sessions.setdefault(app_name, {}).setdefault(user_id, {})[session_id] = session
+        self._resize(key, sum(estimate_event_size(event) for event in events))
+        self._touch(key)
+        # Make room by evicting other sessions, never the one being loaded.
+        self._evict(keep=key)
+        return True
+
+    def _on_evicted(self, key: SessionKey, session: Session) -> None:
+        # Pending rows were captured when they were queued, so nothing is lost.
+        logger.debug("Evicted session %s from memory; it remains in SQLite", key)
@@ -1,49 +0,0 @@
-(function(){const J=document.createElement("link").relList;if(J&&J.supports&&J.supports("modulepreload"))return;for(const L of document.querySelectorAll('link[rel="modulepreload"]'))r(L);new MutationObserver(L=>{for(const k of L)if(k.type==="childList")for(const zt of k.addedNodes)zt.tagName==="LINK"&&zt.rel==="modulepreload"&&r(zt)}).observe(document,{childList:!0,subtree:!0});function U(L){const k={};return L.integrity&&(k.integrity=L.integrity),L.referrerPolicy&&(k.referrerPolicy=L.referrerPolicy),L.crossOrigin==="use-credentials"?k.credentials="include":L.crossOrigin==="anonymous"?k.credentials="omit":k.credentials="same-origin",k}function r(L){if(L.ep)return;L.ep=!0;const k=U(L);fetch(L.href,k)}})();var Mf={exports:{}},$u={};/**
- * @license React
- * react-jsx-runtime.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Or;function Fm(){if(Or)return $u;Or=1;var T=Symbol.for("react.transitional.element"),J=Symbol.for("react.fragment");function U(r,L,k){var zt=null;if(k!==void 0&&(zt=""+k),L.key!==void 0&&(zt=""+L.key),"key"in L){k={};for(var gt in L)gt!=="key"&&(k[gt]=L[gt])}else k=L;return L=k.ref,{$$typeof:T,type:r,key:zt,ref:L!==void 0?L:null,props:k}}return $u.Fragment=J,$u.jsx=U,$u.jsxs=U,$u}var Nr;function Im(){return Nr||(Nr=1,Mf.exports=Fm()),Mf.exports}var b=Im(),Df={exports:{}},Z={};/**
- * @license React
- * react.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Mr;function Pm(){if(Mr)return Z;Mr=1;var T=Symbol.for("react.transitional.element"),J=Symbol.for("react.portal"),U=Symbol.for("react.fragment"),r=Symbol.for("react.strict_mode"),L=Symbol.for("react.profiler"),k=Symbol.for("react.consumer"),zt=Symbol.for("react.context"),gt=Symbol.for("react.forward_ref"),j=Symbol.for("react.suspense"),A=Symbol.for("react.memo"),lt=Symbol.for("react.lazy"),H=Symbol.for("react.activity"),it=Symbol.iterator;function Qt(o){return o===null||typeof o!="object"?null:(o=it&&o[it]||o["@@iterator"],typeof o=="function"?o:null)}var $t={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},Vt=Object.assign,Hl={};function tl(o,x,O){this.props=o,this.context=x,this.refs=Hl,this.updater=O||$t}tl.prototype.isReactComponent={},tl.prototype.setState=function(o,x){if(typeof o!="object"&&typeof o!="function"&&o!=null)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,o,x,"setState")},tl.prototype.forceUpdate=function(o){this.updater.enqueueForceUpdate(this,o,"forceUpdate")};function El(){}El.prototype=tl.prototype;function qt(o,x,O){this.props=o,this.context=x,this.refs=Hl,this.updater=O||$t}var nl=qt.prototype=new El;nl.constructor=qt,Vt(nl,tl.prototype),nl.isPureReactComponent=!0;var xl=Array.isArray;function Kt(){}var W={H:null,A:null,T:null,S:null},Ft=Object.prototype.hasOwnProperty;function ml(o,x,O){var D=O.ref;return{$$typeof:T,type:o,key:x,ref:D!==void 0?D:null,props:O}}function Wl(o,x){return ml(o.type,x,o.props)}function Al(o){return typeof o=="object"&&o!==null&&o.$$typeof===T}function Tt(o){var x={"=":"=0",":":"=2"};return"$"+o.replace(/[=:]/g,function(O){return x[O]})}var kl=/\/+/g;function cl(o,x){return typeof o=="object"&&o!==null&&o.key!=null?Tt(""+o.key):x.toString(36)}function ll(o){switch(o.status){case"fulfilled":return o.value;case"rejected":throw o.reason;default:switch(typeof o.status=="string"?o.then(Kt,Kt):(o.status="pending",o.then(function(x){o.status==="pending"&&(o.status="fulfilled",o.value=x)},function(x){o.status==="pending"&&(o.status="rejected",o.reason=x)})),o.status){case"fulfilled":return o.value;case"rejected":throw o.reason}}throw o}function g(o,x,O,D,Q){var X=typeof o;(X==="undefined"||X==="boolean")&&(o=null);var at=!1;if(o===null)at=!0;else switch(X){case"bigint":case"string":case"number":at=!0;break;case"object":switch(o.$$typeof){case T:case J:at=!0;break;case lt:return at=o._init,g(at(o._payload),x,O,D,Q)}}if(at)return Q=Q(o),at=D===""?"."+cl(o,0):D,xl(Q)?(O="",at!=null&&(O=at.replace(kl,"$&/")+"/"),g(Q,x,O,"",function(Xl){return Xl})):Q!=null&&(Al(Q)&&(Q=Wl(Q,O+(Q.key==null||o&&o.key===Q.key?"":(""+Q.key).replace(kl,"$&/")+"/")+at)),x.push(Q)),1;at=0;var Xt=D===""?".":D+":";if(xl(o))for(var ot=0;ot<o.length;ot++)D=o[ot],X=Xt+cl(D,ot),at+=g(D,x,O,X,Q);else if(ot=Qt(o),typeof ot=="function")for(o=ot.call(o),ot=0;!(D=o.next()).done;)D=D.value,X=Xt+cl(D,ot++),at+=g(D,x,O,X,Q);else if(X==="object"){if(typeof o.then=="function")return g(ll(o),x,O,D,Q);throw x=String(o),Error("Objects are not valid as a React child (found: "+(x==="[object Object]"?"object with keys {"+Object.keys(o).join(", ")+"}":x)+"). If you meant to render a collection of children, use an array instead.")}return at}function N(o,x,O){if(o==null)return o;var D=[],Q=0;return g(o,D,"","",function(X){return x.call(O,X,Q++)}),D}function q(o){if(o._status===-1){var x=o._result;x=x(),x.then(function(O){(o._status===0||o._status===-1)&&(o._status=1,o._result=O)},function(O){(o._status===0||o._status===-1)&&(o._status=2,o._result=O)}),o._status===-1&&(o._status=0,o._result=x)}if(o._status===1)return o._result.default;throw o._result}var et=typeof reportError=="function"?reportError:function(o){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var x=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof o=="object"&&o!==null&&typeof o.message=="string"?String(o.message):String(o),error:o});if(!window.dispatchEvent(x))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",o);return}console.error(o)},st={map:N,forEach:function(o,x,O){N(o,function(){x.apply(this,arguments)},O)},count:function(o){var x=0;return N(o,function(){x++}),x},toArray:function(o){return N(o,function(x){return x})||[]},only:function(o){if(!Al(o))throw Error("React.Children.only expected to receive a single React element child.");return o}};return Z.Activity=H,Z.Children=st,Z.Component=tl,Z.Fragment=U,Z.Profiler=L,Z.PureComponent=qt,Z.StrictMode=r,Z.Suspense=j,Z.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=W,Z.__COMPILER_RUNTIME={__proto__:null,c:function(o){return W.H.useMemoCache(o)}},Z.cache=function(o){return function(){return o.apply(null,arguments)}},Z.cacheSignal=function(){return null},Z.cloneElement=function(o,x,O){if(o==null)throw Error("The argument must be a React element, but you passed "+o+".");var D=Vt({},o.props),Q=o.key;if(x!=null)for(X in x.key!==void 0&&(Q=""+x.key),x)!Ft.call(x,X)||X==="key"||X==="__self"||X==="__source"||X==="ref"&&x.ref===void 0||(D[X]=x[X]);var X=arguments.length-2;if(X===1)D.children=O;else if(1<X){for(var at=Array(X),Xt=0;Xt<X;Xt++)at[Xt]=arguments[Xt+2];D.children=at}return ml(o.type,Q,D)},Z.createContext=function(o){return o={$$typeof:zt,_currentValue:o,_currentValue2:o,_threadCount:0,Provider:null,Consumer:null},o.Provider=o,o.Consumer={$$typeof:k,_context:o},o},Z.createElement=function(o,x,O){var D,Q={},X=null;if(x!=null)for(D in x.key!==void 0&&(X=""+x.key),x)Ft.call(x,D)&&D!=="key"&&D!=="__self"&&D!=="__source"&&(Q[D]=x[D]);var at=arguments.length-2;if(at===1)Q.children=O;else if(1<at){for(var Xt=Array(at),ot=0;ot<at;ot++)Xt[ot]=arguments[ot+2];Q.children=Xt}if(o&&o.defaultProps)for(D in at=o.defaultProps,at)Q[D]===void 0&&(Q[D]=at[D]);return ml(o,X,Q)},Z.createRef=function(){return{current:null}},Z.forwardRef=function(o){return{$$typeof:gt,render:o}},Z.isValidElement=Al,Z.lazy=function(o){return{$$typeof:lt,_payload:{_status:-1,_result:o},_init:q}},Z.memo=function(o,x){return{$$typeof:A,type:o,compare:x===void 0?null:x}},Z.startTransition=function(o){var x=W.T,O={};W.T=O;try{var D=o(),Q=W.S;Q!==null&&Q(O,D),typeof D=="object"&&D!==null&&typeof D.then=="function"&&D.then(Kt,et)}catch(X){et(X)}finally{x!==null&&O.types!==null&&(x.types=O.types),W.T=x}},Z.unstable_useCacheRefresh=function(){return W.H.useCacheRefresh()},Z.use=function(o){return W.H.use(o)},Z.useActionState=function(o,x,O){return W.H.useActionState(o,x,O)},Z.useCallback=function(o,x){return W.H.useCallback(o,x)},Z.useContext=function(o){return W.H.useContext(o)},Z.useDebugValue=function(){},Z.useDeferredValue=function(o,x){return W.H.useDeferredValue(o,x)},Z.useEffect=function(o,x){return W.H.useEffect(o,x)},Z.useEffectEvent=function(o){return W.H.useEffectEvent(o)},Z.useId=function(){return W.H.useId()},Z.useImperativeHandle=function(o,x,O){return W.H.useImperativeHandle(o,x,O)},Z.useInsertionEffect=function(o,x){return W.H.useInsertionEffect(o,x)},Z.useLayoutEffect=function(o,x){return W.H.useLayoutEffect(o,x)},Z.useMemo=function(o,x){return W.H.useMemo(o,x)},Z.useOptimistic=function(o,x){return W.H.useOptimistic(o,x)},Z.useReducer=function(o,x,O){return W.H.useReducer(o,x,O)},Z.useRef=function(o){return W.H.useRef(o)},Z.useState=function(o){return W.H.useState(o)},Z.useSyncExternalStore=function(o,x,O){return W.H.useSyncExternalStore(o,x,O)},Z.useTransition=function(){return W.H.useTransition()},Z.version="19.2.4",Z}var Dr;function Hf(){return Dr||(Dr=1,Df.exports=Pm()),Df.exports}var R=Hf(),Cf={exports:{}},Fu={},Uf={exports:{}},Rf={};/**
- * @license React
- * scheduler.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Cr;function tv(){return Cr||(Cr=1,(function(T){function J(g,N){var q=g.length;g.push(N);t:for(;0<q;){var et=q-1>>>1,st=g[et];if(0<L(st,N))g[et]=N,g[q]=st,q=et;else break t}}function U(g){return g.length===0?null:g[0]}function r(g){if(g.length===0)return null;var N=g[0],q=g.pop();if(q!==N){g[0]=q;t:for(var et=0,st=g.length,o=st>>>1;et<o;){var x=2*(et+1)-1,O=g[x],D=x+1,Q=g[D];if(0>L(O,q))D<st&&0>L(Q,O)?(g[et]=Q,g[D]=q,et=D):(g[et]=O,g[x]=q,et=x);else if(D<st&&0>L(Q,q))g[et]=Q,g[D]=q,et=D;else break t}}return N}function L(g,N){var q=g.sortIndex-N.sortIndex;return q!==0?q:g.id-N.id}if(T.unstable_now=void 0,typeof performance=="object"&&typeof performance.now=="function"){var k=performance;T.unstable_now=function(){return k.now()}}else{var zt=Date,gt=zt.now();T.unstable_now=function(){return zt.now()-gt}}var j=[],A=[],lt=1,H=null,it=3,Qt=!1,$t=!1,Vt=!1,Hl=!1,tl=typeof setTimeout=="function"?setTimeout:null,El=typeof clearTimeout=="function"?clearTimeout:null,qt=typeof setImmediate<"u"?setImmediate:null;function nl(g){for(var N=U(A);N!==null;){if(N.callback===null)r(A);else if(N.startTime<=g)r(A),N.sortIndex=N.expirationTime,J(j,N);else break;N=U(A)}}function xl(g){if(Vt=!1,nl(g),!$t)if(U(j)!==null)$t=!0,Kt||(Kt=!0,Tt());else{var N=U(A);N!==null&&ll(xl,N.startTime-g)}}var Kt=!1,W=-1,Ft=5,ml=-1;function Wl(){return Hl?!0:!(T.unstable_now()-ml<Ft)}function Al(){if(Hl=!1,Kt){var g=T.unstable_now();ml=g;var N=!0;try{t:{$t=!1,Vt&&(Vt=!1,El(W),W=-1),Qt=!0;var q=it;try{l:{for(nl(g),H=U(j);H!==null&&!(H.expirationTime>g&&Wl());){var et=H.callback;if(typeof et=="function"){H.callback=null,it=H.priorityLevel;var st=et(H.expirationTime<=g);if(g=T.unstable_now(),typeof st=="function"){H.callback=st,nl(g),N=!0;break l}H===U(j)&&r(j),nl(g)}else r(j);H=U(j)}if(H!==null)N=!0;else{var o=U(A);o!==null&&ll(xl,o.startTime-g),N=!1}}break t}finally{H=null,it=q,Qt=!1}N=void 0}}finally{N?Tt():Kt=!1}}}var Tt;if(typeof qt=="function")Tt=function(){qt(Al)};else if(typeof MessageChannel<"u"){var kl=new MessageChannel,cl=kl.port2;kl.port1.onmessage=Al,Tt=function(){cl.postMessage(null)}}else Tt=function(){tl(Al,0)};function ll(g,N){W=tl(function(){g(T.unstable_now())},N)}T.unstable_IdlePriority=5,T.unstable_ImmediatePriority=1,T.unstable_LowPriority=4,T.unstable_NormalPriority=3,T.unstable_Profiling=null,T.unstable_UserBlockingPriority=2,T.unstable_cancelCallback=function(g){g.callback=null},T.unstable_forceFrameRate=function(g){0>g||125<g?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):Ft=0<g?Math.floor(1e3/g):5},T.unstable_getCurrentPriorityLevel=function(){return it},T.unstable_next=function(g){switch(it){case 1:case 2:case 3:var N=3;break;default:N=it}var q=it;it=N;try{return g()}finally{it=q}},T.unstable_requestPaint=function(){Hl=!0},T.unstable_runWithPriority=function(g,N){switch(g){case 1:case 2:case 3:case 4:case 5:break;default:g=3}var q=it;it=g;try{return N()}finally{it=q}},T.unstable_scheduleCallback=function(g,N,q){var et=T.unstable_now();switch(typeof q=="object"&&q!==null?(q=q.delay,q=typeof q=="number"&&0<q?et+q:et):q=et,g){case 1:var st=-1;break;case 2:st=250;break;case 5:st=1073741823;break;case 4:st=1e4;break;default:st=5e3}return st=q+st,g={id:lt++,callback:N,priorityLevel:g,startTime:q,expirationTime:st,sortIndex:-1},q>et?(g.sortIndex=q,J(A,g),U(j)===null&&g===U(A)&&(Vt?(El(W),W=-1):Vt=!0,ll(xl,q-et))):(g.sortIndex=st,J(j,g),$t||Qt||($t=!0,Kt||(Kt=!0,Tt()))),g},T.unstable_shouldYield=Wl,T.unstable_wrapCallback=function(g){var N=it;return function(){var q=it;it=N;try{return g.apply(this,arguments)}finally{it=q}}}})(Rf)),Rf}var Ur;function lv(){return Ur||(Ur=1,Uf.exports=tv()),Uf.exports}var jf={exports:{}},Pt={};/**
- * @license React
- * react-dom.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Rr;function ev(){if(Rr)return Pt;Rr=1;var T=Hf();function J(j){var A="https://react.dev/errors/"+j;if(1<arguments.length){A+="?args[]="+encodeURIComponent(arguments[1]);for(var lt=2;lt<arguments.length;lt++)A+="&args[]="+encodeURIComponent(arguments[lt])}return"Minified React error #"+j+"; visit "+A+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function U(){}var r={d:{f:U,r:function(){throw Error(J(522))},D:U,C:U,L:U,m:U,X:U,S:U,M:U},p:0,findDOMNode:null},L=Symbol.for("react.portal");function k(j,A,lt){var H=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:L,key:H==null?null:""+H,children:j,containerInfo:A,implementation:lt}}var zt=T.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function gt(j,A){if(j==="font")return"";if(typeof A=="string")return A==="use-credentials"?A:""}return Pt.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=r,Pt.createPortal=function(j,A){var lt=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!A||A.nodeType!==1&&A.nodeType!==9&&A.nodeType!==11)throw Error(J(299));return k(j,A,null,lt)},Pt.flushSync=function(j){var A=zt.T,lt=r.p;try{if(zt.T=null,r.p=2,j)return j()}finally{zt.T=A,r.p=lt,r.d.f()}},Pt.preconnect=function(j,A){typeof j=="string"&&(A?(A=A.crossOrigin,A=typeof A=="string"?A==="use-credentials"?A:"":void 0):A=null,r.d.C(j,A))},Pt.prefetchDNS=function(j){typeof j=="string"&&r.d.D(j)},Pt.preinit=function(j,A){if(typeof j=="string"&&A&&typeof A.as=="string"){var lt=A.as,H=gt(lt,A.crossOrigin),it=typeof A.integrity=="string"?A.integrity:void 0,Qt=typeof A.fetchPriority=="string"?A.fetchPriority:void 0;lt==="style"?r.d.S(j,typeof A.precedence=="string"?A.precedence:void 0,{crossOrigin:H,integrity:it,fetchPriority:Qt}):lt==="script"&&r.d.X(j,{crossOrigin:H,integrity:it,fetchPriority:Qt,nonce:typeof A.nonce=="string"?A.nonce:void 0})}},Pt.preinitModule=function(j,A){if(typeof j=="string")if(typeof A=="object"&&A!==null){if(A.as==null||A.as==="script"){var lt=gt(A.as,A.crossOrigin);r.d.M(j,{crossOrigin:lt,integrity:typeof A.integrity=="string"?A.integrity:void 0,nonce:typeof A.nonce=="string"?A.nonce:void 0})}}else A==null&&r.d.M(j)},Pt.preload=function(j,A){if(typeof j=="string"&&typeof A=="object"&&A!==null&&typeof A.as=="string"){var lt=A.as,H=gt(lt,A.crossOrigin);r.d.L(j,lt,{crossOrigin:H,integrity:typeof A.integrity=="string"?A.integrity:void 0,nonce:typeof A.nonce=="string"?A.nonce:void 0,type:typeof A.type=="string"?A.type:void 0,fetchPriority:typeof A.fetchPriority=="string"?A.fetchPriority:void 0,referrerPolicy:typeof A.referrerPolicy=="string"?A.referrerPolicy:void 0,imageSrcSet:typeof A.imageSrcSet=="string"?A.imageSrcSet:void 0,imageSizes:typeof A.imageSizes=="string"?A.imageSizes:void 0,media:typeof A.media=="string"?A.media:void 0})}},Pt.preloadModule=function(j,A){if(typeof j=="string")if(A){var lt=gt(A.as,A.crossOrigin);r.d.m(j,{as:typeof A.as=="string"&&A.as!=="script"?A.as:void 0,crossOrigin:lt,integrity:typeof A.integrity=="string"?A.integrity:void 0})}else r.d.m(j)},Pt.requestFormReset=function(j){r.d.r(j)},Pt.unstable_batchedUpdates=function(j,A){return j(A)},Pt.useFormState=function(j,A,lt){return zt.H.useFormState(j,A,lt)},Pt.useFormStatus=function(){return zt.H.useHostTransitionStatus()},Pt.version="19.2.4",Pt}var jr;function av(){if(jr)return jf.exports;jr=1;function T(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(T)}catch(J){console.error(J)}}return T(),jf.exports=ev(),jf.exports}/**
- * @license React
- * react-dom-client.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Hr;function uv(){if(Hr)return Fu;Hr=1;var T=lv(),J=Hf(),U=av();function r(t){var l="https://react.dev/errors/"+t;if(1<arguments.length){l+="?args[]="+encodeURIComponent(arguments[1]);for(var e=2;e<arguments.length;e++)l+="&args[]="+encodeURIComponent(arguments[e])}return"Minified React error #"+t+"; visit "+l+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function L(t){return!(!t||t.nodeType!==1&&t.nodeType!==9&&t.nodeType!==11)}function k(t){var l=t,e=t;if(t.alternate)for(;l.return;)l=l.return;else{t=l;do l=t,(l.flags&4098)!==0&&(e=l.return),t=l.return;while(t)}return l.tag===3?e:null}function zt(t){if(t.tag===13){var l=t.memoizedState;if(l===null&&(t=t.alternate,t!==null&&(l=t.memoizedState)),l!==null)return l.dehydrated}return null}function gt(t){if(t.tag===31){var l=t.memoizedState;if(l===null&&(t=t.alternate,t!==null&&(l=t.memoizedState)),l!==null)return l.dehydrated}return null}function j(t){if(k(t)!==t)throw Error(r(188))}function A(t){var l=t.alternate;if(!l){if(l=k(t),l===null)throw Error(r(188));return l!==t?null:t}for(var e=t,a=l;;){var u=e.return;if(u===null)break;var n=u.alternate;if(n===null){if(a=u.return,a!==null){e=a;continue}break}if(u.child===n.child){for(n=u.child;n;){if(n===e)return j(u),t;if(n===a)return j(u),l;n=n.sibling}throw Error(r(188))}if(e.return!==a.return)e=u,a=n;else{for(var c=!1,i=u.child;i;){if(i===e){c=!0,e=u,a=n;break}if(i===a){c=!0,a=u,e=n;break}i=i.sibling}if(!c){for(i=n.child;i;){if(i===e){c=!0,e=n,a=u;break}if(i===a){c=!0,a=n,e=u;break}i=i.sibling}if(!c)throw Error(r(189))}}if(e.alternate!==a)throw Error(r(190))}if(e.tag!==3)throw Error(r(188));return e.stateNode.current===e?t:l}function lt(t){var l=t.tag;if(l===5||l===26||l===27||l===6)return t;for(t=t.child;t!==null;){if(l=lt(t),l!==null)return l;t=t.sibling}return null}var H=Object.assign,it=Symbol.for("react.element"),Qt=Symbol.for("react.transitional.element"),$t=Symbol.for("react.portal"),Vt=Symbol.for("react.fragment"),Hl=Symbol.for("react.strict_mode"),tl=Symbol.for("react.profiler"),El=Symbol.for("react.consumer"),qt=Symbol.for("react.context"),nl=Symbol.for("react.forward_ref"),xl=Symbol.for("react.suspense"),Kt=Symbol.for("react.suspense_list"),W=Symbol.for("react.memo"),Ft=Symbol.for("react.lazy"),ml=Symbol.for("react.activity"),Wl=Symbol.for("react.memo_cache_sentinel"),Al=Symbol.iterator;function Tt(t){return t===null||typeof t!="object"?null:(t=Al&&t[Al]||t["@@iterator"],typeof t=="function"?t:null)}var kl=Symbol.for("react.client.reference");function cl(t){if(t==null)return null;if(typeof t=="function")return t.$$typeof===kl?null:t.displayName||t.name||null;if(typeof t=="string")return t;switch(t){case Vt:return"Fragment";case tl:return"Profiler";case Hl:return"StrictMode";case xl:return"Suspense";case Kt:return"SuspenseList";case ml:return"Activity"}if(typeof t=="object")switch(t.$$typeof){case $t:return"Portal";case qt:return t.displayName||"Context";case El:return(t._context.displayName||"Context")+".Consumer";case nl:var l=t.render;return t=t.displayName,t||(t=l.displayName||l.name||"",t=t!==""?"ForwardRef("+t+")":"ForwardRef"),t;case W:return l=t.displayName||null,l!==null?l:cl(t.type)||"Memo";case Ft:l=t._payload,t=t._init;try{return cl(t(l))}catch{}}return null}var ll=Array.isArray,g=J.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,N=U.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,q={pending:!1,data:null,method:null,action:null},et=[],st=-1;function o(t){return{current:t}}function x(t){0>st||(t.current=et[st],et[st]=null,st--)}function O(t,l){st++,et[st]=t.current,t.current=l}var D=o(null),Q=o(null),X=o(null),at=o(null);function Xt(t,l){switch(O(X,l),O(Q,t),O(D,null),l.nodeType){case 9:case 11:t=(t=l.documentElement)&&(t=t.namespaceURI)?$d(t):0;break;default:if(t=l.tagName,l=l.namespaceURI)l=$d(l),t=Fd(l,t);else switch(t){case"svg":t=1;break;case"math":t=2;break;default:t=0}}x(D),O(D,t)}function ot(){x(D),x(Q),x(X)}function Xl(t){t.memoizedState!==null&&O(at,t);var l=D.current,e=Fd(l,t.type);l!==e&&(O(Q,t),O(D,e))}function _t(t){Q.current===t&&(x(D),x(Q)),at.current===t&&(x(at),Ju._currentValue=q)}var Ve,Pu;function $l(t){if(Ve===void 0)try{throw Error()}catch(e){var l=e.stack.trim().match(/\n( *(at )?)/);Ve=l&&l[1]||"",Pu=-1<e.stack.indexOf(`
-    at`)?" (<anonymous>)":-1<e.stack.indexOf("@")?"@unknown:0:0":""}return`
-`+Ve+t+Pu}var Ke=!1;function ge(t,l){if(!t||Ke)return"";Ke=!0;var e=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var a={DetermineComponentFrameRoot:function(){try{if(l){var E=function(){throw Error()};if(Object.defineProperty(E.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(E,[])}catch(h){var y=h}Reflect.construct(t,[],E)}else{try{E.call()}catch(h){y=h}t.call(E.prototype)}}else{try{throw Error()}catch(h){y=h}(E=t())&&typeof E.catch=="function"&&E.catch(function(){})}}catch(h){if(h&&y&&typeof h.stack=="string")return[h.stack,y.stack]}return[null,null]}};a.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var u=Object.getOwnPropertyDescriptor(a.DetermineComponentFrameRoot,"name");u&&u.configurable&&Object.defineProperty(a.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var n=a.DetermineComponentFrameRoot(),c=n[0],i=n[1];if(c&&i){var f=c.split(`
-`),v=i.split(`
-`);for(u=a=0;a<f.length&&!f[a].includes("DetermineComponentFrameRoot");)a++;for(;u<v.length&&!v[u].includes("DetermineComponentFrameRoot");)u++;if(a===f.length||u===v.length)for(a=f.length-1,u=v.length-1;1<=a&&0<=u&&f[a]!==v[u];)u--;for(;1<=a&&0<=u;a--,u--)if(f[a]!==v[u]){if(a!==1||u!==1)do if(a--,u--,0>u||f[a]!==v[u]){var S=`
-`+f[a].replace(" at new "," at ");return t.displayName&&S.includes("<anonymous>")&&(S=S.replace("<anonymous>",t.displayName)),S}while(1<=a&&0<=u);break}}}finally{Ke=!1,Error.prepareStackTrace=e}return(e=t?t.displayName||t.name:"")?$l(e):""}function ya(t,l){switch(t.tag){case 26:case 27:case 5:return $l(t.type);case 16:return $l("Lazy");case 13:return t.child!==l&&l!==null?$l("Suspense Fallback"):$l("Suspense");case 19:return $l("SuspenseList");case 0:case 15:return ge(t.type,!1);case 11:return ge(t.type.render,!1);case 1:return ge(t.type,!0);case 31:return $l("Activity");default:return""}}function Se(t){try{var l="",e=null;do l+=ya(t,e),e=t,t=t.return;while(t);return l}catch(a){return`
-Error generating stack: `+a.message+`
-`+a.stack}}var be=Object.prototype.hasOwnProperty,Bl=T.unstable_scheduleCallback,Je=T.unstable_cancelCallback,St=T.unstable_shouldYield,vc=T.unstable_requestPaint,Ot=T.unstable_now,Fl=T.unstable_getCurrentPriorityLevel,Il=T.unstable_ImmediatePriority,uu=T.unstable_UserBlockingPriority,we=T.unstable_NormalPriority,nu=T.unstable_LowPriority,We=T.unstable_IdlePriority,yc=T.log,hc=T.unstable_setDisableYieldValue,ke=null,el=null;function Zl(t){if(typeof yc=="function"&&hc(t),el&&typeof el.setStrictMode=="function")try{el.setStrictMode(ke,t)}catch{}}var al=Math.clz32?Math.clz32:Sc,tn=Math.log,gc=Math.LN2;function Sc(t){return t>>>=0,t===0?32:31-(tn(t)/gc|0)|0}var ha=256,ga=262144,Sa=4194304;function Ll(t){var l=t&42;if(l!==0)return l;switch(t&-t){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:return t&261888;case 262144:case 524288:case 1048576:case 2097152:return t&3932160;case 4194304:case 8388608:case 16777216:case 33554432:return t&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return t}}function ba(t,l,e){var a=t.pendingLanes;if(a===0)return 0;var u=0,n=t.suspendedLanes,c=t.pingedLanes;t=t.warmLanes;var i=a&134217727;return i!==0?(a=i&~n,a!==0?u=Ll(a):(c&=i,c!==0?u=Ll(c):e||(e=i&~t,e!==0&&(u=Ll(e))))):(i=a&~n,i!==0?u=Ll(i):c!==0?u=Ll(c):e||(e=a&~t,e!==0&&(u=Ll(e)))),u===0?0:l!==0&&l!==u&&(l&n)===0&&(n=u&-u,e=l&-l,n>=e||n===32&&(e&4194048)!==0)?l:u}function $e(t,l){return(t.pendingLanes&~(t.suspendedLanes&~t.pingedLanes)&l)===0}function cu(t,l){switch(t){case 1:case 2:case 4:case 8:case 64:return l+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return l+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function pa(){var t=Sa;return Sa<<=1,(Sa&62914560)===0&&(Sa=4194304),t}function Fe(t){for(var l=[],e=0;31>e;e++)l.push(t);return l}function z(t,l){t.pendingLanes|=l,l!==268435456&&(t.suspendedLanes=0,t.pingedLanes=0,t.warmLanes=0)}function _(t,l,e,a,u,n){var c=t.pendingLanes;t.pendingLanes=e,t.suspendedLanes=0,t.pingedLanes=0,t.warmLanes=0,t.expiredLanes&=e,t.entangledLanes&=e,t.errorRecoveryDisabledLanes&=e,t.shellSuspendCounter=0;var i=t.entanglements,f=t.expirationTimes,v=t.hiddenUpdates;for(e=c&~e;0<e;){var S=31-al(e),E=1<<S;i[S]=0,f[S]=-1;var y=v[S];if(y!==null)for(v[S]=null,S=0;S<y.length;S++){var h=y[S];h!==null&&(h.lane&=-536870913)}e&=~E}a!==0&&V(t,a,0),n!==0&&u===0&&t.tag!==0&&(t.suspendedLanes|=n&~(c&~l))}function V(t,l,e){t.pendingLanes|=l,t.suspendedLanes&=~l;var a=31-al(l);t.entangledLanes|=l,t.entanglements[a]=t.entanglements[a]|1073741824|e&261930}function G(t,l){var e=t.entangledLanes|=l;for(t=t.entanglements;e;){var a=31-al(e),u=1<<a;u&l|t[a]&l&&(t[a]|=l),e&=~u}}function ut(t,l){var e=l&-l;return e=(e&42)!==0?1:bt(e),(e&(t.suspendedLanes|l))!==0?0:e}function bt(t){switch(t){case 2:t=1;break;case 8:t=4;break;case 32:t=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:t=128;break;case 268435456:t=134217728;break;default:t=0}return t}function dt(t){return t&=-t,2<t?8<t?(t&134217727)!==0?32:268435456:8:2}function It(){var t=N.p;return t!==0?t:(t=window.event,t===void 0?32:pr(t.type))}function ql(t,l){var e=N.p;try{return N.p=t,l()}finally{N.p=e}}var zl=Math.random().toString(36).slice(2),Ut="__reactFiber$"+zl,Yt="__reactProps$"+zl,pe="__reactContainer$"+zl,bc="__reactEvents$"+zl,Qr="__reactListeners$"+zl,Xr="__reactHandles$"+zl,Bf="__reactResources$"+zl,iu="__reactMarker$"+zl;function pc(t){delete t[Ut],delete t[Yt],delete t[bc],delete t[Qr],delete t[Xr]}function Ea(t){var l=t[Ut];if(l)return l;for(var e=t.parentNode;e;){if(l=e[pe]||e[Ut]){if(e=l.alternate,l.child!==null||e!==null&&e.child!==null)for(t=ur(t);t!==null;){if(e=t[Ut])return e;t=ur(t)}return l}t=e,e=t.parentNode}return null}function xa(t){if(t=t[Ut]||t[pe]){var l=t.tag;if(l===5||l===6||l===13||l===31||l===26||l===27||l===3)return t}return null}function fu(t){var l=t.tag;if(l===5||l===26||l===27||l===6)return t.stateNode;throw Error(r(33))}function Aa(t){var l=t[Bf];return l||(l=t[Bf]={hoistableStyles:new Map,hoistableScripts:new Map}),l}function Zt(t){t[iu]=!0}var qf=new Set,Yf={};function Ie(t,l){za(t,l),za(t+"Capture",l)}function za(t,l){for(Yf[t]=l,t=0;t<l.length;t++)qf.add(l[t])}var Zr=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),Gf={},Qf={};function Lr(t){return be.call(Qf,t)?!0:be.call(Gf,t)?!1:Zr.test(t)?Qf[t]=!0:(Gf[t]=!0,!1)}function ln(t,l,e){if(Lr(l))if(e===null)t.removeAttribute(l);else{switch(typeof e){case"undefined":case"function":case"symbol":t.removeAttribute(l);return;case"boolean":var a=l.toLowerCase().slice(0,5);if(a!=="data-"&&a!=="aria-"){t.removeAttribute(l);return}}t.setAttribute(l,""+e)}}function en(t,l,e){if(e===null)t.removeAttribute(l);else{switch(typeof e){case"undefined":case"function":case"symbol":case"boolean":t.removeAttribute(l);return}t.setAttribute(l,""+e)}}function Pl(t,l,e,a){if(a===null)t.removeAttribute(e);else{switch(typeof a){case"undefined":case"function":case"symbol":case"boolean":t.removeAttribute(e);return}t.setAttributeNS(l,e,""+a)}}function Tl(t){switch(typeof t){case"bigint":case"boolean":case"number":case"string":case"undefined":return t;case"object":return t;default:return""}}function Xf(t){var l=t.type;return(t=t.nodeName)&&t.toLowerCase()==="input"&&(l==="checkbox"||l==="radio")}function Vr(t,l,e){var a=Object.getOwnPropertyDescriptor(t.constructor.prototype,l);if(!t.hasOwnProperty(l)&&typeof a<"u"&&typeof a.get=="function"&&typeof a.set=="function"){var u=a.get,n=a.set;return Object.defineProperty(t,l,{configurable:!0,get:function(){return u.call(this)},set:function(c){e=""+c,n.call(this,c)}}),Object.defineProperty(t,l,{enumerable:a.enumerable}),{getValue:function(){return e},setValue:function(c){e=""+c},stopTracking:function(){t._valueTracker=null,delete t[l]}}}}function Ec(t){if(!t._valueTracker){var l=Xf(t)?"checked":"value";t._valueTracker=Vr(t,l,""+t[l])}}function Zf(t){if(!t)return!1;var l=t._valueTracker;if(!l)return!0;var e=l.getValue(),a="";return t&&(a=Xf(t)?t.checked?"true":"false":t.value),t=a,t!==e?(l.setValue(t),!0):!1}function an(t){if(t=t||(typeof document<"u"?document:void 0),typeof t>"u")return null;try{return t.activeElement||t.body}catch{return t.body}}var Kr=/[\n"\\]/g;function _l(t){return t.replace(Kr,function(l){return"\\"+l.charCodeAt(0).toString(16)+" "})}function xc(t,l,e,a,u,n,c,i){t.name="",c!=null&&typeof c!="function"&&typeof c!="symbol"&&typeof c!="boolean"?t.type=c:t.removeAttribute("type"),l!=null?c==="number"?(l===0&&t.value===""||t.value!=l)&&(t.value=""+Tl(l)):t.value!==""+Tl(l)&&(t.value=""+Tl(l)):c!=="submit"&&c!=="reset"||t.removeAttribute("value"),l!=null?Ac(t,c,Tl(l)):e!=null?Ac(t,c,Tl(e)):a!=null&&t.removeAttribute("value"),u==null&&n!=null&&(t.defaultChecked=!!n),u!=null&&(t.checked=u&&typeof u!="function"&&typeof u!="symbol"),i!=null&&typeof i!="function"&&typeof i!="symbol"&&typeof i!="boolean"?t.name=""+Tl(i):t.removeAttribute("name")}function Lf(t,l,e,a,u,n,c,i){if(n!=null&&typeof n!="function"&&typeof n!="symbol"&&typeof n!="boolean"&&(t.type=n),l!=null||e!=null){if(!(n!=="submit"&&n!=="reset"||l!=null)){Ec(t);return}e=e!=null?""+Tl(e):"",l=l!=null?""+Tl(l):e,i||l===t.value||(t.value=l),t.defaultValue=l}a=a??u,a=typeof a!="function"&&typeof a!="symbol"&&!!a,t.checked=i?t.checked:!!a,t.defaultChecked=!!a,c!=null&&typeof c!="function"&&typeof c!="symbol"&&typeof c!="boolean"&&(t.name=c),Ec(t)}function Ac(t,l,e){l==="number"&&an(t.ownerDocument)===t||t.defaultValue===""+e||(t.defaultValue=""+e)}function Ta(t,l,e,a){if(t=t.options,l){l={};for(var u=0;u<e.length;u++)l["$"+e[u]]=!0;for(e=0;e<t.length;e++)u=l.hasOwnProperty("$"+t[e].value),t[e].selected!==u&&(t[e].selected=u),u&&a&&(t[e].defaultSelected=!0)}else{for(e=""+Tl(e),l=null,u=0;u<t.length;u++){if(t[u].value===e){t[u].selected=!0,a&&(t[u].defaultSelected=!0);return}l!==null||t[u].disabled||(l=t[u])}l!==null&&(l.selected=!0)}}function Vf(t,l,e){if(l!=null&&(l=""+Tl(l),l!==t.value&&(t.value=l),e==null)){t.defaultValue!==l&&(t.defaultValue=l);return}t.defaultValue=e!=null?""+Tl(e):""}function Kf(t,l,e,a){if(l==null){if(a!=null){if(e!=null)throw Error(r(92));if(ll(a)){if(1<a.length)throw Error(r(93));a=a[0]}e=a}e==null&&(e=""),l=e}e=Tl(l),t.defaultValue=e,a=t.textContent,a===e&&a!==""&&a!==null&&(t.value=a),Ec(t)}function _a(t,l){if(l){var e=t.firstChild;if(e&&e===t.lastChild&&e.nodeType===3){e.nodeValue=l;return}}t.textContent=l}var Jr=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function Jf(t,l,e){var a=l.indexOf("--")===0;e==null||typeof e=="boolean"||e===""?a?t.setProperty(l,""):l==="float"?t.cssFloat="":t[l]="":a?t.setProperty(l,e):typeof e!="number"||e===0||Jr.has(l)?l==="float"?t.cssFloat=e:t[l]=(""+e).trim():t[l]=e+"px"}function wf(t,l,e){if(l!=null&&typeof l!="object")throw Error(r(62));if(t=t.style,e!=null){for(var a in e)!e.hasOwnProperty(a)||l!=null&&l.hasOwnProperty(a)||(a.indexOf("--")===0?t.setProperty(a,""):a==="float"?t.cssFloat="":t[a]="");for(var u in l)a=l[u],l.hasOwnProperty(u)&&e[u]!==a&&Jf(t,u,a)}else for(var n in l)l.hasOwnProperty(n)&&Jf(t,n,l[n])}function zc(t){if(t.indexOf("-")===-1)return!1;switch(t){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var wr=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),Wr=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function un(t){return Wr.test(""+t)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":t}function te(){}var Tc=null;function _c(t){return t=t.target||t.srcElement||window,t.correspondingUseElement&&(t=t.correspondingUseElement),t.nodeType===3?t.parentNode:t}var Oa=null,Na=null;function Wf(t){var l=xa(t);if(l&&(t=l.stateNode)){var e=t[Yt]||null;t:switch(t=l.stateNode,l.type){case"input":if(xc(t,e.value,e.defaultValue,e.defaultValue,e.checked,e.defaultChecked,e.type,e.name),l=e.name,e.type==="radio"&&l!=null){for(e=t;e.parentNode;)e=e.parentNode;for(e=e.querySelectorAll('input[name="'+_l(""+l)+'"][type="radio"]'),l=0;l<e.length;l++){var a=e[l];if(a!==t&&a.form===t.form){var u=a[Yt]||null;if(!u)throw Error(r(90));xc(a,u.value,u.defaultValue,u.defaultValue,u.checked,u.defaultChecked,u.type,u.name)}}for(l=0;l<e.length;l++)a=e[l],a.form===t.form&&Zf(a)}break t;case"textarea":Vf(t,e.value,e.defaultValue);break t;case"select":l=e.value,l!=null&&Ta(t,!!e.multiple,l,!1)}}}var Oc=!1;function kf(t,l,e){if(Oc)return t(l,e);Oc=!0;try{var a=t(l);return a}finally{if(Oc=!1,(Oa!==null||Na!==null)&&(Jn(),Oa&&(l=Oa,t=Na,Na=Oa=null,Wf(l),t)))for(l=0;l<t.length;l++)Wf(t[l])}}function su(t,l){var e=t.stateNode;if(e===null)return null;var a=e[Yt]||null;if(a===null)return null;e=a[l];t:switch(l){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(a=!a.disabled)||(t=t.type,a=!(t==="button"||t==="input"||t==="select"||t==="textarea")),t=!a;break t;default:t=!1}if(t)return null;if(e&&typeof e!="function")throw Error(r(231,l,typeof e));return e}var le=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),Nc=!1;if(le)try{var ou={};Object.defineProperty(ou,"passive",{get:function(){Nc=!0}}),window.addEventListener("test",ou,ou),window.removeEventListener("test",ou,ou)}catch{Nc=!1}var Ee=null,Mc=null,nn=null;function $f(){if(nn)return nn;var t,l=Mc,e=l.length,a,u="value"in Ee?Ee.value:Ee.textContent,n=u.length;for(t=0;t<e&&l[t]===u[t];t++);var c=e-t;for(a=1;a<=c&&l[e-a]===u[n-a];a++);return nn=u.slice(t,1<a?1-a:void 0)}function cn(t){var l=t.keyCode;return"charCode"in t?(t=t.charCode,t===0&&l===13&&(t=13)):t=l,t===10&&(t=13),32<=t||t===13?t:0}function fn(){return!0}function Ff(){return!1}function il(t){function l(e,a,u,n,c){this._reactName=e,this._targetInst=u,this.type=a,this.nativeEvent=n,this.target=c,this.currentTarget=null;for(var i in t)t.hasOwnProperty(i)&&(e=t[i],this[i]=e?e(n):n[i]);return this.isDefaultPrevented=(n.defaultPrevented!=null?n.defaultPrevented:n.returnValue===!1)?fn:Ff,this.isPropagationStopped=Ff,this}return H(l.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():typeof e.returnValue!="unknown"&&(e.returnValue=!1),this.isDefaultPrevented=fn)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():typeof e.cancelBubble!="unknown"&&(e.cancelBubble=!0),this.isPropagationStopped=fn)},persist:function(){},isPersistent:fn}),l}var Pe={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(t){return t.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},sn=il(Pe),du=H({},Pe,{view:0,detail:0}),kr=il(du),Dc,Cc,ru,on=H({},du,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Rc,button:0,buttons:0,relatedTarget:function(t){return t.relatedTarget===void 0?t.fromElement===t.srcElement?t.toElement:t.fromElement:t.relatedTarget},movementX:function(t){return"movementX"in t?t.movementX:(t!==ru&&(ru&&t.type==="mousemove"?(Dc=t.screenX-ru.screenX,Cc=t.screenY-ru.screenY):Cc=Dc=0,ru=t),Dc)},movementY:function(t){return"movementY"in t?t.movementY:Cc}}),If=il(on),$r=H({},on,{dataTransfer:0}),Fr=il($r),Ir=H({},du,{relatedTarget:0}),Uc=il(Ir),Pr=H({},Pe,{animationName:0,elapsedTime:0,pseudoElement:0}),t0=il(Pr),l0=H({},Pe,{clipboardData:function(t){return"clipboardData"in t?t.clipboardData:window.clipboardData}}),e0=il(l0),a0=H({},Pe,{data:0}),Pf=il(a0),u0={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},n0={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},c0={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function i0(t){var l=this.nativeEvent;return l.getModifierState?l.getModifierState(t):(t=c0[t])?!!l[t]:!1}function Rc(){return i0}var f0=H({},du,{key:function(t){if(t.key){var l=u0[t.key]||t.key;if(l!=="Unidentified")return l}return t.type==="keypress"?(t=cn(t),t===13?"Enter":String.fromCharCode(t)):t.type==="keydown"||t.type==="keyup"?n0[t.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Rc,charCode:function(t){return t.type==="keypress"?cn(t):0},keyCode:function(t){return t.type==="keydown"||t.type==="keyup"?t.keyCode:0},which:function(t){return t.type==="keypress"?cn(t):t.type==="keydown"||t.type==="keyup"?t.keyCode:0}}),s0=il(f0),o0=H({},on,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),ts=il(o0),d0=H({},du,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Rc}),r0=il(d0),m0=H({},Pe,{propertyName:0,elapsedTime:0,pseudoElement:0}),v0=il(m0),y0=H({},on,{deltaX:function(t){return"deltaX"in t?t.deltaX:"wheelDeltaX"in t?-t.wheelDeltaX:0},deltaY:function(t){return"deltaY"in t?t.deltaY:"wheelDeltaY"in t?-t.wheelDeltaY:"wheelDelta"in t?-t.wheelDelta:0},deltaZ:0,deltaMode:0}),h0=il(y0),g0=H({},Pe,{newState:0,oldState:0}),S0=il(g0),b0=[9,13,27,32],jc=le&&"CompositionEvent"in window,mu=null;le&&"documentMode"in document&&(mu=document.documentMode);var p0=le&&"TextEvent"in window&&!mu,ls=le&&(!jc||mu&&8<mu&&11>=mu),es=" ",as=!1;function us(t,l){switch(t){case"keyup":return b0.indexOf(l.keyCode)!==-1;case"keydown":return l.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function ns(t){return t=t.detail,typeof t=="object"&&"data"in t?t.data:null}var Ma=!1;function E0(t,l){switch(t){case"compositionend":return ns(l);case"keypress":return l.which!==32?null:(as=!0,es);case"textInput":return t=l.data,t===es&&as?null:t;default:return null}}function x0(t,l){if(Ma)return t==="compositionend"||!jc&&us(t,l)?(t=$f(),nn=Mc=Ee=null,Ma=!1,t):null;switch(t){case"paste":return null;case"keypress":if(!(l.ctrlKey||l.altKey||l.metaKey)||l.ctrlKey&&l.altKey){if(l.char&&1<l.char.length)return l.char;if(l.which)return String.fromCharCode(l.which)}return null;case"compositionend":return ls&&l.locale!=="ko"?null:l.data;default:return null}}var A0={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function cs(t){var l=t&&t.nodeName&&t.nodeName.toLowerCase();return l==="input"?!!A0[t.type]:l==="textarea"}function is(t,l,e,a){Oa?Na?Na.push(a):Na=[a]:Oa=a,l=Pn(l,"onChange"),0<l.length&&(e=new sn("onChange","change",null,e,a),t.push({event:e,listeners:l}))}var vu=null,yu=null;function z0(t){Vd(t,0)}function dn(t){var l=fu(t);if(Zf(l))return t}function fs(t,l){if(t==="change")return l}var ss=!1;if(le){var Hc;if(le){var Bc="oninput"in document;if(!Bc){var os=document.createElement("div");os.setAttribute("oninput","return;"),Bc=typeof os.oninput=="function"}Hc=Bc}else Hc=!1;ss=Hc&&(!document.documentMode||9<document.documentMode)}function ds(){vu&&(vu.detachEvent("onpropertychange",rs),yu=vu=null)}function rs(t){if(t.propertyName==="value"&&dn(yu)){var l=[];is(l,yu,t,_c(t)),kf(z0,l)}}function T0(t,l,e){t==="focusin"?(ds(),vu=l,yu=e,vu.attachEvent("onpropertychange",rs)):t==="focusout"&&ds()}function _0(t){if(t==="selectionchange"||t==="keyup"||t==="keydown")return dn(yu)}function O0(t,l){if(t==="click")return dn(l)}function N0(t,l){if(t==="input"||t==="change")return dn(l)}function M0(t,l){return t===l&&(t!==0||1/t===1/l)||t!==t&&l!==l}var vl=typeof Object.is=="function"?Object.is:M0;function hu(t,l){if(vl(t,l))return!0;if(typeof t!="object"||t===null||typeof l!="object"||l===null)return!1;var e=Object.keys(t),a=Object.keys(l);if(e.length!==a.length)return!1;for(a=0;a<e.length;a++){var u=e[a];if(!be.call(l,u)||!vl(t[u],l[u]))return!1}return!0}function ms(t){for(;t&&t.firstChild;)t=t.firstChild;return t}function vs(t,l){var e=ms(t);t=0;for(var a;e;){if(e.nodeType===3){if(a=t+e.textContent.length,t<=l&&a>=l)return{node:e,offset:l-t};t=a}t:{for(;e;){if(e.nextSibling){e=e.nextSibling;break t}e=e.parentNode}e=void 0}e=ms(e)}}function ys(t,l){return t&&l?t===l?!0:t&&t.nodeType===3?!1:l&&l.nodeType===3?ys(t,l.parentNode):"contains"in t?t.contains(l):t.compareDocumentPosition?!!(t.compareDocumentPosition(l)&16):!1:!1}function hs(t){t=t!=null&&t.ownerDocument!=null&&t.ownerDocument.defaultView!=null?t.ownerDocument.defaultView:window;for(var l=an(t.document);l instanceof t.HTMLIFrameElement;){try{var e=typeof l.contentWindow.location.href=="string"}catch{e=!1}if(e)t=l.contentWindow;else break;l=an(t.document)}return l}function qc(t){var l=t&&t.nodeName&&t.nodeName.toLowerCase();return l&&(l==="input"&&(t.type==="text"||t.type==="search"||t.type==="tel"||t.type==="url"||t.type==="password")||l==="textarea"||t.contentEditable==="true")}var D0=le&&"documentMode"in document&&11>=document.documentMode,Da=null,Yc=null,gu=null,Gc=!1;function gs(t,l,e){var a=e.window===e?e.document:e.nodeType===9?e:e.ownerDocument;Gc||Da==null||Da!==an(a)||(a=Da,"selectionStart"in a&&qc(a)?a={start:a.selectionStart,end:a.selectionEnd}:(a=(a.ownerDocument&&a.ownerDocument.defaultView||window).getSelection(),a={anchorNode:a.anchorNode,anchorOffset:a.anchorOffset,focusNode:a.focusNode,focusOffset:a.focusOffset}),gu&&hu(gu,a)||(gu=a,a=Pn(Yc,"onSelect"),0<a.length&&(l=new sn("onSelect","select",null,l,e),t.push({event:l,listeners:a}),l.target=Da)))}function ta(t,l){var e={};return e[t.toLowerCase()]=l.toLowerCase(),e["Webkit"+t]="webkit"+l,e["Moz"+t]="moz"+l,e}var Ca={animationend:ta("Animation","AnimationEnd"),animationiteration:ta("Animation","AnimationIteration"),animationstart:ta("Animation","AnimationStart"),transitionrun:ta("Transition","TransitionRun"),transitionstart:ta("Transition","TransitionStart"),transitioncancel:ta("Transition","TransitionCancel"),transitionend:ta("Transition","TransitionEnd")},Qc={},Ss={};le&&(Ss=document.createElement("div").style,"AnimationEvent"in window||(delete Ca.animationend.animation,delete Ca.animationiteration.animation,delete Ca.animationstart.animation),"TransitionEvent"in window||delete Ca.transitionend.transition);function la(t){if(Qc[t])return Qc[t];if(!Ca[t])return t;var l=Ca[t],e;for(e in l)if(l.hasOwnProperty(e)&&e in Ss)return Qc[t]=l[e];return t}var bs=la("animationend"),ps=la("animationiteration"),Es=la("animationstart"),C0=la("transitionrun"),U0=la("transitionstart"),R0=la("transitioncancel"),xs=la("transitionend"),As=new Map,Xc="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");Xc.push("scrollEnd");function Yl(t,l){As.set(t,l),Ie(l,[t])}var rn=typeof reportError=="function"?reportError:function(t){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var l=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof t=="object"&&t!==null&&typeof t.message=="string"?String(t.message):String(t),error:t});if(!window.dispatchEvent(l))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",t);return}console.error(t)},Ol=[],Ua=0,Zc=0;function mn(){for(var t=Ua,l=Zc=Ua=0;l<t;){var e=Ol[l];Ol[l++]=null;var a=Ol[l];Ol[l++]=null;var u=Ol[l];Ol[l++]=null;var n=Ol[l];if(Ol[l++]=null,a!==null&&u!==null){var c=a.pending;c===null?u.next=u:(u.next=c.next,c.next=u),a.pending=u}n!==0&&zs(e,u,n)}}function vn(t,l,e,a){Ol[Ua++]=t,Ol[Ua++]=l,Ol[Ua++]=e,Ol[Ua++]=a,Zc|=a,t.lanes|=a,t=t.alternate,t!==null&&(t.lanes|=a)}function Lc(t,l,e,a){return vn(t,l,e,a),yn(t)}function ea(t,l){return vn(t,null,null,l),yn(t)}function zs(t,l,e){t.lanes|=e;var a=t.alternate;a!==null&&(a.lanes|=e);for(var u=!1,n=t.return;n!==null;)n.childLanes|=e,a=n.alternate,a!==null&&(a.childLanes|=e),n.tag===22&&(t=n.stateNode,t===null||t._visibility&1||(u=!0)),t=n,n=n.return;return t.tag===3?(n=t.stateNode,u&&l!==null&&(u=31-al(e),t=n.hiddenUpdates,a=t[u],a===null?t[u]=[l]:a.push(l),l.lane=e|536870912),n):null}function yn(t){if(50<Gu)throw Gu=0,Ii=null,Error(r(185));for(var l=t.return;l!==null;)t=l,l=t.return;return t.tag===3?t.stateNode:null}var Ra={};function j0(t,l,e,a){this.tag=t,this.key=e,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=l,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=a,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function yl(t,l,e,a){return new j0(t,l,e,a)}function Vc(t){return t=t.prototype,!(!t||!t.isReactComponent)}function ee(t,l){var e=t.alternate;return e===null?(e=yl(t.tag,l,t.key,t.mode),e.elementType=t.elementType,e.type=t.type,e.stateNode=t.stateNode,e.alternate=t,t.alternate=e):(e.pendingProps=l,e.type=t.type,e.flags=0,e.subtreeFlags=0,e.deletions=null),e.flags=t.flags&65011712,e.childLanes=t.childLanes,e.lanes=t.lanes,e.child=t.child,e.memoizedProps=t.memoizedProps,e.memoizedState=t.memoizedState,e.updateQueue=t.updateQueue,l=t.dependencies,e.dependencies=l===null?null:{lanes:l.lanes,firstContext:l.firstContext},e.sibling=t.sibling,e.index=t.index,e.ref=t.ref,e.refCleanup=t.refCleanup,e}function Ts(t,l){t.flags&=65011714;var e=t.alternate;return e===null?(t.childLanes=0,t.lanes=l,t.child=null,t.subtreeFlags=0,t.memoizedProps=null,t.memoizedState=null,t.updateQueue=null,t.dependencies=null,t.stateNode=null):(t.childLanes=e.childLanes,t.lanes=e.lanes,t.child=e.child,t.subtreeFlags=0,t.deletions=null,t.memoizedProps=e.memoizedProps,t.memoizedState=e.memoizedState,t.updateQueue=e.updateQueue,t.type=e.type,l=e.dependencies,t.dependencies=l===null?null:{lanes:l.lanes,firstContext:l.firstContext}),t}function hn(t,l,e,a,u,n){var c=0;if(a=t,typeof t=="function")Vc(t)&&(c=1);else if(typeof t=="string")c=Gm(t,e,D.current)?26:t==="html"||t==="head"||t==="body"?27:5;else t:switch(t){case ml:return t=yl(31,e,l,u),t.elementType=ml,t.lanes=n,t;case Vt:return aa(e.children,u,n,l);case Hl:c=8,u|=24;break;case tl:return t=yl(12,e,l,u|2),t.elementType=tl,t.lanes=n,t;case xl:return t=yl(13,e,l,u),t.elementType=xl,t.lanes=n,t;case Kt:return t=yl(19,e,l,u),t.elementType=Kt,t.lanes=n,t;default:if(typeof t=="object"&&t!==null)switch(t.$$typeof){case qt:c=10;break t;case El:c=9;break t;case nl:c=11;break t;case W:c=14;break t;case Ft:c=16,a=null;break t}c=29,e=Error(r(130,t===null?"null":typeof t,"")),a=null}return l=yl(c,e,l,u),l.elementType=t,l.type=a,l.lanes=n,l}function aa(t,l,e,a){return t=yl(7,t,a,l),t.lanes=e,t}function Kc(t,l,e){return t=yl(6,t,null,l),t.lanes=e,t}function _s(t){var l=yl(18,null,null,0);return l.stateNode=t,l}function Jc(t,l,e){return l=yl(4,t.children!==null?t.children:[],t.key,l),l.lanes=e,l.stateNode={containerInfo:t.containerInfo,pendingChildren:null,implementation:t.implementation},l}var Os=new WeakMap;function Nl(t,l){if(typeof t=="object"&&t!==null){var e=Os.get(t);return e!==void 0?e:(l={value:t,source:l,stack:Se(l)},Os.set(t,l),l)}return{value:t,source:l,stack:Se(l)}}var ja=[],Ha=0,gn=null,Su=0,Ml=[],Dl=0,xe=null,Vl=1,Kl="";function ae(t,l){ja[Ha++]=Su,ja[Ha++]=gn,gn=t,Su=l}function Ns(t,l,e){Ml[Dl++]=Vl,Ml[Dl++]=Kl,Ml[Dl++]=xe,xe=t;var a=Vl;t=Kl;var u=32-al(a)-1;a&=~(1<<u),e+=1;var n=32-al(l)+u;if(30<n){var c=u-u%5;n=(a&(1<<c)-1).toString(32),a>>=c,u-=c,Vl=1<<32-al(l)+u|e<<u|a,Kl=n+t}else Vl=1<<n|e<<u|a,Kl=t}function wc(t){t.return!==null&&(ae(t,1),Ns(t,1,0))}function Wc(t){for(;t===gn;)gn=ja[--Ha],ja[Ha]=null,Su=ja[--Ha],ja[Ha]=null;for(;t===xe;)xe=Ml[--Dl],Ml[Dl]=null,Kl=Ml[--Dl],Ml[Dl]=null,Vl=Ml[--Dl],Ml[Dl]=null}function Ms(t,l){Ml[Dl++]=Vl,Ml[Dl++]=Kl,Ml[Dl++]=xe,Vl=l.id,Kl=l.overflow,xe=t}var Jt=null,Et=null,tt=!1,Ae=null,Cl=!1,kc=Error(r(519));function ze(t){var l=Error(r(418,1<arguments.length&&arguments[1]!==void 0&&arguments[1]?"text":"HTML",""));throw bu(Nl(l,t)),kc}function Ds(t){var l=t.stateNode,e=t.type,a=t.memoizedProps;switch(l[Ut]=t,l[Yt]=a,e){case"dialog":F("cancel",l),F("close",l);break;case"iframe":case"object":case"embed":F("load",l);break;case"video":case"audio":for(e=0;e<Xu.length;e++)F(Xu[e],l);break;case"source":F("error",l);break;case"img":case"image":case"link":F("error",l),F("load",l);break;case"details":F("toggle",l);break;case"input":F("invalid",l),Lf(l,a.value,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name,!0);break;case"select":F("invalid",l);break;case"textarea":F("invalid",l),Kf(l,a.value,a.defaultValue,a.children)}e=a.children,typeof e!="string"&&typeof e!="number"&&typeof e!="bigint"||l.textContent===""+e||a.suppressHydrationWarning===!0||Wd(l.textContent,e)?(a.popover!=null&&(F("beforetoggle",l),F("toggle",l)),a.onScroll!=null&&F("scroll",l),a.onScrollEnd!=null&&F("scrollend",l),a.onClick!=null&&(l.onclick=te),l=!0):l=!1,l||ze(t,!0)}function Cs(t){for(Jt=t.return;Jt;)switch(Jt.tag){case 5:case 31:case 13:Cl=!1;return;case 27:case 3:Cl=!0;return;default:Jt=Jt.return}}function Ba(t){if(t!==Jt)return!1;if(!tt)return Cs(t),tt=!0,!1;var l=t.tag,e;if((e=l!==3&&l!==27)&&((e=l===5)&&(e=t.type,e=!(e!=="form"&&e!=="button")||vf(t.type,t.memoizedProps)),e=!e),e&&Et&&ze(t),Cs(t),l===13){if(t=t.memoizedState,t=t!==null?t.dehydrated:null,!t)throw Error(r(317));Et=ar(t)}else if(l===31){if(t=t.memoizedState,t=t!==null?t.dehydrated:null,!t)throw Error(r(317));Et=ar(t)}else l===27?(l=Et,Ye(t.type)?(t=bf,bf=null,Et=t):Et=l):Et=Jt?Rl(t.stateNode.nextSibling):null;return!0}function ua(){Et=Jt=null,tt=!1}function $c(){var t=Ae;return t!==null&&(dl===null?dl=t:dl.push.apply(dl,t),Ae=null),t}function bu(t){Ae===null?Ae=[t]:Ae.push(t)}var Fc=o(null),na=null,ue=null;function Te(t,l,e){O(Fc,l._currentValue),l._currentValue=e}function ne(t){t._currentValue=Fc.current,x(Fc)}function Ic(t,l,e){for(;t!==null;){var a=t.alternate;if((t.childLanes&l)!==l?(t.childLanes|=l,a!==null&&(a.childLanes|=l)):a!==null&&(a.childLanes&l)!==l&&(a.childLanes|=l),t===e)break;t=t.return}}function Pc(t,l,e,a){var u=t.child;for(u!==null&&(u.return=t);u!==null;){var n=u.dependencies;if(n!==null){var c=u.child;n=n.firstContext;t:for(;n!==null;){var i=n;n=u;for(var f=0;f<l.length;f++)if(i.context===l[f]){n.lanes|=e,i=n.alternate,i!==null&&(i.lanes|=e),Ic(n.return,e,t),a||(c=null);break t}n=i.next}}else if(u.tag===18){if(c=u.return,c===null)throw Error(r(341));c.lanes|=e,n=c.alternate,n!==null&&(n.lanes|=e),Ic(c,e,t),c=null}else c=u.child;if(c!==null)c.return=u;else for(c=u;c!==null;){if(c===t){c=null;break}if(u=c.sibling,u!==null){u.return=c.return,c=u;break}c=c.return}u=c}}function qa(t,l,e,a){t=null;for(var u=l,n=!1;u!==null;){if(!n){if((u.flags&524288)!==0)n=!0;else if((u.flags&262144)!==0)break}if(u.tag===10){var c=u.alternate;if(c===null)throw Error(r(387));if(c=c.memoizedProps,c!==null){var i=u.type;vl(u.pendingProps.value,c.value)||(t!==null?t.push(i):t=[i])}}else if(u===at.current){if(c=u.alternate,c===null)throw Error(r(387));c.memoizedState.memoizedState!==u.memoizedState.memoizedState&&(t!==null?t.push(Ju):t=[Ju])}u=u.return}t!==null&&Pc(l,t,e,a),l.flags|=262144}function Sn(t){for(t=t.firstContext;t!==null;){if(!vl(t.context._currentValue,t.memoizedValue))return!0;t=t.next}return!1}function ca(t){na=t,ue=null,t=t.dependencies,t!==null&&(t.firstContext=null)}function wt(t){return Us(na,t)}function bn(t,l){return na===null&&ca(t),Us(t,l)}function Us(t,l){var e=l._currentValue;if(l={context:l,memoizedValue:e,next:null},ue===null){if(t===null)throw Error(r(308));ue=l,t.dependencies={lanes:0,firstContext:l},t.flags|=524288}else ue=ue.next=l;return e}var H0=typeof AbortController<"u"?AbortController:function(){var t=[],l=this.signal={aborted:!1,addEventListener:function(e,a){t.push(a)}};this.abort=function(){l.aborted=!0,t.forEach(function(e){return e()})}},B0=T.unstable_scheduleCallback,q0=T.unstable_NormalPriority,Rt={$$typeof:qt,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function ti(){return{controller:new H0,data:new Map,refCount:0}}function pu(t){t.refCount--,t.refCount===0&&B0(q0,function(){t.controller.abort()})}var Eu=null,li=0,Ya=0,Ga=null;function Y0(t,l){if(Eu===null){var e=Eu=[];li=0,Ya=uf(),Ga={status:"pending",value:void 0,then:function(a){e.push(a)}}}return li++,l.then(Rs,Rs),l}function Rs(){if(--li===0&&Eu!==null){Ga!==null&&(Ga.status="fulfilled");var t=Eu;Eu=null,Ya=0,Ga=null;for(var l=0;l<t.length;l++)(0,t[l])()}}function G0(t,l){var e=[],a={status:"pending",value:null,reason:null,then:function(u){e.push(u)}};return t.then(function(){a.status="fulfilled",a.value=l;for(var u=0;u<e.length;u++)(0,e[u])(l)},function(u){for(a.status="rejected",a.reason=u,u=0;u<e.length;u++)(0,e[u])(void 0)}),a}var js=g.S;g.S=function(t,l){Sd=Ot(),typeof l=="object"&&l!==null&&typeof l.then=="function"&&Y0(t,l),js!==null&&js(t,l)};var ia=o(null);function ei(){var t=ia.current;return t!==null?t:pt.pooledCache}function pn(t,l){l===null?O(ia,ia.current):O(ia,l.pool)}function Hs(){var t=ei();return t===null?null:{parent:Rt._currentValue,pool:t}}var Qa=Error(r(460)),ai=Error(r(474)),En=Error(r(542)),xn={then:function(){}};function Bs(t){return t=t.status,t==="fulfilled"||t==="rejected"}function qs(t,l,e){switch(e=t[e],e===void 0?t.push(l):e!==l&&(l.then(te,te),l=e),l.status){case"fulfilled":return l.value;case"rejected":throw t=l.reason,Gs(t),t;default:if(typeof l.status=="string")l.then(te,te);else{if(t=pt,t!==null&&100<t.shellSuspendCounter)throw Error(r(482));t=l,t.status="pending",t.then(function(a){if(l.status==="pending"){var u=l;u.status="fulfilled",u.value=a}},function(a){if(l.status==="pending"){var u=l;u.status="rejected",u.reason=a}})}switch(l.status){case"fulfilled":return l.value;case"rejected":throw t=l.reason,Gs(t),t}throw sa=l,Qa}}function fa(t){try{var l=t._init;return l(t._payload)}catch(e){throw e!==null&&typeof e=="object"&&typeof e.then=="function"?(sa=e,Qa):e}}var sa=null;function Ys(){if(sa===null)throw Error(r(459));var t=sa;return sa=null,t}function Gs(t){if(t===Qa||t===En)throw Error(r(483))}var Xa=null,xu=0;function An(t){var l=xu;return xu+=1,Xa===null&&(Xa=[]),qs(Xa,t,l)}function Au(t,l){l=l.props.ref,t.ref=l!==void 0?l:null}function zn(t,l){throw l.$$typeof===it?Error(r(525)):(t=Object.prototype.toString.call(l),Error(r(31,t==="[object Object]"?"object with keys {"+Object.keys(l).join(", ")+"}":t)))}function Qs(t){function l(d,s){if(t){var m=d.deletions;m===null?(d.deletions=[s],d.flags|=16):m.push(s)}}function e(d,s){if(!t)return null;for(;s!==null;)l(d,s),s=s.sibling;return null}function a(d){for(var s=new Map;d!==null;)d.key!==null?s.set(d.key,d):s.set(d.index,d),d=d.sibling;return s}function u(d,s){return d=ee(d,s),d.index=0,d.sibling=null,d}function n(d,s,m){return d.index=m,t?(m=d.alternate,m!==null?(m=m.index,m<s?(d.flags|=67108866,s):m):(d.flags|=67108866,s)):(d.flags|=1048576,s)}function c(d){return t&&d.alternate===null&&(d.flags|=67108866),d}function i(d,s,m,p){return s===null||s.tag!==6?(s=Kc(m,d.mode,p),s.return=d,s):(s=u(s,m),s.return=d,s)}function f(d,s,m,p){var B=m.type;return B===Vt?S(d,s,m.props.children,p,m.key):s!==null&&(s.elementType===B||typeof B=="object"&&B!==null&&B.$$typeof===Ft&&fa(B)===s.type)?(s=u(s,m.props),Au(s,m),s.return=d,s):(s=hn(m.type,m.key,m.props,null,d.mode,p),Au(s,m),s.return=d,s)}function v(d,s,m,p){return s===null||s.tag!==4||s.stateNode.containerInfo!==m.containerInfo||s.stateNode.implementation!==m.implementation?(s=Jc(m,d.mode,p),s.return=d,s):(s=u(s,m.children||[]),s.return=d,s)}function S(d,s,m,p,B){return s===null||s.tag!==7?(s=aa(m,d.mode,p,B),s.return=d,s):(s=u(s,m),s.return=d,s)}function E(d,s,m){if(typeof s=="string"&&s!==""||typeof s=="number"||typeof s=="bigint")return s=Kc(""+s,d.mode,m),s.return=d,s;if(typeof s=="object"&&s!==null){switch(s.$$typeof){case Qt:return m=hn(s.type,s.key,s.props,null,d.mode,m),Au(m,s),m.return=d,m;case $t:return s=Jc(s,d.mode,m),s.return=d,s;case Ft:return s=fa(s),E(d,s,m)}if(ll(s)||Tt(s))return s=aa(s,d.mode,m,null),s.return=d,s;if(typeof s.then=="function")return E(d,An(s),m);if(s.$$typeof===qt)return E(d,bn(d,s),m);zn(d,s)}return null}function y(d,s,m,p){var B=s!==null?s.key:null;if(typeof m=="string"&&m!==""||typeof m=="number"||typeof m=="bigint")return B!==null?null:i(d,s,""+m,p);if(typeof m=="object"&&m!==null){switch(m.$$typeof){case Qt:return m.key===B?f(d,s,m,p):null;case $t:return m.key===B?v(d,s,m,p):null;case Ft:return m=fa(m),y(d,s,m,p)}if(ll(m)||Tt(m))return B!==null?null:S(d,s,m,p,null);if(typeof m.then=="function")return y(d,s,An(m),p);if(m.$$typeof===qt)return y(d,s,bn(d,m),p);zn(d,m)}return null}function h(d,s,m,p,B){if(typeof p=="string"&&p!==""||typeof p=="number"||typeof p=="bigint")return d=d.get(m)||null,i(s,d,""+p,B);if(typeof p=="object"&&p!==null){switch(p.$$typeof){case Qt:return d=d.get(p.key===null?m:p.key)||null,f(s,d,p,B);case $t:return d=d.get(p.key===null?m:p.key)||null,v(s,d,p,B);case Ft:return p=fa(p),h(d,s,m,p,B)}if(ll(p)||Tt(p))return d=d.get(m)||null,S(s,d,p,B,null);if(typeof p.then=="function")return h(d,s,m,An(p),B);if(p.$$typeof===qt)return h(d,s,m,bn(s,p),B);zn(s,p)}return null}function M(d,s,m,p){for(var B=null,nt=null,C=s,w=s=0,P=null;C!==null&&w<m.length;w++){C.index>w?(P=C,C=null):P=C.sibling;var ct=y(d,C,m[w],p);if(ct===null){C===null&&(C=P);break}t&&C&&ct.alternate===null&&l(d,C),s=n(ct,s,w),nt===null?B=ct:nt.sibling=ct,nt=ct,C=P}if(w===m.length)return e(d,C),tt&&ae(d,w),B;if(C===null){for(;w<m.length;w++)C=E(d,m[w],p),C!==null&&(s=n(C,s,w),nt===null?B=C:nt.sibling=C,nt=C);return tt&&ae(d,w),B}for(C=a(C);w<m.length;w++)P=h(C,d,w,m[w],p),P!==null&&(t&&P.alternate!==null&&C.delete(P.key===null?w:P.key),s=n(P,s,w),nt===null?B=P:nt.sibling=P,nt=P);return t&&C.forEach(function(Le){return l(d,Le)}),tt&&ae(d,w),B}function Y(d,s,m,p){if(m==null)throw Error(r(151));for(var B=null,nt=null,C=s,w=s=0,P=null,ct=m.next();C!==null&&!ct.done;w++,ct=m.next()){C.index>w?(P=C,C=null):P=C.sibling;var Le=y(d,C,ct.value,p);if(Le===null){C===null&&(C=P);break}t&&C&&Le.alternate===null&&l(d,C),s=n(Le,s,w),nt===null?B=Le:nt.sibling=Le,nt=Le,C=P}if(ct.done)return e(d,C),tt&&ae(d,w),B;if(C===null){for(;!ct.done;w++,ct=m.next())ct=E(d,ct.value,p),ct!==null&&(s=n(ct,s,w),nt===null?B=ct:nt.sibling=ct,nt=ct);return tt&&ae(d,w),B}for(C=a(C);!ct.done;w++,ct=m.next())ct=h(C,d,w,ct.value,p),ct!==null&&(t&&ct.alternate!==null&&C.delete(ct.key===null?w:ct.key),s=n(ct,s,w),nt===null?B=ct:nt.sibling=ct,nt=ct);return t&&C.forEach(function($m){return l(d,$m)}),tt&&ae(d,w),B}function ht(d,s,m,p){if(typeof m=="object"&&m!==null&&m.type===Vt&&m.key===null&&(m=m.props.children),typeof m=="object"&&m!==null){switch(m.$$typeof){case Qt:t:{for(var B=m.key;s!==null;){if(s.key===B){if(B=m.type,B===Vt){if(s.tag===7){e(d,s.sibling),p=u(s,m.props.children),p.return=d,d=p;break t}}else if(s.elementType===B||typeof B=="object"&&B!==null&&B.$$typeof===Ft&&fa(B)===s.type){e(d,s.sibling),p=u(s,m.props),Au(p,m),p.return=d,d=p;break t}e(d,s);break}else l(d,s);s=s.sibling}m.type===Vt?(p=aa(m.props.children,d.mode,p,m.key),p.return=d,d=p):(p=hn(m.type,m.key,m.props,null,d.mode,p),Au(p,m),p.return=d,d=p)}return c(d);case $t:t:{for(B=m.key;s!==null;){if(s.key===B)if(s.tag===4&&s.stateNode.containerInfo===m.containerInfo&&s.stateNode.implementation===m.implementation){e(d,s.sibling),p=u(s,m.children||[]),p.return=d,d=p;break t}else{e(d,s);break}else l(d,s);s=s.sibling}p=Jc(m,d.mode,p),p.return=d,d=p}return c(d);case Ft:return m=fa(m),ht(d,s,m,p)}if(ll(m))return M(d,s,m,p);if(Tt(m)){if(B=Tt(m),typeof B!="function")throw Error(r(150));return m=B.call(m),Y(d,s,m,p)}if(typeof m.then=="function")return ht(d,s,An(m),p);if(m.$$typeof===qt)return ht(d,s,bn(d,m),p);zn(d,m)}return typeof m=="string"&&m!==""||typeof m=="number"||typeof m=="bigint"?(m=""+m,s!==null&&s.tag===6?(e(d,s.sibling),p=u(s,m),p.return=d,d=p):(e(d,s),p=Kc(m,d.mode,p),p.return=d,d=p),c(d)):e(d,s)}return function(d,s,m,p){try{xu=0;var B=ht(d,s,m,p);return Xa=null,B}catch(C){if(C===Qa||C===En)throw C;var nt=yl(29,C,null,d.mode);return nt.lanes=p,nt.return=d,nt}finally{}}}var oa=Qs(!0),Xs=Qs(!1),_e=!1;function ui(t){t.updateQueue={baseState:t.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function ni(t,l){t=t.updateQueue,l.updateQueue===t&&(l.updateQueue={baseState:t.baseState,firstBaseUpdate:t.firstBaseUpdate,lastBaseUpdate:t.lastBaseUpdate,shared:t.shared,callbacks:null})}function Oe(t){return{lane:t,tag:0,payload:null,callback:null,next:null}}function Ne(t,l,e){var a=t.updateQueue;if(a===null)return null;if(a=a.shared,(ft&2)!==0){var u=a.pending;return u===null?l.next=l:(l.next=u.next,u.next=l),a.pending=l,l=yn(t),zs(t,null,e),l}return vn(t,a,l,e),yn(t)}function zu(t,l,e){if(l=l.updateQueue,l!==null&&(l=l.shared,(e&4194048)!==0)){var a=l.lanes;a&=t.pendingLanes,e|=a,l.lanes=e,G(t,e)}}function ci(t,l){var e=t.updateQueue,a=t.alternate;if(a!==null&&(a=a.updateQueue,e===a)){var u=null,n=null;if(e=e.firstBaseUpdate,e!==null){do{var c={lane:e.lane,tag:e.tag,payload:e.payload,callback:null,next:null};n===null?u=n=c:n=n.next=c,e=e.next}while(e!==null);n===null?u=n=l:n=n.next=l}else u=n=l;e={baseState:a.baseState,firstBaseUpdate:u,lastBaseUpdate:n,shared:a.shared,callbacks:a.callbacks},t.updateQueue=e;return}t=e.lastBaseUpdate,t===null?e.firstBaseUpdate=l:t.next=l,e.lastBaseUpdate=l}var ii=!1;function Tu(){if(ii){var t=Ga;if(t!==null)throw t}}function _u(t,l,e,a){ii=!1;var u=t.updateQueue;_e=!1;var n=u.firstBaseUpdate,c=u.lastBaseUpdate,i=u.shared.pending;if(i!==null){u.shared.pending=null;var f=i,v=f.next;f.next=null,c===null?n=v:c.next=v,c=f;var S=t.alternate;S!==null&&(S=S.updateQueue,i=S.lastBaseUpdate,i!==c&&(i===null?S.firstBaseUpdate=v:i.next=v,S.lastBaseUpdate=f))}if(n!==null){var E=u.baseState;c=0,S=v=f=null,i=n;do{var y=i.lane&-536870913,h=y!==i.lane;if(h?(I&y)===y:(a&y)===y){y!==0&&y===Ya&&(ii=!0),S!==null&&(S=S.next={lane:0,tag:i.tag,payload:i.payload,callback:null,next:null});t:{var M=t,Y=i;y=l;var ht=e;switch(Y.tag){case 1:if(M=Y.payload,typeof M=="function"){E=M.call(ht,E,y);break t}E=M;break t;case 3:M.flags=M.flags&-65537|128;case 0:if(M=Y.payload,y=typeof M=="function"?M.call(ht,E,y):M,y==null)break t;E=H({},E,y);break t;case 2:_e=!0}}y=i.callback,y!==null&&(t.flags|=64,h&&(t.flags|=8192),h=u.callbacks,h===null?u.callbacks=[y]:h.push(y))}else h={lane:y,tag:i.tag,payload:i.payload,callback:i.callback,next:null},S===null?(v=S=h,f=E):S=S.next=h,c|=y;if(i=i.next,i===null){if(i=u.shared.pending,i===null)break;h=i,i=h.next,h.next=null,u.lastBaseUpdate=h,u.shared.pending=null}}while(!0);S===null&&(f=E),u.baseState=f,u.firstBaseUpdate=v,u.lastBaseUpdate=S,n===null&&(u.shared.lanes=0),Re|=c,t.lanes=c,t.memoizedState=E}}function Zs(t,l){if(typeof t!="function")throw Error(r(191,t));t.call(l)}function Ls(t,l){var e=t.callbacks;if(e!==null)for(t.callbacks=null,t=0;t<e.length;t++)Zs(e[t],l)}var Za=o(null),Tn=o(0);function Vs(t,l){t=ve,O(Tn,t),O(Za,l),ve=t|l.baseLanes}function fi(){O(Tn,ve),O(Za,Za.current)}function si(){ve=Tn.current,x(Za),x(Tn)}var hl=o(null),Ul=null;function Me(t){var l=t.alternate;O(Dt,Dt.current&1),O(hl,t),Ul===null&&(l===null||Za.current!==null||l.memoizedState!==null)&&(Ul=t)}function oi(t){O(Dt,Dt.current),O(hl,t),Ul===null&&(Ul=t)}function Ks(t){t.tag===22?(O(Dt,Dt.current),O(hl,t),Ul===null&&(Ul=t)):De()}function De(){O(Dt,Dt.current),O(hl,hl.current)}function gl(t){x(hl),Ul===t&&(Ul=null),x(Dt)}var Dt=o(0);function _n(t){for(var l=t;l!==null;){if(l.tag===13){var e=l.memoizedState;if(e!==null&&(e=e.dehydrated,e===null||gf(e)||Sf(e)))return l}else if(l.tag===19&&(l.memoizedProps.revealOrder==="forwards"||l.memoizedProps.revealOrder==="backwards"||l.memoizedProps.revealOrder==="unstable_legacy-backwards"||l.memoizedProps.revealOrder==="together")){if((l.flags&128)!==0)return l}else if(l.child!==null){l.child.return=l,l=l.child;continue}if(l===t)break;for(;l.sibling===null;){if(l.return===null||l.return===t)return null;l=l.return}l.sibling.return=l.return,l=l.sibling}return null}var ce=0,K=null,vt=null,jt=null,On=!1,La=!1,da=!1,Nn=0,Ou=0,Va=null,Q0=0;function Nt(){throw Error(r(321))}function di(t,l){if(l===null)return!1;for(var e=0;e<l.length&&e<t.length;e++)if(!vl(t[e],l[e]))return!1;return!0}function ri(t,l,e,a,u,n){return ce=n,K=l,l.memoizedState=null,l.updateQueue=null,l.lanes=0,g.H=t===null||t.memoizedState===null?Mo:Oi,da=!1,n=e(a,u),da=!1,La&&(n=ws(l,e,a,u)),Js(t),n}function Js(t){g.H=Du;var l=vt!==null&&vt.next!==null;if(ce=0,jt=vt=K=null,On=!1,Ou=0,Va=null,l)throw Error(r(300));t===null||Ht||(t=t.dependencies,t!==null&&Sn(t)&&(Ht=!0))}function ws(t,l,e,a){K=t;var u=0;do{if(La&&(Va=null),Ou=0,La=!1,25<=u)throw Error(r(301));if(u+=1,jt=vt=null,t.updateQueue!=null){var n=t.updateQueue;n.lastEffect=null,n.events=null,n.stores=null,n.memoCache!=null&&(n.memoCache.index=0)}g.H=Do,n=l(e,a)}while(La);return n}function X0(){var t=g.H,l=t.useState()[0];return l=typeof l.then=="function"?Nu(l):l,t=t.useState()[0],(vt!==null?vt.memoizedState:null)!==t&&(K.flags|=1024),l}function mi(){var t=Nn!==0;return Nn=0,t}function vi(t,l,e){l.updateQueue=t.updateQueue,l.flags&=-2053,t.lanes&=~e}function yi(t){if(On){for(t=t.memoizedState;t!==null;){var l=t.queue;l!==null&&(l.pending=null),t=t.next}On=!1}ce=0,jt=vt=K=null,La=!1,Ou=Nn=0,Va=null}function ul(){var t={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return jt===null?K.memoizedState=jt=t:jt=jt.next=t,jt}function Ct(){if(vt===null){var t=K.alternate;t=t!==null?t.memoizedState:null}else t=vt.next;var l=jt===null?K.memoizedState:jt.next;if(l!==null)jt=l,vt=t;else{if(t===null)throw K.alternate===null?Error(r(467)):Error(r(310));vt=t,t={memoizedState:vt.memoizedState,baseState:vt.baseState,baseQueue:vt.baseQueue,queue:vt.queue,next:null},jt===null?K.memoizedState=jt=t:jt=jt.next=t}return jt}function Mn(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function Nu(t){var l=Ou;return Ou+=1,Va===null&&(Va=[]),t=qs(Va,t,l),l=K,(jt===null?l.memoizedState:jt.next)===null&&(l=l.alternate,g.H=l===null||l.memoizedState===null?Mo:Oi),t}function Dn(t){if(t!==null&&typeof t=="object"){if(typeof t.then=="function")return Nu(t);if(t.$$typeof===qt)return wt(t)}throw Error(r(438,String(t)))}function hi(t){var l=null,e=K.updateQueue;if(e!==null&&(l=e.memoCache),l==null){var a=K.alternate;a!==null&&(a=a.updateQueue,a!==null&&(a=a.memoCache,a!=null&&(l={data:a.data.map(function(u){return u.slice()}),index:0})))}if(l==null&&(l={data:[],index:0}),e===null&&(e=Mn(),K.updateQueue=e),e.memoCache=l,e=l.data[l.index],e===void 0)for(e=l.data[l.index]=Array(t),a=0;a<t;a++)e[a]=Wl;return l.index++,e}function ie(t,l){return typeof l=="function"?l(t):l}function Cn(t){var l=Ct();return gi(l,vt,t)}function gi(t,l,e){var a=t.queue;if(a===null)throw Error(r(311));a.lastRenderedReducer=e;var u=t.baseQueue,n=a.pending;if(n!==null){if(u!==null){var c=u.next;u.next=n.next,n.next=c}l.baseQueue=u=n,a.pending=null}if(n=t.baseState,u===null)t.memoizedState=n;else{l=u.next;var i=c=null,f=null,v=l,S=!1;do{var E=v.lane&-536870913;if(E!==v.lane?(I&E)===E:(ce&E)===E){var y=v.revertLane;if(y===0)f!==null&&(f=f.next={lane:0,revertLane:0,gesture:null,action:v.action,hasEagerState:v.hasEagerState,eagerState:v.eagerState,next:null}),E===Ya&&(S=!0);else if((ce&y)===y){v=v.next,y===Ya&&(S=!0);continue}else E={lane:0,revertLane:v.revertLane,gesture:null,action:v.action,hasEagerState:v.hasEagerState,eagerState:v.eagerState,next:null},f===null?(i=f=E,c=n):f=f.next=E,K.lanes|=y,Re|=y;E=v.action,da&&e(n,E),n=v.hasEagerState?v.eagerState:e(n,E)}else y={lane:E,revertLane:v.revertLane,gesture:v.gesture,action:v.action,hasEagerState:v.hasEagerState,eagerState:v.eagerState,next:null},f===null?(i=f=y,c=n):f=f.next=y,K.lanes|=E,Re|=E;v=v.next}while(v!==null&&v!==l);if(f===null?c=n:f.next=i,!vl(n,t.memoizedState)&&(Ht=!0,S&&(e=Ga,e!==null)))throw e;t.memoizedState=n,t.baseState=c,t.baseQueue=f,a.lastRenderedState=n}return u===null&&(a.lanes=0),[t.memoizedState,a.dispatch]}function Si(t){var l=Ct(),e=l.queue;if(e===null)throw Error(r(311));e.lastRenderedReducer=t;var a=e.dispatch,u=e.pending,n=l.memoizedState;if(u!==null){e.pending=null;var c=u=u.next;do n=t(n,c.action),c=c.next;while(c!==u);vl(n,l.memoizedState)||(Ht=!0),l.memoizedState=n,l.baseQueue===null&&(l.baseState=n),e.lastRenderedState=n}return[n,a]}function Ws(t,l,e){var a=K,u=Ct(),n=tt;if(n){if(e===void 0)throw Error(r(407));e=e()}else e=l();var c=!vl((vt||u).memoizedState,e);if(c&&(u.memoizedState=e,Ht=!0),u=u.queue,Ei(Fs.bind(null,a,u,t),[t]),u.getSnapshot!==l||c||jt!==null&&jt.memoizedState.tag&1){if(a.flags|=2048,Ka(9,{destroy:void 0},$s.bind(null,a,u,e,l),null),pt===null)throw Error(r(349));n||(ce&127)!==0||ks(a,l,e)}return e}function ks(t,l,e){t.flags|=16384,t={getSnapshot:l,value:e},l=K.updateQueue,l===null?(l=Mn(),K.updateQueue=l,l.stores=[t]):(e=l.stores,e===null?l.stores=[t]:e.push(t))}function $s(t,l,e,a){l.value=e,l.getSnapshot=a,Is(l)&&Ps(t)}function Fs(t,l,e){return e(function(){Is(l)&&Ps(t)})}function Is(t){var l=t.getSnapshot;t=t.value;try{var e=l();return!vl(t,e)}catch{return!0}}function Ps(t){var l=ea(t,2);l!==null&&rl(l,t,2)}function bi(t){var l=ul();if(typeof t=="function"){var e=t;if(t=e(),da){Zl(!0);try{e()}finally{Zl(!1)}}}return l.memoizedState=l.baseState=t,l.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:ie,lastRenderedState:t},l}function to(t,l,e,a){return t.baseState=e,gi(t,vt,typeof a=="function"?a:ie)}function Z0(t,l,e,a,u){if(jn(t))throw Error(r(485));if(t=l.action,t!==null){var n={payload:u,action:t,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(c){n.listeners.push(c)}};g.T!==null?e(!0):n.isTransition=!1,a(n),e=l.pending,e===null?(n.next=l.pending=n,lo(l,n)):(n.next=e.next,l.pending=e.next=n)}}function lo(t,l){var e=l.action,a=l.payload,u=t.state;if(l.isTransition){var n=g.T,c={};g.T=c;try{var i=e(u,a),f=g.S;f!==null&&f(c,i),eo(t,l,i)}catch(v){pi(t,l,v)}finally{n!==null&&c.types!==null&&(n.types=c.types),g.T=n}}else try{n=e(u,a),eo(t,l,n)}catch(v){pi(t,l,v)}}function eo(t,l,e){e!==null&&typeof e=="object"&&typeof e.then=="function"?e.then(function(a){ao(t,l,a)},function(a){return pi(t,l,a)}):ao(t,l,e)}function ao(t,l,e){l.status="fulfilled",l.value=e,uo(l),t.state=e,l=t.pending,l!==null&&(e=l.next,e===l?t.pending=null:(e=e.next,l.next=e,lo(t,e)))}function pi(t,l,e){var a=t.pending;if(t.pending=null,a!==null){a=a.next;do l.status="rejected",l.reason=e,uo(l),l=l.next;while(l!==a)}t.action=null}function uo(t){t=t.listeners;for(var l=0;l<t.length;l++)(0,t[l])()}function no(t,l){return l}function co(t,l){if(tt){var e=pt.formState;if(e!==null){t:{var a=K;if(tt){if(Et){l:{for(var u=Et,n=Cl;u.nodeType!==8;){if(!n){u=null;break l}if(u=Rl(u.nextSibling),u===null){u=null;break l}}n=u.data,u=n==="F!"||n==="F"?u:null}if(u){Et=Rl(u.nextSibling),a=u.data==="F!";break t}}ze(a)}a=!1}a&&(l=e[0])}}return e=ul(),e.memoizedState=e.baseState=l,a={pending:null,lanes:0,dispatch:null,lastRenderedReducer:no,lastRenderedState:l},e.queue=a,e=_o.bind(null,K,a),a.dispatch=e,a=bi(!1),n=_i.bind(null,K,!1,a.queue),a=ul(),u={state:l,dispatch:null,action:t,pending:null},a.queue=u,e=Z0.bind(null,K,u,n,e),u.dispatch=e,a.memoizedState=t,[l,e,!1]}function io(t){var l=Ct();return fo(l,vt,t)}function fo(t,l,e){if(l=gi(t,l,no)[0],t=Cn(ie)[0],typeof l=="object"&&l!==null&&typeof l.then=="function")try{var a=Nu(l)}catch(c){throw c===Qa?En:c}else a=l;l=Ct();var u=l.queue,n=u.dispatch;return e!==l.memoizedState&&(K.flags|=2048,Ka(9,{destroy:void 0},L0.bind(null,u,e),null)),[a,n,t]}function L0(t,l){t.action=l}function so(t){var l=Ct(),e=vt;if(e!==null)return fo(l,e,t);Ct(),l=l.memoizedState,e=Ct();var a=e.queue.dispatch;return e.memoizedState=t,[l,a,!1]}function Ka(t,l,e,a){return t={tag:t,create:e,deps:a,inst:l,next:null},l=K.updateQueue,l===null&&(l=Mn(),K.updateQueue=l),e=l.lastEffect,e===null?l.lastEffect=t.next=t:(a=e.next,e.next=t,t.next=a,l.lastEffect=t),t}function oo(){return Ct().memoizedState}function Un(t,l,e,a){var u=ul();K.flags|=t,u.memoizedState=Ka(1|l,{destroy:void 0},e,a===void 0?null:a)}function Rn(t,l,e,a){var u=Ct();a=a===void 0?null:a;var n=u.memoizedState.inst;vt!==null&&a!==null&&di(a,vt.memoizedState.deps)?u.memoizedState=Ka(l,n,e,a):(K.flags|=t,u.memoizedState=Ka(1|l,n,e,a))}function ro(t,l){Un(8390656,8,t,l)}function Ei(t,l){Rn(2048,8,t,l)}function V0(t){K.flags|=4;var l=K.updateQueue;if(l===null)l=Mn(),K.updateQueue=l,l.events=[t];else{var e=l.events;e===null?l.events=[t]:e.push(t)}}function mo(t){var l=Ct().memoizedState;return V0({ref:l,nextImpl:t}),function(){if((ft&2)!==0)throw Error(r(440));return l.impl.apply(void 0,arguments)}}function vo(t,l){return Rn(4,2,t,l)}function yo(t,l){return Rn(4,4,t,l)}function ho(t,l){if(typeof l=="function"){t=t();var e=l(t);return function(){typeof e=="function"?e():l(null)}}if(l!=null)return t=t(),l.current=t,function(){l.current=null}}function go(t,l,e){e=e!=null?e.concat([t]):null,Rn(4,4,ho.bind(null,l,t),e)}function xi(){}function So(t,l){var e=Ct();l=l===void 0?null:l;var a=e.memoizedState;return l!==null&&di(l,a[1])?a[0]:(e.memoizedState=[t,l],t)}function bo(t,l){var e=Ct();l=l===void 0?null:l;var a=e.memoizedState;if(l!==null&&di(l,a[1]))return a[0];if(a=t(),da){Zl(!0);try{t()}finally{Zl(!1)}}return e.memoizedState=[a,l],a}function Ai(t,l,e){return e===void 0||(ce&1073741824)!==0&&(I&261930)===0?t.memoizedState=l:(t.memoizedState=e,t=pd(),K.lanes|=t,Re|=t,e)}function po(t,l,e,a){return vl(e,l)?e:Za.current!==null?(t=Ai(t,e,a),vl(t,l)||(Ht=!0),t):(ce&42)===0||(ce&1073741824)!==0&&(I&261930)===0?(Ht=!0,t.memoizedState=e):(t=pd(),K.lanes|=t,Re|=t,l)}function Eo(t,l,e,a,u){var n=N.p;N.p=n!==0&&8>n?n:8;var c=g.T,i={};g.T=i,_i(t,!1,l,e);try{var f=u(),v=g.S;if(v!==null&&v(i,f),f!==null&&typeof f=="object"&&typeof f.then=="function"){var S=G0(f,a);Mu(t,l,S,pl(t))}else Mu(t,l,a,pl(t))}catch(E){Mu(t,l,{then:function(){},status:"rejected",reason:E},pl())}finally{N.p=n,c!==null&&i.types!==null&&(c.types=i.types),g.T=c}}function K0(){}function zi(t,l,e,a){if(t.tag!==5)throw Error(r(476));var u=xo(t).queue;Eo(t,u,l,q,e===null?K0:function(){return Ao(t),e(a)})}function xo(t){var l=t.memoizedState;if(l!==null)return l;l={memoizedState:q,baseState:q,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:ie,lastRenderedState:q},next:null};var e={};return l.next={memoizedState:e,baseState:e,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:ie,lastRenderedState:e},next:null},t.memoizedState=l,t=t.alternate,t!==null&&(t.memoizedState=l),l}function Ao(t){var l=xo(t);l.next===null&&(l=t.alternate.memoizedState),Mu(t,l.next.queue,{},pl())}function Ti(){return wt(Ju)}function zo(){return Ct().memoizedState}function To(){return Ct().memoizedState}function J0(t){for(var l=t.return;l!==null;){switch(l.tag){case 24:case 3:var e=pl();t=Oe(e);var a=Ne(l,t,e);a!==null&&(rl(a,l,e),zu(a,l,e)),l={cache:ti()},t.payload=l;return}l=l.return}}function w0(t,l,e){var a=pl();e={lane:a,revertLane:0,gesture:null,action:e,hasEagerState:!1,eagerState:null,next:null},jn(t)?Oo(l,e):(e=Lc(t,l,e,a),e!==null&&(rl(e,t,a),No(e,l,a)))}function _o(t,l,e){var a=pl();Mu(t,l,e,a)}function Mu(t,l,e,a){var u={lane:a,revertLane:0,gesture:null,action:e,hasEagerState:!1,eagerState:null,next:null};if(jn(t))Oo(l,u);else{var n=t.alternate;if(t.lanes===0&&(n===null||n.lanes===0)&&(n=l.lastRenderedReducer,n!==null))try{var c=l.lastRenderedState,i=n(c,e);if(u.hasEagerState=!0,u.eagerState=i,vl(i,c))return vn(t,l,u,0),pt===null&&mn(),!1}catch{}finally{}if(e=Lc(t,l,u,a),e!==null)return rl(e,t,a),No(e,l,a),!0}return!1}function _i(t,l,e,a){if(a={lane:2,revertLane:uf(),gesture:null,action:a,hasEagerState:!1,eagerState:null,next:null},jn(t)){if(l)throw Error(r(479))}else l=Lc(t,e,a,2),l!==null&&rl(l,t,2)}function jn(t){var l=t.alternate;return t===K||l!==null&&l===K}function Oo(t,l){La=On=!0;var e=t.pending;e===null?l.next=l:(l.next=e.next,e.next=l),t.pending=l}function No(t,l,e){if((e&4194048)!==0){var a=l.lanes;a&=t.pendingLanes,e|=a,l.lanes=e,G(t,e)}}var Du={readContext:wt,use:Dn,useCallback:Nt,useContext:Nt,useEffect:Nt,useImperativeHandle:Nt,useLayoutEffect:Nt,useInsertionEffect:Nt,useMemo:Nt,useReducer:Nt,useRef:Nt,useState:Nt,useDebugValue:Nt,useDeferredValue:Nt,useTransition:Nt,useSyncExternalStore:Nt,useId:Nt,useHostTransitionStatus:Nt,useFormState:Nt,useActionState:Nt,useOptimistic:Nt,useMemoCache:Nt,useCacheRefresh:Nt};Du.useEffectEvent=Nt;var Mo={readContext:wt,use:Dn,useCallback:function(t,l){return ul().memoizedState=[t,l===void 0?null:l],t},useContext:wt,useEffect:ro,useImperativeHandle:function(t,l,e){e=e!=null?e.concat([t]):null,Un(4194308,4,ho.bind(null,l,t),e)},useLayoutEffect:function(t,l){return Un(4194308,4,t,l)},useInsertionEffect:function(t,l){Un(4,2,t,l)},useMemo:function(t,l){var e=ul();l=l===void 0?null:l;var a=t();if(da){Zl(!0);try{t()}finally{Zl(!1)}}return e.memoizedState=[a,l],a},useReducer:function(t,l,e){var a=ul();if(e!==void 0){var u=e(l);if(da){Zl(!0);try{e(l)}finally{Zl(!1)}}}else u=l;return a.memoizedState=a.baseState=u,t={pending:null,lanes:0,dispatch:null,lastRenderedReducer:t,lastRenderedState:u},a.queue=t,t=t.dispatch=w0.bind(null,K,t),[a.memoizedState,t]},useRef:function(t){var l=ul();return t={current:t},l.memoizedState=t},useState:function(t){t=bi(t);var l=t.queue,e=_o.bind(null,K,l);return l.dispatch=e,[t.memoizedState,e]},useDebugValue:xi,useDeferredValue:function(t,l){var e=ul();return Ai(e,t,l)},useTransition:function(){var t=bi(!1);return t=Eo.bind(null,K,t.queue,!0,!1),ul().memoizedState=t,[!1,t]},useSyncExternalStore:function(t,l,e){var a=K,u=ul();if(tt){if(e===void 0)throw Error(r(407));e=e()}else{if(e=l(),pt===null)throw Error(r(349));(I&127)!==0||ks(a,l,e)}u.memoizedState=e;var n={value:e,getSnapshot:l};return u.queue=n,ro(Fs.bind(null,a,n,t),[t]),a.flags|=2048,Ka(9,{destroy:void 0},$s.bind(null,a,n,e,l),null),e},useId:function(){var t=ul(),l=pt.identifierPrefix;if(tt){var e=Kl,a=Vl;e=(a&~(1<<32-al(a)-1)).toString(32)+e,l="_"+l+"R_"+e,e=Nn++,0<e&&(l+="H"+e.toString(32)),l+="_"}else e=Q0++,l="_"+l+"r_"+e.toString(32)+"_";return t.memoizedState=l},useHostTransitionStatus:Ti,useFormState:co,useActionState:co,useOptimistic:function(t){var l=ul();l.memoizedState=l.baseState=t;var e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return l.queue=e,l=_i.bind(null,K,!0,e),e.dispatch=l,[t,l]},useMemoCache:hi,useCacheRefresh:function(){return ul().memoizedState=J0.bind(null,K)},useEffectEvent:function(t){var l=ul(),e={impl:t};return l.memoizedState=e,function(){if((ft&2)!==0)throw Error(r(440));return e.impl.apply(void 0,arguments)}}},Oi={readContext:wt,use:Dn,useCallback:So,useContext:wt,useEffect:Ei,useImperativeHandle:go,useInsertionEffect:vo,useLayoutEffect:yo,useMemo:bo,useReducer:Cn,useRef:oo,useState:function(){return Cn(ie)},useDebugValue:xi,useDeferredValue:function(t,l){var e=Ct();return po(e,vt.memoizedState,t,l)},useTransition:function(){var t=Cn(ie)[0],l=Ct().memoizedState;return[typeof t=="boolean"?t:Nu(t),l]},useSyncExternalStore:Ws,useId:zo,useHostTransitionStatus:Ti,useFormState:io,useActionState:io,useOptimistic:function(t,l){var e=Ct();return to(e,vt,t,l)},useMemoCache:hi,useCacheRefresh:To};Oi.useEffectEvent=mo;var Do={readContext:wt,use:Dn,useCallback:So,useContext:wt,useEffect:Ei,useImperativeHandle:go,useInsertionEffect:vo,useLayoutEffect:yo,useMemo:bo,useReducer:Si,useRef:oo,useState:function(){return Si(ie)},useDebugValue:xi,useDeferredValue:function(t,l){var e=Ct();return vt===null?Ai(e,t,l):po(e,vt.memoizedState,t,l)},useTransition:function(){var t=Si(ie)[0],l=Ct().memoizedState;return[typeof t=="boolean"?t:Nu(t),l]},useSyncExternalStore:Ws,useId:zo,useHostTransitionStatus:Ti,useFormState:so,useActionState:so,useOptimistic:function(t,l){var e=Ct();return vt!==null?to(e,vt,t,l):(e.baseState=t,[t,e.queue.dispatch])},useMemoCache:hi,useCacheRefresh:To};Do.useEffectEvent=mo;function Ni(t,l,e,a){l=t.memoizedState,e=e(a,l),e=e==null?l:H({},l,e),t.memoizedState=e,t.lanes===0&&(t.updateQueue.baseState=e)}var Mi={enqueueSetState:function(t,l,e){t=t._reactInternals;var a=pl(),u=Oe(a);u.payload=l,e!=null&&(u.callback=e),l=Ne(t,u,a),l!==null&&(rl(l,t,a),zu(l,t,a))},enqueueReplaceState:function(t,l,e){t=t._reactInternals;var a=pl(),u=Oe(a);u.tag=1,u.payload=l,e!=null&&(u.callback=e),l=Ne(t,u,a),l!==null&&(rl(l,t,a),zu(l,t,a))},enqueueForceUpdate:function(t,l){t=t._reactInternals;var e=pl(),a=Oe(e);a.tag=2,l!=null&&(a.callback=l),l=Ne(t,a,e),l!==null&&(rl(l,t,e),zu(l,t,e))}};function Co(t,l,e,a,u,n,c){return t=t.stateNode,typeof t.shouldComponentUpdate=="function"?t.shouldComponentUpdate(a,n,c):l.prototype&&l.prototype.isPureReactComponent?!hu(e,a)||!hu(u,n):!0}function Uo(t,l,e,a){t=l.state,typeof l.componentWillReceiveProps=="function"&&l.componentWillReceiveProps(e,a),typeof l.UNSAFE_componentWillReceiveProps=="function"&&l.UNSAFE_componentWillReceiveProps(e,a),l.state!==t&&Mi.enqueueReplaceState(l,l.state,null)}function ra(t,l){var e=l;if("ref"in l){e={};for(var a in l)a!=="ref"&&(e[a]=l[a])}if(t=t.defaultProps){e===l&&(e=H({},e));for(var u in t)e[u]===void 0&&(e[u]=t[u])}return e}function Ro(t){rn(t)}function jo(t){console.error(t)}function Ho(t){rn(t)}function Hn(t,l){try{var e=t.onUncaughtError;e(l.value,{componentStack:l.stack})}catch(a){setTimeout(function(){throw a})}}function Bo(t,l,e){try{var a=t.onCaughtError;a(e.value,{componentStack:e.stack,errorBoundary:l.tag===1?l.stateNode:null})}catch(u){setTimeout(function(){throw u})}}function Di(t,l,e){return e=Oe(e),e.tag=3,e.payload={element:null},e.callback=function(){Hn(t,l)},e}function qo(t){return t=Oe(t),t.tag=3,t}function Yo(t,l,e,a){var u=e.type.getDerivedStateFromError;if(typeof u=="function"){var n=a.value;t.payload=function(){return u(n)},t.callback=function(){Bo(l,e,a)}}var c=e.stateNode;c!==null&&typeof c.componentDidCatch=="function"&&(t.callback=function(){Bo(l,e,a),typeof u!="function"&&(je===null?je=new Set([this]):je.add(this));var i=a.stack;this.componentDidCatch(a.value,{componentStack:i!==null?i:""})})}function W0(t,l,e,a,u){if(e.flags|=32768,a!==null&&typeof a=="object"&&typeof a.then=="function"){if(l=e.alternate,l!==null&&qa(l,e,u,!0),e=hl.current,e!==null){switch(e.tag){case 31:case 13:return Ul===null?wn():e.alternate===null&&Mt===0&&(Mt=3),e.flags&=-257,e.flags|=65536,e.lanes=u,a===xn?e.flags|=16384:(l=e.updateQueue,l===null?e.updateQueue=new Set([a]):l.add(a),lf(t,a,u)),!1;case 22:return e.flags|=65536,a===xn?e.flags|=16384:(l=e.updateQueue,l===null?(l={transitions:null,markerInstances:null,retryQueue:new Set([a])},e.updateQueue=l):(e=l.retryQueue,e===null?l.retryQueue=new Set([a]):e.add(a)),lf(t,a,u)),!1}throw Error(r(435,e.tag))}return lf(t,a,u),wn(),!1}if(tt)return l=hl.current,l!==null?((l.flags&65536)===0&&(l.flags|=256),l.flags|=65536,l.lanes=u,a!==kc&&(t=Error(r(422),{cause:a}),bu(Nl(t,e)))):(a!==kc&&(l=Error(r(423),{cause:a}),bu(Nl(l,e))),t=t.current.alternate,t.flags|=65536,u&=-u,t.lanes|=u,a=Nl(a,e),u=Di(t.stateNode,a,u),ci(t,u),Mt!==4&&(Mt=2)),!1;var n=Error(r(520),{cause:a});if(n=Nl(n,e),Yu===null?Yu=[n]:Yu.push(n),Mt!==4&&(Mt=2),l===null)return!0;a=Nl(a,e),e=l;do{switch(e.tag){case 3:return e.flags|=65536,t=u&-u,e.lanes|=t,t=Di(e.stateNode,a,t),ci(e,t),!1;case 1:if(l=e.type,n=e.stateNode,(e.flags&128)===0&&(typeof l.getDerivedStateFromError=="function"||n!==null&&typeof n.componentDidCatch=="function"&&(je===null||!je.has(n))))return e.flags|=65536,u&=-u,e.lanes|=u,u=qo(u),Yo(u,t,e,a),ci(e,u),!1}e=e.return}while(e!==null);return!1}var Ci=Error(r(461)),Ht=!1;function Wt(t,l,e,a){l.child=t===null?Xs(l,null,e,a):oa(l,t.child,e,a)}function Go(t,l,e,a,u){e=e.render;var n=l.ref;if("ref"in a){var c={};for(var i in a)i!=="ref"&&(c[i]=a[i])}else c=a;return ca(l),a=ri(t,l,e,c,n,u),i=mi(),t!==null&&!Ht?(vi(t,l,u),fe(t,l,u)):(tt&&i&&wc(l),l.flags|=1,Wt(t,l,a,u),l.child)}function Qo(t,l,e,a,u){if(t===null){var n=e.type;return typeof n=="function"&&!Vc(n)&&n.defaultProps===void 0&&e.compare===null?(l.tag=15,l.type=n,Xo(t,l,n,a,u)):(t=hn(e.type,null,a,l,l.mode,u),t.ref=l.ref,t.return=l,l.child=t)}if(n=t.child,!Gi(t,u)){var c=n.memoizedProps;if(e=e.compare,e=e!==null?e:hu,e(c,a)&&t.ref===l.ref)return fe(t,l,u)}return l.flags|=1,t=ee(n,a),t.ref=l.ref,t.return=l,l.child=t}function Xo(t,l,e,a,u){if(t!==null){var n=t.memoizedProps;if(hu(n,a)&&t.ref===l.ref)if(Ht=!1,l.pendingProps=a=n,Gi(t,u))(t.flags&131072)!==0&&(Ht=!0);else return l.lanes=t.lanes,fe(t,l,u)}return Ui(t,l,e,a,u)}function Zo(t,l,e,a){var u=a.children,n=t!==null?t.memoizedState:null;if(t===null&&l.stateNode===null&&(l.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),a.mode==="hidden"){if((l.flags&128)!==0){if(n=n!==null?n.baseLanes|e:e,t!==null){for(a=l.child=t.child,u=0;a!==null;)u=u|a.lanes|a.childLanes,a=a.sibling;a=u&~n}else a=0,l.child=null;return Lo(t,l,n,e,a)}if((e&536870912)!==0)l.memoizedState={baseLanes:0,cachePool:null},t!==null&&pn(l,n!==null?n.cachePool:null),n!==null?Vs(l,n):fi(),Ks(l);else return a=l.lanes=536870912,Lo(t,l,n!==null?n.baseLanes|e:e,e,a)}else n!==null?(pn(l,n.cachePool),Vs(l,n),De(),l.memoizedState=null):(t!==null&&pn(l,null),fi(),De());return Wt(t,l,u,e),l.child}function Cu(t,l){return t!==null&&t.tag===22||l.stateNode!==null||(l.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),l.sibling}function Lo(t,l,e,a,u){var n=ei();return n=n===null?null:{parent:Rt._currentValue,pool:n},l.memoizedState={baseLanes:e,cachePool:n},t!==null&&pn(l,null),fi(),Ks(l),t!==null&&qa(t,l,a,!0),l.childLanes=u,null}function Bn(t,l){return l=Yn({mode:l.mode,children:l.children},t.mode),l.ref=t.ref,t.child=l,l.return=t,l}function Vo(t,l,e){return oa(l,t.child,null,e),t=Bn(l,l.pendingProps),t.flags|=2,gl(l),l.memoizedState=null,t}function k0(t,l,e){var a=l.pendingProps,u=(l.flags&128)!==0;if(l.flags&=-129,t===null){if(tt){if(a.mode==="hidden")return t=Bn(l,a),l.lanes=536870912,Cu(null,t);if(oi(l),(t=Et)?(t=er(t,Cl),t=t!==null&&t.data==="&"?t:null,t!==null&&(l.memoizedState={dehydrated:t,treeContext:xe!==null?{id:Vl,overflow:Kl}:null,retryLane:536870912,hydrationErrors:null},e=_s(t),e.return=l,l.child=e,Jt=l,Et=null)):t=null,t===null)throw ze(l);return l.lanes=536870912,null}return Bn(l,a)}var n=t.memoizedState;if(n!==null){var c=n.dehydrated;if(oi(l),u)if(l.flags&256)l.flags&=-257,l=Vo(t,l,e);else if(l.memoizedState!==null)l.child=t.child,l.flags|=128,l=null;else throw Error(r(558));else if(Ht||qa(t,l,e,!1),u=(e&t.childLanes)!==0,Ht||u){if(a=pt,a!==null&&(c=ut(a,e),c!==0&&c!==n.retryLane))throw n.retryLane=c,ea(t,c),rl(a,t,c),Ci;wn(),l=Vo(t,l,e)}else t=n.treeContext,Et=Rl(c.nextSibling),Jt=l,tt=!0,Ae=null,Cl=!1,t!==null&&Ms(l,t),l=Bn(l,a),l.flags|=4096;return l}return t=ee(t.child,{mode:a.mode,children:a.children}),t.ref=l.ref,l.child=t,t.return=l,t}function qn(t,l){var e=l.ref;if(e===null)t!==null&&t.ref!==null&&(l.flags|=4194816);else{if(typeof e!="function"&&typeof e!="object")throw Error(r(284));(t===null||t.ref!==e)&&(l.flags|=4194816)}}function Ui(t,l,e,a,u){return ca(l),e=ri(t,l,e,a,void 0,u),a=mi(),t!==null&&!Ht?(vi(t,l,u),fe(t,l,u)):(tt&&a&&wc(l),l.flags|=1,Wt(t,l,e,u),l.child)}function Ko(t,l,e,a,u,n){return ca(l),l.updateQueue=null,e=ws(l,a,e,u),Js(t),a=mi(),t!==null&&!Ht?(vi(t,l,n),fe(t,l,n)):(tt&&a&&wc(l),l.flags|=1,Wt(t,l,e,n),l.child)}function Jo(t,l,e,a,u){if(ca(l),l.stateNode===null){var n=Ra,c=e.contextType;typeof c=="object"&&c!==null&&(n=wt(c)),n=new e(a,n),l.memoizedState=n.state!==null&&n.state!==void 0?n.state:null,n.updater=Mi,l.stateNode=n,n._reactInternals=l,n=l.stateNode,n.props=a,n.state=l.memoizedState,n.refs={},ui(l),c=e.contextType,n.context=typeof c=="object"&&c!==null?wt(c):Ra,n.state=l.memoizedState,c=e.getDerivedStateFromProps,typeof c=="function"&&(Ni(l,e,c,a),n.state=l.memoizedState),typeof e.getDerivedStateFromProps=="function"||typeof n.getSnapshotBeforeUpdate=="function"||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(c=n.state,typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount(),c!==n.state&&Mi.enqueueReplaceState(n,n.state,null),_u(l,a,n,u),Tu(),n.state=l.memoizedState),typeof n.componentDidMount=="function"&&(l.flags|=4194308),a=!0}else if(t===null){n=l.stateNode;var i=l.memoizedProps,f=ra(e,i);n.props=f;var v=n.context,S=e.contextType;c=Ra,typeof S=="object"&&S!==null&&(c=wt(S));var E=e.getDerivedStateFromProps;S=typeof E=="function"||typeof n.getSnapshotBeforeUpdate=="function",i=l.pendingProps!==i,S||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(i||v!==c)&&Uo(l,n,a,c),_e=!1;var y=l.memoizedState;n.state=y,_u(l,a,n,u),Tu(),v=l.memoizedState,i||y!==v||_e?(typeof E=="function"&&(Ni(l,e,E,a),v=l.memoizedState),(f=_e||Co(l,e,f,a,y,v,c))?(S||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount()),typeof n.componentDidMount=="function"&&(l.flags|=4194308)):(typeof n.componentDidMount=="function"&&(l.flags|=4194308),l.memoizedProps=a,l.memoizedState=v),n.props=a,n.state=v,n.context=c,a=f):(typeof n.componentDidMount=="function"&&(l.flags|=4194308),a=!1)}else{n=l.stateNode,ni(t,l),c=l.memoizedProps,S=ra(e,c),n.props=S,E=l.pendingProps,y=n.context,v=e.contextType,f=Ra,typeof v=="object"&&v!==null&&(f=wt(v)),i=e.getDerivedStateFromProps,(v=typeof i=="function"||typeof n.getSnapshotBeforeUpdate=="function")||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(c!==E||y!==f)&&Uo(l,n,a,f),_e=!1,y=l.memoizedState,n.state=y,_u(l,a,n,u),Tu();var h=l.memoizedState;c!==E||y!==h||_e||t!==null&&t.dependencies!==null&&Sn(t.dependencies)?(typeof i=="function"&&(Ni(l,e,i,a),h=l.memoizedState),(S=_e||Co(l,e,S,a,y,h,f)||t!==null&&t.dependencies!==null&&Sn(t.dependencies))?(v||typeof n.UNSAFE_componentWillUpdate!="function"&&typeof n.componentWillUpdate!="function"||(typeof n.componentWillUpdate=="function"&&n.componentWillUpdate(a,h,f),typeof n.UNSAFE_componentWillUpdate=="function"&&n.UNSAFE_componentWillUpdate(a,h,f)),typeof n.componentDidUpdate=="function"&&(l.flags|=4),typeof n.getSnapshotBeforeUpdate=="function"&&(l.flags|=1024)):(typeof n.componentDidUpdate!="function"||c===t.memoizedProps&&y===t.memoizedState||(l.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||c===t.memoizedProps&&y===t.memoizedState||(l.flags|=1024),l.memoizedProps=a,l.memoizedState=h),n.props=a,n.state=h,n.context=f,a=S):(typeof n.componentDidUpdate!="function"||c===t.memoizedProps&&y===t.memoizedState||(l.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||c===t.memoizedProps&&y===t.memoizedState||(l.flags|=1024),a=!1)}return n=a,qn(t,l),a=(l.flags&128)!==0,n||a?(n=l.stateNode,e=a&&typeof e.getDerivedStateFromError!="function"?null:n.render(),l.flags|=1,t!==null&&a?(l.child=oa(l,t.child,null,u),l.child=oa(l,null,e,u)):Wt(t,l,e,u),l.memoizedState=n.state,t=l.child):t=fe(t,l,u),t}function wo(t,l,e,a){return ua(),l.flags|=256,Wt(t,l,e,a),l.child}var Ri={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function ji(t){return{baseLanes:t,cachePool:Hs()}}function Hi(t,l,e){return t=t!==null?t.childLanes&~e:0,l&&(t|=bl),t}function Wo(t,l,e){var a=l.pendingProps,u=!1,n=(l.flags&128)!==0,c;if((c=n)||(c=t!==null&&t.memoizedState===null?!1:(Dt.current&2)!==0),c&&(u=!0,l.flags&=-129),c=(l.flags&32)!==0,l.flags&=-33,t===null){if(tt){if(u?Me(l):De(),(t=Et)?(t=er(t,Cl),t=t!==null&&t.data!=="&"?t:null,t!==null&&(l.memoizedState={dehydrated:t,treeContext:xe!==null?{id:Vl,overflow:Kl}:null,retryLane:536870912,hydrationErrors:null},e=_s(t),e.return=l,l.child=e,Jt=l,Et=null)):t=null,t===null)throw ze(l);return Sf(t)?l.lanes=32:l.lanes=536870912,null}var i=a.children;return a=a.fallback,u?(De(),u=l.mode,i=Yn({mode:"hidden",children:i},u),a=aa(a,u,e,null),i.return=l,a.return=l,i.sibling=a,l.child=i,a=l.child,a.memoizedState=ji(e),a.childLanes=Hi(t,c,e),l.memoizedState=Ri,Cu(null,a)):(Me(l),Bi(l,i))}var f=t.memoizedState;if(f!==null&&(i=f.dehydrated,i!==null)){if(n)l.flags&256?(Me(l),l.flags&=-257,l=qi(t,l,e)):l.memoizedState!==null?(De(),l.child=t.child,l.flags|=128,l=null):(De(),i=a.fallback,u=l.mode,a=Yn({mode:"visible",children:a.children},u),i=aa(i,u,e,null),i.flags|=2,a.return=l,i.return=l,a.sibling=i,l.child=a,oa(l,t.child,null,e),a=l.child,a.memoizedState=ji(e),a.childLanes=Hi(t,c,e),l.memoizedState=Ri,l=Cu(null,a));else if(Me(l),Sf(i)){if(c=i.nextSibling&&i.nextSibling.dataset,c)var v=c.dgst;c=v,a=Error(r(419)),a.stack="",a.digest=c,bu({value:a,source:null,stack:null}),l=qi(t,l,e)}else if(Ht||qa(t,l,e,!1),c=(e&t.childLanes)!==0,Ht||c){if(c=pt,c!==null&&(a=ut(c,e),a!==0&&a!==f.retryLane))throw f.retryLane=a,ea(t,a),rl(c,t,a),Ci;gf(i)||wn(),l=qi(t,l,e)}else gf(i)?(l.flags|=192,l.child=t.child,l=null):(t=f.treeContext,Et=Rl(i.nextSibling),Jt=l,tt=!0,Ae=null,Cl=!1,t!==null&&Ms(l,t),l=Bi(l,a.children),l.flags|=4096);return l}return u?(De(),i=a.fallback,u=l.mode,f=t.child,v=f.sibling,a=ee(f,{mode:"hidden",children:a.children}),a.subtreeFlags=f.subtreeFlags&65011712,v!==null?i=ee(v,i):(i=aa(i,u,e,null),i.flags|=2),i.return=l,a.return=l,a.sibling=i,l.child=a,Cu(null,a),a=l.child,i=t.child.memoizedState,i===null?i=ji(e):(u=i.cachePool,u!==null?(f=Rt._currentValue,u=u.parent!==f?{parent:f,pool:f}:u):u=Hs(),i={baseLanes:i.baseLanes|e,cachePool:u}),a.memoizedState=i,a.childLanes=Hi(t,c,e),l.memoizedState=Ri,Cu(t.child,a)):(Me(l),e=t.child,t=e.sibling,e=ee(e,{mode:"visible",children:a.children}),e.return=l,e.sibling=null,t!==null&&(c=l.deletions,c===null?(l.deletions=[t],l.flags|=16):c.push(t)),l.child=e,l.memoizedState=null,e)}function Bi(t,l){return l=Yn({mode:"visible",children:l},t.mode),l.return=t,t.child=l}function Yn(t,l){return t=yl(22,t,null,l),t.lanes=0,t}function qi(t,l,e){return oa(l,t.child,null,e),t=Bi(l,l.pendingProps.children),t.flags|=2,l.memoizedState=null,t}function ko(t,l,e){t.lanes|=l;var a=t.alternate;a!==null&&(a.lanes|=l),Ic(t.return,l,e)}function Yi(t,l,e,a,u,n){var c=t.memoizedState;c===null?t.memoizedState={isBackwards:l,rendering:null,renderingStartTime:0,last:a,tail:e,tailMode:u,treeForkCount:n}:(c.isBackwards=l,c.rendering=null,c.renderingStartTime=0,c.last=a,c.tail=e,c.tailMode=u,c.treeForkCount=n)}function $o(t,l,e){var a=l.pendingProps,u=a.revealOrder,n=a.tail;a=a.children;var c=Dt.current,i=(c&2)!==0;if(i?(c=c&1|2,l.flags|=128):c&=1,O(Dt,c),Wt(t,l,a,e),a=tt?Su:0,!i&&t!==null&&(t.flags&128)!==0)t:for(t=l.child;t!==null;){if(t.tag===13)t.memoizedState!==null&&ko(t,e,l);else if(t.tag===19)ko(t,e,l);else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break t;for(;t.sibling===null;){if(t.return===null||t.return===l)break t;t=t.return}t.sibling.return=t.return,t=t.sibling}switch(u){case"forwards":for(e=l.child,u=null;e!==null;)t=e.alternate,t!==null&&_n(t)===null&&(u=e),e=e.sibling;e=u,e===null?(u=l.child,l.child=null):(u=e.sibling,e.sibling=null),Yi(l,!1,u,e,n,a);break;case"backwards":case"unstable_legacy-backwards":for(e=null,u=l.child,l.child=null;u!==null;){if(t=u.alternate,t!==null&&_n(t)===null){l.child=u;break}t=u.sibling,u.sibling=e,e=u,u=t}Yi(l,!0,e,null,n,a);break;case"together":Yi(l,!1,null,null,void 0,a);break;default:l.memoizedState=null}return l.child}function fe(t,l,e){if(t!==null&&(l.dependencies=t.dependencies),Re|=l.lanes,(e&l.childLanes)===0)if(t!==null){if(qa(t,l,e,!1),(e&l.childLanes)===0)return null}else return null;if(t!==null&&l.child!==t.child)throw Error(r(153));if(l.child!==null){for(t=l.child,e=ee(t,t.pendingProps),l.child=e,e.return=l;t.sibling!==null;)t=t.sibling,e=e.sibling=ee(t,t.pendingProps),e.return=l;e.sibling=null}return l.child}function Gi(t,l){return(t.lanes&l)!==0?!0:(t=t.dependencies,!!(t!==null&&Sn(t)))}function $0(t,l,e){switch(l.tag){case 3:Xt(l,l.stateNode.containerInfo),Te(l,Rt,t.memoizedState.cache),ua();break;case 27:case 5:Xl(l);break;case 4:Xt(l,l.stateNode.containerInfo);break;case 10:Te(l,l.type,l.memoizedProps.value);break;case 31:if(l.memoizedState!==null)return l.flags|=128,oi(l),null;break;case 13:var a=l.memoizedState;if(a!==null)return a.dehydrated!==null?(Me(l),l.flags|=128,null):(e&l.child.childLanes)!==0?Wo(t,l,e):(Me(l),t=fe(t,l,e),t!==null?t.sibling:null);Me(l);break;case 19:var u=(t.flags&128)!==0;if(a=(e&l.childLanes)!==0,a||(qa(t,l,e,!1),a=(e&l.childLanes)!==0),u){if(a)return $o(t,l,e);l.flags|=128}if(u=l.memoizedState,u!==null&&(u.rendering=null,u.tail=null,u.lastEffect=null),O(Dt,Dt.current),a)break;return null;case 22:return l.lanes=0,Zo(t,l,e,l.pendingProps);case 24:Te(l,Rt,t.memoizedState.cache)}return fe(t,l,e)}function Fo(t,l,e){if(t!==null)if(t.memoizedProps!==l.pendingProps)Ht=!0;else{if(!Gi(t,e)&&(l.flags&128)===0)return Ht=!1,$0(t,l,e);Ht=(t.flags&131072)!==0}else Ht=!1,tt&&(l.flags&1048576)!==0&&Ns(l,Su,l.index);switch(l.lanes=0,l.tag){case 16:t:{var a=l.pendingProps;if(t=fa(l.elementType),l.type=t,typeof t=="function")Vc(t)?(a=ra(t,a),l.tag=1,l=Jo(null,l,t,a,e)):(l.tag=0,l=Ui(null,l,t,a,e));else{if(t!=null){var u=t.$$typeof;if(u===nl){l.tag=11,l=Go(null,l,t,a,e);break t}else if(u===W){l.tag=14,l=Qo(null,l,t,a,e);break t}}throw l=cl(t)||t,Error(r(306,l,""))}}return l;case 0:return Ui(t,l,l.type,l.pendingProps,e);case 1:return a=l.type,u=ra(a,l.pendingProps),Jo(t,l,a,u,e);case 3:t:{if(Xt(l,l.stateNode.containerInfo),t===null)throw Error(r(387));a=l.pendingProps;var n=l.memoizedState;u=n.element,ni(t,l),_u(l,a,null,e);var c=l.memoizedState;if(a=c.cache,Te(l,Rt,a),a!==n.cache&&Pc(l,[Rt],e,!0),Tu(),a=c.element,n.isDehydrated)if(n={element:a,isDehydrated:!1,cache:c.cache},l.updateQueue.baseState=n,l.memoizedState=n,l.flags&256){l=wo(t,l,a,e);break t}else if(a!==u){u=Nl(Error(r(424)),l),bu(u),l=wo(t,l,a,e);break t}else{switch(t=l.stateNode.containerInfo,t.nodeType){case 9:t=t.body;break;default:t=t.nodeName==="HTML"?t.ownerDocument.body:t}for(Et=Rl(t.firstChild),Jt=l,tt=!0,Ae=null,Cl=!0,e=Xs(l,null,a,e),l.child=e;e;)e.flags=e.flags&-3|4096,e=e.sibling}else{if(ua(),a===u){l=fe(t,l,e);break t}Wt(t,l,a,e)}l=l.child}return l;case 26:return qn(t,l),t===null?(e=fr(l.type,null,l.pendingProps,null))?l.memoizedState=e:tt||(e=l.type,t=l.pendingProps,a=tc(X.current).createElement(e),a[Ut]=l,a[Yt]=t,kt(a,e,t),Zt(a),l.stateNode=a):l.memoizedState=fr(l.type,t.memoizedProps,l.pendingProps,t.memoizedState),null;case 27:return Xl(l),t===null&&tt&&(a=l.stateNode=nr(l.type,l.pendingProps,X.current),Jt=l,Cl=!0,u=Et,Ye(l.type)?(bf=u,Et=Rl(a.firstChild)):Et=u),Wt(t,l,l.pendingProps.children,e),qn(t,l),t===null&&(l.flags|=4194304),l.child;case 5:return t===null&&tt&&((u=a=Et)&&(a=_m(a,l.type,l.pendingProps,Cl),a!==null?(l.stateNode=a,Jt=l,Et=Rl(a.firstChild),Cl=!1,u=!0):u=!1),u||ze(l)),Xl(l),u=l.type,n=l.pendingProps,c=t!==null?t.memoizedProps:null,a=n.children,vf(u,n)?a=null:c!==null&&vf(u,c)&&(l.flags|=32),l.memoizedState!==null&&(u=ri(t,l,X0,null,null,e),Ju._currentValue=u),qn(t,l),Wt(t,l,a,e),l.child;case 6:return t===null&&tt&&((t=e=Et)&&(e=Om(e,l.pendingProps,Cl),e!==null?(l.stateNode=e,Jt=l,Et=null,t=!0):t=!1),t||ze(l)),null;case 13:return Wo(t,l,e);case 4:return Xt(l,l.stateNode.containerInfo),a=l.pendingProps,t===null?l.child=oa(l,null,a,e):Wt(t,l,a,e),l.child;case 11:return Go(t,l,l.type,l.pendingProps,e);case 7:return Wt(t,l,l.pendingProps,e),l.child;case 8:return Wt(t,l,l.pendingProps.children,e),l.child;case 12:return Wt(t,l,l.pendingProps.children,e),l.child;case 10:return a=l.pendingProps,Te(l,l.type,a.value),Wt(t,l,a.children,e),l.child;case 9:return u=l.type._context,a=l.pendingProps.children,ca(l),u=wt(u),a=a(u),l.flags|=1,Wt(t,l,a,e),l.child;case 14:return Qo(t,l,l.type,l.pendingProps,e);case 15:return Xo(t,l,l.type,l.pendingProps,e);case 19:return $o(t,l,e);case 31:return k0(t,l,e);case 22:return Zo(t,l,e,l.pendingProps);case 24:return ca(l),a=wt(Rt),t===null?(u=ei(),u===null&&(u=pt,n=ti(),u.pooledCache=n,n.refCount++,n!==null&&(u.pooledCacheLanes|=e),u=n),l.memoizedState={parent:a,cache:u},ui(l),Te(l,Rt,u)):((t.lanes&e)!==0&&(ni(t,l),_u(l,null,null,e),Tu()),u=t.memoizedState,n=l.memoizedState,u.parent!==a?(u={parent:a,cache:a},l.memoizedState=u,l.lanes===0&&(l.memoizedState=l.updateQueue.baseState=u),Te(l,Rt,a)):(a=n.cache,Te(l,Rt,a),a!==u.cache&&Pc(l,[Rt],e,!0))),Wt(t,l,l.pendingProps.children,e),l.child;case 29:throw l.pendingProps}throw Error(r(156,l.tag))}function se(t){t.flags|=4}function Qi(t,l,e,a,u){if((l=(t.mode&32)!==0)&&(l=!1),l){if(t.flags|=16777216,(u&335544128)===u)if(t.stateNode.complete)t.flags|=8192;else if(zd())t.flags|=8192;else throw sa=xn,ai}else t.flags&=-16777217}function Io(t,l){if(l.type!=="stylesheet"||(l.state.loading&4)!==0)t.flags&=-16777217;else if(t.flags|=16777216,!mr(l))if(zd())t.flags|=8192;else throw sa=xn,ai}function Gn(t,l){l!==null&&(t.flags|=4),t.flags&16384&&(l=t.tag!==22?pa():536870912,t.lanes|=l,ka|=l)}function Uu(t,l){if(!tt)switch(t.tailMode){case"hidden":l=t.tail;for(var e=null;l!==null;)l.alternate!==null&&(e=l),l=l.sibling;e===null?t.tail=null:e.sibling=null;break;case"collapsed":e=t.tail;for(var a=null;e!==null;)e.alternate!==null&&(a=e),e=e.sibling;a===null?l||t.tail===null?t.tail=null:t.tail.sibling=null:a.sibling=null}}function xt(t){var l=t.alternate!==null&&t.alternate.child===t.child,e=0,a=0;if(l)for(var u=t.child;u!==null;)e|=u.lanes|u.childLanes,a|=u.subtreeFlags&65011712,a|=u.flags&65011712,u.return=t,u=u.sibling;else for(u=t.child;u!==null;)e|=u.lanes|u.childLanes,a|=u.subtreeFlags,a|=u.flags,u.return=t,u=u.sibling;return t.subtreeFlags|=a,t.childLanes=e,l}function F0(t,l,e){var a=l.pendingProps;switch(Wc(l),l.tag){case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return xt(l),null;case 1:return xt(l),null;case 3:return e=l.stateNode,a=null,t!==null&&(a=t.memoizedState.cache),l.memoizedState.cache!==a&&(l.flags|=2048),ne(Rt),ot(),e.pendingContext&&(e.context=e.pendingContext,e.pendingContext=null),(t===null||t.child===null)&&(Ba(l)?se(l):t===null||t.memoizedState.isDehydrated&&(l.flags&256)===0||(l.flags|=1024,$c())),xt(l),null;case 26:var u=l.type,n=l.memoizedState;return t===null?(se(l),n!==null?(xt(l),Io(l,n)):(xt(l),Qi(l,u,null,a,e))):n?n!==t.memoizedState?(se(l),xt(l),Io(l,n)):(xt(l),l.flags&=-16777217):(t=t.memoizedProps,t!==a&&se(l),xt(l),Qi(l,u,t,a,e)),null;case 27:if(_t(l),e=X.current,u=l.type,t!==null&&l.stateNode!=null)t.memoizedProps!==a&&se(l);else{if(!a){if(l.stateNode===null)throw Error(r(166));return xt(l),null}t=D.current,Ba(l)?Ds(l):(t=nr(u,a,e),l.stateNode=t,se(l))}return xt(l),null;case 5:if(_t(l),u=l.type,t!==null&&l.stateNode!=null)t.memoizedProps!==a&&se(l);else{if(!a){if(l.stateNode===null)throw Error(r(166));return xt(l),null}if(n=D.current,Ba(l))Ds(l);else{var c=tc(X.current);switch(n){case 1:n=c.createElementNS("http://www.w3.org/2000/svg",u);break;case 2:n=c.createElementNS("http://www.w3.org/1998/Math/MathML",u);break;default:switch(u){case"svg":n=c.createElementNS("http://www.w3.org/2000/svg",u);break;case"math":n=c.createElementNS("http://www.w3.org/1998/Math/MathML",u);break;case"script":n=c.createElement("div"),n.innerHTML="<script><\/script>",n=n.removeChild(n.firstChild);break;case"select":n=typeof a.is=="string"?c.createElement("select",{is:a.is}):c.createElement("select"),a.multiple?n.multiple=!0:a.size&&(n.size=a.size);break;default:n=typeof a.is=="string"?c.createElement(u,{is:a.is}):c.createElement(u)}}n[Ut]=l,n[Yt]=a;t:for(c=l.child;c!==null;){if(c.tag===5||c.tag===6)n.appendChild(c.stateNode);else if(c.tag!==4&&c.tag!==27&&c.child!==null){c.child.return=c,c=c.child;continue}if(c===l)break t;for(;c.sibling===null;){if(c.return===null||c.return===l)break t;c=c.return}c.sibling.return=c.return,c=c.sibling}l.stateNode=n;t:switch(kt(n,u,a),u){case"button":case"input":case"select":case"textarea":a=!!a.autoFocus;break t;case"img":a=!0;break t;default:a=!1}a&&se(l)}}return xt(l),Qi(l,l.type,t===null?null:t.memoizedProps,l.pendingProps,e),null;case 6:if(t&&l.stateNode!=null)t.memoizedProps!==a&&se(l);else{if(typeof a!="string"&&l.stateNode===null)throw Error(r(166));if(t=X.current,Ba(l)){if(t=l.stateNode,e=l.memoizedProps,a=null,u=Jt,u!==null)switch(u.tag){case 27:case 5:a=u.memoizedProps}t[Ut]=l,t=!!(t.nodeValue===e||a!==null&&a.suppressHydrationWarning===!0||Wd(t.nodeValue,e)),t||ze(l,!0)}else t=tc(t).createTextNode(a),t[Ut]=l,l.stateNode=t}return xt(l),null;case 31:if(e=l.memoizedState,t===null||t.memoizedState!==null){if(a=Ba(l),e!==null){if(t===null){if(!a)throw Error(r(318));if(t=l.memoizedState,t=t!==null?t.dehydrated:null,!t)throw Error(r(557));t[Ut]=l}else ua(),(l.flags&128)===0&&(l.memoizedState=null),l.flags|=4;xt(l),t=!1}else e=$c(),t!==null&&t.memoizedState!==null&&(t.memoizedState.hydrationErrors=e),t=!0;if(!t)return l.flags&256?(gl(l),l):(gl(l),null);if((l.flags&128)!==0)throw Error(r(558))}return xt(l),null;case 13:if(a=l.memoizedState,t===null||t.memoizedState!==null&&t.memoizedState.dehydrated!==null){if(u=Ba(l),a!==null&&a.dehydrated!==null){if(t===null){if(!u)throw Error(r(318));if(u=l.memoizedState,u=u!==null?u.dehydrated:null,!u)throw Error(r(317));u[Ut]=l}else ua(),(l.flags&128)===0&&(l.memoizedState=null),l.flags|=4;xt(l),u=!1}else u=$c(),t!==null&&t.memoizedState!==null&&(t.memoizedState.hydrationErrors=u),u=!0;if(!u)return l.flags&256?(gl(l),l):(gl(l),null)}return gl(l),(l.flags&128)!==0?(l.lanes=e,l):(e=a!==null,t=t!==null&&t.memoizedState!==null,e&&(a=l.child,u=null,a.alternate!==null&&a.alternate.memoizedState!==null&&a.alternate.memoizedState.cachePool!==null&&(u=a.alternate.memoizedState.cachePool.pool),n=null,a.memoizedState!==null&&a.memoizedState.cachePool!==null&&(n=a.memoizedState.cachePool.pool),n!==u&&(a.flags|=2048)),e!==t&&e&&(l.child.flags|=8192),Gn(l,l.updateQueue),xt(l),null);case 4:return ot(),t===null&&sf(l.stateNode.containerInfo),xt(l),null;case 10:return ne(l.type),xt(l),null;case 19:if(x(Dt),a=l.memoizedState,a===null)return xt(l),null;if(u=(l.flags&128)!==0,n=a.rendering,n===null)if(u)Uu(a,!1);else{if(Mt!==0||t!==null&&(t.flags&128)!==0)for(t=l.child;t!==null;){if(n=_n(t),n!==null){for(l.flags|=128,Uu(a,!1),t=n.updateQueue,l.updateQueue=t,Gn(l,t),l.subtreeFlags=0,t=e,e=l.child;e!==null;)Ts(e,t),e=e.sibling;return O(Dt,Dt.current&1|2),tt&&ae(l,a.treeForkCount),l.child}t=t.sibling}a.tail!==null&&Ot()>Vn&&(l.flags|=128,u=!0,Uu(a,!1),l.lanes=4194304)}else{if(!u)if(t=_n(n),t!==null){if(l.flags|=128,u=!0,t=t.updateQueue,l.updateQueue=t,Gn(l,t),Uu(a,!0),a.tail===null&&a.tailMode==="hidden"&&!n.alternate&&!tt)return xt(l),null}else 2*Ot()-a.renderingStartTime>Vn&&e!==536870912&&(l.flags|=128,u=!0,Uu(a,!1),l.lanes=4194304);a.isBackwards?(n.sibling=l.child,l.child=n):(t=a.last,t!==null?t.sibling=n:l.child=n,a.last=n)}return a.tail!==null?(t=a.tail,a.rendering=t,a.tail=t.sibling,a.renderingStartTime=Ot(),t.sibling=null,e=Dt.current,O(Dt,u?e&1|2:e&1),tt&&ae(l,a.treeForkCount),t):(xt(l),null);case 22:case 23:return gl(l),si(),a=l.memoizedState!==null,t!==null?t.memoizedState!==null!==a&&(l.flags|=8192):a&&(l.flags|=8192),a?(e&536870912)!==0&&(l.flags&128)===0&&(xt(l),l.subtreeFlags&6&&(l.flags|=8192)):xt(l),e=l.updateQueue,e!==null&&Gn(l,e.retryQueue),e=null,t!==null&&t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(e=t.memoizedState.cachePool.pool),a=null,l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(a=l.memoizedState.cachePool.pool),a!==e&&(l.flags|=2048),t!==null&&x(ia),null;case 24:return e=null,t!==null&&(e=t.memoizedState.cache),l.memoizedState.cache!==e&&(l.flags|=2048),ne(Rt),xt(l),null;case 25:return null;case 30:return null}throw Error(r(156,l.tag))}function I0(t,l){switch(Wc(l),l.tag){case 1:return t=l.flags,t&65536?(l.flags=t&-65537|128,l):null;case 3:return ne(Rt),ot(),t=l.flags,(t&65536)!==0&&(t&128)===0?(l.flags=t&-65537|128,l):null;case 26:case 27:case 5:return _t(l),null;case 31:if(l.memoizedState!==null){if(gl(l),l.alternate===null)throw Error(r(340));ua()}return t=l.flags,t&65536?(l.flags=t&-65537|128,l):null;case 13:if(gl(l),t=l.memoizedState,t!==null&&t.dehydrated!==null){if(l.alternate===null)throw Error(r(340));ua()}return t=l.flags,t&65536?(l.flags=t&-65537|128,l):null;case 19:return x(Dt),null;case 4:return ot(),null;case 10:return ne(l.type),null;case 22:case 23:return gl(l),si(),t!==null&&x(ia),t=l.flags,t&65536?(l.flags=t&-65537|128,l):null;case 24:return ne(Rt),null;case 25:return null;default:return null}}function Po(t,l){switch(Wc(l),l.tag){case 3:ne(Rt),ot();break;case 26:case 27:case 5:_t(l);break;case 4:ot();break;case 31:l.memoizedState!==null&&gl(l);break;case 13:gl(l);break;case 19:x(Dt);break;case 10:ne(l.type);break;case 22:case 23:gl(l),si(),t!==null&&x(ia);break;case 24:ne(Rt)}}function Ru(t,l){try{var e=l.updateQueue,a=e!==null?e.lastEffect:null;if(a!==null){var u=a.next;e=u;do{if((e.tag&t)===t){a=void 0;var n=e.create,c=e.inst;a=n(),c.destroy=a}e=e.next}while(e!==u)}}catch(i){mt(l,l.return,i)}}function Ce(t,l,e){try{var a=l.updateQueue,u=a!==null?a.lastEffect:null;if(u!==null){var n=u.next;a=n;do{if((a.tag&t)===t){var c=a.inst,i=c.destroy;if(i!==void 0){c.destroy=void 0,u=l;var f=e,v=i;try{v()}catch(S){mt(u,f,S)}}}a=a.next}while(a!==n)}}catch(S){mt(l,l.return,S)}}function td(t){var l=t.updateQueue;if(l!==null){var e=t.stateNode;try{Ls(l,e)}catch(a){mt(t,t.return,a)}}}function ld(t,l,e){e.props=ra(t.type,t.memoizedProps),e.state=t.memoizedState;try{e.componentWillUnmount()}catch(a){mt(t,l,a)}}function ju(t,l){try{var e=t.ref;if(e!==null){switch(t.tag){case 26:case 27:case 5:var a=t.stateNode;break;case 30:a=t.stateNode;break;default:a=t.stateNode}typeof e=="function"?t.refCleanup=e(a):e.current=a}}catch(u){mt(t,l,u)}}function Jl(t,l){var e=t.ref,a=t.refCleanup;if(e!==null)if(typeof a=="function")try{a()}catch(u){mt(t,l,u)}finally{t.refCleanup=null,t=t.alternate,t!=null&&(t.refCleanup=null)}else if(typeof e=="function")try{e(null)}catch(u){mt(t,l,u)}else e.current=null}function ed(t){var l=t.type,e=t.memoizedProps,a=t.stateNode;try{t:switch(l){case"button":case"input":case"select":case"textarea":e.autoFocus&&a.focus();break t;case"img":e.src?a.src=e.src:e.srcSet&&(a.srcset=e.srcSet)}}catch(u){mt(t,t.return,u)}}function Xi(t,l,e){try{var a=t.stateNode;pm(a,t.type,e,l),a[Yt]=l}catch(u){mt(t,t.return,u)}}function ad(t){return t.tag===5||t.tag===3||t.tag===26||t.tag===27&&Ye(t.type)||t.tag===4}function Zi(t){t:for(;;){for(;t.sibling===null;){if(t.return===null||ad(t.return))return null;t=t.return}for(t.sibling.return=t.return,t=t.sibling;t.tag!==5&&t.tag!==6&&t.tag!==18;){if(t.tag===27&&Ye(t.type)||t.flags&2||t.child===null||t.tag===4)continue t;t.child.return=t,t=t.child}if(!(t.flags&2))return t.stateNode}}function Li(t,l,e){var a=t.tag;if(a===5||a===6)t=t.stateNode,l?(e.nodeType===9?e.body:e.nodeName==="HTML"?e.ownerDocument.body:e).insertBefore(t,l):(l=e.nodeType===9?e.body:e.nodeName==="HTML"?e.ownerDocument.body:e,l.appendChild(t),e=e._reactRootContainer,e!=null||l.onclick!==null||(l.onclick=te));else if(a!==4&&(a===27&&Ye(t.type)&&(e=t.stateNode,l=null),t=t.child,t!==null))for(Li(t,l,e),t=t.sibling;t!==null;)Li(t,l,e),t=t.sibling}function Qn(t,l,e){var a=t.tag;if(a===5||a===6)t=t.stateNode,l?e.insertBefore(t,l):e.appendChild(t);else if(a!==4&&(a===27&&Ye(t.type)&&(e=t.stateNode),t=t.child,t!==null))for(Qn(t,l,e),t=t.sibling;t!==null;)Qn(t,l,e),t=t.sibling}function ud(t){var l=t.stateNode,e=t.memoizedProps;try{for(var a=t.type,u=l.attributes;u.length;)l.removeAttributeNode(u[0]);kt(l,a,e),l[Ut]=t,l[Yt]=e}catch(n){mt(t,t.return,n)}}var oe=!1,Bt=!1,Vi=!1,nd=typeof WeakSet=="function"?WeakSet:Set,Lt=null;function P0(t,l){if(t=t.containerInfo,rf=ic,t=hs(t),qc(t)){if("selectionStart"in t)var e={start:t.selectionStart,end:t.selectionEnd};else t:{e=(e=t.ownerDocument)&&e.defaultView||window;var a=e.getSelection&&e.getSelection();if(a&&a.rangeCount!==0){e=a.anchorNode;var u=a.anchorOffset,n=a.focusNode;a=a.focusOffset;try{e.nodeType,n.nodeType}catch{e=null;break t}var c=0,i=-1,f=-1,v=0,S=0,E=t,y=null;l:for(;;){for(var h;E!==e||u!==0&&E.nodeType!==3||(i=c+u),E!==n||a!==0&&E.nodeType!==3||(f=c+a),E.nodeType===3&&(c+=E.nodeValue.length),(h=E.firstChild)!==null;)y=E,E=h;for(;;){if(E===t)break l;if(y===e&&++v===u&&(i=c),y===n&&++S===a&&(f=c),(h=E.nextSibling)!==null)break;E=y,y=E.parentNode}E=h}e=i===-1||f===-1?null:{start:i,end:f}}else e=null}e=e||{start:0,end:0}}else e=null;for(mf={focusedElem:t,selectionRange:e},ic=!1,Lt=l;Lt!==null;)if(l=Lt,t=l.child,(l.subtreeFlags&1028)!==0&&t!==null)t.return=l,Lt=t;else for(;Lt!==null;){switch(l=Lt,n=l.alternate,t=l.flags,l.tag){case 0:if((t&4)!==0&&(t=l.updateQueue,t=t!==null?t.events:null,t!==null))for(e=0;e<t.length;e++)u=t[e],u.ref.impl=u.nextImpl;break;case 11:case 15:break;case 1:if((t&1024)!==0&&n!==null){t=void 0,e=l,u=n.memoizedProps,n=n.memoizedState,a=e.stateNode;try{var M=ra(e.type,u);t=a.getSnapshotBeforeUpdate(M,n),a.__reactInternalSnapshotBeforeUpdate=t}catch(Y){mt(e,e.return,Y)}}break;case 3:if((t&1024)!==0){if(t=l.stateNode.containerInfo,e=t.nodeType,e===9)hf(t);else if(e===1)switch(t.nodeName){case"HEAD":case"HTML":case"BODY":hf(t);break;default:t.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((t&1024)!==0)throw Error(r(163))}if(t=l.sibling,t!==null){t.return=l.return,Lt=t;break}Lt=l.return}}function cd(t,l,e){var a=e.flags;switch(e.tag){case 0:case 11:case 15:re(t,e),a&4&&Ru(5,e);break;case 1:if(re(t,e),a&4)if(t=e.stateNode,l===null)try{t.componentDidMount()}catch(c){mt(e,e.return,c)}else{var u=ra(e.type,l.memoizedProps);l=l.memoizedState;try{t.componentDidUpdate(u,l,t.__reactInternalSnapshotBeforeUpdate)}catch(c){mt(e,e.return,c)}}a&64&&td(e),a&512&&ju(e,e.return);break;case 3:if(re(t,e),a&64&&(t=e.updateQueue,t!==null)){if(l=null,e.child!==null)switch(e.child.tag){case 27:case 5:l=e.child.stateNode;break;case 1:l=e.child.stateNode}try{Ls(t,l)}catch(c){mt(e,e.return,c)}}break;case 27:l===null&&a&4&&ud(e);case 26:case 5:re(t,e),l===null&&a&4&&ed(e),a&512&&ju(e,e.return);break;case 12:re(t,e);break;case 31:re(t,e),a&4&&sd(t,e);break;case 13:re(t,e),a&4&&od(t,e),a&64&&(t=e.memoizedState,t!==null&&(t=t.dehydrated,t!==null&&(e=fm.bind(null,e),Nm(t,e))));break;case 22:if(a=e.memoizedState!==null||oe,!a){l=l!==null&&l.memoizedState!==null||Bt,u=oe;var n=Bt;oe=a,(Bt=l)&&!n?me(t,e,(e.subtreeFlags&8772)!==0):re(t,e),oe=u,Bt=n}break;case 30:break;default:re(t,e)}}function id(t){var l=t.alternate;l!==null&&(t.alternate=null,id(l)),t.child=null,t.deletions=null,t.sibling=null,t.tag===5&&(l=t.stateNode,l!==null&&pc(l)),t.stateNode=null,t.return=null,t.dependencies=null,t.memoizedProps=null,t.memoizedState=null,t.pendingProps=null,t.stateNode=null,t.updateQueue=null}var At=null,fl=!1;function de(t,l,e){for(e=e.child;e!==null;)fd(t,l,e),e=e.sibling}function fd(t,l,e){if(el&&typeof el.onCommitFiberUnmount=="function")try{el.onCommitFiberUnmount(ke,e)}catch{}switch(e.tag){case 26:Bt||Jl(e,l),de(t,l,e),e.memoizedState?e.memoizedState.count--:e.stateNode&&(e=e.stateNode,e.parentNode.removeChild(e));break;case 27:Bt||Jl(e,l);var a=At,u=fl;Ye(e.type)&&(At=e.stateNode,fl=!1),de(t,l,e),Lu(e.stateNode),At=a,fl=u;break;case 5:Bt||Jl(e,l);case 6:if(a=At,u=fl,At=null,de(t,l,e),At=a,fl=u,At!==null)if(fl)try{(At.nodeType===9?At.body:At.nodeName==="HTML"?At.ownerDocument.body:At).removeChild(e.stateNode)}catch(n){mt(e,l,n)}else try{At.removeChild(e.stateNode)}catch(n){mt(e,l,n)}break;case 18:At!==null&&(fl?(t=At,tr(t.nodeType===9?t.body:t.nodeName==="HTML"?t.ownerDocument.body:t,e.stateNode),au(t)):tr(At,e.stateNode));break;case 4:a=At,u=fl,At=e.stateNode.containerInfo,fl=!0,de(t,l,e),At=a,fl=u;break;case 0:case 11:case 14:case 15:Ce(2,e,l),Bt||Ce(4,e,l),de(t,l,e);break;case 1:Bt||(Jl(e,l),a=e.stateNode,typeof a.componentWillUnmount=="function"&&ld(e,l,a)),de(t,l,e);break;case 21:de(t,l,e);break;case 22:Bt=(a=Bt)||e.memoizedState!==null,de(t,l,e),Bt=a;break;default:de(t,l,e)}}function sd(t,l){if(l.memoizedState===null&&(t=l.alternate,t!==null&&(t=t.memoizedState,t!==null))){t=t.dehydrated;try{au(t)}catch(e){mt(l,l.return,e)}}}function od(t,l){if(l.memoizedState===null&&(t=l.alternate,t!==null&&(t=t.memoizedState,t!==null&&(t=t.dehydrated,t!==null))))try{au(t)}catch(e){mt(l,l.return,e)}}function tm(t){switch(t.tag){case 31:case 13:case 19:var l=t.stateNode;return l===null&&(l=t.stateNode=new nd),l;case 22:return t=t.stateNode,l=t._retryCache,l===null&&(l=t._retryCache=new nd),l;default:throw Error(r(435,t.tag))}}function Xn(t,l){var e=tm(t);l.forEach(function(a){if(!e.has(a)){e.add(a);var u=sm.bind(null,t,a);a.then(u,u)}})}function sl(t,l){var e=l.deletions;if(e!==null)for(var a=0;a<e.length;a++){var u=e[a],n=t,c=l,i=c;t:for(;i!==null;){switch(i.tag){case 27:if(Ye(i.type)){At=i.stateNode,fl=!1;break t}break;case 5:At=i.stateNode,fl=!1;break t;case 3:case 4:At=i.stateNode.containerInfo,fl=!0;break t}i=i.return}if(At===null)throw Error(r(160));fd(n,c,u),At=null,fl=!1,n=u.alternate,n!==null&&(n.return=null),u.return=null}if(l.subtreeFlags&13886)for(l=l.child;l!==null;)dd(l,t),l=l.sibling}var Gl=null;function dd(t,l){var e=t.alternate,a=t.flags;switch(t.tag){case 0:case 11:case 14:case 15:sl(l,t),ol(t),a&4&&(Ce(3,t,t.return),Ru(3,t),Ce(5,t,t.return));break;case 1:sl(l,t),ol(t),a&512&&(Bt||e===null||Jl(e,e.return)),a&64&&oe&&(t=t.updateQueue,t!==null&&(a=t.callbacks,a!==null&&(e=t.shared.hiddenCallbacks,t.shared.hiddenCallbacks=e===null?a:e.concat(a))));break;case 26:var u=Gl;if(sl(l,t),ol(t),a&512&&(Bt||e===null||Jl(e,e.return)),a&4){var n=e!==null?e.memoizedState:null;if(a=t.memoizedState,e===null)if(a===null)if(t.stateNode===null){t:{a=t.type,e=t.memoizedProps,u=u.ownerDocument||u;l:switch(a){case"title":n=u.getElementsByTagName("title")[0],(!n||n[iu]||n[Ut]||n.namespaceURI==="http://www.w3.org/2000/svg"||n.hasAttribute("itemprop"))&&(n=u.createElement(a),u.head.insertBefore(n,u.querySelector("head > title"))),kt(n,a,e),n[Ut]=t,Zt(n),a=n;break t;case"link":var c=dr("link","href",u).get(a+(e.href||""));if(c){for(var i=0;i<c.length;i++)if(n=c[i],n.getAttribute("href")===(e.href==null||e.href===""?null:e.href)&&n.getAttribute("rel")===(e.rel==null?null:e.rel)&&n.getAttribute("title")===(e.title==null?null:e.title)&&n.getAttribute("crossorigin")===(e.crossOrigin==null?null:e.crossOrigin)){c.splice(i,1);break l}}n=u.createElement(a),kt(n,a,e),u.head.appendChild(n);break;case"meta":if(c=dr("meta","content",u).get(a+(e.content||""))){for(i=0;i<c.length;i++)if(n=c[i],n.getAttribute("content")===(e.content==null?null:""+e.content)&&n.getAttribute("name")===(e.name==null?null:e.name)&&n.getAttribute("property")===(e.property==null?null:e.property)&&n.getAttribute("http-equiv")===(e.httpEquiv==null?null:e.httpEquiv)&&n.getAttribute("charset")===(e.charSet==null?null:e.charSet)){c.splice(i,1);break l}}n=u.createElement(a),kt(n,a,e),u.head.appendChild(n);break;default:throw Error(r(468,a))}n[Ut]=t,Zt(n),a=n}t.stateNode=a}else rr(u,t.type,t.stateNode);else t.stateNode=or(u,a,t.memoizedProps);else n!==a?(n===null?e.stateNode!==null&&(e=e.stateNode,e.parentNode.removeChild(e)):n.count--,a===null?rr(u,t.type,t.stateNode):or(u,a,t.memoizedProps)):a===null&&t.stateNode!==null&&Xi(t,t.memoizedProps,e.memoizedProps)}break;case 27:sl(l,t),ol(t),a&512&&(Bt||e===null||Jl(e,e.return)),e!==null&&a&4&&Xi(t,t.memoizedProps,e.memoizedProps);break;case 5:if(sl(l,t),ol(t),a&512&&(Bt||e===null||Jl(e,e.return)),t.flags&32){u=t.stateNode;try{_a(u,"")}catch(M){mt(t,t.return,M)}}a&4&&t.stateNode!=null&&(u=t.memoizedProps,Xi(t,u,e!==null?e.memoizedProps:u)),a&1024&&(Vi=!0);break;case 6:if(sl(l,t),ol(t),a&4){if(t.stateNode===null)throw Error(r(162));a=t.memoizedProps,e=t.stateNode;try{e.nodeValue=a}catch(M){mt(t,t.return,M)}}break;case 3:if(ac=null,u=Gl,Gl=lc(l.containerInfo),sl(l,t),Gl=u,ol(t),a&4&&e!==null&&e.memoizedState.isDehydrated)try{au(l.containerInfo)}catch(M){mt(t,t.return,M)}Vi&&(Vi=!1,rd(t));break;case 4:a=Gl,Gl=lc(t.stateNode.containerInfo),sl(l,t),ol(t),Gl=a;break;case 12:sl(l,t),ol(t);break;case 31:sl(l,t),ol(t),a&4&&(a=t.updateQueue,a!==null&&(t.updateQueue=null,Xn(t,a)));break;case 13:sl(l,t),ol(t),t.child.flags&8192&&t.memoizedState!==null!=(e!==null&&e.memoizedState!==null)&&(Ln=Ot()),a&4&&(a=t.updateQueue,a!==null&&(t.updateQueue=null,Xn(t,a)));break;case 22:u=t.memoizedState!==null;var f=e!==null&&e.memoizedState!==null,v=oe,S=Bt;if(oe=v||u,Bt=S||f,sl(l,t),Bt=S,oe=v,ol(t),a&8192)t:for(l=t.stateNode,l._visibility=u?l._visibility&-2:l._visibility|1,u&&(e===null||f||oe||Bt||ma(t)),e=null,l=t;;){if(l.tag===5||l.tag===26){if(e===null){f=e=l;try{if(n=f.stateNode,u)c=n.style,typeof c.setProperty=="function"?c.setProperty("display","none","important"):c.display="none";else{i=f.stateNode;var E=f.memoizedProps.style,y=E!=null&&E.hasOwnProperty("display")?E.display:null;i.style.display=y==null||typeof y=="boolean"?"":(""+y).trim()}}catch(M){mt(f,f.return,M)}}}else if(l.tag===6){if(e===null){f=l;try{f.stateNode.nodeValue=u?"":f.memoizedProps}catch(M){mt(f,f.return,M)}}}else if(l.tag===18){if(e===null){f=l;try{var h=f.stateNode;u?lr(h,!0):lr(f.stateNode,!1)}catch(M){mt(f,f.return,M)}}}else if((l.tag!==22&&l.tag!==23||l.memoizedState===null||l===t)&&l.child!==null){l.child.return=l,l=l.child;continue}if(l===t)break t;for(;l.sibling===null;){if(l.return===null||l.return===t)break t;e===l&&(e=null),l=l.return}e===l&&(e=null),l.sibling.return=l.return,l=l.sibling}a&4&&(a=t.updateQueue,a!==null&&(e=a.retryQueue,e!==null&&(a.retryQueue=null,Xn(t,e))));break;case 19:sl(l,t),ol(t),a&4&&(a=t.updateQueue,a!==null&&(t.updateQueue=null,Xn(t,a)));break;case 30:break;case 21:break;default:sl(l,t),ol(t)}}function ol(t){var l=t.flags;if(l&2){try{for(var e,a=t.return;a!==null;){if(ad(a)){e=a;break}a=a.return}if(e==null)throw Error(r(160));switch(e.tag){case 27:var u=e.stateNode,n=Zi(t);Qn(t,n,u);break;case 5:var c=e.stateNode;e.flags&32&&(_a(c,""),e.flags&=-33);var i=Zi(t);Qn(t,i,c);break;case 3:case 4:var f=e.stateNode.containerInfo,v=Zi(t);Li(t,v,f);break;default:throw Error(r(161))}}catch(S){mt(t,t.return,S)}t.flags&=-3}l&4096&&(t.flags&=-4097)}function rd(t){if(t.subtreeFlags&1024)for(t=t.child;t!==null;){var l=t;rd(l),l.tag===5&&l.flags&1024&&l.stateNode.reset(),t=t.sibling}}function re(t,l){if(l.subtreeFlags&8772)for(l=l.child;l!==null;)cd(t,l.alternate,l),l=l.sibling}function ma(t){for(t=t.child;t!==null;){var l=t;switch(l.tag){case 0:case 11:case 14:case 15:Ce(4,l,l.return),ma(l);break;case 1:Jl(l,l.return);var e=l.stateNode;typeof e.componentWillUnmount=="function"&&ld(l,l.return,e),ma(l);break;case 27:Lu(l.stateNode);case 26:case 5:Jl(l,l.return),ma(l);break;case 22:l.memoizedState===null&&ma(l);break;case 30:ma(l);break;default:ma(l)}t=t.sibling}}function me(t,l,e){for(e=e&&(l.subtreeFlags&8772)!==0,l=l.child;l!==null;){var a=l.alternate,u=t,n=l,c=n.flags;switch(n.tag){case 0:case 11:case 15:me(u,n,e),Ru(4,n);break;case 1:if(me(u,n,e),a=n,u=a.stateNode,typeof u.componentDidMount=="function")try{u.componentDidMount()}catch(v){mt(a,a.return,v)}if(a=n,u=a.updateQueue,u!==null){var i=a.stateNode;try{var f=u.shared.hiddenCallbacks;if(f!==null)for(u.shared.hiddenCallbacks=null,u=0;u<f.length;u++)Zs(f[u],i)}catch(v){mt(a,a.return,v)}}e&&c&64&&td(n),ju(n,n.return);break;case 27:ud(n);case 26:case 5:me(u,n,e),e&&a===null&&c&4&&ed(n),ju(n,n.return);break;case 12:me(u,n,e);break;case 31:me(u,n,e),e&&c&4&&sd(u,n);break;case 13:me(u,n,e),e&&c&4&&od(u,n);break;case 22:n.memoizedState===null&&me(u,n,e),ju(n,n.return);break;case 30:break;default:me(u,n,e)}l=l.sibling}}function Ki(t,l){var e=null;t!==null&&t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(e=t.memoizedState.cachePool.pool),t=null,l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(t=l.memoizedState.cachePool.pool),t!==e&&(t!=null&&t.refCount++,e!=null&&pu(e))}function Ji(t,l){t=null,l.alternate!==null&&(t=l.alternate.memoizedState.cache),l=l.memoizedState.cache,l!==t&&(l.refCount++,t!=null&&pu(t))}function Ql(t,l,e,a){if(l.subtreeFlags&10256)for(l=l.child;l!==null;)md(t,l,e,a),l=l.sibling}function md(t,l,e,a){var u=l.flags;switch(l.tag){case 0:case 11:case 15:Ql(t,l,e,a),u&2048&&Ru(9,l);break;case 1:Ql(t,l,e,a);break;case 3:Ql(t,l,e,a),u&2048&&(t=null,l.alternate!==null&&(t=l.alternate.memoizedState.cache),l=l.memoizedState.cache,l!==t&&(l.refCount++,t!=null&&pu(t)));break;case 12:if(u&2048){Ql(t,l,e,a),t=l.stateNode;try{var n=l.memoizedProps,c=n.id,i=n.onPostCommit;typeof i=="function"&&i(c,l.alternate===null?"mount":"update",t.passiveEffectDuration,-0)}catch(f){mt(l,l.return,f)}}else Ql(t,l,e,a);break;case 31:Ql(t,l,e,a);break;case 13:Ql(t,l,e,a);break;case 23:break;case 22:n=l.stateNode,c=l.alternate,l.memoizedState!==null?n._visibility&2?Ql(t,l,e,a):Hu(t,l):n._visibility&2?Ql(t,l,e,a):(n._visibility|=2,Ja(t,l,e,a,(l.subtreeFlags&10256)!==0||!1)),u&2048&&Ki(c,l);break;case 24:Ql(t,l,e,a),u&2048&&Ji(l.alternate,l);break;default:Ql(t,l,e,a)}}function Ja(t,l,e,a,u){for(u=u&&((l.subtreeFlags&10256)!==0||!1),l=l.child;l!==null;){var n=t,c=l,i=e,f=a,v=c.flags;switch(c.tag){case 0:case 11:case 15:Ja(n,c,i,f,u),Ru(8,c);break;case 23:break;case 22:var S=c.stateNode;c.memoizedState!==null?S._visibility&2?Ja(n,c,i,f,u):Hu(n,c):(S._visibility|=2,Ja(n,c,i,f,u)),u&&v&2048&&Ki(c.alternate,c);break;case 24:Ja(n,c,i,f,u),u&&v&2048&&Ji(c.alternate,c);break;default:Ja(n,c,i,f,u)}l=l.sibling}}function Hu(t,l){if(l.subtreeFlags&10256)for(l=l.child;l!==null;){var e=t,a=l,u=a.flags;switch(a.tag){case 22:Hu(e,a),u&2048&&Ki(a.alternate,a);break;case 24:Hu(e,a),u&2048&&Ji(a.alternate,a);break;default:Hu(e,a)}l=l.sibling}}var Bu=8192;function wa(t,l,e){if(t.subtreeFlags&Bu)for(t=t.child;t!==null;)vd(t,l,e),t=t.sibling}function vd(t,l,e){switch(t.tag){case 26:wa(t,l,e),t.flags&Bu&&t.memoizedState!==null&&Qm(e,Gl,t.memoizedState,t.memoizedProps);break;case 5:wa(t,l,e);break;case 3:case 4:var a=Gl;Gl=lc(t.stateNode.containerInfo),wa(t,l,e),Gl=a;break;case 22:t.memoizedState===null&&(a=t.alternate,a!==null&&a.memoizedState!==null?(a=Bu,Bu=16777216,wa(t,l,e),Bu=a):wa(t,l,e));break;default:wa(t,l,e)}}function yd(t){var l=t.alternate;if(l!==null&&(t=l.child,t!==null)){l.child=null;do l=t.sibling,t.sibling=null,t=l;while(t!==null)}}function qu(t){var l=t.deletions;if((t.flags&16)!==0){if(l!==null)for(var e=0;e<l.length;e++){var a=l[e];Lt=a,gd(a,t)}yd(t)}if(t.subtreeFlags&10256)for(t=t.child;t!==null;)hd(t),t=t.sibling}function hd(t){switch(t.tag){case 0:case 11:case 15:qu(t),t.flags&2048&&Ce(9,t,t.return);break;case 3:qu(t);break;case 12:qu(t);break;case 22:var l=t.stateNode;t.memoizedState!==null&&l._visibility&2&&(t.return===null||t.return.tag!==13)?(l._visibility&=-3,Zn(t)):qu(t);break;default:qu(t)}}function Zn(t){var l=t.deletions;if((t.flags&16)!==0){if(l!==null)for(var e=0;e<l.length;e++){var a=l[e];Lt=a,gd(a,t)}yd(t)}for(t=t.child;t!==null;){switch(l=t,l.tag){case 0:case 11:case 15:Ce(8,l,l.return),Zn(l);break;case 22:e=l.stateNode,e._visibility&2&&(e._visibility&=-3,Zn(l));break;default:Zn(l)}t=t.sibling}}function gd(t,l){for(;Lt!==null;){var e=Lt;switch(e.tag){case 0:case 11:case 15:Ce(8,e,l);break;case 23:case 22:if(e.memoizedState!==null&&e.memoizedState.cachePool!==null){var a=e.memoizedState.cachePool.pool;a!=null&&a.refCount++}break;case 24:pu(e.memoizedState.cache)}if(a=e.child,a!==null)a.return=e,Lt=a;else t:for(e=t;Lt!==null;){a=Lt;var u=a.sibling,n=a.return;if(id(a),a===e){Lt=null;break t}if(u!==null){u.return=n,Lt=u;break t}Lt=n}}}var lm={getCacheForType:function(t){var l=wt(Rt),e=l.data.get(t);return e===void 0&&(e=t(),l.data.set(t,e)),e},cacheSignal:function(){return wt(Rt).controller.signal}},em=typeof WeakMap=="function"?WeakMap:Map,ft=0,pt=null,$=null,I=0,rt=0,Sl=null,Ue=!1,Wa=!1,wi=!1,ve=0,Mt=0,Re=0,va=0,Wi=0,bl=0,ka=0,Yu=null,dl=null,ki=!1,Ln=0,Sd=0,Vn=1/0,Kn=null,je=null,Gt=0,He=null,$a=null,ye=0,$i=0,Fi=null,bd=null,Gu=0,Ii=null;function pl(){return(ft&2)!==0&&I!==0?I&-I:g.T!==null?uf():It()}function pd(){if(bl===0)if((I&536870912)===0||tt){var t=ga;ga<<=1,(ga&3932160)===0&&(ga=262144),bl=t}else bl=536870912;return t=hl.current,t!==null&&(t.flags|=32),bl}function rl(t,l,e){(t===pt&&(rt===2||rt===9)||t.cancelPendingCommit!==null)&&(Fa(t,0),Be(t,I,bl,!1)),z(t,e),((ft&2)===0||t!==pt)&&(t===pt&&((ft&2)===0&&(va|=e),Mt===4&&Be(t,I,bl,!1)),wl(t))}function Ed(t,l,e){if((ft&6)!==0)throw Error(r(327));var a=!e&&(l&127)===0&&(l&t.expiredLanes)===0||$e(t,l),u=a?nm(t,l):tf(t,l,!0),n=a;do{if(u===0){Wa&&!a&&Be(t,l,0,!1);break}else{if(e=t.current.alternate,n&&!am(e)){u=tf(t,l,!1),n=!1;continue}if(u===2){if(n=l,t.errorRecoveryDisabledLanes&n)var c=0;else c=t.pendingLanes&-536870913,c=c!==0?c:c&536870912?536870912:0;if(c!==0){l=c;t:{var i=t;u=Yu;var f=i.current.memoizedState.isDehydrated;if(f&&(Fa(i,c).flags|=256),c=tf(i,c,!1),c!==2){if(wi&&!f){i.errorRecoveryDisabledLanes|=n,va|=n,u=4;break t}n=dl,dl=u,n!==null&&(dl===null?dl=n:dl.push.apply(dl,n))}u=c}if(n=!1,u!==2)continue}}if(u===1){Fa(t,0),Be(t,l,0,!0);break}t:{switch(a=t,n=u,n){case 0:case 1:throw Error(r(345));case 4:if((l&4194048)!==l)break;case 6:Be(a,l,bl,!Ue);break t;case 2:dl=null;break;case 3:case 5:break;default:throw Error(r(329))}if((l&62914560)===l&&(u=Ln+300-Ot(),10<u)){if(Be(a,l,bl,!Ue),ba(a,0,!0)!==0)break t;ye=l,a.timeoutHandle=Id(xd.bind(null,a,e,dl,Kn,ki,l,bl,va,ka,Ue,n,"Throttled",-0,0),u);break t}xd(a,e,dl,Kn,ki,l,bl,va,ka,Ue,n,null,-0,0)}}break}while(!0);wl(t)}function xd(t,l,e,a,u,n,c,i,f,v,S,E,y,h){if(t.timeoutHandle=-1,E=l.subtreeFlags,E&8192||(E&16785408)===16785408){E={stylesheets:null,count:0,imgCount:0,imgBytes:0,suspenseyImages:[],waitingForImages:!0,waitingForViewTransition:!1,unsuspend:te},vd(l,n,E);var M=(n&62914560)===n?Ln-Ot():(n&4194048)===n?Sd-Ot():0;if(M=Xm(E,M),M!==null){ye=n,t.cancelPendingCommit=M(Dd.bind(null,t,l,n,e,a,u,c,i,f,S,E,null,y,h)),Be(t,n,c,!v);return}}Dd(t,l,n,e,a,u,c,i,f)}function am(t){for(var l=t;;){var e=l.tag;if((e===0||e===11||e===15)&&l.flags&16384&&(e=l.updateQueue,e!==null&&(e=e.stores,e!==null)))for(var a=0;a<e.length;a++){var u=e[a],n=u.getSnapshot;u=u.value;try{if(!vl(n(),u))return!1}catch{return!1}}if(e=l.child,l.subtreeFlags&16384&&e!==null)e.return=l,l=e;else{if(l===t)break;for(;l.sibling===null;){if(l.return===null||l.return===t)return!0;l=l.return}l.sibling.return=l.return,l=l.sibling}}return!0}function Be(t,l,e,a){l&=~Wi,l&=~va,t.suspendedLanes|=l,t.pingedLanes&=~l,a&&(t.warmLanes|=l),a=t.expirationTimes;for(var u=l;0<u;){var n=31-al(u),c=1<<n;a[n]=-1,u&=~c}e!==0&&V(t,e,l)}function Jn(){return(ft&6)===0?(Qu(0),!1):!0}function Pi(){if($!==null){if(rt===0)var t=$.return;else t=$,ue=na=null,yi(t),Xa=null,xu=0,t=$;for(;t!==null;)Po(t.alternate,t),t=t.return;$=null}}function Fa(t,l){var e=t.timeoutHandle;e!==-1&&(t.timeoutHandle=-1,Am(e)),e=t.cancelPendingCommit,e!==null&&(t.cancelPendingCommit=null,e()),ye=0,Pi(),pt=t,$=e=ee(t.current,null),I=l,rt=0,Sl=null,Ue=!1,Wa=$e(t,l),wi=!1,ka=bl=Wi=va=Re=Mt=0,dl=Yu=null,ki=!1,(l&8)!==0&&(l|=l&32);var a=t.entangledLanes;if(a!==0)for(t=t.entanglements,a&=l;0<a;){var u=31-al(a),n=1<<u;l|=t[u],a&=~n}return ve=l,mn(),e}function Ad(t,l){K=null,g.H=Du,l===Qa||l===En?(l=Ys(),rt=3):l===ai?(l=Ys(),rt=4):rt=l===Ci?8:l!==null&&typeof l=="object"&&typeof l.then=="function"?6:1,Sl=l,$===null&&(Mt=1,Hn(t,Nl(l,t.current)))}function zd(){var t=hl.current;return t===null?!0:(I&4194048)===I?Ul===null:(I&62914560)===I||(I&536870912)!==0?t===Ul:!1}function Td(){var t=g.H;return g.H=Du,t===null?Du:t}function _d(){var t=g.A;return g.A=lm,t}function wn(){Mt=4,Ue||(I&4194048)!==I&&hl.current!==null||(Wa=!0),(Re&134217727)===0&&(va&134217727)===0||pt===null||Be(pt,I,bl,!1)}function tf(t,l,e){var a=ft;ft|=2;var u=Td(),n=_d();(pt!==t||I!==l)&&(Kn=null,Fa(t,l)),l=!1;var c=Mt;t:do try{if(rt!==0&&$!==null){var i=$,f=Sl;switch(rt){case 8:Pi(),c=6;break t;case 3:case 2:case 9:case 6:hl.current===null&&(l=!0);var v=rt;if(rt=0,Sl=null,Ia(t,i,f,v),e&&Wa){c=0;break t}break;default:v=rt,rt=0,Sl=null,Ia(t,i,f,v)}}um(),c=Mt;break}catch(S){Ad(t,S)}while(!0);return l&&t.shellSuspendCounter++,ue=na=null,ft=a,g.H=u,g.A=n,$===null&&(pt=null,I=0,mn()),c}function um(){for(;$!==null;)Od($)}function nm(t,l){var e=ft;ft|=2;var a=Td(),u=_d();pt!==t||I!==l?(Kn=null,Vn=Ot()+500,Fa(t,l)):Wa=$e(t,l);t:do try{if(rt!==0&&$!==null){l=$;var n=Sl;l:switch(rt){case 1:rt=0,Sl=null,Ia(t,l,n,1);break;case 2:case 9:if(Bs(n)){rt=0,Sl=null,Nd(l);break}l=function(){rt!==2&&rt!==9||pt!==t||(rt=7),wl(t)},n.then(l,l);break t;case 3:rt=7;break t;case 4:rt=5;break t;case 7:Bs(n)?(rt=0,Sl=null,Nd(l)):(rt=0,Sl=null,Ia(t,l,n,7));break;case 5:var c=null;switch($.tag){case 26:c=$.memoizedState;case 5:case 27:var i=$;if(c?mr(c):i.stateNode.complete){rt=0,Sl=null;var f=i.sibling;if(f!==null)$=f;else{var v=i.return;v!==null?($=v,Wn(v)):$=null}break l}}rt=0,Sl=null,Ia(t,l,n,5);break;case 6:rt=0,Sl=null,Ia(t,l,n,6);break;case 8:Pi(),Mt=6;break t;default:throw Error(r(462))}}cm();break}catch(S){Ad(t,S)}while(!0);return ue=na=null,g.H=a,g.A=u,ft=e,$!==null?0:(pt=null,I=0,mn(),Mt)}function cm(){for(;$!==null&&!St();)Od($)}function Od(t){var l=Fo(t.alternate,t,ve);t.memoizedProps=t.pendingProps,l===null?Wn(t):$=l}function Nd(t){var l=t,e=l.alternate;switch(l.tag){case 15:case 0:l=Ko(e,l,l.pendingProps,l.type,void 0,I);break;case 11:l=Ko(e,l,l.pendingProps,l.type.render,l.ref,I);break;case 5:yi(l);default:Po(e,l),l=$=Ts(l,ve),l=Fo(e,l,ve)}t.memoizedProps=t.pendingProps,l===null?Wn(t):$=l}function Ia(t,l,e,a){ue=na=null,yi(l),Xa=null,xu=0;var u=l.return;try{if(W0(t,u,l,e,I)){Mt=1,Hn(t,Nl(e,t.current)),$=null;return}}catch(n){if(u!==null)throw $=u,n;Mt=1,Hn(t,Nl(e,t.current)),$=null;return}l.flags&32768?(tt||a===1?t=!0:Wa||(I&536870912)!==0?t=!1:(Ue=t=!0,(a===2||a===9||a===3||a===6)&&(a=hl.current,a!==null&&a.tag===13&&(a.flags|=16384))),Md(l,t)):Wn(l)}function Wn(t){var l=t;do{if((l.flags&32768)!==0){Md(l,Ue);return}t=l.return;var e=F0(l.alternate,l,ve);if(e!==null){$=e;return}if(l=l.sibling,l!==null){$=l;return}$=l=t}while(l!==null);Mt===0&&(Mt=5)}function Md(t,l){do{var e=I0(t.alternate,t);if(e!==null){e.flags&=32767,$=e;return}if(e=t.return,e!==null&&(e.flags|=32768,e.subtreeFlags=0,e.deletions=null),!l&&(t=t.sibling,t!==null)){$=t;return}$=t=e}while(t!==null);Mt=6,$=null}function Dd(t,l,e,a,u,n,c,i,f){t.cancelPendingCommit=null;do kn();while(Gt!==0);if((ft&6)!==0)throw Error(r(327));if(l!==null){if(l===t.current)throw Error(r(177));if(n=l.lanes|l.childLanes,n|=Zc,_(t,e,n,c,i,f),t===pt&&($=pt=null,I=0),$a=l,He=t,ye=e,$i=n,Fi=u,bd=a,(l.subtreeFlags&10256)!==0||(l.flags&10256)!==0?(t.callbackNode=null,t.callbackPriority=0,om(we,function(){return Hd(),null})):(t.callbackNode=null,t.callbackPriority=0),a=(l.flags&13878)!==0,(l.subtreeFlags&13878)!==0||a){a=g.T,g.T=null,u=N.p,N.p=2,c=ft,ft|=4;try{P0(t,l,e)}finally{ft=c,N.p=u,g.T=a}}Gt=1,Cd(),Ud(),Rd()}}function Cd(){if(Gt===1){Gt=0;var t=He,l=$a,e=(l.flags&13878)!==0;if((l.subtreeFlags&13878)!==0||e){e=g.T,g.T=null;var a=N.p;N.p=2;var u=ft;ft|=4;try{dd(l,t);var n=mf,c=hs(t.containerInfo),i=n.focusedElem,f=n.selectionRange;if(c!==i&&i&&i.ownerDocument&&ys(i.ownerDocument.documentElement,i)){if(f!==null&&qc(i)){var v=f.start,S=f.end;if(S===void 0&&(S=v),"selectionStart"in i)i.selectionStart=v,i.selectionEnd=Math.min(S,i.value.length);else{var E=i.ownerDocument||document,y=E&&E.defaultView||window;if(y.getSelection){var h=y.getSelection(),M=i.textContent.length,Y=Math.min(f.start,M),ht=f.end===void 0?Y:Math.min(f.end,M);!h.extend&&Y>ht&&(c=ht,ht=Y,Y=c);var d=vs(i,Y),s=vs(i,ht);if(d&&s&&(h.rangeCount!==1||h.anchorNode!==d.node||h.anchorOffset!==d.offset||h.focusNode!==s.node||h.focusOffset!==s.offset)){var m=E.createRange();m.setStart(d.node,d.offset),h.removeAllRanges(),Y>ht?(h.addRange(m),h.extend(s.node,s.offset)):(m.setEnd(s.node,s.offset),h.addRange(m))}}}}for(E=[],h=i;h=h.parentNode;)h.nodeType===1&&E.push({element:h,left:h.scrollLeft,top:h.scrollTop});for(typeof i.focus=="function"&&i.focus(),i=0;i<E.length;i++){var p=E[i];p.element.scrollLeft=p.left,p.element.scrollTop=p.top}}ic=!!rf,mf=rf=null}finally{ft=u,N.p=a,g.T=e}}t.current=l,Gt=2}}function Ud(){if(Gt===2){Gt=0;var t=He,l=$a,e=(l.flags&8772)!==0;if((l.subtreeFlags&8772)!==0||e){e=g.T,g.T=null;var a=N.p;N.p=2;var u=ft;ft|=4;try{cd(t,l.alternate,l)}finally{ft=u,N.p=a,g.T=e}}Gt=3}}function Rd(){if(Gt===4||Gt===3){Gt=0,vc();var t=He,l=$a,e=ye,a=bd;(l.subtreeFlags&10256)!==0||(l.flags&10256)!==0?Gt=5:(Gt=0,$a=He=null,jd(t,t.pendingLanes));var u=t.pendingLanes;if(u===0&&(je=null),dt(e),l=l.stateNode,el&&typeof el.onCommitFiberRoot=="function")try{el.onCommitFiberRoot(ke,l,void 0,(l.current.flags&128)===128)}catch{}if(a!==null){l=g.T,u=N.p,N.p=2,g.T=null;try{for(var n=t.onRecoverableError,c=0;c<a.length;c++){var i=a[c];n(i.value,{componentStack:i.stack})}}finally{g.T=l,N.p=u}}(ye&3)!==0&&kn(),wl(t),u=t.pendingLanes,(e&261930)!==0&&(u&42)!==0?t===Ii?Gu++:(Gu=0,Ii=t):Gu=0,Qu(0)}}function jd(t,l){(t.pooledCacheLanes&=l)===0&&(l=t.pooledCache,l!=null&&(t.pooledCache=null,pu(l)))}function kn(){return Cd(),Ud(),Rd(),Hd()}function Hd(){if(Gt!==5)return!1;var t=He,l=$i;$i=0;var e=dt(ye),a=g.T,u=N.p;try{N.p=32>e?32:e,g.T=null,e=Fi,Fi=null;var n=He,c=ye;if(Gt=0,$a=He=null,ye=0,(ft&6)!==0)throw Error(r(331));var i=ft;if(ft|=4,hd(n.current),md(n,n.current,c,e),ft=i,Qu(0,!1),el&&typeof el.onPostCommitFiberRoot=="function")try{el.onPostCommitFiberRoot(ke,n)}catch{}return!0}finally{N.p=u,g.T=a,jd(t,l)}}function Bd(t,l,e){l=Nl(e,l),l=Di(t.stateNode,l,2),t=Ne(t,l,2),t!==null&&(z(t,2),wl(t))}function mt(t,l,e){if(t.tag===3)Bd(t,t,e);else for(;l!==null;){if(l.tag===3){Bd(l,t,e);break}else if(l.tag===1){var a=l.stateNode;if(typeof l.type.getDerivedStateFromError=="function"||typeof a.componentDidCatch=="function"&&(je===null||!je.has(a))){t=Nl(e,t),e=qo(2),a=Ne(l,e,2),a!==null&&(Yo(e,a,l,t),z(a,2),wl(a));break}}l=l.return}}function lf(t,l,e){var a=t.pingCache;if(a===null){a=t.pingCache=new em;var u=new Set;a.set(l,u)}else u=a.get(l),u===void 0&&(u=new Set,a.set(l,u));u.has(e)||(wi=!0,u.add(e),t=im.bind(null,t,l,e),l.then(t,t))}function im(t,l,e){var a=t.pingCache;a!==null&&a.delete(l),t.pingedLanes|=t.suspendedLanes&e,t.warmLanes&=~e,pt===t&&(I&e)===e&&(Mt===4||Mt===3&&(I&62914560)===I&&300>Ot()-Ln?(ft&2)===0&&Fa(t,0):Wi|=e,ka===I&&(ka=0)),wl(t)}function qd(t,l){l===0&&(l=pa()),t=ea(t,l),t!==null&&(z(t,l),wl(t))}function fm(t){var l=t.memoizedState,e=0;l!==null&&(e=l.retryLane),qd(t,e)}function sm(t,l){var e=0;switch(t.tag){case 31:case 13:var a=t.stateNode,u=t.memoizedState;u!==null&&(e=u.retryLane);break;case 19:a=t.stateNode;break;case 22:a=t.stateNode._retryCache;break;default:throw Error(r(314))}a!==null&&a.delete(l),qd(t,e)}function om(t,l){return Bl(t,l)}var $n=null,Pa=null,ef=!1,Fn=!1,af=!1,qe=0;function wl(t){t!==Pa&&t.next===null&&(Pa===null?$n=Pa=t:Pa=Pa.next=t),Fn=!0,ef||(ef=!0,rm())}function Qu(t,l){if(!af&&Fn){af=!0;do for(var e=!1,a=$n;a!==null;){if(t!==0){var u=a.pendingLanes;if(u===0)var n=0;else{var c=a.suspendedLanes,i=a.pingedLanes;n=(1<<31-al(42|t)+1)-1,n&=u&~(c&~i),n=n&201326741?n&201326741|1:n?n|2:0}n!==0&&(e=!0,Xd(a,n))}else n=I,n=ba(a,a===pt?n:0,a.cancelPendingCommit!==null||a.timeoutHandle!==-1),(n&3)===0||$e(a,n)||(e=!0,Xd(a,n));a=a.next}while(e);af=!1}}function dm(){Yd()}function Yd(){Fn=ef=!1;var t=0;qe!==0&&xm()&&(t=qe);for(var l=Ot(),e=null,a=$n;a!==null;){var u=a.next,n=Gd(a,l);n===0?(a.next=null,e===null?$n=u:e.next=u,u===null&&(Pa=e)):(e=a,(t!==0||(n&3)!==0)&&(Fn=!0)),a=u}Gt!==0&&Gt!==5||Qu(t),qe!==0&&(qe=0)}function Gd(t,l){for(var e=t.suspendedLanes,a=t.pingedLanes,u=t.expirationTimes,n=t.pendingLanes&-62914561;0<n;){var c=31-al(n),i=1<<c,f=u[c];f===-1?((i&e)===0||(i&a)!==0)&&(u[c]=cu(i,l)):f<=l&&(t.expiredLanes|=i),n&=~i}if(l=pt,e=I,e=ba(t,t===l?e:0,t.cancelPendingCommit!==null||t.timeoutHandle!==-1),a=t.callbackNode,e===0||t===l&&(rt===2||rt===9)||t.cancelPendingCommit!==null)return a!==null&&a!==null&&Je(a),t.callbackNode=null,t.callbackPriority=0;if((e&3)===0||$e(t,e)){if(l=e&-e,l===t.callbackPriority)return l;switch(a!==null&&Je(a),dt(e)){case 2:case 8:e=uu;break;case 32:e=we;break;case 268435456:e=We;break;default:e=we}return a=Qd.bind(null,t),e=Bl(e,a),t.callbackPriority=l,t.callbackNode=e,l}return a!==null&&a!==null&&Je(a),t.callbackPriority=2,t.callbackNode=null,2}function Qd(t,l){if(Gt!==0&&Gt!==5)return t.callbackNode=null,t.callbackPriority=0,null;var e=t.callbackNode;if(kn()&&t.callbackNode!==e)return null;var a=I;return a=ba(t,t===pt?a:0,t.cancelPendingCommit!==null||t.timeoutHandle!==-1),a===0?null:(Ed(t,a,l),Gd(t,Ot()),t.callbackNode!=null&&t.callbackNode===e?Qd.bind(null,t):null)}function Xd(t,l){if(kn())return null;Ed(t,l,!0)}function rm(){zm(function(){(ft&6)!==0?Bl(Il,dm):Yd()})}function uf(){if(qe===0){var t=Ya;t===0&&(t=ha,ha<<=1,(ha&261888)===0&&(ha=256)),qe=t}return qe}function Zd(t){return t==null||typeof t=="symbol"||typeof t=="boolean"?null:typeof t=="function"?t:un(""+t)}function Ld(t,l){var e=l.ownerDocument.createElement("input");return e.name=l.name,e.value=l.value,t.id&&e.setAttribute("form",t.id),l.parentNode.insertBefore(e,l),t=new FormData(t),e.parentNode.removeChild(e),t}function mm(t,l,e,a,u){if(l==="submit"&&e&&e.stateNode===u){var n=Zd((u[Yt]||null).action),c=a.submitter;c&&(l=(l=c[Yt]||null)?Zd(l.formAction):c.getAttribute("formAction"),l!==null&&(n=l,c=null));var i=new sn("action","action",null,a,u);t.push({event:i,listeners:[{instance:null,listener:function(){if(a.defaultPrevented){if(qe!==0){var f=c?Ld(u,c):new FormData(u);zi(e,{pending:!0,data:f,method:u.method,action:n},null,f)}}else typeof n=="function"&&(i.preventDefault(),f=c?Ld(u,c):new FormData(u),zi(e,{pending:!0,data:f,method:u.method,action:n},n,f))},currentTarget:u}]})}}for(var nf=0;nf<Xc.length;nf++){var cf=Xc[nf],vm=cf.toLowerCase(),ym=cf[0].toUpperCase()+cf.slice(1);Yl(vm,"on"+ym)}Yl(bs,"onAnimationEnd"),Yl(ps,"onAnimationIteration"),Yl(Es,"onAnimationStart"),Yl("dblclick","onDoubleClick"),Yl("focusin","onFocus"),Yl("focusout","onBlur"),Yl(C0,"onTransitionRun"),Yl(U0,"onTransitionStart"),Yl(R0,"onTransitionCancel"),Yl(xs,"onTransitionEnd"),za("onMouseEnter",["mouseout","mouseover"]),za("onMouseLeave",["mouseout","mouseover"]),za("onPointerEnter",["pointerout","pointerover"]),za("onPointerLeave",["pointerout","pointerover"]),Ie("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),Ie("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),Ie("onBeforeInput",["compositionend","keypress","textInput","paste"]),Ie("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),Ie("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),Ie("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Xu="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),hm=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(Xu));function Vd(t,l){l=(l&4)!==0;for(var e=0;e<t.length;e++){var a=t[e],u=a.event;a=a.listeners;t:{var n=void 0;if(l)for(var c=a.length-1;0<=c;c--){var i=a[c],f=i.instance,v=i.currentTarget;if(i=i.listener,f!==n&&u.isPropagationStopped())break t;n=i,u.currentTarget=v;try{n(u)}catch(S){rn(S)}u.currentTarget=null,n=f}else for(c=0;c<a.length;c++){if(i=a[c],f=i.instance,v=i.currentTarget,i=i.listener,f!==n&&u.isPropagationStopped())break t;n=i,u.currentTarget=v;try{n(u)}catch(S){rn(S)}u.currentTarget=null,n=f}}}}function F(t,l){var e=l[bc];e===void 0&&(e=l[bc]=new Set);var a=t+"__bubble";e.has(a)||(Kd(l,t,2,!1),e.add(a))}function ff(t,l,e){var a=0;l&&(a|=4),Kd(e,t,a,l)}var In="_reactListening"+Math.random().toString(36).slice(2);function sf(t){if(!t[In]){t[In]=!0,qf.forEach(function(e){e!=="selectionchange"&&(hm.has(e)||ff(e,!1,t),ff(e,!0,t))});var l=t.nodeType===9?t:t.ownerDocument;l===null||l[In]||(l[In]=!0,ff("selectionchange",!1,l))}}function Kd(t,l,e,a){switch(pr(l)){case 2:var u=Vm;break;case 8:u=Km;break;default:u=zf}e=u.bind(null,l,e,t),u=void 0,!Nc||l!=="touchstart"&&l!=="touchmove"&&l!=="wheel"||(u=!0),a?u!==void 0?t.addEventListener(l,e,{capture:!0,passive:u}):t.addEventListener(l,e,!0):u!==void 0?t.addEventListener(l,e,{passive:u}):t.addEventListener(l,e,!1)}function of(t,l,e,a,u){var n=a;if((l&1)===0&&(l&2)===0&&a!==null)t:for(;;){if(a===null)return;var c=a.tag;if(c===3||c===4){var i=a.stateNode.containerInfo;if(i===u)break;if(c===4)for(c=a.return;c!==null;){var f=c.tag;if((f===3||f===4)&&c.stateNode.containerInfo===u)return;c=c.return}for(;i!==null;){if(c=Ea(i),c===null)return;if(f=c.tag,f===5||f===6||f===26||f===27){a=n=c;continue t}i=i.parentNode}}a=a.return}kf(function(){var v=n,S=_c(e),E=[];t:{var y=As.get(t);if(y!==void 0){var h=sn,M=t;switch(t){case"keypress":if(cn(e)===0)break t;case"keydown":case"keyup":h=s0;break;case"focusin":M="focus",h=Uc;break;case"focusout":M="blur",h=Uc;break;case"beforeblur":case"afterblur":h=Uc;break;case"click":if(e.button===2)break t;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":h=If;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":h=Fr;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":h=r0;break;case bs:case ps:case Es:h=t0;break;case xs:h=v0;break;case"scroll":case"scrollend":h=kr;break;case"wheel":h=h0;break;case"copy":case"cut":case"paste":h=e0;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":h=ts;break;case"toggle":case"beforetoggle":h=S0}var Y=(l&4)!==0,ht=!Y&&(t==="scroll"||t==="scrollend"),d=Y?y!==null?y+"Capture":null:y;Y=[];for(var s=v,m;s!==null;){var p=s;if(m=p.stateNode,p=p.tag,p!==5&&p!==26&&p!==27||m===null||d===null||(p=su(s,d),p!=null&&Y.push(Zu(s,p,m))),ht)break;s=s.return}0<Y.length&&(y=new h(y,M,null,e,S),E.push({event:y,listeners:Y}))}}if((l&7)===0){t:{if(y=t==="mouseover"||t==="pointerover",h=t==="mouseout"||t==="pointerout",y&&e!==Tc&&(M=e.relatedTarget||e.fromElement)&&(Ea(M)||M[pe]))break t;if((h||y)&&(y=S.window===S?S:(y=S.ownerDocument)?y.defaultView||y.parentWindow:window,h?(M=e.relatedTarget||e.toElement,h=v,M=M?Ea(M):null,M!==null&&(ht=k(M),Y=M.tag,M!==ht||Y!==5&&Y!==27&&Y!==6)&&(M=null)):(h=null,M=v),h!==M)){if(Y=If,p="onMouseLeave",d="onMouseEnter",s="mouse",(t==="pointerout"||t==="pointerover")&&(Y=ts,p="onPointerLeave",d="onPointerEnter",s="pointer"),ht=h==null?y:fu(h),m=M==null?y:fu(M),y=new Y(p,s+"leave",h,e,S),y.target=ht,y.relatedTarget=m,p=null,Ea(S)===v&&(Y=new Y(d,s+"enter",M,e,S),Y.target=m,Y.relatedTarget=ht,p=Y),ht=p,h&&M)l:{for(Y=gm,d=h,s=M,m=0,p=d;p;p=Y(p))m++;p=0;for(var B=s;B;B=Y(B))p++;for(;0<m-p;)d=Y(d),m--;for(;0<p-m;)s=Y(s),p--;for(;m--;){if(d===s||s!==null&&d===s.alternate){Y=d;break l}d=Y(d),s=Y(s)}Y=null}else Y=null;h!==null&&Jd(E,y,h,Y,!1),M!==null&&ht!==null&&Jd(E,ht,M,Y,!0)}}t:{if(y=v?fu(v):window,h=y.nodeName&&y.nodeName.toLowerCase(),h==="select"||h==="input"&&y.type==="file")var nt=fs;else if(cs(y))if(ss)nt=N0;else{nt=_0;var C=T0}else h=y.nodeName,!h||h.toLowerCase()!=="input"||y.type!=="checkbox"&&y.type!=="radio"?v&&zc(v.elementType)&&(nt=fs):nt=O0;if(nt&&(nt=nt(t,v))){is(E,nt,e,S);break t}C&&C(t,y,v),t==="focusout"&&v&&y.type==="number"&&v.memoizedProps.value!=null&&Ac(y,"number",y.value)}switch(C=v?fu(v):window,t){case"focusin":(cs(C)||C.contentEditable==="true")&&(Da=C,Yc=v,gu=null);break;case"focusout":gu=Yc=Da=null;break;case"mousedown":Gc=!0;break;case"contextmenu":case"mouseup":case"dragend":Gc=!1,gs(E,e,S);break;case"selectionchange":if(D0)break;case"keydown":case"keyup":gs(E,e,S)}var w;if(jc)t:{switch(t){case"compositionstart":var P="onCompositionStart";break t;case"compositionend":P="onCompositionEnd";break t;case"compositionupdate":P="onCompositionUpdate";break t}P=void 0}else Ma?us(t,e)&&(P="onCompositionEnd"):t==="keydown"&&e.keyCode===229&&(P="onCompositionStart");P&&(ls&&e.locale!=="ko"&&(Ma||P!=="onCompositionStart"?P==="onCompositionEnd"&&Ma&&(w=$f()):(Ee=S,Mc="value"in Ee?Ee.value:Ee.textContent,Ma=!0)),C=Pn(v,P),0<C.length&&(P=new Pf(P,t,null,e,S),E.push({event:P,listeners:C}),w?P.data=w:(w=ns(e),w!==null&&(P.data=w)))),(w=p0?E0(t,e):x0(t,e))&&(P=Pn(v,"onBeforeInput"),0<P.length&&(C=new Pf("onBeforeInput","beforeinput",null,e,S),E.push({event:C,listeners:P}),C.data=w)),mm(E,t,v,e,S)}Vd(E,l)})}function Zu(t,l,e){return{instance:t,listener:l,currentTarget:e}}function Pn(t,l){for(var e=l+"Capture",a=[];t!==null;){var u=t,n=u.stateNode;if(u=u.tag,u!==5&&u!==26&&u!==27||n===null||(u=su(t,e),u!=null&&a.unshift(Zu(t,u,n)),u=su(t,l),u!=null&&a.push(Zu(t,u,n))),t.tag===3)return a;t=t.return}return[]}function gm(t){if(t===null)return null;do t=t.return;while(t&&t.tag!==5&&t.tag!==27);return t||null}function Jd(t,l,e,a,u){for(var n=l._reactName,c=[];e!==null&&e!==a;){var i=e,f=i.alternate,v=i.stateNode;if(i=i.tag,f!==null&&f===a)break;i!==5&&i!==26&&i!==27||v===null||(f=v,u?(v=su(e,n),v!=null&&c.unshift(Zu(e,v,f))):u||(v=su(e,n),v!=null&&c.push(Zu(e,v,f)))),e=e.return}c.length!==0&&t.push({event:l,listeners:c})}var Sm=/\r\n?/g,bm=/\u0000|\uFFFD/g;function wd(t){return(typeof t=="string"?t:""+t).replace(Sm,`
-`).replace(bm,"")}function Wd(t,l){return l=wd(l),wd(t)===l}function yt(t,l,e,a,u,n){switch(e){case"children":typeof a=="string"?l==="body"||l==="textarea"&&a===""||_a(t,a):(typeof a=="number"||typeof a=="bigint")&&l!=="body"&&_a(t,""+a);break;case"className":en(t,"class",a);break;case"tabIndex":en(t,"tabindex",a);break;case"dir":case"role":case"viewBox":case"width":case"height":en(t,e,a);break;case"style":wf(t,a,n);break;case"data":if(l!=="object"){en(t,"data",a);break}case"src":case"href":if(a===""&&(l!=="a"||e!=="href")){t.removeAttribute(e);break}if(a==null||typeof a=="function"||typeof a=="symbol"||typeof a=="boolean"){t.removeAttribute(e);break}a=un(""+a),t.setAttribute(e,a);break;case"action":case"formAction":if(typeof a=="function"){t.setAttribute(e,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(e==="formAction"?(l!=="input"&&yt(t,l,"name",u.name,u,null),yt(t,l,"formEncType",u.formEncType,u,null),yt(t,l,"formMethod",u.formMethod,u,null),yt(t,l,"formTarget",u.formTarget,u,null)):(yt(t,l,"encType",u.encType,u,null),yt(t,l,"method",u.method,u,null),yt(t,l,"target",u.target,u,null)));if(a==null||typeof a=="symbol"||typeof a=="boolean"){t.removeAttribute(e);break}a=un(""+a),t.setAttribute(e,a);break;case"onClick":a!=null&&(t.onclick=te);break;case"onScroll":a!=null&&F("scroll",t);break;case"onScrollEnd":a!=null&&F("scrollend",t);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(r(61));if(e=a.__html,e!=null){if(u.children!=null)throw Error(r(60));t.innerHTML=e}}break;case"multiple":t.multiple=a&&typeof a!="function"&&typeof a!="symbol";break;case"muted":t.muted=a&&typeof a!="function"&&typeof a!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(a==null||typeof a=="function"||typeof a=="boolean"||typeof a=="symbol"){t.removeAttribute("xlink:href");break}e=un(""+a),t.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",e);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":a!=null&&typeof a!="function"&&typeof a!="symbol"?t.setAttribute(e,""+a):t.removeAttribute(e);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":a&&typeof a!="function"&&typeof a!="symbol"?t.setAttribute(e,""):t.removeAttribute(e);break;case"capture":case"download":a===!0?t.setAttribute(e,""):a!==!1&&a!=null&&typeof a!="function"&&typeof a!="symbol"?t.setAttribute(e,a):t.removeAttribute(e);break;case"cols":case"rows":case"size":case"span":a!=null&&typeof a!="function"&&typeof a!="symbol"&&!isNaN(a)&&1<=a?t.setAttribute(e,a):t.removeAttribute(e);break;case"rowSpan":case"start":a==null||typeof a=="function"||typeof a=="symbol"||isNaN(a)?t.removeAttribute(e):t.setAttribute(e,a);break;case"popover":F("beforetoggle",t),F("toggle",t),ln(t,"popover",a);break;case"xlinkActuate":Pl(t,"http://www.w3.org/1999/xlink","xlink:actuate",a);break;case"xlinkArcrole":Pl(t,"http://www.w3.org/1999/xlink","xlink:arcrole",a);break;case"xlinkRole":Pl(t,"http://www.w3.org/1999/xlink","xlink:role",a);break;case"xlinkShow":Pl(t,"http://www.w3.org/1999/xlink","xlink:show",a);break;case"xlinkTitle":Pl(t,"http://www.w3.org/1999/xlink","xlink:title",a);break;case"xlinkType":Pl(t,"http://www.w3.org/1999/xlink","xlink:type",a);break;case"xmlBase":Pl(t,"http://www.w3.org/XML/1998/namespace","xml:base",a);break;case"xmlLang":Pl(t,"http://www.w3.org/XML/1998/namespace","xml:lang",a);break;case"xmlSpace":Pl(t,"http://www.w3.org/XML/1998/namespace","xml:space",a);break;case"is":ln(t,"is",a);break;case"innerText":case"textContent":break;default:(!(2<e.length)||e[0]!=="o"&&e[0]!=="O"||e[1]!=="n"&&e[1]!=="N")&&(e=wr.get(e)||e,ln(t,e,a))}}function df(t,l,e,a,u,n){switch(e){case"style":wf(t,a,n);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(r(61));if(e=a.__html,e!=null){if(u.children!=null)throw Error(r(60));t.innerHTML=e}}break;case"children":typeof a=="string"?_a(t,a):(typeof a=="number"||typeof a=="bigint")&&_a(t,""+a);break;case"onScroll":a!=null&&F("scroll",t);break;case"onScrollEnd":a!=null&&F("scrollend",t);break;case"onClick":a!=null&&(t.onclick=te);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!Yf.hasOwnProperty(e))t:{if(e[0]==="o"&&e[1]==="n"&&(u=e.endsWith("Capture"),l=e.slice(2,u?e.length-7:void 0),n=t[Yt]||null,n=n!=null?n[e]:null,typeof n=="function"&&t.removeEventListener(l,n,u),typeof a=="function")){typeof n!="function"&&n!==null&&(e in t?t[e]=null:t.hasAttribute(e)&&t.removeAttribute(e)),t.addEventListener(l,a,u);break t}e in t?t[e]=a:a===!0?t.setAttribute(e,""):ln(t,e,a)}}}function kt(t,l,e){switch(l){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":F("error",t),F("load",t);var a=!1,u=!1,n;for(n in e)if(e.hasOwnProperty(n)){var c=e[n];if(c!=null)switch(n){case"src":a=!0;break;case"srcSet":u=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(r(137,l));default:yt(t,l,n,c,e,null)}}u&&yt(t,l,"srcSet",e.srcSet,e,null),a&&yt(t,l,"src",e.src,e,null);return;case"input":F("invalid",t);var i=n=c=u=null,f=null,v=null;for(a in e)if(e.hasOwnProperty(a)){var S=e[a];if(S!=null)switch(a){case"name":u=S;break;case"type":c=S;break;case"checked":f=S;break;case"defaultChecked":v=S;break;case"value":n=S;break;case"defaultValue":i=S;break;case"children":case"dangerouslySetInnerHTML":if(S!=null)throw Error(r(137,l));break;default:yt(t,l,a,S,e,null)}}Lf(t,n,i,f,v,c,u,!1);return;case"select":F("invalid",t),a=c=n=null;for(u in e)if(e.hasOwnProperty(u)&&(i=e[u],i!=null))switch(u){case"value":n=i;break;case"defaultValue":c=i;break;case"multiple":a=i;default:yt(t,l,u,i,e,null)}l=n,e=c,t.multiple=!!a,l!=null?Ta(t,!!a,l,!1):e!=null&&Ta(t,!!a,e,!0);return;case"textarea":F("invalid",t),n=u=a=null;for(c in e)if(e.hasOwnProperty(c)&&(i=e[c],i!=null))switch(c){case"value":a=i;break;case"defaultValue":u=i;break;case"children":n=i;break;case"dangerouslySetInnerHTML":if(i!=null)throw Error(r(91));break;default:yt(t,l,c,i,e,null)}Kf(t,a,u,n);return;case"option":for(f in e)if(e.hasOwnProperty(f)&&(a=e[f],a!=null))switch(f){case"selected":t.selected=a&&typeof a!="function"&&typeof a!="symbol";break;default:yt(t,l,f,a,e,null)}return;case"dialog":F("beforetoggle",t),F("toggle",t),F("cancel",t),F("close",t);break;case"iframe":case"object":F("load",t);break;case"video":case"audio":for(a=0;a<Xu.length;a++)F(Xu[a],t);break;case"image":F("error",t),F("load",t);break;case"details":F("toggle",t);break;case"embed":case"source":case"link":F("error",t),F("load",t);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(v in e)if(e.hasOwnProperty(v)&&(a=e[v],a!=null))switch(v){case"children":case"dangerouslySetInnerHTML":throw Error(r(137,l));default:yt(t,l,v,a,e,null)}return;default:if(zc(l)){for(S in e)e.hasOwnProperty(S)&&(a=e[S],a!==void 0&&df(t,l,S,a,e,void 0));return}}for(i in e)e.hasOwnProperty(i)&&(a=e[i],a!=null&&yt(t,l,i,a,e,null))}function pm(t,l,e,a){switch(l){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var u=null,n=null,c=null,i=null,f=null,v=null,S=null;for(h in e){var E=e[h];if(e.hasOwnProperty(h)&&E!=null)switch(h){case"checked":break;case"value":break;case"defaultValue":f=E;default:a.hasOwnProperty(h)||yt(t,l,h,null,a,E)}}for(var y in a){var h=a[y];if(E=e[y],a.hasOwnProperty(y)&&(h!=null||E!=null))switch(y){case"type":n=h;break;case"name":u=h;break;case"checked":v=h;break;case"defaultChecked":S=h;break;case"value":c=h;break;case"defaultValue":i=h;break;case"children":case"dangerouslySetInnerHTML":if(h!=null)throw Error(r(137,l));break;default:h!==E&&yt(t,l,y,h,a,E)}}xc(t,c,i,f,v,S,n,u);return;case"select":h=c=i=y=null;for(n in e)if(f=e[n],e.hasOwnProperty(n)&&f!=null)switch(n){case"value":break;case"multiple":h=f;default:a.hasOwnProperty(n)||yt(t,l,n,null,a,f)}for(u in a)if(n=a[u],f=e[u],a.hasOwnProperty(u)&&(n!=null||f!=null))switch(u){case"value":y=n;break;case"defaultValue":i=n;break;case"multiple":c=n;default:n!==f&&yt(t,l,u,n,a,f)}l=i,e=c,a=h,y!=null?Ta(t,!!e,y,!1):!!a!=!!e&&(l!=null?Ta(t,!!e,l,!0):Ta(t,!!e,e?[]:"",!1));return;case"textarea":h=y=null;for(i in e)if(u=e[i],e.hasOwnProperty(i)&&u!=null&&!a.hasOwnProperty(i))switch(i){case"value":break;case"children":break;default:yt(t,l,i,null,a,u)}for(c in a)if(u=a[c],n=e[c],a.hasOwnProperty(c)&&(u!=null||n!=null))switch(c){case"value":y=u;break;case"defaultValue":h=u;break;case"children":break;case"dangerouslySetInnerHTML":if(u!=null)throw Error(r(91));break;default:u!==n&&yt(t,l,c,u,a,n)}Vf(t,y,h);return;case"option":for(var M in e)if(y=e[M],e.hasOwnProperty(M)&&y!=null&&!a.hasOwnProperty(M))switch(M){case"selected":t.selected=!1;break;default:yt(t,l,M,null,a,y)}for(f in a)if(y=a[f],h=e[f],a.hasOwnProperty(f)&&y!==h&&(y!=null||h!=null))switch(f){case"selected":t.selected=y&&typeof y!="function"&&typeof y!="symbol";break;default:yt(t,l,f,y,a,h)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var Y in e)y=e[Y],e.hasOwnProperty(Y)&&y!=null&&!a.hasOwnProperty(Y)&&yt(t,l,Y,null,a,y);for(v in a)if(y=a[v],h=e[v],a.hasOwnProperty(v)&&y!==h&&(y!=null||h!=null))switch(v){case"children":case"dangerouslySetInnerHTML":if(y!=null)throw Error(r(137,l));break;default:yt(t,l,v,y,a,h)}return;default:if(zc(l)){for(var ht in e)y=e[ht],e.hasOwnProperty(ht)&&y!==void 0&&!a.hasOwnProperty(ht)&&df(t,l,ht,void 0,a,y);for(S in a)y=a[S],h=e[S],!a.hasOwnProperty(S)||y===h||y===void 0&&h===void 0||df(t,l,S,y,a,h);return}}for(var d in e)y=e[d],e.hasOwnProperty(d)&&y!=null&&!a.hasOwnProperty(d)&&yt(t,l,d,null,a,y);for(E in a)y=a[E],h=e[E],!a.hasOwnProperty(E)||y===h||y==null&&h==null||yt(t,l,E,y,a,h)}function kd(t){switch(t){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function Em(){if(typeof performance.getEntriesByType=="function"){for(var t=0,l=0,e=performance.getEntriesByType("resource"),a=0;a<e.length;a++){var u=e[a],n=u.transferSize,c=u.initiatorType,i=u.duration;if(n&&i&&kd(c)){for(c=0,i=u.responseEnd,a+=1;a<e.length;a++){var f=e[a],v=f.startTime;if(v>i)break;var S=f.transferSize,E=f.initiatorType;S&&kd(E)&&(f=f.responseEnd,c+=S*(f<i?1:(i-v)/(f-v)))}if(--a,l+=8*(n+c)/(u.duration/1e3),t++,10<t)break}}if(0<t)return l/t/1e6}return navigator.connection&&(t=navigator.connection.downlink,typeof t=="number")?t:5}var rf=null,mf=null;function tc(t){return t.nodeType===9?t:t.ownerDocument}function $d(t){switch(t){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function Fd(t,l){if(t===0)switch(l){case"svg":return 1;case"math":return 2;default:return 0}return t===1&&l==="foreignObject"?0:t}function vf(t,l){return t==="textarea"||t==="noscript"||typeof l.children=="string"||typeof l.children=="number"||typeof l.children=="bigint"||typeof l.dangerouslySetInnerHTML=="object"&&l.dangerouslySetInnerHTML!==null&&l.dangerouslySetInnerHTML.__html!=null}var yf=null;function xm(){var t=window.event;return t&&t.type==="popstate"?t===yf?!1:(yf=t,!0):(yf=null,!1)}var Id=typeof setTimeout=="function"?setTimeout:void 0,Am=typeof clearTimeout=="function"?clearTimeout:void 0,Pd=typeof Promise=="function"?Promise:void 0,zm=typeof queueMicrotask=="function"?queueMicrotask:typeof Pd<"u"?function(t){return Pd.resolve(null).then(t).catch(Tm)}:Id;function Tm(t){setTimeout(function(){throw t})}function Ye(t){return t==="head"}function tr(t,l){var e=l,a=0;do{var u=e.nextSibling;if(t.removeChild(e),u&&u.nodeType===8)if(e=u.data,e==="/$"||e==="/&"){if(a===0){t.removeChild(u),au(l);return}a--}else if(e==="$"||e==="$?"||e==="$~"||e==="$!"||e==="&")a++;else if(e==="html")Lu(t.ownerDocument.documentElement);else if(e==="head"){e=t.ownerDocument.head,Lu(e);for(var n=e.firstChild;n;){var c=n.nextSibling,i=n.nodeName;n[iu]||i==="SCRIPT"||i==="STYLE"||i==="LINK"&&n.rel.toLowerCase()==="stylesheet"||e.removeChild(n),n=c}}else e==="body"&&Lu(t.ownerDocument.body);e=u}while(e);au(l)}function lr(t,l){var e=t;t=0;do{var a=e.nextSibling;if(e.nodeType===1?l?(e._stashedDisplay=e.style.display,e.style.display="none"):(e.style.display=e._stashedDisplay||"",e.getAttribute("style")===""&&e.removeAttribute("style")):e.nodeType===3&&(l?(e._stashedText=e.nodeValue,e.nodeValue=""):e.nodeValue=e._stashedText||""),a&&a.nodeType===8)if(e=a.data,e==="/$"){if(t===0)break;t--}else e!=="$"&&e!=="$?"&&e!=="$~"&&e!=="$!"||t++;e=a}while(e)}function hf(t){var l=t.firstChild;for(l&&l.nodeType===10&&(l=l.nextSibling);l;){var e=l;switch(l=l.nextSibling,e.nodeName){case"HTML":case"HEAD":case"BODY":hf(e),pc(e);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(e.rel.toLowerCase()==="stylesheet")continue}t.removeChild(e)}}function _m(t,l,e,a){for(;t.nodeType===1;){var u=e;if(t.nodeName.toLowerCase()!==l.toLowerCase()){if(!a&&(t.nodeName!=="INPUT"||t.type!=="hidden"))break}else if(a){if(!t[iu])switch(l){case"meta":if(!t.hasAttribute("itemprop"))break;return t;case"link":if(n=t.getAttribute("rel"),n==="stylesheet"&&t.hasAttribute("data-precedence"))break;if(n!==u.rel||t.getAttribute("href")!==(u.href==null||u.href===""?null:u.href)||t.getAttribute("crossorigin")!==(u.crossOrigin==null?null:u.crossOrigin)||t.getAttribute("title")!==(u.title==null?null:u.title))break;return t;case"style":if(t.hasAttribute("data-precedence"))break;return t;case"script":if(n=t.getAttribute("src"),(n!==(u.src==null?null:u.src)||t.getAttribute("type")!==(u.type==null?null:u.type)||t.getAttribute("crossorigin")!==(u.crossOrigin==null?null:u.crossOrigin))&&n&&t.hasAttribute("async")&&!t.hasAttribute("itemprop"))break;return t;default:return t}}else if(l==="input"&&t.type==="hidden"){var n=u.name==null?null:""+u.name;if(u.type==="hidden"&&t.getAttribute("name")===n)return t}else return t;if(t=Rl(t.nextSibling),t===null)break}return null}function Om(t,l,e){if(l==="")return null;for(;t.nodeType!==3;)if((t.nodeType!==1||t.nodeName!=="INPUT"||t.type!=="hidden")&&!e||(t=Rl(t.nextSibling),t===null))return null;return t}function er(t,l){for(;t.nodeType!==8;)if((t.nodeType!==1||t.nodeName!=="INPUT"||t.type!=="hidden")&&!l||(t=Rl(t.nextSibling),t===null))return null;return t}function gf(t){return t.data==="$?"||t.data==="$~"}function Sf(t){return t.data==="$!"||t.data==="$?"&&t.ownerDocument.readyState!=="loading"}function Nm(t,l){var e=t.ownerDocument;if(t.data==="$~")t._reactRetry=l;else if(t.data!=="$?"||e.readyState!=="loading")l();else{var a=function(){l(),e.removeEventListener("DOMContentLoaded",a)};e.addEventListener("DOMContentLoaded",a),t._reactRetry=a}}function Rl(t){for(;t!=null;t=t.nextSibling){var l=t.nodeType;if(l===1||l===3)break;if(l===8){if(l=t.data,l==="$"||l==="$!"||l==="$?"||l==="$~"||l==="&"||l==="F!"||l==="F")break;if(l==="/$"||l==="/&")return null}}return t}var bf=null;function ar(t){t=t.nextSibling;for(var l=0;t;){if(t.nodeType===8){var e=t.data;if(e==="/$"||e==="/&"){if(l===0)return Rl(t.nextSibling);l--}else e!=="$"&&e!=="$!"&&e!=="$?"&&e!=="$~"&&e!=="&"||l++}t=t.nextSibling}return null}function ur(t){t=t.previousSibling;for(var l=0;t;){if(t.nodeType===8){var e=t.data;if(e==="$"||e==="$!"||e==="$?"||e==="$~"||e==="&"){if(l===0)return t;l--}else e!=="/$"&&e!=="/&"||l++}t=t.previousSibling}return null}function nr(t,l,e){switch(l=tc(e),t){case"html":if(t=l.documentElement,!t)throw Error(r(452));return t;case"head":if(t=l.head,!t)throw Error(r(453));return t;case"body":if(t=l.body,!t)throw Error(r(454));return t;default:throw Error(r(451))}}function Lu(t){for(var l=t.attributes;l.length;)t.removeAttributeNode(l[0]);pc(t)}var jl=new Map,cr=new Set;function lc(t){return typeof t.getRootNode=="function"?t.getRootNode():t.nodeType===9?t:t.ownerDocument}var he=N.d;N.d={f:Mm,r:Dm,D:Cm,C:Um,L:Rm,m:jm,X:Bm,S:Hm,M:qm};function Mm(){var t=he.f(),l=Jn();return t||l}function Dm(t){var l=xa(t);l!==null&&l.tag===5&&l.type==="form"?Ao(l):he.r(t)}var tu=typeof document>"u"?null:document;function ir(t,l,e){var a=tu;if(a&&typeof l=="string"&&l){var u=_l(l);u='link[rel="'+t+'"][href="'+u+'"]',typeof e=="string"&&(u+='[crossorigin="'+e+'"]'),cr.has(u)||(cr.add(u),t={rel:t,crossOrigin:e,href:l},a.querySelector(u)===null&&(l=a.createElement("link"),kt(l,"link",t),Zt(l),a.head.appendChild(l)))}}function Cm(t){he.D(t),ir("dns-prefetch",t,null)}function Um(t,l){he.C(t,l),ir("preconnect",t,l)}function Rm(t,l,e){he.L(t,l,e);var a=tu;if(a&&t&&l){var u='link[rel="preload"][as="'+_l(l)+'"]';l==="image"&&e&&e.imageSrcSet?(u+='[imagesrcset="'+_l(e.imageSrcSet)+'"]',typeof e.imageSizes=="string"&&(u+='[imagesizes="'+_l(e.imageSizes)+'"]')):u+='[href="'+_l(t)+'"]';var n=u;switch(l){case"style":n=lu(t);break;case"script":n=eu(t)}jl.has(n)||(t=H({rel:"preload",href:l==="image"&&e&&e.imageSrcSet?void 0:t,as:l},e),jl.set(n,t),a.querySelector(u)!==null||l==="style"&&a.querySelector(Vu(n))||l==="script"&&a.querySelector(Ku(n))||(l=a.createElement("link"),kt(l,"link",t),Zt(l),a.head.appendChild(l)))}}function jm(t,l){he.m(t,l);var e=tu;if(e&&t){var a=l&&typeof l.as=="string"?l.as:"script",u='link[rel="modulepreload"][as="'+_l(a)+'"][href="'+_l(t)+'"]',n=u;switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=eu(t)}if(!jl.has(n)&&(t=H({rel:"modulepreload",href:t},l),jl.set(n,t),e.querySelector(u)===null)){switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(e.querySelector(Ku(n)))return}a=e.createElement("link"),kt(a,"link",t),Zt(a),e.head.appendChild(a)}}}function Hm(t,l,e){he.S(t,l,e);var a=tu;if(a&&t){var u=Aa(a).hoistableStyles,n=lu(t);l=l||"default";var c=u.get(n);if(!c){var i={loading:0,preload:null};if(c=a.querySelector(Vu(n)))i.loading=5;else{t=H({rel:"stylesheet",href:t,"data-precedence":l},e),(e=jl.get(n))&&pf(t,e);var f=c=a.createElement("link");Zt(f),kt(f,"link",t),f._p=new Promise(function(v,S){f.onload=v,f.onerror=S}),f.addEventListener("load",function(){i.loading|=1}),f.addEventListener("error",function(){i.loading|=2}),i.loading|=4,ec(c,l,a)}c={type:"stylesheet",instance:c,count:1,state:i},u.set(n,c)}}}function Bm(t,l){he.X(t,l);var e=tu;if(e&&t){var a=Aa(e).hoistableScripts,u=eu(t),n=a.get(u);n||(n=e.querySelector(Ku(u)),n||(t=H({src:t,async:!0},l),(l=jl.get(u))&&Ef(t,l),n=e.createElement("script"),Zt(n),kt(n,"link",t),e.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(u,n))}}function qm(t,l){he.M(t,l);var e=tu;if(e&&t){var a=Aa(e).hoistableScripts,u=eu(t),n=a.get(u);n||(n=e.querySelector(Ku(u)),n||(t=H({src:t,async:!0,type:"module"},l),(l=jl.get(u))&&Ef(t,l),n=e.createElement("script"),Zt(n),kt(n,"link",t),e.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(u,n))}}function fr(t,l,e,a){var u=(u=X.current)?lc(u):null;if(!u)throw Error(r(446));switch(t){case"meta":case"title":return null;case"style":return typeof e.precedence=="string"&&typeof e.href=="string"?(l=lu(e.href),e=Aa(u).hoistableStyles,a=e.get(l),a||(a={type:"style",instance:null,count:0,state:null},e.set(l,a)),a):{type:"void",instance:null,count:0,state:null};case"link":if(e.rel==="stylesheet"&&typeof e.href=="string"&&typeof e.precedence=="string"){t=lu(e.href);var n=Aa(u).hoistableStyles,c=n.get(t);if(c||(u=u.ownerDocument||u,c={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(t,c),(n=u.querySelector(Vu(t)))&&!n._p&&(c.instance=n,c.state.loading=5),jl.has(t)||(e={rel:"preload",as:"style",href:e.href,crossOrigin:e.crossOrigin,integrity:e.integrity,media:e.media,hrefLang:e.hrefLang,referrerPolicy:e.referrerPolicy},jl.set(t,e),n||Ym(u,t,e,c.state))),l&&a===null)throw Error(r(528,""));return c}if(l&&a!==null)throw Error(r(529,""));return null;case"script":return l=e.async,e=e.src,typeof e=="string"&&l&&typeof l!="function"&&typeof l!="symbol"?(l=eu(e),e=Aa(u).hoistableScripts,a=e.get(l),a||(a={type:"script",instance:null,count:0,state:null},e.set(l,a)),a):{type:"void",instance:null,count:0,state:null};default:throw Error(r(444,t))}}function lu(t){return'href="'+_l(t)+'"'}function Vu(t){return'link[rel="stylesheet"]['+t+"]"}function sr(t){return H({},t,{"data-precedence":t.precedence,precedence:null})}function Ym(t,l,e,a){t.querySelector('link[rel="preload"][as="style"]['+l+"]")?a.loading=1:(l=t.createElement("link"),a.preload=l,l.addEventListener("load",function(){return a.loading|=1}),l.addEventListener("error",function(){return a.loading|=2}),kt(l,"link",e),Zt(l),t.head.appendChild(l))}function eu(t){return'[src="'+_l(t)+'"]'}function Ku(t){return"script[async]"+t}function or(t,l,e){if(l.count++,l.instance===null)switch(l.type){case"style":var a=t.querySelector('style[data-href~="'+_l(e.href)+'"]');if(a)return l.instance=a,Zt(a),a;var u=H({},e,{"data-href":e.href,"data-precedence":e.precedence,href:null,precedence:null});return a=(t.ownerDocument||t).createElement("style"),Zt(a),kt(a,"style",u),ec(a,e.precedence,t),l.instance=a;case"stylesheet":u=lu(e.href);var n=t.querySelector(Vu(u));if(n)return l.state.loading|=4,l.instance=n,Zt(n),n;a=sr(e),(u=jl.get(u))&&pf(a,u),n=(t.ownerDocument||t).createElement("link"),Zt(n);var c=n;return c._p=new Promise(function(i,f){c.onload=i,c.onerror=f}),kt(n,"link",a),l.state.loading|=4,ec(n,e.precedence,t),l.instance=n;case"script":return n=eu(e.src),(u=t.querySelector(Ku(n)))?(l.instance=u,Zt(u),u):(a=e,(u=jl.get(n))&&(a=H({},e),Ef(a,u)),t=t.ownerDocument||t,u=t.createElement("script"),Zt(u),kt(u,"link",a),t.head.appendChild(u),l.instance=u);case"void":return null;default:throw Error(r(443,l.type))}else l.type==="stylesheet"&&(l.state.loading&4)===0&&(a=l.instance,l.state.loading|=4,ec(a,e.precedence,t));return l.instance}function ec(t,l,e){for(var a=e.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),u=a.length?a[a.length-1]:null,n=u,c=0;c<a.length;c++){var i=a[c];if(i.dataset.precedence===l)n=i;else if(n!==u)break}n?n.parentNode.insertBefore(t,n.nextSibling):(l=e.nodeType===9?e.head:e,l.insertBefore(t,l.firstChild))}function pf(t,l){t.crossOrigin==null&&(t.crossOrigin=l.crossOrigin),t.referrerPolicy==null&&(t.referrerPolicy=l.referrerPolicy),t.title==null&&(t.title=l.title)}function Ef(t,l){t.crossOrigin==null&&(t.crossOrigin=l.crossOrigin),t.referrerPolicy==null&&(t.referrerPolicy=l.referrerPolicy),t.integrity==null&&(t.integrity=l.integrity)}var ac=null;function dr(t,l,e){if(ac===null){var a=new Map,u=ac=new Map;u.set(e,a)}else u=ac,a=u.get(e),a||(a=new Map,u.set(e,a));if(a.has(t))return a;for(a.set(t,null),e=e.getElementsByTagName(t),u=0;u<e.length;u++){var n=e[u];if(!(n[iu]||n[Ut]||t==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var c=n.getAttribute(l)||"";c=t+c;var i=a.get(c);i?i.push(n):a.set(c,[n])}}return a}function rr(t,l,e){t=t.ownerDocument||t,t.head.insertBefore(e,l==="title"?t.querySelector("head > title"):null)}function Gm(t,l,e){if(e===1||l.itemProp!=null)return!1;switch(t){case"meta":case"title":return!0;case"style":if(typeof l.precedence!="string"||typeof l.href!="string"||l.href==="")break;return!0;case"link":if(typeof l.rel!="string"||typeof l.href!="string"||l.href===""||l.onLoad||l.onError)break;switch(l.rel){case"stylesheet":return t=l.disabled,typeof l.precedence=="string"&&t==null;default:return!0}case"script":if(l.async&&typeof l.async!="function"&&typeof l.async!="symbol"&&!l.onLoad&&!l.onError&&l.src&&typeof l.src=="string")return!0}return!1}function mr(t){return!(t.type==="stylesheet"&&(t.state.loading&3)===0)}function Qm(t,l,e,a){if(e.type==="stylesheet"&&(typeof a.media!="string"||matchMedia(a.media).matches!==!1)&&(e.state.loading&4)===0){if(e.instance===null){var u=lu(a.href),n=l.querySelector(Vu(u));if(n){l=n._p,l!==null&&typeof l=="object"&&typeof l.then=="function"&&(t.count++,t=uc.bind(t),l.then(t,t)),e.state.loading|=4,e.instance=n,Zt(n);return}n=l.ownerDocument||l,a=sr(a),(u=jl.get(u))&&pf(a,u),n=n.createElement("link"),Zt(n);var c=n;c._p=new Promise(function(i,f){c.onload=i,c.onerror=f}),kt(n,"link",a),e.instance=n}t.stylesheets===null&&(t.stylesheets=new Map),t.stylesheets.set(e,l),(l=e.state.preload)&&(e.state.loading&3)===0&&(t.count++,e=uc.bind(t),l.addEventListener("load",e),l.addEventListener("error",e))}}var xf=0;function Xm(t,l){return t.stylesheets&&t.count===0&&cc(t,t.stylesheets),0<t.count||0<t.imgCount?function(e){var a=setTimeout(function(){if(t.stylesheets&&cc(t,t.stylesheets),t.unsuspend){var n=t.unsuspend;t.unsuspend=null,n()}},6e4+l);0<t.imgBytes&&xf===0&&(xf=62500*Em());var u=setTimeout(function(){if(t.waitingForImages=!1,t.count===0&&(t.stylesheets&&cc(t,t.stylesheets),t.unsuspend)){var n=t.unsuspend;t.unsuspend=null,n()}},(t.imgBytes>xf?50:800)+l);return t.unsuspend=e,function(){t.unsuspend=null,clearTimeout(a),clearTimeout(u)}}:null}function uc(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)cc(this,this.stylesheets);else if(this.unsuspend){var t=this.unsuspend;this.unsuspend=null,t()}}}var nc=null;function cc(t,l){t.stylesheets=null,t.unsuspend!==null&&(t.count++,nc=new Map,l.forEach(Zm,t),nc=null,uc.call(t))}function Zm(t,l){if(!(l.state.loading&4)){var e=nc.get(t);if(e)var a=e.get(null);else{e=new Map,nc.set(t,e);for(var u=t.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<u.length;n++){var c=u[n];(c.nodeName==="LINK"||c.getAttribute("media")!=="not all")&&(e.set(c.dataset.precedence,c),a=c)}a&&e.set(null,a)}u=l.instance,c=u.getAttribute("data-precedence"),n=e.get(c)||a,n===a&&e.set(null,u),e.set(c,u),this.count++,a=uc.bind(this),u.addEventListener("load",a),u.addEventListener("error",a),n?n.parentNode.insertBefore(u,n.nextSibling):(t=t.nodeType===9?t.head:t,t.insertBefore(u,t.firstChild)),l.state.loading|=4}}var Ju={$$typeof:qt,Provider:null,Consumer:null,_currentValue:q,_currentValue2:q,_threadCount:0};function Lm(t,l,e,a,u,n,c,i,f){this.tag=1,this.containerInfo=t,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Fe(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Fe(0),this.hiddenUpdates=Fe(null),this.identifierPrefix=a,this.onUncaughtError=u,this.onCaughtError=n,this.onRecoverableError=c,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=f,this.incompleteTransitions=new Map}function vr(t,l,e,a,u,n,c,i,f,v,S,E){return t=new Lm(t,l,e,c,f,v,S,E,i),l=1,n===!0&&(l|=24),n=yl(3,null,null,l),t.current=n,n.stateNode=t,l=ti(),l.refCount++,t.pooledCache=l,l.refCount++,n.memoizedState={element:a,isDehydrated:e,cache:l},ui(n),t}function yr(t){return t?(t=Ra,t):Ra}function hr(t,l,e,a,u,n){u=yr(u),a.context===null?a.context=u:a.pendingContext=u,a=Oe(l),a.payload={element:e},n=n===void 0?null:n,n!==null&&(a.callback=n),e=Ne(t,a,l),e!==null&&(rl(e,t,l),zu(e,t,l))}function gr(t,l){if(t=t.memoizedState,t!==null&&t.dehydrated!==null){var e=t.retryLane;t.retryLane=e!==0&&e<l?e:l}}function Af(t,l){gr(t,l),(t=t.alternate)&&gr(t,l)}function Sr(t){if(t.tag===13||t.tag===31){var l=ea(t,67108864);l!==null&&rl(l,t,67108864),Af(t,67108864)}}function br(t){if(t.tag===13||t.tag===31){var l=pl();l=bt(l);var e=ea(t,l);e!==null&&rl(e,t,l),Af(t,l)}}var ic=!0;function Vm(t,l,e,a){var u=g.T;g.T=null;var n=N.p;try{N.p=2,zf(t,l,e,a)}finally{N.p=n,g.T=u}}function Km(t,l,e,a){var u=g.T;g.T=null;var n=N.p;try{N.p=8,zf(t,l,e,a)}finally{N.p=n,g.T=u}}function zf(t,l,e,a){if(ic){var u=Tf(a);if(u===null)of(t,l,a,fc,e),Er(t,a);else if(wm(u,t,l,e,a))a.stopPropagation();else if(Er(t,a),l&4&&-1<Jm.indexOf(t)){for(;u!==null;){var n=xa(u);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var c=Ll(n.pendingLanes);if(c!==0){var i=n;for(i.pendingLanes|=2,i.entangledLanes|=2;c;){var f=1<<31-al(c);i.entanglements[1]|=f,c&=~f}wl(n),(ft&6)===0&&(Vn=Ot()+500,Qu(0))}}break;case 31:case 13:i=ea(n,2),i!==null&&rl(i,n,2),Jn(),Af(n,2)}if(n=Tf(a),n===null&&of(t,l,a,fc,e),n===u)break;u=n}u!==null&&a.stopPropagation()}else of(t,l,a,null,e)}}function Tf(t){return t=_c(t),_f(t)}var fc=null;function _f(t){if(fc=null,t=Ea(t),t!==null){var l=k(t);if(l===null)t=null;else{var e=l.tag;if(e===13){if(t=zt(l),t!==null)return t;t=null}else if(e===31){if(t=gt(l),t!==null)return t;t=null}else if(e===3){if(l.stateNode.current.memoizedState.isDehydrated)return l.tag===3?l.stateNode.containerInfo:null;t=null}else l!==t&&(t=null)}}return fc=t,null}function pr(t){switch(t){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Fl()){case Il:return 2;case uu:return 8;case we:case nu:return 32;case We:return 268435456;default:return 32}default:return 32}}var Of=!1,Ge=null,Qe=null,Xe=null,wu=new Map,Wu=new Map,Ze=[],Jm="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function Er(t,l){switch(t){case"focusin":case"focusout":Ge=null;break;case"dragenter":case"dragleave":Qe=null;break;case"mouseover":case"mouseout":Xe=null;break;case"pointerover":case"pointerout":wu.delete(l.pointerId);break;case"gotpointercapture":case"lostpointercapture":Wu.delete(l.pointerId)}}function ku(t,l,e,a,u,n){return t===null||t.nativeEvent!==n?(t={blockedOn:l,domEventName:e,eventSystemFlags:a,nativeEvent:n,targetContainers:[u]},l!==null&&(l=xa(l),l!==null&&Sr(l)),t):(t.eventSystemFlags|=a,l=t.targetContainers,u!==null&&l.indexOf(u)===-1&&l.push(u),t)}function wm(t,l,e,a,u){switch(l){case"focusin":return Ge=ku(Ge,t,l,e,a,u),!0;case"dragenter":return Qe=ku(Qe,t,l,e,a,u),!0;case"mouseover":return Xe=ku(Xe,t,l,e,a,u),!0;case"pointerover":var n=u.pointerId;return wu.set(n,ku(wu.get(n)||null,t,l,e,a,u)),!0;case"gotpointercapture":return n=u.pointerId,Wu.set(n,ku(Wu.get(n)||null,t,l,e,a,u)),!0}return!1}function xr(t){var l=Ea(t.target);if(l!==null){var e=k(l);if(e!==null){if(l=e.tag,l===13){if(l=zt(e),l!==null){t.blockedOn=l,ql(t.priority,function(){br(e)});return}}else if(l===31){if(l=gt(e),l!==null){t.blockedOn=l,ql(t.priority,function(){br(e)});return}}else if(l===3&&e.stateNode.current.memoizedState.isDehydrated){t.blockedOn=e.tag===3?e.stateNode.containerInfo:null;return}}}t.blockedOn=null}function sc(t){if(t.blockedOn!==null)return!1;for(var l=t.targetContainers;0<l.length;){var e=Tf(t.nativeEvent);if(e===null){e=t.nativeEvent;var a=new e.constructor(e.type,e);Tc=a,e.target.dispatchEvent(a),Tc=null}else return l=xa(e),l!==null&&Sr(l),t.blockedOn=e,!1;l.shift()}return!0}function Ar(t,l,e){sc(t)&&e.delete(l)}function Wm(){Of=!1,Ge!==null&&sc(Ge)&&(Ge=null),Qe!==null&&sc(Qe)&&(Qe=null),Xe!==null&&sc(Xe)&&(Xe=null),wu.forEach(Ar),Wu.forEach(Ar)}function oc(t,l){t.blockedOn===l&&(t.blockedOn=null,Of||(Of=!0,T.unstable_scheduleCallback(T.unstable_NormalPriority,Wm)))}var dc=null;function zr(t){dc!==t&&(dc=t,T.unstable_scheduleCallback(T.unstable_NormalPriority,function(){dc===t&&(dc=null);for(var l=0;l<t.length;l+=3){var e=t[l],a=t[l+1],u=t[l+2];if(typeof a!="function"){if(_f(a||e)===null)continue;break}var n=xa(e);n!==null&&(t.splice(l,3),l-=3,zi(n,{pending:!0,data:u,method:e.method,action:a},a,u))}}))}function au(t){function l(f){return oc(f,t)}Ge!==null&&oc(Ge,t),Qe!==null&&oc(Qe,t),Xe!==null&&oc(Xe,t),wu.forEach(l),Wu.forEach(l);for(var e=0;e<Ze.length;e++){var a=Ze[e];a.blockedOn===t&&(a.blockedOn=null)}for(;0<Ze.length&&(e=Ze[0],e.blockedOn===null);)xr(e),e.blockedOn===null&&Ze.shift();if(e=(t.ownerDocument||t).$$reactFormReplay,e!=null)for(a=0;a<e.length;a+=3){var u=e[a],n=e[a+1],c=u[Yt]||null;if(typeof n=="function")c||zr(e);else if(c){var i=null;if(n&&n.hasAttribute("formAction")){if(u=n,c=n[Yt]||null)i=c.formAction;else if(_f(u)!==null)continue}else i=c.action;typeof i=="function"?e[a+1]=i:(e.splice(a,3),a-=3),zr(e)}}}function Tr(){function t(n){n.canIntercept&&n.info==="react-transition"&&n.intercept({handler:function(){return new Promise(function(c){return u=c})},focusReset:"manual",scroll:"manual"})}function l(){u!==null&&(u(),u=null),a||setTimeout(e,20)}function e(){if(!a&&!navigation.transition){var n=navigation.currentEntry;n&&n.url!=null&&navigation.navigate(n.url,{state:n.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var a=!1,u=null;return navigation.addEventListener("navigate",t),navigation.addEventListener("navigatesuccess",l),navigation.addEventListener("navigateerror",l),setTimeout(e,100),function(){a=!0,navigation.removeEventListener("navigate",t),navigation.removeEventListener("navigatesuccess",l),navigation.removeEventListener("navigateerror",l),u!==null&&(u(),u=null)}}}function Nf(t){this._internalRoot=t}rc.prototype.render=Nf.prototype.render=function(t){var l=this._internalRoot;if(l===null)throw Error(r(409));var e=l.current,a=pl();hr(e,a,t,l,null,null)},rc.prototype.unmount=Nf.prototype.unmount=function(){var t=this._internalRoot;if(t!==null){this._internalRoot=null;var l=t.containerInfo;hr(t.current,2,null,t,null,null),Jn(),l[pe]=null}};function rc(t){this._internalRoot=t}rc.prototype.unstable_scheduleHydration=function(t){if(t){var l=It();t={blockedOn:null,target:t,priority:l};for(var e=0;e<Ze.length&&l!==0&&l<Ze[e].priority;e++);Ze.splice(e,0,t),e===0&&xr(t)}};var _r=J.version;if(_r!=="19.2.4")throw Error(r(527,_r,"19.2.4"));N.findDOMNode=function(t){var l=t._reactInternals;if(l===void 0)throw typeof t.render=="function"?Error(r(188)):(t=Object.keys(t).join(","),Error(r(268,t)));return t=A(l),t=t!==null?lt(t):null,t=t===null?null:t.stateNode,t};var km={bundleType:0,version:"19.2.4",rendererPackageName:"react-dom",currentDispatcherRef:g,reconcilerVersion:"19.2.4"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var mc=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!mc.isDisabled&&mc.supportsFiber)try{ke=mc.inject(km),el=mc}catch{}}return Fu.createRoot=function(t,l){if(!L(t))throw Error(r(299));var e=!1,a="",u=Ro,n=jo,c=Ho;return l!=null&&(l.unstable_strictMode===!0&&(e=!0),l.identifierPrefix!==void 0&&(a=l.identifierPrefix),l.onUncaughtError!==void 0&&(u=l.onUncaughtError),l.onCaughtError!==void 0&&(n=l.onCaughtError),l.onRecoverableError!==void 0&&(c=l.onRecoverableError)),l=vr(t,1,!1,null,null,e,a,null,u,n,c,Tr),t[pe]=l.current,sf(t),new Nf(l)},Fu.hydrateRoot=function(t,l,e){if(!L(t))throw Error(r(299));var a=!1,u="",n=Ro,c=jo,i=Ho,f=null;return e!=null&&(e.unstable_strictMode===!0&&(a=!0),e.identifierPrefix!==void 0&&(u=e.identifierPrefix),e.onUncaughtError!==void 0&&(n=e.onUncaughtError),e.onCaughtError!==void 0&&(c=e.onCaughtError),e.onRecoverableError!==void 0&&(i=e.onRecoverableError),e.formState!==void 0&&(f=e.formState)),l=vr(t,1,!0,l,e??null,a,u,f,n,c,i,Tr),l.context=yr(null),e=l.current,a=pl(),a=bt(a),u=Oe(a),u.callback=null,Ne(e,u,a),e=a,l.current.lanes=e,z(l,e),wl(l),t[pe]=l.current,sf(t),new rc(l)},Fu.version="19.2.4",Fu}var Br;function nv(){if(Br)return Cf.exports;Br=1;function T(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(T)}catch(J){console.error(J)}}return T(),Cf.exports=uv(),Cf.exports}var cv=nv();const qr="disconnected";function iv(T,J){switch(J.type){case"CONNECT_REQUESTED":return"connecting";case"CONNECTED":return"connected";case"DISCONNECTED":return"disconnected";case"RECONNECT_REQUESTED":return"reconnecting";case"CONNECTION_ERROR":return"error";default:return T}}function fv(T){switch(T){case"connecting":return"接続中";case"connected":return"接続済み";case"disconnected":return"切断";case"reconnecting":return"再接続中";case"error":return"エラー";default:return"不明"}}function Yr(T){return T<=767?"mobile":T<=1023?"tablet":"desktop"}function sv(){return typeof window>"u"?"desktop":Yr(window.innerWidth)}function Iu(){return`${Date.now()}-${Math.random().toString(36).slice(2)}`}function ov(){return typeof navigator<"u"&&/jsdom/i.test(navigator.userAgent)}function dv(T,J){return`${window.location.protocol==="https:"?"wss:":"ws:"}//${window.location.host}/ws/${T}/${J}`}function rv(T){const J=window.atob(T),U=new Uint8Array(J.length);for(let r=0;r<J.length;r+=1)U[r]=J.charCodeAt(r);return U.buffer}function mv(T,J=24e3){if(!T)return J;const U=T.match(/rate=(\d+)/);if(!U)return J;const r=Number(U[1]);return Number.isFinite(r)?r:J}function vv(T){const J=new Int16Array(T.length);for(let U=0;U<T.length;U+=1){const r=Math.max(-1,Math.min(1,T[U]));J[U]=r<0?r*32768:r*32767}return J}function yv(){const[T,J]=R.useState(sv),[U,r]=R.useReducer(iv,qr),[L,k]=R.useState(!1),[zt,gt]=R.useState([]),[j,A]=R.useState(""),[lt,H]=R.useState([]),[it,Qt]=R.useState(!1),[$t,Vt]=R.useState(0),[Hl,tl]=R.useState(0),[El,qt]=R.useState("idle"),[nl,xl]=R.useState(0),[Kt,W]=R.useState([]),[Ft,ml]=R.useState([]),[Wl,Al]=R.useState(!0),[Tt,kl]=R.useState({proactivity:!1,affectiveDialog:!1}),[cl,ll]=R.useState({proactivity:!1,affectiveDialog:!1}),[g,N]=R.useState({proactivity:!1,affectiveDialog:!1}),[q,et]=R.useState("idle"),[st,o]=R.useState("proactivity=false&affective_dialog=false"),[x,O]=R.useState(!1),[D,Q]=R.useState(!1),X=typeof window<"u"&&typeof WebSocket<"u"&&!ov(),at=R.useRef(qr),Xt=R.useRef(null),ot=R.useRef(null),Xl=R.useRef(null),_t=R.useRef(null),Ve=R.useRef(!1),Pu=R.useRef("demo-user"),$l=R.useRef(`demo-session-${Iu()}`),Ke=R.useRef(!1),ge=R.useRef(null),ya=R.useRef(null),Se=R.useRef(null),be=R.useRef(null),Bl=R.useRef(null),Je=R.useRef(0),St=R.useCallback((z,_,V,G="standard")=>{const ut={id:Iu(),timestamp:new Date().toISOString(),summary:_,category:z,kind:G,detail:JSON.stringify(V)};W(bt=>[ut,...bt].slice(0,100))},[]),vc=R.useCallback(z=>{ml(_=>_.includes(z)?_.filter(V=>V!==z):[..._,z])},[]),Ot=R.useCallback(z=>{window.dispatchEvent(new CustomEvent("mock-stream-event",{detail:z}))},[]),Fl=R.useCallback(()=>{Se.current&&(Se.current.disconnect(),Se.current.onaudioprocess=null,Se.current=null),be.current&&(be.current.disconnect(),be.current=null),ya.current&&(ya.current.close(),ya.current=null),ge.current&&(ge.current.getTracks().forEach(z=>z.stop()),ge.current=null)},[]),Il=R.useCallback(()=>{Bl.current&&(Bl.current.close(),Bl.current=null),Je.current=0},[]),uu=R.useCallback((z,_)=>{try{const V=mv(_,24e3);(!Bl.current||Bl.current.sampleRate!==V)&&(Il(),Bl.current=new AudioContext({sampleRate:V}));const G=Bl.current;if(!G)return;const ut=rv(z),bt=new DataView(ut),dt=Math.floor(bt.byteLength/2),It=new Float32Array(dt);for(let Yt=0;Yt<dt;Yt+=1){const pe=bt.getInt16(Yt*2,!0);It[Yt]=pe/32768}const ql=G.createBuffer(1,dt,V);ql.copyToChannel(It,0);const zl=G.createBufferSource();zl.buffer=ql,zl.connect(G.destination);const Ut=Math.max(G.currentTime,Je.current);zl.start(Ut),Je.current=Ut+ql.duration}catch(V){St("notification","音声再生処理失敗",{message:String(V)})}},[St,Il]),we=R.useCallback(z=>{var V,G,ut,bt;let _;try{_=JSON.parse(z)}catch{Ot({kind:"error",message:"invalid server payload"});return}if(_.error){const dt=typeof _.error=="string"?_.error:_.error.message??"unknown websocket error";Ot({kind:"error",message:dt})}if(_.interrupted===!0&&(Il(),Ot({kind:"interrupted"})),(V=_.content)!=null&&V.parts)for(const dt of _.content.parts){const It=dt.inlineData??{mimeType:(G=dt.inline_data)==null?void 0:G.mime_type,data:(ut=dt.inline_data)==null?void 0:ut.data};dt.text&&Ot({kind:"text",role:_.author==="user"?"user":"agent",text:dt.text,partial:_.turnComplete!==!0}),(bt=It.mimeType)!=null&&bt.startsWith("audio/pcm")&&It.data&&(uu(It.data,It.mimeType),Ot({kind:"audioOutput",chunkSize:It.data.length}))}_.turnComplete===!0&&Ot({kind:"turnComplete"})},[Ot,uu,Il]),nu=R.useCallback(()=>{if(!X||_t.current&&_t.current.readyState<=WebSocket.OPEN)return;Ve.current=!1;const z=new WebSocket(dv(Pu.current,$l.current));z.binaryType="arraybuffer",_t.current=z,z.onopen=()=>{r({type:"CONNECTED"})},z.onmessage=_=>{typeof _.data=="string"&&we(_.data)},z.onerror=()=>{Ot({kind:"error",message:"websocket transport error"})},z.onclose=()=>{_t.current=null,Fl(),!Ve.current&&(r({type:"CONNECTION_ERROR"}),k(!0))}},[Ot,we,X,Fl]),We=R.useCallback(()=>{_t.current&&(Ve.current=!0,_t.current.close(),_t.current=null)},[]),yc=R.useCallback(async()=>{if(!X)return;if(!_t.current||_t.current.readyState!==WebSocket.OPEN)throw new Error("WebSocket未接続");const z=await navigator.mediaDevices.getUserMedia({audio:{channelCount:1}});ge.current=z;const _=new AudioContext({sampleRate:16e3});ya.current=_;const V=_.createMediaStreamSource(z);be.current=V;const G=_.createScriptProcessor(2048,1,1);Se.current=G;const ut=_.createGain();ut.gain.value=0,G.onaudioprocess=bt=>{if(!Ke.current||!_t.current||_t.current.readyState!==WebSocket.OPEN)return;const dt=bt.inputBuffer.getChannelData(0),It=vv(dt);_t.current.send(It.buffer),window.dispatchEvent(new CustomEvent("mock-audio-chunk",{detail:{size:It.byteLength}}))},V.connect(G),G.connect(ut),ut.connect(_.destination)},[X]);R.useEffect(()=>{Ke.current=it},[it]),R.useEffect(()=>{const z=()=>{J(Yr(window.innerWidth))};return window.addEventListener("resize",z),()=>window.removeEventListener("resize",z)},[]),R.useEffect(()=>{const z=()=>{it&&Vt(_=>_+1)};return window.addEventListener("mock-audio-chunk",z),()=>window.removeEventListener("mock-audio-chunk",z)},[it]),R.useEffect(()=>()=>{const z=Xl.current;z&&z.getTracks().forEach(_=>_.stop()),We(),Fl(),Il()},[We,Il,Fl]),R.useEffect(()=>{if(X||U!=="connecting"&&U!=="reconnecting")return;const z=window.setTimeout(()=>{r({type:"CONNECTED"})},400);return()=>window.clearTimeout(z)},[U,X]),R.useEffect(()=>{const z=at.current;z!==U&&(z==="connecting"&&U==="connected"&&(gt(_=>[..._,"接続開始"]),St("notification","接続済み",{phase:"initial"})),z==="reconnecting"&&U==="connected"&&(gt(_=>[..._,"再接続に成功"]),St("notification","再接続に成功",{phase:"recover"})),z==="reconnecting"&&U==="connected"&&q==="applying"&&(ll(Tt),et("idle"),gt(_=>[..._,"設定変更を反映しました"]),St("notification","RunConfig反映完了",{proactivity:Tt.proactivity,affectiveDialog:Tt.affectiveDialog})),at.current=U)},[St,U,Tt,q]),R.useEffect(()=>{if(!L)return;const z=window.setTimeout(()=>{r({type:"RECONNECT_REQUESTED"}),gt(_=>[..._,"再接続を試行中"]),St("notification","再接続試行",{scheduled:!0}),k(!1),nu()},1e3);return()=>window.clearTimeout(z)},[St,nu,L]),R.useEffect(()=>{const z=Xt.current;z&&(z.scrollTop=z.scrollHeight)},[lt]),R.useEffect(()=>{const z=_=>{const G=_.detail;if(G){if(G.kind==="text"){const ut=G.text.trim();if(!ut)return;if(G.role==="agent"&&ot.current&&G.partial){const dt=ot.current;H(It=>It.map(ql=>ql.id===dt?{...ql,content:`${ql.content}${ut}`,status:"partial"}:ql)),St("conversation","エージェント応答更新",{partial:!0});return}const bt=Iu();H(dt=>[...dt,{id:bt,role:G.role,content:ut,status:G.partial?"partial":"complete"}]),G.role==="agent"&&(ot.current=G.partial?bt:null),St("conversation","会話イベント受信",{role:G.role,partial:G.partial});return}if(G.kind==="audioOutput"){tl(ut=>ut+1),qt("playing"),St("conversation","音声出力受信",{chunkSize:G.chunkSize},"audio");return}if(G.kind==="turnComplete"){const ut=ot.current;if(!ut)return;H(bt=>bt.map(dt=>dt.id===ut?{...dt,status:"complete"}:dt)),ot.current=null,St("conversation","ターン完了",{kind:"turnComplete"});return}if(G.kind==="runConfigApplyResult"){if(G.status==="applied"){ll(G.effective),N(G.effective),et("idle"),gt(bt=>[...bt,"設定変更を反映しました"]),St("notification","RunConfig反映完了",{status:G.status,effective:G.effective});return}const ut=g.proactivity||g.affectiveDialog?g:{proactivity:!1,affectiveDialog:!1};ll(ut),et("idle"),gt(bt=>[...bt,`設定反映に失敗: ${G.reason??"unsupported"}`]),St("notification","RunConfig反映失敗",{status:G.status,reason:G.reason,fallback:ut});return}if(G.kind==="error"){r({type:"CONNECTION_ERROR"}),gt(ut=>[...ut,`WebSocketエラー: ${G.message}`]),St("notification","WebSocketエラー",{message:G.message}),k(!0);return}if(G.kind==="interrupted"){const ut=ot.current;ut&&(H(bt=>bt.map(dt=>dt.id===ut?{...dt,status:"interrupted"}:dt)),ot.current=null),qt(bt=>bt==="playing"?"interrupted":bt),St("notification","中断イベント",{kind:"interrupted"})}}};return window.addEventListener("mock-stream-event",z),()=>window.removeEventListener("mock-stream-event",z)},[St,g]);const hc=()=>{r({type:"CONNECT_REQUESTED"}),St("notification","接続開始要求",{source:"ui"}),nu()},ke=()=>{We(),Fl(),Qt(!1),r({type:"DISCONNECTED"}),k(!0),gt(z=>[...z,"切断"]),St("notification","切断",{reconnectScheduled:!0})},el=()=>{const z=j.trim();z&&(H(_=>[..._,{id:Iu(),role:"user",content:z,status:"complete"}]),St("conversation","テキスト送信",{text:z}),_t.current&&_t.current.readyState===WebSocket.OPEN&&_t.current.send(JSON.stringify({type:"text",text:z})),A(""))},Zl=z=>{z.preventDefault(),el()},al=()=>{if(Ke.current){Qt(!1),Fl();return}Qt(!0),yc().catch(z=>{Qt(!1),Fl();const _=z instanceof Error?z.message:"音声入力開始に失敗";gt(V=>[...V,`音声入力に失敗: ${_}`]),St("notification","音声入力開始失敗",{message:_})})},tn=()=>{const z=Xl.current;z&&(z.getTracks().forEach(_=>_.stop()),Xl.current=null),O(!1),Q(!1)},gc=async()=>{try{if(!navigator.mediaDevices||!navigator.mediaDevices.getUserMedia)throw new Error("カメラ未対応");const z=await navigator.mediaDevices.getUserMedia({video:!0});Xl.current=z,O(!0),Q(!0),St("notification","カメラプレビュー開始",{status:"opened"})}catch(z){O(!1),Q(!1);const _=z instanceof Error?z.message:"unknown";gt(V=>[...V,`カメラ利用に失敗: ${_}`]),St("notification","カメラ利用失敗",{message:_})}},Sc=()=>{H(z=>[...z,{id:Iu(),role:"user",content:"[画像を送信しました]",status:"complete"}]),xl(z=>z+1),St("conversation","画像送信",{placeholder:!0}),_t.current&&_t.current.readyState===WebSocket.OPEN&&_t.current.send(JSON.stringify({type:"image",mimeType:"image/png",data:"iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mP8/x8AAusB9mZ1tcQAAAAASUVORK5CYII="})),tn()},ha=()=>{Al(z=>!z)},ga=()=>{W([]),ml([])},Sa=z=>{const _=new URLSearchParams({proactivity:String(z.proactivity),affective_dialog:String(z.affectiveDialog)}).toString();o(_),et("applying"),gt(V=>[...V,"設定変更を反映中"]),St("notification","RunConfig変更要求",{proactivity:z.proactivity,affective_dialog:z.affectiveDialog,query:_}),r({type:"RECONNECT_REQUESTED"}),X&&(We(),k(!0))},Ll=z=>{kl(_=>{const V={..._,[z]:!_[z]};return U==="connected"||U==="reconnecting"?Sa(V):o(new URLSearchParams({proactivity:String(V.proactivity),affective_dialog:String(V.affectiveDialog)}).toString()),V})},ba=()=>b.jsxs(b.Fragment,{children:[b.jsxs("p",{className:"mt-2 text-xs text-slate-300",children:["上流音声チャンク: ",b.jsx("span",{"data-testid":"audio-upstream-chunk-count",children:$t})]}),b.jsxs("p",{className:"mt-1 text-xs text-slate-300",children:["下流音声チャンク: ",b.jsx("span",{"data-testid":"audio-downstream-chunk-count",children:Hl})]}),b.jsxs("p",{className:"mt-1 text-xs text-slate-300",children:["音声再生状態:"," ",b.jsxs("span",{"data-testid":"audio-playback-state",children:[El==="idle"&&"待機中",El==="playing"&&"再生中",El==="interrupted"&&"中断"]})]}),b.jsxs("p",{className:"mt-1 text-xs text-slate-300",children:["画像上流送信数: ",b.jsx("span",{"data-testid":"image-upstream-count",children:nl})]})]}),$e=()=>{const z=Wl?Kt:Kt.filter(_=>_.kind!=="audio");return b.jsxs(b.Fragment,{children:[b.jsxs("div",{className:"mt-3 flex items-center justify-between gap-3 border-t border-slate-700/70 pt-3",children:[b.jsxs("label",{className:"flex items-center gap-2 text-xs text-slate-300",children:[b.jsx("input",{type:"checkbox",checked:Wl,onChange:ha}),"音声イベントを表示"]}),b.jsx("button",{type:"button",className:"rounded bg-slate-700 px-2 py-1 text-xs text-slate-100",onClick:ga,children:"ログをクリア"})]}),b.jsx("ul",{"data-testid":"event-log-list",className:"mt-3 space-y-2",children:z.map(_=>{const V=Ft.includes(_.id),G=_.kind==="audio"?"audio":_.category,ut=_.kind==="audio"?"text-cyan-300":_.category==="notification"?"text-amber-300":"text-slate-300";return b.jsxs("li",{"data-testid":"event-log-item",className:"rounded border border-slate-700 bg-slate-900/80 p-2 text-xs",children:[b.jsxs("p",{"data-testid":`event-log-item-${G}`,className:ut,children:["[",G,"] ",_.summary]}),b.jsx("p",{className:"mt-1 text-slate-500",children:_.timestamp}),b.jsx("button",{type:"button",className:"mt-1 rounded bg-slate-700 px-2 py-1 text-slate-100",onClick:()=>vc(_.id),children:V?"詳細を閉じる":"詳細を開く"}),V&&b.jsx("pre",{"data-testid":"event-log-detail",className:"mt-2 overflow-x-auto rounded bg-slate-800 p-2 text-[11px] text-slate-200",children:_.detail})]},_.id)})})]})},cu=(z,_="session_overview",V="run_config")=>b.jsxs("section",{"aria-label":"connection",role:"region",className:z,children:[b.jsxs("div",{className:"flex items-center justify-between gap-2",children:[b.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100 [font-family:'JetBrains_Mono',monospace]",children:_}),b.jsx("span",{"data-testid":"connection-state",className:"rounded-full bg-[#1F2A22] px-2 py-1 text-[10px] text-[#2EE6A6] [font-family:'JetBrains_Mono',monospace]",children:fv(U)})]}),U==="disconnected"&&L&&b.jsx("p",{className:"mt-2 text-sm text-amber-300",children:"再接続予定"}),U==="error"&&L&&b.jsx("p",{"data-testid":"recovery-status-banner",className:"mt-2 text-sm text-amber-300",children:"自動回復を試行中"}),b.jsxs("div",{className:"mt-3 flex flex-wrap gap-2",children:[(U==="disconnected"||U==="error")&&b.jsx("button",{type:"button",className:"rounded-[12px] bg-[#00D4AA] px-3 py-2 text-xs font-semibold text-slate-900 transition-colors hover:bg-[#25e1b7]",onClick:hc,children:"接続開始"}),U==="connected"&&b.jsx("button",{type:"button",className:"rounded-[12px] bg-[#1E2631] px-3 py-2 text-xs font-semibold text-slate-100 transition-colors hover:bg-slate-600",onClick:ke,children:"切断"})]}),b.jsxs("div",{className:"mt-4 rounded-[16px] border border-slate-700 bg-[#151C25] p-3",children:[b.jsx("p",{className:"text-xs font-semibold tracking-wide text-slate-200 [font-family:Oswald,sans-serif]",children:V}),b.jsxs("label",{className:"mt-2 flex items-center gap-2 text-sm text-slate-200",children:[b.jsx("input",{type:"checkbox",checked:Tt.proactivity,onChange:()=>Ll("proactivity"),disabled:q==="applying"}),"Proactivity"]}),b.jsxs("label",{className:"mt-1 flex items-center gap-2 text-sm text-slate-200",children:[b.jsx("input",{type:"checkbox",checked:Tt.affectiveDialog,onChange:()=>Ll("affectiveDialog"),disabled:q==="applying"}),"Affective Dialog"]}),b.jsx("p",{"data-testid":"run-config-status",className:"mt-2 text-xs text-slate-400",children:q==="applying"?"反映中":"待機"}),b.jsx("p",{"data-testid":"run-config-query",className:"mt-1 text-xs text-slate-500",children:st}),b.jsxs("p",{"data-testid":"run-config-effective",className:"mt-1 text-xs text-slate-400",children:["effective: proactivity=",String(cl.proactivity),", affectiveDialog=",String(cl.affectiveDialog)]}),b.jsx("p",{"data-testid":"run-config-drift",className:"mt-1 text-xs text-slate-400",children:Tt.proactivity===cl.proactivity&&Tt.affectiveDialog===cl.affectiveDialog?"一致":"不一致"})]})]}),pa=(z,_="stream_transcript")=>b.jsxs("section",{"aria-label":"conversation",role:"region",className:z,children:[b.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100 [font-family:Oswald,sans-serif]",children:_}),b.jsxs("ul",{ref:Xt,"data-testid":"conversation-log",className:"mt-3 max-h-72 space-y-2 overflow-y-auto rounded-[14px] border border-slate-700 bg-[#111821] p-3",children:[lt.length===0&&b.jsx("li",{className:"text-sm text-slate-500",children:"メッセージはまだありません"}),lt.map(V=>b.jsxs("li",{"data-testid":`conversation-message-${V.role}`,className:`rounded px-3 py-2 text-sm ${V.role==="user"?"bg-[#1E2631] text-[#D9E0EA]":V.status==="interrupted"?"bg-[#2B1E22] text-[#FF9AA2]":"bg-[#1A2B27] text-[#DDF6EE]"}`,children:[b.jsx("p",{children:V.content}),b.jsx("p",{className:"mt-1 text-xs text-slate-400",children:V.status})]},V.id))]})]}),Fe=(z,_="voice_activity")=>b.jsxs("section",{"aria-label":"event-console",role:"region",className:z,children:[b.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100 [font-family:Oswald,sans-serif]",children:_}),ba(),$e()]});return b.jsxs("main",{className:"min-h-screen bg-[#0B0E13] text-slate-100","data-layout":T,children:[b.jsxs("header",{className:"border-b border-slate-800 bg-[#0F141C] px-4 py-4",children:[b.jsx("h1",{className:"text-3xl font-semibold leading-none [font-family:Oswald,sans-serif]",children:"Realtime Voice Agent"}),b.jsxs("p",{className:"mt-1 text-xs text-slate-400 [font-family:'JetBrains_Mono',monospace]",children:[T==="desktop"&&"BIDI streaming console for text, audio, and image context",T==="tablet"&&"tablet_layout // collapsible panels",T==="mobile"&&"live_voice_console"]}),b.jsx("p",{"data-testid":"layout-mode",className:"mt-1 text-xs text-slate-500",children:T})]}),T==="desktop"&&b.jsxs("div",{className:"m-4 grid grid-cols-[260px_1fr_360px] gap-6 rounded-[24px] bg-[#0F1115] p-6",children:[cu("rounded-[20px] border border-slate-800 bg-[#151A20] p-[20px_18px]","session_overview","run_config"),b.jsxs("div",{className:"flex min-h-[560px] flex-col gap-4",children:[pa("flex-1 rounded-[16px] border border-slate-800 bg-[#151C25] p-[14px]","stream_transcript"),b.jsx("div",{className:"rounded-[16px] border border-slate-800 bg-[#151C25] p-3 text-xs text-slate-400 [font-family:'JetBrains_Mono',monospace]",children:"stream.websocket ready for text/voice/image payloads"})]}),b.jsxs("div",{className:"flex min-h-[560px] flex-col gap-4",children:[Fe("rounded-[16px] border border-slate-800 bg-[#151C25] p-[14px]"),b.jsxs("div",{className:"rounded-[16px] border border-slate-800 bg-[#151C25] p-[14px]",children:[b.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100 [font-family:Oswald,sans-serif]",children:"image_context"}),b.jsx("p",{className:"mt-2 text-[10px] text-[#6F7B8B] [font-family:'JetBrains_Mono',monospace]",children:"model: gemini-live-2.5-flash-native-audio"})]})]})]}),T==="tablet"&&b.jsxs("div",{className:"m-4 grid grid-cols-[1fr_290px] gap-[14px] rounded-[24px] bg-[#0F1115] p-5",children:[b.jsxs("div",{className:"flex min-h-[520px] flex-col gap-4",children:[pa("rounded-[14px] border border-slate-800 bg-[#151C25] p-3","conversation_stream"),b.jsxs("div",{className:"grid grid-cols-3 gap-[10px]",children:[b.jsxs("div",{className:"rounded-[12px] bg-[#171E27] p-[10px]",children:[b.jsx("p",{className:"text-[10px] text-[#8D98A8] [font-family:'JetBrains_Mono',monospace]",children:"latency_ms"}),b.jsx("p",{className:"text-[24px] leading-none [font-family:Oswald,sans-serif]",children:"178"})]}),b.jsxs("div",{className:"rounded-[12px] bg-[#171E27] p-[10px]",children:[b.jsx("p",{className:"text-[10px] text-[#8D98A8] [font-family:'JetBrains_Mono',monospace]",children:"turns"}),b.jsx("p",{className:"text-[24px] leading-none [font-family:Oswald,sans-serif]",children:"9"})]}),b.jsxs("div",{className:"rounded-[12px] bg-[#FF7A3D] p-[10px] text-[#0F1115]",children:[b.jsx("p",{className:"text-[10px] text-[#2B1408] [font-family:'JetBrains_Mono',monospace]",children:"state"}),b.jsx("p",{className:"text-[24px] leading-none [font-family:Oswald,sans-serif]",children:"SPEAKING"})]})]})]}),b.jsxs("div",{className:"flex min-h-[520px] flex-col gap-4",children:[cu("rounded-[14px] border border-slate-800 bg-[#151C25] p-3","voice_activity","run_config"),Fe("flex-1 rounded-[14px] border border-slate-800 bg-[#151C25] p-3","tool_events")]})]}),T==="mobile"&&b.jsxs("div",{className:"m-3 flex flex-col gap-[14px] rounded-[28px] bg-[#0F1115] p-[20px_16px]",children:[b.jsxs("div",{className:"rounded-[14px] bg-transparent",children:[b.jsx("p",{className:"text-[30px] leading-none [font-family:Oswald,sans-serif]",children:"Voxa Mobile"}),b.jsx("p",{className:"mt-1 text-[11px] text-[#8D98A8] [font-family:'JetBrains_Mono',monospace]",children:"live_voice_console"}),b.jsxs("div",{className:"mt-3 flex items-center gap-2",children:[b.jsx("span",{className:"rounded-full bg-[#1F2A22] px-2 py-1 text-[10px] text-[#2EE6A6]",children:"CONNECTED"}),b.jsx("span",{className:"rounded-full bg-[#2C271B] px-2 py-1 text-[10px] text-[#F7C56B]",children:"reconnecting"})]})]}),b.jsxs("div",{className:"grid grid-cols-2 gap-[10px]",children:[b.jsxs("div",{className:"rounded-[12px] bg-[#171E27] p-[10px]",children:[b.jsx("p",{className:"text-[10px] text-[#8D98A8] [font-family:'JetBrains_Mono',monospace]",children:"latency"}),b.jsx("p",{className:"text-[24px] leading-none [font-family:Oswald,sans-serif]",children:"186ms"})]}),b.jsxs("div",{className:"rounded-[12px] bg-[#FF7A3D] p-[10px] text-[#0F1115]",children:[b.jsx("p",{className:"text-[10px] text-[#2B1408] [font-family:'JetBrains_Mono',monospace]",children:"state"}),b.jsx("p",{className:"text-[24px] leading-none [font-family:Oswald,sans-serif]",children:"LIVE"})]})]}),pa("rounded-[14px] border border-slate-800 bg-[#151C25] p-3","conversation"),b.jsx("div",{className:"rounded-[16px] border border-slate-800 bg-[#111821] p-3",children:b.jsx("button",{type:"button",className:"w-full rounded-[16px] bg-[#00D4AA] px-4 py-3 text-xs font-semibold text-[#092118]",children:"hold_to_talk"})}),b.jsx("div",{className:"rounded-[14px] border border-slate-800 bg-[#161E28] p-[6px_8px]",children:b.jsxs("div",{className:"grid grid-cols-3 gap-2 text-center text-[10px] [font-family:'JetBrains_Mono',monospace]",children:[b.jsx("div",{className:"rounded-[10px] bg-[#1E2631] py-2 text-white",children:"chat"}),b.jsx("div",{className:"rounded-[10px] bg-[#111722] py-2 text-[#8D98A8]",children:"voice"}),b.jsx("div",{className:"rounded-[10px] bg-[#111722] py-2 text-[#8D98A8]",children:"tools"})]})}),cu("rounded-[12px] border border-slate-800 bg-[#151C25] p-[10px]","session_overview","run_config"),Fe("rounded-[12px] border border-slate-800 bg-[#151C25] p-[10px]","tool_events")]}),b.jsxs("section",{"aria-label":"input-controls",role:"region",className:T==="mobile"?"border-t border-slate-800 bg-[#0F141C] p-3":"sticky bottom-0 border-t border-slate-800 bg-[#0F141C] p-4",children:[b.jsxs("form",{className:"flex flex-wrap items-center gap-2",onSubmit:Zl,children:[b.jsx("label",{htmlFor:"text-input",className:"sr-only",children:"テキスト入力"}),b.jsx("input",{id:"text-input",type:"text",value:j,onChange:z=>A(z.target.value),className:"min-w-[200px] flex-1 rounded-xl border border-slate-700 bg-slate-800 px-3 py-2 text-sm text-slate-100 placeholder:text-slate-500",placeholder:"メッセージを入力"}),b.jsx("button",{type:"submit",className:"rounded-xl bg-[#FF7A3D] px-4 py-2 text-sm font-semibold text-slate-950",children:"送信"}),b.jsx("button",{type:"button",className:"rounded-xl bg-[#00D4AA] px-4 py-2 text-sm font-semibold text-slate-950",onClick:al,children:it?"音声停止":"音声開始"}),b.jsx("button",{type:"button",className:"rounded-xl bg-slate-700 px-3 py-2 text-sm text-white",onClick:gc,children:"画像送信"})]}),it&&b.jsx("p",{"data-testid":"voice-input-state",className:"mt-2 text-sm text-emerald-300",children:"音声入力中"}),b.jsx("p",{"data-testid":"camera-state",className:"mt-1 text-sm text-slate-400",children:D?"利用中":"未使用"})]}),x&&b.jsx("section",{role:"dialog","aria-label":"camera-preview",className:"fixed inset-0 z-10 flex items-center justify-center bg-black/60 p-4",children:b.jsxs("div",{className:"w-full max-w-md rounded-2xl border border-slate-700 bg-[#121821] p-4",children:[b.jsx("p",{className:"text-xl font-semibold [font-family:Oswald,sans-serif]",children:"Camera Preview"}),b.jsx("p",{className:"mt-2 text-sm text-slate-300",children:"プレビュー準備完了"}),b.jsxs("div",{className:"mt-4 flex gap-2",children:[b.jsx("button",{type:"button",className:"rounded-xl bg-[#FF7A3D] px-3 py-2 text-sm font-semibold text-slate-900",onClick:Sc,children:"画像を送信"}),b.jsx("button",{type:"button",className:"rounded-xl bg-slate-700 px-3 py-2 text-sm text-white",onClick:tn,children:"キャンセル"})]})]})}),b.jsxs("section",{"aria-label":"system-notices",role:"region",className:"border-t border-slate-800 bg-[#0F141C] p-3",children:[b.jsx("p",{className:"text-sm font-medium text-slate-200",children:"システム通知"}),b.jsx("ul",{"data-testid":"system-notices",className:"mt-1 list-disc pl-5 text-sm text-slate-300",children:zt.map((z,_)=>b.jsx("li",{"data-testid":"system-notice-item",className:"system-notice-item rounded border-l-2 border-amber-400 bg-amber-950/30 px-2 py-1",children:z},`${z}-${_}`))})]})]})}function hv(){return{connection:"disconnected",conversation:[],notices:[],eventLog:[]}}const gv=R.createContext(null);function Sv({children:T}){const[J]=R.useState(hv()),U=R.useMemo(()=>J,[J]);return b.jsx(gv.Provider,{value:U,children:T})}const Gr=document.getElementById("root");if(!Gr)throw new Error("Root element #root not found");cv.createRoot(Gr).render(b.jsx(R.StrictMode,{children:b.jsx(Sv,{children:b.jsx(yv,{})})}));"serviceWorker"in navigator&&window.addEventListener("load",()=>{navigator.serviceWorker.register("/service-worker.js").catch(T=>{console.error("service worker registration failed",T)})});
@@ -1,49 +0,0 @@
-(function(){const J=document.createElement("link").relList;if(J&&J.supports&&J.supports("modulepreload"))return;for(const L of document.querySelectorAll('link[rel="modulepreload"]'))r(L);new MutationObserver(L=>{for(const k of L)if(k.type==="childList")for(const Ot of k.addedNodes)Ot.tagName==="LINK"&&Ot.rel==="modulepreload"&&r(Ot)}).observe(document,{childList:!0,subtree:!0});function U(L){const k={};return L.integrity&&(k.integrity=L.integrity),L.referrerPolicy&&(k.referrerPolicy=L.referrerPolicy),L.crossOrigin==="use-credentials"?k.credentials="include":L.crossOrigin==="anonymous"?k.credentials="omit":k.credentials="same-origin",k}function r(L){if(L.ep)return;L.ep=!0;const k=U(L);fetch(L.href,k)}})();var Mf={exports:{}},$u={};/**
- * @license React
- * react-jsx-runtime.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Or;function Fm(){if(Or)return $u;Or=1;var T=Symbol.for("react.transitional.element"),J=Symbol.for("react.fragment");function U(r,L,k){var Ot=null;if(k!==void 0&&(Ot=""+k),L.key!==void 0&&(Ot=""+L.key),"key"in L){k={};for(var gt in L)gt!=="key"&&(k[gt]=L[gt])}else k=L;return L=k.ref,{$$typeof:T,type:r,key:Ot,ref:L!==void 0?L:null,props:k}}return $u.Fragment=J,$u.jsx=U,$u.jsxs=U,$u}var Nr;function Im(){return Nr||(Nr=1,Mf.exports=Fm()),Mf.exports}var b=Im(),Df={exports:{}},Z={};/**
- * @license React
- * react.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Mr;function Pm(){if(Mr)return Z;Mr=1;var T=Symbol.for("react.transitional.element"),J=Symbol.for("react.portal"),U=Symbol.for("react.fragment"),r=Symbol.for("react.strict_mode"),L=Symbol.for("react.profiler"),k=Symbol.for("react.consumer"),Ot=Symbol.for("react.context"),gt=Symbol.for("react.forward_ref"),j=Symbol.for("react.suspense"),A=Symbol.for("react.memo"),lt=Symbol.for("react.lazy"),H=Symbol.for("react.activity"),ct=Symbol.iterator;function Qt(o){return o===null||typeof o!="object"?null:(o=ct&&o[ct]||o["@@iterator"],typeof o=="function"?o:null)}var $t={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},Vt=Object.assign,Bl={};function Pt(o,x,O){this.props=o,this.context=x,this.refs=Bl,this.updater=O||$t}Pt.prototype.isReactComponent={},Pt.prototype.setState=function(o,x){if(typeof o!="object"&&typeof o!="function"&&o!=null)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,o,x,"setState")},Pt.prototype.forceUpdate=function(o){this.updater.enqueueForceUpdate(this,o,"forceUpdate")};function Al(){}Al.prototype=Pt.prototype;function Yt(o,x,O){this.props=o,this.context=x,this.refs=Bl,this.updater=O||$t}var nl=Yt.prototype=new Al;nl.constructor=Yt,Vt(nl,Pt.prototype),nl.isPureReactComponent=!0;var zl=Array.isArray;function Kt(){}var W={H:null,A:null,T:null,S:null},Ft=Object.prototype.hasOwnProperty;function vl(o,x,O){var D=O.ref;return{$$typeof:T,type:o,key:x,ref:D!==void 0?D:null,props:O}}function Wl(o,x){return vl(o.type,x,o.props)}function Tl(o){return typeof o=="object"&&o!==null&&o.$$typeof===T}function Nt(o){var x={"=":"=0",":":"=2"};return"$"+o.replace(/[=:]/g,function(O){return x[O]})}var kl=/\/+/g;function il(o,x){return typeof o=="object"&&o!==null&&o.key!=null?Nt(""+o.key):x.toString(36)}function tl(o){switch(o.status){case"fulfilled":return o.value;case"rejected":throw o.reason;default:switch(typeof o.status=="string"?o.then(Kt,Kt):(o.status="pending",o.then(function(x){o.status==="pending"&&(o.status="fulfilled",o.value=x)},function(x){o.status==="pending"&&(o.status="rejected",o.reason=x)})),o.status){case"fulfilled":return o.value;case"rejected":throw o.reason}}throw o}function g(o,x,O,D,Q){var X=typeof o;(X==="undefined"||X==="boolean")&&(o=null);var at=!1;if(o===null)at=!0;else switch(X){case"bigint":case"string":case"number":at=!0;break;case"object":switch(o.$$typeof){case T:case J:at=!0;break;case lt:return at=o._init,g(at(o._payload),x,O,D,Q)}}if(at)return Q=Q(o),at=D===""?"."+il(o,0):D,zl(Q)?(O="",at!=null&&(O=at.replace(kl,"$&/")+"/"),g(Q,x,O,"",function(Xl){return Xl})):Q!=null&&(Tl(Q)&&(Q=Wl(Q,O+(Q.key==null||o&&o.key===Q.key?"":(""+Q.key).replace(kl,"$&/")+"/")+at)),x.push(Q)),1;at=0;var Xt=D===""?".":D+":";if(zl(o))for(var ot=0;ot<o.length;ot++)D=o[ot],X=Xt+il(D,ot),at+=g(D,x,O,X,Q);else if(ot=Qt(o),typeof ot=="function")for(o=ot.call(o),ot=0;!(D=o.next()).done;)D=D.value,X=Xt+il(D,ot++),at+=g(D,x,O,X,Q);else if(X==="object"){if(typeof o.then=="function")return g(tl(o),x,O,D,Q);throw x=String(o),Error("Objects are not valid as a React child (found: "+(x==="[object Object]"?"object with keys {"+Object.keys(o).join(", ")+"}":x)+"). If you meant to render a collection of children, use an array instead.")}return at}function N(o,x,O){if(o==null)return o;var D=[],Q=0;return g(o,D,"","",function(X){return x.call(O,X,Q++)}),D}function q(o){if(o._status===-1){var x=o._result;x=x(),x.then(function(O){(o._status===0||o._status===-1)&&(o._status=1,o._result=O)},function(O){(o._status===0||o._status===-1)&&(o._status=2,o._result=O)}),o._status===-1&&(o._status=0,o._result=x)}if(o._status===1)return o._result.default;throw o._result}var et=typeof reportError=="function"?reportError:function(o){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var x=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof o=="object"&&o!==null&&typeof o.message=="string"?String(o.message):String(o),error:o});if(!window.dispatchEvent(x))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",o);return}console.error(o)},st={map:N,forEach:function(o,x,O){N(o,function(){x.apply(this,arguments)},O)},count:function(o){var x=0;return N(o,function(){x++}),x},toArray:function(o){return N(o,function(x){return x})||[]},only:function(o){if(!Tl(o))throw Error("React.Children.only expected to receive a single React element child.");return o}};return Z.Activity=H,Z.Children=st,Z.Component=Pt,Z.Fragment=U,Z.Profiler=L,Z.PureComponent=Yt,Z.StrictMode=r,Z.Suspense=j,Z.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=W,Z.__COMPILER_RUNTIME={__proto__:null,c:function(o){return W.H.useMemoCache(o)}},Z.cache=function(o){return function(){return o.apply(null,arguments)}},Z.cacheSignal=function(){return null},Z.cloneElement=function(o,x,O){if(o==null)throw Error("The argument must be a React element, but you passed "+o+".");var D=Vt({},o.props),Q=o.key;if(x!=null)for(X in x.key!==void 0&&(Q=""+x.key),x)!Ft.call(x,X)||X==="key"||X==="__self"||X==="__source"||X==="ref"&&x.ref===void 0||(D[X]=x[X]);var X=arguments.length-2;if(X===1)D.children=O;else if(1<X){for(var at=Array(X),Xt=0;Xt<X;Xt++)at[Xt]=arguments[Xt+2];D.children=at}return vl(o.type,Q,D)},Z.createContext=function(o){return o={$$typeof:Ot,_currentValue:o,_currentValue2:o,_threadCount:0,Provider:null,Consumer:null},o.Provider=o,o.Consumer={$$typeof:k,_context:o},o},Z.createElement=function(o,x,O){var D,Q={},X=null;if(x!=null)for(D in x.key!==void 0&&(X=""+x.key),x)Ft.call(x,D)&&D!=="key"&&D!=="__self"&&D!=="__source"&&(Q[D]=x[D]);var at=arguments.length-2;if(at===1)Q.children=O;else if(1<at){for(var Xt=Array(at),ot=0;ot<at;ot++)Xt[ot]=arguments[ot+2];Q.children=Xt}if(o&&o.defaultProps)for(D in at=o.defaultProps,at)Q[D]===void 0&&(Q[D]=at[D]);return vl(o,X,Q)},Z.createRef=function(){return{current:null}},Z.forwardRef=function(o){return{$$typeof:gt,render:o}},Z.isValidElement=Tl,Z.lazy=function(o){return{$$typeof:lt,_payload:{_status:-1,_result:o},_init:q}},Z.memo=function(o,x){return{$$typeof:A,type:o,compare:x===void 0?null:x}},Z.startTransition=function(o){var x=W.T,O={};W.T=O;try{var D=o(),Q=W.S;Q!==null&&Q(O,D),typeof D=="object"&&D!==null&&typeof D.then=="function"&&D.then(Kt,et)}catch(X){et(X)}finally{x!==null&&O.types!==null&&(x.types=O.types),W.T=x}},Z.unstable_useCacheRefresh=function(){return W.H.useCacheRefresh()},Z.use=function(o){return W.H.use(o)},Z.useActionState=function(o,x,O){return W.H.useActionState(o,x,O)},Z.useCallback=function(o,x){return W.H.useCallback(o,x)},Z.useContext=function(o){return W.H.useContext(o)},Z.useDebugValue=function(){},Z.useDeferredValue=function(o,x){return W.H.useDeferredValue(o,x)},Z.useEffect=function(o,x){return W.H.useEffect(o,x)},Z.useEffectEvent=function(o){return W.H.useEffectEvent(o)},Z.useId=function(){return W.H.useId()},Z.useImperativeHandle=function(o,x,O){return W.H.useImperativeHandle(o,x,O)},Z.useInsertionEffect=function(o,x){return W.H.useInsertionEffect(o,x)},Z.useLayoutEffect=function(o,x){return W.H.useLayoutEffect(o,x)},Z.useMemo=function(o,x){return W.H.useMemo(o,x)},Z.useOptimistic=function(o,x){return W.H.useOptimistic(o,x)},Z.useReducer=function(o,x,O){return W.H.useReducer(o,x,O)},Z.useRef=function(o){return W.H.useRef(o)},Z.useState=function(o){return W.H.useState(o)},Z.useSyncExternalStore=function(o,x,O){return W.H.useSyncExternalStore(o,x,O)},Z.useTransition=function(){return W.H.useTransition()},Z.version="19.2.4",Z}var Dr;function Hf(){return Dr||(Dr=1,Df.exports=Pm()),Df.exports}var R=Hf(),Cf={exports:{}},Fu={},Uf={exports:{}},Rf={};/**
- * @license React
- * scheduler.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Cr;function tv(){return Cr||(Cr=1,(function(T){function J(g,N){var q=g.length;g.push(N);t:for(;0<q;){var et=q-1>>>1,st=g[et];if(0<L(st,N))g[et]=N,g[q]=st,q=et;else break t}}function U(g){return g.length===0?null:g[0]}function r(g){if(g.length===0)return null;var N=g[0],q=g.pop();if(q!==N){g[0]=q;t:for(var et=0,st=g.length,o=st>>>1;et<o;){var x=2*(et+1)-1,O=g[x],D=x+1,Q=g[D];if(0>L(O,q))D<st&&0>L(Q,O)?(g[et]=Q,g[D]=q,et=D):(g[et]=O,g[x]=q,et=x);else if(D<st&&0>L(Q,q))g[et]=Q,g[D]=q,et=D;else break t}}return N}function L(g,N){var q=g.sortIndex-N.sortIndex;return q!==0?q:g.id-N.id}if(T.unstable_now=void 0,typeof performance=="object"&&typeof performance.now=="function"){var k=performance;T.unstable_now=function(){return k.now()}}else{var Ot=Date,gt=Ot.now();T.unstable_now=function(){return Ot.now()-gt}}var j=[],A=[],lt=1,H=null,ct=3,Qt=!1,$t=!1,Vt=!1,Bl=!1,Pt=typeof setTimeout=="function"?setTimeout:null,Al=typeof clearTimeout=="function"?clearTimeout:null,Yt=typeof setImmediate<"u"?setImmediate:null;function nl(g){for(var N=U(A);N!==null;){if(N.callback===null)r(A);else if(N.startTime<=g)r(A),N.sortIndex=N.expirationTime,J(j,N);else break;N=U(A)}}function zl(g){if(Vt=!1,nl(g),!$t)if(U(j)!==null)$t=!0,Kt||(Kt=!0,Nt());else{var N=U(A);N!==null&&tl(zl,N.startTime-g)}}var Kt=!1,W=-1,Ft=5,vl=-1;function Wl(){return Bl?!0:!(T.unstable_now()-vl<Ft)}function Tl(){if(Bl=!1,Kt){var g=T.unstable_now();vl=g;var N=!0;try{t:{$t=!1,Vt&&(Vt=!1,Al(W),W=-1),Qt=!0;var q=ct;try{l:{for(nl(g),H=U(j);H!==null&&!(H.expirationTime>g&&Wl());){var et=H.callback;if(typeof et=="function"){H.callback=null,ct=H.priorityLevel;var st=et(H.expirationTime<=g);if(g=T.unstable_now(),typeof st=="function"){H.callback=st,nl(g),N=!0;break l}H===U(j)&&r(j),nl(g)}else r(j);H=U(j)}if(H!==null)N=!0;else{var o=U(A);o!==null&&tl(zl,o.startTime-g),N=!1}}break t}finally{H=null,ct=q,Qt=!1}N=void 0}}finally{N?Nt():Kt=!1}}}var Nt;if(typeof Yt=="function")Nt=function(){Yt(Tl)};else if(typeof MessageChannel<"u"){var kl=new MessageChannel,il=kl.port2;kl.port1.onmessage=Tl,Nt=function(){il.postMessage(null)}}else Nt=function(){Pt(Tl,0)};function tl(g,N){W=Pt(function(){g(T.unstable_now())},N)}T.unstable_IdlePriority=5,T.unstable_ImmediatePriority=1,T.unstable_LowPriority=4,T.unstable_NormalPriority=3,T.unstable_Profiling=null,T.unstable_UserBlockingPriority=2,T.unstable_cancelCallback=function(g){g.callback=null},T.unstable_forceFrameRate=function(g){0>g||125<g?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):Ft=0<g?Math.floor(1e3/g):5},T.unstable_getCurrentPriorityLevel=function(){return ct},T.unstable_next=function(g){switch(ct){case 1:case 2:case 3:var N=3;break;default:N=ct}var q=ct;ct=N;try{return g()}finally{ct=q}},T.unstable_requestPaint=function(){Bl=!0},T.unstable_runWithPriority=function(g,N){switch(g){case 1:case 2:case 3:case 4:case 5:break;default:g=3}var q=ct;ct=g;try{return N()}finally{ct=q}},T.unstable_scheduleCallback=function(g,N,q){var et=T.unstable_now();switch(typeof q=="object"&&q!==null?(q=q.delay,q=typeof q=="number"&&0<q?et+q:et):q=et,g){case 1:var st=-1;break;case 2:st=250;break;case 5:st=1073741823;break;case 4:st=1e4;break;default:st=5e3}return st=q+st,g={id:lt++,callback:N,priorityLevel:g,startTime:q,expirationTime:st,sortIndex:-1},q>et?(g.sortIndex=q,J(A,g),U(j)===null&&g===U(A)&&(Vt?(Al(W),W=-1):Vt=!0,tl(zl,q-et))):(g.sortIndex=st,J(j,g),$t||Qt||($t=!0,Kt||(Kt=!0,Nt()))),g},T.unstable_shouldYield=Wl,T.unstable_wrapCallback=function(g){var N=ct;return function(){var q=ct;ct=N;try{return g.apply(this,arguments)}finally{ct=q}}}})(Rf)),Rf}var Ur;function lv(){return Ur||(Ur=1,Uf.exports=tv()),Uf.exports}var jf={exports:{}},It={};/**
- * @license React
- * react-dom.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Rr;function ev(){if(Rr)return It;Rr=1;var T=Hf();function J(j){var A="https://react.dev/errors/"+j;if(1<arguments.length){A+="?args[]="+encodeURIComponent(arguments[1]);for(var lt=2;lt<arguments.length;lt++)A+="&args[]="+encodeURIComponent(arguments[lt])}return"Minified React error #"+j+"; visit "+A+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function U(){}var r={d:{f:U,r:function(){throw Error(J(522))},D:U,C:U,L:U,m:U,X:U,S:U,M:U},p:0,findDOMNode:null},L=Symbol.for("react.portal");function k(j,A,lt){var H=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:L,key:H==null?null:""+H,children:j,containerInfo:A,implementation:lt}}var Ot=T.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function gt(j,A){if(j==="font")return"";if(typeof A=="string")return A==="use-credentials"?A:""}return It.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=r,It.createPortal=function(j,A){var lt=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!A||A.nodeType!==1&&A.nodeType!==9&&A.nodeType!==11)throw Error(J(299));return k(j,A,null,lt)},It.flushSync=function(j){var A=Ot.T,lt=r.p;try{if(Ot.T=null,r.p=2,j)return j()}finally{Ot.T=A,r.p=lt,r.d.f()}},It.preconnect=function(j,A){typeof j=="string"&&(A?(A=A.crossOrigin,A=typeof A=="string"?A==="use-credentials"?A:"":void 0):A=null,r.d.C(j,A))},It.prefetchDNS=function(j){typeof j=="string"&&r.d.D(j)},It.preinit=function(j,A){if(typeof j=="string"&&A&&typeof A.as=="string"){var lt=A.as,H=gt(lt,A.crossOrigin),ct=typeof A.integrity=="string"?A.integrity:void 0,Qt=typeof A.fetchPriority=="string"?A.fetchPriority:void 0;lt==="style"?r.d.S(j,typeof A.precedence=="string"?A.precedence:void 0,{crossOrigin:H,integrity:ct,fetchPriority:Qt}):lt==="script"&&r.d.X(j,{crossOrigin:H,integrity:ct,fetchPriority:Qt,nonce:typeof A.nonce=="string"?A.nonce:void 0})}},It.preinitModule=function(j,A){if(typeof j=="string")if(typeof A=="object"&&A!==null){if(A.as==null||A.as==="script"){var lt=gt(A.as,A.crossOrigin);r.d.M(j,{crossOrigin:lt,integrity:typeof A.integrity=="string"?A.integrity:void 0,nonce:typeof A.nonce=="string"?A.nonce:void 0})}}else A==null&&r.d.M(j)},It.preload=function(j,A){if(typeof j=="string"&&typeof A=="object"&&A!==null&&typeof A.as=="string"){var lt=A.as,H=gt(lt,A.crossOrigin);r.d.L(j,lt,{crossOrigin:H,integrity:typeof A.integrity=="string"?A.integrity:void 0,nonce:typeof A.nonce=="string"?A.nonce:void 0,type:typeof A.type=="string"?A.type:void 0,fetchPriority:typeof A.fetchPriority=="string"?A.fetchPriority:void 0,referrerPolicy:typeof A.referrerPolicy=="string"?A.referrerPolicy:void 0,imageSrcSet:typeof A.imageSrcSet=="string"?A.imageSrcSet:void 0,imageSizes:typeof A.imageSizes=="string"?A.imageSizes:void 0,media:typeof A.media=="string"?A.media:void 0})}},It.preloadModule=function(j,A){if(typeof j=="string")if(A){var lt=gt(A.as,A.crossOrigin);r.d.m(j,{as:typeof A.as=="string"&&A.as!=="script"?A.as:void 0,crossOrigin:lt,integrity:typeof A.integrity=="string"?A.integrity:void 0})}else r.d.m(j)},It.requestFormReset=function(j){r.d.r(j)},It.unstable_batchedUpdates=function(j,A){return j(A)},It.useFormState=function(j,A,lt){return Ot.H.useFormState(j,A,lt)},It.useFormStatus=function(){return Ot.H.useHostTransitionStatus()},It.version="19.2.4",It}var jr;function av(){if(jr)return jf.exports;jr=1;function T(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(T)}catch(J){console.error(J)}}return T(),jf.exports=ev(),jf.exports}/**
- * @license React
- * react-dom-client.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Hr;function uv(){if(Hr)return Fu;Hr=1;var T=lv(),J=Hf(),U=av();function r(t){var l="https://react.dev/errors/"+t;if(1<arguments.length){l+="?args[]="+encodeURIComponent(arguments[1]);for(var e=2;e<arguments.length;e++)l+="&args[]="+encodeURIComponent(arguments[e])}return"Minified React error #"+t+"; visit "+l+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function L(t){return!(!t||t.nodeType!==1&&t.nodeType!==9&&t.nodeType!==11)}function k(t){var l=t,e=t;if(t.alternate)for(;l.return;)l=l.return;else{t=l;do l=t,(l.flags&4098)!==0&&(e=l.return),t=l.return;while(t)}return l.tag===3?e:null}function Ot(t){if(t.tag===13){var l=t.memoizedState;if(l===null&&(t=t.alternate,t!==null&&(l=t.memoizedState)),l!==null)return l.dehydrated}return null}function gt(t){if(t.tag===31){var l=t.memoizedState;if(l===null&&(t=t.alternate,t!==null&&(l=t.memoizedState)),l!==null)return l.dehydrated}return null}function j(t){if(k(t)!==t)throw Error(r(188))}function A(t){var l=t.alternate;if(!l){if(l=k(t),l===null)throw Error(r(188));return l!==t?null:t}for(var e=t,a=l;;){var u=e.return;if(u===null)break;var n=u.alternate;if(n===null){if(a=u.return,a!==null){e=a;continue}break}if(u.child===n.child){for(n=u.child;n;){if(n===e)return j(u),t;if(n===a)return j(u),l;n=n.sibling}throw Error(r(188))}if(e.return!==a.return)e=u,a=n;else{for(var i=!1,c=u.child;c;){if(c===e){i=!0,e=u,a=n;break}if(c===a){i=!0,a=u,e=n;break}c=c.sibling}if(!i){for(c=n.child;c;){if(c===e){i=!0,e=n,a=u;break}if(c===a){i=!0,a=n,e=u;break}c=c.sibling}if(!i)throw Error(r(189))}}if(e.alternate!==a)throw Error(r(190))}if(e.tag!==3)throw Error(r(188));return e.stateNode.current===e?t:l}function lt(t){var l=t.tag;if(l===5||l===26||l===27||l===6)return t;for(t=t.child;t!==null;){if(l=lt(t),l!==null)return l;t=t.sibling}return null}var H=Object.assign,ct=Symbol.for("react.element"),Qt=Symbol.for("react.transitional.element"),$t=Symbol.for("react.portal"),Vt=Symbol.for("react.fragment"),Bl=Symbol.for("react.strict_mode"),Pt=Symbol.for("react.profiler"),Al=Symbol.for("react.consumer"),Yt=Symbol.for("react.context"),nl=Symbol.for("react.forward_ref"),zl=Symbol.for("react.suspense"),Kt=Symbol.for("react.suspense_list"),W=Symbol.for("react.memo"),Ft=Symbol.for("react.lazy"),vl=Symbol.for("react.activity"),Wl=Symbol.for("react.memo_cache_sentinel"),Tl=Symbol.iterator;function Nt(t){return t===null||typeof t!="object"?null:(t=Tl&&t[Tl]||t["@@iterator"],typeof t=="function"?t:null)}var kl=Symbol.for("react.client.reference");function il(t){if(t==null)return null;if(typeof t=="function")return t.$$typeof===kl?null:t.displayName||t.name||null;if(typeof t=="string")return t;switch(t){case Vt:return"Fragment";case Pt:return"Profiler";case Bl:return"StrictMode";case zl:return"Suspense";case Kt:return"SuspenseList";case vl:return"Activity"}if(typeof t=="object")switch(t.$$typeof){case $t:return"Portal";case Yt:return t.displayName||"Context";case Al:return(t._context.displayName||"Context")+".Consumer";case nl:var l=t.render;return t=t.displayName,t||(t=l.displayName||l.name||"",t=t!==""?"ForwardRef("+t+")":"ForwardRef"),t;case W:return l=t.displayName||null,l!==null?l:il(t.type)||"Memo";case Ft:l=t._payload,t=t._init;try{return il(t(l))}catch{}}return null}var tl=Array.isArray,g=J.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,N=U.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,q={pending:!1,data:null,method:null,action:null},et=[],st=-1;function o(t){return{current:t}}function x(t){0>st||(t.current=et[st],et[st]=null,st--)}function O(t,l){st++,et[st]=t.current,t.current=l}var D=o(null),Q=o(null),X=o(null),at=o(null);function Xt(t,l){switch(O(X,l),O(Q,t),O(D,null),l.nodeType){case 9:case 11:t=(t=l.documentElement)&&(t=t.namespaceURI)?$d(t):0;break;default:if(t=l.tagName,l=l.namespaceURI)l=$d(l),t=Fd(l,t);else switch(t){case"svg":t=1;break;case"math":t=2;break;default:t=0}}x(D),O(D,t)}function ot(){x(D),x(Q),x(X)}function Xl(t){t.memoizedState!==null&&O(at,t);var l=D.current,e=Fd(l,t.type);l!==e&&(O(Q,t),O(D,e))}function Mt(t){Q.current===t&&(x(D),x(Q)),at.current===t&&(x(at),Ju._currentValue=q)}var Ve,Pu;function $l(t){if(Ve===void 0)try{throw Error()}catch(e){var l=e.stack.trim().match(/\n( *(at )?)/);Ve=l&&l[1]||"",Pu=-1<e.stack.indexOf(`
-    at`)?" (<anonymous>)":-1<e.stack.indexOf("@")?"@unknown:0:0":""}return`
-`+Ve+t+Pu}var Ke=!1;function ge(t,l){if(!t||Ke)return"";Ke=!0;var e=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var a={DetermineComponentFrameRoot:function(){try{if(l){var E=function(){throw Error()};if(Object.defineProperty(E.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(E,[])}catch(h){var y=h}Reflect.construct(t,[],E)}else{try{E.call()}catch(h){y=h}t.call(E.prototype)}}else{try{throw Error()}catch(h){y=h}(E=t())&&typeof E.catch=="function"&&E.catch(function(){})}}catch(h){if(h&&y&&typeof h.stack=="string")return[h.stack,y.stack]}return[null,null]}};a.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var u=Object.getOwnPropertyDescriptor(a.DetermineComponentFrameRoot,"name");u&&u.configurable&&Object.defineProperty(a.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var n=a.DetermineComponentFrameRoot(),i=n[0],c=n[1];if(i&&c){var f=i.split(`
-`),v=c.split(`
-`);for(u=a=0;a<f.length&&!f[a].includes("DetermineComponentFrameRoot");)a++;for(;u<v.length&&!v[u].includes("DetermineComponentFrameRoot");)u++;if(a===f.length||u===v.length)for(a=f.length-1,u=v.length-1;1<=a&&0<=u&&f[a]!==v[u];)u--;for(;1<=a&&0<=u;a--,u--)if(f[a]!==v[u]){if(a!==1||u!==1)do if(a--,u--,0>u||f[a]!==v[u]){var S=`
-`+f[a].replace(" at new "," at ");return t.displayName&&S.includes("<anonymous>")&&(S=S.replace("<anonymous>",t.displayName)),S}while(1<=a&&0<=u);break}}}finally{Ke=!1,Error.prepareStackTrace=e}return(e=t?t.displayName||t.name:"")?$l(e):""}function ya(t,l){switch(t.tag){case 26:case 27:case 5:return $l(t.type);case 16:return $l("Lazy");case 13:return t.child!==l&&l!==null?$l("Suspense Fallback"):$l("Suspense");case 19:return $l("SuspenseList");case 0:case 15:return ge(t.type,!1);case 11:return ge(t.type.render,!1);case 1:return ge(t.type,!0);case 31:return $l("Activity");default:return""}}function Se(t){try{var l="",e=null;do l+=ya(t,e),e=t,t=t.return;while(t);return l}catch(a){return`
-Error generating stack: `+a.message+`
-`+a.stack}}var be=Object.prototype.hasOwnProperty,ql=T.unstable_scheduleCallback,Je=T.unstable_cancelCallback,St=T.unstable_shouldYield,vi=T.unstable_requestPaint,zt=T.unstable_now,Fl=T.unstable_getCurrentPriorityLevel,Il=T.unstable_ImmediatePriority,uu=T.unstable_UserBlockingPriority,we=T.unstable_NormalPriority,nu=T.unstable_LowPriority,We=T.unstable_IdlePriority,yi=T.log,hi=T.unstable_setDisableYieldValue,ke=null,ll=null;function Zl(t){if(typeof yi=="function"&&hi(t),ll&&typeof ll.setStrictMode=="function")try{ll.setStrictMode(ke,t)}catch{}}var el=Math.clz32?Math.clz32:Si,tn=Math.log,gi=Math.LN2;function Si(t){return t>>>=0,t===0?32:31-(tn(t)/gi|0)|0}var ha=256,ga=262144,Sa=4194304;function Ll(t){var l=t&42;if(l!==0)return l;switch(t&-t){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:return t&261888;case 262144:case 524288:case 1048576:case 2097152:return t&3932160;case 4194304:case 8388608:case 16777216:case 33554432:return t&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return t}}function ba(t,l,e){var a=t.pendingLanes;if(a===0)return 0;var u=0,n=t.suspendedLanes,i=t.pingedLanes;t=t.warmLanes;var c=a&134217727;return c!==0?(a=c&~n,a!==0?u=Ll(a):(i&=c,i!==0?u=Ll(i):e||(e=c&~t,e!==0&&(u=Ll(e))))):(c=a&~n,c!==0?u=Ll(c):i!==0?u=Ll(i):e||(e=a&~t,e!==0&&(u=Ll(e)))),u===0?0:l!==0&&l!==u&&(l&n)===0&&(n=u&-u,e=l&-l,n>=e||n===32&&(e&4194048)!==0)?l:u}function $e(t,l){return(t.pendingLanes&~(t.suspendedLanes&~t.pingedLanes)&l)===0}function iu(t,l){switch(t){case 1:case 2:case 4:case 8:case 64:return l+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return l+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function pa(){var t=Sa;return Sa<<=1,(Sa&62914560)===0&&(Sa=4194304),t}function Fe(t){for(var l=[],e=0;31>e;e++)l.push(t);return l}function z(t,l){t.pendingLanes|=l,l!==268435456&&(t.suspendedLanes=0,t.pingedLanes=0,t.warmLanes=0)}function _(t,l,e,a,u,n){var i=t.pendingLanes;t.pendingLanes=e,t.suspendedLanes=0,t.pingedLanes=0,t.warmLanes=0,t.expiredLanes&=e,t.entangledLanes&=e,t.errorRecoveryDisabledLanes&=e,t.shellSuspendCounter=0;var c=t.entanglements,f=t.expirationTimes,v=t.hiddenUpdates;for(e=i&~e;0<e;){var S=31-el(e),E=1<<S;c[S]=0,f[S]=-1;var y=v[S];if(y!==null)for(v[S]=null,S=0;S<y.length;S++){var h=y[S];h!==null&&(h.lane&=-536870913)}e&=~E}a!==0&&V(t,a,0),n!==0&&u===0&&t.tag!==0&&(t.suspendedLanes|=n&~(i&~l))}function V(t,l,e){t.pendingLanes|=l,t.suspendedLanes&=~l;var a=31-el(l);t.entangledLanes|=l,t.entanglements[a]=t.entanglements[a]|1073741824|e&261930}function Y(t,l){var e=t.entangledLanes|=l;for(t=t.entanglements;e;){var a=31-el(e),u=1<<a;u&l|t[a]&l&&(t[a]|=l),e&=~u}}function ut(t,l){var e=l&-l;return e=(e&42)!==0?1:bt(e),(e&(t.suspendedLanes|l))!==0?0:e}function bt(t){switch(t){case 2:t=1;break;case 8:t=4;break;case 32:t=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:t=128;break;case 268435456:t=134217728;break;default:t=0}return t}function Tt(t){return t&=-t,2<t?8<t?(t&134217727)!==0?32:268435456:8:2}function yl(){var t=N.p;return t!==0?t:(t=window.event,t===void 0?32:pr(t.type))}function cl(t,l){var e=N.p;try{return N.p=t,l()}finally{N.p=e}}var al=Math.random().toString(36).slice(2),mt="__reactFiber$"+al,Et="__reactProps$"+al,pe="__reactContainer$"+al,bi="__reactEvents$"+al,Qr="__reactListeners$"+al,Xr="__reactHandles$"+al,Bf="__reactResources$"+al,cu="__reactMarker$"+al;function pi(t){delete t[mt],delete t[Et],delete t[bi],delete t[Qr],delete t[Xr]}function Ea(t){var l=t[mt];if(l)return l;for(var e=t.parentNode;e;){if(l=e[pe]||e[mt]){if(e=l.alternate,l.child!==null||e!==null&&e.child!==null)for(t=ur(t);t!==null;){if(e=t[mt])return e;t=ur(t)}return l}t=e,e=t.parentNode}return null}function xa(t){if(t=t[mt]||t[pe]){var l=t.tag;if(l===5||l===6||l===13||l===31||l===26||l===27||l===3)return t}return null}function fu(t){var l=t.tag;if(l===5||l===26||l===27||l===6)return t.stateNode;throw Error(r(33))}function Aa(t){var l=t[Bf];return l||(l=t[Bf]={hoistableStyles:new Map,hoistableScripts:new Map}),l}function Zt(t){t[cu]=!0}var qf=new Set,Yf={};function Ie(t,l){za(t,l),za(t+"Capture",l)}function za(t,l){for(Yf[t]=l,t=0;t<l.length;t++)qf.add(l[t])}var Zr=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),Gf={},Qf={};function Lr(t){return be.call(Qf,t)?!0:be.call(Gf,t)?!1:Zr.test(t)?Qf[t]=!0:(Gf[t]=!0,!1)}function ln(t,l,e){if(Lr(l))if(e===null)t.removeAttribute(l);else{switch(typeof e){case"undefined":case"function":case"symbol":t.removeAttribute(l);return;case"boolean":var a=l.toLowerCase().slice(0,5);if(a!=="data-"&&a!=="aria-"){t.removeAttribute(l);return}}t.setAttribute(l,""+e)}}function en(t,l,e){if(e===null)t.removeAttribute(l);else{switch(typeof e){case"undefined":case"function":case"symbol":case"boolean":t.removeAttribute(l);return}t.setAttribute(l,""+e)}}function Pl(t,l,e,a){if(a===null)t.removeAttribute(e);else{switch(typeof a){case"undefined":case"function":case"symbol":case"boolean":t.removeAttribute(e);return}t.setAttributeNS(l,e,""+a)}}function _l(t){switch(typeof t){case"bigint":case"boolean":case"number":case"string":case"undefined":return t;case"object":return t;default:return""}}function Xf(t){var l=t.type;return(t=t.nodeName)&&t.toLowerCase()==="input"&&(l==="checkbox"||l==="radio")}function Vr(t,l,e){var a=Object.getOwnPropertyDescriptor(t.constructor.prototype,l);if(!t.hasOwnProperty(l)&&typeof a<"u"&&typeof a.get=="function"&&typeof a.set=="function"){var u=a.get,n=a.set;return Object.defineProperty(t,l,{configurable:!0,get:function(){return u.call(this)},set:function(i){e=""+i,n.call(this,i)}}),Object.defineProperty(t,l,{enumerable:a.enumerable}),{getValue:function(){return e},setValue:function(i){e=""+i},stopTracking:function(){t._valueTracker=null,delete t[l]}}}}function Ei(t){if(!t._valueTracker){var l=Xf(t)?"checked":"value";t._valueTracker=Vr(t,l,""+t[l])}}function Zf(t){if(!t)return!1;var l=t._valueTracker;if(!l)return!0;var e=l.getValue(),a="";return t&&(a=Xf(t)?t.checked?"true":"false":t.value),t=a,t!==e?(l.setValue(t),!0):!1}function an(t){if(t=t||(typeof document<"u"?document:void 0),typeof t>"u")return null;try{return t.activeElement||t.body}catch{return t.body}}var Kr=/[\n"\\]/g;function Ol(t){return t.replace(Kr,function(l){return"\\"+l.charCodeAt(0).toString(16)+" "})}function xi(t,l,e,a,u,n,i,c){t.name="",i!=null&&typeof i!="function"&&typeof i!="symbol"&&typeof i!="boolean"?t.type=i:t.removeAttribute("type"),l!=null?i==="number"?(l===0&&t.value===""||t.value!=l)&&(t.value=""+_l(l)):t.value!==""+_l(l)&&(t.value=""+_l(l)):i!=="submit"&&i!=="reset"||t.removeAttribute("value"),l!=null?Ai(t,i,_l(l)):e!=null?Ai(t,i,_l(e)):a!=null&&t.removeAttribute("value"),u==null&&n!=null&&(t.defaultChecked=!!n),u!=null&&(t.checked=u&&typeof u!="function"&&typeof u!="symbol"),c!=null&&typeof c!="function"&&typeof c!="symbol"&&typeof c!="boolean"?t.name=""+_l(c):t.removeAttribute("name")}function Lf(t,l,e,a,u,n,i,c){if(n!=null&&typeof n!="function"&&typeof n!="symbol"&&typeof n!="boolean"&&(t.type=n),l!=null||e!=null){if(!(n!=="submit"&&n!=="reset"||l!=null)){Ei(t);return}e=e!=null?""+_l(e):"",l=l!=null?""+_l(l):e,c||l===t.value||(t.value=l),t.defaultValue=l}a=a??u,a=typeof a!="function"&&typeof a!="symbol"&&!!a,t.checked=c?t.checked:!!a,t.defaultChecked=!!a,i!=null&&typeof i!="function"&&typeof i!="symbol"&&typeof i!="boolean"&&(t.name=i),Ei(t)}function Ai(t,l,e){l==="number"&&an(t.ownerDocument)===t||t.defaultValue===""+e||(t.defaultValue=""+e)}function Ta(t,l,e,a){if(t=t.options,l){l={};for(var u=0;u<e.length;u++)l["$"+e[u]]=!0;for(e=0;e<t.length;e++)u=l.hasOwnProperty("$"+t[e].value),t[e].selected!==u&&(t[e].selected=u),u&&a&&(t[e].defaultSelected=!0)}else{for(e=""+_l(e),l=null,u=0;u<t.length;u++){if(t[u].value===e){t[u].selected=!0,a&&(t[u].defaultSelected=!0);return}l!==null||t[u].disabled||(l=t[u])}l!==null&&(l.selected=!0)}}function Vf(t,l,e){if(l!=null&&(l=""+_l(l),l!==t.value&&(t.value=l),e==null)){t.defaultValue!==l&&(t.defaultValue=l);return}t.defaultValue=e!=null?""+_l(e):""}function Kf(t,l,e,a){if(l==null){if(a!=null){if(e!=null)throw Error(r(92));if(tl(a)){if(1<a.length)throw Error(r(93));a=a[0]}e=a}e==null&&(e=""),l=e}e=_l(l),t.defaultValue=e,a=t.textContent,a===e&&a!==""&&a!==null&&(t.value=a),Ei(t)}function _a(t,l){if(l){var e=t.firstChild;if(e&&e===t.lastChild&&e.nodeType===3){e.nodeValue=l;return}}t.textContent=l}var Jr=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function Jf(t,l,e){var a=l.indexOf("--")===0;e==null||typeof e=="boolean"||e===""?a?t.setProperty(l,""):l==="float"?t.cssFloat="":t[l]="":a?t.setProperty(l,e):typeof e!="number"||e===0||Jr.has(l)?l==="float"?t.cssFloat=e:t[l]=(""+e).trim():t[l]=e+"px"}function wf(t,l,e){if(l!=null&&typeof l!="object")throw Error(r(62));if(t=t.style,e!=null){for(var a in e)!e.hasOwnProperty(a)||l!=null&&l.hasOwnProperty(a)||(a.indexOf("--")===0?t.setProperty(a,""):a==="float"?t.cssFloat="":t[a]="");for(var u in l)a=l[u],l.hasOwnProperty(u)&&e[u]!==a&&Jf(t,u,a)}else for(var n in l)l.hasOwnProperty(n)&&Jf(t,n,l[n])}function zi(t){if(t.indexOf("-")===-1)return!1;switch(t){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var wr=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),Wr=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function un(t){return Wr.test(""+t)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":t}function te(){}var Ti=null;function _i(t){return t=t.target||t.srcElement||window,t.correspondingUseElement&&(t=t.correspondingUseElement),t.nodeType===3?t.parentNode:t}var Oa=null,Na=null;function Wf(t){var l=xa(t);if(l&&(t=l.stateNode)){var e=t[Et]||null;t:switch(t=l.stateNode,l.type){case"input":if(xi(t,e.value,e.defaultValue,e.defaultValue,e.checked,e.defaultChecked,e.type,e.name),l=e.name,e.type==="radio"&&l!=null){for(e=t;e.parentNode;)e=e.parentNode;for(e=e.querySelectorAll('input[name="'+Ol(""+l)+'"][type="radio"]'),l=0;l<e.length;l++){var a=e[l];if(a!==t&&a.form===t.form){var u=a[Et]||null;if(!u)throw Error(r(90));xi(a,u.value,u.defaultValue,u.defaultValue,u.checked,u.defaultChecked,u.type,u.name)}}for(l=0;l<e.length;l++)a=e[l],a.form===t.form&&Zf(a)}break t;case"textarea":Vf(t,e.value,e.defaultValue);break t;case"select":l=e.value,l!=null&&Ta(t,!!e.multiple,l,!1)}}}var Oi=!1;function kf(t,l,e){if(Oi)return t(l,e);Oi=!0;try{var a=t(l);return a}finally{if(Oi=!1,(Oa!==null||Na!==null)&&(Jn(),Oa&&(l=Oa,t=Na,Na=Oa=null,Wf(l),t)))for(l=0;l<t.length;l++)Wf(t[l])}}function su(t,l){var e=t.stateNode;if(e===null)return null;var a=e[Et]||null;if(a===null)return null;e=a[l];t:switch(l){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(a=!a.disabled)||(t=t.type,a=!(t==="button"||t==="input"||t==="select"||t==="textarea")),t=!a;break t;default:t=!1}if(t)return null;if(e&&typeof e!="function")throw Error(r(231,l,typeof e));return e}var le=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),Ni=!1;if(le)try{var ou={};Object.defineProperty(ou,"passive",{get:function(){Ni=!0}}),window.addEventListener("test",ou,ou),window.removeEventListener("test",ou,ou)}catch{Ni=!1}var Ee=null,Mi=null,nn=null;function $f(){if(nn)return nn;var t,l=Mi,e=l.length,a,u="value"in Ee?Ee.value:Ee.textContent,n=u.length;for(t=0;t<e&&l[t]===u[t];t++);var i=e-t;for(a=1;a<=i&&l[e-a]===u[n-a];a++);return nn=u.slice(t,1<a?1-a:void 0)}function cn(t){var l=t.keyCode;return"charCode"in t?(t=t.charCode,t===0&&l===13&&(t=13)):t=l,t===10&&(t=13),32<=t||t===13?t:0}function fn(){return!0}function Ff(){return!1}function fl(t){function l(e,a,u,n,i){this._reactName=e,this._targetInst=u,this.type=a,this.nativeEvent=n,this.target=i,this.currentTarget=null;for(var c in t)t.hasOwnProperty(c)&&(e=t[c],this[c]=e?e(n):n[c]);return this.isDefaultPrevented=(n.defaultPrevented!=null?n.defaultPrevented:n.returnValue===!1)?fn:Ff,this.isPropagationStopped=Ff,this}return H(l.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():typeof e.returnValue!="unknown"&&(e.returnValue=!1),this.isDefaultPrevented=fn)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():typeof e.cancelBubble!="unknown"&&(e.cancelBubble=!0),this.isPropagationStopped=fn)},persist:function(){},isPersistent:fn}),l}var Pe={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(t){return t.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},sn=fl(Pe),du=H({},Pe,{view:0,detail:0}),kr=fl(du),Di,Ci,ru,on=H({},du,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Ri,button:0,buttons:0,relatedTarget:function(t){return t.relatedTarget===void 0?t.fromElement===t.srcElement?t.toElement:t.fromElement:t.relatedTarget},movementX:function(t){return"movementX"in t?t.movementX:(t!==ru&&(ru&&t.type==="mousemove"?(Di=t.screenX-ru.screenX,Ci=t.screenY-ru.screenY):Ci=Di=0,ru=t),Di)},movementY:function(t){return"movementY"in t?t.movementY:Ci}}),If=fl(on),$r=H({},on,{dataTransfer:0}),Fr=fl($r),Ir=H({},du,{relatedTarget:0}),Ui=fl(Ir),Pr=H({},Pe,{animationName:0,elapsedTime:0,pseudoElement:0}),t0=fl(Pr),l0=H({},Pe,{clipboardData:function(t){return"clipboardData"in t?t.clipboardData:window.clipboardData}}),e0=fl(l0),a0=H({},Pe,{data:0}),Pf=fl(a0),u0={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},n0={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},i0={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function c0(t){var l=this.nativeEvent;return l.getModifierState?l.getModifierState(t):(t=i0[t])?!!l[t]:!1}function Ri(){return c0}var f0=H({},du,{key:function(t){if(t.key){var l=u0[t.key]||t.key;if(l!=="Unidentified")return l}return t.type==="keypress"?(t=cn(t),t===13?"Enter":String.fromCharCode(t)):t.type==="keydown"||t.type==="keyup"?n0[t.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Ri,charCode:function(t){return t.type==="keypress"?cn(t):0},keyCode:function(t){return t.type==="keydown"||t.type==="keyup"?t.keyCode:0},which:function(t){return t.type==="keypress"?cn(t):t.type==="keydown"||t.type==="keyup"?t.keyCode:0}}),s0=fl(f0),o0=H({},on,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),ts=fl(o0),d0=H({},du,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Ri}),r0=fl(d0),m0=H({},Pe,{propertyName:0,elapsedTime:0,pseudoElement:0}),v0=fl(m0),y0=H({},on,{deltaX:function(t){return"deltaX"in t?t.deltaX:"wheelDeltaX"in t?-t.wheelDeltaX:0},deltaY:function(t){return"deltaY"in t?t.deltaY:"wheelDeltaY"in t?-t.wheelDeltaY:"wheelDelta"in t?-t.wheelDelta:0},deltaZ:0,deltaMode:0}),h0=fl(y0),g0=H({},Pe,{newState:0,oldState:0}),S0=fl(g0),b0=[9,13,27,32],ji=le&&"CompositionEvent"in window,mu=null;le&&"documentMode"in document&&(mu=document.documentMode);var p0=le&&"TextEvent"in window&&!mu,ls=le&&(!ji||mu&&8<mu&&11>=mu),es=" ",as=!1;function us(t,l){switch(t){case"keyup":return b0.indexOf(l.keyCode)!==-1;case"keydown":return l.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function ns(t){return t=t.detail,typeof t=="object"&&"data"in t?t.data:null}var Ma=!1;function E0(t,l){switch(t){case"compositionend":return ns(l);case"keypress":return l.which!==32?null:(as=!0,es);case"textInput":return t=l.data,t===es&&as?null:t;default:return null}}function x0(t,l){if(Ma)return t==="compositionend"||!ji&&us(t,l)?(t=$f(),nn=Mi=Ee=null,Ma=!1,t):null;switch(t){case"paste":return null;case"keypress":if(!(l.ctrlKey||l.altKey||l.metaKey)||l.ctrlKey&&l.altKey){if(l.char&&1<l.char.length)return l.char;if(l.which)return String.fromCharCode(l.which)}return null;case"compositionend":return ls&&l.locale!=="ko"?null:l.data;default:return null}}var A0={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function is(t){var l=t&&t.nodeName&&t.nodeName.toLowerCase();return l==="input"?!!A0[t.type]:l==="textarea"}function cs(t,l,e,a){Oa?Na?Na.push(a):Na=[a]:Oa=a,l=Pn(l,"onChange"),0<l.length&&(e=new sn("onChange","change",null,e,a),t.push({event:e,listeners:l}))}var vu=null,yu=null;function z0(t){Vd(t,0)}function dn(t){var l=fu(t);if(Zf(l))return t}function fs(t,l){if(t==="change")return l}var ss=!1;if(le){var Hi;if(le){var Bi="oninput"in document;if(!Bi){var os=document.createElement("div");os.setAttribute("oninput","return;"),Bi=typeof os.oninput=="function"}Hi=Bi}else Hi=!1;ss=Hi&&(!document.documentMode||9<document.documentMode)}function ds(){vu&&(vu.detachEvent("onpropertychange",rs),yu=vu=null)}function rs(t){if(t.propertyName==="value"&&dn(yu)){var l=[];cs(l,yu,t,_i(t)),kf(z0,l)}}function T0(t,l,e){t==="focusin"?(ds(),vu=l,yu=e,vu.attachEvent("onpropertychange",rs)):t==="focusout"&&ds()}function _0(t){if(t==="selectionchange"||t==="keyup"||t==="keydown")return dn(yu)}function O0(t,l){if(t==="click")return dn(l)}function N0(t,l){if(t==="input"||t==="change")return dn(l)}function M0(t,l){return t===l&&(t!==0||1/t===1/l)||t!==t&&l!==l}var hl=typeof Object.is=="function"?Object.is:M0;function hu(t,l){if(hl(t,l))return!0;if(typeof t!="object"||t===null||typeof l!="object"||l===null)return!1;var e=Object.keys(t),a=Object.keys(l);if(e.length!==a.length)return!1;for(a=0;a<e.length;a++){var u=e[a];if(!be.call(l,u)||!hl(t[u],l[u]))return!1}return!0}function ms(t){for(;t&&t.firstChild;)t=t.firstChild;return t}function vs(t,l){var e=ms(t);t=0;for(var a;e;){if(e.nodeType===3){if(a=t+e.textContent.length,t<=l&&a>=l)return{node:e,offset:l-t};t=a}t:{for(;e;){if(e.nextSibling){e=e.nextSibling;break t}e=e.parentNode}e=void 0}e=ms(e)}}function ys(t,l){return t&&l?t===l?!0:t&&t.nodeType===3?!1:l&&l.nodeType===3?ys(t,l.parentNode):"contains"in t?t.contains(l):t.compareDocumentPosition?!!(t.compareDocumentPosition(l)&16):!1:!1}function hs(t){t=t!=null&&t.ownerDocument!=null&&t.ownerDocument.defaultView!=null?t.ownerDocument.defaultView:window;for(var l=an(t.document);l instanceof t.HTMLIFrameElement;){try{var e=typeof l.contentWindow.location.href=="string"}catch{e=!1}if(e)t=l.contentWindow;else break;l=an(t.document)}return l}function qi(t){var l=t&&t.nodeName&&t.nodeName.toLowerCase();return l&&(l==="input"&&(t.type==="text"||t.type==="search"||t.type==="tel"||t.type==="url"||t.type==="password")||l==="textarea"||t.contentEditable==="true")}var D0=le&&"documentMode"in document&&11>=document.documentMode,Da=null,Yi=null,gu=null,Gi=!1;function gs(t,l,e){var a=e.window===e?e.document:e.nodeType===9?e:e.ownerDocument;Gi||Da==null||Da!==an(a)||(a=Da,"selectionStart"in a&&qi(a)?a={start:a.selectionStart,end:a.selectionEnd}:(a=(a.ownerDocument&&a.ownerDocument.defaultView||window).getSelection(),a={anchorNode:a.anchorNode,anchorOffset:a.anchorOffset,focusNode:a.focusNode,focusOffset:a.focusOffset}),gu&&hu(gu,a)||(gu=a,a=Pn(Yi,"onSelect"),0<a.length&&(l=new sn("onSelect","select",null,l,e),t.push({event:l,listeners:a}),l.target=Da)))}function ta(t,l){var e={};return e[t.toLowerCase()]=l.toLowerCase(),e["Webkit"+t]="webkit"+l,e["Moz"+t]="moz"+l,e}var Ca={animationend:ta("Animation","AnimationEnd"),animationiteration:ta("Animation","AnimationIteration"),animationstart:ta("Animation","AnimationStart"),transitionrun:ta("Transition","TransitionRun"),transitionstart:ta("Transition","TransitionStart"),transitioncancel:ta("Transition","TransitionCancel"),transitionend:ta("Transition","TransitionEnd")},Qi={},Ss={};le&&(Ss=document.createElement("div").style,"AnimationEvent"in window||(delete Ca.animationend.animation,delete Ca.animationiteration.animation,delete Ca.animationstart.animation),"TransitionEvent"in window||delete Ca.transitionend.transition);function la(t){if(Qi[t])return Qi[t];if(!Ca[t])return t;var l=Ca[t],e;for(e in l)if(l.hasOwnProperty(e)&&e in Ss)return Qi[t]=l[e];return t}var bs=la("animationend"),ps=la("animationiteration"),Es=la("animationstart"),C0=la("transitionrun"),U0=la("transitionstart"),R0=la("transitioncancel"),xs=la("transitionend"),As=new Map,Xi="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");Xi.push("scrollEnd");function Yl(t,l){As.set(t,l),Ie(l,[t])}var rn=typeof reportError=="function"?reportError:function(t){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var l=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof t=="object"&&t!==null&&typeof t.message=="string"?String(t.message):String(t),error:t});if(!window.dispatchEvent(l))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",t);return}console.error(t)},Nl=[],Ua=0,Zi=0;function mn(){for(var t=Ua,l=Zi=Ua=0;l<t;){var e=Nl[l];Nl[l++]=null;var a=Nl[l];Nl[l++]=null;var u=Nl[l];Nl[l++]=null;var n=Nl[l];if(Nl[l++]=null,a!==null&&u!==null){var i=a.pending;i===null?u.next=u:(u.next=i.next,i.next=u),a.pending=u}n!==0&&zs(e,u,n)}}function vn(t,l,e,a){Nl[Ua++]=t,Nl[Ua++]=l,Nl[Ua++]=e,Nl[Ua++]=a,Zi|=a,t.lanes|=a,t=t.alternate,t!==null&&(t.lanes|=a)}function Li(t,l,e,a){return vn(t,l,e,a),yn(t)}function ea(t,l){return vn(t,null,null,l),yn(t)}function zs(t,l,e){t.lanes|=e;var a=t.alternate;a!==null&&(a.lanes|=e);for(var u=!1,n=t.return;n!==null;)n.childLanes|=e,a=n.alternate,a!==null&&(a.childLanes|=e),n.tag===22&&(t=n.stateNode,t===null||t._visibility&1||(u=!0)),t=n,n=n.return;return t.tag===3?(n=t.stateNode,u&&l!==null&&(u=31-el(e),t=n.hiddenUpdates,a=t[u],a===null?t[u]=[l]:a.push(l),l.lane=e|536870912),n):null}function yn(t){if(50<Gu)throw Gu=0,Ic=null,Error(r(185));for(var l=t.return;l!==null;)t=l,l=t.return;return t.tag===3?t.stateNode:null}var Ra={};function j0(t,l,e,a){this.tag=t,this.key=e,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=l,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=a,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function gl(t,l,e,a){return new j0(t,l,e,a)}function Vi(t){return t=t.prototype,!(!t||!t.isReactComponent)}function ee(t,l){var e=t.alternate;return e===null?(e=gl(t.tag,l,t.key,t.mode),e.elementType=t.elementType,e.type=t.type,e.stateNode=t.stateNode,e.alternate=t,t.alternate=e):(e.pendingProps=l,e.type=t.type,e.flags=0,e.subtreeFlags=0,e.deletions=null),e.flags=t.flags&65011712,e.childLanes=t.childLanes,e.lanes=t.lanes,e.child=t.child,e.memoizedProps=t.memoizedProps,e.memoizedState=t.memoizedState,e.updateQueue=t.updateQueue,l=t.dependencies,e.dependencies=l===null?null:{lanes:l.lanes,firstContext:l.firstContext},e.sibling=t.sibling,e.index=t.index,e.ref=t.ref,e.refCleanup=t.refCleanup,e}function Ts(t,l){t.flags&=65011714;var e=t.alternate;return e===null?(t.childLanes=0,t.lanes=l,t.child=null,t.subtreeFlags=0,t.memoizedProps=null,t.memoizedState=null,t.updateQueue=null,t.dependencies=null,t.stateNode=null):(t.childLanes=e.childLanes,t.lanes=e.lanes,t.child=e.child,t.subtreeFlags=0,t.deletions=null,t.memoizedProps=e.memoizedProps,t.memoizedState=e.memoizedState,t.updateQueue=e.updateQueue,t.type=e.type,l=e.dependencies,t.dependencies=l===null?null:{lanes:l.lanes,firstContext:l.firstContext}),t}function hn(t,l,e,a,u,n){var i=0;if(a=t,typeof t=="function")Vi(t)&&(i=1);else if(typeof t=="string")i=Gm(t,e,D.current)?26:t==="html"||t==="head"||t==="body"?27:5;else t:switch(t){case vl:return t=gl(31,e,l,u),t.elementType=vl,t.lanes=n,t;case Vt:return aa(e.children,u,n,l);case Bl:i=8,u|=24;break;case Pt:return t=gl(12,e,l,u|2),t.elementType=Pt,t.lanes=n,t;case zl:return t=gl(13,e,l,u),t.elementType=zl,t.lanes=n,t;case Kt:return t=gl(19,e,l,u),t.elementType=Kt,t.lanes=n,t;default:if(typeof t=="object"&&t!==null)switch(t.$$typeof){case Yt:i=10;break t;case Al:i=9;break t;case nl:i=11;break t;case W:i=14;break t;case Ft:i=16,a=null;break t}i=29,e=Error(r(130,t===null?"null":typeof t,"")),a=null}return l=gl(i,e,l,u),l.elementType=t,l.type=a,l.lanes=n,l}function aa(t,l,e,a){return t=gl(7,t,a,l),t.lanes=e,t}function Ki(t,l,e){return t=gl(6,t,null,l),t.lanes=e,t}function _s(t){var l=gl(18,null,null,0);return l.stateNode=t,l}function Ji(t,l,e){return l=gl(4,t.children!==null?t.children:[],t.key,l),l.lanes=e,l.stateNode={containerInfo:t.containerInfo,pendingChildren:null,implementation:t.implementation},l}var Os=new WeakMap;function Ml(t,l){if(typeof t=="object"&&t!==null){var e=Os.get(t);return e!==void 0?e:(l={value:t,source:l,stack:Se(l)},Os.set(t,l),l)}return{value:t,source:l,stack:Se(l)}}var ja=[],Ha=0,gn=null,Su=0,Dl=[],Cl=0,xe=null,Vl=1,Kl="";function ae(t,l){ja[Ha++]=Su,ja[Ha++]=gn,gn=t,Su=l}function Ns(t,l,e){Dl[Cl++]=Vl,Dl[Cl++]=Kl,Dl[Cl++]=xe,xe=t;var a=Vl;t=Kl;var u=32-el(a)-1;a&=~(1<<u),e+=1;var n=32-el(l)+u;if(30<n){var i=u-u%5;n=(a&(1<<i)-1).toString(32),a>>=i,u-=i,Vl=1<<32-el(l)+u|e<<u|a,Kl=n+t}else Vl=1<<n|e<<u|a,Kl=t}function wi(t){t.return!==null&&(ae(t,1),Ns(t,1,0))}function Wi(t){for(;t===gn;)gn=ja[--Ha],ja[Ha]=null,Su=ja[--Ha],ja[Ha]=null;for(;t===xe;)xe=Dl[--Cl],Dl[Cl]=null,Kl=Dl[--Cl],Dl[Cl]=null,Vl=Dl[--Cl],Dl[Cl]=null}function Ms(t,l){Dl[Cl++]=Vl,Dl[Cl++]=Kl,Dl[Cl++]=xe,Vl=l.id,Kl=l.overflow,xe=t}var Jt=null,xt=null,tt=!1,Ae=null,Ul=!1,ki=Error(r(519));function ze(t){var l=Error(r(418,1<arguments.length&&arguments[1]!==void 0&&arguments[1]?"text":"HTML",""));throw bu(Ml(l,t)),ki}function Ds(t){var l=t.stateNode,e=t.type,a=t.memoizedProps;switch(l[mt]=t,l[Et]=a,e){case"dialog":F("cancel",l),F("close",l);break;case"iframe":case"object":case"embed":F("load",l);break;case"video":case"audio":for(e=0;e<Xu.length;e++)F(Xu[e],l);break;case"source":F("error",l);break;case"img":case"image":case"link":F("error",l),F("load",l);break;case"details":F("toggle",l);break;case"input":F("invalid",l),Lf(l,a.value,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name,!0);break;case"select":F("invalid",l);break;case"textarea":F("invalid",l),Kf(l,a.value,a.defaultValue,a.children)}e=a.children,typeof e!="string"&&typeof e!="number"&&typeof e!="bigint"||l.textContent===""+e||a.suppressHydrationWarning===!0||Wd(l.textContent,e)?(a.popover!=null&&(F("beforetoggle",l),F("toggle",l)),a.onScroll!=null&&F("scroll",l),a.onScrollEnd!=null&&F("scrollend",l),a.onClick!=null&&(l.onclick=te),l=!0):l=!1,l||ze(t,!0)}function Cs(t){for(Jt=t.return;Jt;)switch(Jt.tag){case 5:case 31:case 13:Ul=!1;return;case 27:case 3:Ul=!0;return;default:Jt=Jt.return}}function Ba(t){if(t!==Jt)return!1;if(!tt)return Cs(t),tt=!0,!1;var l=t.tag,e;if((e=l!==3&&l!==27)&&((e=l===5)&&(e=t.type,e=!(e!=="form"&&e!=="button")||vf(t.type,t.memoizedProps)),e=!e),e&&xt&&ze(t),Cs(t),l===13){if(t=t.memoizedState,t=t!==null?t.dehydrated:null,!t)throw Error(r(317));xt=ar(t)}else if(l===31){if(t=t.memoizedState,t=t!==null?t.dehydrated:null,!t)throw Error(r(317));xt=ar(t)}else l===27?(l=xt,Ye(t.type)?(t=bf,bf=null,xt=t):xt=l):xt=Jt?jl(t.stateNode.nextSibling):null;return!0}function ua(){xt=Jt=null,tt=!1}function $i(){var t=Ae;return t!==null&&(rl===null?rl=t:rl.push.apply(rl,t),Ae=null),t}function bu(t){Ae===null?Ae=[t]:Ae.push(t)}var Fi=o(null),na=null,ue=null;function Te(t,l,e){O(Fi,l._currentValue),l._currentValue=e}function ne(t){t._currentValue=Fi.current,x(Fi)}function Ii(t,l,e){for(;t!==null;){var a=t.alternate;if((t.childLanes&l)!==l?(t.childLanes|=l,a!==null&&(a.childLanes|=l)):a!==null&&(a.childLanes&l)!==l&&(a.childLanes|=l),t===e)break;t=t.return}}function Pi(t,l,e,a){var u=t.child;for(u!==null&&(u.return=t);u!==null;){var n=u.dependencies;if(n!==null){var i=u.child;n=n.firstContext;t:for(;n!==null;){var c=n;n=u;for(var f=0;f<l.length;f++)if(c.context===l[f]){n.lanes|=e,c=n.alternate,c!==null&&(c.lanes|=e),Ii(n.return,e,t),a||(i=null);break t}n=c.next}}else if(u.tag===18){if(i=u.return,i===null)throw Error(r(341));i.lanes|=e,n=i.alternate,n!==null&&(n.lanes|=e),Ii(i,e,t),i=null}else i=u.child;if(i!==null)i.return=u;else for(i=u;i!==null;){if(i===t){i=null;break}if(u=i.sibling,u!==null){u.return=i.return,i=u;break}i=i.return}u=i}}function qa(t,l,e,a){t=null;for(var u=l,n=!1;u!==null;){if(!n){if((u.flags&524288)!==0)n=!0;else if((u.flags&262144)!==0)break}if(u.tag===10){var i=u.alternate;if(i===null)throw Error(r(387));if(i=i.memoizedProps,i!==null){var c=u.type;hl(u.pendingProps.value,i.value)||(t!==null?t.push(c):t=[c])}}else if(u===at.current){if(i=u.alternate,i===null)throw Error(r(387));i.memoizedState.memoizedState!==u.memoizedState.memoizedState&&(t!==null?t.push(Ju):t=[Ju])}u=u.return}t!==null&&Pi(l,t,e,a),l.flags|=262144}function Sn(t){for(t=t.firstContext;t!==null;){if(!hl(t.context._currentValue,t.memoizedValue))return!0;t=t.next}return!1}function ia(t){na=t,ue=null,t=t.dependencies,t!==null&&(t.firstContext=null)}function wt(t){return Us(na,t)}function bn(t,l){return na===null&&ia(t),Us(t,l)}function Us(t,l){var e=l._currentValue;if(l={context:l,memoizedValue:e,next:null},ue===null){if(t===null)throw Error(r(308));ue=l,t.dependencies={lanes:0,firstContext:l},t.flags|=524288}else ue=ue.next=l;return e}var H0=typeof AbortController<"u"?AbortController:function(){var t=[],l=this.signal={aborted:!1,addEventListener:function(e,a){t.push(a)}};this.abort=function(){l.aborted=!0,t.forEach(function(e){return e()})}},B0=T.unstable_scheduleCallback,q0=T.unstable_NormalPriority,jt={$$typeof:Yt,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function tc(){return{controller:new H0,data:new Map,refCount:0}}function pu(t){t.refCount--,t.refCount===0&&B0(q0,function(){t.controller.abort()})}var Eu=null,lc=0,Ya=0,Ga=null;function Y0(t,l){if(Eu===null){var e=Eu=[];lc=0,Ya=uf(),Ga={status:"pending",value:void 0,then:function(a){e.push(a)}}}return lc++,l.then(Rs,Rs),l}function Rs(){if(--lc===0&&Eu!==null){Ga!==null&&(Ga.status="fulfilled");var t=Eu;Eu=null,Ya=0,Ga=null;for(var l=0;l<t.length;l++)(0,t[l])()}}function G0(t,l){var e=[],a={status:"pending",value:null,reason:null,then:function(u){e.push(u)}};return t.then(function(){a.status="fulfilled",a.value=l;for(var u=0;u<e.length;u++)(0,e[u])(l)},function(u){for(a.status="rejected",a.reason=u,u=0;u<e.length;u++)(0,e[u])(void 0)}),a}var js=g.S;g.S=function(t,l){Sd=zt(),typeof l=="object"&&l!==null&&typeof l.then=="function"&&Y0(t,l),js!==null&&js(t,l)};var ca=o(null);function ec(){var t=ca.current;return t!==null?t:pt.pooledCache}function pn(t,l){l===null?O(ca,ca.current):O(ca,l.pool)}function Hs(){var t=ec();return t===null?null:{parent:jt._currentValue,pool:t}}var Qa=Error(r(460)),ac=Error(r(474)),En=Error(r(542)),xn={then:function(){}};function Bs(t){return t=t.status,t==="fulfilled"||t==="rejected"}function qs(t,l,e){switch(e=t[e],e===void 0?t.push(l):e!==l&&(l.then(te,te),l=e),l.status){case"fulfilled":return l.value;case"rejected":throw t=l.reason,Gs(t),t;default:if(typeof l.status=="string")l.then(te,te);else{if(t=pt,t!==null&&100<t.shellSuspendCounter)throw Error(r(482));t=l,t.status="pending",t.then(function(a){if(l.status==="pending"){var u=l;u.status="fulfilled",u.value=a}},function(a){if(l.status==="pending"){var u=l;u.status="rejected",u.reason=a}})}switch(l.status){case"fulfilled":return l.value;case"rejected":throw t=l.reason,Gs(t),t}throw sa=l,Qa}}function fa(t){try{var l=t._init;return l(t._payload)}catch(e){throw e!==null&&typeof e=="object"&&typeof e.then=="function"?(sa=e,Qa):e}}var sa=null;function Ys(){if(sa===null)throw Error(r(459));var t=sa;return sa=null,t}function Gs(t){if(t===Qa||t===En)throw Error(r(483))}var Xa=null,xu=0;function An(t){var l=xu;return xu+=1,Xa===null&&(Xa=[]),qs(Xa,t,l)}function Au(t,l){l=l.props.ref,t.ref=l!==void 0?l:null}function zn(t,l){throw l.$$typeof===ct?Error(r(525)):(t=Object.prototype.toString.call(l),Error(r(31,t==="[object Object]"?"object with keys {"+Object.keys(l).join(", ")+"}":t)))}function Qs(t){function l(d,s){if(t){var m=d.deletions;m===null?(d.deletions=[s],d.flags|=16):m.push(s)}}function e(d,s){if(!t)return null;for(;s!==null;)l(d,s),s=s.sibling;return null}function a(d){for(var s=new Map;d!==null;)d.key!==null?s.set(d.key,d):s.set(d.index,d),d=d.sibling;return s}function u(d,s){return d=ee(d,s),d.index=0,d.sibling=null,d}function n(d,s,m){return d.index=m,t?(m=d.alternate,m!==null?(m=m.index,m<s?(d.flags|=67108866,s):m):(d.flags|=67108866,s)):(d.flags|=1048576,s)}function i(d){return t&&d.alternate===null&&(d.flags|=67108866),d}function c(d,s,m,p){return s===null||s.tag!==6?(s=Ki(m,d.mode,p),s.return=d,s):(s=u(s,m),s.return=d,s)}function f(d,s,m,p){var B=m.type;return B===Vt?S(d,s,m.props.children,p,m.key):s!==null&&(s.elementType===B||typeof B=="object"&&B!==null&&B.$$typeof===Ft&&fa(B)===s.type)?(s=u(s,m.props),Au(s,m),s.return=d,s):(s=hn(m.type,m.key,m.props,null,d.mode,p),Au(s,m),s.return=d,s)}function v(d,s,m,p){return s===null||s.tag!==4||s.stateNode.containerInfo!==m.containerInfo||s.stateNode.implementation!==m.implementation?(s=Ji(m,d.mode,p),s.return=d,s):(s=u(s,m.children||[]),s.return=d,s)}function S(d,s,m,p,B){return s===null||s.tag!==7?(s=aa(m,d.mode,p,B),s.return=d,s):(s=u(s,m),s.return=d,s)}function E(d,s,m){if(typeof s=="string"&&s!==""||typeof s=="number"||typeof s=="bigint")return s=Ki(""+s,d.mode,m),s.return=d,s;if(typeof s=="object"&&s!==null){switch(s.$$typeof){case Qt:return m=hn(s.type,s.key,s.props,null,d.mode,m),Au(m,s),m.return=d,m;case $t:return s=Ji(s,d.mode,m),s.return=d,s;case Ft:return s=fa(s),E(d,s,m)}if(tl(s)||Nt(s))return s=aa(s,d.mode,m,null),s.return=d,s;if(typeof s.then=="function")return E(d,An(s),m);if(s.$$typeof===Yt)return E(d,bn(d,s),m);zn(d,s)}return null}function y(d,s,m,p){var B=s!==null?s.key:null;if(typeof m=="string"&&m!==""||typeof m=="number"||typeof m=="bigint")return B!==null?null:c(d,s,""+m,p);if(typeof m=="object"&&m!==null){switch(m.$$typeof){case Qt:return m.key===B?f(d,s,m,p):null;case $t:return m.key===B?v(d,s,m,p):null;case Ft:return m=fa(m),y(d,s,m,p)}if(tl(m)||Nt(m))return B!==null?null:S(d,s,m,p,null);if(typeof m.then=="function")return y(d,s,An(m),p);if(m.$$typeof===Yt)return y(d,s,bn(d,m),p);zn(d,m)}return null}function h(d,s,m,p,B){if(typeof p=="string"&&p!==""||typeof p=="number"||typeof p=="bigint")return d=d.get(m)||null,c(s,d,""+p,B);if(typeof p=="object"&&p!==null){switch(p.$$typeof){case Qt:return d=d.get(p.key===null?m:p.key)||null,f(s,d,p,B);case $t:return d=d.get(p.key===null?m:p.key)||null,v(s,d,p,B);case Ft:return p=fa(p),h(d,s,m,p,B)}if(tl(p)||Nt(p))return d=d.get(m)||null,S(s,d,p,B,null);if(typeof p.then=="function")return h(d,s,m,An(p),B);if(p.$$typeof===Yt)return h(d,s,m,bn(s,p),B);zn(s,p)}return null}function M(d,s,m,p){for(var B=null,nt=null,C=s,w=s=0,P=null;C!==null&&w<m.length;w++){C.index>w?(P=C,C=null):P=C.sibling;var it=y(d,C,m[w],p);if(it===null){C===null&&(C=P);break}t&&C&&it.alternate===null&&l(d,C),s=n(it,s,w),nt===null?B=it:nt.sibling=it,nt=it,C=P}if(w===m.length)return e(d,C),tt&&ae(d,w),B;if(C===null){for(;w<m.length;w++)C=E(d,m[w],p),C!==null&&(s=n(C,s,w),nt===null?B=C:nt.sibling=C,nt=C);return tt&&ae(d,w),B}for(C=a(C);w<m.length;w++)P=h(C,d,w,m[w],p),P!==null&&(t&&P.alternate!==null&&C.delete(P.key===null?w:P.key),s=n(P,s,w),nt===null?B=P:nt.sibling=P,nt=P);return t&&C.forEach(function(Le){return l(d,Le)}),tt&&ae(d,w),B}function G(d,s,m,p){if(m==null)throw Error(r(151));for(var B=null,nt=null,C=s,w=s=0,P=null,it=m.next();C!==null&&!it.done;w++,it=m.next()){C.index>w?(P=C,C=null):P=C.sibling;var Le=y(d,C,it.value,p);if(Le===null){C===null&&(C=P);break}t&&C&&Le.alternate===null&&l(d,C),s=n(Le,s,w),nt===null?B=Le:nt.sibling=Le,nt=Le,C=P}if(it.done)return e(d,C),tt&&ae(d,w),B;if(C===null){for(;!it.done;w++,it=m.next())it=E(d,it.value,p),it!==null&&(s=n(it,s,w),nt===null?B=it:nt.sibling=it,nt=it);return tt&&ae(d,w),B}for(C=a(C);!it.done;w++,it=m.next())it=h(C,d,w,it.value,p),it!==null&&(t&&it.alternate!==null&&C.delete(it.key===null?w:it.key),s=n(it,s,w),nt===null?B=it:nt.sibling=it,nt=it);return t&&C.forEach(function($m){return l(d,$m)}),tt&&ae(d,w),B}function ht(d,s,m,p){if(typeof m=="object"&&m!==null&&m.type===Vt&&m.key===null&&(m=m.props.children),typeof m=="object"&&m!==null){switch(m.$$typeof){case Qt:t:{for(var B=m.key;s!==null;){if(s.key===B){if(B=m.type,B===Vt){if(s.tag===7){e(d,s.sibling),p=u(s,m.props.children),p.return=d,d=p;break t}}else if(s.elementType===B||typeof B=="object"&&B!==null&&B.$$typeof===Ft&&fa(B)===s.type){e(d,s.sibling),p=u(s,m.props),Au(p,m),p.return=d,d=p;break t}e(d,s);break}else l(d,s);s=s.sibling}m.type===Vt?(p=aa(m.props.children,d.mode,p,m.key),p.return=d,d=p):(p=hn(m.type,m.key,m.props,null,d.mode,p),Au(p,m),p.return=d,d=p)}return i(d);case $t:t:{for(B=m.key;s!==null;){if(s.key===B)if(s.tag===4&&s.stateNode.containerInfo===m.containerInfo&&s.stateNode.implementation===m.implementation){e(d,s.sibling),p=u(s,m.children||[]),p.return=d,d=p;break t}else{e(d,s);break}else l(d,s);s=s.sibling}p=Ji(m,d.mode,p),p.return=d,d=p}return i(d);case Ft:return m=fa(m),ht(d,s,m,p)}if(tl(m))return M(d,s,m,p);if(Nt(m)){if(B=Nt(m),typeof B!="function")throw Error(r(150));return m=B.call(m),G(d,s,m,p)}if(typeof m.then=="function")return ht(d,s,An(m),p);if(m.$$typeof===Yt)return ht(d,s,bn(d,m),p);zn(d,m)}return typeof m=="string"&&m!==""||typeof m=="number"||typeof m=="bigint"?(m=""+m,s!==null&&s.tag===6?(e(d,s.sibling),p=u(s,m),p.return=d,d=p):(e(d,s),p=Ki(m,d.mode,p),p.return=d,d=p),i(d)):e(d,s)}return function(d,s,m,p){try{xu=0;var B=ht(d,s,m,p);return Xa=null,B}catch(C){if(C===Qa||C===En)throw C;var nt=gl(29,C,null,d.mode);return nt.lanes=p,nt.return=d,nt}finally{}}}var oa=Qs(!0),Xs=Qs(!1),_e=!1;function uc(t){t.updateQueue={baseState:t.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function nc(t,l){t=t.updateQueue,l.updateQueue===t&&(l.updateQueue={baseState:t.baseState,firstBaseUpdate:t.firstBaseUpdate,lastBaseUpdate:t.lastBaseUpdate,shared:t.shared,callbacks:null})}function Oe(t){return{lane:t,tag:0,payload:null,callback:null,next:null}}function Ne(t,l,e){var a=t.updateQueue;if(a===null)return null;if(a=a.shared,(ft&2)!==0){var u=a.pending;return u===null?l.next=l:(l.next=u.next,u.next=l),a.pending=l,l=yn(t),zs(t,null,e),l}return vn(t,a,l,e),yn(t)}function zu(t,l,e){if(l=l.updateQueue,l!==null&&(l=l.shared,(e&4194048)!==0)){var a=l.lanes;a&=t.pendingLanes,e|=a,l.lanes=e,Y(t,e)}}function ic(t,l){var e=t.updateQueue,a=t.alternate;if(a!==null&&(a=a.updateQueue,e===a)){var u=null,n=null;if(e=e.firstBaseUpdate,e!==null){do{var i={lane:e.lane,tag:e.tag,payload:e.payload,callback:null,next:null};n===null?u=n=i:n=n.next=i,e=e.next}while(e!==null);n===null?u=n=l:n=n.next=l}else u=n=l;e={baseState:a.baseState,firstBaseUpdate:u,lastBaseUpdate:n,shared:a.shared,callbacks:a.callbacks},t.updateQueue=e;return}t=e.lastBaseUpdate,t===null?e.firstBaseUpdate=l:t.next=l,e.lastBaseUpdate=l}var cc=!1;function Tu(){if(cc){var t=Ga;if(t!==null)throw t}}function _u(t,l,e,a){cc=!1;var u=t.updateQueue;_e=!1;var n=u.firstBaseUpdate,i=u.lastBaseUpdate,c=u.shared.pending;if(c!==null){u.shared.pending=null;var f=c,v=f.next;f.next=null,i===null?n=v:i.next=v,i=f;var S=t.alternate;S!==null&&(S=S.updateQueue,c=S.lastBaseUpdate,c!==i&&(c===null?S.firstBaseUpdate=v:c.next=v,S.lastBaseUpdate=f))}if(n!==null){var E=u.baseState;i=0,S=v=f=null,c=n;do{var y=c.lane&-536870913,h=y!==c.lane;if(h?(I&y)===y:(a&y)===y){y!==0&&y===Ya&&(cc=!0),S!==null&&(S=S.next={lane:0,tag:c.tag,payload:c.payload,callback:null,next:null});t:{var M=t,G=c;y=l;var ht=e;switch(G.tag){case 1:if(M=G.payload,typeof M=="function"){E=M.call(ht,E,y);break t}E=M;break t;case 3:M.flags=M.flags&-65537|128;case 0:if(M=G.payload,y=typeof M=="function"?M.call(ht,E,y):M,y==null)break t;E=H({},E,y);break t;case 2:_e=!0}}y=c.callback,y!==null&&(t.flags|=64,h&&(t.flags|=8192),h=u.callbacks,h===null?u.callbacks=[y]:h.push(y))}else h={lane:y,tag:c.tag,payload:c.payload,callback:c.callback,next:null},S===null?(v=S=h,f=E):S=S.next=h,i|=y;if(c=c.next,c===null){if(c=u.shared.pending,c===null)break;h=c,c=h.next,h.next=null,u.lastBaseUpdate=h,u.shared.pending=null}}while(!0);S===null&&(f=E),u.baseState=f,u.firstBaseUpdate=v,u.lastBaseUpdate=S,n===null&&(u.shared.lanes=0),Re|=i,t.lanes=i,t.memoizedState=E}}function Zs(t,l){if(typeof t!="function")throw Error(r(191,t));t.call(l)}function Ls(t,l){var e=t.callbacks;if(e!==null)for(t.callbacks=null,t=0;t<e.length;t++)Zs(e[t],l)}var Za=o(null),Tn=o(0);function Vs(t,l){t=ve,O(Tn,t),O(Za,l),ve=t|l.baseLanes}function fc(){O(Tn,ve),O(Za,Za.current)}function sc(){ve=Tn.current,x(Za),x(Tn)}var Sl=o(null),Rl=null;function Me(t){var l=t.alternate;O(Ut,Ut.current&1),O(Sl,t),Rl===null&&(l===null||Za.current!==null||l.memoizedState!==null)&&(Rl=t)}function oc(t){O(Ut,Ut.current),O(Sl,t),Rl===null&&(Rl=t)}function Ks(t){t.tag===22?(O(Ut,Ut.current),O(Sl,t),Rl===null&&(Rl=t)):De()}function De(){O(Ut,Ut.current),O(Sl,Sl.current)}function bl(t){x(Sl),Rl===t&&(Rl=null),x(Ut)}var Ut=o(0);function _n(t){for(var l=t;l!==null;){if(l.tag===13){var e=l.memoizedState;if(e!==null&&(e=e.dehydrated,e===null||gf(e)||Sf(e)))return l}else if(l.tag===19&&(l.memoizedProps.revealOrder==="forwards"||l.memoizedProps.revealOrder==="backwards"||l.memoizedProps.revealOrder==="unstable_legacy-backwards"||l.memoizedProps.revealOrder==="together")){if((l.flags&128)!==0)return l}else if(l.child!==null){l.child.return=l,l=l.child;continue}if(l===t)break;for(;l.sibling===null;){if(l.return===null||l.return===t)return null;l=l.return}l.sibling.return=l.return,l=l.sibling}return null}var ie=0,K=null,vt=null,Ht=null,On=!1,La=!1,da=!1,Nn=0,Ou=0,Va=null,Q0=0;function Dt(){throw Error(r(321))}function dc(t,l){if(l===null)return!1;for(var e=0;e<l.length&&e<t.length;e++)if(!hl(t[e],l[e]))return!1;return!0}function rc(t,l,e,a,u,n){return ie=n,K=l,l.memoizedState=null,l.updateQueue=null,l.lanes=0,g.H=t===null||t.memoizedState===null?Mo:Oc,da=!1,n=e(a,u),da=!1,La&&(n=ws(l,e,a,u)),Js(t),n}function Js(t){g.H=Du;var l=vt!==null&&vt.next!==null;if(ie=0,Ht=vt=K=null,On=!1,Ou=0,Va=null,l)throw Error(r(300));t===null||Bt||(t=t.dependencies,t!==null&&Sn(t)&&(Bt=!0))}function ws(t,l,e,a){K=t;var u=0;do{if(La&&(Va=null),Ou=0,La=!1,25<=u)throw Error(r(301));if(u+=1,Ht=vt=null,t.updateQueue!=null){var n=t.updateQueue;n.lastEffect=null,n.events=null,n.stores=null,n.memoCache!=null&&(n.memoCache.index=0)}g.H=Do,n=l(e,a)}while(La);return n}function X0(){var t=g.H,l=t.useState()[0];return l=typeof l.then=="function"?Nu(l):l,t=t.useState()[0],(vt!==null?vt.memoizedState:null)!==t&&(K.flags|=1024),l}function mc(){var t=Nn!==0;return Nn=0,t}function vc(t,l,e){l.updateQueue=t.updateQueue,l.flags&=-2053,t.lanes&=~e}function yc(t){if(On){for(t=t.memoizedState;t!==null;){var l=t.queue;l!==null&&(l.pending=null),t=t.next}On=!1}ie=0,Ht=vt=K=null,La=!1,Ou=Nn=0,Va=null}function ul(){var t={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return Ht===null?K.memoizedState=Ht=t:Ht=Ht.next=t,Ht}function Rt(){if(vt===null){var t=K.alternate;t=t!==null?t.memoizedState:null}else t=vt.next;var l=Ht===null?K.memoizedState:Ht.next;if(l!==null)Ht=l,vt=t;else{if(t===null)throw K.alternate===null?Error(r(467)):Error(r(310));vt=t,t={memoizedState:vt.memoizedState,baseState:vt.baseState,baseQueue:vt.baseQueue,queue:vt.queue,next:null},Ht===null?K.memoizedState=Ht=t:Ht=Ht.next=t}return Ht}function Mn(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function Nu(t){var l=Ou;return Ou+=1,Va===null&&(Va=[]),t=qs(Va,t,l),l=K,(Ht===null?l.memoizedState:Ht.next)===null&&(l=l.alternate,g.H=l===null||l.memoizedState===null?Mo:Oc),t}function Dn(t){if(t!==null&&typeof t=="object"){if(typeof t.then=="function")return Nu(t);if(t.$$typeof===Yt)return wt(t)}throw Error(r(438,String(t)))}function hc(t){var l=null,e=K.updateQueue;if(e!==null&&(l=e.memoCache),l==null){var a=K.alternate;a!==null&&(a=a.updateQueue,a!==null&&(a=a.memoCache,a!=null&&(l={data:a.data.map(function(u){return u.slice()}),index:0})))}if(l==null&&(l={data:[],index:0}),e===null&&(e=Mn(),K.updateQueue=e),e.memoCache=l,e=l.data[l.index],e===void 0)for(e=l.data[l.index]=Array(t),a=0;a<t;a++)e[a]=Wl;return l.index++,e}function ce(t,l){return typeof l=="function"?l(t):l}function Cn(t){var l=Rt();return gc(l,vt,t)}function gc(t,l,e){var a=t.queue;if(a===null)throw Error(r(311));a.lastRenderedReducer=e;var u=t.baseQueue,n=a.pending;if(n!==null){if(u!==null){var i=u.next;u.next=n.next,n.next=i}l.baseQueue=u=n,a.pending=null}if(n=t.baseState,u===null)t.memoizedState=n;else{l=u.next;var c=i=null,f=null,v=l,S=!1;do{var E=v.lane&-536870913;if(E!==v.lane?(I&E)===E:(ie&E)===E){var y=v.revertLane;if(y===0)f!==null&&(f=f.next={lane:0,revertLane:0,gesture:null,action:v.action,hasEagerState:v.hasEagerState,eagerState:v.eagerState,next:null}),E===Ya&&(S=!0);else if((ie&y)===y){v=v.next,y===Ya&&(S=!0);continue}else E={lane:0,revertLane:v.revertLane,gesture:null,action:v.action,hasEagerState:v.hasEagerState,eagerState:v.eagerState,next:null},f===null?(c=f=E,i=n):f=f.next=E,K.lanes|=y,Re|=y;E=v.action,da&&e(n,E),n=v.hasEagerState?v.eagerState:e(n,E)}else y={lane:E,revertLane:v.revertLane,gesture:v.gesture,action:v.action,hasEagerState:v.hasEagerState,eagerState:v.eagerState,next:null},f===null?(c=f=y,i=n):f=f.next=y,K.lanes|=E,Re|=E;v=v.next}while(v!==null&&v!==l);if(f===null?i=n:f.next=c,!hl(n,t.memoizedState)&&(Bt=!0,S&&(e=Ga,e!==null)))throw e;t.memoizedState=n,t.baseState=i,t.baseQueue=f,a.lastRenderedState=n}return u===null&&(a.lanes=0),[t.memoizedState,a.dispatch]}function Sc(t){var l=Rt(),e=l.queue;if(e===null)throw Error(r(311));e.lastRenderedReducer=t;var a=e.dispatch,u=e.pending,n=l.memoizedState;if(u!==null){e.pending=null;var i=u=u.next;do n=t(n,i.action),i=i.next;while(i!==u);hl(n,l.memoizedState)||(Bt=!0),l.memoizedState=n,l.baseQueue===null&&(l.baseState=n),e.lastRenderedState=n}return[n,a]}function Ws(t,l,e){var a=K,u=Rt(),n=tt;if(n){if(e===void 0)throw Error(r(407));e=e()}else e=l();var i=!hl((vt||u).memoizedState,e);if(i&&(u.memoizedState=e,Bt=!0),u=u.queue,Ec(Fs.bind(null,a,u,t),[t]),u.getSnapshot!==l||i||Ht!==null&&Ht.memoizedState.tag&1){if(a.flags|=2048,Ka(9,{destroy:void 0},$s.bind(null,a,u,e,l),null),pt===null)throw Error(r(349));n||(ie&127)!==0||ks(a,l,e)}return e}function ks(t,l,e){t.flags|=16384,t={getSnapshot:l,value:e},l=K.updateQueue,l===null?(l=Mn(),K.updateQueue=l,l.stores=[t]):(e=l.stores,e===null?l.stores=[t]:e.push(t))}function $s(t,l,e,a){l.value=e,l.getSnapshot=a,Is(l)&&Ps(t)}function Fs(t,l,e){return e(function(){Is(l)&&Ps(t)})}function Is(t){var l=t.getSnapshot;t=t.value;try{var e=l();return!hl(t,e)}catch{return!0}}function Ps(t){var l=ea(t,2);l!==null&&ml(l,t,2)}function bc(t){var l=ul();if(typeof t=="function"){var e=t;if(t=e(),da){Zl(!0);try{e()}finally{Zl(!1)}}}return l.memoizedState=l.baseState=t,l.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:ce,lastRenderedState:t},l}function to(t,l,e,a){return t.baseState=e,gc(t,vt,typeof a=="function"?a:ce)}function Z0(t,l,e,a,u){if(jn(t))throw Error(r(485));if(t=l.action,t!==null){var n={payload:u,action:t,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(i){n.listeners.push(i)}};g.T!==null?e(!0):n.isTransition=!1,a(n),e=l.pending,e===null?(n.next=l.pending=n,lo(l,n)):(n.next=e.next,l.pending=e.next=n)}}function lo(t,l){var e=l.action,a=l.payload,u=t.state;if(l.isTransition){var n=g.T,i={};g.T=i;try{var c=e(u,a),f=g.S;f!==null&&f(i,c),eo(t,l,c)}catch(v){pc(t,l,v)}finally{n!==null&&i.types!==null&&(n.types=i.types),g.T=n}}else try{n=e(u,a),eo(t,l,n)}catch(v){pc(t,l,v)}}function eo(t,l,e){e!==null&&typeof e=="object"&&typeof e.then=="function"?e.then(function(a){ao(t,l,a)},function(a){return pc(t,l,a)}):ao(t,l,e)}function ao(t,l,e){l.status="fulfilled",l.value=e,uo(l),t.state=e,l=t.pending,l!==null&&(e=l.next,e===l?t.pending=null:(e=e.next,l.next=e,lo(t,e)))}function pc(t,l,e){var a=t.pending;if(t.pending=null,a!==null){a=a.next;do l.status="rejected",l.reason=e,uo(l),l=l.next;while(l!==a)}t.action=null}function uo(t){t=t.listeners;for(var l=0;l<t.length;l++)(0,t[l])()}function no(t,l){return l}function io(t,l){if(tt){var e=pt.formState;if(e!==null){t:{var a=K;if(tt){if(xt){l:{for(var u=xt,n=Ul;u.nodeType!==8;){if(!n){u=null;break l}if(u=jl(u.nextSibling),u===null){u=null;break l}}n=u.data,u=n==="F!"||n==="F"?u:null}if(u){xt=jl(u.nextSibling),a=u.data==="F!";break t}}ze(a)}a=!1}a&&(l=e[0])}}return e=ul(),e.memoizedState=e.baseState=l,a={pending:null,lanes:0,dispatch:null,lastRenderedReducer:no,lastRenderedState:l},e.queue=a,e=_o.bind(null,K,a),a.dispatch=e,a=bc(!1),n=_c.bind(null,K,!1,a.queue),a=ul(),u={state:l,dispatch:null,action:t,pending:null},a.queue=u,e=Z0.bind(null,K,u,n,e),u.dispatch=e,a.memoizedState=t,[l,e,!1]}function co(t){var l=Rt();return fo(l,vt,t)}function fo(t,l,e){if(l=gc(t,l,no)[0],t=Cn(ce)[0],typeof l=="object"&&l!==null&&typeof l.then=="function")try{var a=Nu(l)}catch(i){throw i===Qa?En:i}else a=l;l=Rt();var u=l.queue,n=u.dispatch;return e!==l.memoizedState&&(K.flags|=2048,Ka(9,{destroy:void 0},L0.bind(null,u,e),null)),[a,n,t]}function L0(t,l){t.action=l}function so(t){var l=Rt(),e=vt;if(e!==null)return fo(l,e,t);Rt(),l=l.memoizedState,e=Rt();var a=e.queue.dispatch;return e.memoizedState=t,[l,a,!1]}function Ka(t,l,e,a){return t={tag:t,create:e,deps:a,inst:l,next:null},l=K.updateQueue,l===null&&(l=Mn(),K.updateQueue=l),e=l.lastEffect,e===null?l.lastEffect=t.next=t:(a=e.next,e.next=t,t.next=a,l.lastEffect=t),t}function oo(){return Rt().memoizedState}function Un(t,l,e,a){var u=ul();K.flags|=t,u.memoizedState=Ka(1|l,{destroy:void 0},e,a===void 0?null:a)}function Rn(t,l,e,a){var u=Rt();a=a===void 0?null:a;var n=u.memoizedState.inst;vt!==null&&a!==null&&dc(a,vt.memoizedState.deps)?u.memoizedState=Ka(l,n,e,a):(K.flags|=t,u.memoizedState=Ka(1|l,n,e,a))}function ro(t,l){Un(8390656,8,t,l)}function Ec(t,l){Rn(2048,8,t,l)}function V0(t){K.flags|=4;var l=K.updateQueue;if(l===null)l=Mn(),K.updateQueue=l,l.events=[t];else{var e=l.events;e===null?l.events=[t]:e.push(t)}}function mo(t){var l=Rt().memoizedState;return V0({ref:l,nextImpl:t}),function(){if((ft&2)!==0)throw Error(r(440));return l.impl.apply(void 0,arguments)}}function vo(t,l){return Rn(4,2,t,l)}function yo(t,l){return Rn(4,4,t,l)}function ho(t,l){if(typeof l=="function"){t=t();var e=l(t);return function(){typeof e=="function"?e():l(null)}}if(l!=null)return t=t(),l.current=t,function(){l.current=null}}function go(t,l,e){e=e!=null?e.concat([t]):null,Rn(4,4,ho.bind(null,l,t),e)}function xc(){}function So(t,l){var e=Rt();l=l===void 0?null:l;var a=e.memoizedState;return l!==null&&dc(l,a[1])?a[0]:(e.memoizedState=[t,l],t)}function bo(t,l){var e=Rt();l=l===void 0?null:l;var a=e.memoizedState;if(l!==null&&dc(l,a[1]))return a[0];if(a=t(),da){Zl(!0);try{t()}finally{Zl(!1)}}return e.memoizedState=[a,l],a}function Ac(t,l,e){return e===void 0||(ie&1073741824)!==0&&(I&261930)===0?t.memoizedState=l:(t.memoizedState=e,t=pd(),K.lanes|=t,Re|=t,e)}function po(t,l,e,a){return hl(e,l)?e:Za.current!==null?(t=Ac(t,e,a),hl(t,l)||(Bt=!0),t):(ie&42)===0||(ie&1073741824)!==0&&(I&261930)===0?(Bt=!0,t.memoizedState=e):(t=pd(),K.lanes|=t,Re|=t,l)}function Eo(t,l,e,a,u){var n=N.p;N.p=n!==0&&8>n?n:8;var i=g.T,c={};g.T=c,_c(t,!1,l,e);try{var f=u(),v=g.S;if(v!==null&&v(c,f),f!==null&&typeof f=="object"&&typeof f.then=="function"){var S=G0(f,a);Mu(t,l,S,xl(t))}else Mu(t,l,a,xl(t))}catch(E){Mu(t,l,{then:function(){},status:"rejected",reason:E},xl())}finally{N.p=n,i!==null&&c.types!==null&&(i.types=c.types),g.T=i}}function K0(){}function zc(t,l,e,a){if(t.tag!==5)throw Error(r(476));var u=xo(t).queue;Eo(t,u,l,q,e===null?K0:function(){return Ao(t),e(a)})}function xo(t){var l=t.memoizedState;if(l!==null)return l;l={memoizedState:q,baseState:q,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:ce,lastRenderedState:q},next:null};var e={};return l.next={memoizedState:e,baseState:e,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:ce,lastRenderedState:e},next:null},t.memoizedState=l,t=t.alternate,t!==null&&(t.memoizedState=l),l}function Ao(t){var l=xo(t);l.next===null&&(l=t.alternate.memoizedState),Mu(t,l.next.queue,{},xl())}function Tc(){return wt(Ju)}function zo(){return Rt().memoizedState}function To(){return Rt().memoizedState}function J0(t){for(var l=t.return;l!==null;){switch(l.tag){case 24:case 3:var e=xl();t=Oe(e);var a=Ne(l,t,e);a!==null&&(ml(a,l,e),zu(a,l,e)),l={cache:tc()},t.payload=l;return}l=l.return}}function w0(t,l,e){var a=xl();e={lane:a,revertLane:0,gesture:null,action:e,hasEagerState:!1,eagerState:null,next:null},jn(t)?Oo(l,e):(e=Li(t,l,e,a),e!==null&&(ml(e,t,a),No(e,l,a)))}function _o(t,l,e){var a=xl();Mu(t,l,e,a)}function Mu(t,l,e,a){var u={lane:a,revertLane:0,gesture:null,action:e,hasEagerState:!1,eagerState:null,next:null};if(jn(t))Oo(l,u);else{var n=t.alternate;if(t.lanes===0&&(n===null||n.lanes===0)&&(n=l.lastRenderedReducer,n!==null))try{var i=l.lastRenderedState,c=n(i,e);if(u.hasEagerState=!0,u.eagerState=c,hl(c,i))return vn(t,l,u,0),pt===null&&mn(),!1}catch{}finally{}if(e=Li(t,l,u,a),e!==null)return ml(e,t,a),No(e,l,a),!0}return!1}function _c(t,l,e,a){if(a={lane:2,revertLane:uf(),gesture:null,action:a,hasEagerState:!1,eagerState:null,next:null},jn(t)){if(l)throw Error(r(479))}else l=Li(t,e,a,2),l!==null&&ml(l,t,2)}function jn(t){var l=t.alternate;return t===K||l!==null&&l===K}function Oo(t,l){La=On=!0;var e=t.pending;e===null?l.next=l:(l.next=e.next,e.next=l),t.pending=l}function No(t,l,e){if((e&4194048)!==0){var a=l.lanes;a&=t.pendingLanes,e|=a,l.lanes=e,Y(t,e)}}var Du={readContext:wt,use:Dn,useCallback:Dt,useContext:Dt,useEffect:Dt,useImperativeHandle:Dt,useLayoutEffect:Dt,useInsertionEffect:Dt,useMemo:Dt,useReducer:Dt,useRef:Dt,useState:Dt,useDebugValue:Dt,useDeferredValue:Dt,useTransition:Dt,useSyncExternalStore:Dt,useId:Dt,useHostTransitionStatus:Dt,useFormState:Dt,useActionState:Dt,useOptimistic:Dt,useMemoCache:Dt,useCacheRefresh:Dt};Du.useEffectEvent=Dt;var Mo={readContext:wt,use:Dn,useCallback:function(t,l){return ul().memoizedState=[t,l===void 0?null:l],t},useContext:wt,useEffect:ro,useImperativeHandle:function(t,l,e){e=e!=null?e.concat([t]):null,Un(4194308,4,ho.bind(null,l,t),e)},useLayoutEffect:function(t,l){return Un(4194308,4,t,l)},useInsertionEffect:function(t,l){Un(4,2,t,l)},useMemo:function(t,l){var e=ul();l=l===void 0?null:l;var a=t();if(da){Zl(!0);try{t()}finally{Zl(!1)}}return e.memoizedState=[a,l],a},useReducer:function(t,l,e){var a=ul();if(e!==void 0){var u=e(l);if(da){Zl(!0);try{e(l)}finally{Zl(!1)}}}else u=l;return a.memoizedState=a.baseState=u,t={pending:null,lanes:0,dispatch:null,lastRenderedReducer:t,lastRenderedState:u},a.queue=t,t=t.dispatch=w0.bind(null,K,t),[a.memoizedState,t]},useRef:function(t){var l=ul();return t={current:t},l.memoizedState=t},useState:function(t){t=bc(t);var l=t.queue,e=_o.bind(null,K,l);return l.dispatch=e,[t.memoizedState,e]},useDebugValue:xc,useDeferredValue:function(t,l){var e=ul();return Ac(e,t,l)},useTransition:function(){var t=bc(!1);return t=Eo.bind(null,K,t.queue,!0,!1),ul().memoizedState=t,[!1,t]},useSyncExternalStore:function(t,l,e){var a=K,u=ul();if(tt){if(e===void 0)throw Error(r(407));e=e()}else{if(e=l(),pt===null)throw Error(r(349));(I&127)!==0||ks(a,l,e)}u.memoizedState=e;var n={value:e,getSnapshot:l};return u.queue=n,ro(Fs.bind(null,a,n,t),[t]),a.flags|=2048,Ka(9,{destroy:void 0},$s.bind(null,a,n,e,l),null),e},useId:function(){var t=ul(),l=pt.identifierPrefix;if(tt){var e=Kl,a=Vl;e=(a&~(1<<32-el(a)-1)).toString(32)+e,l="_"+l+"R_"+e,e=Nn++,0<e&&(l+="H"+e.toString(32)),l+="_"}else e=Q0++,l="_"+l+"r_"+e.toString(32)+"_";return t.memoizedState=l},useHostTransitionStatus:Tc,useFormState:io,useActionState:io,useOptimistic:function(t){var l=ul();l.memoizedState=l.baseState=t;var e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return l.queue=e,l=_c.bind(null,K,!0,e),e.dispatch=l,[t,l]},useMemoCache:hc,useCacheRefresh:function(){return ul().memoizedState=J0.bind(null,K)},useEffectEvent:function(t){var l=ul(),e={impl:t};return l.memoizedState=e,function(){if((ft&2)!==0)throw Error(r(440));return e.impl.apply(void 0,arguments)}}},Oc={readContext:wt,use:Dn,useCallback:So,useContext:wt,useEffect:Ec,useImperativeHandle:go,useInsertionEffect:vo,useLayoutEffect:yo,useMemo:bo,useReducer:Cn,useRef:oo,useState:function(){return Cn(ce)},useDebugValue:xc,useDeferredValue:function(t,l){var e=Rt();return po(e,vt.memoizedState,t,l)},useTransition:function(){var t=Cn(ce)[0],l=Rt().memoizedState;return[typeof t=="boolean"?t:Nu(t),l]},useSyncExternalStore:Ws,useId:zo,useHostTransitionStatus:Tc,useFormState:co,useActionState:co,useOptimistic:function(t,l){var e=Rt();return to(e,vt,t,l)},useMemoCache:hc,useCacheRefresh:To};Oc.useEffectEvent=mo;var Do={readContext:wt,use:Dn,useCallback:So,useContext:wt,useEffect:Ec,useImperativeHandle:go,useInsertionEffect:vo,useLayoutEffect:yo,useMemo:bo,useReducer:Sc,useRef:oo,useState:function(){return Sc(ce)},useDebugValue:xc,useDeferredValue:function(t,l){var e=Rt();return vt===null?Ac(e,t,l):po(e,vt.memoizedState,t,l)},useTransition:function(){var t=Sc(ce)[0],l=Rt().memoizedState;return[typeof t=="boolean"?t:Nu(t),l]},useSyncExternalStore:Ws,useId:zo,useHostTransitionStatus:Tc,useFormState:so,useActionState:so,useOptimistic:function(t,l){var e=Rt();return vt!==null?to(e,vt,t,l):(e.baseState=t,[t,e.queue.dispatch])},useMemoCache:hc,useCacheRefresh:To};Do.useEffectEvent=mo;function Nc(t,l,e,a){l=t.memoizedState,e=e(a,l),e=e==null?l:H({},l,e),t.memoizedState=e,t.lanes===0&&(t.updateQueue.baseState=e)}var Mc={enqueueSetState:function(t,l,e){t=t._reactInternals;var a=xl(),u=Oe(a);u.payload=l,e!=null&&(u.callback=e),l=Ne(t,u,a),l!==null&&(ml(l,t,a),zu(l,t,a))},enqueueReplaceState:function(t,l,e){t=t._reactInternals;var a=xl(),u=Oe(a);u.tag=1,u.payload=l,e!=null&&(u.callback=e),l=Ne(t,u,a),l!==null&&(ml(l,t,a),zu(l,t,a))},enqueueForceUpdate:function(t,l){t=t._reactInternals;var e=xl(),a=Oe(e);a.tag=2,l!=null&&(a.callback=l),l=Ne(t,a,e),l!==null&&(ml(l,t,e),zu(l,t,e))}};function Co(t,l,e,a,u,n,i){return t=t.stateNode,typeof t.shouldComponentUpdate=="function"?t.shouldComponentUpdate(a,n,i):l.prototype&&l.prototype.isPureReactComponent?!hu(e,a)||!hu(u,n):!0}function Uo(t,l,e,a){t=l.state,typeof l.componentWillReceiveProps=="function"&&l.componentWillReceiveProps(e,a),typeof l.UNSAFE_componentWillReceiveProps=="function"&&l.UNSAFE_componentWillReceiveProps(e,a),l.state!==t&&Mc.enqueueReplaceState(l,l.state,null)}function ra(t,l){var e=l;if("ref"in l){e={};for(var a in l)a!=="ref"&&(e[a]=l[a])}if(t=t.defaultProps){e===l&&(e=H({},e));for(var u in t)e[u]===void 0&&(e[u]=t[u])}return e}function Ro(t){rn(t)}function jo(t){console.error(t)}function Ho(t){rn(t)}function Hn(t,l){try{var e=t.onUncaughtError;e(l.value,{componentStack:l.stack})}catch(a){setTimeout(function(){throw a})}}function Bo(t,l,e){try{var a=t.onCaughtError;a(e.value,{componentStack:e.stack,errorBoundary:l.tag===1?l.stateNode:null})}catch(u){setTimeout(function(){throw u})}}function Dc(t,l,e){return e=Oe(e),e.tag=3,e.payload={element:null},e.callback=function(){Hn(t,l)},e}function qo(t){return t=Oe(t),t.tag=3,t}function Yo(t,l,e,a){var u=e.type.getDerivedStateFromError;if(typeof u=="function"){var n=a.value;t.payload=function(){return u(n)},t.callback=function(){Bo(l,e,a)}}var i=e.stateNode;i!==null&&typeof i.componentDidCatch=="function"&&(t.callback=function(){Bo(l,e,a),typeof u!="function"&&(je===null?je=new Set([this]):je.add(this));var c=a.stack;this.componentDidCatch(a.value,{componentStack:c!==null?c:""})})}function W0(t,l,e,a,u){if(e.flags|=32768,a!==null&&typeof a=="object"&&typeof a.then=="function"){if(l=e.alternate,l!==null&&qa(l,e,u,!0),e=Sl.current,e!==null){switch(e.tag){case 31:case 13:return Rl===null?wn():e.alternate===null&&Ct===0&&(Ct=3),e.flags&=-257,e.flags|=65536,e.lanes=u,a===xn?e.flags|=16384:(l=e.updateQueue,l===null?e.updateQueue=new Set([a]):l.add(a),lf(t,a,u)),!1;case 22:return e.flags|=65536,a===xn?e.flags|=16384:(l=e.updateQueue,l===null?(l={transitions:null,markerInstances:null,retryQueue:new Set([a])},e.updateQueue=l):(e=l.retryQueue,e===null?l.retryQueue=new Set([a]):e.add(a)),lf(t,a,u)),!1}throw Error(r(435,e.tag))}return lf(t,a,u),wn(),!1}if(tt)return l=Sl.current,l!==null?((l.flags&65536)===0&&(l.flags|=256),l.flags|=65536,l.lanes=u,a!==ki&&(t=Error(r(422),{cause:a}),bu(Ml(t,e)))):(a!==ki&&(l=Error(r(423),{cause:a}),bu(Ml(l,e))),t=t.current.alternate,t.flags|=65536,u&=-u,t.lanes|=u,a=Ml(a,e),u=Dc(t.stateNode,a,u),ic(t,u),Ct!==4&&(Ct=2)),!1;var n=Error(r(520),{cause:a});if(n=Ml(n,e),Yu===null?Yu=[n]:Yu.push(n),Ct!==4&&(Ct=2),l===null)return!0;a=Ml(a,e),e=l;do{switch(e.tag){case 3:return e.flags|=65536,t=u&-u,e.lanes|=t,t=Dc(e.stateNode,a,t),ic(e,t),!1;case 1:if(l=e.type,n=e.stateNode,(e.flags&128)===0&&(typeof l.getDerivedStateFromError=="function"||n!==null&&typeof n.componentDidCatch=="function"&&(je===null||!je.has(n))))return e.flags|=65536,u&=-u,e.lanes|=u,u=qo(u),Yo(u,t,e,a),ic(e,u),!1}e=e.return}while(e!==null);return!1}var Cc=Error(r(461)),Bt=!1;function Wt(t,l,e,a){l.child=t===null?Xs(l,null,e,a):oa(l,t.child,e,a)}function Go(t,l,e,a,u){e=e.render;var n=l.ref;if("ref"in a){var i={};for(var c in a)c!=="ref"&&(i[c]=a[c])}else i=a;return ia(l),a=rc(t,l,e,i,n,u),c=mc(),t!==null&&!Bt?(vc(t,l,u),fe(t,l,u)):(tt&&c&&wi(l),l.flags|=1,Wt(t,l,a,u),l.child)}function Qo(t,l,e,a,u){if(t===null){var n=e.type;return typeof n=="function"&&!Vi(n)&&n.defaultProps===void 0&&e.compare===null?(l.tag=15,l.type=n,Xo(t,l,n,a,u)):(t=hn(e.type,null,a,l,l.mode,u),t.ref=l.ref,t.return=l,l.child=t)}if(n=t.child,!Gc(t,u)){var i=n.memoizedProps;if(e=e.compare,e=e!==null?e:hu,e(i,a)&&t.ref===l.ref)return fe(t,l,u)}return l.flags|=1,t=ee(n,a),t.ref=l.ref,t.return=l,l.child=t}function Xo(t,l,e,a,u){if(t!==null){var n=t.memoizedProps;if(hu(n,a)&&t.ref===l.ref)if(Bt=!1,l.pendingProps=a=n,Gc(t,u))(t.flags&131072)!==0&&(Bt=!0);else return l.lanes=t.lanes,fe(t,l,u)}return Uc(t,l,e,a,u)}function Zo(t,l,e,a){var u=a.children,n=t!==null?t.memoizedState:null;if(t===null&&l.stateNode===null&&(l.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),a.mode==="hidden"){if((l.flags&128)!==0){if(n=n!==null?n.baseLanes|e:e,t!==null){for(a=l.child=t.child,u=0;a!==null;)u=u|a.lanes|a.childLanes,a=a.sibling;a=u&~n}else a=0,l.child=null;return Lo(t,l,n,e,a)}if((e&536870912)!==0)l.memoizedState={baseLanes:0,cachePool:null},t!==null&&pn(l,n!==null?n.cachePool:null),n!==null?Vs(l,n):fc(),Ks(l);else return a=l.lanes=536870912,Lo(t,l,n!==null?n.baseLanes|e:e,e,a)}else n!==null?(pn(l,n.cachePool),Vs(l,n),De(),l.memoizedState=null):(t!==null&&pn(l,null),fc(),De());return Wt(t,l,u,e),l.child}function Cu(t,l){return t!==null&&t.tag===22||l.stateNode!==null||(l.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),l.sibling}function Lo(t,l,e,a,u){var n=ec();return n=n===null?null:{parent:jt._currentValue,pool:n},l.memoizedState={baseLanes:e,cachePool:n},t!==null&&pn(l,null),fc(),Ks(l),t!==null&&qa(t,l,a,!0),l.childLanes=u,null}function Bn(t,l){return l=Yn({mode:l.mode,children:l.children},t.mode),l.ref=t.ref,t.child=l,l.return=t,l}function Vo(t,l,e){return oa(l,t.child,null,e),t=Bn(l,l.pendingProps),t.flags|=2,bl(l),l.memoizedState=null,t}function k0(t,l,e){var a=l.pendingProps,u=(l.flags&128)!==0;if(l.flags&=-129,t===null){if(tt){if(a.mode==="hidden")return t=Bn(l,a),l.lanes=536870912,Cu(null,t);if(oc(l),(t=xt)?(t=er(t,Ul),t=t!==null&&t.data==="&"?t:null,t!==null&&(l.memoizedState={dehydrated:t,treeContext:xe!==null?{id:Vl,overflow:Kl}:null,retryLane:536870912,hydrationErrors:null},e=_s(t),e.return=l,l.child=e,Jt=l,xt=null)):t=null,t===null)throw ze(l);return l.lanes=536870912,null}return Bn(l,a)}var n=t.memoizedState;if(n!==null){var i=n.dehydrated;if(oc(l),u)if(l.flags&256)l.flags&=-257,l=Vo(t,l,e);else if(l.memoizedState!==null)l.child=t.child,l.flags|=128,l=null;else throw Error(r(558));else if(Bt||qa(t,l,e,!1),u=(e&t.childLanes)!==0,Bt||u){if(a=pt,a!==null&&(i=ut(a,e),i!==0&&i!==n.retryLane))throw n.retryLane=i,ea(t,i),ml(a,t,i),Cc;wn(),l=Vo(t,l,e)}else t=n.treeContext,xt=jl(i.nextSibling),Jt=l,tt=!0,Ae=null,Ul=!1,t!==null&&Ms(l,t),l=Bn(l,a),l.flags|=4096;return l}return t=ee(t.child,{mode:a.mode,children:a.children}),t.ref=l.ref,l.child=t,t.return=l,t}function qn(t,l){var e=l.ref;if(e===null)t!==null&&t.ref!==null&&(l.flags|=4194816);else{if(typeof e!="function"&&typeof e!="object")throw Error(r(284));(t===null||t.ref!==e)&&(l.flags|=4194816)}}function Uc(t,l,e,a,u){return ia(l),e=rc(t,l,e,a,void 0,u),a=mc(),t!==null&&!Bt?(vc(t,l,u),fe(t,l,u)):(tt&&a&&wi(l),l.flags|=1,Wt(t,l,e,u),l.child)}function Ko(t,l,e,a,u,n){return ia(l),l.updateQueue=null,e=ws(l,a,e,u),Js(t),a=mc(),t!==null&&!Bt?(vc(t,l,n),fe(t,l,n)):(tt&&a&&wi(l),l.flags|=1,Wt(t,l,e,n),l.child)}function Jo(t,l,e,a,u){if(ia(l),l.stateNode===null){var n=Ra,i=e.contextType;typeof i=="object"&&i!==null&&(n=wt(i)),n=new e(a,n),l.memoizedState=n.state!==null&&n.state!==void 0?n.state:null,n.updater=Mc,l.stateNode=n,n._reactInternals=l,n=l.stateNode,n.props=a,n.state=l.memoizedState,n.refs={},uc(l),i=e.contextType,n.context=typeof i=="object"&&i!==null?wt(i):Ra,n.state=l.memoizedState,i=e.getDerivedStateFromProps,typeof i=="function"&&(Nc(l,e,i,a),n.state=l.memoizedState),typeof e.getDerivedStateFromProps=="function"||typeof n.getSnapshotBeforeUpdate=="function"||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(i=n.state,typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount(),i!==n.state&&Mc.enqueueReplaceState(n,n.state,null),_u(l,a,n,u),Tu(),n.state=l.memoizedState),typeof n.componentDidMount=="function"&&(l.flags|=4194308),a=!0}else if(t===null){n=l.stateNode;var c=l.memoizedProps,f=ra(e,c);n.props=f;var v=n.context,S=e.contextType;i=Ra,typeof S=="object"&&S!==null&&(i=wt(S));var E=e.getDerivedStateFromProps;S=typeof E=="function"||typeof n.getSnapshotBeforeUpdate=="function",c=l.pendingProps!==c,S||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(c||v!==i)&&Uo(l,n,a,i),_e=!1;var y=l.memoizedState;n.state=y,_u(l,a,n,u),Tu(),v=l.memoizedState,c||y!==v||_e?(typeof E=="function"&&(Nc(l,e,E,a),v=l.memoizedState),(f=_e||Co(l,e,f,a,y,v,i))?(S||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount()),typeof n.componentDidMount=="function"&&(l.flags|=4194308)):(typeof n.componentDidMount=="function"&&(l.flags|=4194308),l.memoizedProps=a,l.memoizedState=v),n.props=a,n.state=v,n.context=i,a=f):(typeof n.componentDidMount=="function"&&(l.flags|=4194308),a=!1)}else{n=l.stateNode,nc(t,l),i=l.memoizedProps,S=ra(e,i),n.props=S,E=l.pendingProps,y=n.context,v=e.contextType,f=Ra,typeof v=="object"&&v!==null&&(f=wt(v)),c=e.getDerivedStateFromProps,(v=typeof c=="function"||typeof n.getSnapshotBeforeUpdate=="function")||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(i!==E||y!==f)&&Uo(l,n,a,f),_e=!1,y=l.memoizedState,n.state=y,_u(l,a,n,u),Tu();var h=l.memoizedState;i!==E||y!==h||_e||t!==null&&t.dependencies!==null&&Sn(t.dependencies)?(typeof c=="function"&&(Nc(l,e,c,a),h=l.memoizedState),(S=_e||Co(l,e,S,a,y,h,f)||t!==null&&t.dependencies!==null&&Sn(t.dependencies))?(v||typeof n.UNSAFE_componentWillUpdate!="function"&&typeof n.componentWillUpdate!="function"||(typeof n.componentWillUpdate=="function"&&n.componentWillUpdate(a,h,f),typeof n.UNSAFE_componentWillUpdate=="function"&&n.UNSAFE_componentWillUpdate(a,h,f)),typeof n.componentDidUpdate=="function"&&(l.flags|=4),typeof n.getSnapshotBeforeUpdate=="function"&&(l.flags|=1024)):(typeof n.componentDidUpdate!="function"||i===t.memoizedProps&&y===t.memoizedState||(l.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||i===t.memoizedProps&&y===t.memoizedState||(l.flags|=1024),l.memoizedProps=a,l.memoizedState=h),n.props=a,n.state=h,n.context=f,a=S):(typeof n.componentDidUpdate!="function"||i===t.memoizedProps&&y===t.memoizedState||(l.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||i===t.memoizedProps&&y===t.memoizedState||(l.flags|=1024),a=!1)}return n=a,qn(t,l),a=(l.flags&128)!==0,n||a?(n=l.stateNode,e=a&&typeof e.getDerivedStateFromError!="function"?null:n.render(),l.flags|=1,t!==null&&a?(l.child=oa(l,t.child,null,u),l.child=oa(l,null,e,u)):Wt(t,l,e,u),l.memoizedState=n.state,t=l.child):t=fe(t,l,u),t}function wo(t,l,e,a){return ua(),l.flags|=256,Wt(t,l,e,a),l.child}var Rc={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function jc(t){return{baseLanes:t,cachePool:Hs()}}function Hc(t,l,e){return t=t!==null?t.childLanes&~e:0,l&&(t|=El),t}function Wo(t,l,e){var a=l.pendingProps,u=!1,n=(l.flags&128)!==0,i;if((i=n)||(i=t!==null&&t.memoizedState===null?!1:(Ut.current&2)!==0),i&&(u=!0,l.flags&=-129),i=(l.flags&32)!==0,l.flags&=-33,t===null){if(tt){if(u?Me(l):De(),(t=xt)?(t=er(t,Ul),t=t!==null&&t.data!=="&"?t:null,t!==null&&(l.memoizedState={dehydrated:t,treeContext:xe!==null?{id:Vl,overflow:Kl}:null,retryLane:536870912,hydrationErrors:null},e=_s(t),e.return=l,l.child=e,Jt=l,xt=null)):t=null,t===null)throw ze(l);return Sf(t)?l.lanes=32:l.lanes=536870912,null}var c=a.children;return a=a.fallback,u?(De(),u=l.mode,c=Yn({mode:"hidden",children:c},u),a=aa(a,u,e,null),c.return=l,a.return=l,c.sibling=a,l.child=c,a=l.child,a.memoizedState=jc(e),a.childLanes=Hc(t,i,e),l.memoizedState=Rc,Cu(null,a)):(Me(l),Bc(l,c))}var f=t.memoizedState;if(f!==null&&(c=f.dehydrated,c!==null)){if(n)l.flags&256?(Me(l),l.flags&=-257,l=qc(t,l,e)):l.memoizedState!==null?(De(),l.child=t.child,l.flags|=128,l=null):(De(),c=a.fallback,u=l.mode,a=Yn({mode:"visible",children:a.children},u),c=aa(c,u,e,null),c.flags|=2,a.return=l,c.return=l,a.sibling=c,l.child=a,oa(l,t.child,null,e),a=l.child,a.memoizedState=jc(e),a.childLanes=Hc(t,i,e),l.memoizedState=Rc,l=Cu(null,a));else if(Me(l),Sf(c)){if(i=c.nextSibling&&c.nextSibling.dataset,i)var v=i.dgst;i=v,a=Error(r(419)),a.stack="",a.digest=i,bu({value:a,source:null,stack:null}),l=qc(t,l,e)}else if(Bt||qa(t,l,e,!1),i=(e&t.childLanes)!==0,Bt||i){if(i=pt,i!==null&&(a=ut(i,e),a!==0&&a!==f.retryLane))throw f.retryLane=a,ea(t,a),ml(i,t,a),Cc;gf(c)||wn(),l=qc(t,l,e)}else gf(c)?(l.flags|=192,l.child=t.child,l=null):(t=f.treeContext,xt=jl(c.nextSibling),Jt=l,tt=!0,Ae=null,Ul=!1,t!==null&&Ms(l,t),l=Bc(l,a.children),l.flags|=4096);return l}return u?(De(),c=a.fallback,u=l.mode,f=t.child,v=f.sibling,a=ee(f,{mode:"hidden",children:a.children}),a.subtreeFlags=f.subtreeFlags&65011712,v!==null?c=ee(v,c):(c=aa(c,u,e,null),c.flags|=2),c.return=l,a.return=l,a.sibling=c,l.child=a,Cu(null,a),a=l.child,c=t.child.memoizedState,c===null?c=jc(e):(u=c.cachePool,u!==null?(f=jt._currentValue,u=u.parent!==f?{parent:f,pool:f}:u):u=Hs(),c={baseLanes:c.baseLanes|e,cachePool:u}),a.memoizedState=c,a.childLanes=Hc(t,i,e),l.memoizedState=Rc,Cu(t.child,a)):(Me(l),e=t.child,t=e.sibling,e=ee(e,{mode:"visible",children:a.children}),e.return=l,e.sibling=null,t!==null&&(i=l.deletions,i===null?(l.deletions=[t],l.flags|=16):i.push(t)),l.child=e,l.memoizedState=null,e)}function Bc(t,l){return l=Yn({mode:"visible",children:l},t.mode),l.return=t,t.child=l}function Yn(t,l){return t=gl(22,t,null,l),t.lanes=0,t}function qc(t,l,e){return oa(l,t.child,null,e),t=Bc(l,l.pendingProps.children),t.flags|=2,l.memoizedState=null,t}function ko(t,l,e){t.lanes|=l;var a=t.alternate;a!==null&&(a.lanes|=l),Ii(t.return,l,e)}function Yc(t,l,e,a,u,n){var i=t.memoizedState;i===null?t.memoizedState={isBackwards:l,rendering:null,renderingStartTime:0,last:a,tail:e,tailMode:u,treeForkCount:n}:(i.isBackwards=l,i.rendering=null,i.renderingStartTime=0,i.last=a,i.tail=e,i.tailMode=u,i.treeForkCount=n)}function $o(t,l,e){var a=l.pendingProps,u=a.revealOrder,n=a.tail;a=a.children;var i=Ut.current,c=(i&2)!==0;if(c?(i=i&1|2,l.flags|=128):i&=1,O(Ut,i),Wt(t,l,a,e),a=tt?Su:0,!c&&t!==null&&(t.flags&128)!==0)t:for(t=l.child;t!==null;){if(t.tag===13)t.memoizedState!==null&&ko(t,e,l);else if(t.tag===19)ko(t,e,l);else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break t;for(;t.sibling===null;){if(t.return===null||t.return===l)break t;t=t.return}t.sibling.return=t.return,t=t.sibling}switch(u){case"forwards":for(e=l.child,u=null;e!==null;)t=e.alternate,t!==null&&_n(t)===null&&(u=e),e=e.sibling;e=u,e===null?(u=l.child,l.child=null):(u=e.sibling,e.sibling=null),Yc(l,!1,u,e,n,a);break;case"backwards":case"unstable_legacy-backwards":for(e=null,u=l.child,l.child=null;u!==null;){if(t=u.alternate,t!==null&&_n(t)===null){l.child=u;break}t=u.sibling,u.sibling=e,e=u,u=t}Yc(l,!0,e,null,n,a);break;case"together":Yc(l,!1,null,null,void 0,a);break;default:l.memoizedState=null}return l.child}function fe(t,l,e){if(t!==null&&(l.dependencies=t.dependencies),Re|=l.lanes,(e&l.childLanes)===0)if(t!==null){if(qa(t,l,e,!1),(e&l.childLanes)===0)return null}else return null;if(t!==null&&l.child!==t.child)throw Error(r(153));if(l.child!==null){for(t=l.child,e=ee(t,t.pendingProps),l.child=e,e.return=l;t.sibling!==null;)t=t.sibling,e=e.sibling=ee(t,t.pendingProps),e.return=l;e.sibling=null}return l.child}function Gc(t,l){return(t.lanes&l)!==0?!0:(t=t.dependencies,!!(t!==null&&Sn(t)))}function $0(t,l,e){switch(l.tag){case 3:Xt(l,l.stateNode.containerInfo),Te(l,jt,t.memoizedState.cache),ua();break;case 27:case 5:Xl(l);break;case 4:Xt(l,l.stateNode.containerInfo);break;case 10:Te(l,l.type,l.memoizedProps.value);break;case 31:if(l.memoizedState!==null)return l.flags|=128,oc(l),null;break;case 13:var a=l.memoizedState;if(a!==null)return a.dehydrated!==null?(Me(l),l.flags|=128,null):(e&l.child.childLanes)!==0?Wo(t,l,e):(Me(l),t=fe(t,l,e),t!==null?t.sibling:null);Me(l);break;case 19:var u=(t.flags&128)!==0;if(a=(e&l.childLanes)!==0,a||(qa(t,l,e,!1),a=(e&l.childLanes)!==0),u){if(a)return $o(t,l,e);l.flags|=128}if(u=l.memoizedState,u!==null&&(u.rendering=null,u.tail=null,u.lastEffect=null),O(Ut,Ut.current),a)break;return null;case 22:return l.lanes=0,Zo(t,l,e,l.pendingProps);case 24:Te(l,jt,t.memoizedState.cache)}return fe(t,l,e)}function Fo(t,l,e){if(t!==null)if(t.memoizedProps!==l.pendingProps)Bt=!0;else{if(!Gc(t,e)&&(l.flags&128)===0)return Bt=!1,$0(t,l,e);Bt=(t.flags&131072)!==0}else Bt=!1,tt&&(l.flags&1048576)!==0&&Ns(l,Su,l.index);switch(l.lanes=0,l.tag){case 16:t:{var a=l.pendingProps;if(t=fa(l.elementType),l.type=t,typeof t=="function")Vi(t)?(a=ra(t,a),l.tag=1,l=Jo(null,l,t,a,e)):(l.tag=0,l=Uc(null,l,t,a,e));else{if(t!=null){var u=t.$$typeof;if(u===nl){l.tag=11,l=Go(null,l,t,a,e);break t}else if(u===W){l.tag=14,l=Qo(null,l,t,a,e);break t}}throw l=il(t)||t,Error(r(306,l,""))}}return l;case 0:return Uc(t,l,l.type,l.pendingProps,e);case 1:return a=l.type,u=ra(a,l.pendingProps),Jo(t,l,a,u,e);case 3:t:{if(Xt(l,l.stateNode.containerInfo),t===null)throw Error(r(387));a=l.pendingProps;var n=l.memoizedState;u=n.element,nc(t,l),_u(l,a,null,e);var i=l.memoizedState;if(a=i.cache,Te(l,jt,a),a!==n.cache&&Pi(l,[jt],e,!0),Tu(),a=i.element,n.isDehydrated)if(n={element:a,isDehydrated:!1,cache:i.cache},l.updateQueue.baseState=n,l.memoizedState=n,l.flags&256){l=wo(t,l,a,e);break t}else if(a!==u){u=Ml(Error(r(424)),l),bu(u),l=wo(t,l,a,e);break t}else{switch(t=l.stateNode.containerInfo,t.nodeType){case 9:t=t.body;break;default:t=t.nodeName==="HTML"?t.ownerDocument.body:t}for(xt=jl(t.firstChild),Jt=l,tt=!0,Ae=null,Ul=!0,e=Xs(l,null,a,e),l.child=e;e;)e.flags=e.flags&-3|4096,e=e.sibling}else{if(ua(),a===u){l=fe(t,l,e);break t}Wt(t,l,a,e)}l=l.child}return l;case 26:return qn(t,l),t===null?(e=fr(l.type,null,l.pendingProps,null))?l.memoizedState=e:tt||(e=l.type,t=l.pendingProps,a=ti(X.current).createElement(e),a[mt]=l,a[Et]=t,kt(a,e,t),Zt(a),l.stateNode=a):l.memoizedState=fr(l.type,t.memoizedProps,l.pendingProps,t.memoizedState),null;case 27:return Xl(l),t===null&&tt&&(a=l.stateNode=nr(l.type,l.pendingProps,X.current),Jt=l,Ul=!0,u=xt,Ye(l.type)?(bf=u,xt=jl(a.firstChild)):xt=u),Wt(t,l,l.pendingProps.children,e),qn(t,l),t===null&&(l.flags|=4194304),l.child;case 5:return t===null&&tt&&((u=a=xt)&&(a=_m(a,l.type,l.pendingProps,Ul),a!==null?(l.stateNode=a,Jt=l,xt=jl(a.firstChild),Ul=!1,u=!0):u=!1),u||ze(l)),Xl(l),u=l.type,n=l.pendingProps,i=t!==null?t.memoizedProps:null,a=n.children,vf(u,n)?a=null:i!==null&&vf(u,i)&&(l.flags|=32),l.memoizedState!==null&&(u=rc(t,l,X0,null,null,e),Ju._currentValue=u),qn(t,l),Wt(t,l,a,e),l.child;case 6:return t===null&&tt&&((t=e=xt)&&(e=Om(e,l.pendingProps,Ul),e!==null?(l.stateNode=e,Jt=l,xt=null,t=!0):t=!1),t||ze(l)),null;case 13:return Wo(t,l,e);case 4:return Xt(l,l.stateNode.containerInfo),a=l.pendingProps,t===null?l.child=oa(l,null,a,e):Wt(t,l,a,e),l.child;case 11:return Go(t,l,l.type,l.pendingProps,e);case 7:return Wt(t,l,l.pendingProps,e),l.child;case 8:return Wt(t,l,l.pendingProps.children,e),l.child;case 12:return Wt(t,l,l.pendingProps.children,e),l.child;case 10:return a=l.pendingProps,Te(l,l.type,a.value),Wt(t,l,a.children,e),l.child;case 9:return u=l.type._context,a=l.pendingProps.children,ia(l),u=wt(u),a=a(u),l.flags|=1,Wt(t,l,a,e),l.child;case 14:return Qo(t,l,l.type,l.pendingProps,e);case 15:return Xo(t,l,l.type,l.pendingProps,e);case 19:return $o(t,l,e);case 31:return k0(t,l,e);case 22:return Zo(t,l,e,l.pendingProps);case 24:return ia(l),a=wt(jt),t===null?(u=ec(),u===null&&(u=pt,n=tc(),u.pooledCache=n,n.refCount++,n!==null&&(u.pooledCacheLanes|=e),u=n),l.memoizedState={parent:a,cache:u},uc(l),Te(l,jt,u)):((t.lanes&e)!==0&&(nc(t,l),_u(l,null,null,e),Tu()),u=t.memoizedState,n=l.memoizedState,u.parent!==a?(u={parent:a,cache:a},l.memoizedState=u,l.lanes===0&&(l.memoizedState=l.updateQueue.baseState=u),Te(l,jt,a)):(a=n.cache,Te(l,jt,a),a!==u.cache&&Pi(l,[jt],e,!0))),Wt(t,l,l.pendingProps.children,e),l.child;case 29:throw l.pendingProps}throw Error(r(156,l.tag))}function se(t){t.flags|=4}function Qc(t,l,e,a,u){if((l=(t.mode&32)!==0)&&(l=!1),l){if(t.flags|=16777216,(u&335544128)===u)if(t.stateNode.complete)t.flags|=8192;else if(zd())t.flags|=8192;else throw sa=xn,ac}else t.flags&=-16777217}function Io(t,l){if(l.type!=="stylesheet"||(l.state.loading&4)!==0)t.flags&=-16777217;else if(t.flags|=16777216,!mr(l))if(zd())t.flags|=8192;else throw sa=xn,ac}function Gn(t,l){l!==null&&(t.flags|=4),t.flags&16384&&(l=t.tag!==22?pa():536870912,t.lanes|=l,ka|=l)}function Uu(t,l){if(!tt)switch(t.tailMode){case"hidden":l=t.tail;for(var e=null;l!==null;)l.alternate!==null&&(e=l),l=l.sibling;e===null?t.tail=null:e.sibling=null;break;case"collapsed":e=t.tail;for(var a=null;e!==null;)e.alternate!==null&&(a=e),e=e.sibling;a===null?l||t.tail===null?t.tail=null:t.tail.sibling=null:a.sibling=null}}function At(t){var l=t.alternate!==null&&t.alternate.child===t.child,e=0,a=0;if(l)for(var u=t.child;u!==null;)e|=u.lanes|u.childLanes,a|=u.subtreeFlags&65011712,a|=u.flags&65011712,u.return=t,u=u.sibling;else for(u=t.child;u!==null;)e|=u.lanes|u.childLanes,a|=u.subtreeFlags,a|=u.flags,u.return=t,u=u.sibling;return t.subtreeFlags|=a,t.childLanes=e,l}function F0(t,l,e){var a=l.pendingProps;switch(Wi(l),l.tag){case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return At(l),null;case 1:return At(l),null;case 3:return e=l.stateNode,a=null,t!==null&&(a=t.memoizedState.cache),l.memoizedState.cache!==a&&(l.flags|=2048),ne(jt),ot(),e.pendingContext&&(e.context=e.pendingContext,e.pendingContext=null),(t===null||t.child===null)&&(Ba(l)?se(l):t===null||t.memoizedState.isDehydrated&&(l.flags&256)===0||(l.flags|=1024,$i())),At(l),null;case 26:var u=l.type,n=l.memoizedState;return t===null?(se(l),n!==null?(At(l),Io(l,n)):(At(l),Qc(l,u,null,a,e))):n?n!==t.memoizedState?(se(l),At(l),Io(l,n)):(At(l),l.flags&=-16777217):(t=t.memoizedProps,t!==a&&se(l),At(l),Qc(l,u,t,a,e)),null;case 27:if(Mt(l),e=X.current,u=l.type,t!==null&&l.stateNode!=null)t.memoizedProps!==a&&se(l);else{if(!a){if(l.stateNode===null)throw Error(r(166));return At(l),null}t=D.current,Ba(l)?Ds(l):(t=nr(u,a,e),l.stateNode=t,se(l))}return At(l),null;case 5:if(Mt(l),u=l.type,t!==null&&l.stateNode!=null)t.memoizedProps!==a&&se(l);else{if(!a){if(l.stateNode===null)throw Error(r(166));return At(l),null}if(n=D.current,Ba(l))Ds(l);else{var i=ti(X.current);switch(n){case 1:n=i.createElementNS("http://www.w3.org/2000/svg",u);break;case 2:n=i.createElementNS("http://www.w3.org/1998/Math/MathML",u);break;default:switch(u){case"svg":n=i.createElementNS("http://www.w3.org/2000/svg",u);break;case"math":n=i.createElementNS("http://www.w3.org/1998/Math/MathML",u);break;case"script":n=i.createElement("div"),n.innerHTML="<script><\/script>",n=n.removeChild(n.firstChild);break;case"select":n=typeof a.is=="string"?i.createElement("select",{is:a.is}):i.createElement("select"),a.multiple?n.multiple=!0:a.size&&(n.size=a.size);break;default:n=typeof a.is=="string"?i.createElement(u,{is:a.is}):i.createElement(u)}}n[mt]=l,n[Et]=a;t:for(i=l.child;i!==null;){if(i.tag===5||i.tag===6)n.appendChild(i.stateNode);else if(i.tag!==4&&i.tag!==27&&i.child!==null){i.child.return=i,i=i.child;continue}if(i===l)break t;for(;i.sibling===null;){if(i.return===null||i.return===l)break t;i=i.return}i.sibling.return=i.return,i=i.sibling}l.stateNode=n;t:switch(kt(n,u,a),u){case"button":case"input":case"select":case"textarea":a=!!a.autoFocus;break t;case"img":a=!0;break t;default:a=!1}a&&se(l)}}return At(l),Qc(l,l.type,t===null?null:t.memoizedProps,l.pendingProps,e),null;case 6:if(t&&l.stateNode!=null)t.memoizedProps!==a&&se(l);else{if(typeof a!="string"&&l.stateNode===null)throw Error(r(166));if(t=X.current,Ba(l)){if(t=l.stateNode,e=l.memoizedProps,a=null,u=Jt,u!==null)switch(u.tag){case 27:case 5:a=u.memoizedProps}t[mt]=l,t=!!(t.nodeValue===e||a!==null&&a.suppressHydrationWarning===!0||Wd(t.nodeValue,e)),t||ze(l,!0)}else t=ti(t).createTextNode(a),t[mt]=l,l.stateNode=t}return At(l),null;case 31:if(e=l.memoizedState,t===null||t.memoizedState!==null){if(a=Ba(l),e!==null){if(t===null){if(!a)throw Error(r(318));if(t=l.memoizedState,t=t!==null?t.dehydrated:null,!t)throw Error(r(557));t[mt]=l}else ua(),(l.flags&128)===0&&(l.memoizedState=null),l.flags|=4;At(l),t=!1}else e=$i(),t!==null&&t.memoizedState!==null&&(t.memoizedState.hydrationErrors=e),t=!0;if(!t)return l.flags&256?(bl(l),l):(bl(l),null);if((l.flags&128)!==0)throw Error(r(558))}return At(l),null;case 13:if(a=l.memoizedState,t===null||t.memoizedState!==null&&t.memoizedState.dehydrated!==null){if(u=Ba(l),a!==null&&a.dehydrated!==null){if(t===null){if(!u)throw Error(r(318));if(u=l.memoizedState,u=u!==null?u.dehydrated:null,!u)throw Error(r(317));u[mt]=l}else ua(),(l.flags&128)===0&&(l.memoizedState=null),l.flags|=4;At(l),u=!1}else u=$i(),t!==null&&t.memoizedState!==null&&(t.memoizedState.hydrationErrors=u),u=!0;if(!u)return l.flags&256?(bl(l),l):(bl(l),null)}return bl(l),(l.flags&128)!==0?(l.lanes=e,l):(e=a!==null,t=t!==null&&t.memoizedState!==null,e&&(a=l.child,u=null,a.alternate!==null&&a.alternate.memoizedState!==null&&a.alternate.memoizedState.cachePool!==null&&(u=a.alternate.memoizedState.cachePool.pool),n=null,a.memoizedState!==null&&a.memoizedState.cachePool!==null&&(n=a.memoizedState.cachePool.pool),n!==u&&(a.flags|=2048)),e!==t&&e&&(l.child.flags|=8192),Gn(l,l.updateQueue),At(l),null);case 4:return ot(),t===null&&sf(l.stateNode.containerInfo),At(l),null;case 10:return ne(l.type),At(l),null;case 19:if(x(Ut),a=l.memoizedState,a===null)return At(l),null;if(u=(l.flags&128)!==0,n=a.rendering,n===null)if(u)Uu(a,!1);else{if(Ct!==0||t!==null&&(t.flags&128)!==0)for(t=l.child;t!==null;){if(n=_n(t),n!==null){for(l.flags|=128,Uu(a,!1),t=n.updateQueue,l.updateQueue=t,Gn(l,t),l.subtreeFlags=0,t=e,e=l.child;e!==null;)Ts(e,t),e=e.sibling;return O(Ut,Ut.current&1|2),tt&&ae(l,a.treeForkCount),l.child}t=t.sibling}a.tail!==null&&zt()>Vn&&(l.flags|=128,u=!0,Uu(a,!1),l.lanes=4194304)}else{if(!u)if(t=_n(n),t!==null){if(l.flags|=128,u=!0,t=t.updateQueue,l.updateQueue=t,Gn(l,t),Uu(a,!0),a.tail===null&&a.tailMode==="hidden"&&!n.alternate&&!tt)return At(l),null}else 2*zt()-a.renderingStartTime>Vn&&e!==536870912&&(l.flags|=128,u=!0,Uu(a,!1),l.lanes=4194304);a.isBackwards?(n.sibling=l.child,l.child=n):(t=a.last,t!==null?t.sibling=n:l.child=n,a.last=n)}return a.tail!==null?(t=a.tail,a.rendering=t,a.tail=t.sibling,a.renderingStartTime=zt(),t.sibling=null,e=Ut.current,O(Ut,u?e&1|2:e&1),tt&&ae(l,a.treeForkCount),t):(At(l),null);case 22:case 23:return bl(l),sc(),a=l.memoizedState!==null,t!==null?t.memoizedState!==null!==a&&(l.flags|=8192):a&&(l.flags|=8192),a?(e&536870912)!==0&&(l.flags&128)===0&&(At(l),l.subtreeFlags&6&&(l.flags|=8192)):At(l),e=l.updateQueue,e!==null&&Gn(l,e.retryQueue),e=null,t!==null&&t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(e=t.memoizedState.cachePool.pool),a=null,l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(a=l.memoizedState.cachePool.pool),a!==e&&(l.flags|=2048),t!==null&&x(ca),null;case 24:return e=null,t!==null&&(e=t.memoizedState.cache),l.memoizedState.cache!==e&&(l.flags|=2048),ne(jt),At(l),null;case 25:return null;case 30:return null}throw Error(r(156,l.tag))}function I0(t,l){switch(Wi(l),l.tag){case 1:return t=l.flags,t&65536?(l.flags=t&-65537|128,l):null;case 3:return ne(jt),ot(),t=l.flags,(t&65536)!==0&&(t&128)===0?(l.flags=t&-65537|128,l):null;case 26:case 27:case 5:return Mt(l),null;case 31:if(l.memoizedState!==null){if(bl(l),l.alternate===null)throw Error(r(340));ua()}return t=l.flags,t&65536?(l.flags=t&-65537|128,l):null;case 13:if(bl(l),t=l.memoizedState,t!==null&&t.dehydrated!==null){if(l.alternate===null)throw Error(r(340));ua()}return t=l.flags,t&65536?(l.flags=t&-65537|128,l):null;case 19:return x(Ut),null;case 4:return ot(),null;case 10:return ne(l.type),null;case 22:case 23:return bl(l),sc(),t!==null&&x(ca),t=l.flags,t&65536?(l.flags=t&-65537|128,l):null;case 24:return ne(jt),null;case 25:return null;default:return null}}function Po(t,l){switch(Wi(l),l.tag){case 3:ne(jt),ot();break;case 26:case 27:case 5:Mt(l);break;case 4:ot();break;case 31:l.memoizedState!==null&&bl(l);break;case 13:bl(l);break;case 19:x(Ut);break;case 10:ne(l.type);break;case 22:case 23:bl(l),sc(),t!==null&&x(ca);break;case 24:ne(jt)}}function Ru(t,l){try{var e=l.updateQueue,a=e!==null?e.lastEffect:null;if(a!==null){var u=a.next;e=u;do{if((e.tag&t)===t){a=void 0;var n=e.create,i=e.inst;a=n(),i.destroy=a}e=e.next}while(e!==u)}}catch(c){rt(l,l.return,c)}}function Ce(t,l,e){try{var a=l.updateQueue,u=a!==null?a.lastEffect:null;if(u!==null){var n=u.next;a=n;do{if((a.tag&t)===t){var i=a.inst,c=i.destroy;if(c!==void 0){i.destroy=void 0,u=l;var f=e,v=c;try{v()}catch(S){rt(u,f,S)}}}a=a.next}while(a!==n)}}catch(S){rt(l,l.return,S)}}function td(t){var l=t.updateQueue;if(l!==null){var e=t.stateNode;try{Ls(l,e)}catch(a){rt(t,t.return,a)}}}function ld(t,l,e){e.props=ra(t.type,t.memoizedProps),e.state=t.memoizedState;try{e.componentWillUnmount()}catch(a){rt(t,l,a)}}function ju(t,l){try{var e=t.ref;if(e!==null){switch(t.tag){case 26:case 27:case 5:var a=t.stateNode;break;case 30:a=t.stateNode;break;default:a=t.stateNode}typeof e=="function"?t.refCleanup=e(a):e.current=a}}catch(u){rt(t,l,u)}}function Jl(t,l){var e=t.ref,a=t.refCleanup;if(e!==null)if(typeof a=="function")try{a()}catch(u){rt(t,l,u)}finally{t.refCleanup=null,t=t.alternate,t!=null&&(t.refCleanup=null)}else if(typeof e=="function")try{e(null)}catch(u){rt(t,l,u)}else e.current=null}function ed(t){var l=t.type,e=t.memoizedProps,a=t.stateNode;try{t:switch(l){case"button":case"input":case"select":case"textarea":e.autoFocus&&a.focus();break t;case"img":e.src?a.src=e.src:e.srcSet&&(a.srcset=e.srcSet)}}catch(u){rt(t,t.return,u)}}function Xc(t,l,e){try{var a=t.stateNode;pm(a,t.type,e,l),a[Et]=l}catch(u){rt(t,t.return,u)}}function ad(t){return t.tag===5||t.tag===3||t.tag===26||t.tag===27&&Ye(t.type)||t.tag===4}function Zc(t){t:for(;;){for(;t.sibling===null;){if(t.return===null||ad(t.return))return null;t=t.return}for(t.sibling.return=t.return,t=t.sibling;t.tag!==5&&t.tag!==6&&t.tag!==18;){if(t.tag===27&&Ye(t.type)||t.flags&2||t.child===null||t.tag===4)continue t;t.child.return=t,t=t.child}if(!(t.flags&2))return t.stateNode}}function Lc(t,l,e){var a=t.tag;if(a===5||a===6)t=t.stateNode,l?(e.nodeType===9?e.body:e.nodeName==="HTML"?e.ownerDocument.body:e).insertBefore(t,l):(l=e.nodeType===9?e.body:e.nodeName==="HTML"?e.ownerDocument.body:e,l.appendChild(t),e=e._reactRootContainer,e!=null||l.onclick!==null||(l.onclick=te));else if(a!==4&&(a===27&&Ye(t.type)&&(e=t.stateNode,l=null),t=t.child,t!==null))for(Lc(t,l,e),t=t.sibling;t!==null;)Lc(t,l,e),t=t.sibling}function Qn(t,l,e){var a=t.tag;if(a===5||a===6)t=t.stateNode,l?e.insertBefore(t,l):e.appendChild(t);else if(a!==4&&(a===27&&Ye(t.type)&&(e=t.stateNode),t=t.child,t!==null))for(Qn(t,l,e),t=t.sibling;t!==null;)Qn(t,l,e),t=t.sibling}function ud(t){var l=t.stateNode,e=t.memoizedProps;try{for(var a=t.type,u=l.attributes;u.length;)l.removeAttributeNode(u[0]);kt(l,a,e),l[mt]=t,l[Et]=e}catch(n){rt(t,t.return,n)}}var oe=!1,qt=!1,Vc=!1,nd=typeof WeakSet=="function"?WeakSet:Set,Lt=null;function P0(t,l){if(t=t.containerInfo,rf=ci,t=hs(t),qi(t)){if("selectionStart"in t)var e={start:t.selectionStart,end:t.selectionEnd};else t:{e=(e=t.ownerDocument)&&e.defaultView||window;var a=e.getSelection&&e.getSelection();if(a&&a.rangeCount!==0){e=a.anchorNode;var u=a.anchorOffset,n=a.focusNode;a=a.focusOffset;try{e.nodeType,n.nodeType}catch{e=null;break t}var i=0,c=-1,f=-1,v=0,S=0,E=t,y=null;l:for(;;){for(var h;E!==e||u!==0&&E.nodeType!==3||(c=i+u),E!==n||a!==0&&E.nodeType!==3||(f=i+a),E.nodeType===3&&(i+=E.nodeValue.length),(h=E.firstChild)!==null;)y=E,E=h;for(;;){if(E===t)break l;if(y===e&&++v===u&&(c=i),y===n&&++S===a&&(f=i),(h=E.nextSibling)!==null)break;E=y,y=E.parentNode}E=h}e=c===-1||f===-1?null:{start:c,end:f}}else e=null}e=e||{start:0,end:0}}else e=null;for(mf={focusedElem:t,selectionRange:e},ci=!1,Lt=l;Lt!==null;)if(l=Lt,t=l.child,(l.subtreeFlags&1028)!==0&&t!==null)t.return=l,Lt=t;else for(;Lt!==null;){switch(l=Lt,n=l.alternate,t=l.flags,l.tag){case 0:if((t&4)!==0&&(t=l.updateQueue,t=t!==null?t.events:null,t!==null))for(e=0;e<t.length;e++)u=t[e],u.ref.impl=u.nextImpl;break;case 11:case 15:break;case 1:if((t&1024)!==0&&n!==null){t=void 0,e=l,u=n.memoizedProps,n=n.memoizedState,a=e.stateNode;try{var M=ra(e.type,u);t=a.getSnapshotBeforeUpdate(M,n),a.__reactInternalSnapshotBeforeUpdate=t}catch(G){rt(e,e.return,G)}}break;case 3:if((t&1024)!==0){if(t=l.stateNode.containerInfo,e=t.nodeType,e===9)hf(t);else if(e===1)switch(t.nodeName){case"HEAD":case"HTML":case"BODY":hf(t);break;default:t.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((t&1024)!==0)throw Error(r(163))}if(t=l.sibling,t!==null){t.return=l.return,Lt=t;break}Lt=l.return}}function id(t,l,e){var a=e.flags;switch(e.tag){case 0:case 11:case 15:re(t,e),a&4&&Ru(5,e);break;case 1:if(re(t,e),a&4)if(t=e.stateNode,l===null)try{t.componentDidMount()}catch(i){rt(e,e.return,i)}else{var u=ra(e.type,l.memoizedProps);l=l.memoizedState;try{t.componentDidUpdate(u,l,t.__reactInternalSnapshotBeforeUpdate)}catch(i){rt(e,e.return,i)}}a&64&&td(e),a&512&&ju(e,e.return);break;case 3:if(re(t,e),a&64&&(t=e.updateQueue,t!==null)){if(l=null,e.child!==null)switch(e.child.tag){case 27:case 5:l=e.child.stateNode;break;case 1:l=e.child.stateNode}try{Ls(t,l)}catch(i){rt(e,e.return,i)}}break;case 27:l===null&&a&4&&ud(e);case 26:case 5:re(t,e),l===null&&a&4&&ed(e),a&512&&ju(e,e.return);break;case 12:re(t,e);break;case 31:re(t,e),a&4&&sd(t,e);break;case 13:re(t,e),a&4&&od(t,e),a&64&&(t=e.memoizedState,t!==null&&(t=t.dehydrated,t!==null&&(e=fm.bind(null,e),Nm(t,e))));break;case 22:if(a=e.memoizedState!==null||oe,!a){l=l!==null&&l.memoizedState!==null||qt,u=oe;var n=qt;oe=a,(qt=l)&&!n?me(t,e,(e.subtreeFlags&8772)!==0):re(t,e),oe=u,qt=n}break;case 30:break;default:re(t,e)}}function cd(t){var l=t.alternate;l!==null&&(t.alternate=null,cd(l)),t.child=null,t.deletions=null,t.sibling=null,t.tag===5&&(l=t.stateNode,l!==null&&pi(l)),t.stateNode=null,t.return=null,t.dependencies=null,t.memoizedProps=null,t.memoizedState=null,t.pendingProps=null,t.stateNode=null,t.updateQueue=null}var _t=null,sl=!1;function de(t,l,e){for(e=e.child;e!==null;)fd(t,l,e),e=e.sibling}function fd(t,l,e){if(ll&&typeof ll.onCommitFiberUnmount=="function")try{ll.onCommitFiberUnmount(ke,e)}catch{}switch(e.tag){case 26:qt||Jl(e,l),de(t,l,e),e.memoizedState?e.memoizedState.count--:e.stateNode&&(e=e.stateNode,e.parentNode.removeChild(e));break;case 27:qt||Jl(e,l);var a=_t,u=sl;Ye(e.type)&&(_t=e.stateNode,sl=!1),de(t,l,e),Lu(e.stateNode),_t=a,sl=u;break;case 5:qt||Jl(e,l);case 6:if(a=_t,u=sl,_t=null,de(t,l,e),_t=a,sl=u,_t!==null)if(sl)try{(_t.nodeType===9?_t.body:_t.nodeName==="HTML"?_t.ownerDocument.body:_t).removeChild(e.stateNode)}catch(n){rt(e,l,n)}else try{_t.removeChild(e.stateNode)}catch(n){rt(e,l,n)}break;case 18:_t!==null&&(sl?(t=_t,tr(t.nodeType===9?t.body:t.nodeName==="HTML"?t.ownerDocument.body:t,e.stateNode),au(t)):tr(_t,e.stateNode));break;case 4:a=_t,u=sl,_t=e.stateNode.containerInfo,sl=!0,de(t,l,e),_t=a,sl=u;break;case 0:case 11:case 14:case 15:Ce(2,e,l),qt||Ce(4,e,l),de(t,l,e);break;case 1:qt||(Jl(e,l),a=e.stateNode,typeof a.componentWillUnmount=="function"&&ld(e,l,a)),de(t,l,e);break;case 21:de(t,l,e);break;case 22:qt=(a=qt)||e.memoizedState!==null,de(t,l,e),qt=a;break;default:de(t,l,e)}}function sd(t,l){if(l.memoizedState===null&&(t=l.alternate,t!==null&&(t=t.memoizedState,t!==null))){t=t.dehydrated;try{au(t)}catch(e){rt(l,l.return,e)}}}function od(t,l){if(l.memoizedState===null&&(t=l.alternate,t!==null&&(t=t.memoizedState,t!==null&&(t=t.dehydrated,t!==null))))try{au(t)}catch(e){rt(l,l.return,e)}}function tm(t){switch(t.tag){case 31:case 13:case 19:var l=t.stateNode;return l===null&&(l=t.stateNode=new nd),l;case 22:return t=t.stateNode,l=t._retryCache,l===null&&(l=t._retryCache=new nd),l;default:throw Error(r(435,t.tag))}}function Xn(t,l){var e=tm(t);l.forEach(function(a){if(!e.has(a)){e.add(a);var u=sm.bind(null,t,a);a.then(u,u)}})}function ol(t,l){var e=l.deletions;if(e!==null)for(var a=0;a<e.length;a++){var u=e[a],n=t,i=l,c=i;t:for(;c!==null;){switch(c.tag){case 27:if(Ye(c.type)){_t=c.stateNode,sl=!1;break t}break;case 5:_t=c.stateNode,sl=!1;break t;case 3:case 4:_t=c.stateNode.containerInfo,sl=!0;break t}c=c.return}if(_t===null)throw Error(r(160));fd(n,i,u),_t=null,sl=!1,n=u.alternate,n!==null&&(n.return=null),u.return=null}if(l.subtreeFlags&13886)for(l=l.child;l!==null;)dd(l,t),l=l.sibling}var Gl=null;function dd(t,l){var e=t.alternate,a=t.flags;switch(t.tag){case 0:case 11:case 14:case 15:ol(l,t),dl(t),a&4&&(Ce(3,t,t.return),Ru(3,t),Ce(5,t,t.return));break;case 1:ol(l,t),dl(t),a&512&&(qt||e===null||Jl(e,e.return)),a&64&&oe&&(t=t.updateQueue,t!==null&&(a=t.callbacks,a!==null&&(e=t.shared.hiddenCallbacks,t.shared.hiddenCallbacks=e===null?a:e.concat(a))));break;case 26:var u=Gl;if(ol(l,t),dl(t),a&512&&(qt||e===null||Jl(e,e.return)),a&4){var n=e!==null?e.memoizedState:null;if(a=t.memoizedState,e===null)if(a===null)if(t.stateNode===null){t:{a=t.type,e=t.memoizedProps,u=u.ownerDocument||u;l:switch(a){case"title":n=u.getElementsByTagName("title")[0],(!n||n[cu]||n[mt]||n.namespaceURI==="http://www.w3.org/2000/svg"||n.hasAttribute("itemprop"))&&(n=u.createElement(a),u.head.insertBefore(n,u.querySelector("head > title"))),kt(n,a,e),n[mt]=t,Zt(n),a=n;break t;case"link":var i=dr("link","href",u).get(a+(e.href||""));if(i){for(var c=0;c<i.length;c++)if(n=i[c],n.getAttribute("href")===(e.href==null||e.href===""?null:e.href)&&n.getAttribute("rel")===(e.rel==null?null:e.rel)&&n.getAttribute("title")===(e.title==null?null:e.title)&&n.getAttribute("crossorigin")===(e.crossOrigin==null?null:e.crossOrigin)){i.splice(c,1);break l}}n=u.createElement(a),kt(n,a,e),u.head.appendChild(n);break;case"meta":if(i=dr("meta","content",u).get(a+(e.content||""))){for(c=0;c<i.length;c++)if(n=i[c],n.getAttribute("content")===(e.content==null?null:""+e.content)&&n.getAttribute("name")===(e.name==null?null:e.name)&&n.getAttribute("property")===(e.property==null?null:e.property)&&n.getAttribute("http-equiv")===(e.httpEquiv==null?null:e.httpEquiv)&&n.getAttribute("charset")===(e.charSet==null?null:e.charSet)){i.splice(c,1);break l}}n=u.createElement(a),kt(n,a,e),u.head.appendChild(n);break;default:throw Error(r(468,a))}n[mt]=t,Zt(n),a=n}t.stateNode=a}else rr(u,t.type,t.stateNode);else t.stateNode=or(u,a,t.memoizedProps);else n!==a?(n===null?e.stateNode!==null&&(e=e.stateNode,e.parentNode.removeChild(e)):n.count--,a===null?rr(u,t.type,t.stateNode):or(u,a,t.memoizedProps)):a===null&&t.stateNode!==null&&Xc(t,t.memoizedProps,e.memoizedProps)}break;case 27:ol(l,t),dl(t),a&512&&(qt||e===null||Jl(e,e.return)),e!==null&&a&4&&Xc(t,t.memoizedProps,e.memoizedProps);break;case 5:if(ol(l,t),dl(t),a&512&&(qt||e===null||Jl(e,e.return)),t.flags&32){u=t.stateNode;try{_a(u,"")}catch(M){rt(t,t.return,M)}}a&4&&t.stateNode!=null&&(u=t.memoizedProps,Xc(t,u,e!==null?e.memoizedProps:u)),a&1024&&(Vc=!0);break;case 6:if(ol(l,t),dl(t),a&4){if(t.stateNode===null)throw Error(r(162));a=t.memoizedProps,e=t.stateNode;try{e.nodeValue=a}catch(M){rt(t,t.return,M)}}break;case 3:if(ai=null,u=Gl,Gl=li(l.containerInfo),ol(l,t),Gl=u,dl(t),a&4&&e!==null&&e.memoizedState.isDehydrated)try{au(l.containerInfo)}catch(M){rt(t,t.return,M)}Vc&&(Vc=!1,rd(t));break;case 4:a=Gl,Gl=li(t.stateNode.containerInfo),ol(l,t),dl(t),Gl=a;break;case 12:ol(l,t),dl(t);break;case 31:ol(l,t),dl(t),a&4&&(a=t.updateQueue,a!==null&&(t.updateQueue=null,Xn(t,a)));break;case 13:ol(l,t),dl(t),t.child.flags&8192&&t.memoizedState!==null!=(e!==null&&e.memoizedState!==null)&&(Ln=zt()),a&4&&(a=t.updateQueue,a!==null&&(t.updateQueue=null,Xn(t,a)));break;case 22:u=t.memoizedState!==null;var f=e!==null&&e.memoizedState!==null,v=oe,S=qt;if(oe=v||u,qt=S||f,ol(l,t),qt=S,oe=v,dl(t),a&8192)t:for(l=t.stateNode,l._visibility=u?l._visibility&-2:l._visibility|1,u&&(e===null||f||oe||qt||ma(t)),e=null,l=t;;){if(l.tag===5||l.tag===26){if(e===null){f=e=l;try{if(n=f.stateNode,u)i=n.style,typeof i.setProperty=="function"?i.setProperty("display","none","important"):i.display="none";else{c=f.stateNode;var E=f.memoizedProps.style,y=E!=null&&E.hasOwnProperty("display")?E.display:null;c.style.display=y==null||typeof y=="boolean"?"":(""+y).trim()}}catch(M){rt(f,f.return,M)}}}else if(l.tag===6){if(e===null){f=l;try{f.stateNode.nodeValue=u?"":f.memoizedProps}catch(M){rt(f,f.return,M)}}}else if(l.tag===18){if(e===null){f=l;try{var h=f.stateNode;u?lr(h,!0):lr(f.stateNode,!1)}catch(M){rt(f,f.return,M)}}}else if((l.tag!==22&&l.tag!==23||l.memoizedState===null||l===t)&&l.child!==null){l.child.return=l,l=l.child;continue}if(l===t)break t;for(;l.sibling===null;){if(l.return===null||l.return===t)break t;e===l&&(e=null),l=l.return}e===l&&(e=null),l.sibling.return=l.return,l=l.sibling}a&4&&(a=t.updateQueue,a!==null&&(e=a.retryQueue,e!==null&&(a.retryQueue=null,Xn(t,e))));break;case 19:ol(l,t),dl(t),a&4&&(a=t.updateQueue,a!==null&&(t.updateQueue=null,Xn(t,a)));break;case 30:break;case 21:break;default:ol(l,t),dl(t)}}function dl(t){var l=t.flags;if(l&2){try{for(var e,a=t.return;a!==null;){if(ad(a)){e=a;break}a=a.return}if(e==null)throw Error(r(160));switch(e.tag){case 27:var u=e.stateNode,n=Zc(t);Qn(t,n,u);break;case 5:var i=e.stateNode;e.flags&32&&(_a(i,""),e.flags&=-33);var c=Zc(t);Qn(t,c,i);break;case 3:case 4:var f=e.stateNode.containerInfo,v=Zc(t);Lc(t,v,f);break;default:throw Error(r(161))}}catch(S){rt(t,t.return,S)}t.flags&=-3}l&4096&&(t.flags&=-4097)}function rd(t){if(t.subtreeFlags&1024)for(t=t.child;t!==null;){var l=t;rd(l),l.tag===5&&l.flags&1024&&l.stateNode.reset(),t=t.sibling}}function re(t,l){if(l.subtreeFlags&8772)for(l=l.child;l!==null;)id(t,l.alternate,l),l=l.sibling}function ma(t){for(t=t.child;t!==null;){var l=t;switch(l.tag){case 0:case 11:case 14:case 15:Ce(4,l,l.return),ma(l);break;case 1:Jl(l,l.return);var e=l.stateNode;typeof e.componentWillUnmount=="function"&&ld(l,l.return,e),ma(l);break;case 27:Lu(l.stateNode);case 26:case 5:Jl(l,l.return),ma(l);break;case 22:l.memoizedState===null&&ma(l);break;case 30:ma(l);break;default:ma(l)}t=t.sibling}}function me(t,l,e){for(e=e&&(l.subtreeFlags&8772)!==0,l=l.child;l!==null;){var a=l.alternate,u=t,n=l,i=n.flags;switch(n.tag){case 0:case 11:case 15:me(u,n,e),Ru(4,n);break;case 1:if(me(u,n,e),a=n,u=a.stateNode,typeof u.componentDidMount=="function")try{u.componentDidMount()}catch(v){rt(a,a.return,v)}if(a=n,u=a.updateQueue,u!==null){var c=a.stateNode;try{var f=u.shared.hiddenCallbacks;if(f!==null)for(u.shared.hiddenCallbacks=null,u=0;u<f.length;u++)Zs(f[u],c)}catch(v){rt(a,a.return,v)}}e&&i&64&&td(n),ju(n,n.return);break;case 27:ud(n);case 26:case 5:me(u,n,e),e&&a===null&&i&4&&ed(n),ju(n,n.return);break;case 12:me(u,n,e);break;case 31:me(u,n,e),e&&i&4&&sd(u,n);break;case 13:me(u,n,e),e&&i&4&&od(u,n);break;case 22:n.memoizedState===null&&me(u,n,e),ju(n,n.return);break;case 30:break;default:me(u,n,e)}l=l.sibling}}function Kc(t,l){var e=null;t!==null&&t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(e=t.memoizedState.cachePool.pool),t=null,l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(t=l.memoizedState.cachePool.pool),t!==e&&(t!=null&&t.refCount++,e!=null&&pu(e))}function Jc(t,l){t=null,l.alternate!==null&&(t=l.alternate.memoizedState.cache),l=l.memoizedState.cache,l!==t&&(l.refCount++,t!=null&&pu(t))}function Ql(t,l,e,a){if(l.subtreeFlags&10256)for(l=l.child;l!==null;)md(t,l,e,a),l=l.sibling}function md(t,l,e,a){var u=l.flags;switch(l.tag){case 0:case 11:case 15:Ql(t,l,e,a),u&2048&&Ru(9,l);break;case 1:Ql(t,l,e,a);break;case 3:Ql(t,l,e,a),u&2048&&(t=null,l.alternate!==null&&(t=l.alternate.memoizedState.cache),l=l.memoizedState.cache,l!==t&&(l.refCount++,t!=null&&pu(t)));break;case 12:if(u&2048){Ql(t,l,e,a),t=l.stateNode;try{var n=l.memoizedProps,i=n.id,c=n.onPostCommit;typeof c=="function"&&c(i,l.alternate===null?"mount":"update",t.passiveEffectDuration,-0)}catch(f){rt(l,l.return,f)}}else Ql(t,l,e,a);break;case 31:Ql(t,l,e,a);break;case 13:Ql(t,l,e,a);break;case 23:break;case 22:n=l.stateNode,i=l.alternate,l.memoizedState!==null?n._visibility&2?Ql(t,l,e,a):Hu(t,l):n._visibility&2?Ql(t,l,e,a):(n._visibility|=2,Ja(t,l,e,a,(l.subtreeFlags&10256)!==0||!1)),u&2048&&Kc(i,l);break;case 24:Ql(t,l,e,a),u&2048&&Jc(l.alternate,l);break;default:Ql(t,l,e,a)}}function Ja(t,l,e,a,u){for(u=u&&((l.subtreeFlags&10256)!==0||!1),l=l.child;l!==null;){var n=t,i=l,c=e,f=a,v=i.flags;switch(i.tag){case 0:case 11:case 15:Ja(n,i,c,f,u),Ru(8,i);break;case 23:break;case 22:var S=i.stateNode;i.memoizedState!==null?S._visibility&2?Ja(n,i,c,f,u):Hu(n,i):(S._visibility|=2,Ja(n,i,c,f,u)),u&&v&2048&&Kc(i.alternate,i);break;case 24:Ja(n,i,c,f,u),u&&v&2048&&Jc(i.alternate,i);break;default:Ja(n,i,c,f,u)}l=l.sibling}}function Hu(t,l){if(l.subtreeFlags&10256)for(l=l.child;l!==null;){var e=t,a=l,u=a.flags;switch(a.tag){case 22:Hu(e,a),u&2048&&Kc(a.alternate,a);break;case 24:Hu(e,a),u&2048&&Jc(a.alternate,a);break;default:Hu(e,a)}l=l.sibling}}var Bu=8192;function wa(t,l,e){if(t.subtreeFlags&Bu)for(t=t.child;t!==null;)vd(t,l,e),t=t.sibling}function vd(t,l,e){switch(t.tag){case 26:wa(t,l,e),t.flags&Bu&&t.memoizedState!==null&&Qm(e,Gl,t.memoizedState,t.memoizedProps);break;case 5:wa(t,l,e);break;case 3:case 4:var a=Gl;Gl=li(t.stateNode.containerInfo),wa(t,l,e),Gl=a;break;case 22:t.memoizedState===null&&(a=t.alternate,a!==null&&a.memoizedState!==null?(a=Bu,Bu=16777216,wa(t,l,e),Bu=a):wa(t,l,e));break;default:wa(t,l,e)}}function yd(t){var l=t.alternate;if(l!==null&&(t=l.child,t!==null)){l.child=null;do l=t.sibling,t.sibling=null,t=l;while(t!==null)}}function qu(t){var l=t.deletions;if((t.flags&16)!==0){if(l!==null)for(var e=0;e<l.length;e++){var a=l[e];Lt=a,gd(a,t)}yd(t)}if(t.subtreeFlags&10256)for(t=t.child;t!==null;)hd(t),t=t.sibling}function hd(t){switch(t.tag){case 0:case 11:case 15:qu(t),t.flags&2048&&Ce(9,t,t.return);break;case 3:qu(t);break;case 12:qu(t);break;case 22:var l=t.stateNode;t.memoizedState!==null&&l._visibility&2&&(t.return===null||t.return.tag!==13)?(l._visibility&=-3,Zn(t)):qu(t);break;default:qu(t)}}function Zn(t){var l=t.deletions;if((t.flags&16)!==0){if(l!==null)for(var e=0;e<l.length;e++){var a=l[e];Lt=a,gd(a,t)}yd(t)}for(t=t.child;t!==null;){switch(l=t,l.tag){case 0:case 11:case 15:Ce(8,l,l.return),Zn(l);break;case 22:e=l.stateNode,e._visibility&2&&(e._visibility&=-3,Zn(l));break;default:Zn(l)}t=t.sibling}}function gd(t,l){for(;Lt!==null;){var e=Lt;switch(e.tag){case 0:case 11:case 15:Ce(8,e,l);break;case 23:case 22:if(e.memoizedState!==null&&e.memoizedState.cachePool!==null){var a=e.memoizedState.cachePool.pool;a!=null&&a.refCount++}break;case 24:pu(e.memoizedState.cache)}if(a=e.child,a!==null)a.return=e,Lt=a;else t:for(e=t;Lt!==null;){a=Lt;var u=a.sibling,n=a.return;if(cd(a),a===e){Lt=null;break t}if(u!==null){u.return=n,Lt=u;break t}Lt=n}}}var lm={getCacheForType:function(t){var l=wt(jt),e=l.data.get(t);return e===void 0&&(e=t(),l.data.set(t,e)),e},cacheSignal:function(){return wt(jt).controller.signal}},em=typeof WeakMap=="function"?WeakMap:Map,ft=0,pt=null,$=null,I=0,dt=0,pl=null,Ue=!1,Wa=!1,wc=!1,ve=0,Ct=0,Re=0,va=0,Wc=0,El=0,ka=0,Yu=null,rl=null,kc=!1,Ln=0,Sd=0,Vn=1/0,Kn=null,je=null,Gt=0,He=null,$a=null,ye=0,$c=0,Fc=null,bd=null,Gu=0,Ic=null;function xl(){return(ft&2)!==0&&I!==0?I&-I:g.T!==null?uf():yl()}function pd(){if(El===0)if((I&536870912)===0||tt){var t=ga;ga<<=1,(ga&3932160)===0&&(ga=262144),El=t}else El=536870912;return t=Sl.current,t!==null&&(t.flags|=32),El}function ml(t,l,e){(t===pt&&(dt===2||dt===9)||t.cancelPendingCommit!==null)&&(Fa(t,0),Be(t,I,El,!1)),z(t,e),((ft&2)===0||t!==pt)&&(t===pt&&((ft&2)===0&&(va|=e),Ct===4&&Be(t,I,El,!1)),wl(t))}function Ed(t,l,e){if((ft&6)!==0)throw Error(r(327));var a=!e&&(l&127)===0&&(l&t.expiredLanes)===0||$e(t,l),u=a?nm(t,l):tf(t,l,!0),n=a;do{if(u===0){Wa&&!a&&Be(t,l,0,!1);break}else{if(e=t.current.alternate,n&&!am(e)){u=tf(t,l,!1),n=!1;continue}if(u===2){if(n=l,t.errorRecoveryDisabledLanes&n)var i=0;else i=t.pendingLanes&-536870913,i=i!==0?i:i&536870912?536870912:0;if(i!==0){l=i;t:{var c=t;u=Yu;var f=c.current.memoizedState.isDehydrated;if(f&&(Fa(c,i).flags|=256),i=tf(c,i,!1),i!==2){if(wc&&!f){c.errorRecoveryDisabledLanes|=n,va|=n,u=4;break t}n=rl,rl=u,n!==null&&(rl===null?rl=n:rl.push.apply(rl,n))}u=i}if(n=!1,u!==2)continue}}if(u===1){Fa(t,0),Be(t,l,0,!0);break}t:{switch(a=t,n=u,n){case 0:case 1:throw Error(r(345));case 4:if((l&4194048)!==l)break;case 6:Be(a,l,El,!Ue);break t;case 2:rl=null;break;case 3:case 5:break;default:throw Error(r(329))}if((l&62914560)===l&&(u=Ln+300-zt(),10<u)){if(Be(a,l,El,!Ue),ba(a,0,!0)!==0)break t;ye=l,a.timeoutHandle=Id(xd.bind(null,a,e,rl,Kn,kc,l,El,va,ka,Ue,n,"Throttled",-0,0),u);break t}xd(a,e,rl,Kn,kc,l,El,va,ka,Ue,n,null,-0,0)}}break}while(!0);wl(t)}function xd(t,l,e,a,u,n,i,c,f,v,S,E,y,h){if(t.timeoutHandle=-1,E=l.subtreeFlags,E&8192||(E&16785408)===16785408){E={stylesheets:null,count:0,imgCount:0,imgBytes:0,suspenseyImages:[],waitingForImages:!0,waitingForViewTransition:!1,unsuspend:te},vd(l,n,E);var M=(n&62914560)===n?Ln-zt():(n&4194048)===n?Sd-zt():0;if(M=Xm(E,M),M!==null){ye=n,t.cancelPendingCommit=M(Dd.bind(null,t,l,n,e,a,u,i,c,f,S,E,null,y,h)),Be(t,n,i,!v);return}}Dd(t,l,n,e,a,u,i,c,f)}function am(t){for(var l=t;;){var e=l.tag;if((e===0||e===11||e===15)&&l.flags&16384&&(e=l.updateQueue,e!==null&&(e=e.stores,e!==null)))for(var a=0;a<e.length;a++){var u=e[a],n=u.getSnapshot;u=u.value;try{if(!hl(n(),u))return!1}catch{return!1}}if(e=l.child,l.subtreeFlags&16384&&e!==null)e.return=l,l=e;else{if(l===t)break;for(;l.sibling===null;){if(l.return===null||l.return===t)return!0;l=l.return}l.sibling.return=l.return,l=l.sibling}}return!0}function Be(t,l,e,a){l&=~Wc,l&=~va,t.suspendedLanes|=l,t.pingedLanes&=~l,a&&(t.warmLanes|=l),a=t.expirationTimes;for(var u=l;0<u;){var n=31-el(u),i=1<<n;a[n]=-1,u&=~i}e!==0&&V(t,e,l)}function Jn(){return(ft&6)===0?(Qu(0),!1):!0}function Pc(){if($!==null){if(dt===0)var t=$.return;else t=$,ue=na=null,yc(t),Xa=null,xu=0,t=$;for(;t!==null;)Po(t.alternate,t),t=t.return;$=null}}function Fa(t,l){var e=t.timeoutHandle;e!==-1&&(t.timeoutHandle=-1,Am(e)),e=t.cancelPendingCommit,e!==null&&(t.cancelPendingCommit=null,e()),ye=0,Pc(),pt=t,$=e=ee(t.current,null),I=l,dt=0,pl=null,Ue=!1,Wa=$e(t,l),wc=!1,ka=El=Wc=va=Re=Ct=0,rl=Yu=null,kc=!1,(l&8)!==0&&(l|=l&32);var a=t.entangledLanes;if(a!==0)for(t=t.entanglements,a&=l;0<a;){var u=31-el(a),n=1<<u;l|=t[u],a&=~n}return ve=l,mn(),e}function Ad(t,l){K=null,g.H=Du,l===Qa||l===En?(l=Ys(),dt=3):l===ac?(l=Ys(),dt=4):dt=l===Cc?8:l!==null&&typeof l=="object"&&typeof l.then=="function"?6:1,pl=l,$===null&&(Ct=1,Hn(t,Ml(l,t.current)))}function zd(){var t=Sl.current;return t===null?!0:(I&4194048)===I?Rl===null:(I&62914560)===I||(I&536870912)!==0?t===Rl:!1}function Td(){var t=g.H;return g.H=Du,t===null?Du:t}function _d(){var t=g.A;return g.A=lm,t}function wn(){Ct=4,Ue||(I&4194048)!==I&&Sl.current!==null||(Wa=!0),(Re&134217727)===0&&(va&134217727)===0||pt===null||Be(pt,I,El,!1)}function tf(t,l,e){var a=ft;ft|=2;var u=Td(),n=_d();(pt!==t||I!==l)&&(Kn=null,Fa(t,l)),l=!1;var i=Ct;t:do try{if(dt!==0&&$!==null){var c=$,f=pl;switch(dt){case 8:Pc(),i=6;break t;case 3:case 2:case 9:case 6:Sl.current===null&&(l=!0);var v=dt;if(dt=0,pl=null,Ia(t,c,f,v),e&&Wa){i=0;break t}break;default:v=dt,dt=0,pl=null,Ia(t,c,f,v)}}um(),i=Ct;break}catch(S){Ad(t,S)}while(!0);return l&&t.shellSuspendCounter++,ue=na=null,ft=a,g.H=u,g.A=n,$===null&&(pt=null,I=0,mn()),i}function um(){for(;$!==null;)Od($)}function nm(t,l){var e=ft;ft|=2;var a=Td(),u=_d();pt!==t||I!==l?(Kn=null,Vn=zt()+500,Fa(t,l)):Wa=$e(t,l);t:do try{if(dt!==0&&$!==null){l=$;var n=pl;l:switch(dt){case 1:dt=0,pl=null,Ia(t,l,n,1);break;case 2:case 9:if(Bs(n)){dt=0,pl=null,Nd(l);break}l=function(){dt!==2&&dt!==9||pt!==t||(dt=7),wl(t)},n.then(l,l);break t;case 3:dt=7;break t;case 4:dt=5;break t;case 7:Bs(n)?(dt=0,pl=null,Nd(l)):(dt=0,pl=null,Ia(t,l,n,7));break;case 5:var i=null;switch($.tag){case 26:i=$.memoizedState;case 5:case 27:var c=$;if(i?mr(i):c.stateNode.complete){dt=0,pl=null;var f=c.sibling;if(f!==null)$=f;else{var v=c.return;v!==null?($=v,Wn(v)):$=null}break l}}dt=0,pl=null,Ia(t,l,n,5);break;case 6:dt=0,pl=null,Ia(t,l,n,6);break;case 8:Pc(),Ct=6;break t;default:throw Error(r(462))}}im();break}catch(S){Ad(t,S)}while(!0);return ue=na=null,g.H=a,g.A=u,ft=e,$!==null?0:(pt=null,I=0,mn(),Ct)}function im(){for(;$!==null&&!St();)Od($)}function Od(t){var l=Fo(t.alternate,t,ve);t.memoizedProps=t.pendingProps,l===null?Wn(t):$=l}function Nd(t){var l=t,e=l.alternate;switch(l.tag){case 15:case 0:l=Ko(e,l,l.pendingProps,l.type,void 0,I);break;case 11:l=Ko(e,l,l.pendingProps,l.type.render,l.ref,I);break;case 5:yc(l);default:Po(e,l),l=$=Ts(l,ve),l=Fo(e,l,ve)}t.memoizedProps=t.pendingProps,l===null?Wn(t):$=l}function Ia(t,l,e,a){ue=na=null,yc(l),Xa=null,xu=0;var u=l.return;try{if(W0(t,u,l,e,I)){Ct=1,Hn(t,Ml(e,t.current)),$=null;return}}catch(n){if(u!==null)throw $=u,n;Ct=1,Hn(t,Ml(e,t.current)),$=null;return}l.flags&32768?(tt||a===1?t=!0:Wa||(I&536870912)!==0?t=!1:(Ue=t=!0,(a===2||a===9||a===3||a===6)&&(a=Sl.current,a!==null&&a.tag===13&&(a.flags|=16384))),Md(l,t)):Wn(l)}function Wn(t){var l=t;do{if((l.flags&32768)!==0){Md(l,Ue);return}t=l.return;var e=F0(l.alternate,l,ve);if(e!==null){$=e;return}if(l=l.sibling,l!==null){$=l;return}$=l=t}while(l!==null);Ct===0&&(Ct=5)}function Md(t,l){do{var e=I0(t.alternate,t);if(e!==null){e.flags&=32767,$=e;return}if(e=t.return,e!==null&&(e.flags|=32768,e.subtreeFlags=0,e.deletions=null),!l&&(t=t.sibling,t!==null)){$=t;return}$=t=e}while(t!==null);Ct=6,$=null}function Dd(t,l,e,a,u,n,i,c,f){t.cancelPendingCommit=null;do kn();while(Gt!==0);if((ft&6)!==0)throw Error(r(327));if(l!==null){if(l===t.current)throw Error(r(177));if(n=l.lanes|l.childLanes,n|=Zi,_(t,e,n,i,c,f),t===pt&&($=pt=null,I=0),$a=l,He=t,ye=e,$c=n,Fc=u,bd=a,(l.subtreeFlags&10256)!==0||(l.flags&10256)!==0?(t.callbackNode=null,t.callbackPriority=0,om(we,function(){return Hd(),null})):(t.callbackNode=null,t.callbackPriority=0),a=(l.flags&13878)!==0,(l.subtreeFlags&13878)!==0||a){a=g.T,g.T=null,u=N.p,N.p=2,i=ft,ft|=4;try{P0(t,l,e)}finally{ft=i,N.p=u,g.T=a}}Gt=1,Cd(),Ud(),Rd()}}function Cd(){if(Gt===1){Gt=0;var t=He,l=$a,e=(l.flags&13878)!==0;if((l.subtreeFlags&13878)!==0||e){e=g.T,g.T=null;var a=N.p;N.p=2;var u=ft;ft|=4;try{dd(l,t);var n=mf,i=hs(t.containerInfo),c=n.focusedElem,f=n.selectionRange;if(i!==c&&c&&c.ownerDocument&&ys(c.ownerDocument.documentElement,c)){if(f!==null&&qi(c)){var v=f.start,S=f.end;if(S===void 0&&(S=v),"selectionStart"in c)c.selectionStart=v,c.selectionEnd=Math.min(S,c.value.length);else{var E=c.ownerDocument||document,y=E&&E.defaultView||window;if(y.getSelection){var h=y.getSelection(),M=c.textContent.length,G=Math.min(f.start,M),ht=f.end===void 0?G:Math.min(f.end,M);!h.extend&&G>ht&&(i=ht,ht=G,G=i);var d=vs(c,G),s=vs(c,ht);if(d&&s&&(h.rangeCount!==1||h.anchorNode!==d.node||h.anchorOffset!==d.offset||h.focusNode!==s.node||h.focusOffset!==s.offset)){var m=E.createRange();m.setStart(d.node,d.offset),h.removeAllRanges(),G>ht?(h.addRange(m),h.extend(s.node,s.offset)):(m.setEnd(s.node,s.offset),h.addRange(m))}}}}for(E=[],h=c;h=h.parentNode;)h.nodeType===1&&E.push({element:h,left:h.scrollLeft,top:h.scrollTop});for(typeof c.focus=="function"&&c.focus(),c=0;c<E.length;c++){var p=E[c];p.element.scrollLeft=p.left,p.element.scrollTop=p.top}}ci=!!rf,mf=rf=null}finally{ft=u,N.p=a,g.T=e}}t.current=l,Gt=2}}function Ud(){if(Gt===2){Gt=0;var t=He,l=$a,e=(l.flags&8772)!==0;if((l.subtreeFlags&8772)!==0||e){e=g.T,g.T=null;var a=N.p;N.p=2;var u=ft;ft|=4;try{id(t,l.alternate,l)}finally{ft=u,N.p=a,g.T=e}}Gt=3}}function Rd(){if(Gt===4||Gt===3){Gt=0,vi();var t=He,l=$a,e=ye,a=bd;(l.subtreeFlags&10256)!==0||(l.flags&10256)!==0?Gt=5:(Gt=0,$a=He=null,jd(t,t.pendingLanes));var u=t.pendingLanes;if(u===0&&(je=null),Tt(e),l=l.stateNode,ll&&typeof ll.onCommitFiberRoot=="function")try{ll.onCommitFiberRoot(ke,l,void 0,(l.current.flags&128)===128)}catch{}if(a!==null){l=g.T,u=N.p,N.p=2,g.T=null;try{for(var n=t.onRecoverableError,i=0;i<a.length;i++){var c=a[i];n(c.value,{componentStack:c.stack})}}finally{g.T=l,N.p=u}}(ye&3)!==0&&kn(),wl(t),u=t.pendingLanes,(e&261930)!==0&&(u&42)!==0?t===Ic?Gu++:(Gu=0,Ic=t):Gu=0,Qu(0)}}function jd(t,l){(t.pooledCacheLanes&=l)===0&&(l=t.pooledCache,l!=null&&(t.pooledCache=null,pu(l)))}function kn(){return Cd(),Ud(),Rd(),Hd()}function Hd(){if(Gt!==5)return!1;var t=He,l=$c;$c=0;var e=Tt(ye),a=g.T,u=N.p;try{N.p=32>e?32:e,g.T=null,e=Fc,Fc=null;var n=He,i=ye;if(Gt=0,$a=He=null,ye=0,(ft&6)!==0)throw Error(r(331));var c=ft;if(ft|=4,hd(n.current),md(n,n.current,i,e),ft=c,Qu(0,!1),ll&&typeof ll.onPostCommitFiberRoot=="function")try{ll.onPostCommitFiberRoot(ke,n)}catch{}return!0}finally{N.p=u,g.T=a,jd(t,l)}}function Bd(t,l,e){l=Ml(e,l),l=Dc(t.stateNode,l,2),t=Ne(t,l,2),t!==null&&(z(t,2),wl(t))}function rt(t,l,e){if(t.tag===3)Bd(t,t,e);else for(;l!==null;){if(l.tag===3){Bd(l,t,e);break}else if(l.tag===1){var a=l.stateNode;if(typeof l.type.getDerivedStateFromError=="function"||typeof a.componentDidCatch=="function"&&(je===null||!je.has(a))){t=Ml(e,t),e=qo(2),a=Ne(l,e,2),a!==null&&(Yo(e,a,l,t),z(a,2),wl(a));break}}l=l.return}}function lf(t,l,e){var a=t.pingCache;if(a===null){a=t.pingCache=new em;var u=new Set;a.set(l,u)}else u=a.get(l),u===void 0&&(u=new Set,a.set(l,u));u.has(e)||(wc=!0,u.add(e),t=cm.bind(null,t,l,e),l.then(t,t))}function cm(t,l,e){var a=t.pingCache;a!==null&&a.delete(l),t.pingedLanes|=t.suspendedLanes&e,t.warmLanes&=~e,pt===t&&(I&e)===e&&(Ct===4||Ct===3&&(I&62914560)===I&&300>zt()-Ln?(ft&2)===0&&Fa(t,0):Wc|=e,ka===I&&(ka=0)),wl(t)}function qd(t,l){l===0&&(l=pa()),t=ea(t,l),t!==null&&(z(t,l),wl(t))}function fm(t){var l=t.memoizedState,e=0;l!==null&&(e=l.retryLane),qd(t,e)}function sm(t,l){var e=0;switch(t.tag){case 31:case 13:var a=t.stateNode,u=t.memoizedState;u!==null&&(e=u.retryLane);break;case 19:a=t.stateNode;break;case 22:a=t.stateNode._retryCache;break;default:throw Error(r(314))}a!==null&&a.delete(l),qd(t,e)}function om(t,l){return ql(t,l)}var $n=null,Pa=null,ef=!1,Fn=!1,af=!1,qe=0;function wl(t){t!==Pa&&t.next===null&&(Pa===null?$n=Pa=t:Pa=Pa.next=t),Fn=!0,ef||(ef=!0,rm())}function Qu(t,l){if(!af&&Fn){af=!0;do for(var e=!1,a=$n;a!==null;){if(t!==0){var u=a.pendingLanes;if(u===0)var n=0;else{var i=a.suspendedLanes,c=a.pingedLanes;n=(1<<31-el(42|t)+1)-1,n&=u&~(i&~c),n=n&201326741?n&201326741|1:n?n|2:0}n!==0&&(e=!0,Xd(a,n))}else n=I,n=ba(a,a===pt?n:0,a.cancelPendingCommit!==null||a.timeoutHandle!==-1),(n&3)===0||$e(a,n)||(e=!0,Xd(a,n));a=a.next}while(e);af=!1}}function dm(){Yd()}function Yd(){Fn=ef=!1;var t=0;qe!==0&&xm()&&(t=qe);for(var l=zt(),e=null,a=$n;a!==null;){var u=a.next,n=Gd(a,l);n===0?(a.next=null,e===null?$n=u:e.next=u,u===null&&(Pa=e)):(e=a,(t!==0||(n&3)!==0)&&(Fn=!0)),a=u}Gt!==0&&Gt!==5||Qu(t),qe!==0&&(qe=0)}function Gd(t,l){for(var e=t.suspendedLanes,a=t.pingedLanes,u=t.expirationTimes,n=t.pendingLanes&-62914561;0<n;){var i=31-el(n),c=1<<i,f=u[i];f===-1?((c&e)===0||(c&a)!==0)&&(u[i]=iu(c,l)):f<=l&&(t.expiredLanes|=c),n&=~c}if(l=pt,e=I,e=ba(t,t===l?e:0,t.cancelPendingCommit!==null||t.timeoutHandle!==-1),a=t.callbackNode,e===0||t===l&&(dt===2||dt===9)||t.cancelPendingCommit!==null)return a!==null&&a!==null&&Je(a),t.callbackNode=null,t.callbackPriority=0;if((e&3)===0||$e(t,e)){if(l=e&-e,l===t.callbackPriority)return l;switch(a!==null&&Je(a),Tt(e)){case 2:case 8:e=uu;break;case 32:e=we;break;case 268435456:e=We;break;default:e=we}return a=Qd.bind(null,t),e=ql(e,a),t.callbackPriority=l,t.callbackNode=e,l}return a!==null&&a!==null&&Je(a),t.callbackPriority=2,t.callbackNode=null,2}function Qd(t,l){if(Gt!==0&&Gt!==5)return t.callbackNode=null,t.callbackPriority=0,null;var e=t.callbackNode;if(kn()&&t.callbackNode!==e)return null;var a=I;return a=ba(t,t===pt?a:0,t.cancelPendingCommit!==null||t.timeoutHandle!==-1),a===0?null:(Ed(t,a,l),Gd(t,zt()),t.callbackNode!=null&&t.callbackNode===e?Qd.bind(null,t):null)}function Xd(t,l){if(kn())return null;Ed(t,l,!0)}function rm(){zm(function(){(ft&6)!==0?ql(Il,dm):Yd()})}function uf(){if(qe===0){var t=Ya;t===0&&(t=ha,ha<<=1,(ha&261888)===0&&(ha=256)),qe=t}return qe}function Zd(t){return t==null||typeof t=="symbol"||typeof t=="boolean"?null:typeof t=="function"?t:un(""+t)}function Ld(t,l){var e=l.ownerDocument.createElement("input");return e.name=l.name,e.value=l.value,t.id&&e.setAttribute("form",t.id),l.parentNode.insertBefore(e,l),t=new FormData(t),e.parentNode.removeChild(e),t}function mm(t,l,e,a,u){if(l==="submit"&&e&&e.stateNode===u){var n=Zd((u[Et]||null).action),i=a.submitter;i&&(l=(l=i[Et]||null)?Zd(l.formAction):i.getAttribute("formAction"),l!==null&&(n=l,i=null));var c=new sn("action","action",null,a,u);t.push({event:c,listeners:[{instance:null,listener:function(){if(a.defaultPrevented){if(qe!==0){var f=i?Ld(u,i):new FormData(u);zc(e,{pending:!0,data:f,method:u.method,action:n},null,f)}}else typeof n=="function"&&(c.preventDefault(),f=i?Ld(u,i):new FormData(u),zc(e,{pending:!0,data:f,method:u.method,action:n},n,f))},currentTarget:u}]})}}for(var nf=0;nf<Xi.length;nf++){var cf=Xi[nf],vm=cf.toLowerCase(),ym=cf[0].toUpperCase()+cf.slice(1);Yl(vm,"on"+ym)}Yl(bs,"onAnimationEnd"),Yl(ps,"onAnimationIteration"),Yl(Es,"onAnimationStart"),Yl("dblclick","onDoubleClick"),Yl("focusin","onFocus"),Yl("focusout","onBlur"),Yl(C0,"onTransitionRun"),Yl(U0,"onTransitionStart"),Yl(R0,"onTransitionCancel"),Yl(xs,"onTransitionEnd"),za("onMouseEnter",["mouseout","mouseover"]),za("onMouseLeave",["mouseout","mouseover"]),za("onPointerEnter",["pointerout","pointerover"]),za("onPointerLeave",["pointerout","pointerover"]),Ie("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),Ie("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),Ie("onBeforeInput",["compositionend","keypress","textInput","paste"]),Ie("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),Ie("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),Ie("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Xu="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),hm=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(Xu));function Vd(t,l){l=(l&4)!==0;for(var e=0;e<t.length;e++){var a=t[e],u=a.event;a=a.listeners;t:{var n=void 0;if(l)for(var i=a.length-1;0<=i;i--){var c=a[i],f=c.instance,v=c.currentTarget;if(c=c.listener,f!==n&&u.isPropagationStopped())break t;n=c,u.currentTarget=v;try{n(u)}catch(S){rn(S)}u.currentTarget=null,n=f}else for(i=0;i<a.length;i++){if(c=a[i],f=c.instance,v=c.currentTarget,c=c.listener,f!==n&&u.isPropagationStopped())break t;n=c,u.currentTarget=v;try{n(u)}catch(S){rn(S)}u.currentTarget=null,n=f}}}}function F(t,l){var e=l[bi];e===void 0&&(e=l[bi]=new Set);var a=t+"__bubble";e.has(a)||(Kd(l,t,2,!1),e.add(a))}function ff(t,l,e){var a=0;l&&(a|=4),Kd(e,t,a,l)}var In="_reactListening"+Math.random().toString(36).slice(2);function sf(t){if(!t[In]){t[In]=!0,qf.forEach(function(e){e!=="selectionchange"&&(hm.has(e)||ff(e,!1,t),ff(e,!0,t))});var l=t.nodeType===9?t:t.ownerDocument;l===null||l[In]||(l[In]=!0,ff("selectionchange",!1,l))}}function Kd(t,l,e,a){switch(pr(l)){case 2:var u=Vm;break;case 8:u=Km;break;default:u=zf}e=u.bind(null,l,e,t),u=void 0,!Ni||l!=="touchstart"&&l!=="touchmove"&&l!=="wheel"||(u=!0),a?u!==void 0?t.addEventListener(l,e,{capture:!0,passive:u}):t.addEventListener(l,e,!0):u!==void 0?t.addEventListener(l,e,{passive:u}):t.addEventListener(l,e,!1)}function of(t,l,e,a,u){var n=a;if((l&1)===0&&(l&2)===0&&a!==null)t:for(;;){if(a===null)return;var i=a.tag;if(i===3||i===4){var c=a.stateNode.containerInfo;if(c===u)break;if(i===4)for(i=a.return;i!==null;){var f=i.tag;if((f===3||f===4)&&i.stateNode.containerInfo===u)return;i=i.return}for(;c!==null;){if(i=Ea(c),i===null)return;if(f=i.tag,f===5||f===6||f===26||f===27){a=n=i;continue t}c=c.parentNode}}a=a.return}kf(function(){var v=n,S=_i(e),E=[];t:{var y=As.get(t);if(y!==void 0){var h=sn,M=t;switch(t){case"keypress":if(cn(e)===0)break t;case"keydown":case"keyup":h=s0;break;case"focusin":M="focus",h=Ui;break;case"focusout":M="blur",h=Ui;break;case"beforeblur":case"afterblur":h=Ui;break;case"click":if(e.button===2)break t;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":h=If;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":h=Fr;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":h=r0;break;case bs:case ps:case Es:h=t0;break;case xs:h=v0;break;case"scroll":case"scrollend":h=kr;break;case"wheel":h=h0;break;case"copy":case"cut":case"paste":h=e0;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":h=ts;break;case"toggle":case"beforetoggle":h=S0}var G=(l&4)!==0,ht=!G&&(t==="scroll"||t==="scrollend"),d=G?y!==null?y+"Capture":null:y;G=[];for(var s=v,m;s!==null;){var p=s;if(m=p.stateNode,p=p.tag,p!==5&&p!==26&&p!==27||m===null||d===null||(p=su(s,d),p!=null&&G.push(Zu(s,p,m))),ht)break;s=s.return}0<G.length&&(y=new h(y,M,null,e,S),E.push({event:y,listeners:G}))}}if((l&7)===0){t:{if(y=t==="mouseover"||t==="pointerover",h=t==="mouseout"||t==="pointerout",y&&e!==Ti&&(M=e.relatedTarget||e.fromElement)&&(Ea(M)||M[pe]))break t;if((h||y)&&(y=S.window===S?S:(y=S.ownerDocument)?y.defaultView||y.parentWindow:window,h?(M=e.relatedTarget||e.toElement,h=v,M=M?Ea(M):null,M!==null&&(ht=k(M),G=M.tag,M!==ht||G!==5&&G!==27&&G!==6)&&(M=null)):(h=null,M=v),h!==M)){if(G=If,p="onMouseLeave",d="onMouseEnter",s="mouse",(t==="pointerout"||t==="pointerover")&&(G=ts,p="onPointerLeave",d="onPointerEnter",s="pointer"),ht=h==null?y:fu(h),m=M==null?y:fu(M),y=new G(p,s+"leave",h,e,S),y.target=ht,y.relatedTarget=m,p=null,Ea(S)===v&&(G=new G(d,s+"enter",M,e,S),G.target=m,G.relatedTarget=ht,p=G),ht=p,h&&M)l:{for(G=gm,d=h,s=M,m=0,p=d;p;p=G(p))m++;p=0;for(var B=s;B;B=G(B))p++;for(;0<m-p;)d=G(d),m--;for(;0<p-m;)s=G(s),p--;for(;m--;){if(d===s||s!==null&&d===s.alternate){G=d;break l}d=G(d),s=G(s)}G=null}else G=null;h!==null&&Jd(E,y,h,G,!1),M!==null&&ht!==null&&Jd(E,ht,M,G,!0)}}t:{if(y=v?fu(v):window,h=y.nodeName&&y.nodeName.toLowerCase(),h==="select"||h==="input"&&y.type==="file")var nt=fs;else if(is(y))if(ss)nt=N0;else{nt=_0;var C=T0}else h=y.nodeName,!h||h.toLowerCase()!=="input"||y.type!=="checkbox"&&y.type!=="radio"?v&&zi(v.elementType)&&(nt=fs):nt=O0;if(nt&&(nt=nt(t,v))){cs(E,nt,e,S);break t}C&&C(t,y,v),t==="focusout"&&v&&y.type==="number"&&v.memoizedProps.value!=null&&Ai(y,"number",y.value)}switch(C=v?fu(v):window,t){case"focusin":(is(C)||C.contentEditable==="true")&&(Da=C,Yi=v,gu=null);break;case"focusout":gu=Yi=Da=null;break;case"mousedown":Gi=!0;break;case"contextmenu":case"mouseup":case"dragend":Gi=!1,gs(E,e,S);break;case"selectionchange":if(D0)break;case"keydown":case"keyup":gs(E,e,S)}var w;if(ji)t:{switch(t){case"compositionstart":var P="onCompositionStart";break t;case"compositionend":P="onCompositionEnd";break t;case"compositionupdate":P="onCompositionUpdate";break t}P=void 0}else Ma?us(t,e)&&(P="onCompositionEnd"):t==="keydown"&&e.keyCode===229&&(P="onCompositionStart");P&&(ls&&e.locale!=="ko"&&(Ma||P!=="onCompositionStart"?P==="onCompositionEnd"&&Ma&&(w=$f()):(Ee=S,Mi="value"in Ee?Ee.value:Ee.textContent,Ma=!0)),C=Pn(v,P),0<C.length&&(P=new Pf(P,t,null,e,S),E.push({event:P,listeners:C}),w?P.data=w:(w=ns(e),w!==null&&(P.data=w)))),(w=p0?E0(t,e):x0(t,e))&&(P=Pn(v,"onBeforeInput"),0<P.length&&(C=new Pf("onBeforeInput","beforeinput",null,e,S),E.push({event:C,listeners:P}),C.data=w)),mm(E,t,v,e,S)}Vd(E,l)})}function Zu(t,l,e){return{instance:t,listener:l,currentTarget:e}}function Pn(t,l){for(var e=l+"Capture",a=[];t!==null;){var u=t,n=u.stateNode;if(u=u.tag,u!==5&&u!==26&&u!==27||n===null||(u=su(t,e),u!=null&&a.unshift(Zu(t,u,n)),u=su(t,l),u!=null&&a.push(Zu(t,u,n))),t.tag===3)return a;t=t.return}return[]}function gm(t){if(t===null)return null;do t=t.return;while(t&&t.tag!==5&&t.tag!==27);return t||null}function Jd(t,l,e,a,u){for(var n=l._reactName,i=[];e!==null&&e!==a;){var c=e,f=c.alternate,v=c.stateNode;if(c=c.tag,f!==null&&f===a)break;c!==5&&c!==26&&c!==27||v===null||(f=v,u?(v=su(e,n),v!=null&&i.unshift(Zu(e,v,f))):u||(v=su(e,n),v!=null&&i.push(Zu(e,v,f)))),e=e.return}i.length!==0&&t.push({event:l,listeners:i})}var Sm=/\r\n?/g,bm=/\u0000|\uFFFD/g;function wd(t){return(typeof t=="string"?t:""+t).replace(Sm,`
-`).replace(bm,"")}function Wd(t,l){return l=wd(l),wd(t)===l}function yt(t,l,e,a,u,n){switch(e){case"children":typeof a=="string"?l==="body"||l==="textarea"&&a===""||_a(t,a):(typeof a=="number"||typeof a=="bigint")&&l!=="body"&&_a(t,""+a);break;case"className":en(t,"class",a);break;case"tabIndex":en(t,"tabindex",a);break;case"dir":case"role":case"viewBox":case"width":case"height":en(t,e,a);break;case"style":wf(t,a,n);break;case"data":if(l!=="object"){en(t,"data",a);break}case"src":case"href":if(a===""&&(l!=="a"||e!=="href")){t.removeAttribute(e);break}if(a==null||typeof a=="function"||typeof a=="symbol"||typeof a=="boolean"){t.removeAttribute(e);break}a=un(""+a),t.setAttribute(e,a);break;case"action":case"formAction":if(typeof a=="function"){t.setAttribute(e,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(e==="formAction"?(l!=="input"&&yt(t,l,"name",u.name,u,null),yt(t,l,"formEncType",u.formEncType,u,null),yt(t,l,"formMethod",u.formMethod,u,null),yt(t,l,"formTarget",u.formTarget,u,null)):(yt(t,l,"encType",u.encType,u,null),yt(t,l,"method",u.method,u,null),yt(t,l,"target",u.target,u,null)));if(a==null||typeof a=="symbol"||typeof a=="boolean"){t.removeAttribute(e);break}a=un(""+a),t.setAttribute(e,a);break;case"onClick":a!=null&&(t.onclick=te);break;case"onScroll":a!=null&&F("scroll",t);break;case"onScrollEnd":a!=null&&F("scrollend",t);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(r(61));if(e=a.__html,e!=null){if(u.children!=null)throw Error(r(60));t.innerHTML=e}}break;case"multiple":t.multiple=a&&typeof a!="function"&&typeof a!="symbol";break;case"muted":t.muted=a&&typeof a!="function"&&typeof a!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(a==null||typeof a=="function"||typeof a=="boolean"||typeof a=="symbol"){t.removeAttribute("xlink:href");break}e=un(""+a),t.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",e);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":a!=null&&typeof a!="function"&&typeof a!="symbol"?t.setAttribute(e,""+a):t.removeAttribute(e);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":a&&typeof a!="function"&&typeof a!="symbol"?t.setAttribute(e,""):t.removeAttribute(e);break;case"capture":case"download":a===!0?t.setAttribute(e,""):a!==!1&&a!=null&&typeof a!="function"&&typeof a!="symbol"?t.setAttribute(e,a):t.removeAttribute(e);break;case"cols":case"rows":case"size":case"span":a!=null&&typeof a!="function"&&typeof a!="symbol"&&!isNaN(a)&&1<=a?t.setAttribute(e,a):t.removeAttribute(e);break;case"rowSpan":case"start":a==null||typeof a=="function"||typeof a=="symbol"||isNaN(a)?t.removeAttribute(e):t.setAttribute(e,a);break;case"popover":F("beforetoggle",t),F("toggle",t),ln(t,"popover",a);break;case"xlinkActuate":Pl(t,"http://www.w3.org/1999/xlink","xlink:actuate",a);break;case"xlinkArcrole":Pl(t,"http://www.w3.org/1999/xlink","xlink:arcrole",a);break;case"xlinkRole":Pl(t,"http://www.w3.org/1999/xlink","xlink:role",a);break;case"xlinkShow":Pl(t,"http://www.w3.org/1999/xlink","xlink:show",a);break;case"xlinkTitle":Pl(t,"http://www.w3.org/1999/xlink","xlink:title",a);break;case"xlinkType":Pl(t,"http://www.w3.org/1999/xlink","xlink:type",a);break;case"xmlBase":Pl(t,"http://www.w3.org/XML/1998/namespace","xml:base",a);break;case"xmlLang":Pl(t,"http://www.w3.org/XML/1998/namespace","xml:lang",a);break;case"xmlSpace":Pl(t,"http://www.w3.org/XML/1998/namespace","xml:space",a);break;case"is":ln(t,"is",a);break;case"innerText":case"textContent":break;default:(!(2<e.length)||e[0]!=="o"&&e[0]!=="O"||e[1]!=="n"&&e[1]!=="N")&&(e=wr.get(e)||e,ln(t,e,a))}}function df(t,l,e,a,u,n){switch(e){case"style":wf(t,a,n);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(r(61));if(e=a.__html,e!=null){if(u.children!=null)throw Error(r(60));t.innerHTML=e}}break;case"children":typeof a=="string"?_a(t,a):(typeof a=="number"||typeof a=="bigint")&&_a(t,""+a);break;case"onScroll":a!=null&&F("scroll",t);break;case"onScrollEnd":a!=null&&F("scrollend",t);break;case"onClick":a!=null&&(t.onclick=te);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!Yf.hasOwnProperty(e))t:{if(e[0]==="o"&&e[1]==="n"&&(u=e.endsWith("Capture"),l=e.slice(2,u?e.length-7:void 0),n=t[Et]||null,n=n!=null?n[e]:null,typeof n=="function"&&t.removeEventListener(l,n,u),typeof a=="function")){typeof n!="function"&&n!==null&&(e in t?t[e]=null:t.hasAttribute(e)&&t.removeAttribute(e)),t.addEventListener(l,a,u);break t}e in t?t[e]=a:a===!0?t.setAttribute(e,""):ln(t,e,a)}}}function kt(t,l,e){switch(l){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":F("error",t),F("load",t);var a=!1,u=!1,n;for(n in e)if(e.hasOwnProperty(n)){var i=e[n];if(i!=null)switch(n){case"src":a=!0;break;case"srcSet":u=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(r(137,l));default:yt(t,l,n,i,e,null)}}u&&yt(t,l,"srcSet",e.srcSet,e,null),a&&yt(t,l,"src",e.src,e,null);return;case"input":F("invalid",t);var c=n=i=u=null,f=null,v=null;for(a in e)if(e.hasOwnProperty(a)){var S=e[a];if(S!=null)switch(a){case"name":u=S;break;case"type":i=S;break;case"checked":f=S;break;case"defaultChecked":v=S;break;case"value":n=S;break;case"defaultValue":c=S;break;case"children":case"dangerouslySetInnerHTML":if(S!=null)throw Error(r(137,l));break;default:yt(t,l,a,S,e,null)}}Lf(t,n,c,f,v,i,u,!1);return;case"select":F("invalid",t),a=i=n=null;for(u in e)if(e.hasOwnProperty(u)&&(c=e[u],c!=null))switch(u){case"value":n=c;break;case"defaultValue":i=c;break;case"multiple":a=c;default:yt(t,l,u,c,e,null)}l=n,e=i,t.multiple=!!a,l!=null?Ta(t,!!a,l,!1):e!=null&&Ta(t,!!a,e,!0);return;case"textarea":F("invalid",t),n=u=a=null;for(i in e)if(e.hasOwnProperty(i)&&(c=e[i],c!=null))switch(i){case"value":a=c;break;case"defaultValue":u=c;break;case"children":n=c;break;case"dangerouslySetInnerHTML":if(c!=null)throw Error(r(91));break;default:yt(t,l,i,c,e,null)}Kf(t,a,u,n);return;case"option":for(f in e)if(e.hasOwnProperty(f)&&(a=e[f],a!=null))switch(f){case"selected":t.selected=a&&typeof a!="function"&&typeof a!="symbol";break;default:yt(t,l,f,a,e,null)}return;case"dialog":F("beforetoggle",t),F("toggle",t),F("cancel",t),F("close",t);break;case"iframe":case"object":F("load",t);break;case"video":case"audio":for(a=0;a<Xu.length;a++)F(Xu[a],t);break;case"image":F("error",t),F("load",t);break;case"details":F("toggle",t);break;case"embed":case"source":case"link":F("error",t),F("load",t);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(v in e)if(e.hasOwnProperty(v)&&(a=e[v],a!=null))switch(v){case"children":case"dangerouslySetInnerHTML":throw Error(r(137,l));default:yt(t,l,v,a,e,null)}return;default:if(zi(l)){for(S in e)e.hasOwnProperty(S)&&(a=e[S],a!==void 0&&df(t,l,S,a,e,void 0));return}}for(c in e)e.hasOwnProperty(c)&&(a=e[c],a!=null&&yt(t,l,c,a,e,null))}function pm(t,l,e,a){switch(l){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var u=null,n=null,i=null,c=null,f=null,v=null,S=null;for(h in e){var E=e[h];if(e.hasOwnProperty(h)&&E!=null)switch(h){case"checked":break;case"value":break;case"defaultValue":f=E;default:a.hasOwnProperty(h)||yt(t,l,h,null,a,E)}}for(var y in a){var h=a[y];if(E=e[y],a.hasOwnProperty(y)&&(h!=null||E!=null))switch(y){case"type":n=h;break;case"name":u=h;break;case"checked":v=h;break;case"defaultChecked":S=h;break;case"value":i=h;break;case"defaultValue":c=h;break;case"children":case"dangerouslySetInnerHTML":if(h!=null)throw Error(r(137,l));break;default:h!==E&&yt(t,l,y,h,a,E)}}xi(t,i,c,f,v,S,n,u);return;case"select":h=i=c=y=null;for(n in e)if(f=e[n],e.hasOwnProperty(n)&&f!=null)switch(n){case"value":break;case"multiple":h=f;default:a.hasOwnProperty(n)||yt(t,l,n,null,a,f)}for(u in a)if(n=a[u],f=e[u],a.hasOwnProperty(u)&&(n!=null||f!=null))switch(u){case"value":y=n;break;case"defaultValue":c=n;break;case"multiple":i=n;default:n!==f&&yt(t,l,u,n,a,f)}l=c,e=i,a=h,y!=null?Ta(t,!!e,y,!1):!!a!=!!e&&(l!=null?Ta(t,!!e,l,!0):Ta(t,!!e,e?[]:"",!1));return;case"textarea":h=y=null;for(c in e)if(u=e[c],e.hasOwnProperty(c)&&u!=null&&!a.hasOwnProperty(c))switch(c){case"value":break;case"children":break;default:yt(t,l,c,null,a,u)}for(i in a)if(u=a[i],n=e[i],a.hasOwnProperty(i)&&(u!=null||n!=null))switch(i){case"value":y=u;break;case"defaultValue":h=u;break;case"children":break;case"dangerouslySetInnerHTML":if(u!=null)throw Error(r(91));break;default:u!==n&&yt(t,l,i,u,a,n)}Vf(t,y,h);return;case"option":for(var M in e)if(y=e[M],e.hasOwnProperty(M)&&y!=null&&!a.hasOwnProperty(M))switch(M){case"selected":t.selected=!1;break;default:yt(t,l,M,null,a,y)}for(f in a)if(y=a[f],h=e[f],a.hasOwnProperty(f)&&y!==h&&(y!=null||h!=null))switch(f){case"selected":t.selected=y&&typeof y!="function"&&typeof y!="symbol";break;default:yt(t,l,f,y,a,h)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var G in e)y=e[G],e.hasOwnProperty(G)&&y!=null&&!a.hasOwnProperty(G)&&yt(t,l,G,null,a,y);for(v in a)if(y=a[v],h=e[v],a.hasOwnProperty(v)&&y!==h&&(y!=null||h!=null))switch(v){case"children":case"dangerouslySetInnerHTML":if(y!=null)throw Error(r(137,l));break;default:yt(t,l,v,y,a,h)}return;default:if(zi(l)){for(var ht in e)y=e[ht],e.hasOwnProperty(ht)&&y!==void 0&&!a.hasOwnProperty(ht)&&df(t,l,ht,void 0,a,y);for(S in a)y=a[S],h=e[S],!a.hasOwnProperty(S)||y===h||y===void 0&&h===void 0||df(t,l,S,y,a,h);return}}for(var d in e)y=e[d],e.hasOwnProperty(d)&&y!=null&&!a.hasOwnProperty(d)&&yt(t,l,d,null,a,y);for(E in a)y=a[E],h=e[E],!a.hasOwnProperty(E)||y===h||y==null&&h==null||yt(t,l,E,y,a,h)}function kd(t){switch(t){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function Em(){if(typeof performance.getEntriesByType=="function"){for(var t=0,l=0,e=performance.getEntriesByType("resource"),a=0;a<e.length;a++){var u=e[a],n=u.transferSize,i=u.initiatorType,c=u.duration;if(n&&c&&kd(i)){for(i=0,c=u.responseEnd,a+=1;a<e.length;a++){var f=e[a],v=f.startTime;if(v>c)break;var S=f.transferSize,E=f.initiatorType;S&&kd(E)&&(f=f.responseEnd,i+=S*(f<c?1:(c-v)/(f-v)))}if(--a,l+=8*(n+i)/(u.duration/1e3),t++,10<t)break}}if(0<t)return l/t/1e6}return navigator.connection&&(t=navigator.connection.downlink,typeof t=="number")?t:5}var rf=null,mf=null;function ti(t){return t.nodeType===9?t:t.ownerDocument}function $d(t){switch(t){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function Fd(t,l){if(t===0)switch(l){case"svg":return 1;case"math":return 2;default:return 0}return t===1&&l==="foreignObject"?0:t}function vf(t,l){return t==="textarea"||t==="noscript"||typeof l.children=="string"||typeof l.children=="number"||typeof l.children=="bigint"||typeof l.dangerouslySetInnerHTML=="object"&&l.dangerouslySetInnerHTML!==null&&l.dangerouslySetInnerHTML.__html!=null}var yf=null;function xm(){var t=window.event;return t&&t.type==="popstate"?t===yf?!1:(yf=t,!0):(yf=null,!1)}var Id=typeof setTimeout=="function"?setTimeout:void 0,Am=typeof clearTimeout=="function"?clearTimeout:void 0,Pd=typeof Promise=="function"?Promise:void 0,zm=typeof queueMicrotask=="function"?queueMicrotask:typeof Pd<"u"?function(t){return Pd.resolve(null).then(t).catch(Tm)}:Id;function Tm(t){setTimeout(function(){throw t})}function Ye(t){return t==="head"}function tr(t,l){var e=l,a=0;do{var u=e.nextSibling;if(t.removeChild(e),u&&u.nodeType===8)if(e=u.data,e==="/$"||e==="/&"){if(a===0){t.removeChild(u),au(l);return}a--}else if(e==="$"||e==="$?"||e==="$~"||e==="$!"||e==="&")a++;else if(e==="html")Lu(t.ownerDocument.documentElement);else if(e==="head"){e=t.ownerDocument.head,Lu(e);for(var n=e.firstChild;n;){var i=n.nextSibling,c=n.nodeName;n[cu]||c==="SCRIPT"||c==="STYLE"||c==="LINK"&&n.rel.toLowerCase()==="stylesheet"||e.removeChild(n),n=i}}else e==="body"&&Lu(t.ownerDocument.body);e=u}while(e);au(l)}function lr(t,l){var e=t;t=0;do{var a=e.nextSibling;if(e.nodeType===1?l?(e._stashedDisplay=e.style.display,e.style.display="none"):(e.style.display=e._stashedDisplay||"",e.getAttribute("style")===""&&e.removeAttribute("style")):e.nodeType===3&&(l?(e._stashedText=e.nodeValue,e.nodeValue=""):e.nodeValue=e._stashedText||""),a&&a.nodeType===8)if(e=a.data,e==="/$"){if(t===0)break;t--}else e!=="$"&&e!=="$?"&&e!=="$~"&&e!=="$!"||t++;e=a}while(e)}function hf(t){var l=t.firstChild;for(l&&l.nodeType===10&&(l=l.nextSibling);l;){var e=l;switch(l=l.nextSibling,e.nodeName){case"HTML":case"HEAD":case"BODY":hf(e),pi(e);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(e.rel.toLowerCase()==="stylesheet")continue}t.removeChild(e)}}function _m(t,l,e,a){for(;t.nodeType===1;){var u=e;if(t.nodeName.toLowerCase()!==l.toLowerCase()){if(!a&&(t.nodeName!=="INPUT"||t.type!=="hidden"))break}else if(a){if(!t[cu])switch(l){case"meta":if(!t.hasAttribute("itemprop"))break;return t;case"link":if(n=t.getAttribute("rel"),n==="stylesheet"&&t.hasAttribute("data-precedence"))break;if(n!==u.rel||t.getAttribute("href")!==(u.href==null||u.href===""?null:u.href)||t.getAttribute("crossorigin")!==(u.crossOrigin==null?null:u.crossOrigin)||t.getAttribute("title")!==(u.title==null?null:u.title))break;return t;case"style":if(t.hasAttribute("data-precedence"))break;return t;case"script":if(n=t.getAttribute("src"),(n!==(u.src==null?null:u.src)||t.getAttribute("type")!==(u.type==null?null:u.type)||t.getAttribute("crossorigin")!==(u.crossOrigin==null?null:u.crossOrigin))&&n&&t.hasAttribute("async")&&!t.hasAttribute("itemprop"))break;return t;default:return t}}else if(l==="input"&&t.type==="hidden"){var n=u.name==null?null:""+u.name;if(u.type==="hidden"&&t.getAttribute("name")===n)return t}else return t;if(t=jl(t.nextSibling),t===null)break}return null}function Om(t,l,e){if(l==="")return null;for(;t.nodeType!==3;)if((t.nodeType!==1||t.nodeName!=="INPUT"||t.type!=="hidden")&&!e||(t=jl(t.nextSibling),t===null))return null;return t}function er(t,l){for(;t.nodeType!==8;)if((t.nodeType!==1||t.nodeName!=="INPUT"||t.type!=="hidden")&&!l||(t=jl(t.nextSibling),t===null))return null;return t}function gf(t){return t.data==="$?"||t.data==="$~"}function Sf(t){return t.data==="$!"||t.data==="$?"&&t.ownerDocument.readyState!=="loading"}function Nm(t,l){var e=t.ownerDocument;if(t.data==="$~")t._reactRetry=l;else if(t.data!=="$?"||e.readyState!=="loading")l();else{var a=function(){l(),e.removeEventListener("DOMContentLoaded",a)};e.addEventListener("DOMContentLoaded",a),t._reactRetry=a}}function jl(t){for(;t!=null;t=t.nextSibling){var l=t.nodeType;if(l===1||l===3)break;if(l===8){if(l=t.data,l==="$"||l==="$!"||l==="$?"||l==="$~"||l==="&"||l==="F!"||l==="F")break;if(l==="/$"||l==="/&")return null}}return t}var bf=null;function ar(t){t=t.nextSibling;for(var l=0;t;){if(t.nodeType===8){var e=t.data;if(e==="/$"||e==="/&"){if(l===0)return jl(t.nextSibling);l--}else e!=="$"&&e!=="$!"&&e!=="$?"&&e!=="$~"&&e!=="&"||l++}t=t.nextSibling}return null}function ur(t){t=t.previousSibling;for(var l=0;t;){if(t.nodeType===8){var e=t.data;if(e==="$"||e==="$!"||e==="$?"||e==="$~"||e==="&"){if(l===0)return t;l--}else e!=="/$"&&e!=="/&"||l++}t=t.previousSibling}return null}function nr(t,l,e){switch(l=ti(e),t){case"html":if(t=l.documentElement,!t)throw Error(r(452));return t;case"head":if(t=l.head,!t)throw Error(r(453));return t;case"body":if(t=l.body,!t)throw Error(r(454));return t;default:throw Error(r(451))}}function Lu(t){for(var l=t.attributes;l.length;)t.removeAttributeNode(l[0]);pi(t)}var Hl=new Map,ir=new Set;function li(t){return typeof t.getRootNode=="function"?t.getRootNode():t.nodeType===9?t:t.ownerDocument}var he=N.d;N.d={f:Mm,r:Dm,D:Cm,C:Um,L:Rm,m:jm,X:Bm,S:Hm,M:qm};function Mm(){var t=he.f(),l=Jn();return t||l}function Dm(t){var l=xa(t);l!==null&&l.tag===5&&l.type==="form"?Ao(l):he.r(t)}var tu=typeof document>"u"?null:document;function cr(t,l,e){var a=tu;if(a&&typeof l=="string"&&l){var u=Ol(l);u='link[rel="'+t+'"][href="'+u+'"]',typeof e=="string"&&(u+='[crossorigin="'+e+'"]'),ir.has(u)||(ir.add(u),t={rel:t,crossOrigin:e,href:l},a.querySelector(u)===null&&(l=a.createElement("link"),kt(l,"link",t),Zt(l),a.head.appendChild(l)))}}function Cm(t){he.D(t),cr("dns-prefetch",t,null)}function Um(t,l){he.C(t,l),cr("preconnect",t,l)}function Rm(t,l,e){he.L(t,l,e);var a=tu;if(a&&t&&l){var u='link[rel="preload"][as="'+Ol(l)+'"]';l==="image"&&e&&e.imageSrcSet?(u+='[imagesrcset="'+Ol(e.imageSrcSet)+'"]',typeof e.imageSizes=="string"&&(u+='[imagesizes="'+Ol(e.imageSizes)+'"]')):u+='[href="'+Ol(t)+'"]';var n=u;switch(l){case"style":n=lu(t);break;case"script":n=eu(t)}Hl.has(n)||(t=H({rel:"preload",href:l==="image"&&e&&e.imageSrcSet?void 0:t,as:l},e),Hl.set(n,t),a.querySelector(u)!==null||l==="style"&&a.querySelector(Vu(n))||l==="script"&&a.querySelector(Ku(n))||(l=a.createElement("link"),kt(l,"link",t),Zt(l),a.head.appendChild(l)))}}function jm(t,l){he.m(t,l);var e=tu;if(e&&t){var a=l&&typeof l.as=="string"?l.as:"script",u='link[rel="modulepreload"][as="'+Ol(a)+'"][href="'+Ol(t)+'"]',n=u;switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=eu(t)}if(!Hl.has(n)&&(t=H({rel:"modulepreload",href:t},l),Hl.set(n,t),e.querySelector(u)===null)){switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(e.querySelector(Ku(n)))return}a=e.createElement("link"),kt(a,"link",t),Zt(a),e.head.appendChild(a)}}}function Hm(t,l,e){he.S(t,l,e);var a=tu;if(a&&t){var u=Aa(a).hoistableStyles,n=lu(t);l=l||"default";var i=u.get(n);if(!i){var c={loading:0,preload:null};if(i=a.querySelector(Vu(n)))c.loading=5;else{t=H({rel:"stylesheet",href:t,"data-precedence":l},e),(e=Hl.get(n))&&pf(t,e);var f=i=a.createElement("link");Zt(f),kt(f,"link",t),f._p=new Promise(function(v,S){f.onload=v,f.onerror=S}),f.addEventListener("load",function(){c.loading|=1}),f.addEventListener("error",function(){c.loading|=2}),c.loading|=4,ei(i,l,a)}i={type:"stylesheet",instance:i,count:1,state:c},u.set(n,i)}}}function Bm(t,l){he.X(t,l);var e=tu;if(e&&t){var a=Aa(e).hoistableScripts,u=eu(t),n=a.get(u);n||(n=e.querySelector(Ku(u)),n||(t=H({src:t,async:!0},l),(l=Hl.get(u))&&Ef(t,l),n=e.createElement("script"),Zt(n),kt(n,"link",t),e.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(u,n))}}function qm(t,l){he.M(t,l);var e=tu;if(e&&t){var a=Aa(e).hoistableScripts,u=eu(t),n=a.get(u);n||(n=e.querySelector(Ku(u)),n||(t=H({src:t,async:!0,type:"module"},l),(l=Hl.get(u))&&Ef(t,l),n=e.createElement("script"),Zt(n),kt(n,"link",t),e.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(u,n))}}function fr(t,l,e,a){var u=(u=X.current)?li(u):null;if(!u)throw Error(r(446));switch(t){case"meta":case"title":return null;case"style":return typeof e.precedence=="string"&&typeof e.href=="string"?(l=lu(e.href),e=Aa(u).hoistableStyles,a=e.get(l),a||(a={type:"style",instance:null,count:0,state:null},e.set(l,a)),a):{type:"void",instance:null,count:0,state:null};case"link":if(e.rel==="stylesheet"&&typeof e.href=="string"&&typeof e.precedence=="string"){t=lu(e.href);var n=Aa(u).hoistableStyles,i=n.get(t);if(i||(u=u.ownerDocument||u,i={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(t,i),(n=u.querySelector(Vu(t)))&&!n._p&&(i.instance=n,i.state.loading=5),Hl.has(t)||(e={rel:"preload",as:"style",href:e.href,crossOrigin:e.crossOrigin,integrity:e.integrity,media:e.media,hrefLang:e.hrefLang,referrerPolicy:e.referrerPolicy},Hl.set(t,e),n||Ym(u,t,e,i.state))),l&&a===null)throw Error(r(528,""));return i}if(l&&a!==null)throw Error(r(529,""));return null;case"script":return l=e.async,e=e.src,typeof e=="string"&&l&&typeof l!="function"&&typeof l!="symbol"?(l=eu(e),e=Aa(u).hoistableScripts,a=e.get(l),a||(a={type:"script",instance:null,count:0,state:null},e.set(l,a)),a):{type:"void",instance:null,count:0,state:null};default:throw Error(r(444,t))}}function lu(t){return'href="'+Ol(t)+'"'}function Vu(t){return'link[rel="stylesheet"]['+t+"]"}function sr(t){return H({},t,{"data-precedence":t.precedence,precedence:null})}function Ym(t,l,e,a){t.querySelector('link[rel="preload"][as="style"]['+l+"]")?a.loading=1:(l=t.createElement("link"),a.preload=l,l.addEventListener("load",function(){return a.loading|=1}),l.addEventListener("error",function(){return a.loading|=2}),kt(l,"link",e),Zt(l),t.head.appendChild(l))}function eu(t){return'[src="'+Ol(t)+'"]'}function Ku(t){return"script[async]"+t}function or(t,l,e){if(l.count++,l.instance===null)switch(l.type){case"style":var a=t.querySelector('style[data-href~="'+Ol(e.href)+'"]');if(a)return l.instance=a,Zt(a),a;var u=H({},e,{"data-href":e.href,"data-precedence":e.precedence,href:null,precedence:null});return a=(t.ownerDocument||t).createElement("style"),Zt(a),kt(a,"style",u),ei(a,e.precedence,t),l.instance=a;case"stylesheet":u=lu(e.href);var n=t.querySelector(Vu(u));if(n)return l.state.loading|=4,l.instance=n,Zt(n),n;a=sr(e),(u=Hl.get(u))&&pf(a,u),n=(t.ownerDocument||t).createElement("link"),Zt(n);var i=n;return i._p=new Promise(function(c,f){i.onload=c,i.onerror=f}),kt(n,"link",a),l.state.loading|=4,ei(n,e.precedence,t),l.instance=n;case"script":return n=eu(e.src),(u=t.querySelector(Ku(n)))?(l.instance=u,Zt(u),u):(a=e,(u=Hl.get(n))&&(a=H({},e),Ef(a,u)),t=t.ownerDocument||t,u=t.createElement("script"),Zt(u),kt(u,"link",a),t.head.appendChild(u),l.instance=u);case"void":return null;default:throw Error(r(443,l.type))}else l.type==="stylesheet"&&(l.state.loading&4)===0&&(a=l.instance,l.state.loading|=4,ei(a,e.precedence,t));return l.instance}function ei(t,l,e){for(var a=e.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),u=a.length?a[a.length-1]:null,n=u,i=0;i<a.length;i++){var c=a[i];if(c.dataset.precedence===l)n=c;else if(n!==u)break}n?n.parentNode.insertBefore(t,n.nextSibling):(l=e.nodeType===9?e.head:e,l.insertBefore(t,l.firstChild))}function pf(t,l){t.crossOrigin==null&&(t.crossOrigin=l.crossOrigin),t.referrerPolicy==null&&(t.referrerPolicy=l.referrerPolicy),t.title==null&&(t.title=l.title)}function Ef(t,l){t.crossOrigin==null&&(t.crossOrigin=l.crossOrigin),t.referrerPolicy==null&&(t.referrerPolicy=l.referrerPolicy),t.integrity==null&&(t.integrity=l.integrity)}var ai=null;function dr(t,l,e){if(ai===null){var a=new Map,u=ai=new Map;u.set(e,a)}else u=ai,a=u.get(e),a||(a=new Map,u.set(e,a));if(a.has(t))return a;for(a.set(t,null),e=e.getElementsByTagName(t),u=0;u<e.length;u++){var n=e[u];if(!(n[cu]||n[mt]||t==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var i=n.getAttribute(l)||"";i=t+i;var c=a.get(i);c?c.push(n):a.set(i,[n])}}return a}function rr(t,l,e){t=t.ownerDocument||t,t.head.insertBefore(e,l==="title"?t.querySelector("head > title"):null)}function Gm(t,l,e){if(e===1||l.itemProp!=null)return!1;switch(t){case"meta":case"title":return!0;case"style":if(typeof l.precedence!="string"||typeof l.href!="string"||l.href==="")break;return!0;case"link":if(typeof l.rel!="string"||typeof l.href!="string"||l.href===""||l.onLoad||l.onError)break;switch(l.rel){case"stylesheet":return t=l.disabled,typeof l.precedence=="string"&&t==null;default:return!0}case"script":if(l.async&&typeof l.async!="function"&&typeof l.async!="symbol"&&!l.onLoad&&!l.onError&&l.src&&typeof l.src=="string")return!0}return!1}function mr(t){return!(t.type==="stylesheet"&&(t.state.loading&3)===0)}function Qm(t,l,e,a){if(e.type==="stylesheet"&&(typeof a.media!="string"||matchMedia(a.media).matches!==!1)&&(e.state.loading&4)===0){if(e.instance===null){var u=lu(a.href),n=l.querySelector(Vu(u));if(n){l=n._p,l!==null&&typeof l=="object"&&typeof l.then=="function"&&(t.count++,t=ui.bind(t),l.then(t,t)),e.state.loading|=4,e.instance=n,Zt(n);return}n=l.ownerDocument||l,a=sr(a),(u=Hl.get(u))&&pf(a,u),n=n.createElement("link"),Zt(n);var i=n;i._p=new Promise(function(c,f){i.onload=c,i.onerror=f}),kt(n,"link",a),e.instance=n}t.stylesheets===null&&(t.stylesheets=new Map),t.stylesheets.set(e,l),(l=e.state.preload)&&(e.state.loading&3)===0&&(t.count++,e=ui.bind(t),l.addEventListener("load",e),l.addEventListener("error",e))}}var xf=0;function Xm(t,l){return t.stylesheets&&t.count===0&&ii(t,t.stylesheets),0<t.count||0<t.imgCount?function(e){var a=setTimeout(function(){if(t.stylesheets&&ii(t,t.stylesheets),t.unsuspend){var n=t.unsuspend;t.unsuspend=null,n()}},6e4+l);0<t.imgBytes&&xf===0&&(xf=62500*Em());var u=setTimeout(function(){if(t.waitingForImages=!1,t.count===0&&(t.stylesheets&&ii(t,t.stylesheets),t.unsuspend)){var n=t.unsuspend;t.unsuspend=null,n()}},(t.imgBytes>xf?50:800)+l);return t.unsuspend=e,function(){t.unsuspend=null,clearTimeout(a),clearTimeout(u)}}:null}function ui(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)ii(this,this.stylesheets);else if(this.unsuspend){var t=this.unsuspend;this.unsuspend=null,t()}}}var ni=null;function ii(t,l){t.stylesheets=null,t.unsuspend!==null&&(t.count++,ni=new Map,l.forEach(Zm,t),ni=null,ui.call(t))}function Zm(t,l){if(!(l.state.loading&4)){var e=ni.get(t);if(e)var a=e.get(null);else{e=new Map,ni.set(t,e);for(var u=t.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<u.length;n++){var i=u[n];(i.nodeName==="LINK"||i.getAttribute("media")!=="not all")&&(e.set(i.dataset.precedence,i),a=i)}a&&e.set(null,a)}u=l.instance,i=u.getAttribute("data-precedence"),n=e.get(i)||a,n===a&&e.set(null,u),e.set(i,u),this.count++,a=ui.bind(this),u.addEventListener("load",a),u.addEventListener("error",a),n?n.parentNode.insertBefore(u,n.nextSibling):(t=t.nodeType===9?t.head:t,t.insertBefore(u,t.firstChild)),l.state.loading|=4}}var Ju={$$typeof:Yt,Provider:null,Consumer:null,_currentValue:q,_currentValue2:q,_threadCount:0};function Lm(t,l,e,a,u,n,i,c,f){this.tag=1,this.containerInfo=t,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Fe(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Fe(0),this.hiddenUpdates=Fe(null),this.identifierPrefix=a,this.onUncaughtError=u,this.onCaughtError=n,this.onRecoverableError=i,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=f,this.incompleteTransitions=new Map}function vr(t,l,e,a,u,n,i,c,f,v,S,E){return t=new Lm(t,l,e,i,f,v,S,E,c),l=1,n===!0&&(l|=24),n=gl(3,null,null,l),t.current=n,n.stateNode=t,l=tc(),l.refCount++,t.pooledCache=l,l.refCount++,n.memoizedState={element:a,isDehydrated:e,cache:l},uc(n),t}function yr(t){return t?(t=Ra,t):Ra}function hr(t,l,e,a,u,n){u=yr(u),a.context===null?a.context=u:a.pendingContext=u,a=Oe(l),a.payload={element:e},n=n===void 0?null:n,n!==null&&(a.callback=n),e=Ne(t,a,l),e!==null&&(ml(e,t,l),zu(e,t,l))}function gr(t,l){if(t=t.memoizedState,t!==null&&t.dehydrated!==null){var e=t.retryLane;t.retryLane=e!==0&&e<l?e:l}}function Af(t,l){gr(t,l),(t=t.alternate)&&gr(t,l)}function Sr(t){if(t.tag===13||t.tag===31){var l=ea(t,67108864);l!==null&&ml(l,t,67108864),Af(t,67108864)}}function br(t){if(t.tag===13||t.tag===31){var l=xl();l=bt(l);var e=ea(t,l);e!==null&&ml(e,t,l),Af(t,l)}}var ci=!0;function Vm(t,l,e,a){var u=g.T;g.T=null;var n=N.p;try{N.p=2,zf(t,l,e,a)}finally{N.p=n,g.T=u}}function Km(t,l,e,a){var u=g.T;g.T=null;var n=N.p;try{N.p=8,zf(t,l,e,a)}finally{N.p=n,g.T=u}}function zf(t,l,e,a){if(ci){var u=Tf(a);if(u===null)of(t,l,a,fi,e),Er(t,a);else if(wm(u,t,l,e,a))a.stopPropagation();else if(Er(t,a),l&4&&-1<Jm.indexOf(t)){for(;u!==null;){var n=xa(u);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var i=Ll(n.pendingLanes);if(i!==0){var c=n;for(c.pendingLanes|=2,c.entangledLanes|=2;i;){var f=1<<31-el(i);c.entanglements[1]|=f,i&=~f}wl(n),(ft&6)===0&&(Vn=zt()+500,Qu(0))}}break;case 31:case 13:c=ea(n,2),c!==null&&ml(c,n,2),Jn(),Af(n,2)}if(n=Tf(a),n===null&&of(t,l,a,fi,e),n===u)break;u=n}u!==null&&a.stopPropagation()}else of(t,l,a,null,e)}}function Tf(t){return t=_i(t),_f(t)}var fi=null;function _f(t){if(fi=null,t=Ea(t),t!==null){var l=k(t);if(l===null)t=null;else{var e=l.tag;if(e===13){if(t=Ot(l),t!==null)return t;t=null}else if(e===31){if(t=gt(l),t!==null)return t;t=null}else if(e===3){if(l.stateNode.current.memoizedState.isDehydrated)return l.tag===3?l.stateNode.containerInfo:null;t=null}else l!==t&&(t=null)}}return fi=t,null}function pr(t){switch(t){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Fl()){case Il:return 2;case uu:return 8;case we:case nu:return 32;case We:return 268435456;default:return 32}default:return 32}}var Of=!1,Ge=null,Qe=null,Xe=null,wu=new Map,Wu=new Map,Ze=[],Jm="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function Er(t,l){switch(t){case"focusin":case"focusout":Ge=null;break;case"dragenter":case"dragleave":Qe=null;break;case"mouseover":case"mouseout":Xe=null;break;case"pointerover":case"pointerout":wu.delete(l.pointerId);break;case"gotpointercapture":case"lostpointercapture":Wu.delete(l.pointerId)}}function ku(t,l,e,a,u,n){return t===null||t.nativeEvent!==n?(t={blockedOn:l,domEventName:e,eventSystemFlags:a,nativeEvent:n,targetContainers:[u]},l!==null&&(l=xa(l),l!==null&&Sr(l)),t):(t.eventSystemFlags|=a,l=t.targetContainers,u!==null&&l.indexOf(u)===-1&&l.push(u),t)}function wm(t,l,e,a,u){switch(l){case"focusin":return Ge=ku(Ge,t,l,e,a,u),!0;case"dragenter":return Qe=ku(Qe,t,l,e,a,u),!0;case"mouseover":return Xe=ku(Xe,t,l,e,a,u),!0;case"pointerover":var n=u.pointerId;return wu.set(n,ku(wu.get(n)||null,t,l,e,a,u)),!0;case"gotpointercapture":return n=u.pointerId,Wu.set(n,ku(Wu.get(n)||null,t,l,e,a,u)),!0}return!1}function xr(t){var l=Ea(t.target);if(l!==null){var e=k(l);if(e!==null){if(l=e.tag,l===13){if(l=Ot(e),l!==null){t.blockedOn=l,cl(t.priority,function(){br(e)});return}}else if(l===31){if(l=gt(e),l!==null){t.blockedOn=l,cl(t.priority,function(){br(e)});return}}else if(l===3&&e.stateNode.current.memoizedState.isDehydrated){t.blockedOn=e.tag===3?e.stateNode.containerInfo:null;return}}}t.blockedOn=null}function si(t){if(t.blockedOn!==null)return!1;for(var l=t.targetContainers;0<l.length;){var e=Tf(t.nativeEvent);if(e===null){e=t.nativeEvent;var a=new e.constructor(e.type,e);Ti=a,e.target.dispatchEvent(a),Ti=null}else return l=xa(e),l!==null&&Sr(l),t.blockedOn=e,!1;l.shift()}return!0}function Ar(t,l,e){si(t)&&e.delete(l)}function Wm(){Of=!1,Ge!==null&&si(Ge)&&(Ge=null),Qe!==null&&si(Qe)&&(Qe=null),Xe!==null&&si(Xe)&&(Xe=null),wu.forEach(Ar),Wu.forEach(Ar)}function oi(t,l){t.blockedOn===l&&(t.blockedOn=null,Of||(Of=!0,T.unstable_scheduleCallback(T.unstable_NormalPriority,Wm)))}var di=null;function zr(t){di!==t&&(di=t,T.unstable_scheduleCallback(T.unstable_NormalPriority,function(){di===t&&(di=null);for(var l=0;l<t.length;l+=3){var e=t[l],a=t[l+1],u=t[l+2];if(typeof a!="function"){if(_f(a||e)===null)continue;break}var n=xa(e);n!==null&&(t.splice(l,3),l-=3,zc(n,{pending:!0,data:u,method:e.method,action:a},a,u))}}))}function au(t){function l(f){return oi(f,t)}Ge!==null&&oi(Ge,t),Qe!==null&&oi(Qe,t),Xe!==null&&oi(Xe,t),wu.forEach(l),Wu.forEach(l);for(var e=0;e<Ze.length;e++){var a=Ze[e];a.blockedOn===t&&(a.blockedOn=null)}for(;0<Ze.length&&(e=Ze[0],e.blockedOn===null);)xr(e),e.blockedOn===null&&Ze.shift();if(e=(t.ownerDocument||t).$$reactFormReplay,e!=null)for(a=0;a<e.length;a+=3){var u=e[a],n=e[a+1],i=u[Et]||null;if(typeof n=="function")i||zr(e);else if(i){var c=null;if(n&&n.hasAttribute("formAction")){if(u=n,i=n[Et]||null)c=i.formAction;else if(_f(u)!==null)continue}else c=i.action;typeof c=="function"?e[a+1]=c:(e.splice(a,3),a-=3),zr(e)}}}function Tr(){function t(n){n.canIntercept&&n.info==="react-transition"&&n.intercept({handler:function(){return new Promise(function(i){return u=i})},focusReset:"manual",scroll:"manual"})}function l(){u!==null&&(u(),u=null),a||setTimeout(e,20)}function e(){if(!a&&!navigation.transition){var n=navigation.currentEntry;n&&n.url!=null&&navigation.navigate(n.url,{state:n.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var a=!1,u=null;return navigation.addEventListener("navigate",t),navigation.addEventListener("navigatesuccess",l),navigation.addEventListener("navigateerror",l),setTimeout(e,100),function(){a=!0,navigation.removeEventListener("navigate",t),navigation.removeEventListener("navigatesuccess",l),navigation.removeEventListener("navigateerror",l),u!==null&&(u(),u=null)}}}function Nf(t){this._internalRoot=t}ri.prototype.render=Nf.prototype.render=function(t){var l=this._internalRoot;if(l===null)throw Error(r(409));var e=l.current,a=xl();hr(e,a,t,l,null,null)},ri.prototype.unmount=Nf.prototype.unmount=function(){var t=this._internalRoot;if(t!==null){this._internalRoot=null;var l=t.containerInfo;hr(t.current,2,null,t,null,null),Jn(),l[pe]=null}};function ri(t){this._internalRoot=t}ri.prototype.unstable_scheduleHydration=function(t){if(t){var l=yl();t={blockedOn:null,target:t,priority:l};for(var e=0;e<Ze.length&&l!==0&&l<Ze[e].priority;e++);Ze.splice(e,0,t),e===0&&xr(t)}};var _r=J.version;if(_r!=="19.2.4")throw Error(r(527,_r,"19.2.4"));N.findDOMNode=function(t){var l=t._reactInternals;if(l===void 0)throw typeof t.render=="function"?Error(r(188)):(t=Object.keys(t).join(","),Error(r(268,t)));return t=A(l),t=t!==null?lt(t):null,t=t===null?null:t.stateNode,t};var km={bundleType:0,version:"19.2.4",rendererPackageName:"react-dom",currentDispatcherRef:g,reconcilerVersion:"19.2.4"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var mi=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!mi.isDisabled&&mi.supportsFiber)try{ke=mi.inject(km),ll=mi}catch{}}return Fu.createRoot=function(t,l){if(!L(t))throw Error(r(299));var e=!1,a="",u=Ro,n=jo,i=Ho;return l!=null&&(l.unstable_strictMode===!0&&(e=!0),l.identifierPrefix!==void 0&&(a=l.identifierPrefix),l.onUncaughtError!==void 0&&(u=l.onUncaughtError),l.onCaughtError!==void 0&&(n=l.onCaughtError),l.onRecoverableError!==void 0&&(i=l.onRecoverableError)),l=vr(t,1,!1,null,null,e,a,null,u,n,i,Tr),t[pe]=l.current,sf(t),new Nf(l)},Fu.hydrateRoot=function(t,l,e){if(!L(t))throw Error(r(299));var a=!1,u="",n=Ro,i=jo,c=Ho,f=null;return e!=null&&(e.unstable_strictMode===!0&&(a=!0),e.identifierPrefix!==void 0&&(u=e.identifierPrefix),e.onUncaughtError!==void 0&&(n=e.onUncaughtError),e.onCaughtError!==void 0&&(i=e.onCaughtError),e.onRecoverableError!==void 0&&(c=e.onRecoverableError),e.formState!==void 0&&(f=e.formState)),l=vr(t,1,!0,l,e??null,a,u,f,n,i,c,Tr),l.context=yr(null),e=l.current,a=xl(),a=bt(a),u=Oe(a),u.callback=null,Ne(e,u,a),e=a,l.current.lanes=e,z(l,e),wl(l),t[pe]=l.current,sf(t),new ri(l)},Fu.version="19.2.4",Fu}var Br;function nv(){if(Br)return Cf.exports;Br=1;function T(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(T)}catch(J){console.error(J)}}return T(),Cf.exports=uv(),Cf.exports}var iv=nv();const qr="disconnected";function cv(T,J){switch(J.type){case"CONNECT_REQUESTED":return"connecting";case"CONNECTED":return"connected";case"DISCONNECTED":return"disconnected";case"RECONNECT_REQUESTED":return"reconnecting";case"CONNECTION_ERROR":return"error";default:return T}}function fv(T){switch(T){case"connecting":return"接続中";case"connected":return"接続済み";case"disconnected":return"切断";case"reconnecting":return"再接続中";case"error":return"エラー";default:return"不明"}}function Yr(T){return T<=767?"mobile":T<=1023?"tablet":"desktop"}function sv(){return typeof window>"u"?"desktop":Yr(window.innerWidth)}function Iu(){return`${Date.now()}-${Math.random().toString(36).slice(2)}`}function ov(){return typeof navigator<"u"&&/jsdom/i.test(navigator.userAgent)}function dv(T,J){return`${window.location.protocol==="https:"?"wss:":"ws:"}//${window.location.host}/ws/${T}/${J}`}function rv(T){const J=window.atob(T),U=new Uint8Array(J.length);for(let r=0;r<J.length;r+=1)U[r]=J.charCodeAt(r);return U.buffer}function mv(T,J=24e3){if(!T)return J;const U=T.match(/rate=(\d+)/);if(!U)return J;const r=Number(U[1]);return Number.isFinite(r)?r:J}function vv(T){const J=new Int16Array(T.length);for(let U=0;U<T.length;U+=1){const r=Math.max(-1,Math.min(1,T[U]));J[U]=r<0?r*32768:r*32767}return J}function yv(){const[T,J]=R.useState(sv),[U,r]=R.useReducer(cv,qr),[L,k]=R.useState(!1),[Ot,gt]=R.useState([]),[j,A]=R.useState(""),[lt,H]=R.useState([]),[ct,Qt]=R.useState(!1),[$t,Vt]=R.useState(0),[Bl,Pt]=R.useState(0),[Al,Yt]=R.useState("idle"),[nl,zl]=R.useState(0),[Kt,W]=R.useState([]),[Ft,vl]=R.useState([]),[Wl,Tl]=R.useState(!0),[Nt,kl]=R.useState({proactivity:!1,affectiveDialog:!1}),[il,tl]=R.useState({proactivity:!1,affectiveDialog:!1}),[g,N]=R.useState({proactivity:!1,affectiveDialog:!1}),[q,et]=R.useState("idle"),[st,o]=R.useState("proactivity=false&affective_dialog=false"),[x,O]=R.useState(!1),[D,Q]=R.useState(!1),X=typeof window<"u"&&typeof WebSocket<"u"&&!ov(),at=R.useRef(qr),Xt=R.useRef(null),ot=R.useRef(null),Xl=R.useRef(null),Mt=R.useRef(null),Ve=R.useRef(!1),Pu=R.useRef("demo-user"),$l=R.useRef(`demo-session-${Iu()}`),Ke=R.useRef(!1),ge=R.useRef(null),ya=R.useRef(null),Se=R.useRef(null),be=R.useRef(null),ql=R.useRef(null),Je=R.useRef(0),St=R.useCallback((z,_,V,Y="standard")=>{const ut={id:Iu(),timestamp:new Date().toISOString(),summary:_,category:z,kind:Y,detail:JSON.stringify(V)};W(bt=>[ut,...bt].slice(0,100))},[]),vi=R.useCallback(z=>{vl(_=>_.includes(z)?_.filter(V=>V!==z):[..._,z])},[]),zt=R.useCallback(z=>{window.dispatchEvent(new CustomEvent("mock-stream-event",{detail:z}))},[]),Fl=R.useCallback(()=>{Se.current&&(Se.current.disconnect(),Se.current.onaudioprocess=null,Se.current=null),be.current&&(be.current.disconnect(),be.current=null),ya.current&&(ya.current.close(),ya.current=null),ge.current&&(ge.current.getTracks().forEach(z=>z.stop()),ge.current=null)},[]),Il=R.useCallback(()=>{ql.current&&(ql.current.close(),ql.current=null),Je.current=0},[]),uu=R.useCallback((z,_)=>{try{const V=mv(_,24e3);(!ql.current||ql.current.sampleRate!==V)&&(Il(),ql.current=new AudioContext({sampleRate:V}));const Y=ql.current;if(!Y)return;const ut=rv(z),bt=new DataView(ut),Tt=Math.floor(bt.byteLength/2),yl=new Float32Array(Tt);for(let Et=0;Et<Tt;Et+=1){const pe=bt.getInt16(Et*2,!0);yl[Et]=pe/32768}const cl=Y.createBuffer(1,Tt,V);cl.copyToChannel(yl,0);const al=Y.createBufferSource();al.buffer=cl,al.connect(Y.destination);const mt=Math.max(Y.currentTime,Je.current);al.start(mt),Je.current=mt+cl.duration}catch(V){St("notification","音声再生処理失敗",{message:String(V)})}},[St,Il]),we=R.useCallback(z=>{var ut,bt,Tt,yl,cl,al;let _;try{_=JSON.parse(z)}catch{zt({kind:"error",message:"invalid server payload"});return}if(_.error){const mt=typeof _.error=="string"?_.error:_.error.message??"unknown websocket error";zt({kind:"error",message:mt})}_.interrupted===!0&&(Il(),zt({kind:"interrupted"}));let V=!1;if((ut=_.content)!=null&&ut.parts)for(const mt of _.content.parts){const Et=mt.inlineData??{mimeType:(bt=mt.inline_data)==null?void 0:bt.mime_type,data:(Tt=mt.inline_data)==null?void 0:Tt.data};mt.text&&(V=!0,zt({kind:"text",role:_.author==="user"?"user":"agent",text:mt.text,partial:_.turnComplete!==!0})),(yl=Et.mimeType)!=null&&yl.startsWith("audio/pcm")&&Et.data&&(uu(Et.data,Et.mimeType),zt({kind:"audioOutput",chunkSize:Et.data.length}))}const Y=((cl=_.outputTranscription)==null?void 0:cl.text)??((al=_.output_transcription)==null?void 0:al.text);!V&&(Y!=null&&Y.trim())&&zt({kind:"text",role:"agent",text:Y,partial:_.turnComplete!==!0}),_.turnComplete===!0&&zt({kind:"turnComplete"})},[zt,uu,Il]),nu=R.useCallback(()=>{if(!X||Mt.current&&Mt.current.readyState<=WebSocket.OPEN)return;Ve.current=!1;const z=new WebSocket(dv(Pu.current,$l.current));z.binaryType="arraybuffer",Mt.current=z,z.onopen=()=>{r({type:"CONNECTED"})},z.onmessage=_=>{typeof _.data=="string"&&we(_.data)},z.onerror=()=>{zt({kind:"error",message:"websocket transport error"})},z.onclose=()=>{Mt.current=null,Fl(),!Ve.current&&(r({type:"CONNECTION_ERROR"}),k(!0))}},[zt,we,X,Fl]),We=R.useCallback(()=>{Mt.current&&(Ve.current=!0,Mt.current.close(),Mt.current=null)},[]),yi=R.useCallback(async()=>{if(!X)return;if(!Mt.current||Mt.current.readyState!==WebSocket.OPEN)throw new Error("WebSocket未接続");const z=await navigator.mediaDevices.getUserMedia({audio:{channelCount:1}});ge.current=z;const _=new AudioContext({sampleRate:16e3});ya.current=_;const V=_.createMediaStreamSource(z);be.current=V;const Y=_.createScriptProcessor(2048,1,1);Se.current=Y;const ut=_.createGain();ut.gain.value=0,Y.onaudioprocess=bt=>{if(!Ke.current||!Mt.current||Mt.current.readyState!==WebSocket.OPEN)return;const Tt=bt.inputBuffer.getChannelData(0),yl=vv(Tt);Mt.current.send(yl.buffer),window.dispatchEvent(new CustomEvent("mock-audio-chunk",{detail:{size:yl.byteLength}}))},V.connect(Y),Y.connect(ut),ut.connect(_.destination)},[X]);R.useEffect(()=>{Ke.current=ct},[ct]),R.useEffect(()=>{const z=()=>{J(Yr(window.innerWidth))};return window.addEventListener("resize",z),()=>window.removeEventListener("resize",z)},[]),R.useEffect(()=>{const z=()=>{ct&&Vt(_=>_+1)};return window.addEventListener("mock-audio-chunk",z),()=>window.removeEventListener("mock-audio-chunk",z)},[ct]),R.useEffect(()=>()=>{const z=Xl.current;z&&z.getTracks().forEach(_=>_.stop()),We(),Fl(),Il()},[We,Il,Fl]),R.useEffect(()=>{if(X||U!=="connecting"&&U!=="reconnecting")return;const z=window.setTimeout(()=>{r({type:"CONNECTED"})},400);return()=>window.clearTimeout(z)},[U,X]),R.useEffect(()=>{const z=at.current;z!==U&&(z==="connecting"&&U==="connected"&&(gt(_=>[..._,"接続開始"]),St("notification","接続済み",{phase:"initial"})),z==="reconnecting"&&U==="connected"&&(gt(_=>[..._,"再接続に成功"]),St("notification","再接続に成功",{phase:"recover"})),z==="reconnecting"&&U==="connected"&&q==="applying"&&(tl(Nt),et("idle"),gt(_=>[..._,"設定変更を反映しました"]),St("notification","RunConfig反映完了",{proactivity:Nt.proactivity,affectiveDialog:Nt.affectiveDialog})),at.current=U)},[St,U,Nt,q]),R.useEffect(()=>{if(!L)return;const z=window.setTimeout(()=>{r({type:"RECONNECT_REQUESTED"}),gt(_=>[..._,"再接続を試行中"]),St("notification","再接続試行",{scheduled:!0}),k(!1),nu()},1e3);return()=>window.clearTimeout(z)},[St,nu,L]),R.useEffect(()=>{const z=Xt.current;z&&(z.scrollTop=z.scrollHeight)},[lt]),R.useEffect(()=>{const z=_=>{const Y=_.detail;if(Y){if(Y.kind==="text"){const ut=Y.text.trim();if(!ut)return;if(Y.role==="agent"&&ot.current&&Y.partial){const Tt=ot.current;H(yl=>yl.map(cl=>cl.id===Tt?{...cl,content:`${cl.content}${ut}`,status:"partial"}:cl)),St("conversation","エージェント応答更新",{partial:!0});return}const bt=Iu();H(Tt=>[...Tt,{id:bt,role:Y.role,content:ut,status:Y.partial?"partial":"complete"}]),Y.role==="agent"&&(ot.current=Y.partial?bt:null),St("conversation","会話イベント受信",{role:Y.role,partial:Y.partial});return}if(Y.kind==="audioOutput"){Pt(ut=>ut+1),Yt("playing"),St("conversation","音声出力受信",{chunkSize:Y.chunkSize},"audio");return}if(Y.kind==="turnComplete"){const ut=ot.current;if(!ut)return;H(bt=>bt.map(Tt=>Tt.id===ut?{...Tt,status:"complete"}:Tt)),ot.current=null,St("conversation","ターン完了",{kind:"turnComplete"});return}if(Y.kind==="runConfigApplyResult"){if(Y.status==="applied"){tl(Y.effective),N(Y.effective),et("idle"),gt(bt=>[...bt,"設定変更を反映しました"]),St("notification","RunConfig反映完了",{status:Y.status,effective:Y.effective});return}const ut=g.proactivity||g.affectiveDialog?g:{proactivity:!1,affectiveDialog:!1};tl(ut),et("idle"),gt(bt=>[...bt,`設定反映に失敗: ${Y.reason??"unsupported"}`]),St("notification","RunConfig反映失敗",{status:Y.status,reason:Y.reason,fallback:ut});return}if(Y.kind==="error"){r({type:"CONNECTION_ERROR"}),gt(ut=>[...ut,`WebSocketエラー: ${Y.message}`]),St("notification","WebSocketエラー",{message:Y.message}),k(!0);return}if(Y.kind==="interrupted"){const ut=ot.current;ut&&(H(bt=>bt.map(Tt=>Tt.id===ut?{...Tt,status:"interrupted"}:Tt)),ot.current=null),Yt(bt=>bt==="playing"?"interrupted":bt),St("notification","中断イベント",{kind:"interrupted"})}}};return window.addEventListener("mock-stream-event",z),()=>window.removeEventListener("mock-stream-event",z)},[St,g]);const hi=()=>{r({type:"CONNECT_REQUESTED"}),St("notification","接続開始要求",{source:"ui"}),nu()},ke=()=>{We(),Fl(),Qt(!1),r({type:"DISCONNECTED"}),k(!0),gt(z=>[...z,"切断"]),St("notification","切断",{reconnectScheduled:!0})},ll=()=>{const z=j.trim();z&&(H(_=>[..._,{id:Iu(),role:"user",content:z,status:"complete"}]),St("conversation","テキスト送信",{text:z}),Mt.current&&Mt.current.readyState===WebSocket.OPEN&&Mt.current.send(JSON.stringify({type:"text",text:z})),A(""))},Zl=z=>{z.preventDefault(),ll()},el=()=>{if(Ke.current){Qt(!1),Fl();return}Qt(!0),yi().catch(z=>{Qt(!1),Fl();const _=z instanceof Error?z.message:"音声入力開始に失敗";gt(V=>[...V,`音声入力に失敗: ${_}`]),St("notification","音声入力開始失敗",{message:_})})},tn=()=>{const z=Xl.current;z&&(z.getTracks().forEach(_=>_.stop()),Xl.current=null),O(!1),Q(!1)},gi=async()=>{try{if(!navigator.mediaDevices||!navigator.mediaDevices.getUserMedia)throw new Error("カメラ未対応");const z=await navigator.mediaDevices.getUserMedia({video:!0});Xl.current=z,O(!0),Q(!0),St("notification","カメラプレビュー開始",{status:"opened"})}catch(z){O(!1),Q(!1);const _=z instanceof Error?z.message:"unknown";gt(V=>[...V,`カメラ利用に失敗: ${_}`]),St("notification","カメラ利用失敗",{message:_})}},Si=()=>{H(z=>[...z,{id:Iu(),role:"user",content:"[画像を送信しました]",status:"complete"}]),zl(z=>z+1),St("conversation","画像送信",{placeholder:!0}),Mt.current&&Mt.current.readyState===WebSocket.OPEN&&Mt.current.send(JSON.stringify({type:"image",mimeType:"image/png",data:"iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mP8/x8AAusB9mZ1tcQAAAAASUVORK5CYII="})),tn()},ha=()=>{Tl(z=>!z)},ga=()=>{W([]),vl([])},Sa=z=>{const _=new URLSearchParams({proactivity:String(z.proactivity),affective_dialog:String(z.affectiveDialog)}).toString();o(_),et("applying"),gt(V=>[...V,"設定変更を反映中"]),St("notification","RunConfig変更要求",{proactivity:z.proactivity,affective_dialog:z.affectiveDialog,query:_}),r({type:"RECONNECT_REQUESTED"}),X&&(We(),k(!0))},Ll=z=>{kl(_=>{const V={..._,[z]:!_[z]};return U==="connected"||U==="reconnecting"?Sa(V):o(new URLSearchParams({proactivity:String(V.proactivity),affective_dialog:String(V.affectiveDialog)}).toString()),V})},ba=()=>b.jsxs(b.Fragment,{children:[b.jsxs("p",{className:"mt-2 text-xs text-slate-300",children:["上流音声チャンク: ",b.jsx("span",{"data-testid":"audio-upstream-chunk-count",children:$t})]}),b.jsxs("p",{className:"mt-1 text-xs text-slate-300",children:["下流音声チャンク: ",b.jsx("span",{"data-testid":"audio-downstream-chunk-count",children:Bl})]}),b.jsxs("p",{className:"mt-1 text-xs text-slate-300",children:["音声再生状態:"," ",b.jsxs("span",{"data-testid":"audio-playback-state",children:[Al==="idle"&&"待機中",Al==="playing"&&"再生中",Al==="interrupted"&&"中断"]})]}),b.jsxs("p",{className:"mt-1 text-xs text-slate-300",children:["画像上流送信数: ",b.jsx("span",{"data-testid":"image-upstream-count",children:nl})]})]}),$e=()=>{const z=Wl?Kt:Kt.filter(_=>_.kind!=="audio");return b.jsxs(b.Fragment,{children:[b.jsxs("div",{className:"mt-3 flex items-center justify-between gap-3 border-t border-slate-700/70 pt-3",children:[b.jsxs("label",{className:"flex items-center gap-2 text-xs text-slate-300",children:[b.jsx("input",{type:"checkbox",checked:Wl,onChange:ha}),"音声イベントを表示"]}),b.jsx("button",{type:"button",className:"rounded bg-slate-700 px-2 py-1 text-xs text-slate-100",onClick:ga,children:"ログをクリア"})]}),b.jsx("ul",{"data-testid":"event-log-list",className:"mt-3 space-y-2",children:z.map(_=>{const V=Ft.includes(_.id),Y=_.kind==="audio"?"audio":_.category,ut=_.kind==="audio"?"text-cyan-300":_.category==="notification"?"text-amber-300":"text-slate-300";return b.jsxs("li",{"data-testid":"event-log-item",className:"rounded border border-slate-700 bg-slate-900/80 p-2 text-xs",children:[b.jsxs("p",{"data-testid":`event-log-item-${Y}`,className:ut,children:["[",Y,"] ",_.summary]}),b.jsx("p",{className:"mt-1 text-slate-500",children:_.timestamp}),b.jsx("button",{type:"button",className:"mt-1 rounded bg-slate-700 px-2 py-1 text-slate-100",onClick:()=>vi(_.id),children:V?"詳細を閉じる":"詳細を開く"}),V&&b.jsx("pre",{"data-testid":"event-log-detail",className:"mt-2 overflow-x-auto rounded bg-slate-800 p-2 text-[11px] text-slate-200",children:_.detail})]},_.id)})})]})},iu=(z,_="session_overview",V="run_config")=>b.jsxs("section",{"aria-label":"connection",role:"region",className:z,children:[b.jsxs("div",{className:"flex items-center justify-between gap-2",children:[b.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100 [font-family:'JetBrains_Mono',monospace]",children:_}),b.jsx("span",{"data-testid":"connection-state",className:"rounded-full bg-[#1F2A22] px-2 py-1 text-[10px] text-[#2EE6A6] [font-family:'JetBrains_Mono',monospace]",children:fv(U)})]}),U==="disconnected"&&L&&b.jsx("p",{className:"mt-2 text-sm text-amber-300",children:"再接続予定"}),U==="error"&&L&&b.jsx("p",{"data-testid":"recovery-status-banner",className:"mt-2 text-sm text-amber-300",children:"自動回復を試行中"}),b.jsxs("div",{className:"mt-3 flex flex-wrap gap-2",children:[(U==="disconnected"||U==="error")&&b.jsx("button",{type:"button",className:"rounded-[12px] bg-[#00D4AA] px-3 py-2 text-xs font-semibold text-slate-900 transition-colors hover:bg-[#25e1b7]",onClick:hi,children:"接続開始"}),U==="connected"&&b.jsx("button",{type:"button",className:"rounded-[12px] bg-[#1E2631] px-3 py-2 text-xs font-semibold text-slate-100 transition-colors hover:bg-slate-600",onClick:ke,children:"切断"})]}),b.jsxs("div",{className:"mt-4 rounded-[16px] border border-slate-700 bg-[#151C25] p-3",children:[b.jsx("p",{className:"text-xs font-semibold tracking-wide text-slate-200 [font-family:Oswald,sans-serif]",children:V}),b.jsxs("label",{className:"mt-2 flex items-center gap-2 text-sm text-slate-200",children:[b.jsx("input",{type:"checkbox",checked:Nt.proactivity,onChange:()=>Ll("proactivity"),disabled:q==="applying"}),"Proactivity"]}),b.jsxs("label",{className:"mt-1 flex items-center gap-2 text-sm text-slate-200",children:[b.jsx("input",{type:"checkbox",checked:Nt.affectiveDialog,onChange:()=>Ll("affectiveDialog"),disabled:q==="applying"}),"Affective Dialog"]}),b.jsx("p",{"data-testid":"run-config-status",className:"mt-2 text-xs text-slate-400",children:q==="applying"?"反映中":"待機"}),b.jsx("p",{"data-testid":"run-config-query",className:"mt-1 text-xs text-slate-500",children:st}),b.jsxs("p",{"data-testid":"run-config-effective",className:"mt-1 text-xs text-slate-400",children:["effective: proactivity=",String(il.proactivity),", affectiveDialog=",String(il.affectiveDialog)]}),b.jsx("p",{"data-testid":"run-config-drift",className:"mt-1 text-xs text-slate-400",children:Nt.proactivity===il.proactivity&&Nt.affectiveDialog===il.affectiveDialog?"一致":"不一致"})]})]}),pa=(z,_="stream_transcript")=>b.jsxs("section",{"aria-label":"conversation",role:"region",className:z,children:[b.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100 [font-family:Oswald,sans-serif]",children:_}),b.jsxs("ul",{ref:Xt,"data-testid":"conversation-log",className:"mt-3 max-h-72 space-y-2 overflow-y-auto rounded-[14px] border border-slate-700 bg-[#111821] p-3",children:[lt.length===0&&b.jsx("li",{className:"text-sm text-slate-500",children:"メッセージはまだありません"}),lt.map(V=>b.jsxs("li",{"data-testid":`conversation-message-${V.role}`,className:`rounded px-3 py-2 text-sm ${V.role==="user"?"bg-[#1E2631] text-[#D9E0EA]":V.status==="interrupted"?"bg-[#2B1E22] text-[#FF9AA2]":"bg-[#1A2B27] text-[#DDF6EE]"}`,children:[b.jsx("p",{children:V.content}),b.jsx("p",{className:"mt-1 text-xs text-slate-400",children:V.status})]},V.id))]})]}),Fe=(z,_="voice_activity")=>b.jsxs("section",{"aria-label":"event-console",role:"region",className:z,children:[b.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100 [font-family:Oswald,sans-serif]",children:_}),ba(),$e()]});return b.jsxs("main",{className:"min-h-screen bg-[#0B0E13] text-slate-100","data-layout":T,children:[b.jsxs("header",{className:"border-b border-slate-800 bg-[#0F141C] px-4 py-4",children:[b.jsx("h1",{className:"text-3xl font-semibold leading-none [font-family:Oswald,sans-serif]",children:"Realtime Voice Agent"}),b.jsxs("p",{className:"mt-1 text-xs text-slate-400 [font-family:'JetBrains_Mono',monospace]",children:[T==="desktop"&&"BIDI streaming console for text, audio, and image context",T==="tablet"&&"tablet_layout // collapsible panels",T==="mobile"&&"live_voice_console"]}),b.jsx("p",{"data-testid":"layout-mode",className:"mt-1 text-xs text-slate-500",children:T})]}),T==="desktop"&&b.jsxs("div",{className:"m-4 grid grid-cols-[260px_1fr_360px] gap-6 rounded-[24px] bg-[#0F1115] p-6",children:[iu("rounded-[20px] border border-slate-800 bg-[#151A20] p-[20px_18px]","session_overview","run_config"),b.jsxs("div",{className:"flex min-h-[560px] flex-col gap-4",children:[pa("flex-1 rounded-[16px] border border-slate-800 bg-[#151C25] p-[14px]","stream_transcript"),b.jsx("div",{className:"rounded-[16px] border border-slate-800 bg-[#151C25] p-3 text-xs text-slate-400 [font-family:'JetBrains_Mono',monospace]",children:"stream.websocket ready for text/voice/image payloads"})]}),b.jsxs("div",{className:"flex min-h-[560px] flex-col gap-4",children:[Fe("rounded-[16px] border border-slate-800 bg-[#151C25] p-[14px]"),b.jsxs("div",{className:"rounded-[16px] border border-slate-800 bg-[#151C25] p-[14px]",children:[b.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100 [font-family:Oswald,sans-serif]",children:"image_context"}),b.jsx("p",{className:"mt-2 text-[10px] text-[#6F7B8B] [font-family:'JetBrains_Mono',monospace]",children:"model: gemini-live-2.5-flash-native-audio"})]})]})]}),T==="tablet"&&b.jsxs("div",{className:"m-4 grid grid-cols-[1fr_290px] gap-[14px] rounded-[24px] bg-[#0F1115] p-5",children:[b.jsxs("div",{className:"flex min-h-[520px] flex-col gap-4",children:[pa("rounded-[14px] border border-slate-800 bg-[#151C25] p-3","conversation_stream"),b.jsxs("div",{className:"grid grid-cols-3 gap-[10px]",children:[b.jsxs("div",{className:"rounded-[12px] bg-[#171E27] p-[10px]",children:[b.jsx("p",{className:"text-[10px] text-[#8D98A8] [font-family:'JetBrains_Mono',monospace]",children:"latency_ms"}),b.jsx("p",{className:"text-[24px] leading-none [font-family:Oswald,sans-serif]",children:"178"})]}),b.jsxs("div",{className:"rounded-[12px] bg-[#171E27] p-[10px]",children:[b.jsx("p",{className:"text-[10px] text-[#8D98A8] [font-family:'JetBrains_Mono',monospace]",children:"turns"}),b.jsx("p",{className:"text-[24px] leading-none [font-family:Oswald,sans-serif]",children:"9"})]}),b.jsxs("div",{className:"rounded-[12px] bg-[#FF7A3D] p-[10px] text-[#0F1115]",children:[b.jsx("p",{className:"text-[10px] text-[#2B1408] [font-family:'JetBrains_Mono',monospace]",children:"state"}),b.jsx("p",{className:"text-[24px] leading-none [font-family:Oswald,sans-serif]",children:"SPEAKING"})]})]})]}),b.jsxs("div",{className:"flex min-h-[520px] flex-col gap-4",children:[iu("rounded-[14px] border border-slate-800 bg-[#151C25] p-3","voice_activity","run_config"),Fe("flex-1 rounded-[14px] border border-slate-800 bg-[#151C25] p-3","tool_events")]})]}),T==="mobile"&&b.jsxs("div",{className:"m-3 flex flex-col gap-[14px] rounded-[28px] bg-[#0F1115] p-[20px_16px]",children:[b.jsxs("div",{className:"rounded-[14px] bg-transparent",children:[b.jsx("p",{className:"text-[30px] leading-none [font-family:Oswald,sans-serif]",children:"Voxa Mobile"}),b.jsx("p",{className:"mt-1 text-[11px] text-[#8D98A8] [font-family:'JetBrains_Mono',monospace]",children:"live_voice_console"}),b.jsxs("div",{className:"mt-3 flex items-center gap-2",children:[b.jsx("span",{className:"rounded-full bg-[#1F2A22] px-2 py-1 text-[10px] text-[#2EE6A6]",children:"CONNECTED"}),b.jsx("span",{className:"rounded-full bg-[#2C271B] px-2 py-1 text-[10px] text-[#F7C56B]",children:"reconnecting"})]})]}),b.jsxs("div",{className:"grid grid-cols-2 gap-[10px]",children:[b.jsxs("div",{className:"rounded-[12px] bg-[#171E27] p-[10px]",children:[b.jsx("p",{className:"text-[10px] text-[#8D98A8] [font-family:'JetBrains_Mono',monospace]",children:"latency"}),b.jsx("p",{className:"text-[24px] leading-none [font-family:Oswald,sans-serif]",children:"186ms"})]}),b.jsxs("div",{className:"rounded-[12px] bg-[#FF7A3D] p-[10px] text-[#0F1115]",children:[b.jsx("p",{className:"text-[10px] text-[#2B1408] [font-family:'JetBrains_Mono',monospace]",children:"state"}),b.jsx("p",{className:"text-[24px] leading-none [font-family:Oswald,sans-serif]",children:"LIVE"})]})]}),pa("rounded-[14px] border border-slate-800 bg-[#151C25] p-3","conversation"),b.jsx("div",{className:"rounded-[16px] border border-slate-800 bg-[#111821] p-3",children:b.jsx("button",{type:"button",className:"w-full rounded-[16px] bg-[#00D4AA] px-4 py-3 text-xs font-semibold text-[#092118]",children:"hold_to_talk"})}),b.jsx("div",{className:"rounded-[14px] border border-slate-800 bg-[#161E28] p-[6px_8px]",children:b.jsxs("div",{className:"grid grid-cols-3 gap-2 text-center text-[10px] [font-family:'JetBrains_Mono',monospace]",children:[b.jsx("div",{className:"rounded-[10px] bg-[#1E2631] py-2 text-white",children:"chat"}),b.jsx("div",{className:"rounded-[10px] bg-[#111722] py-2 text-[#8D98A8]",children:"voice"}),b.jsx("div",{className:"rounded-[10px] bg-[#111722] py-2 text-[#8D98A8]",children:"tools"})]})}),iu("rounded-[12px] border border-slate-800 bg-[#151C25] p-[10px]","session_overview","run_config"),Fe("rounded-[12px] border border-slate-800 bg-[#151C25] p-[10px]","tool_events")]}),b.jsxs("section",{"aria-label":"input-controls",role:"region",className:T==="mobile"?"border-t border-slate-800 bg-[#0F141C] p-3":"sticky bottom-0 border-t border-slate-800 bg-[#0F141C] p-4",children:[b.jsxs("form",{className:"flex flex-wrap items-center gap-2",onSubmit:Zl,children:[b.jsx("label",{htmlFor:"text-input",className:"sr-only",children:"テキスト入力"}),b.jsx("input",{id:"text-input",type:"text",value:j,onChange:z=>A(z.target.value),className:"min-w-[200px] flex-1 rounded-xl border border-slate-700 bg-slate-800 px-3 py-2 text-sm text-slate-100 placeholder:text-slate-500",placeholder:"メッセージを入力"}),b.jsx("button",{type:"submit",className:"rounded-xl bg-[#FF7A3D] px-4 py-2 text-sm font-semibold text-slate-950",children:"送信"}),b.jsx("button",{type:"button",className:"rounded-xl bg-[#00D4AA] px-4 py-2 text-sm font-semibold text-slate-950",onClick:el,children:ct?"音声停止":"音声開始"}),b.jsx("button",{type:"button",className:"rounded-xl bg-slate-700 px-3 py-2 text-sm text-white",onClick:gi,children:"画像送信"})]}),ct&&b.jsx("p",{"data-testid":"voice-input-state",className:"mt-2 text-sm text-emerald-300",children:"音声入力中"}),b.jsx("p",{"data-testid":"camera-state",className:"mt-1 text-sm text-slate-400",children:D?"利用中":"未使用"})]}),x&&b.jsx("section",{role:"dialog","aria-label":"camera-preview",className:"fixed inset-0 z-10 flex items-center justify-center bg-black/60 p-4",children:b.jsxs("div",{className:"w-full max-w-md rounded-2xl border border-slate-700 bg-[#121821] p-4",children:[b.jsx("p",{className:"text-xl font-semibold [font-family:Oswald,sans-serif]",children:"Camera Preview"}),b.jsx("p",{className:"mt-2 text-sm text-slate-300",children:"プレビュー準備完了"}),b.jsxs("div",{className:"mt-4 flex gap-2",children:[b.jsx("button",{type:"button",className:"rounded-xl bg-[#FF7A3D] px-3 py-2 text-sm font-semibold text-slate-900",onClick:Si,children:"画像を送信"}),b.jsx("button",{type:"button",className:"rounded-xl bg-slate-700 px-3 py-2 text-sm text-white",onClick:tn,children:"キャンセル"})]})]})}),b.jsxs("section",{"aria-label":"system-notices",role:"region",className:"border-t border-slate-800 bg-[#0F141C] p-3",children:[b.jsx("p",{className:"text-sm font-medium text-slate-200",children:"システム通知"}),b.jsx("ul",{"data-testid":"system-notices",className:"mt-1 list-disc pl-5 text-sm text-slate-300",children:Ot.map((z,_)=>b.jsx("li",{"data-testid":"system-notice-item",className:"system-notice-item rounded border-l-2 border-amber-400 bg-amber-950/30 px-2 py-1",children:z},`${z}-${_}`))})]})]})}function hv(){return{connection:"disconnected",conversation:[],notices:[],eventLog:[]}}const gv=R.createContext(null);function Sv({children:T}){const[J]=R.useState(hv()),U=R.useMemo(()=>J,[J]);return b.jsx(gv.Provider,{value:U,children:T})}const Gr=document.getElementById("root");if(!Gr)throw new Error("Root element #root not found");iv.createRoot(Gr).render(b.jsx(R.StrictMode,{children:b.jsx(Sv,{children:b.jsx(yv,{})})}));"serviceWorker"in navigator&&window.addEventListener("load",()=>{navigator.serviceWorker.register("/service-worker.js").catch(T=>{console.error("service worker registration failed",T)})});
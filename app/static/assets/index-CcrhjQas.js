@@ -1,49 +0,0 @@
-(function(){const J=document.createElement("link").relList;if(J&&J.supports&&J.supports("modulepreload"))return;for(const V of document.querySelectorAll('link[rel="modulepreload"]'))r(V);new MutationObserver(V=>{for(const k of V)if(k.type==="childList")for(const _t of k.addedNodes)_t.tagName==="LINK"&&_t.rel==="modulepreload"&&r(_t)}).observe(document,{childList:!0,subtree:!0});function U(V){const k={};return V.integrity&&(k.integrity=V.integrity),V.referrerPolicy&&(k.referrerPolicy=V.referrerPolicy),V.crossOrigin==="use-credentials"?k.credentials="include":V.crossOrigin==="anonymous"?k.credentials="omit":k.credentials="same-origin",k}function r(V){if(V.ep)return;V.ep=!0;const k=U(V);fetch(V.href,k)}})();var Mf={exports:{}},Fu={};/**
- * @license React
- * react-jsx-runtime.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Or;function F0(){if(Or)return Fu;Or=1;var z=Symbol.for("react.transitional.element"),J=Symbol.for("react.fragment");function U(r,V,k){var _t=null;if(k!==void 0&&(_t=""+k),V.key!==void 0&&(_t=""+V.key),"key"in V){k={};for(var St in V)St!=="key"&&(k[St]=V[St])}else k=V;return V=k.ref,{$$typeof:z,type:r,key:_t,ref:V!==void 0?V:null,props:k}}return Fu.Fragment=J,Fu.jsx=U,Fu.jsxs=U,Fu}var Nr;function I0(){return Nr||(Nr=1,Mf.exports=F0()),Mf.exports}var b=I0(),Df={exports:{}},L={};/**
- * @license React
- * react.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Mr;function P0(){if(Mr)return L;Mr=1;var z=Symbol.for("react.transitional.element"),J=Symbol.for("react.portal"),U=Symbol.for("react.fragment"),r=Symbol.for("react.strict_mode"),V=Symbol.for("react.profiler"),k=Symbol.for("react.consumer"),_t=Symbol.for("react.context"),St=Symbol.for("react.forward_ref"),j=Symbol.for("react.suspense"),A=Symbol.for("react.memo"),lt=Symbol.for("react.lazy"),H=Symbol.for("react.activity"),ct=Symbol.iterator;function Qt(o){return o===null||typeof o!="object"?null:(o=ct&&o[ct]||o["@@iterator"],typeof o=="function"?o:null)}var Ft={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},Kt=Object.assign,ql={};function tl(o,x,O){this.props=o,this.context=x,this.refs=ql,this.updater=O||Ft}tl.prototype.isReactComponent={},tl.prototype.setState=function(o,x){if(typeof o!="object"&&typeof o!="function"&&o!=null)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,o,x,"setState")},tl.prototype.forceUpdate=function(o){this.updater.enqueueForceUpdate(this,o,"forceUpdate")};function Tl(){}Tl.prototype=tl.prototype;function Yt(o,x,O){this.props=o,this.context=x,this.refs=ql,this.updater=O||Ft}var il=Yt.prototype=new Tl;il.constructor=Yt,Kt(il,tl.prototype),il.isPureReactComponent=!0;var zl=Array.isArray;function Jt(){}var W={H:null,A:null,T:null,S:null},It=Object.prototype.hasOwnProperty;function yl(o,x,O){var D=O.ref;return{$$typeof:z,type:o,key:x,ref:D!==void 0?D:null,props:O}}function kl(o,x){return yl(o.type,x,o.props)}function _l(o){return typeof o=="object"&&o!==null&&o.$$typeof===z}function Ot(o){var x={"=":"=0",":":"=2"};return"$"+o.replace(/[=:]/g,function(O){return x[O]})}var $l=/\/+/g;function cl(o,x){return typeof o=="object"&&o!==null&&o.key!=null?Ot(""+o.key):x.toString(36)}function ll(o){switch(o.status){case"fulfilled":return o.value;case"rejected":throw o.reason;default:switch(typeof o.status=="string"?o.then(Jt,Jt):(o.status="pending",o.then(function(x){o.status==="pending"&&(o.status="fulfilled",o.value=x)},function(x){o.status==="pending"&&(o.status="rejected",o.reason=x)})),o.status){case"fulfilled":return o.value;case"rejected":throw o.reason}}throw o}function g(o,x,O,D,Q){var Z=typeof o;(Z==="undefined"||Z==="boolean")&&(o=null);var ut=!1;if(o===null)ut=!0;else switch(Z){case"bigint":case"string":case"number":ut=!0;break;case"object":switch(o.$$typeof){case z:case J:ut=!0;break;case lt:return ut=o._init,g(ut(o._payload),x,O,D,Q)}}if(ut)return Q=Q(o),ut=D===""?"."+cl(o,0):D,zl(Q)?(O="",ut!=null&&(O=ut.replace($l,"$&/")+"/"),g(Q,x,O,"",function(Zl){return Zl})):Q!=null&&(_l(Q)&&(Q=kl(Q,O+(Q.key==null||o&&o.key===Q.key?"":(""+Q.key).replace($l,"$&/")+"/")+ut)),x.push(Q)),1;ut=0;var Xt=D===""?".":D+":";if(zl(o))for(var ot=0;ot<o.length;ot++)D=o[ot],Z=Xt+cl(D,ot),ut+=g(D,x,O,Z,Q);else if(ot=Qt(o),typeof ot=="function")for(o=ot.call(o),ot=0;!(D=o.next()).done;)D=D.value,Z=Xt+cl(D,ot++),ut+=g(D,x,O,Z,Q);else if(Z==="object"){if(typeof o.then=="function")return g(ll(o),x,O,D,Q);throw x=String(o),Error("Objects are not valid as a React child (found: "+(x==="[object Object]"?"object with keys {"+Object.keys(o).join(", ")+"}":x)+"). If you meant to render a collection of children, use an array instead.")}return ut}function N(o,x,O){if(o==null)return o;var D=[],Q=0;return g(o,D,"","",function(Z){return x.call(O,Z,Q++)}),D}function Y(o){if(o._status===-1){var x=o._result;x=x(),x.then(function(O){(o._status===0||o._status===-1)&&(o._status=1,o._result=O)},function(O){(o._status===0||o._status===-1)&&(o._status=2,o._result=O)}),o._status===-1&&(o._status=0,o._result=x)}if(o._status===1)return o._result.default;throw o._result}var at=typeof reportError=="function"?reportError:function(o){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var x=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof o=="object"&&o!==null&&typeof o.message=="string"?String(o.message):String(o),error:o});if(!window.dispatchEvent(x))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",o);return}console.error(o)},st={map:N,forEach:function(o,x,O){N(o,function(){x.apply(this,arguments)},O)},count:function(o){var x=0;return N(o,function(){x++}),x},toArray:function(o){return N(o,function(x){return x})||[]},only:function(o){if(!_l(o))throw Error("React.Children.only expected to receive a single React element child.");return o}};return L.Activity=H,L.Children=st,L.Component=tl,L.Fragment=U,L.Profiler=V,L.PureComponent=Yt,L.StrictMode=r,L.Suspense=j,L.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=W,L.__COMPILER_RUNTIME={__proto__:null,c:function(o){return W.H.useMemoCache(o)}},L.cache=function(o){return function(){return o.apply(null,arguments)}},L.cacheSignal=function(){return null},L.cloneElement=function(o,x,O){if(o==null)throw Error("The argument must be a React element, but you passed "+o+".");var D=Kt({},o.props),Q=o.key;if(x!=null)for(Z in x.key!==void 0&&(Q=""+x.key),x)!It.call(x,Z)||Z==="key"||Z==="__self"||Z==="__source"||Z==="ref"&&x.ref===void 0||(D[Z]=x[Z]);var Z=arguments.length-2;if(Z===1)D.children=O;else if(1<Z){for(var ut=Array(Z),Xt=0;Xt<Z;Xt++)ut[Xt]=arguments[Xt+2];D.children=ut}return yl(o.type,Q,D)},L.createContext=function(o){return o={$$typeof:_t,_currentValue:o,_currentValue2:o,_threadCount:0,Provider:null,Consumer:null},o.Provider=o,o.Consumer={$$typeof:k,_context:o},o},L.createElement=function(o,x,O){var D,Q={},Z=null;if(x!=null)for(D in x.key!==void 0&&(Z=""+x.key),x)It.call(x,D)&&D!=="key"&&D!=="__self"&&D!=="__source"&&(Q[D]=x[D]);var ut=arguments.length-2;if(ut===1)Q.children=O;else if(1<ut){for(var Xt=Array(ut),ot=0;ot<ut;ot++)Xt[ot]=arguments[ot+2];Q.children=Xt}if(o&&o.defaultProps)for(D in ut=o.defaultProps,ut)Q[D]===void 0&&(Q[D]=ut[D]);return yl(o,Z,Q)},L.createRef=function(){return{current:null}},L.forwardRef=function(o){return{$$typeof:St,render:o}},L.isValidElement=_l,L.lazy=function(o){return{$$typeof:lt,_payload:{_status:-1,_result:o},_init:Y}},L.memo=function(o,x){return{$$typeof:A,type:o,compare:x===void 0?null:x}},L.startTransition=function(o){var x=W.T,O={};W.T=O;try{var D=o(),Q=W.S;Q!==null&&Q(O,D),typeof D=="object"&&D!==null&&typeof D.then=="function"&&D.then(Jt,at)}catch(Z){at(Z)}finally{x!==null&&O.types!==null&&(x.types=O.types),W.T=x}},L.unstable_useCacheRefresh=function(){return W.H.useCacheRefresh()},L.use=function(o){return W.H.use(o)},L.useActionState=function(o,x,O){return W.H.useActionState(o,x,O)},L.useCallback=function(o,x){return W.H.useCallback(o,x)},L.useContext=function(o){return W.H.useContext(o)},L.useDebugValue=function(){},L.useDeferredValue=function(o,x){return W.H.useDeferredValue(o,x)},L.useEffect=function(o,x){return W.H.useEffect(o,x)},L.useEffectEvent=function(o){return W.H.useEffectEvent(o)},L.useId=function(){return W.H.useId()},L.useImperativeHandle=function(o,x,O){return W.H.useImperativeHandle(o,x,O)},L.useInsertionEffect=function(o,x){return W.H.useInsertionEffect(o,x)},L.useLayoutEffect=function(o,x){return W.H.useLayoutEffect(o,x)},L.useMemo=function(o,x){return W.H.useMemo(o,x)},L.useOptimistic=function(o,x){return W.H.useOptimistic(o,x)},L.useReducer=function(o,x,O){return W.H.useReducer(o,x,O)},L.useRef=function(o){return W.H.useRef(o)},L.useState=function(o){return W.H.useState(o)},L.useSyncExternalStore=function(o,x,O){return W.H.useSyncExternalStore(o,x,O)},L.useTransition=function(){return W.H.useTransition()},L.version="19.2.4",L}var Dr;function Hf(){return Dr||(Dr=1,Df.exports=P0()),Df.exports}var R=Hf(),Cf={exports:{}},Iu={},Uf={exports:{}},Rf={};/**
- * @license React
- * scheduler.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Cr;function tv(){return Cr||(Cr=1,(function(z){function J(g,N){var Y=g.length;g.push(N);t:for(;0<Y;){var at=Y-1>>>1,st=g[at];if(0<V(st,N))g[at]=N,g[Y]=st,Y=at;else break t}}function U(g){return g.length===0?null:g[0]}function r(g){if(g.length===0)return null;var N=g[0],Y=g.pop();if(Y!==N){g[0]=Y;t:for(var at=0,st=g.length,o=st>>>1;at<o;){var x=2*(at+1)-1,O=g[x],D=x+1,Q=g[D];if(0>V(O,Y))D<st&&0>V(Q,O)?(g[at]=Q,g[D]=Y,at=D):(g[at]=O,g[x]=Y,at=x);else if(D<st&&0>V(Q,Y))g[at]=Q,g[D]=Y,at=D;else break t}}return N}function V(g,N){var Y=g.sortIndex-N.sortIndex;return Y!==0?Y:g.id-N.id}if(z.unstable_now=void 0,typeof performance=="object"&&typeof performance.now=="function"){var k=performance;z.unstable_now=function(){return k.now()}}else{var _t=Date,St=_t.now();z.unstable_now=function(){return _t.now()-St}}var j=[],A=[],lt=1,H=null,ct=3,Qt=!1,Ft=!1,Kt=!1,ql=!1,tl=typeof setTimeout=="function"?setTimeout:null,Tl=typeof clearTimeout=="function"?clearTimeout:null,Yt=typeof setImmediate<"u"?setImmediate:null;function il(g){for(var N=U(A);N!==null;){if(N.callback===null)r(A);else if(N.startTime<=g)r(A),N.sortIndex=N.expirationTime,J(j,N);else break;N=U(A)}}function zl(g){if(Kt=!1,il(g),!Ft)if(U(j)!==null)Ft=!0,Jt||(Jt=!0,Ot());else{var N=U(A);N!==null&&ll(zl,N.startTime-g)}}var Jt=!1,W=-1,It=5,yl=-1;function kl(){return ql?!0:!(z.unstable_now()-yl<It)}function _l(){if(ql=!1,Jt){var g=z.unstable_now();yl=g;var N=!0;try{t:{Ft=!1,Kt&&(Kt=!1,Tl(W),W=-1),Qt=!0;var Y=ct;try{l:{for(il(g),H=U(j);H!==null&&!(H.expirationTime>g&&kl());){var at=H.callback;if(typeof at=="function"){H.callback=null,ct=H.priorityLevel;var st=at(H.expirationTime<=g);if(g=z.unstable_now(),typeof st=="function"){H.callback=st,il(g),N=!0;break l}H===U(j)&&r(j),il(g)}else r(j);H=U(j)}if(H!==null)N=!0;else{var o=U(A);o!==null&&ll(zl,o.startTime-g),N=!1}}break t}finally{H=null,ct=Y,Qt=!1}N=void 0}}finally{N?Ot():Jt=!1}}}var Ot;if(typeof Yt=="function")Ot=function(){Yt(_l)};else if(typeof MessageChannel<"u"){var $l=new MessageChannel,cl=$l.port2;$l.port1.onmessage=_l,Ot=function(){cl.postMessage(null)}}else Ot=function(){tl(_l,0)};function ll(g,N){W=tl(function(){g(z.unstable_now())},N)}z.unstable_IdlePriority=5,z.unstable_ImmediatePriority=1,z.unstable_LowPriority=4,z.unstable_NormalPriority=3,z.unstable_Profiling=null,z.unstable_UserBlockingPriority=2,z.unstable_cancelCallback=function(g){g.callback=null},z.unstable_forceFrameRate=function(g){0>g||125<g?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):It=0<g?Math.floor(1e3/g):5},z.unstable_getCurrentPriorityLevel=function(){return ct},z.unstable_next=function(g){switch(ct){case 1:case 2:case 3:var N=3;break;default:N=ct}var Y=ct;ct=N;try{return g()}finally{ct=Y}},z.unstable_requestPaint=function(){ql=!0},z.unstable_runWithPriority=function(g,N){switch(g){case 1:case 2:case 3:case 4:case 5:break;default:g=3}var Y=ct;ct=g;try{return N()}finally{ct=Y}},z.unstable_scheduleCallback=function(g,N,Y){var at=z.unstable_now();switch(typeof Y=="object"&&Y!==null?(Y=Y.delay,Y=typeof Y=="number"&&0<Y?at+Y:at):Y=at,g){case 1:var st=-1;break;case 2:st=250;break;case 5:st=1073741823;break;case 4:st=1e4;break;default:st=5e3}return st=Y+st,g={id:lt++,callback:N,priorityLevel:g,startTime:Y,expirationTime:st,sortIndex:-1},Y>at?(g.sortIndex=Y,J(A,g),U(j)===null&&g===U(A)&&(Kt?(Tl(W),W=-1):Kt=!0,ll(zl,Y-at))):(g.sortIndex=st,J(j,g),Ft||Qt||(Ft=!0,Jt||(Jt=!0,Ot()))),g},z.unstable_shouldYield=kl,z.unstable_wrapCallback=function(g){var N=ct;return function(){var Y=ct;ct=N;try{return g.apply(this,arguments)}finally{ct=Y}}}})(Rf)),Rf}var Ur;function lv(){return Ur||(Ur=1,Uf.exports=tv()),Uf.exports}var jf={exports:{}},Pt={};/**
- * @license React
- * react-dom.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Rr;function ev(){if(Rr)return Pt;Rr=1;var z=Hf();function J(j){var A="https://react.dev/errors/"+j;if(1<arguments.length){A+="?args[]="+encodeURIComponent(arguments[1]);for(var lt=2;lt<arguments.length;lt++)A+="&args[]="+encodeURIComponent(arguments[lt])}return"Minified React error #"+j+"; visit "+A+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function U(){}var r={d:{f:U,r:function(){throw Error(J(522))},D:U,C:U,L:U,m:U,X:U,S:U,M:U},p:0,findDOMNode:null},V=Symbol.for("react.portal");function k(j,A,lt){var H=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:V,key:H==null?null:""+H,children:j,containerInfo:A,implementation:lt}}var _t=z.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function St(j,A){if(j==="font")return"";if(typeof A=="string")return A==="use-credentials"?A:""}return Pt.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=r,Pt.createPortal=function(j,A){var lt=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!A||A.nodeType!==1&&A.nodeType!==9&&A.nodeType!==11)throw Error(J(299));return k(j,A,null,lt)},Pt.flushSync=function(j){var A=_t.T,lt=r.p;try{if(_t.T=null,r.p=2,j)return j()}finally{_t.T=A,r.p=lt,r.d.f()}},Pt.preconnect=function(j,A){typeof j=="string"&&(A?(A=A.crossOrigin,A=typeof A=="string"?A==="use-credentials"?A:"":void 0):A=null,r.d.C(j,A))},Pt.prefetchDNS=function(j){typeof j=="string"&&r.d.D(j)},Pt.preinit=function(j,A){if(typeof j=="string"&&A&&typeof A.as=="string"){var lt=A.as,H=St(lt,A.crossOrigin),ct=typeof A.integrity=="string"?A.integrity:void 0,Qt=typeof A.fetchPriority=="string"?A.fetchPriority:void 0;lt==="style"?r.d.S(j,typeof A.precedence=="string"?A.precedence:void 0,{crossOrigin:H,integrity:ct,fetchPriority:Qt}):lt==="script"&&r.d.X(j,{crossOrigin:H,integrity:ct,fetchPriority:Qt,nonce:typeof A.nonce=="string"?A.nonce:void 0})}},Pt.preinitModule=function(j,A){if(typeof j=="string")if(typeof A=="object"&&A!==null){if(A.as==null||A.as==="script"){var lt=St(A.as,A.crossOrigin);r.d.M(j,{crossOrigin:lt,integrity:typeof A.integrity=="string"?A.integrity:void 0,nonce:typeof A.nonce=="string"?A.nonce:void 0})}}else A==null&&r.d.M(j)},Pt.preload=function(j,A){if(typeof j=="string"&&typeof A=="object"&&A!==null&&typeof A.as=="string"){var lt=A.as,H=St(lt,A.crossOrigin);r.d.L(j,lt,{crossOrigin:H,integrity:typeof A.integrity=="string"?A.integrity:void 0,nonce:typeof A.nonce=="string"?A.nonce:void 0,type:typeof A.type=="string"?A.type:void 0,fetchPriority:typeof A.fetchPriority=="string"?A.fetchPriority:void 0,referrerPolicy:typeof A.referrerPolicy=="string"?A.referrerPolicy:void 0,imageSrcSet:typeof A.imageSrcSet=="string"?A.imageSrcSet:void 0,imageSizes:typeof A.imageSizes=="string"?A.imageSizes:void 0,media:typeof A.media=="string"?A.media:void 0})}},Pt.preloadModule=function(j,A){if(typeof j=="string")if(A){var lt=St(A.as,A.crossOrigin);r.d.m(j,{as:typeof A.as=="string"&&A.as!=="script"?A.as:void 0,crossOrigin:lt,integrity:typeof A.integrity=="string"?A.integrity:void 0})}else r.d.m(j)},Pt.requestFormReset=function(j){r.d.r(j)},Pt.unstable_batchedUpdates=function(j,A){return j(A)},Pt.useFormState=function(j,A,lt){return _t.H.useFormState(j,A,lt)},Pt.useFormStatus=function(){return _t.H.useHostTransitionStatus()},Pt.version="19.2.4",Pt}var jr;function av(){if(jr)return jf.exports;jr=1;function z(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(z)}catch(J){console.error(J)}}return z(),jf.exports=ev(),jf.exports}/**
- * @license React
- * react-dom-client.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Hr;function uv(){if(Hr)return Iu;Hr=1;var z=lv(),J=Hf(),U=av();function r(t){var l="https://react.dev/errors/"+t;if(1<arguments.length){l+="?args[]="+encodeURIComponent(arguments[1]);for(var e=2;e<arguments.length;e++)l+="&args[]="+encodeURIComponent(arguments[e])}return"Minified React error #"+t+"; visit "+l+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function V(t){return!(!t||t.nodeType!==1&&t.nodeType!==9&&t.nodeType!==11)}function k(t){var l=t,e=t;if(t.alternate)for(;l.return;)l=l.return;else{t=l;do l=t,(l.flags&4098)!==0&&(e=l.return),t=l.return;while(t)}return l.tag===3?e:null}function _t(t){if(t.tag===13){var l=t.memoizedState;if(l===null&&(t=t.alternate,t!==null&&(l=t.memoizedState)),l!==null)return l.dehydrated}return null}function St(t){if(t.tag===31){var l=t.memoizedState;if(l===null&&(t=t.alternate,t!==null&&(l=t.memoizedState)),l!==null)return l.dehydrated}return null}function j(t){if(k(t)!==t)throw Error(r(188))}function A(t){var l=t.alternate;if(!l){if(l=k(t),l===null)throw Error(r(188));return l!==t?null:t}for(var e=t,a=l;;){var u=e.return;if(u===null)break;var n=u.alternate;if(n===null){if(a=u.return,a!==null){e=a;continue}break}if(u.child===n.child){for(n=u.child;n;){if(n===e)return j(u),t;if(n===a)return j(u),l;n=n.sibling}throw Error(r(188))}if(e.return!==a.return)e=u,a=n;else{for(var i=!1,c=u.child;c;){if(c===e){i=!0,e=u,a=n;break}if(c===a){i=!0,a=u,e=n;break}c=c.sibling}if(!i){for(c=n.child;c;){if(c===e){i=!0,e=n,a=u;break}if(c===a){i=!0,a=n,e=u;break}c=c.sibling}if(!i)throw Error(r(189))}}if(e.alternate!==a)throw Error(r(190))}if(e.tag!==3)throw Error(r(188));return e.stateNode.current===e?t:l}function lt(t){var l=t.tag;if(l===5||l===26||l===27||l===6)return t;for(t=t.child;t!==null;){if(l=lt(t),l!==null)return l;t=t.sibling}return null}var H=Object.assign,ct=Symbol.for("react.element"),Qt=Symbol.for("react.transitional.element"),Ft=Symbol.for("react.portal"),Kt=Symbol.for("react.fragment"),ql=Symbol.for("react.strict_mode"),tl=Symbol.for("react.profiler"),Tl=Symbol.for("react.consumer"),Yt=Symbol.for("react.context"),il=Symbol.for("react.forward_ref"),zl=Symbol.for("react.suspense"),Jt=Symbol.for("react.suspense_list"),W=Symbol.for("react.memo"),It=Symbol.for("react.lazy"),yl=Symbol.for("react.activity"),kl=Symbol.for("react.memo_cache_sentinel"),_l=Symbol.iterator;function Ot(t){return t===null||typeof t!="object"?null:(t=_l&&t[_l]||t["@@iterator"],typeof t=="function"?t:null)}var $l=Symbol.for("react.client.reference");function cl(t){if(t==null)return null;if(typeof t=="function")return t.$$typeof===$l?null:t.displayName||t.name||null;if(typeof t=="string")return t;switch(t){case Kt:return"Fragment";case tl:return"Profiler";case ql:return"StrictMode";case zl:return"Suspense";case Jt:return"SuspenseList";case yl:return"Activity"}if(typeof t=="object")switch(t.$$typeof){case Ft:return"Portal";case Yt:return t.displayName||"Context";case Tl:return(t._context.displayName||"Context")+".Consumer";case il:var l=t.render;return t=t.displayName,t||(t=l.displayName||l.name||"",t=t!==""?"ForwardRef("+t+")":"ForwardRef"),t;case W:return l=t.displayName||null,l!==null?l:cl(t.type)||"Memo";case It:l=t._payload,t=t._init;try{return cl(t(l))}catch{}}return null}var ll=Array.isArray,g=J.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,N=U.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,Y={pending:!1,data:null,method:null,action:null},at=[],st=-1;function o(t){return{current:t}}function x(t){0>st||(t.current=at[st],at[st]=null,st--)}function O(t,l){st++,at[st]=t.current,t.current=l}var D=o(null),Q=o(null),Z=o(null),ut=o(null);function Xt(t,l){switch(O(Z,l),O(Q,t),O(D,null),l.nodeType){case 9:case 11:t=(t=l.documentElement)&&(t=t.namespaceURI)?$d(t):0;break;default:if(t=l.tagName,l=l.namespaceURI)l=$d(l),t=Fd(l,t);else switch(t){case"svg":t=1;break;case"math":t=2;break;default:t=0}}x(D),O(D,t)}function ot(){x(D),x(Q),x(Z)}function Zl(t){t.memoizedState!==null&&O(ut,t);var l=D.current,e=Fd(l,t.type);l!==e&&(O(Q,t),O(D,e))}function Nt(t){Q.current===t&&(x(D),x(Q)),ut.current===t&&(x(ut),wu._currentValue=Y)}var Ve,Pu;function Fl(t){if(Ve===void 0)try{throw Error()}catch(e){var l=e.stack.trim().match(/\n( *(at )?)/);Ve=l&&l[1]||"",Pu=-1<e.stack.indexOf(`
-    at`)?" (<anonymous>)":-1<e.stack.indexOf("@")?"@unknown:0:0":""}return`
-`+Ve+t+Pu}var Ke=!1;function Se(t,l){if(!t||Ke)return"";Ke=!0;var e=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var a={DetermineComponentFrameRoot:function(){try{if(l){var E=function(){throw Error()};if(Object.defineProperty(E.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(E,[])}catch(h){var y=h}Reflect.construct(t,[],E)}else{try{E.call()}catch(h){y=h}t.call(E.prototype)}}else{try{throw Error()}catch(h){y=h}(E=t())&&typeof E.catch=="function"&&E.catch(function(){})}}catch(h){if(h&&y&&typeof h.stack=="string")return[h.stack,y.stack]}return[null,null]}};a.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var u=Object.getOwnPropertyDescriptor(a.DetermineComponentFrameRoot,"name");u&&u.configurable&&Object.defineProperty(a.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var n=a.DetermineComponentFrameRoot(),i=n[0],c=n[1];if(i&&c){var f=i.split(`
-`),v=c.split(`
-`);for(u=a=0;a<f.length&&!f[a].includes("DetermineComponentFrameRoot");)a++;for(;u<v.length&&!v[u].includes("DetermineComponentFrameRoot");)u++;if(a===f.length||u===v.length)for(a=f.length-1,u=v.length-1;1<=a&&0<=u&&f[a]!==v[u];)u--;for(;1<=a&&0<=u;a--,u--)if(f[a]!==v[u]){if(a!==1||u!==1)do if(a--,u--,0>u||f[a]!==v[u]){var S=`
-`+f[a].replace(" at new "," at ");return t.displayName&&S.includes("<anonymous>")&&(S=S.replace("<anonymous>",t.displayName)),S}while(1<=a&&0<=u);break}}}finally{Ke=!1,Error.prepareStackTrace=e}return(e=t?t.displayName||t.name:"")?Fl(e):""}function ya(t,l){switch(t.tag){case 26:case 27:case 5:return Fl(t.type);case 16:return Fl("Lazy");case 13:return t.child!==l&&l!==null?Fl("Suspense Fallback"):Fl("Suspense");case 19:return Fl("SuspenseList");case 0:case 15:return Se(t.type,!1);case 11:return Se(t.type.render,!1);case 1:return Se(t.type,!0);case 31:return Fl("Activity");default:return""}}function be(t){try{var l="",e=null;do l+=ya(t,e),e=t,t=t.return;while(t);return l}catch(a){return`
-Error generating stack: `+a.message+`
-`+a.stack}}var pe=Object.prototype.hasOwnProperty,Yl=z.unstable_scheduleCallback,Je=z.unstable_cancelCallback,vt=z.unstable_shouldYield,vi=z.unstable_requestPaint,Et=z.unstable_now,Il=z.unstable_getCurrentPriorityLevel,Pl=z.unstable_ImmediatePriority,nu=z.unstable_UserBlockingPriority,we=z.unstable_NormalPriority,iu=z.unstable_LowPriority,We=z.unstable_IdlePriority,yi=z.log,hi=z.unstable_setDisableYieldValue,ke=null,el=null;function Ll(t){if(typeof yi=="function"&&hi(t),el&&typeof el.setStrictMode=="function")try{el.setStrictMode(ke,t)}catch{}}var al=Math.clz32?Math.clz32:Si,tn=Math.log,gi=Math.LN2;function Si(t){return t>>>=0,t===0?32:31-(tn(t)/gi|0)|0}var ha=256,ga=262144,Sa=4194304;function Vl(t){var l=t&42;if(l!==0)return l;switch(t&-t){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:return t&261888;case 262144:case 524288:case 1048576:case 2097152:return t&3932160;case 4194304:case 8388608:case 16777216:case 33554432:return t&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return t}}function ba(t,l,e){var a=t.pendingLanes;if(a===0)return 0;var u=0,n=t.suspendedLanes,i=t.pingedLanes;t=t.warmLanes;var c=a&134217727;return c!==0?(a=c&~n,a!==0?u=Vl(a):(i&=c,i!==0?u=Vl(i):e||(e=c&~t,e!==0&&(u=Vl(e))))):(c=a&~n,c!==0?u=Vl(c):i!==0?u=Vl(i):e||(e=a&~t,e!==0&&(u=Vl(e)))),u===0?0:l!==0&&l!==u&&(l&n)===0&&(n=u&-u,e=l&-l,n>=e||n===32&&(e&4194048)!==0)?l:u}function $e(t,l){return(t.pendingLanes&~(t.suspendedLanes&~t.pingedLanes)&l)===0}function cu(t,l){switch(t){case 1:case 2:case 4:case 8:case 64:return l+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return l+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function pa(){var t=Sa;return Sa<<=1,(Sa&62914560)===0&&(Sa=4194304),t}function Fe(t){for(var l=[],e=0;31>e;e++)l.push(t);return l}function T(t,l){t.pendingLanes|=l,l!==268435456&&(t.suspendedLanes=0,t.pingedLanes=0,t.warmLanes=0)}function _(t,l,e,a,u,n){var i=t.pendingLanes;t.pendingLanes=e,t.suspendedLanes=0,t.pingedLanes=0,t.warmLanes=0,t.expiredLanes&=e,t.entangledLanes&=e,t.errorRecoveryDisabledLanes&=e,t.shellSuspendCounter=0;var c=t.entanglements,f=t.expirationTimes,v=t.hiddenUpdates;for(e=i&~e;0<e;){var S=31-al(e),E=1<<S;c[S]=0,f[S]=-1;var y=v[S];if(y!==null)for(v[S]=null,S=0;S<y.length;S++){var h=y[S];h!==null&&(h.lane&=-536870913)}e&=~E}a!==0&&X(t,a,0),n!==0&&u===0&&t.tag!==0&&(t.suspendedLanes|=n&~(i&~l))}function X(t,l,e){t.pendingLanes|=l,t.suspendedLanes&=~l;var a=31-al(l);t.entangledLanes|=l,t.entanglements[a]=t.entanglements[a]|1073741824|e&261930}function B(t,l){var e=t.entangledLanes|=l;for(t=t.entanglements;e;){var a=31-al(e),u=1<<a;u&l|t[a]&l&&(t[a]|=l),e&=~u}}function et(t,l){var e=l&-l;return e=(e&42)!==0?1:dt(e),(e&(t.suspendedLanes|l))!==0?0:e}function dt(t){switch(t){case 2:t=1;break;case 8:t=4;break;case 32:t=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:t=128;break;case 268435456:t=134217728;break;default:t=0}return t}function Tt(t){return t&=-t,2<t?8<t?(t&134217727)!==0?32:268435456:8:2}function hl(){var t=N.p;return t!==0?t:(t=window.event,t===void 0?32:pr(t.type))}function fl(t,l){var e=N.p;try{return N.p=t,l()}finally{N.p=e}}var ul=Math.random().toString(36).slice(2),Mt="__reactFiber$"+ul,bt="__reactProps$"+ul,Zt="__reactContainer$"+ul,bi="__reactEvents$"+ul,Qr="__reactListeners$"+ul,Xr="__reactHandles$"+ul,Bf="__reactResources$"+ul,fu="__reactMarker$"+ul;function pi(t){delete t[Mt],delete t[bt],delete t[bi],delete t[Qr],delete t[Xr]}function Ea(t){var l=t[Mt];if(l)return l;for(var e=t.parentNode;e;){if(l=e[Zt]||e[Mt]){if(e=l.alternate,l.child!==null||e!==null&&e.child!==null)for(t=ur(t);t!==null;){if(e=t[Mt])return e;t=ur(t)}return l}t=e,e=t.parentNode}return null}function xa(t){if(t=t[Mt]||t[Zt]){var l=t.tag;if(l===5||l===6||l===13||l===31||l===26||l===27||l===3)return t}return null}function su(t){var l=t.tag;if(l===5||l===26||l===27||l===6)return t.stateNode;throw Error(r(33))}function Aa(t){var l=t[Bf];return l||(l=t[Bf]={hoistableStyles:new Map,hoistableScripts:new Map}),l}function Lt(t){t[fu]=!0}var qf=new Set,Yf={};function Ie(t,l){Ta(t,l),Ta(t+"Capture",l)}function Ta(t,l){for(Yf[t]=l,t=0;t<l.length;t++)qf.add(l[t])}var Zr=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),Gf={},Qf={};function Lr(t){return pe.call(Qf,t)?!0:pe.call(Gf,t)?!1:Zr.test(t)?Qf[t]=!0:(Gf[t]=!0,!1)}function ln(t,l,e){if(Lr(l))if(e===null)t.removeAttribute(l);else{switch(typeof e){case"undefined":case"function":case"symbol":t.removeAttribute(l);return;case"boolean":var a=l.toLowerCase().slice(0,5);if(a!=="data-"&&a!=="aria-"){t.removeAttribute(l);return}}t.setAttribute(l,""+e)}}function en(t,l,e){if(e===null)t.removeAttribute(l);else{switch(typeof e){case"undefined":case"function":case"symbol":case"boolean":t.removeAttribute(l);return}t.setAttribute(l,""+e)}}function te(t,l,e,a){if(a===null)t.removeAttribute(e);else{switch(typeof a){case"undefined":case"function":case"symbol":case"boolean":t.removeAttribute(e);return}t.setAttributeNS(l,e,""+a)}}function Ol(t){switch(typeof t){case"bigint":case"boolean":case"number":case"string":case"undefined":return t;case"object":return t;default:return""}}function Xf(t){var l=t.type;return(t=t.nodeName)&&t.toLowerCase()==="input"&&(l==="checkbox"||l==="radio")}function Vr(t,l,e){var a=Object.getOwnPropertyDescriptor(t.constructor.prototype,l);if(!t.hasOwnProperty(l)&&typeof a<"u"&&typeof a.get=="function"&&typeof a.set=="function"){var u=a.get,n=a.set;return Object.defineProperty(t,l,{configurable:!0,get:function(){return u.call(this)},set:function(i){e=""+i,n.call(this,i)}}),Object.defineProperty(t,l,{enumerable:a.enumerable}),{getValue:function(){return e},setValue:function(i){e=""+i},stopTracking:function(){t._valueTracker=null,delete t[l]}}}}function Ei(t){if(!t._valueTracker){var l=Xf(t)?"checked":"value";t._valueTracker=Vr(t,l,""+t[l])}}function Zf(t){if(!t)return!1;var l=t._valueTracker;if(!l)return!0;var e=l.getValue(),a="";return t&&(a=Xf(t)?t.checked?"true":"false":t.value),t=a,t!==e?(l.setValue(t),!0):!1}function an(t){if(t=t||(typeof document<"u"?document:void 0),typeof t>"u")return null;try{return t.activeElement||t.body}catch{return t.body}}var Kr=/[\n"\\]/g;function Nl(t){return t.replace(Kr,function(l){return"\\"+l.charCodeAt(0).toString(16)+" "})}function xi(t,l,e,a,u,n,i,c){t.name="",i!=null&&typeof i!="function"&&typeof i!="symbol"&&typeof i!="boolean"?t.type=i:t.removeAttribute("type"),l!=null?i==="number"?(l===0&&t.value===""||t.value!=l)&&(t.value=""+Ol(l)):t.value!==""+Ol(l)&&(t.value=""+Ol(l)):i!=="submit"&&i!=="reset"||t.removeAttribute("value"),l!=null?Ai(t,i,Ol(l)):e!=null?Ai(t,i,Ol(e)):a!=null&&t.removeAttribute("value"),u==null&&n!=null&&(t.defaultChecked=!!n),u!=null&&(t.checked=u&&typeof u!="function"&&typeof u!="symbol"),c!=null&&typeof c!="function"&&typeof c!="symbol"&&typeof c!="boolean"?t.name=""+Ol(c):t.removeAttribute("name")}function Lf(t,l,e,a,u,n,i,c){if(n!=null&&typeof n!="function"&&typeof n!="symbol"&&typeof n!="boolean"&&(t.type=n),l!=null||e!=null){if(!(n!=="submit"&&n!=="reset"||l!=null)){Ei(t);return}e=e!=null?""+Ol(e):"",l=l!=null?""+Ol(l):e,c||l===t.value||(t.value=l),t.defaultValue=l}a=a??u,a=typeof a!="function"&&typeof a!="symbol"&&!!a,t.checked=c?t.checked:!!a,t.defaultChecked=!!a,i!=null&&typeof i!="function"&&typeof i!="symbol"&&typeof i!="boolean"&&(t.name=i),Ei(t)}function Ai(t,l,e){l==="number"&&an(t.ownerDocument)===t||t.defaultValue===""+e||(t.defaultValue=""+e)}function za(t,l,e,a){if(t=t.options,l){l={};for(var u=0;u<e.length;u++)l["$"+e[u]]=!0;for(e=0;e<t.length;e++)u=l.hasOwnProperty("$"+t[e].value),t[e].selected!==u&&(t[e].selected=u),u&&a&&(t[e].defaultSelected=!0)}else{for(e=""+Ol(e),l=null,u=0;u<t.length;u++){if(t[u].value===e){t[u].selected=!0,a&&(t[u].defaultSelected=!0);return}l!==null||t[u].disabled||(l=t[u])}l!==null&&(l.selected=!0)}}function Vf(t,l,e){if(l!=null&&(l=""+Ol(l),l!==t.value&&(t.value=l),e==null)){t.defaultValue!==l&&(t.defaultValue=l);return}t.defaultValue=e!=null?""+Ol(e):""}function Kf(t,l,e,a){if(l==null){if(a!=null){if(e!=null)throw Error(r(92));if(ll(a)){if(1<a.length)throw Error(r(93));a=a[0]}e=a}e==null&&(e=""),l=e}e=Ol(l),t.defaultValue=e,a=t.textContent,a===e&&a!==""&&a!==null&&(t.value=a),Ei(t)}function _a(t,l){if(l){var e=t.firstChild;if(e&&e===t.lastChild&&e.nodeType===3){e.nodeValue=l;return}}t.textContent=l}var Jr=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function Jf(t,l,e){var a=l.indexOf("--")===0;e==null||typeof e=="boolean"||e===""?a?t.setProperty(l,""):l==="float"?t.cssFloat="":t[l]="":a?t.setProperty(l,e):typeof e!="number"||e===0||Jr.has(l)?l==="float"?t.cssFloat=e:t[l]=(""+e).trim():t[l]=e+"px"}function wf(t,l,e){if(l!=null&&typeof l!="object")throw Error(r(62));if(t=t.style,e!=null){for(var a in e)!e.hasOwnProperty(a)||l!=null&&l.hasOwnProperty(a)||(a.indexOf("--")===0?t.setProperty(a,""):a==="float"?t.cssFloat="":t[a]="");for(var u in l)a=l[u],l.hasOwnProperty(u)&&e[u]!==a&&Jf(t,u,a)}else for(var n in l)l.hasOwnProperty(n)&&Jf(t,n,l[n])}function Ti(t){if(t.indexOf("-")===-1)return!1;switch(t){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var wr=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),Wr=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function un(t){return Wr.test(""+t)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":t}function le(){}var zi=null;function _i(t){return t=t.target||t.srcElement||window,t.correspondingUseElement&&(t=t.correspondingUseElement),t.nodeType===3?t.parentNode:t}var Oa=null,Na=null;function Wf(t){var l=xa(t);if(l&&(t=l.stateNode)){var e=t[bt]||null;t:switch(t=l.stateNode,l.type){case"input":if(xi(t,e.value,e.defaultValue,e.defaultValue,e.checked,e.defaultChecked,e.type,e.name),l=e.name,e.type==="radio"&&l!=null){for(e=t;e.parentNode;)e=e.parentNode;for(e=e.querySelectorAll('input[name="'+Nl(""+l)+'"][type="radio"]'),l=0;l<e.length;l++){var a=e[l];if(a!==t&&a.form===t.form){var u=a[bt]||null;if(!u)throw Error(r(90));xi(a,u.value,u.defaultValue,u.defaultValue,u.checked,u.defaultChecked,u.type,u.name)}}for(l=0;l<e.length;l++)a=e[l],a.form===t.form&&Zf(a)}break t;case"textarea":Vf(t,e.value,e.defaultValue);break t;case"select":l=e.value,l!=null&&za(t,!!e.multiple,l,!1)}}}var Oi=!1;function kf(t,l,e){if(Oi)return t(l,e);Oi=!0;try{var a=t(l);return a}finally{if(Oi=!1,(Oa!==null||Na!==null)&&(Jn(),Oa&&(l=Oa,t=Na,Na=Oa=null,Wf(l),t)))for(l=0;l<t.length;l++)Wf(t[l])}}function ou(t,l){var e=t.stateNode;if(e===null)return null;var a=e[bt]||null;if(a===null)return null;e=a[l];t:switch(l){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(a=!a.disabled)||(t=t.type,a=!(t==="button"||t==="input"||t==="select"||t==="textarea")),t=!a;break t;default:t=!1}if(t)return null;if(e&&typeof e!="function")throw Error(r(231,l,typeof e));return e}var ee=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),Ni=!1;if(ee)try{var du={};Object.defineProperty(du,"passive",{get:function(){Ni=!0}}),window.addEventListener("test",du,du),window.removeEventListener("test",du,du)}catch{Ni=!1}var Ee=null,Mi=null,nn=null;function $f(){if(nn)return nn;var t,l=Mi,e=l.length,a,u="value"in Ee?Ee.value:Ee.textContent,n=u.length;for(t=0;t<e&&l[t]===u[t];t++);var i=e-t;for(a=1;a<=i&&l[e-a]===u[n-a];a++);return nn=u.slice(t,1<a?1-a:void 0)}function cn(t){var l=t.keyCode;return"charCode"in t?(t=t.charCode,t===0&&l===13&&(t=13)):t=l,t===10&&(t=13),32<=t||t===13?t:0}function fn(){return!0}function Ff(){return!1}function sl(t){function l(e,a,u,n,i){this._reactName=e,this._targetInst=u,this.type=a,this.nativeEvent=n,this.target=i,this.currentTarget=null;for(var c in t)t.hasOwnProperty(c)&&(e=t[c],this[c]=e?e(n):n[c]);return this.isDefaultPrevented=(n.defaultPrevented!=null?n.defaultPrevented:n.returnValue===!1)?fn:Ff,this.isPropagationStopped=Ff,this}return H(l.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():typeof e.returnValue!="unknown"&&(e.returnValue=!1),this.isDefaultPrevented=fn)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():typeof e.cancelBubble!="unknown"&&(e.cancelBubble=!0),this.isPropagationStopped=fn)},persist:function(){},isPersistent:fn}),l}var Pe={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(t){return t.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},sn=sl(Pe),ru=H({},Pe,{view:0,detail:0}),kr=sl(ru),Di,Ci,mu,on=H({},ru,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Ri,button:0,buttons:0,relatedTarget:function(t){return t.relatedTarget===void 0?t.fromElement===t.srcElement?t.toElement:t.fromElement:t.relatedTarget},movementX:function(t){return"movementX"in t?t.movementX:(t!==mu&&(mu&&t.type==="mousemove"?(Di=t.screenX-mu.screenX,Ci=t.screenY-mu.screenY):Ci=Di=0,mu=t),Di)},movementY:function(t){return"movementY"in t?t.movementY:Ci}}),If=sl(on),$r=H({},on,{dataTransfer:0}),Fr=sl($r),Ir=H({},ru,{relatedTarget:0}),Ui=sl(Ir),Pr=H({},Pe,{animationName:0,elapsedTime:0,pseudoElement:0}),tm=sl(Pr),lm=H({},Pe,{clipboardData:function(t){return"clipboardData"in t?t.clipboardData:window.clipboardData}}),em=sl(lm),am=H({},Pe,{data:0}),Pf=sl(am),um={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},nm={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},im={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function cm(t){var l=this.nativeEvent;return l.getModifierState?l.getModifierState(t):(t=im[t])?!!l[t]:!1}function Ri(){return cm}var fm=H({},ru,{key:function(t){if(t.key){var l=um[t.key]||t.key;if(l!=="Unidentified")return l}return t.type==="keypress"?(t=cn(t),t===13?"Enter":String.fromCharCode(t)):t.type==="keydown"||t.type==="keyup"?nm[t.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Ri,charCode:function(t){return t.type==="keypress"?cn(t):0},keyCode:function(t){return t.type==="keydown"||t.type==="keyup"?t.keyCode:0},which:function(t){return t.type==="keypress"?cn(t):t.type==="keydown"||t.type==="keyup"?t.keyCode:0}}),sm=sl(fm),om=H({},on,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),ts=sl(om),dm=H({},ru,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Ri}),rm=sl(dm),mm=H({},Pe,{propertyName:0,elapsedTime:0,pseudoElement:0}),vm=sl(mm),ym=H({},on,{deltaX:function(t){return"deltaX"in t?t.deltaX:"wheelDeltaX"in t?-t.wheelDeltaX:0},deltaY:function(t){return"deltaY"in t?t.deltaY:"wheelDeltaY"in t?-t.wheelDeltaY:"wheelDelta"in t?-t.wheelDelta:0},deltaZ:0,deltaMode:0}),hm=sl(ym),gm=H({},Pe,{newState:0,oldState:0}),Sm=sl(gm),bm=[9,13,27,32],ji=ee&&"CompositionEvent"in window,vu=null;ee&&"documentMode"in document&&(vu=document.documentMode);var pm=ee&&"TextEvent"in window&&!vu,ls=ee&&(!ji||vu&&8<vu&&11>=vu),es=" ",as=!1;function us(t,l){switch(t){case"keyup":return bm.indexOf(l.keyCode)!==-1;case"keydown":return l.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function ns(t){return t=t.detail,typeof t=="object"&&"data"in t?t.data:null}var Ma=!1;function Em(t,l){switch(t){case"compositionend":return ns(l);case"keypress":return l.which!==32?null:(as=!0,es);case"textInput":return t=l.data,t===es&&as?null:t;default:return null}}function xm(t,l){if(Ma)return t==="compositionend"||!ji&&us(t,l)?(t=$f(),nn=Mi=Ee=null,Ma=!1,t):null;switch(t){case"paste":return null;case"keypress":if(!(l.ctrlKey||l.altKey||l.metaKey)||l.ctrlKey&&l.altKey){if(l.char&&1<l.char.length)return l.char;if(l.which)return String.fromCharCode(l.which)}return null;case"compositionend":return ls&&l.locale!=="ko"?null:l.data;default:return null}}var Am={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function is(t){var l=t&&t.nodeName&&t.nodeName.toLowerCase();return l==="input"?!!Am[t.type]:l==="textarea"}function cs(t,l,e,a){Oa?Na?Na.push(a):Na=[a]:Oa=a,l=Pn(l,"onChange"),0<l.length&&(e=new sn("onChange","change",null,e,a),t.push({event:e,listeners:l}))}var yu=null,hu=null;function Tm(t){Vd(t,0)}function dn(t){var l=su(t);if(Zf(l))return t}function fs(t,l){if(t==="change")return l}var ss=!1;if(ee){var Hi;if(ee){var Bi="oninput"in document;if(!Bi){var os=document.createElement("div");os.setAttribute("oninput","return;"),Bi=typeof os.oninput=="function"}Hi=Bi}else Hi=!1;ss=Hi&&(!document.documentMode||9<document.documentMode)}function ds(){yu&&(yu.detachEvent("onpropertychange",rs),hu=yu=null)}function rs(t){if(t.propertyName==="value"&&dn(hu)){var l=[];cs(l,hu,t,_i(t)),kf(Tm,l)}}function zm(t,l,e){t==="focusin"?(ds(),yu=l,hu=e,yu.attachEvent("onpropertychange",rs)):t==="focusout"&&ds()}function _m(t){if(t==="selectionchange"||t==="keyup"||t==="keydown")return dn(hu)}function Om(t,l){if(t==="click")return dn(l)}function Nm(t,l){if(t==="input"||t==="change")return dn(l)}function Mm(t,l){return t===l&&(t!==0||1/t===1/l)||t!==t&&l!==l}var gl=typeof Object.is=="function"?Object.is:Mm;function gu(t,l){if(gl(t,l))return!0;if(typeof t!="object"||t===null||typeof l!="object"||l===null)return!1;var e=Object.keys(t),a=Object.keys(l);if(e.length!==a.length)return!1;for(a=0;a<e.length;a++){var u=e[a];if(!pe.call(l,u)||!gl(t[u],l[u]))return!1}return!0}function ms(t){for(;t&&t.firstChild;)t=t.firstChild;return t}function vs(t,l){var e=ms(t);t=0;for(var a;e;){if(e.nodeType===3){if(a=t+e.textContent.length,t<=l&&a>=l)return{node:e,offset:l-t};t=a}t:{for(;e;){if(e.nextSibling){e=e.nextSibling;break t}e=e.parentNode}e=void 0}e=ms(e)}}function ys(t,l){return t&&l?t===l?!0:t&&t.nodeType===3?!1:l&&l.nodeType===3?ys(t,l.parentNode):"contains"in t?t.contains(l):t.compareDocumentPosition?!!(t.compareDocumentPosition(l)&16):!1:!1}function hs(t){t=t!=null&&t.ownerDocument!=null&&t.ownerDocument.defaultView!=null?t.ownerDocument.defaultView:window;for(var l=an(t.document);l instanceof t.HTMLIFrameElement;){try{var e=typeof l.contentWindow.location.href=="string"}catch{e=!1}if(e)t=l.contentWindow;else break;l=an(t.document)}return l}function qi(t){var l=t&&t.nodeName&&t.nodeName.toLowerCase();return l&&(l==="input"&&(t.type==="text"||t.type==="search"||t.type==="tel"||t.type==="url"||t.type==="password")||l==="textarea"||t.contentEditable==="true")}var Dm=ee&&"documentMode"in document&&11>=document.documentMode,Da=null,Yi=null,Su=null,Gi=!1;function gs(t,l,e){var a=e.window===e?e.document:e.nodeType===9?e:e.ownerDocument;Gi||Da==null||Da!==an(a)||(a=Da,"selectionStart"in a&&qi(a)?a={start:a.selectionStart,end:a.selectionEnd}:(a=(a.ownerDocument&&a.ownerDocument.defaultView||window).getSelection(),a={anchorNode:a.anchorNode,anchorOffset:a.anchorOffset,focusNode:a.focusNode,focusOffset:a.focusOffset}),Su&&gu(Su,a)||(Su=a,a=Pn(Yi,"onSelect"),0<a.length&&(l=new sn("onSelect","select",null,l,e),t.push({event:l,listeners:a}),l.target=Da)))}function ta(t,l){var e={};return e[t.toLowerCase()]=l.toLowerCase(),e["Webkit"+t]="webkit"+l,e["Moz"+t]="moz"+l,e}var Ca={animationend:ta("Animation","AnimationEnd"),animationiteration:ta("Animation","AnimationIteration"),animationstart:ta("Animation","AnimationStart"),transitionrun:ta("Transition","TransitionRun"),transitionstart:ta("Transition","TransitionStart"),transitioncancel:ta("Transition","TransitionCancel"),transitionend:ta("Transition","TransitionEnd")},Qi={},Ss={};ee&&(Ss=document.createElement("div").style,"AnimationEvent"in window||(delete Ca.animationend.animation,delete Ca.animationiteration.animation,delete Ca.animationstart.animation),"TransitionEvent"in window||delete Ca.transitionend.transition);function la(t){if(Qi[t])return Qi[t];if(!Ca[t])return t;var l=Ca[t],e;for(e in l)if(l.hasOwnProperty(e)&&e in Ss)return Qi[t]=l[e];return t}var bs=la("animationend"),ps=la("animationiteration"),Es=la("animationstart"),Cm=la("transitionrun"),Um=la("transitionstart"),Rm=la("transitioncancel"),xs=la("transitionend"),As=new Map,Xi="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");Xi.push("scrollEnd");function Gl(t,l){As.set(t,l),Ie(l,[t])}var rn=typeof reportError=="function"?reportError:function(t){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var l=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof t=="object"&&t!==null&&typeof t.message=="string"?String(t.message):String(t),error:t});if(!window.dispatchEvent(l))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",t);return}console.error(t)},Ml=[],Ua=0,Zi=0;function mn(){for(var t=Ua,l=Zi=Ua=0;l<t;){var e=Ml[l];Ml[l++]=null;var a=Ml[l];Ml[l++]=null;var u=Ml[l];Ml[l++]=null;var n=Ml[l];if(Ml[l++]=null,a!==null&&u!==null){var i=a.pending;i===null?u.next=u:(u.next=i.next,i.next=u),a.pending=u}n!==0&&Ts(e,u,n)}}function vn(t,l,e,a){Ml[Ua++]=t,Ml[Ua++]=l,Ml[Ua++]=e,Ml[Ua++]=a,Zi|=a,t.lanes|=a,t=t.alternate,t!==null&&(t.lanes|=a)}function Li(t,l,e,a){return vn(t,l,e,a),yn(t)}function ea(t,l){return vn(t,null,null,l),yn(t)}function Ts(t,l,e){t.lanes|=e;var a=t.alternate;a!==null&&(a.lanes|=e);for(var u=!1,n=t.return;n!==null;)n.childLanes|=e,a=n.alternate,a!==null&&(a.childLanes|=e),n.tag===22&&(t=n.stateNode,t===null||t._visibility&1||(u=!0)),t=n,n=n.return;return t.tag===3?(n=t.stateNode,u&&l!==null&&(u=31-al(e),t=n.hiddenUpdates,a=t[u],a===null?t[u]=[l]:a.push(l),l.lane=e|536870912),n):null}function yn(t){if(50<Qu)throw Qu=0,Ic=null,Error(r(185));for(var l=t.return;l!==null;)t=l,l=t.return;return t.tag===3?t.stateNode:null}var Ra={};function jm(t,l,e,a){this.tag=t,this.key=e,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=l,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=a,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Sl(t,l,e,a){return new jm(t,l,e,a)}function Vi(t){return t=t.prototype,!(!t||!t.isReactComponent)}function ae(t,l){var e=t.alternate;return e===null?(e=Sl(t.tag,l,t.key,t.mode),e.elementType=t.elementType,e.type=t.type,e.stateNode=t.stateNode,e.alternate=t,t.alternate=e):(e.pendingProps=l,e.type=t.type,e.flags=0,e.subtreeFlags=0,e.deletions=null),e.flags=t.flags&65011712,e.childLanes=t.childLanes,e.lanes=t.lanes,e.child=t.child,e.memoizedProps=t.memoizedProps,e.memoizedState=t.memoizedState,e.updateQueue=t.updateQueue,l=t.dependencies,e.dependencies=l===null?null:{lanes:l.lanes,firstContext:l.firstContext},e.sibling=t.sibling,e.index=t.index,e.ref=t.ref,e.refCleanup=t.refCleanup,e}function zs(t,l){t.flags&=65011714;var e=t.alternate;return e===null?(t.childLanes=0,t.lanes=l,t.child=null,t.subtreeFlags=0,t.memoizedProps=null,t.memoizedState=null,t.updateQueue=null,t.dependencies=null,t.stateNode=null):(t.childLanes=e.childLanes,t.lanes=e.lanes,t.child=e.child,t.subtreeFlags=0,t.deletions=null,t.memoizedProps=e.memoizedProps,t.memoizedState=e.memoizedState,t.updateQueue=e.updateQueue,t.type=e.type,l=e.dependencies,t.dependencies=l===null?null:{lanes:l.lanes,firstContext:l.firstContext}),t}function hn(t,l,e,a,u,n){var i=0;if(a=t,typeof t=="function")Vi(t)&&(i=1);else if(typeof t=="string")i=G0(t,e,D.current)?26:t==="html"||t==="head"||t==="body"?27:5;else t:switch(t){case yl:return t=Sl(31,e,l,u),t.elementType=yl,t.lanes=n,t;case Kt:return aa(e.children,u,n,l);case ql:i=8,u|=24;break;case tl:return t=Sl(12,e,l,u|2),t.elementType=tl,t.lanes=n,t;case zl:return t=Sl(13,e,l,u),t.elementType=zl,t.lanes=n,t;case Jt:return t=Sl(19,e,l,u),t.elementType=Jt,t.lanes=n,t;default:if(typeof t=="object"&&t!==null)switch(t.$$typeof){case Yt:i=10;break t;case Tl:i=9;break t;case il:i=11;break t;case W:i=14;break t;case It:i=16,a=null;break t}i=29,e=Error(r(130,t===null?"null":typeof t,"")),a=null}return l=Sl(i,e,l,u),l.elementType=t,l.type=a,l.lanes=n,l}function aa(t,l,e,a){return t=Sl(7,t,a,l),t.lanes=e,t}function Ki(t,l,e){return t=Sl(6,t,null,l),t.lanes=e,t}function _s(t){var l=Sl(18,null,null,0);return l.stateNode=t,l}function Ji(t,l,e){return l=Sl(4,t.children!==null?t.children:[],t.key,l),l.lanes=e,l.stateNode={containerInfo:t.containerInfo,pendingChildren:null,implementation:t.implementation},l}var Os=new WeakMap;function Dl(t,l){if(typeof t=="object"&&t!==null){var e=Os.get(t);return e!==void 0?e:(l={value:t,source:l,stack:be(l)},Os.set(t,l),l)}return{value:t,source:l,stack:be(l)}}var ja=[],Ha=0,gn=null,bu=0,Cl=[],Ul=0,xe=null,Kl=1,Jl="";function ue(t,l){ja[Ha++]=bu,ja[Ha++]=gn,gn=t,bu=l}function Ns(t,l,e){Cl[Ul++]=Kl,Cl[Ul++]=Jl,Cl[Ul++]=xe,xe=t;var a=Kl;t=Jl;var u=32-al(a)-1;a&=~(1<<u),e+=1;var n=32-al(l)+u;if(30<n){var i=u-u%5;n=(a&(1<<i)-1).toString(32),a>>=i,u-=i,Kl=1<<32-al(l)+u|e<<u|a,Jl=n+t}else Kl=1<<n|e<<u|a,Jl=t}function wi(t){t.return!==null&&(ue(t,1),Ns(t,1,0))}function Wi(t){for(;t===gn;)gn=ja[--Ha],ja[Ha]=null,bu=ja[--Ha],ja[Ha]=null;for(;t===xe;)xe=Cl[--Ul],Cl[Ul]=null,Jl=Cl[--Ul],Cl[Ul]=null,Kl=Cl[--Ul],Cl[Ul]=null}function Ms(t,l){Cl[Ul++]=Kl,Cl[Ul++]=Jl,Cl[Ul++]=xe,Kl=l.id,Jl=l.overflow,xe=t}var wt=null,xt=null,tt=!1,Ae=null,Rl=!1,ki=Error(r(519));function Te(t){var l=Error(r(418,1<arguments.length&&arguments[1]!==void 0&&arguments[1]?"text":"HTML",""));throw pu(Dl(l,t)),ki}function Ds(t){var l=t.stateNode,e=t.type,a=t.memoizedProps;switch(l[Mt]=t,l[bt]=a,e){case"dialog":F("cancel",l),F("close",l);break;case"iframe":case"object":case"embed":F("load",l);break;case"video":case"audio":for(e=0;e<Zu.length;e++)F(Zu[e],l);break;case"source":F("error",l);break;case"img":case"image":case"link":F("error",l),F("load",l);break;case"details":F("toggle",l);break;case"input":F("invalid",l),Lf(l,a.value,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name,!0);break;case"select":F("invalid",l);break;case"textarea":F("invalid",l),Kf(l,a.value,a.defaultValue,a.children)}e=a.children,typeof e!="string"&&typeof e!="number"&&typeof e!="bigint"||l.textContent===""+e||a.suppressHydrationWarning===!0||Wd(l.textContent,e)?(a.popover!=null&&(F("beforetoggle",l),F("toggle",l)),a.onScroll!=null&&F("scroll",l),a.onScrollEnd!=null&&F("scrollend",l),a.onClick!=null&&(l.onclick=le),l=!0):l=!1,l||Te(t,!0)}function Cs(t){for(wt=t.return;wt;)switch(wt.tag){case 5:case 31:case 13:Rl=!1;return;case 27:case 3:Rl=!0;return;default:wt=wt.return}}function Ba(t){if(t!==wt)return!1;if(!tt)return Cs(t),tt=!0,!1;var l=t.tag,e;if((e=l!==3&&l!==27)&&((e=l===5)&&(e=t.type,e=!(e!=="form"&&e!=="button")||vf(t.type,t.memoizedProps)),e=!e),e&&xt&&Te(t),Cs(t),l===13){if(t=t.memoizedState,t=t!==null?t.dehydrated:null,!t)throw Error(r(317));xt=ar(t)}else if(l===31){if(t=t.memoizedState,t=t!==null?t.dehydrated:null,!t)throw Error(r(317));xt=ar(t)}else l===27?(l=xt,Ye(t.type)?(t=bf,bf=null,xt=t):xt=l):xt=wt?Hl(t.stateNode.nextSibling):null;return!0}function ua(){xt=wt=null,tt=!1}function $i(){var t=Ae;return t!==null&&(ml===null?ml=t:ml.push.apply(ml,t),Ae=null),t}function pu(t){Ae===null?Ae=[t]:Ae.push(t)}var Fi=o(null),na=null,ne=null;function ze(t,l,e){O(Fi,l._currentValue),l._currentValue=e}function ie(t){t._currentValue=Fi.current,x(Fi)}function Ii(t,l,e){for(;t!==null;){var a=t.alternate;if((t.childLanes&l)!==l?(t.childLanes|=l,a!==null&&(a.childLanes|=l)):a!==null&&(a.childLanes&l)!==l&&(a.childLanes|=l),t===e)break;t=t.return}}function Pi(t,l,e,a){var u=t.child;for(u!==null&&(u.return=t);u!==null;){var n=u.dependencies;if(n!==null){var i=u.child;n=n.firstContext;t:for(;n!==null;){var c=n;n=u;for(var f=0;f<l.length;f++)if(c.context===l[f]){n.lanes|=e,c=n.alternate,c!==null&&(c.lanes|=e),Ii(n.return,e,t),a||(i=null);break t}n=c.next}}else if(u.tag===18){if(i=u.return,i===null)throw Error(r(341));i.lanes|=e,n=i.alternate,n!==null&&(n.lanes|=e),Ii(i,e,t),i=null}else i=u.child;if(i!==null)i.return=u;else for(i=u;i!==null;){if(i===t){i=null;break}if(u=i.sibling,u!==null){u.return=i.return,i=u;break}i=i.return}u=i}}function qa(t,l,e,a){t=null;for(var u=l,n=!1;u!==null;){if(!n){if((u.flags&524288)!==0)n=!0;else if((u.flags&262144)!==0)break}if(u.tag===10){var i=u.alternate;if(i===null)throw Error(r(387));if(i=i.memoizedProps,i!==null){var c=u.type;gl(u.pendingProps.value,i.value)||(t!==null?t.push(c):t=[c])}}else if(u===ut.current){if(i=u.alternate,i===null)throw Error(r(387));i.memoizedState.memoizedState!==u.memoizedState.memoizedState&&(t!==null?t.push(wu):t=[wu])}u=u.return}t!==null&&Pi(l,t,e,a),l.flags|=262144}function Sn(t){for(t=t.firstContext;t!==null;){if(!gl(t.context._currentValue,t.memoizedValue))return!0;t=t.next}return!1}function ia(t){na=t,ne=null,t=t.dependencies,t!==null&&(t.firstContext=null)}function Wt(t){return Us(na,t)}function bn(t,l){return na===null&&ia(t),Us(t,l)}function Us(t,l){var e=l._currentValue;if(l={context:l,memoizedValue:e,next:null},ne===null){if(t===null)throw Error(r(308));ne=l,t.dependencies={lanes:0,firstContext:l},t.flags|=524288}else ne=ne.next=l;return e}var Hm=typeof AbortController<"u"?AbortController:function(){var t=[],l=this.signal={aborted:!1,addEventListener:function(e,a){t.push(a)}};this.abort=function(){l.aborted=!0,t.forEach(function(e){return e()})}},Bm=z.unstable_scheduleCallback,qm=z.unstable_NormalPriority,jt={$$typeof:Yt,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function tc(){return{controller:new Hm,data:new Map,refCount:0}}function Eu(t){t.refCount--,t.refCount===0&&Bm(qm,function(){t.controller.abort()})}var xu=null,lc=0,Ya=0,Ga=null;function Ym(t,l){if(xu===null){var e=xu=[];lc=0,Ya=uf(),Ga={status:"pending",value:void 0,then:function(a){e.push(a)}}}return lc++,l.then(Rs,Rs),l}function Rs(){if(--lc===0&&xu!==null){Ga!==null&&(Ga.status="fulfilled");var t=xu;xu=null,Ya=0,Ga=null;for(var l=0;l<t.length;l++)(0,t[l])()}}function Gm(t,l){var e=[],a={status:"pending",value:null,reason:null,then:function(u){e.push(u)}};return t.then(function(){a.status="fulfilled",a.value=l;for(var u=0;u<e.length;u++)(0,e[u])(l)},function(u){for(a.status="rejected",a.reason=u,u=0;u<e.length;u++)(0,e[u])(void 0)}),a}var js=g.S;g.S=function(t,l){Sd=Et(),typeof l=="object"&&l!==null&&typeof l.then=="function"&&Ym(t,l),js!==null&&js(t,l)};var ca=o(null);function ec(){var t=ca.current;return t!==null?t:pt.pooledCache}function pn(t,l){l===null?O(ca,ca.current):O(ca,l.pool)}function Hs(){var t=ec();return t===null?null:{parent:jt._currentValue,pool:t}}var Qa=Error(r(460)),ac=Error(r(474)),En=Error(r(542)),xn={then:function(){}};function Bs(t){return t=t.status,t==="fulfilled"||t==="rejected"}function qs(t,l,e){switch(e=t[e],e===void 0?t.push(l):e!==l&&(l.then(le,le),l=e),l.status){case"fulfilled":return l.value;case"rejected":throw t=l.reason,Gs(t),t;default:if(typeof l.status=="string")l.then(le,le);else{if(t=pt,t!==null&&100<t.shellSuspendCounter)throw Error(r(482));t=l,t.status="pending",t.then(function(a){if(l.status==="pending"){var u=l;u.status="fulfilled",u.value=a}},function(a){if(l.status==="pending"){var u=l;u.status="rejected",u.reason=a}})}switch(l.status){case"fulfilled":return l.value;case"rejected":throw t=l.reason,Gs(t),t}throw sa=l,Qa}}function fa(t){try{var l=t._init;return l(t._payload)}catch(e){throw e!==null&&typeof e=="object"&&typeof e.then=="function"?(sa=e,Qa):e}}var sa=null;function Ys(){if(sa===null)throw Error(r(459));var t=sa;return sa=null,t}function Gs(t){if(t===Qa||t===En)throw Error(r(483))}var Xa=null,Au=0;function An(t){var l=Au;return Au+=1,Xa===null&&(Xa=[]),qs(Xa,t,l)}function Tu(t,l){l=l.props.ref,t.ref=l!==void 0?l:null}function Tn(t,l){throw l.$$typeof===ct?Error(r(525)):(t=Object.prototype.toString.call(l),Error(r(31,t==="[object Object]"?"object with keys {"+Object.keys(l).join(", ")+"}":t)))}function Qs(t){function l(d,s){if(t){var m=d.deletions;m===null?(d.deletions=[s],d.flags|=16):m.push(s)}}function e(d,s){if(!t)return null;for(;s!==null;)l(d,s),s=s.sibling;return null}function a(d){for(var s=new Map;d!==null;)d.key!==null?s.set(d.key,d):s.set(d.index,d),d=d.sibling;return s}function u(d,s){return d=ae(d,s),d.index=0,d.sibling=null,d}function n(d,s,m){return d.index=m,t?(m=d.alternate,m!==null?(m=m.index,m<s?(d.flags|=67108866,s):m):(d.flags|=67108866,s)):(d.flags|=1048576,s)}function i(d){return t&&d.alternate===null&&(d.flags|=67108866),d}function c(d,s,m,p){return s===null||s.tag!==6?(s=Ki(m,d.mode,p),s.return=d,s):(s=u(s,m),s.return=d,s)}function f(d,s,m,p){var q=m.type;return q===Kt?S(d,s,m.props.children,p,m.key):s!==null&&(s.elementType===q||typeof q=="object"&&q!==null&&q.$$typeof===It&&fa(q)===s.type)?(s=u(s,m.props),Tu(s,m),s.return=d,s):(s=hn(m.type,m.key,m.props,null,d.mode,p),Tu(s,m),s.return=d,s)}function v(d,s,m,p){return s===null||s.tag!==4||s.stateNode.containerInfo!==m.containerInfo||s.stateNode.implementation!==m.implementation?(s=Ji(m,d.mode,p),s.return=d,s):(s=u(s,m.children||[]),s.return=d,s)}function S(d,s,m,p,q){return s===null||s.tag!==7?(s=aa(m,d.mode,p,q),s.return=d,s):(s=u(s,m),s.return=d,s)}function E(d,s,m){if(typeof s=="string"&&s!==""||typeof s=="number"||typeof s=="bigint")return s=Ki(""+s,d.mode,m),s.return=d,s;if(typeof s=="object"&&s!==null){switch(s.$$typeof){case Qt:return m=hn(s.type,s.key,s.props,null,d.mode,m),Tu(m,s),m.return=d,m;case Ft:return s=Ji(s,d.mode,m),s.return=d,s;case It:return s=fa(s),E(d,s,m)}if(ll(s)||Ot(s))return s=aa(s,d.mode,m,null),s.return=d,s;if(typeof s.then=="function")return E(d,An(s),m);if(s.$$typeof===Yt)return E(d,bn(d,s),m);Tn(d,s)}return null}function y(d,s,m,p){var q=s!==null?s.key:null;if(typeof m=="string"&&m!==""||typeof m=="number"||typeof m=="bigint")return q!==null?null:c(d,s,""+m,p);if(typeof m=="object"&&m!==null){switch(m.$$typeof){case Qt:return m.key===q?f(d,s,m,p):null;case Ft:return m.key===q?v(d,s,m,p):null;case It:return m=fa(m),y(d,s,m,p)}if(ll(m)||Ot(m))return q!==null?null:S(d,s,m,p,null);if(typeof m.then=="function")return y(d,s,An(m),p);if(m.$$typeof===Yt)return y(d,s,bn(d,m),p);Tn(d,m)}return null}function h(d,s,m,p,q){if(typeof p=="string"&&p!==""||typeof p=="number"||typeof p=="bigint")return d=d.get(m)||null,c(s,d,""+p,q);if(typeof p=="object"&&p!==null){switch(p.$$typeof){case Qt:return d=d.get(p.key===null?m:p.key)||null,f(s,d,p,q);case Ft:return d=d.get(p.key===null?m:p.key)||null,v(s,d,p,q);case It:return p=fa(p),h(d,s,m,p,q)}if(ll(p)||Ot(p))return d=d.get(m)||null,S(s,d,p,q,null);if(typeof p.then=="function")return h(d,s,m,An(p),q);if(p.$$typeof===Yt)return h(d,s,m,bn(s,p),q);Tn(s,p)}return null}function M(d,s,m,p){for(var q=null,nt=null,C=s,w=s=0,P=null;C!==null&&w<m.length;w++){C.index>w?(P=C,C=null):P=C.sibling;var it=y(d,C,m[w],p);if(it===null){C===null&&(C=P);break}t&&C&&it.alternate===null&&l(d,C),s=n(it,s,w),nt===null?q=it:nt.sibling=it,nt=it,C=P}if(w===m.length)return e(d,C),tt&&ue(d,w),q;if(C===null){for(;w<m.length;w++)C=E(d,m[w],p),C!==null&&(s=n(C,s,w),nt===null?q=C:nt.sibling=C,nt=C);return tt&&ue(d,w),q}for(C=a(C);w<m.length;w++)P=h(C,d,w,m[w],p),P!==null&&(t&&P.alternate!==null&&C.delete(P.key===null?w:P.key),s=n(P,s,w),nt===null?q=P:nt.sibling=P,nt=P);return t&&C.forEach(function(Le){return l(d,Le)}),tt&&ue(d,w),q}function G(d,s,m,p){if(m==null)throw Error(r(151));for(var q=null,nt=null,C=s,w=s=0,P=null,it=m.next();C!==null&&!it.done;w++,it=m.next()){C.index>w?(P=C,C=null):P=C.sibling;var Le=y(d,C,it.value,p);if(Le===null){C===null&&(C=P);break}t&&C&&Le.alternate===null&&l(d,C),s=n(Le,s,w),nt===null?q=Le:nt.sibling=Le,nt=Le,C=P}if(it.done)return e(d,C),tt&&ue(d,w),q;if(C===null){for(;!it.done;w++,it=m.next())it=E(d,it.value,p),it!==null&&(s=n(it,s,w),nt===null?q=it:nt.sibling=it,nt=it);return tt&&ue(d,w),q}for(C=a(C);!it.done;w++,it=m.next())it=h(C,d,w,it.value,p),it!==null&&(t&&it.alternate!==null&&C.delete(it.key===null?w:it.key),s=n(it,s,w),nt===null?q=it:nt.sibling=it,nt=it);return t&&C.forEach(function($0){return l(d,$0)}),tt&&ue(d,w),q}function gt(d,s,m,p){if(typeof m=="object"&&m!==null&&m.type===Kt&&m.key===null&&(m=m.props.children),typeof m=="object"&&m!==null){switch(m.$$typeof){case Qt:t:{for(var q=m.key;s!==null;){if(s.key===q){if(q=m.type,q===Kt){if(s.tag===7){e(d,s.sibling),p=u(s,m.props.children),p.return=d,d=p;break t}}else if(s.elementType===q||typeof q=="object"&&q!==null&&q.$$typeof===It&&fa(q)===s.type){e(d,s.sibling),p=u(s,m.props),Tu(p,m),p.return=d,d=p;break t}e(d,s);break}else l(d,s);s=s.sibling}m.type===Kt?(p=aa(m.props.children,d.mode,p,m.key),p.return=d,d=p):(p=hn(m.type,m.key,m.props,null,d.mode,p),Tu(p,m),p.return=d,d=p)}return i(d);case Ft:t:{for(q=m.key;s!==null;){if(s.key===q)if(s.tag===4&&s.stateNode.containerInfo===m.containerInfo&&s.stateNode.implementation===m.implementation){e(d,s.sibling),p=u(s,m.children||[]),p.return=d,d=p;break t}else{e(d,s);break}else l(d,s);s=s.sibling}p=Ji(m,d.mode,p),p.return=d,d=p}return i(d);case It:return m=fa(m),gt(d,s,m,p)}if(ll(m))return M(d,s,m,p);if(Ot(m)){if(q=Ot(m),typeof q!="function")throw Error(r(150));return m=q.call(m),G(d,s,m,p)}if(typeof m.then=="function")return gt(d,s,An(m),p);if(m.$$typeof===Yt)return gt(d,s,bn(d,m),p);Tn(d,m)}return typeof m=="string"&&m!==""||typeof m=="number"||typeof m=="bigint"?(m=""+m,s!==null&&s.tag===6?(e(d,s.sibling),p=u(s,m),p.return=d,d=p):(e(d,s),p=Ki(m,d.mode,p),p.return=d,d=p),i(d)):e(d,s)}return function(d,s,m,p){try{Au=0;var q=gt(d,s,m,p);return Xa=null,q}catch(C){if(C===Qa||C===En)throw C;var nt=Sl(29,C,null,d.mode);return nt.lanes=p,nt.return=d,nt}finally{}}}var oa=Qs(!0),Xs=Qs(!1),_e=!1;function uc(t){t.updateQueue={baseState:t.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function nc(t,l){t=t.updateQueue,l.updateQueue===t&&(l.updateQueue={baseState:t.baseState,firstBaseUpdate:t.firstBaseUpdate,lastBaseUpdate:t.lastBaseUpdate,shared:t.shared,callbacks:null})}function Oe(t){return{lane:t,tag:0,payload:null,callback:null,next:null}}function Ne(t,l,e){var a=t.updateQueue;if(a===null)return null;if(a=a.shared,(ft&2)!==0){var u=a.pending;return u===null?l.next=l:(l.next=u.next,u.next=l),a.pending=l,l=yn(t),Ts(t,null,e),l}return vn(t,a,l,e),yn(t)}function zu(t,l,e){if(l=l.updateQueue,l!==null&&(l=l.shared,(e&4194048)!==0)){var a=l.lanes;a&=t.pendingLanes,e|=a,l.lanes=e,B(t,e)}}function ic(t,l){var e=t.updateQueue,a=t.alternate;if(a!==null&&(a=a.updateQueue,e===a)){var u=null,n=null;if(e=e.firstBaseUpdate,e!==null){do{var i={lane:e.lane,tag:e.tag,payload:e.payload,callback:null,next:null};n===null?u=n=i:n=n.next=i,e=e.next}while(e!==null);n===null?u=n=l:n=n.next=l}else u=n=l;e={baseState:a.baseState,firstBaseUpdate:u,lastBaseUpdate:n,shared:a.shared,callbacks:a.callbacks},t.updateQueue=e;return}t=e.lastBaseUpdate,t===null?e.firstBaseUpdate=l:t.next=l,e.lastBaseUpdate=l}var cc=!1;function _u(){if(cc){var t=Ga;if(t!==null)throw t}}function Ou(t,l,e,a){cc=!1;var u=t.updateQueue;_e=!1;var n=u.firstBaseUpdate,i=u.lastBaseUpdate,c=u.shared.pending;if(c!==null){u.shared.pending=null;var f=c,v=f.next;f.next=null,i===null?n=v:i.next=v,i=f;var S=t.alternate;S!==null&&(S=S.updateQueue,c=S.lastBaseUpdate,c!==i&&(c===null?S.firstBaseUpdate=v:c.next=v,S.lastBaseUpdate=f))}if(n!==null){var E=u.baseState;i=0,S=v=f=null,c=n;do{var y=c.lane&-536870913,h=y!==c.lane;if(h?(I&y)===y:(a&y)===y){y!==0&&y===Ya&&(cc=!0),S!==null&&(S=S.next={lane:0,tag:c.tag,payload:c.payload,callback:null,next:null});t:{var M=t,G=c;y=l;var gt=e;switch(G.tag){case 1:if(M=G.payload,typeof M=="function"){E=M.call(gt,E,y);break t}E=M;break t;case 3:M.flags=M.flags&-65537|128;case 0:if(M=G.payload,y=typeof M=="function"?M.call(gt,E,y):M,y==null)break t;E=H({},E,y);break t;case 2:_e=!0}}y=c.callback,y!==null&&(t.flags|=64,h&&(t.flags|=8192),h=u.callbacks,h===null?u.callbacks=[y]:h.push(y))}else h={lane:y,tag:c.tag,payload:c.payload,callback:c.callback,next:null},S===null?(v=S=h,f=E):S=S.next=h,i|=y;if(c=c.next,c===null){if(c=u.shared.pending,c===null)break;h=c,c=h.next,h.next=null,u.lastBaseUpdate=h,u.shared.pending=null}}while(!0);S===null&&(f=E),u.baseState=f,u.firstBaseUpdate=v,u.lastBaseUpdate=S,n===null&&(u.shared.lanes=0),Re|=i,t.lanes=i,t.memoizedState=E}}function Zs(t,l){if(typeof t!="function")throw Error(r(191,t));t.call(l)}function Ls(t,l){var e=t.callbacks;if(e!==null)for(t.callbacks=null,t=0;t<e.length;t++)Zs(e[t],l)}var Za=o(null),zn=o(0);function Vs(t,l){t=ye,O(zn,t),O(Za,l),ye=t|l.baseLanes}function fc(){O(zn,ye),O(Za,Za.current)}function sc(){ye=zn.current,x(Za),x(zn)}var bl=o(null),jl=null;function Me(t){var l=t.alternate;O(Ut,Ut.current&1),O(bl,t),jl===null&&(l===null||Za.current!==null||l.memoizedState!==null)&&(jl=t)}function oc(t){O(Ut,Ut.current),O(bl,t),jl===null&&(jl=t)}function Ks(t){t.tag===22?(O(Ut,Ut.current),O(bl,t),jl===null&&(jl=t)):De()}function De(){O(Ut,Ut.current),O(bl,bl.current)}function pl(t){x(bl),jl===t&&(jl=null),x(Ut)}var Ut=o(0);function _n(t){for(var l=t;l!==null;){if(l.tag===13){var e=l.memoizedState;if(e!==null&&(e=e.dehydrated,e===null||gf(e)||Sf(e)))return l}else if(l.tag===19&&(l.memoizedProps.revealOrder==="forwards"||l.memoizedProps.revealOrder==="backwards"||l.memoizedProps.revealOrder==="unstable_legacy-backwards"||l.memoizedProps.revealOrder==="together")){if((l.flags&128)!==0)return l}else if(l.child!==null){l.child.return=l,l=l.child;continue}if(l===t)break;for(;l.sibling===null;){if(l.return===null||l.return===t)return null;l=l.return}l.sibling.return=l.return,l=l.sibling}return null}var ce=0,K=null,yt=null,Ht=null,On=!1,La=!1,da=!1,Nn=0,Nu=0,Va=null,Qm=0;function Dt(){throw Error(r(321))}function dc(t,l){if(l===null)return!1;for(var e=0;e<l.length&&e<t.length;e++)if(!gl(t[e],l[e]))return!1;return!0}function rc(t,l,e,a,u,n){return ce=n,K=l,l.memoizedState=null,l.updateQueue=null,l.lanes=0,g.H=t===null||t.memoizedState===null?Mo:Oc,da=!1,n=e(a,u),da=!1,La&&(n=ws(l,e,a,u)),Js(t),n}function Js(t){g.H=Cu;var l=yt!==null&&yt.next!==null;if(ce=0,Ht=yt=K=null,On=!1,Nu=0,Va=null,l)throw Error(r(300));t===null||Bt||(t=t.dependencies,t!==null&&Sn(t)&&(Bt=!0))}function ws(t,l,e,a){K=t;var u=0;do{if(La&&(Va=null),Nu=0,La=!1,25<=u)throw Error(r(301));if(u+=1,Ht=yt=null,t.updateQueue!=null){var n=t.updateQueue;n.lastEffect=null,n.events=null,n.stores=null,n.memoCache!=null&&(n.memoCache.index=0)}g.H=Do,n=l(e,a)}while(La);return n}function Xm(){var t=g.H,l=t.useState()[0];return l=typeof l.then=="function"?Mu(l):l,t=t.useState()[0],(yt!==null?yt.memoizedState:null)!==t&&(K.flags|=1024),l}function mc(){var t=Nn!==0;return Nn=0,t}function vc(t,l,e){l.updateQueue=t.updateQueue,l.flags&=-2053,t.lanes&=~e}function yc(t){if(On){for(t=t.memoizedState;t!==null;){var l=t.queue;l!==null&&(l.pending=null),t=t.next}On=!1}ce=0,Ht=yt=K=null,La=!1,Nu=Nn=0,Va=null}function nl(){var t={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return Ht===null?K.memoizedState=Ht=t:Ht=Ht.next=t,Ht}function Rt(){if(yt===null){var t=K.alternate;t=t!==null?t.memoizedState:null}else t=yt.next;var l=Ht===null?K.memoizedState:Ht.next;if(l!==null)Ht=l,yt=t;else{if(t===null)throw K.alternate===null?Error(r(467)):Error(r(310));yt=t,t={memoizedState:yt.memoizedState,baseState:yt.baseState,baseQueue:yt.baseQueue,queue:yt.queue,next:null},Ht===null?K.memoizedState=Ht=t:Ht=Ht.next=t}return Ht}function Mn(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function Mu(t){var l=Nu;return Nu+=1,Va===null&&(Va=[]),t=qs(Va,t,l),l=K,(Ht===null?l.memoizedState:Ht.next)===null&&(l=l.alternate,g.H=l===null||l.memoizedState===null?Mo:Oc),t}function Dn(t){if(t!==null&&typeof t=="object"){if(typeof t.then=="function")return Mu(t);if(t.$$typeof===Yt)return Wt(t)}throw Error(r(438,String(t)))}function hc(t){var l=null,e=K.updateQueue;if(e!==null&&(l=e.memoCache),l==null){var a=K.alternate;a!==null&&(a=a.updateQueue,a!==null&&(a=a.memoCache,a!=null&&(l={data:a.data.map(function(u){return u.slice()}),index:0})))}if(l==null&&(l={data:[],index:0}),e===null&&(e=Mn(),K.updateQueue=e),e.memoCache=l,e=l.data[l.index],e===void 0)for(e=l.data[l.index]=Array(t),a=0;a<t;a++)e[a]=kl;return l.index++,e}function fe(t,l){return typeof l=="function"?l(t):l}function Cn(t){var l=Rt();return gc(l,yt,t)}function gc(t,l,e){var a=t.queue;if(a===null)throw Error(r(311));a.lastRenderedReducer=e;var u=t.baseQueue,n=a.pending;if(n!==null){if(u!==null){var i=u.next;u.next=n.next,n.next=i}l.baseQueue=u=n,a.pending=null}if(n=t.baseState,u===null)t.memoizedState=n;else{l=u.next;var c=i=null,f=null,v=l,S=!1;do{var E=v.lane&-536870913;if(E!==v.lane?(I&E)===E:(ce&E)===E){var y=v.revertLane;if(y===0)f!==null&&(f=f.next={lane:0,revertLane:0,gesture:null,action:v.action,hasEagerState:v.hasEagerState,eagerState:v.eagerState,next:null}),E===Ya&&(S=!0);else if((ce&y)===y){v=v.next,y===Ya&&(S=!0);continue}else E={lane:0,revertLane:v.revertLane,gesture:null,action:v.action,hasEagerState:v.hasEagerState,eagerState:v.eagerState,next:null},f===null?(c=f=E,i=n):f=f.next=E,K.lanes|=y,Re|=y;E=v.action,da&&e(n,E),n=v.hasEagerState?v.eagerState:e(n,E)}else y={lane:E,revertLane:v.revertLane,gesture:v.gesture,action:v.action,hasEagerState:v.hasEagerState,eagerState:v.eagerState,next:null},f===null?(c=f=y,i=n):f=f.next=y,K.lanes|=E,Re|=E;v=v.next}while(v!==null&&v!==l);if(f===null?i=n:f.next=c,!gl(n,t.memoizedState)&&(Bt=!0,S&&(e=Ga,e!==null)))throw e;t.memoizedState=n,t.baseState=i,t.baseQueue=f,a.lastRenderedState=n}return u===null&&(a.lanes=0),[t.memoizedState,a.dispatch]}function Sc(t){var l=Rt(),e=l.queue;if(e===null)throw Error(r(311));e.lastRenderedReducer=t;var a=e.dispatch,u=e.pending,n=l.memoizedState;if(u!==null){e.pending=null;var i=u=u.next;do n=t(n,i.action),i=i.next;while(i!==u);gl(n,l.memoizedState)||(Bt=!0),l.memoizedState=n,l.baseQueue===null&&(l.baseState=n),e.lastRenderedState=n}return[n,a]}function Ws(t,l,e){var a=K,u=Rt(),n=tt;if(n){if(e===void 0)throw Error(r(407));e=e()}else e=l();var i=!gl((yt||u).memoizedState,e);if(i&&(u.memoizedState=e,Bt=!0),u=u.queue,Ec(Fs.bind(null,a,u,t),[t]),u.getSnapshot!==l||i||Ht!==null&&Ht.memoizedState.tag&1){if(a.flags|=2048,Ka(9,{destroy:void 0},$s.bind(null,a,u,e,l),null),pt===null)throw Error(r(349));n||(ce&127)!==0||ks(a,l,e)}return e}function ks(t,l,e){t.flags|=16384,t={getSnapshot:l,value:e},l=K.updateQueue,l===null?(l=Mn(),K.updateQueue=l,l.stores=[t]):(e=l.stores,e===null?l.stores=[t]:e.push(t))}function $s(t,l,e,a){l.value=e,l.getSnapshot=a,Is(l)&&Ps(t)}function Fs(t,l,e){return e(function(){Is(l)&&Ps(t)})}function Is(t){var l=t.getSnapshot;t=t.value;try{var e=l();return!gl(t,e)}catch{return!0}}function Ps(t){var l=ea(t,2);l!==null&&vl(l,t,2)}function bc(t){var l=nl();if(typeof t=="function"){var e=t;if(t=e(),da){Ll(!0);try{e()}finally{Ll(!1)}}}return l.memoizedState=l.baseState=t,l.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:fe,lastRenderedState:t},l}function to(t,l,e,a){return t.baseState=e,gc(t,yt,typeof a=="function"?a:fe)}function Zm(t,l,e,a,u){if(jn(t))throw Error(r(485));if(t=l.action,t!==null){var n={payload:u,action:t,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(i){n.listeners.push(i)}};g.T!==null?e(!0):n.isTransition=!1,a(n),e=l.pending,e===null?(n.next=l.pending=n,lo(l,n)):(n.next=e.next,l.pending=e.next=n)}}function lo(t,l){var e=l.action,a=l.payload,u=t.state;if(l.isTransition){var n=g.T,i={};g.T=i;try{var c=e(u,a),f=g.S;f!==null&&f(i,c),eo(t,l,c)}catch(v){pc(t,l,v)}finally{n!==null&&i.types!==null&&(n.types=i.types),g.T=n}}else try{n=e(u,a),eo(t,l,n)}catch(v){pc(t,l,v)}}function eo(t,l,e){e!==null&&typeof e=="object"&&typeof e.then=="function"?e.then(function(a){ao(t,l,a)},function(a){return pc(t,l,a)}):ao(t,l,e)}function ao(t,l,e){l.status="fulfilled",l.value=e,uo(l),t.state=e,l=t.pending,l!==null&&(e=l.next,e===l?t.pending=null:(e=e.next,l.next=e,lo(t,e)))}function pc(t,l,e){var a=t.pending;if(t.pending=null,a!==null){a=a.next;do l.status="rejected",l.reason=e,uo(l),l=l.next;while(l!==a)}t.action=null}function uo(t){t=t.listeners;for(var l=0;l<t.length;l++)(0,t[l])()}function no(t,l){return l}function io(t,l){if(tt){var e=pt.formState;if(e!==null){t:{var a=K;if(tt){if(xt){l:{for(var u=xt,n=Rl;u.nodeType!==8;){if(!n){u=null;break l}if(u=Hl(u.nextSibling),u===null){u=null;break l}}n=u.data,u=n==="F!"||n==="F"?u:null}if(u){xt=Hl(u.nextSibling),a=u.data==="F!";break t}}Te(a)}a=!1}a&&(l=e[0])}}return e=nl(),e.memoizedState=e.baseState=l,a={pending:null,lanes:0,dispatch:null,lastRenderedReducer:no,lastRenderedState:l},e.queue=a,e=_o.bind(null,K,a),a.dispatch=e,a=bc(!1),n=_c.bind(null,K,!1,a.queue),a=nl(),u={state:l,dispatch:null,action:t,pending:null},a.queue=u,e=Zm.bind(null,K,u,n,e),u.dispatch=e,a.memoizedState=t,[l,e,!1]}function co(t){var l=Rt();return fo(l,yt,t)}function fo(t,l,e){if(l=gc(t,l,no)[0],t=Cn(fe)[0],typeof l=="object"&&l!==null&&typeof l.then=="function")try{var a=Mu(l)}catch(i){throw i===Qa?En:i}else a=l;l=Rt();var u=l.queue,n=u.dispatch;return e!==l.memoizedState&&(K.flags|=2048,Ka(9,{destroy:void 0},Lm.bind(null,u,e),null)),[a,n,t]}function Lm(t,l){t.action=l}function so(t){var l=Rt(),e=yt;if(e!==null)return fo(l,e,t);Rt(),l=l.memoizedState,e=Rt();var a=e.queue.dispatch;return e.memoizedState=t,[l,a,!1]}function Ka(t,l,e,a){return t={tag:t,create:e,deps:a,inst:l,next:null},l=K.updateQueue,l===null&&(l=Mn(),K.updateQueue=l),e=l.lastEffect,e===null?l.lastEffect=t.next=t:(a=e.next,e.next=t,t.next=a,l.lastEffect=t),t}function oo(){return Rt().memoizedState}function Un(t,l,e,a){var u=nl();K.flags|=t,u.memoizedState=Ka(1|l,{destroy:void 0},e,a===void 0?null:a)}function Rn(t,l,e,a){var u=Rt();a=a===void 0?null:a;var n=u.memoizedState.inst;yt!==null&&a!==null&&dc(a,yt.memoizedState.deps)?u.memoizedState=Ka(l,n,e,a):(K.flags|=t,u.memoizedState=Ka(1|l,n,e,a))}function ro(t,l){Un(8390656,8,t,l)}function Ec(t,l){Rn(2048,8,t,l)}function Vm(t){K.flags|=4;var l=K.updateQueue;if(l===null)l=Mn(),K.updateQueue=l,l.events=[t];else{var e=l.events;e===null?l.events=[t]:e.push(t)}}function mo(t){var l=Rt().memoizedState;return Vm({ref:l,nextImpl:t}),function(){if((ft&2)!==0)throw Error(r(440));return l.impl.apply(void 0,arguments)}}function vo(t,l){return Rn(4,2,t,l)}function yo(t,l){return Rn(4,4,t,l)}function ho(t,l){if(typeof l=="function"){t=t();var e=l(t);return function(){typeof e=="function"?e():l(null)}}if(l!=null)return t=t(),l.current=t,function(){l.current=null}}function go(t,l,e){e=e!=null?e.concat([t]):null,Rn(4,4,ho.bind(null,l,t),e)}function xc(){}function So(t,l){var e=Rt();l=l===void 0?null:l;var a=e.memoizedState;return l!==null&&dc(l,a[1])?a[0]:(e.memoizedState=[t,l],t)}function bo(t,l){var e=Rt();l=l===void 0?null:l;var a=e.memoizedState;if(l!==null&&dc(l,a[1]))return a[0];if(a=t(),da){Ll(!0);try{t()}finally{Ll(!1)}}return e.memoizedState=[a,l],a}function Ac(t,l,e){return e===void 0||(ce&1073741824)!==0&&(I&261930)===0?t.memoizedState=l:(t.memoizedState=e,t=pd(),K.lanes|=t,Re|=t,e)}function po(t,l,e,a){return gl(e,l)?e:Za.current!==null?(t=Ac(t,e,a),gl(t,l)||(Bt=!0),t):(ce&42)===0||(ce&1073741824)!==0&&(I&261930)===0?(Bt=!0,t.memoizedState=e):(t=pd(),K.lanes|=t,Re|=t,l)}function Eo(t,l,e,a,u){var n=N.p;N.p=n!==0&&8>n?n:8;var i=g.T,c={};g.T=c,_c(t,!1,l,e);try{var f=u(),v=g.S;if(v!==null&&v(c,f),f!==null&&typeof f=="object"&&typeof f.then=="function"){var S=Gm(f,a);Du(t,l,S,Al(t))}else Du(t,l,a,Al(t))}catch(E){Du(t,l,{then:function(){},status:"rejected",reason:E},Al())}finally{N.p=n,i!==null&&c.types!==null&&(i.types=c.types),g.T=i}}function Km(){}function Tc(t,l,e,a){if(t.tag!==5)throw Error(r(476));var u=xo(t).queue;Eo(t,u,l,Y,e===null?Km:function(){return Ao(t),e(a)})}function xo(t){var l=t.memoizedState;if(l!==null)return l;l={memoizedState:Y,baseState:Y,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:fe,lastRenderedState:Y},next:null};var e={};return l.next={memoizedState:e,baseState:e,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:fe,lastRenderedState:e},next:null},t.memoizedState=l,t=t.alternate,t!==null&&(t.memoizedState=l),l}function Ao(t){var l=xo(t);l.next===null&&(l=t.alternate.memoizedState),Du(t,l.next.queue,{},Al())}function zc(){return Wt(wu)}function To(){return Rt().memoizedState}function zo(){return Rt().memoizedState}function Jm(t){for(var l=t.return;l!==null;){switch(l.tag){case 24:case 3:var e=Al();t=Oe(e);var a=Ne(l,t,e);a!==null&&(vl(a,l,e),zu(a,l,e)),l={cache:tc()},t.payload=l;return}l=l.return}}function wm(t,l,e){var a=Al();e={lane:a,revertLane:0,gesture:null,action:e,hasEagerState:!1,eagerState:null,next:null},jn(t)?Oo(l,e):(e=Li(t,l,e,a),e!==null&&(vl(e,t,a),No(e,l,a)))}function _o(t,l,e){var a=Al();Du(t,l,e,a)}function Du(t,l,e,a){var u={lane:a,revertLane:0,gesture:null,action:e,hasEagerState:!1,eagerState:null,next:null};if(jn(t))Oo(l,u);else{var n=t.alternate;if(t.lanes===0&&(n===null||n.lanes===0)&&(n=l.lastRenderedReducer,n!==null))try{var i=l.lastRenderedState,c=n(i,e);if(u.hasEagerState=!0,u.eagerState=c,gl(c,i))return vn(t,l,u,0),pt===null&&mn(),!1}catch{}finally{}if(e=Li(t,l,u,a),e!==null)return vl(e,t,a),No(e,l,a),!0}return!1}function _c(t,l,e,a){if(a={lane:2,revertLane:uf(),gesture:null,action:a,hasEagerState:!1,eagerState:null,next:null},jn(t)){if(l)throw Error(r(479))}else l=Li(t,e,a,2),l!==null&&vl(l,t,2)}function jn(t){var l=t.alternate;return t===K||l!==null&&l===K}function Oo(t,l){La=On=!0;var e=t.pending;e===null?l.next=l:(l.next=e.next,e.next=l),t.pending=l}function No(t,l,e){if((e&4194048)!==0){var a=l.lanes;a&=t.pendingLanes,e|=a,l.lanes=e,B(t,e)}}var Cu={readContext:Wt,use:Dn,useCallback:Dt,useContext:Dt,useEffect:Dt,useImperativeHandle:Dt,useLayoutEffect:Dt,useInsertionEffect:Dt,useMemo:Dt,useReducer:Dt,useRef:Dt,useState:Dt,useDebugValue:Dt,useDeferredValue:Dt,useTransition:Dt,useSyncExternalStore:Dt,useId:Dt,useHostTransitionStatus:Dt,useFormState:Dt,useActionState:Dt,useOptimistic:Dt,useMemoCache:Dt,useCacheRefresh:Dt};Cu.useEffectEvent=Dt;var Mo={readContext:Wt,use:Dn,useCallback:function(t,l){return nl().memoizedState=[t,l===void 0?null:l],t},useContext:Wt,useEffect:ro,useImperativeHandle:function(t,l,e){e=e!=null?e.concat([t]):null,Un(4194308,4,ho.bind(null,l,t),e)},useLayoutEffect:function(t,l){return Un(4194308,4,t,l)},useInsertionEffect:function(t,l){Un(4,2,t,l)},useMemo:function(t,l){var e=nl();l=l===void 0?null:l;var a=t();if(da){Ll(!0);try{t()}finally{Ll(!1)}}return e.memoizedState=[a,l],a},useReducer:function(t,l,e){var a=nl();if(e!==void 0){var u=e(l);if(da){Ll(!0);try{e(l)}finally{Ll(!1)}}}else u=l;return a.memoizedState=a.baseState=u,t={pending:null,lanes:0,dispatch:null,lastRenderedReducer:t,lastRenderedState:u},a.queue=t,t=t.dispatch=wm.bind(null,K,t),[a.memoizedState,t]},useRef:function(t){var l=nl();return t={current:t},l.memoizedState=t},useState:function(t){t=bc(t);var l=t.queue,e=_o.bind(null,K,l);return l.dispatch=e,[t.memoizedState,e]},useDebugValue:xc,useDeferredValue:function(t,l){var e=nl();return Ac(e,t,l)},useTransition:function(){var t=bc(!1);return t=Eo.bind(null,K,t.queue,!0,!1),nl().memoizedState=t,[!1,t]},useSyncExternalStore:function(t,l,e){var a=K,u=nl();if(tt){if(e===void 0)throw Error(r(407));e=e()}else{if(e=l(),pt===null)throw Error(r(349));(I&127)!==0||ks(a,l,e)}u.memoizedState=e;var n={value:e,getSnapshot:l};return u.queue=n,ro(Fs.bind(null,a,n,t),[t]),a.flags|=2048,Ka(9,{destroy:void 0},$s.bind(null,a,n,e,l),null),e},useId:function(){var t=nl(),l=pt.identifierPrefix;if(tt){var e=Jl,a=Kl;e=(a&~(1<<32-al(a)-1)).toString(32)+e,l="_"+l+"R_"+e,e=Nn++,0<e&&(l+="H"+e.toString(32)),l+="_"}else e=Qm++,l="_"+l+"r_"+e.toString(32)+"_";return t.memoizedState=l},useHostTransitionStatus:zc,useFormState:io,useActionState:io,useOptimistic:function(t){var l=nl();l.memoizedState=l.baseState=t;var e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return l.queue=e,l=_c.bind(null,K,!0,e),e.dispatch=l,[t,l]},useMemoCache:hc,useCacheRefresh:function(){return nl().memoizedState=Jm.bind(null,K)},useEffectEvent:function(t){var l=nl(),e={impl:t};return l.memoizedState=e,function(){if((ft&2)!==0)throw Error(r(440));return e.impl.apply(void 0,arguments)}}},Oc={readContext:Wt,use:Dn,useCallback:So,useContext:Wt,useEffect:Ec,useImperativeHandle:go,useInsertionEffect:vo,useLayoutEffect:yo,useMemo:bo,useReducer:Cn,useRef:oo,useState:function(){return Cn(fe)},useDebugValue:xc,useDeferredValue:function(t,l){var e=Rt();return po(e,yt.memoizedState,t,l)},useTransition:function(){var t=Cn(fe)[0],l=Rt().memoizedState;return[typeof t=="boolean"?t:Mu(t),l]},useSyncExternalStore:Ws,useId:To,useHostTransitionStatus:zc,useFormState:co,useActionState:co,useOptimistic:function(t,l){var e=Rt();return to(e,yt,t,l)},useMemoCache:hc,useCacheRefresh:zo};Oc.useEffectEvent=mo;var Do={readContext:Wt,use:Dn,useCallback:So,useContext:Wt,useEffect:Ec,useImperativeHandle:go,useInsertionEffect:vo,useLayoutEffect:yo,useMemo:bo,useReducer:Sc,useRef:oo,useState:function(){return Sc(fe)},useDebugValue:xc,useDeferredValue:function(t,l){var e=Rt();return yt===null?Ac(e,t,l):po(e,yt.memoizedState,t,l)},useTransition:function(){var t=Sc(fe)[0],l=Rt().memoizedState;return[typeof t=="boolean"?t:Mu(t),l]},useSyncExternalStore:Ws,useId:To,useHostTransitionStatus:zc,useFormState:so,useActionState:so,useOptimistic:function(t,l){var e=Rt();return yt!==null?to(e,yt,t,l):(e.baseState=t,[t,e.queue.dispatch])},useMemoCache:hc,useCacheRefresh:zo};Do.useEffectEvent=mo;function Nc(t,l,e,a){l=t.memoizedState,e=e(a,l),e=e==null?l:H({},l,e),t.memoizedState=e,t.lanes===0&&(t.updateQueue.baseState=e)}var Mc={enqueueSetState:function(t,l,e){t=t._reactInternals;var a=Al(),u=Oe(a);u.payload=l,e!=null&&(u.callback=e),l=Ne(t,u,a),l!==null&&(vl(l,t,a),zu(l,t,a))},enqueueReplaceState:function(t,l,e){t=t._reactInternals;var a=Al(),u=Oe(a);u.tag=1,u.payload=l,e!=null&&(u.callback=e),l=Ne(t,u,a),l!==null&&(vl(l,t,a),zu(l,t,a))},enqueueForceUpdate:function(t,l){t=t._reactInternals;var e=Al(),a=Oe(e);a.tag=2,l!=null&&(a.callback=l),l=Ne(t,a,e),l!==null&&(vl(l,t,e),zu(l,t,e))}};function Co(t,l,e,a,u,n,i){return t=t.stateNode,typeof t.shouldComponentUpdate=="function"?t.shouldComponentUpdate(a,n,i):l.prototype&&l.prototype.isPureReactComponent?!gu(e,a)||!gu(u,n):!0}function Uo(t,l,e,a){t=l.state,typeof l.componentWillReceiveProps=="function"&&l.componentWillReceiveProps(e,a),typeof l.UNSAFE_componentWillReceiveProps=="function"&&l.UNSAFE_componentWillReceiveProps(e,a),l.state!==t&&Mc.enqueueReplaceState(l,l.state,null)}function ra(t,l){var e=l;if("ref"in l){e={};for(var a in l)a!=="ref"&&(e[a]=l[a])}if(t=t.defaultProps){e===l&&(e=H({},e));for(var u in t)e[u]===void 0&&(e[u]=t[u])}return e}function Ro(t){rn(t)}function jo(t){console.error(t)}function Ho(t){rn(t)}function Hn(t,l){try{var e=t.onUncaughtError;e(l.value,{componentStack:l.stack})}catch(a){setTimeout(function(){throw a})}}function Bo(t,l,e){try{var a=t.onCaughtError;a(e.value,{componentStack:e.stack,errorBoundary:l.tag===1?l.stateNode:null})}catch(u){setTimeout(function(){throw u})}}function Dc(t,l,e){return e=Oe(e),e.tag=3,e.payload={element:null},e.callback=function(){Hn(t,l)},e}function qo(t){return t=Oe(t),t.tag=3,t}function Yo(t,l,e,a){var u=e.type.getDerivedStateFromError;if(typeof u=="function"){var n=a.value;t.payload=function(){return u(n)},t.callback=function(){Bo(l,e,a)}}var i=e.stateNode;i!==null&&typeof i.componentDidCatch=="function"&&(t.callback=function(){Bo(l,e,a),typeof u!="function"&&(je===null?je=new Set([this]):je.add(this));var c=a.stack;this.componentDidCatch(a.value,{componentStack:c!==null?c:""})})}function Wm(t,l,e,a,u){if(e.flags|=32768,a!==null&&typeof a=="object"&&typeof a.then=="function"){if(l=e.alternate,l!==null&&qa(l,e,u,!0),e=bl.current,e!==null){switch(e.tag){case 31:case 13:return jl===null?wn():e.alternate===null&&Ct===0&&(Ct=3),e.flags&=-257,e.flags|=65536,e.lanes=u,a===xn?e.flags|=16384:(l=e.updateQueue,l===null?e.updateQueue=new Set([a]):l.add(a),lf(t,a,u)),!1;case 22:return e.flags|=65536,a===xn?e.flags|=16384:(l=e.updateQueue,l===null?(l={transitions:null,markerInstances:null,retryQueue:new Set([a])},e.updateQueue=l):(e=l.retryQueue,e===null?l.retryQueue=new Set([a]):e.add(a)),lf(t,a,u)),!1}throw Error(r(435,e.tag))}return lf(t,a,u),wn(),!1}if(tt)return l=bl.current,l!==null?((l.flags&65536)===0&&(l.flags|=256),l.flags|=65536,l.lanes=u,a!==ki&&(t=Error(r(422),{cause:a}),pu(Dl(t,e)))):(a!==ki&&(l=Error(r(423),{cause:a}),pu(Dl(l,e))),t=t.current.alternate,t.flags|=65536,u&=-u,t.lanes|=u,a=Dl(a,e),u=Dc(t.stateNode,a,u),ic(t,u),Ct!==4&&(Ct=2)),!1;var n=Error(r(520),{cause:a});if(n=Dl(n,e),Gu===null?Gu=[n]:Gu.push(n),Ct!==4&&(Ct=2),l===null)return!0;a=Dl(a,e),e=l;do{switch(e.tag){case 3:return e.flags|=65536,t=u&-u,e.lanes|=t,t=Dc(e.stateNode,a,t),ic(e,t),!1;case 1:if(l=e.type,n=e.stateNode,(e.flags&128)===0&&(typeof l.getDerivedStateFromError=="function"||n!==null&&typeof n.componentDidCatch=="function"&&(je===null||!je.has(n))))return e.flags|=65536,u&=-u,e.lanes|=u,u=qo(u),Yo(u,t,e,a),ic(e,u),!1}e=e.return}while(e!==null);return!1}var Cc=Error(r(461)),Bt=!1;function kt(t,l,e,a){l.child=t===null?Xs(l,null,e,a):oa(l,t.child,e,a)}function Go(t,l,e,a,u){e=e.render;var n=l.ref;if("ref"in a){var i={};for(var c in a)c!=="ref"&&(i[c]=a[c])}else i=a;return ia(l),a=rc(t,l,e,i,n,u),c=mc(),t!==null&&!Bt?(vc(t,l,u),se(t,l,u)):(tt&&c&&wi(l),l.flags|=1,kt(t,l,a,u),l.child)}function Qo(t,l,e,a,u){if(t===null){var n=e.type;return typeof n=="function"&&!Vi(n)&&n.defaultProps===void 0&&e.compare===null?(l.tag=15,l.type=n,Xo(t,l,n,a,u)):(t=hn(e.type,null,a,l,l.mode,u),t.ref=l.ref,t.return=l,l.child=t)}if(n=t.child,!Gc(t,u)){var i=n.memoizedProps;if(e=e.compare,e=e!==null?e:gu,e(i,a)&&t.ref===l.ref)return se(t,l,u)}return l.flags|=1,t=ae(n,a),t.ref=l.ref,t.return=l,l.child=t}function Xo(t,l,e,a,u){if(t!==null){var n=t.memoizedProps;if(gu(n,a)&&t.ref===l.ref)if(Bt=!1,l.pendingProps=a=n,Gc(t,u))(t.flags&131072)!==0&&(Bt=!0);else return l.lanes=t.lanes,se(t,l,u)}return Uc(t,l,e,a,u)}function Zo(t,l,e,a){var u=a.children,n=t!==null?t.memoizedState:null;if(t===null&&l.stateNode===null&&(l.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),a.mode==="hidden"){if((l.flags&128)!==0){if(n=n!==null?n.baseLanes|e:e,t!==null){for(a=l.child=t.child,u=0;a!==null;)u=u|a.lanes|a.childLanes,a=a.sibling;a=u&~n}else a=0,l.child=null;return Lo(t,l,n,e,a)}if((e&536870912)!==0)l.memoizedState={baseLanes:0,cachePool:null},t!==null&&pn(l,n!==null?n.cachePool:null),n!==null?Vs(l,n):fc(),Ks(l);else return a=l.lanes=536870912,Lo(t,l,n!==null?n.baseLanes|e:e,e,a)}else n!==null?(pn(l,n.cachePool),Vs(l,n),De(),l.memoizedState=null):(t!==null&&pn(l,null),fc(),De());return kt(t,l,u,e),l.child}function Uu(t,l){return t!==null&&t.tag===22||l.stateNode!==null||(l.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),l.sibling}function Lo(t,l,e,a,u){var n=ec();return n=n===null?null:{parent:jt._currentValue,pool:n},l.memoizedState={baseLanes:e,cachePool:n},t!==null&&pn(l,null),fc(),Ks(l),t!==null&&qa(t,l,a,!0),l.childLanes=u,null}function Bn(t,l){return l=Yn({mode:l.mode,children:l.children},t.mode),l.ref=t.ref,t.child=l,l.return=t,l}function Vo(t,l,e){return oa(l,t.child,null,e),t=Bn(l,l.pendingProps),t.flags|=2,pl(l),l.memoizedState=null,t}function km(t,l,e){var a=l.pendingProps,u=(l.flags&128)!==0;if(l.flags&=-129,t===null){if(tt){if(a.mode==="hidden")return t=Bn(l,a),l.lanes=536870912,Uu(null,t);if(oc(l),(t=xt)?(t=er(t,Rl),t=t!==null&&t.data==="&"?t:null,t!==null&&(l.memoizedState={dehydrated:t,treeContext:xe!==null?{id:Kl,overflow:Jl}:null,retryLane:536870912,hydrationErrors:null},e=_s(t),e.return=l,l.child=e,wt=l,xt=null)):t=null,t===null)throw Te(l);return l.lanes=536870912,null}return Bn(l,a)}var n=t.memoizedState;if(n!==null){var i=n.dehydrated;if(oc(l),u)if(l.flags&256)l.flags&=-257,l=Vo(t,l,e);else if(l.memoizedState!==null)l.child=t.child,l.flags|=128,l=null;else throw Error(r(558));else if(Bt||qa(t,l,e,!1),u=(e&t.childLanes)!==0,Bt||u){if(a=pt,a!==null&&(i=et(a,e),i!==0&&i!==n.retryLane))throw n.retryLane=i,ea(t,i),vl(a,t,i),Cc;wn(),l=Vo(t,l,e)}else t=n.treeContext,xt=Hl(i.nextSibling),wt=l,tt=!0,Ae=null,Rl=!1,t!==null&&Ms(l,t),l=Bn(l,a),l.flags|=4096;return l}return t=ae(t.child,{mode:a.mode,children:a.children}),t.ref=l.ref,l.child=t,t.return=l,t}function qn(t,l){var e=l.ref;if(e===null)t!==null&&t.ref!==null&&(l.flags|=4194816);else{if(typeof e!="function"&&typeof e!="object")throw Error(r(284));(t===null||t.ref!==e)&&(l.flags|=4194816)}}function Uc(t,l,e,a,u){return ia(l),e=rc(t,l,e,a,void 0,u),a=mc(),t!==null&&!Bt?(vc(t,l,u),se(t,l,u)):(tt&&a&&wi(l),l.flags|=1,kt(t,l,e,u),l.child)}function Ko(t,l,e,a,u,n){return ia(l),l.updateQueue=null,e=ws(l,a,e,u),Js(t),a=mc(),t!==null&&!Bt?(vc(t,l,n),se(t,l,n)):(tt&&a&&wi(l),l.flags|=1,kt(t,l,e,n),l.child)}function Jo(t,l,e,a,u){if(ia(l),l.stateNode===null){var n=Ra,i=e.contextType;typeof i=="object"&&i!==null&&(n=Wt(i)),n=new e(a,n),l.memoizedState=n.state!==null&&n.state!==void 0?n.state:null,n.updater=Mc,l.stateNode=n,n._reactInternals=l,n=l.stateNode,n.props=a,n.state=l.memoizedState,n.refs={},uc(l),i=e.contextType,n.context=typeof i=="object"&&i!==null?Wt(i):Ra,n.state=l.memoizedState,i=e.getDerivedStateFromProps,typeof i=="function"&&(Nc(l,e,i,a),n.state=l.memoizedState),typeof e.getDerivedStateFromProps=="function"||typeof n.getSnapshotBeforeUpdate=="function"||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(i=n.state,typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount(),i!==n.state&&Mc.enqueueReplaceState(n,n.state,null),Ou(l,a,n,u),_u(),n.state=l.memoizedState),typeof n.componentDidMount=="function"&&(l.flags|=4194308),a=!0}else if(t===null){n=l.stateNode;var c=l.memoizedProps,f=ra(e,c);n.props=f;var v=n.context,S=e.contextType;i=Ra,typeof S=="object"&&S!==null&&(i=Wt(S));var E=e.getDerivedStateFromProps;S=typeof E=="function"||typeof n.getSnapshotBeforeUpdate=="function",c=l.pendingProps!==c,S||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(c||v!==i)&&Uo(l,n,a,i),_e=!1;var y=l.memoizedState;n.state=y,Ou(l,a,n,u),_u(),v=l.memoizedState,c||y!==v||_e?(typeof E=="function"&&(Nc(l,e,E,a),v=l.memoizedState),(f=_e||Co(l,e,f,a,y,v,i))?(S||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount()),typeof n.componentDidMount=="function"&&(l.flags|=4194308)):(typeof n.componentDidMount=="function"&&(l.flags|=4194308),l.memoizedProps=a,l.memoizedState=v),n.props=a,n.state=v,n.context=i,a=f):(typeof n.componentDidMount=="function"&&(l.flags|=4194308),a=!1)}else{n=l.stateNode,nc(t,l),i=l.memoizedProps,S=ra(e,i),n.props=S,E=l.pendingProps,y=n.context,v=e.contextType,f=Ra,typeof v=="object"&&v!==null&&(f=Wt(v)),c=e.getDerivedStateFromProps,(v=typeof c=="function"||typeof n.getSnapshotBeforeUpdate=="function")||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(i!==E||y!==f)&&Uo(l,n,a,f),_e=!1,y=l.memoizedState,n.state=y,Ou(l,a,n,u),_u();var h=l.memoizedState;i!==E||y!==h||_e||t!==null&&t.dependencies!==null&&Sn(t.dependencies)?(typeof c=="function"&&(Nc(l,e,c,a),h=l.memoizedState),(S=_e||Co(l,e,S,a,y,h,f)||t!==null&&t.dependencies!==null&&Sn(t.dependencies))?(v||typeof n.UNSAFE_componentWillUpdate!="function"&&typeof n.componentWillUpdate!="function"||(typeof n.componentWillUpdate=="function"&&n.componentWillUpdate(a,h,f),typeof n.UNSAFE_componentWillUpdate=="function"&&n.UNSAFE_componentWillUpdate(a,h,f)),typeof n.componentDidUpdate=="function"&&(l.flags|=4),typeof n.getSnapshotBeforeUpdate=="function"&&(l.flags|=1024)):(typeof n.componentDidUpdate!="function"||i===t.memoizedProps&&y===t.memoizedState||(l.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||i===t.memoizedProps&&y===t.memoizedState||(l.flags|=1024),l.memoizedProps=a,l.memoizedState=h),n.props=a,n.state=h,n.context=f,a=S):(typeof n.componentDidUpdate!="function"||i===t.memoizedProps&&y===t.memoizedState||(l.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||i===t.memoizedProps&&y===t.memoizedState||(l.flags|=1024),a=!1)}return n=a,qn(t,l),a=(l.flags&128)!==0,n||a?(n=l.stateNode,e=a&&typeof e.getDerivedStateFromError!="function"?null:n.render(),l.flags|=1,t!==null&&a?(l.child=oa(l,t.child,null,u),l.child=oa(l,null,e,u)):kt(t,l,e,u),l.memoizedState=n.state,t=l.child):t=se(t,l,u),t}function wo(t,l,e,a){return ua(),l.flags|=256,kt(t,l,e,a),l.child}var Rc={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function jc(t){return{baseLanes:t,cachePool:Hs()}}function Hc(t,l,e){return t=t!==null?t.childLanes&~e:0,l&&(t|=xl),t}function Wo(t,l,e){var a=l.pendingProps,u=!1,n=(l.flags&128)!==0,i;if((i=n)||(i=t!==null&&t.memoizedState===null?!1:(Ut.current&2)!==0),i&&(u=!0,l.flags&=-129),i=(l.flags&32)!==0,l.flags&=-33,t===null){if(tt){if(u?Me(l):De(),(t=xt)?(t=er(t,Rl),t=t!==null&&t.data!=="&"?t:null,t!==null&&(l.memoizedState={dehydrated:t,treeContext:xe!==null?{id:Kl,overflow:Jl}:null,retryLane:536870912,hydrationErrors:null},e=_s(t),e.return=l,l.child=e,wt=l,xt=null)):t=null,t===null)throw Te(l);return Sf(t)?l.lanes=32:l.lanes=536870912,null}var c=a.children;return a=a.fallback,u?(De(),u=l.mode,c=Yn({mode:"hidden",children:c},u),a=aa(a,u,e,null),c.return=l,a.return=l,c.sibling=a,l.child=c,a=l.child,a.memoizedState=jc(e),a.childLanes=Hc(t,i,e),l.memoizedState=Rc,Uu(null,a)):(Me(l),Bc(l,c))}var f=t.memoizedState;if(f!==null&&(c=f.dehydrated,c!==null)){if(n)l.flags&256?(Me(l),l.flags&=-257,l=qc(t,l,e)):l.memoizedState!==null?(De(),l.child=t.child,l.flags|=128,l=null):(De(),c=a.fallback,u=l.mode,a=Yn({mode:"visible",children:a.children},u),c=aa(c,u,e,null),c.flags|=2,a.return=l,c.return=l,a.sibling=c,l.child=a,oa(l,t.child,null,e),a=l.child,a.memoizedState=jc(e),a.childLanes=Hc(t,i,e),l.memoizedState=Rc,l=Uu(null,a));else if(Me(l),Sf(c)){if(i=c.nextSibling&&c.nextSibling.dataset,i)var v=i.dgst;i=v,a=Error(r(419)),a.stack="",a.digest=i,pu({value:a,source:null,stack:null}),l=qc(t,l,e)}else if(Bt||qa(t,l,e,!1),i=(e&t.childLanes)!==0,Bt||i){if(i=pt,i!==null&&(a=et(i,e),a!==0&&a!==f.retryLane))throw f.retryLane=a,ea(t,a),vl(i,t,a),Cc;gf(c)||wn(),l=qc(t,l,e)}else gf(c)?(l.flags|=192,l.child=t.child,l=null):(t=f.treeContext,xt=Hl(c.nextSibling),wt=l,tt=!0,Ae=null,Rl=!1,t!==null&&Ms(l,t),l=Bc(l,a.children),l.flags|=4096);return l}return u?(De(),c=a.fallback,u=l.mode,f=t.child,v=f.sibling,a=ae(f,{mode:"hidden",children:a.children}),a.subtreeFlags=f.subtreeFlags&65011712,v!==null?c=ae(v,c):(c=aa(c,u,e,null),c.flags|=2),c.return=l,a.return=l,a.sibling=c,l.child=a,Uu(null,a),a=l.child,c=t.child.memoizedState,c===null?c=jc(e):(u=c.cachePool,u!==null?(f=jt._currentValue,u=u.parent!==f?{parent:f,pool:f}:u):u=Hs(),c={baseLanes:c.baseLanes|e,cachePool:u}),a.memoizedState=c,a.childLanes=Hc(t,i,e),l.memoizedState=Rc,Uu(t.child,a)):(Me(l),e=t.child,t=e.sibling,e=ae(e,{mode:"visible",children:a.children}),e.return=l,e.sibling=null,t!==null&&(i=l.deletions,i===null?(l.deletions=[t],l.flags|=16):i.push(t)),l.child=e,l.memoizedState=null,e)}function Bc(t,l){return l=Yn({mode:"visible",children:l},t.mode),l.return=t,t.child=l}function Yn(t,l){return t=Sl(22,t,null,l),t.lanes=0,t}function qc(t,l,e){return oa(l,t.child,null,e),t=Bc(l,l.pendingProps.children),t.flags|=2,l.memoizedState=null,t}function ko(t,l,e){t.lanes|=l;var a=t.alternate;a!==null&&(a.lanes|=l),Ii(t.return,l,e)}function Yc(t,l,e,a,u,n){var i=t.memoizedState;i===null?t.memoizedState={isBackwards:l,rendering:null,renderingStartTime:0,last:a,tail:e,tailMode:u,treeForkCount:n}:(i.isBackwards=l,i.rendering=null,i.renderingStartTime=0,i.last=a,i.tail=e,i.tailMode=u,i.treeForkCount=n)}function $o(t,l,e){var a=l.pendingProps,u=a.revealOrder,n=a.tail;a=a.children;var i=Ut.current,c=(i&2)!==0;if(c?(i=i&1|2,l.flags|=128):i&=1,O(Ut,i),kt(t,l,a,e),a=tt?bu:0,!c&&t!==null&&(t.flags&128)!==0)t:for(t=l.child;t!==null;){if(t.tag===13)t.memoizedState!==null&&ko(t,e,l);else if(t.tag===19)ko(t,e,l);else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break t;for(;t.sibling===null;){if(t.return===null||t.return===l)break t;t=t.return}t.sibling.return=t.return,t=t.sibling}switch(u){case"forwards":for(e=l.child,u=null;e!==null;)t=e.alternate,t!==null&&_n(t)===null&&(u=e),e=e.sibling;e=u,e===null?(u=l.child,l.child=null):(u=e.sibling,e.sibling=null),Yc(l,!1,u,e,n,a);break;case"backwards":case"unstable_legacy-backwards":for(e=null,u=l.child,l.child=null;u!==null;){if(t=u.alternate,t!==null&&_n(t)===null){l.child=u;break}t=u.sibling,u.sibling=e,e=u,u=t}Yc(l,!0,e,null,n,a);break;case"together":Yc(l,!1,null,null,void 0,a);break;default:l.memoizedState=null}return l.child}function se(t,l,e){if(t!==null&&(l.dependencies=t.dependencies),Re|=l.lanes,(e&l.childLanes)===0)if(t!==null){if(qa(t,l,e,!1),(e&l.childLanes)===0)return null}else return null;if(t!==null&&l.child!==t.child)throw Error(r(153));if(l.child!==null){for(t=l.child,e=ae(t,t.pendingProps),l.child=e,e.return=l;t.sibling!==null;)t=t.sibling,e=e.sibling=ae(t,t.pendingProps),e.return=l;e.sibling=null}return l.child}function Gc(t,l){return(t.lanes&l)!==0?!0:(t=t.dependencies,!!(t!==null&&Sn(t)))}function $m(t,l,e){switch(l.tag){case 3:Xt(l,l.stateNode.containerInfo),ze(l,jt,t.memoizedState.cache),ua();break;case 27:case 5:Zl(l);break;case 4:Xt(l,l.stateNode.containerInfo);break;case 10:ze(l,l.type,l.memoizedProps.value);break;case 31:if(l.memoizedState!==null)return l.flags|=128,oc(l),null;break;case 13:var a=l.memoizedState;if(a!==null)return a.dehydrated!==null?(Me(l),l.flags|=128,null):(e&l.child.childLanes)!==0?Wo(t,l,e):(Me(l),t=se(t,l,e),t!==null?t.sibling:null);Me(l);break;case 19:var u=(t.flags&128)!==0;if(a=(e&l.childLanes)!==0,a||(qa(t,l,e,!1),a=(e&l.childLanes)!==0),u){if(a)return $o(t,l,e);l.flags|=128}if(u=l.memoizedState,u!==null&&(u.rendering=null,u.tail=null,u.lastEffect=null),O(Ut,Ut.current),a)break;return null;case 22:return l.lanes=0,Zo(t,l,e,l.pendingProps);case 24:ze(l,jt,t.memoizedState.cache)}return se(t,l,e)}function Fo(t,l,e){if(t!==null)if(t.memoizedProps!==l.pendingProps)Bt=!0;else{if(!Gc(t,e)&&(l.flags&128)===0)return Bt=!1,$m(t,l,e);Bt=(t.flags&131072)!==0}else Bt=!1,tt&&(l.flags&1048576)!==0&&Ns(l,bu,l.index);switch(l.lanes=0,l.tag){case 16:t:{var a=l.pendingProps;if(t=fa(l.elementType),l.type=t,typeof t=="function")Vi(t)?(a=ra(t,a),l.tag=1,l=Jo(null,l,t,a,e)):(l.tag=0,l=Uc(null,l,t,a,e));else{if(t!=null){var u=t.$$typeof;if(u===il){l.tag=11,l=Go(null,l,t,a,e);break t}else if(u===W){l.tag=14,l=Qo(null,l,t,a,e);break t}}throw l=cl(t)||t,Error(r(306,l,""))}}return l;case 0:return Uc(t,l,l.type,l.pendingProps,e);case 1:return a=l.type,u=ra(a,l.pendingProps),Jo(t,l,a,u,e);case 3:t:{if(Xt(l,l.stateNode.containerInfo),t===null)throw Error(r(387));a=l.pendingProps;var n=l.memoizedState;u=n.element,nc(t,l),Ou(l,a,null,e);var i=l.memoizedState;if(a=i.cache,ze(l,jt,a),a!==n.cache&&Pi(l,[jt],e,!0),_u(),a=i.element,n.isDehydrated)if(n={element:a,isDehydrated:!1,cache:i.cache},l.updateQueue.baseState=n,l.memoizedState=n,l.flags&256){l=wo(t,l,a,e);break t}else if(a!==u){u=Dl(Error(r(424)),l),pu(u),l=wo(t,l,a,e);break t}else{switch(t=l.stateNode.containerInfo,t.nodeType){case 9:t=t.body;break;default:t=t.nodeName==="HTML"?t.ownerDocument.body:t}for(xt=Hl(t.firstChild),wt=l,tt=!0,Ae=null,Rl=!0,e=Xs(l,null,a,e),l.child=e;e;)e.flags=e.flags&-3|4096,e=e.sibling}else{if(ua(),a===u){l=se(t,l,e);break t}kt(t,l,a,e)}l=l.child}return l;case 26:return qn(t,l),t===null?(e=fr(l.type,null,l.pendingProps,null))?l.memoizedState=e:tt||(e=l.type,t=l.pendingProps,a=ti(Z.current).createElement(e),a[Mt]=l,a[bt]=t,$t(a,e,t),Lt(a),l.stateNode=a):l.memoizedState=fr(l.type,t.memoizedProps,l.pendingProps,t.memoizedState),null;case 27:return Zl(l),t===null&&tt&&(a=l.stateNode=nr(l.type,l.pendingProps,Z.current),wt=l,Rl=!0,u=xt,Ye(l.type)?(bf=u,xt=Hl(a.firstChild)):xt=u),kt(t,l,l.pendingProps.children,e),qn(t,l),t===null&&(l.flags|=4194304),l.child;case 5:return t===null&&tt&&((u=a=xt)&&(a=_0(a,l.type,l.pendingProps,Rl),a!==null?(l.stateNode=a,wt=l,xt=Hl(a.firstChild),Rl=!1,u=!0):u=!1),u||Te(l)),Zl(l),u=l.type,n=l.pendingProps,i=t!==null?t.memoizedProps:null,a=n.children,vf(u,n)?a=null:i!==null&&vf(u,i)&&(l.flags|=32),l.memoizedState!==null&&(u=rc(t,l,Xm,null,null,e),wu._currentValue=u),qn(t,l),kt(t,l,a,e),l.child;case 6:return t===null&&tt&&((t=e=xt)&&(e=O0(e,l.pendingProps,Rl),e!==null?(l.stateNode=e,wt=l,xt=null,t=!0):t=!1),t||Te(l)),null;case 13:return Wo(t,l,e);case 4:return Xt(l,l.stateNode.containerInfo),a=l.pendingProps,t===null?l.child=oa(l,null,a,e):kt(t,l,a,e),l.child;case 11:return Go(t,l,l.type,l.pendingProps,e);case 7:return kt(t,l,l.pendingProps,e),l.child;case 8:return kt(t,l,l.pendingProps.children,e),l.child;case 12:return kt(t,l,l.pendingProps.children,e),l.child;case 10:return a=l.pendingProps,ze(l,l.type,a.value),kt(t,l,a.children,e),l.child;case 9:return u=l.type._context,a=l.pendingProps.children,ia(l),u=Wt(u),a=a(u),l.flags|=1,kt(t,l,a,e),l.child;case 14:return Qo(t,l,l.type,l.pendingProps,e);case 15:return Xo(t,l,l.type,l.pendingProps,e);case 19:return $o(t,l,e);case 31:return km(t,l,e);case 22:return Zo(t,l,e,l.pendingProps);case 24:return ia(l),a=Wt(jt),t===null?(u=ec(),u===null&&(u=pt,n=tc(),u.pooledCache=n,n.refCount++,n!==null&&(u.pooledCacheLanes|=e),u=n),l.memoizedState={parent:a,cache:u},uc(l),ze(l,jt,u)):((t.lanes&e)!==0&&(nc(t,l),Ou(l,null,null,e),_u()),u=t.memoizedState,n=l.memoizedState,u.parent!==a?(u={parent:a,cache:a},l.memoizedState=u,l.lanes===0&&(l.memoizedState=l.updateQueue.baseState=u),ze(l,jt,a)):(a=n.cache,ze(l,jt,a),a!==u.cache&&Pi(l,[jt],e,!0))),kt(t,l,l.pendingProps.children,e),l.child;case 29:throw l.pendingProps}throw Error(r(156,l.tag))}function oe(t){t.flags|=4}function Qc(t,l,e,a,u){if((l=(t.mode&32)!==0)&&(l=!1),l){if(t.flags|=16777216,(u&335544128)===u)if(t.stateNode.complete)t.flags|=8192;else if(Td())t.flags|=8192;else throw sa=xn,ac}else t.flags&=-16777217}function Io(t,l){if(l.type!=="stylesheet"||(l.state.loading&4)!==0)t.flags&=-16777217;else if(t.flags|=16777216,!mr(l))if(Td())t.flags|=8192;else throw sa=xn,ac}function Gn(t,l){l!==null&&(t.flags|=4),t.flags&16384&&(l=t.tag!==22?pa():536870912,t.lanes|=l,ka|=l)}function Ru(t,l){if(!tt)switch(t.tailMode){case"hidden":l=t.tail;for(var e=null;l!==null;)l.alternate!==null&&(e=l),l=l.sibling;e===null?t.tail=null:e.sibling=null;break;case"collapsed":e=t.tail;for(var a=null;e!==null;)e.alternate!==null&&(a=e),e=e.sibling;a===null?l||t.tail===null?t.tail=null:t.tail.sibling=null:a.sibling=null}}function At(t){var l=t.alternate!==null&&t.alternate.child===t.child,e=0,a=0;if(l)for(var u=t.child;u!==null;)e|=u.lanes|u.childLanes,a|=u.subtreeFlags&65011712,a|=u.flags&65011712,u.return=t,u=u.sibling;else for(u=t.child;u!==null;)e|=u.lanes|u.childLanes,a|=u.subtreeFlags,a|=u.flags,u.return=t,u=u.sibling;return t.subtreeFlags|=a,t.childLanes=e,l}function Fm(t,l,e){var a=l.pendingProps;switch(Wi(l),l.tag){case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return At(l),null;case 1:return At(l),null;case 3:return e=l.stateNode,a=null,t!==null&&(a=t.memoizedState.cache),l.memoizedState.cache!==a&&(l.flags|=2048),ie(jt),ot(),e.pendingContext&&(e.context=e.pendingContext,e.pendingContext=null),(t===null||t.child===null)&&(Ba(l)?oe(l):t===null||t.memoizedState.isDehydrated&&(l.flags&256)===0||(l.flags|=1024,$i())),At(l),null;case 26:var u=l.type,n=l.memoizedState;return t===null?(oe(l),n!==null?(At(l),Io(l,n)):(At(l),Qc(l,u,null,a,e))):n?n!==t.memoizedState?(oe(l),At(l),Io(l,n)):(At(l),l.flags&=-16777217):(t=t.memoizedProps,t!==a&&oe(l),At(l),Qc(l,u,t,a,e)),null;case 27:if(Nt(l),e=Z.current,u=l.type,t!==null&&l.stateNode!=null)t.memoizedProps!==a&&oe(l);else{if(!a){if(l.stateNode===null)throw Error(r(166));return At(l),null}t=D.current,Ba(l)?Ds(l):(t=nr(u,a,e),l.stateNode=t,oe(l))}return At(l),null;case 5:if(Nt(l),u=l.type,t!==null&&l.stateNode!=null)t.memoizedProps!==a&&oe(l);else{if(!a){if(l.stateNode===null)throw Error(r(166));return At(l),null}if(n=D.current,Ba(l))Ds(l);else{var i=ti(Z.current);switch(n){case 1:n=i.createElementNS("http://www.w3.org/2000/svg",u);break;case 2:n=i.createElementNS("http://www.w3.org/1998/Math/MathML",u);break;default:switch(u){case"svg":n=i.createElementNS("http://www.w3.org/2000/svg",u);break;case"math":n=i.createElementNS("http://www.w3.org/1998/Math/MathML",u);break;case"script":n=i.createElement("div"),n.innerHTML="<script><\/script>",n=n.removeChild(n.firstChild);break;case"select":n=typeof a.is=="string"?i.createElement("select",{is:a.is}):i.createElement("select"),a.multiple?n.multiple=!0:a.size&&(n.size=a.size);break;default:n=typeof a.is=="string"?i.createElement(u,{is:a.is}):i.createElement(u)}}n[Mt]=l,n[bt]=a;t:for(i=l.child;i!==null;){if(i.tag===5||i.tag===6)n.appendChild(i.stateNode);else if(i.tag!==4&&i.tag!==27&&i.child!==null){i.child.return=i,i=i.child;continue}if(i===l)break t;for(;i.sibling===null;){if(i.return===null||i.return===l)break t;i=i.return}i.sibling.return=i.return,i=i.sibling}l.stateNode=n;t:switch($t(n,u,a),u){case"button":case"input":case"select":case"textarea":a=!!a.autoFocus;break t;case"img":a=!0;break t;default:a=!1}a&&oe(l)}}return At(l),Qc(l,l.type,t===null?null:t.memoizedProps,l.pendingProps,e),null;case 6:if(t&&l.stateNode!=null)t.memoizedProps!==a&&oe(l);else{if(typeof a!="string"&&l.stateNode===null)throw Error(r(166));if(t=Z.current,Ba(l)){if(t=l.stateNode,e=l.memoizedProps,a=null,u=wt,u!==null)switch(u.tag){case 27:case 5:a=u.memoizedProps}t[Mt]=l,t=!!(t.nodeValue===e||a!==null&&a.suppressHydrationWarning===!0||Wd(t.nodeValue,e)),t||Te(l,!0)}else t=ti(t).createTextNode(a),t[Mt]=l,l.stateNode=t}return At(l),null;case 31:if(e=l.memoizedState,t===null||t.memoizedState!==null){if(a=Ba(l),e!==null){if(t===null){if(!a)throw Error(r(318));if(t=l.memoizedState,t=t!==null?t.dehydrated:null,!t)throw Error(r(557));t[Mt]=l}else ua(),(l.flags&128)===0&&(l.memoizedState=null),l.flags|=4;At(l),t=!1}else e=$i(),t!==null&&t.memoizedState!==null&&(t.memoizedState.hydrationErrors=e),t=!0;if(!t)return l.flags&256?(pl(l),l):(pl(l),null);if((l.flags&128)!==0)throw Error(r(558))}return At(l),null;case 13:if(a=l.memoizedState,t===null||t.memoizedState!==null&&t.memoizedState.dehydrated!==null){if(u=Ba(l),a!==null&&a.dehydrated!==null){if(t===null){if(!u)throw Error(r(318));if(u=l.memoizedState,u=u!==null?u.dehydrated:null,!u)throw Error(r(317));u[Mt]=l}else ua(),(l.flags&128)===0&&(l.memoizedState=null),l.flags|=4;At(l),u=!1}else u=$i(),t!==null&&t.memoizedState!==null&&(t.memoizedState.hydrationErrors=u),u=!0;if(!u)return l.flags&256?(pl(l),l):(pl(l),null)}return pl(l),(l.flags&128)!==0?(l.lanes=e,l):(e=a!==null,t=t!==null&&t.memoizedState!==null,e&&(a=l.child,u=null,a.alternate!==null&&a.alternate.memoizedState!==null&&a.alternate.memoizedState.cachePool!==null&&(u=a.alternate.memoizedState.cachePool.pool),n=null,a.memoizedState!==null&&a.memoizedState.cachePool!==null&&(n=a.memoizedState.cachePool.pool),n!==u&&(a.flags|=2048)),e!==t&&e&&(l.child.flags|=8192),Gn(l,l.updateQueue),At(l),null);case 4:return ot(),t===null&&sf(l.stateNode.containerInfo),At(l),null;case 10:return ie(l.type),At(l),null;case 19:if(x(Ut),a=l.memoizedState,a===null)return At(l),null;if(u=(l.flags&128)!==0,n=a.rendering,n===null)if(u)Ru(a,!1);else{if(Ct!==0||t!==null&&(t.flags&128)!==0)for(t=l.child;t!==null;){if(n=_n(t),n!==null){for(l.flags|=128,Ru(a,!1),t=n.updateQueue,l.updateQueue=t,Gn(l,t),l.subtreeFlags=0,t=e,e=l.child;e!==null;)zs(e,t),e=e.sibling;return O(Ut,Ut.current&1|2),tt&&ue(l,a.treeForkCount),l.child}t=t.sibling}a.tail!==null&&Et()>Vn&&(l.flags|=128,u=!0,Ru(a,!1),l.lanes=4194304)}else{if(!u)if(t=_n(n),t!==null){if(l.flags|=128,u=!0,t=t.updateQueue,l.updateQueue=t,Gn(l,t),Ru(a,!0),a.tail===null&&a.tailMode==="hidden"&&!n.alternate&&!tt)return At(l),null}else 2*Et()-a.renderingStartTime>Vn&&e!==536870912&&(l.flags|=128,u=!0,Ru(a,!1),l.lanes=4194304);a.isBackwards?(n.sibling=l.child,l.child=n):(t=a.last,t!==null?t.sibling=n:l.child=n,a.last=n)}return a.tail!==null?(t=a.tail,a.rendering=t,a.tail=t.sibling,a.renderingStartTime=Et(),t.sibling=null,e=Ut.current,O(Ut,u?e&1|2:e&1),tt&&ue(l,a.treeForkCount),t):(At(l),null);case 22:case 23:return pl(l),sc(),a=l.memoizedState!==null,t!==null?t.memoizedState!==null!==a&&(l.flags|=8192):a&&(l.flags|=8192),a?(e&536870912)!==0&&(l.flags&128)===0&&(At(l),l.subtreeFlags&6&&(l.flags|=8192)):At(l),e=l.updateQueue,e!==null&&Gn(l,e.retryQueue),e=null,t!==null&&t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(e=t.memoizedState.cachePool.pool),a=null,l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(a=l.memoizedState.cachePool.pool),a!==e&&(l.flags|=2048),t!==null&&x(ca),null;case 24:return e=null,t!==null&&(e=t.memoizedState.cache),l.memoizedState.cache!==e&&(l.flags|=2048),ie(jt),At(l),null;case 25:return null;case 30:return null}throw Error(r(156,l.tag))}function Im(t,l){switch(Wi(l),l.tag){case 1:return t=l.flags,t&65536?(l.flags=t&-65537|128,l):null;case 3:return ie(jt),ot(),t=l.flags,(t&65536)!==0&&(t&128)===0?(l.flags=t&-65537|128,l):null;case 26:case 27:case 5:return Nt(l),null;case 31:if(l.memoizedState!==null){if(pl(l),l.alternate===null)throw Error(r(340));ua()}return t=l.flags,t&65536?(l.flags=t&-65537|128,l):null;case 13:if(pl(l),t=l.memoizedState,t!==null&&t.dehydrated!==null){if(l.alternate===null)throw Error(r(340));ua()}return t=l.flags,t&65536?(l.flags=t&-65537|128,l):null;case 19:return x(Ut),null;case 4:return ot(),null;case 10:return ie(l.type),null;case 22:case 23:return pl(l),sc(),t!==null&&x(ca),t=l.flags,t&65536?(l.flags=t&-65537|128,l):null;case 24:return ie(jt),null;case 25:return null;default:return null}}function Po(t,l){switch(Wi(l),l.tag){case 3:ie(jt),ot();break;case 26:case 27:case 5:Nt(l);break;case 4:ot();break;case 31:l.memoizedState!==null&&pl(l);break;case 13:pl(l);break;case 19:x(Ut);break;case 10:ie(l.type);break;case 22:case 23:pl(l),sc(),t!==null&&x(ca);break;case 24:ie(jt)}}function ju(t,l){try{var e=l.updateQueue,a=e!==null?e.lastEffect:null;if(a!==null){var u=a.next;e=u;do{if((e.tag&t)===t){a=void 0;var n=e.create,i=e.inst;a=n(),i.destroy=a}e=e.next}while(e!==u)}}catch(c){mt(l,l.return,c)}}function Ce(t,l,e){try{var a=l.updateQueue,u=a!==null?a.lastEffect:null;if(u!==null){var n=u.next;a=n;do{if((a.tag&t)===t){var i=a.inst,c=i.destroy;if(c!==void 0){i.destroy=void 0,u=l;var f=e,v=c;try{v()}catch(S){mt(u,f,S)}}}a=a.next}while(a!==n)}}catch(S){mt(l,l.return,S)}}function td(t){var l=t.updateQueue;if(l!==null){var e=t.stateNode;try{Ls(l,e)}catch(a){mt(t,t.return,a)}}}function ld(t,l,e){e.props=ra(t.type,t.memoizedProps),e.state=t.memoizedState;try{e.componentWillUnmount()}catch(a){mt(t,l,a)}}function Hu(t,l){try{var e=t.ref;if(e!==null){switch(t.tag){case 26:case 27:case 5:var a=t.stateNode;break;case 30:a=t.stateNode;break;default:a=t.stateNode}typeof e=="function"?t.refCleanup=e(a):e.current=a}}catch(u){mt(t,l,u)}}function wl(t,l){var e=t.ref,a=t.refCleanup;if(e!==null)if(typeof a=="function")try{a()}catch(u){mt(t,l,u)}finally{t.refCleanup=null,t=t.alternate,t!=null&&(t.refCleanup=null)}else if(typeof e=="function")try{e(null)}catch(u){mt(t,l,u)}else e.current=null}function ed(t){var l=t.type,e=t.memoizedProps,a=t.stateNode;try{t:switch(l){case"button":case"input":case"select":case"textarea":e.autoFocus&&a.focus();break t;case"img":e.src?a.src=e.src:e.srcSet&&(a.srcset=e.srcSet)}}catch(u){mt(t,t.return,u)}}function Xc(t,l,e){try{var a=t.stateNode;p0(a,t.type,e,l),a[bt]=l}catch(u){mt(t,t.return,u)}}function ad(t){return t.tag===5||t.tag===3||t.tag===26||t.tag===27&&Ye(t.type)||t.tag===4}function Zc(t){t:for(;;){for(;t.sibling===null;){if(t.return===null||ad(t.return))return null;t=t.return}for(t.sibling.return=t.return,t=t.sibling;t.tag!==5&&t.tag!==6&&t.tag!==18;){if(t.tag===27&&Ye(t.type)||t.flags&2||t.child===null||t.tag===4)continue t;t.child.return=t,t=t.child}if(!(t.flags&2))return t.stateNode}}function Lc(t,l,e){var a=t.tag;if(a===5||a===6)t=t.stateNode,l?(e.nodeType===9?e.body:e.nodeName==="HTML"?e.ownerDocument.body:e).insertBefore(t,l):(l=e.nodeType===9?e.body:e.nodeName==="HTML"?e.ownerDocument.body:e,l.appendChild(t),e=e._reactRootContainer,e!=null||l.onclick!==null||(l.onclick=le));else if(a!==4&&(a===27&&Ye(t.type)&&(e=t.stateNode,l=null),t=t.child,t!==null))for(Lc(t,l,e),t=t.sibling;t!==null;)Lc(t,l,e),t=t.sibling}function Qn(t,l,e){var a=t.tag;if(a===5||a===6)t=t.stateNode,l?e.insertBefore(t,l):e.appendChild(t);else if(a!==4&&(a===27&&Ye(t.type)&&(e=t.stateNode),t=t.child,t!==null))for(Qn(t,l,e),t=t.sibling;t!==null;)Qn(t,l,e),t=t.sibling}function ud(t){var l=t.stateNode,e=t.memoizedProps;try{for(var a=t.type,u=l.attributes;u.length;)l.removeAttributeNode(u[0]);$t(l,a,e),l[Mt]=t,l[bt]=e}catch(n){mt(t,t.return,n)}}var de=!1,qt=!1,Vc=!1,nd=typeof WeakSet=="function"?WeakSet:Set,Vt=null;function Pm(t,l){if(t=t.containerInfo,rf=ci,t=hs(t),qi(t)){if("selectionStart"in t)var e={start:t.selectionStart,end:t.selectionEnd};else t:{e=(e=t.ownerDocument)&&e.defaultView||window;var a=e.getSelection&&e.getSelection();if(a&&a.rangeCount!==0){e=a.anchorNode;var u=a.anchorOffset,n=a.focusNode;a=a.focusOffset;try{e.nodeType,n.nodeType}catch{e=null;break t}var i=0,c=-1,f=-1,v=0,S=0,E=t,y=null;l:for(;;){for(var h;E!==e||u!==0&&E.nodeType!==3||(c=i+u),E!==n||a!==0&&E.nodeType!==3||(f=i+a),E.nodeType===3&&(i+=E.nodeValue.length),(h=E.firstChild)!==null;)y=E,E=h;for(;;){if(E===t)break l;if(y===e&&++v===u&&(c=i),y===n&&++S===a&&(f=i),(h=E.nextSibling)!==null)break;E=y,y=E.parentNode}E=h}e=c===-1||f===-1?null:{start:c,end:f}}else e=null}e=e||{start:0,end:0}}else e=null;for(mf={focusedElem:t,selectionRange:e},ci=!1,Vt=l;Vt!==null;)if(l=Vt,t=l.child,(l.subtreeFlags&1028)!==0&&t!==null)t.return=l,Vt=t;else for(;Vt!==null;){switch(l=Vt,n=l.alternate,t=l.flags,l.tag){case 0:if((t&4)!==0&&(t=l.updateQueue,t=t!==null?t.events:null,t!==null))for(e=0;e<t.length;e++)u=t[e],u.ref.impl=u.nextImpl;break;case 11:case 15:break;case 1:if((t&1024)!==0&&n!==null){t=void 0,e=l,u=n.memoizedProps,n=n.memoizedState,a=e.stateNode;try{var M=ra(e.type,u);t=a.getSnapshotBeforeUpdate(M,n),a.__reactInternalSnapshotBeforeUpdate=t}catch(G){mt(e,e.return,G)}}break;case 3:if((t&1024)!==0){if(t=l.stateNode.containerInfo,e=t.nodeType,e===9)hf(t);else if(e===1)switch(t.nodeName){case"HEAD":case"HTML":case"BODY":hf(t);break;default:t.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((t&1024)!==0)throw Error(r(163))}if(t=l.sibling,t!==null){t.return=l.return,Vt=t;break}Vt=l.return}}function id(t,l,e){var a=e.flags;switch(e.tag){case 0:case 11:case 15:me(t,e),a&4&&ju(5,e);break;case 1:if(me(t,e),a&4)if(t=e.stateNode,l===null)try{t.componentDidMount()}catch(i){mt(e,e.return,i)}else{var u=ra(e.type,l.memoizedProps);l=l.memoizedState;try{t.componentDidUpdate(u,l,t.__reactInternalSnapshotBeforeUpdate)}catch(i){mt(e,e.return,i)}}a&64&&td(e),a&512&&Hu(e,e.return);break;case 3:if(me(t,e),a&64&&(t=e.updateQueue,t!==null)){if(l=null,e.child!==null)switch(e.child.tag){case 27:case 5:l=e.child.stateNode;break;case 1:l=e.child.stateNode}try{Ls(t,l)}catch(i){mt(e,e.return,i)}}break;case 27:l===null&&a&4&&ud(e);case 26:case 5:me(t,e),l===null&&a&4&&ed(e),a&512&&Hu(e,e.return);break;case 12:me(t,e);break;case 31:me(t,e),a&4&&sd(t,e);break;case 13:me(t,e),a&4&&od(t,e),a&64&&(t=e.memoizedState,t!==null&&(t=t.dehydrated,t!==null&&(e=f0.bind(null,e),N0(t,e))));break;case 22:if(a=e.memoizedState!==null||de,!a){l=l!==null&&l.memoizedState!==null||qt,u=de;var n=qt;de=a,(qt=l)&&!n?ve(t,e,(e.subtreeFlags&8772)!==0):me(t,e),de=u,qt=n}break;case 30:break;default:me(t,e)}}function cd(t){var l=t.alternate;l!==null&&(t.alternate=null,cd(l)),t.child=null,t.deletions=null,t.sibling=null,t.tag===5&&(l=t.stateNode,l!==null&&pi(l)),t.stateNode=null,t.return=null,t.dependencies=null,t.memoizedProps=null,t.memoizedState=null,t.pendingProps=null,t.stateNode=null,t.updateQueue=null}var zt=null,ol=!1;function re(t,l,e){for(e=e.child;e!==null;)fd(t,l,e),e=e.sibling}function fd(t,l,e){if(el&&typeof el.onCommitFiberUnmount=="function")try{el.onCommitFiberUnmount(ke,e)}catch{}switch(e.tag){case 26:qt||wl(e,l),re(t,l,e),e.memoizedState?e.memoizedState.count--:e.stateNode&&(e=e.stateNode,e.parentNode.removeChild(e));break;case 27:qt||wl(e,l);var a=zt,u=ol;Ye(e.type)&&(zt=e.stateNode,ol=!1),re(t,l,e),Vu(e.stateNode),zt=a,ol=u;break;case 5:qt||wl(e,l);case 6:if(a=zt,u=ol,zt=null,re(t,l,e),zt=a,ol=u,zt!==null)if(ol)try{(zt.nodeType===9?zt.body:zt.nodeName==="HTML"?zt.ownerDocument.body:zt).removeChild(e.stateNode)}catch(n){mt(e,l,n)}else try{zt.removeChild(e.stateNode)}catch(n){mt(e,l,n)}break;case 18:zt!==null&&(ol?(t=zt,tr(t.nodeType===9?t.body:t.nodeName==="HTML"?t.ownerDocument.body:t,e.stateNode),au(t)):tr(zt,e.stateNode));break;case 4:a=zt,u=ol,zt=e.stateNode.containerInfo,ol=!0,re(t,l,e),zt=a,ol=u;break;case 0:case 11:case 14:case 15:Ce(2,e,l),qt||Ce(4,e,l),re(t,l,e);break;case 1:qt||(wl(e,l),a=e.stateNode,typeof a.componentWillUnmount=="function"&&ld(e,l,a)),re(t,l,e);break;case 21:re(t,l,e);break;case 22:qt=(a=qt)||e.memoizedState!==null,re(t,l,e),qt=a;break;default:re(t,l,e)}}function sd(t,l){if(l.memoizedState===null&&(t=l.alternate,t!==null&&(t=t.memoizedState,t!==null))){t=t.dehydrated;try{au(t)}catch(e){mt(l,l.return,e)}}}function od(t,l){if(l.memoizedState===null&&(t=l.alternate,t!==null&&(t=t.memoizedState,t!==null&&(t=t.dehydrated,t!==null))))try{au(t)}catch(e){mt(l,l.return,e)}}function t0(t){switch(t.tag){case 31:case 13:case 19:var l=t.stateNode;return l===null&&(l=t.stateNode=new nd),l;case 22:return t=t.stateNode,l=t._retryCache,l===null&&(l=t._retryCache=new nd),l;default:throw Error(r(435,t.tag))}}function Xn(t,l){var e=t0(t);l.forEach(function(a){if(!e.has(a)){e.add(a);var u=s0.bind(null,t,a);a.then(u,u)}})}function dl(t,l){var e=l.deletions;if(e!==null)for(var a=0;a<e.length;a++){var u=e[a],n=t,i=l,c=i;t:for(;c!==null;){switch(c.tag){case 27:if(Ye(c.type)){zt=c.stateNode,ol=!1;break t}break;case 5:zt=c.stateNode,ol=!1;break t;case 3:case 4:zt=c.stateNode.containerInfo,ol=!0;break t}c=c.return}if(zt===null)throw Error(r(160));fd(n,i,u),zt=null,ol=!1,n=u.alternate,n!==null&&(n.return=null),u.return=null}if(l.subtreeFlags&13886)for(l=l.child;l!==null;)dd(l,t),l=l.sibling}var Ql=null;function dd(t,l){var e=t.alternate,a=t.flags;switch(t.tag){case 0:case 11:case 14:case 15:dl(l,t),rl(t),a&4&&(Ce(3,t,t.return),ju(3,t),Ce(5,t,t.return));break;case 1:dl(l,t),rl(t),a&512&&(qt||e===null||wl(e,e.return)),a&64&&de&&(t=t.updateQueue,t!==null&&(a=t.callbacks,a!==null&&(e=t.shared.hiddenCallbacks,t.shared.hiddenCallbacks=e===null?a:e.concat(a))));break;case 26:var u=Ql;if(dl(l,t),rl(t),a&512&&(qt||e===null||wl(e,e.return)),a&4){var n=e!==null?e.memoizedState:null;if(a=t.memoizedState,e===null)if(a===null)if(t.stateNode===null){t:{a=t.type,e=t.memoizedProps,u=u.ownerDocument||u;l:switch(a){case"title":n=u.getElementsByTagName("title")[0],(!n||n[fu]||n[Mt]||n.namespaceURI==="http://www.w3.org/2000/svg"||n.hasAttribute("itemprop"))&&(n=u.createElement(a),u.head.insertBefore(n,u.querySelector("head > title"))),$t(n,a,e),n[Mt]=t,Lt(n),a=n;break t;case"link":var i=dr("link","href",u).get(a+(e.href||""));if(i){for(var c=0;c<i.length;c++)if(n=i[c],n.getAttribute("href")===(e.href==null||e.href===""?null:e.href)&&n.getAttribute("rel")===(e.rel==null?null:e.rel)&&n.getAttribute("title")===(e.title==null?null:e.title)&&n.getAttribute("crossorigin")===(e.crossOrigin==null?null:e.crossOrigin)){i.splice(c,1);break l}}n=u.createElement(a),$t(n,a,e),u.head.appendChild(n);break;case"meta":if(i=dr("meta","content",u).get(a+(e.content||""))){for(c=0;c<i.length;c++)if(n=i[c],n.getAttribute("content")===(e.content==null?null:""+e.content)&&n.getAttribute("name")===(e.name==null?null:e.name)&&n.getAttribute("property")===(e.property==null?null:e.property)&&n.getAttribute("http-equiv")===(e.httpEquiv==null?null:e.httpEquiv)&&n.getAttribute("charset")===(e.charSet==null?null:e.charSet)){i.splice(c,1);break l}}n=u.createElement(a),$t(n,a,e),u.head.appendChild(n);break;default:throw Error(r(468,a))}n[Mt]=t,Lt(n),a=n}t.stateNode=a}else rr(u,t.type,t.stateNode);else t.stateNode=or(u,a,t.memoizedProps);else n!==a?(n===null?e.stateNode!==null&&(e=e.stateNode,e.parentNode.removeChild(e)):n.count--,a===null?rr(u,t.type,t.stateNode):or(u,a,t.memoizedProps)):a===null&&t.stateNode!==null&&Xc(t,t.memoizedProps,e.memoizedProps)}break;case 27:dl(l,t),rl(t),a&512&&(qt||e===null||wl(e,e.return)),e!==null&&a&4&&Xc(t,t.memoizedProps,e.memoizedProps);break;case 5:if(dl(l,t),rl(t),a&512&&(qt||e===null||wl(e,e.return)),t.flags&32){u=t.stateNode;try{_a(u,"")}catch(M){mt(t,t.return,M)}}a&4&&t.stateNode!=null&&(u=t.memoizedProps,Xc(t,u,e!==null?e.memoizedProps:u)),a&1024&&(Vc=!0);break;case 6:if(dl(l,t),rl(t),a&4){if(t.stateNode===null)throw Error(r(162));a=t.memoizedProps,e=t.stateNode;try{e.nodeValue=a}catch(M){mt(t,t.return,M)}}break;case 3:if(ai=null,u=Ql,Ql=li(l.containerInfo),dl(l,t),Ql=u,rl(t),a&4&&e!==null&&e.memoizedState.isDehydrated)try{au(l.containerInfo)}catch(M){mt(t,t.return,M)}Vc&&(Vc=!1,rd(t));break;case 4:a=Ql,Ql=li(t.stateNode.containerInfo),dl(l,t),rl(t),Ql=a;break;case 12:dl(l,t),rl(t);break;case 31:dl(l,t),rl(t),a&4&&(a=t.updateQueue,a!==null&&(t.updateQueue=null,Xn(t,a)));break;case 13:dl(l,t),rl(t),t.child.flags&8192&&t.memoizedState!==null!=(e!==null&&e.memoizedState!==null)&&(Ln=Et()),a&4&&(a=t.updateQueue,a!==null&&(t.updateQueue=null,Xn(t,a)));break;case 22:u=t.memoizedState!==null;var f=e!==null&&e.memoizedState!==null,v=de,S=qt;if(de=v||u,qt=S||f,dl(l,t),qt=S,de=v,rl(t),a&8192)t:for(l=t.stateNode,l._visibility=u?l._visibility&-2:l._visibility|1,u&&(e===null||f||de||qt||ma(t)),e=null,l=t;;){if(l.tag===5||l.tag===26){if(e===null){f=e=l;try{if(n=f.stateNode,u)i=n.style,typeof i.setProperty=="function"?i.setProperty("display","none","important"):i.display="none";else{c=f.stateNode;var E=f.memoizedProps.style,y=E!=null&&E.hasOwnProperty("display")?E.display:null;c.style.display=y==null||typeof y=="boolean"?"":(""+y).trim()}}catch(M){mt(f,f.return,M)}}}else if(l.tag===6){if(e===null){f=l;try{f.stateNode.nodeValue=u?"":f.memoizedProps}catch(M){mt(f,f.return,M)}}}else if(l.tag===18){if(e===null){f=l;try{var h=f.stateNode;u?lr(h,!0):lr(f.stateNode,!1)}catch(M){mt(f,f.return,M)}}}else if((l.tag!==22&&l.tag!==23||l.memoizedState===null||l===t)&&l.child!==null){l.child.return=l,l=l.child;continue}if(l===t)break t;for(;l.sibling===null;){if(l.return===null||l.return===t)break t;e===l&&(e=null),l=l.return}e===l&&(e=null),l.sibling.return=l.return,l=l.sibling}a&4&&(a=t.updateQueue,a!==null&&(e=a.retryQueue,e!==null&&(a.retryQueue=null,Xn(t,e))));break;case 19:dl(l,t),rl(t),a&4&&(a=t.updateQueue,a!==null&&(t.updateQueue=null,Xn(t,a)));break;case 30:break;case 21:break;default:dl(l,t),rl(t)}}function rl(t){var l=t.flags;if(l&2){try{for(var e,a=t.return;a!==null;){if(ad(a)){e=a;break}a=a.return}if(e==null)throw Error(r(160));switch(e.tag){case 27:var u=e.stateNode,n=Zc(t);Qn(t,n,u);break;case 5:var i=e.stateNode;e.flags&32&&(_a(i,""),e.flags&=-33);var c=Zc(t);Qn(t,c,i);break;case 3:case 4:var f=e.stateNode.containerInfo,v=Zc(t);Lc(t,v,f);break;default:throw Error(r(161))}}catch(S){mt(t,t.return,S)}t.flags&=-3}l&4096&&(t.flags&=-4097)}function rd(t){if(t.subtreeFlags&1024)for(t=t.child;t!==null;){var l=t;rd(l),l.tag===5&&l.flags&1024&&l.stateNode.reset(),t=t.sibling}}function me(t,l){if(l.subtreeFlags&8772)for(l=l.child;l!==null;)id(t,l.alternate,l),l=l.sibling}function ma(t){for(t=t.child;t!==null;){var l=t;switch(l.tag){case 0:case 11:case 14:case 15:Ce(4,l,l.return),ma(l);break;case 1:wl(l,l.return);var e=l.stateNode;typeof e.componentWillUnmount=="function"&&ld(l,l.return,e),ma(l);break;case 27:Vu(l.stateNode);case 26:case 5:wl(l,l.return),ma(l);break;case 22:l.memoizedState===null&&ma(l);break;case 30:ma(l);break;default:ma(l)}t=t.sibling}}function ve(t,l,e){for(e=e&&(l.subtreeFlags&8772)!==0,l=l.child;l!==null;){var a=l.alternate,u=t,n=l,i=n.flags;switch(n.tag){case 0:case 11:case 15:ve(u,n,e),ju(4,n);break;case 1:if(ve(u,n,e),a=n,u=a.stateNode,typeof u.componentDidMount=="function")try{u.componentDidMount()}catch(v){mt(a,a.return,v)}if(a=n,u=a.updateQueue,u!==null){var c=a.stateNode;try{var f=u.shared.hiddenCallbacks;if(f!==null)for(u.shared.hiddenCallbacks=null,u=0;u<f.length;u++)Zs(f[u],c)}catch(v){mt(a,a.return,v)}}e&&i&64&&td(n),Hu(n,n.return);break;case 27:ud(n);case 26:case 5:ve(u,n,e),e&&a===null&&i&4&&ed(n),Hu(n,n.return);break;case 12:ve(u,n,e);break;case 31:ve(u,n,e),e&&i&4&&sd(u,n);break;case 13:ve(u,n,e),e&&i&4&&od(u,n);break;case 22:n.memoizedState===null&&ve(u,n,e),Hu(n,n.return);break;case 30:break;default:ve(u,n,e)}l=l.sibling}}function Kc(t,l){var e=null;t!==null&&t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(e=t.memoizedState.cachePool.pool),t=null,l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(t=l.memoizedState.cachePool.pool),t!==e&&(t!=null&&t.refCount++,e!=null&&Eu(e))}function Jc(t,l){t=null,l.alternate!==null&&(t=l.alternate.memoizedState.cache),l=l.memoizedState.cache,l!==t&&(l.refCount++,t!=null&&Eu(t))}function Xl(t,l,e,a){if(l.subtreeFlags&10256)for(l=l.child;l!==null;)md(t,l,e,a),l=l.sibling}function md(t,l,e,a){var u=l.flags;switch(l.tag){case 0:case 11:case 15:Xl(t,l,e,a),u&2048&&ju(9,l);break;case 1:Xl(t,l,e,a);break;case 3:Xl(t,l,e,a),u&2048&&(t=null,l.alternate!==null&&(t=l.alternate.memoizedState.cache),l=l.memoizedState.cache,l!==t&&(l.refCount++,t!=null&&Eu(t)));break;case 12:if(u&2048){Xl(t,l,e,a),t=l.stateNode;try{var n=l.memoizedProps,i=n.id,c=n.onPostCommit;typeof c=="function"&&c(i,l.alternate===null?"mount":"update",t.passiveEffectDuration,-0)}catch(f){mt(l,l.return,f)}}else Xl(t,l,e,a);break;case 31:Xl(t,l,e,a);break;case 13:Xl(t,l,e,a);break;case 23:break;case 22:n=l.stateNode,i=l.alternate,l.memoizedState!==null?n._visibility&2?Xl(t,l,e,a):Bu(t,l):n._visibility&2?Xl(t,l,e,a):(n._visibility|=2,Ja(t,l,e,a,(l.subtreeFlags&10256)!==0||!1)),u&2048&&Kc(i,l);break;case 24:Xl(t,l,e,a),u&2048&&Jc(l.alternate,l);break;default:Xl(t,l,e,a)}}function Ja(t,l,e,a,u){for(u=u&&((l.subtreeFlags&10256)!==0||!1),l=l.child;l!==null;){var n=t,i=l,c=e,f=a,v=i.flags;switch(i.tag){case 0:case 11:case 15:Ja(n,i,c,f,u),ju(8,i);break;case 23:break;case 22:var S=i.stateNode;i.memoizedState!==null?S._visibility&2?Ja(n,i,c,f,u):Bu(n,i):(S._visibility|=2,Ja(n,i,c,f,u)),u&&v&2048&&Kc(i.alternate,i);break;case 24:Ja(n,i,c,f,u),u&&v&2048&&Jc(i.alternate,i);break;default:Ja(n,i,c,f,u)}l=l.sibling}}function Bu(t,l){if(l.subtreeFlags&10256)for(l=l.child;l!==null;){var e=t,a=l,u=a.flags;switch(a.tag){case 22:Bu(e,a),u&2048&&Kc(a.alternate,a);break;case 24:Bu(e,a),u&2048&&Jc(a.alternate,a);break;default:Bu(e,a)}l=l.sibling}}var qu=8192;function wa(t,l,e){if(t.subtreeFlags&qu)for(t=t.child;t!==null;)vd(t,l,e),t=t.sibling}function vd(t,l,e){switch(t.tag){case 26:wa(t,l,e),t.flags&qu&&t.memoizedState!==null&&Q0(e,Ql,t.memoizedState,t.memoizedProps);break;case 5:wa(t,l,e);break;case 3:case 4:var a=Ql;Ql=li(t.stateNode.containerInfo),wa(t,l,e),Ql=a;break;case 22:t.memoizedState===null&&(a=t.alternate,a!==null&&a.memoizedState!==null?(a=qu,qu=16777216,wa(t,l,e),qu=a):wa(t,l,e));break;default:wa(t,l,e)}}function yd(t){var l=t.alternate;if(l!==null&&(t=l.child,t!==null)){l.child=null;do l=t.sibling,t.sibling=null,t=l;while(t!==null)}}function Yu(t){var l=t.deletions;if((t.flags&16)!==0){if(l!==null)for(var e=0;e<l.length;e++){var a=l[e];Vt=a,gd(a,t)}yd(t)}if(t.subtreeFlags&10256)for(t=t.child;t!==null;)hd(t),t=t.sibling}function hd(t){switch(t.tag){case 0:case 11:case 15:Yu(t),t.flags&2048&&Ce(9,t,t.return);break;case 3:Yu(t);break;case 12:Yu(t);break;case 22:var l=t.stateNode;t.memoizedState!==null&&l._visibility&2&&(t.return===null||t.return.tag!==13)?(l._visibility&=-3,Zn(t)):Yu(t);break;default:Yu(t)}}function Zn(t){var l=t.deletions;if((t.flags&16)!==0){if(l!==null)for(var e=0;e<l.length;e++){var a=l[e];Vt=a,gd(a,t)}yd(t)}for(t=t.child;t!==null;){switch(l=t,l.tag){case 0:case 11:case 15:Ce(8,l,l.return),Zn(l);break;case 22:e=l.stateNode,e._visibility&2&&(e._visibility&=-3,Zn(l));break;default:Zn(l)}t=t.sibling}}function gd(t,l){for(;Vt!==null;){var e=Vt;switch(e.tag){case 0:case 11:case 15:Ce(8,e,l);break;case 23:case 22:if(e.memoizedState!==null&&e.memoizedState.cachePool!==null){var a=e.memoizedState.cachePool.pool;a!=null&&a.refCount++}break;case 24:Eu(e.memoizedState.cache)}if(a=e.child,a!==null)a.return=e,Vt=a;else t:for(e=t;Vt!==null;){a=Vt;var u=a.sibling,n=a.return;if(cd(a),a===e){Vt=null;break t}if(u!==null){u.return=n,Vt=u;break t}Vt=n}}}var l0={getCacheForType:function(t){var l=Wt(jt),e=l.data.get(t);return e===void 0&&(e=t(),l.data.set(t,e)),e},cacheSignal:function(){return Wt(jt).controller.signal}},e0=typeof WeakMap=="function"?WeakMap:Map,ft=0,pt=null,$=null,I=0,rt=0,El=null,Ue=!1,Wa=!1,wc=!1,ye=0,Ct=0,Re=0,va=0,Wc=0,xl=0,ka=0,Gu=null,ml=null,kc=!1,Ln=0,Sd=0,Vn=1/0,Kn=null,je=null,Gt=0,He=null,$a=null,he=0,$c=0,Fc=null,bd=null,Qu=0,Ic=null;function Al(){return(ft&2)!==0&&I!==0?I&-I:g.T!==null?uf():hl()}function pd(){if(xl===0)if((I&536870912)===0||tt){var t=ga;ga<<=1,(ga&3932160)===0&&(ga=262144),xl=t}else xl=536870912;return t=bl.current,t!==null&&(t.flags|=32),xl}function vl(t,l,e){(t===pt&&(rt===2||rt===9)||t.cancelPendingCommit!==null)&&(Fa(t,0),Be(t,I,xl,!1)),T(t,e),((ft&2)===0||t!==pt)&&(t===pt&&((ft&2)===0&&(va|=e),Ct===4&&Be(t,I,xl,!1)),Wl(t))}function Ed(t,l,e){if((ft&6)!==0)throw Error(r(327));var a=!e&&(l&127)===0&&(l&t.expiredLanes)===0||$e(t,l),u=a?n0(t,l):tf(t,l,!0),n=a;do{if(u===0){Wa&&!a&&Be(t,l,0,!1);break}else{if(e=t.current.alternate,n&&!a0(e)){u=tf(t,l,!1),n=!1;continue}if(u===2){if(n=l,t.errorRecoveryDisabledLanes&n)var i=0;else i=t.pendingLanes&-536870913,i=i!==0?i:i&536870912?536870912:0;if(i!==0){l=i;t:{var c=t;u=Gu;var f=c.current.memoizedState.isDehydrated;if(f&&(Fa(c,i).flags|=256),i=tf(c,i,!1),i!==2){if(wc&&!f){c.errorRecoveryDisabledLanes|=n,va|=n,u=4;break t}n=ml,ml=u,n!==null&&(ml===null?ml=n:ml.push.apply(ml,n))}u=i}if(n=!1,u!==2)continue}}if(u===1){Fa(t,0),Be(t,l,0,!0);break}t:{switch(a=t,n=u,n){case 0:case 1:throw Error(r(345));case 4:if((l&4194048)!==l)break;case 6:Be(a,l,xl,!Ue);break t;case 2:ml=null;break;case 3:case 5:break;default:throw Error(r(329))}if((l&62914560)===l&&(u=Ln+300-Et(),10<u)){if(Be(a,l,xl,!Ue),ba(a,0,!0)!==0)break t;he=l,a.timeoutHandle=Id(xd.bind(null,a,e,ml,Kn,kc,l,xl,va,ka,Ue,n,"Throttled",-0,0),u);break t}xd(a,e,ml,Kn,kc,l,xl,va,ka,Ue,n,null,-0,0)}}break}while(!0);Wl(t)}function xd(t,l,e,a,u,n,i,c,f,v,S,E,y,h){if(t.timeoutHandle=-1,E=l.subtreeFlags,E&8192||(E&16785408)===16785408){E={stylesheets:null,count:0,imgCount:0,imgBytes:0,suspenseyImages:[],waitingForImages:!0,waitingForViewTransition:!1,unsuspend:le},vd(l,n,E);var M=(n&62914560)===n?Ln-Et():(n&4194048)===n?Sd-Et():0;if(M=X0(E,M),M!==null){he=n,t.cancelPendingCommit=M(Dd.bind(null,t,l,n,e,a,u,i,c,f,S,E,null,y,h)),Be(t,n,i,!v);return}}Dd(t,l,n,e,a,u,i,c,f)}function a0(t){for(var l=t;;){var e=l.tag;if((e===0||e===11||e===15)&&l.flags&16384&&(e=l.updateQueue,e!==null&&(e=e.stores,e!==null)))for(var a=0;a<e.length;a++){var u=e[a],n=u.getSnapshot;u=u.value;try{if(!gl(n(),u))return!1}catch{return!1}}if(e=l.child,l.subtreeFlags&16384&&e!==null)e.return=l,l=e;else{if(l===t)break;for(;l.sibling===null;){if(l.return===null||l.return===t)return!0;l=l.return}l.sibling.return=l.return,l=l.sibling}}return!0}function Be(t,l,e,a){l&=~Wc,l&=~va,t.suspendedLanes|=l,t.pingedLanes&=~l,a&&(t.warmLanes|=l),a=t.expirationTimes;for(var u=l;0<u;){var n=31-al(u),i=1<<n;a[n]=-1,u&=~i}e!==0&&X(t,e,l)}function Jn(){return(ft&6)===0?(Xu(0),!1):!0}function Pc(){if($!==null){if(rt===0)var t=$.return;else t=$,ne=na=null,yc(t),Xa=null,Au=0,t=$;for(;t!==null;)Po(t.alternate,t),t=t.return;$=null}}function Fa(t,l){var e=t.timeoutHandle;e!==-1&&(t.timeoutHandle=-1,A0(e)),e=t.cancelPendingCommit,e!==null&&(t.cancelPendingCommit=null,e()),he=0,Pc(),pt=t,$=e=ae(t.current,null),I=l,rt=0,El=null,Ue=!1,Wa=$e(t,l),wc=!1,ka=xl=Wc=va=Re=Ct=0,ml=Gu=null,kc=!1,(l&8)!==0&&(l|=l&32);var a=t.entangledLanes;if(a!==0)for(t=t.entanglements,a&=l;0<a;){var u=31-al(a),n=1<<u;l|=t[u],a&=~n}return ye=l,mn(),e}function Ad(t,l){K=null,g.H=Cu,l===Qa||l===En?(l=Ys(),rt=3):l===ac?(l=Ys(),rt=4):rt=l===Cc?8:l!==null&&typeof l=="object"&&typeof l.then=="function"?6:1,El=l,$===null&&(Ct=1,Hn(t,Dl(l,t.current)))}function Td(){var t=bl.current;return t===null?!0:(I&4194048)===I?jl===null:(I&62914560)===I||(I&536870912)!==0?t===jl:!1}function zd(){var t=g.H;return g.H=Cu,t===null?Cu:t}function _d(){var t=g.A;return g.A=l0,t}function wn(){Ct=4,Ue||(I&4194048)!==I&&bl.current!==null||(Wa=!0),(Re&134217727)===0&&(va&134217727)===0||pt===null||Be(pt,I,xl,!1)}function tf(t,l,e){var a=ft;ft|=2;var u=zd(),n=_d();(pt!==t||I!==l)&&(Kn=null,Fa(t,l)),l=!1;var i=Ct;t:do try{if(rt!==0&&$!==null){var c=$,f=El;switch(rt){case 8:Pc(),i=6;break t;case 3:case 2:case 9:case 6:bl.current===null&&(l=!0);var v=rt;if(rt=0,El=null,Ia(t,c,f,v),e&&Wa){i=0;break t}break;default:v=rt,rt=0,El=null,Ia(t,c,f,v)}}u0(),i=Ct;break}catch(S){Ad(t,S)}while(!0);return l&&t.shellSuspendCounter++,ne=na=null,ft=a,g.H=u,g.A=n,$===null&&(pt=null,I=0,mn()),i}function u0(){for(;$!==null;)Od($)}function n0(t,l){var e=ft;ft|=2;var a=zd(),u=_d();pt!==t||I!==l?(Kn=null,Vn=Et()+500,Fa(t,l)):Wa=$e(t,l);t:do try{if(rt!==0&&$!==null){l=$;var n=El;l:switch(rt){case 1:rt=0,El=null,Ia(t,l,n,1);break;case 2:case 9:if(Bs(n)){rt=0,El=null,Nd(l);break}l=function(){rt!==2&&rt!==9||pt!==t||(rt=7),Wl(t)},n.then(l,l);break t;case 3:rt=7;break t;case 4:rt=5;break t;case 7:Bs(n)?(rt=0,El=null,Nd(l)):(rt=0,El=null,Ia(t,l,n,7));break;case 5:var i=null;switch($.tag){case 26:i=$.memoizedState;case 5:case 27:var c=$;if(i?mr(i):c.stateNode.complete){rt=0,El=null;var f=c.sibling;if(f!==null)$=f;else{var v=c.return;v!==null?($=v,Wn(v)):$=null}break l}}rt=0,El=null,Ia(t,l,n,5);break;case 6:rt=0,El=null,Ia(t,l,n,6);break;case 8:Pc(),Ct=6;break t;default:throw Error(r(462))}}i0();break}catch(S){Ad(t,S)}while(!0);return ne=na=null,g.H=a,g.A=u,ft=e,$!==null?0:(pt=null,I=0,mn(),Ct)}function i0(){for(;$!==null&&!vt();)Od($)}function Od(t){var l=Fo(t.alternate,t,ye);t.memoizedProps=t.pendingProps,l===null?Wn(t):$=l}function Nd(t){var l=t,e=l.alternate;switch(l.tag){case 15:case 0:l=Ko(e,l,l.pendingProps,l.type,void 0,I);break;case 11:l=Ko(e,l,l.pendingProps,l.type.render,l.ref,I);break;case 5:yc(l);default:Po(e,l),l=$=zs(l,ye),l=Fo(e,l,ye)}t.memoizedProps=t.pendingProps,l===null?Wn(t):$=l}function Ia(t,l,e,a){ne=na=null,yc(l),Xa=null,Au=0;var u=l.return;try{if(Wm(t,u,l,e,I)){Ct=1,Hn(t,Dl(e,t.current)),$=null;return}}catch(n){if(u!==null)throw $=u,n;Ct=1,Hn(t,Dl(e,t.current)),$=null;return}l.flags&32768?(tt||a===1?t=!0:Wa||(I&536870912)!==0?t=!1:(Ue=t=!0,(a===2||a===9||a===3||a===6)&&(a=bl.current,a!==null&&a.tag===13&&(a.flags|=16384))),Md(l,t)):Wn(l)}function Wn(t){var l=t;do{if((l.flags&32768)!==0){Md(l,Ue);return}t=l.return;var e=Fm(l.alternate,l,ye);if(e!==null){$=e;return}if(l=l.sibling,l!==null){$=l;return}$=l=t}while(l!==null);Ct===0&&(Ct=5)}function Md(t,l){do{var e=Im(t.alternate,t);if(e!==null){e.flags&=32767,$=e;return}if(e=t.return,e!==null&&(e.flags|=32768,e.subtreeFlags=0,e.deletions=null),!l&&(t=t.sibling,t!==null)){$=t;return}$=t=e}while(t!==null);Ct=6,$=null}function Dd(t,l,e,a,u,n,i,c,f){t.cancelPendingCommit=null;do kn();while(Gt!==0);if((ft&6)!==0)throw Error(r(327));if(l!==null){if(l===t.current)throw Error(r(177));if(n=l.lanes|l.childLanes,n|=Zi,_(t,e,n,i,c,f),t===pt&&($=pt=null,I=0),$a=l,He=t,he=e,$c=n,Fc=u,bd=a,(l.subtreeFlags&10256)!==0||(l.flags&10256)!==0?(t.callbackNode=null,t.callbackPriority=0,o0(we,function(){return Hd(),null})):(t.callbackNode=null,t.callbackPriority=0),a=(l.flags&13878)!==0,(l.subtreeFlags&13878)!==0||a){a=g.T,g.T=null,u=N.p,N.p=2,i=ft,ft|=4;try{Pm(t,l,e)}finally{ft=i,N.p=u,g.T=a}}Gt=1,Cd(),Ud(),Rd()}}function Cd(){if(Gt===1){Gt=0;var t=He,l=$a,e=(l.flags&13878)!==0;if((l.subtreeFlags&13878)!==0||e){e=g.T,g.T=null;var a=N.p;N.p=2;var u=ft;ft|=4;try{dd(l,t);var n=mf,i=hs(t.containerInfo),c=n.focusedElem,f=n.selectionRange;if(i!==c&&c&&c.ownerDocument&&ys(c.ownerDocument.documentElement,c)){if(f!==null&&qi(c)){var v=f.start,S=f.end;if(S===void 0&&(S=v),"selectionStart"in c)c.selectionStart=v,c.selectionEnd=Math.min(S,c.value.length);else{var E=c.ownerDocument||document,y=E&&E.defaultView||window;if(y.getSelection){var h=y.getSelection(),M=c.textContent.length,G=Math.min(f.start,M),gt=f.end===void 0?G:Math.min(f.end,M);!h.extend&&G>gt&&(i=gt,gt=G,G=i);var d=vs(c,G),s=vs(c,gt);if(d&&s&&(h.rangeCount!==1||h.anchorNode!==d.node||h.anchorOffset!==d.offset||h.focusNode!==s.node||h.focusOffset!==s.offset)){var m=E.createRange();m.setStart(d.node,d.offset),h.removeAllRanges(),G>gt?(h.addRange(m),h.extend(s.node,s.offset)):(m.setEnd(s.node,s.offset),h.addRange(m))}}}}for(E=[],h=c;h=h.parentNode;)h.nodeType===1&&E.push({element:h,left:h.scrollLeft,top:h.scrollTop});for(typeof c.focus=="function"&&c.focus(),c=0;c<E.length;c++){var p=E[c];p.element.scrollLeft=p.left,p.element.scrollTop=p.top}}ci=!!rf,mf=rf=null}finally{ft=u,N.p=a,g.T=e}}t.current=l,Gt=2}}function Ud(){if(Gt===2){Gt=0;var t=He,l=$a,e=(l.flags&8772)!==0;if((l.subtreeFlags&8772)!==0||e){e=g.T,g.T=null;var a=N.p;N.p=2;var u=ft;ft|=4;try{id(t,l.alternate,l)}finally{ft=u,N.p=a,g.T=e}}Gt=3}}function Rd(){if(Gt===4||Gt===3){Gt=0,vi();var t=He,l=$a,e=he,a=bd;(l.subtreeFlags&10256)!==0||(l.flags&10256)!==0?Gt=5:(Gt=0,$a=He=null,jd(t,t.pendingLanes));var u=t.pendingLanes;if(u===0&&(je=null),Tt(e),l=l.stateNode,el&&typeof el.onCommitFiberRoot=="function")try{el.onCommitFiberRoot(ke,l,void 0,(l.current.flags&128)===128)}catch{}if(a!==null){l=g.T,u=N.p,N.p=2,g.T=null;try{for(var n=t.onRecoverableError,i=0;i<a.length;i++){var c=a[i];n(c.value,{componentStack:c.stack})}}finally{g.T=l,N.p=u}}(he&3)!==0&&kn(),Wl(t),u=t.pendingLanes,(e&261930)!==0&&(u&42)!==0?t===Ic?Qu++:(Qu=0,Ic=t):Qu=0,Xu(0)}}function jd(t,l){(t.pooledCacheLanes&=l)===0&&(l=t.pooledCache,l!=null&&(t.pooledCache=null,Eu(l)))}function kn(){return Cd(),Ud(),Rd(),Hd()}function Hd(){if(Gt!==5)return!1;var t=He,l=$c;$c=0;var e=Tt(he),a=g.T,u=N.p;try{N.p=32>e?32:e,g.T=null,e=Fc,Fc=null;var n=He,i=he;if(Gt=0,$a=He=null,he=0,(ft&6)!==0)throw Error(r(331));var c=ft;if(ft|=4,hd(n.current),md(n,n.current,i,e),ft=c,Xu(0,!1),el&&typeof el.onPostCommitFiberRoot=="function")try{el.onPostCommitFiberRoot(ke,n)}catch{}return!0}finally{N.p=u,g.T=a,jd(t,l)}}function Bd(t,l,e){l=Dl(e,l),l=Dc(t.stateNode,l,2),t=Ne(t,l,2),t!==null&&(T(t,2),Wl(t))}function mt(t,l,e){if(t.tag===3)Bd(t,t,e);else for(;l!==null;){if(l.tag===3){Bd(l,t,e);break}else if(l.tag===1){var a=l.stateNode;if(typeof l.type.getDerivedStateFromError=="function"||typeof a.componentDidCatch=="function"&&(je===null||!je.has(a))){t=Dl(e,t),e=qo(2),a=Ne(l,e,2),a!==null&&(Yo(e,a,l,t),T(a,2),Wl(a));break}}l=l.return}}function lf(t,l,e){var a=t.pingCache;if(a===null){a=t.pingCache=new e0;var u=new Set;a.set(l,u)}else u=a.get(l),u===void 0&&(u=new Set,a.set(l,u));u.has(e)||(wc=!0,u.add(e),t=c0.bind(null,t,l,e),l.then(t,t))}function c0(t,l,e){var a=t.pingCache;a!==null&&a.delete(l),t.pingedLanes|=t.suspendedLanes&e,t.warmLanes&=~e,pt===t&&(I&e)===e&&(Ct===4||Ct===3&&(I&62914560)===I&&300>Et()-Ln?(ft&2)===0&&Fa(t,0):Wc|=e,ka===I&&(ka=0)),Wl(t)}function qd(t,l){l===0&&(l=pa()),t=ea(t,l),t!==null&&(T(t,l),Wl(t))}function f0(t){var l=t.memoizedState,e=0;l!==null&&(e=l.retryLane),qd(t,e)}function s0(t,l){var e=0;switch(t.tag){case 31:case 13:var a=t.stateNode,u=t.memoizedState;u!==null&&(e=u.retryLane);break;case 19:a=t.stateNode;break;case 22:a=t.stateNode._retryCache;break;default:throw Error(r(314))}a!==null&&a.delete(l),qd(t,e)}function o0(t,l){return Yl(t,l)}var $n=null,Pa=null,ef=!1,Fn=!1,af=!1,qe=0;function Wl(t){t!==Pa&&t.next===null&&(Pa===null?$n=Pa=t:Pa=Pa.next=t),Fn=!0,ef||(ef=!0,r0())}function Xu(t,l){if(!af&&Fn){af=!0;do for(var e=!1,a=$n;a!==null;){if(t!==0){var u=a.pendingLanes;if(u===0)var n=0;else{var i=a.suspendedLanes,c=a.pingedLanes;n=(1<<31-al(42|t)+1)-1,n&=u&~(i&~c),n=n&201326741?n&201326741|1:n?n|2:0}n!==0&&(e=!0,Xd(a,n))}else n=I,n=ba(a,a===pt?n:0,a.cancelPendingCommit!==null||a.timeoutHandle!==-1),(n&3)===0||$e(a,n)||(e=!0,Xd(a,n));a=a.next}while(e);af=!1}}function d0(){Yd()}function Yd(){Fn=ef=!1;var t=0;qe!==0&&x0()&&(t=qe);for(var l=Et(),e=null,a=$n;a!==null;){var u=a.next,n=Gd(a,l);n===0?(a.next=null,e===null?$n=u:e.next=u,u===null&&(Pa=e)):(e=a,(t!==0||(n&3)!==0)&&(Fn=!0)),a=u}Gt!==0&&Gt!==5||Xu(t),qe!==0&&(qe=0)}function Gd(t,l){for(var e=t.suspendedLanes,a=t.pingedLanes,u=t.expirationTimes,n=t.pendingLanes&-62914561;0<n;){var i=31-al(n),c=1<<i,f=u[i];f===-1?((c&e)===0||(c&a)!==0)&&(u[i]=cu(c,l)):f<=l&&(t.expiredLanes|=c),n&=~c}if(l=pt,e=I,e=ba(t,t===l?e:0,t.cancelPendingCommit!==null||t.timeoutHandle!==-1),a=t.callbackNode,e===0||t===l&&(rt===2||rt===9)||t.cancelPendingCommit!==null)return a!==null&&a!==null&&Je(a),t.callbackNode=null,t.callbackPriority=0;if((e&3)===0||$e(t,e)){if(l=e&-e,l===t.callbackPriority)return l;switch(a!==null&&Je(a),Tt(e)){case 2:case 8:e=nu;break;case 32:e=we;break;case 268435456:e=We;break;default:e=we}return a=Qd.bind(null,t),e=Yl(e,a),t.callbackPriority=l,t.callbackNode=e,l}return a!==null&&a!==null&&Je(a),t.callbackPriority=2,t.callbackNode=null,2}function Qd(t,l){if(Gt!==0&&Gt!==5)return t.callbackNode=null,t.callbackPriority=0,null;var e=t.callbackNode;if(kn()&&t.callbackNode!==e)return null;var a=I;return a=ba(t,t===pt?a:0,t.cancelPendingCommit!==null||t.timeoutHandle!==-1),a===0?null:(Ed(t,a,l),Gd(t,Et()),t.callbackNode!=null&&t.callbackNode===e?Qd.bind(null,t):null)}function Xd(t,l){if(kn())return null;Ed(t,l,!0)}function r0(){T0(function(){(ft&6)!==0?Yl(Pl,d0):Yd()})}function uf(){if(qe===0){var t=Ya;t===0&&(t=ha,ha<<=1,(ha&261888)===0&&(ha=256)),qe=t}return qe}function Zd(t){return t==null||typeof t=="symbol"||typeof t=="boolean"?null:typeof t=="function"?t:un(""+t)}function Ld(t,l){var e=l.ownerDocument.createElement("input");return e.name=l.name,e.value=l.value,t.id&&e.setAttribute("form",t.id),l.parentNode.insertBefore(e,l),t=new FormData(t),e.parentNode.removeChild(e),t}function m0(t,l,e,a,u){if(l==="submit"&&e&&e.stateNode===u){var n=Zd((u[bt]||null).action),i=a.submitter;i&&(l=(l=i[bt]||null)?Zd(l.formAction):i.getAttribute("formAction"),l!==null&&(n=l,i=null));var c=new sn("action","action",null,a,u);t.push({event:c,listeners:[{instance:null,listener:function(){if(a.defaultPrevented){if(qe!==0){var f=i?Ld(u,i):new FormData(u);Tc(e,{pending:!0,data:f,method:u.method,action:n},null,f)}}else typeof n=="function"&&(c.preventDefault(),f=i?Ld(u,i):new FormData(u),Tc(e,{pending:!0,data:f,method:u.method,action:n},n,f))},currentTarget:u}]})}}for(var nf=0;nf<Xi.length;nf++){var cf=Xi[nf],v0=cf.toLowerCase(),y0=cf[0].toUpperCase()+cf.slice(1);Gl(v0,"on"+y0)}Gl(bs,"onAnimationEnd"),Gl(ps,"onAnimationIteration"),Gl(Es,"onAnimationStart"),Gl("dblclick","onDoubleClick"),Gl("focusin","onFocus"),Gl("focusout","onBlur"),Gl(Cm,"onTransitionRun"),Gl(Um,"onTransitionStart"),Gl(Rm,"onTransitionCancel"),Gl(xs,"onTransitionEnd"),Ta("onMouseEnter",["mouseout","mouseover"]),Ta("onMouseLeave",["mouseout","mouseover"]),Ta("onPointerEnter",["pointerout","pointerover"]),Ta("onPointerLeave",["pointerout","pointerover"]),Ie("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),Ie("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),Ie("onBeforeInput",["compositionend","keypress","textInput","paste"]),Ie("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),Ie("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),Ie("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Zu="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),h0=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(Zu));function Vd(t,l){l=(l&4)!==0;for(var e=0;e<t.length;e++){var a=t[e],u=a.event;a=a.listeners;t:{var n=void 0;if(l)for(var i=a.length-1;0<=i;i--){var c=a[i],f=c.instance,v=c.currentTarget;if(c=c.listener,f!==n&&u.isPropagationStopped())break t;n=c,u.currentTarget=v;try{n(u)}catch(S){rn(S)}u.currentTarget=null,n=f}else for(i=0;i<a.length;i++){if(c=a[i],f=c.instance,v=c.currentTarget,c=c.listener,f!==n&&u.isPropagationStopped())break t;n=c,u.currentTarget=v;try{n(u)}catch(S){rn(S)}u.currentTarget=null,n=f}}}}function F(t,l){var e=l[bi];e===void 0&&(e=l[bi]=new Set);var a=t+"__bubble";e.has(a)||(Kd(l,t,2,!1),e.add(a))}function ff(t,l,e){var a=0;l&&(a|=4),Kd(e,t,a,l)}var In="_reactListening"+Math.random().toString(36).slice(2);function sf(t){if(!t[In]){t[In]=!0,qf.forEach(function(e){e!=="selectionchange"&&(h0.has(e)||ff(e,!1,t),ff(e,!0,t))});var l=t.nodeType===9?t:t.ownerDocument;l===null||l[In]||(l[In]=!0,ff("selectionchange",!1,l))}}function Kd(t,l,e,a){switch(pr(l)){case 2:var u=V0;break;case 8:u=K0;break;default:u=Tf}e=u.bind(null,l,e,t),u=void 0,!Ni||l!=="touchstart"&&l!=="touchmove"&&l!=="wheel"||(u=!0),a?u!==void 0?t.addEventListener(l,e,{capture:!0,passive:u}):t.addEventListener(l,e,!0):u!==void 0?t.addEventListener(l,e,{passive:u}):t.addEventListener(l,e,!1)}function of(t,l,e,a,u){var n=a;if((l&1)===0&&(l&2)===0&&a!==null)t:for(;;){if(a===null)return;var i=a.tag;if(i===3||i===4){var c=a.stateNode.containerInfo;if(c===u)break;if(i===4)for(i=a.return;i!==null;){var f=i.tag;if((f===3||f===4)&&i.stateNode.containerInfo===u)return;i=i.return}for(;c!==null;){if(i=Ea(c),i===null)return;if(f=i.tag,f===5||f===6||f===26||f===27){a=n=i;continue t}c=c.parentNode}}a=a.return}kf(function(){var v=n,S=_i(e),E=[];t:{var y=As.get(t);if(y!==void 0){var h=sn,M=t;switch(t){case"keypress":if(cn(e)===0)break t;case"keydown":case"keyup":h=sm;break;case"focusin":M="focus",h=Ui;break;case"focusout":M="blur",h=Ui;break;case"beforeblur":case"afterblur":h=Ui;break;case"click":if(e.button===2)break t;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":h=If;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":h=Fr;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":h=rm;break;case bs:case ps:case Es:h=tm;break;case xs:h=vm;break;case"scroll":case"scrollend":h=kr;break;case"wheel":h=hm;break;case"copy":case"cut":case"paste":h=em;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":h=ts;break;case"toggle":case"beforetoggle":h=Sm}var G=(l&4)!==0,gt=!G&&(t==="scroll"||t==="scrollend"),d=G?y!==null?y+"Capture":null:y;G=[];for(var s=v,m;s!==null;){var p=s;if(m=p.stateNode,p=p.tag,p!==5&&p!==26&&p!==27||m===null||d===null||(p=ou(s,d),p!=null&&G.push(Lu(s,p,m))),gt)break;s=s.return}0<G.length&&(y=new h(y,M,null,e,S),E.push({event:y,listeners:G}))}}if((l&7)===0){t:{if(y=t==="mouseover"||t==="pointerover",h=t==="mouseout"||t==="pointerout",y&&e!==zi&&(M=e.relatedTarget||e.fromElement)&&(Ea(M)||M[Zt]))break t;if((h||y)&&(y=S.window===S?S:(y=S.ownerDocument)?y.defaultView||y.parentWindow:window,h?(M=e.relatedTarget||e.toElement,h=v,M=M?Ea(M):null,M!==null&&(gt=k(M),G=M.tag,M!==gt||G!==5&&G!==27&&G!==6)&&(M=null)):(h=null,M=v),h!==M)){if(G=If,p="onMouseLeave",d="onMouseEnter",s="mouse",(t==="pointerout"||t==="pointerover")&&(G=ts,p="onPointerLeave",d="onPointerEnter",s="pointer"),gt=h==null?y:su(h),m=M==null?y:su(M),y=new G(p,s+"leave",h,e,S),y.target=gt,y.relatedTarget=m,p=null,Ea(S)===v&&(G=new G(d,s+"enter",M,e,S),G.target=m,G.relatedTarget=gt,p=G),gt=p,h&&M)l:{for(G=g0,d=h,s=M,m=0,p=d;p;p=G(p))m++;p=0;for(var q=s;q;q=G(q))p++;for(;0<m-p;)d=G(d),m--;for(;0<p-m;)s=G(s),p--;for(;m--;){if(d===s||s!==null&&d===s.alternate){G=d;break l}d=G(d),s=G(s)}G=null}else G=null;h!==null&&Jd(E,y,h,G,!1),M!==null&&gt!==null&&Jd(E,gt,M,G,!0)}}t:{if(y=v?su(v):window,h=y.nodeName&&y.nodeName.toLowerCase(),h==="select"||h==="input"&&y.type==="file")var nt=fs;else if(is(y))if(ss)nt=Nm;else{nt=_m;var C=zm}else h=y.nodeName,!h||h.toLowerCase()!=="input"||y.type!=="checkbox"&&y.type!=="radio"?v&&Ti(v.elementType)&&(nt=fs):nt=Om;if(nt&&(nt=nt(t,v))){cs(E,nt,e,S);break t}C&&C(t,y,v),t==="focusout"&&v&&y.type==="number"&&v.memoizedProps.value!=null&&Ai(y,"number",y.value)}switch(C=v?su(v):window,t){case"focusin":(is(C)||C.contentEditable==="true")&&(Da=C,Yi=v,Su=null);break;case"focusout":Su=Yi=Da=null;break;case"mousedown":Gi=!0;break;case"contextmenu":case"mouseup":case"dragend":Gi=!1,gs(E,e,S);break;case"selectionchange":if(Dm)break;case"keydown":case"keyup":gs(E,e,S)}var w;if(ji)t:{switch(t){case"compositionstart":var P="onCompositionStart";break t;case"compositionend":P="onCompositionEnd";break t;case"compositionupdate":P="onCompositionUpdate";break t}P=void 0}else Ma?us(t,e)&&(P="onCompositionEnd"):t==="keydown"&&e.keyCode===229&&(P="onCompositionStart");P&&(ls&&e.locale!=="ko"&&(Ma||P!=="onCompositionStart"?P==="onCompositionEnd"&&Ma&&(w=$f()):(Ee=S,Mi="value"in Ee?Ee.value:Ee.textContent,Ma=!0)),C=Pn(v,P),0<C.length&&(P=new Pf(P,t,null,e,S),E.push({event:P,listeners:C}),w?P.data=w:(w=ns(e),w!==null&&(P.data=w)))),(w=pm?Em(t,e):xm(t,e))&&(P=Pn(v,"onBeforeInput"),0<P.length&&(C=new Pf("onBeforeInput","beforeinput",null,e,S),E.push({event:C,listeners:P}),C.data=w)),m0(E,t,v,e,S)}Vd(E,l)})}function Lu(t,l,e){return{instance:t,listener:l,currentTarget:e}}function Pn(t,l){for(var e=l+"Capture",a=[];t!==null;){var u=t,n=u.stateNode;if(u=u.tag,u!==5&&u!==26&&u!==27||n===null||(u=ou(t,e),u!=null&&a.unshift(Lu(t,u,n)),u=ou(t,l),u!=null&&a.push(Lu(t,u,n))),t.tag===3)return a;t=t.return}return[]}function g0(t){if(t===null)return null;do t=t.return;while(t&&t.tag!==5&&t.tag!==27);return t||null}function Jd(t,l,e,a,u){for(var n=l._reactName,i=[];e!==null&&e!==a;){var c=e,f=c.alternate,v=c.stateNode;if(c=c.tag,f!==null&&f===a)break;c!==5&&c!==26&&c!==27||v===null||(f=v,u?(v=ou(e,n),v!=null&&i.unshift(Lu(e,v,f))):u||(v=ou(e,n),v!=null&&i.push(Lu(e,v,f)))),e=e.return}i.length!==0&&t.push({event:l,listeners:i})}var S0=/\r\n?/g,b0=/\u0000|\uFFFD/g;function wd(t){return(typeof t=="string"?t:""+t).replace(S0,`
-`).replace(b0,"")}function Wd(t,l){return l=wd(l),wd(t)===l}function ht(t,l,e,a,u,n){switch(e){case"children":typeof a=="string"?l==="body"||l==="textarea"&&a===""||_a(t,a):(typeof a=="number"||typeof a=="bigint")&&l!=="body"&&_a(t,""+a);break;case"className":en(t,"class",a);break;case"tabIndex":en(t,"tabindex",a);break;case"dir":case"role":case"viewBox":case"width":case"height":en(t,e,a);break;case"style":wf(t,a,n);break;case"data":if(l!=="object"){en(t,"data",a);break}case"src":case"href":if(a===""&&(l!=="a"||e!=="href")){t.removeAttribute(e);break}if(a==null||typeof a=="function"||typeof a=="symbol"||typeof a=="boolean"){t.removeAttribute(e);break}a=un(""+a),t.setAttribute(e,a);break;case"action":case"formAction":if(typeof a=="function"){t.setAttribute(e,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(e==="formAction"?(l!=="input"&&ht(t,l,"name",u.name,u,null),ht(t,l,"formEncType",u.formEncType,u,null),ht(t,l,"formMethod",u.formMethod,u,null),ht(t,l,"formTarget",u.formTarget,u,null)):(ht(t,l,"encType",u.encType,u,null),ht(t,l,"method",u.method,u,null),ht(t,l,"target",u.target,u,null)));if(a==null||typeof a=="symbol"||typeof a=="boolean"){t.removeAttribute(e);break}a=un(""+a),t.setAttribute(e,a);break;case"onClick":a!=null&&(t.onclick=le);break;case"onScroll":a!=null&&F("scroll",t);break;case"onScrollEnd":a!=null&&F("scrollend",t);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(r(61));if(e=a.__html,e!=null){if(u.children!=null)throw Error(r(60));t.innerHTML=e}}break;case"multiple":t.multiple=a&&typeof a!="function"&&typeof a!="symbol";break;case"muted":t.muted=a&&typeof a!="function"&&typeof a!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(a==null||typeof a=="function"||typeof a=="boolean"||typeof a=="symbol"){t.removeAttribute("xlink:href");break}e=un(""+a),t.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",e);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":a!=null&&typeof a!="function"&&typeof a!="symbol"?t.setAttribute(e,""+a):t.removeAttribute(e);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":a&&typeof a!="function"&&typeof a!="symbol"?t.setAttribute(e,""):t.removeAttribute(e);break;case"capture":case"download":a===!0?t.setAttribute(e,""):a!==!1&&a!=null&&typeof a!="function"&&typeof a!="symbol"?t.setAttribute(e,a):t.removeAttribute(e);break;case"cols":case"rows":case"size":case"span":a!=null&&typeof a!="function"&&typeof a!="symbol"&&!isNaN(a)&&1<=a?t.setAttribute(e,a):t.removeAttribute(e);break;case"rowSpan":case"start":a==null||typeof a=="function"||typeof a=="symbol"||isNaN(a)?t.removeAttribute(e):t.setAttribute(e,a);break;case"popover":F("beforetoggle",t),F("toggle",t),ln(t,"popover",a);break;case"xlinkActuate":te(t,"http://www.w3.org/1999/xlink","xlink:actuate",a);break;case"xlinkArcrole":te(t,"http://www.w3.org/1999/xlink","xlink:arcrole",a);break;case"xlinkRole":te(t,"http://www.w3.org/1999/xlink","xlink:role",a);break;case"xlinkShow":te(t,"http://www.w3.org/1999/xlink","xlink:show",a);break;case"xlinkTitle":te(t,"http://www.w3.org/1999/xlink","xlink:title",a);break;case"xlinkType":te(t,"http://www.w3.org/1999/xlink","xlink:type",a);break;case"xmlBase":te(t,"http://www.w3.org/XML/1998/namespace","xml:base",a);break;case"xmlLang":te(t,"http://www.w3.org/XML/1998/namespace","xml:lang",a);break;case"xmlSpace":te(t,"http://www.w3.org/XML/1998/namespace","xml:space",a);break;case"is":ln(t,"is",a);break;case"innerText":case"textContent":break;default:(!(2<e.length)||e[0]!=="o"&&e[0]!=="O"||e[1]!=="n"&&e[1]!=="N")&&(e=wr.get(e)||e,ln(t,e,a))}}function df(t,l,e,a,u,n){switch(e){case"style":wf(t,a,n);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(r(61));if(e=a.__html,e!=null){if(u.children!=null)throw Error(r(60));t.innerHTML=e}}break;case"children":typeof a=="string"?_a(t,a):(typeof a=="number"||typeof a=="bigint")&&_a(t,""+a);break;case"onScroll":a!=null&&F("scroll",t);break;case"onScrollEnd":a!=null&&F("scrollend",t);break;case"onClick":a!=null&&(t.onclick=le);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!Yf.hasOwnProperty(e))t:{if(e[0]==="o"&&e[1]==="n"&&(u=e.endsWith("Capture"),l=e.slice(2,u?e.length-7:void 0),n=t[bt]||null,n=n!=null?n[e]:null,typeof n=="function"&&t.removeEventListener(l,n,u),typeof a=="function")){typeof n!="function"&&n!==null&&(e in t?t[e]=null:t.hasAttribute(e)&&t.removeAttribute(e)),t.addEventListener(l,a,u);break t}e in t?t[e]=a:a===!0?t.setAttribute(e,""):ln(t,e,a)}}}function $t(t,l,e){switch(l){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":F("error",t),F("load",t);var a=!1,u=!1,n;for(n in e)if(e.hasOwnProperty(n)){var i=e[n];if(i!=null)switch(n){case"src":a=!0;break;case"srcSet":u=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(r(137,l));default:ht(t,l,n,i,e,null)}}u&&ht(t,l,"srcSet",e.srcSet,e,null),a&&ht(t,l,"src",e.src,e,null);return;case"input":F("invalid",t);var c=n=i=u=null,f=null,v=null;for(a in e)if(e.hasOwnProperty(a)){var S=e[a];if(S!=null)switch(a){case"name":u=S;break;case"type":i=S;break;case"checked":f=S;break;case"defaultChecked":v=S;break;case"value":n=S;break;case"defaultValue":c=S;break;case"children":case"dangerouslySetInnerHTML":if(S!=null)throw Error(r(137,l));break;default:ht(t,l,a,S,e,null)}}Lf(t,n,c,f,v,i,u,!1);return;case"select":F("invalid",t),a=i=n=null;for(u in e)if(e.hasOwnProperty(u)&&(c=e[u],c!=null))switch(u){case"value":n=c;break;case"defaultValue":i=c;break;case"multiple":a=c;default:ht(t,l,u,c,e,null)}l=n,e=i,t.multiple=!!a,l!=null?za(t,!!a,l,!1):e!=null&&za(t,!!a,e,!0);return;case"textarea":F("invalid",t),n=u=a=null;for(i in e)if(e.hasOwnProperty(i)&&(c=e[i],c!=null))switch(i){case"value":a=c;break;case"defaultValue":u=c;break;case"children":n=c;break;case"dangerouslySetInnerHTML":if(c!=null)throw Error(r(91));break;default:ht(t,l,i,c,e,null)}Kf(t,a,u,n);return;case"option":for(f in e)if(e.hasOwnProperty(f)&&(a=e[f],a!=null))switch(f){case"selected":t.selected=a&&typeof a!="function"&&typeof a!="symbol";break;default:ht(t,l,f,a,e,null)}return;case"dialog":F("beforetoggle",t),F("toggle",t),F("cancel",t),F("close",t);break;case"iframe":case"object":F("load",t);break;case"video":case"audio":for(a=0;a<Zu.length;a++)F(Zu[a],t);break;case"image":F("error",t),F("load",t);break;case"details":F("toggle",t);break;case"embed":case"source":case"link":F("error",t),F("load",t);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(v in e)if(e.hasOwnProperty(v)&&(a=e[v],a!=null))switch(v){case"children":case"dangerouslySetInnerHTML":throw Error(r(137,l));default:ht(t,l,v,a,e,null)}return;default:if(Ti(l)){for(S in e)e.hasOwnProperty(S)&&(a=e[S],a!==void 0&&df(t,l,S,a,e,void 0));return}}for(c in e)e.hasOwnProperty(c)&&(a=e[c],a!=null&&ht(t,l,c,a,e,null))}function p0(t,l,e,a){switch(l){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var u=null,n=null,i=null,c=null,f=null,v=null,S=null;for(h in e){var E=e[h];if(e.hasOwnProperty(h)&&E!=null)switch(h){case"checked":break;case"value":break;case"defaultValue":f=E;default:a.hasOwnProperty(h)||ht(t,l,h,null,a,E)}}for(var y in a){var h=a[y];if(E=e[y],a.hasOwnProperty(y)&&(h!=null||E!=null))switch(y){case"type":n=h;break;case"name":u=h;break;case"checked":v=h;break;case"defaultChecked":S=h;break;case"value":i=h;break;case"defaultValue":c=h;break;case"children":case"dangerouslySetInnerHTML":if(h!=null)throw Error(r(137,l));break;default:h!==E&&ht(t,l,y,h,a,E)}}xi(t,i,c,f,v,S,n,u);return;case"select":h=i=c=y=null;for(n in e)if(f=e[n],e.hasOwnProperty(n)&&f!=null)switch(n){case"value":break;case"multiple":h=f;default:a.hasOwnProperty(n)||ht(t,l,n,null,a,f)}for(u in a)if(n=a[u],f=e[u],a.hasOwnProperty(u)&&(n!=null||f!=null))switch(u){case"value":y=n;break;case"defaultValue":c=n;break;case"multiple":i=n;default:n!==f&&ht(t,l,u,n,a,f)}l=c,e=i,a=h,y!=null?za(t,!!e,y,!1):!!a!=!!e&&(l!=null?za(t,!!e,l,!0):za(t,!!e,e?[]:"",!1));return;case"textarea":h=y=null;for(c in e)if(u=e[c],e.hasOwnProperty(c)&&u!=null&&!a.hasOwnProperty(c))switch(c){case"value":break;case"children":break;default:ht(t,l,c,null,a,u)}for(i in a)if(u=a[i],n=e[i],a.hasOwnProperty(i)&&(u!=null||n!=null))switch(i){case"value":y=u;break;case"defaultValue":h=u;break;case"children":break;case"dangerouslySetInnerHTML":if(u!=null)throw Error(r(91));break;default:u!==n&&ht(t,l,i,u,a,n)}Vf(t,y,h);return;case"option":for(var M in e)if(y=e[M],e.hasOwnProperty(M)&&y!=null&&!a.hasOwnProperty(M))switch(M){case"selected":t.selected=!1;break;default:ht(t,l,M,null,a,y)}for(f in a)if(y=a[f],h=e[f],a.hasOwnProperty(f)&&y!==h&&(y!=null||h!=null))switch(f){case"selected":t.selected=y&&typeof y!="function"&&typeof y!="symbol";break;default:ht(t,l,f,y,a,h)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var G in e)y=e[G],e.hasOwnProperty(G)&&y!=null&&!a.hasOwnProperty(G)&&ht(t,l,G,null,a,y);for(v in a)if(y=a[v],h=e[v],a.hasOwnProperty(v)&&y!==h&&(y!=null||h!=null))switch(v){case"children":case"dangerouslySetInnerHTML":if(y!=null)throw Error(r(137,l));break;default:ht(t,l,v,y,a,h)}return;default:if(Ti(l)){for(var gt in e)y=e[gt],e.hasOwnProperty(gt)&&y!==void 0&&!a.hasOwnProperty(gt)&&df(t,l,gt,void 0,a,y);for(S in a)y=a[S],h=e[S],!a.hasOwnProperty(S)||y===h||y===void 0&&h===void 0||df(t,l,S,y,a,h);return}}for(var d in e)y=e[d],e.hasOwnProperty(d)&&y!=null&&!a.hasOwnProperty(d)&&ht(t,l,d,null,a,y);for(E in a)y=a[E],h=e[E],!a.hasOwnProperty(E)||y===h||y==null&&h==null||ht(t,l,E,y,a,h)}function kd(t){switch(t){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function E0(){if(typeof performance.getEntriesByType=="function"){for(var t=0,l=0,e=performance.getEntriesByType("resource"),a=0;a<e.length;a++){var u=e[a],n=u.transferSize,i=u.initiatorType,c=u.duration;if(n&&c&&kd(i)){for(i=0,c=u.responseEnd,a+=1;a<e.length;a++){var f=e[a],v=f.startTime;if(v>c)break;var S=f.transferSize,E=f.initiatorType;S&&kd(E)&&(f=f.responseEnd,i+=S*(f<c?1:(c-v)/(f-v)))}if(--a,l+=8*(n+i)/(u.duration/1e3),t++,10<t)break}}if(0<t)return l/t/1e6}return navigator.connection&&(t=navigator.connection.downlink,typeof t=="number")?t:5}var rf=null,mf=null;function ti(t){return t.nodeType===9?t:t.ownerDocument}function $d(t){switch(t){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function Fd(t,l){if(t===0)switch(l){case"svg":return 1;case"math":return 2;default:return 0}return t===1&&l==="foreignObject"?0:t}function vf(t,l){return t==="textarea"||t==="noscript"||typeof l.children=="string"||typeof l.children=="number"||typeof l.children=="bigint"||typeof l.dangerouslySetInnerHTML=="object"&&l.dangerouslySetInnerHTML!==null&&l.dangerouslySetInnerHTML.__html!=null}var yf=null;function x0(){var t=window.event;return t&&t.type==="popstate"?t===yf?!1:(yf=t,!0):(yf=null,!1)}var Id=typeof setTimeout=="function"?setTimeout:void 0,A0=typeof clearTimeout=="function"?clearTimeout:void 0,Pd=typeof Promise=="function"?Promise:void 0,T0=typeof queueMicrotask=="function"?queueMicrotask:typeof Pd<"u"?function(t){return Pd.resolve(null).then(t).catch(z0)}:Id;function z0(t){setTimeout(function(){throw t})}function Ye(t){return t==="head"}function tr(t,l){var e=l,a=0;do{var u=e.nextSibling;if(t.removeChild(e),u&&u.nodeType===8)if(e=u.data,e==="/$"||e==="/&"){if(a===0){t.removeChild(u),au(l);return}a--}else if(e==="$"||e==="$?"||e==="$~"||e==="$!"||e==="&")a++;else if(e==="html")Vu(t.ownerDocument.documentElement);else if(e==="head"){e=t.ownerDocument.head,Vu(e);for(var n=e.firstChild;n;){var i=n.nextSibling,c=n.nodeName;n[fu]||c==="SCRIPT"||c==="STYLE"||c==="LINK"&&n.rel.toLowerCase()==="stylesheet"||e.removeChild(n),n=i}}else e==="body"&&Vu(t.ownerDocument.body);e=u}while(e);au(l)}function lr(t,l){var e=t;t=0;do{var a=e.nextSibling;if(e.nodeType===1?l?(e._stashedDisplay=e.style.display,e.style.display="none"):(e.style.display=e._stashedDisplay||"",e.getAttribute("style")===""&&e.removeAttribute("style")):e.nodeType===3&&(l?(e._stashedText=e.nodeValue,e.nodeValue=""):e.nodeValue=e._stashedText||""),a&&a.nodeType===8)if(e=a.data,e==="/$"){if(t===0)break;t--}else e!=="$"&&e!=="$?"&&e!=="$~"&&e!=="$!"||t++;e=a}while(e)}function hf(t){var l=t.firstChild;for(l&&l.nodeType===10&&(l=l.nextSibling);l;){var e=l;switch(l=l.nextSibling,e.nodeName){case"HTML":case"HEAD":case"BODY":hf(e),pi(e);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(e.rel.toLowerCase()==="stylesheet")continue}t.removeChild(e)}}function _0(t,l,e,a){for(;t.nodeType===1;){var u=e;if(t.nodeName.toLowerCase()!==l.toLowerCase()){if(!a&&(t.nodeName!=="INPUT"||t.type!=="hidden"))break}else if(a){if(!t[fu])switch(l){case"meta":if(!t.hasAttribute("itemprop"))break;return t;case"link":if(n=t.getAttribute("rel"),n==="stylesheet"&&t.hasAttribute("data-precedence"))break;if(n!==u.rel||t.getAttribute("href")!==(u.href==null||u.href===""?null:u.href)||t.getAttribute("crossorigin")!==(u.crossOrigin==null?null:u.crossOrigin)||t.getAttribute("title")!==(u.title==null?null:u.title))break;return t;case"style":if(t.hasAttribute("data-precedence"))break;return t;case"script":if(n=t.getAttribute("src"),(n!==(u.src==null?null:u.src)||t.getAttribute("type")!==(u.type==null?null:u.type)||t.getAttribute("crossorigin")!==(u.crossOrigin==null?null:u.crossOrigin))&&n&&t.hasAttribute("async")&&!t.hasAttribute("itemprop"))break;return t;default:return t}}else if(l==="input"&&t.type==="hidden"){var n=u.name==null?null:""+u.name;if(u.type==="hidden"&&t.getAttribute("name")===n)return t}else return t;if(t=Hl(t.nextSibling),t===null)break}return null}function O0(t,l,e){if(l==="")return null;for(;t.nodeType!==3;)if((t.nodeType!==1||t.nodeName!=="INPUT"||t.type!=="hidden")&&!e||(t=Hl(t.nextSibling),t===null))return null;return t}function er(t,l){for(;t.nodeType!==8;)if((t.nodeType!==1||t.nodeName!=="INPUT"||t.type!=="hidden")&&!l||(t=Hl(t.nextSibling),t===null))return null;return t}function gf(t){return t.data==="$?"||t.data==="$~"}function Sf(t){return t.data==="$!"||t.data==="$?"&&t.ownerDocument.readyState!=="loading"}function N0(t,l){var e=t.ownerDocument;if(t.data==="$~")t._reactRetry=l;else if(t.data!=="$?"||e.readyState!=="loading")l();else{var a=function(){l(),e.removeEventListener("DOMContentLoaded",a)};e.addEventListener("DOMContentLoaded",a),t._reactRetry=a}}function Hl(t){for(;t!=null;t=t.nextSibling){var l=t.nodeType;if(l===1||l===3)break;if(l===8){if(l=t.data,l==="$"||l==="$!"||l==="$?"||l==="$~"||l==="&"||l==="F!"||l==="F")break;if(l==="/$"||l==="/&")return null}}return t}var bf=null;function ar(t){t=t.nextSibling;for(var l=0;t;){if(t.nodeType===8){var e=t.data;if(e==="/$"||e==="/&"){if(l===0)return Hl(t.nextSibling);l--}else e!=="$"&&e!=="$!"&&e!=="$?"&&e!=="$~"&&e!=="&"||l++}t=t.nextSibling}return null}function ur(t){t=t.previousSibling;for(var l=0;t;){if(t.nodeType===8){var e=t.data;if(e==="$"||e==="$!"||e==="$?"||e==="$~"||e==="&"){if(l===0)return t;l--}else e!=="/$"&&e!=="/&"||l++}t=t.previousSibling}return null}function nr(t,l,e){switch(l=ti(e),t){case"html":if(t=l.documentElement,!t)throw Error(r(452));return t;case"head":if(t=l.head,!t)throw Error(r(453));return t;case"body":if(t=l.body,!t)throw Error(r(454));return t;default:throw Error(r(451))}}function Vu(t){for(var l=t.attributes;l.length;)t.removeAttributeNode(l[0]);pi(t)}var Bl=new Map,ir=new Set;function li(t){return typeof t.getRootNode=="function"?t.getRootNode():t.nodeType===9?t:t.ownerDocument}var ge=N.d;N.d={f:M0,r:D0,D:C0,C:U0,L:R0,m:j0,X:B0,S:H0,M:q0};function M0(){var t=ge.f(),l=Jn();return t||l}function D0(t){var l=xa(t);l!==null&&l.tag===5&&l.type==="form"?Ao(l):ge.r(t)}var tu=typeof document>"u"?null:document;function cr(t,l,e){var a=tu;if(a&&typeof l=="string"&&l){var u=Nl(l);u='link[rel="'+t+'"][href="'+u+'"]',typeof e=="string"&&(u+='[crossorigin="'+e+'"]'),ir.has(u)||(ir.add(u),t={rel:t,crossOrigin:e,href:l},a.querySelector(u)===null&&(l=a.createElement("link"),$t(l,"link",t),Lt(l),a.head.appendChild(l)))}}function C0(t){ge.D(t),cr("dns-prefetch",t,null)}function U0(t,l){ge.C(t,l),cr("preconnect",t,l)}function R0(t,l,e){ge.L(t,l,e);var a=tu;if(a&&t&&l){var u='link[rel="preload"][as="'+Nl(l)+'"]';l==="image"&&e&&e.imageSrcSet?(u+='[imagesrcset="'+Nl(e.imageSrcSet)+'"]',typeof e.imageSizes=="string"&&(u+='[imagesizes="'+Nl(e.imageSizes)+'"]')):u+='[href="'+Nl(t)+'"]';var n=u;switch(l){case"style":n=lu(t);break;case"script":n=eu(t)}Bl.has(n)||(t=H({rel:"preload",href:l==="image"&&e&&e.imageSrcSet?void 0:t,as:l},e),Bl.set(n,t),a.querySelector(u)!==null||l==="style"&&a.querySelector(Ku(n))||l==="script"&&a.querySelector(Ju(n))||(l=a.createElement("link"),$t(l,"link",t),Lt(l),a.head.appendChild(l)))}}function j0(t,l){ge.m(t,l);var e=tu;if(e&&t){var a=l&&typeof l.as=="string"?l.as:"script",u='link[rel="modulepreload"][as="'+Nl(a)+'"][href="'+Nl(t)+'"]',n=u;switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=eu(t)}if(!Bl.has(n)&&(t=H({rel:"modulepreload",href:t},l),Bl.set(n,t),e.querySelector(u)===null)){switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(e.querySelector(Ju(n)))return}a=e.createElement("link"),$t(a,"link",t),Lt(a),e.head.appendChild(a)}}}function H0(t,l,e){ge.S(t,l,e);var a=tu;if(a&&t){var u=Aa(a).hoistableStyles,n=lu(t);l=l||"default";var i=u.get(n);if(!i){var c={loading:0,preload:null};if(i=a.querySelector(Ku(n)))c.loading=5;else{t=H({rel:"stylesheet",href:t,"data-precedence":l},e),(e=Bl.get(n))&&pf(t,e);var f=i=a.createElement("link");Lt(f),$t(f,"link",t),f._p=new Promise(function(v,S){f.onload=v,f.onerror=S}),f.addEventListener("load",function(){c.loading|=1}),f.addEventListener("error",function(){c.loading|=2}),c.loading|=4,ei(i,l,a)}i={type:"stylesheet",instance:i,count:1,state:c},u.set(n,i)}}}function B0(t,l){ge.X(t,l);var e=tu;if(e&&t){var a=Aa(e).hoistableScripts,u=eu(t),n=a.get(u);n||(n=e.querySelector(Ju(u)),n||(t=H({src:t,async:!0},l),(l=Bl.get(u))&&Ef(t,l),n=e.createElement("script"),Lt(n),$t(n,"link",t),e.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(u,n))}}function q0(t,l){ge.M(t,l);var e=tu;if(e&&t){var a=Aa(e).hoistableScripts,u=eu(t),n=a.get(u);n||(n=e.querySelector(Ju(u)),n||(t=H({src:t,async:!0,type:"module"},l),(l=Bl.get(u))&&Ef(t,l),n=e.createElement("script"),Lt(n),$t(n,"link",t),e.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(u,n))}}function fr(t,l,e,a){var u=(u=Z.current)?li(u):null;if(!u)throw Error(r(446));switch(t){case"meta":case"title":return null;case"style":return typeof e.precedence=="string"&&typeof e.href=="string"?(l=lu(e.href),e=Aa(u).hoistableStyles,a=e.get(l),a||(a={type:"style",instance:null,count:0,state:null},e.set(l,a)),a):{type:"void",instance:null,count:0,state:null};case"link":if(e.rel==="stylesheet"&&typeof e.href=="string"&&typeof e.precedence=="string"){t=lu(e.href);var n=Aa(u).hoistableStyles,i=n.get(t);if(i||(u=u.ownerDocument||u,i={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(t,i),(n=u.querySelector(Ku(t)))&&!n._p&&(i.instance=n,i.state.loading=5),Bl.has(t)||(e={rel:"preload",as:"style",href:e.href,crossOrigin:e.crossOrigin,integrity:e.integrity,media:e.media,hrefLang:e.hrefLang,referrerPolicy:e.referrerPolicy},Bl.set(t,e),n||Y0(u,t,e,i.state))),l&&a===null)throw Error(r(528,""));return i}if(l&&a!==null)throw Error(r(529,""));return null;case"script":return l=e.async,e=e.src,typeof e=="string"&&l&&typeof l!="function"&&typeof l!="symbol"?(l=eu(e),e=Aa(u).hoistableScripts,a=e.get(l),a||(a={type:"script",instance:null,count:0,state:null},e.set(l,a)),a):{type:"void",instance:null,count:0,state:null};default:throw Error(r(444,t))}}function lu(t){return'href="'+Nl(t)+'"'}function Ku(t){return'link[rel="stylesheet"]['+t+"]"}function sr(t){return H({},t,{"data-precedence":t.precedence,precedence:null})}function Y0(t,l,e,a){t.querySelector('link[rel="preload"][as="style"]['+l+"]")?a.loading=1:(l=t.createElement("link"),a.preload=l,l.addEventListener("load",function(){return a.loading|=1}),l.addEventListener("error",function(){return a.loading|=2}),$t(l,"link",e),Lt(l),t.head.appendChild(l))}function eu(t){return'[src="'+Nl(t)+'"]'}function Ju(t){return"script[async]"+t}function or(t,l,e){if(l.count++,l.instance===null)switch(l.type){case"style":var a=t.querySelector('style[data-href~="'+Nl(e.href)+'"]');if(a)return l.instance=a,Lt(a),a;var u=H({},e,{"data-href":e.href,"data-precedence":e.precedence,href:null,precedence:null});return a=(t.ownerDocument||t).createElement("style"),Lt(a),$t(a,"style",u),ei(a,e.precedence,t),l.instance=a;case"stylesheet":u=lu(e.href);var n=t.querySelector(Ku(u));if(n)return l.state.loading|=4,l.instance=n,Lt(n),n;a=sr(e),(u=Bl.get(u))&&pf(a,u),n=(t.ownerDocument||t).createElement("link"),Lt(n);var i=n;return i._p=new Promise(function(c,f){i.onload=c,i.onerror=f}),$t(n,"link",a),l.state.loading|=4,ei(n,e.precedence,t),l.instance=n;case"script":return n=eu(e.src),(u=t.querySelector(Ju(n)))?(l.instance=u,Lt(u),u):(a=e,(u=Bl.get(n))&&(a=H({},e),Ef(a,u)),t=t.ownerDocument||t,u=t.createElement("script"),Lt(u),$t(u,"link",a),t.head.appendChild(u),l.instance=u);case"void":return null;default:throw Error(r(443,l.type))}else l.type==="stylesheet"&&(l.state.loading&4)===0&&(a=l.instance,l.state.loading|=4,ei(a,e.precedence,t));return l.instance}function ei(t,l,e){for(var a=e.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),u=a.length?a[a.length-1]:null,n=u,i=0;i<a.length;i++){var c=a[i];if(c.dataset.precedence===l)n=c;else if(n!==u)break}n?n.parentNode.insertBefore(t,n.nextSibling):(l=e.nodeType===9?e.head:e,l.insertBefore(t,l.firstChild))}function pf(t,l){t.crossOrigin==null&&(t.crossOrigin=l.crossOrigin),t.referrerPolicy==null&&(t.referrerPolicy=l.referrerPolicy),t.title==null&&(t.title=l.title)}function Ef(t,l){t.crossOrigin==null&&(t.crossOrigin=l.crossOrigin),t.referrerPolicy==null&&(t.referrerPolicy=l.referrerPolicy),t.integrity==null&&(t.integrity=l.integrity)}var ai=null;function dr(t,l,e){if(ai===null){var a=new Map,u=ai=new Map;u.set(e,a)}else u=ai,a=u.get(e),a||(a=new Map,u.set(e,a));if(a.has(t))return a;for(a.set(t,null),e=e.getElementsByTagName(t),u=0;u<e.length;u++){var n=e[u];if(!(n[fu]||n[Mt]||t==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var i=n.getAttribute(l)||"";i=t+i;var c=a.get(i);c?c.push(n):a.set(i,[n])}}return a}function rr(t,l,e){t=t.ownerDocument||t,t.head.insertBefore(e,l==="title"?t.querySelector("head > title"):null)}function G0(t,l,e){if(e===1||l.itemProp!=null)return!1;switch(t){case"meta":case"title":return!0;case"style":if(typeof l.precedence!="string"||typeof l.href!="string"||l.href==="")break;return!0;case"link":if(typeof l.rel!="string"||typeof l.href!="string"||l.href===""||l.onLoad||l.onError)break;switch(l.rel){case"stylesheet":return t=l.disabled,typeof l.precedence=="string"&&t==null;default:return!0}case"script":if(l.async&&typeof l.async!="function"&&typeof l.async!="symbol"&&!l.onLoad&&!l.onError&&l.src&&typeof l.src=="string")return!0}return!1}function mr(t){return!(t.type==="stylesheet"&&(t.state.loading&3)===0)}function Q0(t,l,e,a){if(e.type==="stylesheet"&&(typeof a.media!="string"||matchMedia(a.media).matches!==!1)&&(e.state.loading&4)===0){if(e.instance===null){var u=lu(a.href),n=l.querySelector(Ku(u));if(n){l=n._p,l!==null&&typeof l=="object"&&typeof l.then=="function"&&(t.count++,t=ui.bind(t),l.then(t,t)),e.state.loading|=4,e.instance=n,Lt(n);return}n=l.ownerDocument||l,a=sr(a),(u=Bl.get(u))&&pf(a,u),n=n.createElement("link"),Lt(n);var i=n;i._p=new Promise(function(c,f){i.onload=c,i.onerror=f}),$t(n,"link",a),e.instance=n}t.stylesheets===null&&(t.stylesheets=new Map),t.stylesheets.set(e,l),(l=e.state.preload)&&(e.state.loading&3)===0&&(t.count++,e=ui.bind(t),l.addEventListener("load",e),l.addEventListener("error",e))}}var xf=0;function X0(t,l){return t.stylesheets&&t.count===0&&ii(t,t.stylesheets),0<t.count||0<t.imgCount?function(e){var a=setTimeout(function(){if(t.stylesheets&&ii(t,t.stylesheets),t.unsuspend){var n=t.unsuspend;t.unsuspend=null,n()}},6e4+l);0<t.imgBytes&&xf===0&&(xf=62500*E0());var u=setTimeout(function(){if(t.waitingForImages=!1,t.count===0&&(t.stylesheets&&ii(t,t.stylesheets),t.unsuspend)){var n=t.unsuspend;t.unsuspend=null,n()}},(t.imgBytes>xf?50:800)+l);return t.unsuspend=e,function(){t.unsuspend=null,clearTimeout(a),clearTimeout(u)}}:null}function ui(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)ii(this,this.stylesheets);else if(this.unsuspend){var t=this.unsuspend;this.unsuspend=null,t()}}}var ni=null;function ii(t,l){t.stylesheets=null,t.unsuspend!==null&&(t.count++,ni=new Map,l.forEach(Z0,t),ni=null,ui.call(t))}function Z0(t,l){if(!(l.state.loading&4)){var e=ni.get(t);if(e)var a=e.get(null);else{e=new Map,ni.set(t,e);for(var u=t.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<u.length;n++){var i=u[n];(i.nodeName==="LINK"||i.getAttribute("media")!=="not all")&&(e.set(i.dataset.precedence,i),a=i)}a&&e.set(null,a)}u=l.instance,i=u.getAttribute("data-precedence"),n=e.get(i)||a,n===a&&e.set(null,u),e.set(i,u),this.count++,a=ui.bind(this),u.addEventListener("load",a),u.addEventListener("error",a),n?n.parentNode.insertBefore(u,n.nextSibling):(t=t.nodeType===9?t.head:t,t.insertBefore(u,t.firstChild)),l.state.loading|=4}}var wu={$$typeof:Yt,Provider:null,Consumer:null,_currentValue:Y,_currentValue2:Y,_threadCount:0};function L0(t,l,e,a,u,n,i,c,f){this.tag=1,this.containerInfo=t,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Fe(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Fe(0),this.hiddenUpdates=Fe(null),this.identifierPrefix=a,this.onUncaughtError=u,this.onCaughtError=n,this.onRecoverableError=i,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=f,this.incompleteTransitions=new Map}function vr(t,l,e,a,u,n,i,c,f,v,S,E){return t=new L0(t,l,e,i,f,v,S,E,c),l=1,n===!0&&(l|=24),n=Sl(3,null,null,l),t.current=n,n.stateNode=t,l=tc(),l.refCount++,t.pooledCache=l,l.refCount++,n.memoizedState={element:a,isDehydrated:e,cache:l},uc(n),t}function yr(t){return t?(t=Ra,t):Ra}function hr(t,l,e,a,u,n){u=yr(u),a.context===null?a.context=u:a.pendingContext=u,a=Oe(l),a.payload={element:e},n=n===void 0?null:n,n!==null&&(a.callback=n),e=Ne(t,a,l),e!==null&&(vl(e,t,l),zu(e,t,l))}function gr(t,l){if(t=t.memoizedState,t!==null&&t.dehydrated!==null){var e=t.retryLane;t.retryLane=e!==0&&e<l?e:l}}function Af(t,l){gr(t,l),(t=t.alternate)&&gr(t,l)}function Sr(t){if(t.tag===13||t.tag===31){var l=ea(t,67108864);l!==null&&vl(l,t,67108864),Af(t,67108864)}}function br(t){if(t.tag===13||t.tag===31){var l=Al();l=dt(l);var e=ea(t,l);e!==null&&vl(e,t,l),Af(t,l)}}var ci=!0;function V0(t,l,e,a){var u=g.T;g.T=null;var n=N.p;try{N.p=2,Tf(t,l,e,a)}finally{N.p=n,g.T=u}}function K0(t,l,e,a){var u=g.T;g.T=null;var n=N.p;try{N.p=8,Tf(t,l,e,a)}finally{N.p=n,g.T=u}}function Tf(t,l,e,a){if(ci){var u=zf(a);if(u===null)of(t,l,a,fi,e),Er(t,a);else if(w0(u,t,l,e,a))a.stopPropagation();else if(Er(t,a),l&4&&-1<J0.indexOf(t)){for(;u!==null;){var n=xa(u);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var i=Vl(n.pendingLanes);if(i!==0){var c=n;for(c.pendingLanes|=2,c.entangledLanes|=2;i;){var f=1<<31-al(i);c.entanglements[1]|=f,i&=~f}Wl(n),(ft&6)===0&&(Vn=Et()+500,Xu(0))}}break;case 31:case 13:c=ea(n,2),c!==null&&vl(c,n,2),Jn(),Af(n,2)}if(n=zf(a),n===null&&of(t,l,a,fi,e),n===u)break;u=n}u!==null&&a.stopPropagation()}else of(t,l,a,null,e)}}function zf(t){return t=_i(t),_f(t)}var fi=null;function _f(t){if(fi=null,t=Ea(t),t!==null){var l=k(t);if(l===null)t=null;else{var e=l.tag;if(e===13){if(t=_t(l),t!==null)return t;t=null}else if(e===31){if(t=St(l),t!==null)return t;t=null}else if(e===3){if(l.stateNode.current.memoizedState.isDehydrated)return l.tag===3?l.stateNode.containerInfo:null;t=null}else l!==t&&(t=null)}}return fi=t,null}function pr(t){switch(t){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Il()){case Pl:return 2;case nu:return 8;case we:case iu:return 32;case We:return 268435456;default:return 32}default:return 32}}var Of=!1,Ge=null,Qe=null,Xe=null,Wu=new Map,ku=new Map,Ze=[],J0="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function Er(t,l){switch(t){case"focusin":case"focusout":Ge=null;break;case"dragenter":case"dragleave":Qe=null;break;case"mouseover":case"mouseout":Xe=null;break;case"pointerover":case"pointerout":Wu.delete(l.pointerId);break;case"gotpointercapture":case"lostpointercapture":ku.delete(l.pointerId)}}function $u(t,l,e,a,u,n){return t===null||t.nativeEvent!==n?(t={blockedOn:l,domEventName:e,eventSystemFlags:a,nativeEvent:n,targetContainers:[u]},l!==null&&(l=xa(l),l!==null&&Sr(l)),t):(t.eventSystemFlags|=a,l=t.targetContainers,u!==null&&l.indexOf(u)===-1&&l.push(u),t)}function w0(t,l,e,a,u){switch(l){case"focusin":return Ge=$u(Ge,t,l,e,a,u),!0;case"dragenter":return Qe=$u(Qe,t,l,e,a,u),!0;case"mouseover":return Xe=$u(Xe,t,l,e,a,u),!0;case"pointerover":var n=u.pointerId;return Wu.set(n,$u(Wu.get(n)||null,t,l,e,a,u)),!0;case"gotpointercapture":return n=u.pointerId,ku.set(n,$u(ku.get(n)||null,t,l,e,a,u)),!0}return!1}function xr(t){var l=Ea(t.target);if(l!==null){var e=k(l);if(e!==null){if(l=e.tag,l===13){if(l=_t(e),l!==null){t.blockedOn=l,fl(t.priority,function(){br(e)});return}}else if(l===31){if(l=St(e),l!==null){t.blockedOn=l,fl(t.priority,function(){br(e)});return}}else if(l===3&&e.stateNode.current.memoizedState.isDehydrated){t.blockedOn=e.tag===3?e.stateNode.containerInfo:null;return}}}t.blockedOn=null}function si(t){if(t.blockedOn!==null)return!1;for(var l=t.targetContainers;0<l.length;){var e=zf(t.nativeEvent);if(e===null){e=t.nativeEvent;var a=new e.constructor(e.type,e);zi=a,e.target.dispatchEvent(a),zi=null}else return l=xa(e),l!==null&&Sr(l),t.blockedOn=e,!1;l.shift()}return!0}function Ar(t,l,e){si(t)&&e.delete(l)}function W0(){Of=!1,Ge!==null&&si(Ge)&&(Ge=null),Qe!==null&&si(Qe)&&(Qe=null),Xe!==null&&si(Xe)&&(Xe=null),Wu.forEach(Ar),ku.forEach(Ar)}function oi(t,l){t.blockedOn===l&&(t.blockedOn=null,Of||(Of=!0,z.unstable_scheduleCallback(z.unstable_NormalPriority,W0)))}var di=null;function Tr(t){di!==t&&(di=t,z.unstable_scheduleCallback(z.unstable_NormalPriority,function(){di===t&&(di=null);for(var l=0;l<t.length;l+=3){var e=t[l],a=t[l+1],u=t[l+2];if(typeof a!="function"){if(_f(a||e)===null)continue;break}var n=xa(e);n!==null&&(t.splice(l,3),l-=3,Tc(n,{pending:!0,data:u,method:e.method,action:a},a,u))}}))}function au(t){function l(f){return oi(f,t)}Ge!==null&&oi(Ge,t),Qe!==null&&oi(Qe,t),Xe!==null&&oi(Xe,t),Wu.forEach(l),ku.forEach(l);for(var e=0;e<Ze.length;e++){var a=Ze[e];a.blockedOn===t&&(a.blockedOn=null)}for(;0<Ze.length&&(e=Ze[0],e.blockedOn===null);)xr(e),e.blockedOn===null&&Ze.shift();if(e=(t.ownerDocument||t).$$reactFormReplay,e!=null)for(a=0;a<e.length;a+=3){var u=e[a],n=e[a+1],i=u[bt]||null;if(typeof n=="function")i||Tr(e);else if(i){var c=null;if(n&&n.hasAttribute("formAction")){if(u=n,i=n[bt]||null)c=i.formAction;else if(_f(u)!==null)continue}else c=i.action;typeof c=="function"?e[a+1]=c:(e.splice(a,3),a-=3),Tr(e)}}}function zr(){function t(n){n.canIntercept&&n.info==="react-transition"&&n.intercept({handler:function(){return new Promise(function(i){return u=i})},focusReset:"manual",scroll:"manual"})}function l(){u!==null&&(u(),u=null),a||setTimeout(e,20)}function e(){if(!a&&!navigation.transition){var n=navigation.currentEntry;n&&n.url!=null&&navigation.navigate(n.url,{state:n.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var a=!1,u=null;return navigation.addEventListener("navigate",t),navigation.addEventListener("navigatesuccess",l),navigation.addEventListener("navigateerror",l),setTimeout(e,100),function(){a=!0,navigation.removeEventListener("navigate",t),navigation.removeEventListener("navigatesuccess",l),navigation.removeEventListener("navigateerror",l),u!==null&&(u(),u=null)}}}function Nf(t){this._internalRoot=t}ri.prototype.render=Nf.prototype.render=function(t){var l=this._internalRoot;if(l===null)throw Error(r(409));var e=l.current,a=Al();hr(e,a,t,l,null,null)},ri.prototype.unmount=Nf.prototype.unmount=function(){var t=this._internalRoot;if(t!==null){this._internalRoot=null;var l=t.containerInfo;hr(t.current,2,null,t,null,null),Jn(),l[Zt]=null}};function ri(t){this._internalRoot=t}ri.prototype.unstable_scheduleHydration=function(t){if(t){var l=hl();t={blockedOn:null,target:t,priority:l};for(var e=0;e<Ze.length&&l!==0&&l<Ze[e].priority;e++);Ze.splice(e,0,t),e===0&&xr(t)}};var _r=J.version;if(_r!=="19.2.4")throw Error(r(527,_r,"19.2.4"));N.findDOMNode=function(t){var l=t._reactInternals;if(l===void 0)throw typeof t.render=="function"?Error(r(188)):(t=Object.keys(t).join(","),Error(r(268,t)));return t=A(l),t=t!==null?lt(t):null,t=t===null?null:t.stateNode,t};var k0={bundleType:0,version:"19.2.4",rendererPackageName:"react-dom",currentDispatcherRef:g,reconcilerVersion:"19.2.4"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var mi=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!mi.isDisabled&&mi.supportsFiber)try{ke=mi.inject(k0),el=mi}catch{}}return Iu.createRoot=function(t,l){if(!V(t))throw Error(r(299));var e=!1,a="",u=Ro,n=jo,i=Ho;return l!=null&&(l.unstable_strictMode===!0&&(e=!0),l.identifierPrefix!==void 0&&(a=l.identifierPrefix),l.onUncaughtError!==void 0&&(u=l.onUncaughtError),l.onCaughtError!==void 0&&(n=l.onCaughtError),l.onRecoverableError!==void 0&&(i=l.onRecoverableError)),l=vr(t,1,!1,null,null,e,a,null,u,n,i,zr),t[Zt]=l.current,sf(t),new Nf(l)},Iu.hydrateRoot=function(t,l,e){if(!V(t))throw Error(r(299));var a=!1,u="",n=Ro,i=jo,c=Ho,f=null;return e!=null&&(e.unstable_strictMode===!0&&(a=!0),e.identifierPrefix!==void 0&&(u=e.identifierPrefix),e.onUncaughtError!==void 0&&(n=e.onUncaughtError),e.onCaughtError!==void 0&&(i=e.onCaughtError),e.onRecoverableError!==void 0&&(c=e.onRecoverableError),e.formState!==void 0&&(f=e.formState)),l=vr(t,1,!0,l,e??null,a,u,f,n,i,c,zr),l.context=yr(null),e=l.current,a=Al(),a=dt(a),u=Oe(a),u.callback=null,Ne(e,u,a),e=a,l.current.lanes=e,T(l,e),Wl(l),t[Zt]=l.current,sf(t),new ri(l)},Iu.version="19.2.4",Iu}var Br;function nv(){if(Br)return Cf.exports;Br=1;function z(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(z)}catch(J){console.error(J)}}return z(),Cf.exports=uv(),Cf.exports}var iv=nv();const qr="disconnected";function cv(z,J){switch(J.type){case"CONNECT_REQUESTED":return"connecting";case"CONNECTED":return"connected";case"DISCONNECTED":return"disconnected";case"RECONNECT_REQUESTED":return"reconnecting";case"CONNECTION_ERROR":return"error";default:return z}}function fv(z){switch(z){case"connecting":return"接続中";case"connected":return"接続済み";case"disconnected":return"切断";case"reconnecting":return"再接続中";case"error":return"エラー";default:return"不明"}}function Yr(z){return z<=767?"mobile":z<=1023?"tablet":"desktop"}function sv(){return typeof window>"u"?"desktop":Yr(window.innerWidth)}function uu(){return`${Date.now()}-${Math.random().toString(36).slice(2)}`}function ov(){return typeof navigator<"u"&&/jsdom/i.test(navigator.userAgent)}function dv(z,J){return`${window.location.protocol==="https:"?"wss:":"ws:"}//${window.location.host}/ws/${z}/${J}`}function rv(z){const J=window.atob(z),U=new Uint8Array(J.length);for(let r=0;r<J.length;r+=1)U[r]=J.charCodeAt(r);return U.buffer}function mv(z,J=24e3){if(!z)return J;const U=z.match(/rate=(\d+)/);if(!U)return J;const r=Number(U[1]);return Number.isFinite(r)?r:J}function vv(z){const J=new Int16Array(z.length);for(let U=0;U<z.length;U+=1){const r=Math.max(-1,Math.min(1,z[U]));J[U]=r<0?r*32768:r*32767}return J}function yv(){const[z,J]=R.useState(sv),[U,r]=R.useReducer(cv,qr),[V,k]=R.useState(!1),[_t,St]=R.useState([]),[j,A]=R.useState(""),[lt,H]=R.useState([]),[ct,Qt]=R.useState(!1),[Ft,Kt]=R.useState(0),[ql,tl]=R.useState(0),[Tl,Yt]=R.useState("idle"),[il,zl]=R.useState(0),[Jt,W]=R.useState([]),[It,yl]=R.useState([]),[kl,_l]=R.useState(!0),[Ot,$l]=R.useState({proactivity:!1,affectiveDialog:!1}),[cl,ll]=R.useState({proactivity:!1,affectiveDialog:!1}),[g,N]=R.useState({proactivity:!1,affectiveDialog:!1}),[Y,at]=R.useState("idle"),[st,o]=R.useState("proactivity=false&affective_dialog=false"),[x,O]=R.useState(!1),[D,Q]=R.useState(!1),Z=typeof window<"u"&&typeof WebSocket<"u"&&!ov(),ut=R.useRef(qr),Xt=R.useRef(null),ot=R.useRef(null),Zl=R.useRef(null),Nt=R.useRef(null),Ve=R.useRef(!1),Pu=R.useRef("demo-user"),Fl=R.useRef(`demo-session-${uu()}`),Ke=R.useRef(!1),Se=R.useRef(null),ya=R.useRef(null),be=R.useRef(null),pe=R.useRef(null),Yl=R.useRef(null),Je=R.useRef(0),vt=R.useCallback((T,_,X,B="standard")=>{const et={id:uu(),timestamp:new Date().toISOString(),summary:_,category:T,kind:B,detail:JSON.stringify(X)};W(dt=>[et,...dt].slice(0,100))},[]),vi=R.useCallback(T=>{yl(_=>_.includes(T)?_.filter(X=>X!==T):[..._,T])},[]),Et=R.useCallback(T=>{window.dispatchEvent(new CustomEvent("mock-stream-event",{detail:T}))},[]),Il=R.useCallback(()=>{be.current&&(be.current.disconnect(),be.current.onaudioprocess=null,be.current=null),pe.current&&(pe.current.disconnect(),pe.current=null),ya.current&&(ya.current.close(),ya.current=null),Se.current&&(Se.current.getTracks().forEach(T=>T.stop()),Se.current=null)},[]),Pl=R.useCallback(()=>{Yl.current&&(Yl.current.close(),Yl.current=null),Je.current=0},[]),nu=R.useCallback((T,_)=>{try{const X=mv(_,24e3);(!Yl.current||Yl.current.sampleRate!==X)&&(Pl(),Yl.current=new AudioContext({sampleRate:X}));const B=Yl.current;if(!B)return;const et=rv(T),dt=new DataView(et),Tt=Math.floor(dt.byteLength/2),hl=new Float32Array(Tt);for(let bt=0;bt<Tt;bt+=1){const Zt=dt.getInt16(bt*2,!0);hl[bt]=Zt/32768}const fl=B.createBuffer(1,Tt,X);fl.copyToChannel(hl,0);const ul=B.createBufferSource();ul.buffer=fl,ul.connect(B.destination);const Mt=Math.max(B.currentTime,Je.current);ul.start(Mt),Je.current=Mt+fl.duration}catch(X){vt("notification","音声再生処理失敗",{message:String(X)})}},[vt,Pl]),we=R.useCallback(T=>{var et,dt,Tt,hl,fl,ul,Mt;let _;try{_=JSON.parse(T)}catch{Et({kind:"error",message:"invalid server payload"});return}if(_.error){const bt=typeof _.error=="string"?_.error:_.error.message??"unknown websocket error";Et({kind:"error",message:bt})}_.interrupted===!0&&(Pl(),Et({kind:"interrupted"}));let X=!1;if((et=_.content)!=null&&et.parts)for(const bt of _.content.parts){const Zt=bt.inlineData??{mimeType:(dt=bt.inline_data)==null?void 0:dt.mime_type,data:(Tt=bt.inline_data)==null?void 0:Tt.data};bt.text&&(X=!0,Et({kind:"text",role:_.author==="user"?"user":"agent",text:bt.text,partial:_.turnComplete!==!0})),(hl=Zt.mimeType)!=null&&hl.startsWith("audio/pcm")&&Zt.data&&(nu(Zt.data,Zt.mimeType),Et({kind:"audioOutput",chunkSize:Zt.data.length})),(fl=Zt.mimeType)!=null&&fl.startsWith("image/")&&Zt.data&&Et({kind:"imageOutput",role:_.author==="user"?"user":"agent",data:Zt.data,mimeType:Zt.mimeType})}const B=((ul=_.outputTranscription)==null?void 0:ul.text)??((Mt=_.output_transcription)==null?void 0:Mt.text);!X&&(B!=null&&B.trim())&&Et({kind:"text",role:"agent",text:B,partial:_.turnComplete!==!0}),_.turnComplete===!0&&Et({kind:"turnComplete"})},[Et,nu,Pl]),iu=R.useCallback(()=>{if(!Z||Nt.current&&Nt.current.readyState<=WebSocket.OPEN)return;Ve.current=!1;const T=new WebSocket(dv(Pu.current,Fl.current));T.binaryType="arraybuffer",Nt.current=T,T.onopen=()=>{r({type:"CONNECTED"})},T.onmessage=_=>{typeof _.data=="string"&&we(_.data)},T.onerror=()=>{Et({kind:"error",message:"websocket transport error"})},T.onclose=()=>{Nt.current=null,Il(),!Ve.current&&(r({type:"CONNECTION_ERROR"}),k(!0))}},[Et,we,Z,Il]),We=R.useCallback(()=>{Nt.current&&(Ve.current=!0,Nt.current.close(),Nt.current=null)},[]),yi=R.useCallback(async()=>{if(!Z)return;if(!Nt.current||Nt.current.readyState!==WebSocket.OPEN)throw new Error("WebSocket未接続");const T=await navigator.mediaDevices.getUserMedia({audio:{channelCount:1}});Se.current=T;const _=new AudioContext({sampleRate:16e3});ya.current=_;const X=_.createMediaStreamSource(T);pe.current=X;const B=_.createScriptProcessor(2048,1,1);be.current=B;const et=_.createGain();et.gain.value=0,B.onaudioprocess=dt=>{if(!Ke.current||!Nt.current||Nt.current.readyState!==WebSocket.OPEN)return;const Tt=dt.inputBuffer.getChannelData(0),hl=vv(Tt);Nt.current.send(hl.buffer),window.dispatchEvent(new CustomEvent("mock-audio-chunk",{detail:{size:hl.byteLength}}))},X.connect(B),B.connect(et),et.connect(_.destination)},[Z]);R.useEffect(()=>{Ke.current=ct},[ct]),R.useEffect(()=>{const T=()=>{J(Yr(window.innerWidth))};return window.addEventListener("resize",T),()=>window.removeEventListener("resize",T)},[]),R.useEffect(()=>{const T=()=>{ct&&Kt(_=>_+1)};return window.addEventListener("mock-audio-chunk",T),()=>window.removeEventListener("mock-audio-chunk",T)},[ct]),R.useEffect(()=>()=>{const T=Zl.current;T&&T.getTracks().forEach(_=>_.stop()),We(),Il(),Pl()},[We,Pl,Il]),R.useEffect(()=>{if(Z||U!=="connecting"&&U!=="reconnecting")return;const T=window.setTimeout(()=>{r({type:"CONNECTED"})},400);return()=>window.clearTimeout(T)},[U,Z]),R.useEffect(()=>{const T=ut.current;T!==U&&(T==="connecting"&&U==="connected"&&(St(_=>[..._,"接続開始"]),vt("notification","接続済み",{phase:"initial"})),T==="reconnecting"&&U==="connected"&&(St(_=>[..._,"再接続に成功"]),vt("notification","再接続に成功",{phase:"recover"})),T==="reconnecting"&&U==="connected"&&Y==="applying"&&(ll(Ot),at("idle"),St(_=>[..._,"設定変更を反映しました"]),vt("notification","RunConfig反映完了",{proactivity:Ot.proactivity,affectiveDialog:Ot.affectiveDialog})),ut.current=U)},[vt,U,Ot,Y]),R.useEffect(()=>{if(!V)return;const T=window.setTimeout(()=>{r({type:"RECONNECT_REQUESTED"}),St(_=>[..._,"再接続を試行中"]),vt("notification","再接続試行",{scheduled:!0}),k(!1),iu()},1e3);return()=>window.clearTimeout(T)},[vt,iu,V]),R.useEffect(()=>{const T=Xt.current;T&&(T.scrollTop=T.scrollHeight)},[lt]),R.useEffect(()=>{const T=_=>{const B=_.detail;if(B){if(B.kind==="text"){const et=B.text.trim();if(!et)return;if(B.role==="agent"&&ot.current&&B.partial){const Tt=ot.current;H(hl=>hl.map(fl=>fl.id===Tt?{...fl,content:`${fl.content}${et}`,status:"partial"}:fl)),vt("conversation","エージェント応答更新",{partial:!0});return}const dt=uu();H(Tt=>[...Tt,{id:dt,role:B.role,content:et,status:B.partial?"partial":"complete"}]),B.role==="agent"&&(ot.current=B.partial?dt:null),vt("conversation","会話イベント受信",{role:B.role,partial:B.partial});return}if(B.kind==="audioOutput"){tl(et=>et+1),Yt("playing"),vt("conversation","音声出力受信",{chunkSize:B.chunkSize},"audio");return}if(B.kind==="imageOutput"){const et=uu();H(dt=>[...dt,{id:et,role:B.role,content:"画像を生成しました",status:"complete",imageData:B.data,imageMimeType:B.mimeType}]),vt("conversation","画像生成を受信",{mimeType:B.mimeType});return}if(B.kind==="turnComplete"){const et=ot.current;if(!et)return;H(dt=>dt.map(Tt=>Tt.id===et?{...Tt,status:"complete"}:Tt)),ot.current=null,vt("conversation","ターン完了",{kind:"turnComplete"});return}if(B.kind==="runConfigApplyResult"){if(B.status==="applied"){ll(B.effective),N(B.effective),at("idle"),St(dt=>[...dt,"設定変更を反映しました"]),vt("notification","RunConfig反映完了",{status:B.status,effective:B.effective});return}const et=g.proactivity||g.affectiveDialog?g:{proactivity:!1,affectiveDialog:!1};ll(et),at("idle"),St(dt=>[...dt,`設定反映に失敗: ${B.reason??"unsupported"}`]),vt("notification","RunConfig反映失敗",{status:B.status,reason:B.reason,fallback:et});return}if(B.kind==="error"){r({type:"CONNECTION_ERROR"}),St(et=>[...et,`WebSocketエラー: ${B.message}`]),vt("notification","WebSocketエラー",{message:B.message}),k(!0);return}if(B.kind==="interrupted"){const et=ot.current;et&&(H(dt=>dt.map(Tt=>Tt.id===et?{...Tt,status:"interrupted"}:Tt)),ot.current=null),Yt(dt=>dt==="playing"?"interrupted":dt),vt("notification","中断イベント",{kind:"interrupted"})}}};return window.addEventListener("mock-stream-event",T),()=>window.removeEventListener("mock-stream-event",T)},[vt,g]);const hi=()=>{r({type:"CONNECT_REQUESTED"}),vt("notification","接続開始要求",{source:"ui"}),iu()},ke=()=>{We(),Il(),Qt(!1),r({type:"DISCONNECTED"}),k(!0),St(T=>[...T,"切断"]),vt("notification","切断",{reconnectScheduled:!0})},el=()=>{const T=j.trim();T&&(H(_=>[..._,{id:uu(),role:"user",content:T,status:"complete"}]),vt("conversation","テキスト送信",{text:T}),Nt.current&&Nt.current.readyState===WebSocket.OPEN&&Nt.current.send(JSON.stringify({type:"text",text:T})),A(""))},Ll=T=>{T.preventDefault(),el()},al=()=>{if(Ke.current){Qt(!1),Il();return}Qt(!0),yi().catch(T=>{Qt(!1),Il();const _=T instanceof Error?T.message:"音声入力開始に失敗";St(X=>[...X,`音声入力に失敗: ${_}`]),vt("notification","音声入力開始失敗",{message:_})})},tn=()=>{const T=Zl.current;T&&(T.getTracks().forEach(_=>_.stop()),Zl.current=null),O(!1),Q(!1)},gi=async()=>{try{if(!navigator.mediaDevices||!navigator.mediaDevices.getUserMedia)throw new Error("カメラ未対応");const T=await navigator.mediaDevices.getUserMedia({video:!0});Zl.current=T,O(!0),Q(!0),vt("notification","カメラプレビュー開始",{status:"opened"})}catch(T){O(!1),Q(!1);const _=T instanceof Error?T.message:"unknown";St(X=>[...X,`カメラ利用に失敗: ${_}`]),vt("notification","カメラ利用失敗",{message:_})}},Si=()=>{H(T=>[...T,{id:uu(),role:"user",content:"[画像を送信しました]",status:"complete"}]),zl(T=>T+1),vt("conversation","画像送信",{placeholder:!0}),Nt.current&&Nt.current.readyState===WebSocket.OPEN&&Nt.current.send(JSON.stringify({type:"image",mimeType:"image/png",data:"iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mP8/x8AAusB9mZ1tcQAAAAASUVORK5CYII="})),tn()},ha=()=>{_l(T=>!T)},ga=()=>{W([]),yl([])},Sa=T=>{const _=new URLSearchParams({proactivity:String(T.proactivity),affective_dialog:String(T.affectiveDialog)}).toString();o(_),at("applying"),St(X=>[...X,"設定変更を反映中"]),vt("notification","RunConfig変更要求",{proactivity:T.proactivity,affective_dialog:T.affectiveDialog,query:_}),r({type:"RECONNECT_REQUESTED"}),Z&&(We(),k(!0))},Vl=T=>{$l(_=>{const X={..._,[T]:!_[T]};return U==="connected"||U==="reconnecting"?Sa(X):o(new URLSearchParams({proactivity:String(X.proactivity),affective_dialog:String(X.affectiveDialog)}).toString()),X})},ba=()=>b.jsxs(b.Fragment,{children:[b.jsxs("p",{className:"mt-2 text-xs text-slate-300",children:["上流音声チャンク: ",b.jsx("span",{"data-testid":"audio-upstream-chunk-count",children:Ft})]}),b.jsxs("p",{className:"mt-1 text-xs text-slate-300",children:["下流音声チャンク: ",b.jsx("span",{"data-testid":"audio-downstream-chunk-count",children:ql})]}),b.jsxs("p",{className:"mt-1 text-xs text-slate-300",children:["音声再生状態:"," ",b.jsxs("span",{"data-testid":"audio-playback-state",children:[Tl==="idle"&&"待機中",Tl==="playing"&&"再生中",Tl==="interrupted"&&"中断"]})]}),b.jsxs("p",{className:"mt-1 text-xs text-slate-300",children:["画像上流送信数: ",b.jsx("span",{"data-testid":"image-upstream-count",children:il})]})]}),$e=()=>{const T=kl?Jt:Jt.filter(_=>_.kind!=="audio");return b.jsxs(b.Fragment,{children:[b.jsxs("div",{className:"mt-3 flex items-center justify-between gap-3 border-t border-slate-700/70 pt-3",children:[b.jsxs("label",{className:"flex items-center gap-2 text-xs text-slate-300",children:[b.jsx("input",{type:"checkbox",checked:kl,onChange:ha}),"音声イベントを表示"]}),b.jsx("button",{type:"button",className:"rounded bg-slate-700 px-2 py-1 text-xs text-slate-100",onClick:ga,children:"ログをクリア"})]}),b.jsx("ul",{"data-testid":"event-log-list",className:"mt-3 space-y-2",children:T.map(_=>{const X=It.includes(_.id),B=_.kind==="audio"?"audio":_.category,et=_.kind==="audio"?"text-cyan-300":_.category==="notification"?"text-amber-300":"text-slate-300";return b.jsxs("li",{"data-testid":"event-log-item",className:"rounded border border-slate-700 bg-slate-900/80 p-2 text-xs",children:[b.jsxs("p",{"data-testid":`event-log-item-${B}`,className:et,children:["[",B,"] ",_.summary]}),b.jsx("p",{className:"mt-1 text-slate-500",children:_.timestamp}),b.jsx("button",{type:"button",className:"mt-1 rounded bg-slate-700 px-2 py-1 text-slate-100",onClick:()=>vi(_.id),children:X?"詳細を閉じる":"詳細を開く"}),X&&b.jsx("pre",{"data-testid":"event-log-detail",className:"mt-2 overflow-x-auto rounded bg-slate-800 p-2 text-[11px] text-slate-200",children:_.detail})]},_.id)})})]})},cu=(T,_="session_overview",X="run_config")=>b.jsxs("section",{"aria-label":"connection",role:"region",className:T,children:[b.jsxs("div",{className:"flex items-center justify-between gap-2",children:[b.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100 [font-family:'JetBrains_Mono',monospace]",children:_}),b.jsx("span",{"data-testid":"connection-state",className:"rounded-full bg-[#1F2A22] px-2 py-1 text-[10px] text-[#2EE6A6] [font-family:'JetBrains_Mono',monospace]",children:fv(U)})]}),U==="disconnected"&&V&&b.jsx("p",{className:"mt-2 text-sm text-amber-300",children:"再接続予定"}),U==="error"&&V&&b.jsx("p",{"data-testid":"recovery-status-banner",className:"mt-2 text-sm text-amber-300",children:"自動回復を試行中"}),b.jsxs("div",{className:"mt-3 flex flex-wrap gap-2",children:[(U==="disconnected"||U==="error")&&b.jsx("button",{type:"button",className:"rounded-[12px] bg-[#00D4AA] px-3 py-2 text-xs font-semibold text-slate-900 transition-colors hover:bg-[#25e1b7]",onClick:hi,children:"接続開始"}),U==="connected"&&b.jsx("button",{type:"button",className:"rounded-[12px] bg-[#1E2631] px-3 py-2 text-xs font-semibold text-slate-100 transition-colors hover:bg-slate-600",onClick:ke,children:"切断"})]}),b.jsxs("div",{className:"mt-4 rounded-[16px] border border-slate-700 bg-[#151C25] p-3",children:[b.jsx("p",{className:"text-xs font-semibold tracking-wide text-slate-200 [font-family:Oswald,sans-serif]",children:X}),b.jsxs("label",{className:"mt-2 flex items-center gap-2 text-sm text-slate-200",children:[b.jsx("input",{type:"checkbox",checked:Ot.proactivity,onChange:()=>Vl("proactivity"),disabled:Y==="applying"}),"Proactivity"]}),b.jsxs("label",{className:"mt-1 flex items-center gap-2 text-sm text-slate-200",children:[b.jsx("input",{type:"checkbox",checked:Ot.affectiveDialog,onChange:()=>Vl("affectiveDialog"),disabled:Y==="applying"}),"Affective Dialog"]}),b.jsx("p",{"data-testid":"run-config-status",className:"mt-2 text-xs text-slate-400",children:Y==="applying"?"反映中":"待機"}),b.jsx("p",{"data-testid":"run-config-query",className:"mt-1 text-xs text-slate-500",children:st}),b.jsxs("p",{"data-testid":"run-config-effective",className:"mt-1 text-xs text-slate-400",children:["effective: proactivity=",String(cl.proactivity),", affectiveDialog=",String(cl.affectiveDialog)]}),b.jsx("p",{"data-testid":"run-config-drift",className:"mt-1 text-xs text-slate-400",children:Ot.proactivity===cl.proactivity&&Ot.affectiveDialog===cl.affectiveDialog?"一致":"不一致"})]})]}),pa=(T,_="stream_transcript")=>b.jsxs("section",{"aria-label":"conversation",role:"region",className:T,children:[b.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100 [font-family:Oswald,sans-serif]",children:_}),b.jsxs("ul",{ref:Xt,"data-testid":"conversation-log",className:"mt-3 max-h-72 space-y-2 overflow-y-auto rounded-[14px] border border-slate-700 bg-[#111821] p-3",children:[lt.length===0&&b.jsx("li",{className:"text-sm text-slate-500",children:"メッセージはまだありません"}),lt.map(X=>b.jsxs("li",{"data-testid":`conversation-message-${X.role}`,className:`rounded px-3 py-2 text-sm ${X.role==="user"?"bg-[#1E2631] text-[#D9E0EA]":X.status==="interrupted"?"bg-[#2B1E22] text-[#FF9AA2]":"bg-[#1A2B27] text-[#DDF6EE]"}`,children:[X.content&&b.jsx("p",{children:X.content}),X.imageData&&b.jsx("img",{src:`data:${X.imageMimeType??"image/png"};base64,${X.imageData}`,alt:"生成画像",className:"mt-2 max-w-full rounded"}),b.jsx("p",{className:"mt-1 text-xs text-slate-400",children:X.status})]},X.id))]})]}),Fe=(T,_="voice_activity")=>b.jsxs("section",{"aria-label":"event-console",role:"region",className:T,children:[b.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100 [font-family:Oswald,sans-serif]",children:_}),ba(),$e()]});return b.jsxs("main",{className:"min-h-screen bg-[#0B0E13] text-slate-100","data-layout":z,children:[b.jsxs("header",{className:"border-b border-slate-800 bg-[#0F141C] px-4 py-4",children:[b.jsx("h1",{className:"text-3xl font-semibold leading-none [font-family:Oswald,sans-serif]",children:"Realtime Voice Agent"}),b.jsxs("p",{className:"mt-1 text-xs text-slate-400 [font-family:'JetBrains_Mono',monospace]",children:[z==="desktop"&&"BIDI streaming console for text, audio, and image context",z==="tablet"&&"tablet_layout // collapsible panels",z==="mobile"&&"live_voice_console"]}),b.jsx("p",{"data-testid":"layout-mode",className:"mt-1 text-xs text-slate-500",children:z})]}),z==="desktop"&&b.jsxs("div",{className:"m-4 grid grid-cols-[260px_1fr_360px] gap-6 rounded-[24px] bg-[#0F1115] p-6",children:[cu("rounded-[20px] border border-slate-800 bg-[#151A20] p-[20px_18px]","session_overview","run_config"),b.jsxs("div",{className:"flex min-h-[560px] flex-col gap-4",children:[pa("flex-1 rounded-[16px] border border-slate-800 bg-[#151C25] p-[14px]","stream_transcript"),b.jsx("div",{className:"rounded-[16px] border border-slate-800 bg-[#151C25] p-3 text-xs text-slate-400 [font-family:'JetBrains_Mono',monospace]",children:"stream.websocket ready for text/voice/image payloads"})]}),b.jsxs("div",{className:"flex min-h-[560px] flex-col gap-4",children:[Fe("rounded-[16px] border border-slate-800 bg-[#151C25] p-[14px]"),b.jsxs("div",{className:"rounded-[16px] border border-slate-800 bg-[#151C25] p-[14px]",children:[b.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100 [font-family:Oswald,sans-serif]",children:"image_context"}),b.jsx("p",{className:"mt-2 text-[10px] text-[#6F7B8B] [font-family:'JetBrains_Mono',monospace]",children:"model: gemini-live-2.5-flash-native-audio"})]})]})]}),z==="tablet"&&b.jsxs("div",{className:"m-4 grid grid-cols-[1fr_290px] gap-[14px] rounded-[24px] bg-[#0F1115] p-5",children:[b.jsxs("div",{className:"flex min-h-[520px] flex-col gap-4",children:[pa("rounded-[14px] border border-slate-800 bg-[#151C25] p-3","conversation_stream"),b.jsxs("div",{className:"grid grid-cols-3 gap-[10px]",children:[b.jsxs("div",{className:"rounded-[12px] bg-[#171E27] p-[10px]",children:[b.jsx("p",{className:"text-[10px] text-[#8D98A8] [font-family:'JetBrains_Mono',monospace]",children:"latency_ms"}),b.jsx("p",{className:"text-[24px] leading-none [font-family:Oswald,sans-serif]",children:"178"})]}),b.jsxs("div",{className:"rounded-[12px] bg-[#171E27] p-[10px]",children:[b.jsx("p",{className:"text-[10px] text-[#8D98A8] [font-family:'JetBrains_Mono',monospace]",children:"turns"}),b.jsx("p",{className:"text-[24px] leading-none [font-family:Oswald,sans-serif]",children:"9"})]}),b.jsxs("div",{className:"rounded-[12px] bg-[#FF7A3D] p-[10px] text-[#0F1115]",children:[b.jsx("p",{className:"text-[10px] text-[#2B1408] [font-family:'JetBrains_Mono',monospace]",children:"state"}),b.jsx("p",{className:"text-[24px] leading-none [font-family:Oswald,sans-serif]",children:"SPEAKING"})]})]})]}),b.jsxs("div",{className:"flex min-h-[520px] flex-col gap-4",children:[cu("rounded-[14px] border border-slate-800 bg-[#151C25] p-3","voice_activity","run_config"),Fe("flex-1 rounded-[14px] border border-slate-800 bg-[#151C25] p-3","tool_events")]})]}),z==="mobile"&&b.jsxs("div",{className:"m-3 flex flex-col gap-[14px] rounded-[28px] bg-[#0F1115] p-[20px_16px]",children:[b.jsxs("div",{className:"rounded-[14px] bg-transparent",children:[b.jsx("p",{className:"text-[30px] leading-none [font-family:Oswald,sans-serif]",children:"Voxa Mobile"}),b.jsx("p",{className:"mt-1 text-[11px] text-[#8D98A8] [font-family:'JetBrains_Mono',monospace]",children:"live_voice_console"}),b.jsxs("div",{className:"mt-3 flex items-center gap-2",children:[b.jsx("span",{className:"rounded-full bg-[#1F2A22] px-2 py-1 text-[10px] text-[#2EE6A6]",children:"CONNECTED"}),b.jsx("span",{className:"rounded-full bg-[#2C271B] px-2 py-1 text-[10px] text-[#F7C56B]",children:"reconnecting"})]})]}),b.jsxs("div",{className:"grid grid-cols-2 gap-[10px]",children:[b.jsxs("div",{className:"rounded-[12px] bg-[#171E27] p-[10px]",children:[b.jsx("p",{className:"text-[10px] text-[#8D98A8] [font-family:'JetBrains_Mono',monospace]",children:"latency"}),b.jsx("p",{className:"text-[24px] leading-none [font-family:Oswald,sans-serif]",children:"186ms"})]}),b.jsxs("div",{className:"rounded-[12px] bg-[#FF7A3D] p-[10px] text-[#0F1115]",children:[b.jsx("p",{className:"text-[10px] text-[#2B1408] [font-family:'JetBrains_Mono',monospace]",children:"state"}),b.jsx("p",{className:"text-[24px] leading-none [font-family:Oswald,sans-serif]",children:"LIVE"})]})]}),pa("rounded-[14px] border border-slate-800 bg-[#151C25] p-3","conversation"),b.jsx("div",{className:"rounded-[16px] border border-slate-800 bg-[#111821] p-3",children:b.jsx("button",{type:"button",className:"w-full rounded-[16px] bg-[#00D4AA] px-4 py-3 text-xs font-semibold text-[#092118]",children:"hold_to_talk"})}),b.jsx("div",{className:"rounded-[14px] border border-slate-800 bg-[#161E28] p-[6px_8px]",children:b.jsxs("div",{className:"grid grid-cols-3 gap-2 text-center text-[10px] [font-family:'JetBrains_Mono',monospace]",children:[b.jsx("div",{className:"rounded-[10px] bg-[#1E2631] py-2 text-white",children:"chat"}),b.jsx("div",{className:"rounded-[10px] bg-[#111722] py-2 text-[#8D98A8]",children:"voice"}),b.jsx("div",{className:"rounded-[10px] bg-[#111722] py-2 text-[#8D98A8]",children:"tools"})]})}),cu("rounded-[12px] border border-slate-800 bg-[#151C25] p-[10px]","session_overview","run_config"),Fe("rounded-[12px] border border-slate-800 bg-[#151C25] p-[10px]","tool_events")]}),b.jsxs("section",{"aria-label":"input-controls",role:"region",className:z==="mobile"?"border-t border-slate-800 bg-[#0F141C] p-3":"sticky bottom-0 border-t border-slate-800 bg-[#0F141C] p-4",children:[b.jsxs("form",{className:"flex flex-wrap items-center gap-2",onSubmit:Ll,children:[b.jsx("label",{htmlFor:"text-input",className:"sr-only",children:"テキスト入力"}),b.jsx("input",{id:"text-input",type:"text",value:j,onChange:T=>A(T.target.value),className:"min-w-[200px] flex-1 rounded-xl border border-slate-700 bg-slate-800 px-3 py-2 text-sm text-slate-100 placeholder:text-slate-500",placeholder:"メッセージを入力"}),b.jsx("button",{type:"submit",className:"rounded-xl bg-[#FF7A3D] px-4 py-2 text-sm font-semibold text-slate-950",children:"送信"}),b.jsx("button",{type:"button",className:"rounded-xl bg-[#00D4AA] px-4 py-2 text-sm font-semibold text-slate-950",onClick:al,children:ct?"音声停止":"音声開始"}),b.jsx("button",{type:"button",className:"rounded-xl bg-slate-700 px-3 py-2 text-sm text-white",onClick:gi,children:"画像送信"})]}),ct&&b.jsx("p",{"data-testid":"voice-input-state",className:"mt-2 text-sm text-emerald-300",children:"音声入力中"}),b.jsx("p",{"data-testid":"camera-state",className:"mt-1 text-sm text-slate-400",children:D?"利用中":"未使用"})]}),x&&b.jsx("section",{role:"dialog","aria-label":"camera-preview",className:"fixed inset-0 z-10 flex items-center justify-center bg-black/60 p-4",children:b.jsxs("div",{className:"w-full max-w-md rounded-2xl border border-slate-700 bg-[#121821] p-4",children:[b.jsx("p",{className:"text-xl font-semibold [font-family:Oswald,sans-serif]",children:"Camera Preview"}),b.jsx("p",{className:"mt-2 text-sm text-slate-300",children:"プレビュー準備完了"}),b.jsxs("div",{className:"mt-4 flex gap-2",children:[b.jsx("button",{type:"button",className:"rounded-xl bg-[#FF7A3D] px-3 py-2 text-sm font-semibold text-slate-900",onClick:Si,children:"画像を送信"}),b.jsx("button",{type:"button",className:"rounded-xl bg-slate-700 px-3 py-2 text-sm text-white",onClick:tn,children:"キャンセル"})]})]})}),b.jsxs("section",{"aria-label":"system-notices",role:"region",className:"border-t border-slate-800 bg-[#0F141C] p-3",children:[b.jsx("p",{className:"text-sm font-medium text-slate-200",children:"システム通知"}),b.jsx("ul",{"data-testid":"system-notices",className:"mt-1 list-disc pl-5 text-sm text-slate-300",children:_t.map((T,_)=>b.jsx("li",{"data-testid":"system-notice-item",className:"system-notice-item rounded border-l-2 border-amber-400 bg-amber-950/30 px-2 py-1",children:T},`${T}-${_}`))})]})]})}function hv(){return{connection:"disconnected",conversation:[],notices:[],eventLog:[]}}const gv=R.createContext(null);function Sv({children:z}){const[J]=R.useState(hv()),U=R.useMemo(()=>J,[J]);return b.jsx(gv.Provider,{value:U,children:z})}const Gr=document.getElementById("root");if(!Gr)throw new Error("Root element #root not found");iv.createRoot(Gr).render(b.jsx(R.StrictMode,{children:b.jsx(Sv,{children:b.jsx(yv,{})})}));"serviceWorker"in navigator&&window.addEventListener("load",()=>{navigator.serviceWorker.register("/service-worker.js").catch(z=>{console.error("service worker registration failed",z)})});
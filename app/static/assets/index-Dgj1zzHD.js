@@ -1,49 +0,0 @@
-(function(){const ol=document.createElement("link").relList;if(ol&&ol.supports&&ol.supports("modulepreload"))return;for(const Q of document.querySelectorAll('link[rel="modulepreload"]'))r(Q);new MutationObserver(Q=>{for(const $ of Q)if($.type==="childList")for(const zl of $.addedNodes)zl.tagName==="LINK"&&zl.rel==="modulepreload"&&r(zl)}).observe(document,{childList:!0,subtree:!0});function q(Q){const $={};return Q.integrity&&($.integrity=Q.integrity),Q.referrerPolicy&&($.referrerPolicy=Q.referrerPolicy),Q.crossOrigin==="use-credentials"?$.credentials="include":Q.crossOrigin==="anonymous"?$.credentials="omit":$.credentials="same-origin",$}function r(Q){if(Q.ep)return;Q.ep=!0;const $=q(Q);fetch(Q.href,$)}})();var bf={exports:{}},Ru={};/**
- * @license React
- * react-jsx-runtime.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var z0;function Fv(){if(z0)return Ru;z0=1;var T=Symbol.for("react.transitional.element"),ol=Symbol.for("react.fragment");function q(r,Q,$){var zl=null;if($!==void 0&&(zl=""+$),Q.key!==void 0&&(zl=""+Q.key),"key"in Q){$={};for(var gl in Q)gl!=="key"&&($[gl]=Q[gl])}else $=Q;return Q=$.ref,{$$typeof:T,type:r,key:zl,ref:Q!==void 0?Q:null,props:$}}return Ru.Fragment=ol,Ru.jsx=q,Ru.jsxs=q,Ru}var T0;function Iv(){return T0||(T0=1,bf.exports=Fv()),bf.exports}var b=Iv(),pf={exports:{}},G={};/**
- * @license React
- * react.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var A0;function Pv(){if(A0)return G;A0=1;var T=Symbol.for("react.transitional.element"),ol=Symbol.for("react.portal"),q=Symbol.for("react.fragment"),r=Symbol.for("react.strict_mode"),Q=Symbol.for("react.profiler"),$=Symbol.for("react.consumer"),zl=Symbol.for("react.context"),gl=Symbol.for("react.forward_ref"),U=Symbol.for("react.suspense"),z=Symbol.for("react.memo"),I=Symbol.for("react.lazy"),j=Symbol.for("react.activity"),nl=Symbol.iterator;function kl(o){return o===null||typeof o!="object"?null:(o=nl&&o[nl]||o["@@iterator"],typeof o=="function"?o:null)}var Jl={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},Gl=Object.assign,Ut={};function $l(o,x,A){this.props=o,this.context=x,this.refs=Ut,this.updater=A||Jl}$l.prototype.isReactComponent={},$l.prototype.setState=function(o,x){if(typeof o!="object"&&typeof o!="function"&&o!=null)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,o,x,"setState")},$l.prototype.forceUpdate=function(o){this.updater.enqueueForceUpdate(this,o,"forceUpdate")};function St(){}St.prototype=$l.prototype;function Hl(o,x,A){this.props=o,this.context=x,this.refs=Ut,this.updater=A||Jl}var tt=Hl.prototype=new St;tt.constructor=Hl,Gl(tt,$l.prototype),tt.isPureReactComponent=!0;var bt=Array.isArray;function Ql(){}var K={H:null,A:null,T:null,S:null},wl=Object.prototype.hasOwnProperty;function ot(o,x,A){var D=A.ref;return{$$typeof:T,type:o,key:x,ref:D!==void 0?D:null,props:A}}function Gt(o,x){return ot(o.type,x,o.props)}function pt(o){return typeof o=="object"&&o!==null&&o.$$typeof===T}function Tl(o){var x={"=":"=0",":":"=2"};return"$"+o.replace(/[=:]/g,function(A){return x[A]})}var Qt=/\/+/g;function et(o,x){return typeof o=="object"&&o!==null&&o.key!=null?Tl(""+o.key):x.toString(36)}function Fl(o){switch(o.status){case"fulfilled":return o.value;case"rejected":throw o.reason;default:switch(typeof o.status=="string"?o.then(Ql,Ql):(o.status="pending",o.then(function(x){o.status==="pending"&&(o.status="fulfilled",o.value=x)},function(x){o.status==="pending"&&(o.status="rejected",o.reason=x)})),o.status){case"fulfilled":return o.value;case"rejected":throw o.reason}}throw o}function g(o,x,A,D,Y){var L=typeof o;(L==="undefined"||L==="boolean")&&(o=null);var tl=!1;if(o===null)tl=!0;else switch(L){case"bigint":case"string":case"number":tl=!0;break;case"object":switch(o.$$typeof){case T:case ol:tl=!0;break;case I:return tl=o._init,g(tl(o._payload),x,A,D,Y)}}if(tl)return Y=Y(o),tl=D===""?"."+et(o,0):D,bt(Y)?(A="",tl!=null&&(A=tl.replace(Qt,"$&/")+"/"),g(Y,x,A,"",function(dl){return dl})):Y!=null&&(pt(Y)&&(Y=Gt(Y,A+(Y.key==null||o&&o.key===Y.key?"":(""+Y.key).replace(Qt,"$&/")+"/")+tl)),x.push(Y)),1;tl=0;var Al=D===""?".":D+":";if(bt(o))for(var Sl=0;Sl<o.length;Sl++)D=o[Sl],L=Al+et(D,Sl),tl+=g(D,x,A,L,Y);else if(Sl=kl(o),typeof Sl=="function")for(o=Sl.call(o),Sl=0;!(D=o.next()).done;)D=D.value,L=Al+et(D,Sl++),tl+=g(D,x,A,L,Y);else if(L==="object"){if(typeof o.then=="function")return g(Fl(o),x,A,D,Y);throw x=String(o),Error("Objects are not valid as a React child (found: "+(x==="[object Object]"?"object with keys {"+Object.keys(o).join(", ")+"}":x)+"). If you meant to render a collection of children, use an array instead.")}return tl}function O(o,x,A){if(o==null)return o;var D=[],Y=0;return g(o,D,"","",function(L){return x.call(A,L,Y++)}),D}function H(o){if(o._status===-1){var x=o._result;x=x(),x.then(function(A){(o._status===0||o._status===-1)&&(o._status=1,o._result=A)},function(A){(o._status===0||o._status===-1)&&(o._status=2,o._result=A)}),o._status===-1&&(o._status=0,o._result=x)}if(o._status===1)return o._result.default;throw o._result}var ll=typeof reportError=="function"?reportError:function(o){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var x=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof o=="object"&&o!==null&&typeof o.message=="string"?String(o.message):String(o),error:o});if(!window.dispatchEvent(x))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",o);return}console.error(o)},il={map:O,forEach:function(o,x,A){O(o,function(){x.apply(this,arguments)},A)},count:function(o){var x=0;return O(o,function(){x++}),x},toArray:function(o){return O(o,function(x){return x})||[]},only:function(o){if(!pt(o))throw Error("React.Children.only expected to receive a single React element child.");return o}};return G.Activity=j,G.Children=il,G.Component=$l,G.Fragment=q,G.Profiler=Q,G.PureComponent=Hl,G.StrictMode=r,G.Suspense=U,G.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=K,G.__COMPILER_RUNTIME={__proto__:null,c:function(o){return K.H.useMemoCache(o)}},G.cache=function(o){return function(){return o.apply(null,arguments)}},G.cacheSignal=function(){return null},G.cloneElement=function(o,x,A){if(o==null)throw Error("The argument must be a React element, but you passed "+o+".");var D=Gl({},o.props),Y=o.key;if(x!=null)for(L in x.key!==void 0&&(Y=""+x.key),x)!wl.call(x,L)||L==="key"||L==="__self"||L==="__source"||L==="ref"&&x.ref===void 0||(D[L]=x[L]);var L=arguments.length-2;if(L===1)D.children=A;else if(1<L){for(var tl=Array(L),Al=0;Al<L;Al++)tl[Al]=arguments[Al+2];D.children=tl}return ot(o.type,Y,D)},G.createContext=function(o){return o={$$typeof:zl,_currentValue:o,_currentValue2:o,_threadCount:0,Provider:null,Consumer:null},o.Provider=o,o.Consumer={$$typeof:$,_context:o},o},G.createElement=function(o,x,A){var D,Y={},L=null;if(x!=null)for(D in x.key!==void 0&&(L=""+x.key),x)wl.call(x,D)&&D!=="key"&&D!=="__self"&&D!=="__source"&&(Y[D]=x[D]);var tl=arguments.length-2;if(tl===1)Y.children=A;else if(1<tl){for(var Al=Array(tl),Sl=0;Sl<tl;Sl++)Al[Sl]=arguments[Sl+2];Y.children=Al}if(o&&o.defaultProps)for(D in tl=o.defaultProps,tl)Y[D]===void 0&&(Y[D]=tl[D]);return ot(o,L,Y)},G.createRef=function(){return{current:null}},G.forwardRef=function(o){return{$$typeof:gl,render:o}},G.isValidElement=pt,G.lazy=function(o){return{$$typeof:I,_payload:{_status:-1,_result:o},_init:H}},G.memo=function(o,x){return{$$typeof:z,type:o,compare:x===void 0?null:x}},G.startTransition=function(o){var x=K.T,A={};K.T=A;try{var D=o(),Y=K.S;Y!==null&&Y(A,D),typeof D=="object"&&D!==null&&typeof D.then=="function"&&D.then(Ql,ll)}catch(L){ll(L)}finally{x!==null&&A.types!==null&&(x.types=A.types),K.T=x}},G.unstable_useCacheRefresh=function(){return K.H.useCacheRefresh()},G.use=function(o){return K.H.use(o)},G.useActionState=function(o,x,A){return K.H.useActionState(o,x,A)},G.useCallback=function(o,x){return K.H.useCallback(o,x)},G.useContext=function(o){return K.H.useContext(o)},G.useDebugValue=function(){},G.useDeferredValue=function(o,x){return K.H.useDeferredValue(o,x)},G.useEffect=function(o,x){return K.H.useEffect(o,x)},G.useEffectEvent=function(o){return K.H.useEffectEvent(o)},G.useId=function(){return K.H.useId()},G.useImperativeHandle=function(o,x,A){return K.H.useImperativeHandle(o,x,A)},G.useInsertionEffect=function(o,x){return K.H.useInsertionEffect(o,x)},G.useLayoutEffect=function(o,x){return K.H.useLayoutEffect(o,x)},G.useMemo=function(o,x){return K.H.useMemo(o,x)},G.useOptimistic=function(o,x){return K.H.useOptimistic(o,x)},G.useReducer=function(o,x,A){return K.H.useReducer(o,x,A)},G.useRef=function(o){return K.H.useRef(o)},G.useState=function(o){return K.H.useState(o)},G.useSyncExternalStore=function(o,x,A){return K.H.useSyncExternalStore(o,x,A)},G.useTransition=function(){return K.H.useTransition()},G.version="19.2.4",G}var _0;function Af(){return _0||(_0=1,pf.exports=Pv()),pf.exports}var V=Af(),Ef={exports:{}},Hu={},xf={exports:{}},zf={};/**
- * @license React
- * scheduler.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var O0;function ly(){return O0||(O0=1,(function(T){function ol(g,O){var H=g.length;g.push(O);l:for(;0<H;){var ll=H-1>>>1,il=g[ll];if(0<Q(il,O))g[ll]=O,g[H]=il,H=ll;else break l}}function q(g){return g.length===0?null:g[0]}function r(g){if(g.length===0)return null;var O=g[0],H=g.pop();if(H!==O){g[0]=H;l:for(var ll=0,il=g.length,o=il>>>1;ll<o;){var x=2*(ll+1)-1,A=g[x],D=x+1,Y=g[D];if(0>Q(A,H))D<il&&0>Q(Y,A)?(g[ll]=Y,g[D]=H,ll=D):(g[ll]=A,g[x]=H,ll=x);else if(D<il&&0>Q(Y,H))g[ll]=Y,g[D]=H,ll=D;else break l}}return O}function Q(g,O){var H=g.sortIndex-O.sortIndex;return H!==0?H:g.id-O.id}if(T.unstable_now=void 0,typeof performance=="object"&&typeof performance.now=="function"){var $=performance;T.unstable_now=function(){return $.now()}}else{var zl=Date,gl=zl.now();T.unstable_now=function(){return zl.now()-gl}}var U=[],z=[],I=1,j=null,nl=3,kl=!1,Jl=!1,Gl=!1,Ut=!1,$l=typeof setTimeout=="function"?setTimeout:null,St=typeof clearTimeout=="function"?clearTimeout:null,Hl=typeof setImmediate<"u"?setImmediate:null;function tt(g){for(var O=q(z);O!==null;){if(O.callback===null)r(z);else if(O.startTime<=g)r(z),O.sortIndex=O.expirationTime,ol(U,O);else break;O=q(z)}}function bt(g){if(Gl=!1,tt(g),!Jl)if(q(U)!==null)Jl=!0,Ql||(Ql=!0,Tl());else{var O=q(z);O!==null&&Fl(bt,O.startTime-g)}}var Ql=!1,K=-1,wl=5,ot=-1;function Gt(){return Ut?!0:!(T.unstable_now()-ot<wl)}function pt(){if(Ut=!1,Ql){var g=T.unstable_now();ot=g;var O=!0;try{l:{Jl=!1,Gl&&(Gl=!1,St(K),K=-1),kl=!0;var H=nl;try{t:{for(tt(g),j=q(U);j!==null&&!(j.expirationTime>g&&Gt());){var ll=j.callback;if(typeof ll=="function"){j.callback=null,nl=j.priorityLevel;var il=ll(j.expirationTime<=g);if(g=T.unstable_now(),typeof il=="function"){j.callback=il,tt(g),O=!0;break t}j===q(U)&&r(U),tt(g)}else r(U);j=q(U)}if(j!==null)O=!0;else{var o=q(z);o!==null&&Fl(bt,o.startTime-g),O=!1}}break l}finally{j=null,nl=H,kl=!1}O=void 0}}finally{O?Tl():Ql=!1}}}var Tl;if(typeof Hl=="function")Tl=function(){Hl(pt)};else if(typeof MessageChannel<"u"){var Qt=new MessageChannel,et=Qt.port2;Qt.port1.onmessage=pt,Tl=function(){et.postMessage(null)}}else Tl=function(){$l(pt,0)};function Fl(g,O){K=$l(function(){g(T.unstable_now())},O)}T.unstable_IdlePriority=5,T.unstable_ImmediatePriority=1,T.unstable_LowPriority=4,T.unstable_NormalPriority=3,T.unstable_Profiling=null,T.unstable_UserBlockingPriority=2,T.unstable_cancelCallback=function(g){g.callback=null},T.unstable_forceFrameRate=function(g){0>g||125<g?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):wl=0<g?Math.floor(1e3/g):5},T.unstable_getCurrentPriorityLevel=function(){return nl},T.unstable_next=function(g){switch(nl){case 1:case 2:case 3:var O=3;break;default:O=nl}var H=nl;nl=O;try{return g()}finally{nl=H}},T.unstable_requestPaint=function(){Ut=!0},T.unstable_runWithPriority=function(g,O){switch(g){case 1:case 2:case 3:case 4:case 5:break;default:g=3}var H=nl;nl=g;try{return O()}finally{nl=H}},T.unstable_scheduleCallback=function(g,O,H){var ll=T.unstable_now();switch(typeof H=="object"&&H!==null?(H=H.delay,H=typeof H=="number"&&0<H?ll+H:ll):H=ll,g){case 1:var il=-1;break;case 2:il=250;break;case 5:il=1073741823;break;case 4:il=1e4;break;default:il=5e3}return il=H+il,g={id:I++,callback:O,priorityLevel:g,startTime:H,expirationTime:il,sortIndex:-1},H>ll?(g.sortIndex=H,ol(z,g),q(U)===null&&g===q(z)&&(Gl?(St(K),K=-1):Gl=!0,Fl(bt,H-ll))):(g.sortIndex=il,ol(U,g),Jl||kl||(Jl=!0,Ql||(Ql=!0,Tl()))),g},T.unstable_shouldYield=Gt,T.unstable_wrapCallback=function(g){var O=nl;return function(){var H=nl;nl=O;try{return g.apply(this,arguments)}finally{nl=H}}}})(zf)),zf}var N0;function ty(){return N0||(N0=1,xf.exports=ly()),xf.exports}var Tf={exports:{}},Wl={};/**
- * @license React
- * react-dom.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var D0;function ey(){if(D0)return Wl;D0=1;var T=Af();function ol(U){var z="https://react.dev/errors/"+U;if(1<arguments.length){z+="?args[]="+encodeURIComponent(arguments[1]);for(var I=2;I<arguments.length;I++)z+="&args[]="+encodeURIComponent(arguments[I])}return"Minified React error #"+U+"; visit "+z+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function q(){}var r={d:{f:q,r:function(){throw Error(ol(522))},D:q,C:q,L:q,m:q,X:q,S:q,M:q},p:0,findDOMNode:null},Q=Symbol.for("react.portal");function $(U,z,I){var j=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:Q,key:j==null?null:""+j,children:U,containerInfo:z,implementation:I}}var zl=T.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function gl(U,z){if(U==="font")return"";if(typeof z=="string")return z==="use-credentials"?z:""}return Wl.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=r,Wl.createPortal=function(U,z){var I=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!z||z.nodeType!==1&&z.nodeType!==9&&z.nodeType!==11)throw Error(ol(299));return $(U,z,null,I)},Wl.flushSync=function(U){var z=zl.T,I=r.p;try{if(zl.T=null,r.p=2,U)return U()}finally{zl.T=z,r.p=I,r.d.f()}},Wl.preconnect=function(U,z){typeof U=="string"&&(z?(z=z.crossOrigin,z=typeof z=="string"?z==="use-credentials"?z:"":void 0):z=null,r.d.C(U,z))},Wl.prefetchDNS=function(U){typeof U=="string"&&r.d.D(U)},Wl.preinit=function(U,z){if(typeof U=="string"&&z&&typeof z.as=="string"){var I=z.as,j=gl(I,z.crossOrigin),nl=typeof z.integrity=="string"?z.integrity:void 0,kl=typeof z.fetchPriority=="string"?z.fetchPriority:void 0;I==="style"?r.d.S(U,typeof z.precedence=="string"?z.precedence:void 0,{crossOrigin:j,integrity:nl,fetchPriority:kl}):I==="script"&&r.d.X(U,{crossOrigin:j,integrity:nl,fetchPriority:kl,nonce:typeof z.nonce=="string"?z.nonce:void 0})}},Wl.preinitModule=function(U,z){if(typeof U=="string")if(typeof z=="object"&&z!==null){if(z.as==null||z.as==="script"){var I=gl(z.as,z.crossOrigin);r.d.M(U,{crossOrigin:I,integrity:typeof z.integrity=="string"?z.integrity:void 0,nonce:typeof z.nonce=="string"?z.nonce:void 0})}}else z==null&&r.d.M(U)},Wl.preload=function(U,z){if(typeof U=="string"&&typeof z=="object"&&z!==null&&typeof z.as=="string"){var I=z.as,j=gl(I,z.crossOrigin);r.d.L(U,I,{crossOrigin:j,integrity:typeof z.integrity=="string"?z.integrity:void 0,nonce:typeof z.nonce=="string"?z.nonce:void 0,type:typeof z.type=="string"?z.type:void 0,fetchPriority:typeof z.fetchPriority=="string"?z.fetchPriority:void 0,referrerPolicy:typeof z.referrerPolicy=="string"?z.referrerPolicy:void 0,imageSrcSet:typeof z.imageSrcSet=="string"?z.imageSrcSet:void 0,imageSizes:typeof z.imageSizes=="string"?z.imageSizes:void 0,media:typeof z.media=="string"?z.media:void 0})}},Wl.preloadModule=function(U,z){if(typeof U=="string")if(z){var I=gl(z.as,z.crossOrigin);r.d.m(U,{as:typeof z.as=="string"&&z.as!=="script"?z.as:void 0,crossOrigin:I,integrity:typeof z.integrity=="string"?z.integrity:void 0})}else r.d.m(U)},Wl.requestFormReset=function(U){r.d.r(U)},Wl.unstable_batchedUpdates=function(U,z){return U(z)},Wl.useFormState=function(U,z,I){return zl.H.useFormState(U,z,I)},Wl.useFormStatus=function(){return zl.H.useHostTransitionStatus()},Wl.version="19.2.4",Wl}var M0;function ay(){if(M0)return Tf.exports;M0=1;function T(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(T)}catch(ol){console.error(ol)}}return T(),Tf.exports=ey(),Tf.exports}/**
- * @license React
- * react-dom-client.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var U0;function uy(){if(U0)return Hu;U0=1;var T=ty(),ol=Af(),q=ay();function r(l){var t="https://react.dev/errors/"+l;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var e=2;e<arguments.length;e++)t+="&args[]="+encodeURIComponent(arguments[e])}return"Minified React error #"+l+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function Q(l){return!(!l||l.nodeType!==1&&l.nodeType!==9&&l.nodeType!==11)}function $(l){var t=l,e=l;if(l.alternate)for(;t.return;)t=t.return;else{l=t;do t=l,(t.flags&4098)!==0&&(e=t.return),l=t.return;while(l)}return t.tag===3?e:null}function zl(l){if(l.tag===13){var t=l.memoizedState;if(t===null&&(l=l.alternate,l!==null&&(t=l.memoizedState)),t!==null)return t.dehydrated}return null}function gl(l){if(l.tag===31){var t=l.memoizedState;if(t===null&&(l=l.alternate,l!==null&&(t=l.memoizedState)),t!==null)return t.dehydrated}return null}function U(l){if($(l)!==l)throw Error(r(188))}function z(l){var t=l.alternate;if(!t){if(t=$(l),t===null)throw Error(r(188));return t!==l?null:l}for(var e=l,a=t;;){var u=e.return;if(u===null)break;var n=u.alternate;if(n===null){if(a=u.return,a!==null){e=a;continue}break}if(u.child===n.child){for(n=u.child;n;){if(n===e)return U(u),l;if(n===a)return U(u),t;n=n.sibling}throw Error(r(188))}if(e.return!==a.return)e=u,a=n;else{for(var i=!1,c=u.child;c;){if(c===e){i=!0,e=u,a=n;break}if(c===a){i=!0,a=u,e=n;break}c=c.sibling}if(!i){for(c=n.child;c;){if(c===e){i=!0,e=n,a=u;break}if(c===a){i=!0,a=n,e=u;break}c=c.sibling}if(!i)throw Error(r(189))}}if(e.alternate!==a)throw Error(r(190))}if(e.tag!==3)throw Error(r(188));return e.stateNode.current===e?l:t}function I(l){var t=l.tag;if(t===5||t===26||t===27||t===6)return l;for(l=l.child;l!==null;){if(t=I(l),t!==null)return t;l=l.sibling}return null}var j=Object.assign,nl=Symbol.for("react.element"),kl=Symbol.for("react.transitional.element"),Jl=Symbol.for("react.portal"),Gl=Symbol.for("react.fragment"),Ut=Symbol.for("react.strict_mode"),$l=Symbol.for("react.profiler"),St=Symbol.for("react.consumer"),Hl=Symbol.for("react.context"),tt=Symbol.for("react.forward_ref"),bt=Symbol.for("react.suspense"),Ql=Symbol.for("react.suspense_list"),K=Symbol.for("react.memo"),wl=Symbol.for("react.lazy"),ot=Symbol.for("react.activity"),Gt=Symbol.for("react.memo_cache_sentinel"),pt=Symbol.iterator;function Tl(l){return l===null||typeof l!="object"?null:(l=pt&&l[pt]||l["@@iterator"],typeof l=="function"?l:null)}var Qt=Symbol.for("react.client.reference");function et(l){if(l==null)return null;if(typeof l=="function")return l.$$typeof===Qt?null:l.displayName||l.name||null;if(typeof l=="string")return l;switch(l){case Gl:return"Fragment";case $l:return"Profiler";case Ut:return"StrictMode";case bt:return"Suspense";case Ql:return"SuspenseList";case ot:return"Activity"}if(typeof l=="object")switch(l.$$typeof){case Jl:return"Portal";case Hl:return l.displayName||"Context";case St:return(l._context.displayName||"Context")+".Consumer";case tt:var t=l.render;return l=l.displayName,l||(l=t.displayName||t.name||"",l=l!==""?"ForwardRef("+l+")":"ForwardRef"),l;case K:return t=l.displayName||null,t!==null?t:et(l.type)||"Memo";case wl:t=l._payload,l=l._init;try{return et(l(t))}catch{}}return null}var Fl=Array.isArray,g=ol.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,O=q.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,H={pending:!1,data:null,method:null,action:null},ll=[],il=-1;function o(l){return{current:l}}function x(l){0>il||(l.current=ll[il],ll[il]=null,il--)}function A(l,t){il++,ll[il]=l.current,l.current=t}var D=o(null),Y=o(null),L=o(null),tl=o(null);function Al(l,t){switch(A(L,t),A(Y,l),A(D,null),t.nodeType){case 9:case 11:l=(l=t.documentElement)&&(l=l.namespaceURI)?Jd(l):0;break;default:if(l=t.tagName,t=t.namespaceURI)t=Jd(t),l=wd(t,l);else switch(l){case"svg":l=1;break;case"math":l=2;break;default:l=0}}x(D),A(D,l)}function Sl(){x(D),x(Y),x(L)}function dl(l){l.memoizedState!==null&&A(tl,l);var t=D.current,e=wd(t,l.type);t!==e&&(A(Y,l),A(D,e))}function ke(l){Y.current===l&&(x(D),x(Y)),tl.current===l&&(x(tl),Mu._currentValue=H)}var qa,Bu;function Xt(l){if(qa===void 0)try{throw Error()}catch(e){var t=e.stack.trim().match(/\n( *(at )?)/);qa=t&&t[1]||"",Bu=-1<e.stack.indexOf(`
-    at`)?" (<anonymous>)":-1<e.stack.indexOf("@")?"@unknown:0:0":""}return`
-`+qa+l+Bu}var Ya=!1;function Ga(l,t){if(!l||Ya)return"";Ya=!0;var e=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var a={DetermineComponentFrameRoot:function(){try{if(t){var E=function(){throw Error()};if(Object.defineProperty(E.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(E,[])}catch(h){var y=h}Reflect.construct(l,[],E)}else{try{E.call()}catch(h){y=h}l.call(E.prototype)}}else{try{throw Error()}catch(h){y=h}(E=l())&&typeof E.catch=="function"&&E.catch(function(){})}}catch(h){if(h&&y&&typeof h.stack=="string")return[h.stack,y.stack]}return[null,null]}};a.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var u=Object.getOwnPropertyDescriptor(a.DetermineComponentFrameRoot,"name");u&&u.configurable&&Object.defineProperty(a.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var n=a.DetermineComponentFrameRoot(),i=n[0],c=n[1];if(i&&c){var f=i.split(`
-`),v=c.split(`
-`);for(u=a=0;a<f.length&&!f[a].includes("DetermineComponentFrameRoot");)a++;for(;u<v.length&&!v[u].includes("DetermineComponentFrameRoot");)u++;if(a===f.length||u===v.length)for(a=f.length-1,u=v.length-1;1<=a&&0<=u&&f[a]!==v[u];)u--;for(;1<=a&&0<=u;a--,u--)if(f[a]!==v[u]){if(a!==1||u!==1)do if(a--,u--,0>u||f[a]!==v[u]){var S=`
-`+f[a].replace(" at new "," at ");return l.displayName&&S.includes("<anonymous>")&&(S=S.replace("<anonymous>",l.displayName)),S}while(1<=a&&0<=u);break}}}finally{Ya=!1,Error.prepareStackTrace=e}return(e=l?l.displayName||l.name:"")?Xt(e):""}function qu(l,t){switch(l.tag){case 26:case 27:case 5:return Xt(l.type);case 16:return Xt("Lazy");case 13:return l.child!==t&&t!==null?Xt("Suspense Fallback"):Xt("Suspense");case 19:return Xt("SuspenseList");case 0:case 15:return Ga(l.type,!1);case 11:return Ga(l.type.render,!1);case 1:return Ga(l.type,!0);case 31:return Xt("Activity");default:return""}}function Yu(l){try{var t="",e=null;do t+=qu(l,e),e=l,l=l.return;while(l);return t}catch(a){return`
-Error generating stack: `+a.message+`
-`+a.stack}}var Qa=Object.prototype.hasOwnProperty,Xa=T.unstable_scheduleCallback,Za=T.unstable_cancelCallback,ui=T.unstable_shouldYield,Gu=T.unstable_requestPaint,Il=T.unstable_now,ni=T.unstable_getCurrentPriorityLevel,$e=T.unstable_ImmediatePriority,Fe=T.unstable_UserBlockingPriority,ie=T.unstable_NormalPriority,_=T.unstable_LowPriority,C=T.unstable_IdlePriority,rl=T.log,P=T.unstable_setDisableYieldValue,bl=null,cl=null;function Ml(l){if(typeof rl=="function"&&P(l),cl&&typeof cl.setStrictMode=="function")try{cl.setStrictMode(bl,l)}catch{}}var Pl=Math.clz32?Math.clz32:q0,Ie=Math.log,B0=Math.LN2;function q0(l){return l>>>=0,l===0?32:31-(Ie(l)/B0|0)|0}var Qu=256,Xu=262144,Zu=4194304;function Ue(l){var t=l&42;if(t!==0)return t;switch(l&-l){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:return l&261888;case 262144:case 524288:case 1048576:case 2097152:return l&3932160;case 4194304:case 8388608:case 16777216:case 33554432:return l&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return l}}function Lu(l,t,e){var a=l.pendingLanes;if(a===0)return 0;var u=0,n=l.suspendedLanes,i=l.pingedLanes;l=l.warmLanes;var c=a&134217727;return c!==0?(a=c&~n,a!==0?u=Ue(a):(i&=c,i!==0?u=Ue(i):e||(e=c&~l,e!==0&&(u=Ue(e))))):(c=a&~n,c!==0?u=Ue(c):i!==0?u=Ue(i):e||(e=a&~l,e!==0&&(u=Ue(e)))),u===0?0:t!==0&&t!==u&&(t&n)===0&&(n=u&-u,e=t&-t,n>=e||n===32&&(e&4194048)!==0)?t:u}function La(l,t){return(l.pendingLanes&~(l.suspendedLanes&~l.pingedLanes)&t)===0}function Y0(l,t){switch(l){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function _f(){var l=Zu;return Zu<<=1,(Zu&62914560)===0&&(Zu=4194304),l}function ii(l){for(var t=[],e=0;31>e;e++)t.push(l);return t}function Va(l,t){l.pendingLanes|=t,t!==268435456&&(l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0)}function G0(l,t,e,a,u,n){var i=l.pendingLanes;l.pendingLanes=e,l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0,l.expiredLanes&=e,l.entangledLanes&=e,l.errorRecoveryDisabledLanes&=e,l.shellSuspendCounter=0;var c=l.entanglements,f=l.expirationTimes,v=l.hiddenUpdates;for(e=i&~e;0<e;){var S=31-Pl(e),E=1<<S;c[S]=0,f[S]=-1;var y=v[S];if(y!==null)for(v[S]=null,S=0;S<y.length;S++){var h=y[S];h!==null&&(h.lane&=-536870913)}e&=~E}a!==0&&Of(l,a,0),n!==0&&u===0&&l.tag!==0&&(l.suspendedLanes|=n&~(i&~t))}function Of(l,t,e){l.pendingLanes|=t,l.suspendedLanes&=~t;var a=31-Pl(t);l.entangledLanes|=t,l.entanglements[a]=l.entanglements[a]|1073741824|e&261930}function Nf(l,t){var e=l.entangledLanes|=t;for(l=l.entanglements;e;){var a=31-Pl(e),u=1<<a;u&t|l[a]&t&&(l[a]|=t),e&=~u}}function Df(l,t){var e=t&-t;return e=(e&42)!==0?1:ci(e),(e&(l.suspendedLanes|t))!==0?0:e}function ci(l){switch(l){case 2:l=1;break;case 8:l=4;break;case 32:l=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:l=128;break;case 268435456:l=134217728;break;default:l=0}return l}function fi(l){return l&=-l,2<l?8<l?(l&134217727)!==0?32:268435456:8:2}function Mf(){var l=O.p;return l!==0?l:(l=window.event,l===void 0?32:h0(l.type))}function Uf(l,t){var e=O.p;try{return O.p=l,t()}finally{O.p=e}}var ce=Math.random().toString(36).slice(2),Xl="__reactFiber$"+ce,at="__reactProps$"+ce,Pe="__reactContainer$"+ce,si="__reactEvents$"+ce,Q0="__reactListeners$"+ce,X0="__reactHandles$"+ce,Cf="__reactResources$"+ce,Ka="__reactMarker$"+ce;function oi(l){delete l[Xl],delete l[at],delete l[si],delete l[Q0],delete l[X0]}function la(l){var t=l[Xl];if(t)return t;for(var e=l.parentNode;e;){if(t=e[Pe]||e[Xl]){if(e=t.alternate,t.child!==null||e!==null&&e.child!==null)for(l=l0(l);l!==null;){if(e=l[Xl])return e;l=l0(l)}return t}l=e,e=l.parentNode}return null}function ta(l){if(l=l[Xl]||l[Pe]){var t=l.tag;if(t===5||t===6||t===13||t===31||t===26||t===27||t===3)return l}return null}function Ja(l){var t=l.tag;if(t===5||t===26||t===27||t===6)return l.stateNode;throw Error(r(33))}function ea(l){var t=l[Cf];return t||(t=l[Cf]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function ql(l){l[Ka]=!0}var jf=new Set,Rf={};function Ce(l,t){aa(l,t),aa(l+"Capture",t)}function aa(l,t){for(Rf[l]=t,l=0;l<t.length;l++)jf.add(t[l])}var Z0=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),Hf={},Bf={};function L0(l){return Qa.call(Bf,l)?!0:Qa.call(Hf,l)?!1:Z0.test(l)?Bf[l]=!0:(Hf[l]=!0,!1)}function Vu(l,t,e){if(L0(t))if(e===null)l.removeAttribute(t);else{switch(typeof e){case"undefined":case"function":case"symbol":l.removeAttribute(t);return;case"boolean":var a=t.toLowerCase().slice(0,5);if(a!=="data-"&&a!=="aria-"){l.removeAttribute(t);return}}l.setAttribute(t,""+e)}}function Ku(l,t,e){if(e===null)l.removeAttribute(t);else{switch(typeof e){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(t);return}l.setAttribute(t,""+e)}}function Zt(l,t,e,a){if(a===null)l.removeAttribute(e);else{switch(typeof a){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(e);return}l.setAttributeNS(t,e,""+a)}}function Et(l){switch(typeof l){case"bigint":case"boolean":case"number":case"string":case"undefined":return l;case"object":return l;default:return""}}function qf(l){var t=l.type;return(l=l.nodeName)&&l.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function V0(l,t,e){var a=Object.getOwnPropertyDescriptor(l.constructor.prototype,t);if(!l.hasOwnProperty(t)&&typeof a<"u"&&typeof a.get=="function"&&typeof a.set=="function"){var u=a.get,n=a.set;return Object.defineProperty(l,t,{configurable:!0,get:function(){return u.call(this)},set:function(i){e=""+i,n.call(this,i)}}),Object.defineProperty(l,t,{enumerable:a.enumerable}),{getValue:function(){return e},setValue:function(i){e=""+i},stopTracking:function(){l._valueTracker=null,delete l[t]}}}}function di(l){if(!l._valueTracker){var t=qf(l)?"checked":"value";l._valueTracker=V0(l,t,""+l[t])}}function Yf(l){if(!l)return!1;var t=l._valueTracker;if(!t)return!0;var e=t.getValue(),a="";return l&&(a=qf(l)?l.checked?"true":"false":l.value),l=a,l!==e?(t.setValue(l),!0):!1}function Ju(l){if(l=l||(typeof document<"u"?document:void 0),typeof l>"u")return null;try{return l.activeElement||l.body}catch{return l.body}}var K0=/[\n"\\]/g;function xt(l){return l.replace(K0,function(t){return"\\"+t.charCodeAt(0).toString(16)+" "})}function mi(l,t,e,a,u,n,i,c){l.name="",i!=null&&typeof i!="function"&&typeof i!="symbol"&&typeof i!="boolean"?l.type=i:l.removeAttribute("type"),t!=null?i==="number"?(t===0&&l.value===""||l.value!=t)&&(l.value=""+Et(t)):l.value!==""+Et(t)&&(l.value=""+Et(t)):i!=="submit"&&i!=="reset"||l.removeAttribute("value"),t!=null?vi(l,i,Et(t)):e!=null?vi(l,i,Et(e)):a!=null&&l.removeAttribute("value"),u==null&&n!=null&&(l.defaultChecked=!!n),u!=null&&(l.checked=u&&typeof u!="function"&&typeof u!="symbol"),c!=null&&typeof c!="function"&&typeof c!="symbol"&&typeof c!="boolean"?l.name=""+Et(c):l.removeAttribute("name")}function Gf(l,t,e,a,u,n,i,c){if(n!=null&&typeof n!="function"&&typeof n!="symbol"&&typeof n!="boolean"&&(l.type=n),t!=null||e!=null){if(!(n!=="submit"&&n!=="reset"||t!=null)){di(l);return}e=e!=null?""+Et(e):"",t=t!=null?""+Et(t):e,c||t===l.value||(l.value=t),l.defaultValue=t}a=a??u,a=typeof a!="function"&&typeof a!="symbol"&&!!a,l.checked=c?l.checked:!!a,l.defaultChecked=!!a,i!=null&&typeof i!="function"&&typeof i!="symbol"&&typeof i!="boolean"&&(l.name=i),di(l)}function vi(l,t,e){t==="number"&&Ju(l.ownerDocument)===l||l.defaultValue===""+e||(l.defaultValue=""+e)}function ua(l,t,e,a){if(l=l.options,t){t={};for(var u=0;u<e.length;u++)t["$"+e[u]]=!0;for(e=0;e<l.length;e++)u=t.hasOwnProperty("$"+l[e].value),l[e].selected!==u&&(l[e].selected=u),u&&a&&(l[e].defaultSelected=!0)}else{for(e=""+Et(e),t=null,u=0;u<l.length;u++){if(l[u].value===e){l[u].selected=!0,a&&(l[u].defaultSelected=!0);return}t!==null||l[u].disabled||(t=l[u])}t!==null&&(t.selected=!0)}}function Qf(l,t,e){if(t!=null&&(t=""+Et(t),t!==l.value&&(l.value=t),e==null)){l.defaultValue!==t&&(l.defaultValue=t);return}l.defaultValue=e!=null?""+Et(e):""}function Xf(l,t,e,a){if(t==null){if(a!=null){if(e!=null)throw Error(r(92));if(Fl(a)){if(1<a.length)throw Error(r(93));a=a[0]}e=a}e==null&&(e=""),t=e}e=Et(t),l.defaultValue=e,a=l.textContent,a===e&&a!==""&&a!==null&&(l.value=a),di(l)}function na(l,t){if(t){var e=l.firstChild;if(e&&e===l.lastChild&&e.nodeType===3){e.nodeValue=t;return}}l.textContent=t}var J0=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function Zf(l,t,e){var a=t.indexOf("--")===0;e==null||typeof e=="boolean"||e===""?a?l.setProperty(t,""):t==="float"?l.cssFloat="":l[t]="":a?l.setProperty(t,e):typeof e!="number"||e===0||J0.has(t)?t==="float"?l.cssFloat=e:l[t]=(""+e).trim():l[t]=e+"px"}function Lf(l,t,e){if(t!=null&&typeof t!="object")throw Error(r(62));if(l=l.style,e!=null){for(var a in e)!e.hasOwnProperty(a)||t!=null&&t.hasOwnProperty(a)||(a.indexOf("--")===0?l.setProperty(a,""):a==="float"?l.cssFloat="":l[a]="");for(var u in t)a=t[u],t.hasOwnProperty(u)&&e[u]!==a&&Zf(l,u,a)}else for(var n in t)t.hasOwnProperty(n)&&Zf(l,n,t[n])}function yi(l){if(l.indexOf("-")===-1)return!1;switch(l){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var w0=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),W0=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function wu(l){return W0.test(""+l)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":l}function Lt(){}var ri=null;function hi(l){return l=l.target||l.srcElement||window,l.correspondingUseElement&&(l=l.correspondingUseElement),l.nodeType===3?l.parentNode:l}var ia=null,ca=null;function Vf(l){var t=ta(l);if(t&&(l=t.stateNode)){var e=l[at]||null;l:switch(l=t.stateNode,t.type){case"input":if(mi(l,e.value,e.defaultValue,e.defaultValue,e.checked,e.defaultChecked,e.type,e.name),t=e.name,e.type==="radio"&&t!=null){for(e=l;e.parentNode;)e=e.parentNode;for(e=e.querySelectorAll('input[name="'+xt(""+t)+'"][type="radio"]'),t=0;t<e.length;t++){var a=e[t];if(a!==l&&a.form===l.form){var u=a[at]||null;if(!u)throw Error(r(90));mi(a,u.value,u.defaultValue,u.defaultValue,u.checked,u.defaultChecked,u.type,u.name)}}for(t=0;t<e.length;t++)a=e[t],a.form===l.form&&Yf(a)}break l;case"textarea":Qf(l,e.value,e.defaultValue);break l;case"select":t=e.value,t!=null&&ua(l,!!e.multiple,t,!1)}}}var gi=!1;function Kf(l,t,e){if(gi)return l(t,e);gi=!0;try{var a=l(t);return a}finally{if(gi=!1,(ia!==null||ca!==null)&&(Hn(),ia&&(t=ia,l=ca,ca=ia=null,Vf(t),l)))for(t=0;t<l.length;t++)Vf(l[t])}}function wa(l,t){var e=l.stateNode;if(e===null)return null;var a=e[at]||null;if(a===null)return null;e=a[t];l:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(a=!a.disabled)||(l=l.type,a=!(l==="button"||l==="input"||l==="select"||l==="textarea")),l=!a;break l;default:l=!1}if(l)return null;if(e&&typeof e!="function")throw Error(r(231,t,typeof e));return e}var Vt=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),Si=!1;if(Vt)try{var Wa={};Object.defineProperty(Wa,"passive",{get:function(){Si=!0}}),window.addEventListener("test",Wa,Wa),window.removeEventListener("test",Wa,Wa)}catch{Si=!1}var fe=null,bi=null,Wu=null;function Jf(){if(Wu)return Wu;var l,t=bi,e=t.length,a,u="value"in fe?fe.value:fe.textContent,n=u.length;for(l=0;l<e&&t[l]===u[l];l++);var i=e-l;for(a=1;a<=i&&t[e-a]===u[n-a];a++);return Wu=u.slice(l,1<a?1-a:void 0)}function ku(l){var t=l.keyCode;return"charCode"in l?(l=l.charCode,l===0&&t===13&&(l=13)):l=t,l===10&&(l=13),32<=l||l===13?l:0}function $u(){return!0}function wf(){return!1}function ut(l){function t(e,a,u,n,i){this._reactName=e,this._targetInst=u,this.type=a,this.nativeEvent=n,this.target=i,this.currentTarget=null;for(var c in l)l.hasOwnProperty(c)&&(e=l[c],this[c]=e?e(n):n[c]);return this.isDefaultPrevented=(n.defaultPrevented!=null?n.defaultPrevented:n.returnValue===!1)?$u:wf,this.isPropagationStopped=wf,this}return j(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():typeof e.returnValue!="unknown"&&(e.returnValue=!1),this.isDefaultPrevented=$u)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():typeof e.cancelBubble!="unknown"&&(e.cancelBubble=!0),this.isPropagationStopped=$u)},persist:function(){},isPersistent:$u}),t}var je={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(l){return l.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Fu=ut(je),ka=j({},je,{view:0,detail:0}),k0=ut(ka),pi,Ei,$a,Iu=j({},ka,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:zi,button:0,buttons:0,relatedTarget:function(l){return l.relatedTarget===void 0?l.fromElement===l.srcElement?l.toElement:l.fromElement:l.relatedTarget},movementX:function(l){return"movementX"in l?l.movementX:(l!==$a&&($a&&l.type==="mousemove"?(pi=l.screenX-$a.screenX,Ei=l.screenY-$a.screenY):Ei=pi=0,$a=l),pi)},movementY:function(l){return"movementY"in l?l.movementY:Ei}}),Wf=ut(Iu),$0=j({},Iu,{dataTransfer:0}),F0=ut($0),I0=j({},ka,{relatedTarget:0}),xi=ut(I0),P0=j({},je,{animationName:0,elapsedTime:0,pseudoElement:0}),lm=ut(P0),tm=j({},je,{clipboardData:function(l){return"clipboardData"in l?l.clipboardData:window.clipboardData}}),em=ut(tm),am=j({},je,{data:0}),kf=ut(am),um={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},nm={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},im={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function cm(l){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(l):(l=im[l])?!!t[l]:!1}function zi(){return cm}var fm=j({},ka,{key:function(l){if(l.key){var t=um[l.key]||l.key;if(t!=="Unidentified")return t}return l.type==="keypress"?(l=ku(l),l===13?"Enter":String.fromCharCode(l)):l.type==="keydown"||l.type==="keyup"?nm[l.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:zi,charCode:function(l){return l.type==="keypress"?ku(l):0},keyCode:function(l){return l.type==="keydown"||l.type==="keyup"?l.keyCode:0},which:function(l){return l.type==="keypress"?ku(l):l.type==="keydown"||l.type==="keyup"?l.keyCode:0}}),sm=ut(fm),om=j({},Iu,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),$f=ut(om),dm=j({},ka,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:zi}),mm=ut(dm),vm=j({},je,{propertyName:0,elapsedTime:0,pseudoElement:0}),ym=ut(vm),rm=j({},Iu,{deltaX:function(l){return"deltaX"in l?l.deltaX:"wheelDeltaX"in l?-l.wheelDeltaX:0},deltaY:function(l){return"deltaY"in l?l.deltaY:"wheelDeltaY"in l?-l.wheelDeltaY:"wheelDelta"in l?-l.wheelDelta:0},deltaZ:0,deltaMode:0}),hm=ut(rm),gm=j({},je,{newState:0,oldState:0}),Sm=ut(gm),bm=[9,13,27,32],Ti=Vt&&"CompositionEvent"in window,Fa=null;Vt&&"documentMode"in document&&(Fa=document.documentMode);var pm=Vt&&"TextEvent"in window&&!Fa,Ff=Vt&&(!Ti||Fa&&8<Fa&&11>=Fa),If=" ",Pf=!1;function ls(l,t){switch(l){case"keyup":return bm.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function ts(l){return l=l.detail,typeof l=="object"&&"data"in l?l.data:null}var fa=!1;function Em(l,t){switch(l){case"compositionend":return ts(t);case"keypress":return t.which!==32?null:(Pf=!0,If);case"textInput":return l=t.data,l===If&&Pf?null:l;default:return null}}function xm(l,t){if(fa)return l==="compositionend"||!Ti&&ls(l,t)?(l=Jf(),Wu=bi=fe=null,fa=!1,l):null;switch(l){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Ff&&t.locale!=="ko"?null:t.data;default:return null}}var zm={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function es(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t==="input"?!!zm[l.type]:t==="textarea"}function as(l,t,e,a){ia?ca?ca.push(a):ca=[a]:ia=a,t=Zn(t,"onChange"),0<t.length&&(e=new Fu("onChange","change",null,e,a),l.push({event:e,listeners:t}))}var Ia=null,Pa=null;function Tm(l){Qd(l,0)}function Pu(l){var t=Ja(l);if(Yf(t))return l}function us(l,t){if(l==="change")return t}var ns=!1;if(Vt){var Ai;if(Vt){var _i="oninput"in document;if(!_i){var is=document.createElement("div");is.setAttribute("oninput","return;"),_i=typeof is.oninput=="function"}Ai=_i}else Ai=!1;ns=Ai&&(!document.documentMode||9<document.documentMode)}function cs(){Ia&&(Ia.detachEvent("onpropertychange",fs),Pa=Ia=null)}function fs(l){if(l.propertyName==="value"&&Pu(Pa)){var t=[];as(t,Pa,l,hi(l)),Kf(Tm,t)}}function Am(l,t,e){l==="focusin"?(cs(),Ia=t,Pa=e,Ia.attachEvent("onpropertychange",fs)):l==="focusout"&&cs()}function _m(l){if(l==="selectionchange"||l==="keyup"||l==="keydown")return Pu(Pa)}function Om(l,t){if(l==="click")return Pu(t)}function Nm(l,t){if(l==="input"||l==="change")return Pu(t)}function Dm(l,t){return l===t&&(l!==0||1/l===1/t)||l!==l&&t!==t}var dt=typeof Object.is=="function"?Object.is:Dm;function lu(l,t){if(dt(l,t))return!0;if(typeof l!="object"||l===null||typeof t!="object"||t===null)return!1;var e=Object.keys(l),a=Object.keys(t);if(e.length!==a.length)return!1;for(a=0;a<e.length;a++){var u=e[a];if(!Qa.call(t,u)||!dt(l[u],t[u]))return!1}return!0}function ss(l){for(;l&&l.firstChild;)l=l.firstChild;return l}function os(l,t){var e=ss(l);l=0;for(var a;e;){if(e.nodeType===3){if(a=l+e.textContent.length,l<=t&&a>=t)return{node:e,offset:t-l};l=a}l:{for(;e;){if(e.nextSibling){e=e.nextSibling;break l}e=e.parentNode}e=void 0}e=ss(e)}}function ds(l,t){return l&&t?l===t?!0:l&&l.nodeType===3?!1:t&&t.nodeType===3?ds(l,t.parentNode):"contains"in l?l.contains(t):l.compareDocumentPosition?!!(l.compareDocumentPosition(t)&16):!1:!1}function ms(l){l=l!=null&&l.ownerDocument!=null&&l.ownerDocument.defaultView!=null?l.ownerDocument.defaultView:window;for(var t=Ju(l.document);t instanceof l.HTMLIFrameElement;){try{var e=typeof t.contentWindow.location.href=="string"}catch{e=!1}if(e)l=t.contentWindow;else break;t=Ju(l.document)}return t}function Oi(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t&&(t==="input"&&(l.type==="text"||l.type==="search"||l.type==="tel"||l.type==="url"||l.type==="password")||t==="textarea"||l.contentEditable==="true")}var Mm=Vt&&"documentMode"in document&&11>=document.documentMode,sa=null,Ni=null,tu=null,Di=!1;function vs(l,t,e){var a=e.window===e?e.document:e.nodeType===9?e:e.ownerDocument;Di||sa==null||sa!==Ju(a)||(a=sa,"selectionStart"in a&&Oi(a)?a={start:a.selectionStart,end:a.selectionEnd}:(a=(a.ownerDocument&&a.ownerDocument.defaultView||window).getSelection(),a={anchorNode:a.anchorNode,anchorOffset:a.anchorOffset,focusNode:a.focusNode,focusOffset:a.focusOffset}),tu&&lu(tu,a)||(tu=a,a=Zn(Ni,"onSelect"),0<a.length&&(t=new Fu("onSelect","select",null,t,e),l.push({event:t,listeners:a}),t.target=sa)))}function Re(l,t){var e={};return e[l.toLowerCase()]=t.toLowerCase(),e["Webkit"+l]="webkit"+t,e["Moz"+l]="moz"+t,e}var oa={animationend:Re("Animation","AnimationEnd"),animationiteration:Re("Animation","AnimationIteration"),animationstart:Re("Animation","AnimationStart"),transitionrun:Re("Transition","TransitionRun"),transitionstart:Re("Transition","TransitionStart"),transitioncancel:Re("Transition","TransitionCancel"),transitionend:Re("Transition","TransitionEnd")},Mi={},ys={};Vt&&(ys=document.createElement("div").style,"AnimationEvent"in window||(delete oa.animationend.animation,delete oa.animationiteration.animation,delete oa.animationstart.animation),"TransitionEvent"in window||delete oa.transitionend.transition);function He(l){if(Mi[l])return Mi[l];if(!oa[l])return l;var t=oa[l],e;for(e in t)if(t.hasOwnProperty(e)&&e in ys)return Mi[l]=t[e];return l}var rs=He("animationend"),hs=He("animationiteration"),gs=He("animationstart"),Um=He("transitionrun"),Cm=He("transitionstart"),jm=He("transitioncancel"),Ss=He("transitionend"),bs=new Map,Ui="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");Ui.push("scrollEnd");function Ct(l,t){bs.set(l,t),Ce(t,[l])}var ln=typeof reportError=="function"?reportError:function(l){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof l=="object"&&l!==null&&typeof l.message=="string"?String(l.message):String(l),error:l});if(!window.dispatchEvent(t))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",l);return}console.error(l)},zt=[],da=0,Ci=0;function tn(){for(var l=da,t=Ci=da=0;t<l;){var e=zt[t];zt[t++]=null;var a=zt[t];zt[t++]=null;var u=zt[t];zt[t++]=null;var n=zt[t];if(zt[t++]=null,a!==null&&u!==null){var i=a.pending;i===null?u.next=u:(u.next=i.next,i.next=u),a.pending=u}n!==0&&ps(e,u,n)}}function en(l,t,e,a){zt[da++]=l,zt[da++]=t,zt[da++]=e,zt[da++]=a,Ci|=a,l.lanes|=a,l=l.alternate,l!==null&&(l.lanes|=a)}function ji(l,t,e,a){return en(l,t,e,a),an(l)}function Be(l,t){return en(l,null,null,t),an(l)}function ps(l,t,e){l.lanes|=e;var a=l.alternate;a!==null&&(a.lanes|=e);for(var u=!1,n=l.return;n!==null;)n.childLanes|=e,a=n.alternate,a!==null&&(a.childLanes|=e),n.tag===22&&(l=n.stateNode,l===null||l._visibility&1||(u=!0)),l=n,n=n.return;return l.tag===3?(n=l.stateNode,u&&t!==null&&(u=31-Pl(e),l=n.hiddenUpdates,a=l[u],a===null?l[u]=[t]:a.push(t),t.lane=e|536870912),n):null}function an(l){if(50<zu)throw zu=0,Zc=null,Error(r(185));for(var t=l.return;t!==null;)l=t,t=l.return;return l.tag===3?l.stateNode:null}var ma={};function Rm(l,t,e,a){this.tag=l,this.key=e,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=a,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function mt(l,t,e,a){return new Rm(l,t,e,a)}function Ri(l){return l=l.prototype,!(!l||!l.isReactComponent)}function Kt(l,t){var e=l.alternate;return e===null?(e=mt(l.tag,t,l.key,l.mode),e.elementType=l.elementType,e.type=l.type,e.stateNode=l.stateNode,e.alternate=l,l.alternate=e):(e.pendingProps=t,e.type=l.type,e.flags=0,e.subtreeFlags=0,e.deletions=null),e.flags=l.flags&65011712,e.childLanes=l.childLanes,e.lanes=l.lanes,e.child=l.child,e.memoizedProps=l.memoizedProps,e.memoizedState=l.memoizedState,e.updateQueue=l.updateQueue,t=l.dependencies,e.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},e.sibling=l.sibling,e.index=l.index,e.ref=l.ref,e.refCleanup=l.refCleanup,e}function Es(l,t){l.flags&=65011714;var e=l.alternate;return e===null?(l.childLanes=0,l.lanes=t,l.child=null,l.subtreeFlags=0,l.memoizedProps=null,l.memoizedState=null,l.updateQueue=null,l.dependencies=null,l.stateNode=null):(l.childLanes=e.childLanes,l.lanes=e.lanes,l.child=e.child,l.subtreeFlags=0,l.deletions=null,l.memoizedProps=e.memoizedProps,l.memoizedState=e.memoizedState,l.updateQueue=e.updateQueue,l.type=e.type,t=e.dependencies,l.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext}),l}function un(l,t,e,a,u,n){var i=0;if(a=l,typeof l=="function")Ri(l)&&(i=1);else if(typeof l=="string")i=Gv(l,e,D.current)?26:l==="html"||l==="head"||l==="body"?27:5;else l:switch(l){case ot:return l=mt(31,e,t,u),l.elementType=ot,l.lanes=n,l;case Gl:return qe(e.children,u,n,t);case Ut:i=8,u|=24;break;case $l:return l=mt(12,e,t,u|2),l.elementType=$l,l.lanes=n,l;case bt:return l=mt(13,e,t,u),l.elementType=bt,l.lanes=n,l;case Ql:return l=mt(19,e,t,u),l.elementType=Ql,l.lanes=n,l;default:if(typeof l=="object"&&l!==null)switch(l.$$typeof){case Hl:i=10;break l;case St:i=9;break l;case tt:i=11;break l;case K:i=14;break l;case wl:i=16,a=null;break l}i=29,e=Error(r(130,l===null?"null":typeof l,"")),a=null}return t=mt(i,e,t,u),t.elementType=l,t.type=a,t.lanes=n,t}function qe(l,t,e,a){return l=mt(7,l,a,t),l.lanes=e,l}function Hi(l,t,e){return l=mt(6,l,null,t),l.lanes=e,l}function xs(l){var t=mt(18,null,null,0);return t.stateNode=l,t}function Bi(l,t,e){return t=mt(4,l.children!==null?l.children:[],l.key,t),t.lanes=e,t.stateNode={containerInfo:l.containerInfo,pendingChildren:null,implementation:l.implementation},t}var zs=new WeakMap;function Tt(l,t){if(typeof l=="object"&&l!==null){var e=zs.get(l);return e!==void 0?e:(t={value:l,source:t,stack:Yu(t)},zs.set(l,t),t)}return{value:l,source:t,stack:Yu(t)}}var va=[],ya=0,nn=null,eu=0,At=[],_t=0,se=null,Ht=1,Bt="";function Jt(l,t){va[ya++]=eu,va[ya++]=nn,nn=l,eu=t}function Ts(l,t,e){At[_t++]=Ht,At[_t++]=Bt,At[_t++]=se,se=l;var a=Ht;l=Bt;var u=32-Pl(a)-1;a&=~(1<<u),e+=1;var n=32-Pl(t)+u;if(30<n){var i=u-u%5;n=(a&(1<<i)-1).toString(32),a>>=i,u-=i,Ht=1<<32-Pl(t)+u|e<<u|a,Bt=n+l}else Ht=1<<n|e<<u|a,Bt=l}function qi(l){l.return!==null&&(Jt(l,1),Ts(l,1,0))}function Yi(l){for(;l===nn;)nn=va[--ya],va[ya]=null,eu=va[--ya],va[ya]=null;for(;l===se;)se=At[--_t],At[_t]=null,Bt=At[--_t],At[_t]=null,Ht=At[--_t],At[_t]=null}function As(l,t){At[_t++]=Ht,At[_t++]=Bt,At[_t++]=se,Ht=t.id,Bt=t.overflow,se=l}var Zl=null,pl=null,F=!1,oe=null,Ot=!1,Gi=Error(r(519));function de(l){var t=Error(r(418,1<arguments.length&&arguments[1]!==void 0&&arguments[1]?"text":"HTML",""));throw au(Tt(t,l)),Gi}function _s(l){var t=l.stateNode,e=l.type,a=l.memoizedProps;switch(t[Xl]=l,t[at]=a,e){case"dialog":w("cancel",t),w("close",t);break;case"iframe":case"object":case"embed":w("load",t);break;case"video":case"audio":for(e=0;e<Au.length;e++)w(Au[e],t);break;case"source":w("error",t);break;case"img":case"image":case"link":w("error",t),w("load",t);break;case"details":w("toggle",t);break;case"input":w("invalid",t),Gf(t,a.value,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name,!0);break;case"select":w("invalid",t);break;case"textarea":w("invalid",t),Xf(t,a.value,a.defaultValue,a.children)}e=a.children,typeof e!="string"&&typeof e!="number"&&typeof e!="bigint"||t.textContent===""+e||a.suppressHydrationWarning===!0||Vd(t.textContent,e)?(a.popover!=null&&(w("beforetoggle",t),w("toggle",t)),a.onScroll!=null&&w("scroll",t),a.onScrollEnd!=null&&w("scrollend",t),a.onClick!=null&&(t.onclick=Lt),t=!0):t=!1,t||de(l,!0)}function Os(l){for(Zl=l.return;Zl;)switch(Zl.tag){case 5:case 31:case 13:Ot=!1;return;case 27:case 3:Ot=!0;return;default:Zl=Zl.return}}function ra(l){if(l!==Zl)return!1;if(!F)return Os(l),F=!0,!1;var t=l.tag,e;if((e=t!==3&&t!==27)&&((e=t===5)&&(e=l.type,e=!(e!=="form"&&e!=="button")||af(l.type,l.memoizedProps)),e=!e),e&&pl&&de(l),Os(l),t===13){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(r(317));pl=Pd(l)}else if(t===31){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(r(317));pl=Pd(l)}else t===27?(t=pl,Ae(l.type)?(l=sf,sf=null,pl=l):pl=t):pl=Zl?Dt(l.stateNode.nextSibling):null;return!0}function Ye(){pl=Zl=null,F=!1}function Qi(){var l=oe;return l!==null&&(ft===null?ft=l:ft.push.apply(ft,l),oe=null),l}function au(l){oe===null?oe=[l]:oe.push(l)}var Xi=o(null),Ge=null,wt=null;function me(l,t,e){A(Xi,t._currentValue),t._currentValue=e}function Wt(l){l._currentValue=Xi.current,x(Xi)}function Zi(l,t,e){for(;l!==null;){var a=l.alternate;if((l.childLanes&t)!==t?(l.childLanes|=t,a!==null&&(a.childLanes|=t)):a!==null&&(a.childLanes&t)!==t&&(a.childLanes|=t),l===e)break;l=l.return}}function Li(l,t,e,a){var u=l.child;for(u!==null&&(u.return=l);u!==null;){var n=u.dependencies;if(n!==null){var i=u.child;n=n.firstContext;l:for(;n!==null;){var c=n;n=u;for(var f=0;f<t.length;f++)if(c.context===t[f]){n.lanes|=e,c=n.alternate,c!==null&&(c.lanes|=e),Zi(n.return,e,l),a||(i=null);break l}n=c.next}}else if(u.tag===18){if(i=u.return,i===null)throw Error(r(341));i.lanes|=e,n=i.alternate,n!==null&&(n.lanes|=e),Zi(i,e,l),i=null}else i=u.child;if(i!==null)i.return=u;else for(i=u;i!==null;){if(i===l){i=null;break}if(u=i.sibling,u!==null){u.return=i.return,i=u;break}i=i.return}u=i}}function ha(l,t,e,a){l=null;for(var u=t,n=!1;u!==null;){if(!n){if((u.flags&524288)!==0)n=!0;else if((u.flags&262144)!==0)break}if(u.tag===10){var i=u.alternate;if(i===null)throw Error(r(387));if(i=i.memoizedProps,i!==null){var c=u.type;dt(u.pendingProps.value,i.value)||(l!==null?l.push(c):l=[c])}}else if(u===tl.current){if(i=u.alternate,i===null)throw Error(r(387));i.memoizedState.memoizedState!==u.memoizedState.memoizedState&&(l!==null?l.push(Mu):l=[Mu])}u=u.return}l!==null&&Li(t,l,e,a),t.flags|=262144}function cn(l){for(l=l.firstContext;l!==null;){if(!dt(l.context._currentValue,l.memoizedValue))return!0;l=l.next}return!1}function Qe(l){Ge=l,wt=null,l=l.dependencies,l!==null&&(l.firstContext=null)}function Ll(l){return Ns(Ge,l)}function fn(l,t){return Ge===null&&Qe(l),Ns(l,t)}function Ns(l,t){var e=t._currentValue;if(t={context:t,memoizedValue:e,next:null},wt===null){if(l===null)throw Error(r(308));wt=t,l.dependencies={lanes:0,firstContext:t},l.flags|=524288}else wt=wt.next=t;return e}var Hm=typeof AbortController<"u"?AbortController:function(){var l=[],t=this.signal={aborted:!1,addEventListener:function(e,a){l.push(a)}};this.abort=function(){t.aborted=!0,l.forEach(function(e){return e()})}},Bm=T.unstable_scheduleCallback,qm=T.unstable_NormalPriority,Ul={$$typeof:Hl,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function Vi(){return{controller:new Hm,data:new Map,refCount:0}}function uu(l){l.refCount--,l.refCount===0&&Bm(qm,function(){l.controller.abort()})}var nu=null,Ki=0,ga=0,Sa=null;function Ym(l,t){if(nu===null){var e=nu=[];Ki=0,ga=Wc(),Sa={status:"pending",value:void 0,then:function(a){e.push(a)}}}return Ki++,t.then(Ds,Ds),t}function Ds(){if(--Ki===0&&nu!==null){Sa!==null&&(Sa.status="fulfilled");var l=nu;nu=null,ga=0,Sa=null;for(var t=0;t<l.length;t++)(0,l[t])()}}function Gm(l,t){var e=[],a={status:"pending",value:null,reason:null,then:function(u){e.push(u)}};return l.then(function(){a.status="fulfilled",a.value=t;for(var u=0;u<e.length;u++)(0,e[u])(t)},function(u){for(a.status="rejected",a.reason=u,u=0;u<e.length;u++)(0,e[u])(void 0)}),a}var Ms=g.S;g.S=function(l,t){yd=Il(),typeof t=="object"&&t!==null&&typeof t.then=="function"&&Ym(l,t),Ms!==null&&Ms(l,t)};var Xe=o(null);function Ji(){var l=Xe.current;return l!==null?l:hl.pooledCache}function sn(l,t){t===null?A(Xe,Xe.current):A(Xe,t.pool)}function Us(){var l=Ji();return l===null?null:{parent:Ul._currentValue,pool:l}}var ba=Error(r(460)),wi=Error(r(474)),on=Error(r(542)),dn={then:function(){}};function Cs(l){return l=l.status,l==="fulfilled"||l==="rejected"}function js(l,t,e){switch(e=l[e],e===void 0?l.push(t):e!==t&&(t.then(Lt,Lt),t=e),t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,Hs(l),l;default:if(typeof t.status=="string")t.then(Lt,Lt);else{if(l=hl,l!==null&&100<l.shellSuspendCounter)throw Error(r(482));l=t,l.status="pending",l.then(function(a){if(t.status==="pending"){var u=t;u.status="fulfilled",u.value=a}},function(a){if(t.status==="pending"){var u=t;u.status="rejected",u.reason=a}})}switch(t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,Hs(l),l}throw Le=t,ba}}function Ze(l){try{var t=l._init;return t(l._payload)}catch(e){throw e!==null&&typeof e=="object"&&typeof e.then=="function"?(Le=e,ba):e}}var Le=null;function Rs(){if(Le===null)throw Error(r(459));var l=Le;return Le=null,l}function Hs(l){if(l===ba||l===on)throw Error(r(483))}var pa=null,iu=0;function mn(l){var t=iu;return iu+=1,pa===null&&(pa=[]),js(pa,l,t)}function cu(l,t){t=t.props.ref,l.ref=t!==void 0?t:null}function vn(l,t){throw t.$$typeof===nl?Error(r(525)):(l=Object.prototype.toString.call(t),Error(r(31,l==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":l)))}function Bs(l){function t(d,s){if(l){var m=d.deletions;m===null?(d.deletions=[s],d.flags|=16):m.push(s)}}function e(d,s){if(!l)return null;for(;s!==null;)t(d,s),s=s.sibling;return null}function a(d){for(var s=new Map;d!==null;)d.key!==null?s.set(d.key,d):s.set(d.index,d),d=d.sibling;return s}function u(d,s){return d=Kt(d,s),d.index=0,d.sibling=null,d}function n(d,s,m){return d.index=m,l?(m=d.alternate,m!==null?(m=m.index,m<s?(d.flags|=67108866,s):m):(d.flags|=67108866,s)):(d.flags|=1048576,s)}function i(d){return l&&d.alternate===null&&(d.flags|=67108866),d}function c(d,s,m,p){return s===null||s.tag!==6?(s=Hi(m,d.mode,p),s.return=d,s):(s=u(s,m),s.return=d,s)}function f(d,s,m,p){var R=m.type;return R===Gl?S(d,s,m.props.children,p,m.key):s!==null&&(s.elementType===R||typeof R=="object"&&R!==null&&R.$$typeof===wl&&Ze(R)===s.type)?(s=u(s,m.props),cu(s,m),s.return=d,s):(s=un(m.type,m.key,m.props,null,d.mode,p),cu(s,m),s.return=d,s)}function v(d,s,m,p){return s===null||s.tag!==4||s.stateNode.containerInfo!==m.containerInfo||s.stateNode.implementation!==m.implementation?(s=Bi(m,d.mode,p),s.return=d,s):(s=u(s,m.children||[]),s.return=d,s)}function S(d,s,m,p,R){return s===null||s.tag!==7?(s=qe(m,d.mode,p,R),s.return=d,s):(s=u(s,m),s.return=d,s)}function E(d,s,m){if(typeof s=="string"&&s!==""||typeof s=="number"||typeof s=="bigint")return s=Hi(""+s,d.mode,m),s.return=d,s;if(typeof s=="object"&&s!==null){switch(s.$$typeof){case kl:return m=un(s.type,s.key,s.props,null,d.mode,m),cu(m,s),m.return=d,m;case Jl:return s=Bi(s,d.mode,m),s.return=d,s;case wl:return s=Ze(s),E(d,s,m)}if(Fl(s)||Tl(s))return s=qe(s,d.mode,m,null),s.return=d,s;if(typeof s.then=="function")return E(d,mn(s),m);if(s.$$typeof===Hl)return E(d,fn(d,s),m);vn(d,s)}return null}function y(d,s,m,p){var R=s!==null?s.key:null;if(typeof m=="string"&&m!==""||typeof m=="number"||typeof m=="bigint")return R!==null?null:c(d,s,""+m,p);if(typeof m=="object"&&m!==null){switch(m.$$typeof){case kl:return m.key===R?f(d,s,m,p):null;case Jl:return m.key===R?v(d,s,m,p):null;case wl:return m=Ze(m),y(d,s,m,p)}if(Fl(m)||Tl(m))return R!==null?null:S(d,s,m,p,null);if(typeof m.then=="function")return y(d,s,mn(m),p);if(m.$$typeof===Hl)return y(d,s,fn(d,m),p);vn(d,m)}return null}function h(d,s,m,p,R){if(typeof p=="string"&&p!==""||typeof p=="number"||typeof p=="bigint")return d=d.get(m)||null,c(s,d,""+p,R);if(typeof p=="object"&&p!==null){switch(p.$$typeof){case kl:return d=d.get(p.key===null?m:p.key)||null,f(s,d,p,R);case Jl:return d=d.get(p.key===null?m:p.key)||null,v(s,d,p,R);case wl:return p=Ze(p),h(d,s,m,p,R)}if(Fl(p)||Tl(p))return d=d.get(m)||null,S(s,d,p,R,null);if(typeof p.then=="function")return h(d,s,m,mn(p),R);if(p.$$typeof===Hl)return h(d,s,m,fn(s,p),R);vn(s,p)}return null}function N(d,s,m,p){for(var R=null,el=null,M=s,Z=s=0,k=null;M!==null&&Z<m.length;Z++){M.index>Z?(k=M,M=null):k=M.sibling;var al=y(d,M,m[Z],p);if(al===null){M===null&&(M=k);break}l&&M&&al.alternate===null&&t(d,M),s=n(al,s,Z),el===null?R=al:el.sibling=al,el=al,M=k}if(Z===m.length)return e(d,M),F&&Jt(d,Z),R;if(M===null){for(;Z<m.length;Z++)M=E(d,m[Z],p),M!==null&&(s=n(M,s,Z),el===null?R=M:el.sibling=M,el=M);return F&&Jt(d,Z),R}for(M=a(M);Z<m.length;Z++)k=h(M,d,Z,m[Z],p),k!==null&&(l&&k.alternate!==null&&M.delete(k.key===null?Z:k.key),s=n(k,s,Z),el===null?R=k:el.sibling=k,el=k);return l&&M.forEach(function(Me){return t(d,Me)}),F&&Jt(d,Z),R}function B(d,s,m,p){if(m==null)throw Error(r(151));for(var R=null,el=null,M=s,Z=s=0,k=null,al=m.next();M!==null&&!al.done;Z++,al=m.next()){M.index>Z?(k=M,M=null):k=M.sibling;var Me=y(d,M,al.value,p);if(Me===null){M===null&&(M=k);break}l&&M&&Me.alternate===null&&t(d,M),s=n(Me,s,Z),el===null?R=Me:el.sibling=Me,el=Me,M=k}if(al.done)return e(d,M),F&&Jt(d,Z),R;if(M===null){for(;!al.done;Z++,al=m.next())al=E(d,al.value,p),al!==null&&(s=n(al,s,Z),el===null?R=al:el.sibling=al,el=al);return F&&Jt(d,Z),R}for(M=a(M);!al.done;Z++,al=m.next())al=h(M,d,Z,al.value,p),al!==null&&(l&&al.alternate!==null&&M.delete(al.key===null?Z:al.key),s=n(al,s,Z),el===null?R=al:el.sibling=al,el=al);return l&&M.forEach(function($v){return t(d,$v)}),F&&Jt(d,Z),R}function yl(d,s,m,p){if(typeof m=="object"&&m!==null&&m.type===Gl&&m.key===null&&(m=m.props.children),typeof m=="object"&&m!==null){switch(m.$$typeof){case kl:l:{for(var R=m.key;s!==null;){if(s.key===R){if(R=m.type,R===Gl){if(s.tag===7){e(d,s.sibling),p=u(s,m.props.children),p.return=d,d=p;break l}}else if(s.elementType===R||typeof R=="object"&&R!==null&&R.$$typeof===wl&&Ze(R)===s.type){e(d,s.sibling),p=u(s,m.props),cu(p,m),p.return=d,d=p;break l}e(d,s);break}else t(d,s);s=s.sibling}m.type===Gl?(p=qe(m.props.children,d.mode,p,m.key),p.return=d,d=p):(p=un(m.type,m.key,m.props,null,d.mode,p),cu(p,m),p.return=d,d=p)}return i(d);case Jl:l:{for(R=m.key;s!==null;){if(s.key===R)if(s.tag===4&&s.stateNode.containerInfo===m.containerInfo&&s.stateNode.implementation===m.implementation){e(d,s.sibling),p=u(s,m.children||[]),p.return=d,d=p;break l}else{e(d,s);break}else t(d,s);s=s.sibling}p=Bi(m,d.mode,p),p.return=d,d=p}return i(d);case wl:return m=Ze(m),yl(d,s,m,p)}if(Fl(m))return N(d,s,m,p);if(Tl(m)){if(R=Tl(m),typeof R!="function")throw Error(r(150));return m=R.call(m),B(d,s,m,p)}if(typeof m.then=="function")return yl(d,s,mn(m),p);if(m.$$typeof===Hl)return yl(d,s,fn(d,m),p);vn(d,m)}return typeof m=="string"&&m!==""||typeof m=="number"||typeof m=="bigint"?(m=""+m,s!==null&&s.tag===6?(e(d,s.sibling),p=u(s,m),p.return=d,d=p):(e(d,s),p=Hi(m,d.mode,p),p.return=d,d=p),i(d)):e(d,s)}return function(d,s,m,p){try{iu=0;var R=yl(d,s,m,p);return pa=null,R}catch(M){if(M===ba||M===on)throw M;var el=mt(29,M,null,d.mode);return el.lanes=p,el.return=d,el}finally{}}}var Ve=Bs(!0),qs=Bs(!1),ve=!1;function Wi(l){l.updateQueue={baseState:l.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function ki(l,t){l=l.updateQueue,t.updateQueue===l&&(t.updateQueue={baseState:l.baseState,firstBaseUpdate:l.firstBaseUpdate,lastBaseUpdate:l.lastBaseUpdate,shared:l.shared,callbacks:null})}function ye(l){return{lane:l,tag:0,payload:null,callback:null,next:null}}function re(l,t,e){var a=l.updateQueue;if(a===null)return null;if(a=a.shared,(ul&2)!==0){var u=a.pending;return u===null?t.next=t:(t.next=u.next,u.next=t),a.pending=t,t=an(l),ps(l,null,e),t}return en(l,a,t,e),an(l)}function fu(l,t,e){if(t=t.updateQueue,t!==null&&(t=t.shared,(e&4194048)!==0)){var a=t.lanes;a&=l.pendingLanes,e|=a,t.lanes=e,Nf(l,e)}}function $i(l,t){var e=l.updateQueue,a=l.alternate;if(a!==null&&(a=a.updateQueue,e===a)){var u=null,n=null;if(e=e.firstBaseUpdate,e!==null){do{var i={lane:e.lane,tag:e.tag,payload:e.payload,callback:null,next:null};n===null?u=n=i:n=n.next=i,e=e.next}while(e!==null);n===null?u=n=t:n=n.next=t}else u=n=t;e={baseState:a.baseState,firstBaseUpdate:u,lastBaseUpdate:n,shared:a.shared,callbacks:a.callbacks},l.updateQueue=e;return}l=e.lastBaseUpdate,l===null?e.firstBaseUpdate=t:l.next=t,e.lastBaseUpdate=t}var Fi=!1;function su(){if(Fi){var l=Sa;if(l!==null)throw l}}function ou(l,t,e,a){Fi=!1;var u=l.updateQueue;ve=!1;var n=u.firstBaseUpdate,i=u.lastBaseUpdate,c=u.shared.pending;if(c!==null){u.shared.pending=null;var f=c,v=f.next;f.next=null,i===null?n=v:i.next=v,i=f;var S=l.alternate;S!==null&&(S=S.updateQueue,c=S.lastBaseUpdate,c!==i&&(c===null?S.firstBaseUpdate=v:c.next=v,S.lastBaseUpdate=f))}if(n!==null){var E=u.baseState;i=0,S=v=f=null,c=n;do{var y=c.lane&-536870913,h=y!==c.lane;if(h?(W&y)===y:(a&y)===y){y!==0&&y===ga&&(Fi=!0),S!==null&&(S=S.next={lane:0,tag:c.tag,payload:c.payload,callback:null,next:null});l:{var N=l,B=c;y=t;var yl=e;switch(B.tag){case 1:if(N=B.payload,typeof N=="function"){E=N.call(yl,E,y);break l}E=N;break l;case 3:N.flags=N.flags&-65537|128;case 0:if(N=B.payload,y=typeof N=="function"?N.call(yl,E,y):N,y==null)break l;E=j({},E,y);break l;case 2:ve=!0}}y=c.callback,y!==null&&(l.flags|=64,h&&(l.flags|=8192),h=u.callbacks,h===null?u.callbacks=[y]:h.push(y))}else h={lane:y,tag:c.tag,payload:c.payload,callback:c.callback,next:null},S===null?(v=S=h,f=E):S=S.next=h,i|=y;if(c=c.next,c===null){if(c=u.shared.pending,c===null)break;h=c,c=h.next,h.next=null,u.lastBaseUpdate=h,u.shared.pending=null}}while(!0);S===null&&(f=E),u.baseState=f,u.firstBaseUpdate=v,u.lastBaseUpdate=S,n===null&&(u.shared.lanes=0),pe|=i,l.lanes=i,l.memoizedState=E}}function Ys(l,t){if(typeof l!="function")throw Error(r(191,l));l.call(t)}function Gs(l,t){var e=l.callbacks;if(e!==null)for(l.callbacks=null,l=0;l<e.length;l++)Ys(e[l],t)}var Ea=o(null),yn=o(0);function Qs(l,t){l=ae,A(yn,l),A(Ea,t),ae=l|t.baseLanes}function Ii(){A(yn,ae),A(Ea,Ea.current)}function Pi(){ae=yn.current,x(Ea),x(yn)}var vt=o(null),Nt=null;function he(l){var t=l.alternate;A(Nl,Nl.current&1),A(vt,l),Nt===null&&(t===null||Ea.current!==null||t.memoizedState!==null)&&(Nt=l)}function lc(l){A(Nl,Nl.current),A(vt,l),Nt===null&&(Nt=l)}function Xs(l){l.tag===22?(A(Nl,Nl.current),A(vt,l),Nt===null&&(Nt=l)):ge()}function ge(){A(Nl,Nl.current),A(vt,vt.current)}function yt(l){x(vt),Nt===l&&(Nt=null),x(Nl)}var Nl=o(0);function rn(l){for(var t=l;t!==null;){if(t.tag===13){var e=t.memoizedState;if(e!==null&&(e=e.dehydrated,e===null||cf(e)||ff(e)))return t}else if(t.tag===19&&(t.memoizedProps.revealOrder==="forwards"||t.memoizedProps.revealOrder==="backwards"||t.memoizedProps.revealOrder==="unstable_legacy-backwards"||t.memoizedProps.revealOrder==="together")){if((t.flags&128)!==0)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var kt=0,X=null,ml=null,Cl=null,hn=!1,xa=!1,Ke=!1,gn=0,du=0,za=null,Qm=0;function _l(){throw Error(r(321))}function tc(l,t){if(t===null)return!1;for(var e=0;e<t.length&&e<l.length;e++)if(!dt(l[e],t[e]))return!1;return!0}function ec(l,t,e,a,u,n){return kt=n,X=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,g.H=l===null||l.memoizedState===null?Ao:gc,Ke=!1,n=e(a,u),Ke=!1,xa&&(n=Ls(t,e,a,u)),Zs(l),n}function Zs(l){g.H=yu;var t=ml!==null&&ml.next!==null;if(kt=0,Cl=ml=X=null,hn=!1,du=0,za=null,t)throw Error(r(300));l===null||jl||(l=l.dependencies,l!==null&&cn(l)&&(jl=!0))}function Ls(l,t,e,a){X=l;var u=0;do{if(xa&&(za=null),du=0,xa=!1,25<=u)throw Error(r(301));if(u+=1,Cl=ml=null,l.updateQueue!=null){var n=l.updateQueue;n.lastEffect=null,n.events=null,n.stores=null,n.memoCache!=null&&(n.memoCache.index=0)}g.H=_o,n=t(e,a)}while(xa);return n}function Xm(){var l=g.H,t=l.useState()[0];return t=typeof t.then=="function"?mu(t):t,l=l.useState()[0],(ml!==null?ml.memoizedState:null)!==l&&(X.flags|=1024),t}function ac(){var l=gn!==0;return gn=0,l}function uc(l,t,e){t.updateQueue=l.updateQueue,t.flags&=-2053,l.lanes&=~e}function nc(l){if(hn){for(l=l.memoizedState;l!==null;){var t=l.queue;t!==null&&(t.pending=null),l=l.next}hn=!1}kt=0,Cl=ml=X=null,xa=!1,du=gn=0,za=null}function lt(){var l={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return Cl===null?X.memoizedState=Cl=l:Cl=Cl.next=l,Cl}function Dl(){if(ml===null){var l=X.alternate;l=l!==null?l.memoizedState:null}else l=ml.next;var t=Cl===null?X.memoizedState:Cl.next;if(t!==null)Cl=t,ml=l;else{if(l===null)throw X.alternate===null?Error(r(467)):Error(r(310));ml=l,l={memoizedState:ml.memoizedState,baseState:ml.baseState,baseQueue:ml.baseQueue,queue:ml.queue,next:null},Cl===null?X.memoizedState=Cl=l:Cl=Cl.next=l}return Cl}function Sn(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function mu(l){var t=du;return du+=1,za===null&&(za=[]),l=js(za,l,t),t=X,(Cl===null?t.memoizedState:Cl.next)===null&&(t=t.alternate,g.H=t===null||t.memoizedState===null?Ao:gc),l}function bn(l){if(l!==null&&typeof l=="object"){if(typeof l.then=="function")return mu(l);if(l.$$typeof===Hl)return Ll(l)}throw Error(r(438,String(l)))}function ic(l){var t=null,e=X.updateQueue;if(e!==null&&(t=e.memoCache),t==null){var a=X.alternate;a!==null&&(a=a.updateQueue,a!==null&&(a=a.memoCache,a!=null&&(t={data:a.data.map(function(u){return u.slice()}),index:0})))}if(t==null&&(t={data:[],index:0}),e===null&&(e=Sn(),X.updateQueue=e),e.memoCache=t,e=t.data[t.index],e===void 0)for(e=t.data[t.index]=Array(l),a=0;a<l;a++)e[a]=Gt;return t.index++,e}function $t(l,t){return typeof t=="function"?t(l):t}function pn(l){var t=Dl();return cc(t,ml,l)}function cc(l,t,e){var a=l.queue;if(a===null)throw Error(r(311));a.lastRenderedReducer=e;var u=l.baseQueue,n=a.pending;if(n!==null){if(u!==null){var i=u.next;u.next=n.next,n.next=i}t.baseQueue=u=n,a.pending=null}if(n=l.baseState,u===null)l.memoizedState=n;else{t=u.next;var c=i=null,f=null,v=t,S=!1;do{var E=v.lane&-536870913;if(E!==v.lane?(W&E)===E:(kt&E)===E){var y=v.revertLane;if(y===0)f!==null&&(f=f.next={lane:0,revertLane:0,gesture:null,action:v.action,hasEagerState:v.hasEagerState,eagerState:v.eagerState,next:null}),E===ga&&(S=!0);else if((kt&y)===y){v=v.next,y===ga&&(S=!0);continue}else E={lane:0,revertLane:v.revertLane,gesture:null,action:v.action,hasEagerState:v.hasEagerState,eagerState:v.eagerState,next:null},f===null?(c=f=E,i=n):f=f.next=E,X.lanes|=y,pe|=y;E=v.action,Ke&&e(n,E),n=v.hasEagerState?v.eagerState:e(n,E)}else y={lane:E,revertLane:v.revertLane,gesture:v.gesture,action:v.action,hasEagerState:v.hasEagerState,eagerState:v.eagerState,next:null},f===null?(c=f=y,i=n):f=f.next=y,X.lanes|=E,pe|=E;v=v.next}while(v!==null&&v!==t);if(f===null?i=n:f.next=c,!dt(n,l.memoizedState)&&(jl=!0,S&&(e=Sa,e!==null)))throw e;l.memoizedState=n,l.baseState=i,l.baseQueue=f,a.lastRenderedState=n}return u===null&&(a.lanes=0),[l.memoizedState,a.dispatch]}function fc(l){var t=Dl(),e=t.queue;if(e===null)throw Error(r(311));e.lastRenderedReducer=l;var a=e.dispatch,u=e.pending,n=t.memoizedState;if(u!==null){e.pending=null;var i=u=u.next;do n=l(n,i.action),i=i.next;while(i!==u);dt(n,t.memoizedState)||(jl=!0),t.memoizedState=n,t.baseQueue===null&&(t.baseState=n),e.lastRenderedState=n}return[n,a]}function Vs(l,t,e){var a=X,u=Dl(),n=F;if(n){if(e===void 0)throw Error(r(407));e=e()}else e=t();var i=!dt((ml||u).memoizedState,e);if(i&&(u.memoizedState=e,jl=!0),u=u.queue,dc(ws.bind(null,a,u,l),[l]),u.getSnapshot!==t||i||Cl!==null&&Cl.memoizedState.tag&1){if(a.flags|=2048,Ta(9,{destroy:void 0},Js.bind(null,a,u,e,t),null),hl===null)throw Error(r(349));n||(kt&127)!==0||Ks(a,t,e)}return e}function Ks(l,t,e){l.flags|=16384,l={getSnapshot:t,value:e},t=X.updateQueue,t===null?(t=Sn(),X.updateQueue=t,t.stores=[l]):(e=t.stores,e===null?t.stores=[l]:e.push(l))}function Js(l,t,e,a){t.value=e,t.getSnapshot=a,Ws(t)&&ks(l)}function ws(l,t,e){return e(function(){Ws(t)&&ks(l)})}function Ws(l){var t=l.getSnapshot;l=l.value;try{var e=t();return!dt(l,e)}catch{return!0}}function ks(l){var t=Be(l,2);t!==null&&st(t,l,2)}function sc(l){var t=lt();if(typeof l=="function"){var e=l;if(l=e(),Ke){Ml(!0);try{e()}finally{Ml(!1)}}}return t.memoizedState=t.baseState=l,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:$t,lastRenderedState:l},t}function $s(l,t,e,a){return l.baseState=e,cc(l,ml,typeof a=="function"?a:$t)}function Zm(l,t,e,a,u){if(zn(l))throw Error(r(485));if(l=t.action,l!==null){var n={payload:u,action:l,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(i){n.listeners.push(i)}};g.T!==null?e(!0):n.isTransition=!1,a(n),e=t.pending,e===null?(n.next=t.pending=n,Fs(t,n)):(n.next=e.next,t.pending=e.next=n)}}function Fs(l,t){var e=t.action,a=t.payload,u=l.state;if(t.isTransition){var n=g.T,i={};g.T=i;try{var c=e(u,a),f=g.S;f!==null&&f(i,c),Is(l,t,c)}catch(v){oc(l,t,v)}finally{n!==null&&i.types!==null&&(n.types=i.types),g.T=n}}else try{n=e(u,a),Is(l,t,n)}catch(v){oc(l,t,v)}}function Is(l,t,e){e!==null&&typeof e=="object"&&typeof e.then=="function"?e.then(function(a){Ps(l,t,a)},function(a){return oc(l,t,a)}):Ps(l,t,e)}function Ps(l,t,e){t.status="fulfilled",t.value=e,lo(t),l.state=e,t=l.pending,t!==null&&(e=t.next,e===t?l.pending=null:(e=e.next,t.next=e,Fs(l,e)))}function oc(l,t,e){var a=l.pending;if(l.pending=null,a!==null){a=a.next;do t.status="rejected",t.reason=e,lo(t),t=t.next;while(t!==a)}l.action=null}function lo(l){l=l.listeners;for(var t=0;t<l.length;t++)(0,l[t])()}function to(l,t){return t}function eo(l,t){if(F){var e=hl.formState;if(e!==null){l:{var a=X;if(F){if(pl){t:{for(var u=pl,n=Ot;u.nodeType!==8;){if(!n){u=null;break t}if(u=Dt(u.nextSibling),u===null){u=null;break t}}n=u.data,u=n==="F!"||n==="F"?u:null}if(u){pl=Dt(u.nextSibling),a=u.data==="F!";break l}}de(a)}a=!1}a&&(t=e[0])}}return e=lt(),e.memoizedState=e.baseState=t,a={pending:null,lanes:0,dispatch:null,lastRenderedReducer:to,lastRenderedState:t},e.queue=a,e=xo.bind(null,X,a),a.dispatch=e,a=sc(!1),n=hc.bind(null,X,!1,a.queue),a=lt(),u={state:t,dispatch:null,action:l,pending:null},a.queue=u,e=Zm.bind(null,X,u,n,e),u.dispatch=e,a.memoizedState=l,[t,e,!1]}function ao(l){var t=Dl();return uo(t,ml,l)}function uo(l,t,e){if(t=cc(l,t,to)[0],l=pn($t)[0],typeof t=="object"&&t!==null&&typeof t.then=="function")try{var a=mu(t)}catch(i){throw i===ba?on:i}else a=t;t=Dl();var u=t.queue,n=u.dispatch;return e!==t.memoizedState&&(X.flags|=2048,Ta(9,{destroy:void 0},Lm.bind(null,u,e),null)),[a,n,l]}function Lm(l,t){l.action=t}function no(l){var t=Dl(),e=ml;if(e!==null)return uo(t,e,l);Dl(),t=t.memoizedState,e=Dl();var a=e.queue.dispatch;return e.memoizedState=l,[t,a,!1]}function Ta(l,t,e,a){return l={tag:l,create:e,deps:a,inst:t,next:null},t=X.updateQueue,t===null&&(t=Sn(),X.updateQueue=t),e=t.lastEffect,e===null?t.lastEffect=l.next=l:(a=e.next,e.next=l,l.next=a,t.lastEffect=l),l}function io(){return Dl().memoizedState}function En(l,t,e,a){var u=lt();X.flags|=l,u.memoizedState=Ta(1|t,{destroy:void 0},e,a===void 0?null:a)}function xn(l,t,e,a){var u=Dl();a=a===void 0?null:a;var n=u.memoizedState.inst;ml!==null&&a!==null&&tc(a,ml.memoizedState.deps)?u.memoizedState=Ta(t,n,e,a):(X.flags|=l,u.memoizedState=Ta(1|t,n,e,a))}function co(l,t){En(8390656,8,l,t)}function dc(l,t){xn(2048,8,l,t)}function Vm(l){X.flags|=4;var t=X.updateQueue;if(t===null)t=Sn(),X.updateQueue=t,t.events=[l];else{var e=t.events;e===null?t.events=[l]:e.push(l)}}function fo(l){var t=Dl().memoizedState;return Vm({ref:t,nextImpl:l}),function(){if((ul&2)!==0)throw Error(r(440));return t.impl.apply(void 0,arguments)}}function so(l,t){return xn(4,2,l,t)}function oo(l,t){return xn(4,4,l,t)}function mo(l,t){if(typeof t=="function"){l=l();var e=t(l);return function(){typeof e=="function"?e():t(null)}}if(t!=null)return l=l(),t.current=l,function(){t.current=null}}function vo(l,t,e){e=e!=null?e.concat([l]):null,xn(4,4,mo.bind(null,t,l),e)}function mc(){}function yo(l,t){var e=Dl();t=t===void 0?null:t;var a=e.memoizedState;return t!==null&&tc(t,a[1])?a[0]:(e.memoizedState=[l,t],l)}function ro(l,t){var e=Dl();t=t===void 0?null:t;var a=e.memoizedState;if(t!==null&&tc(t,a[1]))return a[0];if(a=l(),Ke){Ml(!0);try{l()}finally{Ml(!1)}}return e.memoizedState=[a,t],a}function vc(l,t,e){return e===void 0||(kt&1073741824)!==0&&(W&261930)===0?l.memoizedState=t:(l.memoizedState=e,l=hd(),X.lanes|=l,pe|=l,e)}function ho(l,t,e,a){return dt(e,t)?e:Ea.current!==null?(l=vc(l,e,a),dt(l,t)||(jl=!0),l):(kt&42)===0||(kt&1073741824)!==0&&(W&261930)===0?(jl=!0,l.memoizedState=e):(l=hd(),X.lanes|=l,pe|=l,t)}function go(l,t,e,a,u){var n=O.p;O.p=n!==0&&8>n?n:8;var i=g.T,c={};g.T=c,hc(l,!1,t,e);try{var f=u(),v=g.S;if(v!==null&&v(c,f),f!==null&&typeof f=="object"&&typeof f.then=="function"){var S=Gm(f,a);vu(l,t,S,gt(l))}else vu(l,t,a,gt(l))}catch(E){vu(l,t,{then:function(){},status:"rejected",reason:E},gt())}finally{O.p=n,i!==null&&c.types!==null&&(i.types=c.types),g.T=i}}function Km(){}function yc(l,t,e,a){if(l.tag!==5)throw Error(r(476));var u=So(l).queue;go(l,u,t,H,e===null?Km:function(){return bo(l),e(a)})}function So(l){var t=l.memoizedState;if(t!==null)return t;t={memoizedState:H,baseState:H,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:$t,lastRenderedState:H},next:null};var e={};return t.next={memoizedState:e,baseState:e,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:$t,lastRenderedState:e},next:null},l.memoizedState=t,l=l.alternate,l!==null&&(l.memoizedState=t),t}function bo(l){var t=So(l);t.next===null&&(t=l.alternate.memoizedState),vu(l,t.next.queue,{},gt())}function rc(){return Ll(Mu)}function po(){return Dl().memoizedState}function Eo(){return Dl().memoizedState}function Jm(l){for(var t=l.return;t!==null;){switch(t.tag){case 24:case 3:var e=gt();l=ye(e);var a=re(t,l,e);a!==null&&(st(a,t,e),fu(a,t,e)),t={cache:Vi()},l.payload=t;return}t=t.return}}function wm(l,t,e){var a=gt();e={lane:a,revertLane:0,gesture:null,action:e,hasEagerState:!1,eagerState:null,next:null},zn(l)?zo(t,e):(e=ji(l,t,e,a),e!==null&&(st(e,l,a),To(e,t,a)))}function xo(l,t,e){var a=gt();vu(l,t,e,a)}function vu(l,t,e,a){var u={lane:a,revertLane:0,gesture:null,action:e,hasEagerState:!1,eagerState:null,next:null};if(zn(l))zo(t,u);else{var n=l.alternate;if(l.lanes===0&&(n===null||n.lanes===0)&&(n=t.lastRenderedReducer,n!==null))try{var i=t.lastRenderedState,c=n(i,e);if(u.hasEagerState=!0,u.eagerState=c,dt(c,i))return en(l,t,u,0),hl===null&&tn(),!1}catch{}finally{}if(e=ji(l,t,u,a),e!==null)return st(e,l,a),To(e,t,a),!0}return!1}function hc(l,t,e,a){if(a={lane:2,revertLane:Wc(),gesture:null,action:a,hasEagerState:!1,eagerState:null,next:null},zn(l)){if(t)throw Error(r(479))}else t=ji(l,e,a,2),t!==null&&st(t,l,2)}function zn(l){var t=l.alternate;return l===X||t!==null&&t===X}function zo(l,t){xa=hn=!0;var e=l.pending;e===null?t.next=t:(t.next=e.next,e.next=t),l.pending=t}function To(l,t,e){if((e&4194048)!==0){var a=t.lanes;a&=l.pendingLanes,e|=a,t.lanes=e,Nf(l,e)}}var yu={readContext:Ll,use:bn,useCallback:_l,useContext:_l,useEffect:_l,useImperativeHandle:_l,useLayoutEffect:_l,useInsertionEffect:_l,useMemo:_l,useReducer:_l,useRef:_l,useState:_l,useDebugValue:_l,useDeferredValue:_l,useTransition:_l,useSyncExternalStore:_l,useId:_l,useHostTransitionStatus:_l,useFormState:_l,useActionState:_l,useOptimistic:_l,useMemoCache:_l,useCacheRefresh:_l};yu.useEffectEvent=_l;var Ao={readContext:Ll,use:bn,useCallback:function(l,t){return lt().memoizedState=[l,t===void 0?null:t],l},useContext:Ll,useEffect:co,useImperativeHandle:function(l,t,e){e=e!=null?e.concat([l]):null,En(4194308,4,mo.bind(null,t,l),e)},useLayoutEffect:function(l,t){return En(4194308,4,l,t)},useInsertionEffect:function(l,t){En(4,2,l,t)},useMemo:function(l,t){var e=lt();t=t===void 0?null:t;var a=l();if(Ke){Ml(!0);try{l()}finally{Ml(!1)}}return e.memoizedState=[a,t],a},useReducer:function(l,t,e){var a=lt();if(e!==void 0){var u=e(t);if(Ke){Ml(!0);try{e(t)}finally{Ml(!1)}}}else u=t;return a.memoizedState=a.baseState=u,l={pending:null,lanes:0,dispatch:null,lastRenderedReducer:l,lastRenderedState:u},a.queue=l,l=l.dispatch=wm.bind(null,X,l),[a.memoizedState,l]},useRef:function(l){var t=lt();return l={current:l},t.memoizedState=l},useState:function(l){l=sc(l);var t=l.queue,e=xo.bind(null,X,t);return t.dispatch=e,[l.memoizedState,e]},useDebugValue:mc,useDeferredValue:function(l,t){var e=lt();return vc(e,l,t)},useTransition:function(){var l=sc(!1);return l=go.bind(null,X,l.queue,!0,!1),lt().memoizedState=l,[!1,l]},useSyncExternalStore:function(l,t,e){var a=X,u=lt();if(F){if(e===void 0)throw Error(r(407));e=e()}else{if(e=t(),hl===null)throw Error(r(349));(W&127)!==0||Ks(a,t,e)}u.memoizedState=e;var n={value:e,getSnapshot:t};return u.queue=n,co(ws.bind(null,a,n,l),[l]),a.flags|=2048,Ta(9,{destroy:void 0},Js.bind(null,a,n,e,t),null),e},useId:function(){var l=lt(),t=hl.identifierPrefix;if(F){var e=Bt,a=Ht;e=(a&~(1<<32-Pl(a)-1)).toString(32)+e,t="_"+t+"R_"+e,e=gn++,0<e&&(t+="H"+e.toString(32)),t+="_"}else e=Qm++,t="_"+t+"r_"+e.toString(32)+"_";return l.memoizedState=t},useHostTransitionStatus:rc,useFormState:eo,useActionState:eo,useOptimistic:function(l){var t=lt();t.memoizedState=t.baseState=l;var e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=e,t=hc.bind(null,X,!0,e),e.dispatch=t,[l,t]},useMemoCache:ic,useCacheRefresh:function(){return lt().memoizedState=Jm.bind(null,X)},useEffectEvent:function(l){var t=lt(),e={impl:l};return t.memoizedState=e,function(){if((ul&2)!==0)throw Error(r(440));return e.impl.apply(void 0,arguments)}}},gc={readContext:Ll,use:bn,useCallback:yo,useContext:Ll,useEffect:dc,useImperativeHandle:vo,useInsertionEffect:so,useLayoutEffect:oo,useMemo:ro,useReducer:pn,useRef:io,useState:function(){return pn($t)},useDebugValue:mc,useDeferredValue:function(l,t){var e=Dl();return ho(e,ml.memoizedState,l,t)},useTransition:function(){var l=pn($t)[0],t=Dl().memoizedState;return[typeof l=="boolean"?l:mu(l),t]},useSyncExternalStore:Vs,useId:po,useHostTransitionStatus:rc,useFormState:ao,useActionState:ao,useOptimistic:function(l,t){var e=Dl();return $s(e,ml,l,t)},useMemoCache:ic,useCacheRefresh:Eo};gc.useEffectEvent=fo;var _o={readContext:Ll,use:bn,useCallback:yo,useContext:Ll,useEffect:dc,useImperativeHandle:vo,useInsertionEffect:so,useLayoutEffect:oo,useMemo:ro,useReducer:fc,useRef:io,useState:function(){return fc($t)},useDebugValue:mc,useDeferredValue:function(l,t){var e=Dl();return ml===null?vc(e,l,t):ho(e,ml.memoizedState,l,t)},useTransition:function(){var l=fc($t)[0],t=Dl().memoizedState;return[typeof l=="boolean"?l:mu(l),t]},useSyncExternalStore:Vs,useId:po,useHostTransitionStatus:rc,useFormState:no,useActionState:no,useOptimistic:function(l,t){var e=Dl();return ml!==null?$s(e,ml,l,t):(e.baseState=l,[l,e.queue.dispatch])},useMemoCache:ic,useCacheRefresh:Eo};_o.useEffectEvent=fo;function Sc(l,t,e,a){t=l.memoizedState,e=e(a,t),e=e==null?t:j({},t,e),l.memoizedState=e,l.lanes===0&&(l.updateQueue.baseState=e)}var bc={enqueueSetState:function(l,t,e){l=l._reactInternals;var a=gt(),u=ye(a);u.payload=t,e!=null&&(u.callback=e),t=re(l,u,a),t!==null&&(st(t,l,a),fu(t,l,a))},enqueueReplaceState:function(l,t,e){l=l._reactInternals;var a=gt(),u=ye(a);u.tag=1,u.payload=t,e!=null&&(u.callback=e),t=re(l,u,a),t!==null&&(st(t,l,a),fu(t,l,a))},enqueueForceUpdate:function(l,t){l=l._reactInternals;var e=gt(),a=ye(e);a.tag=2,t!=null&&(a.callback=t),t=re(l,a,e),t!==null&&(st(t,l,e),fu(t,l,e))}};function Oo(l,t,e,a,u,n,i){return l=l.stateNode,typeof l.shouldComponentUpdate=="function"?l.shouldComponentUpdate(a,n,i):t.prototype&&t.prototype.isPureReactComponent?!lu(e,a)||!lu(u,n):!0}function No(l,t,e,a){l=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(e,a),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(e,a),t.state!==l&&bc.enqueueReplaceState(t,t.state,null)}function Je(l,t){var e=t;if("ref"in t){e={};for(var a in t)a!=="ref"&&(e[a]=t[a])}if(l=l.defaultProps){e===t&&(e=j({},e));for(var u in l)e[u]===void 0&&(e[u]=l[u])}return e}function Do(l){ln(l)}function Mo(l){console.error(l)}function Uo(l){ln(l)}function Tn(l,t){try{var e=l.onUncaughtError;e(t.value,{componentStack:t.stack})}catch(a){setTimeout(function(){throw a})}}function Co(l,t,e){try{var a=l.onCaughtError;a(e.value,{componentStack:e.stack,errorBoundary:t.tag===1?t.stateNode:null})}catch(u){setTimeout(function(){throw u})}}function pc(l,t,e){return e=ye(e),e.tag=3,e.payload={element:null},e.callback=function(){Tn(l,t)},e}function jo(l){return l=ye(l),l.tag=3,l}function Ro(l,t,e,a){var u=e.type.getDerivedStateFromError;if(typeof u=="function"){var n=a.value;l.payload=function(){return u(n)},l.callback=function(){Co(t,e,a)}}var i=e.stateNode;i!==null&&typeof i.componentDidCatch=="function"&&(l.callback=function(){Co(t,e,a),typeof u!="function"&&(Ee===null?Ee=new Set([this]):Ee.add(this));var c=a.stack;this.componentDidCatch(a.value,{componentStack:c!==null?c:""})})}function Wm(l,t,e,a,u){if(e.flags|=32768,a!==null&&typeof a=="object"&&typeof a.then=="function"){if(t=e.alternate,t!==null&&ha(t,e,u,!0),e=vt.current,e!==null){switch(e.tag){case 31:case 13:return Nt===null?Bn():e.alternate===null&&Ol===0&&(Ol=3),e.flags&=-257,e.flags|=65536,e.lanes=u,a===dn?e.flags|=16384:(t=e.updateQueue,t===null?e.updateQueue=new Set([a]):t.add(a),Kc(l,a,u)),!1;case 22:return e.flags|=65536,a===dn?e.flags|=16384:(t=e.updateQueue,t===null?(t={transitions:null,markerInstances:null,retryQueue:new Set([a])},e.updateQueue=t):(e=t.retryQueue,e===null?t.retryQueue=new Set([a]):e.add(a)),Kc(l,a,u)),!1}throw Error(r(435,e.tag))}return Kc(l,a,u),Bn(),!1}if(F)return t=vt.current,t!==null?((t.flags&65536)===0&&(t.flags|=256),t.flags|=65536,t.lanes=u,a!==Gi&&(l=Error(r(422),{cause:a}),au(Tt(l,e)))):(a!==Gi&&(t=Error(r(423),{cause:a}),au(Tt(t,e))),l=l.current.alternate,l.flags|=65536,u&=-u,l.lanes|=u,a=Tt(a,e),u=pc(l.stateNode,a,u),$i(l,u),Ol!==4&&(Ol=2)),!1;var n=Error(r(520),{cause:a});if(n=Tt(n,e),xu===null?xu=[n]:xu.push(n),Ol!==4&&(Ol=2),t===null)return!0;a=Tt(a,e),e=t;do{switch(e.tag){case 3:return e.flags|=65536,l=u&-u,e.lanes|=l,l=pc(e.stateNode,a,l),$i(e,l),!1;case 1:if(t=e.type,n=e.stateNode,(e.flags&128)===0&&(typeof t.getDerivedStateFromError=="function"||n!==null&&typeof n.componentDidCatch=="function"&&(Ee===null||!Ee.has(n))))return e.flags|=65536,u&=-u,e.lanes|=u,u=jo(u),Ro(u,l,e,a),$i(e,u),!1}e=e.return}while(e!==null);return!1}var Ec=Error(r(461)),jl=!1;function Vl(l,t,e,a){t.child=l===null?qs(t,null,e,a):Ve(t,l.child,e,a)}function Ho(l,t,e,a,u){e=e.render;var n=t.ref;if("ref"in a){var i={};for(var c in a)c!=="ref"&&(i[c]=a[c])}else i=a;return Qe(t),a=ec(l,t,e,i,n,u),c=ac(),l!==null&&!jl?(uc(l,t,u),Ft(l,t,u)):(F&&c&&qi(t),t.flags|=1,Vl(l,t,a,u),t.child)}function Bo(l,t,e,a,u){if(l===null){var n=e.type;return typeof n=="function"&&!Ri(n)&&n.defaultProps===void 0&&e.compare===null?(t.tag=15,t.type=n,qo(l,t,n,a,u)):(l=un(e.type,null,a,t,t.mode,u),l.ref=t.ref,l.return=t,t.child=l)}if(n=l.child,!Dc(l,u)){var i=n.memoizedProps;if(e=e.compare,e=e!==null?e:lu,e(i,a)&&l.ref===t.ref)return Ft(l,t,u)}return t.flags|=1,l=Kt(n,a),l.ref=t.ref,l.return=t,t.child=l}function qo(l,t,e,a,u){if(l!==null){var n=l.memoizedProps;if(lu(n,a)&&l.ref===t.ref)if(jl=!1,t.pendingProps=a=n,Dc(l,u))(l.flags&131072)!==0&&(jl=!0);else return t.lanes=l.lanes,Ft(l,t,u)}return xc(l,t,e,a,u)}function Yo(l,t,e,a){var u=a.children,n=l!==null?l.memoizedState:null;if(l===null&&t.stateNode===null&&(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),a.mode==="hidden"){if((t.flags&128)!==0){if(n=n!==null?n.baseLanes|e:e,l!==null){for(a=t.child=l.child,u=0;a!==null;)u=u|a.lanes|a.childLanes,a=a.sibling;a=u&~n}else a=0,t.child=null;return Go(l,t,n,e,a)}if((e&536870912)!==0)t.memoizedState={baseLanes:0,cachePool:null},l!==null&&sn(t,n!==null?n.cachePool:null),n!==null?Qs(t,n):Ii(),Xs(t);else return a=t.lanes=536870912,Go(l,t,n!==null?n.baseLanes|e:e,e,a)}else n!==null?(sn(t,n.cachePool),Qs(t,n),ge(),t.memoizedState=null):(l!==null&&sn(t,null),Ii(),ge());return Vl(l,t,u,e),t.child}function ru(l,t){return l!==null&&l.tag===22||t.stateNode!==null||(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),t.sibling}function Go(l,t,e,a,u){var n=Ji();return n=n===null?null:{parent:Ul._currentValue,pool:n},t.memoizedState={baseLanes:e,cachePool:n},l!==null&&sn(t,null),Ii(),Xs(t),l!==null&&ha(l,t,a,!0),t.childLanes=u,null}function An(l,t){return t=On({mode:t.mode,children:t.children},l.mode),t.ref=l.ref,l.child=t,t.return=l,t}function Qo(l,t,e){return Ve(t,l.child,null,e),l=An(t,t.pendingProps),l.flags|=2,yt(t),t.memoizedState=null,l}function km(l,t,e){var a=t.pendingProps,u=(t.flags&128)!==0;if(t.flags&=-129,l===null){if(F){if(a.mode==="hidden")return l=An(t,a),t.lanes=536870912,ru(null,l);if(lc(t),(l=pl)?(l=Id(l,Ot),l=l!==null&&l.data==="&"?l:null,l!==null&&(t.memoizedState={dehydrated:l,treeContext:se!==null?{id:Ht,overflow:Bt}:null,retryLane:536870912,hydrationErrors:null},e=xs(l),e.return=t,t.child=e,Zl=t,pl=null)):l=null,l===null)throw de(t);return t.lanes=536870912,null}return An(t,a)}var n=l.memoizedState;if(n!==null){var i=n.dehydrated;if(lc(t),u)if(t.flags&256)t.flags&=-257,t=Qo(l,t,e);else if(t.memoizedState!==null)t.child=l.child,t.flags|=128,t=null;else throw Error(r(558));else if(jl||ha(l,t,e,!1),u=(e&l.childLanes)!==0,jl||u){if(a=hl,a!==null&&(i=Df(a,e),i!==0&&i!==n.retryLane))throw n.retryLane=i,Be(l,i),st(a,l,i),Ec;Bn(),t=Qo(l,t,e)}else l=n.treeContext,pl=Dt(i.nextSibling),Zl=t,F=!0,oe=null,Ot=!1,l!==null&&As(t,l),t=An(t,a),t.flags|=4096;return t}return l=Kt(l.child,{mode:a.mode,children:a.children}),l.ref=t.ref,t.child=l,l.return=t,l}function _n(l,t){var e=t.ref;if(e===null)l!==null&&l.ref!==null&&(t.flags|=4194816);else{if(typeof e!="function"&&typeof e!="object")throw Error(r(284));(l===null||l.ref!==e)&&(t.flags|=4194816)}}function xc(l,t,e,a,u){return Qe(t),e=ec(l,t,e,a,void 0,u),a=ac(),l!==null&&!jl?(uc(l,t,u),Ft(l,t,u)):(F&&a&&qi(t),t.flags|=1,Vl(l,t,e,u),t.child)}function Xo(l,t,e,a,u,n){return Qe(t),t.updateQueue=null,e=Ls(t,a,e,u),Zs(l),a=ac(),l!==null&&!jl?(uc(l,t,n),Ft(l,t,n)):(F&&a&&qi(t),t.flags|=1,Vl(l,t,e,n),t.child)}function Zo(l,t,e,a,u){if(Qe(t),t.stateNode===null){var n=ma,i=e.contextType;typeof i=="object"&&i!==null&&(n=Ll(i)),n=new e(a,n),t.memoizedState=n.state!==null&&n.state!==void 0?n.state:null,n.updater=bc,t.stateNode=n,n._reactInternals=t,n=t.stateNode,n.props=a,n.state=t.memoizedState,n.refs={},Wi(t),i=e.contextType,n.context=typeof i=="object"&&i!==null?Ll(i):ma,n.state=t.memoizedState,i=e.getDerivedStateFromProps,typeof i=="function"&&(Sc(t,e,i,a),n.state=t.memoizedState),typeof e.getDerivedStateFromProps=="function"||typeof n.getSnapshotBeforeUpdate=="function"||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(i=n.state,typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount(),i!==n.state&&bc.enqueueReplaceState(n,n.state,null),ou(t,a,n,u),su(),n.state=t.memoizedState),typeof n.componentDidMount=="function"&&(t.flags|=4194308),a=!0}else if(l===null){n=t.stateNode;var c=t.memoizedProps,f=Je(e,c);n.props=f;var v=n.context,S=e.contextType;i=ma,typeof S=="object"&&S!==null&&(i=Ll(S));var E=e.getDerivedStateFromProps;S=typeof E=="function"||typeof n.getSnapshotBeforeUpdate=="function",c=t.pendingProps!==c,S||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(c||v!==i)&&No(t,n,a,i),ve=!1;var y=t.memoizedState;n.state=y,ou(t,a,n,u),su(),v=t.memoizedState,c||y!==v||ve?(typeof E=="function"&&(Sc(t,e,E,a),v=t.memoizedState),(f=ve||Oo(t,e,f,a,y,v,i))?(S||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount()),typeof n.componentDidMount=="function"&&(t.flags|=4194308)):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=a,t.memoizedState=v),n.props=a,n.state=v,n.context=i,a=f):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),a=!1)}else{n=t.stateNode,ki(l,t),i=t.memoizedProps,S=Je(e,i),n.props=S,E=t.pendingProps,y=n.context,v=e.contextType,f=ma,typeof v=="object"&&v!==null&&(f=Ll(v)),c=e.getDerivedStateFromProps,(v=typeof c=="function"||typeof n.getSnapshotBeforeUpdate=="function")||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(i!==E||y!==f)&&No(t,n,a,f),ve=!1,y=t.memoizedState,n.state=y,ou(t,a,n,u),su();var h=t.memoizedState;i!==E||y!==h||ve||l!==null&&l.dependencies!==null&&cn(l.dependencies)?(typeof c=="function"&&(Sc(t,e,c,a),h=t.memoizedState),(S=ve||Oo(t,e,S,a,y,h,f)||l!==null&&l.dependencies!==null&&cn(l.dependencies))?(v||typeof n.UNSAFE_componentWillUpdate!="function"&&typeof n.componentWillUpdate!="function"||(typeof n.componentWillUpdate=="function"&&n.componentWillUpdate(a,h,f),typeof n.UNSAFE_componentWillUpdate=="function"&&n.UNSAFE_componentWillUpdate(a,h,f)),typeof n.componentDidUpdate=="function"&&(t.flags|=4),typeof n.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof n.componentDidUpdate!="function"||i===l.memoizedProps&&y===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||i===l.memoizedProps&&y===l.memoizedState||(t.flags|=1024),t.memoizedProps=a,t.memoizedState=h),n.props=a,n.state=h,n.context=f,a=S):(typeof n.componentDidUpdate!="function"||i===l.memoizedProps&&y===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||i===l.memoizedProps&&y===l.memoizedState||(t.flags|=1024),a=!1)}return n=a,_n(l,t),a=(t.flags&128)!==0,n||a?(n=t.stateNode,e=a&&typeof e.getDerivedStateFromError!="function"?null:n.render(),t.flags|=1,l!==null&&a?(t.child=Ve(t,l.child,null,u),t.child=Ve(t,null,e,u)):Vl(l,t,e,u),t.memoizedState=n.state,l=t.child):l=Ft(l,t,u),l}function Lo(l,t,e,a){return Ye(),t.flags|=256,Vl(l,t,e,a),t.child}var zc={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function Tc(l){return{baseLanes:l,cachePool:Us()}}function Ac(l,t,e){return l=l!==null?l.childLanes&~e:0,t&&(l|=ht),l}function Vo(l,t,e){var a=t.pendingProps,u=!1,n=(t.flags&128)!==0,i;if((i=n)||(i=l!==null&&l.memoizedState===null?!1:(Nl.current&2)!==0),i&&(u=!0,t.flags&=-129),i=(t.flags&32)!==0,t.flags&=-33,l===null){if(F){if(u?he(t):ge(),(l=pl)?(l=Id(l,Ot),l=l!==null&&l.data!=="&"?l:null,l!==null&&(t.memoizedState={dehydrated:l,treeContext:se!==null?{id:Ht,overflow:Bt}:null,retryLane:536870912,hydrationErrors:null},e=xs(l),e.return=t,t.child=e,Zl=t,pl=null)):l=null,l===null)throw de(t);return ff(l)?t.lanes=32:t.lanes=536870912,null}var c=a.children;return a=a.fallback,u?(ge(),u=t.mode,c=On({mode:"hidden",children:c},u),a=qe(a,u,e,null),c.return=t,a.return=t,c.sibling=a,t.child=c,a=t.child,a.memoizedState=Tc(e),a.childLanes=Ac(l,i,e),t.memoizedState=zc,ru(null,a)):(he(t),_c(t,c))}var f=l.memoizedState;if(f!==null&&(c=f.dehydrated,c!==null)){if(n)t.flags&256?(he(t),t.flags&=-257,t=Oc(l,t,e)):t.memoizedState!==null?(ge(),t.child=l.child,t.flags|=128,t=null):(ge(),c=a.fallback,u=t.mode,a=On({mode:"visible",children:a.children},u),c=qe(c,u,e,null),c.flags|=2,a.return=t,c.return=t,a.sibling=c,t.child=a,Ve(t,l.child,null,e),a=t.child,a.memoizedState=Tc(e),a.childLanes=Ac(l,i,e),t.memoizedState=zc,t=ru(null,a));else if(he(t),ff(c)){if(i=c.nextSibling&&c.nextSibling.dataset,i)var v=i.dgst;i=v,a=Error(r(419)),a.stack="",a.digest=i,au({value:a,source:null,stack:null}),t=Oc(l,t,e)}else if(jl||ha(l,t,e,!1),i=(e&l.childLanes)!==0,jl||i){if(i=hl,i!==null&&(a=Df(i,e),a!==0&&a!==f.retryLane))throw f.retryLane=a,Be(l,a),st(i,l,a),Ec;cf(c)||Bn(),t=Oc(l,t,e)}else cf(c)?(t.flags|=192,t.child=l.child,t=null):(l=f.treeContext,pl=Dt(c.nextSibling),Zl=t,F=!0,oe=null,Ot=!1,l!==null&&As(t,l),t=_c(t,a.children),t.flags|=4096);return t}return u?(ge(),c=a.fallback,u=t.mode,f=l.child,v=f.sibling,a=Kt(f,{mode:"hidden",children:a.children}),a.subtreeFlags=f.subtreeFlags&65011712,v!==null?c=Kt(v,c):(c=qe(c,u,e,null),c.flags|=2),c.return=t,a.return=t,a.sibling=c,t.child=a,ru(null,a),a=t.child,c=l.child.memoizedState,c===null?c=Tc(e):(u=c.cachePool,u!==null?(f=Ul._currentValue,u=u.parent!==f?{parent:f,pool:f}:u):u=Us(),c={baseLanes:c.baseLanes|e,cachePool:u}),a.memoizedState=c,a.childLanes=Ac(l,i,e),t.memoizedState=zc,ru(l.child,a)):(he(t),e=l.child,l=e.sibling,e=Kt(e,{mode:"visible",children:a.children}),e.return=t,e.sibling=null,l!==null&&(i=t.deletions,i===null?(t.deletions=[l],t.flags|=16):i.push(l)),t.child=e,t.memoizedState=null,e)}function _c(l,t){return t=On({mode:"visible",children:t},l.mode),t.return=l,l.child=t}function On(l,t){return l=mt(22,l,null,t),l.lanes=0,l}function Oc(l,t,e){return Ve(t,l.child,null,e),l=_c(t,t.pendingProps.children),l.flags|=2,t.memoizedState=null,l}function Ko(l,t,e){l.lanes|=t;var a=l.alternate;a!==null&&(a.lanes|=t),Zi(l.return,t,e)}function Nc(l,t,e,a,u,n){var i=l.memoizedState;i===null?l.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:a,tail:e,tailMode:u,treeForkCount:n}:(i.isBackwards=t,i.rendering=null,i.renderingStartTime=0,i.last=a,i.tail=e,i.tailMode=u,i.treeForkCount=n)}function Jo(l,t,e){var a=t.pendingProps,u=a.revealOrder,n=a.tail;a=a.children;var i=Nl.current,c=(i&2)!==0;if(c?(i=i&1|2,t.flags|=128):i&=1,A(Nl,i),Vl(l,t,a,e),a=F?eu:0,!c&&l!==null&&(l.flags&128)!==0)l:for(l=t.child;l!==null;){if(l.tag===13)l.memoizedState!==null&&Ko(l,e,t);else if(l.tag===19)Ko(l,e,t);else if(l.child!==null){l.child.return=l,l=l.child;continue}if(l===t)break l;for(;l.sibling===null;){if(l.return===null||l.return===t)break l;l=l.return}l.sibling.return=l.return,l=l.sibling}switch(u){case"forwards":for(e=t.child,u=null;e!==null;)l=e.alternate,l!==null&&rn(l)===null&&(u=e),e=e.sibling;e=u,e===null?(u=t.child,t.child=null):(u=e.sibling,e.sibling=null),Nc(t,!1,u,e,n,a);break;case"backwards":case"unstable_legacy-backwards":for(e=null,u=t.child,t.child=null;u!==null;){if(l=u.alternate,l!==null&&rn(l)===null){t.child=u;break}l=u.sibling,u.sibling=e,e=u,u=l}Nc(t,!0,e,null,n,a);break;case"together":Nc(t,!1,null,null,void 0,a);break;default:t.memoizedState=null}return t.child}function Ft(l,t,e){if(l!==null&&(t.dependencies=l.dependencies),pe|=t.lanes,(e&t.childLanes)===0)if(l!==null){if(ha(l,t,e,!1),(e&t.childLanes)===0)return null}else return null;if(l!==null&&t.child!==l.child)throw Error(r(153));if(t.child!==null){for(l=t.child,e=Kt(l,l.pendingProps),t.child=e,e.return=t;l.sibling!==null;)l=l.sibling,e=e.sibling=Kt(l,l.pendingProps),e.return=t;e.sibling=null}return t.child}function Dc(l,t){return(l.lanes&t)!==0?!0:(l=l.dependencies,!!(l!==null&&cn(l)))}function $m(l,t,e){switch(t.tag){case 3:Al(t,t.stateNode.containerInfo),me(t,Ul,l.memoizedState.cache),Ye();break;case 27:case 5:dl(t);break;case 4:Al(t,t.stateNode.containerInfo);break;case 10:me(t,t.type,t.memoizedProps.value);break;case 31:if(t.memoizedState!==null)return t.flags|=128,lc(t),null;break;case 13:var a=t.memoizedState;if(a!==null)return a.dehydrated!==null?(he(t),t.flags|=128,null):(e&t.child.childLanes)!==0?Vo(l,t,e):(he(t),l=Ft(l,t,e),l!==null?l.sibling:null);he(t);break;case 19:var u=(l.flags&128)!==0;if(a=(e&t.childLanes)!==0,a||(ha(l,t,e,!1),a=(e&t.childLanes)!==0),u){if(a)return Jo(l,t,e);t.flags|=128}if(u=t.memoizedState,u!==null&&(u.rendering=null,u.tail=null,u.lastEffect=null),A(Nl,Nl.current),a)break;return null;case 22:return t.lanes=0,Yo(l,t,e,t.pendingProps);case 24:me(t,Ul,l.memoizedState.cache)}return Ft(l,t,e)}function wo(l,t,e){if(l!==null)if(l.memoizedProps!==t.pendingProps)jl=!0;else{if(!Dc(l,e)&&(t.flags&128)===0)return jl=!1,$m(l,t,e);jl=(l.flags&131072)!==0}else jl=!1,F&&(t.flags&1048576)!==0&&Ts(t,eu,t.index);switch(t.lanes=0,t.tag){case 16:l:{var a=t.pendingProps;if(l=Ze(t.elementType),t.type=l,typeof l=="function")Ri(l)?(a=Je(l,a),t.tag=1,t=Zo(null,t,l,a,e)):(t.tag=0,t=xc(null,t,l,a,e));else{if(l!=null){var u=l.$$typeof;if(u===tt){t.tag=11,t=Ho(null,t,l,a,e);break l}else if(u===K){t.tag=14,t=Bo(null,t,l,a,e);break l}}throw t=et(l)||l,Error(r(306,t,""))}}return t;case 0:return xc(l,t,t.type,t.pendingProps,e);case 1:return a=t.type,u=Je(a,t.pendingProps),Zo(l,t,a,u,e);case 3:l:{if(Al(t,t.stateNode.containerInfo),l===null)throw Error(r(387));a=t.pendingProps;var n=t.memoizedState;u=n.element,ki(l,t),ou(t,a,null,e);var i=t.memoizedState;if(a=i.cache,me(t,Ul,a),a!==n.cache&&Li(t,[Ul],e,!0),su(),a=i.element,n.isDehydrated)if(n={element:a,isDehydrated:!1,cache:i.cache},t.updateQueue.baseState=n,t.memoizedState=n,t.flags&256){t=Lo(l,t,a,e);break l}else if(a!==u){u=Tt(Error(r(424)),t),au(u),t=Lo(l,t,a,e);break l}else{switch(l=t.stateNode.containerInfo,l.nodeType){case 9:l=l.body;break;default:l=l.nodeName==="HTML"?l.ownerDocument.body:l}for(pl=Dt(l.firstChild),Zl=t,F=!0,oe=null,Ot=!0,e=qs(t,null,a,e),t.child=e;e;)e.flags=e.flags&-3|4096,e=e.sibling}else{if(Ye(),a===u){t=Ft(l,t,e);break l}Vl(l,t,a,e)}t=t.child}return t;case 26:return _n(l,t),l===null?(e=u0(t.type,null,t.pendingProps,null))?t.memoizedState=e:F||(e=t.type,l=t.pendingProps,a=Ln(L.current).createElement(e),a[Xl]=t,a[at]=l,Kl(a,e,l),ql(a),t.stateNode=a):t.memoizedState=u0(t.type,l.memoizedProps,t.pendingProps,l.memoizedState),null;case 27:return dl(t),l===null&&F&&(a=t.stateNode=t0(t.type,t.pendingProps,L.current),Zl=t,Ot=!0,u=pl,Ae(t.type)?(sf=u,pl=Dt(a.firstChild)):pl=u),Vl(l,t,t.pendingProps.children,e),_n(l,t),l===null&&(t.flags|=4194304),t.child;case 5:return l===null&&F&&((u=a=pl)&&(a=_v(a,t.type,t.pendingProps,Ot),a!==null?(t.stateNode=a,Zl=t,pl=Dt(a.firstChild),Ot=!1,u=!0):u=!1),u||de(t)),dl(t),u=t.type,n=t.pendingProps,i=l!==null?l.memoizedProps:null,a=n.children,af(u,n)?a=null:i!==null&&af(u,i)&&(t.flags|=32),t.memoizedState!==null&&(u=ec(l,t,Xm,null,null,e),Mu._currentValue=u),_n(l,t),Vl(l,t,a,e),t.child;case 6:return l===null&&F&&((l=e=pl)&&(e=Ov(e,t.pendingProps,Ot),e!==null?(t.stateNode=e,Zl=t,pl=null,l=!0):l=!1),l||de(t)),null;case 13:return Vo(l,t,e);case 4:return Al(t,t.stateNode.containerInfo),a=t.pendingProps,l===null?t.child=Ve(t,null,a,e):Vl(l,t,a,e),t.child;case 11:return Ho(l,t,t.type,t.pendingProps,e);case 7:return Vl(l,t,t.pendingProps,e),t.child;case 8:return Vl(l,t,t.pendingProps.children,e),t.child;case 12:return Vl(l,t,t.pendingProps.children,e),t.child;case 10:return a=t.pendingProps,me(t,t.type,a.value),Vl(l,t,a.children,e),t.child;case 9:return u=t.type._context,a=t.pendingProps.children,Qe(t),u=Ll(u),a=a(u),t.flags|=1,Vl(l,t,a,e),t.child;case 14:return Bo(l,t,t.type,t.pendingProps,e);case 15:return qo(l,t,t.type,t.pendingProps,e);case 19:return Jo(l,t,e);case 31:return km(l,t,e);case 22:return Yo(l,t,e,t.pendingProps);case 24:return Qe(t),a=Ll(Ul),l===null?(u=Ji(),u===null&&(u=hl,n=Vi(),u.pooledCache=n,n.refCount++,n!==null&&(u.pooledCacheLanes|=e),u=n),t.memoizedState={parent:a,cache:u},Wi(t),me(t,Ul,u)):((l.lanes&e)!==0&&(ki(l,t),ou(t,null,null,e),su()),u=l.memoizedState,n=t.memoizedState,u.parent!==a?(u={parent:a,cache:a},t.memoizedState=u,t.lanes===0&&(t.memoizedState=t.updateQueue.baseState=u),me(t,Ul,a)):(a=n.cache,me(t,Ul,a),a!==u.cache&&Li(t,[Ul],e,!0))),Vl(l,t,t.pendingProps.children,e),t.child;case 29:throw t.pendingProps}throw Error(r(156,t.tag))}function It(l){l.flags|=4}function Mc(l,t,e,a,u){if((t=(l.mode&32)!==0)&&(t=!1),t){if(l.flags|=16777216,(u&335544128)===u)if(l.stateNode.complete)l.flags|=8192;else if(pd())l.flags|=8192;else throw Le=dn,wi}else l.flags&=-16777217}function Wo(l,t){if(t.type!=="stylesheet"||(t.state.loading&4)!==0)l.flags&=-16777217;else if(l.flags|=16777216,!s0(t))if(pd())l.flags|=8192;else throw Le=dn,wi}function Nn(l,t){t!==null&&(l.flags|=4),l.flags&16384&&(t=l.tag!==22?_f():536870912,l.lanes|=t,Na|=t)}function hu(l,t){if(!F)switch(l.tailMode){case"hidden":t=l.tail;for(var e=null;t!==null;)t.alternate!==null&&(e=t),t=t.sibling;e===null?l.tail=null:e.sibling=null;break;case"collapsed":e=l.tail;for(var a=null;e!==null;)e.alternate!==null&&(a=e),e=e.sibling;a===null?t||l.tail===null?l.tail=null:l.tail.sibling=null:a.sibling=null}}function El(l){var t=l.alternate!==null&&l.alternate.child===l.child,e=0,a=0;if(t)for(var u=l.child;u!==null;)e|=u.lanes|u.childLanes,a|=u.subtreeFlags&65011712,a|=u.flags&65011712,u.return=l,u=u.sibling;else for(u=l.child;u!==null;)e|=u.lanes|u.childLanes,a|=u.subtreeFlags,a|=u.flags,u.return=l,u=u.sibling;return l.subtreeFlags|=a,l.childLanes=e,t}function Fm(l,t,e){var a=t.pendingProps;switch(Yi(t),t.tag){case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return El(t),null;case 1:return El(t),null;case 3:return e=t.stateNode,a=null,l!==null&&(a=l.memoizedState.cache),t.memoizedState.cache!==a&&(t.flags|=2048),Wt(Ul),Sl(),e.pendingContext&&(e.context=e.pendingContext,e.pendingContext=null),(l===null||l.child===null)&&(ra(t)?It(t):l===null||l.memoizedState.isDehydrated&&(t.flags&256)===0||(t.flags|=1024,Qi())),El(t),null;case 26:var u=t.type,n=t.memoizedState;return l===null?(It(t),n!==null?(El(t),Wo(t,n)):(El(t),Mc(t,u,null,a,e))):n?n!==l.memoizedState?(It(t),El(t),Wo(t,n)):(El(t),t.flags&=-16777217):(l=l.memoizedProps,l!==a&&It(t),El(t),Mc(t,u,l,a,e)),null;case 27:if(ke(t),e=L.current,u=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==a&&It(t);else{if(!a){if(t.stateNode===null)throw Error(r(166));return El(t),null}l=D.current,ra(t)?_s(t):(l=t0(u,a,e),t.stateNode=l,It(t))}return El(t),null;case 5:if(ke(t),u=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==a&&It(t);else{if(!a){if(t.stateNode===null)throw Error(r(166));return El(t),null}if(n=D.current,ra(t))_s(t);else{var i=Ln(L.current);switch(n){case 1:n=i.createElementNS("http://www.w3.org/2000/svg",u);break;case 2:n=i.createElementNS("http://www.w3.org/1998/Math/MathML",u);break;default:switch(u){case"svg":n=i.createElementNS("http://www.w3.org/2000/svg",u);break;case"math":n=i.createElementNS("http://www.w3.org/1998/Math/MathML",u);break;case"script":n=i.createElement("div"),n.innerHTML="<script><\/script>",n=n.removeChild(n.firstChild);break;case"select":n=typeof a.is=="string"?i.createElement("select",{is:a.is}):i.createElement("select"),a.multiple?n.multiple=!0:a.size&&(n.size=a.size);break;default:n=typeof a.is=="string"?i.createElement(u,{is:a.is}):i.createElement(u)}}n[Xl]=t,n[at]=a;l:for(i=t.child;i!==null;){if(i.tag===5||i.tag===6)n.appendChild(i.stateNode);else if(i.tag!==4&&i.tag!==27&&i.child!==null){i.child.return=i,i=i.child;continue}if(i===t)break l;for(;i.sibling===null;){if(i.return===null||i.return===t)break l;i=i.return}i.sibling.return=i.return,i=i.sibling}t.stateNode=n;l:switch(Kl(n,u,a),u){case"button":case"input":case"select":case"textarea":a=!!a.autoFocus;break l;case"img":a=!0;break l;default:a=!1}a&&It(t)}}return El(t),Mc(t,t.type,l===null?null:l.memoizedProps,t.pendingProps,e),null;case 6:if(l&&t.stateNode!=null)l.memoizedProps!==a&&It(t);else{if(typeof a!="string"&&t.stateNode===null)throw Error(r(166));if(l=L.current,ra(t)){if(l=t.stateNode,e=t.memoizedProps,a=null,u=Zl,u!==null)switch(u.tag){case 27:case 5:a=u.memoizedProps}l[Xl]=t,l=!!(l.nodeValue===e||a!==null&&a.suppressHydrationWarning===!0||Vd(l.nodeValue,e)),l||de(t,!0)}else l=Ln(l).createTextNode(a),l[Xl]=t,t.stateNode=l}return El(t),null;case 31:if(e=t.memoizedState,l===null||l.memoizedState!==null){if(a=ra(t),e!==null){if(l===null){if(!a)throw Error(r(318));if(l=t.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(r(557));l[Xl]=t}else Ye(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;El(t),l=!1}else e=Qi(),l!==null&&l.memoizedState!==null&&(l.memoizedState.hydrationErrors=e),l=!0;if(!l)return t.flags&256?(yt(t),t):(yt(t),null);if((t.flags&128)!==0)throw Error(r(558))}return El(t),null;case 13:if(a=t.memoizedState,l===null||l.memoizedState!==null&&l.memoizedState.dehydrated!==null){if(u=ra(t),a!==null&&a.dehydrated!==null){if(l===null){if(!u)throw Error(r(318));if(u=t.memoizedState,u=u!==null?u.dehydrated:null,!u)throw Error(r(317));u[Xl]=t}else Ye(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;El(t),u=!1}else u=Qi(),l!==null&&l.memoizedState!==null&&(l.memoizedState.hydrationErrors=u),u=!0;if(!u)return t.flags&256?(yt(t),t):(yt(t),null)}return yt(t),(t.flags&128)!==0?(t.lanes=e,t):(e=a!==null,l=l!==null&&l.memoizedState!==null,e&&(a=t.child,u=null,a.alternate!==null&&a.alternate.memoizedState!==null&&a.alternate.memoizedState.cachePool!==null&&(u=a.alternate.memoizedState.cachePool.pool),n=null,a.memoizedState!==null&&a.memoizedState.cachePool!==null&&(n=a.memoizedState.cachePool.pool),n!==u&&(a.flags|=2048)),e!==l&&e&&(t.child.flags|=8192),Nn(t,t.updateQueue),El(t),null);case 4:return Sl(),l===null&&Ic(t.stateNode.containerInfo),El(t),null;case 10:return Wt(t.type),El(t),null;case 19:if(x(Nl),a=t.memoizedState,a===null)return El(t),null;if(u=(t.flags&128)!==0,n=a.rendering,n===null)if(u)hu(a,!1);else{if(Ol!==0||l!==null&&(l.flags&128)!==0)for(l=t.child;l!==null;){if(n=rn(l),n!==null){for(t.flags|=128,hu(a,!1),l=n.updateQueue,t.updateQueue=l,Nn(t,l),t.subtreeFlags=0,l=e,e=t.child;e!==null;)Es(e,l),e=e.sibling;return A(Nl,Nl.current&1|2),F&&Jt(t,a.treeForkCount),t.child}l=l.sibling}a.tail!==null&&Il()>jn&&(t.flags|=128,u=!0,hu(a,!1),t.lanes=4194304)}else{if(!u)if(l=rn(n),l!==null){if(t.flags|=128,u=!0,l=l.updateQueue,t.updateQueue=l,Nn(t,l),hu(a,!0),a.tail===null&&a.tailMode==="hidden"&&!n.alternate&&!F)return El(t),null}else 2*Il()-a.renderingStartTime>jn&&e!==536870912&&(t.flags|=128,u=!0,hu(a,!1),t.lanes=4194304);a.isBackwards?(n.sibling=t.child,t.child=n):(l=a.last,l!==null?l.sibling=n:t.child=n,a.last=n)}return a.tail!==null?(l=a.tail,a.rendering=l,a.tail=l.sibling,a.renderingStartTime=Il(),l.sibling=null,e=Nl.current,A(Nl,u?e&1|2:e&1),F&&Jt(t,a.treeForkCount),l):(El(t),null);case 22:case 23:return yt(t),Pi(),a=t.memoizedState!==null,l!==null?l.memoizedState!==null!==a&&(t.flags|=8192):a&&(t.flags|=8192),a?(e&536870912)!==0&&(t.flags&128)===0&&(El(t),t.subtreeFlags&6&&(t.flags|=8192)):El(t),e=t.updateQueue,e!==null&&Nn(t,e.retryQueue),e=null,l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(e=l.memoizedState.cachePool.pool),a=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(a=t.memoizedState.cachePool.pool),a!==e&&(t.flags|=2048),l!==null&&x(Xe),null;case 24:return e=null,l!==null&&(e=l.memoizedState.cache),t.memoizedState.cache!==e&&(t.flags|=2048),Wt(Ul),El(t),null;case 25:return null;case 30:return null}throw Error(r(156,t.tag))}function Im(l,t){switch(Yi(t),t.tag){case 1:return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 3:return Wt(Ul),Sl(),l=t.flags,(l&65536)!==0&&(l&128)===0?(t.flags=l&-65537|128,t):null;case 26:case 27:case 5:return ke(t),null;case 31:if(t.memoizedState!==null){if(yt(t),t.alternate===null)throw Error(r(340));Ye()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 13:if(yt(t),l=t.memoizedState,l!==null&&l.dehydrated!==null){if(t.alternate===null)throw Error(r(340));Ye()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 19:return x(Nl),null;case 4:return Sl(),null;case 10:return Wt(t.type),null;case 22:case 23:return yt(t),Pi(),l!==null&&x(Xe),l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 24:return Wt(Ul),null;case 25:return null;default:return null}}function ko(l,t){switch(Yi(t),t.tag){case 3:Wt(Ul),Sl();break;case 26:case 27:case 5:ke(t);break;case 4:Sl();break;case 31:t.memoizedState!==null&&yt(t);break;case 13:yt(t);break;case 19:x(Nl);break;case 10:Wt(t.type);break;case 22:case 23:yt(t),Pi(),l!==null&&x(Xe);break;case 24:Wt(Ul)}}function gu(l,t){try{var e=t.updateQueue,a=e!==null?e.lastEffect:null;if(a!==null){var u=a.next;e=u;do{if((e.tag&l)===l){a=void 0;var n=e.create,i=e.inst;a=n(),i.destroy=a}e=e.next}while(e!==u)}}catch(c){sl(t,t.return,c)}}function Se(l,t,e){try{var a=t.updateQueue,u=a!==null?a.lastEffect:null;if(u!==null){var n=u.next;a=n;do{if((a.tag&l)===l){var i=a.inst,c=i.destroy;if(c!==void 0){i.destroy=void 0,u=t;var f=e,v=c;try{v()}catch(S){sl(u,f,S)}}}a=a.next}while(a!==n)}}catch(S){sl(t,t.return,S)}}function $o(l){var t=l.updateQueue;if(t!==null){var e=l.stateNode;try{Gs(t,e)}catch(a){sl(l,l.return,a)}}}function Fo(l,t,e){e.props=Je(l.type,l.memoizedProps),e.state=l.memoizedState;try{e.componentWillUnmount()}catch(a){sl(l,t,a)}}function Su(l,t){try{var e=l.ref;if(e!==null){switch(l.tag){case 26:case 27:case 5:var a=l.stateNode;break;case 30:a=l.stateNode;break;default:a=l.stateNode}typeof e=="function"?l.refCleanup=e(a):e.current=a}}catch(u){sl(l,t,u)}}function qt(l,t){var e=l.ref,a=l.refCleanup;if(e!==null)if(typeof a=="function")try{a()}catch(u){sl(l,t,u)}finally{l.refCleanup=null,l=l.alternate,l!=null&&(l.refCleanup=null)}else if(typeof e=="function")try{e(null)}catch(u){sl(l,t,u)}else e.current=null}function Io(l){var t=l.type,e=l.memoizedProps,a=l.stateNode;try{l:switch(t){case"button":case"input":case"select":case"textarea":e.autoFocus&&a.focus();break l;case"img":e.src?a.src=e.src:e.srcSet&&(a.srcset=e.srcSet)}}catch(u){sl(l,l.return,u)}}function Uc(l,t,e){try{var a=l.stateNode;pv(a,l.type,e,t),a[at]=t}catch(u){sl(l,l.return,u)}}function Po(l){return l.tag===5||l.tag===3||l.tag===26||l.tag===27&&Ae(l.type)||l.tag===4}function Cc(l){l:for(;;){for(;l.sibling===null;){if(l.return===null||Po(l.return))return null;l=l.return}for(l.sibling.return=l.return,l=l.sibling;l.tag!==5&&l.tag!==6&&l.tag!==18;){if(l.tag===27&&Ae(l.type)||l.flags&2||l.child===null||l.tag===4)continue l;l.child.return=l,l=l.child}if(!(l.flags&2))return l.stateNode}}function jc(l,t,e){var a=l.tag;if(a===5||a===6)l=l.stateNode,t?(e.nodeType===9?e.body:e.nodeName==="HTML"?e.ownerDocument.body:e).insertBefore(l,t):(t=e.nodeType===9?e.body:e.nodeName==="HTML"?e.ownerDocument.body:e,t.appendChild(l),e=e._reactRootContainer,e!=null||t.onclick!==null||(t.onclick=Lt));else if(a!==4&&(a===27&&Ae(l.type)&&(e=l.stateNode,t=null),l=l.child,l!==null))for(jc(l,t,e),l=l.sibling;l!==null;)jc(l,t,e),l=l.sibling}function Dn(l,t,e){var a=l.tag;if(a===5||a===6)l=l.stateNode,t?e.insertBefore(l,t):e.appendChild(l);else if(a!==4&&(a===27&&Ae(l.type)&&(e=l.stateNode),l=l.child,l!==null))for(Dn(l,t,e),l=l.sibling;l!==null;)Dn(l,t,e),l=l.sibling}function ld(l){var t=l.stateNode,e=l.memoizedProps;try{for(var a=l.type,u=t.attributes;u.length;)t.removeAttributeNode(u[0]);Kl(t,a,e),t[Xl]=l,t[at]=e}catch(n){sl(l,l.return,n)}}var Pt=!1,Rl=!1,Rc=!1,td=typeof WeakSet=="function"?WeakSet:Set,Yl=null;function Pm(l,t){if(l=l.containerInfo,tf=$n,l=ms(l),Oi(l)){if("selectionStart"in l)var e={start:l.selectionStart,end:l.selectionEnd};else l:{e=(e=l.ownerDocument)&&e.defaultView||window;var a=e.getSelection&&e.getSelection();if(a&&a.rangeCount!==0){e=a.anchorNode;var u=a.anchorOffset,n=a.focusNode;a=a.focusOffset;try{e.nodeType,n.nodeType}catch{e=null;break l}var i=0,c=-1,f=-1,v=0,S=0,E=l,y=null;t:for(;;){for(var h;E!==e||u!==0&&E.nodeType!==3||(c=i+u),E!==n||a!==0&&E.nodeType!==3||(f=i+a),E.nodeType===3&&(i+=E.nodeValue.length),(h=E.firstChild)!==null;)y=E,E=h;for(;;){if(E===l)break t;if(y===e&&++v===u&&(c=i),y===n&&++S===a&&(f=i),(h=E.nextSibling)!==null)break;E=y,y=E.parentNode}E=h}e=c===-1||f===-1?null:{start:c,end:f}}else e=null}e=e||{start:0,end:0}}else e=null;for(ef={focusedElem:l,selectionRange:e},$n=!1,Yl=t;Yl!==null;)if(t=Yl,l=t.child,(t.subtreeFlags&1028)!==0&&l!==null)l.return=t,Yl=l;else for(;Yl!==null;){switch(t=Yl,n=t.alternate,l=t.flags,t.tag){case 0:if((l&4)!==0&&(l=t.updateQueue,l=l!==null?l.events:null,l!==null))for(e=0;e<l.length;e++)u=l[e],u.ref.impl=u.nextImpl;break;case 11:case 15:break;case 1:if((l&1024)!==0&&n!==null){l=void 0,e=t,u=n.memoizedProps,n=n.memoizedState,a=e.stateNode;try{var N=Je(e.type,u);l=a.getSnapshotBeforeUpdate(N,n),a.__reactInternalSnapshotBeforeUpdate=l}catch(B){sl(e,e.return,B)}}break;case 3:if((l&1024)!==0){if(l=t.stateNode.containerInfo,e=l.nodeType,e===9)nf(l);else if(e===1)switch(l.nodeName){case"HEAD":case"HTML":case"BODY":nf(l);break;default:l.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((l&1024)!==0)throw Error(r(163))}if(l=t.sibling,l!==null){l.return=t.return,Yl=l;break}Yl=t.return}}function ed(l,t,e){var a=e.flags;switch(e.tag){case 0:case 11:case 15:te(l,e),a&4&&gu(5,e);break;case 1:if(te(l,e),a&4)if(l=e.stateNode,t===null)try{l.componentDidMount()}catch(i){sl(e,e.return,i)}else{var u=Je(e.type,t.memoizedProps);t=t.memoizedState;try{l.componentDidUpdate(u,t,l.__reactInternalSnapshotBeforeUpdate)}catch(i){sl(e,e.return,i)}}a&64&&$o(e),a&512&&Su(e,e.return);break;case 3:if(te(l,e),a&64&&(l=e.updateQueue,l!==null)){if(t=null,e.child!==null)switch(e.child.tag){case 27:case 5:t=e.child.stateNode;break;case 1:t=e.child.stateNode}try{Gs(l,t)}catch(i){sl(e,e.return,i)}}break;case 27:t===null&&a&4&&ld(e);case 26:case 5:te(l,e),t===null&&a&4&&Io(e),a&512&&Su(e,e.return);break;case 12:te(l,e);break;case 31:te(l,e),a&4&&nd(l,e);break;case 13:te(l,e),a&4&&id(l,e),a&64&&(l=e.memoizedState,l!==null&&(l=l.dehydrated,l!==null&&(e=fv.bind(null,e),Nv(l,e))));break;case 22:if(a=e.memoizedState!==null||Pt,!a){t=t!==null&&t.memoizedState!==null||Rl,u=Pt;var n=Rl;Pt=a,(Rl=t)&&!n?ee(l,e,(e.subtreeFlags&8772)!==0):te(l,e),Pt=u,Rl=n}break;case 30:break;default:te(l,e)}}function ad(l){var t=l.alternate;t!==null&&(l.alternate=null,ad(t)),l.child=null,l.deletions=null,l.sibling=null,l.tag===5&&(t=l.stateNode,t!==null&&oi(t)),l.stateNode=null,l.return=null,l.dependencies=null,l.memoizedProps=null,l.memoizedState=null,l.pendingProps=null,l.stateNode=null,l.updateQueue=null}var xl=null,nt=!1;function le(l,t,e){for(e=e.child;e!==null;)ud(l,t,e),e=e.sibling}function ud(l,t,e){if(cl&&typeof cl.onCommitFiberUnmount=="function")try{cl.onCommitFiberUnmount(bl,e)}catch{}switch(e.tag){case 26:Rl||qt(e,t),le(l,t,e),e.memoizedState?e.memoizedState.count--:e.stateNode&&(e=e.stateNode,e.parentNode.removeChild(e));break;case 27:Rl||qt(e,t);var a=xl,u=nt;Ae(e.type)&&(xl=e.stateNode,nt=!1),le(l,t,e),Ou(e.stateNode),xl=a,nt=u;break;case 5:Rl||qt(e,t);case 6:if(a=xl,u=nt,xl=null,le(l,t,e),xl=a,nt=u,xl!==null)if(nt)try{(xl.nodeType===9?xl.body:xl.nodeName==="HTML"?xl.ownerDocument.body:xl).removeChild(e.stateNode)}catch(n){sl(e,t,n)}else try{xl.removeChild(e.stateNode)}catch(n){sl(e,t,n)}break;case 18:xl!==null&&(nt?(l=xl,$d(l.nodeType===9?l.body:l.nodeName==="HTML"?l.ownerDocument.body:l,e.stateNode),Ba(l)):$d(xl,e.stateNode));break;case 4:a=xl,u=nt,xl=e.stateNode.containerInfo,nt=!0,le(l,t,e),xl=a,nt=u;break;case 0:case 11:case 14:case 15:Se(2,e,t),Rl||Se(4,e,t),le(l,t,e);break;case 1:Rl||(qt(e,t),a=e.stateNode,typeof a.componentWillUnmount=="function"&&Fo(e,t,a)),le(l,t,e);break;case 21:le(l,t,e);break;case 22:Rl=(a=Rl)||e.memoizedState!==null,le(l,t,e),Rl=a;break;default:le(l,t,e)}}function nd(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null))){l=l.dehydrated;try{Ba(l)}catch(e){sl(t,t.return,e)}}}function id(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null&&(l=l.dehydrated,l!==null))))try{Ba(l)}catch(e){sl(t,t.return,e)}}function lv(l){switch(l.tag){case 31:case 13:case 19:var t=l.stateNode;return t===null&&(t=l.stateNode=new td),t;case 22:return l=l.stateNode,t=l._retryCache,t===null&&(t=l._retryCache=new td),t;default:throw Error(r(435,l.tag))}}function Mn(l,t){var e=lv(l);t.forEach(function(a){if(!e.has(a)){e.add(a);var u=sv.bind(null,l,a);a.then(u,u)}})}function it(l,t){var e=t.deletions;if(e!==null)for(var a=0;a<e.length;a++){var u=e[a],n=l,i=t,c=i;l:for(;c!==null;){switch(c.tag){case 27:if(Ae(c.type)){xl=c.stateNode,nt=!1;break l}break;case 5:xl=c.stateNode,nt=!1;break l;case 3:case 4:xl=c.stateNode.containerInfo,nt=!0;break l}c=c.return}if(xl===null)throw Error(r(160));ud(n,i,u),xl=null,nt=!1,n=u.alternate,n!==null&&(n.return=null),u.return=null}if(t.subtreeFlags&13886)for(t=t.child;t!==null;)cd(t,l),t=t.sibling}var jt=null;function cd(l,t){var e=l.alternate,a=l.flags;switch(l.tag){case 0:case 11:case 14:case 15:it(t,l),ct(l),a&4&&(Se(3,l,l.return),gu(3,l),Se(5,l,l.return));break;case 1:it(t,l),ct(l),a&512&&(Rl||e===null||qt(e,e.return)),a&64&&Pt&&(l=l.updateQueue,l!==null&&(a=l.callbacks,a!==null&&(e=l.shared.hiddenCallbacks,l.shared.hiddenCallbacks=e===null?a:e.concat(a))));break;case 26:var u=jt;if(it(t,l),ct(l),a&512&&(Rl||e===null||qt(e,e.return)),a&4){var n=e!==null?e.memoizedState:null;if(a=l.memoizedState,e===null)if(a===null)if(l.stateNode===null){l:{a=l.type,e=l.memoizedProps,u=u.ownerDocument||u;t:switch(a){case"title":n=u.getElementsByTagName("title")[0],(!n||n[Ka]||n[Xl]||n.namespaceURI==="http://www.w3.org/2000/svg"||n.hasAttribute("itemprop"))&&(n=u.createElement(a),u.head.insertBefore(n,u.querySelector("head > title"))),Kl(n,a,e),n[Xl]=l,ql(n),a=n;break l;case"link":var i=c0("link","href",u).get(a+(e.href||""));if(i){for(var c=0;c<i.length;c++)if(n=i[c],n.getAttribute("href")===(e.href==null||e.href===""?null:e.href)&&n.getAttribute("rel")===(e.rel==null?null:e.rel)&&n.getAttribute("title")===(e.title==null?null:e.title)&&n.getAttribute("crossorigin")===(e.crossOrigin==null?null:e.crossOrigin)){i.splice(c,1);break t}}n=u.createElement(a),Kl(n,a,e),u.head.appendChild(n);break;case"meta":if(i=c0("meta","content",u).get(a+(e.content||""))){for(c=0;c<i.length;c++)if(n=i[c],n.getAttribute("content")===(e.content==null?null:""+e.content)&&n.getAttribute("name")===(e.name==null?null:e.name)&&n.getAttribute("property")===(e.property==null?null:e.property)&&n.getAttribute("http-equiv")===(e.httpEquiv==null?null:e.httpEquiv)&&n.getAttribute("charset")===(e.charSet==null?null:e.charSet)){i.splice(c,1);break t}}n=u.createElement(a),Kl(n,a,e),u.head.appendChild(n);break;default:throw Error(r(468,a))}n[Xl]=l,ql(n),a=n}l.stateNode=a}else f0(u,l.type,l.stateNode);else l.stateNode=i0(u,a,l.memoizedProps);else n!==a?(n===null?e.stateNode!==null&&(e=e.stateNode,e.parentNode.removeChild(e)):n.count--,a===null?f0(u,l.type,l.stateNode):i0(u,a,l.memoizedProps)):a===null&&l.stateNode!==null&&Uc(l,l.memoizedProps,e.memoizedProps)}break;case 27:it(t,l),ct(l),a&512&&(Rl||e===null||qt(e,e.return)),e!==null&&a&4&&Uc(l,l.memoizedProps,e.memoizedProps);break;case 5:if(it(t,l),ct(l),a&512&&(Rl||e===null||qt(e,e.return)),l.flags&32){u=l.stateNode;try{na(u,"")}catch(N){sl(l,l.return,N)}}a&4&&l.stateNode!=null&&(u=l.memoizedProps,Uc(l,u,e!==null?e.memoizedProps:u)),a&1024&&(Rc=!0);break;case 6:if(it(t,l),ct(l),a&4){if(l.stateNode===null)throw Error(r(162));a=l.memoizedProps,e=l.stateNode;try{e.nodeValue=a}catch(N){sl(l,l.return,N)}}break;case 3:if(Jn=null,u=jt,jt=Vn(t.containerInfo),it(t,l),jt=u,ct(l),a&4&&e!==null&&e.memoizedState.isDehydrated)try{Ba(t.containerInfo)}catch(N){sl(l,l.return,N)}Rc&&(Rc=!1,fd(l));break;case 4:a=jt,jt=Vn(l.stateNode.containerInfo),it(t,l),ct(l),jt=a;break;case 12:it(t,l),ct(l);break;case 31:it(t,l),ct(l),a&4&&(a=l.updateQueue,a!==null&&(l.updateQueue=null,Mn(l,a)));break;case 13:it(t,l),ct(l),l.child.flags&8192&&l.memoizedState!==null!=(e!==null&&e.memoizedState!==null)&&(Cn=Il()),a&4&&(a=l.updateQueue,a!==null&&(l.updateQueue=null,Mn(l,a)));break;case 22:u=l.memoizedState!==null;var f=e!==null&&e.memoizedState!==null,v=Pt,S=Rl;if(Pt=v||u,Rl=S||f,it(t,l),Rl=S,Pt=v,ct(l),a&8192)l:for(t=l.stateNode,t._visibility=u?t._visibility&-2:t._visibility|1,u&&(e===null||f||Pt||Rl||we(l)),e=null,t=l;;){if(t.tag===5||t.tag===26){if(e===null){f=e=t;try{if(n=f.stateNode,u)i=n.style,typeof i.setProperty=="function"?i.setProperty("display","none","important"):i.display="none";else{c=f.stateNode;var E=f.memoizedProps.style,y=E!=null&&E.hasOwnProperty("display")?E.display:null;c.style.display=y==null||typeof y=="boolean"?"":(""+y).trim()}}catch(N){sl(f,f.return,N)}}}else if(t.tag===6){if(e===null){f=t;try{f.stateNode.nodeValue=u?"":f.memoizedProps}catch(N){sl(f,f.return,N)}}}else if(t.tag===18){if(e===null){f=t;try{var h=f.stateNode;u?Fd(h,!0):Fd(f.stateNode,!1)}catch(N){sl(f,f.return,N)}}}else if((t.tag!==22&&t.tag!==23||t.memoizedState===null||t===l)&&t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break l;for(;t.sibling===null;){if(t.return===null||t.return===l)break l;e===t&&(e=null),t=t.return}e===t&&(e=null),t.sibling.return=t.return,t=t.sibling}a&4&&(a=l.updateQueue,a!==null&&(e=a.retryQueue,e!==null&&(a.retryQueue=null,Mn(l,e))));break;case 19:it(t,l),ct(l),a&4&&(a=l.updateQueue,a!==null&&(l.updateQueue=null,Mn(l,a)));break;case 30:break;case 21:break;default:it(t,l),ct(l)}}function ct(l){var t=l.flags;if(t&2){try{for(var e,a=l.return;a!==null;){if(Po(a)){e=a;break}a=a.return}if(e==null)throw Error(r(160));switch(e.tag){case 27:var u=e.stateNode,n=Cc(l);Dn(l,n,u);break;case 5:var i=e.stateNode;e.flags&32&&(na(i,""),e.flags&=-33);var c=Cc(l);Dn(l,c,i);break;case 3:case 4:var f=e.stateNode.containerInfo,v=Cc(l);jc(l,v,f);break;default:throw Error(r(161))}}catch(S){sl(l,l.return,S)}l.flags&=-3}t&4096&&(l.flags&=-4097)}function fd(l){if(l.subtreeFlags&1024)for(l=l.child;l!==null;){var t=l;fd(t),t.tag===5&&t.flags&1024&&t.stateNode.reset(),l=l.sibling}}function te(l,t){if(t.subtreeFlags&8772)for(t=t.child;t!==null;)ed(l,t.alternate,t),t=t.sibling}function we(l){for(l=l.child;l!==null;){var t=l;switch(t.tag){case 0:case 11:case 14:case 15:Se(4,t,t.return),we(t);break;case 1:qt(t,t.return);var e=t.stateNode;typeof e.componentWillUnmount=="function"&&Fo(t,t.return,e),we(t);break;case 27:Ou(t.stateNode);case 26:case 5:qt(t,t.return),we(t);break;case 22:t.memoizedState===null&&we(t);break;case 30:we(t);break;default:we(t)}l=l.sibling}}function ee(l,t,e){for(e=e&&(t.subtreeFlags&8772)!==0,t=t.child;t!==null;){var a=t.alternate,u=l,n=t,i=n.flags;switch(n.tag){case 0:case 11:case 15:ee(u,n,e),gu(4,n);break;case 1:if(ee(u,n,e),a=n,u=a.stateNode,typeof u.componentDidMount=="function")try{u.componentDidMount()}catch(v){sl(a,a.return,v)}if(a=n,u=a.updateQueue,u!==null){var c=a.stateNode;try{var f=u.shared.hiddenCallbacks;if(f!==null)for(u.shared.hiddenCallbacks=null,u=0;u<f.length;u++)Ys(f[u],c)}catch(v){sl(a,a.return,v)}}e&&i&64&&$o(n),Su(n,n.return);break;case 27:ld(n);case 26:case 5:ee(u,n,e),e&&a===null&&i&4&&Io(n),Su(n,n.return);break;case 12:ee(u,n,e);break;case 31:ee(u,n,e),e&&i&4&&nd(u,n);break;case 13:ee(u,n,e),e&&i&4&&id(u,n);break;case 22:n.memoizedState===null&&ee(u,n,e),Su(n,n.return);break;case 30:break;default:ee(u,n,e)}t=t.sibling}}function Hc(l,t){var e=null;l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(e=l.memoizedState.cachePool.pool),l=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(l=t.memoizedState.cachePool.pool),l!==e&&(l!=null&&l.refCount++,e!=null&&uu(e))}function Bc(l,t){l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&uu(l))}function Rt(l,t,e,a){if(t.subtreeFlags&10256)for(t=t.child;t!==null;)sd(l,t,e,a),t=t.sibling}function sd(l,t,e,a){var u=t.flags;switch(t.tag){case 0:case 11:case 15:Rt(l,t,e,a),u&2048&&gu(9,t);break;case 1:Rt(l,t,e,a);break;case 3:Rt(l,t,e,a),u&2048&&(l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&uu(l)));break;case 12:if(u&2048){Rt(l,t,e,a),l=t.stateNode;try{var n=t.memoizedProps,i=n.id,c=n.onPostCommit;typeof c=="function"&&c(i,t.alternate===null?"mount":"update",l.passiveEffectDuration,-0)}catch(f){sl(t,t.return,f)}}else Rt(l,t,e,a);break;case 31:Rt(l,t,e,a);break;case 13:Rt(l,t,e,a);break;case 23:break;case 22:n=t.stateNode,i=t.alternate,t.memoizedState!==null?n._visibility&2?Rt(l,t,e,a):bu(l,t):n._visibility&2?Rt(l,t,e,a):(n._visibility|=2,Aa(l,t,e,a,(t.subtreeFlags&10256)!==0||!1)),u&2048&&Hc(i,t);break;case 24:Rt(l,t,e,a),u&2048&&Bc(t.alternate,t);break;default:Rt(l,t,e,a)}}function Aa(l,t,e,a,u){for(u=u&&((t.subtreeFlags&10256)!==0||!1),t=t.child;t!==null;){var n=l,i=t,c=e,f=a,v=i.flags;switch(i.tag){case 0:case 11:case 15:Aa(n,i,c,f,u),gu(8,i);break;case 23:break;case 22:var S=i.stateNode;i.memoizedState!==null?S._visibility&2?Aa(n,i,c,f,u):bu(n,i):(S._visibility|=2,Aa(n,i,c,f,u)),u&&v&2048&&Hc(i.alternate,i);break;case 24:Aa(n,i,c,f,u),u&&v&2048&&Bc(i.alternate,i);break;default:Aa(n,i,c,f,u)}t=t.sibling}}function bu(l,t){if(t.subtreeFlags&10256)for(t=t.child;t!==null;){var e=l,a=t,u=a.flags;switch(a.tag){case 22:bu(e,a),u&2048&&Hc(a.alternate,a);break;case 24:bu(e,a),u&2048&&Bc(a.alternate,a);break;default:bu(e,a)}t=t.sibling}}var pu=8192;function _a(l,t,e){if(l.subtreeFlags&pu)for(l=l.child;l!==null;)od(l,t,e),l=l.sibling}function od(l,t,e){switch(l.tag){case 26:_a(l,t,e),l.flags&pu&&l.memoizedState!==null&&Qv(e,jt,l.memoizedState,l.memoizedProps);break;case 5:_a(l,t,e);break;case 3:case 4:var a=jt;jt=Vn(l.stateNode.containerInfo),_a(l,t,e),jt=a;break;case 22:l.memoizedState===null&&(a=l.alternate,a!==null&&a.memoizedState!==null?(a=pu,pu=16777216,_a(l,t,e),pu=a):_a(l,t,e));break;default:_a(l,t,e)}}function dd(l){var t=l.alternate;if(t!==null&&(l=t.child,l!==null)){t.child=null;do t=l.sibling,l.sibling=null,l=t;while(l!==null)}}function Eu(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var e=0;e<t.length;e++){var a=t[e];Yl=a,vd(a,l)}dd(l)}if(l.subtreeFlags&10256)for(l=l.child;l!==null;)md(l),l=l.sibling}function md(l){switch(l.tag){case 0:case 11:case 15:Eu(l),l.flags&2048&&Se(9,l,l.return);break;case 3:Eu(l);break;case 12:Eu(l);break;case 22:var t=l.stateNode;l.memoizedState!==null&&t._visibility&2&&(l.return===null||l.return.tag!==13)?(t._visibility&=-3,Un(l)):Eu(l);break;default:Eu(l)}}function Un(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var e=0;e<t.length;e++){var a=t[e];Yl=a,vd(a,l)}dd(l)}for(l=l.child;l!==null;){switch(t=l,t.tag){case 0:case 11:case 15:Se(8,t,t.return),Un(t);break;case 22:e=t.stateNode,e._visibility&2&&(e._visibility&=-3,Un(t));break;default:Un(t)}l=l.sibling}}function vd(l,t){for(;Yl!==null;){var e=Yl;switch(e.tag){case 0:case 11:case 15:Se(8,e,t);break;case 23:case 22:if(e.memoizedState!==null&&e.memoizedState.cachePool!==null){var a=e.memoizedState.cachePool.pool;a!=null&&a.refCount++}break;case 24:uu(e.memoizedState.cache)}if(a=e.child,a!==null)a.return=e,Yl=a;else l:for(e=l;Yl!==null;){a=Yl;var u=a.sibling,n=a.return;if(ad(a),a===e){Yl=null;break l}if(u!==null){u.return=n,Yl=u;break l}Yl=n}}}var tv={getCacheForType:function(l){var t=Ll(Ul),e=t.data.get(l);return e===void 0&&(e=l(),t.data.set(l,e)),e},cacheSignal:function(){return Ll(Ul).controller.signal}},ev=typeof WeakMap=="function"?WeakMap:Map,ul=0,hl=null,J=null,W=0,fl=0,rt=null,be=!1,Oa=!1,qc=!1,ae=0,Ol=0,pe=0,We=0,Yc=0,ht=0,Na=0,xu=null,ft=null,Gc=!1,Cn=0,yd=0,jn=1/0,Rn=null,Ee=null,Bl=0,xe=null,Da=null,ue=0,Qc=0,Xc=null,rd=null,zu=0,Zc=null;function gt(){return(ul&2)!==0&&W!==0?W&-W:g.T!==null?Wc():Mf()}function hd(){if(ht===0)if((W&536870912)===0||F){var l=Xu;Xu<<=1,(Xu&3932160)===0&&(Xu=262144),ht=l}else ht=536870912;return l=vt.current,l!==null&&(l.flags|=32),ht}function st(l,t,e){(l===hl&&(fl===2||fl===9)||l.cancelPendingCommit!==null)&&(Ma(l,0),ze(l,W,ht,!1)),Va(l,e),((ul&2)===0||l!==hl)&&(l===hl&&((ul&2)===0&&(We|=e),Ol===4&&ze(l,W,ht,!1)),Yt(l))}function gd(l,t,e){if((ul&6)!==0)throw Error(r(327));var a=!e&&(t&127)===0&&(t&l.expiredLanes)===0||La(l,t),u=a?nv(l,t):Vc(l,t,!0),n=a;do{if(u===0){Oa&&!a&&ze(l,t,0,!1);break}else{if(e=l.current.alternate,n&&!av(e)){u=Vc(l,t,!1),n=!1;continue}if(u===2){if(n=t,l.errorRecoveryDisabledLanes&n)var i=0;else i=l.pendingLanes&-536870913,i=i!==0?i:i&536870912?536870912:0;if(i!==0){t=i;l:{var c=l;u=xu;var f=c.current.memoizedState.isDehydrated;if(f&&(Ma(c,i).flags|=256),i=Vc(c,i,!1),i!==2){if(qc&&!f){c.errorRecoveryDisabledLanes|=n,We|=n,u=4;break l}n=ft,ft=u,n!==null&&(ft===null?ft=n:ft.push.apply(ft,n))}u=i}if(n=!1,u!==2)continue}}if(u===1){Ma(l,0),ze(l,t,0,!0);break}l:{switch(a=l,n=u,n){case 0:case 1:throw Error(r(345));case 4:if((t&4194048)!==t)break;case 6:ze(a,t,ht,!be);break l;case 2:ft=null;break;case 3:case 5:break;default:throw Error(r(329))}if((t&62914560)===t&&(u=Cn+300-Il(),10<u)){if(ze(a,t,ht,!be),Lu(a,0,!0)!==0)break l;ue=t,a.timeoutHandle=Wd(Sd.bind(null,a,e,ft,Rn,Gc,t,ht,We,Na,be,n,"Throttled",-0,0),u);break l}Sd(a,e,ft,Rn,Gc,t,ht,We,Na,be,n,null,-0,0)}}break}while(!0);Yt(l)}function Sd(l,t,e,a,u,n,i,c,f,v,S,E,y,h){if(l.timeoutHandle=-1,E=t.subtreeFlags,E&8192||(E&16785408)===16785408){E={stylesheets:null,count:0,imgCount:0,imgBytes:0,suspenseyImages:[],waitingForImages:!0,waitingForViewTransition:!1,unsuspend:Lt},od(t,n,E);var N=(n&62914560)===n?Cn-Il():(n&4194048)===n?yd-Il():0;if(N=Xv(E,N),N!==null){ue=n,l.cancelPendingCommit=N(_d.bind(null,l,t,n,e,a,u,i,c,f,S,E,null,y,h)),ze(l,n,i,!v);return}}_d(l,t,n,e,a,u,i,c,f)}function av(l){for(var t=l;;){var e=t.tag;if((e===0||e===11||e===15)&&t.flags&16384&&(e=t.updateQueue,e!==null&&(e=e.stores,e!==null)))for(var a=0;a<e.length;a++){var u=e[a],n=u.getSnapshot;u=u.value;try{if(!dt(n(),u))return!1}catch{return!1}}if(e=t.child,t.subtreeFlags&16384&&e!==null)e.return=t,t=e;else{if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function ze(l,t,e,a){t&=~Yc,t&=~We,l.suspendedLanes|=t,l.pingedLanes&=~t,a&&(l.warmLanes|=t),a=l.expirationTimes;for(var u=t;0<u;){var n=31-Pl(u),i=1<<n;a[n]=-1,u&=~i}e!==0&&Of(l,e,t)}function Hn(){return(ul&6)===0?(Tu(0),!1):!0}function Lc(){if(J!==null){if(fl===0)var l=J.return;else l=J,wt=Ge=null,nc(l),pa=null,iu=0,l=J;for(;l!==null;)ko(l.alternate,l),l=l.return;J=null}}function Ma(l,t){var e=l.timeoutHandle;e!==-1&&(l.timeoutHandle=-1,zv(e)),e=l.cancelPendingCommit,e!==null&&(l.cancelPendingCommit=null,e()),ue=0,Lc(),hl=l,J=e=Kt(l.current,null),W=t,fl=0,rt=null,be=!1,Oa=La(l,t),qc=!1,Na=ht=Yc=We=pe=Ol=0,ft=xu=null,Gc=!1,(t&8)!==0&&(t|=t&32);var a=l.entangledLanes;if(a!==0)for(l=l.entanglements,a&=t;0<a;){var u=31-Pl(a),n=1<<u;t|=l[u],a&=~n}return ae=t,tn(),e}function bd(l,t){X=null,g.H=yu,t===ba||t===on?(t=Rs(),fl=3):t===wi?(t=Rs(),fl=4):fl=t===Ec?8:t!==null&&typeof t=="object"&&typeof t.then=="function"?6:1,rt=t,J===null&&(Ol=1,Tn(l,Tt(t,l.current)))}function pd(){var l=vt.current;return l===null?!0:(W&4194048)===W?Nt===null:(W&62914560)===W||(W&536870912)!==0?l===Nt:!1}function Ed(){var l=g.H;return g.H=yu,l===null?yu:l}function xd(){var l=g.A;return g.A=tv,l}function Bn(){Ol=4,be||(W&4194048)!==W&&vt.current!==null||(Oa=!0),(pe&134217727)===0&&(We&134217727)===0||hl===null||ze(hl,W,ht,!1)}function Vc(l,t,e){var a=ul;ul|=2;var u=Ed(),n=xd();(hl!==l||W!==t)&&(Rn=null,Ma(l,t)),t=!1;var i=Ol;l:do try{if(fl!==0&&J!==null){var c=J,f=rt;switch(fl){case 8:Lc(),i=6;break l;case 3:case 2:case 9:case 6:vt.current===null&&(t=!0);var v=fl;if(fl=0,rt=null,Ua(l,c,f,v),e&&Oa){i=0;break l}break;default:v=fl,fl=0,rt=null,Ua(l,c,f,v)}}uv(),i=Ol;break}catch(S){bd(l,S)}while(!0);return t&&l.shellSuspendCounter++,wt=Ge=null,ul=a,g.H=u,g.A=n,J===null&&(hl=null,W=0,tn()),i}function uv(){for(;J!==null;)zd(J)}function nv(l,t){var e=ul;ul|=2;var a=Ed(),u=xd();hl!==l||W!==t?(Rn=null,jn=Il()+500,Ma(l,t)):Oa=La(l,t);l:do try{if(fl!==0&&J!==null){t=J;var n=rt;t:switch(fl){case 1:fl=0,rt=null,Ua(l,t,n,1);break;case 2:case 9:if(Cs(n)){fl=0,rt=null,Td(t);break}t=function(){fl!==2&&fl!==9||hl!==l||(fl=7),Yt(l)},n.then(t,t);break l;case 3:fl=7;break l;case 4:fl=5;break l;case 7:Cs(n)?(fl=0,rt=null,Td(t)):(fl=0,rt=null,Ua(l,t,n,7));break;case 5:var i=null;switch(J.tag){case 26:i=J.memoizedState;case 5:case 27:var c=J;if(i?s0(i):c.stateNode.complete){fl=0,rt=null;var f=c.sibling;if(f!==null)J=f;else{var v=c.return;v!==null?(J=v,qn(v)):J=null}break t}}fl=0,rt=null,Ua(l,t,n,5);break;case 6:fl=0,rt=null,Ua(l,t,n,6);break;case 8:Lc(),Ol=6;break l;default:throw Error(r(462))}}iv();break}catch(S){bd(l,S)}while(!0);return wt=Ge=null,g.H=a,g.A=u,ul=e,J!==null?0:(hl=null,W=0,tn(),Ol)}function iv(){for(;J!==null&&!ui();)zd(J)}function zd(l){var t=wo(l.alternate,l,ae);l.memoizedProps=l.pendingProps,t===null?qn(l):J=t}function Td(l){var t=l,e=t.alternate;switch(t.tag){case 15:case 0:t=Xo(e,t,t.pendingProps,t.type,void 0,W);break;case 11:t=Xo(e,t,t.pendingProps,t.type.render,t.ref,W);break;case 5:nc(t);default:ko(e,t),t=J=Es(t,ae),t=wo(e,t,ae)}l.memoizedProps=l.pendingProps,t===null?qn(l):J=t}function Ua(l,t,e,a){wt=Ge=null,nc(t),pa=null,iu=0;var u=t.return;try{if(Wm(l,u,t,e,W)){Ol=1,Tn(l,Tt(e,l.current)),J=null;return}}catch(n){if(u!==null)throw J=u,n;Ol=1,Tn(l,Tt(e,l.current)),J=null;return}t.flags&32768?(F||a===1?l=!0:Oa||(W&536870912)!==0?l=!1:(be=l=!0,(a===2||a===9||a===3||a===6)&&(a=vt.current,a!==null&&a.tag===13&&(a.flags|=16384))),Ad(t,l)):qn(t)}function qn(l){var t=l;do{if((t.flags&32768)!==0){Ad(t,be);return}l=t.return;var e=Fm(t.alternate,t,ae);if(e!==null){J=e;return}if(t=t.sibling,t!==null){J=t;return}J=t=l}while(t!==null);Ol===0&&(Ol=5)}function Ad(l,t){do{var e=Im(l.alternate,l);if(e!==null){e.flags&=32767,J=e;return}if(e=l.return,e!==null&&(e.flags|=32768,e.subtreeFlags=0,e.deletions=null),!t&&(l=l.sibling,l!==null)){J=l;return}J=l=e}while(l!==null);Ol=6,J=null}function _d(l,t,e,a,u,n,i,c,f){l.cancelPendingCommit=null;do Yn();while(Bl!==0);if((ul&6)!==0)throw Error(r(327));if(t!==null){if(t===l.current)throw Error(r(177));if(n=t.lanes|t.childLanes,n|=Ci,G0(l,e,n,i,c,f),l===hl&&(J=hl=null,W=0),Da=t,xe=l,ue=e,Qc=n,Xc=u,rd=a,(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?(l.callbackNode=null,l.callbackPriority=0,ov(ie,function(){return Ud(),null})):(l.callbackNode=null,l.callbackPriority=0),a=(t.flags&13878)!==0,(t.subtreeFlags&13878)!==0||a){a=g.T,g.T=null,u=O.p,O.p=2,i=ul,ul|=4;try{Pm(l,t,e)}finally{ul=i,O.p=u,g.T=a}}Bl=1,Od(),Nd(),Dd()}}function Od(){if(Bl===1){Bl=0;var l=xe,t=Da,e=(t.flags&13878)!==0;if((t.subtreeFlags&13878)!==0||e){e=g.T,g.T=null;var a=O.p;O.p=2;var u=ul;ul|=4;try{cd(t,l);var n=ef,i=ms(l.containerInfo),c=n.focusedElem,f=n.selectionRange;if(i!==c&&c&&c.ownerDocument&&ds(c.ownerDocument.documentElement,c)){if(f!==null&&Oi(c)){var v=f.start,S=f.end;if(S===void 0&&(S=v),"selectionStart"in c)c.selectionStart=v,c.selectionEnd=Math.min(S,c.value.length);else{var E=c.ownerDocument||document,y=E&&E.defaultView||window;if(y.getSelection){var h=y.getSelection(),N=c.textContent.length,B=Math.min(f.start,N),yl=f.end===void 0?B:Math.min(f.end,N);!h.extend&&B>yl&&(i=yl,yl=B,B=i);var d=os(c,B),s=os(c,yl);if(d&&s&&(h.rangeCount!==1||h.anchorNode!==d.node||h.anchorOffset!==d.offset||h.focusNode!==s.node||h.focusOffset!==s.offset)){var m=E.createRange();m.setStart(d.node,d.offset),h.removeAllRanges(),B>yl?(h.addRange(m),h.extend(s.node,s.offset)):(m.setEnd(s.node,s.offset),h.addRange(m))}}}}for(E=[],h=c;h=h.parentNode;)h.nodeType===1&&E.push({element:h,left:h.scrollLeft,top:h.scrollTop});for(typeof c.focus=="function"&&c.focus(),c=0;c<E.length;c++){var p=E[c];p.element.scrollLeft=p.left,p.element.scrollTop=p.top}}$n=!!tf,ef=tf=null}finally{ul=u,O.p=a,g.T=e}}l.current=t,Bl=2}}function Nd(){if(Bl===2){Bl=0;var l=xe,t=Da,e=(t.flags&8772)!==0;if((t.subtreeFlags&8772)!==0||e){e=g.T,g.T=null;var a=O.p;O.p=2;var u=ul;ul|=4;try{ed(l,t.alternate,t)}finally{ul=u,O.p=a,g.T=e}}Bl=3}}function Dd(){if(Bl===4||Bl===3){Bl=0,Gu();var l=xe,t=Da,e=ue,a=rd;(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?Bl=5:(Bl=0,Da=xe=null,Md(l,l.pendingLanes));var u=l.pendingLanes;if(u===0&&(Ee=null),fi(e),t=t.stateNode,cl&&typeof cl.onCommitFiberRoot=="function")try{cl.onCommitFiberRoot(bl,t,void 0,(t.current.flags&128)===128)}catch{}if(a!==null){t=g.T,u=O.p,O.p=2,g.T=null;try{for(var n=l.onRecoverableError,i=0;i<a.length;i++){var c=a[i];n(c.value,{componentStack:c.stack})}}finally{g.T=t,O.p=u}}(ue&3)!==0&&Yn(),Yt(l),u=l.pendingLanes,(e&261930)!==0&&(u&42)!==0?l===Zc?zu++:(zu=0,Zc=l):zu=0,Tu(0)}}function Md(l,t){(l.pooledCacheLanes&=t)===0&&(t=l.pooledCache,t!=null&&(l.pooledCache=null,uu(t)))}function Yn(){return Od(),Nd(),Dd(),Ud()}function Ud(){if(Bl!==5)return!1;var l=xe,t=Qc;Qc=0;var e=fi(ue),a=g.T,u=O.p;try{O.p=32>e?32:e,g.T=null,e=Xc,Xc=null;var n=xe,i=ue;if(Bl=0,Da=xe=null,ue=0,(ul&6)!==0)throw Error(r(331));var c=ul;if(ul|=4,md(n.current),sd(n,n.current,i,e),ul=c,Tu(0,!1),cl&&typeof cl.onPostCommitFiberRoot=="function")try{cl.onPostCommitFiberRoot(bl,n)}catch{}return!0}finally{O.p=u,g.T=a,Md(l,t)}}function Cd(l,t,e){t=Tt(e,t),t=pc(l.stateNode,t,2),l=re(l,t,2),l!==null&&(Va(l,2),Yt(l))}function sl(l,t,e){if(l.tag===3)Cd(l,l,e);else for(;t!==null;){if(t.tag===3){Cd(t,l,e);break}else if(t.tag===1){var a=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof a.componentDidCatch=="function"&&(Ee===null||!Ee.has(a))){l=Tt(e,l),e=jo(2),a=re(t,e,2),a!==null&&(Ro(e,a,t,l),Va(a,2),Yt(a));break}}t=t.return}}function Kc(l,t,e){var a=l.pingCache;if(a===null){a=l.pingCache=new ev;var u=new Set;a.set(t,u)}else u=a.get(t),u===void 0&&(u=new Set,a.set(t,u));u.has(e)||(qc=!0,u.add(e),l=cv.bind(null,l,t,e),t.then(l,l))}function cv(l,t,e){var a=l.pingCache;a!==null&&a.delete(t),l.pingedLanes|=l.suspendedLanes&e,l.warmLanes&=~e,hl===l&&(W&e)===e&&(Ol===4||Ol===3&&(W&62914560)===W&&300>Il()-Cn?(ul&2)===0&&Ma(l,0):Yc|=e,Na===W&&(Na=0)),Yt(l)}function jd(l,t){t===0&&(t=_f()),l=Be(l,t),l!==null&&(Va(l,t),Yt(l))}function fv(l){var t=l.memoizedState,e=0;t!==null&&(e=t.retryLane),jd(l,e)}function sv(l,t){var e=0;switch(l.tag){case 31:case 13:var a=l.stateNode,u=l.memoizedState;u!==null&&(e=u.retryLane);break;case 19:a=l.stateNode;break;case 22:a=l.stateNode._retryCache;break;default:throw Error(r(314))}a!==null&&a.delete(t),jd(l,e)}function ov(l,t){return Xa(l,t)}var Gn=null,Ca=null,Jc=!1,Qn=!1,wc=!1,Te=0;function Yt(l){l!==Ca&&l.next===null&&(Ca===null?Gn=Ca=l:Ca=Ca.next=l),Qn=!0,Jc||(Jc=!0,mv())}function Tu(l,t){if(!wc&&Qn){wc=!0;do for(var e=!1,a=Gn;a!==null;){if(l!==0){var u=a.pendingLanes;if(u===0)var n=0;else{var i=a.suspendedLanes,c=a.pingedLanes;n=(1<<31-Pl(42|l)+1)-1,n&=u&~(i&~c),n=n&201326741?n&201326741|1:n?n|2:0}n!==0&&(e=!0,qd(a,n))}else n=W,n=Lu(a,a===hl?n:0,a.cancelPendingCommit!==null||a.timeoutHandle!==-1),(n&3)===0||La(a,n)||(e=!0,qd(a,n));a=a.next}while(e);wc=!1}}function dv(){Rd()}function Rd(){Qn=Jc=!1;var l=0;Te!==0&&xv()&&(l=Te);for(var t=Il(),e=null,a=Gn;a!==null;){var u=a.next,n=Hd(a,t);n===0?(a.next=null,e===null?Gn=u:e.next=u,u===null&&(Ca=e)):(e=a,(l!==0||(n&3)!==0)&&(Qn=!0)),a=u}Bl!==0&&Bl!==5||Tu(l),Te!==0&&(Te=0)}function Hd(l,t){for(var e=l.suspendedLanes,a=l.pingedLanes,u=l.expirationTimes,n=l.pendingLanes&-62914561;0<n;){var i=31-Pl(n),c=1<<i,f=u[i];f===-1?((c&e)===0||(c&a)!==0)&&(u[i]=Y0(c,t)):f<=t&&(l.expiredLanes|=c),n&=~c}if(t=hl,e=W,e=Lu(l,l===t?e:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),a=l.callbackNode,e===0||l===t&&(fl===2||fl===9)||l.cancelPendingCommit!==null)return a!==null&&a!==null&&Za(a),l.callbackNode=null,l.callbackPriority=0;if((e&3)===0||La(l,e)){if(t=e&-e,t===l.callbackPriority)return t;switch(a!==null&&Za(a),fi(e)){case 2:case 8:e=Fe;break;case 32:e=ie;break;case 268435456:e=C;break;default:e=ie}return a=Bd.bind(null,l),e=Xa(e,a),l.callbackPriority=t,l.callbackNode=e,t}return a!==null&&a!==null&&Za(a),l.callbackPriority=2,l.callbackNode=null,2}function Bd(l,t){if(Bl!==0&&Bl!==5)return l.callbackNode=null,l.callbackPriority=0,null;var e=l.callbackNode;if(Yn()&&l.callbackNode!==e)return null;var a=W;return a=Lu(l,l===hl?a:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),a===0?null:(gd(l,a,t),Hd(l,Il()),l.callbackNode!=null&&l.callbackNode===e?Bd.bind(null,l):null)}function qd(l,t){if(Yn())return null;gd(l,t,!0)}function mv(){Tv(function(){(ul&6)!==0?Xa($e,dv):Rd()})}function Wc(){if(Te===0){var l=ga;l===0&&(l=Qu,Qu<<=1,(Qu&261888)===0&&(Qu=256)),Te=l}return Te}function Yd(l){return l==null||typeof l=="symbol"||typeof l=="boolean"?null:typeof l=="function"?l:wu(""+l)}function Gd(l,t){var e=t.ownerDocument.createElement("input");return e.name=t.name,e.value=t.value,l.id&&e.setAttribute("form",l.id),t.parentNode.insertBefore(e,t),l=new FormData(l),e.parentNode.removeChild(e),l}function vv(l,t,e,a,u){if(t==="submit"&&e&&e.stateNode===u){var n=Yd((u[at]||null).action),i=a.submitter;i&&(t=(t=i[at]||null)?Yd(t.formAction):i.getAttribute("formAction"),t!==null&&(n=t,i=null));var c=new Fu("action","action",null,a,u);l.push({event:c,listeners:[{instance:null,listener:function(){if(a.defaultPrevented){if(Te!==0){var f=i?Gd(u,i):new FormData(u);yc(e,{pending:!0,data:f,method:u.method,action:n},null,f)}}else typeof n=="function"&&(c.preventDefault(),f=i?Gd(u,i):new FormData(u),yc(e,{pending:!0,data:f,method:u.method,action:n},n,f))},currentTarget:u}]})}}for(var kc=0;kc<Ui.length;kc++){var $c=Ui[kc],yv=$c.toLowerCase(),rv=$c[0].toUpperCase()+$c.slice(1);Ct(yv,"on"+rv)}Ct(rs,"onAnimationEnd"),Ct(hs,"onAnimationIteration"),Ct(gs,"onAnimationStart"),Ct("dblclick","onDoubleClick"),Ct("focusin","onFocus"),Ct("focusout","onBlur"),Ct(Um,"onTransitionRun"),Ct(Cm,"onTransitionStart"),Ct(jm,"onTransitionCancel"),Ct(Ss,"onTransitionEnd"),aa("onMouseEnter",["mouseout","mouseover"]),aa("onMouseLeave",["mouseout","mouseover"]),aa("onPointerEnter",["pointerout","pointerover"]),aa("onPointerLeave",["pointerout","pointerover"]),Ce("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),Ce("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),Ce("onBeforeInput",["compositionend","keypress","textInput","paste"]),Ce("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),Ce("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),Ce("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Au="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),hv=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(Au));function Qd(l,t){t=(t&4)!==0;for(var e=0;e<l.length;e++){var a=l[e],u=a.event;a=a.listeners;l:{var n=void 0;if(t)for(var i=a.length-1;0<=i;i--){var c=a[i],f=c.instance,v=c.currentTarget;if(c=c.listener,f!==n&&u.isPropagationStopped())break l;n=c,u.currentTarget=v;try{n(u)}catch(S){ln(S)}u.currentTarget=null,n=f}else for(i=0;i<a.length;i++){if(c=a[i],f=c.instance,v=c.currentTarget,c=c.listener,f!==n&&u.isPropagationStopped())break l;n=c,u.currentTarget=v;try{n(u)}catch(S){ln(S)}u.currentTarget=null,n=f}}}}function w(l,t){var e=t[si];e===void 0&&(e=t[si]=new Set);var a=l+"__bubble";e.has(a)||(Xd(t,l,2,!1),e.add(a))}function Fc(l,t,e){var a=0;t&&(a|=4),Xd(e,l,a,t)}var Xn="_reactListening"+Math.random().toString(36).slice(2);function Ic(l){if(!l[Xn]){l[Xn]=!0,jf.forEach(function(e){e!=="selectionchange"&&(hv.has(e)||Fc(e,!1,l),Fc(e,!0,l))});var t=l.nodeType===9?l:l.ownerDocument;t===null||t[Xn]||(t[Xn]=!0,Fc("selectionchange",!1,t))}}function Xd(l,t,e,a){switch(h0(t)){case 2:var u=Vv;break;case 8:u=Kv;break;default:u=yf}e=u.bind(null,t,e,l),u=void 0,!Si||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(u=!0),a?u!==void 0?l.addEventListener(t,e,{capture:!0,passive:u}):l.addEventListener(t,e,!0):u!==void 0?l.addEventListener(t,e,{passive:u}):l.addEventListener(t,e,!1)}function Pc(l,t,e,a,u){var n=a;if((t&1)===0&&(t&2)===0&&a!==null)l:for(;;){if(a===null)return;var i=a.tag;if(i===3||i===4){var c=a.stateNode.containerInfo;if(c===u)break;if(i===4)for(i=a.return;i!==null;){var f=i.tag;if((f===3||f===4)&&i.stateNode.containerInfo===u)return;i=i.return}for(;c!==null;){if(i=la(c),i===null)return;if(f=i.tag,f===5||f===6||f===26||f===27){a=n=i;continue l}c=c.parentNode}}a=a.return}Kf(function(){var v=n,S=hi(e),E=[];l:{var y=bs.get(l);if(y!==void 0){var h=Fu,N=l;switch(l){case"keypress":if(ku(e)===0)break l;case"keydown":case"keyup":h=sm;break;case"focusin":N="focus",h=xi;break;case"focusout":N="blur",h=xi;break;case"beforeblur":case"afterblur":h=xi;break;case"click":if(e.button===2)break l;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":h=Wf;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":h=F0;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":h=mm;break;case rs:case hs:case gs:h=lm;break;case Ss:h=ym;break;case"scroll":case"scrollend":h=k0;break;case"wheel":h=hm;break;case"copy":case"cut":case"paste":h=em;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":h=$f;break;case"toggle":case"beforetoggle":h=Sm}var B=(t&4)!==0,yl=!B&&(l==="scroll"||l==="scrollend"),d=B?y!==null?y+"Capture":null:y;B=[];for(var s=v,m;s!==null;){var p=s;if(m=p.stateNode,p=p.tag,p!==5&&p!==26&&p!==27||m===null||d===null||(p=wa(s,d),p!=null&&B.push(_u(s,p,m))),yl)break;s=s.return}0<B.length&&(y=new h(y,N,null,e,S),E.push({event:y,listeners:B}))}}if((t&7)===0){l:{if(y=l==="mouseover"||l==="pointerover",h=l==="mouseout"||l==="pointerout",y&&e!==ri&&(N=e.relatedTarget||e.fromElement)&&(la(N)||N[Pe]))break l;if((h||y)&&(y=S.window===S?S:(y=S.ownerDocument)?y.defaultView||y.parentWindow:window,h?(N=e.relatedTarget||e.toElement,h=v,N=N?la(N):null,N!==null&&(yl=$(N),B=N.tag,N!==yl||B!==5&&B!==27&&B!==6)&&(N=null)):(h=null,N=v),h!==N)){if(B=Wf,p="onMouseLeave",d="onMouseEnter",s="mouse",(l==="pointerout"||l==="pointerover")&&(B=$f,p="onPointerLeave",d="onPointerEnter",s="pointer"),yl=h==null?y:Ja(h),m=N==null?y:Ja(N),y=new B(p,s+"leave",h,e,S),y.target=yl,y.relatedTarget=m,p=null,la(S)===v&&(B=new B(d,s+"enter",N,e,S),B.target=m,B.relatedTarget=yl,p=B),yl=p,h&&N)t:{for(B=gv,d=h,s=N,m=0,p=d;p;p=B(p))m++;p=0;for(var R=s;R;R=B(R))p++;for(;0<m-p;)d=B(d),m--;for(;0<p-m;)s=B(s),p--;for(;m--;){if(d===s||s!==null&&d===s.alternate){B=d;break t}d=B(d),s=B(s)}B=null}else B=null;h!==null&&Zd(E,y,h,B,!1),N!==null&&yl!==null&&Zd(E,yl,N,B,!0)}}l:{if(y=v?Ja(v):window,h=y.nodeName&&y.nodeName.toLowerCase(),h==="select"||h==="input"&&y.type==="file")var el=us;else if(es(y))if(ns)el=Nm;else{el=_m;var M=Am}else h=y.nodeName,!h||h.toLowerCase()!=="input"||y.type!=="checkbox"&&y.type!=="radio"?v&&yi(v.elementType)&&(el=us):el=Om;if(el&&(el=el(l,v))){as(E,el,e,S);break l}M&&M(l,y,v),l==="focusout"&&v&&y.type==="number"&&v.memoizedProps.value!=null&&vi(y,"number",y.value)}switch(M=v?Ja(v):window,l){case"focusin":(es(M)||M.contentEditable==="true")&&(sa=M,Ni=v,tu=null);break;case"focusout":tu=Ni=sa=null;break;case"mousedown":Di=!0;break;case"contextmenu":case"mouseup":case"dragend":Di=!1,vs(E,e,S);break;case"selectionchange":if(Mm)break;case"keydown":case"keyup":vs(E,e,S)}var Z;if(Ti)l:{switch(l){case"compositionstart":var k="onCompositionStart";break l;case"compositionend":k="onCompositionEnd";break l;case"compositionupdate":k="onCompositionUpdate";break l}k=void 0}else fa?ls(l,e)&&(k="onCompositionEnd"):l==="keydown"&&e.keyCode===229&&(k="onCompositionStart");k&&(Ff&&e.locale!=="ko"&&(fa||k!=="onCompositionStart"?k==="onCompositionEnd"&&fa&&(Z=Jf()):(fe=S,bi="value"in fe?fe.value:fe.textContent,fa=!0)),M=Zn(v,k),0<M.length&&(k=new kf(k,l,null,e,S),E.push({event:k,listeners:M}),Z?k.data=Z:(Z=ts(e),Z!==null&&(k.data=Z)))),(Z=pm?Em(l,e):xm(l,e))&&(k=Zn(v,"onBeforeInput"),0<k.length&&(M=new kf("onBeforeInput","beforeinput",null,e,S),E.push({event:M,listeners:k}),M.data=Z)),vv(E,l,v,e,S)}Qd(E,t)})}function _u(l,t,e){return{instance:l,listener:t,currentTarget:e}}function Zn(l,t){for(var e=t+"Capture",a=[];l!==null;){var u=l,n=u.stateNode;if(u=u.tag,u!==5&&u!==26&&u!==27||n===null||(u=wa(l,e),u!=null&&a.unshift(_u(l,u,n)),u=wa(l,t),u!=null&&a.push(_u(l,u,n))),l.tag===3)return a;l=l.return}return[]}function gv(l){if(l===null)return null;do l=l.return;while(l&&l.tag!==5&&l.tag!==27);return l||null}function Zd(l,t,e,a,u){for(var n=t._reactName,i=[];e!==null&&e!==a;){var c=e,f=c.alternate,v=c.stateNode;if(c=c.tag,f!==null&&f===a)break;c!==5&&c!==26&&c!==27||v===null||(f=v,u?(v=wa(e,n),v!=null&&i.unshift(_u(e,v,f))):u||(v=wa(e,n),v!=null&&i.push(_u(e,v,f)))),e=e.return}i.length!==0&&l.push({event:t,listeners:i})}var Sv=/\r\n?/g,bv=/\u0000|\uFFFD/g;function Ld(l){return(typeof l=="string"?l:""+l).replace(Sv,`
-`).replace(bv,"")}function Vd(l,t){return t=Ld(t),Ld(l)===t}function vl(l,t,e,a,u,n){switch(e){case"children":typeof a=="string"?t==="body"||t==="textarea"&&a===""||na(l,a):(typeof a=="number"||typeof a=="bigint")&&t!=="body"&&na(l,""+a);break;case"className":Ku(l,"class",a);break;case"tabIndex":Ku(l,"tabindex",a);break;case"dir":case"role":case"viewBox":case"width":case"height":Ku(l,e,a);break;case"style":Lf(l,a,n);break;case"data":if(t!=="object"){Ku(l,"data",a);break}case"src":case"href":if(a===""&&(t!=="a"||e!=="href")){l.removeAttribute(e);break}if(a==null||typeof a=="function"||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(e);break}a=wu(""+a),l.setAttribute(e,a);break;case"action":case"formAction":if(typeof a=="function"){l.setAttribute(e,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(e==="formAction"?(t!=="input"&&vl(l,t,"name",u.name,u,null),vl(l,t,"formEncType",u.formEncType,u,null),vl(l,t,"formMethod",u.formMethod,u,null),vl(l,t,"formTarget",u.formTarget,u,null)):(vl(l,t,"encType",u.encType,u,null),vl(l,t,"method",u.method,u,null),vl(l,t,"target",u.target,u,null)));if(a==null||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(e);break}a=wu(""+a),l.setAttribute(e,a);break;case"onClick":a!=null&&(l.onclick=Lt);break;case"onScroll":a!=null&&w("scroll",l);break;case"onScrollEnd":a!=null&&w("scrollend",l);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(r(61));if(e=a.__html,e!=null){if(u.children!=null)throw Error(r(60));l.innerHTML=e}}break;case"multiple":l.multiple=a&&typeof a!="function"&&typeof a!="symbol";break;case"muted":l.muted=a&&typeof a!="function"&&typeof a!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(a==null||typeof a=="function"||typeof a=="boolean"||typeof a=="symbol"){l.removeAttribute("xlink:href");break}e=wu(""+a),l.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",e);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(e,""+a):l.removeAttribute(e);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":a&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(e,""):l.removeAttribute(e);break;case"capture":case"download":a===!0?l.setAttribute(e,""):a!==!1&&a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(e,a):l.removeAttribute(e);break;case"cols":case"rows":case"size":case"span":a!=null&&typeof a!="function"&&typeof a!="symbol"&&!isNaN(a)&&1<=a?l.setAttribute(e,a):l.removeAttribute(e);break;case"rowSpan":case"start":a==null||typeof a=="function"||typeof a=="symbol"||isNaN(a)?l.removeAttribute(e):l.setAttribute(e,a);break;case"popover":w("beforetoggle",l),w("toggle",l),Vu(l,"popover",a);break;case"xlinkActuate":Zt(l,"http://www.w3.org/1999/xlink","xlink:actuate",a);break;case"xlinkArcrole":Zt(l,"http://www.w3.org/1999/xlink","xlink:arcrole",a);break;case"xlinkRole":Zt(l,"http://www.w3.org/1999/xlink","xlink:role",a);break;case"xlinkShow":Zt(l,"http://www.w3.org/1999/xlink","xlink:show",a);break;case"xlinkTitle":Zt(l,"http://www.w3.org/1999/xlink","xlink:title",a);break;case"xlinkType":Zt(l,"http://www.w3.org/1999/xlink","xlink:type",a);break;case"xmlBase":Zt(l,"http://www.w3.org/XML/1998/namespace","xml:base",a);break;case"xmlLang":Zt(l,"http://www.w3.org/XML/1998/namespace","xml:lang",a);break;case"xmlSpace":Zt(l,"http://www.w3.org/XML/1998/namespace","xml:space",a);break;case"is":Vu(l,"is",a);break;case"innerText":case"textContent":break;default:(!(2<e.length)||e[0]!=="o"&&e[0]!=="O"||e[1]!=="n"&&e[1]!=="N")&&(e=w0.get(e)||e,Vu(l,e,a))}}function lf(l,t,e,a,u,n){switch(e){case"style":Lf(l,a,n);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(r(61));if(e=a.__html,e!=null){if(u.children!=null)throw Error(r(60));l.innerHTML=e}}break;case"children":typeof a=="string"?na(l,a):(typeof a=="number"||typeof a=="bigint")&&na(l,""+a);break;case"onScroll":a!=null&&w("scroll",l);break;case"onScrollEnd":a!=null&&w("scrollend",l);break;case"onClick":a!=null&&(l.onclick=Lt);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!Rf.hasOwnProperty(e))l:{if(e[0]==="o"&&e[1]==="n"&&(u=e.endsWith("Capture"),t=e.slice(2,u?e.length-7:void 0),n=l[at]||null,n=n!=null?n[e]:null,typeof n=="function"&&l.removeEventListener(t,n,u),typeof a=="function")){typeof n!="function"&&n!==null&&(e in l?l[e]=null:l.hasAttribute(e)&&l.removeAttribute(e)),l.addEventListener(t,a,u);break l}e in l?l[e]=a:a===!0?l.setAttribute(e,""):Vu(l,e,a)}}}function Kl(l,t,e){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":w("error",l),w("load",l);var a=!1,u=!1,n;for(n in e)if(e.hasOwnProperty(n)){var i=e[n];if(i!=null)switch(n){case"src":a=!0;break;case"srcSet":u=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(r(137,t));default:vl(l,t,n,i,e,null)}}u&&vl(l,t,"srcSet",e.srcSet,e,null),a&&vl(l,t,"src",e.src,e,null);return;case"input":w("invalid",l);var c=n=i=u=null,f=null,v=null;for(a in e)if(e.hasOwnProperty(a)){var S=e[a];if(S!=null)switch(a){case"name":u=S;break;case"type":i=S;break;case"checked":f=S;break;case"defaultChecked":v=S;break;case"value":n=S;break;case"defaultValue":c=S;break;case"children":case"dangerouslySetInnerHTML":if(S!=null)throw Error(r(137,t));break;default:vl(l,t,a,S,e,null)}}Gf(l,n,c,f,v,i,u,!1);return;case"select":w("invalid",l),a=i=n=null;for(u in e)if(e.hasOwnProperty(u)&&(c=e[u],c!=null))switch(u){case"value":n=c;break;case"defaultValue":i=c;break;case"multiple":a=c;default:vl(l,t,u,c,e,null)}t=n,e=i,l.multiple=!!a,t!=null?ua(l,!!a,t,!1):e!=null&&ua(l,!!a,e,!0);return;case"textarea":w("invalid",l),n=u=a=null;for(i in e)if(e.hasOwnProperty(i)&&(c=e[i],c!=null))switch(i){case"value":a=c;break;case"defaultValue":u=c;break;case"children":n=c;break;case"dangerouslySetInnerHTML":if(c!=null)throw Error(r(91));break;default:vl(l,t,i,c,e,null)}Xf(l,a,u,n);return;case"option":for(f in e)if(e.hasOwnProperty(f)&&(a=e[f],a!=null))switch(f){case"selected":l.selected=a&&typeof a!="function"&&typeof a!="symbol";break;default:vl(l,t,f,a,e,null)}return;case"dialog":w("beforetoggle",l),w("toggle",l),w("cancel",l),w("close",l);break;case"iframe":case"object":w("load",l);break;case"video":case"audio":for(a=0;a<Au.length;a++)w(Au[a],l);break;case"image":w("error",l),w("load",l);break;case"details":w("toggle",l);break;case"embed":case"source":case"link":w("error",l),w("load",l);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(v in e)if(e.hasOwnProperty(v)&&(a=e[v],a!=null))switch(v){case"children":case"dangerouslySetInnerHTML":throw Error(r(137,t));default:vl(l,t,v,a,e,null)}return;default:if(yi(t)){for(S in e)e.hasOwnProperty(S)&&(a=e[S],a!==void 0&&lf(l,t,S,a,e,void 0));return}}for(c in e)e.hasOwnProperty(c)&&(a=e[c],a!=null&&vl(l,t,c,a,e,null))}function pv(l,t,e,a){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var u=null,n=null,i=null,c=null,f=null,v=null,S=null;for(h in e){var E=e[h];if(e.hasOwnProperty(h)&&E!=null)switch(h){case"checked":break;case"value":break;case"defaultValue":f=E;default:a.hasOwnProperty(h)||vl(l,t,h,null,a,E)}}for(var y in a){var h=a[y];if(E=e[y],a.hasOwnProperty(y)&&(h!=null||E!=null))switch(y){case"type":n=h;break;case"name":u=h;break;case"checked":v=h;break;case"defaultChecked":S=h;break;case"value":i=h;break;case"defaultValue":c=h;break;case"children":case"dangerouslySetInnerHTML":if(h!=null)throw Error(r(137,t));break;default:h!==E&&vl(l,t,y,h,a,E)}}mi(l,i,c,f,v,S,n,u);return;case"select":h=i=c=y=null;for(n in e)if(f=e[n],e.hasOwnProperty(n)&&f!=null)switch(n){case"value":break;case"multiple":h=f;default:a.hasOwnProperty(n)||vl(l,t,n,null,a,f)}for(u in a)if(n=a[u],f=e[u],a.hasOwnProperty(u)&&(n!=null||f!=null))switch(u){case"value":y=n;break;case"defaultValue":c=n;break;case"multiple":i=n;default:n!==f&&vl(l,t,u,n,a,f)}t=c,e=i,a=h,y!=null?ua(l,!!e,y,!1):!!a!=!!e&&(t!=null?ua(l,!!e,t,!0):ua(l,!!e,e?[]:"",!1));return;case"textarea":h=y=null;for(c in e)if(u=e[c],e.hasOwnProperty(c)&&u!=null&&!a.hasOwnProperty(c))switch(c){case"value":break;case"children":break;default:vl(l,t,c,null,a,u)}for(i in a)if(u=a[i],n=e[i],a.hasOwnProperty(i)&&(u!=null||n!=null))switch(i){case"value":y=u;break;case"defaultValue":h=u;break;case"children":break;case"dangerouslySetInnerHTML":if(u!=null)throw Error(r(91));break;default:u!==n&&vl(l,t,i,u,a,n)}Qf(l,y,h);return;case"option":for(var N in e)if(y=e[N],e.hasOwnProperty(N)&&y!=null&&!a.hasOwnProperty(N))switch(N){case"selected":l.selected=!1;break;default:vl(l,t,N,null,a,y)}for(f in a)if(y=a[f],h=e[f],a.hasOwnProperty(f)&&y!==h&&(y!=null||h!=null))switch(f){case"selected":l.selected=y&&typeof y!="function"&&typeof y!="symbol";break;default:vl(l,t,f,y,a,h)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var B in e)y=e[B],e.hasOwnProperty(B)&&y!=null&&!a.hasOwnProperty(B)&&vl(l,t,B,null,a,y);for(v in a)if(y=a[v],h=e[v],a.hasOwnProperty(v)&&y!==h&&(y!=null||h!=null))switch(v){case"children":case"dangerouslySetInnerHTML":if(y!=null)throw Error(r(137,t));break;default:vl(l,t,v,y,a,h)}return;default:if(yi(t)){for(var yl in e)y=e[yl],e.hasOwnProperty(yl)&&y!==void 0&&!a.hasOwnProperty(yl)&&lf(l,t,yl,void 0,a,y);for(S in a)y=a[S],h=e[S],!a.hasOwnProperty(S)||y===h||y===void 0&&h===void 0||lf(l,t,S,y,a,h);return}}for(var d in e)y=e[d],e.hasOwnProperty(d)&&y!=null&&!a.hasOwnProperty(d)&&vl(l,t,d,null,a,y);for(E in a)y=a[E],h=e[E],!a.hasOwnProperty(E)||y===h||y==null&&h==null||vl(l,t,E,y,a,h)}function Kd(l){switch(l){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function Ev(){if(typeof performance.getEntriesByType=="function"){for(var l=0,t=0,e=performance.getEntriesByType("resource"),a=0;a<e.length;a++){var u=e[a],n=u.transferSize,i=u.initiatorType,c=u.duration;if(n&&c&&Kd(i)){for(i=0,c=u.responseEnd,a+=1;a<e.length;a++){var f=e[a],v=f.startTime;if(v>c)break;var S=f.transferSize,E=f.initiatorType;S&&Kd(E)&&(f=f.responseEnd,i+=S*(f<c?1:(c-v)/(f-v)))}if(--a,t+=8*(n+i)/(u.duration/1e3),l++,10<l)break}}if(0<l)return t/l/1e6}return navigator.connection&&(l=navigator.connection.downlink,typeof l=="number")?l:5}var tf=null,ef=null;function Ln(l){return l.nodeType===9?l:l.ownerDocument}function Jd(l){switch(l){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function wd(l,t){if(l===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return l===1&&t==="foreignObject"?0:l}function af(l,t){return l==="textarea"||l==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var uf=null;function xv(){var l=window.event;return l&&l.type==="popstate"?l===uf?!1:(uf=l,!0):(uf=null,!1)}var Wd=typeof setTimeout=="function"?setTimeout:void 0,zv=typeof clearTimeout=="function"?clearTimeout:void 0,kd=typeof Promise=="function"?Promise:void 0,Tv=typeof queueMicrotask=="function"?queueMicrotask:typeof kd<"u"?function(l){return kd.resolve(null).then(l).catch(Av)}:Wd;function Av(l){setTimeout(function(){throw l})}function Ae(l){return l==="head"}function $d(l,t){var e=t,a=0;do{var u=e.nextSibling;if(l.removeChild(e),u&&u.nodeType===8)if(e=u.data,e==="/$"||e==="/&"){if(a===0){l.removeChild(u),Ba(t);return}a--}else if(e==="$"||e==="$?"||e==="$~"||e==="$!"||e==="&")a++;else if(e==="html")Ou(l.ownerDocument.documentElement);else if(e==="head"){e=l.ownerDocument.head,Ou(e);for(var n=e.firstChild;n;){var i=n.nextSibling,c=n.nodeName;n[Ka]||c==="SCRIPT"||c==="STYLE"||c==="LINK"&&n.rel.toLowerCase()==="stylesheet"||e.removeChild(n),n=i}}else e==="body"&&Ou(l.ownerDocument.body);e=u}while(e);Ba(t)}function Fd(l,t){var e=l;l=0;do{var a=e.nextSibling;if(e.nodeType===1?t?(e._stashedDisplay=e.style.display,e.style.display="none"):(e.style.display=e._stashedDisplay||"",e.getAttribute("style")===""&&e.removeAttribute("style")):e.nodeType===3&&(t?(e._stashedText=e.nodeValue,e.nodeValue=""):e.nodeValue=e._stashedText||""),a&&a.nodeType===8)if(e=a.data,e==="/$"){if(l===0)break;l--}else e!=="$"&&e!=="$?"&&e!=="$~"&&e!=="$!"||l++;e=a}while(e)}function nf(l){var t=l.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var e=t;switch(t=t.nextSibling,e.nodeName){case"HTML":case"HEAD":case"BODY":nf(e),oi(e);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(e.rel.toLowerCase()==="stylesheet")continue}l.removeChild(e)}}function _v(l,t,e,a){for(;l.nodeType===1;){var u=e;if(l.nodeName.toLowerCase()!==t.toLowerCase()){if(!a&&(l.nodeName!=="INPUT"||l.type!=="hidden"))break}else if(a){if(!l[Ka])switch(t){case"meta":if(!l.hasAttribute("itemprop"))break;return l;case"link":if(n=l.getAttribute("rel"),n==="stylesheet"&&l.hasAttribute("data-precedence"))break;if(n!==u.rel||l.getAttribute("href")!==(u.href==null||u.href===""?null:u.href)||l.getAttribute("crossorigin")!==(u.crossOrigin==null?null:u.crossOrigin)||l.getAttribute("title")!==(u.title==null?null:u.title))break;return l;case"style":if(l.hasAttribute("data-precedence"))break;return l;case"script":if(n=l.getAttribute("src"),(n!==(u.src==null?null:u.src)||l.getAttribute("type")!==(u.type==null?null:u.type)||l.getAttribute("crossorigin")!==(u.crossOrigin==null?null:u.crossOrigin))&&n&&l.hasAttribute("async")&&!l.hasAttribute("itemprop"))break;return l;default:return l}}else if(t==="input"&&l.type==="hidden"){var n=u.name==null?null:""+u.name;if(u.type==="hidden"&&l.getAttribute("name")===n)return l}else return l;if(l=Dt(l.nextSibling),l===null)break}return null}function Ov(l,t,e){if(t==="")return null;for(;l.nodeType!==3;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!e||(l=Dt(l.nextSibling),l===null))return null;return l}function Id(l,t){for(;l.nodeType!==8;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!t||(l=Dt(l.nextSibling),l===null))return null;return l}function cf(l){return l.data==="$?"||l.data==="$~"}function ff(l){return l.data==="$!"||l.data==="$?"&&l.ownerDocument.readyState!=="loading"}function Nv(l,t){var e=l.ownerDocument;if(l.data==="$~")l._reactRetry=t;else if(l.data!=="$?"||e.readyState!=="loading")t();else{var a=function(){t(),e.removeEventListener("DOMContentLoaded",a)};e.addEventListener("DOMContentLoaded",a),l._reactRetry=a}}function Dt(l){for(;l!=null;l=l.nextSibling){var t=l.nodeType;if(t===1||t===3)break;if(t===8){if(t=l.data,t==="$"||t==="$!"||t==="$?"||t==="$~"||t==="&"||t==="F!"||t==="F")break;if(t==="/$"||t==="/&")return null}}return l}var sf=null;function Pd(l){l=l.nextSibling;for(var t=0;l;){if(l.nodeType===8){var e=l.data;if(e==="/$"||e==="/&"){if(t===0)return Dt(l.nextSibling);t--}else e!=="$"&&e!=="$!"&&e!=="$?"&&e!=="$~"&&e!=="&"||t++}l=l.nextSibling}return null}function l0(l){l=l.previousSibling;for(var t=0;l;){if(l.nodeType===8){var e=l.data;if(e==="$"||e==="$!"||e==="$?"||e==="$~"||e==="&"){if(t===0)return l;t--}else e!=="/$"&&e!=="/&"||t++}l=l.previousSibling}return null}function t0(l,t,e){switch(t=Ln(e),l){case"html":if(l=t.documentElement,!l)throw Error(r(452));return l;case"head":if(l=t.head,!l)throw Error(r(453));return l;case"body":if(l=t.body,!l)throw Error(r(454));return l;default:throw Error(r(451))}}function Ou(l){for(var t=l.attributes;t.length;)l.removeAttributeNode(t[0]);oi(l)}var Mt=new Map,e0=new Set;function Vn(l){return typeof l.getRootNode=="function"?l.getRootNode():l.nodeType===9?l:l.ownerDocument}var ne=O.d;O.d={f:Dv,r:Mv,D:Uv,C:Cv,L:jv,m:Rv,X:Bv,S:Hv,M:qv};function Dv(){var l=ne.f(),t=Hn();return l||t}function Mv(l){var t=ta(l);t!==null&&t.tag===5&&t.type==="form"?bo(t):ne.r(l)}var ja=typeof document>"u"?null:document;function a0(l,t,e){var a=ja;if(a&&typeof t=="string"&&t){var u=xt(t);u='link[rel="'+l+'"][href="'+u+'"]',typeof e=="string"&&(u+='[crossorigin="'+e+'"]'),e0.has(u)||(e0.add(u),l={rel:l,crossOrigin:e,href:t},a.querySelector(u)===null&&(t=a.createElement("link"),Kl(t,"link",l),ql(t),a.head.appendChild(t)))}}function Uv(l){ne.D(l),a0("dns-prefetch",l,null)}function Cv(l,t){ne.C(l,t),a0("preconnect",l,t)}function jv(l,t,e){ne.L(l,t,e);var a=ja;if(a&&l&&t){var u='link[rel="preload"][as="'+xt(t)+'"]';t==="image"&&e&&e.imageSrcSet?(u+='[imagesrcset="'+xt(e.imageSrcSet)+'"]',typeof e.imageSizes=="string"&&(u+='[imagesizes="'+xt(e.imageSizes)+'"]')):u+='[href="'+xt(l)+'"]';var n=u;switch(t){case"style":n=Ra(l);break;case"script":n=Ha(l)}Mt.has(n)||(l=j({rel:"preload",href:t==="image"&&e&&e.imageSrcSet?void 0:l,as:t},e),Mt.set(n,l),a.querySelector(u)!==null||t==="style"&&a.querySelector(Nu(n))||t==="script"&&a.querySelector(Du(n))||(t=a.createElement("link"),Kl(t,"link",l),ql(t),a.head.appendChild(t)))}}function Rv(l,t){ne.m(l,t);var e=ja;if(e&&l){var a=t&&typeof t.as=="string"?t.as:"script",u='link[rel="modulepreload"][as="'+xt(a)+'"][href="'+xt(l)+'"]',n=u;switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=Ha(l)}if(!Mt.has(n)&&(l=j({rel:"modulepreload",href:l},t),Mt.set(n,l),e.querySelector(u)===null)){switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(e.querySelector(Du(n)))return}a=e.createElement("link"),Kl(a,"link",l),ql(a),e.head.appendChild(a)}}}function Hv(l,t,e){ne.S(l,t,e);var a=ja;if(a&&l){var u=ea(a).hoistableStyles,n=Ra(l);t=t||"default";var i=u.get(n);if(!i){var c={loading:0,preload:null};if(i=a.querySelector(Nu(n)))c.loading=5;else{l=j({rel:"stylesheet",href:l,"data-precedence":t},e),(e=Mt.get(n))&&of(l,e);var f=i=a.createElement("link");ql(f),Kl(f,"link",l),f._p=new Promise(function(v,S){f.onload=v,f.onerror=S}),f.addEventListener("load",function(){c.loading|=1}),f.addEventListener("error",function(){c.loading|=2}),c.loading|=4,Kn(i,t,a)}i={type:"stylesheet",instance:i,count:1,state:c},u.set(n,i)}}}function Bv(l,t){ne.X(l,t);var e=ja;if(e&&l){var a=ea(e).hoistableScripts,u=Ha(l),n=a.get(u);n||(n=e.querySelector(Du(u)),n||(l=j({src:l,async:!0},t),(t=Mt.get(u))&&df(l,t),n=e.createElement("script"),ql(n),Kl(n,"link",l),e.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(u,n))}}function qv(l,t){ne.M(l,t);var e=ja;if(e&&l){var a=ea(e).hoistableScripts,u=Ha(l),n=a.get(u);n||(n=e.querySelector(Du(u)),n||(l=j({src:l,async:!0,type:"module"},t),(t=Mt.get(u))&&df(l,t),n=e.createElement("script"),ql(n),Kl(n,"link",l),e.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(u,n))}}function u0(l,t,e,a){var u=(u=L.current)?Vn(u):null;if(!u)throw Error(r(446));switch(l){case"meta":case"title":return null;case"style":return typeof e.precedence=="string"&&typeof e.href=="string"?(t=Ra(e.href),e=ea(u).hoistableStyles,a=e.get(t),a||(a={type:"style",instance:null,count:0,state:null},e.set(t,a)),a):{type:"void",instance:null,count:0,state:null};case"link":if(e.rel==="stylesheet"&&typeof e.href=="string"&&typeof e.precedence=="string"){l=Ra(e.href);var n=ea(u).hoistableStyles,i=n.get(l);if(i||(u=u.ownerDocument||u,i={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(l,i),(n=u.querySelector(Nu(l)))&&!n._p&&(i.instance=n,i.state.loading=5),Mt.has(l)||(e={rel:"preload",as:"style",href:e.href,crossOrigin:e.crossOrigin,integrity:e.integrity,media:e.media,hrefLang:e.hrefLang,referrerPolicy:e.referrerPolicy},Mt.set(l,e),n||Yv(u,l,e,i.state))),t&&a===null)throw Error(r(528,""));return i}if(t&&a!==null)throw Error(r(529,""));return null;case"script":return t=e.async,e=e.src,typeof e=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=Ha(e),e=ea(u).hoistableScripts,a=e.get(t),a||(a={type:"script",instance:null,count:0,state:null},e.set(t,a)),a):{type:"void",instance:null,count:0,state:null};default:throw Error(r(444,l))}}function Ra(l){return'href="'+xt(l)+'"'}function Nu(l){return'link[rel="stylesheet"]['+l+"]"}function n0(l){return j({},l,{"data-precedence":l.precedence,precedence:null})}function Yv(l,t,e,a){l.querySelector('link[rel="preload"][as="style"]['+t+"]")?a.loading=1:(t=l.createElement("link"),a.preload=t,t.addEventListener("load",function(){return a.loading|=1}),t.addEventListener("error",function(){return a.loading|=2}),Kl(t,"link",e),ql(t),l.head.appendChild(t))}function Ha(l){return'[src="'+xt(l)+'"]'}function Du(l){return"script[async]"+l}function i0(l,t,e){if(t.count++,t.instance===null)switch(t.type){case"style":var a=l.querySelector('style[data-href~="'+xt(e.href)+'"]');if(a)return t.instance=a,ql(a),a;var u=j({},e,{"data-href":e.href,"data-precedence":e.precedence,href:null,precedence:null});return a=(l.ownerDocument||l).createElement("style"),ql(a),Kl(a,"style",u),Kn(a,e.precedence,l),t.instance=a;case"stylesheet":u=Ra(e.href);var n=l.querySelector(Nu(u));if(n)return t.state.loading|=4,t.instance=n,ql(n),n;a=n0(e),(u=Mt.get(u))&&of(a,u),n=(l.ownerDocument||l).createElement("link"),ql(n);var i=n;return i._p=new Promise(function(c,f){i.onload=c,i.onerror=f}),Kl(n,"link",a),t.state.loading|=4,Kn(n,e.precedence,l),t.instance=n;case"script":return n=Ha(e.src),(u=l.querySelector(Du(n)))?(t.instance=u,ql(u),u):(a=e,(u=Mt.get(n))&&(a=j({},e),df(a,u)),l=l.ownerDocument||l,u=l.createElement("script"),ql(u),Kl(u,"link",a),l.head.appendChild(u),t.instance=u);case"void":return null;default:throw Error(r(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(a=t.instance,t.state.loading|=4,Kn(a,e.precedence,l));return t.instance}function Kn(l,t,e){for(var a=e.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),u=a.length?a[a.length-1]:null,n=u,i=0;i<a.length;i++){var c=a[i];if(c.dataset.precedence===t)n=c;else if(n!==u)break}n?n.parentNode.insertBefore(l,n.nextSibling):(t=e.nodeType===9?e.head:e,t.insertBefore(l,t.firstChild))}function of(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.title==null&&(l.title=t.title)}function df(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.integrity==null&&(l.integrity=t.integrity)}var Jn=null;function c0(l,t,e){if(Jn===null){var a=new Map,u=Jn=new Map;u.set(e,a)}else u=Jn,a=u.get(e),a||(a=new Map,u.set(e,a));if(a.has(l))return a;for(a.set(l,null),e=e.getElementsByTagName(l),u=0;u<e.length;u++){var n=e[u];if(!(n[Ka]||n[Xl]||l==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var i=n.getAttribute(t)||"";i=l+i;var c=a.get(i);c?c.push(n):a.set(i,[n])}}return a}function f0(l,t,e){l=l.ownerDocument||l,l.head.insertBefore(e,t==="title"?l.querySelector("head > title"):null)}function Gv(l,t,e){if(e===1||t.itemProp!=null)return!1;switch(l){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;switch(t.rel){case"stylesheet":return l=t.disabled,typeof t.precedence=="string"&&l==null;default:return!0}case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function s0(l){return!(l.type==="stylesheet"&&(l.state.loading&3)===0)}function Qv(l,t,e,a){if(e.type==="stylesheet"&&(typeof a.media!="string"||matchMedia(a.media).matches!==!1)&&(e.state.loading&4)===0){if(e.instance===null){var u=Ra(a.href),n=t.querySelector(Nu(u));if(n){t=n._p,t!==null&&typeof t=="object"&&typeof t.then=="function"&&(l.count++,l=wn.bind(l),t.then(l,l)),e.state.loading|=4,e.instance=n,ql(n);return}n=t.ownerDocument||t,a=n0(a),(u=Mt.get(u))&&of(a,u),n=n.createElement("link"),ql(n);var i=n;i._p=new Promise(function(c,f){i.onload=c,i.onerror=f}),Kl(n,"link",a),e.instance=n}l.stylesheets===null&&(l.stylesheets=new Map),l.stylesheets.set(e,t),(t=e.state.preload)&&(e.state.loading&3)===0&&(l.count++,e=wn.bind(l),t.addEventListener("load",e),t.addEventListener("error",e))}}var mf=0;function Xv(l,t){return l.stylesheets&&l.count===0&&kn(l,l.stylesheets),0<l.count||0<l.imgCount?function(e){var a=setTimeout(function(){if(l.stylesheets&&kn(l,l.stylesheets),l.unsuspend){var n=l.unsuspend;l.unsuspend=null,n()}},6e4+t);0<l.imgBytes&&mf===0&&(mf=62500*Ev());var u=setTimeout(function(){if(l.waitingForImages=!1,l.count===0&&(l.stylesheets&&kn(l,l.stylesheets),l.unsuspend)){var n=l.unsuspend;l.unsuspend=null,n()}},(l.imgBytes>mf?50:800)+t);return l.unsuspend=e,function(){l.unsuspend=null,clearTimeout(a),clearTimeout(u)}}:null}function wn(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)kn(this,this.stylesheets);else if(this.unsuspend){var l=this.unsuspend;this.unsuspend=null,l()}}}var Wn=null;function kn(l,t){l.stylesheets=null,l.unsuspend!==null&&(l.count++,Wn=new Map,t.forEach(Zv,l),Wn=null,wn.call(l))}function Zv(l,t){if(!(t.state.loading&4)){var e=Wn.get(l);if(e)var a=e.get(null);else{e=new Map,Wn.set(l,e);for(var u=l.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<u.length;n++){var i=u[n];(i.nodeName==="LINK"||i.getAttribute("media")!=="not all")&&(e.set(i.dataset.precedence,i),a=i)}a&&e.set(null,a)}u=t.instance,i=u.getAttribute("data-precedence"),n=e.get(i)||a,n===a&&e.set(null,u),e.set(i,u),this.count++,a=wn.bind(this),u.addEventListener("load",a),u.addEventListener("error",a),n?n.parentNode.insertBefore(u,n.nextSibling):(l=l.nodeType===9?l.head:l,l.insertBefore(u,l.firstChild)),t.state.loading|=4}}var Mu={$$typeof:Hl,Provider:null,Consumer:null,_currentValue:H,_currentValue2:H,_threadCount:0};function Lv(l,t,e,a,u,n,i,c,f){this.tag=1,this.containerInfo=l,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=ii(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=ii(0),this.hiddenUpdates=ii(null),this.identifierPrefix=a,this.onUncaughtError=u,this.onCaughtError=n,this.onRecoverableError=i,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=f,this.incompleteTransitions=new Map}function o0(l,t,e,a,u,n,i,c,f,v,S,E){return l=new Lv(l,t,e,i,f,v,S,E,c),t=1,n===!0&&(t|=24),n=mt(3,null,null,t),l.current=n,n.stateNode=l,t=Vi(),t.refCount++,l.pooledCache=t,t.refCount++,n.memoizedState={element:a,isDehydrated:e,cache:t},Wi(n),l}function d0(l){return l?(l=ma,l):ma}function m0(l,t,e,a,u,n){u=d0(u),a.context===null?a.context=u:a.pendingContext=u,a=ye(t),a.payload={element:e},n=n===void 0?null:n,n!==null&&(a.callback=n),e=re(l,a,t),e!==null&&(st(e,l,t),fu(e,l,t))}function v0(l,t){if(l=l.memoizedState,l!==null&&l.dehydrated!==null){var e=l.retryLane;l.retryLane=e!==0&&e<t?e:t}}function vf(l,t){v0(l,t),(l=l.alternate)&&v0(l,t)}function y0(l){if(l.tag===13||l.tag===31){var t=Be(l,67108864);t!==null&&st(t,l,67108864),vf(l,67108864)}}function r0(l){if(l.tag===13||l.tag===31){var t=gt();t=ci(t);var e=Be(l,t);e!==null&&st(e,l,t),vf(l,t)}}var $n=!0;function Vv(l,t,e,a){var u=g.T;g.T=null;var n=O.p;try{O.p=2,yf(l,t,e,a)}finally{O.p=n,g.T=u}}function Kv(l,t,e,a){var u=g.T;g.T=null;var n=O.p;try{O.p=8,yf(l,t,e,a)}finally{O.p=n,g.T=u}}function yf(l,t,e,a){if($n){var u=rf(a);if(u===null)Pc(l,t,a,Fn,e),g0(l,a);else if(wv(u,l,t,e,a))a.stopPropagation();else if(g0(l,a),t&4&&-1<Jv.indexOf(l)){for(;u!==null;){var n=ta(u);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var i=Ue(n.pendingLanes);if(i!==0){var c=n;for(c.pendingLanes|=2,c.entangledLanes|=2;i;){var f=1<<31-Pl(i);c.entanglements[1]|=f,i&=~f}Yt(n),(ul&6)===0&&(jn=Il()+500,Tu(0))}}break;case 31:case 13:c=Be(n,2),c!==null&&st(c,n,2),Hn(),vf(n,2)}if(n=rf(a),n===null&&Pc(l,t,a,Fn,e),n===u)break;u=n}u!==null&&a.stopPropagation()}else Pc(l,t,a,null,e)}}function rf(l){return l=hi(l),hf(l)}var Fn=null;function hf(l){if(Fn=null,l=la(l),l!==null){var t=$(l);if(t===null)l=null;else{var e=t.tag;if(e===13){if(l=zl(t),l!==null)return l;l=null}else if(e===31){if(l=gl(t),l!==null)return l;l=null}else if(e===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;l=null}else t!==l&&(l=null)}}return Fn=l,null}function h0(l){switch(l){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(ni()){case $e:return 2;case Fe:return 8;case ie:case _:return 32;case C:return 268435456;default:return 32}default:return 32}}var gf=!1,_e=null,Oe=null,Ne=null,Uu=new Map,Cu=new Map,De=[],Jv="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function g0(l,t){switch(l){case"focusin":case"focusout":_e=null;break;case"dragenter":case"dragleave":Oe=null;break;case"mouseover":case"mouseout":Ne=null;break;case"pointerover":case"pointerout":Uu.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Cu.delete(t.pointerId)}}function ju(l,t,e,a,u,n){return l===null||l.nativeEvent!==n?(l={blockedOn:t,domEventName:e,eventSystemFlags:a,nativeEvent:n,targetContainers:[u]},t!==null&&(t=ta(t),t!==null&&y0(t)),l):(l.eventSystemFlags|=a,t=l.targetContainers,u!==null&&t.indexOf(u)===-1&&t.push(u),l)}function wv(l,t,e,a,u){switch(t){case"focusin":return _e=ju(_e,l,t,e,a,u),!0;case"dragenter":return Oe=ju(Oe,l,t,e,a,u),!0;case"mouseover":return Ne=ju(Ne,l,t,e,a,u),!0;case"pointerover":var n=u.pointerId;return Uu.set(n,ju(Uu.get(n)||null,l,t,e,a,u)),!0;case"gotpointercapture":return n=u.pointerId,Cu.set(n,ju(Cu.get(n)||null,l,t,e,a,u)),!0}return!1}function S0(l){var t=la(l.target);if(t!==null){var e=$(t);if(e!==null){if(t=e.tag,t===13){if(t=zl(e),t!==null){l.blockedOn=t,Uf(l.priority,function(){r0(e)});return}}else if(t===31){if(t=gl(e),t!==null){l.blockedOn=t,Uf(l.priority,function(){r0(e)});return}}else if(t===3&&e.stateNode.current.memoizedState.isDehydrated){l.blockedOn=e.tag===3?e.stateNode.containerInfo:null;return}}}l.blockedOn=null}function In(l){if(l.blockedOn!==null)return!1;for(var t=l.targetContainers;0<t.length;){var e=rf(l.nativeEvent);if(e===null){e=l.nativeEvent;var a=new e.constructor(e.type,e);ri=a,e.target.dispatchEvent(a),ri=null}else return t=ta(e),t!==null&&y0(t),l.blockedOn=e,!1;t.shift()}return!0}function b0(l,t,e){In(l)&&e.delete(t)}function Wv(){gf=!1,_e!==null&&In(_e)&&(_e=null),Oe!==null&&In(Oe)&&(Oe=null),Ne!==null&&In(Ne)&&(Ne=null),Uu.forEach(b0),Cu.forEach(b0)}function Pn(l,t){l.blockedOn===t&&(l.blockedOn=null,gf||(gf=!0,T.unstable_scheduleCallback(T.unstable_NormalPriority,Wv)))}var li=null;function p0(l){li!==l&&(li=l,T.unstable_scheduleCallback(T.unstable_NormalPriority,function(){li===l&&(li=null);for(var t=0;t<l.length;t+=3){var e=l[t],a=l[t+1],u=l[t+2];if(typeof a!="function"){if(hf(a||e)===null)continue;break}var n=ta(e);n!==null&&(l.splice(t,3),t-=3,yc(n,{pending:!0,data:u,method:e.method,action:a},a,u))}}))}function Ba(l){function t(f){return Pn(f,l)}_e!==null&&Pn(_e,l),Oe!==null&&Pn(Oe,l),Ne!==null&&Pn(Ne,l),Uu.forEach(t),Cu.forEach(t);for(var e=0;e<De.length;e++){var a=De[e];a.blockedOn===l&&(a.blockedOn=null)}for(;0<De.length&&(e=De[0],e.blockedOn===null);)S0(e),e.blockedOn===null&&De.shift();if(e=(l.ownerDocument||l).$$reactFormReplay,e!=null)for(a=0;a<e.length;a+=3){var u=e[a],n=e[a+1],i=u[at]||null;if(typeof n=="function")i||p0(e);else if(i){var c=null;if(n&&n.hasAttribute("formAction")){if(u=n,i=n[at]||null)c=i.formAction;else if(hf(u)!==null)continue}else c=i.action;typeof c=="function"?e[a+1]=c:(e.splice(a,3),a-=3),p0(e)}}}function E0(){function l(n){n.canIntercept&&n.info==="react-transition"&&n.intercept({handler:function(){return new Promise(function(i){return u=i})},focusReset:"manual",scroll:"manual"})}function t(){u!==null&&(u(),u=null),a||setTimeout(e,20)}function e(){if(!a&&!navigation.transition){var n=navigation.currentEntry;n&&n.url!=null&&navigation.navigate(n.url,{state:n.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var a=!1,u=null;return navigation.addEventListener("navigate",l),navigation.addEventListener("navigatesuccess",t),navigation.addEventListener("navigateerror",t),setTimeout(e,100),function(){a=!0,navigation.removeEventListener("navigate",l),navigation.removeEventListener("navigatesuccess",t),navigation.removeEventListener("navigateerror",t),u!==null&&(u(),u=null)}}}function Sf(l){this._internalRoot=l}ti.prototype.render=Sf.prototype.render=function(l){var t=this._internalRoot;if(t===null)throw Error(r(409));var e=t.current,a=gt();m0(e,a,l,t,null,null)},ti.prototype.unmount=Sf.prototype.unmount=function(){var l=this._internalRoot;if(l!==null){this._internalRoot=null;var t=l.containerInfo;m0(l.current,2,null,l,null,null),Hn(),t[Pe]=null}};function ti(l){this._internalRoot=l}ti.prototype.unstable_scheduleHydration=function(l){if(l){var t=Mf();l={blockedOn:null,target:l,priority:t};for(var e=0;e<De.length&&t!==0&&t<De[e].priority;e++);De.splice(e,0,l),e===0&&S0(l)}};var x0=ol.version;if(x0!=="19.2.4")throw Error(r(527,x0,"19.2.4"));O.findDOMNode=function(l){var t=l._reactInternals;if(t===void 0)throw typeof l.render=="function"?Error(r(188)):(l=Object.keys(l).join(","),Error(r(268,l)));return l=z(t),l=l!==null?I(l):null,l=l===null?null:l.stateNode,l};var kv={bundleType:0,version:"19.2.4",rendererPackageName:"react-dom",currentDispatcherRef:g,reconcilerVersion:"19.2.4"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var ei=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!ei.isDisabled&&ei.supportsFiber)try{bl=ei.inject(kv),cl=ei}catch{}}return Hu.createRoot=function(l,t){if(!Q(l))throw Error(r(299));var e=!1,a="",u=Do,n=Mo,i=Uo;return t!=null&&(t.unstable_strictMode===!0&&(e=!0),t.identifierPrefix!==void 0&&(a=t.identifierPrefix),t.onUncaughtError!==void 0&&(u=t.onUncaughtError),t.onCaughtError!==void 0&&(n=t.onCaughtError),t.onRecoverableError!==void 0&&(i=t.onRecoverableError)),t=o0(l,1,!1,null,null,e,a,null,u,n,i,E0),l[Pe]=t.current,Ic(l),new Sf(t)},Hu.hydrateRoot=function(l,t,e){if(!Q(l))throw Error(r(299));var a=!1,u="",n=Do,i=Mo,c=Uo,f=null;return e!=null&&(e.unstable_strictMode===!0&&(a=!0),e.identifierPrefix!==void 0&&(u=e.identifierPrefix),e.onUncaughtError!==void 0&&(n=e.onUncaughtError),e.onCaughtError!==void 0&&(i=e.onCaughtError),e.onRecoverableError!==void 0&&(c=e.onRecoverableError),e.formState!==void 0&&(f=e.formState)),t=o0(l,1,!0,t,e??null,a,u,f,n,i,c,E0),t.context=d0(null),e=t.current,a=gt(),a=ci(a),u=ye(a),u.callback=null,re(e,u,a),e=a,t.current.lanes=e,Va(t,e),Yt(t),l[Pe]=t.current,Ic(l),new ti(t)},Hu.version="19.2.4",Hu}var C0;function ny(){if(C0)return Ef.exports;C0=1;function T(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(T)}catch(ol){console.error(ol)}}return T(),Ef.exports=uy(),Ef.exports}var iy=ny();const j0="disconnected";function cy(T,ol){switch(ol.type){case"CONNECT_REQUESTED":return"connecting";case"CONNECTED":return"connected";case"DISCONNECTED":return"disconnected";case"RECONNECT_REQUESTED":return"reconnecting";case"CONNECTION_ERROR":return"error";default:return T}}function fy(T){switch(T){case"connecting":return"接続中";case"connected":return"接続済み";case"disconnected":return"切断";case"reconnecting":return"再接続中";case"error":return"エラー";default:return"不明"}}function R0(T){return T<=767?"mobile":T<=1023?"tablet":"desktop"}function sy(){return typeof window>"u"?"desktop":R0(window.innerWidth)}function ai(){return`${Date.now()}-${Math.random().toString(36).slice(2)}`}function oy(){const[T,ol]=V.useState(sy),[q,r]=V.useReducer(cy,j0),[Q,$]=V.useState(!1),[zl,gl]=V.useState([]),[U,z]=V.useState(""),[I,j]=V.useState([]),[nl,kl]=V.useState(!1),[Jl,Gl]=V.useState(0),[Ut,$l]=V.useState(0),[St,Hl]=V.useState("idle"),[tt,bt]=V.useState(0),[Ql,K]=V.useState([]),[wl,ot]=V.useState([]),[Gt,pt]=V.useState(!0),[Tl,Qt]=V.useState({proactivity:!1,affectiveDialog:!1}),[et,Fl]=V.useState({proactivity:!1,affectiveDialog:!1}),[g,O]=V.useState({proactivity:!1,affectiveDialog:!1}),[H,ll]=V.useState("idle"),[il,o]=V.useState("proactivity=false&affective_dialog=false"),[x,A]=V.useState(!1),[D,Y]=V.useState(!1),L=V.useRef(j0),tl=V.useRef(null),Al=V.useRef(null),Sl=V.useRef(null),dl=V.useCallback((_,C,rl,P="standard")=>{const bl={id:ai(),timestamp:new Date().toISOString(),summary:C,category:_,kind:P,detail:JSON.stringify(rl)};K(cl=>[bl,...cl].slice(0,100))},[]),ke=V.useCallback(_=>{ot(C=>C.includes(_)?C.filter(rl=>rl!==_):[...C,_])},[]);V.useEffect(()=>{const _=()=>{ol(R0(window.innerWidth))};return window.addEventListener("resize",_),()=>window.removeEventListener("resize",_)},[]),V.useEffect(()=>{const _=()=>{nl&&Gl(C=>C+1)};return window.addEventListener("mock-audio-chunk",_),()=>window.removeEventListener("mock-audio-chunk",_)},[nl]),V.useEffect(()=>()=>{const _=Sl.current;_&&_.getTracks().forEach(C=>C.stop())},[]),V.useEffect(()=>{if(q!=="connecting"&&q!=="reconnecting")return;const _=window.setTimeout(()=>{r({type:"CONNECTED"})},400);return()=>window.clearTimeout(_)},[q]),V.useEffect(()=>{const _=L.current;_!==q&&(_==="connecting"&&q==="connected"&&(gl(C=>[...C,"接続開始"]),dl("notification","接続済み",{phase:"initial"})),_==="reconnecting"&&q==="connected"&&(gl(C=>[...C,"再接続に成功"]),dl("notification","再接続に成功",{phase:"recover"})),_==="reconnecting"&&q==="connected"&&H==="applying"&&(Fl(Tl),ll("idle"),gl(C=>[...C,"設定変更を反映しました"]),dl("notification","RunConfig反映完了",{proactivity:Tl.proactivity,affectiveDialog:Tl.affectiveDialog})),L.current=q)},[dl,q,Tl,H]),V.useEffect(()=>{if(!Q)return;const _=window.setTimeout(()=>{r({type:"RECONNECT_REQUESTED"}),gl(C=>[...C,"再接続を試行中"]),dl("notification","再接続試行",{scheduled:!0}),$(!1)},1e3);return()=>window.clearTimeout(_)},[dl,Q]),V.useEffect(()=>{const _=tl.current;_&&(_.scrollTop=_.scrollHeight)},[I]),V.useEffect(()=>{const _=C=>{const P=C.detail;if(P){if(P.kind==="text"){const bl=P.text.trim();if(!bl)return;if(P.role==="agent"&&Al.current&&P.partial){const Ml=Al.current;j(Pl=>Pl.map(Ie=>Ie.id===Ml?{...Ie,content:`${Ie.content}${bl}`,status:"partial"}:Ie)),dl("conversation","エージェント応答更新",{partial:!0});return}const cl=ai();j(Ml=>[...Ml,{id:cl,role:P.role,content:bl,status:P.partial?"partial":"complete"}]),P.role==="agent"&&(Al.current=P.partial?cl:null),dl("conversation","会話イベント受信",{role:P.role,partial:P.partial});return}if(P.kind==="audioOutput"){$l(bl=>bl+1),Hl("playing"),dl("conversation","音声出力受信",{chunkSize:P.chunkSize},"audio");return}if(P.kind==="turnComplete"){const bl=Al.current;if(!bl)return;j(cl=>cl.map(Ml=>Ml.id===bl?{...Ml,status:"complete"}:Ml)),Al.current=null,dl("conversation","ターン完了",{kind:"turnComplete"});return}if(P.kind==="runConfigApplyResult"){if(P.status==="applied"){Fl(P.effective),O(P.effective),ll("idle"),gl(cl=>[...cl,"設定変更を反映しました"]),dl("notification","RunConfig反映完了",{status:P.status,effective:P.effective});return}const bl=g.proactivity||g.affectiveDialog?g:{proactivity:!1,affectiveDialog:!1};Fl(bl),ll("idle"),gl(cl=>[...cl,`設定反映に失敗: ${P.reason??"unsupported"}`]),dl("notification","RunConfig反映失敗",{status:P.status,reason:P.reason,fallback:bl});return}if(P.kind==="error"){r({type:"CONNECTION_ERROR"}),gl(bl=>[...bl,`WebSocketエラー: ${P.message}`]),dl("notification","WebSocketエラー",{message:P.message}),$(!0);return}if(P.kind==="interrupted"){const bl=Al.current;bl&&(j(cl=>cl.map(Ml=>Ml.id===bl?{...Ml,status:"interrupted"}:Ml)),Al.current=null),Hl(cl=>cl==="playing"?"interrupted":cl),dl("notification","中断イベント",{kind:"interrupted"})}}};return window.addEventListener("mock-stream-event",_),()=>window.removeEventListener("mock-stream-event",_)},[dl,g]);const qa=()=>{r({type:"CONNECT_REQUESTED"}),dl("notification","接続開始要求",{source:"ui"})},Bu=()=>{r({type:"DISCONNECTED"}),$(!0),gl(_=>[..._,"切断"]),dl("notification","切断",{reconnectScheduled:!0})},Xt=()=>{const _=U.trim();_&&(j(C=>[...C,{id:ai(),role:"user",content:_,status:"complete"}]),dl("conversation","テキスト送信",{text:_}),z(""))},Ya=_=>{_.preventDefault(),Xt()},Ga=()=>{kl(_=>!_)},qu=()=>{const _=Sl.current;_&&(_.getTracks().forEach(C=>C.stop()),Sl.current=null),A(!1),Y(!1)},Yu=async()=>{try{if(!navigator.mediaDevices||!navigator.mediaDevices.getUserMedia)throw new Error("カメラ未対応");const _=await navigator.mediaDevices.getUserMedia({video:!0});Sl.current=_,A(!0),Y(!0),dl("notification","カメラプレビュー開始",{status:"opened"})}catch(_){A(!1),Y(!1);const C=_ instanceof Error?_.message:"unknown";gl(rl=>[...rl,`カメラ利用に失敗: ${C}`]),dl("notification","カメラ利用失敗",{message:C})}},Qa=()=>{j(_=>[..._,{id:ai(),role:"user",content:"[画像を送信しました]",status:"complete"}]),bt(_=>_+1),dl("conversation","画像送信",{placeholder:!0}),qu()},Xa=()=>{pt(_=>!_)},Za=()=>{K([]),ot([])},ui=_=>{const C=new URLSearchParams({proactivity:String(_.proactivity),affective_dialog:String(_.affectiveDialog)}).toString();o(C),ll("applying"),gl(rl=>[...rl,"設定変更を反映中"]),dl("notification","RunConfig変更要求",{proactivity:_.proactivity,affective_dialog:_.affectiveDialog,query:C}),r({type:"RECONNECT_REQUESTED"})},Gu=_=>{Qt(C=>{const rl={...C,[_]:!C[_]};return q==="connected"||q==="reconnecting"?ui(rl):o(new URLSearchParams({proactivity:String(rl.proactivity),affective_dialog:String(rl.affectiveDialog)}).toString()),rl})},Il=()=>b.jsxs(b.Fragment,{children:[b.jsxs("p",{className:"mt-2 text-xs text-slate-300",children:["上流音声チャンク: ",b.jsx("span",{"data-testid":"audio-upstream-chunk-count",children:Jl})]}),b.jsxs("p",{className:"mt-1 text-xs text-slate-300",children:["下流音声チャンク: ",b.jsx("span",{"data-testid":"audio-downstream-chunk-count",children:Ut})]}),b.jsxs("p",{className:"mt-1 text-xs text-slate-300",children:["音声再生状態:"," ",b.jsxs("span",{"data-testid":"audio-playback-state",children:[St==="idle"&&"待機中",St==="playing"&&"再生中",St==="interrupted"&&"中断"]})]}),b.jsxs("p",{className:"mt-1 text-xs text-slate-300",children:["画像上流送信数: ",b.jsx("span",{"data-testid":"image-upstream-count",children:tt})]})]}),ni=()=>{const _=Gt?Ql:Ql.filter(C=>C.kind!=="audio");return b.jsxs(b.Fragment,{children:[b.jsxs("div",{className:"mt-3 flex items-center justify-between gap-3 border-t border-slate-700/70 pt-3",children:[b.jsxs("label",{className:"flex items-center gap-2 text-xs text-slate-300",children:[b.jsx("input",{type:"checkbox",checked:Gt,onChange:Xa}),"音声イベントを表示"]}),b.jsx("button",{type:"button",className:"rounded bg-slate-700 px-2 py-1 text-xs text-slate-100",onClick:Za,children:"ログをクリア"})]}),b.jsx("ul",{"data-testid":"event-log-list",className:"mt-3 space-y-2",children:_.map(C=>{const rl=wl.includes(C.id),P=C.kind==="audio"?"audio":C.category,bl=C.kind==="audio"?"text-cyan-300":C.category==="notification"?"text-amber-300":"text-slate-300";return b.jsxs("li",{"data-testid":"event-log-item",className:"rounded border border-slate-700 bg-slate-900/80 p-2 text-xs",children:[b.jsxs("p",{"data-testid":`event-log-item-${P}`,className:bl,children:["[",P,"] ",C.summary]}),b.jsx("p",{className:"mt-1 text-slate-500",children:C.timestamp}),b.jsx("button",{type:"button",className:"mt-1 rounded bg-slate-700 px-2 py-1 text-slate-100",onClick:()=>ke(C.id),children:rl?"詳細を閉じる":"詳細を開く"}),rl&&b.jsx("pre",{"data-testid":"event-log-detail",className:"mt-2 overflow-x-auto rounded bg-slate-800 p-2 text-[11px] text-slate-200",children:C.detail})]},C.id)})})]})},$e=(_,C="session_overview",rl="run_config")=>b.jsxs("section",{"aria-label":"connection",role:"region",className:_,children:[b.jsxs("div",{className:"flex items-center justify-between gap-2",children:[b.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100 [font-family:'JetBrains_Mono',monospace]",children:C}),b.jsx("span",{"data-testid":"connection-state",className:"rounded-full bg-[#1F2A22] px-2 py-1 text-[10px] text-[#2EE6A6] [font-family:'JetBrains_Mono',monospace]",children:fy(q)})]}),q==="disconnected"&&Q&&b.jsx("p",{className:"mt-2 text-sm text-amber-300",children:"再接続予定"}),q==="error"&&Q&&b.jsx("p",{"data-testid":"recovery-status-banner",className:"mt-2 text-sm text-amber-300",children:"自動回復を試行中"}),b.jsxs("div",{className:"mt-3 flex flex-wrap gap-2",children:[(q==="disconnected"||q==="error")&&b.jsx("button",{type:"button",className:"rounded-[12px] bg-[#00D4AA] px-3 py-2 text-xs font-semibold text-slate-900 transition-colors hover:bg-[#25e1b7]",onClick:qa,children:"接続開始"}),q==="connected"&&b.jsx("button",{type:"button",className:"rounded-[12px] bg-[#1E2631] px-3 py-2 text-xs font-semibold text-slate-100 transition-colors hover:bg-slate-600",onClick:Bu,children:"切断"})]}),b.jsxs("div",{className:"mt-4 rounded-[16px] border border-slate-700 bg-[#151C25] p-3",children:[b.jsx("p",{className:"text-xs font-semibold tracking-wide text-slate-200 [font-family:Oswald,sans-serif]",children:rl}),b.jsxs("label",{className:"mt-2 flex items-center gap-2 text-sm text-slate-200",children:[b.jsx("input",{type:"checkbox",checked:Tl.proactivity,onChange:()=>Gu("proactivity"),disabled:H==="applying"}),"Proactivity"]}),b.jsxs("label",{className:"mt-1 flex items-center gap-2 text-sm text-slate-200",children:[b.jsx("input",{type:"checkbox",checked:Tl.affectiveDialog,onChange:()=>Gu("affectiveDialog"),disabled:H==="applying"}),"Affective Dialog"]}),b.jsx("p",{"data-testid":"run-config-status",className:"mt-2 text-xs text-slate-400",children:H==="applying"?"反映中":"待機"}),b.jsx("p",{"data-testid":"run-config-query",className:"mt-1 text-xs text-slate-500",children:il}),b.jsxs("p",{"data-testid":"run-config-effective",className:"mt-1 text-xs text-slate-400",children:["effective: proactivity=",String(et.proactivity),", affectiveDialog=",String(et.affectiveDialog)]}),b.jsx("p",{"data-testid":"run-config-drift",className:"mt-1 text-xs text-slate-400",children:Tl.proactivity===et.proactivity&&Tl.affectiveDialog===et.affectiveDialog?"一致":"不一致"})]})]}),Fe=(_,C="stream_transcript")=>b.jsxs("section",{"aria-label":"conversation",role:"region",className:_,children:[b.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100 [font-family:Oswald,sans-serif]",children:C}),b.jsxs("ul",{ref:tl,"data-testid":"conversation-log",className:"mt-3 max-h-72 space-y-2 overflow-y-auto rounded-[14px] border border-slate-700 bg-[#111821] p-3",children:[I.length===0&&b.jsx("li",{className:"text-sm text-slate-500",children:"メッセージはまだありません"}),I.map(rl=>b.jsxs("li",{"data-testid":`conversation-message-${rl.role}`,className:`rounded px-3 py-2 text-sm ${rl.role==="user"?"bg-[#1E2631] text-[#D9E0EA]":rl.status==="interrupted"?"bg-[#2B1E22] text-[#FF9AA2]":"bg-[#1A2B27] text-[#DDF6EE]"}`,children:[b.jsx("p",{children:rl.content}),b.jsx("p",{className:"mt-1 text-xs text-slate-400",children:rl.status})]},rl.id))]})]}),ie=(_,C="voice_activity")=>b.jsxs("section",{"aria-label":"event-console",role:"region",className:_,children:[b.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100 [font-family:Oswald,sans-serif]",children:C}),Il(),ni()]});return b.jsxs("main",{className:"min-h-screen bg-[#0B0E13] text-slate-100","data-layout":T,children:[b.jsxs("header",{className:"border-b border-slate-800 bg-[#0F141C] px-4 py-4",children:[b.jsx("h1",{className:"text-3xl font-semibold leading-none [font-family:Oswald,sans-serif]",children:"Realtime Voice Agent"}),b.jsxs("p",{className:"mt-1 text-xs text-slate-400 [font-family:'JetBrains_Mono',monospace]",children:[T==="desktop"&&"BIDI streaming console for text, audio, and image context",T==="tablet"&&"tablet_layout // collapsible panels",T==="mobile"&&"live_voice_console"]}),b.jsx("p",{"data-testid":"layout-mode",className:"mt-1 text-xs text-slate-500",children:T})]}),T==="desktop"&&b.jsxs("div",{className:"m-4 grid grid-cols-[260px_1fr_360px] gap-6 rounded-[24px] bg-[#0F1115] p-6",children:[$e("rounded-[20px] border border-slate-800 bg-[#151A20] p-[20px_18px]","session_overview","run_config"),b.jsxs("div",{className:"flex min-h-[560px] flex-col gap-4",children:[Fe("flex-1 rounded-[16px] border border-slate-800 bg-[#151C25] p-[14px]","stream_transcript"),b.jsx("div",{className:"rounded-[16px] border border-slate-800 bg-[#151C25] p-3 text-xs text-slate-400 [font-family:'JetBrains_Mono',monospace]",children:"stream.websocket ready for text/voice/image payloads"})]}),b.jsxs("div",{className:"flex min-h-[560px] flex-col gap-4",children:[ie("rounded-[16px] border border-slate-800 bg-[#151C25] p-[14px]"),b.jsxs("div",{className:"rounded-[16px] border border-slate-800 bg-[#151C25] p-[14px]",children:[b.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100 [font-family:Oswald,sans-serif]",children:"image_context"}),b.jsx("p",{className:"mt-2 text-[10px] text-[#6F7B8B] [font-family:'JetBrains_Mono',monospace]",children:"model: gemini-live-2.5-flash-native-audio"})]})]})]}),T==="tablet"&&b.jsxs("div",{className:"m-4 grid grid-cols-[1fr_290px] gap-[14px] rounded-[24px] bg-[#0F1115] p-5",children:[b.jsxs("div",{className:"flex min-h-[520px] flex-col gap-4",children:[Fe("rounded-[14px] border border-slate-800 bg-[#151C25] p-3","conversation_stream"),b.jsxs("div",{className:"grid grid-cols-3 gap-[10px]",children:[b.jsxs("div",{className:"rounded-[12px] bg-[#171E27] p-[10px]",children:[b.jsx("p",{className:"text-[10px] text-[#8D98A8] [font-family:'JetBrains_Mono',monospace]",children:"latency_ms"}),b.jsx("p",{className:"text-[24px] leading-none [font-family:Oswald,sans-serif]",children:"178"})]}),b.jsxs("div",{className:"rounded-[12px] bg-[#171E27] p-[10px]",children:[b.jsx("p",{className:"text-[10px] text-[#8D98A8] [font-family:'JetBrains_Mono',monospace]",children:"turns"}),b.jsx("p",{className:"text-[24px] leading-none [font-family:Oswald,sans-serif]",children:"9"})]}),b.jsxs("div",{className:"rounded-[12px] bg-[#FF7A3D] p-[10px] text-[#0F1115]",children:[b.jsx("p",{className:"text-[10px] text-[#2B1408] [font-family:'JetBrains_Mono',monospace]",children:"state"}),b.jsx("p",{className:"text-[24px] leading-none [font-family:Oswald,sans-serif]",children:"SPEAKING"})]})]})]}),b.jsxs("div",{className:"flex min-h-[520px] flex-col gap-4",children:[$e("rounded-[14px] border border-slate-800 bg-[#151C25] p-3","voice_activity","run_config"),ie("flex-1 rounded-[14px] border border-slate-800 bg-[#151C25] p-3","tool_events")]})]}),T==="mobile"&&b.jsxs("div",{className:"m-3 flex flex-col gap-[14px] rounded-[28px] bg-[#0F1115] p-[20px_16px]",children:[b.jsxs("div",{className:"rounded-[14px] bg-transparent",children:[b.jsx("p",{className:"text-[30px] leading-none [font-family:Oswald,sans-serif]",children:"Voxa Mobile"}),b.jsx("p",{className:"mt-1 text-[11px] text-[#8D98A8] [font-family:'JetBrains_Mono',monospace]",children:"live_voice_console"}),b.jsxs("div",{className:"mt-3 flex items-center gap-2",children:[b.jsx("span",{className:"rounded-full bg-[#1F2A22] px-2 py-1 text-[10px] text-[#2EE6A6]",children:"CONNECTED"}),b.jsx("span",{className:"rounded-full bg-[#2C271B] px-2 py-1 text-[10px] text-[#F7C56B]",children:"reconnecting"})]})]}),b.jsxs("div",{className:"grid grid-cols-2 gap-[10px]",children:[b.jsxs("div",{className:"rounded-[12px] bg-[#171E27] p-[10px]",children:[b.jsx("p",{className:"text-[10px] text-[#8D98A8] [font-family:'JetBrains_Mono',monospace]",children:"latency"}),b.jsx("p",{className:"text-[24px] leading-none [font-family:Oswald,sans-serif]",children:"186ms"})]}),b.jsxs("div",{className:"rounded-[12px] bg-[#FF7A3D] p-[10px] text-[#0F1115]",children:[b.jsx("p",{className:"text-[10px] text-[#2B1408] [font-family:'JetBrains_Mono',monospace]",children:"state"}),b.jsx("p",{className:"text-[24px] leading-none [font-family:Oswald,sans-serif]",children:"LIVE"})]})]}),Fe("rounded-[14px] border border-slate-800 bg-[#151C25] p-3","conversation"),b.jsx("div",{className:"rounded-[16px] border border-slate-800 bg-[#111821] p-3",children:b.jsx("button",{type:"button",className:"w-full rounded-[16px] bg-[#00D4AA] px-4 py-3 text-xs font-semibold text-[#092118]",children:"hold_to_talk"})}),b.jsx("div",{className:"rounded-[14px] border border-slate-800 bg-[#161E28] p-[6px_8px]",children:b.jsxs("div",{className:"grid grid-cols-3 gap-2 text-center text-[10px] [font-family:'JetBrains_Mono',monospace]",children:[b.jsx("div",{className:"rounded-[10px] bg-[#1E2631] py-2 text-white",children:"chat"}),b.jsx("div",{className:"rounded-[10px] bg-[#111722] py-2 text-[#8D98A8]",children:"voice"}),b.jsx("div",{className:"rounded-[10px] bg-[#111722] py-2 text-[#8D98A8]",children:"tools"})]})}),$e("rounded-[12px] border border-slate-800 bg-[#151C25] p-[10px]","session_overview","run_config"),ie("rounded-[12px] border border-slate-800 bg-[#151C25] p-[10px]","tool_events")]}),b.jsxs("section",{"aria-label":"input-controls",role:"region",className:T==="mobile"?"border-t border-slate-800 bg-[#0F141C] p-3":"sticky bottom-0 border-t border-slate-800 bg-[#0F141C] p-4",children:[b.jsxs("form",{className:"flex flex-wrap items-center gap-2",onSubmit:Ya,children:[b.jsx("label",{htmlFor:"text-input",className:"sr-only",children:"テキスト入力"}),b.jsx("input",{id:"text-input",type:"text",value:U,onChange:_=>z(_.target.value),className:"min-w-[200px] flex-1 rounded-xl border border-slate-700 bg-slate-800 px-3 py-2 text-sm text-slate-100 placeholder:text-slate-500",placeholder:"メッセージを入力"}),b.jsx("button",{type:"submit",className:"rounded-xl bg-[#FF7A3D] px-4 py-2 text-sm font-semibold text-slate-950",children:"送信"}),b.jsx("button",{type:"button",className:"rounded-xl bg-[#00D4AA] px-4 py-2 text-sm font-semibold text-slate-950",onClick:Ga,children:nl?"音声停止":"音声開始"}),b.jsx("button",{type:"button",className:"rounded-xl bg-slate-700 px-3 py-2 text-sm text-white",onClick:Yu,children:"画像送信"})]}),nl&&b.jsx("p",{"data-testid":"voice-input-state",className:"mt-2 text-sm text-emerald-300",children:"音声入力中"}),b.jsx("p",{"data-testid":"camera-state",className:"mt-1 text-sm text-slate-400",children:D?"利用中":"未使用"})]}),x&&b.jsx("section",{role:"dialog","aria-label":"camera-preview",className:"fixed inset-0 z-10 flex items-center justify-center bg-black/60 p-4",children:b.jsxs("div",{className:"w-full max-w-md rounded-2xl border border-slate-700 bg-[#121821] p-4",children:[b.jsx("p",{className:"text-xl font-semibold [font-family:Oswald,sans-serif]",children:"Camera Preview"}),b.jsx("p",{className:"mt-2 text-sm text-slate-300",children:"プレビュー準備完了"}),b.jsxs("div",{className:"mt-4 flex gap-2",children:[b.jsx("button",{type:"button",className:"rounded-xl bg-[#FF7A3D] px-3 py-2 text-sm font-semibold text-slate-900",onClick:Qa,children:"画像を送信"}),b.jsx("button",{type:"button",className:"rounded-xl bg-slate-700 px-3 py-2 text-sm text-white",onClick:qu,children:"キャンセル"})]})]})}),b.jsxs("section",{"aria-label":"system-notices",role:"region",className:"border-t border-slate-800 bg-[#0F141C] p-3",children:[b.jsx("p",{className:"text-sm font-medium text-slate-200",children:"システム通知"}),b.jsx("ul",{"data-testid":"system-notices",className:"mt-1 list-disc pl-5 text-sm text-slate-300",children:zl.map((_,C)=>b.jsx("li",{"data-testid":"system-notice-item",className:"system-notice-item rounded border-l-2 border-amber-400 bg-amber-950/30 px-2 py-1",children:_},`${_}-${C}`))})]})]})}function dy(){return{connection:"disconnected",conversation:[],notices:[],eventLog:[]}}const my=V.createContext(null);function vy({children:T}){const[ol]=V.useState(dy()),q=V.useMemo(()=>ol,[ol]);return b.jsx(my.Provider,{value:q,children:T})}const H0=document.getElementById("root");if(!H0)throw new Error("Root element #root not found");iy.createRoot(H0).render(b.jsx(V.StrictMode,{children:b.jsx(vy,{children:b.jsx(oy,{})})}));"serviceWorker"in navigator&&window.addEventListener("load",()=>{navigator.serviceWorker.register("/service-worker.js").catch(T=>{console.error("service worker registration failed",T)})});
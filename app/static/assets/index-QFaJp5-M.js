@@ -1,49 +0,0 @@
-(function(){const ol=document.createElement("link").relList;if(ol&&ol.supports&&ol.supports("modulepreload"))return;for(const Q of document.querySelectorAll('link[rel="modulepreload"]'))r(Q);new MutationObserver(Q=>{for(const k of Q)if(k.type==="childList")for(const zl of k.addedNodes)zl.tagName==="LINK"&&zl.rel==="modulepreload"&&r(zl)}).observe(document,{childList:!0,subtree:!0});function B(Q){const k={};return Q.integrity&&(k.integrity=Q.integrity),Q.referrerPolicy&&(k.referrerPolicy=Q.referrerPolicy),Q.crossOrigin==="use-credentials"?k.credentials="include":Q.crossOrigin==="anonymous"?k.credentials="omit":k.credentials="same-origin",k}function r(Q){if(Q.ep)return;Q.ep=!0;const k=B(Q);fetch(Q.href,k)}})();var bf={exports:{}},ju={};/**
- * @license React
- * react-jsx-runtime.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var T0;function Fv(){if(T0)return ju;T0=1;var O=Symbol.for("react.transitional.element"),ol=Symbol.for("react.fragment");function B(r,Q,k){var zl=null;if(k!==void 0&&(zl=""+k),Q.key!==void 0&&(zl=""+Q.key),"key"in Q){k={};for(var hl in Q)hl!=="key"&&(k[hl]=Q[hl])}else k=Q;return Q=k.ref,{$$typeof:O,type:r,key:zl,ref:Q!==void 0?Q:null,props:k}}return ju.Fragment=ol,ju.jsx=B,ju.jsxs=B,ju}var A0;function Iv(){return A0||(A0=1,bf.exports=Fv()),bf.exports}var T=Iv(),pf={exports:{}},G={};/**
- * @license React
- * react.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var x0;function Pv(){if(x0)return G;x0=1;var O=Symbol.for("react.transitional.element"),ol=Symbol.for("react.portal"),B=Symbol.for("react.fragment"),r=Symbol.for("react.strict_mode"),Q=Symbol.for("react.profiler"),k=Symbol.for("react.consumer"),zl=Symbol.for("react.context"),hl=Symbol.for("react.forward_ref"),C=Symbol.for("react.suspense"),z=Symbol.for("react.memo"),I=Symbol.for("react.lazy"),R=Symbol.for("react.activity"),nl=Symbol.iterator;function $l(o){return o===null||typeof o!="object"?null:(o=nl&&o[nl]||o["@@iterator"],typeof o=="function"?o:null)}var Jl={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},Gl=Object.assign,Ut={};function kl(o,E,A){this.props=o,this.context=E,this.refs=Ut,this.updater=A||Jl}kl.prototype.isReactComponent={},kl.prototype.setState=function(o,E){if(typeof o!="object"&&typeof o!="function"&&o!=null)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,o,E,"setState")},kl.prototype.forceUpdate=function(o){this.updater.enqueueForceUpdate(this,o,"forceUpdate")};function St(){}St.prototype=kl.prototype;function jl(o,E,A){this.props=o,this.context=E,this.refs=Ut,this.updater=A||Jl}var tt=jl.prototype=new St;tt.constructor=jl,Gl(tt,kl.prototype),tt.isPureReactComponent=!0;var bt=Array.isArray;function Ql(){}var K={H:null,A:null,T:null,S:null},wl=Object.prototype.hasOwnProperty;function ot(o,E,A){var D=A.ref;return{$$typeof:O,type:o,key:E,ref:D!==void 0?D:null,props:A}}function Gt(o,E){return ot(o.type,E,o.props)}function pt(o){return typeof o=="object"&&o!==null&&o.$$typeof===O}function Tl(o){var E={"=":"=0",":":"=2"};return"$"+o.replace(/[=:]/g,function(A){return E[A]})}var Qt=/\/+/g;function et(o,E){return typeof o=="object"&&o!==null&&o.key!=null?Tl(""+o.key):E.toString(36)}function Fl(o){switch(o.status){case"fulfilled":return o.value;case"rejected":throw o.reason;default:switch(typeof o.status=="string"?o.then(Ql,Ql):(o.status="pending",o.then(function(E){o.status==="pending"&&(o.status="fulfilled",o.value=E)},function(E){o.status==="pending"&&(o.status="rejected",o.reason=E)})),o.status){case"fulfilled":return o.value;case"rejected":throw o.reason}}throw o}function g(o,E,A,D,Y){var L=typeof o;(L==="undefined"||L==="boolean")&&(o=null);var tl=!1;if(o===null)tl=!0;else switch(L){case"bigint":case"string":case"number":tl=!0;break;case"object":switch(o.$$typeof){case O:case ol:tl=!0;break;case I:return tl=o._init,g(tl(o._payload),E,A,D,Y)}}if(tl)return Y=Y(o),tl=D===""?"."+et(o,0):D,bt(Y)?(A="",tl!=null&&(A=tl.replace(Qt,"$&/")+"/"),g(Y,E,A,"",function(dl){return dl})):Y!=null&&(pt(Y)&&(Y=Gt(Y,A+(Y.key==null||o&&o.key===Y.key?"":(""+Y.key).replace(Qt,"$&/")+"/")+tl)),E.push(Y)),1;tl=0;var Al=D===""?".":D+":";if(bt(o))for(var gl=0;gl<o.length;gl++)D=o[gl],L=Al+et(D,gl),tl+=g(D,E,A,L,Y);else if(gl=$l(o),typeof gl=="function")for(o=gl.call(o),gl=0;!(D=o.next()).done;)D=D.value,L=Al+et(D,gl++),tl+=g(D,E,A,L,Y);else if(L==="object"){if(typeof o.then=="function")return g(Fl(o),E,A,D,Y);throw E=String(o),Error("Objects are not valid as a React child (found: "+(E==="[object Object]"?"object with keys {"+Object.keys(o).join(", ")+"}":E)+"). If you meant to render a collection of children, use an array instead.")}return tl}function _(o,E,A){if(o==null)return o;var D=[],Y=0;return g(o,D,"","",function(L){return E.call(A,L,Y++)}),D}function H(o){if(o._status===-1){var E=o._result;E=E(),E.then(function(A){(o._status===0||o._status===-1)&&(o._status=1,o._result=A)},function(A){(o._status===0||o._status===-1)&&(o._status=2,o._result=A)}),o._status===-1&&(o._status=0,o._result=E)}if(o._status===1)return o._result.default;throw o._result}var ll=typeof reportError=="function"?reportError:function(o){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var E=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof o=="object"&&o!==null&&typeof o.message=="string"?String(o.message):String(o),error:o});if(!window.dispatchEvent(E))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",o);return}console.error(o)},cl={map:_,forEach:function(o,E,A){_(o,function(){E.apply(this,arguments)},A)},count:function(o){var E=0;return _(o,function(){E++}),E},toArray:function(o){return _(o,function(E){return E})||[]},only:function(o){if(!pt(o))throw Error("React.Children.only expected to receive a single React element child.");return o}};return G.Activity=R,G.Children=cl,G.Component=kl,G.Fragment=B,G.Profiler=Q,G.PureComponent=jl,G.StrictMode=r,G.Suspense=C,G.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=K,G.__COMPILER_RUNTIME={__proto__:null,c:function(o){return K.H.useMemoCache(o)}},G.cache=function(o){return function(){return o.apply(null,arguments)}},G.cacheSignal=function(){return null},G.cloneElement=function(o,E,A){if(o==null)throw Error("The argument must be a React element, but you passed "+o+".");var D=Gl({},o.props),Y=o.key;if(E!=null)for(L in E.key!==void 0&&(Y=""+E.key),E)!wl.call(E,L)||L==="key"||L==="__self"||L==="__source"||L==="ref"&&E.ref===void 0||(D[L]=E[L]);var L=arguments.length-2;if(L===1)D.children=A;else if(1<L){for(var tl=Array(L),Al=0;Al<L;Al++)tl[Al]=arguments[Al+2];D.children=tl}return ot(o.type,Y,D)},G.createContext=function(o){return o={$$typeof:zl,_currentValue:o,_currentValue2:o,_threadCount:0,Provider:null,Consumer:null},o.Provider=o,o.Consumer={$$typeof:k,_context:o},o},G.createElement=function(o,E,A){var D,Y={},L=null;if(E!=null)for(D in E.key!==void 0&&(L=""+E.key),E)wl.call(E,D)&&D!=="key"&&D!=="__self"&&D!=="__source"&&(Y[D]=E[D]);var tl=arguments.length-2;if(tl===1)Y.children=A;else if(1<tl){for(var Al=Array(tl),gl=0;gl<tl;gl++)Al[gl]=arguments[gl+2];Y.children=Al}if(o&&o.defaultProps)for(D in tl=o.defaultProps,tl)Y[D]===void 0&&(Y[D]=tl[D]);return ot(o,L,Y)},G.createRef=function(){return{current:null}},G.forwardRef=function(o){return{$$typeof:hl,render:o}},G.isValidElement=pt,G.lazy=function(o){return{$$typeof:I,_payload:{_status:-1,_result:o},_init:H}},G.memo=function(o,E){return{$$typeof:z,type:o,compare:E===void 0?null:E}},G.startTransition=function(o){var E=K.T,A={};K.T=A;try{var D=o(),Y=K.S;Y!==null&&Y(A,D),typeof D=="object"&&D!==null&&typeof D.then=="function"&&D.then(Ql,ll)}catch(L){ll(L)}finally{E!==null&&A.types!==null&&(E.types=A.types),K.T=E}},G.unstable_useCacheRefresh=function(){return K.H.useCacheRefresh()},G.use=function(o){return K.H.use(o)},G.useActionState=function(o,E,A){return K.H.useActionState(o,E,A)},G.useCallback=function(o,E){return K.H.useCallback(o,E)},G.useContext=function(o){return K.H.useContext(o)},G.useDebugValue=function(){},G.useDeferredValue=function(o,E){return K.H.useDeferredValue(o,E)},G.useEffect=function(o,E){return K.H.useEffect(o,E)},G.useEffectEvent=function(o){return K.H.useEffectEvent(o)},G.useId=function(){return K.H.useId()},G.useImperativeHandle=function(o,E,A){return K.H.useImperativeHandle(o,E,A)},G.useInsertionEffect=function(o,E){return K.H.useInsertionEffect(o,E)},G.useLayoutEffect=function(o,E){return K.H.useLayoutEffect(o,E)},G.useMemo=function(o,E){return K.H.useMemo(o,E)},G.useOptimistic=function(o,E){return K.H.useOptimistic(o,E)},G.useReducer=function(o,E,A){return K.H.useReducer(o,E,A)},G.useRef=function(o){return K.H.useRef(o)},G.useState=function(o){return K.H.useState(o)},G.useSyncExternalStore=function(o,E,A){return K.H.useSyncExternalStore(o,E,A)},G.useTransition=function(){return K.H.useTransition()},G.version="19.2.4",G}var _0;function xf(){return _0||(_0=1,pf.exports=Pv()),pf.exports}var V=xf(),Ef={exports:{}},Hu={},zf={exports:{}},Tf={};/**
- * @license React
- * scheduler.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var O0;function ly(){return O0||(O0=1,(function(O){function ol(g,_){var H=g.length;g.push(_);l:for(;0<H;){var ll=H-1>>>1,cl=g[ll];if(0<Q(cl,_))g[ll]=_,g[H]=cl,H=ll;else break l}}function B(g){return g.length===0?null:g[0]}function r(g){if(g.length===0)return null;var _=g[0],H=g.pop();if(H!==_){g[0]=H;l:for(var ll=0,cl=g.length,o=cl>>>1;ll<o;){var E=2*(ll+1)-1,A=g[E],D=E+1,Y=g[D];if(0>Q(A,H))D<cl&&0>Q(Y,A)?(g[ll]=Y,g[D]=H,ll=D):(g[ll]=A,g[E]=H,ll=E);else if(D<cl&&0>Q(Y,H))g[ll]=Y,g[D]=H,ll=D;else break l}}return _}function Q(g,_){var H=g.sortIndex-_.sortIndex;return H!==0?H:g.id-_.id}if(O.unstable_now=void 0,typeof performance=="object"&&typeof performance.now=="function"){var k=performance;O.unstable_now=function(){return k.now()}}else{var zl=Date,hl=zl.now();O.unstable_now=function(){return zl.now()-hl}}var C=[],z=[],I=1,R=null,nl=3,$l=!1,Jl=!1,Gl=!1,Ut=!1,kl=typeof setTimeout=="function"?setTimeout:null,St=typeof clearTimeout=="function"?clearTimeout:null,jl=typeof setImmediate<"u"?setImmediate:null;function tt(g){for(var _=B(z);_!==null;){if(_.callback===null)r(z);else if(_.startTime<=g)r(z),_.sortIndex=_.expirationTime,ol(C,_);else break;_=B(z)}}function bt(g){if(Gl=!1,tt(g),!Jl)if(B(C)!==null)Jl=!0,Ql||(Ql=!0,Tl());else{var _=B(z);_!==null&&Fl(bt,_.startTime-g)}}var Ql=!1,K=-1,wl=5,ot=-1;function Gt(){return Ut?!0:!(O.unstable_now()-ot<wl)}function pt(){if(Ut=!1,Ql){var g=O.unstable_now();ot=g;var _=!0;try{l:{Jl=!1,Gl&&(Gl=!1,St(K),K=-1),$l=!0;var H=nl;try{t:{for(tt(g),R=B(C);R!==null&&!(R.expirationTime>g&&Gt());){var ll=R.callback;if(typeof ll=="function"){R.callback=null,nl=R.priorityLevel;var cl=ll(R.expirationTime<=g);if(g=O.unstable_now(),typeof cl=="function"){R.callback=cl,tt(g),_=!0;break t}R===B(C)&&r(C),tt(g)}else r(C);R=B(C)}if(R!==null)_=!0;else{var o=B(z);o!==null&&Fl(bt,o.startTime-g),_=!1}}break l}finally{R=null,nl=H,$l=!1}_=void 0}}finally{_?Tl():Ql=!1}}}var Tl;if(typeof jl=="function")Tl=function(){jl(pt)};else if(typeof MessageChannel<"u"){var Qt=new MessageChannel,et=Qt.port2;Qt.port1.onmessage=pt,Tl=function(){et.postMessage(null)}}else Tl=function(){kl(pt,0)};function Fl(g,_){K=kl(function(){g(O.unstable_now())},_)}O.unstable_IdlePriority=5,O.unstable_ImmediatePriority=1,O.unstable_LowPriority=4,O.unstable_NormalPriority=3,O.unstable_Profiling=null,O.unstable_UserBlockingPriority=2,O.unstable_cancelCallback=function(g){g.callback=null},O.unstable_forceFrameRate=function(g){0>g||125<g?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):wl=0<g?Math.floor(1e3/g):5},O.unstable_getCurrentPriorityLevel=function(){return nl},O.unstable_next=function(g){switch(nl){case 1:case 2:case 3:var _=3;break;default:_=nl}var H=nl;nl=_;try{return g()}finally{nl=H}},O.unstable_requestPaint=function(){Ut=!0},O.unstable_runWithPriority=function(g,_){switch(g){case 1:case 2:case 3:case 4:case 5:break;default:g=3}var H=nl;nl=g;try{return _()}finally{nl=H}},O.unstable_scheduleCallback=function(g,_,H){var ll=O.unstable_now();switch(typeof H=="object"&&H!==null?(H=H.delay,H=typeof H=="number"&&0<H?ll+H:ll):H=ll,g){case 1:var cl=-1;break;case 2:cl=250;break;case 5:cl=1073741823;break;case 4:cl=1e4;break;default:cl=5e3}return cl=H+cl,g={id:I++,callback:_,priorityLevel:g,startTime:H,expirationTime:cl,sortIndex:-1},H>ll?(g.sortIndex=H,ol(z,g),B(C)===null&&g===B(z)&&(Gl?(St(K),K=-1):Gl=!0,Fl(bt,H-ll))):(g.sortIndex=cl,ol(C,g),Jl||$l||(Jl=!0,Ql||(Ql=!0,Tl()))),g},O.unstable_shouldYield=Gt,O.unstable_wrapCallback=function(g){var _=nl;return function(){var H=nl;nl=_;try{return g.apply(this,arguments)}finally{nl=H}}}})(Tf)),Tf}var M0;function ty(){return M0||(M0=1,zf.exports=ly()),zf.exports}var Af={exports:{}},Wl={};/**
- * @license React
- * react-dom.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var D0;function ey(){if(D0)return Wl;D0=1;var O=xf();function ol(C){var z="https://react.dev/errors/"+C;if(1<arguments.length){z+="?args[]="+encodeURIComponent(arguments[1]);for(var I=2;I<arguments.length;I++)z+="&args[]="+encodeURIComponent(arguments[I])}return"Minified React error #"+C+"; visit "+z+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function B(){}var r={d:{f:B,r:function(){throw Error(ol(522))},D:B,C:B,L:B,m:B,X:B,S:B,M:B},p:0,findDOMNode:null},Q=Symbol.for("react.portal");function k(C,z,I){var R=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:Q,key:R==null?null:""+R,children:C,containerInfo:z,implementation:I}}var zl=O.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function hl(C,z){if(C==="font")return"";if(typeof z=="string")return z==="use-credentials"?z:""}return Wl.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=r,Wl.createPortal=function(C,z){var I=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!z||z.nodeType!==1&&z.nodeType!==9&&z.nodeType!==11)throw Error(ol(299));return k(C,z,null,I)},Wl.flushSync=function(C){var z=zl.T,I=r.p;try{if(zl.T=null,r.p=2,C)return C()}finally{zl.T=z,r.p=I,r.d.f()}},Wl.preconnect=function(C,z){typeof C=="string"&&(z?(z=z.crossOrigin,z=typeof z=="string"?z==="use-credentials"?z:"":void 0):z=null,r.d.C(C,z))},Wl.prefetchDNS=function(C){typeof C=="string"&&r.d.D(C)},Wl.preinit=function(C,z){if(typeof C=="string"&&z&&typeof z.as=="string"){var I=z.as,R=hl(I,z.crossOrigin),nl=typeof z.integrity=="string"?z.integrity:void 0,$l=typeof z.fetchPriority=="string"?z.fetchPriority:void 0;I==="style"?r.d.S(C,typeof z.precedence=="string"?z.precedence:void 0,{crossOrigin:R,integrity:nl,fetchPriority:$l}):I==="script"&&r.d.X(C,{crossOrigin:R,integrity:nl,fetchPriority:$l,nonce:typeof z.nonce=="string"?z.nonce:void 0})}},Wl.preinitModule=function(C,z){if(typeof C=="string")if(typeof z=="object"&&z!==null){if(z.as==null||z.as==="script"){var I=hl(z.as,z.crossOrigin);r.d.M(C,{crossOrigin:I,integrity:typeof z.integrity=="string"?z.integrity:void 0,nonce:typeof z.nonce=="string"?z.nonce:void 0})}}else z==null&&r.d.M(C)},Wl.preload=function(C,z){if(typeof C=="string"&&typeof z=="object"&&z!==null&&typeof z.as=="string"){var I=z.as,R=hl(I,z.crossOrigin);r.d.L(C,I,{crossOrigin:R,integrity:typeof z.integrity=="string"?z.integrity:void 0,nonce:typeof z.nonce=="string"?z.nonce:void 0,type:typeof z.type=="string"?z.type:void 0,fetchPriority:typeof z.fetchPriority=="string"?z.fetchPriority:void 0,referrerPolicy:typeof z.referrerPolicy=="string"?z.referrerPolicy:void 0,imageSrcSet:typeof z.imageSrcSet=="string"?z.imageSrcSet:void 0,imageSizes:typeof z.imageSizes=="string"?z.imageSizes:void 0,media:typeof z.media=="string"?z.media:void 0})}},Wl.preloadModule=function(C,z){if(typeof C=="string")if(z){var I=hl(z.as,z.crossOrigin);r.d.m(C,{as:typeof z.as=="string"&&z.as!=="script"?z.as:void 0,crossOrigin:I,integrity:typeof z.integrity=="string"?z.integrity:void 0})}else r.d.m(C)},Wl.requestFormReset=function(C){r.d.r(C)},Wl.unstable_batchedUpdates=function(C,z){return C(z)},Wl.useFormState=function(C,z,I){return zl.H.useFormState(C,z,I)},Wl.useFormStatus=function(){return zl.H.useHostTransitionStatus()},Wl.version="19.2.4",Wl}var N0;function ay(){if(N0)return Af.exports;N0=1;function O(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(O)}catch(ol){console.error(ol)}}return O(),Af.exports=ey(),Af.exports}/**
- * @license React
- * react-dom-client.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var U0;function uy(){if(U0)return Hu;U0=1;var O=ty(),ol=xf(),B=ay();function r(l){var t="https://react.dev/errors/"+l;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var e=2;e<arguments.length;e++)t+="&args[]="+encodeURIComponent(arguments[e])}return"Minified React error #"+l+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function Q(l){return!(!l||l.nodeType!==1&&l.nodeType!==9&&l.nodeType!==11)}function k(l){var t=l,e=l;if(l.alternate)for(;t.return;)t=t.return;else{l=t;do t=l,(t.flags&4098)!==0&&(e=t.return),l=t.return;while(l)}return t.tag===3?e:null}function zl(l){if(l.tag===13){var t=l.memoizedState;if(t===null&&(l=l.alternate,l!==null&&(t=l.memoizedState)),t!==null)return t.dehydrated}return null}function hl(l){if(l.tag===31){var t=l.memoizedState;if(t===null&&(l=l.alternate,l!==null&&(t=l.memoizedState)),t!==null)return t.dehydrated}return null}function C(l){if(k(l)!==l)throw Error(r(188))}function z(l){var t=l.alternate;if(!t){if(t=k(l),t===null)throw Error(r(188));return t!==l?null:l}for(var e=l,a=t;;){var u=e.return;if(u===null)break;var n=u.alternate;if(n===null){if(a=u.return,a!==null){e=a;continue}break}if(u.child===n.child){for(n=u.child;n;){if(n===e)return C(u),l;if(n===a)return C(u),t;n=n.sibling}throw Error(r(188))}if(e.return!==a.return)e=u,a=n;else{for(var c=!1,i=u.child;i;){if(i===e){c=!0,e=u,a=n;break}if(i===a){c=!0,a=u,e=n;break}i=i.sibling}if(!c){for(i=n.child;i;){if(i===e){c=!0,e=n,a=u;break}if(i===a){c=!0,a=n,e=u;break}i=i.sibling}if(!c)throw Error(r(189))}}if(e.alternate!==a)throw Error(r(190))}if(e.tag!==3)throw Error(r(188));return e.stateNode.current===e?l:t}function I(l){var t=l.tag;if(t===5||t===26||t===27||t===6)return l;for(l=l.child;l!==null;){if(t=I(l),t!==null)return t;l=l.sibling}return null}var R=Object.assign,nl=Symbol.for("react.element"),$l=Symbol.for("react.transitional.element"),Jl=Symbol.for("react.portal"),Gl=Symbol.for("react.fragment"),Ut=Symbol.for("react.strict_mode"),kl=Symbol.for("react.profiler"),St=Symbol.for("react.consumer"),jl=Symbol.for("react.context"),tt=Symbol.for("react.forward_ref"),bt=Symbol.for("react.suspense"),Ql=Symbol.for("react.suspense_list"),K=Symbol.for("react.memo"),wl=Symbol.for("react.lazy"),ot=Symbol.for("react.activity"),Gt=Symbol.for("react.memo_cache_sentinel"),pt=Symbol.iterator;function Tl(l){return l===null||typeof l!="object"?null:(l=pt&&l[pt]||l["@@iterator"],typeof l=="function"?l:null)}var Qt=Symbol.for("react.client.reference");function et(l){if(l==null)return null;if(typeof l=="function")return l.$$typeof===Qt?null:l.displayName||l.name||null;if(typeof l=="string")return l;switch(l){case Gl:return"Fragment";case kl:return"Profiler";case Ut:return"StrictMode";case bt:return"Suspense";case Ql:return"SuspenseList";case ot:return"Activity"}if(typeof l=="object")switch(l.$$typeof){case Jl:return"Portal";case jl:return l.displayName||"Context";case St:return(l._context.displayName||"Context")+".Consumer";case tt:var t=l.render;return l=l.displayName,l||(l=t.displayName||t.name||"",l=l!==""?"ForwardRef("+l+")":"ForwardRef"),l;case K:return t=l.displayName||null,t!==null?t:et(l.type)||"Memo";case wl:t=l._payload,l=l._init;try{return et(l(t))}catch{}}return null}var Fl=Array.isArray,g=ol.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,_=B.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,H={pending:!1,data:null,method:null,action:null},ll=[],cl=-1;function o(l){return{current:l}}function E(l){0>cl||(l.current=ll[cl],ll[cl]=null,cl--)}function A(l,t){cl++,ll[cl]=l.current,l.current=t}var D=o(null),Y=o(null),L=o(null),tl=o(null);function Al(l,t){switch(A(L,t),A(Y,l),A(D,null),t.nodeType){case 9:case 11:l=(l=t.documentElement)&&(l=l.namespaceURI)?Jd(l):0;break;default:if(l=t.tagName,t=t.namespaceURI)t=Jd(t),l=wd(t,l);else switch(l){case"svg":l=1;break;case"math":l=2;break;default:l=0}}E(D),A(D,l)}function gl(){E(D),E(Y),E(L)}function dl(l){l.memoizedState!==null&&A(tl,l);var t=D.current,e=wd(t,l.type);t!==e&&(A(Y,l),A(D,e))}function $e(l){Y.current===l&&(E(D),E(Y)),tl.current===l&&(E(tl),Nu._currentValue=H)}var Ba,qu;function Xt(l){if(Ba===void 0)try{throw Error()}catch(e){var t=e.stack.trim().match(/\n( *(at )?)/);Ba=t&&t[1]||"",qu=-1<e.stack.indexOf(`
-    at`)?" (<anonymous>)":-1<e.stack.indexOf("@")?"@unknown:0:0":""}return`
-`+Ba+l+qu}var Ya=!1;function Ga(l,t){if(!l||Ya)return"";Ya=!0;var e=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var a={DetermineComponentFrameRoot:function(){try{if(t){var p=function(){throw Error()};if(Object.defineProperty(p.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(p,[])}catch(h){var y=h}Reflect.construct(l,[],p)}else{try{p.call()}catch(h){y=h}l.call(p.prototype)}}else{try{throw Error()}catch(h){y=h}(p=l())&&typeof p.catch=="function"&&p.catch(function(){})}}catch(h){if(h&&y&&typeof h.stack=="string")return[h.stack,y.stack]}return[null,null]}};a.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var u=Object.getOwnPropertyDescriptor(a.DetermineComponentFrameRoot,"name");u&&u.configurable&&Object.defineProperty(a.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var n=a.DetermineComponentFrameRoot(),c=n[0],i=n[1];if(c&&i){var f=c.split(`
-`),v=i.split(`
-`);for(u=a=0;a<f.length&&!f[a].includes("DetermineComponentFrameRoot");)a++;for(;u<v.length&&!v[u].includes("DetermineComponentFrameRoot");)u++;if(a===f.length||u===v.length)for(a=f.length-1,u=v.length-1;1<=a&&0<=u&&f[a]!==v[u];)u--;for(;1<=a&&0<=u;a--,u--)if(f[a]!==v[u]){if(a!==1||u!==1)do if(a--,u--,0>u||f[a]!==v[u]){var S=`
-`+f[a].replace(" at new "," at ");return l.displayName&&S.includes("<anonymous>")&&(S=S.replace("<anonymous>",l.displayName)),S}while(1<=a&&0<=u);break}}}finally{Ya=!1,Error.prepareStackTrace=e}return(e=l?l.displayName||l.name:"")?Xt(e):""}function Bu(l,t){switch(l.tag){case 26:case 27:case 5:return Xt(l.type);case 16:return Xt("Lazy");case 13:return l.child!==t&&t!==null?Xt("Suspense Fallback"):Xt("Suspense");case 19:return Xt("SuspenseList");case 0:case 15:return Ga(l.type,!1);case 11:return Ga(l.type.render,!1);case 1:return Ga(l.type,!0);case 31:return Xt("Activity");default:return""}}function Yu(l){try{var t="",e=null;do t+=Bu(l,e),e=l,l=l.return;while(l);return t}catch(a){return`
-Error generating stack: `+a.message+`
-`+a.stack}}var Qa=Object.prototype.hasOwnProperty,Xa=O.unstable_scheduleCallback,Za=O.unstable_cancelCallback,uc=O.unstable_shouldYield,Gu=O.unstable_requestPaint,Il=O.unstable_now,nc=O.unstable_getCurrentPriorityLevel,ke=O.unstable_ImmediatePriority,Fe=O.unstable_UserBlockingPriority,ce=O.unstable_NormalPriority,x=O.unstable_LowPriority,U=O.unstable_IdlePriority,ql=O.log,P=O.unstable_setDisableYieldValue,Sl=null,il=null;function Dl(l){if(typeof ql=="function"&&P(l),il&&typeof il.setStrictMode=="function")try{il.setStrictMode(Sl,l)}catch{}}var Pl=Math.clz32?Math.clz32:B0,Ie=Math.log,q0=Math.LN2;function B0(l){return l>>>=0,l===0?32:31-(Ie(l)/q0|0)|0}var Qu=256,Xu=262144,Zu=4194304;function Ue(l){var t=l&42;if(t!==0)return t;switch(l&-l){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:return l&261888;case 262144:case 524288:case 1048576:case 2097152:return l&3932160;case 4194304:case 8388608:case 16777216:case 33554432:return l&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return l}}function Lu(l,t,e){var a=l.pendingLanes;if(a===0)return 0;var u=0,n=l.suspendedLanes,c=l.pingedLanes;l=l.warmLanes;var i=a&134217727;return i!==0?(a=i&~n,a!==0?u=Ue(a):(c&=i,c!==0?u=Ue(c):e||(e=i&~l,e!==0&&(u=Ue(e))))):(i=a&~n,i!==0?u=Ue(i):c!==0?u=Ue(c):e||(e=a&~l,e!==0&&(u=Ue(e)))),u===0?0:t!==0&&t!==u&&(t&n)===0&&(n=u&-u,e=t&-t,n>=e||n===32&&(e&4194048)!==0)?t:u}function La(l,t){return(l.pendingLanes&~(l.suspendedLanes&~l.pingedLanes)&t)===0}function Y0(l,t){switch(l){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function _f(){var l=Zu;return Zu<<=1,(Zu&62914560)===0&&(Zu=4194304),l}function cc(l){for(var t=[],e=0;31>e;e++)t.push(l);return t}function Va(l,t){l.pendingLanes|=t,t!==268435456&&(l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0)}function G0(l,t,e,a,u,n){var c=l.pendingLanes;l.pendingLanes=e,l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0,l.expiredLanes&=e,l.entangledLanes&=e,l.errorRecoveryDisabledLanes&=e,l.shellSuspendCounter=0;var i=l.entanglements,f=l.expirationTimes,v=l.hiddenUpdates;for(e=c&~e;0<e;){var S=31-Pl(e),p=1<<S;i[S]=0,f[S]=-1;var y=v[S];if(y!==null)for(v[S]=null,S=0;S<y.length;S++){var h=y[S];h!==null&&(h.lane&=-536870913)}e&=~p}a!==0&&Of(l,a,0),n!==0&&u===0&&l.tag!==0&&(l.suspendedLanes|=n&~(c&~t))}function Of(l,t,e){l.pendingLanes|=t,l.suspendedLanes&=~t;var a=31-Pl(t);l.entangledLanes|=t,l.entanglements[a]=l.entanglements[a]|1073741824|e&261930}function Mf(l,t){var e=l.entangledLanes|=t;for(l=l.entanglements;e;){var a=31-Pl(e),u=1<<a;u&t|l[a]&t&&(l[a]|=t),e&=~u}}function Df(l,t){var e=t&-t;return e=(e&42)!==0?1:ic(e),(e&(l.suspendedLanes|t))!==0?0:e}function ic(l){switch(l){case 2:l=1;break;case 8:l=4;break;case 32:l=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:l=128;break;case 268435456:l=134217728;break;default:l=0}return l}function fc(l){return l&=-l,2<l?8<l?(l&134217727)!==0?32:268435456:8:2}function Nf(){var l=_.p;return l!==0?l:(l=window.event,l===void 0?32:h0(l.type))}function Uf(l,t){var e=_.p;try{return _.p=l,t()}finally{_.p=e}}var ie=Math.random().toString(36).slice(2),Xl="__reactFiber$"+ie,at="__reactProps$"+ie,Pe="__reactContainer$"+ie,sc="__reactEvents$"+ie,Q0="__reactListeners$"+ie,X0="__reactHandles$"+ie,Cf="__reactResources$"+ie,Ka="__reactMarker$"+ie;function oc(l){delete l[Xl],delete l[at],delete l[sc],delete l[Q0],delete l[X0]}function la(l){var t=l[Xl];if(t)return t;for(var e=l.parentNode;e;){if(t=e[Pe]||e[Xl]){if(e=t.alternate,t.child!==null||e!==null&&e.child!==null)for(l=l0(l);l!==null;){if(e=l[Xl])return e;l=l0(l)}return t}l=e,e=l.parentNode}return null}function ta(l){if(l=l[Xl]||l[Pe]){var t=l.tag;if(t===5||t===6||t===13||t===31||t===26||t===27||t===3)return l}return null}function Ja(l){var t=l.tag;if(t===5||t===26||t===27||t===6)return l.stateNode;throw Error(r(33))}function ea(l){var t=l[Cf];return t||(t=l[Cf]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function Bl(l){l[Ka]=!0}var Rf=new Set,jf={};function Ce(l,t){aa(l,t),aa(l+"Capture",t)}function aa(l,t){for(jf[l]=t,l=0;l<t.length;l++)Rf.add(t[l])}var Z0=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),Hf={},qf={};function L0(l){return Qa.call(qf,l)?!0:Qa.call(Hf,l)?!1:Z0.test(l)?qf[l]=!0:(Hf[l]=!0,!1)}function Vu(l,t,e){if(L0(t))if(e===null)l.removeAttribute(t);else{switch(typeof e){case"undefined":case"function":case"symbol":l.removeAttribute(t);return;case"boolean":var a=t.toLowerCase().slice(0,5);if(a!=="data-"&&a!=="aria-"){l.removeAttribute(t);return}}l.setAttribute(t,""+e)}}function Ku(l,t,e){if(e===null)l.removeAttribute(t);else{switch(typeof e){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(t);return}l.setAttribute(t,""+e)}}function Zt(l,t,e,a){if(a===null)l.removeAttribute(e);else{switch(typeof a){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(e);return}l.setAttributeNS(t,e,""+a)}}function Et(l){switch(typeof l){case"bigint":case"boolean":case"number":case"string":case"undefined":return l;case"object":return l;default:return""}}function Bf(l){var t=l.type;return(l=l.nodeName)&&l.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function V0(l,t,e){var a=Object.getOwnPropertyDescriptor(l.constructor.prototype,t);if(!l.hasOwnProperty(t)&&typeof a<"u"&&typeof a.get=="function"&&typeof a.set=="function"){var u=a.get,n=a.set;return Object.defineProperty(l,t,{configurable:!0,get:function(){return u.call(this)},set:function(c){e=""+c,n.call(this,c)}}),Object.defineProperty(l,t,{enumerable:a.enumerable}),{getValue:function(){return e},setValue:function(c){e=""+c},stopTracking:function(){l._valueTracker=null,delete l[t]}}}}function dc(l){if(!l._valueTracker){var t=Bf(l)?"checked":"value";l._valueTracker=V0(l,t,""+l[t])}}function Yf(l){if(!l)return!1;var t=l._valueTracker;if(!t)return!0;var e=t.getValue(),a="";return l&&(a=Bf(l)?l.checked?"true":"false":l.value),l=a,l!==e?(t.setValue(l),!0):!1}function Ju(l){if(l=l||(typeof document<"u"?document:void 0),typeof l>"u")return null;try{return l.activeElement||l.body}catch{return l.body}}var K0=/[\n"\\]/g;function zt(l){return l.replace(K0,function(t){return"\\"+t.charCodeAt(0).toString(16)+" "})}function mc(l,t,e,a,u,n,c,i){l.name="",c!=null&&typeof c!="function"&&typeof c!="symbol"&&typeof c!="boolean"?l.type=c:l.removeAttribute("type"),t!=null?c==="number"?(t===0&&l.value===""||l.value!=t)&&(l.value=""+Et(t)):l.value!==""+Et(t)&&(l.value=""+Et(t)):c!=="submit"&&c!=="reset"||l.removeAttribute("value"),t!=null?vc(l,c,Et(t)):e!=null?vc(l,c,Et(e)):a!=null&&l.removeAttribute("value"),u==null&&n!=null&&(l.defaultChecked=!!n),u!=null&&(l.checked=u&&typeof u!="function"&&typeof u!="symbol"),i!=null&&typeof i!="function"&&typeof i!="symbol"&&typeof i!="boolean"?l.name=""+Et(i):l.removeAttribute("name")}function Gf(l,t,e,a,u,n,c,i){if(n!=null&&typeof n!="function"&&typeof n!="symbol"&&typeof n!="boolean"&&(l.type=n),t!=null||e!=null){if(!(n!=="submit"&&n!=="reset"||t!=null)){dc(l);return}e=e!=null?""+Et(e):"",t=t!=null?""+Et(t):e,i||t===l.value||(l.value=t),l.defaultValue=t}a=a??u,a=typeof a!="function"&&typeof a!="symbol"&&!!a,l.checked=i?l.checked:!!a,l.defaultChecked=!!a,c!=null&&typeof c!="function"&&typeof c!="symbol"&&typeof c!="boolean"&&(l.name=c),dc(l)}function vc(l,t,e){t==="number"&&Ju(l.ownerDocument)===l||l.defaultValue===""+e||(l.defaultValue=""+e)}function ua(l,t,e,a){if(l=l.options,t){t={};for(var u=0;u<e.length;u++)t["$"+e[u]]=!0;for(e=0;e<l.length;e++)u=t.hasOwnProperty("$"+l[e].value),l[e].selected!==u&&(l[e].selected=u),u&&a&&(l[e].defaultSelected=!0)}else{for(e=""+Et(e),t=null,u=0;u<l.length;u++){if(l[u].value===e){l[u].selected=!0,a&&(l[u].defaultSelected=!0);return}t!==null||l[u].disabled||(t=l[u])}t!==null&&(t.selected=!0)}}function Qf(l,t,e){if(t!=null&&(t=""+Et(t),t!==l.value&&(l.value=t),e==null)){l.defaultValue!==t&&(l.defaultValue=t);return}l.defaultValue=e!=null?""+Et(e):""}function Xf(l,t,e,a){if(t==null){if(a!=null){if(e!=null)throw Error(r(92));if(Fl(a)){if(1<a.length)throw Error(r(93));a=a[0]}e=a}e==null&&(e=""),t=e}e=Et(t),l.defaultValue=e,a=l.textContent,a===e&&a!==""&&a!==null&&(l.value=a),dc(l)}function na(l,t){if(t){var e=l.firstChild;if(e&&e===l.lastChild&&e.nodeType===3){e.nodeValue=t;return}}l.textContent=t}var J0=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function Zf(l,t,e){var a=t.indexOf("--")===0;e==null||typeof e=="boolean"||e===""?a?l.setProperty(t,""):t==="float"?l.cssFloat="":l[t]="":a?l.setProperty(t,e):typeof e!="number"||e===0||J0.has(t)?t==="float"?l.cssFloat=e:l[t]=(""+e).trim():l[t]=e+"px"}function Lf(l,t,e){if(t!=null&&typeof t!="object")throw Error(r(62));if(l=l.style,e!=null){for(var a in e)!e.hasOwnProperty(a)||t!=null&&t.hasOwnProperty(a)||(a.indexOf("--")===0?l.setProperty(a,""):a==="float"?l.cssFloat="":l[a]="");for(var u in t)a=t[u],t.hasOwnProperty(u)&&e[u]!==a&&Zf(l,u,a)}else for(var n in t)t.hasOwnProperty(n)&&Zf(l,n,t[n])}function yc(l){if(l.indexOf("-")===-1)return!1;switch(l){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var w0=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),W0=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function wu(l){return W0.test(""+l)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":l}function Lt(){}var rc=null;function hc(l){return l=l.target||l.srcElement||window,l.correspondingUseElement&&(l=l.correspondingUseElement),l.nodeType===3?l.parentNode:l}var ca=null,ia=null;function Vf(l){var t=ta(l);if(t&&(l=t.stateNode)){var e=l[at]||null;l:switch(l=t.stateNode,t.type){case"input":if(mc(l,e.value,e.defaultValue,e.defaultValue,e.checked,e.defaultChecked,e.type,e.name),t=e.name,e.type==="radio"&&t!=null){for(e=l;e.parentNode;)e=e.parentNode;for(e=e.querySelectorAll('input[name="'+zt(""+t)+'"][type="radio"]'),t=0;t<e.length;t++){var a=e[t];if(a!==l&&a.form===l.form){var u=a[at]||null;if(!u)throw Error(r(90));mc(a,u.value,u.defaultValue,u.defaultValue,u.checked,u.defaultChecked,u.type,u.name)}}for(t=0;t<e.length;t++)a=e[t],a.form===l.form&&Yf(a)}break l;case"textarea":Qf(l,e.value,e.defaultValue);break l;case"select":t=e.value,t!=null&&ua(l,!!e.multiple,t,!1)}}}var gc=!1;function Kf(l,t,e){if(gc)return l(t,e);gc=!0;try{var a=l(t);return a}finally{if(gc=!1,(ca!==null||ia!==null)&&(Hn(),ca&&(t=ca,l=ia,ia=ca=null,Vf(t),l)))for(t=0;t<l.length;t++)Vf(l[t])}}function wa(l,t){var e=l.stateNode;if(e===null)return null;var a=e[at]||null;if(a===null)return null;e=a[t];l:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(a=!a.disabled)||(l=l.type,a=!(l==="button"||l==="input"||l==="select"||l==="textarea")),l=!a;break l;default:l=!1}if(l)return null;if(e&&typeof e!="function")throw Error(r(231,t,typeof e));return e}var Vt=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),Sc=!1;if(Vt)try{var Wa={};Object.defineProperty(Wa,"passive",{get:function(){Sc=!0}}),window.addEventListener("test",Wa,Wa),window.removeEventListener("test",Wa,Wa)}catch{Sc=!1}var fe=null,bc=null,Wu=null;function Jf(){if(Wu)return Wu;var l,t=bc,e=t.length,a,u="value"in fe?fe.value:fe.textContent,n=u.length;for(l=0;l<e&&t[l]===u[l];l++);var c=e-l;for(a=1;a<=c&&t[e-a]===u[n-a];a++);return Wu=u.slice(l,1<a?1-a:void 0)}function $u(l){var t=l.keyCode;return"charCode"in l?(l=l.charCode,l===0&&t===13&&(l=13)):l=t,l===10&&(l=13),32<=l||l===13?l:0}function ku(){return!0}function wf(){return!1}function ut(l){function t(e,a,u,n,c){this._reactName=e,this._targetInst=u,this.type=a,this.nativeEvent=n,this.target=c,this.currentTarget=null;for(var i in l)l.hasOwnProperty(i)&&(e=l[i],this[i]=e?e(n):n[i]);return this.isDefaultPrevented=(n.defaultPrevented!=null?n.defaultPrevented:n.returnValue===!1)?ku:wf,this.isPropagationStopped=wf,this}return R(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():typeof e.returnValue!="unknown"&&(e.returnValue=!1),this.isDefaultPrevented=ku)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():typeof e.cancelBubble!="unknown"&&(e.cancelBubble=!0),this.isPropagationStopped=ku)},persist:function(){},isPersistent:ku}),t}var Re={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(l){return l.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Fu=ut(Re),$a=R({},Re,{view:0,detail:0}),$0=ut($a),pc,Ec,ka,Iu=R({},$a,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Tc,button:0,buttons:0,relatedTarget:function(l){return l.relatedTarget===void 0?l.fromElement===l.srcElement?l.toElement:l.fromElement:l.relatedTarget},movementX:function(l){return"movementX"in l?l.movementX:(l!==ka&&(ka&&l.type==="mousemove"?(pc=l.screenX-ka.screenX,Ec=l.screenY-ka.screenY):Ec=pc=0,ka=l),pc)},movementY:function(l){return"movementY"in l?l.movementY:Ec}}),Wf=ut(Iu),k0=R({},Iu,{dataTransfer:0}),F0=ut(k0),I0=R({},$a,{relatedTarget:0}),zc=ut(I0),P0=R({},Re,{animationName:0,elapsedTime:0,pseudoElement:0}),lm=ut(P0),tm=R({},Re,{clipboardData:function(l){return"clipboardData"in l?l.clipboardData:window.clipboardData}}),em=ut(tm),am=R({},Re,{data:0}),$f=ut(am),um={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},nm={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},cm={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function im(l){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(l):(l=cm[l])?!!t[l]:!1}function Tc(){return im}var fm=R({},$a,{key:function(l){if(l.key){var t=um[l.key]||l.key;if(t!=="Unidentified")return t}return l.type==="keypress"?(l=$u(l),l===13?"Enter":String.fromCharCode(l)):l.type==="keydown"||l.type==="keyup"?nm[l.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Tc,charCode:function(l){return l.type==="keypress"?$u(l):0},keyCode:function(l){return l.type==="keydown"||l.type==="keyup"?l.keyCode:0},which:function(l){return l.type==="keypress"?$u(l):l.type==="keydown"||l.type==="keyup"?l.keyCode:0}}),sm=ut(fm),om=R({},Iu,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),kf=ut(om),dm=R({},$a,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Tc}),mm=ut(dm),vm=R({},Re,{propertyName:0,elapsedTime:0,pseudoElement:0}),ym=ut(vm),rm=R({},Iu,{deltaX:function(l){return"deltaX"in l?l.deltaX:"wheelDeltaX"in l?-l.wheelDeltaX:0},deltaY:function(l){return"deltaY"in l?l.deltaY:"wheelDeltaY"in l?-l.wheelDeltaY:"wheelDelta"in l?-l.wheelDelta:0},deltaZ:0,deltaMode:0}),hm=ut(rm),gm=R({},Re,{newState:0,oldState:0}),Sm=ut(gm),bm=[9,13,27,32],Ac=Vt&&"CompositionEvent"in window,Fa=null;Vt&&"documentMode"in document&&(Fa=document.documentMode);var pm=Vt&&"TextEvent"in window&&!Fa,Ff=Vt&&(!Ac||Fa&&8<Fa&&11>=Fa),If=" ",Pf=!1;function ls(l,t){switch(l){case"keyup":return bm.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function ts(l){return l=l.detail,typeof l=="object"&&"data"in l?l.data:null}var fa=!1;function Em(l,t){switch(l){case"compositionend":return ts(t);case"keypress":return t.which!==32?null:(Pf=!0,If);case"textInput":return l=t.data,l===If&&Pf?null:l;default:return null}}function zm(l,t){if(fa)return l==="compositionend"||!Ac&&ls(l,t)?(l=Jf(),Wu=bc=fe=null,fa=!1,l):null;switch(l){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Ff&&t.locale!=="ko"?null:t.data;default:return null}}var Tm={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function es(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t==="input"?!!Tm[l.type]:t==="textarea"}function as(l,t,e,a){ca?ia?ia.push(a):ia=[a]:ca=a,t=Zn(t,"onChange"),0<t.length&&(e=new Fu("onChange","change",null,e,a),l.push({event:e,listeners:t}))}var Ia=null,Pa=null;function Am(l){Qd(l,0)}function Pu(l){var t=Ja(l);if(Yf(t))return l}function us(l,t){if(l==="change")return t}var ns=!1;if(Vt){var xc;if(Vt){var _c="oninput"in document;if(!_c){var cs=document.createElement("div");cs.setAttribute("oninput","return;"),_c=typeof cs.oninput=="function"}xc=_c}else xc=!1;ns=xc&&(!document.documentMode||9<document.documentMode)}function is(){Ia&&(Ia.detachEvent("onpropertychange",fs),Pa=Ia=null)}function fs(l){if(l.propertyName==="value"&&Pu(Pa)){var t=[];as(t,Pa,l,hc(l)),Kf(Am,t)}}function xm(l,t,e){l==="focusin"?(is(),Ia=t,Pa=e,Ia.attachEvent("onpropertychange",fs)):l==="focusout"&&is()}function _m(l){if(l==="selectionchange"||l==="keyup"||l==="keydown")return Pu(Pa)}function Om(l,t){if(l==="click")return Pu(t)}function Mm(l,t){if(l==="input"||l==="change")return Pu(t)}function Dm(l,t){return l===t&&(l!==0||1/l===1/t)||l!==l&&t!==t}var dt=typeof Object.is=="function"?Object.is:Dm;function lu(l,t){if(dt(l,t))return!0;if(typeof l!="object"||l===null||typeof t!="object"||t===null)return!1;var e=Object.keys(l),a=Object.keys(t);if(e.length!==a.length)return!1;for(a=0;a<e.length;a++){var u=e[a];if(!Qa.call(t,u)||!dt(l[u],t[u]))return!1}return!0}function ss(l){for(;l&&l.firstChild;)l=l.firstChild;return l}function os(l,t){var e=ss(l);l=0;for(var a;e;){if(e.nodeType===3){if(a=l+e.textContent.length,l<=t&&a>=t)return{node:e,offset:t-l};l=a}l:{for(;e;){if(e.nextSibling){e=e.nextSibling;break l}e=e.parentNode}e=void 0}e=ss(e)}}function ds(l,t){return l&&t?l===t?!0:l&&l.nodeType===3?!1:t&&t.nodeType===3?ds(l,t.parentNode):"contains"in l?l.contains(t):l.compareDocumentPosition?!!(l.compareDocumentPosition(t)&16):!1:!1}function ms(l){l=l!=null&&l.ownerDocument!=null&&l.ownerDocument.defaultView!=null?l.ownerDocument.defaultView:window;for(var t=Ju(l.document);t instanceof l.HTMLIFrameElement;){try{var e=typeof t.contentWindow.location.href=="string"}catch{e=!1}if(e)l=t.contentWindow;else break;t=Ju(l.document)}return t}function Oc(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t&&(t==="input"&&(l.type==="text"||l.type==="search"||l.type==="tel"||l.type==="url"||l.type==="password")||t==="textarea"||l.contentEditable==="true")}var Nm=Vt&&"documentMode"in document&&11>=document.documentMode,sa=null,Mc=null,tu=null,Dc=!1;function vs(l,t,e){var a=e.window===e?e.document:e.nodeType===9?e:e.ownerDocument;Dc||sa==null||sa!==Ju(a)||(a=sa,"selectionStart"in a&&Oc(a)?a={start:a.selectionStart,end:a.selectionEnd}:(a=(a.ownerDocument&&a.ownerDocument.defaultView||window).getSelection(),a={anchorNode:a.anchorNode,anchorOffset:a.anchorOffset,focusNode:a.focusNode,focusOffset:a.focusOffset}),tu&&lu(tu,a)||(tu=a,a=Zn(Mc,"onSelect"),0<a.length&&(t=new Fu("onSelect","select",null,t,e),l.push({event:t,listeners:a}),t.target=sa)))}function je(l,t){var e={};return e[l.toLowerCase()]=t.toLowerCase(),e["Webkit"+l]="webkit"+t,e["Moz"+l]="moz"+t,e}var oa={animationend:je("Animation","AnimationEnd"),animationiteration:je("Animation","AnimationIteration"),animationstart:je("Animation","AnimationStart"),transitionrun:je("Transition","TransitionRun"),transitionstart:je("Transition","TransitionStart"),transitioncancel:je("Transition","TransitionCancel"),transitionend:je("Transition","TransitionEnd")},Nc={},ys={};Vt&&(ys=document.createElement("div").style,"AnimationEvent"in window||(delete oa.animationend.animation,delete oa.animationiteration.animation,delete oa.animationstart.animation),"TransitionEvent"in window||delete oa.transitionend.transition);function He(l){if(Nc[l])return Nc[l];if(!oa[l])return l;var t=oa[l],e;for(e in t)if(t.hasOwnProperty(e)&&e in ys)return Nc[l]=t[e];return l}var rs=He("animationend"),hs=He("animationiteration"),gs=He("animationstart"),Um=He("transitionrun"),Cm=He("transitionstart"),Rm=He("transitioncancel"),Ss=He("transitionend"),bs=new Map,Uc="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");Uc.push("scrollEnd");function Ct(l,t){bs.set(l,t),Ce(t,[l])}var ln=typeof reportError=="function"?reportError:function(l){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof l=="object"&&l!==null&&typeof l.message=="string"?String(l.message):String(l),error:l});if(!window.dispatchEvent(t))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",l);return}console.error(l)},Tt=[],da=0,Cc=0;function tn(){for(var l=da,t=Cc=da=0;t<l;){var e=Tt[t];Tt[t++]=null;var a=Tt[t];Tt[t++]=null;var u=Tt[t];Tt[t++]=null;var n=Tt[t];if(Tt[t++]=null,a!==null&&u!==null){var c=a.pending;c===null?u.next=u:(u.next=c.next,c.next=u),a.pending=u}n!==0&&ps(e,u,n)}}function en(l,t,e,a){Tt[da++]=l,Tt[da++]=t,Tt[da++]=e,Tt[da++]=a,Cc|=a,l.lanes|=a,l=l.alternate,l!==null&&(l.lanes|=a)}function Rc(l,t,e,a){return en(l,t,e,a),an(l)}function qe(l,t){return en(l,null,null,t),an(l)}function ps(l,t,e){l.lanes|=e;var a=l.alternate;a!==null&&(a.lanes|=e);for(var u=!1,n=l.return;n!==null;)n.childLanes|=e,a=n.alternate,a!==null&&(a.childLanes|=e),n.tag===22&&(l=n.stateNode,l===null||l._visibility&1||(u=!0)),l=n,n=n.return;return l.tag===3?(n=l.stateNode,u&&t!==null&&(u=31-Pl(e),l=n.hiddenUpdates,a=l[u],a===null?l[u]=[t]:a.push(t),t.lane=e|536870912),n):null}function an(l){if(50<Tu)throw Tu=0,Zi=null,Error(r(185));for(var t=l.return;t!==null;)l=t,t=l.return;return l.tag===3?l.stateNode:null}var ma={};function jm(l,t,e,a){this.tag=l,this.key=e,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=a,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function mt(l,t,e,a){return new jm(l,t,e,a)}function jc(l){return l=l.prototype,!(!l||!l.isReactComponent)}function Kt(l,t){var e=l.alternate;return e===null?(e=mt(l.tag,t,l.key,l.mode),e.elementType=l.elementType,e.type=l.type,e.stateNode=l.stateNode,e.alternate=l,l.alternate=e):(e.pendingProps=t,e.type=l.type,e.flags=0,e.subtreeFlags=0,e.deletions=null),e.flags=l.flags&65011712,e.childLanes=l.childLanes,e.lanes=l.lanes,e.child=l.child,e.memoizedProps=l.memoizedProps,e.memoizedState=l.memoizedState,e.updateQueue=l.updateQueue,t=l.dependencies,e.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},e.sibling=l.sibling,e.index=l.index,e.ref=l.ref,e.refCleanup=l.refCleanup,e}function Es(l,t){l.flags&=65011714;var e=l.alternate;return e===null?(l.childLanes=0,l.lanes=t,l.child=null,l.subtreeFlags=0,l.memoizedProps=null,l.memoizedState=null,l.updateQueue=null,l.dependencies=null,l.stateNode=null):(l.childLanes=e.childLanes,l.lanes=e.lanes,l.child=e.child,l.subtreeFlags=0,l.deletions=null,l.memoizedProps=e.memoizedProps,l.memoizedState=e.memoizedState,l.updateQueue=e.updateQueue,l.type=e.type,t=e.dependencies,l.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext}),l}function un(l,t,e,a,u,n){var c=0;if(a=l,typeof l=="function")jc(l)&&(c=1);else if(typeof l=="string")c=Gv(l,e,D.current)?26:l==="html"||l==="head"||l==="body"?27:5;else l:switch(l){case ot:return l=mt(31,e,t,u),l.elementType=ot,l.lanes=n,l;case Gl:return Be(e.children,u,n,t);case Ut:c=8,u|=24;break;case kl:return l=mt(12,e,t,u|2),l.elementType=kl,l.lanes=n,l;case bt:return l=mt(13,e,t,u),l.elementType=bt,l.lanes=n,l;case Ql:return l=mt(19,e,t,u),l.elementType=Ql,l.lanes=n,l;default:if(typeof l=="object"&&l!==null)switch(l.$$typeof){case jl:c=10;break l;case St:c=9;break l;case tt:c=11;break l;case K:c=14;break l;case wl:c=16,a=null;break l}c=29,e=Error(r(130,l===null?"null":typeof l,"")),a=null}return t=mt(c,e,t,u),t.elementType=l,t.type=a,t.lanes=n,t}function Be(l,t,e,a){return l=mt(7,l,a,t),l.lanes=e,l}function Hc(l,t,e){return l=mt(6,l,null,t),l.lanes=e,l}function zs(l){var t=mt(18,null,null,0);return t.stateNode=l,t}function qc(l,t,e){return t=mt(4,l.children!==null?l.children:[],l.key,t),t.lanes=e,t.stateNode={containerInfo:l.containerInfo,pendingChildren:null,implementation:l.implementation},t}var Ts=new WeakMap;function At(l,t){if(typeof l=="object"&&l!==null){var e=Ts.get(l);return e!==void 0?e:(t={value:l,source:t,stack:Yu(t)},Ts.set(l,t),t)}return{value:l,source:t,stack:Yu(t)}}var va=[],ya=0,nn=null,eu=0,xt=[],_t=0,se=null,Ht=1,qt="";function Jt(l,t){va[ya++]=eu,va[ya++]=nn,nn=l,eu=t}function As(l,t,e){xt[_t++]=Ht,xt[_t++]=qt,xt[_t++]=se,se=l;var a=Ht;l=qt;var u=32-Pl(a)-1;a&=~(1<<u),e+=1;var n=32-Pl(t)+u;if(30<n){var c=u-u%5;n=(a&(1<<c)-1).toString(32),a>>=c,u-=c,Ht=1<<32-Pl(t)+u|e<<u|a,qt=n+l}else Ht=1<<n|e<<u|a,qt=l}function Bc(l){l.return!==null&&(Jt(l,1),As(l,1,0))}function Yc(l){for(;l===nn;)nn=va[--ya],va[ya]=null,eu=va[--ya],va[ya]=null;for(;l===se;)se=xt[--_t],xt[_t]=null,qt=xt[--_t],xt[_t]=null,Ht=xt[--_t],xt[_t]=null}function xs(l,t){xt[_t++]=Ht,xt[_t++]=qt,xt[_t++]=se,Ht=t.id,qt=t.overflow,se=l}var Zl=null,bl=null,F=!1,oe=null,Ot=!1,Gc=Error(r(519));function de(l){var t=Error(r(418,1<arguments.length&&arguments[1]!==void 0&&arguments[1]?"text":"HTML",""));throw au(At(t,l)),Gc}function _s(l){var t=l.stateNode,e=l.type,a=l.memoizedProps;switch(t[Xl]=l,t[at]=a,e){case"dialog":w("cancel",t),w("close",t);break;case"iframe":case"object":case"embed":w("load",t);break;case"video":case"audio":for(e=0;e<xu.length;e++)w(xu[e],t);break;case"source":w("error",t);break;case"img":case"image":case"link":w("error",t),w("load",t);break;case"details":w("toggle",t);break;case"input":w("invalid",t),Gf(t,a.value,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name,!0);break;case"select":w("invalid",t);break;case"textarea":w("invalid",t),Xf(t,a.value,a.defaultValue,a.children)}e=a.children,typeof e!="string"&&typeof e!="number"&&typeof e!="bigint"||t.textContent===""+e||a.suppressHydrationWarning===!0||Vd(t.textContent,e)?(a.popover!=null&&(w("beforetoggle",t),w("toggle",t)),a.onScroll!=null&&w("scroll",t),a.onScrollEnd!=null&&w("scrollend",t),a.onClick!=null&&(t.onclick=Lt),t=!0):t=!1,t||de(l,!0)}function Os(l){for(Zl=l.return;Zl;)switch(Zl.tag){case 5:case 31:case 13:Ot=!1;return;case 27:case 3:Ot=!0;return;default:Zl=Zl.return}}function ra(l){if(l!==Zl)return!1;if(!F)return Os(l),F=!0,!1;var t=l.tag,e;if((e=t!==3&&t!==27)&&((e=t===5)&&(e=l.type,e=!(e!=="form"&&e!=="button")||af(l.type,l.memoizedProps)),e=!e),e&&bl&&de(l),Os(l),t===13){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(r(317));bl=Pd(l)}else if(t===31){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(r(317));bl=Pd(l)}else t===27?(t=bl,xe(l.type)?(l=sf,sf=null,bl=l):bl=t):bl=Zl?Dt(l.stateNode.nextSibling):null;return!0}function Ye(){bl=Zl=null,F=!1}function Qc(){var l=oe;return l!==null&&(ft===null?ft=l:ft.push.apply(ft,l),oe=null),l}function au(l){oe===null?oe=[l]:oe.push(l)}var Xc=o(null),Ge=null,wt=null;function me(l,t,e){A(Xc,t._currentValue),t._currentValue=e}function Wt(l){l._currentValue=Xc.current,E(Xc)}function Zc(l,t,e){for(;l!==null;){var a=l.alternate;if((l.childLanes&t)!==t?(l.childLanes|=t,a!==null&&(a.childLanes|=t)):a!==null&&(a.childLanes&t)!==t&&(a.childLanes|=t),l===e)break;l=l.return}}function Lc(l,t,e,a){var u=l.child;for(u!==null&&(u.return=l);u!==null;){var n=u.dependencies;if(n!==null){var c=u.child;n=n.firstContext;l:for(;n!==null;){var i=n;n=u;for(var f=0;f<t.length;f++)if(i.context===t[f]){n.lanes|=e,i=n.alternate,i!==null&&(i.lanes|=e),Zc(n.return,e,l),a||(c=null);break l}n=i.next}}else if(u.tag===18){if(c=u.return,c===null)throw Error(r(341));c.lanes|=e,n=c.alternate,n!==null&&(n.lanes|=e),Zc(c,e,l),c=null}else c=u.child;if(c!==null)c.return=u;else for(c=u;c!==null;){if(c===l){c=null;break}if(u=c.sibling,u!==null){u.return=c.return,c=u;break}c=c.return}u=c}}function ha(l,t,e,a){l=null;for(var u=t,n=!1;u!==null;){if(!n){if((u.flags&524288)!==0)n=!0;else if((u.flags&262144)!==0)break}if(u.tag===10){var c=u.alternate;if(c===null)throw Error(r(387));if(c=c.memoizedProps,c!==null){var i=u.type;dt(u.pendingProps.value,c.value)||(l!==null?l.push(i):l=[i])}}else if(u===tl.current){if(c=u.alternate,c===null)throw Error(r(387));c.memoizedState.memoizedState!==u.memoizedState.memoizedState&&(l!==null?l.push(Nu):l=[Nu])}u=u.return}l!==null&&Lc(t,l,e,a),t.flags|=262144}function cn(l){for(l=l.firstContext;l!==null;){if(!dt(l.context._currentValue,l.memoizedValue))return!0;l=l.next}return!1}function Qe(l){Ge=l,wt=null,l=l.dependencies,l!==null&&(l.firstContext=null)}function Ll(l){return Ms(Ge,l)}function fn(l,t){return Ge===null&&Qe(l),Ms(l,t)}function Ms(l,t){var e=t._currentValue;if(t={context:t,memoizedValue:e,next:null},wt===null){if(l===null)throw Error(r(308));wt=t,l.dependencies={lanes:0,firstContext:t},l.flags|=524288}else wt=wt.next=t;return e}var Hm=typeof AbortController<"u"?AbortController:function(){var l=[],t=this.signal={aborted:!1,addEventListener:function(e,a){l.push(a)}};this.abort=function(){t.aborted=!0,l.forEach(function(e){return e()})}},qm=O.unstable_scheduleCallback,Bm=O.unstable_NormalPriority,Nl={$$typeof:jl,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function Vc(){return{controller:new Hm,data:new Map,refCount:0}}function uu(l){l.refCount--,l.refCount===0&&qm(Bm,function(){l.controller.abort()})}var nu=null,Kc=0,ga=0,Sa=null;function Ym(l,t){if(nu===null){var e=nu=[];Kc=0,ga=Wi(),Sa={status:"pending",value:void 0,then:function(a){e.push(a)}}}return Kc++,t.then(Ds,Ds),t}function Ds(){if(--Kc===0&&nu!==null){Sa!==null&&(Sa.status="fulfilled");var l=nu;nu=null,ga=0,Sa=null;for(var t=0;t<l.length;t++)(0,l[t])()}}function Gm(l,t){var e=[],a={status:"pending",value:null,reason:null,then:function(u){e.push(u)}};return l.then(function(){a.status="fulfilled",a.value=t;for(var u=0;u<e.length;u++)(0,e[u])(t)},function(u){for(a.status="rejected",a.reason=u,u=0;u<e.length;u++)(0,e[u])(void 0)}),a}var Ns=g.S;g.S=function(l,t){yd=Il(),typeof t=="object"&&t!==null&&typeof t.then=="function"&&Ym(l,t),Ns!==null&&Ns(l,t)};var Xe=o(null);function Jc(){var l=Xe.current;return l!==null?l:rl.pooledCache}function sn(l,t){t===null?A(Xe,Xe.current):A(Xe,t.pool)}function Us(){var l=Jc();return l===null?null:{parent:Nl._currentValue,pool:l}}var ba=Error(r(460)),wc=Error(r(474)),on=Error(r(542)),dn={then:function(){}};function Cs(l){return l=l.status,l==="fulfilled"||l==="rejected"}function Rs(l,t,e){switch(e=l[e],e===void 0?l.push(t):e!==t&&(t.then(Lt,Lt),t=e),t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,Hs(l),l;default:if(typeof t.status=="string")t.then(Lt,Lt);else{if(l=rl,l!==null&&100<l.shellSuspendCounter)throw Error(r(482));l=t,l.status="pending",l.then(function(a){if(t.status==="pending"){var u=t;u.status="fulfilled",u.value=a}},function(a){if(t.status==="pending"){var u=t;u.status="rejected",u.reason=a}})}switch(t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,Hs(l),l}throw Le=t,ba}}function Ze(l){try{var t=l._init;return t(l._payload)}catch(e){throw e!==null&&typeof e=="object"&&typeof e.then=="function"?(Le=e,ba):e}}var Le=null;function js(){if(Le===null)throw Error(r(459));var l=Le;return Le=null,l}function Hs(l){if(l===ba||l===on)throw Error(r(483))}var pa=null,cu=0;function mn(l){var t=cu;return cu+=1,pa===null&&(pa=[]),Rs(pa,l,t)}function iu(l,t){t=t.props.ref,l.ref=t!==void 0?t:null}function vn(l,t){throw t.$$typeof===nl?Error(r(525)):(l=Object.prototype.toString.call(t),Error(r(31,l==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":l)))}function qs(l){function t(d,s){if(l){var m=d.deletions;m===null?(d.deletions=[s],d.flags|=16):m.push(s)}}function e(d,s){if(!l)return null;for(;s!==null;)t(d,s),s=s.sibling;return null}function a(d){for(var s=new Map;d!==null;)d.key!==null?s.set(d.key,d):s.set(d.index,d),d=d.sibling;return s}function u(d,s){return d=Kt(d,s),d.index=0,d.sibling=null,d}function n(d,s,m){return d.index=m,l?(m=d.alternate,m!==null?(m=m.index,m<s?(d.flags|=67108866,s):m):(d.flags|=67108866,s)):(d.flags|=1048576,s)}function c(d){return l&&d.alternate===null&&(d.flags|=67108866),d}function i(d,s,m,b){return s===null||s.tag!==6?(s=Hc(m,d.mode,b),s.return=d,s):(s=u(s,m),s.return=d,s)}function f(d,s,m,b){var j=m.type;return j===Gl?S(d,s,m.props.children,b,m.key):s!==null&&(s.elementType===j||typeof j=="object"&&j!==null&&j.$$typeof===wl&&Ze(j)===s.type)?(s=u(s,m.props),iu(s,m),s.return=d,s):(s=un(m.type,m.key,m.props,null,d.mode,b),iu(s,m),s.return=d,s)}function v(d,s,m,b){return s===null||s.tag!==4||s.stateNode.containerInfo!==m.containerInfo||s.stateNode.implementation!==m.implementation?(s=qc(m,d.mode,b),s.return=d,s):(s=u(s,m.children||[]),s.return=d,s)}function S(d,s,m,b,j){return s===null||s.tag!==7?(s=Be(m,d.mode,b,j),s.return=d,s):(s=u(s,m),s.return=d,s)}function p(d,s,m){if(typeof s=="string"&&s!==""||typeof s=="number"||typeof s=="bigint")return s=Hc(""+s,d.mode,m),s.return=d,s;if(typeof s=="object"&&s!==null){switch(s.$$typeof){case $l:return m=un(s.type,s.key,s.props,null,d.mode,m),iu(m,s),m.return=d,m;case Jl:return s=qc(s,d.mode,m),s.return=d,s;case wl:return s=Ze(s),p(d,s,m)}if(Fl(s)||Tl(s))return s=Be(s,d.mode,m,null),s.return=d,s;if(typeof s.then=="function")return p(d,mn(s),m);if(s.$$typeof===jl)return p(d,fn(d,s),m);vn(d,s)}return null}function y(d,s,m,b){var j=s!==null?s.key:null;if(typeof m=="string"&&m!==""||typeof m=="number"||typeof m=="bigint")return j!==null?null:i(d,s,""+m,b);if(typeof m=="object"&&m!==null){switch(m.$$typeof){case $l:return m.key===j?f(d,s,m,b):null;case Jl:return m.key===j?v(d,s,m,b):null;case wl:return m=Ze(m),y(d,s,m,b)}if(Fl(m)||Tl(m))return j!==null?null:S(d,s,m,b,null);if(typeof m.then=="function")return y(d,s,mn(m),b);if(m.$$typeof===jl)return y(d,s,fn(d,m),b);vn(d,m)}return null}function h(d,s,m,b,j){if(typeof b=="string"&&b!==""||typeof b=="number"||typeof b=="bigint")return d=d.get(m)||null,i(s,d,""+b,j);if(typeof b=="object"&&b!==null){switch(b.$$typeof){case $l:return d=d.get(b.key===null?m:b.key)||null,f(s,d,b,j);case Jl:return d=d.get(b.key===null?m:b.key)||null,v(s,d,b,j);case wl:return b=Ze(b),h(d,s,m,b,j)}if(Fl(b)||Tl(b))return d=d.get(m)||null,S(s,d,b,j,null);if(typeof b.then=="function")return h(d,s,m,mn(b),j);if(b.$$typeof===jl)return h(d,s,m,fn(s,b),j);vn(s,b)}return null}function M(d,s,m,b){for(var j=null,el=null,N=s,Z=s=0,$=null;N!==null&&Z<m.length;Z++){N.index>Z?($=N,N=null):$=N.sibling;var al=y(d,N,m[Z],b);if(al===null){N===null&&(N=$);break}l&&N&&al.alternate===null&&t(d,N),s=n(al,s,Z),el===null?j=al:el.sibling=al,el=al,N=$}if(Z===m.length)return e(d,N),F&&Jt(d,Z),j;if(N===null){for(;Z<m.length;Z++)N=p(d,m[Z],b),N!==null&&(s=n(N,s,Z),el===null?j=N:el.sibling=N,el=N);return F&&Jt(d,Z),j}for(N=a(N);Z<m.length;Z++)$=h(N,d,Z,m[Z],b),$!==null&&(l&&$.alternate!==null&&N.delete($.key===null?Z:$.key),s=n($,s,Z),el===null?j=$:el.sibling=$,el=$);return l&&N.forEach(function(Ne){return t(d,Ne)}),F&&Jt(d,Z),j}function q(d,s,m,b){if(m==null)throw Error(r(151));for(var j=null,el=null,N=s,Z=s=0,$=null,al=m.next();N!==null&&!al.done;Z++,al=m.next()){N.index>Z?($=N,N=null):$=N.sibling;var Ne=y(d,N,al.value,b);if(Ne===null){N===null&&(N=$);break}l&&N&&Ne.alternate===null&&t(d,N),s=n(Ne,s,Z),el===null?j=Ne:el.sibling=Ne,el=Ne,N=$}if(al.done)return e(d,N),F&&Jt(d,Z),j;if(N===null){for(;!al.done;Z++,al=m.next())al=p(d,al.value,b),al!==null&&(s=n(al,s,Z),el===null?j=al:el.sibling=al,el=al);return F&&Jt(d,Z),j}for(N=a(N);!al.done;Z++,al=m.next())al=h(N,d,Z,al.value,b),al!==null&&(l&&al.alternate!==null&&N.delete(al.key===null?Z:al.key),s=n(al,s,Z),el===null?j=al:el.sibling=al,el=al);return l&&N.forEach(function(kv){return t(d,kv)}),F&&Jt(d,Z),j}function yl(d,s,m,b){if(typeof m=="object"&&m!==null&&m.type===Gl&&m.key===null&&(m=m.props.children),typeof m=="object"&&m!==null){switch(m.$$typeof){case $l:l:{for(var j=m.key;s!==null;){if(s.key===j){if(j=m.type,j===Gl){if(s.tag===7){e(d,s.sibling),b=u(s,m.props.children),b.return=d,d=b;break l}}else if(s.elementType===j||typeof j=="object"&&j!==null&&j.$$typeof===wl&&Ze(j)===s.type){e(d,s.sibling),b=u(s,m.props),iu(b,m),b.return=d,d=b;break l}e(d,s);break}else t(d,s);s=s.sibling}m.type===Gl?(b=Be(m.props.children,d.mode,b,m.key),b.return=d,d=b):(b=un(m.type,m.key,m.props,null,d.mode,b),iu(b,m),b.return=d,d=b)}return c(d);case Jl:l:{for(j=m.key;s!==null;){if(s.key===j)if(s.tag===4&&s.stateNode.containerInfo===m.containerInfo&&s.stateNode.implementation===m.implementation){e(d,s.sibling),b=u(s,m.children||[]),b.return=d,d=b;break l}else{e(d,s);break}else t(d,s);s=s.sibling}b=qc(m,d.mode,b),b.return=d,d=b}return c(d);case wl:return m=Ze(m),yl(d,s,m,b)}if(Fl(m))return M(d,s,m,b);if(Tl(m)){if(j=Tl(m),typeof j!="function")throw Error(r(150));return m=j.call(m),q(d,s,m,b)}if(typeof m.then=="function")return yl(d,s,mn(m),b);if(m.$$typeof===jl)return yl(d,s,fn(d,m),b);vn(d,m)}return typeof m=="string"&&m!==""||typeof m=="number"||typeof m=="bigint"?(m=""+m,s!==null&&s.tag===6?(e(d,s.sibling),b=u(s,m),b.return=d,d=b):(e(d,s),b=Hc(m,d.mode,b),b.return=d,d=b),c(d)):e(d,s)}return function(d,s,m,b){try{cu=0;var j=yl(d,s,m,b);return pa=null,j}catch(N){if(N===ba||N===on)throw N;var el=mt(29,N,null,d.mode);return el.lanes=b,el.return=d,el}finally{}}}var Ve=qs(!0),Bs=qs(!1),ve=!1;function Wc(l){l.updateQueue={baseState:l.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function $c(l,t){l=l.updateQueue,t.updateQueue===l&&(t.updateQueue={baseState:l.baseState,firstBaseUpdate:l.firstBaseUpdate,lastBaseUpdate:l.lastBaseUpdate,shared:l.shared,callbacks:null})}function ye(l){return{lane:l,tag:0,payload:null,callback:null,next:null}}function re(l,t,e){var a=l.updateQueue;if(a===null)return null;if(a=a.shared,(ul&2)!==0){var u=a.pending;return u===null?t.next=t:(t.next=u.next,u.next=t),a.pending=t,t=an(l),ps(l,null,e),t}return en(l,a,t,e),an(l)}function fu(l,t,e){if(t=t.updateQueue,t!==null&&(t=t.shared,(e&4194048)!==0)){var a=t.lanes;a&=l.pendingLanes,e|=a,t.lanes=e,Mf(l,e)}}function kc(l,t){var e=l.updateQueue,a=l.alternate;if(a!==null&&(a=a.updateQueue,e===a)){var u=null,n=null;if(e=e.firstBaseUpdate,e!==null){do{var c={lane:e.lane,tag:e.tag,payload:e.payload,callback:null,next:null};n===null?u=n=c:n=n.next=c,e=e.next}while(e!==null);n===null?u=n=t:n=n.next=t}else u=n=t;e={baseState:a.baseState,firstBaseUpdate:u,lastBaseUpdate:n,shared:a.shared,callbacks:a.callbacks},l.updateQueue=e;return}l=e.lastBaseUpdate,l===null?e.firstBaseUpdate=t:l.next=t,e.lastBaseUpdate=t}var Fc=!1;function su(){if(Fc){var l=Sa;if(l!==null)throw l}}function ou(l,t,e,a){Fc=!1;var u=l.updateQueue;ve=!1;var n=u.firstBaseUpdate,c=u.lastBaseUpdate,i=u.shared.pending;if(i!==null){u.shared.pending=null;var f=i,v=f.next;f.next=null,c===null?n=v:c.next=v,c=f;var S=l.alternate;S!==null&&(S=S.updateQueue,i=S.lastBaseUpdate,i!==c&&(i===null?S.firstBaseUpdate=v:i.next=v,S.lastBaseUpdate=f))}if(n!==null){var p=u.baseState;c=0,S=v=f=null,i=n;do{var y=i.lane&-536870913,h=y!==i.lane;if(h?(W&y)===y:(a&y)===y){y!==0&&y===ga&&(Fc=!0),S!==null&&(S=S.next={lane:0,tag:i.tag,payload:i.payload,callback:null,next:null});l:{var M=l,q=i;y=t;var yl=e;switch(q.tag){case 1:if(M=q.payload,typeof M=="function"){p=M.call(yl,p,y);break l}p=M;break l;case 3:M.flags=M.flags&-65537|128;case 0:if(M=q.payload,y=typeof M=="function"?M.call(yl,p,y):M,y==null)break l;p=R({},p,y);break l;case 2:ve=!0}}y=i.callback,y!==null&&(l.flags|=64,h&&(l.flags|=8192),h=u.callbacks,h===null?u.callbacks=[y]:h.push(y))}else h={lane:y,tag:i.tag,payload:i.payload,callback:i.callback,next:null},S===null?(v=S=h,f=p):S=S.next=h,c|=y;if(i=i.next,i===null){if(i=u.shared.pending,i===null)break;h=i,i=h.next,h.next=null,u.lastBaseUpdate=h,u.shared.pending=null}}while(!0);S===null&&(f=p),u.baseState=f,u.firstBaseUpdate=v,u.lastBaseUpdate=S,n===null&&(u.shared.lanes=0),pe|=c,l.lanes=c,l.memoizedState=p}}function Ys(l,t){if(typeof l!="function")throw Error(r(191,l));l.call(t)}function Gs(l,t){var e=l.callbacks;if(e!==null)for(l.callbacks=null,l=0;l<e.length;l++)Ys(e[l],t)}var Ea=o(null),yn=o(0);function Qs(l,t){l=ae,A(yn,l),A(Ea,t),ae=l|t.baseLanes}function Ic(){A(yn,ae),A(Ea,Ea.current)}function Pc(){ae=yn.current,E(Ea),E(yn)}var vt=o(null),Mt=null;function he(l){var t=l.alternate;A(Ol,Ol.current&1),A(vt,l),Mt===null&&(t===null||Ea.current!==null||t.memoizedState!==null)&&(Mt=l)}function li(l){A(Ol,Ol.current),A(vt,l),Mt===null&&(Mt=l)}function Xs(l){l.tag===22?(A(Ol,Ol.current),A(vt,l),Mt===null&&(Mt=l)):ge()}function ge(){A(Ol,Ol.current),A(vt,vt.current)}function yt(l){E(vt),Mt===l&&(Mt=null),E(Ol)}var Ol=o(0);function rn(l){for(var t=l;t!==null;){if(t.tag===13){var e=t.memoizedState;if(e!==null&&(e=e.dehydrated,e===null||cf(e)||ff(e)))return t}else if(t.tag===19&&(t.memoizedProps.revealOrder==="forwards"||t.memoizedProps.revealOrder==="backwards"||t.memoizedProps.revealOrder==="unstable_legacy-backwards"||t.memoizedProps.revealOrder==="together")){if((t.flags&128)!==0)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var $t=0,X=null,ml=null,Ul=null,hn=!1,za=!1,Ke=!1,gn=0,du=0,Ta=null,Qm=0;function xl(){throw Error(r(321))}function ti(l,t){if(t===null)return!1;for(var e=0;e<t.length&&e<l.length;e++)if(!dt(l[e],t[e]))return!1;return!0}function ei(l,t,e,a,u,n){return $t=n,X=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,g.H=l===null||l.memoizedState===null?xo:gi,Ke=!1,n=e(a,u),Ke=!1,za&&(n=Ls(t,e,a,u)),Zs(l),n}function Zs(l){g.H=yu;var t=ml!==null&&ml.next!==null;if($t=0,Ul=ml=X=null,hn=!1,du=0,Ta=null,t)throw Error(r(300));l===null||Cl||(l=l.dependencies,l!==null&&cn(l)&&(Cl=!0))}function Ls(l,t,e,a){X=l;var u=0;do{if(za&&(Ta=null),du=0,za=!1,25<=u)throw Error(r(301));if(u+=1,Ul=ml=null,l.updateQueue!=null){var n=l.updateQueue;n.lastEffect=null,n.events=null,n.stores=null,n.memoCache!=null&&(n.memoCache.index=0)}g.H=_o,n=t(e,a)}while(za);return n}function Xm(){var l=g.H,t=l.useState()[0];return t=typeof t.then=="function"?mu(t):t,l=l.useState()[0],(ml!==null?ml.memoizedState:null)!==l&&(X.flags|=1024),t}function ai(){var l=gn!==0;return gn=0,l}function ui(l,t,e){t.updateQueue=l.updateQueue,t.flags&=-2053,l.lanes&=~e}function ni(l){if(hn){for(l=l.memoizedState;l!==null;){var t=l.queue;t!==null&&(t.pending=null),l=l.next}hn=!1}$t=0,Ul=ml=X=null,za=!1,du=gn=0,Ta=null}function lt(){var l={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return Ul===null?X.memoizedState=Ul=l:Ul=Ul.next=l,Ul}function Ml(){if(ml===null){var l=X.alternate;l=l!==null?l.memoizedState:null}else l=ml.next;var t=Ul===null?X.memoizedState:Ul.next;if(t!==null)Ul=t,ml=l;else{if(l===null)throw X.alternate===null?Error(r(467)):Error(r(310));ml=l,l={memoizedState:ml.memoizedState,baseState:ml.baseState,baseQueue:ml.baseQueue,queue:ml.queue,next:null},Ul===null?X.memoizedState=Ul=l:Ul=Ul.next=l}return Ul}function Sn(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function mu(l){var t=du;return du+=1,Ta===null&&(Ta=[]),l=Rs(Ta,l,t),t=X,(Ul===null?t.memoizedState:Ul.next)===null&&(t=t.alternate,g.H=t===null||t.memoizedState===null?xo:gi),l}function bn(l){if(l!==null&&typeof l=="object"){if(typeof l.then=="function")return mu(l);if(l.$$typeof===jl)return Ll(l)}throw Error(r(438,String(l)))}function ci(l){var t=null,e=X.updateQueue;if(e!==null&&(t=e.memoCache),t==null){var a=X.alternate;a!==null&&(a=a.updateQueue,a!==null&&(a=a.memoCache,a!=null&&(t={data:a.data.map(function(u){return u.slice()}),index:0})))}if(t==null&&(t={data:[],index:0}),e===null&&(e=Sn(),X.updateQueue=e),e.memoCache=t,e=t.data[t.index],e===void 0)for(e=t.data[t.index]=Array(l),a=0;a<l;a++)e[a]=Gt;return t.index++,e}function kt(l,t){return typeof t=="function"?t(l):t}function pn(l){var t=Ml();return ii(t,ml,l)}function ii(l,t,e){var a=l.queue;if(a===null)throw Error(r(311));a.lastRenderedReducer=e;var u=l.baseQueue,n=a.pending;if(n!==null){if(u!==null){var c=u.next;u.next=n.next,n.next=c}t.baseQueue=u=n,a.pending=null}if(n=l.baseState,u===null)l.memoizedState=n;else{t=u.next;var i=c=null,f=null,v=t,S=!1;do{var p=v.lane&-536870913;if(p!==v.lane?(W&p)===p:($t&p)===p){var y=v.revertLane;if(y===0)f!==null&&(f=f.next={lane:0,revertLane:0,gesture:null,action:v.action,hasEagerState:v.hasEagerState,eagerState:v.eagerState,next:null}),p===ga&&(S=!0);else if(($t&y)===y){v=v.next,y===ga&&(S=!0);continue}else p={lane:0,revertLane:v.revertLane,gesture:null,action:v.action,hasEagerState:v.hasEagerState,eagerState:v.eagerState,next:null},f===null?(i=f=p,c=n):f=f.next=p,X.lanes|=y,pe|=y;p=v.action,Ke&&e(n,p),n=v.hasEagerState?v.eagerState:e(n,p)}else y={lane:p,revertLane:v.revertLane,gesture:v.gesture,action:v.action,hasEagerState:v.hasEagerState,eagerState:v.eagerState,next:null},f===null?(i=f=y,c=n):f=f.next=y,X.lanes|=p,pe|=p;v=v.next}while(v!==null&&v!==t);if(f===null?c=n:f.next=i,!dt(n,l.memoizedState)&&(Cl=!0,S&&(e=Sa,e!==null)))throw e;l.memoizedState=n,l.baseState=c,l.baseQueue=f,a.lastRenderedState=n}return u===null&&(a.lanes=0),[l.memoizedState,a.dispatch]}function fi(l){var t=Ml(),e=t.queue;if(e===null)throw Error(r(311));e.lastRenderedReducer=l;var a=e.dispatch,u=e.pending,n=t.memoizedState;if(u!==null){e.pending=null;var c=u=u.next;do n=l(n,c.action),c=c.next;while(c!==u);dt(n,t.memoizedState)||(Cl=!0),t.memoizedState=n,t.baseQueue===null&&(t.baseState=n),e.lastRenderedState=n}return[n,a]}function Vs(l,t,e){var a=X,u=Ml(),n=F;if(n){if(e===void 0)throw Error(r(407));e=e()}else e=t();var c=!dt((ml||u).memoizedState,e);if(c&&(u.memoizedState=e,Cl=!0),u=u.queue,di(ws.bind(null,a,u,l),[l]),u.getSnapshot!==t||c||Ul!==null&&Ul.memoizedState.tag&1){if(a.flags|=2048,Aa(9,{destroy:void 0},Js.bind(null,a,u,e,t),null),rl===null)throw Error(r(349));n||($t&127)!==0||Ks(a,t,e)}return e}function Ks(l,t,e){l.flags|=16384,l={getSnapshot:t,value:e},t=X.updateQueue,t===null?(t=Sn(),X.updateQueue=t,t.stores=[l]):(e=t.stores,e===null?t.stores=[l]:e.push(l))}function Js(l,t,e,a){t.value=e,t.getSnapshot=a,Ws(t)&&$s(l)}function ws(l,t,e){return e(function(){Ws(t)&&$s(l)})}function Ws(l){var t=l.getSnapshot;l=l.value;try{var e=t();return!dt(l,e)}catch{return!0}}function $s(l){var t=qe(l,2);t!==null&&st(t,l,2)}function si(l){var t=lt();if(typeof l=="function"){var e=l;if(l=e(),Ke){Dl(!0);try{e()}finally{Dl(!1)}}}return t.memoizedState=t.baseState=l,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:kt,lastRenderedState:l},t}function ks(l,t,e,a){return l.baseState=e,ii(l,ml,typeof a=="function"?a:kt)}function Zm(l,t,e,a,u){if(Tn(l))throw Error(r(485));if(l=t.action,l!==null){var n={payload:u,action:l,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(c){n.listeners.push(c)}};g.T!==null?e(!0):n.isTransition=!1,a(n),e=t.pending,e===null?(n.next=t.pending=n,Fs(t,n)):(n.next=e.next,t.pending=e.next=n)}}function Fs(l,t){var e=t.action,a=t.payload,u=l.state;if(t.isTransition){var n=g.T,c={};g.T=c;try{var i=e(u,a),f=g.S;f!==null&&f(c,i),Is(l,t,i)}catch(v){oi(l,t,v)}finally{n!==null&&c.types!==null&&(n.types=c.types),g.T=n}}else try{n=e(u,a),Is(l,t,n)}catch(v){oi(l,t,v)}}function Is(l,t,e){e!==null&&typeof e=="object"&&typeof e.then=="function"?e.then(function(a){Ps(l,t,a)},function(a){return oi(l,t,a)}):Ps(l,t,e)}function Ps(l,t,e){t.status="fulfilled",t.value=e,lo(t),l.state=e,t=l.pending,t!==null&&(e=t.next,e===t?l.pending=null:(e=e.next,t.next=e,Fs(l,e)))}function oi(l,t,e){var a=l.pending;if(l.pending=null,a!==null){a=a.next;do t.status="rejected",t.reason=e,lo(t),t=t.next;while(t!==a)}l.action=null}function lo(l){l=l.listeners;for(var t=0;t<l.length;t++)(0,l[t])()}function to(l,t){return t}function eo(l,t){if(F){var e=rl.formState;if(e!==null){l:{var a=X;if(F){if(bl){t:{for(var u=bl,n=Ot;u.nodeType!==8;){if(!n){u=null;break t}if(u=Dt(u.nextSibling),u===null){u=null;break t}}n=u.data,u=n==="F!"||n==="F"?u:null}if(u){bl=Dt(u.nextSibling),a=u.data==="F!";break l}}de(a)}a=!1}a&&(t=e[0])}}return e=lt(),e.memoizedState=e.baseState=t,a={pending:null,lanes:0,dispatch:null,lastRenderedReducer:to,lastRenderedState:t},e.queue=a,e=zo.bind(null,X,a),a.dispatch=e,a=si(!1),n=hi.bind(null,X,!1,a.queue),a=lt(),u={state:t,dispatch:null,action:l,pending:null},a.queue=u,e=Zm.bind(null,X,u,n,e),u.dispatch=e,a.memoizedState=l,[t,e,!1]}function ao(l){var t=Ml();return uo(t,ml,l)}function uo(l,t,e){if(t=ii(l,t,to)[0],l=pn(kt)[0],typeof t=="object"&&t!==null&&typeof t.then=="function")try{var a=mu(t)}catch(c){throw c===ba?on:c}else a=t;t=Ml();var u=t.queue,n=u.dispatch;return e!==t.memoizedState&&(X.flags|=2048,Aa(9,{destroy:void 0},Lm.bind(null,u,e),null)),[a,n,l]}function Lm(l,t){l.action=t}function no(l){var t=Ml(),e=ml;if(e!==null)return uo(t,e,l);Ml(),t=t.memoizedState,e=Ml();var a=e.queue.dispatch;return e.memoizedState=l,[t,a,!1]}function Aa(l,t,e,a){return l={tag:l,create:e,deps:a,inst:t,next:null},t=X.updateQueue,t===null&&(t=Sn(),X.updateQueue=t),e=t.lastEffect,e===null?t.lastEffect=l.next=l:(a=e.next,e.next=l,l.next=a,t.lastEffect=l),l}function co(){return Ml().memoizedState}function En(l,t,e,a){var u=lt();X.flags|=l,u.memoizedState=Aa(1|t,{destroy:void 0},e,a===void 0?null:a)}function zn(l,t,e,a){var u=Ml();a=a===void 0?null:a;var n=u.memoizedState.inst;ml!==null&&a!==null&&ti(a,ml.memoizedState.deps)?u.memoizedState=Aa(t,n,e,a):(X.flags|=l,u.memoizedState=Aa(1|t,n,e,a))}function io(l,t){En(8390656,8,l,t)}function di(l,t){zn(2048,8,l,t)}function Vm(l){X.flags|=4;var t=X.updateQueue;if(t===null)t=Sn(),X.updateQueue=t,t.events=[l];else{var e=t.events;e===null?t.events=[l]:e.push(l)}}function fo(l){var t=Ml().memoizedState;return Vm({ref:t,nextImpl:l}),function(){if((ul&2)!==0)throw Error(r(440));return t.impl.apply(void 0,arguments)}}function so(l,t){return zn(4,2,l,t)}function oo(l,t){return zn(4,4,l,t)}function mo(l,t){if(typeof t=="function"){l=l();var e=t(l);return function(){typeof e=="function"?e():t(null)}}if(t!=null)return l=l(),t.current=l,function(){t.current=null}}function vo(l,t,e){e=e!=null?e.concat([l]):null,zn(4,4,mo.bind(null,t,l),e)}function mi(){}function yo(l,t){var e=Ml();t=t===void 0?null:t;var a=e.memoizedState;return t!==null&&ti(t,a[1])?a[0]:(e.memoizedState=[l,t],l)}function ro(l,t){var e=Ml();t=t===void 0?null:t;var a=e.memoizedState;if(t!==null&&ti(t,a[1]))return a[0];if(a=l(),Ke){Dl(!0);try{l()}finally{Dl(!1)}}return e.memoizedState=[a,t],a}function vi(l,t,e){return e===void 0||($t&1073741824)!==0&&(W&261930)===0?l.memoizedState=t:(l.memoizedState=e,l=hd(),X.lanes|=l,pe|=l,e)}function ho(l,t,e,a){return dt(e,t)?e:Ea.current!==null?(l=vi(l,e,a),dt(l,t)||(Cl=!0),l):($t&42)===0||($t&1073741824)!==0&&(W&261930)===0?(Cl=!0,l.memoizedState=e):(l=hd(),X.lanes|=l,pe|=l,t)}function go(l,t,e,a,u){var n=_.p;_.p=n!==0&&8>n?n:8;var c=g.T,i={};g.T=i,hi(l,!1,t,e);try{var f=u(),v=g.S;if(v!==null&&v(i,f),f!==null&&typeof f=="object"&&typeof f.then=="function"){var S=Gm(f,a);vu(l,t,S,gt(l))}else vu(l,t,a,gt(l))}catch(p){vu(l,t,{then:function(){},status:"rejected",reason:p},gt())}finally{_.p=n,c!==null&&i.types!==null&&(c.types=i.types),g.T=c}}function Km(){}function yi(l,t,e,a){if(l.tag!==5)throw Error(r(476));var u=So(l).queue;go(l,u,t,H,e===null?Km:function(){return bo(l),e(a)})}function So(l){var t=l.memoizedState;if(t!==null)return t;t={memoizedState:H,baseState:H,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:kt,lastRenderedState:H},next:null};var e={};return t.next={memoizedState:e,baseState:e,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:kt,lastRenderedState:e},next:null},l.memoizedState=t,l=l.alternate,l!==null&&(l.memoizedState=t),t}function bo(l){var t=So(l);t.next===null&&(t=l.alternate.memoizedState),vu(l,t.next.queue,{},gt())}function ri(){return Ll(Nu)}function po(){return Ml().memoizedState}function Eo(){return Ml().memoizedState}function Jm(l){for(var t=l.return;t!==null;){switch(t.tag){case 24:case 3:var e=gt();l=ye(e);var a=re(t,l,e);a!==null&&(st(a,t,e),fu(a,t,e)),t={cache:Vc()},l.payload=t;return}t=t.return}}function wm(l,t,e){var a=gt();e={lane:a,revertLane:0,gesture:null,action:e,hasEagerState:!1,eagerState:null,next:null},Tn(l)?To(t,e):(e=Rc(l,t,e,a),e!==null&&(st(e,l,a),Ao(e,t,a)))}function zo(l,t,e){var a=gt();vu(l,t,e,a)}function vu(l,t,e,a){var u={lane:a,revertLane:0,gesture:null,action:e,hasEagerState:!1,eagerState:null,next:null};if(Tn(l))To(t,u);else{var n=l.alternate;if(l.lanes===0&&(n===null||n.lanes===0)&&(n=t.lastRenderedReducer,n!==null))try{var c=t.lastRenderedState,i=n(c,e);if(u.hasEagerState=!0,u.eagerState=i,dt(i,c))return en(l,t,u,0),rl===null&&tn(),!1}catch{}finally{}if(e=Rc(l,t,u,a),e!==null)return st(e,l,a),Ao(e,t,a),!0}return!1}function hi(l,t,e,a){if(a={lane:2,revertLane:Wi(),gesture:null,action:a,hasEagerState:!1,eagerState:null,next:null},Tn(l)){if(t)throw Error(r(479))}else t=Rc(l,e,a,2),t!==null&&st(t,l,2)}function Tn(l){var t=l.alternate;return l===X||t!==null&&t===X}function To(l,t){za=hn=!0;var e=l.pending;e===null?t.next=t:(t.next=e.next,e.next=t),l.pending=t}function Ao(l,t,e){if((e&4194048)!==0){var a=t.lanes;a&=l.pendingLanes,e|=a,t.lanes=e,Mf(l,e)}}var yu={readContext:Ll,use:bn,useCallback:xl,useContext:xl,useEffect:xl,useImperativeHandle:xl,useLayoutEffect:xl,useInsertionEffect:xl,useMemo:xl,useReducer:xl,useRef:xl,useState:xl,useDebugValue:xl,useDeferredValue:xl,useTransition:xl,useSyncExternalStore:xl,useId:xl,useHostTransitionStatus:xl,useFormState:xl,useActionState:xl,useOptimistic:xl,useMemoCache:xl,useCacheRefresh:xl};yu.useEffectEvent=xl;var xo={readContext:Ll,use:bn,useCallback:function(l,t){return lt().memoizedState=[l,t===void 0?null:t],l},useContext:Ll,useEffect:io,useImperativeHandle:function(l,t,e){e=e!=null?e.concat([l]):null,En(4194308,4,mo.bind(null,t,l),e)},useLayoutEffect:function(l,t){return En(4194308,4,l,t)},useInsertionEffect:function(l,t){En(4,2,l,t)},useMemo:function(l,t){var e=lt();t=t===void 0?null:t;var a=l();if(Ke){Dl(!0);try{l()}finally{Dl(!1)}}return e.memoizedState=[a,t],a},useReducer:function(l,t,e){var a=lt();if(e!==void 0){var u=e(t);if(Ke){Dl(!0);try{e(t)}finally{Dl(!1)}}}else u=t;return a.memoizedState=a.baseState=u,l={pending:null,lanes:0,dispatch:null,lastRenderedReducer:l,lastRenderedState:u},a.queue=l,l=l.dispatch=wm.bind(null,X,l),[a.memoizedState,l]},useRef:function(l){var t=lt();return l={current:l},t.memoizedState=l},useState:function(l){l=si(l);var t=l.queue,e=zo.bind(null,X,t);return t.dispatch=e,[l.memoizedState,e]},useDebugValue:mi,useDeferredValue:function(l,t){var e=lt();return vi(e,l,t)},useTransition:function(){var l=si(!1);return l=go.bind(null,X,l.queue,!0,!1),lt().memoizedState=l,[!1,l]},useSyncExternalStore:function(l,t,e){var a=X,u=lt();if(F){if(e===void 0)throw Error(r(407));e=e()}else{if(e=t(),rl===null)throw Error(r(349));(W&127)!==0||Ks(a,t,e)}u.memoizedState=e;var n={value:e,getSnapshot:t};return u.queue=n,io(ws.bind(null,a,n,l),[l]),a.flags|=2048,Aa(9,{destroy:void 0},Js.bind(null,a,n,e,t),null),e},useId:function(){var l=lt(),t=rl.identifierPrefix;if(F){var e=qt,a=Ht;e=(a&~(1<<32-Pl(a)-1)).toString(32)+e,t="_"+t+"R_"+e,e=gn++,0<e&&(t+="H"+e.toString(32)),t+="_"}else e=Qm++,t="_"+t+"r_"+e.toString(32)+"_";return l.memoizedState=t},useHostTransitionStatus:ri,useFormState:eo,useActionState:eo,useOptimistic:function(l){var t=lt();t.memoizedState=t.baseState=l;var e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=e,t=hi.bind(null,X,!0,e),e.dispatch=t,[l,t]},useMemoCache:ci,useCacheRefresh:function(){return lt().memoizedState=Jm.bind(null,X)},useEffectEvent:function(l){var t=lt(),e={impl:l};return t.memoizedState=e,function(){if((ul&2)!==0)throw Error(r(440));return e.impl.apply(void 0,arguments)}}},gi={readContext:Ll,use:bn,useCallback:yo,useContext:Ll,useEffect:di,useImperativeHandle:vo,useInsertionEffect:so,useLayoutEffect:oo,useMemo:ro,useReducer:pn,useRef:co,useState:function(){return pn(kt)},useDebugValue:mi,useDeferredValue:function(l,t){var e=Ml();return ho(e,ml.memoizedState,l,t)},useTransition:function(){var l=pn(kt)[0],t=Ml().memoizedState;return[typeof l=="boolean"?l:mu(l),t]},useSyncExternalStore:Vs,useId:po,useHostTransitionStatus:ri,useFormState:ao,useActionState:ao,useOptimistic:function(l,t){var e=Ml();return ks(e,ml,l,t)},useMemoCache:ci,useCacheRefresh:Eo};gi.useEffectEvent=fo;var _o={readContext:Ll,use:bn,useCallback:yo,useContext:Ll,useEffect:di,useImperativeHandle:vo,useInsertionEffect:so,useLayoutEffect:oo,useMemo:ro,useReducer:fi,useRef:co,useState:function(){return fi(kt)},useDebugValue:mi,useDeferredValue:function(l,t){var e=Ml();return ml===null?vi(e,l,t):ho(e,ml.memoizedState,l,t)},useTransition:function(){var l=fi(kt)[0],t=Ml().memoizedState;return[typeof l=="boolean"?l:mu(l),t]},useSyncExternalStore:Vs,useId:po,useHostTransitionStatus:ri,useFormState:no,useActionState:no,useOptimistic:function(l,t){var e=Ml();return ml!==null?ks(e,ml,l,t):(e.baseState=l,[l,e.queue.dispatch])},useMemoCache:ci,useCacheRefresh:Eo};_o.useEffectEvent=fo;function Si(l,t,e,a){t=l.memoizedState,e=e(a,t),e=e==null?t:R({},t,e),l.memoizedState=e,l.lanes===0&&(l.updateQueue.baseState=e)}var bi={enqueueSetState:function(l,t,e){l=l._reactInternals;var a=gt(),u=ye(a);u.payload=t,e!=null&&(u.callback=e),t=re(l,u,a),t!==null&&(st(t,l,a),fu(t,l,a))},enqueueReplaceState:function(l,t,e){l=l._reactInternals;var a=gt(),u=ye(a);u.tag=1,u.payload=t,e!=null&&(u.callback=e),t=re(l,u,a),t!==null&&(st(t,l,a),fu(t,l,a))},enqueueForceUpdate:function(l,t){l=l._reactInternals;var e=gt(),a=ye(e);a.tag=2,t!=null&&(a.callback=t),t=re(l,a,e),t!==null&&(st(t,l,e),fu(t,l,e))}};function Oo(l,t,e,a,u,n,c){return l=l.stateNode,typeof l.shouldComponentUpdate=="function"?l.shouldComponentUpdate(a,n,c):t.prototype&&t.prototype.isPureReactComponent?!lu(e,a)||!lu(u,n):!0}function Mo(l,t,e,a){l=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(e,a),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(e,a),t.state!==l&&bi.enqueueReplaceState(t,t.state,null)}function Je(l,t){var e=t;if("ref"in t){e={};for(var a in t)a!=="ref"&&(e[a]=t[a])}if(l=l.defaultProps){e===t&&(e=R({},e));for(var u in l)e[u]===void 0&&(e[u]=l[u])}return e}function Do(l){ln(l)}function No(l){console.error(l)}function Uo(l){ln(l)}function An(l,t){try{var e=l.onUncaughtError;e(t.value,{componentStack:t.stack})}catch(a){setTimeout(function(){throw a})}}function Co(l,t,e){try{var a=l.onCaughtError;a(e.value,{componentStack:e.stack,errorBoundary:t.tag===1?t.stateNode:null})}catch(u){setTimeout(function(){throw u})}}function pi(l,t,e){return e=ye(e),e.tag=3,e.payload={element:null},e.callback=function(){An(l,t)},e}function Ro(l){return l=ye(l),l.tag=3,l}function jo(l,t,e,a){var u=e.type.getDerivedStateFromError;if(typeof u=="function"){var n=a.value;l.payload=function(){return u(n)},l.callback=function(){Co(t,e,a)}}var c=e.stateNode;c!==null&&typeof c.componentDidCatch=="function"&&(l.callback=function(){Co(t,e,a),typeof u!="function"&&(Ee===null?Ee=new Set([this]):Ee.add(this));var i=a.stack;this.componentDidCatch(a.value,{componentStack:i!==null?i:""})})}function Wm(l,t,e,a,u){if(e.flags|=32768,a!==null&&typeof a=="object"&&typeof a.then=="function"){if(t=e.alternate,t!==null&&ha(t,e,u,!0),e=vt.current,e!==null){switch(e.tag){case 31:case 13:return Mt===null?qn():e.alternate===null&&_l===0&&(_l=3),e.flags&=-257,e.flags|=65536,e.lanes=u,a===dn?e.flags|=16384:(t=e.updateQueue,t===null?e.updateQueue=new Set([a]):t.add(a),Ki(l,a,u)),!1;case 22:return e.flags|=65536,a===dn?e.flags|=16384:(t=e.updateQueue,t===null?(t={transitions:null,markerInstances:null,retryQueue:new Set([a])},e.updateQueue=t):(e=t.retryQueue,e===null?t.retryQueue=new Set([a]):e.add(a)),Ki(l,a,u)),!1}throw Error(r(435,e.tag))}return Ki(l,a,u),qn(),!1}if(F)return t=vt.current,t!==null?((t.flags&65536)===0&&(t.flags|=256),t.flags|=65536,t.lanes=u,a!==Gc&&(l=Error(r(422),{cause:a}),au(At(l,e)))):(a!==Gc&&(t=Error(r(423),{cause:a}),au(At(t,e))),l=l.current.alternate,l.flags|=65536,u&=-u,l.lanes|=u,a=At(a,e),u=pi(l.stateNode,a,u),kc(l,u),_l!==4&&(_l=2)),!1;var n=Error(r(520),{cause:a});if(n=At(n,e),zu===null?zu=[n]:zu.push(n),_l!==4&&(_l=2),t===null)return!0;a=At(a,e),e=t;do{switch(e.tag){case 3:return e.flags|=65536,l=u&-u,e.lanes|=l,l=pi(e.stateNode,a,l),kc(e,l),!1;case 1:if(t=e.type,n=e.stateNode,(e.flags&128)===0&&(typeof t.getDerivedStateFromError=="function"||n!==null&&typeof n.componentDidCatch=="function"&&(Ee===null||!Ee.has(n))))return e.flags|=65536,u&=-u,e.lanes|=u,u=Ro(u),jo(u,l,e,a),kc(e,u),!1}e=e.return}while(e!==null);return!1}var Ei=Error(r(461)),Cl=!1;function Vl(l,t,e,a){t.child=l===null?Bs(t,null,e,a):Ve(t,l.child,e,a)}function Ho(l,t,e,a,u){e=e.render;var n=t.ref;if("ref"in a){var c={};for(var i in a)i!=="ref"&&(c[i]=a[i])}else c=a;return Qe(t),a=ei(l,t,e,c,n,u),i=ai(),l!==null&&!Cl?(ui(l,t,u),Ft(l,t,u)):(F&&i&&Bc(t),t.flags|=1,Vl(l,t,a,u),t.child)}function qo(l,t,e,a,u){if(l===null){var n=e.type;return typeof n=="function"&&!jc(n)&&n.defaultProps===void 0&&e.compare===null?(t.tag=15,t.type=n,Bo(l,t,n,a,u)):(l=un(e.type,null,a,t,t.mode,u),l.ref=t.ref,l.return=t,t.child=l)}if(n=l.child,!Di(l,u)){var c=n.memoizedProps;if(e=e.compare,e=e!==null?e:lu,e(c,a)&&l.ref===t.ref)return Ft(l,t,u)}return t.flags|=1,l=Kt(n,a),l.ref=t.ref,l.return=t,t.child=l}function Bo(l,t,e,a,u){if(l!==null){var n=l.memoizedProps;if(lu(n,a)&&l.ref===t.ref)if(Cl=!1,t.pendingProps=a=n,Di(l,u))(l.flags&131072)!==0&&(Cl=!0);else return t.lanes=l.lanes,Ft(l,t,u)}return zi(l,t,e,a,u)}function Yo(l,t,e,a){var u=a.children,n=l!==null?l.memoizedState:null;if(l===null&&t.stateNode===null&&(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),a.mode==="hidden"){if((t.flags&128)!==0){if(n=n!==null?n.baseLanes|e:e,l!==null){for(a=t.child=l.child,u=0;a!==null;)u=u|a.lanes|a.childLanes,a=a.sibling;a=u&~n}else a=0,t.child=null;return Go(l,t,n,e,a)}if((e&536870912)!==0)t.memoizedState={baseLanes:0,cachePool:null},l!==null&&sn(t,n!==null?n.cachePool:null),n!==null?Qs(t,n):Ic(),Xs(t);else return a=t.lanes=536870912,Go(l,t,n!==null?n.baseLanes|e:e,e,a)}else n!==null?(sn(t,n.cachePool),Qs(t,n),ge(),t.memoizedState=null):(l!==null&&sn(t,null),Ic(),ge());return Vl(l,t,u,e),t.child}function ru(l,t){return l!==null&&l.tag===22||t.stateNode!==null||(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),t.sibling}function Go(l,t,e,a,u){var n=Jc();return n=n===null?null:{parent:Nl._currentValue,pool:n},t.memoizedState={baseLanes:e,cachePool:n},l!==null&&sn(t,null),Ic(),Xs(t),l!==null&&ha(l,t,a,!0),t.childLanes=u,null}function xn(l,t){return t=On({mode:t.mode,children:t.children},l.mode),t.ref=l.ref,l.child=t,t.return=l,t}function Qo(l,t,e){return Ve(t,l.child,null,e),l=xn(t,t.pendingProps),l.flags|=2,yt(t),t.memoizedState=null,l}function $m(l,t,e){var a=t.pendingProps,u=(t.flags&128)!==0;if(t.flags&=-129,l===null){if(F){if(a.mode==="hidden")return l=xn(t,a),t.lanes=536870912,ru(null,l);if(li(t),(l=bl)?(l=Id(l,Ot),l=l!==null&&l.data==="&"?l:null,l!==null&&(t.memoizedState={dehydrated:l,treeContext:se!==null?{id:Ht,overflow:qt}:null,retryLane:536870912,hydrationErrors:null},e=zs(l),e.return=t,t.child=e,Zl=t,bl=null)):l=null,l===null)throw de(t);return t.lanes=536870912,null}return xn(t,a)}var n=l.memoizedState;if(n!==null){var c=n.dehydrated;if(li(t),u)if(t.flags&256)t.flags&=-257,t=Qo(l,t,e);else if(t.memoizedState!==null)t.child=l.child,t.flags|=128,t=null;else throw Error(r(558));else if(Cl||ha(l,t,e,!1),u=(e&l.childLanes)!==0,Cl||u){if(a=rl,a!==null&&(c=Df(a,e),c!==0&&c!==n.retryLane))throw n.retryLane=c,qe(l,c),st(a,l,c),Ei;qn(),t=Qo(l,t,e)}else l=n.treeContext,bl=Dt(c.nextSibling),Zl=t,F=!0,oe=null,Ot=!1,l!==null&&xs(t,l),t=xn(t,a),t.flags|=4096;return t}return l=Kt(l.child,{mode:a.mode,children:a.children}),l.ref=t.ref,t.child=l,l.return=t,l}function _n(l,t){var e=t.ref;if(e===null)l!==null&&l.ref!==null&&(t.flags|=4194816);else{if(typeof e!="function"&&typeof e!="object")throw Error(r(284));(l===null||l.ref!==e)&&(t.flags|=4194816)}}function zi(l,t,e,a,u){return Qe(t),e=ei(l,t,e,a,void 0,u),a=ai(),l!==null&&!Cl?(ui(l,t,u),Ft(l,t,u)):(F&&a&&Bc(t),t.flags|=1,Vl(l,t,e,u),t.child)}function Xo(l,t,e,a,u,n){return Qe(t),t.updateQueue=null,e=Ls(t,a,e,u),Zs(l),a=ai(),l!==null&&!Cl?(ui(l,t,n),Ft(l,t,n)):(F&&a&&Bc(t),t.flags|=1,Vl(l,t,e,n),t.child)}function Zo(l,t,e,a,u){if(Qe(t),t.stateNode===null){var n=ma,c=e.contextType;typeof c=="object"&&c!==null&&(n=Ll(c)),n=new e(a,n),t.memoizedState=n.state!==null&&n.state!==void 0?n.state:null,n.updater=bi,t.stateNode=n,n._reactInternals=t,n=t.stateNode,n.props=a,n.state=t.memoizedState,n.refs={},Wc(t),c=e.contextType,n.context=typeof c=="object"&&c!==null?Ll(c):ma,n.state=t.memoizedState,c=e.getDerivedStateFromProps,typeof c=="function"&&(Si(t,e,c,a),n.state=t.memoizedState),typeof e.getDerivedStateFromProps=="function"||typeof n.getSnapshotBeforeUpdate=="function"||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(c=n.state,typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount(),c!==n.state&&bi.enqueueReplaceState(n,n.state,null),ou(t,a,n,u),su(),n.state=t.memoizedState),typeof n.componentDidMount=="function"&&(t.flags|=4194308),a=!0}else if(l===null){n=t.stateNode;var i=t.memoizedProps,f=Je(e,i);n.props=f;var v=n.context,S=e.contextType;c=ma,typeof S=="object"&&S!==null&&(c=Ll(S));var p=e.getDerivedStateFromProps;S=typeof p=="function"||typeof n.getSnapshotBeforeUpdate=="function",i=t.pendingProps!==i,S||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(i||v!==c)&&Mo(t,n,a,c),ve=!1;var y=t.memoizedState;n.state=y,ou(t,a,n,u),su(),v=t.memoizedState,i||y!==v||ve?(typeof p=="function"&&(Si(t,e,p,a),v=t.memoizedState),(f=ve||Oo(t,e,f,a,y,v,c))?(S||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount()),typeof n.componentDidMount=="function"&&(t.flags|=4194308)):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=a,t.memoizedState=v),n.props=a,n.state=v,n.context=c,a=f):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),a=!1)}else{n=t.stateNode,$c(l,t),c=t.memoizedProps,S=Je(e,c),n.props=S,p=t.pendingProps,y=n.context,v=e.contextType,f=ma,typeof v=="object"&&v!==null&&(f=Ll(v)),i=e.getDerivedStateFromProps,(v=typeof i=="function"||typeof n.getSnapshotBeforeUpdate=="function")||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(c!==p||y!==f)&&Mo(t,n,a,f),ve=!1,y=t.memoizedState,n.state=y,ou(t,a,n,u),su();var h=t.memoizedState;c!==p||y!==h||ve||l!==null&&l.dependencies!==null&&cn(l.dependencies)?(typeof i=="function"&&(Si(t,e,i,a),h=t.memoizedState),(S=ve||Oo(t,e,S,a,y,h,f)||l!==null&&l.dependencies!==null&&cn(l.dependencies))?(v||typeof n.UNSAFE_componentWillUpdate!="function"&&typeof n.componentWillUpdate!="function"||(typeof n.componentWillUpdate=="function"&&n.componentWillUpdate(a,h,f),typeof n.UNSAFE_componentWillUpdate=="function"&&n.UNSAFE_componentWillUpdate(a,h,f)),typeof n.componentDidUpdate=="function"&&(t.flags|=4),typeof n.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof n.componentDidUpdate!="function"||c===l.memoizedProps&&y===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||c===l.memoizedProps&&y===l.memoizedState||(t.flags|=1024),t.memoizedProps=a,t.memoizedState=h),n.props=a,n.state=h,n.context=f,a=S):(typeof n.componentDidUpdate!="function"||c===l.memoizedProps&&y===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||c===l.memoizedProps&&y===l.memoizedState||(t.flags|=1024),a=!1)}return n=a,_n(l,t),a=(t.flags&128)!==0,n||a?(n=t.stateNode,e=a&&typeof e.getDerivedStateFromError!="function"?null:n.render(),t.flags|=1,l!==null&&a?(t.child=Ve(t,l.child,null,u),t.child=Ve(t,null,e,u)):Vl(l,t,e,u),t.memoizedState=n.state,l=t.child):l=Ft(l,t,u),l}function Lo(l,t,e,a){return Ye(),t.flags|=256,Vl(l,t,e,a),t.child}var Ti={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function Ai(l){return{baseLanes:l,cachePool:Us()}}function xi(l,t,e){return l=l!==null?l.childLanes&~e:0,t&&(l|=ht),l}function Vo(l,t,e){var a=t.pendingProps,u=!1,n=(t.flags&128)!==0,c;if((c=n)||(c=l!==null&&l.memoizedState===null?!1:(Ol.current&2)!==0),c&&(u=!0,t.flags&=-129),c=(t.flags&32)!==0,t.flags&=-33,l===null){if(F){if(u?he(t):ge(),(l=bl)?(l=Id(l,Ot),l=l!==null&&l.data!=="&"?l:null,l!==null&&(t.memoizedState={dehydrated:l,treeContext:se!==null?{id:Ht,overflow:qt}:null,retryLane:536870912,hydrationErrors:null},e=zs(l),e.return=t,t.child=e,Zl=t,bl=null)):l=null,l===null)throw de(t);return ff(l)?t.lanes=32:t.lanes=536870912,null}var i=a.children;return a=a.fallback,u?(ge(),u=t.mode,i=On({mode:"hidden",children:i},u),a=Be(a,u,e,null),i.return=t,a.return=t,i.sibling=a,t.child=i,a=t.child,a.memoizedState=Ai(e),a.childLanes=xi(l,c,e),t.memoizedState=Ti,ru(null,a)):(he(t),_i(t,i))}var f=l.memoizedState;if(f!==null&&(i=f.dehydrated,i!==null)){if(n)t.flags&256?(he(t),t.flags&=-257,t=Oi(l,t,e)):t.memoizedState!==null?(ge(),t.child=l.child,t.flags|=128,t=null):(ge(),i=a.fallback,u=t.mode,a=On({mode:"visible",children:a.children},u),i=Be(i,u,e,null),i.flags|=2,a.return=t,i.return=t,a.sibling=i,t.child=a,Ve(t,l.child,null,e),a=t.child,a.memoizedState=Ai(e),a.childLanes=xi(l,c,e),t.memoizedState=Ti,t=ru(null,a));else if(he(t),ff(i)){if(c=i.nextSibling&&i.nextSibling.dataset,c)var v=c.dgst;c=v,a=Error(r(419)),a.stack="",a.digest=c,au({value:a,source:null,stack:null}),t=Oi(l,t,e)}else if(Cl||ha(l,t,e,!1),c=(e&l.childLanes)!==0,Cl||c){if(c=rl,c!==null&&(a=Df(c,e),a!==0&&a!==f.retryLane))throw f.retryLane=a,qe(l,a),st(c,l,a),Ei;cf(i)||qn(),t=Oi(l,t,e)}else cf(i)?(t.flags|=192,t.child=l.child,t=null):(l=f.treeContext,bl=Dt(i.nextSibling),Zl=t,F=!0,oe=null,Ot=!1,l!==null&&xs(t,l),t=_i(t,a.children),t.flags|=4096);return t}return u?(ge(),i=a.fallback,u=t.mode,f=l.child,v=f.sibling,a=Kt(f,{mode:"hidden",children:a.children}),a.subtreeFlags=f.subtreeFlags&65011712,v!==null?i=Kt(v,i):(i=Be(i,u,e,null),i.flags|=2),i.return=t,a.return=t,a.sibling=i,t.child=a,ru(null,a),a=t.child,i=l.child.memoizedState,i===null?i=Ai(e):(u=i.cachePool,u!==null?(f=Nl._currentValue,u=u.parent!==f?{parent:f,pool:f}:u):u=Us(),i={baseLanes:i.baseLanes|e,cachePool:u}),a.memoizedState=i,a.childLanes=xi(l,c,e),t.memoizedState=Ti,ru(l.child,a)):(he(t),e=l.child,l=e.sibling,e=Kt(e,{mode:"visible",children:a.children}),e.return=t,e.sibling=null,l!==null&&(c=t.deletions,c===null?(t.deletions=[l],t.flags|=16):c.push(l)),t.child=e,t.memoizedState=null,e)}function _i(l,t){return t=On({mode:"visible",children:t},l.mode),t.return=l,l.child=t}function On(l,t){return l=mt(22,l,null,t),l.lanes=0,l}function Oi(l,t,e){return Ve(t,l.child,null,e),l=_i(t,t.pendingProps.children),l.flags|=2,t.memoizedState=null,l}function Ko(l,t,e){l.lanes|=t;var a=l.alternate;a!==null&&(a.lanes|=t),Zc(l.return,t,e)}function Mi(l,t,e,a,u,n){var c=l.memoizedState;c===null?l.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:a,tail:e,tailMode:u,treeForkCount:n}:(c.isBackwards=t,c.rendering=null,c.renderingStartTime=0,c.last=a,c.tail=e,c.tailMode=u,c.treeForkCount=n)}function Jo(l,t,e){var a=t.pendingProps,u=a.revealOrder,n=a.tail;a=a.children;var c=Ol.current,i=(c&2)!==0;if(i?(c=c&1|2,t.flags|=128):c&=1,A(Ol,c),Vl(l,t,a,e),a=F?eu:0,!i&&l!==null&&(l.flags&128)!==0)l:for(l=t.child;l!==null;){if(l.tag===13)l.memoizedState!==null&&Ko(l,e,t);else if(l.tag===19)Ko(l,e,t);else if(l.child!==null){l.child.return=l,l=l.child;continue}if(l===t)break l;for(;l.sibling===null;){if(l.return===null||l.return===t)break l;l=l.return}l.sibling.return=l.return,l=l.sibling}switch(u){case"forwards":for(e=t.child,u=null;e!==null;)l=e.alternate,l!==null&&rn(l)===null&&(u=e),e=e.sibling;e=u,e===null?(u=t.child,t.child=null):(u=e.sibling,e.sibling=null),Mi(t,!1,u,e,n,a);break;case"backwards":case"unstable_legacy-backwards":for(e=null,u=t.child,t.child=null;u!==null;){if(l=u.alternate,l!==null&&rn(l)===null){t.child=u;break}l=u.sibling,u.sibling=e,e=u,u=l}Mi(t,!0,e,null,n,a);break;case"together":Mi(t,!1,null,null,void 0,a);break;default:t.memoizedState=null}return t.child}function Ft(l,t,e){if(l!==null&&(t.dependencies=l.dependencies),pe|=t.lanes,(e&t.childLanes)===0)if(l!==null){if(ha(l,t,e,!1),(e&t.childLanes)===0)return null}else return null;if(l!==null&&t.child!==l.child)throw Error(r(153));if(t.child!==null){for(l=t.child,e=Kt(l,l.pendingProps),t.child=e,e.return=t;l.sibling!==null;)l=l.sibling,e=e.sibling=Kt(l,l.pendingProps),e.return=t;e.sibling=null}return t.child}function Di(l,t){return(l.lanes&t)!==0?!0:(l=l.dependencies,!!(l!==null&&cn(l)))}function km(l,t,e){switch(t.tag){case 3:Al(t,t.stateNode.containerInfo),me(t,Nl,l.memoizedState.cache),Ye();break;case 27:case 5:dl(t);break;case 4:Al(t,t.stateNode.containerInfo);break;case 10:me(t,t.type,t.memoizedProps.value);break;case 31:if(t.memoizedState!==null)return t.flags|=128,li(t),null;break;case 13:var a=t.memoizedState;if(a!==null)return a.dehydrated!==null?(he(t),t.flags|=128,null):(e&t.child.childLanes)!==0?Vo(l,t,e):(he(t),l=Ft(l,t,e),l!==null?l.sibling:null);he(t);break;case 19:var u=(l.flags&128)!==0;if(a=(e&t.childLanes)!==0,a||(ha(l,t,e,!1),a=(e&t.childLanes)!==0),u){if(a)return Jo(l,t,e);t.flags|=128}if(u=t.memoizedState,u!==null&&(u.rendering=null,u.tail=null,u.lastEffect=null),A(Ol,Ol.current),a)break;return null;case 22:return t.lanes=0,Yo(l,t,e,t.pendingProps);case 24:me(t,Nl,l.memoizedState.cache)}return Ft(l,t,e)}function wo(l,t,e){if(l!==null)if(l.memoizedProps!==t.pendingProps)Cl=!0;else{if(!Di(l,e)&&(t.flags&128)===0)return Cl=!1,km(l,t,e);Cl=(l.flags&131072)!==0}else Cl=!1,F&&(t.flags&1048576)!==0&&As(t,eu,t.index);switch(t.lanes=0,t.tag){case 16:l:{var a=t.pendingProps;if(l=Ze(t.elementType),t.type=l,typeof l=="function")jc(l)?(a=Je(l,a),t.tag=1,t=Zo(null,t,l,a,e)):(t.tag=0,t=zi(null,t,l,a,e));else{if(l!=null){var u=l.$$typeof;if(u===tt){t.tag=11,t=Ho(null,t,l,a,e);break l}else if(u===K){t.tag=14,t=qo(null,t,l,a,e);break l}}throw t=et(l)||l,Error(r(306,t,""))}}return t;case 0:return zi(l,t,t.type,t.pendingProps,e);case 1:return a=t.type,u=Je(a,t.pendingProps),Zo(l,t,a,u,e);case 3:l:{if(Al(t,t.stateNode.containerInfo),l===null)throw Error(r(387));a=t.pendingProps;var n=t.memoizedState;u=n.element,$c(l,t),ou(t,a,null,e);var c=t.memoizedState;if(a=c.cache,me(t,Nl,a),a!==n.cache&&Lc(t,[Nl],e,!0),su(),a=c.element,n.isDehydrated)if(n={element:a,isDehydrated:!1,cache:c.cache},t.updateQueue.baseState=n,t.memoizedState=n,t.flags&256){t=Lo(l,t,a,e);break l}else if(a!==u){u=At(Error(r(424)),t),au(u),t=Lo(l,t,a,e);break l}else{switch(l=t.stateNode.containerInfo,l.nodeType){case 9:l=l.body;break;default:l=l.nodeName==="HTML"?l.ownerDocument.body:l}for(bl=Dt(l.firstChild),Zl=t,F=!0,oe=null,Ot=!0,e=Bs(t,null,a,e),t.child=e;e;)e.flags=e.flags&-3|4096,e=e.sibling}else{if(Ye(),a===u){t=Ft(l,t,e);break l}Vl(l,t,a,e)}t=t.child}return t;case 26:return _n(l,t),l===null?(e=u0(t.type,null,t.pendingProps,null))?t.memoizedState=e:F||(e=t.type,l=t.pendingProps,a=Ln(L.current).createElement(e),a[Xl]=t,a[at]=l,Kl(a,e,l),Bl(a),t.stateNode=a):t.memoizedState=u0(t.type,l.memoizedProps,t.pendingProps,l.memoizedState),null;case 27:return dl(t),l===null&&F&&(a=t.stateNode=t0(t.type,t.pendingProps,L.current),Zl=t,Ot=!0,u=bl,xe(t.type)?(sf=u,bl=Dt(a.firstChild)):bl=u),Vl(l,t,t.pendingProps.children,e),_n(l,t),l===null&&(t.flags|=4194304),t.child;case 5:return l===null&&F&&((u=a=bl)&&(a=_v(a,t.type,t.pendingProps,Ot),a!==null?(t.stateNode=a,Zl=t,bl=Dt(a.firstChild),Ot=!1,u=!0):u=!1),u||de(t)),dl(t),u=t.type,n=t.pendingProps,c=l!==null?l.memoizedProps:null,a=n.children,af(u,n)?a=null:c!==null&&af(u,c)&&(t.flags|=32),t.memoizedState!==null&&(u=ei(l,t,Xm,null,null,e),Nu._currentValue=u),_n(l,t),Vl(l,t,a,e),t.child;case 6:return l===null&&F&&((l=e=bl)&&(e=Ov(e,t.pendingProps,Ot),e!==null?(t.stateNode=e,Zl=t,bl=null,l=!0):l=!1),l||de(t)),null;case 13:return Vo(l,t,e);case 4:return Al(t,t.stateNode.containerInfo),a=t.pendingProps,l===null?t.child=Ve(t,null,a,e):Vl(l,t,a,e),t.child;case 11:return Ho(l,t,t.type,t.pendingProps,e);case 7:return Vl(l,t,t.pendingProps,e),t.child;case 8:return Vl(l,t,t.pendingProps.children,e),t.child;case 12:return Vl(l,t,t.pendingProps.children,e),t.child;case 10:return a=t.pendingProps,me(t,t.type,a.value),Vl(l,t,a.children,e),t.child;case 9:return u=t.type._context,a=t.pendingProps.children,Qe(t),u=Ll(u),a=a(u),t.flags|=1,Vl(l,t,a,e),t.child;case 14:return qo(l,t,t.type,t.pendingProps,e);case 15:return Bo(l,t,t.type,t.pendingProps,e);case 19:return Jo(l,t,e);case 31:return $m(l,t,e);case 22:return Yo(l,t,e,t.pendingProps);case 24:return Qe(t),a=Ll(Nl),l===null?(u=Jc(),u===null&&(u=rl,n=Vc(),u.pooledCache=n,n.refCount++,n!==null&&(u.pooledCacheLanes|=e),u=n),t.memoizedState={parent:a,cache:u},Wc(t),me(t,Nl,u)):((l.lanes&e)!==0&&($c(l,t),ou(t,null,null,e),su()),u=l.memoizedState,n=t.memoizedState,u.parent!==a?(u={parent:a,cache:a},t.memoizedState=u,t.lanes===0&&(t.memoizedState=t.updateQueue.baseState=u),me(t,Nl,a)):(a=n.cache,me(t,Nl,a),a!==u.cache&&Lc(t,[Nl],e,!0))),Vl(l,t,t.pendingProps.children,e),t.child;case 29:throw t.pendingProps}throw Error(r(156,t.tag))}function It(l){l.flags|=4}function Ni(l,t,e,a,u){if((t=(l.mode&32)!==0)&&(t=!1),t){if(l.flags|=16777216,(u&335544128)===u)if(l.stateNode.complete)l.flags|=8192;else if(pd())l.flags|=8192;else throw Le=dn,wc}else l.flags&=-16777217}function Wo(l,t){if(t.type!=="stylesheet"||(t.state.loading&4)!==0)l.flags&=-16777217;else if(l.flags|=16777216,!s0(t))if(pd())l.flags|=8192;else throw Le=dn,wc}function Mn(l,t){t!==null&&(l.flags|=4),l.flags&16384&&(t=l.tag!==22?_f():536870912,l.lanes|=t,Ma|=t)}function hu(l,t){if(!F)switch(l.tailMode){case"hidden":t=l.tail;for(var e=null;t!==null;)t.alternate!==null&&(e=t),t=t.sibling;e===null?l.tail=null:e.sibling=null;break;case"collapsed":e=l.tail;for(var a=null;e!==null;)e.alternate!==null&&(a=e),e=e.sibling;a===null?t||l.tail===null?l.tail=null:l.tail.sibling=null:a.sibling=null}}function pl(l){var t=l.alternate!==null&&l.alternate.child===l.child,e=0,a=0;if(t)for(var u=l.child;u!==null;)e|=u.lanes|u.childLanes,a|=u.subtreeFlags&65011712,a|=u.flags&65011712,u.return=l,u=u.sibling;else for(u=l.child;u!==null;)e|=u.lanes|u.childLanes,a|=u.subtreeFlags,a|=u.flags,u.return=l,u=u.sibling;return l.subtreeFlags|=a,l.childLanes=e,t}function Fm(l,t,e){var a=t.pendingProps;switch(Yc(t),t.tag){case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return pl(t),null;case 1:return pl(t),null;case 3:return e=t.stateNode,a=null,l!==null&&(a=l.memoizedState.cache),t.memoizedState.cache!==a&&(t.flags|=2048),Wt(Nl),gl(),e.pendingContext&&(e.context=e.pendingContext,e.pendingContext=null),(l===null||l.child===null)&&(ra(t)?It(t):l===null||l.memoizedState.isDehydrated&&(t.flags&256)===0||(t.flags|=1024,Qc())),pl(t),null;case 26:var u=t.type,n=t.memoizedState;return l===null?(It(t),n!==null?(pl(t),Wo(t,n)):(pl(t),Ni(t,u,null,a,e))):n?n!==l.memoizedState?(It(t),pl(t),Wo(t,n)):(pl(t),t.flags&=-16777217):(l=l.memoizedProps,l!==a&&It(t),pl(t),Ni(t,u,l,a,e)),null;case 27:if($e(t),e=L.current,u=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==a&&It(t);else{if(!a){if(t.stateNode===null)throw Error(r(166));return pl(t),null}l=D.current,ra(t)?_s(t):(l=t0(u,a,e),t.stateNode=l,It(t))}return pl(t),null;case 5:if($e(t),u=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==a&&It(t);else{if(!a){if(t.stateNode===null)throw Error(r(166));return pl(t),null}if(n=D.current,ra(t))_s(t);else{var c=Ln(L.current);switch(n){case 1:n=c.createElementNS("http://www.w3.org/2000/svg",u);break;case 2:n=c.createElementNS("http://www.w3.org/1998/Math/MathML",u);break;default:switch(u){case"svg":n=c.createElementNS("http://www.w3.org/2000/svg",u);break;case"math":n=c.createElementNS("http://www.w3.org/1998/Math/MathML",u);break;case"script":n=c.createElement("div"),n.innerHTML="<script><\/script>",n=n.removeChild(n.firstChild);break;case"select":n=typeof a.is=="string"?c.createElement("select",{is:a.is}):c.createElement("select"),a.multiple?n.multiple=!0:a.size&&(n.size=a.size);break;default:n=typeof a.is=="string"?c.createElement(u,{is:a.is}):c.createElement(u)}}n[Xl]=t,n[at]=a;l:for(c=t.child;c!==null;){if(c.tag===5||c.tag===6)n.appendChild(c.stateNode);else if(c.tag!==4&&c.tag!==27&&c.child!==null){c.child.return=c,c=c.child;continue}if(c===t)break l;for(;c.sibling===null;){if(c.return===null||c.return===t)break l;c=c.return}c.sibling.return=c.return,c=c.sibling}t.stateNode=n;l:switch(Kl(n,u,a),u){case"button":case"input":case"select":case"textarea":a=!!a.autoFocus;break l;case"img":a=!0;break l;default:a=!1}a&&It(t)}}return pl(t),Ni(t,t.type,l===null?null:l.memoizedProps,t.pendingProps,e),null;case 6:if(l&&t.stateNode!=null)l.memoizedProps!==a&&It(t);else{if(typeof a!="string"&&t.stateNode===null)throw Error(r(166));if(l=L.current,ra(t)){if(l=t.stateNode,e=t.memoizedProps,a=null,u=Zl,u!==null)switch(u.tag){case 27:case 5:a=u.memoizedProps}l[Xl]=t,l=!!(l.nodeValue===e||a!==null&&a.suppressHydrationWarning===!0||Vd(l.nodeValue,e)),l||de(t,!0)}else l=Ln(l).createTextNode(a),l[Xl]=t,t.stateNode=l}return pl(t),null;case 31:if(e=t.memoizedState,l===null||l.memoizedState!==null){if(a=ra(t),e!==null){if(l===null){if(!a)throw Error(r(318));if(l=t.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(r(557));l[Xl]=t}else Ye(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;pl(t),l=!1}else e=Qc(),l!==null&&l.memoizedState!==null&&(l.memoizedState.hydrationErrors=e),l=!0;if(!l)return t.flags&256?(yt(t),t):(yt(t),null);if((t.flags&128)!==0)throw Error(r(558))}return pl(t),null;case 13:if(a=t.memoizedState,l===null||l.memoizedState!==null&&l.memoizedState.dehydrated!==null){if(u=ra(t),a!==null&&a.dehydrated!==null){if(l===null){if(!u)throw Error(r(318));if(u=t.memoizedState,u=u!==null?u.dehydrated:null,!u)throw Error(r(317));u[Xl]=t}else Ye(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;pl(t),u=!1}else u=Qc(),l!==null&&l.memoizedState!==null&&(l.memoizedState.hydrationErrors=u),u=!0;if(!u)return t.flags&256?(yt(t),t):(yt(t),null)}return yt(t),(t.flags&128)!==0?(t.lanes=e,t):(e=a!==null,l=l!==null&&l.memoizedState!==null,e&&(a=t.child,u=null,a.alternate!==null&&a.alternate.memoizedState!==null&&a.alternate.memoizedState.cachePool!==null&&(u=a.alternate.memoizedState.cachePool.pool),n=null,a.memoizedState!==null&&a.memoizedState.cachePool!==null&&(n=a.memoizedState.cachePool.pool),n!==u&&(a.flags|=2048)),e!==l&&e&&(t.child.flags|=8192),Mn(t,t.updateQueue),pl(t),null);case 4:return gl(),l===null&&Ii(t.stateNode.containerInfo),pl(t),null;case 10:return Wt(t.type),pl(t),null;case 19:if(E(Ol),a=t.memoizedState,a===null)return pl(t),null;if(u=(t.flags&128)!==0,n=a.rendering,n===null)if(u)hu(a,!1);else{if(_l!==0||l!==null&&(l.flags&128)!==0)for(l=t.child;l!==null;){if(n=rn(l),n!==null){for(t.flags|=128,hu(a,!1),l=n.updateQueue,t.updateQueue=l,Mn(t,l),t.subtreeFlags=0,l=e,e=t.child;e!==null;)Es(e,l),e=e.sibling;return A(Ol,Ol.current&1|2),F&&Jt(t,a.treeForkCount),t.child}l=l.sibling}a.tail!==null&&Il()>Rn&&(t.flags|=128,u=!0,hu(a,!1),t.lanes=4194304)}else{if(!u)if(l=rn(n),l!==null){if(t.flags|=128,u=!0,l=l.updateQueue,t.updateQueue=l,Mn(t,l),hu(a,!0),a.tail===null&&a.tailMode==="hidden"&&!n.alternate&&!F)return pl(t),null}else 2*Il()-a.renderingStartTime>Rn&&e!==536870912&&(t.flags|=128,u=!0,hu(a,!1),t.lanes=4194304);a.isBackwards?(n.sibling=t.child,t.child=n):(l=a.last,l!==null?l.sibling=n:t.child=n,a.last=n)}return a.tail!==null?(l=a.tail,a.rendering=l,a.tail=l.sibling,a.renderingStartTime=Il(),l.sibling=null,e=Ol.current,A(Ol,u?e&1|2:e&1),F&&Jt(t,a.treeForkCount),l):(pl(t),null);case 22:case 23:return yt(t),Pc(),a=t.memoizedState!==null,l!==null?l.memoizedState!==null!==a&&(t.flags|=8192):a&&(t.flags|=8192),a?(e&536870912)!==0&&(t.flags&128)===0&&(pl(t),t.subtreeFlags&6&&(t.flags|=8192)):pl(t),e=t.updateQueue,e!==null&&Mn(t,e.retryQueue),e=null,l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(e=l.memoizedState.cachePool.pool),a=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(a=t.memoizedState.cachePool.pool),a!==e&&(t.flags|=2048),l!==null&&E(Xe),null;case 24:return e=null,l!==null&&(e=l.memoizedState.cache),t.memoizedState.cache!==e&&(t.flags|=2048),Wt(Nl),pl(t),null;case 25:return null;case 30:return null}throw Error(r(156,t.tag))}function Im(l,t){switch(Yc(t),t.tag){case 1:return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 3:return Wt(Nl),gl(),l=t.flags,(l&65536)!==0&&(l&128)===0?(t.flags=l&-65537|128,t):null;case 26:case 27:case 5:return $e(t),null;case 31:if(t.memoizedState!==null){if(yt(t),t.alternate===null)throw Error(r(340));Ye()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 13:if(yt(t),l=t.memoizedState,l!==null&&l.dehydrated!==null){if(t.alternate===null)throw Error(r(340));Ye()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 19:return E(Ol),null;case 4:return gl(),null;case 10:return Wt(t.type),null;case 22:case 23:return yt(t),Pc(),l!==null&&E(Xe),l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 24:return Wt(Nl),null;case 25:return null;default:return null}}function $o(l,t){switch(Yc(t),t.tag){case 3:Wt(Nl),gl();break;case 26:case 27:case 5:$e(t);break;case 4:gl();break;case 31:t.memoizedState!==null&&yt(t);break;case 13:yt(t);break;case 19:E(Ol);break;case 10:Wt(t.type);break;case 22:case 23:yt(t),Pc(),l!==null&&E(Xe);break;case 24:Wt(Nl)}}function gu(l,t){try{var e=t.updateQueue,a=e!==null?e.lastEffect:null;if(a!==null){var u=a.next;e=u;do{if((e.tag&l)===l){a=void 0;var n=e.create,c=e.inst;a=n(),c.destroy=a}e=e.next}while(e!==u)}}catch(i){sl(t,t.return,i)}}function Se(l,t,e){try{var a=t.updateQueue,u=a!==null?a.lastEffect:null;if(u!==null){var n=u.next;a=n;do{if((a.tag&l)===l){var c=a.inst,i=c.destroy;if(i!==void 0){c.destroy=void 0,u=t;var f=e,v=i;try{v()}catch(S){sl(u,f,S)}}}a=a.next}while(a!==n)}}catch(S){sl(t,t.return,S)}}function ko(l){var t=l.updateQueue;if(t!==null){var e=l.stateNode;try{Gs(t,e)}catch(a){sl(l,l.return,a)}}}function Fo(l,t,e){e.props=Je(l.type,l.memoizedProps),e.state=l.memoizedState;try{e.componentWillUnmount()}catch(a){sl(l,t,a)}}function Su(l,t){try{var e=l.ref;if(e!==null){switch(l.tag){case 26:case 27:case 5:var a=l.stateNode;break;case 30:a=l.stateNode;break;default:a=l.stateNode}typeof e=="function"?l.refCleanup=e(a):e.current=a}}catch(u){sl(l,t,u)}}function Bt(l,t){var e=l.ref,a=l.refCleanup;if(e!==null)if(typeof a=="function")try{a()}catch(u){sl(l,t,u)}finally{l.refCleanup=null,l=l.alternate,l!=null&&(l.refCleanup=null)}else if(typeof e=="function")try{e(null)}catch(u){sl(l,t,u)}else e.current=null}function Io(l){var t=l.type,e=l.memoizedProps,a=l.stateNode;try{l:switch(t){case"button":case"input":case"select":case"textarea":e.autoFocus&&a.focus();break l;case"img":e.src?a.src=e.src:e.srcSet&&(a.srcset=e.srcSet)}}catch(u){sl(l,l.return,u)}}function Ui(l,t,e){try{var a=l.stateNode;pv(a,l.type,e,t),a[at]=t}catch(u){sl(l,l.return,u)}}function Po(l){return l.tag===5||l.tag===3||l.tag===26||l.tag===27&&xe(l.type)||l.tag===4}function Ci(l){l:for(;;){for(;l.sibling===null;){if(l.return===null||Po(l.return))return null;l=l.return}for(l.sibling.return=l.return,l=l.sibling;l.tag!==5&&l.tag!==6&&l.tag!==18;){if(l.tag===27&&xe(l.type)||l.flags&2||l.child===null||l.tag===4)continue l;l.child.return=l,l=l.child}if(!(l.flags&2))return l.stateNode}}function Ri(l,t,e){var a=l.tag;if(a===5||a===6)l=l.stateNode,t?(e.nodeType===9?e.body:e.nodeName==="HTML"?e.ownerDocument.body:e).insertBefore(l,t):(t=e.nodeType===9?e.body:e.nodeName==="HTML"?e.ownerDocument.body:e,t.appendChild(l),e=e._reactRootContainer,e!=null||t.onclick!==null||(t.onclick=Lt));else if(a!==4&&(a===27&&xe(l.type)&&(e=l.stateNode,t=null),l=l.child,l!==null))for(Ri(l,t,e),l=l.sibling;l!==null;)Ri(l,t,e),l=l.sibling}function Dn(l,t,e){var a=l.tag;if(a===5||a===6)l=l.stateNode,t?e.insertBefore(l,t):e.appendChild(l);else if(a!==4&&(a===27&&xe(l.type)&&(e=l.stateNode),l=l.child,l!==null))for(Dn(l,t,e),l=l.sibling;l!==null;)Dn(l,t,e),l=l.sibling}function ld(l){var t=l.stateNode,e=l.memoizedProps;try{for(var a=l.type,u=t.attributes;u.length;)t.removeAttributeNode(u[0]);Kl(t,a,e),t[Xl]=l,t[at]=e}catch(n){sl(l,l.return,n)}}var Pt=!1,Rl=!1,ji=!1,td=typeof WeakSet=="function"?WeakSet:Set,Yl=null;function Pm(l,t){if(l=l.containerInfo,tf=kn,l=ms(l),Oc(l)){if("selectionStart"in l)var e={start:l.selectionStart,end:l.selectionEnd};else l:{e=(e=l.ownerDocument)&&e.defaultView||window;var a=e.getSelection&&e.getSelection();if(a&&a.rangeCount!==0){e=a.anchorNode;var u=a.anchorOffset,n=a.focusNode;a=a.focusOffset;try{e.nodeType,n.nodeType}catch{e=null;break l}var c=0,i=-1,f=-1,v=0,S=0,p=l,y=null;t:for(;;){for(var h;p!==e||u!==0&&p.nodeType!==3||(i=c+u),p!==n||a!==0&&p.nodeType!==3||(f=c+a),p.nodeType===3&&(c+=p.nodeValue.length),(h=p.firstChild)!==null;)y=p,p=h;for(;;){if(p===l)break t;if(y===e&&++v===u&&(i=c),y===n&&++S===a&&(f=c),(h=p.nextSibling)!==null)break;p=y,y=p.parentNode}p=h}e=i===-1||f===-1?null:{start:i,end:f}}else e=null}e=e||{start:0,end:0}}else e=null;for(ef={focusedElem:l,selectionRange:e},kn=!1,Yl=t;Yl!==null;)if(t=Yl,l=t.child,(t.subtreeFlags&1028)!==0&&l!==null)l.return=t,Yl=l;else for(;Yl!==null;){switch(t=Yl,n=t.alternate,l=t.flags,t.tag){case 0:if((l&4)!==0&&(l=t.updateQueue,l=l!==null?l.events:null,l!==null))for(e=0;e<l.length;e++)u=l[e],u.ref.impl=u.nextImpl;break;case 11:case 15:break;case 1:if((l&1024)!==0&&n!==null){l=void 0,e=t,u=n.memoizedProps,n=n.memoizedState,a=e.stateNode;try{var M=Je(e.type,u);l=a.getSnapshotBeforeUpdate(M,n),a.__reactInternalSnapshotBeforeUpdate=l}catch(q){sl(e,e.return,q)}}break;case 3:if((l&1024)!==0){if(l=t.stateNode.containerInfo,e=l.nodeType,e===9)nf(l);else if(e===1)switch(l.nodeName){case"HEAD":case"HTML":case"BODY":nf(l);break;default:l.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((l&1024)!==0)throw Error(r(163))}if(l=t.sibling,l!==null){l.return=t.return,Yl=l;break}Yl=t.return}}function ed(l,t,e){var a=e.flags;switch(e.tag){case 0:case 11:case 15:te(l,e),a&4&&gu(5,e);break;case 1:if(te(l,e),a&4)if(l=e.stateNode,t===null)try{l.componentDidMount()}catch(c){sl(e,e.return,c)}else{var u=Je(e.type,t.memoizedProps);t=t.memoizedState;try{l.componentDidUpdate(u,t,l.__reactInternalSnapshotBeforeUpdate)}catch(c){sl(e,e.return,c)}}a&64&&ko(e),a&512&&Su(e,e.return);break;case 3:if(te(l,e),a&64&&(l=e.updateQueue,l!==null)){if(t=null,e.child!==null)switch(e.child.tag){case 27:case 5:t=e.child.stateNode;break;case 1:t=e.child.stateNode}try{Gs(l,t)}catch(c){sl(e,e.return,c)}}break;case 27:t===null&&a&4&&ld(e);case 26:case 5:te(l,e),t===null&&a&4&&Io(e),a&512&&Su(e,e.return);break;case 12:te(l,e);break;case 31:te(l,e),a&4&&nd(l,e);break;case 13:te(l,e),a&4&&cd(l,e),a&64&&(l=e.memoizedState,l!==null&&(l=l.dehydrated,l!==null&&(e=fv.bind(null,e),Mv(l,e))));break;case 22:if(a=e.memoizedState!==null||Pt,!a){t=t!==null&&t.memoizedState!==null||Rl,u=Pt;var n=Rl;Pt=a,(Rl=t)&&!n?ee(l,e,(e.subtreeFlags&8772)!==0):te(l,e),Pt=u,Rl=n}break;case 30:break;default:te(l,e)}}function ad(l){var t=l.alternate;t!==null&&(l.alternate=null,ad(t)),l.child=null,l.deletions=null,l.sibling=null,l.tag===5&&(t=l.stateNode,t!==null&&oc(t)),l.stateNode=null,l.return=null,l.dependencies=null,l.memoizedProps=null,l.memoizedState=null,l.pendingProps=null,l.stateNode=null,l.updateQueue=null}var El=null,nt=!1;function le(l,t,e){for(e=e.child;e!==null;)ud(l,t,e),e=e.sibling}function ud(l,t,e){if(il&&typeof il.onCommitFiberUnmount=="function")try{il.onCommitFiberUnmount(Sl,e)}catch{}switch(e.tag){case 26:Rl||Bt(e,t),le(l,t,e),e.memoizedState?e.memoizedState.count--:e.stateNode&&(e=e.stateNode,e.parentNode.removeChild(e));break;case 27:Rl||Bt(e,t);var a=El,u=nt;xe(e.type)&&(El=e.stateNode,nt=!1),le(l,t,e),Ou(e.stateNode),El=a,nt=u;break;case 5:Rl||Bt(e,t);case 6:if(a=El,u=nt,El=null,le(l,t,e),El=a,nt=u,El!==null)if(nt)try{(El.nodeType===9?El.body:El.nodeName==="HTML"?El.ownerDocument.body:El).removeChild(e.stateNode)}catch(n){sl(e,t,n)}else try{El.removeChild(e.stateNode)}catch(n){sl(e,t,n)}break;case 18:El!==null&&(nt?(l=El,kd(l.nodeType===9?l.body:l.nodeName==="HTML"?l.ownerDocument.body:l,e.stateNode),qa(l)):kd(El,e.stateNode));break;case 4:a=El,u=nt,El=e.stateNode.containerInfo,nt=!0,le(l,t,e),El=a,nt=u;break;case 0:case 11:case 14:case 15:Se(2,e,t),Rl||Se(4,e,t),le(l,t,e);break;case 1:Rl||(Bt(e,t),a=e.stateNode,typeof a.componentWillUnmount=="function"&&Fo(e,t,a)),le(l,t,e);break;case 21:le(l,t,e);break;case 22:Rl=(a=Rl)||e.memoizedState!==null,le(l,t,e),Rl=a;break;default:le(l,t,e)}}function nd(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null))){l=l.dehydrated;try{qa(l)}catch(e){sl(t,t.return,e)}}}function cd(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null&&(l=l.dehydrated,l!==null))))try{qa(l)}catch(e){sl(t,t.return,e)}}function lv(l){switch(l.tag){case 31:case 13:case 19:var t=l.stateNode;return t===null&&(t=l.stateNode=new td),t;case 22:return l=l.stateNode,t=l._retryCache,t===null&&(t=l._retryCache=new td),t;default:throw Error(r(435,l.tag))}}function Nn(l,t){var e=lv(l);t.forEach(function(a){if(!e.has(a)){e.add(a);var u=sv.bind(null,l,a);a.then(u,u)}})}function ct(l,t){var e=t.deletions;if(e!==null)for(var a=0;a<e.length;a++){var u=e[a],n=l,c=t,i=c;l:for(;i!==null;){switch(i.tag){case 27:if(xe(i.type)){El=i.stateNode,nt=!1;break l}break;case 5:El=i.stateNode,nt=!1;break l;case 3:case 4:El=i.stateNode.containerInfo,nt=!0;break l}i=i.return}if(El===null)throw Error(r(160));ud(n,c,u),El=null,nt=!1,n=u.alternate,n!==null&&(n.return=null),u.return=null}if(t.subtreeFlags&13886)for(t=t.child;t!==null;)id(t,l),t=t.sibling}var Rt=null;function id(l,t){var e=l.alternate,a=l.flags;switch(l.tag){case 0:case 11:case 14:case 15:ct(t,l),it(l),a&4&&(Se(3,l,l.return),gu(3,l),Se(5,l,l.return));break;case 1:ct(t,l),it(l),a&512&&(Rl||e===null||Bt(e,e.return)),a&64&&Pt&&(l=l.updateQueue,l!==null&&(a=l.callbacks,a!==null&&(e=l.shared.hiddenCallbacks,l.shared.hiddenCallbacks=e===null?a:e.concat(a))));break;case 26:var u=Rt;if(ct(t,l),it(l),a&512&&(Rl||e===null||Bt(e,e.return)),a&4){var n=e!==null?e.memoizedState:null;if(a=l.memoizedState,e===null)if(a===null)if(l.stateNode===null){l:{a=l.type,e=l.memoizedProps,u=u.ownerDocument||u;t:switch(a){case"title":n=u.getElementsByTagName("title")[0],(!n||n[Ka]||n[Xl]||n.namespaceURI==="http://www.w3.org/2000/svg"||n.hasAttribute("itemprop"))&&(n=u.createElement(a),u.head.insertBefore(n,u.querySelector("head > title"))),Kl(n,a,e),n[Xl]=l,Bl(n),a=n;break l;case"link":var c=i0("link","href",u).get(a+(e.href||""));if(c){for(var i=0;i<c.length;i++)if(n=c[i],n.getAttribute("href")===(e.href==null||e.href===""?null:e.href)&&n.getAttribute("rel")===(e.rel==null?null:e.rel)&&n.getAttribute("title")===(e.title==null?null:e.title)&&n.getAttribute("crossorigin")===(e.crossOrigin==null?null:e.crossOrigin)){c.splice(i,1);break t}}n=u.createElement(a),Kl(n,a,e),u.head.appendChild(n);break;case"meta":if(c=i0("meta","content",u).get(a+(e.content||""))){for(i=0;i<c.length;i++)if(n=c[i],n.getAttribute("content")===(e.content==null?null:""+e.content)&&n.getAttribute("name")===(e.name==null?null:e.name)&&n.getAttribute("property")===(e.property==null?null:e.property)&&n.getAttribute("http-equiv")===(e.httpEquiv==null?null:e.httpEquiv)&&n.getAttribute("charset")===(e.charSet==null?null:e.charSet)){c.splice(i,1);break t}}n=u.createElement(a),Kl(n,a,e),u.head.appendChild(n);break;default:throw Error(r(468,a))}n[Xl]=l,Bl(n),a=n}l.stateNode=a}else f0(u,l.type,l.stateNode);else l.stateNode=c0(u,a,l.memoizedProps);else n!==a?(n===null?e.stateNode!==null&&(e=e.stateNode,e.parentNode.removeChild(e)):n.count--,a===null?f0(u,l.type,l.stateNode):c0(u,a,l.memoizedProps)):a===null&&l.stateNode!==null&&Ui(l,l.memoizedProps,e.memoizedProps)}break;case 27:ct(t,l),it(l),a&512&&(Rl||e===null||Bt(e,e.return)),e!==null&&a&4&&Ui(l,l.memoizedProps,e.memoizedProps);break;case 5:if(ct(t,l),it(l),a&512&&(Rl||e===null||Bt(e,e.return)),l.flags&32){u=l.stateNode;try{na(u,"")}catch(M){sl(l,l.return,M)}}a&4&&l.stateNode!=null&&(u=l.memoizedProps,Ui(l,u,e!==null?e.memoizedProps:u)),a&1024&&(ji=!0);break;case 6:if(ct(t,l),it(l),a&4){if(l.stateNode===null)throw Error(r(162));a=l.memoizedProps,e=l.stateNode;try{e.nodeValue=a}catch(M){sl(l,l.return,M)}}break;case 3:if(Jn=null,u=Rt,Rt=Vn(t.containerInfo),ct(t,l),Rt=u,it(l),a&4&&e!==null&&e.memoizedState.isDehydrated)try{qa(t.containerInfo)}catch(M){sl(l,l.return,M)}ji&&(ji=!1,fd(l));break;case 4:a=Rt,Rt=Vn(l.stateNode.containerInfo),ct(t,l),it(l),Rt=a;break;case 12:ct(t,l),it(l);break;case 31:ct(t,l),it(l),a&4&&(a=l.updateQueue,a!==null&&(l.updateQueue=null,Nn(l,a)));break;case 13:ct(t,l),it(l),l.child.flags&8192&&l.memoizedState!==null!=(e!==null&&e.memoizedState!==null)&&(Cn=Il()),a&4&&(a=l.updateQueue,a!==null&&(l.updateQueue=null,Nn(l,a)));break;case 22:u=l.memoizedState!==null;var f=e!==null&&e.memoizedState!==null,v=Pt,S=Rl;if(Pt=v||u,Rl=S||f,ct(t,l),Rl=S,Pt=v,it(l),a&8192)l:for(t=l.stateNode,t._visibility=u?t._visibility&-2:t._visibility|1,u&&(e===null||f||Pt||Rl||we(l)),e=null,t=l;;){if(t.tag===5||t.tag===26){if(e===null){f=e=t;try{if(n=f.stateNode,u)c=n.style,typeof c.setProperty=="function"?c.setProperty("display","none","important"):c.display="none";else{i=f.stateNode;var p=f.memoizedProps.style,y=p!=null&&p.hasOwnProperty("display")?p.display:null;i.style.display=y==null||typeof y=="boolean"?"":(""+y).trim()}}catch(M){sl(f,f.return,M)}}}else if(t.tag===6){if(e===null){f=t;try{f.stateNode.nodeValue=u?"":f.memoizedProps}catch(M){sl(f,f.return,M)}}}else if(t.tag===18){if(e===null){f=t;try{var h=f.stateNode;u?Fd(h,!0):Fd(f.stateNode,!1)}catch(M){sl(f,f.return,M)}}}else if((t.tag!==22&&t.tag!==23||t.memoizedState===null||t===l)&&t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break l;for(;t.sibling===null;){if(t.return===null||t.return===l)break l;e===t&&(e=null),t=t.return}e===t&&(e=null),t.sibling.return=t.return,t=t.sibling}a&4&&(a=l.updateQueue,a!==null&&(e=a.retryQueue,e!==null&&(a.retryQueue=null,Nn(l,e))));break;case 19:ct(t,l),it(l),a&4&&(a=l.updateQueue,a!==null&&(l.updateQueue=null,Nn(l,a)));break;case 30:break;case 21:break;default:ct(t,l),it(l)}}function it(l){var t=l.flags;if(t&2){try{for(var e,a=l.return;a!==null;){if(Po(a)){e=a;break}a=a.return}if(e==null)throw Error(r(160));switch(e.tag){case 27:var u=e.stateNode,n=Ci(l);Dn(l,n,u);break;case 5:var c=e.stateNode;e.flags&32&&(na(c,""),e.flags&=-33);var i=Ci(l);Dn(l,i,c);break;case 3:case 4:var f=e.stateNode.containerInfo,v=Ci(l);Ri(l,v,f);break;default:throw Error(r(161))}}catch(S){sl(l,l.return,S)}l.flags&=-3}t&4096&&(l.flags&=-4097)}function fd(l){if(l.subtreeFlags&1024)for(l=l.child;l!==null;){var t=l;fd(t),t.tag===5&&t.flags&1024&&t.stateNode.reset(),l=l.sibling}}function te(l,t){if(t.subtreeFlags&8772)for(t=t.child;t!==null;)ed(l,t.alternate,t),t=t.sibling}function we(l){for(l=l.child;l!==null;){var t=l;switch(t.tag){case 0:case 11:case 14:case 15:Se(4,t,t.return),we(t);break;case 1:Bt(t,t.return);var e=t.stateNode;typeof e.componentWillUnmount=="function"&&Fo(t,t.return,e),we(t);break;case 27:Ou(t.stateNode);case 26:case 5:Bt(t,t.return),we(t);break;case 22:t.memoizedState===null&&we(t);break;case 30:we(t);break;default:we(t)}l=l.sibling}}function ee(l,t,e){for(e=e&&(t.subtreeFlags&8772)!==0,t=t.child;t!==null;){var a=t.alternate,u=l,n=t,c=n.flags;switch(n.tag){case 0:case 11:case 15:ee(u,n,e),gu(4,n);break;case 1:if(ee(u,n,e),a=n,u=a.stateNode,typeof u.componentDidMount=="function")try{u.componentDidMount()}catch(v){sl(a,a.return,v)}if(a=n,u=a.updateQueue,u!==null){var i=a.stateNode;try{var f=u.shared.hiddenCallbacks;if(f!==null)for(u.shared.hiddenCallbacks=null,u=0;u<f.length;u++)Ys(f[u],i)}catch(v){sl(a,a.return,v)}}e&&c&64&&ko(n),Su(n,n.return);break;case 27:ld(n);case 26:case 5:ee(u,n,e),e&&a===null&&c&4&&Io(n),Su(n,n.return);break;case 12:ee(u,n,e);break;case 31:ee(u,n,e),e&&c&4&&nd(u,n);break;case 13:ee(u,n,e),e&&c&4&&cd(u,n);break;case 22:n.memoizedState===null&&ee(u,n,e),Su(n,n.return);break;case 30:break;default:ee(u,n,e)}t=t.sibling}}function Hi(l,t){var e=null;l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(e=l.memoizedState.cachePool.pool),l=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(l=t.memoizedState.cachePool.pool),l!==e&&(l!=null&&l.refCount++,e!=null&&uu(e))}function qi(l,t){l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&uu(l))}function jt(l,t,e,a){if(t.subtreeFlags&10256)for(t=t.child;t!==null;)sd(l,t,e,a),t=t.sibling}function sd(l,t,e,a){var u=t.flags;switch(t.tag){case 0:case 11:case 15:jt(l,t,e,a),u&2048&&gu(9,t);break;case 1:jt(l,t,e,a);break;case 3:jt(l,t,e,a),u&2048&&(l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&uu(l)));break;case 12:if(u&2048){jt(l,t,e,a),l=t.stateNode;try{var n=t.memoizedProps,c=n.id,i=n.onPostCommit;typeof i=="function"&&i(c,t.alternate===null?"mount":"update",l.passiveEffectDuration,-0)}catch(f){sl(t,t.return,f)}}else jt(l,t,e,a);break;case 31:jt(l,t,e,a);break;case 13:jt(l,t,e,a);break;case 23:break;case 22:n=t.stateNode,c=t.alternate,t.memoizedState!==null?n._visibility&2?jt(l,t,e,a):bu(l,t):n._visibility&2?jt(l,t,e,a):(n._visibility|=2,xa(l,t,e,a,(t.subtreeFlags&10256)!==0||!1)),u&2048&&Hi(c,t);break;case 24:jt(l,t,e,a),u&2048&&qi(t.alternate,t);break;default:jt(l,t,e,a)}}function xa(l,t,e,a,u){for(u=u&&((t.subtreeFlags&10256)!==0||!1),t=t.child;t!==null;){var n=l,c=t,i=e,f=a,v=c.flags;switch(c.tag){case 0:case 11:case 15:xa(n,c,i,f,u),gu(8,c);break;case 23:break;case 22:var S=c.stateNode;c.memoizedState!==null?S._visibility&2?xa(n,c,i,f,u):bu(n,c):(S._visibility|=2,xa(n,c,i,f,u)),u&&v&2048&&Hi(c.alternate,c);break;case 24:xa(n,c,i,f,u),u&&v&2048&&qi(c.alternate,c);break;default:xa(n,c,i,f,u)}t=t.sibling}}function bu(l,t){if(t.subtreeFlags&10256)for(t=t.child;t!==null;){var e=l,a=t,u=a.flags;switch(a.tag){case 22:bu(e,a),u&2048&&Hi(a.alternate,a);break;case 24:bu(e,a),u&2048&&qi(a.alternate,a);break;default:bu(e,a)}t=t.sibling}}var pu=8192;function _a(l,t,e){if(l.subtreeFlags&pu)for(l=l.child;l!==null;)od(l,t,e),l=l.sibling}function od(l,t,e){switch(l.tag){case 26:_a(l,t,e),l.flags&pu&&l.memoizedState!==null&&Qv(e,Rt,l.memoizedState,l.memoizedProps);break;case 5:_a(l,t,e);break;case 3:case 4:var a=Rt;Rt=Vn(l.stateNode.containerInfo),_a(l,t,e),Rt=a;break;case 22:l.memoizedState===null&&(a=l.alternate,a!==null&&a.memoizedState!==null?(a=pu,pu=16777216,_a(l,t,e),pu=a):_a(l,t,e));break;default:_a(l,t,e)}}function dd(l){var t=l.alternate;if(t!==null&&(l=t.child,l!==null)){t.child=null;do t=l.sibling,l.sibling=null,l=t;while(l!==null)}}function Eu(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var e=0;e<t.length;e++){var a=t[e];Yl=a,vd(a,l)}dd(l)}if(l.subtreeFlags&10256)for(l=l.child;l!==null;)md(l),l=l.sibling}function md(l){switch(l.tag){case 0:case 11:case 15:Eu(l),l.flags&2048&&Se(9,l,l.return);break;case 3:Eu(l);break;case 12:Eu(l);break;case 22:var t=l.stateNode;l.memoizedState!==null&&t._visibility&2&&(l.return===null||l.return.tag!==13)?(t._visibility&=-3,Un(l)):Eu(l);break;default:Eu(l)}}function Un(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var e=0;e<t.length;e++){var a=t[e];Yl=a,vd(a,l)}dd(l)}for(l=l.child;l!==null;){switch(t=l,t.tag){case 0:case 11:case 15:Se(8,t,t.return),Un(t);break;case 22:e=t.stateNode,e._visibility&2&&(e._visibility&=-3,Un(t));break;default:Un(t)}l=l.sibling}}function vd(l,t){for(;Yl!==null;){var e=Yl;switch(e.tag){case 0:case 11:case 15:Se(8,e,t);break;case 23:case 22:if(e.memoizedState!==null&&e.memoizedState.cachePool!==null){var a=e.memoizedState.cachePool.pool;a!=null&&a.refCount++}break;case 24:uu(e.memoizedState.cache)}if(a=e.child,a!==null)a.return=e,Yl=a;else l:for(e=l;Yl!==null;){a=Yl;var u=a.sibling,n=a.return;if(ad(a),a===e){Yl=null;break l}if(u!==null){u.return=n,Yl=u;break l}Yl=n}}}var tv={getCacheForType:function(l){var t=Ll(Nl),e=t.data.get(l);return e===void 0&&(e=l(),t.data.set(l,e)),e},cacheSignal:function(){return Ll(Nl).controller.signal}},ev=typeof WeakMap=="function"?WeakMap:Map,ul=0,rl=null,J=null,W=0,fl=0,rt=null,be=!1,Oa=!1,Bi=!1,ae=0,_l=0,pe=0,We=0,Yi=0,ht=0,Ma=0,zu=null,ft=null,Gi=!1,Cn=0,yd=0,Rn=1/0,jn=null,Ee=null,Hl=0,ze=null,Da=null,ue=0,Qi=0,Xi=null,rd=null,Tu=0,Zi=null;function gt(){return(ul&2)!==0&&W!==0?W&-W:g.T!==null?Wi():Nf()}function hd(){if(ht===0)if((W&536870912)===0||F){var l=Xu;Xu<<=1,(Xu&3932160)===0&&(Xu=262144),ht=l}else ht=536870912;return l=vt.current,l!==null&&(l.flags|=32),ht}function st(l,t,e){(l===rl&&(fl===2||fl===9)||l.cancelPendingCommit!==null)&&(Na(l,0),Te(l,W,ht,!1)),Va(l,e),((ul&2)===0||l!==rl)&&(l===rl&&((ul&2)===0&&(We|=e),_l===4&&Te(l,W,ht,!1)),Yt(l))}function gd(l,t,e){if((ul&6)!==0)throw Error(r(327));var a=!e&&(t&127)===0&&(t&l.expiredLanes)===0||La(l,t),u=a?nv(l,t):Vi(l,t,!0),n=a;do{if(u===0){Oa&&!a&&Te(l,t,0,!1);break}else{if(e=l.current.alternate,n&&!av(e)){u=Vi(l,t,!1),n=!1;continue}if(u===2){if(n=t,l.errorRecoveryDisabledLanes&n)var c=0;else c=l.pendingLanes&-536870913,c=c!==0?c:c&536870912?536870912:0;if(c!==0){t=c;l:{var i=l;u=zu;var f=i.current.memoizedState.isDehydrated;if(f&&(Na(i,c).flags|=256),c=Vi(i,c,!1),c!==2){if(Bi&&!f){i.errorRecoveryDisabledLanes|=n,We|=n,u=4;break l}n=ft,ft=u,n!==null&&(ft===null?ft=n:ft.push.apply(ft,n))}u=c}if(n=!1,u!==2)continue}}if(u===1){Na(l,0),Te(l,t,0,!0);break}l:{switch(a=l,n=u,n){case 0:case 1:throw Error(r(345));case 4:if((t&4194048)!==t)break;case 6:Te(a,t,ht,!be);break l;case 2:ft=null;break;case 3:case 5:break;default:throw Error(r(329))}if((t&62914560)===t&&(u=Cn+300-Il(),10<u)){if(Te(a,t,ht,!be),Lu(a,0,!0)!==0)break l;ue=t,a.timeoutHandle=Wd(Sd.bind(null,a,e,ft,jn,Gi,t,ht,We,Ma,be,n,"Throttled",-0,0),u);break l}Sd(a,e,ft,jn,Gi,t,ht,We,Ma,be,n,null,-0,0)}}break}while(!0);Yt(l)}function Sd(l,t,e,a,u,n,c,i,f,v,S,p,y,h){if(l.timeoutHandle=-1,p=t.subtreeFlags,p&8192||(p&16785408)===16785408){p={stylesheets:null,count:0,imgCount:0,imgBytes:0,suspenseyImages:[],waitingForImages:!0,waitingForViewTransition:!1,unsuspend:Lt},od(t,n,p);var M=(n&62914560)===n?Cn-Il():(n&4194048)===n?yd-Il():0;if(M=Xv(p,M),M!==null){ue=n,l.cancelPendingCommit=M(_d.bind(null,l,t,n,e,a,u,c,i,f,S,p,null,y,h)),Te(l,n,c,!v);return}}_d(l,t,n,e,a,u,c,i,f)}function av(l){for(var t=l;;){var e=t.tag;if((e===0||e===11||e===15)&&t.flags&16384&&(e=t.updateQueue,e!==null&&(e=e.stores,e!==null)))for(var a=0;a<e.length;a++){var u=e[a],n=u.getSnapshot;u=u.value;try{if(!dt(n(),u))return!1}catch{return!1}}if(e=t.child,t.subtreeFlags&16384&&e!==null)e.return=t,t=e;else{if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function Te(l,t,e,a){t&=~Yi,t&=~We,l.suspendedLanes|=t,l.pingedLanes&=~t,a&&(l.warmLanes|=t),a=l.expirationTimes;for(var u=t;0<u;){var n=31-Pl(u),c=1<<n;a[n]=-1,u&=~c}e!==0&&Of(l,e,t)}function Hn(){return(ul&6)===0?(Au(0),!1):!0}function Li(){if(J!==null){if(fl===0)var l=J.return;else l=J,wt=Ge=null,ni(l),pa=null,cu=0,l=J;for(;l!==null;)$o(l.alternate,l),l=l.return;J=null}}function Na(l,t){var e=l.timeoutHandle;e!==-1&&(l.timeoutHandle=-1,Tv(e)),e=l.cancelPendingCommit,e!==null&&(l.cancelPendingCommit=null,e()),ue=0,Li(),rl=l,J=e=Kt(l.current,null),W=t,fl=0,rt=null,be=!1,Oa=La(l,t),Bi=!1,Ma=ht=Yi=We=pe=_l=0,ft=zu=null,Gi=!1,(t&8)!==0&&(t|=t&32);var a=l.entangledLanes;if(a!==0)for(l=l.entanglements,a&=t;0<a;){var u=31-Pl(a),n=1<<u;t|=l[u],a&=~n}return ae=t,tn(),e}function bd(l,t){X=null,g.H=yu,t===ba||t===on?(t=js(),fl=3):t===wc?(t=js(),fl=4):fl=t===Ei?8:t!==null&&typeof t=="object"&&typeof t.then=="function"?6:1,rt=t,J===null&&(_l=1,An(l,At(t,l.current)))}function pd(){var l=vt.current;return l===null?!0:(W&4194048)===W?Mt===null:(W&62914560)===W||(W&536870912)!==0?l===Mt:!1}function Ed(){var l=g.H;return g.H=yu,l===null?yu:l}function zd(){var l=g.A;return g.A=tv,l}function qn(){_l=4,be||(W&4194048)!==W&&vt.current!==null||(Oa=!0),(pe&134217727)===0&&(We&134217727)===0||rl===null||Te(rl,W,ht,!1)}function Vi(l,t,e){var a=ul;ul|=2;var u=Ed(),n=zd();(rl!==l||W!==t)&&(jn=null,Na(l,t)),t=!1;var c=_l;l:do try{if(fl!==0&&J!==null){var i=J,f=rt;switch(fl){case 8:Li(),c=6;break l;case 3:case 2:case 9:case 6:vt.current===null&&(t=!0);var v=fl;if(fl=0,rt=null,Ua(l,i,f,v),e&&Oa){c=0;break l}break;default:v=fl,fl=0,rt=null,Ua(l,i,f,v)}}uv(),c=_l;break}catch(S){bd(l,S)}while(!0);return t&&l.shellSuspendCounter++,wt=Ge=null,ul=a,g.H=u,g.A=n,J===null&&(rl=null,W=0,tn()),c}function uv(){for(;J!==null;)Td(J)}function nv(l,t){var e=ul;ul|=2;var a=Ed(),u=zd();rl!==l||W!==t?(jn=null,Rn=Il()+500,Na(l,t)):Oa=La(l,t);l:do try{if(fl!==0&&J!==null){t=J;var n=rt;t:switch(fl){case 1:fl=0,rt=null,Ua(l,t,n,1);break;case 2:case 9:if(Cs(n)){fl=0,rt=null,Ad(t);break}t=function(){fl!==2&&fl!==9||rl!==l||(fl=7),Yt(l)},n.then(t,t);break l;case 3:fl=7;break l;case 4:fl=5;break l;case 7:Cs(n)?(fl=0,rt=null,Ad(t)):(fl=0,rt=null,Ua(l,t,n,7));break;case 5:var c=null;switch(J.tag){case 26:c=J.memoizedState;case 5:case 27:var i=J;if(c?s0(c):i.stateNode.complete){fl=0,rt=null;var f=i.sibling;if(f!==null)J=f;else{var v=i.return;v!==null?(J=v,Bn(v)):J=null}break t}}fl=0,rt=null,Ua(l,t,n,5);break;case 6:fl=0,rt=null,Ua(l,t,n,6);break;case 8:Li(),_l=6;break l;default:throw Error(r(462))}}cv();break}catch(S){bd(l,S)}while(!0);return wt=Ge=null,g.H=a,g.A=u,ul=e,J!==null?0:(rl=null,W=0,tn(),_l)}function cv(){for(;J!==null&&!uc();)Td(J)}function Td(l){var t=wo(l.alternate,l,ae);l.memoizedProps=l.pendingProps,t===null?Bn(l):J=t}function Ad(l){var t=l,e=t.alternate;switch(t.tag){case 15:case 0:t=Xo(e,t,t.pendingProps,t.type,void 0,W);break;case 11:t=Xo(e,t,t.pendingProps,t.type.render,t.ref,W);break;case 5:ni(t);default:$o(e,t),t=J=Es(t,ae),t=wo(e,t,ae)}l.memoizedProps=l.pendingProps,t===null?Bn(l):J=t}function Ua(l,t,e,a){wt=Ge=null,ni(t),pa=null,cu=0;var u=t.return;try{if(Wm(l,u,t,e,W)){_l=1,An(l,At(e,l.current)),J=null;return}}catch(n){if(u!==null)throw J=u,n;_l=1,An(l,At(e,l.current)),J=null;return}t.flags&32768?(F||a===1?l=!0:Oa||(W&536870912)!==0?l=!1:(be=l=!0,(a===2||a===9||a===3||a===6)&&(a=vt.current,a!==null&&a.tag===13&&(a.flags|=16384))),xd(t,l)):Bn(t)}function Bn(l){var t=l;do{if((t.flags&32768)!==0){xd(t,be);return}l=t.return;var e=Fm(t.alternate,t,ae);if(e!==null){J=e;return}if(t=t.sibling,t!==null){J=t;return}J=t=l}while(t!==null);_l===0&&(_l=5)}function xd(l,t){do{var e=Im(l.alternate,l);if(e!==null){e.flags&=32767,J=e;return}if(e=l.return,e!==null&&(e.flags|=32768,e.subtreeFlags=0,e.deletions=null),!t&&(l=l.sibling,l!==null)){J=l;return}J=l=e}while(l!==null);_l=6,J=null}function _d(l,t,e,a,u,n,c,i,f){l.cancelPendingCommit=null;do Yn();while(Hl!==0);if((ul&6)!==0)throw Error(r(327));if(t!==null){if(t===l.current)throw Error(r(177));if(n=t.lanes|t.childLanes,n|=Cc,G0(l,e,n,c,i,f),l===rl&&(J=rl=null,W=0),Da=t,ze=l,ue=e,Qi=n,Xi=u,rd=a,(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?(l.callbackNode=null,l.callbackPriority=0,ov(ce,function(){return Ud(),null})):(l.callbackNode=null,l.callbackPriority=0),a=(t.flags&13878)!==0,(t.subtreeFlags&13878)!==0||a){a=g.T,g.T=null,u=_.p,_.p=2,c=ul,ul|=4;try{Pm(l,t,e)}finally{ul=c,_.p=u,g.T=a}}Hl=1,Od(),Md(),Dd()}}function Od(){if(Hl===1){Hl=0;var l=ze,t=Da,e=(t.flags&13878)!==0;if((t.subtreeFlags&13878)!==0||e){e=g.T,g.T=null;var a=_.p;_.p=2;var u=ul;ul|=4;try{id(t,l);var n=ef,c=ms(l.containerInfo),i=n.focusedElem,f=n.selectionRange;if(c!==i&&i&&i.ownerDocument&&ds(i.ownerDocument.documentElement,i)){if(f!==null&&Oc(i)){var v=f.start,S=f.end;if(S===void 0&&(S=v),"selectionStart"in i)i.selectionStart=v,i.selectionEnd=Math.min(S,i.value.length);else{var p=i.ownerDocument||document,y=p&&p.defaultView||window;if(y.getSelection){var h=y.getSelection(),M=i.textContent.length,q=Math.min(f.start,M),yl=f.end===void 0?q:Math.min(f.end,M);!h.extend&&q>yl&&(c=yl,yl=q,q=c);var d=os(i,q),s=os(i,yl);if(d&&s&&(h.rangeCount!==1||h.anchorNode!==d.node||h.anchorOffset!==d.offset||h.focusNode!==s.node||h.focusOffset!==s.offset)){var m=p.createRange();m.setStart(d.node,d.offset),h.removeAllRanges(),q>yl?(h.addRange(m),h.extend(s.node,s.offset)):(m.setEnd(s.node,s.offset),h.addRange(m))}}}}for(p=[],h=i;h=h.parentNode;)h.nodeType===1&&p.push({element:h,left:h.scrollLeft,top:h.scrollTop});for(typeof i.focus=="function"&&i.focus(),i=0;i<p.length;i++){var b=p[i];b.element.scrollLeft=b.left,b.element.scrollTop=b.top}}kn=!!tf,ef=tf=null}finally{ul=u,_.p=a,g.T=e}}l.current=t,Hl=2}}function Md(){if(Hl===2){Hl=0;var l=ze,t=Da,e=(t.flags&8772)!==0;if((t.subtreeFlags&8772)!==0||e){e=g.T,g.T=null;var a=_.p;_.p=2;var u=ul;ul|=4;try{ed(l,t.alternate,t)}finally{ul=u,_.p=a,g.T=e}}Hl=3}}function Dd(){if(Hl===4||Hl===3){Hl=0,Gu();var l=ze,t=Da,e=ue,a=rd;(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?Hl=5:(Hl=0,Da=ze=null,Nd(l,l.pendingLanes));var u=l.pendingLanes;if(u===0&&(Ee=null),fc(e),t=t.stateNode,il&&typeof il.onCommitFiberRoot=="function")try{il.onCommitFiberRoot(Sl,t,void 0,(t.current.flags&128)===128)}catch{}if(a!==null){t=g.T,u=_.p,_.p=2,g.T=null;try{for(var n=l.onRecoverableError,c=0;c<a.length;c++){var i=a[c];n(i.value,{componentStack:i.stack})}}finally{g.T=t,_.p=u}}(ue&3)!==0&&Yn(),Yt(l),u=l.pendingLanes,(e&261930)!==0&&(u&42)!==0?l===Zi?Tu++:(Tu=0,Zi=l):Tu=0,Au(0)}}function Nd(l,t){(l.pooledCacheLanes&=t)===0&&(t=l.pooledCache,t!=null&&(l.pooledCache=null,uu(t)))}function Yn(){return Od(),Md(),Dd(),Ud()}function Ud(){if(Hl!==5)return!1;var l=ze,t=Qi;Qi=0;var e=fc(ue),a=g.T,u=_.p;try{_.p=32>e?32:e,g.T=null,e=Xi,Xi=null;var n=ze,c=ue;if(Hl=0,Da=ze=null,ue=0,(ul&6)!==0)throw Error(r(331));var i=ul;if(ul|=4,md(n.current),sd(n,n.current,c,e),ul=i,Au(0,!1),il&&typeof il.onPostCommitFiberRoot=="function")try{il.onPostCommitFiberRoot(Sl,n)}catch{}return!0}finally{_.p=u,g.T=a,Nd(l,t)}}function Cd(l,t,e){t=At(e,t),t=pi(l.stateNode,t,2),l=re(l,t,2),l!==null&&(Va(l,2),Yt(l))}function sl(l,t,e){if(l.tag===3)Cd(l,l,e);else for(;t!==null;){if(t.tag===3){Cd(t,l,e);break}else if(t.tag===1){var a=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof a.componentDidCatch=="function"&&(Ee===null||!Ee.has(a))){l=At(e,l),e=Ro(2),a=re(t,e,2),a!==null&&(jo(e,a,t,l),Va(a,2),Yt(a));break}}t=t.return}}function Ki(l,t,e){var a=l.pingCache;if(a===null){a=l.pingCache=new ev;var u=new Set;a.set(t,u)}else u=a.get(t),u===void 0&&(u=new Set,a.set(t,u));u.has(e)||(Bi=!0,u.add(e),l=iv.bind(null,l,t,e),t.then(l,l))}function iv(l,t,e){var a=l.pingCache;a!==null&&a.delete(t),l.pingedLanes|=l.suspendedLanes&e,l.warmLanes&=~e,rl===l&&(W&e)===e&&(_l===4||_l===3&&(W&62914560)===W&&300>Il()-Cn?(ul&2)===0&&Na(l,0):Yi|=e,Ma===W&&(Ma=0)),Yt(l)}function Rd(l,t){t===0&&(t=_f()),l=qe(l,t),l!==null&&(Va(l,t),Yt(l))}function fv(l){var t=l.memoizedState,e=0;t!==null&&(e=t.retryLane),Rd(l,e)}function sv(l,t){var e=0;switch(l.tag){case 31:case 13:var a=l.stateNode,u=l.memoizedState;u!==null&&(e=u.retryLane);break;case 19:a=l.stateNode;break;case 22:a=l.stateNode._retryCache;break;default:throw Error(r(314))}a!==null&&a.delete(t),Rd(l,e)}function ov(l,t){return Xa(l,t)}var Gn=null,Ca=null,Ji=!1,Qn=!1,wi=!1,Ae=0;function Yt(l){l!==Ca&&l.next===null&&(Ca===null?Gn=Ca=l:Ca=Ca.next=l),Qn=!0,Ji||(Ji=!0,mv())}function Au(l,t){if(!wi&&Qn){wi=!0;do for(var e=!1,a=Gn;a!==null;){if(l!==0){var u=a.pendingLanes;if(u===0)var n=0;else{var c=a.suspendedLanes,i=a.pingedLanes;n=(1<<31-Pl(42|l)+1)-1,n&=u&~(c&~i),n=n&201326741?n&201326741|1:n?n|2:0}n!==0&&(e=!0,Bd(a,n))}else n=W,n=Lu(a,a===rl?n:0,a.cancelPendingCommit!==null||a.timeoutHandle!==-1),(n&3)===0||La(a,n)||(e=!0,Bd(a,n));a=a.next}while(e);wi=!1}}function dv(){jd()}function jd(){Qn=Ji=!1;var l=0;Ae!==0&&zv()&&(l=Ae);for(var t=Il(),e=null,a=Gn;a!==null;){var u=a.next,n=Hd(a,t);n===0?(a.next=null,e===null?Gn=u:e.next=u,u===null&&(Ca=e)):(e=a,(l!==0||(n&3)!==0)&&(Qn=!0)),a=u}Hl!==0&&Hl!==5||Au(l),Ae!==0&&(Ae=0)}function Hd(l,t){for(var e=l.suspendedLanes,a=l.pingedLanes,u=l.expirationTimes,n=l.pendingLanes&-62914561;0<n;){var c=31-Pl(n),i=1<<c,f=u[c];f===-1?((i&e)===0||(i&a)!==0)&&(u[c]=Y0(i,t)):f<=t&&(l.expiredLanes|=i),n&=~i}if(t=rl,e=W,e=Lu(l,l===t?e:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),a=l.callbackNode,e===0||l===t&&(fl===2||fl===9)||l.cancelPendingCommit!==null)return a!==null&&a!==null&&Za(a),l.callbackNode=null,l.callbackPriority=0;if((e&3)===0||La(l,e)){if(t=e&-e,t===l.callbackPriority)return t;switch(a!==null&&Za(a),fc(e)){case 2:case 8:e=Fe;break;case 32:e=ce;break;case 268435456:e=U;break;default:e=ce}return a=qd.bind(null,l),e=Xa(e,a),l.callbackPriority=t,l.callbackNode=e,t}return a!==null&&a!==null&&Za(a),l.callbackPriority=2,l.callbackNode=null,2}function qd(l,t){if(Hl!==0&&Hl!==5)return l.callbackNode=null,l.callbackPriority=0,null;var e=l.callbackNode;if(Yn()&&l.callbackNode!==e)return null;var a=W;return a=Lu(l,l===rl?a:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),a===0?null:(gd(l,a,t),Hd(l,Il()),l.callbackNode!=null&&l.callbackNode===e?qd.bind(null,l):null)}function Bd(l,t){if(Yn())return null;gd(l,t,!0)}function mv(){Av(function(){(ul&6)!==0?Xa(ke,dv):jd()})}function Wi(){if(Ae===0){var l=ga;l===0&&(l=Qu,Qu<<=1,(Qu&261888)===0&&(Qu=256)),Ae=l}return Ae}function Yd(l){return l==null||typeof l=="symbol"||typeof l=="boolean"?null:typeof l=="function"?l:wu(""+l)}function Gd(l,t){var e=t.ownerDocument.createElement("input");return e.name=t.name,e.value=t.value,l.id&&e.setAttribute("form",l.id),t.parentNode.insertBefore(e,t),l=new FormData(l),e.parentNode.removeChild(e),l}function vv(l,t,e,a,u){if(t==="submit"&&e&&e.stateNode===u){var n=Yd((u[at]||null).action),c=a.submitter;c&&(t=(t=c[at]||null)?Yd(t.formAction):c.getAttribute("formAction"),t!==null&&(n=t,c=null));var i=new Fu("action","action",null,a,u);l.push({event:i,listeners:[{instance:null,listener:function(){if(a.defaultPrevented){if(Ae!==0){var f=c?Gd(u,c):new FormData(u);yi(e,{pending:!0,data:f,method:u.method,action:n},null,f)}}else typeof n=="function"&&(i.preventDefault(),f=c?Gd(u,c):new FormData(u),yi(e,{pending:!0,data:f,method:u.method,action:n},n,f))},currentTarget:u}]})}}for(var $i=0;$i<Uc.length;$i++){var ki=Uc[$i],yv=ki.toLowerCase(),rv=ki[0].toUpperCase()+ki.slice(1);Ct(yv,"on"+rv)}Ct(rs,"onAnimationEnd"),Ct(hs,"onAnimationIteration"),Ct(gs,"onAnimationStart"),Ct("dblclick","onDoubleClick"),Ct("focusin","onFocus"),Ct("focusout","onBlur"),Ct(Um,"onTransitionRun"),Ct(Cm,"onTransitionStart"),Ct(Rm,"onTransitionCancel"),Ct(Ss,"onTransitionEnd"),aa("onMouseEnter",["mouseout","mouseover"]),aa("onMouseLeave",["mouseout","mouseover"]),aa("onPointerEnter",["pointerout","pointerover"]),aa("onPointerLeave",["pointerout","pointerover"]),Ce("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),Ce("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),Ce("onBeforeInput",["compositionend","keypress","textInput","paste"]),Ce("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),Ce("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),Ce("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var xu="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),hv=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(xu));function Qd(l,t){t=(t&4)!==0;for(var e=0;e<l.length;e++){var a=l[e],u=a.event;a=a.listeners;l:{var n=void 0;if(t)for(var c=a.length-1;0<=c;c--){var i=a[c],f=i.instance,v=i.currentTarget;if(i=i.listener,f!==n&&u.isPropagationStopped())break l;n=i,u.currentTarget=v;try{n(u)}catch(S){ln(S)}u.currentTarget=null,n=f}else for(c=0;c<a.length;c++){if(i=a[c],f=i.instance,v=i.currentTarget,i=i.listener,f!==n&&u.isPropagationStopped())break l;n=i,u.currentTarget=v;try{n(u)}catch(S){ln(S)}u.currentTarget=null,n=f}}}}function w(l,t){var e=t[sc];e===void 0&&(e=t[sc]=new Set);var a=l+"__bubble";e.has(a)||(Xd(t,l,2,!1),e.add(a))}function Fi(l,t,e){var a=0;t&&(a|=4),Xd(e,l,a,t)}var Xn="_reactListening"+Math.random().toString(36).slice(2);function Ii(l){if(!l[Xn]){l[Xn]=!0,Rf.forEach(function(e){e!=="selectionchange"&&(hv.has(e)||Fi(e,!1,l),Fi(e,!0,l))});var t=l.nodeType===9?l:l.ownerDocument;t===null||t[Xn]||(t[Xn]=!0,Fi("selectionchange",!1,t))}}function Xd(l,t,e,a){switch(h0(t)){case 2:var u=Vv;break;case 8:u=Kv;break;default:u=yf}e=u.bind(null,t,e,l),u=void 0,!Sc||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(u=!0),a?u!==void 0?l.addEventListener(t,e,{capture:!0,passive:u}):l.addEventListener(t,e,!0):u!==void 0?l.addEventListener(t,e,{passive:u}):l.addEventListener(t,e,!1)}function Pi(l,t,e,a,u){var n=a;if((t&1)===0&&(t&2)===0&&a!==null)l:for(;;){if(a===null)return;var c=a.tag;if(c===3||c===4){var i=a.stateNode.containerInfo;if(i===u)break;if(c===4)for(c=a.return;c!==null;){var f=c.tag;if((f===3||f===4)&&c.stateNode.containerInfo===u)return;c=c.return}for(;i!==null;){if(c=la(i),c===null)return;if(f=c.tag,f===5||f===6||f===26||f===27){a=n=c;continue l}i=i.parentNode}}a=a.return}Kf(function(){var v=n,S=hc(e),p=[];l:{var y=bs.get(l);if(y!==void 0){var h=Fu,M=l;switch(l){case"keypress":if($u(e)===0)break l;case"keydown":case"keyup":h=sm;break;case"focusin":M="focus",h=zc;break;case"focusout":M="blur",h=zc;break;case"beforeblur":case"afterblur":h=zc;break;case"click":if(e.button===2)break l;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":h=Wf;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":h=F0;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":h=mm;break;case rs:case hs:case gs:h=lm;break;case Ss:h=ym;break;case"scroll":case"scrollend":h=$0;break;case"wheel":h=hm;break;case"copy":case"cut":case"paste":h=em;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":h=kf;break;case"toggle":case"beforetoggle":h=Sm}var q=(t&4)!==0,yl=!q&&(l==="scroll"||l==="scrollend"),d=q?y!==null?y+"Capture":null:y;q=[];for(var s=v,m;s!==null;){var b=s;if(m=b.stateNode,b=b.tag,b!==5&&b!==26&&b!==27||m===null||d===null||(b=wa(s,d),b!=null&&q.push(_u(s,b,m))),yl)break;s=s.return}0<q.length&&(y=new h(y,M,null,e,S),p.push({event:y,listeners:q}))}}if((t&7)===0){l:{if(y=l==="mouseover"||l==="pointerover",h=l==="mouseout"||l==="pointerout",y&&e!==rc&&(M=e.relatedTarget||e.fromElement)&&(la(M)||M[Pe]))break l;if((h||y)&&(y=S.window===S?S:(y=S.ownerDocument)?y.defaultView||y.parentWindow:window,h?(M=e.relatedTarget||e.toElement,h=v,M=M?la(M):null,M!==null&&(yl=k(M),q=M.tag,M!==yl||q!==5&&q!==27&&q!==6)&&(M=null)):(h=null,M=v),h!==M)){if(q=Wf,b="onMouseLeave",d="onMouseEnter",s="mouse",(l==="pointerout"||l==="pointerover")&&(q=kf,b="onPointerLeave",d="onPointerEnter",s="pointer"),yl=h==null?y:Ja(h),m=M==null?y:Ja(M),y=new q(b,s+"leave",h,e,S),y.target=yl,y.relatedTarget=m,b=null,la(S)===v&&(q=new q(d,s+"enter",M,e,S),q.target=m,q.relatedTarget=yl,b=q),yl=b,h&&M)t:{for(q=gv,d=h,s=M,m=0,b=d;b;b=q(b))m++;b=0;for(var j=s;j;j=q(j))b++;for(;0<m-b;)d=q(d),m--;for(;0<b-m;)s=q(s),b--;for(;m--;){if(d===s||s!==null&&d===s.alternate){q=d;break t}d=q(d),s=q(s)}q=null}else q=null;h!==null&&Zd(p,y,h,q,!1),M!==null&&yl!==null&&Zd(p,yl,M,q,!0)}}l:{if(y=v?Ja(v):window,h=y.nodeName&&y.nodeName.toLowerCase(),h==="select"||h==="input"&&y.type==="file")var el=us;else if(es(y))if(ns)el=Mm;else{el=_m;var N=xm}else h=y.nodeName,!h||h.toLowerCase()!=="input"||y.type!=="checkbox"&&y.type!=="radio"?v&&yc(v.elementType)&&(el=us):el=Om;if(el&&(el=el(l,v))){as(p,el,e,S);break l}N&&N(l,y,v),l==="focusout"&&v&&y.type==="number"&&v.memoizedProps.value!=null&&vc(y,"number",y.value)}switch(N=v?Ja(v):window,l){case"focusin":(es(N)||N.contentEditable==="true")&&(sa=N,Mc=v,tu=null);break;case"focusout":tu=Mc=sa=null;break;case"mousedown":Dc=!0;break;case"contextmenu":case"mouseup":case"dragend":Dc=!1,vs(p,e,S);break;case"selectionchange":if(Nm)break;case"keydown":case"keyup":vs(p,e,S)}var Z;if(Ac)l:{switch(l){case"compositionstart":var $="onCompositionStart";break l;case"compositionend":$="onCompositionEnd";break l;case"compositionupdate":$="onCompositionUpdate";break l}$=void 0}else fa?ls(l,e)&&($="onCompositionEnd"):l==="keydown"&&e.keyCode===229&&($="onCompositionStart");$&&(Ff&&e.locale!=="ko"&&(fa||$!=="onCompositionStart"?$==="onCompositionEnd"&&fa&&(Z=Jf()):(fe=S,bc="value"in fe?fe.value:fe.textContent,fa=!0)),N=Zn(v,$),0<N.length&&($=new $f($,l,null,e,S),p.push({event:$,listeners:N}),Z?$.data=Z:(Z=ts(e),Z!==null&&($.data=Z)))),(Z=pm?Em(l,e):zm(l,e))&&($=Zn(v,"onBeforeInput"),0<$.length&&(N=new $f("onBeforeInput","beforeinput",null,e,S),p.push({event:N,listeners:$}),N.data=Z)),vv(p,l,v,e,S)}Qd(p,t)})}function _u(l,t,e){return{instance:l,listener:t,currentTarget:e}}function Zn(l,t){for(var e=t+"Capture",a=[];l!==null;){var u=l,n=u.stateNode;if(u=u.tag,u!==5&&u!==26&&u!==27||n===null||(u=wa(l,e),u!=null&&a.unshift(_u(l,u,n)),u=wa(l,t),u!=null&&a.push(_u(l,u,n))),l.tag===3)return a;l=l.return}return[]}function gv(l){if(l===null)return null;do l=l.return;while(l&&l.tag!==5&&l.tag!==27);return l||null}function Zd(l,t,e,a,u){for(var n=t._reactName,c=[];e!==null&&e!==a;){var i=e,f=i.alternate,v=i.stateNode;if(i=i.tag,f!==null&&f===a)break;i!==5&&i!==26&&i!==27||v===null||(f=v,u?(v=wa(e,n),v!=null&&c.unshift(_u(e,v,f))):u||(v=wa(e,n),v!=null&&c.push(_u(e,v,f)))),e=e.return}c.length!==0&&l.push({event:t,listeners:c})}var Sv=/\r\n?/g,bv=/\u0000|\uFFFD/g;function Ld(l){return(typeof l=="string"?l:""+l).replace(Sv,`
-`).replace(bv,"")}function Vd(l,t){return t=Ld(t),Ld(l)===t}function vl(l,t,e,a,u,n){switch(e){case"children":typeof a=="string"?t==="body"||t==="textarea"&&a===""||na(l,a):(typeof a=="number"||typeof a=="bigint")&&t!=="body"&&na(l,""+a);break;case"className":Ku(l,"class",a);break;case"tabIndex":Ku(l,"tabindex",a);break;case"dir":case"role":case"viewBox":case"width":case"height":Ku(l,e,a);break;case"style":Lf(l,a,n);break;case"data":if(t!=="object"){Ku(l,"data",a);break}case"src":case"href":if(a===""&&(t!=="a"||e!=="href")){l.removeAttribute(e);break}if(a==null||typeof a=="function"||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(e);break}a=wu(""+a),l.setAttribute(e,a);break;case"action":case"formAction":if(typeof a=="function"){l.setAttribute(e,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(e==="formAction"?(t!=="input"&&vl(l,t,"name",u.name,u,null),vl(l,t,"formEncType",u.formEncType,u,null),vl(l,t,"formMethod",u.formMethod,u,null),vl(l,t,"formTarget",u.formTarget,u,null)):(vl(l,t,"encType",u.encType,u,null),vl(l,t,"method",u.method,u,null),vl(l,t,"target",u.target,u,null)));if(a==null||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(e);break}a=wu(""+a),l.setAttribute(e,a);break;case"onClick":a!=null&&(l.onclick=Lt);break;case"onScroll":a!=null&&w("scroll",l);break;case"onScrollEnd":a!=null&&w("scrollend",l);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(r(61));if(e=a.__html,e!=null){if(u.children!=null)throw Error(r(60));l.innerHTML=e}}break;case"multiple":l.multiple=a&&typeof a!="function"&&typeof a!="symbol";break;case"muted":l.muted=a&&typeof a!="function"&&typeof a!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(a==null||typeof a=="function"||typeof a=="boolean"||typeof a=="symbol"){l.removeAttribute("xlink:href");break}e=wu(""+a),l.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",e);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(e,""+a):l.removeAttribute(e);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":a&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(e,""):l.removeAttribute(e);break;case"capture":case"download":a===!0?l.setAttribute(e,""):a!==!1&&a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(e,a):l.removeAttribute(e);break;case"cols":case"rows":case"size":case"span":a!=null&&typeof a!="function"&&typeof a!="symbol"&&!isNaN(a)&&1<=a?l.setAttribute(e,a):l.removeAttribute(e);break;case"rowSpan":case"start":a==null||typeof a=="function"||typeof a=="symbol"||isNaN(a)?l.removeAttribute(e):l.setAttribute(e,a);break;case"popover":w("beforetoggle",l),w("toggle",l),Vu(l,"popover",a);break;case"xlinkActuate":Zt(l,"http://www.w3.org/1999/xlink","xlink:actuate",a);break;case"xlinkArcrole":Zt(l,"http://www.w3.org/1999/xlink","xlink:arcrole",a);break;case"xlinkRole":Zt(l,"http://www.w3.org/1999/xlink","xlink:role",a);break;case"xlinkShow":Zt(l,"http://www.w3.org/1999/xlink","xlink:show",a);break;case"xlinkTitle":Zt(l,"http://www.w3.org/1999/xlink","xlink:title",a);break;case"xlinkType":Zt(l,"http://www.w3.org/1999/xlink","xlink:type",a);break;case"xmlBase":Zt(l,"http://www.w3.org/XML/1998/namespace","xml:base",a);break;case"xmlLang":Zt(l,"http://www.w3.org/XML/1998/namespace","xml:lang",a);break;case"xmlSpace":Zt(l,"http://www.w3.org/XML/1998/namespace","xml:space",a);break;case"is":Vu(l,"is",a);break;case"innerText":case"textContent":break;default:(!(2<e.length)||e[0]!=="o"&&e[0]!=="O"||e[1]!=="n"&&e[1]!=="N")&&(e=w0.get(e)||e,Vu(l,e,a))}}function lf(l,t,e,a,u,n){switch(e){case"style":Lf(l,a,n);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(r(61));if(e=a.__html,e!=null){if(u.children!=null)throw Error(r(60));l.innerHTML=e}}break;case"children":typeof a=="string"?na(l,a):(typeof a=="number"||typeof a=="bigint")&&na(l,""+a);break;case"onScroll":a!=null&&w("scroll",l);break;case"onScrollEnd":a!=null&&w("scrollend",l);break;case"onClick":a!=null&&(l.onclick=Lt);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!jf.hasOwnProperty(e))l:{if(e[0]==="o"&&e[1]==="n"&&(u=e.endsWith("Capture"),t=e.slice(2,u?e.length-7:void 0),n=l[at]||null,n=n!=null?n[e]:null,typeof n=="function"&&l.removeEventListener(t,n,u),typeof a=="function")){typeof n!="function"&&n!==null&&(e in l?l[e]=null:l.hasAttribute(e)&&l.removeAttribute(e)),l.addEventListener(t,a,u);break l}e in l?l[e]=a:a===!0?l.setAttribute(e,""):Vu(l,e,a)}}}function Kl(l,t,e){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":w("error",l),w("load",l);var a=!1,u=!1,n;for(n in e)if(e.hasOwnProperty(n)){var c=e[n];if(c!=null)switch(n){case"src":a=!0;break;case"srcSet":u=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(r(137,t));default:vl(l,t,n,c,e,null)}}u&&vl(l,t,"srcSet",e.srcSet,e,null),a&&vl(l,t,"src",e.src,e,null);return;case"input":w("invalid",l);var i=n=c=u=null,f=null,v=null;for(a in e)if(e.hasOwnProperty(a)){var S=e[a];if(S!=null)switch(a){case"name":u=S;break;case"type":c=S;break;case"checked":f=S;break;case"defaultChecked":v=S;break;case"value":n=S;break;case"defaultValue":i=S;break;case"children":case"dangerouslySetInnerHTML":if(S!=null)throw Error(r(137,t));break;default:vl(l,t,a,S,e,null)}}Gf(l,n,i,f,v,c,u,!1);return;case"select":w("invalid",l),a=c=n=null;for(u in e)if(e.hasOwnProperty(u)&&(i=e[u],i!=null))switch(u){case"value":n=i;break;case"defaultValue":c=i;break;case"multiple":a=i;default:vl(l,t,u,i,e,null)}t=n,e=c,l.multiple=!!a,t!=null?ua(l,!!a,t,!1):e!=null&&ua(l,!!a,e,!0);return;case"textarea":w("invalid",l),n=u=a=null;for(c in e)if(e.hasOwnProperty(c)&&(i=e[c],i!=null))switch(c){case"value":a=i;break;case"defaultValue":u=i;break;case"children":n=i;break;case"dangerouslySetInnerHTML":if(i!=null)throw Error(r(91));break;default:vl(l,t,c,i,e,null)}Xf(l,a,u,n);return;case"option":for(f in e)if(e.hasOwnProperty(f)&&(a=e[f],a!=null))switch(f){case"selected":l.selected=a&&typeof a!="function"&&typeof a!="symbol";break;default:vl(l,t,f,a,e,null)}return;case"dialog":w("beforetoggle",l),w("toggle",l),w("cancel",l),w("close",l);break;case"iframe":case"object":w("load",l);break;case"video":case"audio":for(a=0;a<xu.length;a++)w(xu[a],l);break;case"image":w("error",l),w("load",l);break;case"details":w("toggle",l);break;case"embed":case"source":case"link":w("error",l),w("load",l);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(v in e)if(e.hasOwnProperty(v)&&(a=e[v],a!=null))switch(v){case"children":case"dangerouslySetInnerHTML":throw Error(r(137,t));default:vl(l,t,v,a,e,null)}return;default:if(yc(t)){for(S in e)e.hasOwnProperty(S)&&(a=e[S],a!==void 0&&lf(l,t,S,a,e,void 0));return}}for(i in e)e.hasOwnProperty(i)&&(a=e[i],a!=null&&vl(l,t,i,a,e,null))}function pv(l,t,e,a){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var u=null,n=null,c=null,i=null,f=null,v=null,S=null;for(h in e){var p=e[h];if(e.hasOwnProperty(h)&&p!=null)switch(h){case"checked":break;case"value":break;case"defaultValue":f=p;default:a.hasOwnProperty(h)||vl(l,t,h,null,a,p)}}for(var y in a){var h=a[y];if(p=e[y],a.hasOwnProperty(y)&&(h!=null||p!=null))switch(y){case"type":n=h;break;case"name":u=h;break;case"checked":v=h;break;case"defaultChecked":S=h;break;case"value":c=h;break;case"defaultValue":i=h;break;case"children":case"dangerouslySetInnerHTML":if(h!=null)throw Error(r(137,t));break;default:h!==p&&vl(l,t,y,h,a,p)}}mc(l,c,i,f,v,S,n,u);return;case"select":h=c=i=y=null;for(n in e)if(f=e[n],e.hasOwnProperty(n)&&f!=null)switch(n){case"value":break;case"multiple":h=f;default:a.hasOwnProperty(n)||vl(l,t,n,null,a,f)}for(u in a)if(n=a[u],f=e[u],a.hasOwnProperty(u)&&(n!=null||f!=null))switch(u){case"value":y=n;break;case"defaultValue":i=n;break;case"multiple":c=n;default:n!==f&&vl(l,t,u,n,a,f)}t=i,e=c,a=h,y!=null?ua(l,!!e,y,!1):!!a!=!!e&&(t!=null?ua(l,!!e,t,!0):ua(l,!!e,e?[]:"",!1));return;case"textarea":h=y=null;for(i in e)if(u=e[i],e.hasOwnProperty(i)&&u!=null&&!a.hasOwnProperty(i))switch(i){case"value":break;case"children":break;default:vl(l,t,i,null,a,u)}for(c in a)if(u=a[c],n=e[c],a.hasOwnProperty(c)&&(u!=null||n!=null))switch(c){case"value":y=u;break;case"defaultValue":h=u;break;case"children":break;case"dangerouslySetInnerHTML":if(u!=null)throw Error(r(91));break;default:u!==n&&vl(l,t,c,u,a,n)}Qf(l,y,h);return;case"option":for(var M in e)if(y=e[M],e.hasOwnProperty(M)&&y!=null&&!a.hasOwnProperty(M))switch(M){case"selected":l.selected=!1;break;default:vl(l,t,M,null,a,y)}for(f in a)if(y=a[f],h=e[f],a.hasOwnProperty(f)&&y!==h&&(y!=null||h!=null))switch(f){case"selected":l.selected=y&&typeof y!="function"&&typeof y!="symbol";break;default:vl(l,t,f,y,a,h)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var q in e)y=e[q],e.hasOwnProperty(q)&&y!=null&&!a.hasOwnProperty(q)&&vl(l,t,q,null,a,y);for(v in a)if(y=a[v],h=e[v],a.hasOwnProperty(v)&&y!==h&&(y!=null||h!=null))switch(v){case"children":case"dangerouslySetInnerHTML":if(y!=null)throw Error(r(137,t));break;default:vl(l,t,v,y,a,h)}return;default:if(yc(t)){for(var yl in e)y=e[yl],e.hasOwnProperty(yl)&&y!==void 0&&!a.hasOwnProperty(yl)&&lf(l,t,yl,void 0,a,y);for(S in a)y=a[S],h=e[S],!a.hasOwnProperty(S)||y===h||y===void 0&&h===void 0||lf(l,t,S,y,a,h);return}}for(var d in e)y=e[d],e.hasOwnProperty(d)&&y!=null&&!a.hasOwnProperty(d)&&vl(l,t,d,null,a,y);for(p in a)y=a[p],h=e[p],!a.hasOwnProperty(p)||y===h||y==null&&h==null||vl(l,t,p,y,a,h)}function Kd(l){switch(l){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function Ev(){if(typeof performance.getEntriesByType=="function"){for(var l=0,t=0,e=performance.getEntriesByType("resource"),a=0;a<e.length;a++){var u=e[a],n=u.transferSize,c=u.initiatorType,i=u.duration;if(n&&i&&Kd(c)){for(c=0,i=u.responseEnd,a+=1;a<e.length;a++){var f=e[a],v=f.startTime;if(v>i)break;var S=f.transferSize,p=f.initiatorType;S&&Kd(p)&&(f=f.responseEnd,c+=S*(f<i?1:(i-v)/(f-v)))}if(--a,t+=8*(n+c)/(u.duration/1e3),l++,10<l)break}}if(0<l)return t/l/1e6}return navigator.connection&&(l=navigator.connection.downlink,typeof l=="number")?l:5}var tf=null,ef=null;function Ln(l){return l.nodeType===9?l:l.ownerDocument}function Jd(l){switch(l){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function wd(l,t){if(l===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return l===1&&t==="foreignObject"?0:l}function af(l,t){return l==="textarea"||l==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var uf=null;function zv(){var l=window.event;return l&&l.type==="popstate"?l===uf?!1:(uf=l,!0):(uf=null,!1)}var Wd=typeof setTimeout=="function"?setTimeout:void 0,Tv=typeof clearTimeout=="function"?clearTimeout:void 0,$d=typeof Promise=="function"?Promise:void 0,Av=typeof queueMicrotask=="function"?queueMicrotask:typeof $d<"u"?function(l){return $d.resolve(null).then(l).catch(xv)}:Wd;function xv(l){setTimeout(function(){throw l})}function xe(l){return l==="head"}function kd(l,t){var e=t,a=0;do{var u=e.nextSibling;if(l.removeChild(e),u&&u.nodeType===8)if(e=u.data,e==="/$"||e==="/&"){if(a===0){l.removeChild(u),qa(t);return}a--}else if(e==="$"||e==="$?"||e==="$~"||e==="$!"||e==="&")a++;else if(e==="html")Ou(l.ownerDocument.documentElement);else if(e==="head"){e=l.ownerDocument.head,Ou(e);for(var n=e.firstChild;n;){var c=n.nextSibling,i=n.nodeName;n[Ka]||i==="SCRIPT"||i==="STYLE"||i==="LINK"&&n.rel.toLowerCase()==="stylesheet"||e.removeChild(n),n=c}}else e==="body"&&Ou(l.ownerDocument.body);e=u}while(e);qa(t)}function Fd(l,t){var e=l;l=0;do{var a=e.nextSibling;if(e.nodeType===1?t?(e._stashedDisplay=e.style.display,e.style.display="none"):(e.style.display=e._stashedDisplay||"",e.getAttribute("style")===""&&e.removeAttribute("style")):e.nodeType===3&&(t?(e._stashedText=e.nodeValue,e.nodeValue=""):e.nodeValue=e._stashedText||""),a&&a.nodeType===8)if(e=a.data,e==="/$"){if(l===0)break;l--}else e!=="$"&&e!=="$?"&&e!=="$~"&&e!=="$!"||l++;e=a}while(e)}function nf(l){var t=l.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var e=t;switch(t=t.nextSibling,e.nodeName){case"HTML":case"HEAD":case"BODY":nf(e),oc(e);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(e.rel.toLowerCase()==="stylesheet")continue}l.removeChild(e)}}function _v(l,t,e,a){for(;l.nodeType===1;){var u=e;if(l.nodeName.toLowerCase()!==t.toLowerCase()){if(!a&&(l.nodeName!=="INPUT"||l.type!=="hidden"))break}else if(a){if(!l[Ka])switch(t){case"meta":if(!l.hasAttribute("itemprop"))break;return l;case"link":if(n=l.getAttribute("rel"),n==="stylesheet"&&l.hasAttribute("data-precedence"))break;if(n!==u.rel||l.getAttribute("href")!==(u.href==null||u.href===""?null:u.href)||l.getAttribute("crossorigin")!==(u.crossOrigin==null?null:u.crossOrigin)||l.getAttribute("title")!==(u.title==null?null:u.title))break;return l;case"style":if(l.hasAttribute("data-precedence"))break;return l;case"script":if(n=l.getAttribute("src"),(n!==(u.src==null?null:u.src)||l.getAttribute("type")!==(u.type==null?null:u.type)||l.getAttribute("crossorigin")!==(u.crossOrigin==null?null:u.crossOrigin))&&n&&l.hasAttribute("async")&&!l.hasAttribute("itemprop"))break;return l;default:return l}}else if(t==="input"&&l.type==="hidden"){var n=u.name==null?null:""+u.name;if(u.type==="hidden"&&l.getAttribute("name")===n)return l}else return l;if(l=Dt(l.nextSibling),l===null)break}return null}function Ov(l,t,e){if(t==="")return null;for(;l.nodeType!==3;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!e||(l=Dt(l.nextSibling),l===null))return null;return l}function Id(l,t){for(;l.nodeType!==8;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!t||(l=Dt(l.nextSibling),l===null))return null;return l}function cf(l){return l.data==="$?"||l.data==="$~"}function ff(l){return l.data==="$!"||l.data==="$?"&&l.ownerDocument.readyState!=="loading"}function Mv(l,t){var e=l.ownerDocument;if(l.data==="$~")l._reactRetry=t;else if(l.data!=="$?"||e.readyState!=="loading")t();else{var a=function(){t(),e.removeEventListener("DOMContentLoaded",a)};e.addEventListener("DOMContentLoaded",a),l._reactRetry=a}}function Dt(l){for(;l!=null;l=l.nextSibling){var t=l.nodeType;if(t===1||t===3)break;if(t===8){if(t=l.data,t==="$"||t==="$!"||t==="$?"||t==="$~"||t==="&"||t==="F!"||t==="F")break;if(t==="/$"||t==="/&")return null}}return l}var sf=null;function Pd(l){l=l.nextSibling;for(var t=0;l;){if(l.nodeType===8){var e=l.data;if(e==="/$"||e==="/&"){if(t===0)return Dt(l.nextSibling);t--}else e!=="$"&&e!=="$!"&&e!=="$?"&&e!=="$~"&&e!=="&"||t++}l=l.nextSibling}return null}function l0(l){l=l.previousSibling;for(var t=0;l;){if(l.nodeType===8){var e=l.data;if(e==="$"||e==="$!"||e==="$?"||e==="$~"||e==="&"){if(t===0)return l;t--}else e!=="/$"&&e!=="/&"||t++}l=l.previousSibling}return null}function t0(l,t,e){switch(t=Ln(e),l){case"html":if(l=t.documentElement,!l)throw Error(r(452));return l;case"head":if(l=t.head,!l)throw Error(r(453));return l;case"body":if(l=t.body,!l)throw Error(r(454));return l;default:throw Error(r(451))}}function Ou(l){for(var t=l.attributes;t.length;)l.removeAttributeNode(t[0]);oc(l)}var Nt=new Map,e0=new Set;function Vn(l){return typeof l.getRootNode=="function"?l.getRootNode():l.nodeType===9?l:l.ownerDocument}var ne=_.d;_.d={f:Dv,r:Nv,D:Uv,C:Cv,L:Rv,m:jv,X:qv,S:Hv,M:Bv};function Dv(){var l=ne.f(),t=Hn();return l||t}function Nv(l){var t=ta(l);t!==null&&t.tag===5&&t.type==="form"?bo(t):ne.r(l)}var Ra=typeof document>"u"?null:document;function a0(l,t,e){var a=Ra;if(a&&typeof t=="string"&&t){var u=zt(t);u='link[rel="'+l+'"][href="'+u+'"]',typeof e=="string"&&(u+='[crossorigin="'+e+'"]'),e0.has(u)||(e0.add(u),l={rel:l,crossOrigin:e,href:t},a.querySelector(u)===null&&(t=a.createElement("link"),Kl(t,"link",l),Bl(t),a.head.appendChild(t)))}}function Uv(l){ne.D(l),a0("dns-prefetch",l,null)}function Cv(l,t){ne.C(l,t),a0("preconnect",l,t)}function Rv(l,t,e){ne.L(l,t,e);var a=Ra;if(a&&l&&t){var u='link[rel="preload"][as="'+zt(t)+'"]';t==="image"&&e&&e.imageSrcSet?(u+='[imagesrcset="'+zt(e.imageSrcSet)+'"]',typeof e.imageSizes=="string"&&(u+='[imagesizes="'+zt(e.imageSizes)+'"]')):u+='[href="'+zt(l)+'"]';var n=u;switch(t){case"style":n=ja(l);break;case"script":n=Ha(l)}Nt.has(n)||(l=R({rel:"preload",href:t==="image"&&e&&e.imageSrcSet?void 0:l,as:t},e),Nt.set(n,l),a.querySelector(u)!==null||t==="style"&&a.querySelector(Mu(n))||t==="script"&&a.querySelector(Du(n))||(t=a.createElement("link"),Kl(t,"link",l),Bl(t),a.head.appendChild(t)))}}function jv(l,t){ne.m(l,t);var e=Ra;if(e&&l){var a=t&&typeof t.as=="string"?t.as:"script",u='link[rel="modulepreload"][as="'+zt(a)+'"][href="'+zt(l)+'"]',n=u;switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=Ha(l)}if(!Nt.has(n)&&(l=R({rel:"modulepreload",href:l},t),Nt.set(n,l),e.querySelector(u)===null)){switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(e.querySelector(Du(n)))return}a=e.createElement("link"),Kl(a,"link",l),Bl(a),e.head.appendChild(a)}}}function Hv(l,t,e){ne.S(l,t,e);var a=Ra;if(a&&l){var u=ea(a).hoistableStyles,n=ja(l);t=t||"default";var c=u.get(n);if(!c){var i={loading:0,preload:null};if(c=a.querySelector(Mu(n)))i.loading=5;else{l=R({rel:"stylesheet",href:l,"data-precedence":t},e),(e=Nt.get(n))&&of(l,e);var f=c=a.createElement("link");Bl(f),Kl(f,"link",l),f._p=new Promise(function(v,S){f.onload=v,f.onerror=S}),f.addEventListener("load",function(){i.loading|=1}),f.addEventListener("error",function(){i.loading|=2}),i.loading|=4,Kn(c,t,a)}c={type:"stylesheet",instance:c,count:1,state:i},u.set(n,c)}}}function qv(l,t){ne.X(l,t);var e=Ra;if(e&&l){var a=ea(e).hoistableScripts,u=Ha(l),n=a.get(u);n||(n=e.querySelector(Du(u)),n||(l=R({src:l,async:!0},t),(t=Nt.get(u))&&df(l,t),n=e.createElement("script"),Bl(n),Kl(n,"link",l),e.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(u,n))}}function Bv(l,t){ne.M(l,t);var e=Ra;if(e&&l){var a=ea(e).hoistableScripts,u=Ha(l),n=a.get(u);n||(n=e.querySelector(Du(u)),n||(l=R({src:l,async:!0,type:"module"},t),(t=Nt.get(u))&&df(l,t),n=e.createElement("script"),Bl(n),Kl(n,"link",l),e.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(u,n))}}function u0(l,t,e,a){var u=(u=L.current)?Vn(u):null;if(!u)throw Error(r(446));switch(l){case"meta":case"title":return null;case"style":return typeof e.precedence=="string"&&typeof e.href=="string"?(t=ja(e.href),e=ea(u).hoistableStyles,a=e.get(t),a||(a={type:"style",instance:null,count:0,state:null},e.set(t,a)),a):{type:"void",instance:null,count:0,state:null};case"link":if(e.rel==="stylesheet"&&typeof e.href=="string"&&typeof e.precedence=="string"){l=ja(e.href);var n=ea(u).hoistableStyles,c=n.get(l);if(c||(u=u.ownerDocument||u,c={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(l,c),(n=u.querySelector(Mu(l)))&&!n._p&&(c.instance=n,c.state.loading=5),Nt.has(l)||(e={rel:"preload",as:"style",href:e.href,crossOrigin:e.crossOrigin,integrity:e.integrity,media:e.media,hrefLang:e.hrefLang,referrerPolicy:e.referrerPolicy},Nt.set(l,e),n||Yv(u,l,e,c.state))),t&&a===null)throw Error(r(528,""));return c}if(t&&a!==null)throw Error(r(529,""));return null;case"script":return t=e.async,e=e.src,typeof e=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=Ha(e),e=ea(u).hoistableScripts,a=e.get(t),a||(a={type:"script",instance:null,count:0,state:null},e.set(t,a)),a):{type:"void",instance:null,count:0,state:null};default:throw Error(r(444,l))}}function ja(l){return'href="'+zt(l)+'"'}function Mu(l){return'link[rel="stylesheet"]['+l+"]"}function n0(l){return R({},l,{"data-precedence":l.precedence,precedence:null})}function Yv(l,t,e,a){l.querySelector('link[rel="preload"][as="style"]['+t+"]")?a.loading=1:(t=l.createElement("link"),a.preload=t,t.addEventListener("load",function(){return a.loading|=1}),t.addEventListener("error",function(){return a.loading|=2}),Kl(t,"link",e),Bl(t),l.head.appendChild(t))}function Ha(l){return'[src="'+zt(l)+'"]'}function Du(l){return"script[async]"+l}function c0(l,t,e){if(t.count++,t.instance===null)switch(t.type){case"style":var a=l.querySelector('style[data-href~="'+zt(e.href)+'"]');if(a)return t.instance=a,Bl(a),a;var u=R({},e,{"data-href":e.href,"data-precedence":e.precedence,href:null,precedence:null});return a=(l.ownerDocument||l).createElement("style"),Bl(a),Kl(a,"style",u),Kn(a,e.precedence,l),t.instance=a;case"stylesheet":u=ja(e.href);var n=l.querySelector(Mu(u));if(n)return t.state.loading|=4,t.instance=n,Bl(n),n;a=n0(e),(u=Nt.get(u))&&of(a,u),n=(l.ownerDocument||l).createElement("link"),Bl(n);var c=n;return c._p=new Promise(function(i,f){c.onload=i,c.onerror=f}),Kl(n,"link",a),t.state.loading|=4,Kn(n,e.precedence,l),t.instance=n;case"script":return n=Ha(e.src),(u=l.querySelector(Du(n)))?(t.instance=u,Bl(u),u):(a=e,(u=Nt.get(n))&&(a=R({},e),df(a,u)),l=l.ownerDocument||l,u=l.createElement("script"),Bl(u),Kl(u,"link",a),l.head.appendChild(u),t.instance=u);case"void":return null;default:throw Error(r(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(a=t.instance,t.state.loading|=4,Kn(a,e.precedence,l));return t.instance}function Kn(l,t,e){for(var a=e.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),u=a.length?a[a.length-1]:null,n=u,c=0;c<a.length;c++){var i=a[c];if(i.dataset.precedence===t)n=i;else if(n!==u)break}n?n.parentNode.insertBefore(l,n.nextSibling):(t=e.nodeType===9?e.head:e,t.insertBefore(l,t.firstChild))}function of(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.title==null&&(l.title=t.title)}function df(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.integrity==null&&(l.integrity=t.integrity)}var Jn=null;function i0(l,t,e){if(Jn===null){var a=new Map,u=Jn=new Map;u.set(e,a)}else u=Jn,a=u.get(e),a||(a=new Map,u.set(e,a));if(a.has(l))return a;for(a.set(l,null),e=e.getElementsByTagName(l),u=0;u<e.length;u++){var n=e[u];if(!(n[Ka]||n[Xl]||l==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var c=n.getAttribute(t)||"";c=l+c;var i=a.get(c);i?i.push(n):a.set(c,[n])}}return a}function f0(l,t,e){l=l.ownerDocument||l,l.head.insertBefore(e,t==="title"?l.querySelector("head > title"):null)}function Gv(l,t,e){if(e===1||t.itemProp!=null)return!1;switch(l){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;switch(t.rel){case"stylesheet":return l=t.disabled,typeof t.precedence=="string"&&l==null;default:return!0}case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function s0(l){return!(l.type==="stylesheet"&&(l.state.loading&3)===0)}function Qv(l,t,e,a){if(e.type==="stylesheet"&&(typeof a.media!="string"||matchMedia(a.media).matches!==!1)&&(e.state.loading&4)===0){if(e.instance===null){var u=ja(a.href),n=t.querySelector(Mu(u));if(n){t=n._p,t!==null&&typeof t=="object"&&typeof t.then=="function"&&(l.count++,l=wn.bind(l),t.then(l,l)),e.state.loading|=4,e.instance=n,Bl(n);return}n=t.ownerDocument||t,a=n0(a),(u=Nt.get(u))&&of(a,u),n=n.createElement("link"),Bl(n);var c=n;c._p=new Promise(function(i,f){c.onload=i,c.onerror=f}),Kl(n,"link",a),e.instance=n}l.stylesheets===null&&(l.stylesheets=new Map),l.stylesheets.set(e,t),(t=e.state.preload)&&(e.state.loading&3)===0&&(l.count++,e=wn.bind(l),t.addEventListener("load",e),t.addEventListener("error",e))}}var mf=0;function Xv(l,t){return l.stylesheets&&l.count===0&&$n(l,l.stylesheets),0<l.count||0<l.imgCount?function(e){var a=setTimeout(function(){if(l.stylesheets&&$n(l,l.stylesheets),l.unsuspend){var n=l.unsuspend;l.unsuspend=null,n()}},6e4+t);0<l.imgBytes&&mf===0&&(mf=62500*Ev());var u=setTimeout(function(){if(l.waitingForImages=!1,l.count===0&&(l.stylesheets&&$n(l,l.stylesheets),l.unsuspend)){var n=l.unsuspend;l.unsuspend=null,n()}},(l.imgBytes>mf?50:800)+t);return l.unsuspend=e,function(){l.unsuspend=null,clearTimeout(a),clearTimeout(u)}}:null}function wn(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)$n(this,this.stylesheets);else if(this.unsuspend){var l=this.unsuspend;this.unsuspend=null,l()}}}var Wn=null;function $n(l,t){l.stylesheets=null,l.unsuspend!==null&&(l.count++,Wn=new Map,t.forEach(Zv,l),Wn=null,wn.call(l))}function Zv(l,t){if(!(t.state.loading&4)){var e=Wn.get(l);if(e)var a=e.get(null);else{e=new Map,Wn.set(l,e);for(var u=l.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<u.length;n++){var c=u[n];(c.nodeName==="LINK"||c.getAttribute("media")!=="not all")&&(e.set(c.dataset.precedence,c),a=c)}a&&e.set(null,a)}u=t.instance,c=u.getAttribute("data-precedence"),n=e.get(c)||a,n===a&&e.set(null,u),e.set(c,u),this.count++,a=wn.bind(this),u.addEventListener("load",a),u.addEventListener("error",a),n?n.parentNode.insertBefore(u,n.nextSibling):(l=l.nodeType===9?l.head:l,l.insertBefore(u,l.firstChild)),t.state.loading|=4}}var Nu={$$typeof:jl,Provider:null,Consumer:null,_currentValue:H,_currentValue2:H,_threadCount:0};function Lv(l,t,e,a,u,n,c,i,f){this.tag=1,this.containerInfo=l,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=cc(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=cc(0),this.hiddenUpdates=cc(null),this.identifierPrefix=a,this.onUncaughtError=u,this.onCaughtError=n,this.onRecoverableError=c,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=f,this.incompleteTransitions=new Map}function o0(l,t,e,a,u,n,c,i,f,v,S,p){return l=new Lv(l,t,e,c,f,v,S,p,i),t=1,n===!0&&(t|=24),n=mt(3,null,null,t),l.current=n,n.stateNode=l,t=Vc(),t.refCount++,l.pooledCache=t,t.refCount++,n.memoizedState={element:a,isDehydrated:e,cache:t},Wc(n),l}function d0(l){return l?(l=ma,l):ma}function m0(l,t,e,a,u,n){u=d0(u),a.context===null?a.context=u:a.pendingContext=u,a=ye(t),a.payload={element:e},n=n===void 0?null:n,n!==null&&(a.callback=n),e=re(l,a,t),e!==null&&(st(e,l,t),fu(e,l,t))}function v0(l,t){if(l=l.memoizedState,l!==null&&l.dehydrated!==null){var e=l.retryLane;l.retryLane=e!==0&&e<t?e:t}}function vf(l,t){v0(l,t),(l=l.alternate)&&v0(l,t)}function y0(l){if(l.tag===13||l.tag===31){var t=qe(l,67108864);t!==null&&st(t,l,67108864),vf(l,67108864)}}function r0(l){if(l.tag===13||l.tag===31){var t=gt();t=ic(t);var e=qe(l,t);e!==null&&st(e,l,t),vf(l,t)}}var kn=!0;function Vv(l,t,e,a){var u=g.T;g.T=null;var n=_.p;try{_.p=2,yf(l,t,e,a)}finally{_.p=n,g.T=u}}function Kv(l,t,e,a){var u=g.T;g.T=null;var n=_.p;try{_.p=8,yf(l,t,e,a)}finally{_.p=n,g.T=u}}function yf(l,t,e,a){if(kn){var u=rf(a);if(u===null)Pi(l,t,a,Fn,e),g0(l,a);else if(wv(u,l,t,e,a))a.stopPropagation();else if(g0(l,a),t&4&&-1<Jv.indexOf(l)){for(;u!==null;){var n=ta(u);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var c=Ue(n.pendingLanes);if(c!==0){var i=n;for(i.pendingLanes|=2,i.entangledLanes|=2;c;){var f=1<<31-Pl(c);i.entanglements[1]|=f,c&=~f}Yt(n),(ul&6)===0&&(Rn=Il()+500,Au(0))}}break;case 31:case 13:i=qe(n,2),i!==null&&st(i,n,2),Hn(),vf(n,2)}if(n=rf(a),n===null&&Pi(l,t,a,Fn,e),n===u)break;u=n}u!==null&&a.stopPropagation()}else Pi(l,t,a,null,e)}}function rf(l){return l=hc(l),hf(l)}var Fn=null;function hf(l){if(Fn=null,l=la(l),l!==null){var t=k(l);if(t===null)l=null;else{var e=t.tag;if(e===13){if(l=zl(t),l!==null)return l;l=null}else if(e===31){if(l=hl(t),l!==null)return l;l=null}else if(e===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;l=null}else t!==l&&(l=null)}}return Fn=l,null}function h0(l){switch(l){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(nc()){case ke:return 2;case Fe:return 8;case ce:case x:return 32;case U:return 268435456;default:return 32}default:return 32}}var gf=!1,_e=null,Oe=null,Me=null,Uu=new Map,Cu=new Map,De=[],Jv="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function g0(l,t){switch(l){case"focusin":case"focusout":_e=null;break;case"dragenter":case"dragleave":Oe=null;break;case"mouseover":case"mouseout":Me=null;break;case"pointerover":case"pointerout":Uu.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Cu.delete(t.pointerId)}}function Ru(l,t,e,a,u,n){return l===null||l.nativeEvent!==n?(l={blockedOn:t,domEventName:e,eventSystemFlags:a,nativeEvent:n,targetContainers:[u]},t!==null&&(t=ta(t),t!==null&&y0(t)),l):(l.eventSystemFlags|=a,t=l.targetContainers,u!==null&&t.indexOf(u)===-1&&t.push(u),l)}function wv(l,t,e,a,u){switch(t){case"focusin":return _e=Ru(_e,l,t,e,a,u),!0;case"dragenter":return Oe=Ru(Oe,l,t,e,a,u),!0;case"mouseover":return Me=Ru(Me,l,t,e,a,u),!0;case"pointerover":var n=u.pointerId;return Uu.set(n,Ru(Uu.get(n)||null,l,t,e,a,u)),!0;case"gotpointercapture":return n=u.pointerId,Cu.set(n,Ru(Cu.get(n)||null,l,t,e,a,u)),!0}return!1}function S0(l){var t=la(l.target);if(t!==null){var e=k(t);if(e!==null){if(t=e.tag,t===13){if(t=zl(e),t!==null){l.blockedOn=t,Uf(l.priority,function(){r0(e)});return}}else if(t===31){if(t=hl(e),t!==null){l.blockedOn=t,Uf(l.priority,function(){r0(e)});return}}else if(t===3&&e.stateNode.current.memoizedState.isDehydrated){l.blockedOn=e.tag===3?e.stateNode.containerInfo:null;return}}}l.blockedOn=null}function In(l){if(l.blockedOn!==null)return!1;for(var t=l.targetContainers;0<t.length;){var e=rf(l.nativeEvent);if(e===null){e=l.nativeEvent;var a=new e.constructor(e.type,e);rc=a,e.target.dispatchEvent(a),rc=null}else return t=ta(e),t!==null&&y0(t),l.blockedOn=e,!1;t.shift()}return!0}function b0(l,t,e){In(l)&&e.delete(t)}function Wv(){gf=!1,_e!==null&&In(_e)&&(_e=null),Oe!==null&&In(Oe)&&(Oe=null),Me!==null&&In(Me)&&(Me=null),Uu.forEach(b0),Cu.forEach(b0)}function Pn(l,t){l.blockedOn===t&&(l.blockedOn=null,gf||(gf=!0,O.unstable_scheduleCallback(O.unstable_NormalPriority,Wv)))}var lc=null;function p0(l){lc!==l&&(lc=l,O.unstable_scheduleCallback(O.unstable_NormalPriority,function(){lc===l&&(lc=null);for(var t=0;t<l.length;t+=3){var e=l[t],a=l[t+1],u=l[t+2];if(typeof a!="function"){if(hf(a||e)===null)continue;break}var n=ta(e);n!==null&&(l.splice(t,3),t-=3,yi(n,{pending:!0,data:u,method:e.method,action:a},a,u))}}))}function qa(l){function t(f){return Pn(f,l)}_e!==null&&Pn(_e,l),Oe!==null&&Pn(Oe,l),Me!==null&&Pn(Me,l),Uu.forEach(t),Cu.forEach(t);for(var e=0;e<De.length;e++){var a=De[e];a.blockedOn===l&&(a.blockedOn=null)}for(;0<De.length&&(e=De[0],e.blockedOn===null);)S0(e),e.blockedOn===null&&De.shift();if(e=(l.ownerDocument||l).$$reactFormReplay,e!=null)for(a=0;a<e.length;a+=3){var u=e[a],n=e[a+1],c=u[at]||null;if(typeof n=="function")c||p0(e);else if(c){var i=null;if(n&&n.hasAttribute("formAction")){if(u=n,c=n[at]||null)i=c.formAction;else if(hf(u)!==null)continue}else i=c.action;typeof i=="function"?e[a+1]=i:(e.splice(a,3),a-=3),p0(e)}}}function E0(){function l(n){n.canIntercept&&n.info==="react-transition"&&n.intercept({handler:function(){return new Promise(function(c){return u=c})},focusReset:"manual",scroll:"manual"})}function t(){u!==null&&(u(),u=null),a||setTimeout(e,20)}function e(){if(!a&&!navigation.transition){var n=navigation.currentEntry;n&&n.url!=null&&navigation.navigate(n.url,{state:n.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var a=!1,u=null;return navigation.addEventListener("navigate",l),navigation.addEventListener("navigatesuccess",t),navigation.addEventListener("navigateerror",t),setTimeout(e,100),function(){a=!0,navigation.removeEventListener("navigate",l),navigation.removeEventListener("navigatesuccess",t),navigation.removeEventListener("navigateerror",t),u!==null&&(u(),u=null)}}}function Sf(l){this._internalRoot=l}tc.prototype.render=Sf.prototype.render=function(l){var t=this._internalRoot;if(t===null)throw Error(r(409));var e=t.current,a=gt();m0(e,a,l,t,null,null)},tc.prototype.unmount=Sf.prototype.unmount=function(){var l=this._internalRoot;if(l!==null){this._internalRoot=null;var t=l.containerInfo;m0(l.current,2,null,l,null,null),Hn(),t[Pe]=null}};function tc(l){this._internalRoot=l}tc.prototype.unstable_scheduleHydration=function(l){if(l){var t=Nf();l={blockedOn:null,target:l,priority:t};for(var e=0;e<De.length&&t!==0&&t<De[e].priority;e++);De.splice(e,0,l),e===0&&S0(l)}};var z0=ol.version;if(z0!=="19.2.4")throw Error(r(527,z0,"19.2.4"));_.findDOMNode=function(l){var t=l._reactInternals;if(t===void 0)throw typeof l.render=="function"?Error(r(188)):(l=Object.keys(l).join(","),Error(r(268,l)));return l=z(t),l=l!==null?I(l):null,l=l===null?null:l.stateNode,l};var $v={bundleType:0,version:"19.2.4",rendererPackageName:"react-dom",currentDispatcherRef:g,reconcilerVersion:"19.2.4"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var ec=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!ec.isDisabled&&ec.supportsFiber)try{Sl=ec.inject($v),il=ec}catch{}}return Hu.createRoot=function(l,t){if(!Q(l))throw Error(r(299));var e=!1,a="",u=Do,n=No,c=Uo;return t!=null&&(t.unstable_strictMode===!0&&(e=!0),t.identifierPrefix!==void 0&&(a=t.identifierPrefix),t.onUncaughtError!==void 0&&(u=t.onUncaughtError),t.onCaughtError!==void 0&&(n=t.onCaughtError),t.onRecoverableError!==void 0&&(c=t.onRecoverableError)),t=o0(l,1,!1,null,null,e,a,null,u,n,c,E0),l[Pe]=t.current,Ii(l),new Sf(t)},Hu.hydrateRoot=function(l,t,e){if(!Q(l))throw Error(r(299));var a=!1,u="",n=Do,c=No,i=Uo,f=null;return e!=null&&(e.unstable_strictMode===!0&&(a=!0),e.identifierPrefix!==void 0&&(u=e.identifierPrefix),e.onUncaughtError!==void 0&&(n=e.onUncaughtError),e.onCaughtError!==void 0&&(c=e.onCaughtError),e.onRecoverableError!==void 0&&(i=e.onRecoverableError),e.formState!==void 0&&(f=e.formState)),t=o0(l,1,!0,t,e??null,a,u,f,n,c,i,E0),t.context=d0(null),e=t.current,a=gt(),a=ic(a),u=ye(a),u.callback=null,re(e,u,a),e=a,t.current.lanes=e,Va(t,e),Yt(t),l[Pe]=t.current,Ii(l),new tc(t)},Hu.version="19.2.4",Hu}var C0;function ny(){if(C0)return Ef.exports;C0=1;function O(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(O)}catch(ol){console.error(ol)}}return O(),Ef.exports=uy(),Ef.exports}var cy=ny();const R0="disconnected";function iy(O,ol){switch(ol.type){case"CONNECT_REQUESTED":return"connecting";case"CONNECTED":return"connected";case"DISCONNECTED":return"disconnected";case"RECONNECT_REQUESTED":return"reconnecting";case"CONNECTION_ERROR":return"error";default:return O}}function fy(O){switch(O){case"connecting":return"接続中";case"connected":return"接続済み";case"disconnected":return"切断";case"reconnecting":return"再接続中";case"error":return"エラー";default:return"不明"}}function j0(O){return O<=767?"mobile":O<=1023?"tablet":"desktop"}function sy(){return typeof window>"u"?"desktop":j0(window.innerWidth)}function ac(){return`${Date.now()}-${Math.random().toString(36).slice(2)}`}function oy(){const[O,ol]=V.useState(sy),[B,r]=V.useReducer(iy,R0),[Q,k]=V.useState(!1),[zl,hl]=V.useState([]),[C,z]=V.useState(""),[I,R]=V.useState([]),[nl,$l]=V.useState(!1),[Jl,Gl]=V.useState(0),[Ut,kl]=V.useState(0),[St,jl]=V.useState("idle"),[tt,bt]=V.useState(0),[Ql,K]=V.useState([]),[wl,ot]=V.useState([]),[Gt,pt]=V.useState(!0),[Tl,Qt]=V.useState({proactivity:!1,affectiveDialog:!1}),[et,Fl]=V.useState({proactivity:!1,affectiveDialog:!1}),[g,_]=V.useState({proactivity:!1,affectiveDialog:!1}),[H,ll]=V.useState("idle"),[cl,o]=V.useState("proactivity=false&affective_dialog=false"),[E,A]=V.useState(!1),[D,Y]=V.useState(!1),L=V.useRef(R0),tl=V.useRef(null),Al=V.useRef(null),gl=V.useRef(null),dl=V.useCallback((x,U,ql,P="standard")=>{const Sl={id:ac(),timestamp:new Date().toISOString(),summary:U,category:x,kind:P,detail:JSON.stringify(ql)};K(il=>[Sl,...il].slice(0,100))},[]),$e=V.useCallback(x=>{ot(U=>U.includes(x)?U.filter(ql=>ql!==x):[...U,x])},[]);V.useEffect(()=>{const x=()=>{ol(j0(window.innerWidth))};return window.addEventListener("resize",x),()=>window.removeEventListener("resize",x)},[]),V.useEffect(()=>{const x=()=>{nl&&Gl(U=>U+1)};return window.addEventListener("mock-audio-chunk",x),()=>window.removeEventListener("mock-audio-chunk",x)},[nl]),V.useEffect(()=>()=>{const x=gl.current;x&&x.getTracks().forEach(U=>U.stop())},[]),V.useEffect(()=>{if(B!=="connecting"&&B!=="reconnecting")return;const x=window.setTimeout(()=>{r({type:"CONNECTED"})},400);return()=>window.clearTimeout(x)},[B]),V.useEffect(()=>{const x=L.current;x!==B&&(x==="connecting"&&B==="connected"&&(hl(U=>[...U,"接続開始"]),dl("notification","接続済み",{phase:"initial"})),x==="reconnecting"&&B==="connected"&&(hl(U=>[...U,"再接続に成功"]),dl("notification","再接続に成功",{phase:"recover"})),x==="reconnecting"&&B==="connected"&&H==="applying"&&(Fl(Tl),ll("idle"),hl(U=>[...U,"設定変更を反映しました"]),dl("notification","RunConfig反映完了",{proactivity:Tl.proactivity,affectiveDialog:Tl.affectiveDialog})),L.current=B)},[dl,B,Tl,H]),V.useEffect(()=>{if(!Q)return;const x=window.setTimeout(()=>{r({type:"RECONNECT_REQUESTED"}),hl(U=>[...U,"再接続を試行中"]),dl("notification","再接続試行",{scheduled:!0}),k(!1)},1e3);return()=>window.clearTimeout(x)},[dl,Q]),V.useEffect(()=>{const x=tl.current;x&&(x.scrollTop=x.scrollHeight)},[I]),V.useEffect(()=>{const x=U=>{const P=U.detail;if(P){if(P.kind==="text"){const Sl=P.text.trim();if(!Sl)return;if(P.role==="agent"&&Al.current&&P.partial){const Dl=Al.current;R(Pl=>Pl.map(Ie=>Ie.id===Dl?{...Ie,content:`${Ie.content}${Sl}`,status:"partial"}:Ie)),dl("conversation","エージェント応答更新",{partial:!0});return}const il=ac();R(Dl=>[...Dl,{id:il,role:P.role,content:Sl,status:P.partial?"partial":"complete"}]),P.role==="agent"&&(Al.current=P.partial?il:null),dl("conversation","会話イベント受信",{role:P.role,partial:P.partial});return}if(P.kind==="audioOutput"){kl(Sl=>Sl+1),jl("playing"),dl("conversation","音声出力受信",{chunkSize:P.chunkSize},"audio");return}if(P.kind==="turnComplete"){const Sl=Al.current;if(!Sl)return;R(il=>il.map(Dl=>Dl.id===Sl?{...Dl,status:"complete"}:Dl)),Al.current=null,dl("conversation","ターン完了",{kind:"turnComplete"});return}if(P.kind==="runConfigApplyResult"){if(P.status==="applied"){Fl(P.effective),_(P.effective),ll("idle"),hl(il=>[...il,"設定変更を反映しました"]),dl("notification","RunConfig反映完了",{status:P.status,effective:P.effective});return}const Sl=g.proactivity||g.affectiveDialog?g:{proactivity:!1,affectiveDialog:!1};Fl(Sl),ll("idle"),hl(il=>[...il,`設定反映に失敗: ${P.reason??"unsupported"}`]),dl("notification","RunConfig反映失敗",{status:P.status,reason:P.reason,fallback:Sl});return}if(P.kind==="error"){r({type:"CONNECTION_ERROR"}),hl(Sl=>[...Sl,`WebSocketエラー: ${P.message}`]),dl("notification","WebSocketエラー",{message:P.message}),k(!0);return}if(P.kind==="interrupted"){const Sl=Al.current;Sl&&(R(il=>il.map(Dl=>Dl.id===Sl?{...Dl,status:"interrupted"}:Dl)),Al.current=null),jl(il=>il==="playing"?"interrupted":il),dl("notification","中断イベント",{kind:"interrupted"})}}};return window.addEventListener("mock-stream-event",x),()=>window.removeEventListener("mock-stream-event",x)},[dl,g]);const Ba=()=>{r({type:"CONNECT_REQUESTED"}),dl("notification","接続開始要求",{source:"ui"})},qu=()=>{r({type:"DISCONNECTED"}),k(!0),hl(x=>[...x,"切断"]),dl("notification","切断",{reconnectScheduled:!0})},Xt=()=>{const x=C.trim();x&&(R(U=>[...U,{id:ac(),role:"user",content:x,status:"complete"}]),dl("conversation","テキスト送信",{text:x}),z(""))},Ya=x=>{x.preventDefault(),Xt()},Ga=()=>{$l(x=>!x)},Bu=()=>{const x=gl.current;x&&(x.getTracks().forEach(U=>U.stop()),gl.current=null),A(!1),Y(!1)},Yu=async()=>{try{if(!navigator.mediaDevices||!navigator.mediaDevices.getUserMedia)throw new Error("カメラ未対応");const x=await navigator.mediaDevices.getUserMedia({video:!0});gl.current=x,A(!0),Y(!0),dl("notification","カメラプレビュー開始",{status:"opened"})}catch(x){A(!1),Y(!1);const U=x instanceof Error?x.message:"unknown";hl(ql=>[...ql,`カメラ利用に失敗: ${U}`]),dl("notification","カメラ利用失敗",{message:U})}},Qa=()=>{R(x=>[...x,{id:ac(),role:"user",content:"[画像を送信しました]",status:"complete"}]),bt(x=>x+1),dl("conversation","画像送信",{placeholder:!0}),Bu()},Xa=()=>{pt(x=>!x)},Za=()=>{K([]),ot([])},uc=x=>{const U=new URLSearchParams({proactivity:String(x.proactivity),affective_dialog:String(x.affectiveDialog)}).toString();o(U),ll("applying"),hl(ql=>[...ql,"設定変更を反映中"]),dl("notification","RunConfig変更要求",{proactivity:x.proactivity,affective_dialog:x.affectiveDialog,query:U}),r({type:"RECONNECT_REQUESTED"})},Gu=x=>{Qt(U=>{const ql={...U,[x]:!U[x]};return B==="connected"||B==="reconnecting"?uc(ql):o(new URLSearchParams({proactivity:String(ql.proactivity),affective_dialog:String(ql.affectiveDialog)}).toString()),ql})},Il=()=>T.jsxs(T.Fragment,{children:[T.jsxs("p",{className:"mt-2 text-xs text-slate-300",children:["上流音声チャンク: ",T.jsx("span",{"data-testid":"audio-upstream-chunk-count",children:Jl})]}),T.jsxs("p",{className:"mt-1 text-xs text-slate-300",children:["下流音声チャンク: ",T.jsx("span",{"data-testid":"audio-downstream-chunk-count",children:Ut})]}),T.jsxs("p",{className:"mt-1 text-xs text-slate-300",children:["音声再生状態:"," ",T.jsxs("span",{"data-testid":"audio-playback-state",children:[St==="idle"&&"待機中",St==="playing"&&"再生中",St==="interrupted"&&"中断"]})]}),T.jsxs("p",{className:"mt-1 text-xs text-slate-300",children:["画像上流送信数: ",T.jsx("span",{"data-testid":"image-upstream-count",children:tt})]})]}),nc=()=>{const x=Gt?Ql:Ql.filter(U=>U.kind!=="audio");return T.jsxs(T.Fragment,{children:[T.jsxs("div",{className:"mt-3 flex items-center justify-between gap-3 border-t border-slate-700/70 pt-3",children:[T.jsxs("label",{className:"flex items-center gap-2 text-xs text-slate-300",children:[T.jsx("input",{type:"checkbox",checked:Gt,onChange:Xa}),"音声イベントを表示"]}),T.jsx("button",{type:"button",className:"rounded bg-slate-700 px-2 py-1 text-xs text-slate-100",onClick:Za,children:"ログをクリア"})]}),T.jsx("ul",{"data-testid":"event-log-list",className:"mt-3 space-y-2",children:x.map(U=>{const ql=wl.includes(U.id),P=U.kind==="audio"?"audio":U.category,Sl=U.kind==="audio"?"text-cyan-300":U.category==="notification"?"text-amber-300":"text-slate-300";return T.jsxs("li",{"data-testid":"event-log-item",className:"rounded border border-slate-700 bg-slate-900/80 p-2 text-xs",children:[T.jsxs("p",{"data-testid":`event-log-item-${P}`,className:Sl,children:["[",P,"] ",U.summary]}),T.jsx("p",{className:"mt-1 text-slate-500",children:U.timestamp}),T.jsx("button",{type:"button",className:"mt-1 rounded bg-slate-700 px-2 py-1 text-slate-100",onClick:()=>$e(U.id),children:ql?"詳細を閉じる":"詳細を開く"}),ql&&T.jsx("pre",{"data-testid":"event-log-detail",className:"mt-2 overflow-x-auto rounded bg-slate-800 p-2 text-[11px] text-slate-200",children:U.detail})]},U.id)})})]})},ke=x=>T.jsxs("section",{"aria-label":"connection",role:"region",className:x,children:[T.jsxs("div",{className:"flex items-center justify-between gap-2",children:[T.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100",children:"接続状態"}),T.jsx("span",{"data-testid":"connection-state",className:"rounded-full bg-emerald-950/70 px-2 py-1 text-xs text-emerald-300",children:fy(B)})]}),B==="disconnected"&&Q&&T.jsx("p",{className:"mt-2 text-sm text-amber-300",children:"再接続予定"}),B==="error"&&Q&&T.jsx("p",{"data-testid":"recovery-status-banner",className:"mt-2 text-sm text-amber-300",children:"自動回復を試行中"}),T.jsxs("div",{className:"mt-3 flex flex-wrap gap-2",children:[(B==="disconnected"||B==="error")&&T.jsx("button",{type:"button",className:"rounded-md bg-emerald-500 px-3 py-2 text-xs font-semibold text-slate-900 transition-colors hover:bg-emerald-400",onClick:Ba,children:"接続開始"}),B==="connected"&&T.jsx("button",{type:"button",className:"rounded-md bg-slate-700 px-3 py-2 text-xs font-semibold text-slate-100 transition-colors hover:bg-slate-600",onClick:qu,children:"切断"})]}),T.jsxs("div",{className:"mt-4 rounded-xl border border-slate-700 bg-slate-900/70 p-3",children:[T.jsx("p",{className:"text-xs font-semibold tracking-wide text-slate-300",children:"RUN_CONFIG"}),T.jsxs("label",{className:"mt-2 flex items-center gap-2 text-sm text-slate-200",children:[T.jsx("input",{type:"checkbox",checked:Tl.proactivity,onChange:()=>Gu("proactivity"),disabled:H==="applying"}),"Proactivity"]}),T.jsxs("label",{className:"mt-1 flex items-center gap-2 text-sm text-slate-200",children:[T.jsx("input",{type:"checkbox",checked:Tl.affectiveDialog,onChange:()=>Gu("affectiveDialog"),disabled:H==="applying"}),"Affective Dialog"]}),T.jsx("p",{"data-testid":"run-config-status",className:"mt-2 text-xs text-slate-400",children:H==="applying"?"反映中":"待機"}),T.jsx("p",{"data-testid":"run-config-query",className:"mt-1 text-xs text-slate-500",children:cl}),T.jsxs("p",{"data-testid":"run-config-effective",className:"mt-1 text-xs text-slate-400",children:["effective: proactivity=",String(et.proactivity),", affectiveDialog=",String(et.affectiveDialog)]}),T.jsx("p",{"data-testid":"run-config-drift",className:"mt-1 text-xs text-slate-400",children:Tl.proactivity===et.proactivity&&Tl.affectiveDialog===et.affectiveDialog?"一致":"不一致"})]})]}),Fe=x=>T.jsxs("section",{"aria-label":"conversation",role:"region",className:x,children:[T.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100",children:"stream_transcript"}),T.jsxs("ul",{ref:tl,"data-testid":"conversation-log",className:"mt-3 max-h-72 space-y-2 overflow-y-auto rounded-xl border border-slate-700 bg-slate-950/60 p-3",children:[I.length===0&&T.jsx("li",{className:"text-sm text-slate-500",children:"メッセージはまだありません"}),I.map(U=>T.jsxs("li",{"data-testid":`conversation-message-${U.role}`,className:`rounded px-3 py-2 text-sm ${U.role==="user"?"bg-slate-800 text-slate-100":U.status==="interrupted"?"bg-rose-950/60 text-rose-100":"bg-emerald-950/40 text-emerald-100"}`,children:[T.jsx("p",{children:U.content}),T.jsx("p",{className:"mt-1 text-xs text-slate-400",children:U.status})]},U.id))]})]}),ce=(x,U="voice_activity")=>T.jsxs("section",{"aria-label":"event-console",role:"region",className:x,children:[T.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100",children:U}),Il(),nc()]});return T.jsxs("main",{className:"min-h-screen bg-[#0B0E13] text-slate-100","data-layout":O,children:[T.jsxs("header",{className:"border-b border-slate-800 bg-[#0F141C] px-4 py-4",children:[T.jsx("h1",{className:"text-3xl font-semibold leading-none [font-family:Oswald,sans-serif]",children:"Realtime Voice Agent"}),T.jsx("p",{className:"mt-1 text-xs text-slate-400 [font-family:'JetBrains_Mono',monospace]",children:"bidi streaming audio for text, voice, and image inputs"}),T.jsx("p",{"data-testid":"layout-mode",className:"mt-1 text-xs text-slate-500",children:O})]}),O==="desktop"&&T.jsxs("div",{className:"grid grid-cols-[260px_1fr_300px] gap-4 p-4",children:[ke("rounded-2xl border border-slate-800 bg-[#111821] p-4"),T.jsxs("div",{className:"flex min-h-[560px] flex-col gap-4",children:[Fe("flex-1 rounded-2xl border border-slate-800 bg-[#111821] p-4"),T.jsx("div",{className:"rounded-2xl border border-slate-800 bg-[#0F141C] p-3 text-xs text-slate-400",children:"stream.websocket ready for text/voice/image payloads"})]}),T.jsxs("div",{className:"flex min-h-[560px] flex-col gap-4",children:[ce("flex-1 rounded-2xl border border-slate-800 bg-[#111821] p-4"),T.jsxs("div",{className:"rounded-2xl border border-slate-800 bg-[#111821] p-3",children:[T.jsx("p",{className:"text-xs font-semibold tracking-wide text-slate-300",children:"image_context"}),T.jsx("p",{className:"mt-2 text-xs text-slate-400",children:"screenshot snapshot and tool traces are shown here."})]})]})]}),O==="tablet"&&T.jsxs("div",{className:"grid grid-cols-[1fr_290px] gap-4 p-4",children:[T.jsx("div",{className:"flex min-h-[520px] flex-col gap-4",children:Fe("flex-1 rounded-2xl border border-slate-800 bg-[#111821] p-4")}),T.jsxs("div",{className:"flex min-h-[520px] flex-col gap-4",children:[ke("rounded-2xl border border-slate-800 bg-[#111821] p-4"),ce("flex-1 rounded-2xl border border-slate-800 bg-[#111821] p-4","tool_events")]})]}),O==="mobile"&&T.jsxs("div",{className:"flex flex-col gap-3 p-3",children:[T.jsxs("div",{className:"rounded-2xl border border-slate-800 bg-[#111821] p-3",children:[T.jsx("p",{className:"text-3xl leading-none [font-family:Oswald,sans-serif]",children:"Voxa Mobile"}),T.jsx("p",{className:"mt-1 text-[11px] text-slate-500 [font-family:'JetBrains_Mono',monospace]",children:"live_voice_console"}),T.jsxs("div",{className:"mt-3 flex items-center gap-2",children:[T.jsx("span",{className:"rounded-full bg-emerald-950/70 px-2 py-1 text-[10px] text-emerald-300",children:"CONNECTED"}),T.jsx("span",{className:"rounded-full bg-amber-950/70 px-2 py-1 text-[10px] text-amber-300",children:"reconnecting"})]})]}),ke("rounded-2xl border border-slate-800 bg-[#111821] p-3"),Fe("rounded-2xl border border-slate-800 bg-[#111821] p-3"),T.jsx("div",{className:"rounded-2xl border border-slate-800 bg-[#111821] p-3",children:T.jsx("button",{type:"button",className:"w-full rounded-xl bg-[#00D4AA] px-4 py-3 text-xs font-semibold text-slate-900",children:"hold_to_talk"})}),T.jsx("div",{className:"rounded-2xl border border-slate-800 bg-[#111821] p-2",children:T.jsxs("div",{className:"grid grid-cols-3 gap-2 text-center text-xs",children:[T.jsx("div",{className:"rounded-lg bg-slate-800 py-2 text-slate-200",children:"chat"}),T.jsx("div",{className:"rounded-lg bg-[#1E2631] py-2 text-slate-100",children:"voice"}),T.jsx("div",{className:"rounded-lg bg-slate-900 py-2 text-slate-400",children:"tools"})]})}),ce("rounded-2xl border border-slate-800 bg-[#111821] p-3","run_config")]}),T.jsxs("section",{"aria-label":"input-controls",role:"region",className:O==="mobile"?"border-t border-slate-800 bg-[#0F141C] p-3":"sticky bottom-0 border-t border-slate-800 bg-[#0F141C] p-4",children:[T.jsxs("form",{className:"flex flex-wrap items-center gap-2",onSubmit:Ya,children:[T.jsx("label",{htmlFor:"text-input",className:"sr-only",children:"テキスト入力"}),T.jsx("input",{id:"text-input",type:"text",value:C,onChange:x=>z(x.target.value),className:"min-w-[200px] flex-1 rounded-xl border border-slate-700 bg-slate-800 px-3 py-2 text-sm text-slate-100 placeholder:text-slate-500",placeholder:"メッセージを入力"}),T.jsx("button",{type:"submit",className:"rounded-xl bg-[#FF7A3D] px-4 py-2 text-sm font-semibold text-slate-950",children:"送信"}),T.jsx("button",{type:"button",className:"rounded-xl bg-[#00D4AA] px-4 py-2 text-sm font-semibold text-slate-950",onClick:Ga,children:nl?"音声停止":"音声開始"}),T.jsx("button",{type:"button",className:"rounded-xl bg-slate-700 px-3 py-2 text-sm text-white",onClick:Yu,children:"画像送信"})]}),nl&&T.jsx("p",{"data-testid":"voice-input-state",className:"mt-2 text-sm text-emerald-300",children:"音声入力中"}),T.jsx("p",{"data-testid":"camera-state",className:"mt-1 text-sm text-slate-400",children:D?"利用中":"未使用"})]}),E&&T.jsx("section",{role:"dialog","aria-label":"camera-preview",className:"fixed inset-0 z-10 flex items-center justify-center bg-black/60 p-4",children:T.jsxs("div",{className:"w-full max-w-md rounded-2xl border border-slate-700 bg-[#121821] p-4",children:[T.jsx("p",{className:"text-xl font-semibold [font-family:Oswald,sans-serif]",children:"Camera Preview"}),T.jsx("p",{className:"mt-2 text-sm text-slate-300",children:"プレビュー準備完了"}),T.jsxs("div",{className:"mt-4 flex gap-2",children:[T.jsx("button",{type:"button",className:"rounded-xl bg-[#FF7A3D] px-3 py-2 text-sm font-semibold text-slate-900",onClick:Qa,children:"画像を送信"}),T.jsx("button",{type:"button",className:"rounded-xl bg-slate-700 px-3 py-2 text-sm text-white",onClick:Bu,children:"キャンセル"})]})]})}),T.jsxs("section",{"aria-label":"system-notices",role:"region",className:"border-t border-slate-800 bg-[#0F141C] p-3",children:[T.jsx("p",{className:"text-sm font-medium text-slate-200",children:"システム通知"}),T.jsx("ul",{"data-testid":"system-notices",className:"mt-1 list-disc pl-5 text-sm text-slate-300",children:zl.map((x,U)=>T.jsx("li",{"data-testid":"system-notice-item",className:"system-notice-item rounded border-l-2 border-amber-400 bg-amber-950/30 px-2 py-1",children:x},`${x}-${U}`))})]})]})}function dy(){return{connection:"disconnected",conversation:[],notices:[],eventLog:[]}}const my=V.createContext(null);function vy({children:O}){const[ol]=V.useState(dy()),B=V.useMemo(()=>ol,[ol]);return T.jsx(my.Provider,{value:B,children:O})}const H0=document.getElementById("root");if(!H0)throw new Error("Root element #root not found");cy.createRoot(H0).render(T.jsx(V.StrictMode,{children:T.jsx(vy,{children:T.jsx(oy,{})})}));
@@ -1,49 +0,0 @@
-(function(){const sl=document.createElement("link").relList;if(sl&&sl.supports&&sl.supports("modulepreload"))return;for(const G of document.querySelectorAll('link[rel="modulepreload"]'))h(G);new MutationObserver(G=>{for(const k of G)if(k.type==="childList")for(const zl of k.addedNodes)zl.tagName==="LINK"&&zl.rel==="modulepreload"&&h(zl)}).observe(document,{childList:!0,subtree:!0});function Y(G){const k={};return G.integrity&&(k.integrity=G.integrity),G.referrerPolicy&&(k.referrerPolicy=G.referrerPolicy),G.crossOrigin==="use-credentials"?k.credentials="include":G.crossOrigin==="anonymous"?k.credentials="omit":k.credentials="same-origin",k}function h(G){if(G.ep)return;G.ep=!0;const k=Y(G);fetch(G.href,k)}})();var Sf={exports:{}},Hu={};/**
- * @license React
- * react-jsx-runtime.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var p0;function Fv(){if(p0)return Hu;p0=1;var M=Symbol.for("react.transitional.element"),sl=Symbol.for("react.fragment");function Y(h,G,k){var zl=null;if(k!==void 0&&(zl=""+k),G.key!==void 0&&(zl=""+G.key),"key"in G){k={};for(var hl in G)hl!=="key"&&(k[hl]=G[hl])}else k=G;return G=k.ref,{$$typeof:M,type:h,key:zl,ref:G!==void 0?G:null,props:k}}return Hu.Fragment=sl,Hu.jsx=Y,Hu.jsxs=Y,Hu}var T0;function Iv(){return T0||(T0=1,Sf.exports=Fv()),Sf.exports}var T=Iv(),bf={exports:{}},Q={};/**
- * @license React
- * react.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var A0;function Pv(){if(A0)return Q;A0=1;var M=Symbol.for("react.transitional.element"),sl=Symbol.for("react.portal"),Y=Symbol.for("react.fragment"),h=Symbol.for("react.strict_mode"),G=Symbol.for("react.profiler"),k=Symbol.for("react.consumer"),zl=Symbol.for("react.context"),hl=Symbol.for("react.forward_ref"),x=Symbol.for("react.suspense"),p=Symbol.for("react.memo"),I=Symbol.for("react.lazy"),C=Symbol.for("react.activity"),nl=Symbol.iterator;function Fl(o){return o===null||typeof o!="object"?null:(o=nl&&o[nl]||o["@@iterator"],typeof o=="function"?o:null)}var Wl={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},Gl=Object.assign,xt={};function Il(o,z,_){this.props=o,this.context=z,this.refs=xt,this.updater=_||Wl}Il.prototype.isReactComponent={},Il.prototype.setState=function(o,z){if(typeof o!="object"&&typeof o!="function"&&o!=null)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,o,z,"setState")},Il.prototype.forceUpdate=function(o){this.updater.enqueueForceUpdate(this,o,"forceUpdate")};function St(){}St.prototype=Il.prototype;function Hl(o,z,_){this.props=o,this.context=z,this.refs=xt,this.updater=_||Wl}var tt=Hl.prototype=new St;tt.constructor=Hl,Gl(tt,Il.prototype),tt.isPureReactComponent=!0;var bt=Array.isArray;function Xl(){}var K={H:null,A:null,T:null,S:null},$l=Object.prototype.hasOwnProperty;function ot(o,z,_){var N=_.ref;return{$$typeof:M,type:o,key:z,ref:N!==void 0?N:null,props:_}}function Gt(o,z){return ot(o.type,z,o.props)}function Et(o){return typeof o=="object"&&o!==null&&o.$$typeof===M}function pl(o){var z={"=":"=0",":":"=2"};return"$"+o.replace(/[=:]/g,function(_){return z[_]})}var Xt=/\/+/g;function at(o,z){return typeof o=="object"&&o!==null&&o.key!=null?pl(""+o.key):z.toString(36)}function Pl(o){switch(o.status){case"fulfilled":return o.value;case"rejected":throw o.reason;default:switch(typeof o.status=="string"?o.then(Xl,Xl):(o.status="pending",o.then(function(z){o.status==="pending"&&(o.status="fulfilled",o.value=z)},function(z){o.status==="pending"&&(o.status="rejected",o.reason=z)})),o.status){case"fulfilled":return o.value;case"rejected":throw o.reason}}throw o}function g(o,z,_,N,B){var L=typeof o;(L==="undefined"||L==="boolean")&&(o=null);var tl=!1;if(o===null)tl=!0;else switch(L){case"bigint":case"string":case"number":tl=!0;break;case"object":switch(o.$$typeof){case M:case sl:tl=!0;break;case I:return tl=o._init,g(tl(o._payload),z,_,N,B)}}if(tl)return B=B(o),tl=N===""?"."+at(o,0):N,bt(B)?(_="",tl!=null&&(_=tl.replace(Xt,"$&/")+"/"),g(B,z,_,"",function(ol){return ol})):B!=null&&(Et(B)&&(B=Gt(B,_+(B.key==null||o&&o.key===B.key?"":(""+B.key).replace(Xt,"$&/")+"/")+tl)),z.push(B)),1;tl=0;var Tl=N===""?".":N+":";if(bt(o))for(var rl=0;rl<o.length;rl++)N=o[rl],L=Tl+at(N,rl),tl+=g(N,z,_,L,B);else if(rl=Fl(o),typeof rl=="function")for(o=rl.call(o),rl=0;!(N=o.next()).done;)N=N.value,L=Tl+at(N,rl++),tl+=g(N,z,_,L,B);else if(L==="object"){if(typeof o.then=="function")return g(Pl(o),z,_,N,B);throw z=String(o),Error("Objects are not valid as a React child (found: "+(z==="[object Object]"?"object with keys {"+Object.keys(o).join(", ")+"}":z)+"). If you meant to render a collection of children, use an array instead.")}return tl}function O(o,z,_){if(o==null)return o;var N=[],B=0;return g(o,N,"","",function(L){return z.call(_,L,B++)}),N}function H(o){if(o._status===-1){var z=o._result;z=z(),z.then(function(_){(o._status===0||o._status===-1)&&(o._status=1,o._result=_)},function(_){(o._status===0||o._status===-1)&&(o._status=2,o._result=_)}),o._status===-1&&(o._status=0,o._result=z)}if(o._status===1)return o._result.default;throw o._result}var ll=typeof reportError=="function"?reportError:function(o){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var z=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof o=="object"&&o!==null&&typeof o.message=="string"?String(o.message):String(o),error:o});if(!window.dispatchEvent(z))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",o);return}console.error(o)},cl={map:O,forEach:function(o,z,_){O(o,function(){z.apply(this,arguments)},_)},count:function(o){var z=0;return O(o,function(){z++}),z},toArray:function(o){return O(o,function(z){return z})||[]},only:function(o){if(!Et(o))throw Error("React.Children.only expected to receive a single React element child.");return o}};return Q.Activity=C,Q.Children=cl,Q.Component=Il,Q.Fragment=Y,Q.Profiler=G,Q.PureComponent=Hl,Q.StrictMode=h,Q.Suspense=x,Q.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=K,Q.__COMPILER_RUNTIME={__proto__:null,c:function(o){return K.H.useMemoCache(o)}},Q.cache=function(o){return function(){return o.apply(null,arguments)}},Q.cacheSignal=function(){return null},Q.cloneElement=function(o,z,_){if(o==null)throw Error("The argument must be a React element, but you passed "+o+".");var N=Gl({},o.props),B=o.key;if(z!=null)for(L in z.key!==void 0&&(B=""+z.key),z)!$l.call(z,L)||L==="key"||L==="__self"||L==="__source"||L==="ref"&&z.ref===void 0||(N[L]=z[L]);var L=arguments.length-2;if(L===1)N.children=_;else if(1<L){for(var tl=Array(L),Tl=0;Tl<L;Tl++)tl[Tl]=arguments[Tl+2];N.children=tl}return ot(o.type,B,N)},Q.createContext=function(o){return o={$$typeof:zl,_currentValue:o,_currentValue2:o,_threadCount:0,Provider:null,Consumer:null},o.Provider=o,o.Consumer={$$typeof:k,_context:o},o},Q.createElement=function(o,z,_){var N,B={},L=null;if(z!=null)for(N in z.key!==void 0&&(L=""+z.key),z)$l.call(z,N)&&N!=="key"&&N!=="__self"&&N!=="__source"&&(B[N]=z[N]);var tl=arguments.length-2;if(tl===1)B.children=_;else if(1<tl){for(var Tl=Array(tl),rl=0;rl<tl;rl++)Tl[rl]=arguments[rl+2];B.children=Tl}if(o&&o.defaultProps)for(N in tl=o.defaultProps,tl)B[N]===void 0&&(B[N]=tl[N]);return ot(o,L,B)},Q.createRef=function(){return{current:null}},Q.forwardRef=function(o){return{$$typeof:hl,render:o}},Q.isValidElement=Et,Q.lazy=function(o){return{$$typeof:I,_payload:{_status:-1,_result:o},_init:H}},Q.memo=function(o,z){return{$$typeof:p,type:o,compare:z===void 0?null:z}},Q.startTransition=function(o){var z=K.T,_={};K.T=_;try{var N=o(),B=K.S;B!==null&&B(_,N),typeof N=="object"&&N!==null&&typeof N.then=="function"&&N.then(Xl,ll)}catch(L){ll(L)}finally{z!==null&&_.types!==null&&(z.types=_.types),K.T=z}},Q.unstable_useCacheRefresh=function(){return K.H.useCacheRefresh()},Q.use=function(o){return K.H.use(o)},Q.useActionState=function(o,z,_){return K.H.useActionState(o,z,_)},Q.useCallback=function(o,z){return K.H.useCallback(o,z)},Q.useContext=function(o){return K.H.useContext(o)},Q.useDebugValue=function(){},Q.useDeferredValue=function(o,z){return K.H.useDeferredValue(o,z)},Q.useEffect=function(o,z){return K.H.useEffect(o,z)},Q.useEffectEvent=function(o){return K.H.useEffectEvent(o)},Q.useId=function(){return K.H.useId()},Q.useImperativeHandle=function(o,z,_){return K.H.useImperativeHandle(o,z,_)},Q.useInsertionEffect=function(o,z){return K.H.useInsertionEffect(o,z)},Q.useLayoutEffect=function(o,z){return K.H.useLayoutEffect(o,z)},Q.useMemo=function(o,z){return K.H.useMemo(o,z)},Q.useOptimistic=function(o,z){return K.H.useOptimistic(o,z)},Q.useReducer=function(o,z,_){return K.H.useReducer(o,z,_)},Q.useRef=function(o){return K.H.useRef(o)},Q.useState=function(o){return K.H.useState(o)},Q.useSyncExternalStore=function(o,z,_){return K.H.useSyncExternalStore(o,z,_)},Q.useTransition=function(){return K.H.useTransition()},Q.version="19.2.4",Q}var _0;function Af(){return _0||(_0=1,bf.exports=Pv()),bf.exports}var V=Af(),Ef={exports:{}},ju={},zf={exports:{}},pf={};/**
- * @license React
- * scheduler.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var O0;function ly(){return O0||(O0=1,(function(M){function sl(g,O){var H=g.length;g.push(O);l:for(;0<H;){var ll=H-1>>>1,cl=g[ll];if(0<G(cl,O))g[ll]=O,g[H]=cl,H=ll;else break l}}function Y(g){return g.length===0?null:g[0]}function h(g){if(g.length===0)return null;var O=g[0],H=g.pop();if(H!==O){g[0]=H;l:for(var ll=0,cl=g.length,o=cl>>>1;ll<o;){var z=2*(ll+1)-1,_=g[z],N=z+1,B=g[N];if(0>G(_,H))N<cl&&0>G(B,_)?(g[ll]=B,g[N]=H,ll=N):(g[ll]=_,g[z]=H,ll=z);else if(N<cl&&0>G(B,H))g[ll]=B,g[N]=H,ll=N;else break l}}return O}function G(g,O){var H=g.sortIndex-O.sortIndex;return H!==0?H:g.id-O.id}if(M.unstable_now=void 0,typeof performance=="object"&&typeof performance.now=="function"){var k=performance;M.unstable_now=function(){return k.now()}}else{var zl=Date,hl=zl.now();M.unstable_now=function(){return zl.now()-hl}}var x=[],p=[],I=1,C=null,nl=3,Fl=!1,Wl=!1,Gl=!1,xt=!1,Il=typeof setTimeout=="function"?setTimeout:null,St=typeof clearTimeout=="function"?clearTimeout:null,Hl=typeof setImmediate<"u"?setImmediate:null;function tt(g){for(var O=Y(p);O!==null;){if(O.callback===null)h(p);else if(O.startTime<=g)h(p),O.sortIndex=O.expirationTime,sl(x,O);else break;O=Y(p)}}function bt(g){if(Gl=!1,tt(g),!Wl)if(Y(x)!==null)Wl=!0,Xl||(Xl=!0,pl());else{var O=Y(p);O!==null&&Pl(bt,O.startTime-g)}}var Xl=!1,K=-1,$l=5,ot=-1;function Gt(){return xt?!0:!(M.unstable_now()-ot<$l)}function Et(){if(xt=!1,Xl){var g=M.unstable_now();ot=g;var O=!0;try{l:{Wl=!1,Gl&&(Gl=!1,St(K),K=-1),Fl=!0;var H=nl;try{t:{for(tt(g),C=Y(x);C!==null&&!(C.expirationTime>g&&Gt());){var ll=C.callback;if(typeof ll=="function"){C.callback=null,nl=C.priorityLevel;var cl=ll(C.expirationTime<=g);if(g=M.unstable_now(),typeof cl=="function"){C.callback=cl,tt(g),O=!0;break t}C===Y(x)&&h(x),tt(g)}else h(x);C=Y(x)}if(C!==null)O=!0;else{var o=Y(p);o!==null&&Pl(bt,o.startTime-g),O=!1}}break l}finally{C=null,nl=H,Fl=!1}O=void 0}}finally{O?pl():Xl=!1}}}var pl;if(typeof Hl=="function")pl=function(){Hl(Et)};else if(typeof MessageChannel<"u"){var Xt=new MessageChannel,at=Xt.port2;Xt.port1.onmessage=Et,pl=function(){at.postMessage(null)}}else pl=function(){Il(Et,0)};function Pl(g,O){K=Il(function(){g(M.unstable_now())},O)}M.unstable_IdlePriority=5,M.unstable_ImmediatePriority=1,M.unstable_LowPriority=4,M.unstable_NormalPriority=3,M.unstable_Profiling=null,M.unstable_UserBlockingPriority=2,M.unstable_cancelCallback=function(g){g.callback=null},M.unstable_forceFrameRate=function(g){0>g||125<g?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):$l=0<g?Math.floor(1e3/g):5},M.unstable_getCurrentPriorityLevel=function(){return nl},M.unstable_next=function(g){switch(nl){case 1:case 2:case 3:var O=3;break;default:O=nl}var H=nl;nl=O;try{return g()}finally{nl=H}},M.unstable_requestPaint=function(){xt=!0},M.unstable_runWithPriority=function(g,O){switch(g){case 1:case 2:case 3:case 4:case 5:break;default:g=3}var H=nl;nl=g;try{return O()}finally{nl=H}},M.unstable_scheduleCallback=function(g,O,H){var ll=M.unstable_now();switch(typeof H=="object"&&H!==null?(H=H.delay,H=typeof H=="number"&&0<H?ll+H:ll):H=ll,g){case 1:var cl=-1;break;case 2:cl=250;break;case 5:cl=1073741823;break;case 4:cl=1e4;break;default:cl=5e3}return cl=H+cl,g={id:I++,callback:O,priorityLevel:g,startTime:H,expirationTime:cl,sortIndex:-1},H>ll?(g.sortIndex=H,sl(p,g),Y(x)===null&&g===Y(p)&&(Gl?(St(K),K=-1):Gl=!0,Pl(bt,H-ll))):(g.sortIndex=cl,sl(x,g),Wl||Fl||(Wl=!0,Xl||(Xl=!0,pl()))),g},M.unstable_shouldYield=Gt,M.unstable_wrapCallback=function(g){var O=nl;return function(){var H=nl;nl=O;try{return g.apply(this,arguments)}finally{nl=H}}}})(pf)),pf}var M0;function ty(){return M0||(M0=1,zf.exports=ly()),zf.exports}var Tf={exports:{}},kl={};/**
- * @license React
- * react-dom.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var D0;function ay(){if(D0)return kl;D0=1;var M=Af();function sl(x){var p="https://react.dev/errors/"+x;if(1<arguments.length){p+="?args[]="+encodeURIComponent(arguments[1]);for(var I=2;I<arguments.length;I++)p+="&args[]="+encodeURIComponent(arguments[I])}return"Minified React error #"+x+"; visit "+p+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function Y(){}var h={d:{f:Y,r:function(){throw Error(sl(522))},D:Y,C:Y,L:Y,m:Y,X:Y,S:Y,M:Y},p:0,findDOMNode:null},G=Symbol.for("react.portal");function k(x,p,I){var C=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:G,key:C==null?null:""+C,children:x,containerInfo:p,implementation:I}}var zl=M.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function hl(x,p){if(x==="font")return"";if(typeof p=="string")return p==="use-credentials"?p:""}return kl.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=h,kl.createPortal=function(x,p){var I=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!p||p.nodeType!==1&&p.nodeType!==9&&p.nodeType!==11)throw Error(sl(299));return k(x,p,null,I)},kl.flushSync=function(x){var p=zl.T,I=h.p;try{if(zl.T=null,h.p=2,x)return x()}finally{zl.T=p,h.p=I,h.d.f()}},kl.preconnect=function(x,p){typeof x=="string"&&(p?(p=p.crossOrigin,p=typeof p=="string"?p==="use-credentials"?p:"":void 0):p=null,h.d.C(x,p))},kl.prefetchDNS=function(x){typeof x=="string"&&h.d.D(x)},kl.preinit=function(x,p){if(typeof x=="string"&&p&&typeof p.as=="string"){var I=p.as,C=hl(I,p.crossOrigin),nl=typeof p.integrity=="string"?p.integrity:void 0,Fl=typeof p.fetchPriority=="string"?p.fetchPriority:void 0;I==="style"?h.d.S(x,typeof p.precedence=="string"?p.precedence:void 0,{crossOrigin:C,integrity:nl,fetchPriority:Fl}):I==="script"&&h.d.X(x,{crossOrigin:C,integrity:nl,fetchPriority:Fl,nonce:typeof p.nonce=="string"?p.nonce:void 0})}},kl.preinitModule=function(x,p){if(typeof x=="string")if(typeof p=="object"&&p!==null){if(p.as==null||p.as==="script"){var I=hl(p.as,p.crossOrigin);h.d.M(x,{crossOrigin:I,integrity:typeof p.integrity=="string"?p.integrity:void 0,nonce:typeof p.nonce=="string"?p.nonce:void 0})}}else p==null&&h.d.M(x)},kl.preload=function(x,p){if(typeof x=="string"&&typeof p=="object"&&p!==null&&typeof p.as=="string"){var I=p.as,C=hl(I,p.crossOrigin);h.d.L(x,I,{crossOrigin:C,integrity:typeof p.integrity=="string"?p.integrity:void 0,nonce:typeof p.nonce=="string"?p.nonce:void 0,type:typeof p.type=="string"?p.type:void 0,fetchPriority:typeof p.fetchPriority=="string"?p.fetchPriority:void 0,referrerPolicy:typeof p.referrerPolicy=="string"?p.referrerPolicy:void 0,imageSrcSet:typeof p.imageSrcSet=="string"?p.imageSrcSet:void 0,imageSizes:typeof p.imageSizes=="string"?p.imageSizes:void 0,media:typeof p.media=="string"?p.media:void 0})}},kl.preloadModule=function(x,p){if(typeof x=="string")if(p){var I=hl(p.as,p.crossOrigin);h.d.m(x,{as:typeof p.as=="string"&&p.as!=="script"?p.as:void 0,crossOrigin:I,integrity:typeof p.integrity=="string"?p.integrity:void 0})}else h.d.m(x)},kl.requestFormReset=function(x){h.d.r(x)},kl.unstable_batchedUpdates=function(x,p){return x(p)},kl.useFormState=function(x,p,I){return zl.H.useFormState(x,p,I)},kl.useFormStatus=function(){return zl.H.useHostTransitionStatus()},kl.version="19.2.4",kl}var N0;function ey(){if(N0)return Tf.exports;N0=1;function M(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(M)}catch(sl){console.error(sl)}}return M(),Tf.exports=ay(),Tf.exports}/**
- * @license React
- * react-dom-client.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var U0;function uy(){if(U0)return ju;U0=1;var M=ty(),sl=Af(),Y=ey();function h(l){var t="https://react.dev/errors/"+l;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var a=2;a<arguments.length;a++)t+="&args[]="+encodeURIComponent(arguments[a])}return"Minified React error #"+l+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function G(l){return!(!l||l.nodeType!==1&&l.nodeType!==9&&l.nodeType!==11)}function k(l){var t=l,a=l;if(l.alternate)for(;t.return;)t=t.return;else{l=t;do t=l,(t.flags&4098)!==0&&(a=t.return),l=t.return;while(l)}return t.tag===3?a:null}function zl(l){if(l.tag===13){var t=l.memoizedState;if(t===null&&(l=l.alternate,l!==null&&(t=l.memoizedState)),t!==null)return t.dehydrated}return null}function hl(l){if(l.tag===31){var t=l.memoizedState;if(t===null&&(l=l.alternate,l!==null&&(t=l.memoizedState)),t!==null)return t.dehydrated}return null}function x(l){if(k(l)!==l)throw Error(h(188))}function p(l){var t=l.alternate;if(!t){if(t=k(l),t===null)throw Error(h(188));return t!==l?null:l}for(var a=l,e=t;;){var u=a.return;if(u===null)break;var n=u.alternate;if(n===null){if(e=u.return,e!==null){a=e;continue}break}if(u.child===n.child){for(n=u.child;n;){if(n===a)return x(u),l;if(n===e)return x(u),t;n=n.sibling}throw Error(h(188))}if(a.return!==e.return)a=u,e=n;else{for(var c=!1,i=u.child;i;){if(i===a){c=!0,a=u,e=n;break}if(i===e){c=!0,e=u,a=n;break}i=i.sibling}if(!c){for(i=n.child;i;){if(i===a){c=!0,a=n,e=u;break}if(i===e){c=!0,e=n,a=u;break}i=i.sibling}if(!c)throw Error(h(189))}}if(a.alternate!==e)throw Error(h(190))}if(a.tag!==3)throw Error(h(188));return a.stateNode.current===a?l:t}function I(l){var t=l.tag;if(t===5||t===26||t===27||t===6)return l;for(l=l.child;l!==null;){if(t=I(l),t!==null)return t;l=l.sibling}return null}var C=Object.assign,nl=Symbol.for("react.element"),Fl=Symbol.for("react.transitional.element"),Wl=Symbol.for("react.portal"),Gl=Symbol.for("react.fragment"),xt=Symbol.for("react.strict_mode"),Il=Symbol.for("react.profiler"),St=Symbol.for("react.consumer"),Hl=Symbol.for("react.context"),tt=Symbol.for("react.forward_ref"),bt=Symbol.for("react.suspense"),Xl=Symbol.for("react.suspense_list"),K=Symbol.for("react.memo"),$l=Symbol.for("react.lazy"),ot=Symbol.for("react.activity"),Gt=Symbol.for("react.memo_cache_sentinel"),Et=Symbol.iterator;function pl(l){return l===null||typeof l!="object"?null:(l=Et&&l[Et]||l["@@iterator"],typeof l=="function"?l:null)}var Xt=Symbol.for("react.client.reference");function at(l){if(l==null)return null;if(typeof l=="function")return l.$$typeof===Xt?null:l.displayName||l.name||null;if(typeof l=="string")return l;switch(l){case Gl:return"Fragment";case Il:return"Profiler";case xt:return"StrictMode";case bt:return"Suspense";case Xl:return"SuspenseList";case ot:return"Activity"}if(typeof l=="object")switch(l.$$typeof){case Wl:return"Portal";case Hl:return l.displayName||"Context";case St:return(l._context.displayName||"Context")+".Consumer";case tt:var t=l.render;return l=l.displayName,l||(l=t.displayName||t.name||"",l=l!==""?"ForwardRef("+l+")":"ForwardRef"),l;case K:return t=l.displayName||null,t!==null?t:at(l.type)||"Memo";case $l:t=l._payload,l=l._init;try{return at(l(t))}catch{}}return null}var Pl=Array.isArray,g=sl.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,O=Y.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,H={pending:!1,data:null,method:null,action:null},ll=[],cl=-1;function o(l){return{current:l}}function z(l){0>cl||(l.current=ll[cl],ll[cl]=null,cl--)}function _(l,t){cl++,ll[cl]=l.current,l.current=t}var N=o(null),B=o(null),L=o(null),tl=o(null);function Tl(l,t){switch(_(L,t),_(B,l),_(N,null),t.nodeType){case 9:case 11:l=(l=t.documentElement)&&(l=l.namespaceURI)?Kd(l):0;break;default:if(l=t.tagName,t=t.namespaceURI)t=Kd(t),l=Jd(t,l);else switch(l){case"svg":l=1;break;case"math":l=2;break;default:l=0}}z(N),_(N,l)}function rl(){z(N),z(B),z(L)}function ol(l){l.memoizedState!==null&&_(tl,l);var t=N.current,a=Jd(t,l.type);t!==a&&(_(B,l),_(N,a))}function $a(l){B.current===l&&(z(N),z(B)),tl.current===l&&(z(tl),Uu._currentValue=H)}var qe,qu;function Zt(l){if(qe===void 0)try{throw Error()}catch(a){var t=a.stack.trim().match(/\n( *(at )?)/);qe=t&&t[1]||"",qu=-1<a.stack.indexOf(`
-    at`)?" (<anonymous>)":-1<a.stack.indexOf("@")?"@unknown:0:0":""}return`
-`+qe+l+qu}var Ye=!1;function Be(l,t){if(!l||Ye)return"";Ye=!0;var a=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var e={DetermineComponentFrameRoot:function(){try{if(t){var E=function(){throw Error()};if(Object.defineProperty(E.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(E,[])}catch(r){var y=r}Reflect.construct(l,[],E)}else{try{E.call()}catch(r){y=r}l.call(E.prototype)}}else{try{throw Error()}catch(r){y=r}(E=l())&&typeof E.catch=="function"&&E.catch(function(){})}}catch(r){if(r&&y&&typeof r.stack=="string")return[r.stack,y.stack]}return[null,null]}};e.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var u=Object.getOwnPropertyDescriptor(e.DetermineComponentFrameRoot,"name");u&&u.configurable&&Object.defineProperty(e.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var n=e.DetermineComponentFrameRoot(),c=n[0],i=n[1];if(c&&i){var f=c.split(`
-`),v=i.split(`
-`);for(u=e=0;e<f.length&&!f[e].includes("DetermineComponentFrameRoot");)e++;for(;u<v.length&&!v[u].includes("DetermineComponentFrameRoot");)u++;if(e===f.length||u===v.length)for(e=f.length-1,u=v.length-1;1<=e&&0<=u&&f[e]!==v[u];)u--;for(;1<=e&&0<=u;e--,u--)if(f[e]!==v[u]){if(e!==1||u!==1)do if(e--,u--,0>u||f[e]!==v[u]){var S=`
-`+f[e].replace(" at new "," at ");return l.displayName&&S.includes("<anonymous>")&&(S=S.replace("<anonymous>",l.displayName)),S}while(1<=e&&0<=u);break}}}finally{Ye=!1,Error.prepareStackTrace=a}return(a=l?l.displayName||l.name:"")?Zt(a):""}function Yu(l,t){switch(l.tag){case 26:case 27:case 5:return Zt(l.type);case 16:return Zt("Lazy");case 13:return l.child!==t&&t!==null?Zt("Suspense Fallback"):Zt("Suspense");case 19:return Zt("SuspenseList");case 0:case 15:return Be(l.type,!1);case 11:return Be(l.type.render,!1);case 1:return Be(l.type,!0);case 31:return Zt("Activity");default:return""}}function Bu(l){try{var t="",a=null;do t+=Yu(l,a),a=l,l=l.return;while(l);return t}catch(e){return`
-Error generating stack: `+e.message+`
-`+e.stack}}var Qe=Object.prototype.hasOwnProperty,Ge=M.unstable_scheduleCallback,Xe=M.unstable_cancelCallback,uc=M.unstable_shouldYield,Qu=M.unstable_requestPaint,Zl=M.unstable_now,Ze=M.unstable_getCurrentPriorityLevel,ka=M.unstable_ImmediatePriority,Fa=M.unstable_UserBlockingPriority,A=M.unstable_NormalPriority,j=M.unstable_LowPriority,jl=M.unstable_IdlePriority,P=M.log,Al=M.unstable_setDisableYieldValue,Ml=null,gl=null;function jt(l){if(typeof P=="function"&&Al(l),gl&&typeof gl.setStrictMode=="function")try{gl.setStrictMode(Ml,l)}catch{}}var Yl=Math.clz32?Math.clz32:Y0,j0=Math.log,q0=Math.LN2;function Y0(l){return l>>>=0,l===0?32:31-(j0(l)/q0|0)|0}var Gu=256,Xu=262144,Zu=4194304;function xa(l){var t=l&42;if(t!==0)return t;switch(l&-l){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:return l&261888;case 262144:case 524288:case 1048576:case 2097152:return l&3932160;case 4194304:case 8388608:case 16777216:case 33554432:return l&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return l}}function Lu(l,t,a){var e=l.pendingLanes;if(e===0)return 0;var u=0,n=l.suspendedLanes,c=l.pingedLanes;l=l.warmLanes;var i=e&134217727;return i!==0?(e=i&~n,e!==0?u=xa(e):(c&=i,c!==0?u=xa(c):a||(a=i&~l,a!==0&&(u=xa(a))))):(i=e&~n,i!==0?u=xa(i):c!==0?u=xa(c):a||(a=e&~l,a!==0&&(u=xa(a)))),u===0?0:t!==0&&t!==u&&(t&n)===0&&(n=u&-u,a=t&-t,n>=a||n===32&&(a&4194048)!==0)?t:u}function Le(l,t){return(l.pendingLanes&~(l.suspendedLanes&~l.pingedLanes)&t)===0}function B0(l,t){switch(l){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function _f(){var l=Zu;return Zu<<=1,(Zu&62914560)===0&&(Zu=4194304),l}function nc(l){for(var t=[],a=0;31>a;a++)t.push(l);return t}function Ve(l,t){l.pendingLanes|=t,t!==268435456&&(l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0)}function Q0(l,t,a,e,u,n){var c=l.pendingLanes;l.pendingLanes=a,l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0,l.expiredLanes&=a,l.entangledLanes&=a,l.errorRecoveryDisabledLanes&=a,l.shellSuspendCounter=0;var i=l.entanglements,f=l.expirationTimes,v=l.hiddenUpdates;for(a=c&~a;0<a;){var S=31-Yl(a),E=1<<S;i[S]=0,f[S]=-1;var y=v[S];if(y!==null)for(v[S]=null,S=0;S<y.length;S++){var r=y[S];r!==null&&(r.lane&=-536870913)}a&=~E}e!==0&&Of(l,e,0),n!==0&&u===0&&l.tag!==0&&(l.suspendedLanes|=n&~(c&~t))}function Of(l,t,a){l.pendingLanes|=t,l.suspendedLanes&=~t;var e=31-Yl(t);l.entangledLanes|=t,l.entanglements[e]=l.entanglements[e]|1073741824|a&261930}function Mf(l,t){var a=l.entangledLanes|=t;for(l=l.entanglements;a;){var e=31-Yl(a),u=1<<e;u&t|l[e]&t&&(l[e]|=t),a&=~u}}function Df(l,t){var a=t&-t;return a=(a&42)!==0?1:cc(a),(a&(l.suspendedLanes|t))!==0?0:a}function cc(l){switch(l){case 2:l=1;break;case 8:l=4;break;case 32:l=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:l=128;break;case 268435456:l=134217728;break;default:l=0}return l}function ic(l){return l&=-l,2<l?8<l?(l&134217727)!==0?32:268435456:8:2}function Nf(){var l=O.p;return l!==0?l:(l=window.event,l===void 0?32:h0(l.type))}function Uf(l,t){var a=O.p;try{return O.p=l,t()}finally{O.p=a}}var ia=Math.random().toString(36).slice(2),Ll="__reactFiber$"+ia,et="__reactProps$"+ia,Ia="__reactContainer$"+ia,fc="__reactEvents$"+ia,G0="__reactListeners$"+ia,X0="__reactHandles$"+ia,xf="__reactResources$"+ia,Ke="__reactMarker$"+ia;function sc(l){delete l[Ll],delete l[et],delete l[fc],delete l[G0],delete l[X0]}function Pa(l){var t=l[Ll];if(t)return t;for(var a=l.parentNode;a;){if(t=a[Ia]||a[Ll]){if(a=t.alternate,t.child!==null||a!==null&&a.child!==null)for(l=Pd(l);l!==null;){if(a=l[Ll])return a;l=Pd(l)}return t}l=a,a=l.parentNode}return null}function le(l){if(l=l[Ll]||l[Ia]){var t=l.tag;if(t===5||t===6||t===13||t===31||t===26||t===27||t===3)return l}return null}function Je(l){var t=l.tag;if(t===5||t===26||t===27||t===6)return l.stateNode;throw Error(h(33))}function te(l){var t=l[xf];return t||(t=l[xf]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function Bl(l){l[Ke]=!0}var Cf=new Set,Rf={};function Ca(l,t){ae(l,t),ae(l+"Capture",t)}function ae(l,t){for(Rf[l]=t,l=0;l<t.length;l++)Cf.add(t[l])}var Z0=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),Hf={},jf={};function L0(l){return Qe.call(jf,l)?!0:Qe.call(Hf,l)?!1:Z0.test(l)?jf[l]=!0:(Hf[l]=!0,!1)}function Vu(l,t,a){if(L0(t))if(a===null)l.removeAttribute(t);else{switch(typeof a){case"undefined":case"function":case"symbol":l.removeAttribute(t);return;case"boolean":var e=t.toLowerCase().slice(0,5);if(e!=="data-"&&e!=="aria-"){l.removeAttribute(t);return}}l.setAttribute(t,""+a)}}function Ku(l,t,a){if(a===null)l.removeAttribute(t);else{switch(typeof a){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(t);return}l.setAttribute(t,""+a)}}function Lt(l,t,a,e){if(e===null)l.removeAttribute(a);else{switch(typeof e){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(a);return}l.setAttributeNS(t,a,""+e)}}function zt(l){switch(typeof l){case"bigint":case"boolean":case"number":case"string":case"undefined":return l;case"object":return l;default:return""}}function qf(l){var t=l.type;return(l=l.nodeName)&&l.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function V0(l,t,a){var e=Object.getOwnPropertyDescriptor(l.constructor.prototype,t);if(!l.hasOwnProperty(t)&&typeof e<"u"&&typeof e.get=="function"&&typeof e.set=="function"){var u=e.get,n=e.set;return Object.defineProperty(l,t,{configurable:!0,get:function(){return u.call(this)},set:function(c){a=""+c,n.call(this,c)}}),Object.defineProperty(l,t,{enumerable:e.enumerable}),{getValue:function(){return a},setValue:function(c){a=""+c},stopTracking:function(){l._valueTracker=null,delete l[t]}}}}function oc(l){if(!l._valueTracker){var t=qf(l)?"checked":"value";l._valueTracker=V0(l,t,""+l[t])}}function Yf(l){if(!l)return!1;var t=l._valueTracker;if(!t)return!0;var a=t.getValue(),e="";return l&&(e=qf(l)?l.checked?"true":"false":l.value),l=e,l!==a?(t.setValue(l),!0):!1}function Ju(l){if(l=l||(typeof document<"u"?document:void 0),typeof l>"u")return null;try{return l.activeElement||l.body}catch{return l.body}}var K0=/[\n"\\]/g;function pt(l){return l.replace(K0,function(t){return"\\"+t.charCodeAt(0).toString(16)+" "})}function dc(l,t,a,e,u,n,c,i){l.name="",c!=null&&typeof c!="function"&&typeof c!="symbol"&&typeof c!="boolean"?l.type=c:l.removeAttribute("type"),t!=null?c==="number"?(t===0&&l.value===""||l.value!=t)&&(l.value=""+zt(t)):l.value!==""+zt(t)&&(l.value=""+zt(t)):c!=="submit"&&c!=="reset"||l.removeAttribute("value"),t!=null?mc(l,c,zt(t)):a!=null?mc(l,c,zt(a)):e!=null&&l.removeAttribute("value"),u==null&&n!=null&&(l.defaultChecked=!!n),u!=null&&(l.checked=u&&typeof u!="function"&&typeof u!="symbol"),i!=null&&typeof i!="function"&&typeof i!="symbol"&&typeof i!="boolean"?l.name=""+zt(i):l.removeAttribute("name")}function Bf(l,t,a,e,u,n,c,i){if(n!=null&&typeof n!="function"&&typeof n!="symbol"&&typeof n!="boolean"&&(l.type=n),t!=null||a!=null){if(!(n!=="submit"&&n!=="reset"||t!=null)){oc(l);return}a=a!=null?""+zt(a):"",t=t!=null?""+zt(t):a,i||t===l.value||(l.value=t),l.defaultValue=t}e=e??u,e=typeof e!="function"&&typeof e!="symbol"&&!!e,l.checked=i?l.checked:!!e,l.defaultChecked=!!e,c!=null&&typeof c!="function"&&typeof c!="symbol"&&typeof c!="boolean"&&(l.name=c),oc(l)}function mc(l,t,a){t==="number"&&Ju(l.ownerDocument)===l||l.defaultValue===""+a||(l.defaultValue=""+a)}function ee(l,t,a,e){if(l=l.options,t){t={};for(var u=0;u<a.length;u++)t["$"+a[u]]=!0;for(a=0;a<l.length;a++)u=t.hasOwnProperty("$"+l[a].value),l[a].selected!==u&&(l[a].selected=u),u&&e&&(l[a].defaultSelected=!0)}else{for(a=""+zt(a),t=null,u=0;u<l.length;u++){if(l[u].value===a){l[u].selected=!0,e&&(l[u].defaultSelected=!0);return}t!==null||l[u].disabled||(t=l[u])}t!==null&&(t.selected=!0)}}function Qf(l,t,a){if(t!=null&&(t=""+zt(t),t!==l.value&&(l.value=t),a==null)){l.defaultValue!==t&&(l.defaultValue=t);return}l.defaultValue=a!=null?""+zt(a):""}function Gf(l,t,a,e){if(t==null){if(e!=null){if(a!=null)throw Error(h(92));if(Pl(e)){if(1<e.length)throw Error(h(93));e=e[0]}a=e}a==null&&(a=""),t=a}a=zt(t),l.defaultValue=a,e=l.textContent,e===a&&e!==""&&e!==null&&(l.value=e),oc(l)}function ue(l,t){if(t){var a=l.firstChild;if(a&&a===l.lastChild&&a.nodeType===3){a.nodeValue=t;return}}l.textContent=t}var J0=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function Xf(l,t,a){var e=t.indexOf("--")===0;a==null||typeof a=="boolean"||a===""?e?l.setProperty(t,""):t==="float"?l.cssFloat="":l[t]="":e?l.setProperty(t,a):typeof a!="number"||a===0||J0.has(t)?t==="float"?l.cssFloat=a:l[t]=(""+a).trim():l[t]=a+"px"}function Zf(l,t,a){if(t!=null&&typeof t!="object")throw Error(h(62));if(l=l.style,a!=null){for(var e in a)!a.hasOwnProperty(e)||t!=null&&t.hasOwnProperty(e)||(e.indexOf("--")===0?l.setProperty(e,""):e==="float"?l.cssFloat="":l[e]="");for(var u in t)e=t[u],t.hasOwnProperty(u)&&a[u]!==e&&Xf(l,u,e)}else for(var n in t)t.hasOwnProperty(n)&&Xf(l,n,t[n])}function vc(l){if(l.indexOf("-")===-1)return!1;switch(l){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var w0=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),W0=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function wu(l){return W0.test(""+l)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":l}function Vt(){}var yc=null;function hc(l){return l=l.target||l.srcElement||window,l.correspondingUseElement&&(l=l.correspondingUseElement),l.nodeType===3?l.parentNode:l}var ne=null,ce=null;function Lf(l){var t=le(l);if(t&&(l=t.stateNode)){var a=l[et]||null;l:switch(l=t.stateNode,t.type){case"input":if(dc(l,a.value,a.defaultValue,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name),t=a.name,a.type==="radio"&&t!=null){for(a=l;a.parentNode;)a=a.parentNode;for(a=a.querySelectorAll('input[name="'+pt(""+t)+'"][type="radio"]'),t=0;t<a.length;t++){var e=a[t];if(e!==l&&e.form===l.form){var u=e[et]||null;if(!u)throw Error(h(90));dc(e,u.value,u.defaultValue,u.defaultValue,u.checked,u.defaultChecked,u.type,u.name)}}for(t=0;t<a.length;t++)e=a[t],e.form===l.form&&Yf(e)}break l;case"textarea":Qf(l,a.value,a.defaultValue);break l;case"select":t=a.value,t!=null&&ee(l,!!a.multiple,t,!1)}}}var rc=!1;function Vf(l,t,a){if(rc)return l(t,a);rc=!0;try{var e=l(t);return e}finally{if(rc=!1,(ne!==null||ce!==null)&&(jn(),ne&&(t=ne,l=ce,ce=ne=null,Lf(t),l)))for(t=0;t<l.length;t++)Lf(l[t])}}function we(l,t){var a=l.stateNode;if(a===null)return null;var e=a[et]||null;if(e===null)return null;a=e[t];l:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(e=!e.disabled)||(l=l.type,e=!(l==="button"||l==="input"||l==="select"||l==="textarea")),l=!e;break l;default:l=!1}if(l)return null;if(a&&typeof a!="function")throw Error(h(231,t,typeof a));return a}var Kt=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),gc=!1;if(Kt)try{var We={};Object.defineProperty(We,"passive",{get:function(){gc=!0}}),window.addEventListener("test",We,We),window.removeEventListener("test",We,We)}catch{gc=!1}var fa=null,Sc=null,Wu=null;function Kf(){if(Wu)return Wu;var l,t=Sc,a=t.length,e,u="value"in fa?fa.value:fa.textContent,n=u.length;for(l=0;l<a&&t[l]===u[l];l++);var c=a-l;for(e=1;e<=c&&t[a-e]===u[n-e];e++);return Wu=u.slice(l,1<e?1-e:void 0)}function $u(l){var t=l.keyCode;return"charCode"in l?(l=l.charCode,l===0&&t===13&&(l=13)):l=t,l===10&&(l=13),32<=l||l===13?l:0}function ku(){return!0}function Jf(){return!1}function ut(l){function t(a,e,u,n,c){this._reactName=a,this._targetInst=u,this.type=e,this.nativeEvent=n,this.target=c,this.currentTarget=null;for(var i in l)l.hasOwnProperty(i)&&(a=l[i],this[i]=a?a(n):n[i]);return this.isDefaultPrevented=(n.defaultPrevented!=null?n.defaultPrevented:n.returnValue===!1)?ku:Jf,this.isPropagationStopped=Jf,this}return C(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var a=this.nativeEvent;a&&(a.preventDefault?a.preventDefault():typeof a.returnValue!="unknown"&&(a.returnValue=!1),this.isDefaultPrevented=ku)},stopPropagation:function(){var a=this.nativeEvent;a&&(a.stopPropagation?a.stopPropagation():typeof a.cancelBubble!="unknown"&&(a.cancelBubble=!0),this.isPropagationStopped=ku)},persist:function(){},isPersistent:ku}),t}var Ra={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(l){return l.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Fu=ut(Ra),$e=C({},Ra,{view:0,detail:0}),$0=ut($e),bc,Ec,ke,Iu=C({},$e,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:pc,button:0,buttons:0,relatedTarget:function(l){return l.relatedTarget===void 0?l.fromElement===l.srcElement?l.toElement:l.fromElement:l.relatedTarget},movementX:function(l){return"movementX"in l?l.movementX:(l!==ke&&(ke&&l.type==="mousemove"?(bc=l.screenX-ke.screenX,Ec=l.screenY-ke.screenY):Ec=bc=0,ke=l),bc)},movementY:function(l){return"movementY"in l?l.movementY:Ec}}),wf=ut(Iu),k0=C({},Iu,{dataTransfer:0}),F0=ut(k0),I0=C({},$e,{relatedTarget:0}),zc=ut(I0),P0=C({},Ra,{animationName:0,elapsedTime:0,pseudoElement:0}),lm=ut(P0),tm=C({},Ra,{clipboardData:function(l){return"clipboardData"in l?l.clipboardData:window.clipboardData}}),am=ut(tm),em=C({},Ra,{data:0}),Wf=ut(em),um={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},nm={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},cm={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function im(l){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(l):(l=cm[l])?!!t[l]:!1}function pc(){return im}var fm=C({},$e,{key:function(l){if(l.key){var t=um[l.key]||l.key;if(t!=="Unidentified")return t}return l.type==="keypress"?(l=$u(l),l===13?"Enter":String.fromCharCode(l)):l.type==="keydown"||l.type==="keyup"?nm[l.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:pc,charCode:function(l){return l.type==="keypress"?$u(l):0},keyCode:function(l){return l.type==="keydown"||l.type==="keyup"?l.keyCode:0},which:function(l){return l.type==="keypress"?$u(l):l.type==="keydown"||l.type==="keyup"?l.keyCode:0}}),sm=ut(fm),om=C({},Iu,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),$f=ut(om),dm=C({},$e,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:pc}),mm=ut(dm),vm=C({},Ra,{propertyName:0,elapsedTime:0,pseudoElement:0}),ym=ut(vm),hm=C({},Iu,{deltaX:function(l){return"deltaX"in l?l.deltaX:"wheelDeltaX"in l?-l.wheelDeltaX:0},deltaY:function(l){return"deltaY"in l?l.deltaY:"wheelDeltaY"in l?-l.wheelDeltaY:"wheelDelta"in l?-l.wheelDelta:0},deltaZ:0,deltaMode:0}),rm=ut(hm),gm=C({},Ra,{newState:0,oldState:0}),Sm=ut(gm),bm=[9,13,27,32],Tc=Kt&&"CompositionEvent"in window,Fe=null;Kt&&"documentMode"in document&&(Fe=document.documentMode);var Em=Kt&&"TextEvent"in window&&!Fe,kf=Kt&&(!Tc||Fe&&8<Fe&&11>=Fe),Ff=" ",If=!1;function Pf(l,t){switch(l){case"keyup":return bm.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function ls(l){return l=l.detail,typeof l=="object"&&"data"in l?l.data:null}var ie=!1;function zm(l,t){switch(l){case"compositionend":return ls(t);case"keypress":return t.which!==32?null:(If=!0,Ff);case"textInput":return l=t.data,l===Ff&&If?null:l;default:return null}}function pm(l,t){if(ie)return l==="compositionend"||!Tc&&Pf(l,t)?(l=Kf(),Wu=Sc=fa=null,ie=!1,l):null;switch(l){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return kf&&t.locale!=="ko"?null:t.data;default:return null}}var Tm={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function ts(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t==="input"?!!Tm[l.type]:t==="textarea"}function as(l,t,a,e){ne?ce?ce.push(e):ce=[e]:ne=e,t=Zn(t,"onChange"),0<t.length&&(a=new Fu("onChange","change",null,a,e),l.push({event:a,listeners:t}))}var Ie=null,Pe=null;function Am(l){Qd(l,0)}function Pu(l){var t=Je(l);if(Yf(t))return l}function es(l,t){if(l==="change")return t}var us=!1;if(Kt){var Ac;if(Kt){var _c="oninput"in document;if(!_c){var ns=document.createElement("div");ns.setAttribute("oninput","return;"),_c=typeof ns.oninput=="function"}Ac=_c}else Ac=!1;us=Ac&&(!document.documentMode||9<document.documentMode)}function cs(){Ie&&(Ie.detachEvent("onpropertychange",is),Pe=Ie=null)}function is(l){if(l.propertyName==="value"&&Pu(Pe)){var t=[];as(t,Pe,l,hc(l)),Vf(Am,t)}}function _m(l,t,a){l==="focusin"?(cs(),Ie=t,Pe=a,Ie.attachEvent("onpropertychange",is)):l==="focusout"&&cs()}function Om(l){if(l==="selectionchange"||l==="keyup"||l==="keydown")return Pu(Pe)}function Mm(l,t){if(l==="click")return Pu(t)}function Dm(l,t){if(l==="input"||l==="change")return Pu(t)}function Nm(l,t){return l===t&&(l!==0||1/l===1/t)||l!==l&&t!==t}var dt=typeof Object.is=="function"?Object.is:Nm;function lu(l,t){if(dt(l,t))return!0;if(typeof l!="object"||l===null||typeof t!="object"||t===null)return!1;var a=Object.keys(l),e=Object.keys(t);if(a.length!==e.length)return!1;for(e=0;e<a.length;e++){var u=a[e];if(!Qe.call(t,u)||!dt(l[u],t[u]))return!1}return!0}function fs(l){for(;l&&l.firstChild;)l=l.firstChild;return l}function ss(l,t){var a=fs(l);l=0;for(var e;a;){if(a.nodeType===3){if(e=l+a.textContent.length,l<=t&&e>=t)return{node:a,offset:t-l};l=e}l:{for(;a;){if(a.nextSibling){a=a.nextSibling;break l}a=a.parentNode}a=void 0}a=fs(a)}}function os(l,t){return l&&t?l===t?!0:l&&l.nodeType===3?!1:t&&t.nodeType===3?os(l,t.parentNode):"contains"in l?l.contains(t):l.compareDocumentPosition?!!(l.compareDocumentPosition(t)&16):!1:!1}function ds(l){l=l!=null&&l.ownerDocument!=null&&l.ownerDocument.defaultView!=null?l.ownerDocument.defaultView:window;for(var t=Ju(l.document);t instanceof l.HTMLIFrameElement;){try{var a=typeof t.contentWindow.location.href=="string"}catch{a=!1}if(a)l=t.contentWindow;else break;t=Ju(l.document)}return t}function Oc(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t&&(t==="input"&&(l.type==="text"||l.type==="search"||l.type==="tel"||l.type==="url"||l.type==="password")||t==="textarea"||l.contentEditable==="true")}var Um=Kt&&"documentMode"in document&&11>=document.documentMode,fe=null,Mc=null,tu=null,Dc=!1;function ms(l,t,a){var e=a.window===a?a.document:a.nodeType===9?a:a.ownerDocument;Dc||fe==null||fe!==Ju(e)||(e=fe,"selectionStart"in e&&Oc(e)?e={start:e.selectionStart,end:e.selectionEnd}:(e=(e.ownerDocument&&e.ownerDocument.defaultView||window).getSelection(),e={anchorNode:e.anchorNode,anchorOffset:e.anchorOffset,focusNode:e.focusNode,focusOffset:e.focusOffset}),tu&&lu(tu,e)||(tu=e,e=Zn(Mc,"onSelect"),0<e.length&&(t=new Fu("onSelect","select",null,t,a),l.push({event:t,listeners:e}),t.target=fe)))}function Ha(l,t){var a={};return a[l.toLowerCase()]=t.toLowerCase(),a["Webkit"+l]="webkit"+t,a["Moz"+l]="moz"+t,a}var se={animationend:Ha("Animation","AnimationEnd"),animationiteration:Ha("Animation","AnimationIteration"),animationstart:Ha("Animation","AnimationStart"),transitionrun:Ha("Transition","TransitionRun"),transitionstart:Ha("Transition","TransitionStart"),transitioncancel:Ha("Transition","TransitionCancel"),transitionend:Ha("Transition","TransitionEnd")},Nc={},vs={};Kt&&(vs=document.createElement("div").style,"AnimationEvent"in window||(delete se.animationend.animation,delete se.animationiteration.animation,delete se.animationstart.animation),"TransitionEvent"in window||delete se.transitionend.transition);function ja(l){if(Nc[l])return Nc[l];if(!se[l])return l;var t=se[l],a;for(a in t)if(t.hasOwnProperty(a)&&a in vs)return Nc[l]=t[a];return l}var ys=ja("animationend"),hs=ja("animationiteration"),rs=ja("animationstart"),xm=ja("transitionrun"),Cm=ja("transitionstart"),Rm=ja("transitioncancel"),gs=ja("transitionend"),Ss=new Map,Uc="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");Uc.push("scrollEnd");function Ct(l,t){Ss.set(l,t),Ca(t,[l])}var ln=typeof reportError=="function"?reportError:function(l){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof l=="object"&&l!==null&&typeof l.message=="string"?String(l.message):String(l),error:l});if(!window.dispatchEvent(t))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",l);return}console.error(l)},Tt=[],oe=0,xc=0;function tn(){for(var l=oe,t=xc=oe=0;t<l;){var a=Tt[t];Tt[t++]=null;var e=Tt[t];Tt[t++]=null;var u=Tt[t];Tt[t++]=null;var n=Tt[t];if(Tt[t++]=null,e!==null&&u!==null){var c=e.pending;c===null?u.next=u:(u.next=c.next,c.next=u),e.pending=u}n!==0&&bs(a,u,n)}}function an(l,t,a,e){Tt[oe++]=l,Tt[oe++]=t,Tt[oe++]=a,Tt[oe++]=e,xc|=e,l.lanes|=e,l=l.alternate,l!==null&&(l.lanes|=e)}function Cc(l,t,a,e){return an(l,t,a,e),en(l)}function qa(l,t){return an(l,null,null,t),en(l)}function bs(l,t,a){l.lanes|=a;var e=l.alternate;e!==null&&(e.lanes|=a);for(var u=!1,n=l.return;n!==null;)n.childLanes|=a,e=n.alternate,e!==null&&(e.childLanes|=a),n.tag===22&&(l=n.stateNode,l===null||l._visibility&1||(u=!0)),l=n,n=n.return;return l.tag===3?(n=l.stateNode,u&&t!==null&&(u=31-Yl(a),l=n.hiddenUpdates,e=l[u],e===null?l[u]=[t]:e.push(t),t.lane=a|536870912),n):null}function en(l){if(50<Tu)throw Tu=0,Xi=null,Error(h(185));for(var t=l.return;t!==null;)l=t,t=l.return;return l.tag===3?l.stateNode:null}var de={};function Hm(l,t,a,e){this.tag=l,this.key=a,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=e,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function mt(l,t,a,e){return new Hm(l,t,a,e)}function Rc(l){return l=l.prototype,!(!l||!l.isReactComponent)}function Jt(l,t){var a=l.alternate;return a===null?(a=mt(l.tag,t,l.key,l.mode),a.elementType=l.elementType,a.type=l.type,a.stateNode=l.stateNode,a.alternate=l,l.alternate=a):(a.pendingProps=t,a.type=l.type,a.flags=0,a.subtreeFlags=0,a.deletions=null),a.flags=l.flags&65011712,a.childLanes=l.childLanes,a.lanes=l.lanes,a.child=l.child,a.memoizedProps=l.memoizedProps,a.memoizedState=l.memoizedState,a.updateQueue=l.updateQueue,t=l.dependencies,a.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},a.sibling=l.sibling,a.index=l.index,a.ref=l.ref,a.refCleanup=l.refCleanup,a}function Es(l,t){l.flags&=65011714;var a=l.alternate;return a===null?(l.childLanes=0,l.lanes=t,l.child=null,l.subtreeFlags=0,l.memoizedProps=null,l.memoizedState=null,l.updateQueue=null,l.dependencies=null,l.stateNode=null):(l.childLanes=a.childLanes,l.lanes=a.lanes,l.child=a.child,l.subtreeFlags=0,l.deletions=null,l.memoizedProps=a.memoizedProps,l.memoizedState=a.memoizedState,l.updateQueue=a.updateQueue,l.type=a.type,t=a.dependencies,l.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext}),l}function un(l,t,a,e,u,n){var c=0;if(e=l,typeof l=="function")Rc(l)&&(c=1);else if(typeof l=="string")c=Qv(l,a,N.current)?26:l==="html"||l==="head"||l==="body"?27:5;else l:switch(l){case ot:return l=mt(31,a,t,u),l.elementType=ot,l.lanes=n,l;case Gl:return Ya(a.children,u,n,t);case xt:c=8,u|=24;break;case Il:return l=mt(12,a,t,u|2),l.elementType=Il,l.lanes=n,l;case bt:return l=mt(13,a,t,u),l.elementType=bt,l.lanes=n,l;case Xl:return l=mt(19,a,t,u),l.elementType=Xl,l.lanes=n,l;default:if(typeof l=="object"&&l!==null)switch(l.$$typeof){case Hl:c=10;break l;case St:c=9;break l;case tt:c=11;break l;case K:c=14;break l;case $l:c=16,e=null;break l}c=29,a=Error(h(130,l===null?"null":typeof l,"")),e=null}return t=mt(c,a,t,u),t.elementType=l,t.type=e,t.lanes=n,t}function Ya(l,t,a,e){return l=mt(7,l,e,t),l.lanes=a,l}function Hc(l,t,a){return l=mt(6,l,null,t),l.lanes=a,l}function zs(l){var t=mt(18,null,null,0);return t.stateNode=l,t}function jc(l,t,a){return t=mt(4,l.children!==null?l.children:[],l.key,t),t.lanes=a,t.stateNode={containerInfo:l.containerInfo,pendingChildren:null,implementation:l.implementation},t}var ps=new WeakMap;function At(l,t){if(typeof l=="object"&&l!==null){var a=ps.get(l);return a!==void 0?a:(t={value:l,source:t,stack:Bu(t)},ps.set(l,t),t)}return{value:l,source:t,stack:Bu(t)}}var me=[],ve=0,nn=null,au=0,_t=[],Ot=0,sa=null,qt=1,Yt="";function wt(l,t){me[ve++]=au,me[ve++]=nn,nn=l,au=t}function Ts(l,t,a){_t[Ot++]=qt,_t[Ot++]=Yt,_t[Ot++]=sa,sa=l;var e=qt;l=Yt;var u=32-Yl(e)-1;e&=~(1<<u),a+=1;var n=32-Yl(t)+u;if(30<n){var c=u-u%5;n=(e&(1<<c)-1).toString(32),e>>=c,u-=c,qt=1<<32-Yl(t)+u|a<<u|e,Yt=n+l}else qt=1<<n|a<<u|e,Yt=l}function qc(l){l.return!==null&&(wt(l,1),Ts(l,1,0))}function Yc(l){for(;l===nn;)nn=me[--ve],me[ve]=null,au=me[--ve],me[ve]=null;for(;l===sa;)sa=_t[--Ot],_t[Ot]=null,Yt=_t[--Ot],_t[Ot]=null,qt=_t[--Ot],_t[Ot]=null}function As(l,t){_t[Ot++]=qt,_t[Ot++]=Yt,_t[Ot++]=sa,qt=t.id,Yt=t.overflow,sa=l}var Vl=null,Sl=null,F=!1,oa=null,Mt=!1,Bc=Error(h(519));function da(l){var t=Error(h(418,1<arguments.length&&arguments[1]!==void 0&&arguments[1]?"text":"HTML",""));throw eu(At(t,l)),Bc}function _s(l){var t=l.stateNode,a=l.type,e=l.memoizedProps;switch(t[Ll]=l,t[et]=e,a){case"dialog":w("cancel",t),w("close",t);break;case"iframe":case"object":case"embed":w("load",t);break;case"video":case"audio":for(a=0;a<_u.length;a++)w(_u[a],t);break;case"source":w("error",t);break;case"img":case"image":case"link":w("error",t),w("load",t);break;case"details":w("toggle",t);break;case"input":w("invalid",t),Bf(t,e.value,e.defaultValue,e.checked,e.defaultChecked,e.type,e.name,!0);break;case"select":w("invalid",t);break;case"textarea":w("invalid",t),Gf(t,e.value,e.defaultValue,e.children)}a=e.children,typeof a!="string"&&typeof a!="number"&&typeof a!="bigint"||t.textContent===""+a||e.suppressHydrationWarning===!0||Ld(t.textContent,a)?(e.popover!=null&&(w("beforetoggle",t),w("toggle",t)),e.onScroll!=null&&w("scroll",t),e.onScrollEnd!=null&&w("scrollend",t),e.onClick!=null&&(t.onclick=Vt),t=!0):t=!1,t||da(l,!0)}function Os(l){for(Vl=l.return;Vl;)switch(Vl.tag){case 5:case 31:case 13:Mt=!1;return;case 27:case 3:Mt=!0;return;default:Vl=Vl.return}}function ye(l){if(l!==Vl)return!1;if(!F)return Os(l),F=!0,!1;var t=l.tag,a;if((a=t!==3&&t!==27)&&((a=t===5)&&(a=l.type,a=!(a!=="form"&&a!=="button")||af(l.type,l.memoizedProps)),a=!a),a&&Sl&&da(l),Os(l),t===13){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(h(317));Sl=Id(l)}else if(t===31){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(h(317));Sl=Id(l)}else t===27?(t=Sl,_a(l.type)?(l=ff,ff=null,Sl=l):Sl=t):Sl=Vl?Nt(l.stateNode.nextSibling):null;return!0}function Ba(){Sl=Vl=null,F=!1}function Qc(){var l=oa;return l!==null&&(ft===null?ft=l:ft.push.apply(ft,l),oa=null),l}function eu(l){oa===null?oa=[l]:oa.push(l)}var Gc=o(null),Qa=null,Wt=null;function ma(l,t,a){_(Gc,t._currentValue),t._currentValue=a}function $t(l){l._currentValue=Gc.current,z(Gc)}function Xc(l,t,a){for(;l!==null;){var e=l.alternate;if((l.childLanes&t)!==t?(l.childLanes|=t,e!==null&&(e.childLanes|=t)):e!==null&&(e.childLanes&t)!==t&&(e.childLanes|=t),l===a)break;l=l.return}}function Zc(l,t,a,e){var u=l.child;for(u!==null&&(u.return=l);u!==null;){var n=u.dependencies;if(n!==null){var c=u.child;n=n.firstContext;l:for(;n!==null;){var i=n;n=u;for(var f=0;f<t.length;f++)if(i.context===t[f]){n.lanes|=a,i=n.alternate,i!==null&&(i.lanes|=a),Xc(n.return,a,l),e||(c=null);break l}n=i.next}}else if(u.tag===18){if(c=u.return,c===null)throw Error(h(341));c.lanes|=a,n=c.alternate,n!==null&&(n.lanes|=a),Xc(c,a,l),c=null}else c=u.child;if(c!==null)c.return=u;else for(c=u;c!==null;){if(c===l){c=null;break}if(u=c.sibling,u!==null){u.return=c.return,c=u;break}c=c.return}u=c}}function he(l,t,a,e){l=null;for(var u=t,n=!1;u!==null;){if(!n){if((u.flags&524288)!==0)n=!0;else if((u.flags&262144)!==0)break}if(u.tag===10){var c=u.alternate;if(c===null)throw Error(h(387));if(c=c.memoizedProps,c!==null){var i=u.type;dt(u.pendingProps.value,c.value)||(l!==null?l.push(i):l=[i])}}else if(u===tl.current){if(c=u.alternate,c===null)throw Error(h(387));c.memoizedState.memoizedState!==u.memoizedState.memoizedState&&(l!==null?l.push(Uu):l=[Uu])}u=u.return}l!==null&&Zc(t,l,a,e),t.flags|=262144}function cn(l){for(l=l.firstContext;l!==null;){if(!dt(l.context._currentValue,l.memoizedValue))return!0;l=l.next}return!1}function Ga(l){Qa=l,Wt=null,l=l.dependencies,l!==null&&(l.firstContext=null)}function Kl(l){return Ms(Qa,l)}function fn(l,t){return Qa===null&&Ga(l),Ms(l,t)}function Ms(l,t){var a=t._currentValue;if(t={context:t,memoizedValue:a,next:null},Wt===null){if(l===null)throw Error(h(308));Wt=t,l.dependencies={lanes:0,firstContext:t},l.flags|=524288}else Wt=Wt.next=t;return a}var jm=typeof AbortController<"u"?AbortController:function(){var l=[],t=this.signal={aborted:!1,addEventListener:function(a,e){l.push(e)}};this.abort=function(){t.aborted=!0,l.forEach(function(a){return a()})}},qm=M.unstable_scheduleCallback,Ym=M.unstable_NormalPriority,Ul={$$typeof:Hl,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function Lc(){return{controller:new jm,data:new Map,refCount:0}}function uu(l){l.refCount--,l.refCount===0&&qm(Ym,function(){l.controller.abort()})}var nu=null,Vc=0,re=0,ge=null;function Bm(l,t){if(nu===null){var a=nu=[];Vc=0,re=wi(),ge={status:"pending",value:void 0,then:function(e){a.push(e)}}}return Vc++,t.then(Ds,Ds),t}function Ds(){if(--Vc===0&&nu!==null){ge!==null&&(ge.status="fulfilled");var l=nu;nu=null,re=0,ge=null;for(var t=0;t<l.length;t++)(0,l[t])()}}function Qm(l,t){var a=[],e={status:"pending",value:null,reason:null,then:function(u){a.push(u)}};return l.then(function(){e.status="fulfilled",e.value=t;for(var u=0;u<a.length;u++)(0,a[u])(t)},function(u){for(e.status="rejected",e.reason=u,u=0;u<a.length;u++)(0,a[u])(void 0)}),e}var Ns=g.S;g.S=function(l,t){vd=Zl(),typeof t=="object"&&t!==null&&typeof t.then=="function"&&Bm(l,t),Ns!==null&&Ns(l,t)};var Xa=o(null);function Kc(){var l=Xa.current;return l!==null?l:yl.pooledCache}function sn(l,t){t===null?_(Xa,Xa.current):_(Xa,t.pool)}function Us(){var l=Kc();return l===null?null:{parent:Ul._currentValue,pool:l}}var Se=Error(h(460)),Jc=Error(h(474)),on=Error(h(542)),dn={then:function(){}};function xs(l){return l=l.status,l==="fulfilled"||l==="rejected"}function Cs(l,t,a){switch(a=l[a],a===void 0?l.push(t):a!==t&&(t.then(Vt,Vt),t=a),t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,Hs(l),l;default:if(typeof t.status=="string")t.then(Vt,Vt);else{if(l=yl,l!==null&&100<l.shellSuspendCounter)throw Error(h(482));l=t,l.status="pending",l.then(function(e){if(t.status==="pending"){var u=t;u.status="fulfilled",u.value=e}},function(e){if(t.status==="pending"){var u=t;u.status="rejected",u.reason=e}})}switch(t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,Hs(l),l}throw La=t,Se}}function Za(l){try{var t=l._init;return t(l._payload)}catch(a){throw a!==null&&typeof a=="object"&&typeof a.then=="function"?(La=a,Se):a}}var La=null;function Rs(){if(La===null)throw Error(h(459));var l=La;return La=null,l}function Hs(l){if(l===Se||l===on)throw Error(h(483))}var be=null,cu=0;function mn(l){var t=cu;return cu+=1,be===null&&(be=[]),Cs(be,l,t)}function iu(l,t){t=t.props.ref,l.ref=t!==void 0?t:null}function vn(l,t){throw t.$$typeof===nl?Error(h(525)):(l=Object.prototype.toString.call(t),Error(h(31,l==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":l)))}function js(l){function t(d,s){if(l){var m=d.deletions;m===null?(d.deletions=[s],d.flags|=16):m.push(s)}}function a(d,s){if(!l)return null;for(;s!==null;)t(d,s),s=s.sibling;return null}function e(d){for(var s=new Map;d!==null;)d.key!==null?s.set(d.key,d):s.set(d.index,d),d=d.sibling;return s}function u(d,s){return d=Jt(d,s),d.index=0,d.sibling=null,d}function n(d,s,m){return d.index=m,l?(m=d.alternate,m!==null?(m=m.index,m<s?(d.flags|=67108866,s):m):(d.flags|=67108866,s)):(d.flags|=1048576,s)}function c(d){return l&&d.alternate===null&&(d.flags|=67108866),d}function i(d,s,m,b){return s===null||s.tag!==6?(s=Hc(m,d.mode,b),s.return=d,s):(s=u(s,m),s.return=d,s)}function f(d,s,m,b){var R=m.type;return R===Gl?S(d,s,m.props.children,b,m.key):s!==null&&(s.elementType===R||typeof R=="object"&&R!==null&&R.$$typeof===$l&&Za(R)===s.type)?(s=u(s,m.props),iu(s,m),s.return=d,s):(s=un(m.type,m.key,m.props,null,d.mode,b),iu(s,m),s.return=d,s)}function v(d,s,m,b){return s===null||s.tag!==4||s.stateNode.containerInfo!==m.containerInfo||s.stateNode.implementation!==m.implementation?(s=jc(m,d.mode,b),s.return=d,s):(s=u(s,m.children||[]),s.return=d,s)}function S(d,s,m,b,R){return s===null||s.tag!==7?(s=Ya(m,d.mode,b,R),s.return=d,s):(s=u(s,m),s.return=d,s)}function E(d,s,m){if(typeof s=="string"&&s!==""||typeof s=="number"||typeof s=="bigint")return s=Hc(""+s,d.mode,m),s.return=d,s;if(typeof s=="object"&&s!==null){switch(s.$$typeof){case Fl:return m=un(s.type,s.key,s.props,null,d.mode,m),iu(m,s),m.return=d,m;case Wl:return s=jc(s,d.mode,m),s.return=d,s;case $l:return s=Za(s),E(d,s,m)}if(Pl(s)||pl(s))return s=Ya(s,d.mode,m,null),s.return=d,s;if(typeof s.then=="function")return E(d,mn(s),m);if(s.$$typeof===Hl)return E(d,fn(d,s),m);vn(d,s)}return null}function y(d,s,m,b){var R=s!==null?s.key:null;if(typeof m=="string"&&m!==""||typeof m=="number"||typeof m=="bigint")return R!==null?null:i(d,s,""+m,b);if(typeof m=="object"&&m!==null){switch(m.$$typeof){case Fl:return m.key===R?f(d,s,m,b):null;case Wl:return m.key===R?v(d,s,m,b):null;case $l:return m=Za(m),y(d,s,m,b)}if(Pl(m)||pl(m))return R!==null?null:S(d,s,m,b,null);if(typeof m.then=="function")return y(d,s,mn(m),b);if(m.$$typeof===Hl)return y(d,s,fn(d,m),b);vn(d,m)}return null}function r(d,s,m,b,R){if(typeof b=="string"&&b!==""||typeof b=="number"||typeof b=="bigint")return d=d.get(m)||null,i(s,d,""+b,R);if(typeof b=="object"&&b!==null){switch(b.$$typeof){case Fl:return d=d.get(b.key===null?m:b.key)||null,f(s,d,b,R);case Wl:return d=d.get(b.key===null?m:b.key)||null,v(s,d,b,R);case $l:return b=Za(b),r(d,s,m,b,R)}if(Pl(b)||pl(b))return d=d.get(m)||null,S(s,d,b,R,null);if(typeof b.then=="function")return r(d,s,m,mn(b),R);if(b.$$typeof===Hl)return r(d,s,m,fn(s,b),R);vn(s,b)}return null}function D(d,s,m,b){for(var R=null,al=null,U=s,Z=s=0,$=null;U!==null&&Z<m.length;Z++){U.index>Z?($=U,U=null):$=U.sibling;var el=y(d,U,m[Z],b);if(el===null){U===null&&(U=$);break}l&&U&&el.alternate===null&&t(d,U),s=n(el,s,Z),al===null?R=el:al.sibling=el,al=el,U=$}if(Z===m.length)return a(d,U),F&&wt(d,Z),R;if(U===null){for(;Z<m.length;Z++)U=E(d,m[Z],b),U!==null&&(s=n(U,s,Z),al===null?R=U:al.sibling=U,al=U);return F&&wt(d,Z),R}for(U=e(U);Z<m.length;Z++)$=r(U,d,Z,m[Z],b),$!==null&&(l&&$.alternate!==null&&U.delete($.key===null?Z:$.key),s=n($,s,Z),al===null?R=$:al.sibling=$,al=$);return l&&U.forEach(function(Ua){return t(d,Ua)}),F&&wt(d,Z),R}function q(d,s,m,b){if(m==null)throw Error(h(151));for(var R=null,al=null,U=s,Z=s=0,$=null,el=m.next();U!==null&&!el.done;Z++,el=m.next()){U.index>Z?($=U,U=null):$=U.sibling;var Ua=y(d,U,el.value,b);if(Ua===null){U===null&&(U=$);break}l&&U&&Ua.alternate===null&&t(d,U),s=n(Ua,s,Z),al===null?R=Ua:al.sibling=Ua,al=Ua,U=$}if(el.done)return a(d,U),F&&wt(d,Z),R;if(U===null){for(;!el.done;Z++,el=m.next())el=E(d,el.value,b),el!==null&&(s=n(el,s,Z),al===null?R=el:al.sibling=el,al=el);return F&&wt(d,Z),R}for(U=e(U);!el.done;Z++,el=m.next())el=r(U,d,Z,el.value,b),el!==null&&(l&&el.alternate!==null&&U.delete(el.key===null?Z:el.key),s=n(el,s,Z),al===null?R=el:al.sibling=el,al=el);return l&&U.forEach(function(kv){return t(d,kv)}),F&&wt(d,Z),R}function vl(d,s,m,b){if(typeof m=="object"&&m!==null&&m.type===Gl&&m.key===null&&(m=m.props.children),typeof m=="object"&&m!==null){switch(m.$$typeof){case Fl:l:{for(var R=m.key;s!==null;){if(s.key===R){if(R=m.type,R===Gl){if(s.tag===7){a(d,s.sibling),b=u(s,m.props.children),b.return=d,d=b;break l}}else if(s.elementType===R||typeof R=="object"&&R!==null&&R.$$typeof===$l&&Za(R)===s.type){a(d,s.sibling),b=u(s,m.props),iu(b,m),b.return=d,d=b;break l}a(d,s);break}else t(d,s);s=s.sibling}m.type===Gl?(b=Ya(m.props.children,d.mode,b,m.key),b.return=d,d=b):(b=un(m.type,m.key,m.props,null,d.mode,b),iu(b,m),b.return=d,d=b)}return c(d);case Wl:l:{for(R=m.key;s!==null;){if(s.key===R)if(s.tag===4&&s.stateNode.containerInfo===m.containerInfo&&s.stateNode.implementation===m.implementation){a(d,s.sibling),b=u(s,m.children||[]),b.return=d,d=b;break l}else{a(d,s);break}else t(d,s);s=s.sibling}b=jc(m,d.mode,b),b.return=d,d=b}return c(d);case $l:return m=Za(m),vl(d,s,m,b)}if(Pl(m))return D(d,s,m,b);if(pl(m)){if(R=pl(m),typeof R!="function")throw Error(h(150));return m=R.call(m),q(d,s,m,b)}if(typeof m.then=="function")return vl(d,s,mn(m),b);if(m.$$typeof===Hl)return vl(d,s,fn(d,m),b);vn(d,m)}return typeof m=="string"&&m!==""||typeof m=="number"||typeof m=="bigint"?(m=""+m,s!==null&&s.tag===6?(a(d,s.sibling),b=u(s,m),b.return=d,d=b):(a(d,s),b=Hc(m,d.mode,b),b.return=d,d=b),c(d)):a(d,s)}return function(d,s,m,b){try{cu=0;var R=vl(d,s,m,b);return be=null,R}catch(U){if(U===Se||U===on)throw U;var al=mt(29,U,null,d.mode);return al.lanes=b,al.return=d,al}finally{}}}var Va=js(!0),qs=js(!1),va=!1;function wc(l){l.updateQueue={baseState:l.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function Wc(l,t){l=l.updateQueue,t.updateQueue===l&&(t.updateQueue={baseState:l.baseState,firstBaseUpdate:l.firstBaseUpdate,lastBaseUpdate:l.lastBaseUpdate,shared:l.shared,callbacks:null})}function ya(l){return{lane:l,tag:0,payload:null,callback:null,next:null}}function ha(l,t,a){var e=l.updateQueue;if(e===null)return null;if(e=e.shared,(ul&2)!==0){var u=e.pending;return u===null?t.next=t:(t.next=u.next,u.next=t),e.pending=t,t=en(l),bs(l,null,a),t}return an(l,e,t,a),en(l)}function fu(l,t,a){if(t=t.updateQueue,t!==null&&(t=t.shared,(a&4194048)!==0)){var e=t.lanes;e&=l.pendingLanes,a|=e,t.lanes=a,Mf(l,a)}}function $c(l,t){var a=l.updateQueue,e=l.alternate;if(e!==null&&(e=e.updateQueue,a===e)){var u=null,n=null;if(a=a.firstBaseUpdate,a!==null){do{var c={lane:a.lane,tag:a.tag,payload:a.payload,callback:null,next:null};n===null?u=n=c:n=n.next=c,a=a.next}while(a!==null);n===null?u=n=t:n=n.next=t}else u=n=t;a={baseState:e.baseState,firstBaseUpdate:u,lastBaseUpdate:n,shared:e.shared,callbacks:e.callbacks},l.updateQueue=a;return}l=a.lastBaseUpdate,l===null?a.firstBaseUpdate=t:l.next=t,a.lastBaseUpdate=t}var kc=!1;function su(){if(kc){var l=ge;if(l!==null)throw l}}function ou(l,t,a,e){kc=!1;var u=l.updateQueue;va=!1;var n=u.firstBaseUpdate,c=u.lastBaseUpdate,i=u.shared.pending;if(i!==null){u.shared.pending=null;var f=i,v=f.next;f.next=null,c===null?n=v:c.next=v,c=f;var S=l.alternate;S!==null&&(S=S.updateQueue,i=S.lastBaseUpdate,i!==c&&(i===null?S.firstBaseUpdate=v:i.next=v,S.lastBaseUpdate=f))}if(n!==null){var E=u.baseState;c=0,S=v=f=null,i=n;do{var y=i.lane&-536870913,r=y!==i.lane;if(r?(W&y)===y:(e&y)===y){y!==0&&y===re&&(kc=!0),S!==null&&(S=S.next={lane:0,tag:i.tag,payload:i.payload,callback:null,next:null});l:{var D=l,q=i;y=t;var vl=a;switch(q.tag){case 1:if(D=q.payload,typeof D=="function"){E=D.call(vl,E,y);break l}E=D;break l;case 3:D.flags=D.flags&-65537|128;case 0:if(D=q.payload,y=typeof D=="function"?D.call(vl,E,y):D,y==null)break l;E=C({},E,y);break l;case 2:va=!0}}y=i.callback,y!==null&&(l.flags|=64,r&&(l.flags|=8192),r=u.callbacks,r===null?u.callbacks=[y]:r.push(y))}else r={lane:y,tag:i.tag,payload:i.payload,callback:i.callback,next:null},S===null?(v=S=r,f=E):S=S.next=r,c|=y;if(i=i.next,i===null){if(i=u.shared.pending,i===null)break;r=i,i=r.next,r.next=null,u.lastBaseUpdate=r,u.shared.pending=null}}while(!0);S===null&&(f=E),u.baseState=f,u.firstBaseUpdate=v,u.lastBaseUpdate=S,n===null&&(u.shared.lanes=0),Ea|=c,l.lanes=c,l.memoizedState=E}}function Ys(l,t){if(typeof l!="function")throw Error(h(191,l));l.call(t)}function Bs(l,t){var a=l.callbacks;if(a!==null)for(l.callbacks=null,l=0;l<a.length;l++)Ys(a[l],t)}var Ee=o(null),yn=o(0);function Qs(l,t){l=ua,_(yn,l),_(Ee,t),ua=l|t.baseLanes}function Fc(){_(yn,ua),_(Ee,Ee.current)}function Ic(){ua=yn.current,z(Ee),z(yn)}var vt=o(null),Dt=null;function ra(l){var t=l.alternate;_(Dl,Dl.current&1),_(vt,l),Dt===null&&(t===null||Ee.current!==null||t.memoizedState!==null)&&(Dt=l)}function Pc(l){_(Dl,Dl.current),_(vt,l),Dt===null&&(Dt=l)}function Gs(l){l.tag===22?(_(Dl,Dl.current),_(vt,l),Dt===null&&(Dt=l)):ga()}function ga(){_(Dl,Dl.current),_(vt,vt.current)}function yt(l){z(vt),Dt===l&&(Dt=null),z(Dl)}var Dl=o(0);function hn(l){for(var t=l;t!==null;){if(t.tag===13){var a=t.memoizedState;if(a!==null&&(a=a.dehydrated,a===null||nf(a)||cf(a)))return t}else if(t.tag===19&&(t.memoizedProps.revealOrder==="forwards"||t.memoizedProps.revealOrder==="backwards"||t.memoizedProps.revealOrder==="unstable_legacy-backwards"||t.memoizedProps.revealOrder==="together")){if((t.flags&128)!==0)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var kt=0,X=null,dl=null,xl=null,rn=!1,ze=!1,Ka=!1,gn=0,du=0,pe=null,Gm=0;function _l(){throw Error(h(321))}function li(l,t){if(t===null)return!1;for(var a=0;a<t.length&&a<l.length;a++)if(!dt(l[a],t[a]))return!1;return!0}function ti(l,t,a,e,u,n){return kt=n,X=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,g.H=l===null||l.memoizedState===null?Ao:ri,Ka=!1,n=a(e,u),Ka=!1,ze&&(n=Zs(t,a,e,u)),Xs(l),n}function Xs(l){g.H=yu;var t=dl!==null&&dl.next!==null;if(kt=0,xl=dl=X=null,rn=!1,du=0,pe=null,t)throw Error(h(300));l===null||Cl||(l=l.dependencies,l!==null&&cn(l)&&(Cl=!0))}function Zs(l,t,a,e){X=l;var u=0;do{if(ze&&(pe=null),du=0,ze=!1,25<=u)throw Error(h(301));if(u+=1,xl=dl=null,l.updateQueue!=null){var n=l.updateQueue;n.lastEffect=null,n.events=null,n.stores=null,n.memoCache!=null&&(n.memoCache.index=0)}g.H=_o,n=t(a,e)}while(ze);return n}function Xm(){var l=g.H,t=l.useState()[0];return t=typeof t.then=="function"?mu(t):t,l=l.useState()[0],(dl!==null?dl.memoizedState:null)!==l&&(X.flags|=1024),t}function ai(){var l=gn!==0;return gn=0,l}function ei(l,t,a){t.updateQueue=l.updateQueue,t.flags&=-2053,l.lanes&=~a}function ui(l){if(rn){for(l=l.memoizedState;l!==null;){var t=l.queue;t!==null&&(t.pending=null),l=l.next}rn=!1}kt=0,xl=dl=X=null,ze=!1,du=gn=0,pe=null}function lt(){var l={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return xl===null?X.memoizedState=xl=l:xl=xl.next=l,xl}function Nl(){if(dl===null){var l=X.alternate;l=l!==null?l.memoizedState:null}else l=dl.next;var t=xl===null?X.memoizedState:xl.next;if(t!==null)xl=t,dl=l;else{if(l===null)throw X.alternate===null?Error(h(467)):Error(h(310));dl=l,l={memoizedState:dl.memoizedState,baseState:dl.baseState,baseQueue:dl.baseQueue,queue:dl.queue,next:null},xl===null?X.memoizedState=xl=l:xl=xl.next=l}return xl}function Sn(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function mu(l){var t=du;return du+=1,pe===null&&(pe=[]),l=Cs(pe,l,t),t=X,(xl===null?t.memoizedState:xl.next)===null&&(t=t.alternate,g.H=t===null||t.memoizedState===null?Ao:ri),l}function bn(l){if(l!==null&&typeof l=="object"){if(typeof l.then=="function")return mu(l);if(l.$$typeof===Hl)return Kl(l)}throw Error(h(438,String(l)))}function ni(l){var t=null,a=X.updateQueue;if(a!==null&&(t=a.memoCache),t==null){var e=X.alternate;e!==null&&(e=e.updateQueue,e!==null&&(e=e.memoCache,e!=null&&(t={data:e.data.map(function(u){return u.slice()}),index:0})))}if(t==null&&(t={data:[],index:0}),a===null&&(a=Sn(),X.updateQueue=a),a.memoCache=t,a=t.data[t.index],a===void 0)for(a=t.data[t.index]=Array(l),e=0;e<l;e++)a[e]=Gt;return t.index++,a}function Ft(l,t){return typeof t=="function"?t(l):t}function En(l){var t=Nl();return ci(t,dl,l)}function ci(l,t,a){var e=l.queue;if(e===null)throw Error(h(311));e.lastRenderedReducer=a;var u=l.baseQueue,n=e.pending;if(n!==null){if(u!==null){var c=u.next;u.next=n.next,n.next=c}t.baseQueue=u=n,e.pending=null}if(n=l.baseState,u===null)l.memoizedState=n;else{t=u.next;var i=c=null,f=null,v=t,S=!1;do{var E=v.lane&-536870913;if(E!==v.lane?(W&E)===E:(kt&E)===E){var y=v.revertLane;if(y===0)f!==null&&(f=f.next={lane:0,revertLane:0,gesture:null,action:v.action,hasEagerState:v.hasEagerState,eagerState:v.eagerState,next:null}),E===re&&(S=!0);else if((kt&y)===y){v=v.next,y===re&&(S=!0);continue}else E={lane:0,revertLane:v.revertLane,gesture:null,action:v.action,hasEagerState:v.hasEagerState,eagerState:v.eagerState,next:null},f===null?(i=f=E,c=n):f=f.next=E,X.lanes|=y,Ea|=y;E=v.action,Ka&&a(n,E),n=v.hasEagerState?v.eagerState:a(n,E)}else y={lane:E,revertLane:v.revertLane,gesture:v.gesture,action:v.action,hasEagerState:v.hasEagerState,eagerState:v.eagerState,next:null},f===null?(i=f=y,c=n):f=f.next=y,X.lanes|=E,Ea|=E;v=v.next}while(v!==null&&v!==t);if(f===null?c=n:f.next=i,!dt(n,l.memoizedState)&&(Cl=!0,S&&(a=ge,a!==null)))throw a;l.memoizedState=n,l.baseState=c,l.baseQueue=f,e.lastRenderedState=n}return u===null&&(e.lanes=0),[l.memoizedState,e.dispatch]}function ii(l){var t=Nl(),a=t.queue;if(a===null)throw Error(h(311));a.lastRenderedReducer=l;var e=a.dispatch,u=a.pending,n=t.memoizedState;if(u!==null){a.pending=null;var c=u=u.next;do n=l(n,c.action),c=c.next;while(c!==u);dt(n,t.memoizedState)||(Cl=!0),t.memoizedState=n,t.baseQueue===null&&(t.baseState=n),a.lastRenderedState=n}return[n,e]}function Ls(l,t,a){var e=X,u=Nl(),n=F;if(n){if(a===void 0)throw Error(h(407));a=a()}else a=t();var c=!dt((dl||u).memoizedState,a);if(c&&(u.memoizedState=a,Cl=!0),u=u.queue,oi(Js.bind(null,e,u,l),[l]),u.getSnapshot!==t||c||xl!==null&&xl.memoizedState.tag&1){if(e.flags|=2048,Te(9,{destroy:void 0},Ks.bind(null,e,u,a,t),null),yl===null)throw Error(h(349));n||(kt&127)!==0||Vs(e,t,a)}return a}function Vs(l,t,a){l.flags|=16384,l={getSnapshot:t,value:a},t=X.updateQueue,t===null?(t=Sn(),X.updateQueue=t,t.stores=[l]):(a=t.stores,a===null?t.stores=[l]:a.push(l))}function Ks(l,t,a,e){t.value=a,t.getSnapshot=e,ws(t)&&Ws(l)}function Js(l,t,a){return a(function(){ws(t)&&Ws(l)})}function ws(l){var t=l.getSnapshot;l=l.value;try{var a=t();return!dt(l,a)}catch{return!0}}function Ws(l){var t=qa(l,2);t!==null&&st(t,l,2)}function fi(l){var t=lt();if(typeof l=="function"){var a=l;if(l=a(),Ka){jt(!0);try{a()}finally{jt(!1)}}}return t.memoizedState=t.baseState=l,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Ft,lastRenderedState:l},t}function $s(l,t,a,e){return l.baseState=a,ci(l,dl,typeof e=="function"?e:Ft)}function Zm(l,t,a,e,u){if(Tn(l))throw Error(h(485));if(l=t.action,l!==null){var n={payload:u,action:l,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(c){n.listeners.push(c)}};g.T!==null?a(!0):n.isTransition=!1,e(n),a=t.pending,a===null?(n.next=t.pending=n,ks(t,n)):(n.next=a.next,t.pending=a.next=n)}}function ks(l,t){var a=t.action,e=t.payload,u=l.state;if(t.isTransition){var n=g.T,c={};g.T=c;try{var i=a(u,e),f=g.S;f!==null&&f(c,i),Fs(l,t,i)}catch(v){si(l,t,v)}finally{n!==null&&c.types!==null&&(n.types=c.types),g.T=n}}else try{n=a(u,e),Fs(l,t,n)}catch(v){si(l,t,v)}}function Fs(l,t,a){a!==null&&typeof a=="object"&&typeof a.then=="function"?a.then(function(e){Is(l,t,e)},function(e){return si(l,t,e)}):Is(l,t,a)}function Is(l,t,a){t.status="fulfilled",t.value=a,Ps(t),l.state=a,t=l.pending,t!==null&&(a=t.next,a===t?l.pending=null:(a=a.next,t.next=a,ks(l,a)))}function si(l,t,a){var e=l.pending;if(l.pending=null,e!==null){e=e.next;do t.status="rejected",t.reason=a,Ps(t),t=t.next;while(t!==e)}l.action=null}function Ps(l){l=l.listeners;for(var t=0;t<l.length;t++)(0,l[t])()}function lo(l,t){return t}function to(l,t){if(F){var a=yl.formState;if(a!==null){l:{var e=X;if(F){if(Sl){t:{for(var u=Sl,n=Mt;u.nodeType!==8;){if(!n){u=null;break t}if(u=Nt(u.nextSibling),u===null){u=null;break t}}n=u.data,u=n==="F!"||n==="F"?u:null}if(u){Sl=Nt(u.nextSibling),e=u.data==="F!";break l}}da(e)}e=!1}e&&(t=a[0])}}return a=lt(),a.memoizedState=a.baseState=t,e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:lo,lastRenderedState:t},a.queue=e,a=zo.bind(null,X,e),e.dispatch=a,e=fi(!1),n=hi.bind(null,X,!1,e.queue),e=lt(),u={state:t,dispatch:null,action:l,pending:null},e.queue=u,a=Zm.bind(null,X,u,n,a),u.dispatch=a,e.memoizedState=l,[t,a,!1]}function ao(l){var t=Nl();return eo(t,dl,l)}function eo(l,t,a){if(t=ci(l,t,lo)[0],l=En(Ft)[0],typeof t=="object"&&t!==null&&typeof t.then=="function")try{var e=mu(t)}catch(c){throw c===Se?on:c}else e=t;t=Nl();var u=t.queue,n=u.dispatch;return a!==t.memoizedState&&(X.flags|=2048,Te(9,{destroy:void 0},Lm.bind(null,u,a),null)),[e,n,l]}function Lm(l,t){l.action=t}function uo(l){var t=Nl(),a=dl;if(a!==null)return eo(t,a,l);Nl(),t=t.memoizedState,a=Nl();var e=a.queue.dispatch;return a.memoizedState=l,[t,e,!1]}function Te(l,t,a,e){return l={tag:l,create:a,deps:e,inst:t,next:null},t=X.updateQueue,t===null&&(t=Sn(),X.updateQueue=t),a=t.lastEffect,a===null?t.lastEffect=l.next=l:(e=a.next,a.next=l,l.next=e,t.lastEffect=l),l}function no(){return Nl().memoizedState}function zn(l,t,a,e){var u=lt();X.flags|=l,u.memoizedState=Te(1|t,{destroy:void 0},a,e===void 0?null:e)}function pn(l,t,a,e){var u=Nl();e=e===void 0?null:e;var n=u.memoizedState.inst;dl!==null&&e!==null&&li(e,dl.memoizedState.deps)?u.memoizedState=Te(t,n,a,e):(X.flags|=l,u.memoizedState=Te(1|t,n,a,e))}function co(l,t){zn(8390656,8,l,t)}function oi(l,t){pn(2048,8,l,t)}function Vm(l){X.flags|=4;var t=X.updateQueue;if(t===null)t=Sn(),X.updateQueue=t,t.events=[l];else{var a=t.events;a===null?t.events=[l]:a.push(l)}}function io(l){var t=Nl().memoizedState;return Vm({ref:t,nextImpl:l}),function(){if((ul&2)!==0)throw Error(h(440));return t.impl.apply(void 0,arguments)}}function fo(l,t){return pn(4,2,l,t)}function so(l,t){return pn(4,4,l,t)}function oo(l,t){if(typeof t=="function"){l=l();var a=t(l);return function(){typeof a=="function"?a():t(null)}}if(t!=null)return l=l(),t.current=l,function(){t.current=null}}function mo(l,t,a){a=a!=null?a.concat([l]):null,pn(4,4,oo.bind(null,t,l),a)}function di(){}function vo(l,t){var a=Nl();t=t===void 0?null:t;var e=a.memoizedState;return t!==null&&li(t,e[1])?e[0]:(a.memoizedState=[l,t],l)}function yo(l,t){var a=Nl();t=t===void 0?null:t;var e=a.memoizedState;if(t!==null&&li(t,e[1]))return e[0];if(e=l(),Ka){jt(!0);try{l()}finally{jt(!1)}}return a.memoizedState=[e,t],e}function mi(l,t,a){return a===void 0||(kt&1073741824)!==0&&(W&261930)===0?l.memoizedState=t:(l.memoizedState=a,l=hd(),X.lanes|=l,Ea|=l,a)}function ho(l,t,a,e){return dt(a,t)?a:Ee.current!==null?(l=mi(l,a,e),dt(l,t)||(Cl=!0),l):(kt&42)===0||(kt&1073741824)!==0&&(W&261930)===0?(Cl=!0,l.memoizedState=a):(l=hd(),X.lanes|=l,Ea|=l,t)}function ro(l,t,a,e,u){var n=O.p;O.p=n!==0&&8>n?n:8;var c=g.T,i={};g.T=i,hi(l,!1,t,a);try{var f=u(),v=g.S;if(v!==null&&v(i,f),f!==null&&typeof f=="object"&&typeof f.then=="function"){var S=Qm(f,e);vu(l,t,S,gt(l))}else vu(l,t,e,gt(l))}catch(E){vu(l,t,{then:function(){},status:"rejected",reason:E},gt())}finally{O.p=n,c!==null&&i.types!==null&&(c.types=i.types),g.T=c}}function Km(){}function vi(l,t,a,e){if(l.tag!==5)throw Error(h(476));var u=go(l).queue;ro(l,u,t,H,a===null?Km:function(){return So(l),a(e)})}function go(l){var t=l.memoizedState;if(t!==null)return t;t={memoizedState:H,baseState:H,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Ft,lastRenderedState:H},next:null};var a={};return t.next={memoizedState:a,baseState:a,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Ft,lastRenderedState:a},next:null},l.memoizedState=t,l=l.alternate,l!==null&&(l.memoizedState=t),t}function So(l){var t=go(l);t.next===null&&(t=l.alternate.memoizedState),vu(l,t.next.queue,{},gt())}function yi(){return Kl(Uu)}function bo(){return Nl().memoizedState}function Eo(){return Nl().memoizedState}function Jm(l){for(var t=l.return;t!==null;){switch(t.tag){case 24:case 3:var a=gt();l=ya(a);var e=ha(t,l,a);e!==null&&(st(e,t,a),fu(e,t,a)),t={cache:Lc()},l.payload=t;return}t=t.return}}function wm(l,t,a){var e=gt();a={lane:e,revertLane:0,gesture:null,action:a,hasEagerState:!1,eagerState:null,next:null},Tn(l)?po(t,a):(a=Cc(l,t,a,e),a!==null&&(st(a,l,e),To(a,t,e)))}function zo(l,t,a){var e=gt();vu(l,t,a,e)}function vu(l,t,a,e){var u={lane:e,revertLane:0,gesture:null,action:a,hasEagerState:!1,eagerState:null,next:null};if(Tn(l))po(t,u);else{var n=l.alternate;if(l.lanes===0&&(n===null||n.lanes===0)&&(n=t.lastRenderedReducer,n!==null))try{var c=t.lastRenderedState,i=n(c,a);if(u.hasEagerState=!0,u.eagerState=i,dt(i,c))return an(l,t,u,0),yl===null&&tn(),!1}catch{}finally{}if(a=Cc(l,t,u,e),a!==null)return st(a,l,e),To(a,t,e),!0}return!1}function hi(l,t,a,e){if(e={lane:2,revertLane:wi(),gesture:null,action:e,hasEagerState:!1,eagerState:null,next:null},Tn(l)){if(t)throw Error(h(479))}else t=Cc(l,a,e,2),t!==null&&st(t,l,2)}function Tn(l){var t=l.alternate;return l===X||t!==null&&t===X}function po(l,t){ze=rn=!0;var a=l.pending;a===null?t.next=t:(t.next=a.next,a.next=t),l.pending=t}function To(l,t,a){if((a&4194048)!==0){var e=t.lanes;e&=l.pendingLanes,a|=e,t.lanes=a,Mf(l,a)}}var yu={readContext:Kl,use:bn,useCallback:_l,useContext:_l,useEffect:_l,useImperativeHandle:_l,useLayoutEffect:_l,useInsertionEffect:_l,useMemo:_l,useReducer:_l,useRef:_l,useState:_l,useDebugValue:_l,useDeferredValue:_l,useTransition:_l,useSyncExternalStore:_l,useId:_l,useHostTransitionStatus:_l,useFormState:_l,useActionState:_l,useOptimistic:_l,useMemoCache:_l,useCacheRefresh:_l};yu.useEffectEvent=_l;var Ao={readContext:Kl,use:bn,useCallback:function(l,t){return lt().memoizedState=[l,t===void 0?null:t],l},useContext:Kl,useEffect:co,useImperativeHandle:function(l,t,a){a=a!=null?a.concat([l]):null,zn(4194308,4,oo.bind(null,t,l),a)},useLayoutEffect:function(l,t){return zn(4194308,4,l,t)},useInsertionEffect:function(l,t){zn(4,2,l,t)},useMemo:function(l,t){var a=lt();t=t===void 0?null:t;var e=l();if(Ka){jt(!0);try{l()}finally{jt(!1)}}return a.memoizedState=[e,t],e},useReducer:function(l,t,a){var e=lt();if(a!==void 0){var u=a(t);if(Ka){jt(!0);try{a(t)}finally{jt(!1)}}}else u=t;return e.memoizedState=e.baseState=u,l={pending:null,lanes:0,dispatch:null,lastRenderedReducer:l,lastRenderedState:u},e.queue=l,l=l.dispatch=wm.bind(null,X,l),[e.memoizedState,l]},useRef:function(l){var t=lt();return l={current:l},t.memoizedState=l},useState:function(l){l=fi(l);var t=l.queue,a=zo.bind(null,X,t);return t.dispatch=a,[l.memoizedState,a]},useDebugValue:di,useDeferredValue:function(l,t){var a=lt();return mi(a,l,t)},useTransition:function(){var l=fi(!1);return l=ro.bind(null,X,l.queue,!0,!1),lt().memoizedState=l,[!1,l]},useSyncExternalStore:function(l,t,a){var e=X,u=lt();if(F){if(a===void 0)throw Error(h(407));a=a()}else{if(a=t(),yl===null)throw Error(h(349));(W&127)!==0||Vs(e,t,a)}u.memoizedState=a;var n={value:a,getSnapshot:t};return u.queue=n,co(Js.bind(null,e,n,l),[l]),e.flags|=2048,Te(9,{destroy:void 0},Ks.bind(null,e,n,a,t),null),a},useId:function(){var l=lt(),t=yl.identifierPrefix;if(F){var a=Yt,e=qt;a=(e&~(1<<32-Yl(e)-1)).toString(32)+a,t="_"+t+"R_"+a,a=gn++,0<a&&(t+="H"+a.toString(32)),t+="_"}else a=Gm++,t="_"+t+"r_"+a.toString(32)+"_";return l.memoizedState=t},useHostTransitionStatus:yi,useFormState:to,useActionState:to,useOptimistic:function(l){var t=lt();t.memoizedState=t.baseState=l;var a={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=a,t=hi.bind(null,X,!0,a),a.dispatch=t,[l,t]},useMemoCache:ni,useCacheRefresh:function(){return lt().memoizedState=Jm.bind(null,X)},useEffectEvent:function(l){var t=lt(),a={impl:l};return t.memoizedState=a,function(){if((ul&2)!==0)throw Error(h(440));return a.impl.apply(void 0,arguments)}}},ri={readContext:Kl,use:bn,useCallback:vo,useContext:Kl,useEffect:oi,useImperativeHandle:mo,useInsertionEffect:fo,useLayoutEffect:so,useMemo:yo,useReducer:En,useRef:no,useState:function(){return En(Ft)},useDebugValue:di,useDeferredValue:function(l,t){var a=Nl();return ho(a,dl.memoizedState,l,t)},useTransition:function(){var l=En(Ft)[0],t=Nl().memoizedState;return[typeof l=="boolean"?l:mu(l),t]},useSyncExternalStore:Ls,useId:bo,useHostTransitionStatus:yi,useFormState:ao,useActionState:ao,useOptimistic:function(l,t){var a=Nl();return $s(a,dl,l,t)},useMemoCache:ni,useCacheRefresh:Eo};ri.useEffectEvent=io;var _o={readContext:Kl,use:bn,useCallback:vo,useContext:Kl,useEffect:oi,useImperativeHandle:mo,useInsertionEffect:fo,useLayoutEffect:so,useMemo:yo,useReducer:ii,useRef:no,useState:function(){return ii(Ft)},useDebugValue:di,useDeferredValue:function(l,t){var a=Nl();return dl===null?mi(a,l,t):ho(a,dl.memoizedState,l,t)},useTransition:function(){var l=ii(Ft)[0],t=Nl().memoizedState;return[typeof l=="boolean"?l:mu(l),t]},useSyncExternalStore:Ls,useId:bo,useHostTransitionStatus:yi,useFormState:uo,useActionState:uo,useOptimistic:function(l,t){var a=Nl();return dl!==null?$s(a,dl,l,t):(a.baseState=l,[l,a.queue.dispatch])},useMemoCache:ni,useCacheRefresh:Eo};_o.useEffectEvent=io;function gi(l,t,a,e){t=l.memoizedState,a=a(e,t),a=a==null?t:C({},t,a),l.memoizedState=a,l.lanes===0&&(l.updateQueue.baseState=a)}var Si={enqueueSetState:function(l,t,a){l=l._reactInternals;var e=gt(),u=ya(e);u.payload=t,a!=null&&(u.callback=a),t=ha(l,u,e),t!==null&&(st(t,l,e),fu(t,l,e))},enqueueReplaceState:function(l,t,a){l=l._reactInternals;var e=gt(),u=ya(e);u.tag=1,u.payload=t,a!=null&&(u.callback=a),t=ha(l,u,e),t!==null&&(st(t,l,e),fu(t,l,e))},enqueueForceUpdate:function(l,t){l=l._reactInternals;var a=gt(),e=ya(a);e.tag=2,t!=null&&(e.callback=t),t=ha(l,e,a),t!==null&&(st(t,l,a),fu(t,l,a))}};function Oo(l,t,a,e,u,n,c){return l=l.stateNode,typeof l.shouldComponentUpdate=="function"?l.shouldComponentUpdate(e,n,c):t.prototype&&t.prototype.isPureReactComponent?!lu(a,e)||!lu(u,n):!0}function Mo(l,t,a,e){l=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(a,e),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(a,e),t.state!==l&&Si.enqueueReplaceState(t,t.state,null)}function Ja(l,t){var a=t;if("ref"in t){a={};for(var e in t)e!=="ref"&&(a[e]=t[e])}if(l=l.defaultProps){a===t&&(a=C({},a));for(var u in l)a[u]===void 0&&(a[u]=l[u])}return a}function Do(l){ln(l)}function No(l){console.error(l)}function Uo(l){ln(l)}function An(l,t){try{var a=l.onUncaughtError;a(t.value,{componentStack:t.stack})}catch(e){setTimeout(function(){throw e})}}function xo(l,t,a){try{var e=l.onCaughtError;e(a.value,{componentStack:a.stack,errorBoundary:t.tag===1?t.stateNode:null})}catch(u){setTimeout(function(){throw u})}}function bi(l,t,a){return a=ya(a),a.tag=3,a.payload={element:null},a.callback=function(){An(l,t)},a}function Co(l){return l=ya(l),l.tag=3,l}function Ro(l,t,a,e){var u=a.type.getDerivedStateFromError;if(typeof u=="function"){var n=e.value;l.payload=function(){return u(n)},l.callback=function(){xo(t,a,e)}}var c=a.stateNode;c!==null&&typeof c.componentDidCatch=="function"&&(l.callback=function(){xo(t,a,e),typeof u!="function"&&(za===null?za=new Set([this]):za.add(this));var i=e.stack;this.componentDidCatch(e.value,{componentStack:i!==null?i:""})})}function Wm(l,t,a,e,u){if(a.flags|=32768,e!==null&&typeof e=="object"&&typeof e.then=="function"){if(t=a.alternate,t!==null&&he(t,a,u,!0),a=vt.current,a!==null){switch(a.tag){case 31:case 13:return Dt===null?qn():a.alternate===null&&Ol===0&&(Ol=3),a.flags&=-257,a.flags|=65536,a.lanes=u,e===dn?a.flags|=16384:(t=a.updateQueue,t===null?a.updateQueue=new Set([e]):t.add(e),Vi(l,e,u)),!1;case 22:return a.flags|=65536,e===dn?a.flags|=16384:(t=a.updateQueue,t===null?(t={transitions:null,markerInstances:null,retryQueue:new Set([e])},a.updateQueue=t):(a=t.retryQueue,a===null?t.retryQueue=new Set([e]):a.add(e)),Vi(l,e,u)),!1}throw Error(h(435,a.tag))}return Vi(l,e,u),qn(),!1}if(F)return t=vt.current,t!==null?((t.flags&65536)===0&&(t.flags|=256),t.flags|=65536,t.lanes=u,e!==Bc&&(l=Error(h(422),{cause:e}),eu(At(l,a)))):(e!==Bc&&(t=Error(h(423),{cause:e}),eu(At(t,a))),l=l.current.alternate,l.flags|=65536,u&=-u,l.lanes|=u,e=At(e,a),u=bi(l.stateNode,e,u),$c(l,u),Ol!==4&&(Ol=2)),!1;var n=Error(h(520),{cause:e});if(n=At(n,a),pu===null?pu=[n]:pu.push(n),Ol!==4&&(Ol=2),t===null)return!0;e=At(e,a),a=t;do{switch(a.tag){case 3:return a.flags|=65536,l=u&-u,a.lanes|=l,l=bi(a.stateNode,e,l),$c(a,l),!1;case 1:if(t=a.type,n=a.stateNode,(a.flags&128)===0&&(typeof t.getDerivedStateFromError=="function"||n!==null&&typeof n.componentDidCatch=="function"&&(za===null||!za.has(n))))return a.flags|=65536,u&=-u,a.lanes|=u,u=Co(u),Ro(u,l,a,e),$c(a,u),!1}a=a.return}while(a!==null);return!1}var Ei=Error(h(461)),Cl=!1;function Jl(l,t,a,e){t.child=l===null?qs(t,null,a,e):Va(t,l.child,a,e)}function Ho(l,t,a,e,u){a=a.render;var n=t.ref;if("ref"in e){var c={};for(var i in e)i!=="ref"&&(c[i]=e[i])}else c=e;return Ga(t),e=ti(l,t,a,c,n,u),i=ai(),l!==null&&!Cl?(ei(l,t,u),It(l,t,u)):(F&&i&&qc(t),t.flags|=1,Jl(l,t,e,u),t.child)}function jo(l,t,a,e,u){if(l===null){var n=a.type;return typeof n=="function"&&!Rc(n)&&n.defaultProps===void 0&&a.compare===null?(t.tag=15,t.type=n,qo(l,t,n,e,u)):(l=un(a.type,null,e,t,t.mode,u),l.ref=t.ref,l.return=t,t.child=l)}if(n=l.child,!Di(l,u)){var c=n.memoizedProps;if(a=a.compare,a=a!==null?a:lu,a(c,e)&&l.ref===t.ref)return It(l,t,u)}return t.flags|=1,l=Jt(n,e),l.ref=t.ref,l.return=t,t.child=l}function qo(l,t,a,e,u){if(l!==null){var n=l.memoizedProps;if(lu(n,e)&&l.ref===t.ref)if(Cl=!1,t.pendingProps=e=n,Di(l,u))(l.flags&131072)!==0&&(Cl=!0);else return t.lanes=l.lanes,It(l,t,u)}return zi(l,t,a,e,u)}function Yo(l,t,a,e){var u=e.children,n=l!==null?l.memoizedState:null;if(l===null&&t.stateNode===null&&(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),e.mode==="hidden"){if((t.flags&128)!==0){if(n=n!==null?n.baseLanes|a:a,l!==null){for(e=t.child=l.child,u=0;e!==null;)u=u|e.lanes|e.childLanes,e=e.sibling;e=u&~n}else e=0,t.child=null;return Bo(l,t,n,a,e)}if((a&536870912)!==0)t.memoizedState={baseLanes:0,cachePool:null},l!==null&&sn(t,n!==null?n.cachePool:null),n!==null?Qs(t,n):Fc(),Gs(t);else return e=t.lanes=536870912,Bo(l,t,n!==null?n.baseLanes|a:a,a,e)}else n!==null?(sn(t,n.cachePool),Qs(t,n),ga(),t.memoizedState=null):(l!==null&&sn(t,null),Fc(),ga());return Jl(l,t,u,a),t.child}function hu(l,t){return l!==null&&l.tag===22||t.stateNode!==null||(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),t.sibling}function Bo(l,t,a,e,u){var n=Kc();return n=n===null?null:{parent:Ul._currentValue,pool:n},t.memoizedState={baseLanes:a,cachePool:n},l!==null&&sn(t,null),Fc(),Gs(t),l!==null&&he(l,t,e,!0),t.childLanes=u,null}function _n(l,t){return t=Mn({mode:t.mode,children:t.children},l.mode),t.ref=l.ref,l.child=t,t.return=l,t}function Qo(l,t,a){return Va(t,l.child,null,a),l=_n(t,t.pendingProps),l.flags|=2,yt(t),t.memoizedState=null,l}function $m(l,t,a){var e=t.pendingProps,u=(t.flags&128)!==0;if(t.flags&=-129,l===null){if(F){if(e.mode==="hidden")return l=_n(t,e),t.lanes=536870912,hu(null,l);if(Pc(t),(l=Sl)?(l=Fd(l,Mt),l=l!==null&&l.data==="&"?l:null,l!==null&&(t.memoizedState={dehydrated:l,treeContext:sa!==null?{id:qt,overflow:Yt}:null,retryLane:536870912,hydrationErrors:null},a=zs(l),a.return=t,t.child=a,Vl=t,Sl=null)):l=null,l===null)throw da(t);return t.lanes=536870912,null}return _n(t,e)}var n=l.memoizedState;if(n!==null){var c=n.dehydrated;if(Pc(t),u)if(t.flags&256)t.flags&=-257,t=Qo(l,t,a);else if(t.memoizedState!==null)t.child=l.child,t.flags|=128,t=null;else throw Error(h(558));else if(Cl||he(l,t,a,!1),u=(a&l.childLanes)!==0,Cl||u){if(e=yl,e!==null&&(c=Df(e,a),c!==0&&c!==n.retryLane))throw n.retryLane=c,qa(l,c),st(e,l,c),Ei;qn(),t=Qo(l,t,a)}else l=n.treeContext,Sl=Nt(c.nextSibling),Vl=t,F=!0,oa=null,Mt=!1,l!==null&&As(t,l),t=_n(t,e),t.flags|=4096;return t}return l=Jt(l.child,{mode:e.mode,children:e.children}),l.ref=t.ref,t.child=l,l.return=t,l}function On(l,t){var a=t.ref;if(a===null)l!==null&&l.ref!==null&&(t.flags|=4194816);else{if(typeof a!="function"&&typeof a!="object")throw Error(h(284));(l===null||l.ref!==a)&&(t.flags|=4194816)}}function zi(l,t,a,e,u){return Ga(t),a=ti(l,t,a,e,void 0,u),e=ai(),l!==null&&!Cl?(ei(l,t,u),It(l,t,u)):(F&&e&&qc(t),t.flags|=1,Jl(l,t,a,u),t.child)}function Go(l,t,a,e,u,n){return Ga(t),t.updateQueue=null,a=Zs(t,e,a,u),Xs(l),e=ai(),l!==null&&!Cl?(ei(l,t,n),It(l,t,n)):(F&&e&&qc(t),t.flags|=1,Jl(l,t,a,n),t.child)}function Xo(l,t,a,e,u){if(Ga(t),t.stateNode===null){var n=de,c=a.contextType;typeof c=="object"&&c!==null&&(n=Kl(c)),n=new a(e,n),t.memoizedState=n.state!==null&&n.state!==void 0?n.state:null,n.updater=Si,t.stateNode=n,n._reactInternals=t,n=t.stateNode,n.props=e,n.state=t.memoizedState,n.refs={},wc(t),c=a.contextType,n.context=typeof c=="object"&&c!==null?Kl(c):de,n.state=t.memoizedState,c=a.getDerivedStateFromProps,typeof c=="function"&&(gi(t,a,c,e),n.state=t.memoizedState),typeof a.getDerivedStateFromProps=="function"||typeof n.getSnapshotBeforeUpdate=="function"||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(c=n.state,typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount(),c!==n.state&&Si.enqueueReplaceState(n,n.state,null),ou(t,e,n,u),su(),n.state=t.memoizedState),typeof n.componentDidMount=="function"&&(t.flags|=4194308),e=!0}else if(l===null){n=t.stateNode;var i=t.memoizedProps,f=Ja(a,i);n.props=f;var v=n.context,S=a.contextType;c=de,typeof S=="object"&&S!==null&&(c=Kl(S));var E=a.getDerivedStateFromProps;S=typeof E=="function"||typeof n.getSnapshotBeforeUpdate=="function",i=t.pendingProps!==i,S||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(i||v!==c)&&Mo(t,n,e,c),va=!1;var y=t.memoizedState;n.state=y,ou(t,e,n,u),su(),v=t.memoizedState,i||y!==v||va?(typeof E=="function"&&(gi(t,a,E,e),v=t.memoizedState),(f=va||Oo(t,a,f,e,y,v,c))?(S||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount()),typeof n.componentDidMount=="function"&&(t.flags|=4194308)):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=e,t.memoizedState=v),n.props=e,n.state=v,n.context=c,e=f):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),e=!1)}else{n=t.stateNode,Wc(l,t),c=t.memoizedProps,S=Ja(a,c),n.props=S,E=t.pendingProps,y=n.context,v=a.contextType,f=de,typeof v=="object"&&v!==null&&(f=Kl(v)),i=a.getDerivedStateFromProps,(v=typeof i=="function"||typeof n.getSnapshotBeforeUpdate=="function")||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(c!==E||y!==f)&&Mo(t,n,e,f),va=!1,y=t.memoizedState,n.state=y,ou(t,e,n,u),su();var r=t.memoizedState;c!==E||y!==r||va||l!==null&&l.dependencies!==null&&cn(l.dependencies)?(typeof i=="function"&&(gi(t,a,i,e),r=t.memoizedState),(S=va||Oo(t,a,S,e,y,r,f)||l!==null&&l.dependencies!==null&&cn(l.dependencies))?(v||typeof n.UNSAFE_componentWillUpdate!="function"&&typeof n.componentWillUpdate!="function"||(typeof n.componentWillUpdate=="function"&&n.componentWillUpdate(e,r,f),typeof n.UNSAFE_componentWillUpdate=="function"&&n.UNSAFE_componentWillUpdate(e,r,f)),typeof n.componentDidUpdate=="function"&&(t.flags|=4),typeof n.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof n.componentDidUpdate!="function"||c===l.memoizedProps&&y===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||c===l.memoizedProps&&y===l.memoizedState||(t.flags|=1024),t.memoizedProps=e,t.memoizedState=r),n.props=e,n.state=r,n.context=f,e=S):(typeof n.componentDidUpdate!="function"||c===l.memoizedProps&&y===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||c===l.memoizedProps&&y===l.memoizedState||(t.flags|=1024),e=!1)}return n=e,On(l,t),e=(t.flags&128)!==0,n||e?(n=t.stateNode,a=e&&typeof a.getDerivedStateFromError!="function"?null:n.render(),t.flags|=1,l!==null&&e?(t.child=Va(t,l.child,null,u),t.child=Va(t,null,a,u)):Jl(l,t,a,u),t.memoizedState=n.state,l=t.child):l=It(l,t,u),l}function Zo(l,t,a,e){return Ba(),t.flags|=256,Jl(l,t,a,e),t.child}var pi={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function Ti(l){return{baseLanes:l,cachePool:Us()}}function Ai(l,t,a){return l=l!==null?l.childLanes&~a:0,t&&(l|=rt),l}function Lo(l,t,a){var e=t.pendingProps,u=!1,n=(t.flags&128)!==0,c;if((c=n)||(c=l!==null&&l.memoizedState===null?!1:(Dl.current&2)!==0),c&&(u=!0,t.flags&=-129),c=(t.flags&32)!==0,t.flags&=-33,l===null){if(F){if(u?ra(t):ga(),(l=Sl)?(l=Fd(l,Mt),l=l!==null&&l.data!=="&"?l:null,l!==null&&(t.memoizedState={dehydrated:l,treeContext:sa!==null?{id:qt,overflow:Yt}:null,retryLane:536870912,hydrationErrors:null},a=zs(l),a.return=t,t.child=a,Vl=t,Sl=null)):l=null,l===null)throw da(t);return cf(l)?t.lanes=32:t.lanes=536870912,null}var i=e.children;return e=e.fallback,u?(ga(),u=t.mode,i=Mn({mode:"hidden",children:i},u),e=Ya(e,u,a,null),i.return=t,e.return=t,i.sibling=e,t.child=i,e=t.child,e.memoizedState=Ti(a),e.childLanes=Ai(l,c,a),t.memoizedState=pi,hu(null,e)):(ra(t),_i(t,i))}var f=l.memoizedState;if(f!==null&&(i=f.dehydrated,i!==null)){if(n)t.flags&256?(ra(t),t.flags&=-257,t=Oi(l,t,a)):t.memoizedState!==null?(ga(),t.child=l.child,t.flags|=128,t=null):(ga(),i=e.fallback,u=t.mode,e=Mn({mode:"visible",children:e.children},u),i=Ya(i,u,a,null),i.flags|=2,e.return=t,i.return=t,e.sibling=i,t.child=e,Va(t,l.child,null,a),e=t.child,e.memoizedState=Ti(a),e.childLanes=Ai(l,c,a),t.memoizedState=pi,t=hu(null,e));else if(ra(t),cf(i)){if(c=i.nextSibling&&i.nextSibling.dataset,c)var v=c.dgst;c=v,e=Error(h(419)),e.stack="",e.digest=c,eu({value:e,source:null,stack:null}),t=Oi(l,t,a)}else if(Cl||he(l,t,a,!1),c=(a&l.childLanes)!==0,Cl||c){if(c=yl,c!==null&&(e=Df(c,a),e!==0&&e!==f.retryLane))throw f.retryLane=e,qa(l,e),st(c,l,e),Ei;nf(i)||qn(),t=Oi(l,t,a)}else nf(i)?(t.flags|=192,t.child=l.child,t=null):(l=f.treeContext,Sl=Nt(i.nextSibling),Vl=t,F=!0,oa=null,Mt=!1,l!==null&&As(t,l),t=_i(t,e.children),t.flags|=4096);return t}return u?(ga(),i=e.fallback,u=t.mode,f=l.child,v=f.sibling,e=Jt(f,{mode:"hidden",children:e.children}),e.subtreeFlags=f.subtreeFlags&65011712,v!==null?i=Jt(v,i):(i=Ya(i,u,a,null),i.flags|=2),i.return=t,e.return=t,e.sibling=i,t.child=e,hu(null,e),e=t.child,i=l.child.memoizedState,i===null?i=Ti(a):(u=i.cachePool,u!==null?(f=Ul._currentValue,u=u.parent!==f?{parent:f,pool:f}:u):u=Us(),i={baseLanes:i.baseLanes|a,cachePool:u}),e.memoizedState=i,e.childLanes=Ai(l,c,a),t.memoizedState=pi,hu(l.child,e)):(ra(t),a=l.child,l=a.sibling,a=Jt(a,{mode:"visible",children:e.children}),a.return=t,a.sibling=null,l!==null&&(c=t.deletions,c===null?(t.deletions=[l],t.flags|=16):c.push(l)),t.child=a,t.memoizedState=null,a)}function _i(l,t){return t=Mn({mode:"visible",children:t},l.mode),t.return=l,l.child=t}function Mn(l,t){return l=mt(22,l,null,t),l.lanes=0,l}function Oi(l,t,a){return Va(t,l.child,null,a),l=_i(t,t.pendingProps.children),l.flags|=2,t.memoizedState=null,l}function Vo(l,t,a){l.lanes|=t;var e=l.alternate;e!==null&&(e.lanes|=t),Xc(l.return,t,a)}function Mi(l,t,a,e,u,n){var c=l.memoizedState;c===null?l.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:e,tail:a,tailMode:u,treeForkCount:n}:(c.isBackwards=t,c.rendering=null,c.renderingStartTime=0,c.last=e,c.tail=a,c.tailMode=u,c.treeForkCount=n)}function Ko(l,t,a){var e=t.pendingProps,u=e.revealOrder,n=e.tail;e=e.children;var c=Dl.current,i=(c&2)!==0;if(i?(c=c&1|2,t.flags|=128):c&=1,_(Dl,c),Jl(l,t,e,a),e=F?au:0,!i&&l!==null&&(l.flags&128)!==0)l:for(l=t.child;l!==null;){if(l.tag===13)l.memoizedState!==null&&Vo(l,a,t);else if(l.tag===19)Vo(l,a,t);else if(l.child!==null){l.child.return=l,l=l.child;continue}if(l===t)break l;for(;l.sibling===null;){if(l.return===null||l.return===t)break l;l=l.return}l.sibling.return=l.return,l=l.sibling}switch(u){case"forwards":for(a=t.child,u=null;a!==null;)l=a.alternate,l!==null&&hn(l)===null&&(u=a),a=a.sibling;a=u,a===null?(u=t.child,t.child=null):(u=a.sibling,a.sibling=null),Mi(t,!1,u,a,n,e);break;case"backwards":case"unstable_legacy-backwards":for(a=null,u=t.child,t.child=null;u!==null;){if(l=u.alternate,l!==null&&hn(l)===null){t.child=u;break}l=u.sibling,u.sibling=a,a=u,u=l}Mi(t,!0,a,null,n,e);break;case"together":Mi(t,!1,null,null,void 0,e);break;default:t.memoizedState=null}return t.child}function It(l,t,a){if(l!==null&&(t.dependencies=l.dependencies),Ea|=t.lanes,(a&t.childLanes)===0)if(l!==null){if(he(l,t,a,!1),(a&t.childLanes)===0)return null}else return null;if(l!==null&&t.child!==l.child)throw Error(h(153));if(t.child!==null){for(l=t.child,a=Jt(l,l.pendingProps),t.child=a,a.return=t;l.sibling!==null;)l=l.sibling,a=a.sibling=Jt(l,l.pendingProps),a.return=t;a.sibling=null}return t.child}function Di(l,t){return(l.lanes&t)!==0?!0:(l=l.dependencies,!!(l!==null&&cn(l)))}function km(l,t,a){switch(t.tag){case 3:Tl(t,t.stateNode.containerInfo),ma(t,Ul,l.memoizedState.cache),Ba();break;case 27:case 5:ol(t);break;case 4:Tl(t,t.stateNode.containerInfo);break;case 10:ma(t,t.type,t.memoizedProps.value);break;case 31:if(t.memoizedState!==null)return t.flags|=128,Pc(t),null;break;case 13:var e=t.memoizedState;if(e!==null)return e.dehydrated!==null?(ra(t),t.flags|=128,null):(a&t.child.childLanes)!==0?Lo(l,t,a):(ra(t),l=It(l,t,a),l!==null?l.sibling:null);ra(t);break;case 19:var u=(l.flags&128)!==0;if(e=(a&t.childLanes)!==0,e||(he(l,t,a,!1),e=(a&t.childLanes)!==0),u){if(e)return Ko(l,t,a);t.flags|=128}if(u=t.memoizedState,u!==null&&(u.rendering=null,u.tail=null,u.lastEffect=null),_(Dl,Dl.current),e)break;return null;case 22:return t.lanes=0,Yo(l,t,a,t.pendingProps);case 24:ma(t,Ul,l.memoizedState.cache)}return It(l,t,a)}function Jo(l,t,a){if(l!==null)if(l.memoizedProps!==t.pendingProps)Cl=!0;else{if(!Di(l,a)&&(t.flags&128)===0)return Cl=!1,km(l,t,a);Cl=(l.flags&131072)!==0}else Cl=!1,F&&(t.flags&1048576)!==0&&Ts(t,au,t.index);switch(t.lanes=0,t.tag){case 16:l:{var e=t.pendingProps;if(l=Za(t.elementType),t.type=l,typeof l=="function")Rc(l)?(e=Ja(l,e),t.tag=1,t=Xo(null,t,l,e,a)):(t.tag=0,t=zi(null,t,l,e,a));else{if(l!=null){var u=l.$$typeof;if(u===tt){t.tag=11,t=Ho(null,t,l,e,a);break l}else if(u===K){t.tag=14,t=jo(null,t,l,e,a);break l}}throw t=at(l)||l,Error(h(306,t,""))}}return t;case 0:return zi(l,t,t.type,t.pendingProps,a);case 1:return e=t.type,u=Ja(e,t.pendingProps),Xo(l,t,e,u,a);case 3:l:{if(Tl(t,t.stateNode.containerInfo),l===null)throw Error(h(387));e=t.pendingProps;var n=t.memoizedState;u=n.element,Wc(l,t),ou(t,e,null,a);var c=t.memoizedState;if(e=c.cache,ma(t,Ul,e),e!==n.cache&&Zc(t,[Ul],a,!0),su(),e=c.element,n.isDehydrated)if(n={element:e,isDehydrated:!1,cache:c.cache},t.updateQueue.baseState=n,t.memoizedState=n,t.flags&256){t=Zo(l,t,e,a);break l}else if(e!==u){u=At(Error(h(424)),t),eu(u),t=Zo(l,t,e,a);break l}else{switch(l=t.stateNode.containerInfo,l.nodeType){case 9:l=l.body;break;default:l=l.nodeName==="HTML"?l.ownerDocument.body:l}for(Sl=Nt(l.firstChild),Vl=t,F=!0,oa=null,Mt=!0,a=qs(t,null,e,a),t.child=a;a;)a.flags=a.flags&-3|4096,a=a.sibling}else{if(Ba(),e===u){t=It(l,t,a);break l}Jl(l,t,e,a)}t=t.child}return t;case 26:return On(l,t),l===null?(a=e0(t.type,null,t.pendingProps,null))?t.memoizedState=a:F||(a=t.type,l=t.pendingProps,e=Ln(L.current).createElement(a),e[Ll]=t,e[et]=l,wl(e,a,l),Bl(e),t.stateNode=e):t.memoizedState=e0(t.type,l.memoizedProps,t.pendingProps,l.memoizedState),null;case 27:return ol(t),l===null&&F&&(e=t.stateNode=l0(t.type,t.pendingProps,L.current),Vl=t,Mt=!0,u=Sl,_a(t.type)?(ff=u,Sl=Nt(e.firstChild)):Sl=u),Jl(l,t,t.pendingProps.children,a),On(l,t),l===null&&(t.flags|=4194304),t.child;case 5:return l===null&&F&&((u=e=Sl)&&(e=Ov(e,t.type,t.pendingProps,Mt),e!==null?(t.stateNode=e,Vl=t,Sl=Nt(e.firstChild),Mt=!1,u=!0):u=!1),u||da(t)),ol(t),u=t.type,n=t.pendingProps,c=l!==null?l.memoizedProps:null,e=n.children,af(u,n)?e=null:c!==null&&af(u,c)&&(t.flags|=32),t.memoizedState!==null&&(u=ti(l,t,Xm,null,null,a),Uu._currentValue=u),On(l,t),Jl(l,t,e,a),t.child;case 6:return l===null&&F&&((l=a=Sl)&&(a=Mv(a,t.pendingProps,Mt),a!==null?(t.stateNode=a,Vl=t,Sl=null,l=!0):l=!1),l||da(t)),null;case 13:return Lo(l,t,a);case 4:return Tl(t,t.stateNode.containerInfo),e=t.pendingProps,l===null?t.child=Va(t,null,e,a):Jl(l,t,e,a),t.child;case 11:return Ho(l,t,t.type,t.pendingProps,a);case 7:return Jl(l,t,t.pendingProps,a),t.child;case 8:return Jl(l,t,t.pendingProps.children,a),t.child;case 12:return Jl(l,t,t.pendingProps.children,a),t.child;case 10:return e=t.pendingProps,ma(t,t.type,e.value),Jl(l,t,e.children,a),t.child;case 9:return u=t.type._context,e=t.pendingProps.children,Ga(t),u=Kl(u),e=e(u),t.flags|=1,Jl(l,t,e,a),t.child;case 14:return jo(l,t,t.type,t.pendingProps,a);case 15:return qo(l,t,t.type,t.pendingProps,a);case 19:return Ko(l,t,a);case 31:return $m(l,t,a);case 22:return Yo(l,t,a,t.pendingProps);case 24:return Ga(t),e=Kl(Ul),l===null?(u=Kc(),u===null&&(u=yl,n=Lc(),u.pooledCache=n,n.refCount++,n!==null&&(u.pooledCacheLanes|=a),u=n),t.memoizedState={parent:e,cache:u},wc(t),ma(t,Ul,u)):((l.lanes&a)!==0&&(Wc(l,t),ou(t,null,null,a),su()),u=l.memoizedState,n=t.memoizedState,u.parent!==e?(u={parent:e,cache:e},t.memoizedState=u,t.lanes===0&&(t.memoizedState=t.updateQueue.baseState=u),ma(t,Ul,e)):(e=n.cache,ma(t,Ul,e),e!==u.cache&&Zc(t,[Ul],a,!0))),Jl(l,t,t.pendingProps.children,a),t.child;case 29:throw t.pendingProps}throw Error(h(156,t.tag))}function Pt(l){l.flags|=4}function Ni(l,t,a,e,u){if((t=(l.mode&32)!==0)&&(t=!1),t){if(l.flags|=16777216,(u&335544128)===u)if(l.stateNode.complete)l.flags|=8192;else if(bd())l.flags|=8192;else throw La=dn,Jc}else l.flags&=-16777217}function wo(l,t){if(t.type!=="stylesheet"||(t.state.loading&4)!==0)l.flags&=-16777217;else if(l.flags|=16777216,!f0(t))if(bd())l.flags|=8192;else throw La=dn,Jc}function Dn(l,t){t!==null&&(l.flags|=4),l.flags&16384&&(t=l.tag!==22?_f():536870912,l.lanes|=t,Me|=t)}function ru(l,t){if(!F)switch(l.tailMode){case"hidden":t=l.tail;for(var a=null;t!==null;)t.alternate!==null&&(a=t),t=t.sibling;a===null?l.tail=null:a.sibling=null;break;case"collapsed":a=l.tail;for(var e=null;a!==null;)a.alternate!==null&&(e=a),a=a.sibling;e===null?t||l.tail===null?l.tail=null:l.tail.sibling=null:e.sibling=null}}function bl(l){var t=l.alternate!==null&&l.alternate.child===l.child,a=0,e=0;if(t)for(var u=l.child;u!==null;)a|=u.lanes|u.childLanes,e|=u.subtreeFlags&65011712,e|=u.flags&65011712,u.return=l,u=u.sibling;else for(u=l.child;u!==null;)a|=u.lanes|u.childLanes,e|=u.subtreeFlags,e|=u.flags,u.return=l,u=u.sibling;return l.subtreeFlags|=e,l.childLanes=a,t}function Fm(l,t,a){var e=t.pendingProps;switch(Yc(t),t.tag){case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return bl(t),null;case 1:return bl(t),null;case 3:return a=t.stateNode,e=null,l!==null&&(e=l.memoizedState.cache),t.memoizedState.cache!==e&&(t.flags|=2048),$t(Ul),rl(),a.pendingContext&&(a.context=a.pendingContext,a.pendingContext=null),(l===null||l.child===null)&&(ye(t)?Pt(t):l===null||l.memoizedState.isDehydrated&&(t.flags&256)===0||(t.flags|=1024,Qc())),bl(t),null;case 26:var u=t.type,n=t.memoizedState;return l===null?(Pt(t),n!==null?(bl(t),wo(t,n)):(bl(t),Ni(t,u,null,e,a))):n?n!==l.memoizedState?(Pt(t),bl(t),wo(t,n)):(bl(t),t.flags&=-16777217):(l=l.memoizedProps,l!==e&&Pt(t),bl(t),Ni(t,u,l,e,a)),null;case 27:if($a(t),a=L.current,u=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==e&&Pt(t);else{if(!e){if(t.stateNode===null)throw Error(h(166));return bl(t),null}l=N.current,ye(t)?_s(t):(l=l0(u,e,a),t.stateNode=l,Pt(t))}return bl(t),null;case 5:if($a(t),u=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==e&&Pt(t);else{if(!e){if(t.stateNode===null)throw Error(h(166));return bl(t),null}if(n=N.current,ye(t))_s(t);else{var c=Ln(L.current);switch(n){case 1:n=c.createElementNS("http://www.w3.org/2000/svg",u);break;case 2:n=c.createElementNS("http://www.w3.org/1998/Math/MathML",u);break;default:switch(u){case"svg":n=c.createElementNS("http://www.w3.org/2000/svg",u);break;case"math":n=c.createElementNS("http://www.w3.org/1998/Math/MathML",u);break;case"script":n=c.createElement("div"),n.innerHTML="<script><\/script>",n=n.removeChild(n.firstChild);break;case"select":n=typeof e.is=="string"?c.createElement("select",{is:e.is}):c.createElement("select"),e.multiple?n.multiple=!0:e.size&&(n.size=e.size);break;default:n=typeof e.is=="string"?c.createElement(u,{is:e.is}):c.createElement(u)}}n[Ll]=t,n[et]=e;l:for(c=t.child;c!==null;){if(c.tag===5||c.tag===6)n.appendChild(c.stateNode);else if(c.tag!==4&&c.tag!==27&&c.child!==null){c.child.return=c,c=c.child;continue}if(c===t)break l;for(;c.sibling===null;){if(c.return===null||c.return===t)break l;c=c.return}c.sibling.return=c.return,c=c.sibling}t.stateNode=n;l:switch(wl(n,u,e),u){case"button":case"input":case"select":case"textarea":e=!!e.autoFocus;break l;case"img":e=!0;break l;default:e=!1}e&&Pt(t)}}return bl(t),Ni(t,t.type,l===null?null:l.memoizedProps,t.pendingProps,a),null;case 6:if(l&&t.stateNode!=null)l.memoizedProps!==e&&Pt(t);else{if(typeof e!="string"&&t.stateNode===null)throw Error(h(166));if(l=L.current,ye(t)){if(l=t.stateNode,a=t.memoizedProps,e=null,u=Vl,u!==null)switch(u.tag){case 27:case 5:e=u.memoizedProps}l[Ll]=t,l=!!(l.nodeValue===a||e!==null&&e.suppressHydrationWarning===!0||Ld(l.nodeValue,a)),l||da(t,!0)}else l=Ln(l).createTextNode(e),l[Ll]=t,t.stateNode=l}return bl(t),null;case 31:if(a=t.memoizedState,l===null||l.memoizedState!==null){if(e=ye(t),a!==null){if(l===null){if(!e)throw Error(h(318));if(l=t.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(h(557));l[Ll]=t}else Ba(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;bl(t),l=!1}else a=Qc(),l!==null&&l.memoizedState!==null&&(l.memoizedState.hydrationErrors=a),l=!0;if(!l)return t.flags&256?(yt(t),t):(yt(t),null);if((t.flags&128)!==0)throw Error(h(558))}return bl(t),null;case 13:if(e=t.memoizedState,l===null||l.memoizedState!==null&&l.memoizedState.dehydrated!==null){if(u=ye(t),e!==null&&e.dehydrated!==null){if(l===null){if(!u)throw Error(h(318));if(u=t.memoizedState,u=u!==null?u.dehydrated:null,!u)throw Error(h(317));u[Ll]=t}else Ba(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;bl(t),u=!1}else u=Qc(),l!==null&&l.memoizedState!==null&&(l.memoizedState.hydrationErrors=u),u=!0;if(!u)return t.flags&256?(yt(t),t):(yt(t),null)}return yt(t),(t.flags&128)!==0?(t.lanes=a,t):(a=e!==null,l=l!==null&&l.memoizedState!==null,a&&(e=t.child,u=null,e.alternate!==null&&e.alternate.memoizedState!==null&&e.alternate.memoizedState.cachePool!==null&&(u=e.alternate.memoizedState.cachePool.pool),n=null,e.memoizedState!==null&&e.memoizedState.cachePool!==null&&(n=e.memoizedState.cachePool.pool),n!==u&&(e.flags|=2048)),a!==l&&a&&(t.child.flags|=8192),Dn(t,t.updateQueue),bl(t),null);case 4:return rl(),l===null&&Fi(t.stateNode.containerInfo),bl(t),null;case 10:return $t(t.type),bl(t),null;case 19:if(z(Dl),e=t.memoizedState,e===null)return bl(t),null;if(u=(t.flags&128)!==0,n=e.rendering,n===null)if(u)ru(e,!1);else{if(Ol!==0||l!==null&&(l.flags&128)!==0)for(l=t.child;l!==null;){if(n=hn(l),n!==null){for(t.flags|=128,ru(e,!1),l=n.updateQueue,t.updateQueue=l,Dn(t,l),t.subtreeFlags=0,l=a,a=t.child;a!==null;)Es(a,l),a=a.sibling;return _(Dl,Dl.current&1|2),F&&wt(t,e.treeForkCount),t.child}l=l.sibling}e.tail!==null&&Zl()>Rn&&(t.flags|=128,u=!0,ru(e,!1),t.lanes=4194304)}else{if(!u)if(l=hn(n),l!==null){if(t.flags|=128,u=!0,l=l.updateQueue,t.updateQueue=l,Dn(t,l),ru(e,!0),e.tail===null&&e.tailMode==="hidden"&&!n.alternate&&!F)return bl(t),null}else 2*Zl()-e.renderingStartTime>Rn&&a!==536870912&&(t.flags|=128,u=!0,ru(e,!1),t.lanes=4194304);e.isBackwards?(n.sibling=t.child,t.child=n):(l=e.last,l!==null?l.sibling=n:t.child=n,e.last=n)}return e.tail!==null?(l=e.tail,e.rendering=l,e.tail=l.sibling,e.renderingStartTime=Zl(),l.sibling=null,a=Dl.current,_(Dl,u?a&1|2:a&1),F&&wt(t,e.treeForkCount),l):(bl(t),null);case 22:case 23:return yt(t),Ic(),e=t.memoizedState!==null,l!==null?l.memoizedState!==null!==e&&(t.flags|=8192):e&&(t.flags|=8192),e?(a&536870912)!==0&&(t.flags&128)===0&&(bl(t),t.subtreeFlags&6&&(t.flags|=8192)):bl(t),a=t.updateQueue,a!==null&&Dn(t,a.retryQueue),a=null,l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(a=l.memoizedState.cachePool.pool),e=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(e=t.memoizedState.cachePool.pool),e!==a&&(t.flags|=2048),l!==null&&z(Xa),null;case 24:return a=null,l!==null&&(a=l.memoizedState.cache),t.memoizedState.cache!==a&&(t.flags|=2048),$t(Ul),bl(t),null;case 25:return null;case 30:return null}throw Error(h(156,t.tag))}function Im(l,t){switch(Yc(t),t.tag){case 1:return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 3:return $t(Ul),rl(),l=t.flags,(l&65536)!==0&&(l&128)===0?(t.flags=l&-65537|128,t):null;case 26:case 27:case 5:return $a(t),null;case 31:if(t.memoizedState!==null){if(yt(t),t.alternate===null)throw Error(h(340));Ba()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 13:if(yt(t),l=t.memoizedState,l!==null&&l.dehydrated!==null){if(t.alternate===null)throw Error(h(340));Ba()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 19:return z(Dl),null;case 4:return rl(),null;case 10:return $t(t.type),null;case 22:case 23:return yt(t),Ic(),l!==null&&z(Xa),l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 24:return $t(Ul),null;case 25:return null;default:return null}}function Wo(l,t){switch(Yc(t),t.tag){case 3:$t(Ul),rl();break;case 26:case 27:case 5:$a(t);break;case 4:rl();break;case 31:t.memoizedState!==null&&yt(t);break;case 13:yt(t);break;case 19:z(Dl);break;case 10:$t(t.type);break;case 22:case 23:yt(t),Ic(),l!==null&&z(Xa);break;case 24:$t(Ul)}}function gu(l,t){try{var a=t.updateQueue,e=a!==null?a.lastEffect:null;if(e!==null){var u=e.next;a=u;do{if((a.tag&l)===l){e=void 0;var n=a.create,c=a.inst;e=n(),c.destroy=e}a=a.next}while(a!==u)}}catch(i){fl(t,t.return,i)}}function Sa(l,t,a){try{var e=t.updateQueue,u=e!==null?e.lastEffect:null;if(u!==null){var n=u.next;e=n;do{if((e.tag&l)===l){var c=e.inst,i=c.destroy;if(i!==void 0){c.destroy=void 0,u=t;var f=a,v=i;try{v()}catch(S){fl(u,f,S)}}}e=e.next}while(e!==n)}}catch(S){fl(t,t.return,S)}}function $o(l){var t=l.updateQueue;if(t!==null){var a=l.stateNode;try{Bs(t,a)}catch(e){fl(l,l.return,e)}}}function ko(l,t,a){a.props=Ja(l.type,l.memoizedProps),a.state=l.memoizedState;try{a.componentWillUnmount()}catch(e){fl(l,t,e)}}function Su(l,t){try{var a=l.ref;if(a!==null){switch(l.tag){case 26:case 27:case 5:var e=l.stateNode;break;case 30:e=l.stateNode;break;default:e=l.stateNode}typeof a=="function"?l.refCleanup=a(e):a.current=e}}catch(u){fl(l,t,u)}}function Bt(l,t){var a=l.ref,e=l.refCleanup;if(a!==null)if(typeof e=="function")try{e()}catch(u){fl(l,t,u)}finally{l.refCleanup=null,l=l.alternate,l!=null&&(l.refCleanup=null)}else if(typeof a=="function")try{a(null)}catch(u){fl(l,t,u)}else a.current=null}function Fo(l){var t=l.type,a=l.memoizedProps,e=l.stateNode;try{l:switch(t){case"button":case"input":case"select":case"textarea":a.autoFocus&&e.focus();break l;case"img":a.src?e.src=a.src:a.srcSet&&(e.srcset=a.srcSet)}}catch(u){fl(l,l.return,u)}}function Ui(l,t,a){try{var e=l.stateNode;Ev(e,l.type,a,t),e[et]=t}catch(u){fl(l,l.return,u)}}function Io(l){return l.tag===5||l.tag===3||l.tag===26||l.tag===27&&_a(l.type)||l.tag===4}function xi(l){l:for(;;){for(;l.sibling===null;){if(l.return===null||Io(l.return))return null;l=l.return}for(l.sibling.return=l.return,l=l.sibling;l.tag!==5&&l.tag!==6&&l.tag!==18;){if(l.tag===27&&_a(l.type)||l.flags&2||l.child===null||l.tag===4)continue l;l.child.return=l,l=l.child}if(!(l.flags&2))return l.stateNode}}function Ci(l,t,a){var e=l.tag;if(e===5||e===6)l=l.stateNode,t?(a.nodeType===9?a.body:a.nodeName==="HTML"?a.ownerDocument.body:a).insertBefore(l,t):(t=a.nodeType===9?a.body:a.nodeName==="HTML"?a.ownerDocument.body:a,t.appendChild(l),a=a._reactRootContainer,a!=null||t.onclick!==null||(t.onclick=Vt));else if(e!==4&&(e===27&&_a(l.type)&&(a=l.stateNode,t=null),l=l.child,l!==null))for(Ci(l,t,a),l=l.sibling;l!==null;)Ci(l,t,a),l=l.sibling}function Nn(l,t,a){var e=l.tag;if(e===5||e===6)l=l.stateNode,t?a.insertBefore(l,t):a.appendChild(l);else if(e!==4&&(e===27&&_a(l.type)&&(a=l.stateNode),l=l.child,l!==null))for(Nn(l,t,a),l=l.sibling;l!==null;)Nn(l,t,a),l=l.sibling}function Po(l){var t=l.stateNode,a=l.memoizedProps;try{for(var e=l.type,u=t.attributes;u.length;)t.removeAttributeNode(u[0]);wl(t,e,a),t[Ll]=l,t[et]=a}catch(n){fl(l,l.return,n)}}var la=!1,Rl=!1,Ri=!1,ld=typeof WeakSet=="function"?WeakSet:Set,Ql=null;function Pm(l,t){if(l=l.containerInfo,lf=kn,l=ds(l),Oc(l)){if("selectionStart"in l)var a={start:l.selectionStart,end:l.selectionEnd};else l:{a=(a=l.ownerDocument)&&a.defaultView||window;var e=a.getSelection&&a.getSelection();if(e&&e.rangeCount!==0){a=e.anchorNode;var u=e.anchorOffset,n=e.focusNode;e=e.focusOffset;try{a.nodeType,n.nodeType}catch{a=null;break l}var c=0,i=-1,f=-1,v=0,S=0,E=l,y=null;t:for(;;){for(var r;E!==a||u!==0&&E.nodeType!==3||(i=c+u),E!==n||e!==0&&E.nodeType!==3||(f=c+e),E.nodeType===3&&(c+=E.nodeValue.length),(r=E.firstChild)!==null;)y=E,E=r;for(;;){if(E===l)break t;if(y===a&&++v===u&&(i=c),y===n&&++S===e&&(f=c),(r=E.nextSibling)!==null)break;E=y,y=E.parentNode}E=r}a=i===-1||f===-1?null:{start:i,end:f}}else a=null}a=a||{start:0,end:0}}else a=null;for(tf={focusedElem:l,selectionRange:a},kn=!1,Ql=t;Ql!==null;)if(t=Ql,l=t.child,(t.subtreeFlags&1028)!==0&&l!==null)l.return=t,Ql=l;else for(;Ql!==null;){switch(t=Ql,n=t.alternate,l=t.flags,t.tag){case 0:if((l&4)!==0&&(l=t.updateQueue,l=l!==null?l.events:null,l!==null))for(a=0;a<l.length;a++)u=l[a],u.ref.impl=u.nextImpl;break;case 11:case 15:break;case 1:if((l&1024)!==0&&n!==null){l=void 0,a=t,u=n.memoizedProps,n=n.memoizedState,e=a.stateNode;try{var D=Ja(a.type,u);l=e.getSnapshotBeforeUpdate(D,n),e.__reactInternalSnapshotBeforeUpdate=l}catch(q){fl(a,a.return,q)}}break;case 3:if((l&1024)!==0){if(l=t.stateNode.containerInfo,a=l.nodeType,a===9)uf(l);else if(a===1)switch(l.nodeName){case"HEAD":case"HTML":case"BODY":uf(l);break;default:l.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((l&1024)!==0)throw Error(h(163))}if(l=t.sibling,l!==null){l.return=t.return,Ql=l;break}Ql=t.return}}function td(l,t,a){var e=a.flags;switch(a.tag){case 0:case 11:case 15:aa(l,a),e&4&&gu(5,a);break;case 1:if(aa(l,a),e&4)if(l=a.stateNode,t===null)try{l.componentDidMount()}catch(c){fl(a,a.return,c)}else{var u=Ja(a.type,t.memoizedProps);t=t.memoizedState;try{l.componentDidUpdate(u,t,l.__reactInternalSnapshotBeforeUpdate)}catch(c){fl(a,a.return,c)}}e&64&&$o(a),e&512&&Su(a,a.return);break;case 3:if(aa(l,a),e&64&&(l=a.updateQueue,l!==null)){if(t=null,a.child!==null)switch(a.child.tag){case 27:case 5:t=a.child.stateNode;break;case 1:t=a.child.stateNode}try{Bs(l,t)}catch(c){fl(a,a.return,c)}}break;case 27:t===null&&e&4&&Po(a);case 26:case 5:aa(l,a),t===null&&e&4&&Fo(a),e&512&&Su(a,a.return);break;case 12:aa(l,a);break;case 31:aa(l,a),e&4&&ud(l,a);break;case 13:aa(l,a),e&4&&nd(l,a),e&64&&(l=a.memoizedState,l!==null&&(l=l.dehydrated,l!==null&&(a=fv.bind(null,a),Dv(l,a))));break;case 22:if(e=a.memoizedState!==null||la,!e){t=t!==null&&t.memoizedState!==null||Rl,u=la;var n=Rl;la=e,(Rl=t)&&!n?ea(l,a,(a.subtreeFlags&8772)!==0):aa(l,a),la=u,Rl=n}break;case 30:break;default:aa(l,a)}}function ad(l){var t=l.alternate;t!==null&&(l.alternate=null,ad(t)),l.child=null,l.deletions=null,l.sibling=null,l.tag===5&&(t=l.stateNode,t!==null&&sc(t)),l.stateNode=null,l.return=null,l.dependencies=null,l.memoizedProps=null,l.memoizedState=null,l.pendingProps=null,l.stateNode=null,l.updateQueue=null}var El=null,nt=!1;function ta(l,t,a){for(a=a.child;a!==null;)ed(l,t,a),a=a.sibling}function ed(l,t,a){if(gl&&typeof gl.onCommitFiberUnmount=="function")try{gl.onCommitFiberUnmount(Ml,a)}catch{}switch(a.tag){case 26:Rl||Bt(a,t),ta(l,t,a),a.memoizedState?a.memoizedState.count--:a.stateNode&&(a=a.stateNode,a.parentNode.removeChild(a));break;case 27:Rl||Bt(a,t);var e=El,u=nt;_a(a.type)&&(El=a.stateNode,nt=!1),ta(l,t,a),Mu(a.stateNode),El=e,nt=u;break;case 5:Rl||Bt(a,t);case 6:if(e=El,u=nt,El=null,ta(l,t,a),El=e,nt=u,El!==null)if(nt)try{(El.nodeType===9?El.body:El.nodeName==="HTML"?El.ownerDocument.body:El).removeChild(a.stateNode)}catch(n){fl(a,t,n)}else try{El.removeChild(a.stateNode)}catch(n){fl(a,t,n)}break;case 18:El!==null&&(nt?(l=El,$d(l.nodeType===9?l.body:l.nodeName==="HTML"?l.ownerDocument.body:l,a.stateNode),je(l)):$d(El,a.stateNode));break;case 4:e=El,u=nt,El=a.stateNode.containerInfo,nt=!0,ta(l,t,a),El=e,nt=u;break;case 0:case 11:case 14:case 15:Sa(2,a,t),Rl||Sa(4,a,t),ta(l,t,a);break;case 1:Rl||(Bt(a,t),e=a.stateNode,typeof e.componentWillUnmount=="function"&&ko(a,t,e)),ta(l,t,a);break;case 21:ta(l,t,a);break;case 22:Rl=(e=Rl)||a.memoizedState!==null,ta(l,t,a),Rl=e;break;default:ta(l,t,a)}}function ud(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null))){l=l.dehydrated;try{je(l)}catch(a){fl(t,t.return,a)}}}function nd(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null&&(l=l.dehydrated,l!==null))))try{je(l)}catch(a){fl(t,t.return,a)}}function lv(l){switch(l.tag){case 31:case 13:case 19:var t=l.stateNode;return t===null&&(t=l.stateNode=new ld),t;case 22:return l=l.stateNode,t=l._retryCache,t===null&&(t=l._retryCache=new ld),t;default:throw Error(h(435,l.tag))}}function Un(l,t){var a=lv(l);t.forEach(function(e){if(!a.has(e)){a.add(e);var u=sv.bind(null,l,e);e.then(u,u)}})}function ct(l,t){var a=t.deletions;if(a!==null)for(var e=0;e<a.length;e++){var u=a[e],n=l,c=t,i=c;l:for(;i!==null;){switch(i.tag){case 27:if(_a(i.type)){El=i.stateNode,nt=!1;break l}break;case 5:El=i.stateNode,nt=!1;break l;case 3:case 4:El=i.stateNode.containerInfo,nt=!0;break l}i=i.return}if(El===null)throw Error(h(160));ed(n,c,u),El=null,nt=!1,n=u.alternate,n!==null&&(n.return=null),u.return=null}if(t.subtreeFlags&13886)for(t=t.child;t!==null;)cd(t,l),t=t.sibling}var Rt=null;function cd(l,t){var a=l.alternate,e=l.flags;switch(l.tag){case 0:case 11:case 14:case 15:ct(t,l),it(l),e&4&&(Sa(3,l,l.return),gu(3,l),Sa(5,l,l.return));break;case 1:ct(t,l),it(l),e&512&&(Rl||a===null||Bt(a,a.return)),e&64&&la&&(l=l.updateQueue,l!==null&&(e=l.callbacks,e!==null&&(a=l.shared.hiddenCallbacks,l.shared.hiddenCallbacks=a===null?e:a.concat(e))));break;case 26:var u=Rt;if(ct(t,l),it(l),e&512&&(Rl||a===null||Bt(a,a.return)),e&4){var n=a!==null?a.memoizedState:null;if(e=l.memoizedState,a===null)if(e===null)if(l.stateNode===null){l:{e=l.type,a=l.memoizedProps,u=u.ownerDocument||u;t:switch(e){case"title":n=u.getElementsByTagName("title")[0],(!n||n[Ke]||n[Ll]||n.namespaceURI==="http://www.w3.org/2000/svg"||n.hasAttribute("itemprop"))&&(n=u.createElement(e),u.head.insertBefore(n,u.querySelector("head > title"))),wl(n,e,a),n[Ll]=l,Bl(n),e=n;break l;case"link":var c=c0("link","href",u).get(e+(a.href||""));if(c){for(var i=0;i<c.length;i++)if(n=c[i],n.getAttribute("href")===(a.href==null||a.href===""?null:a.href)&&n.getAttribute("rel")===(a.rel==null?null:a.rel)&&n.getAttribute("title")===(a.title==null?null:a.title)&&n.getAttribute("crossorigin")===(a.crossOrigin==null?null:a.crossOrigin)){c.splice(i,1);break t}}n=u.createElement(e),wl(n,e,a),u.head.appendChild(n);break;case"meta":if(c=c0("meta","content",u).get(e+(a.content||""))){for(i=0;i<c.length;i++)if(n=c[i],n.getAttribute("content")===(a.content==null?null:""+a.content)&&n.getAttribute("name")===(a.name==null?null:a.name)&&n.getAttribute("property")===(a.property==null?null:a.property)&&n.getAttribute("http-equiv")===(a.httpEquiv==null?null:a.httpEquiv)&&n.getAttribute("charset")===(a.charSet==null?null:a.charSet)){c.splice(i,1);break t}}n=u.createElement(e),wl(n,e,a),u.head.appendChild(n);break;default:throw Error(h(468,e))}n[Ll]=l,Bl(n),e=n}l.stateNode=e}else i0(u,l.type,l.stateNode);else l.stateNode=n0(u,e,l.memoizedProps);else n!==e?(n===null?a.stateNode!==null&&(a=a.stateNode,a.parentNode.removeChild(a)):n.count--,e===null?i0(u,l.type,l.stateNode):n0(u,e,l.memoizedProps)):e===null&&l.stateNode!==null&&Ui(l,l.memoizedProps,a.memoizedProps)}break;case 27:ct(t,l),it(l),e&512&&(Rl||a===null||Bt(a,a.return)),a!==null&&e&4&&Ui(l,l.memoizedProps,a.memoizedProps);break;case 5:if(ct(t,l),it(l),e&512&&(Rl||a===null||Bt(a,a.return)),l.flags&32){u=l.stateNode;try{ue(u,"")}catch(D){fl(l,l.return,D)}}e&4&&l.stateNode!=null&&(u=l.memoizedProps,Ui(l,u,a!==null?a.memoizedProps:u)),e&1024&&(Ri=!0);break;case 6:if(ct(t,l),it(l),e&4){if(l.stateNode===null)throw Error(h(162));e=l.memoizedProps,a=l.stateNode;try{a.nodeValue=e}catch(D){fl(l,l.return,D)}}break;case 3:if(Jn=null,u=Rt,Rt=Vn(t.containerInfo),ct(t,l),Rt=u,it(l),e&4&&a!==null&&a.memoizedState.isDehydrated)try{je(t.containerInfo)}catch(D){fl(l,l.return,D)}Ri&&(Ri=!1,id(l));break;case 4:e=Rt,Rt=Vn(l.stateNode.containerInfo),ct(t,l),it(l),Rt=e;break;case 12:ct(t,l),it(l);break;case 31:ct(t,l),it(l),e&4&&(e=l.updateQueue,e!==null&&(l.updateQueue=null,Un(l,e)));break;case 13:ct(t,l),it(l),l.child.flags&8192&&l.memoizedState!==null!=(a!==null&&a.memoizedState!==null)&&(Cn=Zl()),e&4&&(e=l.updateQueue,e!==null&&(l.updateQueue=null,Un(l,e)));break;case 22:u=l.memoizedState!==null;var f=a!==null&&a.memoizedState!==null,v=la,S=Rl;if(la=v||u,Rl=S||f,ct(t,l),Rl=S,la=v,it(l),e&8192)l:for(t=l.stateNode,t._visibility=u?t._visibility&-2:t._visibility|1,u&&(a===null||f||la||Rl||wa(l)),a=null,t=l;;){if(t.tag===5||t.tag===26){if(a===null){f=a=t;try{if(n=f.stateNode,u)c=n.style,typeof c.setProperty=="function"?c.setProperty("display","none","important"):c.display="none";else{i=f.stateNode;var E=f.memoizedProps.style,y=E!=null&&E.hasOwnProperty("display")?E.display:null;i.style.display=y==null||typeof y=="boolean"?"":(""+y).trim()}}catch(D){fl(f,f.return,D)}}}else if(t.tag===6){if(a===null){f=t;try{f.stateNode.nodeValue=u?"":f.memoizedProps}catch(D){fl(f,f.return,D)}}}else if(t.tag===18){if(a===null){f=t;try{var r=f.stateNode;u?kd(r,!0):kd(f.stateNode,!1)}catch(D){fl(f,f.return,D)}}}else if((t.tag!==22&&t.tag!==23||t.memoizedState===null||t===l)&&t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break l;for(;t.sibling===null;){if(t.return===null||t.return===l)break l;a===t&&(a=null),t=t.return}a===t&&(a=null),t.sibling.return=t.return,t=t.sibling}e&4&&(e=l.updateQueue,e!==null&&(a=e.retryQueue,a!==null&&(e.retryQueue=null,Un(l,a))));break;case 19:ct(t,l),it(l),e&4&&(e=l.updateQueue,e!==null&&(l.updateQueue=null,Un(l,e)));break;case 30:break;case 21:break;default:ct(t,l),it(l)}}function it(l){var t=l.flags;if(t&2){try{for(var a,e=l.return;e!==null;){if(Io(e)){a=e;break}e=e.return}if(a==null)throw Error(h(160));switch(a.tag){case 27:var u=a.stateNode,n=xi(l);Nn(l,n,u);break;case 5:var c=a.stateNode;a.flags&32&&(ue(c,""),a.flags&=-33);var i=xi(l);Nn(l,i,c);break;case 3:case 4:var f=a.stateNode.containerInfo,v=xi(l);Ci(l,v,f);break;default:throw Error(h(161))}}catch(S){fl(l,l.return,S)}l.flags&=-3}t&4096&&(l.flags&=-4097)}function id(l){if(l.subtreeFlags&1024)for(l=l.child;l!==null;){var t=l;id(t),t.tag===5&&t.flags&1024&&t.stateNode.reset(),l=l.sibling}}function aa(l,t){if(t.subtreeFlags&8772)for(t=t.child;t!==null;)td(l,t.alternate,t),t=t.sibling}function wa(l){for(l=l.child;l!==null;){var t=l;switch(t.tag){case 0:case 11:case 14:case 15:Sa(4,t,t.return),wa(t);break;case 1:Bt(t,t.return);var a=t.stateNode;typeof a.componentWillUnmount=="function"&&ko(t,t.return,a),wa(t);break;case 27:Mu(t.stateNode);case 26:case 5:Bt(t,t.return),wa(t);break;case 22:t.memoizedState===null&&wa(t);break;case 30:wa(t);break;default:wa(t)}l=l.sibling}}function ea(l,t,a){for(a=a&&(t.subtreeFlags&8772)!==0,t=t.child;t!==null;){var e=t.alternate,u=l,n=t,c=n.flags;switch(n.tag){case 0:case 11:case 15:ea(u,n,a),gu(4,n);break;case 1:if(ea(u,n,a),e=n,u=e.stateNode,typeof u.componentDidMount=="function")try{u.componentDidMount()}catch(v){fl(e,e.return,v)}if(e=n,u=e.updateQueue,u!==null){var i=e.stateNode;try{var f=u.shared.hiddenCallbacks;if(f!==null)for(u.shared.hiddenCallbacks=null,u=0;u<f.length;u++)Ys(f[u],i)}catch(v){fl(e,e.return,v)}}a&&c&64&&$o(n),Su(n,n.return);break;case 27:Po(n);case 26:case 5:ea(u,n,a),a&&e===null&&c&4&&Fo(n),Su(n,n.return);break;case 12:ea(u,n,a);break;case 31:ea(u,n,a),a&&c&4&&ud(u,n);break;case 13:ea(u,n,a),a&&c&4&&nd(u,n);break;case 22:n.memoizedState===null&&ea(u,n,a),Su(n,n.return);break;case 30:break;default:ea(u,n,a)}t=t.sibling}}function Hi(l,t){var a=null;l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(a=l.memoizedState.cachePool.pool),l=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(l=t.memoizedState.cachePool.pool),l!==a&&(l!=null&&l.refCount++,a!=null&&uu(a))}function ji(l,t){l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&uu(l))}function Ht(l,t,a,e){if(t.subtreeFlags&10256)for(t=t.child;t!==null;)fd(l,t,a,e),t=t.sibling}function fd(l,t,a,e){var u=t.flags;switch(t.tag){case 0:case 11:case 15:Ht(l,t,a,e),u&2048&&gu(9,t);break;case 1:Ht(l,t,a,e);break;case 3:Ht(l,t,a,e),u&2048&&(l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&uu(l)));break;case 12:if(u&2048){Ht(l,t,a,e),l=t.stateNode;try{var n=t.memoizedProps,c=n.id,i=n.onPostCommit;typeof i=="function"&&i(c,t.alternate===null?"mount":"update",l.passiveEffectDuration,-0)}catch(f){fl(t,t.return,f)}}else Ht(l,t,a,e);break;case 31:Ht(l,t,a,e);break;case 13:Ht(l,t,a,e);break;case 23:break;case 22:n=t.stateNode,c=t.alternate,t.memoizedState!==null?n._visibility&2?Ht(l,t,a,e):bu(l,t):n._visibility&2?Ht(l,t,a,e):(n._visibility|=2,Ae(l,t,a,e,(t.subtreeFlags&10256)!==0||!1)),u&2048&&Hi(c,t);break;case 24:Ht(l,t,a,e),u&2048&&ji(t.alternate,t);break;default:Ht(l,t,a,e)}}function Ae(l,t,a,e,u){for(u=u&&((t.subtreeFlags&10256)!==0||!1),t=t.child;t!==null;){var n=l,c=t,i=a,f=e,v=c.flags;switch(c.tag){case 0:case 11:case 15:Ae(n,c,i,f,u),gu(8,c);break;case 23:break;case 22:var S=c.stateNode;c.memoizedState!==null?S._visibility&2?Ae(n,c,i,f,u):bu(n,c):(S._visibility|=2,Ae(n,c,i,f,u)),u&&v&2048&&Hi(c.alternate,c);break;case 24:Ae(n,c,i,f,u),u&&v&2048&&ji(c.alternate,c);break;default:Ae(n,c,i,f,u)}t=t.sibling}}function bu(l,t){if(t.subtreeFlags&10256)for(t=t.child;t!==null;){var a=l,e=t,u=e.flags;switch(e.tag){case 22:bu(a,e),u&2048&&Hi(e.alternate,e);break;case 24:bu(a,e),u&2048&&ji(e.alternate,e);break;default:bu(a,e)}t=t.sibling}}var Eu=8192;function _e(l,t,a){if(l.subtreeFlags&Eu)for(l=l.child;l!==null;)sd(l,t,a),l=l.sibling}function sd(l,t,a){switch(l.tag){case 26:_e(l,t,a),l.flags&Eu&&l.memoizedState!==null&&Gv(a,Rt,l.memoizedState,l.memoizedProps);break;case 5:_e(l,t,a);break;case 3:case 4:var e=Rt;Rt=Vn(l.stateNode.containerInfo),_e(l,t,a),Rt=e;break;case 22:l.memoizedState===null&&(e=l.alternate,e!==null&&e.memoizedState!==null?(e=Eu,Eu=16777216,_e(l,t,a),Eu=e):_e(l,t,a));break;default:_e(l,t,a)}}function od(l){var t=l.alternate;if(t!==null&&(l=t.child,l!==null)){t.child=null;do t=l.sibling,l.sibling=null,l=t;while(l!==null)}}function zu(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var a=0;a<t.length;a++){var e=t[a];Ql=e,md(e,l)}od(l)}if(l.subtreeFlags&10256)for(l=l.child;l!==null;)dd(l),l=l.sibling}function dd(l){switch(l.tag){case 0:case 11:case 15:zu(l),l.flags&2048&&Sa(9,l,l.return);break;case 3:zu(l);break;case 12:zu(l);break;case 22:var t=l.stateNode;l.memoizedState!==null&&t._visibility&2&&(l.return===null||l.return.tag!==13)?(t._visibility&=-3,xn(l)):zu(l);break;default:zu(l)}}function xn(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var a=0;a<t.length;a++){var e=t[a];Ql=e,md(e,l)}od(l)}for(l=l.child;l!==null;){switch(t=l,t.tag){case 0:case 11:case 15:Sa(8,t,t.return),xn(t);break;case 22:a=t.stateNode,a._visibility&2&&(a._visibility&=-3,xn(t));break;default:xn(t)}l=l.sibling}}function md(l,t){for(;Ql!==null;){var a=Ql;switch(a.tag){case 0:case 11:case 15:Sa(8,a,t);break;case 23:case 22:if(a.memoizedState!==null&&a.memoizedState.cachePool!==null){var e=a.memoizedState.cachePool.pool;e!=null&&e.refCount++}break;case 24:uu(a.memoizedState.cache)}if(e=a.child,e!==null)e.return=a,Ql=e;else l:for(a=l;Ql!==null;){e=Ql;var u=e.sibling,n=e.return;if(ad(e),e===a){Ql=null;break l}if(u!==null){u.return=n,Ql=u;break l}Ql=n}}}var tv={getCacheForType:function(l){var t=Kl(Ul),a=t.data.get(l);return a===void 0&&(a=l(),t.data.set(l,a)),a},cacheSignal:function(){return Kl(Ul).controller.signal}},av=typeof WeakMap=="function"?WeakMap:Map,ul=0,yl=null,J=null,W=0,il=0,ht=null,ba=!1,Oe=!1,qi=!1,ua=0,Ol=0,Ea=0,Wa=0,Yi=0,rt=0,Me=0,pu=null,ft=null,Bi=!1,Cn=0,vd=0,Rn=1/0,Hn=null,za=null,ql=0,pa=null,De=null,na=0,Qi=0,Gi=null,yd=null,Tu=0,Xi=null;function gt(){return(ul&2)!==0&&W!==0?W&-W:g.T!==null?wi():Nf()}function hd(){if(rt===0)if((W&536870912)===0||F){var l=Xu;Xu<<=1,(Xu&3932160)===0&&(Xu=262144),rt=l}else rt=536870912;return l=vt.current,l!==null&&(l.flags|=32),rt}function st(l,t,a){(l===yl&&(il===2||il===9)||l.cancelPendingCommit!==null)&&(Ne(l,0),Ta(l,W,rt,!1)),Ve(l,a),((ul&2)===0||l!==yl)&&(l===yl&&((ul&2)===0&&(Wa|=a),Ol===4&&Ta(l,W,rt,!1)),Qt(l))}function rd(l,t,a){if((ul&6)!==0)throw Error(h(327));var e=!a&&(t&127)===0&&(t&l.expiredLanes)===0||Le(l,t),u=e?nv(l,t):Li(l,t,!0),n=e;do{if(u===0){Oe&&!e&&Ta(l,t,0,!1);break}else{if(a=l.current.alternate,n&&!ev(a)){u=Li(l,t,!1),n=!1;continue}if(u===2){if(n=t,l.errorRecoveryDisabledLanes&n)var c=0;else c=l.pendingLanes&-536870913,c=c!==0?c:c&536870912?536870912:0;if(c!==0){t=c;l:{var i=l;u=pu;var f=i.current.memoizedState.isDehydrated;if(f&&(Ne(i,c).flags|=256),c=Li(i,c,!1),c!==2){if(qi&&!f){i.errorRecoveryDisabledLanes|=n,Wa|=n,u=4;break l}n=ft,ft=u,n!==null&&(ft===null?ft=n:ft.push.apply(ft,n))}u=c}if(n=!1,u!==2)continue}}if(u===1){Ne(l,0),Ta(l,t,0,!0);break}l:{switch(e=l,n=u,n){case 0:case 1:throw Error(h(345));case 4:if((t&4194048)!==t)break;case 6:Ta(e,t,rt,!ba);break l;case 2:ft=null;break;case 3:case 5:break;default:throw Error(h(329))}if((t&62914560)===t&&(u=Cn+300-Zl(),10<u)){if(Ta(e,t,rt,!ba),Lu(e,0,!0)!==0)break l;na=t,e.timeoutHandle=wd(gd.bind(null,e,a,ft,Hn,Bi,t,rt,Wa,Me,ba,n,"Throttled",-0,0),u);break l}gd(e,a,ft,Hn,Bi,t,rt,Wa,Me,ba,n,null,-0,0)}}break}while(!0);Qt(l)}function gd(l,t,a,e,u,n,c,i,f,v,S,E,y,r){if(l.timeoutHandle=-1,E=t.subtreeFlags,E&8192||(E&16785408)===16785408){E={stylesheets:null,count:0,imgCount:0,imgBytes:0,suspenseyImages:[],waitingForImages:!0,waitingForViewTransition:!1,unsuspend:Vt},sd(t,n,E);var D=(n&62914560)===n?Cn-Zl():(n&4194048)===n?vd-Zl():0;if(D=Xv(E,D),D!==null){na=n,l.cancelPendingCommit=D(_d.bind(null,l,t,n,a,e,u,c,i,f,S,E,null,y,r)),Ta(l,n,c,!v);return}}_d(l,t,n,a,e,u,c,i,f)}function ev(l){for(var t=l;;){var a=t.tag;if((a===0||a===11||a===15)&&t.flags&16384&&(a=t.updateQueue,a!==null&&(a=a.stores,a!==null)))for(var e=0;e<a.length;e++){var u=a[e],n=u.getSnapshot;u=u.value;try{if(!dt(n(),u))return!1}catch{return!1}}if(a=t.child,t.subtreeFlags&16384&&a!==null)a.return=t,t=a;else{if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function Ta(l,t,a,e){t&=~Yi,t&=~Wa,l.suspendedLanes|=t,l.pingedLanes&=~t,e&&(l.warmLanes|=t),e=l.expirationTimes;for(var u=t;0<u;){var n=31-Yl(u),c=1<<n;e[n]=-1,u&=~c}a!==0&&Of(l,a,t)}function jn(){return(ul&6)===0?(Au(0),!1):!0}function Zi(){if(J!==null){if(il===0)var l=J.return;else l=J,Wt=Qa=null,ui(l),be=null,cu=0,l=J;for(;l!==null;)Wo(l.alternate,l),l=l.return;J=null}}function Ne(l,t){var a=l.timeoutHandle;a!==-1&&(l.timeoutHandle=-1,Tv(a)),a=l.cancelPendingCommit,a!==null&&(l.cancelPendingCommit=null,a()),na=0,Zi(),yl=l,J=a=Jt(l.current,null),W=t,il=0,ht=null,ba=!1,Oe=Le(l,t),qi=!1,Me=rt=Yi=Wa=Ea=Ol=0,ft=pu=null,Bi=!1,(t&8)!==0&&(t|=t&32);var e=l.entangledLanes;if(e!==0)for(l=l.entanglements,e&=t;0<e;){var u=31-Yl(e),n=1<<u;t|=l[u],e&=~n}return ua=t,tn(),a}function Sd(l,t){X=null,g.H=yu,t===Se||t===on?(t=Rs(),il=3):t===Jc?(t=Rs(),il=4):il=t===Ei?8:t!==null&&typeof t=="object"&&typeof t.then=="function"?6:1,ht=t,J===null&&(Ol=1,An(l,At(t,l.current)))}function bd(){var l=vt.current;return l===null?!0:(W&4194048)===W?Dt===null:(W&62914560)===W||(W&536870912)!==0?l===Dt:!1}function Ed(){var l=g.H;return g.H=yu,l===null?yu:l}function zd(){var l=g.A;return g.A=tv,l}function qn(){Ol=4,ba||(W&4194048)!==W&&vt.current!==null||(Oe=!0),(Ea&134217727)===0&&(Wa&134217727)===0||yl===null||Ta(yl,W,rt,!1)}function Li(l,t,a){var e=ul;ul|=2;var u=Ed(),n=zd();(yl!==l||W!==t)&&(Hn=null,Ne(l,t)),t=!1;var c=Ol;l:do try{if(il!==0&&J!==null){var i=J,f=ht;switch(il){case 8:Zi(),c=6;break l;case 3:case 2:case 9:case 6:vt.current===null&&(t=!0);var v=il;if(il=0,ht=null,Ue(l,i,f,v),a&&Oe){c=0;break l}break;default:v=il,il=0,ht=null,Ue(l,i,f,v)}}uv(),c=Ol;break}catch(S){Sd(l,S)}while(!0);return t&&l.shellSuspendCounter++,Wt=Qa=null,ul=e,g.H=u,g.A=n,J===null&&(yl=null,W=0,tn()),c}function uv(){for(;J!==null;)pd(J)}function nv(l,t){var a=ul;ul|=2;var e=Ed(),u=zd();yl!==l||W!==t?(Hn=null,Rn=Zl()+500,Ne(l,t)):Oe=Le(l,t);l:do try{if(il!==0&&J!==null){t=J;var n=ht;t:switch(il){case 1:il=0,ht=null,Ue(l,t,n,1);break;case 2:case 9:if(xs(n)){il=0,ht=null,Td(t);break}t=function(){il!==2&&il!==9||yl!==l||(il=7),Qt(l)},n.then(t,t);break l;case 3:il=7;break l;case 4:il=5;break l;case 7:xs(n)?(il=0,ht=null,Td(t)):(il=0,ht=null,Ue(l,t,n,7));break;case 5:var c=null;switch(J.tag){case 26:c=J.memoizedState;case 5:case 27:var i=J;if(c?f0(c):i.stateNode.complete){il=0,ht=null;var f=i.sibling;if(f!==null)J=f;else{var v=i.return;v!==null?(J=v,Yn(v)):J=null}break t}}il=0,ht=null,Ue(l,t,n,5);break;case 6:il=0,ht=null,Ue(l,t,n,6);break;case 8:Zi(),Ol=6;break l;default:throw Error(h(462))}}cv();break}catch(S){Sd(l,S)}while(!0);return Wt=Qa=null,g.H=e,g.A=u,ul=a,J!==null?0:(yl=null,W=0,tn(),Ol)}function cv(){for(;J!==null&&!uc();)pd(J)}function pd(l){var t=Jo(l.alternate,l,ua);l.memoizedProps=l.pendingProps,t===null?Yn(l):J=t}function Td(l){var t=l,a=t.alternate;switch(t.tag){case 15:case 0:t=Go(a,t,t.pendingProps,t.type,void 0,W);break;case 11:t=Go(a,t,t.pendingProps,t.type.render,t.ref,W);break;case 5:ui(t);default:Wo(a,t),t=J=Es(t,ua),t=Jo(a,t,ua)}l.memoizedProps=l.pendingProps,t===null?Yn(l):J=t}function Ue(l,t,a,e){Wt=Qa=null,ui(t),be=null,cu=0;var u=t.return;try{if(Wm(l,u,t,a,W)){Ol=1,An(l,At(a,l.current)),J=null;return}}catch(n){if(u!==null)throw J=u,n;Ol=1,An(l,At(a,l.current)),J=null;return}t.flags&32768?(F||e===1?l=!0:Oe||(W&536870912)!==0?l=!1:(ba=l=!0,(e===2||e===9||e===3||e===6)&&(e=vt.current,e!==null&&e.tag===13&&(e.flags|=16384))),Ad(t,l)):Yn(t)}function Yn(l){var t=l;do{if((t.flags&32768)!==0){Ad(t,ba);return}l=t.return;var a=Fm(t.alternate,t,ua);if(a!==null){J=a;return}if(t=t.sibling,t!==null){J=t;return}J=t=l}while(t!==null);Ol===0&&(Ol=5)}function Ad(l,t){do{var a=Im(l.alternate,l);if(a!==null){a.flags&=32767,J=a;return}if(a=l.return,a!==null&&(a.flags|=32768,a.subtreeFlags=0,a.deletions=null),!t&&(l=l.sibling,l!==null)){J=l;return}J=l=a}while(l!==null);Ol=6,J=null}function _d(l,t,a,e,u,n,c,i,f){l.cancelPendingCommit=null;do Bn();while(ql!==0);if((ul&6)!==0)throw Error(h(327));if(t!==null){if(t===l.current)throw Error(h(177));if(n=t.lanes|t.childLanes,n|=xc,Q0(l,a,n,c,i,f),l===yl&&(J=yl=null,W=0),De=t,pa=l,na=a,Qi=n,Gi=u,yd=e,(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?(l.callbackNode=null,l.callbackPriority=0,ov(A,function(){return Ud(),null})):(l.callbackNode=null,l.callbackPriority=0),e=(t.flags&13878)!==0,(t.subtreeFlags&13878)!==0||e){e=g.T,g.T=null,u=O.p,O.p=2,c=ul,ul|=4;try{Pm(l,t,a)}finally{ul=c,O.p=u,g.T=e}}ql=1,Od(),Md(),Dd()}}function Od(){if(ql===1){ql=0;var l=pa,t=De,a=(t.flags&13878)!==0;if((t.subtreeFlags&13878)!==0||a){a=g.T,g.T=null;var e=O.p;O.p=2;var u=ul;ul|=4;try{cd(t,l);var n=tf,c=ds(l.containerInfo),i=n.focusedElem,f=n.selectionRange;if(c!==i&&i&&i.ownerDocument&&os(i.ownerDocument.documentElement,i)){if(f!==null&&Oc(i)){var v=f.start,S=f.end;if(S===void 0&&(S=v),"selectionStart"in i)i.selectionStart=v,i.selectionEnd=Math.min(S,i.value.length);else{var E=i.ownerDocument||document,y=E&&E.defaultView||window;if(y.getSelection){var r=y.getSelection(),D=i.textContent.length,q=Math.min(f.start,D),vl=f.end===void 0?q:Math.min(f.end,D);!r.extend&&q>vl&&(c=vl,vl=q,q=c);var d=ss(i,q),s=ss(i,vl);if(d&&s&&(r.rangeCount!==1||r.anchorNode!==d.node||r.anchorOffset!==d.offset||r.focusNode!==s.node||r.focusOffset!==s.offset)){var m=E.createRange();m.setStart(d.node,d.offset),r.removeAllRanges(),q>vl?(r.addRange(m),r.extend(s.node,s.offset)):(m.setEnd(s.node,s.offset),r.addRange(m))}}}}for(E=[],r=i;r=r.parentNode;)r.nodeType===1&&E.push({element:r,left:r.scrollLeft,top:r.scrollTop});for(typeof i.focus=="function"&&i.focus(),i=0;i<E.length;i++){var b=E[i];b.element.scrollLeft=b.left,b.element.scrollTop=b.top}}kn=!!lf,tf=lf=null}finally{ul=u,O.p=e,g.T=a}}l.current=t,ql=2}}function Md(){if(ql===2){ql=0;var l=pa,t=De,a=(t.flags&8772)!==0;if((t.subtreeFlags&8772)!==0||a){a=g.T,g.T=null;var e=O.p;O.p=2;var u=ul;ul|=4;try{td(l,t.alternate,t)}finally{ul=u,O.p=e,g.T=a}}ql=3}}function Dd(){if(ql===4||ql===3){ql=0,Qu();var l=pa,t=De,a=na,e=yd;(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?ql=5:(ql=0,De=pa=null,Nd(l,l.pendingLanes));var u=l.pendingLanes;if(u===0&&(za=null),ic(a),t=t.stateNode,gl&&typeof gl.onCommitFiberRoot=="function")try{gl.onCommitFiberRoot(Ml,t,void 0,(t.current.flags&128)===128)}catch{}if(e!==null){t=g.T,u=O.p,O.p=2,g.T=null;try{for(var n=l.onRecoverableError,c=0;c<e.length;c++){var i=e[c];n(i.value,{componentStack:i.stack})}}finally{g.T=t,O.p=u}}(na&3)!==0&&Bn(),Qt(l),u=l.pendingLanes,(a&261930)!==0&&(u&42)!==0?l===Xi?Tu++:(Tu=0,Xi=l):Tu=0,Au(0)}}function Nd(l,t){(l.pooledCacheLanes&=t)===0&&(t=l.pooledCache,t!=null&&(l.pooledCache=null,uu(t)))}function Bn(){return Od(),Md(),Dd(),Ud()}function Ud(){if(ql!==5)return!1;var l=pa,t=Qi;Qi=0;var a=ic(na),e=g.T,u=O.p;try{O.p=32>a?32:a,g.T=null,a=Gi,Gi=null;var n=pa,c=na;if(ql=0,De=pa=null,na=0,(ul&6)!==0)throw Error(h(331));var i=ul;if(ul|=4,dd(n.current),fd(n,n.current,c,a),ul=i,Au(0,!1),gl&&typeof gl.onPostCommitFiberRoot=="function")try{gl.onPostCommitFiberRoot(Ml,n)}catch{}return!0}finally{O.p=u,g.T=e,Nd(l,t)}}function xd(l,t,a){t=At(a,t),t=bi(l.stateNode,t,2),l=ha(l,t,2),l!==null&&(Ve(l,2),Qt(l))}function fl(l,t,a){if(l.tag===3)xd(l,l,a);else for(;t!==null;){if(t.tag===3){xd(t,l,a);break}else if(t.tag===1){var e=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof e.componentDidCatch=="function"&&(za===null||!za.has(e))){l=At(a,l),a=Co(2),e=ha(t,a,2),e!==null&&(Ro(a,e,t,l),Ve(e,2),Qt(e));break}}t=t.return}}function Vi(l,t,a){var e=l.pingCache;if(e===null){e=l.pingCache=new av;var u=new Set;e.set(t,u)}else u=e.get(t),u===void 0&&(u=new Set,e.set(t,u));u.has(a)||(qi=!0,u.add(a),l=iv.bind(null,l,t,a),t.then(l,l))}function iv(l,t,a){var e=l.pingCache;e!==null&&e.delete(t),l.pingedLanes|=l.suspendedLanes&a,l.warmLanes&=~a,yl===l&&(W&a)===a&&(Ol===4||Ol===3&&(W&62914560)===W&&300>Zl()-Cn?(ul&2)===0&&Ne(l,0):Yi|=a,Me===W&&(Me=0)),Qt(l)}function Cd(l,t){t===0&&(t=_f()),l=qa(l,t),l!==null&&(Ve(l,t),Qt(l))}function fv(l){var t=l.memoizedState,a=0;t!==null&&(a=t.retryLane),Cd(l,a)}function sv(l,t){var a=0;switch(l.tag){case 31:case 13:var e=l.stateNode,u=l.memoizedState;u!==null&&(a=u.retryLane);break;case 19:e=l.stateNode;break;case 22:e=l.stateNode._retryCache;break;default:throw Error(h(314))}e!==null&&e.delete(t),Cd(l,a)}function ov(l,t){return Ge(l,t)}var Qn=null,xe=null,Ki=!1,Gn=!1,Ji=!1,Aa=0;function Qt(l){l!==xe&&l.next===null&&(xe===null?Qn=xe=l:xe=xe.next=l),Gn=!0,Ki||(Ki=!0,mv())}function Au(l,t){if(!Ji&&Gn){Ji=!0;do for(var a=!1,e=Qn;e!==null;){if(l!==0){var u=e.pendingLanes;if(u===0)var n=0;else{var c=e.suspendedLanes,i=e.pingedLanes;n=(1<<31-Yl(42|l)+1)-1,n&=u&~(c&~i),n=n&201326741?n&201326741|1:n?n|2:0}n!==0&&(a=!0,qd(e,n))}else n=W,n=Lu(e,e===yl?n:0,e.cancelPendingCommit!==null||e.timeoutHandle!==-1),(n&3)===0||Le(e,n)||(a=!0,qd(e,n));e=e.next}while(a);Ji=!1}}function dv(){Rd()}function Rd(){Gn=Ki=!1;var l=0;Aa!==0&&pv()&&(l=Aa);for(var t=Zl(),a=null,e=Qn;e!==null;){var u=e.next,n=Hd(e,t);n===0?(e.next=null,a===null?Qn=u:a.next=u,u===null&&(xe=a)):(a=e,(l!==0||(n&3)!==0)&&(Gn=!0)),e=u}ql!==0&&ql!==5||Au(l),Aa!==0&&(Aa=0)}function Hd(l,t){for(var a=l.suspendedLanes,e=l.pingedLanes,u=l.expirationTimes,n=l.pendingLanes&-62914561;0<n;){var c=31-Yl(n),i=1<<c,f=u[c];f===-1?((i&a)===0||(i&e)!==0)&&(u[c]=B0(i,t)):f<=t&&(l.expiredLanes|=i),n&=~i}if(t=yl,a=W,a=Lu(l,l===t?a:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),e=l.callbackNode,a===0||l===t&&(il===2||il===9)||l.cancelPendingCommit!==null)return e!==null&&e!==null&&Xe(e),l.callbackNode=null,l.callbackPriority=0;if((a&3)===0||Le(l,a)){if(t=a&-a,t===l.callbackPriority)return t;switch(e!==null&&Xe(e),ic(a)){case 2:case 8:a=Fa;break;case 32:a=A;break;case 268435456:a=jl;break;default:a=A}return e=jd.bind(null,l),a=Ge(a,e),l.callbackPriority=t,l.callbackNode=a,t}return e!==null&&e!==null&&Xe(e),l.callbackPriority=2,l.callbackNode=null,2}function jd(l,t){if(ql!==0&&ql!==5)return l.callbackNode=null,l.callbackPriority=0,null;var a=l.callbackNode;if(Bn()&&l.callbackNode!==a)return null;var e=W;return e=Lu(l,l===yl?e:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),e===0?null:(rd(l,e,t),Hd(l,Zl()),l.callbackNode!=null&&l.callbackNode===a?jd.bind(null,l):null)}function qd(l,t){if(Bn())return null;rd(l,t,!0)}function mv(){Av(function(){(ul&6)!==0?Ge(ka,dv):Rd()})}function wi(){if(Aa===0){var l=re;l===0&&(l=Gu,Gu<<=1,(Gu&261888)===0&&(Gu=256)),Aa=l}return Aa}function Yd(l){return l==null||typeof l=="symbol"||typeof l=="boolean"?null:typeof l=="function"?l:wu(""+l)}function Bd(l,t){var a=t.ownerDocument.createElement("input");return a.name=t.name,a.value=t.value,l.id&&a.setAttribute("form",l.id),t.parentNode.insertBefore(a,t),l=new FormData(l),a.parentNode.removeChild(a),l}function vv(l,t,a,e,u){if(t==="submit"&&a&&a.stateNode===u){var n=Yd((u[et]||null).action),c=e.submitter;c&&(t=(t=c[et]||null)?Yd(t.formAction):c.getAttribute("formAction"),t!==null&&(n=t,c=null));var i=new Fu("action","action",null,e,u);l.push({event:i,listeners:[{instance:null,listener:function(){if(e.defaultPrevented){if(Aa!==0){var f=c?Bd(u,c):new FormData(u);vi(a,{pending:!0,data:f,method:u.method,action:n},null,f)}}else typeof n=="function"&&(i.preventDefault(),f=c?Bd(u,c):new FormData(u),vi(a,{pending:!0,data:f,method:u.method,action:n},n,f))},currentTarget:u}]})}}for(var Wi=0;Wi<Uc.length;Wi++){var $i=Uc[Wi],yv=$i.toLowerCase(),hv=$i[0].toUpperCase()+$i.slice(1);Ct(yv,"on"+hv)}Ct(ys,"onAnimationEnd"),Ct(hs,"onAnimationIteration"),Ct(rs,"onAnimationStart"),Ct("dblclick","onDoubleClick"),Ct("focusin","onFocus"),Ct("focusout","onBlur"),Ct(xm,"onTransitionRun"),Ct(Cm,"onTransitionStart"),Ct(Rm,"onTransitionCancel"),Ct(gs,"onTransitionEnd"),ae("onMouseEnter",["mouseout","mouseover"]),ae("onMouseLeave",["mouseout","mouseover"]),ae("onPointerEnter",["pointerout","pointerover"]),ae("onPointerLeave",["pointerout","pointerover"]),Ca("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),Ca("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),Ca("onBeforeInput",["compositionend","keypress","textInput","paste"]),Ca("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),Ca("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),Ca("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var _u="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),rv=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(_u));function Qd(l,t){t=(t&4)!==0;for(var a=0;a<l.length;a++){var e=l[a],u=e.event;e=e.listeners;l:{var n=void 0;if(t)for(var c=e.length-1;0<=c;c--){var i=e[c],f=i.instance,v=i.currentTarget;if(i=i.listener,f!==n&&u.isPropagationStopped())break l;n=i,u.currentTarget=v;try{n(u)}catch(S){ln(S)}u.currentTarget=null,n=f}else for(c=0;c<e.length;c++){if(i=e[c],f=i.instance,v=i.currentTarget,i=i.listener,f!==n&&u.isPropagationStopped())break l;n=i,u.currentTarget=v;try{n(u)}catch(S){ln(S)}u.currentTarget=null,n=f}}}}function w(l,t){var a=t[fc];a===void 0&&(a=t[fc]=new Set);var e=l+"__bubble";a.has(e)||(Gd(t,l,2,!1),a.add(e))}function ki(l,t,a){var e=0;t&&(e|=4),Gd(a,l,e,t)}var Xn="_reactListening"+Math.random().toString(36).slice(2);function Fi(l){if(!l[Xn]){l[Xn]=!0,Cf.forEach(function(a){a!=="selectionchange"&&(rv.has(a)||ki(a,!1,l),ki(a,!0,l))});var t=l.nodeType===9?l:l.ownerDocument;t===null||t[Xn]||(t[Xn]=!0,ki("selectionchange",!1,t))}}function Gd(l,t,a,e){switch(h0(t)){case 2:var u=Vv;break;case 8:u=Kv;break;default:u=vf}a=u.bind(null,t,a,l),u=void 0,!gc||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(u=!0),e?u!==void 0?l.addEventListener(t,a,{capture:!0,passive:u}):l.addEventListener(t,a,!0):u!==void 0?l.addEventListener(t,a,{passive:u}):l.addEventListener(t,a,!1)}function Ii(l,t,a,e,u){var n=e;if((t&1)===0&&(t&2)===0&&e!==null)l:for(;;){if(e===null)return;var c=e.tag;if(c===3||c===4){var i=e.stateNode.containerInfo;if(i===u)break;if(c===4)for(c=e.return;c!==null;){var f=c.tag;if((f===3||f===4)&&c.stateNode.containerInfo===u)return;c=c.return}for(;i!==null;){if(c=Pa(i),c===null)return;if(f=c.tag,f===5||f===6||f===26||f===27){e=n=c;continue l}i=i.parentNode}}e=e.return}Vf(function(){var v=n,S=hc(a),E=[];l:{var y=Ss.get(l);if(y!==void 0){var r=Fu,D=l;switch(l){case"keypress":if($u(a)===0)break l;case"keydown":case"keyup":r=sm;break;case"focusin":D="focus",r=zc;break;case"focusout":D="blur",r=zc;break;case"beforeblur":case"afterblur":r=zc;break;case"click":if(a.button===2)break l;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":r=wf;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":r=F0;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":r=mm;break;case ys:case hs:case rs:r=lm;break;case gs:r=ym;break;case"scroll":case"scrollend":r=$0;break;case"wheel":r=rm;break;case"copy":case"cut":case"paste":r=am;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":r=$f;break;case"toggle":case"beforetoggle":r=Sm}var q=(t&4)!==0,vl=!q&&(l==="scroll"||l==="scrollend"),d=q?y!==null?y+"Capture":null:y;q=[];for(var s=v,m;s!==null;){var b=s;if(m=b.stateNode,b=b.tag,b!==5&&b!==26&&b!==27||m===null||d===null||(b=we(s,d),b!=null&&q.push(Ou(s,b,m))),vl)break;s=s.return}0<q.length&&(y=new r(y,D,null,a,S),E.push({event:y,listeners:q}))}}if((t&7)===0){l:{if(y=l==="mouseover"||l==="pointerover",r=l==="mouseout"||l==="pointerout",y&&a!==yc&&(D=a.relatedTarget||a.fromElement)&&(Pa(D)||D[Ia]))break l;if((r||y)&&(y=S.window===S?S:(y=S.ownerDocument)?y.defaultView||y.parentWindow:window,r?(D=a.relatedTarget||a.toElement,r=v,D=D?Pa(D):null,D!==null&&(vl=k(D),q=D.tag,D!==vl||q!==5&&q!==27&&q!==6)&&(D=null)):(r=null,D=v),r!==D)){if(q=wf,b="onMouseLeave",d="onMouseEnter",s="mouse",(l==="pointerout"||l==="pointerover")&&(q=$f,b="onPointerLeave",d="onPointerEnter",s="pointer"),vl=r==null?y:Je(r),m=D==null?y:Je(D),y=new q(b,s+"leave",r,a,S),y.target=vl,y.relatedTarget=m,b=null,Pa(S)===v&&(q=new q(d,s+"enter",D,a,S),q.target=m,q.relatedTarget=vl,b=q),vl=b,r&&D)t:{for(q=gv,d=r,s=D,m=0,b=d;b;b=q(b))m++;b=0;for(var R=s;R;R=q(R))b++;for(;0<m-b;)d=q(d),m--;for(;0<b-m;)s=q(s),b--;for(;m--;){if(d===s||s!==null&&d===s.alternate){q=d;break t}d=q(d),s=q(s)}q=null}else q=null;r!==null&&Xd(E,y,r,q,!1),D!==null&&vl!==null&&Xd(E,vl,D,q,!0)}}l:{if(y=v?Je(v):window,r=y.nodeName&&y.nodeName.toLowerCase(),r==="select"||r==="input"&&y.type==="file")var al=es;else if(ts(y))if(us)al=Dm;else{al=Om;var U=_m}else r=y.nodeName,!r||r.toLowerCase()!=="input"||y.type!=="checkbox"&&y.type!=="radio"?v&&vc(v.elementType)&&(al=es):al=Mm;if(al&&(al=al(l,v))){as(E,al,a,S);break l}U&&U(l,y,v),l==="focusout"&&v&&y.type==="number"&&v.memoizedProps.value!=null&&mc(y,"number",y.value)}switch(U=v?Je(v):window,l){case"focusin":(ts(U)||U.contentEditable==="true")&&(fe=U,Mc=v,tu=null);break;case"focusout":tu=Mc=fe=null;break;case"mousedown":Dc=!0;break;case"contextmenu":case"mouseup":case"dragend":Dc=!1,ms(E,a,S);break;case"selectionchange":if(Um)break;case"keydown":case"keyup":ms(E,a,S)}var Z;if(Tc)l:{switch(l){case"compositionstart":var $="onCompositionStart";break l;case"compositionend":$="onCompositionEnd";break l;case"compositionupdate":$="onCompositionUpdate";break l}$=void 0}else ie?Pf(l,a)&&($="onCompositionEnd"):l==="keydown"&&a.keyCode===229&&($="onCompositionStart");$&&(kf&&a.locale!=="ko"&&(ie||$!=="onCompositionStart"?$==="onCompositionEnd"&&ie&&(Z=Kf()):(fa=S,Sc="value"in fa?fa.value:fa.textContent,ie=!0)),U=Zn(v,$),0<U.length&&($=new Wf($,l,null,a,S),E.push({event:$,listeners:U}),Z?$.data=Z:(Z=ls(a),Z!==null&&($.data=Z)))),(Z=Em?zm(l,a):pm(l,a))&&($=Zn(v,"onBeforeInput"),0<$.length&&(U=new Wf("onBeforeInput","beforeinput",null,a,S),E.push({event:U,listeners:$}),U.data=Z)),vv(E,l,v,a,S)}Qd(E,t)})}function Ou(l,t,a){return{instance:l,listener:t,currentTarget:a}}function Zn(l,t){for(var a=t+"Capture",e=[];l!==null;){var u=l,n=u.stateNode;if(u=u.tag,u!==5&&u!==26&&u!==27||n===null||(u=we(l,a),u!=null&&e.unshift(Ou(l,u,n)),u=we(l,t),u!=null&&e.push(Ou(l,u,n))),l.tag===3)return e;l=l.return}return[]}function gv(l){if(l===null)return null;do l=l.return;while(l&&l.tag!==5&&l.tag!==27);return l||null}function Xd(l,t,a,e,u){for(var n=t._reactName,c=[];a!==null&&a!==e;){var i=a,f=i.alternate,v=i.stateNode;if(i=i.tag,f!==null&&f===e)break;i!==5&&i!==26&&i!==27||v===null||(f=v,u?(v=we(a,n),v!=null&&c.unshift(Ou(a,v,f))):u||(v=we(a,n),v!=null&&c.push(Ou(a,v,f)))),a=a.return}c.length!==0&&l.push({event:t,listeners:c})}var Sv=/\r\n?/g,bv=/\u0000|\uFFFD/g;function Zd(l){return(typeof l=="string"?l:""+l).replace(Sv,`
-`).replace(bv,"")}function Ld(l,t){return t=Zd(t),Zd(l)===t}function ml(l,t,a,e,u,n){switch(a){case"children":typeof e=="string"?t==="body"||t==="textarea"&&e===""||ue(l,e):(typeof e=="number"||typeof e=="bigint")&&t!=="body"&&ue(l,""+e);break;case"className":Ku(l,"class",e);break;case"tabIndex":Ku(l,"tabindex",e);break;case"dir":case"role":case"viewBox":case"width":case"height":Ku(l,a,e);break;case"style":Zf(l,e,n);break;case"data":if(t!=="object"){Ku(l,"data",e);break}case"src":case"href":if(e===""&&(t!=="a"||a!=="href")){l.removeAttribute(a);break}if(e==null||typeof e=="function"||typeof e=="symbol"||typeof e=="boolean"){l.removeAttribute(a);break}e=wu(""+e),l.setAttribute(a,e);break;case"action":case"formAction":if(typeof e=="function"){l.setAttribute(a,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(a==="formAction"?(t!=="input"&&ml(l,t,"name",u.name,u,null),ml(l,t,"formEncType",u.formEncType,u,null),ml(l,t,"formMethod",u.formMethod,u,null),ml(l,t,"formTarget",u.formTarget,u,null)):(ml(l,t,"encType",u.encType,u,null),ml(l,t,"method",u.method,u,null),ml(l,t,"target",u.target,u,null)));if(e==null||typeof e=="symbol"||typeof e=="boolean"){l.removeAttribute(a);break}e=wu(""+e),l.setAttribute(a,e);break;case"onClick":e!=null&&(l.onclick=Vt);break;case"onScroll":e!=null&&w("scroll",l);break;case"onScrollEnd":e!=null&&w("scrollend",l);break;case"dangerouslySetInnerHTML":if(e!=null){if(typeof e!="object"||!("__html"in e))throw Error(h(61));if(a=e.__html,a!=null){if(u.children!=null)throw Error(h(60));l.innerHTML=a}}break;case"multiple":l.multiple=e&&typeof e!="function"&&typeof e!="symbol";break;case"muted":l.muted=e&&typeof e!="function"&&typeof e!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(e==null||typeof e=="function"||typeof e=="boolean"||typeof e=="symbol"){l.removeAttribute("xlink:href");break}a=wu(""+e),l.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",a);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":e!=null&&typeof e!="function"&&typeof e!="symbol"?l.setAttribute(a,""+e):l.removeAttribute(a);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":e&&typeof e!="function"&&typeof e!="symbol"?l.setAttribute(a,""):l.removeAttribute(a);break;case"capture":case"download":e===!0?l.setAttribute(a,""):e!==!1&&e!=null&&typeof e!="function"&&typeof e!="symbol"?l.setAttribute(a,e):l.removeAttribute(a);break;case"cols":case"rows":case"size":case"span":e!=null&&typeof e!="function"&&typeof e!="symbol"&&!isNaN(e)&&1<=e?l.setAttribute(a,e):l.removeAttribute(a);break;case"rowSpan":case"start":e==null||typeof e=="function"||typeof e=="symbol"||isNaN(e)?l.removeAttribute(a):l.setAttribute(a,e);break;case"popover":w("beforetoggle",l),w("toggle",l),Vu(l,"popover",e);break;case"xlinkActuate":Lt(l,"http://www.w3.org/1999/xlink","xlink:actuate",e);break;case"xlinkArcrole":Lt(l,"http://www.w3.org/1999/xlink","xlink:arcrole",e);break;case"xlinkRole":Lt(l,"http://www.w3.org/1999/xlink","xlink:role",e);break;case"xlinkShow":Lt(l,"http://www.w3.org/1999/xlink","xlink:show",e);break;case"xlinkTitle":Lt(l,"http://www.w3.org/1999/xlink","xlink:title",e);break;case"xlinkType":Lt(l,"http://www.w3.org/1999/xlink","xlink:type",e);break;case"xmlBase":Lt(l,"http://www.w3.org/XML/1998/namespace","xml:base",e);break;case"xmlLang":Lt(l,"http://www.w3.org/XML/1998/namespace","xml:lang",e);break;case"xmlSpace":Lt(l,"http://www.w3.org/XML/1998/namespace","xml:space",e);break;case"is":Vu(l,"is",e);break;case"innerText":case"textContent":break;default:(!(2<a.length)||a[0]!=="o"&&a[0]!=="O"||a[1]!=="n"&&a[1]!=="N")&&(a=w0.get(a)||a,Vu(l,a,e))}}function Pi(l,t,a,e,u,n){switch(a){case"style":Zf(l,e,n);break;case"dangerouslySetInnerHTML":if(e!=null){if(typeof e!="object"||!("__html"in e))throw Error(h(61));if(a=e.__html,a!=null){if(u.children!=null)throw Error(h(60));l.innerHTML=a}}break;case"children":typeof e=="string"?ue(l,e):(typeof e=="number"||typeof e=="bigint")&&ue(l,""+e);break;case"onScroll":e!=null&&w("scroll",l);break;case"onScrollEnd":e!=null&&w("scrollend",l);break;case"onClick":e!=null&&(l.onclick=Vt);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!Rf.hasOwnProperty(a))l:{if(a[0]==="o"&&a[1]==="n"&&(u=a.endsWith("Capture"),t=a.slice(2,u?a.length-7:void 0),n=l[et]||null,n=n!=null?n[a]:null,typeof n=="function"&&l.removeEventListener(t,n,u),typeof e=="function")){typeof n!="function"&&n!==null&&(a in l?l[a]=null:l.hasAttribute(a)&&l.removeAttribute(a)),l.addEventListener(t,e,u);break l}a in l?l[a]=e:e===!0?l.setAttribute(a,""):Vu(l,a,e)}}}function wl(l,t,a){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":w("error",l),w("load",l);var e=!1,u=!1,n;for(n in a)if(a.hasOwnProperty(n)){var c=a[n];if(c!=null)switch(n){case"src":e=!0;break;case"srcSet":u=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(h(137,t));default:ml(l,t,n,c,a,null)}}u&&ml(l,t,"srcSet",a.srcSet,a,null),e&&ml(l,t,"src",a.src,a,null);return;case"input":w("invalid",l);var i=n=c=u=null,f=null,v=null;for(e in a)if(a.hasOwnProperty(e)){var S=a[e];if(S!=null)switch(e){case"name":u=S;break;case"type":c=S;break;case"checked":f=S;break;case"defaultChecked":v=S;break;case"value":n=S;break;case"defaultValue":i=S;break;case"children":case"dangerouslySetInnerHTML":if(S!=null)throw Error(h(137,t));break;default:ml(l,t,e,S,a,null)}}Bf(l,n,i,f,v,c,u,!1);return;case"select":w("invalid",l),e=c=n=null;for(u in a)if(a.hasOwnProperty(u)&&(i=a[u],i!=null))switch(u){case"value":n=i;break;case"defaultValue":c=i;break;case"multiple":e=i;default:ml(l,t,u,i,a,null)}t=n,a=c,l.multiple=!!e,t!=null?ee(l,!!e,t,!1):a!=null&&ee(l,!!e,a,!0);return;case"textarea":w("invalid",l),n=u=e=null;for(c in a)if(a.hasOwnProperty(c)&&(i=a[c],i!=null))switch(c){case"value":e=i;break;case"defaultValue":u=i;break;case"children":n=i;break;case"dangerouslySetInnerHTML":if(i!=null)throw Error(h(91));break;default:ml(l,t,c,i,a,null)}Gf(l,e,u,n);return;case"option":for(f in a)if(a.hasOwnProperty(f)&&(e=a[f],e!=null))switch(f){case"selected":l.selected=e&&typeof e!="function"&&typeof e!="symbol";break;default:ml(l,t,f,e,a,null)}return;case"dialog":w("beforetoggle",l),w("toggle",l),w("cancel",l),w("close",l);break;case"iframe":case"object":w("load",l);break;case"video":case"audio":for(e=0;e<_u.length;e++)w(_u[e],l);break;case"image":w("error",l),w("load",l);break;case"details":w("toggle",l);break;case"embed":case"source":case"link":w("error",l),w("load",l);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(v in a)if(a.hasOwnProperty(v)&&(e=a[v],e!=null))switch(v){case"children":case"dangerouslySetInnerHTML":throw Error(h(137,t));default:ml(l,t,v,e,a,null)}return;default:if(vc(t)){for(S in a)a.hasOwnProperty(S)&&(e=a[S],e!==void 0&&Pi(l,t,S,e,a,void 0));return}}for(i in a)a.hasOwnProperty(i)&&(e=a[i],e!=null&&ml(l,t,i,e,a,null))}function Ev(l,t,a,e){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var u=null,n=null,c=null,i=null,f=null,v=null,S=null;for(r in a){var E=a[r];if(a.hasOwnProperty(r)&&E!=null)switch(r){case"checked":break;case"value":break;case"defaultValue":f=E;default:e.hasOwnProperty(r)||ml(l,t,r,null,e,E)}}for(var y in e){var r=e[y];if(E=a[y],e.hasOwnProperty(y)&&(r!=null||E!=null))switch(y){case"type":n=r;break;case"name":u=r;break;case"checked":v=r;break;case"defaultChecked":S=r;break;case"value":c=r;break;case"defaultValue":i=r;break;case"children":case"dangerouslySetInnerHTML":if(r!=null)throw Error(h(137,t));break;default:r!==E&&ml(l,t,y,r,e,E)}}dc(l,c,i,f,v,S,n,u);return;case"select":r=c=i=y=null;for(n in a)if(f=a[n],a.hasOwnProperty(n)&&f!=null)switch(n){case"value":break;case"multiple":r=f;default:e.hasOwnProperty(n)||ml(l,t,n,null,e,f)}for(u in e)if(n=e[u],f=a[u],e.hasOwnProperty(u)&&(n!=null||f!=null))switch(u){case"value":y=n;break;case"defaultValue":i=n;break;case"multiple":c=n;default:n!==f&&ml(l,t,u,n,e,f)}t=i,a=c,e=r,y!=null?ee(l,!!a,y,!1):!!e!=!!a&&(t!=null?ee(l,!!a,t,!0):ee(l,!!a,a?[]:"",!1));return;case"textarea":r=y=null;for(i in a)if(u=a[i],a.hasOwnProperty(i)&&u!=null&&!e.hasOwnProperty(i))switch(i){case"value":break;case"children":break;default:ml(l,t,i,null,e,u)}for(c in e)if(u=e[c],n=a[c],e.hasOwnProperty(c)&&(u!=null||n!=null))switch(c){case"value":y=u;break;case"defaultValue":r=u;break;case"children":break;case"dangerouslySetInnerHTML":if(u!=null)throw Error(h(91));break;default:u!==n&&ml(l,t,c,u,e,n)}Qf(l,y,r);return;case"option":for(var D in a)if(y=a[D],a.hasOwnProperty(D)&&y!=null&&!e.hasOwnProperty(D))switch(D){case"selected":l.selected=!1;break;default:ml(l,t,D,null,e,y)}for(f in e)if(y=e[f],r=a[f],e.hasOwnProperty(f)&&y!==r&&(y!=null||r!=null))switch(f){case"selected":l.selected=y&&typeof y!="function"&&typeof y!="symbol";break;default:ml(l,t,f,y,e,r)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var q in a)y=a[q],a.hasOwnProperty(q)&&y!=null&&!e.hasOwnProperty(q)&&ml(l,t,q,null,e,y);for(v in e)if(y=e[v],r=a[v],e.hasOwnProperty(v)&&y!==r&&(y!=null||r!=null))switch(v){case"children":case"dangerouslySetInnerHTML":if(y!=null)throw Error(h(137,t));break;default:ml(l,t,v,y,e,r)}return;default:if(vc(t)){for(var vl in a)y=a[vl],a.hasOwnProperty(vl)&&y!==void 0&&!e.hasOwnProperty(vl)&&Pi(l,t,vl,void 0,e,y);for(S in e)y=e[S],r=a[S],!e.hasOwnProperty(S)||y===r||y===void 0&&r===void 0||Pi(l,t,S,y,e,r);return}}for(var d in a)y=a[d],a.hasOwnProperty(d)&&y!=null&&!e.hasOwnProperty(d)&&ml(l,t,d,null,e,y);for(E in e)y=e[E],r=a[E],!e.hasOwnProperty(E)||y===r||y==null&&r==null||ml(l,t,E,y,e,r)}function Vd(l){switch(l){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function zv(){if(typeof performance.getEntriesByType=="function"){for(var l=0,t=0,a=performance.getEntriesByType("resource"),e=0;e<a.length;e++){var u=a[e],n=u.transferSize,c=u.initiatorType,i=u.duration;if(n&&i&&Vd(c)){for(c=0,i=u.responseEnd,e+=1;e<a.length;e++){var f=a[e],v=f.startTime;if(v>i)break;var S=f.transferSize,E=f.initiatorType;S&&Vd(E)&&(f=f.responseEnd,c+=S*(f<i?1:(i-v)/(f-v)))}if(--e,t+=8*(n+c)/(u.duration/1e3),l++,10<l)break}}if(0<l)return t/l/1e6}return navigator.connection&&(l=navigator.connection.downlink,typeof l=="number")?l:5}var lf=null,tf=null;function Ln(l){return l.nodeType===9?l:l.ownerDocument}function Kd(l){switch(l){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function Jd(l,t){if(l===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return l===1&&t==="foreignObject"?0:l}function af(l,t){return l==="textarea"||l==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var ef=null;function pv(){var l=window.event;return l&&l.type==="popstate"?l===ef?!1:(ef=l,!0):(ef=null,!1)}var wd=typeof setTimeout=="function"?setTimeout:void 0,Tv=typeof clearTimeout=="function"?clearTimeout:void 0,Wd=typeof Promise=="function"?Promise:void 0,Av=typeof queueMicrotask=="function"?queueMicrotask:typeof Wd<"u"?function(l){return Wd.resolve(null).then(l).catch(_v)}:wd;function _v(l){setTimeout(function(){throw l})}function _a(l){return l==="head"}function $d(l,t){var a=t,e=0;do{var u=a.nextSibling;if(l.removeChild(a),u&&u.nodeType===8)if(a=u.data,a==="/$"||a==="/&"){if(e===0){l.removeChild(u),je(t);return}e--}else if(a==="$"||a==="$?"||a==="$~"||a==="$!"||a==="&")e++;else if(a==="html")Mu(l.ownerDocument.documentElement);else if(a==="head"){a=l.ownerDocument.head,Mu(a);for(var n=a.firstChild;n;){var c=n.nextSibling,i=n.nodeName;n[Ke]||i==="SCRIPT"||i==="STYLE"||i==="LINK"&&n.rel.toLowerCase()==="stylesheet"||a.removeChild(n),n=c}}else a==="body"&&Mu(l.ownerDocument.body);a=u}while(a);je(t)}function kd(l,t){var a=l;l=0;do{var e=a.nextSibling;if(a.nodeType===1?t?(a._stashedDisplay=a.style.display,a.style.display="none"):(a.style.display=a._stashedDisplay||"",a.getAttribute("style")===""&&a.removeAttribute("style")):a.nodeType===3&&(t?(a._stashedText=a.nodeValue,a.nodeValue=""):a.nodeValue=a._stashedText||""),e&&e.nodeType===8)if(a=e.data,a==="/$"){if(l===0)break;l--}else a!=="$"&&a!=="$?"&&a!=="$~"&&a!=="$!"||l++;a=e}while(a)}function uf(l){var t=l.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var a=t;switch(t=t.nextSibling,a.nodeName){case"HTML":case"HEAD":case"BODY":uf(a),sc(a);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(a.rel.toLowerCase()==="stylesheet")continue}l.removeChild(a)}}function Ov(l,t,a,e){for(;l.nodeType===1;){var u=a;if(l.nodeName.toLowerCase()!==t.toLowerCase()){if(!e&&(l.nodeName!=="INPUT"||l.type!=="hidden"))break}else if(e){if(!l[Ke])switch(t){case"meta":if(!l.hasAttribute("itemprop"))break;return l;case"link":if(n=l.getAttribute("rel"),n==="stylesheet"&&l.hasAttribute("data-precedence"))break;if(n!==u.rel||l.getAttribute("href")!==(u.href==null||u.href===""?null:u.href)||l.getAttribute("crossorigin")!==(u.crossOrigin==null?null:u.crossOrigin)||l.getAttribute("title")!==(u.title==null?null:u.title))break;return l;case"style":if(l.hasAttribute("data-precedence"))break;return l;case"script":if(n=l.getAttribute("src"),(n!==(u.src==null?null:u.src)||l.getAttribute("type")!==(u.type==null?null:u.type)||l.getAttribute("crossorigin")!==(u.crossOrigin==null?null:u.crossOrigin))&&n&&l.hasAttribute("async")&&!l.hasAttribute("itemprop"))break;return l;default:return l}}else if(t==="input"&&l.type==="hidden"){var n=u.name==null?null:""+u.name;if(u.type==="hidden"&&l.getAttribute("name")===n)return l}else return l;if(l=Nt(l.nextSibling),l===null)break}return null}function Mv(l,t,a){if(t==="")return null;for(;l.nodeType!==3;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!a||(l=Nt(l.nextSibling),l===null))return null;return l}function Fd(l,t){for(;l.nodeType!==8;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!t||(l=Nt(l.nextSibling),l===null))return null;return l}function nf(l){return l.data==="$?"||l.data==="$~"}function cf(l){return l.data==="$!"||l.data==="$?"&&l.ownerDocument.readyState!=="loading"}function Dv(l,t){var a=l.ownerDocument;if(l.data==="$~")l._reactRetry=t;else if(l.data!=="$?"||a.readyState!=="loading")t();else{var e=function(){t(),a.removeEventListener("DOMContentLoaded",e)};a.addEventListener("DOMContentLoaded",e),l._reactRetry=e}}function Nt(l){for(;l!=null;l=l.nextSibling){var t=l.nodeType;if(t===1||t===3)break;if(t===8){if(t=l.data,t==="$"||t==="$!"||t==="$?"||t==="$~"||t==="&"||t==="F!"||t==="F")break;if(t==="/$"||t==="/&")return null}}return l}var ff=null;function Id(l){l=l.nextSibling;for(var t=0;l;){if(l.nodeType===8){var a=l.data;if(a==="/$"||a==="/&"){if(t===0)return Nt(l.nextSibling);t--}else a!=="$"&&a!=="$!"&&a!=="$?"&&a!=="$~"&&a!=="&"||t++}l=l.nextSibling}return null}function Pd(l){l=l.previousSibling;for(var t=0;l;){if(l.nodeType===8){var a=l.data;if(a==="$"||a==="$!"||a==="$?"||a==="$~"||a==="&"){if(t===0)return l;t--}else a!=="/$"&&a!=="/&"||t++}l=l.previousSibling}return null}function l0(l,t,a){switch(t=Ln(a),l){case"html":if(l=t.documentElement,!l)throw Error(h(452));return l;case"head":if(l=t.head,!l)throw Error(h(453));return l;case"body":if(l=t.body,!l)throw Error(h(454));return l;default:throw Error(h(451))}}function Mu(l){for(var t=l.attributes;t.length;)l.removeAttributeNode(t[0]);sc(l)}var Ut=new Map,t0=new Set;function Vn(l){return typeof l.getRootNode=="function"?l.getRootNode():l.nodeType===9?l:l.ownerDocument}var ca=O.d;O.d={f:Nv,r:Uv,D:xv,C:Cv,L:Rv,m:Hv,X:qv,S:jv,M:Yv};function Nv(){var l=ca.f(),t=jn();return l||t}function Uv(l){var t=le(l);t!==null&&t.tag===5&&t.type==="form"?So(t):ca.r(l)}var Ce=typeof document>"u"?null:document;function a0(l,t,a){var e=Ce;if(e&&typeof t=="string"&&t){var u=pt(t);u='link[rel="'+l+'"][href="'+u+'"]',typeof a=="string"&&(u+='[crossorigin="'+a+'"]'),t0.has(u)||(t0.add(u),l={rel:l,crossOrigin:a,href:t},e.querySelector(u)===null&&(t=e.createElement("link"),wl(t,"link",l),Bl(t),e.head.appendChild(t)))}}function xv(l){ca.D(l),a0("dns-prefetch",l,null)}function Cv(l,t){ca.C(l,t),a0("preconnect",l,t)}function Rv(l,t,a){ca.L(l,t,a);var e=Ce;if(e&&l&&t){var u='link[rel="preload"][as="'+pt(t)+'"]';t==="image"&&a&&a.imageSrcSet?(u+='[imagesrcset="'+pt(a.imageSrcSet)+'"]',typeof a.imageSizes=="string"&&(u+='[imagesizes="'+pt(a.imageSizes)+'"]')):u+='[href="'+pt(l)+'"]';var n=u;switch(t){case"style":n=Re(l);break;case"script":n=He(l)}Ut.has(n)||(l=C({rel:"preload",href:t==="image"&&a&&a.imageSrcSet?void 0:l,as:t},a),Ut.set(n,l),e.querySelector(u)!==null||t==="style"&&e.querySelector(Du(n))||t==="script"&&e.querySelector(Nu(n))||(t=e.createElement("link"),wl(t,"link",l),Bl(t),e.head.appendChild(t)))}}function Hv(l,t){ca.m(l,t);var a=Ce;if(a&&l){var e=t&&typeof t.as=="string"?t.as:"script",u='link[rel="modulepreload"][as="'+pt(e)+'"][href="'+pt(l)+'"]',n=u;switch(e){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=He(l)}if(!Ut.has(n)&&(l=C({rel:"modulepreload",href:l},t),Ut.set(n,l),a.querySelector(u)===null)){switch(e){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(a.querySelector(Nu(n)))return}e=a.createElement("link"),wl(e,"link",l),Bl(e),a.head.appendChild(e)}}}function jv(l,t,a){ca.S(l,t,a);var e=Ce;if(e&&l){var u=te(e).hoistableStyles,n=Re(l);t=t||"default";var c=u.get(n);if(!c){var i={loading:0,preload:null};if(c=e.querySelector(Du(n)))i.loading=5;else{l=C({rel:"stylesheet",href:l,"data-precedence":t},a),(a=Ut.get(n))&&sf(l,a);var f=c=e.createElement("link");Bl(f),wl(f,"link",l),f._p=new Promise(function(v,S){f.onload=v,f.onerror=S}),f.addEventListener("load",function(){i.loading|=1}),f.addEventListener("error",function(){i.loading|=2}),i.loading|=4,Kn(c,t,e)}c={type:"stylesheet",instance:c,count:1,state:i},u.set(n,c)}}}function qv(l,t){ca.X(l,t);var a=Ce;if(a&&l){var e=te(a).hoistableScripts,u=He(l),n=e.get(u);n||(n=a.querySelector(Nu(u)),n||(l=C({src:l,async:!0},t),(t=Ut.get(u))&&of(l,t),n=a.createElement("script"),Bl(n),wl(n,"link",l),a.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},e.set(u,n))}}function Yv(l,t){ca.M(l,t);var a=Ce;if(a&&l){var e=te(a).hoistableScripts,u=He(l),n=e.get(u);n||(n=a.querySelector(Nu(u)),n||(l=C({src:l,async:!0,type:"module"},t),(t=Ut.get(u))&&of(l,t),n=a.createElement("script"),Bl(n),wl(n,"link",l),a.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},e.set(u,n))}}function e0(l,t,a,e){var u=(u=L.current)?Vn(u):null;if(!u)throw Error(h(446));switch(l){case"meta":case"title":return null;case"style":return typeof a.precedence=="string"&&typeof a.href=="string"?(t=Re(a.href),a=te(u).hoistableStyles,e=a.get(t),e||(e={type:"style",instance:null,count:0,state:null},a.set(t,e)),e):{type:"void",instance:null,count:0,state:null};case"link":if(a.rel==="stylesheet"&&typeof a.href=="string"&&typeof a.precedence=="string"){l=Re(a.href);var n=te(u).hoistableStyles,c=n.get(l);if(c||(u=u.ownerDocument||u,c={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(l,c),(n=u.querySelector(Du(l)))&&!n._p&&(c.instance=n,c.state.loading=5),Ut.has(l)||(a={rel:"preload",as:"style",href:a.href,crossOrigin:a.crossOrigin,integrity:a.integrity,media:a.media,hrefLang:a.hrefLang,referrerPolicy:a.referrerPolicy},Ut.set(l,a),n||Bv(u,l,a,c.state))),t&&e===null)throw Error(h(528,""));return c}if(t&&e!==null)throw Error(h(529,""));return null;case"script":return t=a.async,a=a.src,typeof a=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=He(a),a=te(u).hoistableScripts,e=a.get(t),e||(e={type:"script",instance:null,count:0,state:null},a.set(t,e)),e):{type:"void",instance:null,count:0,state:null};default:throw Error(h(444,l))}}function Re(l){return'href="'+pt(l)+'"'}function Du(l){return'link[rel="stylesheet"]['+l+"]"}function u0(l){return C({},l,{"data-precedence":l.precedence,precedence:null})}function Bv(l,t,a,e){l.querySelector('link[rel="preload"][as="style"]['+t+"]")?e.loading=1:(t=l.createElement("link"),e.preload=t,t.addEventListener("load",function(){return e.loading|=1}),t.addEventListener("error",function(){return e.loading|=2}),wl(t,"link",a),Bl(t),l.head.appendChild(t))}function He(l){return'[src="'+pt(l)+'"]'}function Nu(l){return"script[async]"+l}function n0(l,t,a){if(t.count++,t.instance===null)switch(t.type){case"style":var e=l.querySelector('style[data-href~="'+pt(a.href)+'"]');if(e)return t.instance=e,Bl(e),e;var u=C({},a,{"data-href":a.href,"data-precedence":a.precedence,href:null,precedence:null});return e=(l.ownerDocument||l).createElement("style"),Bl(e),wl(e,"style",u),Kn(e,a.precedence,l),t.instance=e;case"stylesheet":u=Re(a.href);var n=l.querySelector(Du(u));if(n)return t.state.loading|=4,t.instance=n,Bl(n),n;e=u0(a),(u=Ut.get(u))&&sf(e,u),n=(l.ownerDocument||l).createElement("link"),Bl(n);var c=n;return c._p=new Promise(function(i,f){c.onload=i,c.onerror=f}),wl(n,"link",e),t.state.loading|=4,Kn(n,a.precedence,l),t.instance=n;case"script":return n=He(a.src),(u=l.querySelector(Nu(n)))?(t.instance=u,Bl(u),u):(e=a,(u=Ut.get(n))&&(e=C({},a),of(e,u)),l=l.ownerDocument||l,u=l.createElement("script"),Bl(u),wl(u,"link",e),l.head.appendChild(u),t.instance=u);case"void":return null;default:throw Error(h(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(e=t.instance,t.state.loading|=4,Kn(e,a.precedence,l));return t.instance}function Kn(l,t,a){for(var e=a.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),u=e.length?e[e.length-1]:null,n=u,c=0;c<e.length;c++){var i=e[c];if(i.dataset.precedence===t)n=i;else if(n!==u)break}n?n.parentNode.insertBefore(l,n.nextSibling):(t=a.nodeType===9?a.head:a,t.insertBefore(l,t.firstChild))}function sf(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.title==null&&(l.title=t.title)}function of(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.integrity==null&&(l.integrity=t.integrity)}var Jn=null;function c0(l,t,a){if(Jn===null){var e=new Map,u=Jn=new Map;u.set(a,e)}else u=Jn,e=u.get(a),e||(e=new Map,u.set(a,e));if(e.has(l))return e;for(e.set(l,null),a=a.getElementsByTagName(l),u=0;u<a.length;u++){var n=a[u];if(!(n[Ke]||n[Ll]||l==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var c=n.getAttribute(t)||"";c=l+c;var i=e.get(c);i?i.push(n):e.set(c,[n])}}return e}function i0(l,t,a){l=l.ownerDocument||l,l.head.insertBefore(a,t==="title"?l.querySelector("head > title"):null)}function Qv(l,t,a){if(a===1||t.itemProp!=null)return!1;switch(l){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;switch(t.rel){case"stylesheet":return l=t.disabled,typeof t.precedence=="string"&&l==null;default:return!0}case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function f0(l){return!(l.type==="stylesheet"&&(l.state.loading&3)===0)}function Gv(l,t,a,e){if(a.type==="stylesheet"&&(typeof e.media!="string"||matchMedia(e.media).matches!==!1)&&(a.state.loading&4)===0){if(a.instance===null){var u=Re(e.href),n=t.querySelector(Du(u));if(n){t=n._p,t!==null&&typeof t=="object"&&typeof t.then=="function"&&(l.count++,l=wn.bind(l),t.then(l,l)),a.state.loading|=4,a.instance=n,Bl(n);return}n=t.ownerDocument||t,e=u0(e),(u=Ut.get(u))&&sf(e,u),n=n.createElement("link"),Bl(n);var c=n;c._p=new Promise(function(i,f){c.onload=i,c.onerror=f}),wl(n,"link",e),a.instance=n}l.stylesheets===null&&(l.stylesheets=new Map),l.stylesheets.set(a,t),(t=a.state.preload)&&(a.state.loading&3)===0&&(l.count++,a=wn.bind(l),t.addEventListener("load",a),t.addEventListener("error",a))}}var df=0;function Xv(l,t){return l.stylesheets&&l.count===0&&$n(l,l.stylesheets),0<l.count||0<l.imgCount?function(a){var e=setTimeout(function(){if(l.stylesheets&&$n(l,l.stylesheets),l.unsuspend){var n=l.unsuspend;l.unsuspend=null,n()}},6e4+t);0<l.imgBytes&&df===0&&(df=62500*zv());var u=setTimeout(function(){if(l.waitingForImages=!1,l.count===0&&(l.stylesheets&&$n(l,l.stylesheets),l.unsuspend)){var n=l.unsuspend;l.unsuspend=null,n()}},(l.imgBytes>df?50:800)+t);return l.unsuspend=a,function(){l.unsuspend=null,clearTimeout(e),clearTimeout(u)}}:null}function wn(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)$n(this,this.stylesheets);else if(this.unsuspend){var l=this.unsuspend;this.unsuspend=null,l()}}}var Wn=null;function $n(l,t){l.stylesheets=null,l.unsuspend!==null&&(l.count++,Wn=new Map,t.forEach(Zv,l),Wn=null,wn.call(l))}function Zv(l,t){if(!(t.state.loading&4)){var a=Wn.get(l);if(a)var e=a.get(null);else{a=new Map,Wn.set(l,a);for(var u=l.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<u.length;n++){var c=u[n];(c.nodeName==="LINK"||c.getAttribute("media")!=="not all")&&(a.set(c.dataset.precedence,c),e=c)}e&&a.set(null,e)}u=t.instance,c=u.getAttribute("data-precedence"),n=a.get(c)||e,n===e&&a.set(null,u),a.set(c,u),this.count++,e=wn.bind(this),u.addEventListener("load",e),u.addEventListener("error",e),n?n.parentNode.insertBefore(u,n.nextSibling):(l=l.nodeType===9?l.head:l,l.insertBefore(u,l.firstChild)),t.state.loading|=4}}var Uu={$$typeof:Hl,Provider:null,Consumer:null,_currentValue:H,_currentValue2:H,_threadCount:0};function Lv(l,t,a,e,u,n,c,i,f){this.tag=1,this.containerInfo=l,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=nc(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=nc(0),this.hiddenUpdates=nc(null),this.identifierPrefix=e,this.onUncaughtError=u,this.onCaughtError=n,this.onRecoverableError=c,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=f,this.incompleteTransitions=new Map}function s0(l,t,a,e,u,n,c,i,f,v,S,E){return l=new Lv(l,t,a,c,f,v,S,E,i),t=1,n===!0&&(t|=24),n=mt(3,null,null,t),l.current=n,n.stateNode=l,t=Lc(),t.refCount++,l.pooledCache=t,t.refCount++,n.memoizedState={element:e,isDehydrated:a,cache:t},wc(n),l}function o0(l){return l?(l=de,l):de}function d0(l,t,a,e,u,n){u=o0(u),e.context===null?e.context=u:e.pendingContext=u,e=ya(t),e.payload={element:a},n=n===void 0?null:n,n!==null&&(e.callback=n),a=ha(l,e,t),a!==null&&(st(a,l,t),fu(a,l,t))}function m0(l,t){if(l=l.memoizedState,l!==null&&l.dehydrated!==null){var a=l.retryLane;l.retryLane=a!==0&&a<t?a:t}}function mf(l,t){m0(l,t),(l=l.alternate)&&m0(l,t)}function v0(l){if(l.tag===13||l.tag===31){var t=qa(l,67108864);t!==null&&st(t,l,67108864),mf(l,67108864)}}function y0(l){if(l.tag===13||l.tag===31){var t=gt();t=cc(t);var a=qa(l,t);a!==null&&st(a,l,t),mf(l,t)}}var kn=!0;function Vv(l,t,a,e){var u=g.T;g.T=null;var n=O.p;try{O.p=2,vf(l,t,a,e)}finally{O.p=n,g.T=u}}function Kv(l,t,a,e){var u=g.T;g.T=null;var n=O.p;try{O.p=8,vf(l,t,a,e)}finally{O.p=n,g.T=u}}function vf(l,t,a,e){if(kn){var u=yf(e);if(u===null)Ii(l,t,e,Fn,a),r0(l,e);else if(wv(u,l,t,a,e))e.stopPropagation();else if(r0(l,e),t&4&&-1<Jv.indexOf(l)){for(;u!==null;){var n=le(u);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var c=xa(n.pendingLanes);if(c!==0){var i=n;for(i.pendingLanes|=2,i.entangledLanes|=2;c;){var f=1<<31-Yl(c);i.entanglements[1]|=f,c&=~f}Qt(n),(ul&6)===0&&(Rn=Zl()+500,Au(0))}}break;case 31:case 13:i=qa(n,2),i!==null&&st(i,n,2),jn(),mf(n,2)}if(n=yf(e),n===null&&Ii(l,t,e,Fn,a),n===u)break;u=n}u!==null&&e.stopPropagation()}else Ii(l,t,e,null,a)}}function yf(l){return l=hc(l),hf(l)}var Fn=null;function hf(l){if(Fn=null,l=Pa(l),l!==null){var t=k(l);if(t===null)l=null;else{var a=t.tag;if(a===13){if(l=zl(t),l!==null)return l;l=null}else if(a===31){if(l=hl(t),l!==null)return l;l=null}else if(a===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;l=null}else t!==l&&(l=null)}}return Fn=l,null}function h0(l){switch(l){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Ze()){case ka:return 2;case Fa:return 8;case A:case j:return 32;case jl:return 268435456;default:return 32}default:return 32}}var rf=!1,Oa=null,Ma=null,Da=null,xu=new Map,Cu=new Map,Na=[],Jv="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function r0(l,t){switch(l){case"focusin":case"focusout":Oa=null;break;case"dragenter":case"dragleave":Ma=null;break;case"mouseover":case"mouseout":Da=null;break;case"pointerover":case"pointerout":xu.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Cu.delete(t.pointerId)}}function Ru(l,t,a,e,u,n){return l===null||l.nativeEvent!==n?(l={blockedOn:t,domEventName:a,eventSystemFlags:e,nativeEvent:n,targetContainers:[u]},t!==null&&(t=le(t),t!==null&&v0(t)),l):(l.eventSystemFlags|=e,t=l.targetContainers,u!==null&&t.indexOf(u)===-1&&t.push(u),l)}function wv(l,t,a,e,u){switch(t){case"focusin":return Oa=Ru(Oa,l,t,a,e,u),!0;case"dragenter":return Ma=Ru(Ma,l,t,a,e,u),!0;case"mouseover":return Da=Ru(Da,l,t,a,e,u),!0;case"pointerover":var n=u.pointerId;return xu.set(n,Ru(xu.get(n)||null,l,t,a,e,u)),!0;case"gotpointercapture":return n=u.pointerId,Cu.set(n,Ru(Cu.get(n)||null,l,t,a,e,u)),!0}return!1}function g0(l){var t=Pa(l.target);if(t!==null){var a=k(t);if(a!==null){if(t=a.tag,t===13){if(t=zl(a),t!==null){l.blockedOn=t,Uf(l.priority,function(){y0(a)});return}}else if(t===31){if(t=hl(a),t!==null){l.blockedOn=t,Uf(l.priority,function(){y0(a)});return}}else if(t===3&&a.stateNode.current.memoizedState.isDehydrated){l.blockedOn=a.tag===3?a.stateNode.containerInfo:null;return}}}l.blockedOn=null}function In(l){if(l.blockedOn!==null)return!1;for(var t=l.targetContainers;0<t.length;){var a=yf(l.nativeEvent);if(a===null){a=l.nativeEvent;var e=new a.constructor(a.type,a);yc=e,a.target.dispatchEvent(e),yc=null}else return t=le(a),t!==null&&v0(t),l.blockedOn=a,!1;t.shift()}return!0}function S0(l,t,a){In(l)&&a.delete(t)}function Wv(){rf=!1,Oa!==null&&In(Oa)&&(Oa=null),Ma!==null&&In(Ma)&&(Ma=null),Da!==null&&In(Da)&&(Da=null),xu.forEach(S0),Cu.forEach(S0)}function Pn(l,t){l.blockedOn===t&&(l.blockedOn=null,rf||(rf=!0,M.unstable_scheduleCallback(M.unstable_NormalPriority,Wv)))}var lc=null;function b0(l){lc!==l&&(lc=l,M.unstable_scheduleCallback(M.unstable_NormalPriority,function(){lc===l&&(lc=null);for(var t=0;t<l.length;t+=3){var a=l[t],e=l[t+1],u=l[t+2];if(typeof e!="function"){if(hf(e||a)===null)continue;break}var n=le(a);n!==null&&(l.splice(t,3),t-=3,vi(n,{pending:!0,data:u,method:a.method,action:e},e,u))}}))}function je(l){function t(f){return Pn(f,l)}Oa!==null&&Pn(Oa,l),Ma!==null&&Pn(Ma,l),Da!==null&&Pn(Da,l),xu.forEach(t),Cu.forEach(t);for(var a=0;a<Na.length;a++){var e=Na[a];e.blockedOn===l&&(e.blockedOn=null)}for(;0<Na.length&&(a=Na[0],a.blockedOn===null);)g0(a),a.blockedOn===null&&Na.shift();if(a=(l.ownerDocument||l).$$reactFormReplay,a!=null)for(e=0;e<a.length;e+=3){var u=a[e],n=a[e+1],c=u[et]||null;if(typeof n=="function")c||b0(a);else if(c){var i=null;if(n&&n.hasAttribute("formAction")){if(u=n,c=n[et]||null)i=c.formAction;else if(hf(u)!==null)continue}else i=c.action;typeof i=="function"?a[e+1]=i:(a.splice(e,3),e-=3),b0(a)}}}function E0(){function l(n){n.canIntercept&&n.info==="react-transition"&&n.intercept({handler:function(){return new Promise(function(c){return u=c})},focusReset:"manual",scroll:"manual"})}function t(){u!==null&&(u(),u=null),e||setTimeout(a,20)}function a(){if(!e&&!navigation.transition){var n=navigation.currentEntry;n&&n.url!=null&&navigation.navigate(n.url,{state:n.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var e=!1,u=null;return navigation.addEventListener("navigate",l),navigation.addEventListener("navigatesuccess",t),navigation.addEventListener("navigateerror",t),setTimeout(a,100),function(){e=!0,navigation.removeEventListener("navigate",l),navigation.removeEventListener("navigatesuccess",t),navigation.removeEventListener("navigateerror",t),u!==null&&(u(),u=null)}}}function gf(l){this._internalRoot=l}tc.prototype.render=gf.prototype.render=function(l){var t=this._internalRoot;if(t===null)throw Error(h(409));var a=t.current,e=gt();d0(a,e,l,t,null,null)},tc.prototype.unmount=gf.prototype.unmount=function(){var l=this._internalRoot;if(l!==null){this._internalRoot=null;var t=l.containerInfo;d0(l.current,2,null,l,null,null),jn(),t[Ia]=null}};function tc(l){this._internalRoot=l}tc.prototype.unstable_scheduleHydration=function(l){if(l){var t=Nf();l={blockedOn:null,target:l,priority:t};for(var a=0;a<Na.length&&t!==0&&t<Na[a].priority;a++);Na.splice(a,0,l),a===0&&g0(l)}};var z0=sl.version;if(z0!=="19.2.4")throw Error(h(527,z0,"19.2.4"));O.findDOMNode=function(l){var t=l._reactInternals;if(t===void 0)throw typeof l.render=="function"?Error(h(188)):(l=Object.keys(l).join(","),Error(h(268,l)));return l=p(t),l=l!==null?I(l):null,l=l===null?null:l.stateNode,l};var $v={bundleType:0,version:"19.2.4",rendererPackageName:"react-dom",currentDispatcherRef:g,reconcilerVersion:"19.2.4"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var ac=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!ac.isDisabled&&ac.supportsFiber)try{Ml=ac.inject($v),gl=ac}catch{}}return ju.createRoot=function(l,t){if(!G(l))throw Error(h(299));var a=!1,e="",u=Do,n=No,c=Uo;return t!=null&&(t.unstable_strictMode===!0&&(a=!0),t.identifierPrefix!==void 0&&(e=t.identifierPrefix),t.onUncaughtError!==void 0&&(u=t.onUncaughtError),t.onCaughtError!==void 0&&(n=t.onCaughtError),t.onRecoverableError!==void 0&&(c=t.onRecoverableError)),t=s0(l,1,!1,null,null,a,e,null,u,n,c,E0),l[Ia]=t.current,Fi(l),new gf(t)},ju.hydrateRoot=function(l,t,a){if(!G(l))throw Error(h(299));var e=!1,u="",n=Do,c=No,i=Uo,f=null;return a!=null&&(a.unstable_strictMode===!0&&(e=!0),a.identifierPrefix!==void 0&&(u=a.identifierPrefix),a.onUncaughtError!==void 0&&(n=a.onUncaughtError),a.onCaughtError!==void 0&&(c=a.onCaughtError),a.onRecoverableError!==void 0&&(i=a.onRecoverableError),a.formState!==void 0&&(f=a.formState)),t=s0(l,1,!0,t,a??null,e,u,f,n,c,i,E0),t.context=o0(null),a=t.current,e=gt(),e=cc(e),u=ya(e),u.callback=null,ha(a,u,e),a=e,t.current.lanes=a,Ve(t,a),Qt(t),l[Ia]=t.current,Fi(l),new tc(t)},ju.version="19.2.4",ju}var x0;function ny(){if(x0)return Ef.exports;x0=1;function M(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(M)}catch(sl){console.error(sl)}}return M(),Ef.exports=uy(),Ef.exports}var cy=ny();const C0="disconnected";function iy(M,sl){switch(sl.type){case"CONNECT_REQUESTED":return"connecting";case"CONNECTED":return"connected";case"DISCONNECTED":return"disconnected";case"RECONNECT_REQUESTED":return"reconnecting";case"CONNECTION_ERROR":return"error";default:return M}}function fy(M){switch(M){case"connecting":return"接続中";case"connected":return"接続済み";case"disconnected":return"切断";case"reconnecting":return"再接続中";case"error":return"エラー";default:return"不明"}}function R0(M){return M<=767?"mobile":M<=1023?"tablet":"desktop"}function sy(){return typeof window>"u"?"desktop":R0(window.innerWidth)}function ec(){return`${Date.now()}-${Math.random().toString(36).slice(2)}`}function oy(){const[M,sl]=V.useState(sy),[Y,h]=V.useReducer(iy,C0),[G,k]=V.useState(!1),[zl,hl]=V.useState([]),[x,p]=V.useState(""),[I,C]=V.useState([]),[nl,Fl]=V.useState(!1),[Wl,Gl]=V.useState(0),[xt,Il]=V.useState(0),[St,Hl]=V.useState("idle"),[tt,bt]=V.useState(0),[Xl,K]=V.useState([]),[$l,ot]=V.useState([]),[Gt,Et]=V.useState(!0),[pl,Xt]=V.useState({proactivity:!1,affectiveDialog:!1}),[at,Pl]=V.useState({proactivity:!1,affectiveDialog:!1}),[g,O]=V.useState({proactivity:!1,affectiveDialog:!1}),[H,ll]=V.useState("idle"),[cl,o]=V.useState("proactivity=false&affective_dialog=false"),[z,_]=V.useState(!1),[N,B]=V.useState(!1),L=V.useRef(C0),tl=V.useRef(null),Tl=V.useRef(null),rl=V.useRef(null),ol=V.useCallback((A,j,jl,P="standard")=>{const Al={id:ec(),timestamp:new Date().toISOString(),summary:j,category:A,kind:P,detail:JSON.stringify(jl)};K(Ml=>[Al,...Ml].slice(0,100))},[]),$a=V.useCallback(A=>{ot(j=>j.includes(A)?j.filter(jl=>jl!==A):[...j,A])},[]);V.useEffect(()=>{const A=()=>{sl(R0(window.innerWidth))};return window.addEventListener("resize",A),()=>window.removeEventListener("resize",A)},[]),V.useEffect(()=>{const A=()=>{nl&&Gl(j=>j+1)};return window.addEventListener("mock-audio-chunk",A),()=>window.removeEventListener("mock-audio-chunk",A)},[nl]),V.useEffect(()=>()=>{const A=rl.current;A&&A.getTracks().forEach(j=>j.stop())},[]),V.useEffect(()=>{if(Y!=="connecting"&&Y!=="reconnecting")return;const A=window.setTimeout(()=>{h({type:"CONNECTED"})},400);return()=>window.clearTimeout(A)},[Y]),V.useEffect(()=>{const A=L.current;A!==Y&&(A==="connecting"&&Y==="connected"&&(hl(j=>[...j,"接続開始"]),ol("notification","接続済み",{phase:"initial"})),A==="reconnecting"&&Y==="connected"&&(hl(j=>[...j,"再接続に成功"]),ol("notification","再接続に成功",{phase:"recover"})),A==="reconnecting"&&Y==="connected"&&H==="applying"&&(Pl(pl),ll("idle"),hl(j=>[...j,"設定変更を反映しました"]),ol("notification","RunConfig反映完了",{proactivity:pl.proactivity,affectiveDialog:pl.affectiveDialog})),L.current=Y)},[ol,Y,pl,H]),V.useEffect(()=>{if(!G)return;const A=window.setTimeout(()=>{h({type:"RECONNECT_REQUESTED"}),hl(j=>[...j,"再接続を試行中"]),ol("notification","再接続試行",{scheduled:!0}),k(!1)},1e3);return()=>window.clearTimeout(A)},[ol,G]),V.useEffect(()=>{const A=tl.current;A&&(A.scrollTop=A.scrollHeight)},[I]),V.useEffect(()=>{const A=j=>{const P=j.detail;if(P){if(P.kind==="text"){const Al=P.text.trim();if(!Al)return;if(P.role==="agent"&&Tl.current&&P.partial){const gl=Tl.current;C(jt=>jt.map(Yl=>Yl.id===gl?{...Yl,content:`${Yl.content}${Al}`,status:"partial"}:Yl)),ol("conversation","エージェント応答更新",{partial:!0});return}const Ml=ec();C(gl=>[...gl,{id:Ml,role:P.role,content:Al,status:P.partial?"partial":"complete"}]),P.role==="agent"&&(Tl.current=P.partial?Ml:null),ol("conversation","会話イベント受信",{role:P.role,partial:P.partial});return}if(P.kind==="audioOutput"){Il(Al=>Al+1),Hl("playing"),ol("conversation","音声出力受信",{chunkSize:P.chunkSize},"audio");return}if(P.kind==="turnComplete"){const Al=Tl.current;if(!Al)return;C(Ml=>Ml.map(gl=>gl.id===Al?{...gl,status:"complete"}:gl)),Tl.current=null,ol("conversation","ターン完了",{kind:"turnComplete"});return}if(P.kind==="runConfigApplyResult"){if(P.status==="applied"){Pl(P.effective),O(P.effective),ll("idle"),hl(Ml=>[...Ml,"設定変更を反映しました"]),ol("notification","RunConfig反映完了",{status:P.status,effective:P.effective});return}const Al=g.proactivity||g.affectiveDialog?g:{proactivity:!1,affectiveDialog:!1};Pl(Al),ll("idle"),hl(Ml=>[...Ml,`設定反映に失敗: ${P.reason??"unsupported"}`]),ol("notification","RunConfig反映失敗",{status:P.status,reason:P.reason,fallback:Al});return}if(P.kind==="error"){h({type:"CONNECTION_ERROR"}),hl(Al=>[...Al,`WebSocketエラー: ${P.message}`]),ol("notification","WebSocketエラー",{message:P.message}),k(!0);return}if(P.kind==="interrupted"){const Al=Tl.current;Al&&(C(Ml=>Ml.map(gl=>gl.id===Al?{...gl,status:"interrupted"}:gl)),Tl.current=null),Hl(Ml=>Ml==="playing"?"interrupted":Ml),ol("notification","中断イベント",{kind:"interrupted"})}}};return window.addEventListener("mock-stream-event",A),()=>window.removeEventListener("mock-stream-event",A)},[ol,g]);const qe=()=>{h({type:"CONNECT_REQUESTED"}),ol("notification","接続開始要求",{source:"ui"})},qu=()=>{h({type:"DISCONNECTED"}),k(!0),hl(A=>[...A,"切断"]),ol("notification","切断",{reconnectScheduled:!0})},Zt=()=>{const A=x.trim();A&&(C(j=>[...j,{id:ec(),role:"user",content:A,status:"complete"}]),ol("conversation","テキスト送信",{text:A}),p(""))},Ye=A=>{A.preventDefault(),Zt()},Be=()=>{Fl(A=>!A)},Yu=()=>{const A=rl.current;A&&(A.getTracks().forEach(j=>j.stop()),rl.current=null),_(!1),B(!1)},Bu=async()=>{try{if(!navigator.mediaDevices||!navigator.mediaDevices.getUserMedia)throw new Error("カメラ未対応");const A=await navigator.mediaDevices.getUserMedia({video:!0});rl.current=A,_(!0),B(!0),ol("notification","カメラプレビュー開始",{status:"opened"})}catch(A){_(!1),B(!1);const j=A instanceof Error?A.message:"unknown";hl(jl=>[...jl,`カメラ利用に失敗: ${j}`]),ol("notification","カメラ利用失敗",{message:j})}},Qe=()=>{C(A=>[...A,{id:ec(),role:"user",content:"[画像を送信しました]",status:"complete"}]),bt(A=>A+1),ol("conversation","画像送信",{placeholder:!0}),Yu()},Ge=()=>{Et(A=>!A)},Xe=()=>{K([]),ot([])},uc=A=>{const j=new URLSearchParams({proactivity:String(A.proactivity),affective_dialog:String(A.affectiveDialog)}).toString();o(j),ll("applying"),hl(jl=>[...jl,"設定変更を反映中"]),ol("notification","RunConfig変更要求",{proactivity:A.proactivity,affective_dialog:A.affectiveDialog,query:j}),h({type:"RECONNECT_REQUESTED"})},Qu=A=>{Xt(j=>{const jl={...j,[A]:!j[A]};return Y==="connected"||Y==="reconnecting"?uc(jl):o(new URLSearchParams({proactivity:String(jl.proactivity),affective_dialog:String(jl.affectiveDialog)}).toString()),jl})},Zl=()=>T.jsxs(T.Fragment,{children:[T.jsxs("p",{className:"mt-2 text-sm text-slate-600",children:["上流音声チャンク: ",T.jsx("span",{"data-testid":"audio-upstream-chunk-count",children:Wl})]}),T.jsxs("p",{className:"mt-1 text-sm text-slate-600",children:["下流音声チャンク: ",T.jsx("span",{"data-testid":"audio-downstream-chunk-count",children:xt})]}),T.jsxs("p",{className:"mt-1 text-sm text-slate-600",children:["音声再生状態:"," ",T.jsxs("span",{"data-testid":"audio-playback-state",children:[St==="idle"&&"待機中",St==="playing"&&"再生中",St==="interrupted"&&"中断"]})]}),T.jsxs("p",{className:"mt-1 text-sm text-slate-600",children:["画像上流送信数: ",T.jsx("span",{"data-testid":"image-upstream-count",children:tt})]})]}),Ze=()=>{const A=Gt?Xl:Xl.filter(j=>j.kind!=="audio");return T.jsxs(T.Fragment,{children:[T.jsxs("div",{className:"mt-3 flex items-center justify-between gap-3 border-t border-slate-200 pt-3",children:[T.jsxs("label",{className:"flex items-center gap-2 text-sm text-slate-700",children:[T.jsx("input",{type:"checkbox",checked:Gt,onChange:Ge}),"音声イベントを表示"]}),T.jsx("button",{type:"button",className:"rounded bg-slate-200 px-2 py-1 text-xs",onClick:Xe,children:"ログをクリア"})]}),T.jsx("ul",{"data-testid":"event-log-list",className:"mt-3 space-y-2",children:A.map(j=>{const jl=$l.includes(j.id),P=j.kind==="audio"?"audio":j.category,Al=j.kind==="audio"?"text-sky-700":j.category==="notification"?"text-amber-700":"text-slate-700";return T.jsxs("li",{"data-testid":"event-log-item",className:"rounded border border-slate-200 bg-white p-2 text-xs",children:[T.jsxs("p",{"data-testid":`event-log-item-${P}`,className:Al,children:["[",P,"] ",j.summary]}),T.jsx("p",{className:"mt-1 text-slate-500",children:j.timestamp}),T.jsx("button",{type:"button",className:"mt-1 rounded bg-slate-200 px-2 py-1",onClick:()=>$a(j.id),children:jl?"詳細を閉じる":"詳細を開く"}),jl&&T.jsx("pre",{"data-testid":"event-log-detail",className:"mt-2 overflow-x-auto rounded bg-slate-100 p-2 text-[11px]",children:j.detail})]},j.id)})})]})},ka=A=>T.jsxs("section",{"aria-label":"connection",role:"region",className:A,children:[T.jsxs("div",{className:"flex items-center justify-between gap-2",children:[T.jsx("p",{className:"font-medium",children:"接続状態"}),T.jsx("span",{"data-testid":"connection-state",className:"rounded bg-slate-100 px-2 py-1 text-sm",children:fy(Y)})]}),Y==="disconnected"&&G&&T.jsx("p",{className:"mt-2 text-sm text-amber-700",children:"再接続予定"}),Y==="error"&&G&&T.jsx("p",{"data-testid":"recovery-status-banner",className:"mt-2 text-sm text-amber-700",children:"自動回復を試行中"}),T.jsxs("div",{className:"mt-3 flex flex-wrap gap-2",children:[(Y==="disconnected"||Y==="error")&&T.jsx("button",{type:"button",className:"rounded bg-slate-900 px-3 py-2 text-white",onClick:qe,children:"接続開始"}),Y==="connected"&&T.jsx("button",{type:"button",className:"rounded bg-slate-700 px-3 py-2 text-white",onClick:qu,children:"切断"})]}),T.jsxs("div",{className:"mt-4 rounded border border-slate-200 bg-slate-50 p-3",children:[T.jsx("p",{className:"text-sm font-medium",children:"RunConfig"}),T.jsxs("label",{className:"mt-2 flex items-center gap-2 text-sm",children:[T.jsx("input",{type:"checkbox",checked:pl.proactivity,onChange:()=>Qu("proactivity"),disabled:H==="applying"}),"Proactivity"]}),T.jsxs("label",{className:"mt-1 flex items-center gap-2 text-sm",children:[T.jsx("input",{type:"checkbox",checked:pl.affectiveDialog,onChange:()=>Qu("affectiveDialog"),disabled:H==="applying"}),"Affective Dialog"]}),T.jsx("p",{"data-testid":"run-config-status",className:"mt-2 text-xs text-slate-600",children:H==="applying"?"反映中":"待機"}),T.jsx("p",{"data-testid":"run-config-query",className:"mt-1 text-xs text-slate-600",children:cl}),T.jsxs("p",{"data-testid":"run-config-effective",className:"mt-1 text-xs text-slate-600",children:["effective: proactivity=",String(at.proactivity),", affectiveDialog=",String(at.affectiveDialog)]}),T.jsx("p",{"data-testid":"run-config-drift",className:"mt-1 text-xs text-slate-600",children:pl.proactivity===at.proactivity&&pl.affectiveDialog===at.affectiveDialog?"一致":"不一致"})]})]}),Fa=A=>T.jsxs("section",{"aria-label":"conversation",role:"region",className:A,children:[T.jsx("p",{className:"font-medium",children:"Conversation"}),T.jsxs("ul",{ref:tl,"data-testid":"conversation-log",className:"mt-3 max-h-72 space-y-2 overflow-y-auto rounded border border-slate-100 bg-white p-3",children:[I.length===0&&T.jsx("li",{className:"text-sm text-slate-500",children:"メッセージはまだありません"}),I.map(j=>T.jsxs("li",{"data-testid":`conversation-message-${j.role}`,className:"rounded bg-slate-100 px-3 py-2 text-sm",children:[T.jsx("p",{children:j.content}),T.jsx("p",{className:"mt-1 text-xs text-slate-500",children:j.status})]},j.id))]})]});return T.jsxs("main",{className:"min-h-screen bg-slate-50 text-slate-900","data-layout":M,children:[T.jsxs("header",{className:"border-b border-slate-200 p-4",children:[T.jsx("h1",{className:"text-xl font-semibold",children:"Realtime Voice Agent"}),T.jsx("p",{"data-testid":"layout-mode",className:"text-sm text-slate-600",children:M})]}),M==="desktop"&&T.jsxs("div",{className:"grid grid-cols-[260px_1fr_280px] gap-4 p-4",children:[ka("rounded-md border border-slate-200 p-4"),Fa("rounded-md border border-slate-200 p-4"),T.jsxs("section",{"aria-label":"event-console",role:"region",className:"rounded-md border border-slate-200 p-4",children:[T.jsx("p",{children:"Event console area"}),Zl(),Ze()]})]}),M==="tablet"&&T.jsxs("div",{className:"grid grid-cols-1 gap-4 p-4",children:[ka("rounded-md border border-slate-200 p-4"),Fa("rounded-md border border-slate-200 p-4"),T.jsxs("section",{"aria-label":"event-console",role:"region",className:"rounded-md border border-slate-200 p-4",children:[T.jsx("p",{children:"Event console area (compact)"}),Zl(),Ze()]})]}),M==="mobile"&&T.jsxs("div",{className:"flex flex-col gap-3 p-3",children:[ka("rounded-md border border-slate-200 p-3"),Fa("rounded-md border border-slate-200 p-3"),T.jsxs("section",{"aria-label":"event-console",role:"region",className:"rounded-md border border-slate-200 p-3",children:[T.jsx("p",{children:"Event console area"}),Zl(),Ze()]})]}),T.jsxs("section",{"aria-label":"input-controls",role:"region",className:"sticky bottom-0 border-t border-slate-200 bg-white p-4",children:[T.jsxs("form",{className:"flex flex-wrap items-center gap-2",onSubmit:Ye,children:[T.jsx("label",{htmlFor:"text-input",className:"sr-only",children:"テキスト入力"}),T.jsx("input",{id:"text-input",type:"text",value:x,onChange:A=>p(A.target.value),className:"min-w-[200px] flex-1 rounded border border-slate-300 px-3 py-2 text-sm",placeholder:"メッセージを入力"}),T.jsx("button",{type:"submit",className:"rounded bg-slate-900 px-3 py-2 text-white",children:"送信"}),T.jsx("button",{type:"button",className:"rounded bg-slate-700 px-3 py-2 text-white",onClick:Be,children:nl?"音声停止":"音声開始"}),T.jsx("button",{type:"button",className:"rounded bg-slate-500 px-3 py-2 text-white",onClick:Bu,children:"画像送信"})]}),nl&&T.jsx("p",{"data-testid":"voice-input-state",className:"mt-2 text-sm text-emerald-700",children:"音声入力中"}),T.jsx("p",{"data-testid":"camera-state",className:"mt-1 text-sm text-slate-600",children:N?"利用中":"未使用"})]}),z&&T.jsx("section",{role:"dialog","aria-label":"camera-preview",className:"fixed inset-0 z-10 flex items-center justify-center bg-slate-900/40 p-4",children:T.jsxs("div",{className:"w-full max-w-md rounded-md bg-white p-4",children:[T.jsx("p",{className:"font-medium",children:"Camera Preview"}),T.jsx("p",{className:"mt-2 text-sm text-slate-600",children:"プレビュー準備完了"}),T.jsxs("div",{className:"mt-4 flex gap-2",children:[T.jsx("button",{type:"button",className:"rounded bg-slate-900 px-3 py-2 text-white",onClick:Qe,children:"画像を送信"}),T.jsx("button",{type:"button",className:"rounded bg-slate-600 px-3 py-2 text-white",onClick:Yu,children:"キャンセル"})]})]})}),T.jsxs("section",{"aria-label":"system-notices",role:"region",className:"border-t border-slate-200 bg-slate-100 p-3",children:[T.jsx("p",{className:"text-sm font-medium",children:"システム通知"}),T.jsx("ul",{"data-testid":"system-notices",className:"mt-1 list-disc pl-5 text-sm text-slate-700",children:zl.map((A,j)=>T.jsx("li",{"data-testid":"system-notice-item",className:"system-notice-item rounded border-l-2 border-amber-400 bg-amber-50 px-2 py-1",children:A},`${A}-${j}`))})]})]})}function dy(){return{connection:"disconnected",conversation:[],notices:[],eventLog:[]}}const my=V.createContext(null);function vy({children:M}){const[sl]=V.useState(dy()),Y=V.useMemo(()=>sl,[sl]);return T.jsx(my.Provider,{value:Y,children:M})}const H0=document.getElementById("root");if(!H0)throw new Error("Root element #root not found");cy.createRoot(H0).render(T.jsx(V.StrictMode,{children:T.jsx(vy,{children:T.jsx(oy,{})})}));
@@ -1,49 +0,0 @@
-(function(){const sl=document.createElement("link").relList;if(sl&&sl.supports&&sl.supports("modulepreload"))return;for(const Q of document.querySelectorAll('link[rel="modulepreload"]'))r(Q);new MutationObserver(Q=>{for(const k of Q)if(k.type==="childList")for(const pl of k.addedNodes)pl.tagName==="LINK"&&pl.rel==="modulepreload"&&r(pl)}).observe(document,{childList:!0,subtree:!0});function B(Q){const k={};return Q.integrity&&(k.integrity=Q.integrity),Q.referrerPolicy&&(k.referrerPolicy=Q.referrerPolicy),Q.crossOrigin==="use-credentials"?k.credentials="include":Q.crossOrigin==="anonymous"?k.credentials="omit":k.credentials="same-origin",k}function r(Q){if(Q.ep)return;Q.ep=!0;const k=B(Q);fetch(Q.href,k)}})();var Sf={exports:{}},Hu={};/**
- * @license React
- * react-jsx-runtime.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var z0;function Fv(){if(z0)return Hu;z0=1;var x=Symbol.for("react.transitional.element"),sl=Symbol.for("react.fragment");function B(r,Q,k){var pl=null;if(k!==void 0&&(pl=""+k),Q.key!==void 0&&(pl=""+Q.key),"key"in Q){k={};for(var rl in Q)rl!=="key"&&(k[rl]=Q[rl])}else k=Q;return Q=k.ref,{$$typeof:x,type:r,key:pl,ref:Q!==void 0?Q:null,props:k}}return Hu.Fragment=sl,Hu.jsx=B,Hu.jsxs=B,Hu}var T0;function Iv(){return T0||(T0=1,Sf.exports=Fv()),Sf.exports}var T=Iv(),bf={exports:{}},G={};/**
- * @license React
- * react.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var A0;function Pv(){if(A0)return G;A0=1;var x=Symbol.for("react.transitional.element"),sl=Symbol.for("react.portal"),B=Symbol.for("react.fragment"),r=Symbol.for("react.strict_mode"),Q=Symbol.for("react.profiler"),k=Symbol.for("react.consumer"),pl=Symbol.for("react.context"),rl=Symbol.for("react.forward_ref"),U=Symbol.for("react.suspense"),z=Symbol.for("react.memo"),I=Symbol.for("react.lazy"),R=Symbol.for("react.activity"),nl=Symbol.iterator;function Fl(o){return o===null||typeof o!="object"?null:(o=nl&&o[nl]||o["@@iterator"],typeof o=="function"?o:null)}var Wl={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},Ql=Object.assign,Ut={};function Il(o,p,_){this.props=o,this.context=p,this.refs=Ut,this.updater=_||Wl}Il.prototype.isReactComponent={},Il.prototype.setState=function(o,p){if(typeof o!="object"&&typeof o!="function"&&o!=null)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,o,p,"setState")},Il.prototype.forceUpdate=function(o){this.updater.enqueueForceUpdate(this,o,"forceUpdate")};function St(){}St.prototype=Il.prototype;function Hl(o,p,_){this.props=o,this.context=p,this.refs=Ut,this.updater=_||Wl}var tt=Hl.prototype=new St;tt.constructor=Hl,Ql(tt,Il.prototype),tt.isPureReactComponent=!0;var bt=Array.isArray;function Xl(){}var K={H:null,A:null,T:null,S:null},$l=Object.prototype.hasOwnProperty;function ot(o,p,_){var D=_.ref;return{$$typeof:x,type:o,key:p,ref:D!==void 0?D:null,props:_}}function Qt(o,p){return ot(o.type,p,o.props)}function Et(o){return typeof o=="object"&&o!==null&&o.$$typeof===x}function zl(o){var p={"=":"=0",":":"=2"};return"$"+o.replace(/[=:]/g,function(_){return p[_]})}var Xt=/\/+/g;function at(o,p){return typeof o=="object"&&o!==null&&o.key!=null?zl(""+o.key):p.toString(36)}function Pl(o){switch(o.status){case"fulfilled":return o.value;case"rejected":throw o.reason;default:switch(typeof o.status=="string"?o.then(Xl,Xl):(o.status="pending",o.then(function(p){o.status==="pending"&&(o.status="fulfilled",o.value=p)},function(p){o.status==="pending"&&(o.status="rejected",o.reason=p)})),o.status){case"fulfilled":return o.value;case"rejected":throw o.reason}}throw o}function g(o,p,_,D,Y){var L=typeof o;(L==="undefined"||L==="boolean")&&(o=null);var tl=!1;if(o===null)tl=!0;else switch(L){case"bigint":case"string":case"number":tl=!0;break;case"object":switch(o.$$typeof){case x:case sl:tl=!0;break;case I:return tl=o._init,g(tl(o._payload),p,_,D,Y)}}if(tl)return Y=Y(o),tl=D===""?"."+at(o,0):D,bt(Y)?(_="",tl!=null&&(_=tl.replace(Xt,"$&/")+"/"),g(Y,p,_,"",function(ol){return ol})):Y!=null&&(Et(Y)&&(Y=Qt(Y,_+(Y.key==null||o&&o.key===Y.key?"":(""+Y.key).replace(Xt,"$&/")+"/")+tl)),p.push(Y)),1;tl=0;var Tl=D===""?".":D+":";if(bt(o))for(var hl=0;hl<o.length;hl++)D=o[hl],L=Tl+at(D,hl),tl+=g(D,p,_,L,Y);else if(hl=Fl(o),typeof hl=="function")for(o=hl.call(o),hl=0;!(D=o.next()).done;)D=D.value,L=Tl+at(D,hl++),tl+=g(D,p,_,L,Y);else if(L==="object"){if(typeof o.then=="function")return g(Pl(o),p,_,D,Y);throw p=String(o),Error("Objects are not valid as a React child (found: "+(p==="[object Object]"?"object with keys {"+Object.keys(o).join(", ")+"}":p)+"). If you meant to render a collection of children, use an array instead.")}return tl}function O(o,p,_){if(o==null)return o;var D=[],Y=0;return g(o,D,"","",function(L){return p.call(_,L,Y++)}),D}function j(o){if(o._status===-1){var p=o._result;p=p(),p.then(function(_){(o._status===0||o._status===-1)&&(o._status=1,o._result=_)},function(_){(o._status===0||o._status===-1)&&(o._status=2,o._result=_)}),o._status===-1&&(o._status=0,o._result=p)}if(o._status===1)return o._result.default;throw o._result}var ll=typeof reportError=="function"?reportError:function(o){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var p=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof o=="object"&&o!==null&&typeof o.message=="string"?String(o.message):String(o),error:o});if(!window.dispatchEvent(p))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",o);return}console.error(o)},il={map:O,forEach:function(o,p,_){O(o,function(){p.apply(this,arguments)},_)},count:function(o){var p=0;return O(o,function(){p++}),p},toArray:function(o){return O(o,function(p){return p})||[]},only:function(o){if(!Et(o))throw Error("React.Children.only expected to receive a single React element child.");return o}};return G.Activity=R,G.Children=il,G.Component=Il,G.Fragment=B,G.Profiler=Q,G.PureComponent=Hl,G.StrictMode=r,G.Suspense=U,G.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=K,G.__COMPILER_RUNTIME={__proto__:null,c:function(o){return K.H.useMemoCache(o)}},G.cache=function(o){return function(){return o.apply(null,arguments)}},G.cacheSignal=function(){return null},G.cloneElement=function(o,p,_){if(o==null)throw Error("The argument must be a React element, but you passed "+o+".");var D=Ql({},o.props),Y=o.key;if(p!=null)for(L in p.key!==void 0&&(Y=""+p.key),p)!$l.call(p,L)||L==="key"||L==="__self"||L==="__source"||L==="ref"&&p.ref===void 0||(D[L]=p[L]);var L=arguments.length-2;if(L===1)D.children=_;else if(1<L){for(var tl=Array(L),Tl=0;Tl<L;Tl++)tl[Tl]=arguments[Tl+2];D.children=tl}return ot(o.type,Y,D)},G.createContext=function(o){return o={$$typeof:pl,_currentValue:o,_currentValue2:o,_threadCount:0,Provider:null,Consumer:null},o.Provider=o,o.Consumer={$$typeof:k,_context:o},o},G.createElement=function(o,p,_){var D,Y={},L=null;if(p!=null)for(D in p.key!==void 0&&(L=""+p.key),p)$l.call(p,D)&&D!=="key"&&D!=="__self"&&D!=="__source"&&(Y[D]=p[D]);var tl=arguments.length-2;if(tl===1)Y.children=_;else if(1<tl){for(var Tl=Array(tl),hl=0;hl<tl;hl++)Tl[hl]=arguments[hl+2];Y.children=Tl}if(o&&o.defaultProps)for(D in tl=o.defaultProps,tl)Y[D]===void 0&&(Y[D]=tl[D]);return ot(o,L,Y)},G.createRef=function(){return{current:null}},G.forwardRef=function(o){return{$$typeof:rl,render:o}},G.isValidElement=Et,G.lazy=function(o){return{$$typeof:I,_payload:{_status:-1,_result:o},_init:j}},G.memo=function(o,p){return{$$typeof:z,type:o,compare:p===void 0?null:p}},G.startTransition=function(o){var p=K.T,_={};K.T=_;try{var D=o(),Y=K.S;Y!==null&&Y(_,D),typeof D=="object"&&D!==null&&typeof D.then=="function"&&D.then(Xl,ll)}catch(L){ll(L)}finally{p!==null&&_.types!==null&&(p.types=_.types),K.T=p}},G.unstable_useCacheRefresh=function(){return K.H.useCacheRefresh()},G.use=function(o){return K.H.use(o)},G.useActionState=function(o,p,_){return K.H.useActionState(o,p,_)},G.useCallback=function(o,p){return K.H.useCallback(o,p)},G.useContext=function(o){return K.H.useContext(o)},G.useDebugValue=function(){},G.useDeferredValue=function(o,p){return K.H.useDeferredValue(o,p)},G.useEffect=function(o,p){return K.H.useEffect(o,p)},G.useEffectEvent=function(o){return K.H.useEffectEvent(o)},G.useId=function(){return K.H.useId()},G.useImperativeHandle=function(o,p,_){return K.H.useImperativeHandle(o,p,_)},G.useInsertionEffect=function(o,p){return K.H.useInsertionEffect(o,p)},G.useLayoutEffect=function(o,p){return K.H.useLayoutEffect(o,p)},G.useMemo=function(o,p){return K.H.useMemo(o,p)},G.useOptimistic=function(o,p){return K.H.useOptimistic(o,p)},G.useReducer=function(o,p,_){return K.H.useReducer(o,p,_)},G.useRef=function(o){return K.H.useRef(o)},G.useState=function(o){return K.H.useState(o)},G.useSyncExternalStore=function(o,p,_){return K.H.useSyncExternalStore(o,p,_)},G.useTransition=function(){return K.H.useTransition()},G.version="19.2.4",G}var _0;function Af(){return _0||(_0=1,bf.exports=Pv()),bf.exports}var V=Af(),Ef={exports:{}},ju={},pf={exports:{}},zf={};/**
- * @license React
- * scheduler.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var O0;function ly(){return O0||(O0=1,(function(x){function sl(g,O){var j=g.length;g.push(O);l:for(;0<j;){var ll=j-1>>>1,il=g[ll];if(0<Q(il,O))g[ll]=O,g[j]=il,j=ll;else break l}}function B(g){return g.length===0?null:g[0]}function r(g){if(g.length===0)return null;var O=g[0],j=g.pop();if(j!==O){g[0]=j;l:for(var ll=0,il=g.length,o=il>>>1;ll<o;){var p=2*(ll+1)-1,_=g[p],D=p+1,Y=g[D];if(0>Q(_,j))D<il&&0>Q(Y,_)?(g[ll]=Y,g[D]=j,ll=D):(g[ll]=_,g[p]=j,ll=p);else if(D<il&&0>Q(Y,j))g[ll]=Y,g[D]=j,ll=D;else break l}}return O}function Q(g,O){var j=g.sortIndex-O.sortIndex;return j!==0?j:g.id-O.id}if(x.unstable_now=void 0,typeof performance=="object"&&typeof performance.now=="function"){var k=performance;x.unstable_now=function(){return k.now()}}else{var pl=Date,rl=pl.now();x.unstable_now=function(){return pl.now()-rl}}var U=[],z=[],I=1,R=null,nl=3,Fl=!1,Wl=!1,Ql=!1,Ut=!1,Il=typeof setTimeout=="function"?setTimeout:null,St=typeof clearTimeout=="function"?clearTimeout:null,Hl=typeof setImmediate<"u"?setImmediate:null;function tt(g){for(var O=B(z);O!==null;){if(O.callback===null)r(z);else if(O.startTime<=g)r(z),O.sortIndex=O.expirationTime,sl(U,O);else break;O=B(z)}}function bt(g){if(Ql=!1,tt(g),!Wl)if(B(U)!==null)Wl=!0,Xl||(Xl=!0,zl());else{var O=B(z);O!==null&&Pl(bt,O.startTime-g)}}var Xl=!1,K=-1,$l=5,ot=-1;function Qt(){return Ut?!0:!(x.unstable_now()-ot<$l)}function Et(){if(Ut=!1,Xl){var g=x.unstable_now();ot=g;var O=!0;try{l:{Wl=!1,Ql&&(Ql=!1,St(K),K=-1),Fl=!0;var j=nl;try{t:{for(tt(g),R=B(U);R!==null&&!(R.expirationTime>g&&Qt());){var ll=R.callback;if(typeof ll=="function"){R.callback=null,nl=R.priorityLevel;var il=ll(R.expirationTime<=g);if(g=x.unstable_now(),typeof il=="function"){R.callback=il,tt(g),O=!0;break t}R===B(U)&&r(U),tt(g)}else r(U);R=B(U)}if(R!==null)O=!0;else{var o=B(z);o!==null&&Pl(bt,o.startTime-g),O=!1}}break l}finally{R=null,nl=j,Fl=!1}O=void 0}}finally{O?zl():Xl=!1}}}var zl;if(typeof Hl=="function")zl=function(){Hl(Et)};else if(typeof MessageChannel<"u"){var Xt=new MessageChannel,at=Xt.port2;Xt.port1.onmessage=Et,zl=function(){at.postMessage(null)}}else zl=function(){Il(Et,0)};function Pl(g,O){K=Il(function(){g(x.unstable_now())},O)}x.unstable_IdlePriority=5,x.unstable_ImmediatePriority=1,x.unstable_LowPriority=4,x.unstable_NormalPriority=3,x.unstable_Profiling=null,x.unstable_UserBlockingPriority=2,x.unstable_cancelCallback=function(g){g.callback=null},x.unstable_forceFrameRate=function(g){0>g||125<g?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):$l=0<g?Math.floor(1e3/g):5},x.unstable_getCurrentPriorityLevel=function(){return nl},x.unstable_next=function(g){switch(nl){case 1:case 2:case 3:var O=3;break;default:O=nl}var j=nl;nl=O;try{return g()}finally{nl=j}},x.unstable_requestPaint=function(){Ut=!0},x.unstable_runWithPriority=function(g,O){switch(g){case 1:case 2:case 3:case 4:case 5:break;default:g=3}var j=nl;nl=g;try{return O()}finally{nl=j}},x.unstable_scheduleCallback=function(g,O,j){var ll=x.unstable_now();switch(typeof j=="object"&&j!==null?(j=j.delay,j=typeof j=="number"&&0<j?ll+j:ll):j=ll,g){case 1:var il=-1;break;case 2:il=250;break;case 5:il=1073741823;break;case 4:il=1e4;break;default:il=5e3}return il=j+il,g={id:I++,callback:O,priorityLevel:g,startTime:j,expirationTime:il,sortIndex:-1},j>ll?(g.sortIndex=j,sl(z,g),B(U)===null&&g===B(z)&&(Ql?(St(K),K=-1):Ql=!0,Pl(bt,j-ll))):(g.sortIndex=il,sl(U,g),Wl||Fl||(Wl=!0,Xl||(Xl=!0,zl()))),g},x.unstable_shouldYield=Qt,x.unstable_wrapCallback=function(g){var O=nl;return function(){var j=nl;nl=O;try{return g.apply(this,arguments)}finally{nl=j}}}})(zf)),zf}var x0;function ty(){return x0||(x0=1,pf.exports=ly()),pf.exports}var Tf={exports:{}},kl={};/**
- * @license React
- * react-dom.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var M0;function ay(){if(M0)return kl;M0=1;var x=Af();function sl(U){var z="https://react.dev/errors/"+U;if(1<arguments.length){z+="?args[]="+encodeURIComponent(arguments[1]);for(var I=2;I<arguments.length;I++)z+="&args[]="+encodeURIComponent(arguments[I])}return"Minified React error #"+U+"; visit "+z+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function B(){}var r={d:{f:B,r:function(){throw Error(sl(522))},D:B,C:B,L:B,m:B,X:B,S:B,M:B},p:0,findDOMNode:null},Q=Symbol.for("react.portal");function k(U,z,I){var R=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:Q,key:R==null?null:""+R,children:U,containerInfo:z,implementation:I}}var pl=x.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function rl(U,z){if(U==="font")return"";if(typeof z=="string")return z==="use-credentials"?z:""}return kl.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=r,kl.createPortal=function(U,z){var I=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!z||z.nodeType!==1&&z.nodeType!==9&&z.nodeType!==11)throw Error(sl(299));return k(U,z,null,I)},kl.flushSync=function(U){var z=pl.T,I=r.p;try{if(pl.T=null,r.p=2,U)return U()}finally{pl.T=z,r.p=I,r.d.f()}},kl.preconnect=function(U,z){typeof U=="string"&&(z?(z=z.crossOrigin,z=typeof z=="string"?z==="use-credentials"?z:"":void 0):z=null,r.d.C(U,z))},kl.prefetchDNS=function(U){typeof U=="string"&&r.d.D(U)},kl.preinit=function(U,z){if(typeof U=="string"&&z&&typeof z.as=="string"){var I=z.as,R=rl(I,z.crossOrigin),nl=typeof z.integrity=="string"?z.integrity:void 0,Fl=typeof z.fetchPriority=="string"?z.fetchPriority:void 0;I==="style"?r.d.S(U,typeof z.precedence=="string"?z.precedence:void 0,{crossOrigin:R,integrity:nl,fetchPriority:Fl}):I==="script"&&r.d.X(U,{crossOrigin:R,integrity:nl,fetchPriority:Fl,nonce:typeof z.nonce=="string"?z.nonce:void 0})}},kl.preinitModule=function(U,z){if(typeof U=="string")if(typeof z=="object"&&z!==null){if(z.as==null||z.as==="script"){var I=rl(z.as,z.crossOrigin);r.d.M(U,{crossOrigin:I,integrity:typeof z.integrity=="string"?z.integrity:void 0,nonce:typeof z.nonce=="string"?z.nonce:void 0})}}else z==null&&r.d.M(U)},kl.preload=function(U,z){if(typeof U=="string"&&typeof z=="object"&&z!==null&&typeof z.as=="string"){var I=z.as,R=rl(I,z.crossOrigin);r.d.L(U,I,{crossOrigin:R,integrity:typeof z.integrity=="string"?z.integrity:void 0,nonce:typeof z.nonce=="string"?z.nonce:void 0,type:typeof z.type=="string"?z.type:void 0,fetchPriority:typeof z.fetchPriority=="string"?z.fetchPriority:void 0,referrerPolicy:typeof z.referrerPolicy=="string"?z.referrerPolicy:void 0,imageSrcSet:typeof z.imageSrcSet=="string"?z.imageSrcSet:void 0,imageSizes:typeof z.imageSizes=="string"?z.imageSizes:void 0,media:typeof z.media=="string"?z.media:void 0})}},kl.preloadModule=function(U,z){if(typeof U=="string")if(z){var I=rl(z.as,z.crossOrigin);r.d.m(U,{as:typeof z.as=="string"&&z.as!=="script"?z.as:void 0,crossOrigin:I,integrity:typeof z.integrity=="string"?z.integrity:void 0})}else r.d.m(U)},kl.requestFormReset=function(U){r.d.r(U)},kl.unstable_batchedUpdates=function(U,z){return U(z)},kl.useFormState=function(U,z,I){return pl.H.useFormState(U,z,I)},kl.useFormStatus=function(){return pl.H.useHostTransitionStatus()},kl.version="19.2.4",kl}var D0;function ey(){if(D0)return Tf.exports;D0=1;function x(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(x)}catch(sl){console.error(sl)}}return x(),Tf.exports=ay(),Tf.exports}/**
- * @license React
- * react-dom-client.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var N0;function uy(){if(N0)return ju;N0=1;var x=ty(),sl=Af(),B=ey();function r(l){var t="https://react.dev/errors/"+l;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var a=2;a<arguments.length;a++)t+="&args[]="+encodeURIComponent(arguments[a])}return"Minified React error #"+l+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function Q(l){return!(!l||l.nodeType!==1&&l.nodeType!==9&&l.nodeType!==11)}function k(l){var t=l,a=l;if(l.alternate)for(;t.return;)t=t.return;else{l=t;do t=l,(t.flags&4098)!==0&&(a=t.return),l=t.return;while(l)}return t.tag===3?a:null}function pl(l){if(l.tag===13){var t=l.memoizedState;if(t===null&&(l=l.alternate,l!==null&&(t=l.memoizedState)),t!==null)return t.dehydrated}return null}function rl(l){if(l.tag===31){var t=l.memoizedState;if(t===null&&(l=l.alternate,l!==null&&(t=l.memoizedState)),t!==null)return t.dehydrated}return null}function U(l){if(k(l)!==l)throw Error(r(188))}function z(l){var t=l.alternate;if(!t){if(t=k(l),t===null)throw Error(r(188));return t!==l?null:l}for(var a=l,e=t;;){var u=a.return;if(u===null)break;var n=u.alternate;if(n===null){if(e=u.return,e!==null){a=e;continue}break}if(u.child===n.child){for(n=u.child;n;){if(n===a)return U(u),l;if(n===e)return U(u),t;n=n.sibling}throw Error(r(188))}if(a.return!==e.return)a=u,e=n;else{for(var i=!1,c=u.child;c;){if(c===a){i=!0,a=u,e=n;break}if(c===e){i=!0,e=u,a=n;break}c=c.sibling}if(!i){for(c=n.child;c;){if(c===a){i=!0,a=n,e=u;break}if(c===e){i=!0,e=n,a=u;break}c=c.sibling}if(!i)throw Error(r(189))}}if(a.alternate!==e)throw Error(r(190))}if(a.tag!==3)throw Error(r(188));return a.stateNode.current===a?l:t}function I(l){var t=l.tag;if(t===5||t===26||t===27||t===6)return l;for(l=l.child;l!==null;){if(t=I(l),t!==null)return t;l=l.sibling}return null}var R=Object.assign,nl=Symbol.for("react.element"),Fl=Symbol.for("react.transitional.element"),Wl=Symbol.for("react.portal"),Ql=Symbol.for("react.fragment"),Ut=Symbol.for("react.strict_mode"),Il=Symbol.for("react.profiler"),St=Symbol.for("react.consumer"),Hl=Symbol.for("react.context"),tt=Symbol.for("react.forward_ref"),bt=Symbol.for("react.suspense"),Xl=Symbol.for("react.suspense_list"),K=Symbol.for("react.memo"),$l=Symbol.for("react.lazy"),ot=Symbol.for("react.activity"),Qt=Symbol.for("react.memo_cache_sentinel"),Et=Symbol.iterator;function zl(l){return l===null||typeof l!="object"?null:(l=Et&&l[Et]||l["@@iterator"],typeof l=="function"?l:null)}var Xt=Symbol.for("react.client.reference");function at(l){if(l==null)return null;if(typeof l=="function")return l.$$typeof===Xt?null:l.displayName||l.name||null;if(typeof l=="string")return l;switch(l){case Ql:return"Fragment";case Il:return"Profiler";case Ut:return"StrictMode";case bt:return"Suspense";case Xl:return"SuspenseList";case ot:return"Activity"}if(typeof l=="object")switch(l.$$typeof){case Wl:return"Portal";case Hl:return l.displayName||"Context";case St:return(l._context.displayName||"Context")+".Consumer";case tt:var t=l.render;return l=l.displayName,l||(l=t.displayName||t.name||"",l=l!==""?"ForwardRef("+l+")":"ForwardRef"),l;case K:return t=l.displayName||null,t!==null?t:at(l.type)||"Memo";case $l:t=l._payload,l=l._init;try{return at(l(t))}catch{}}return null}var Pl=Array.isArray,g=sl.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,O=B.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,j={pending:!1,data:null,method:null,action:null},ll=[],il=-1;function o(l){return{current:l}}function p(l){0>il||(l.current=ll[il],ll[il]=null,il--)}function _(l,t){il++,ll[il]=l.current,l.current=t}var D=o(null),Y=o(null),L=o(null),tl=o(null);function Tl(l,t){switch(_(L,t),_(Y,l),_(D,null),t.nodeType){case 9:case 11:l=(l=t.documentElement)&&(l=l.namespaceURI)?Kd(l):0;break;default:if(l=t.tagName,t=t.namespaceURI)t=Kd(t),l=Jd(t,l);else switch(l){case"svg":l=1;break;case"math":l=2;break;default:l=0}}p(D),_(D,l)}function hl(){p(D),p(Y),p(L)}function ol(l){l.memoizedState!==null&&_(tl,l);var t=D.current,a=Jd(t,l.type);t!==a&&(_(Y,l),_(D,a))}function $a(l){Y.current===l&&(p(D),p(Y)),tl.current===l&&(p(tl),Nu._currentValue=j)}var qe,qu;function Zt(l){if(qe===void 0)try{throw Error()}catch(a){var t=a.stack.trim().match(/\n( *(at )?)/);qe=t&&t[1]||"",qu=-1<a.stack.indexOf(`
-    at`)?" (<anonymous>)":-1<a.stack.indexOf("@")?"@unknown:0:0":""}return`
-`+qe+l+qu}var Be=!1;function Ye(l,t){if(!l||Be)return"";Be=!0;var a=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var e={DetermineComponentFrameRoot:function(){try{if(t){var E=function(){throw Error()};if(Object.defineProperty(E.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(E,[])}catch(h){var y=h}Reflect.construct(l,[],E)}else{try{E.call()}catch(h){y=h}l.call(E.prototype)}}else{try{throw Error()}catch(h){y=h}(E=l())&&typeof E.catch=="function"&&E.catch(function(){})}}catch(h){if(h&&y&&typeof h.stack=="string")return[h.stack,y.stack]}return[null,null]}};e.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var u=Object.getOwnPropertyDescriptor(e.DetermineComponentFrameRoot,"name");u&&u.configurable&&Object.defineProperty(e.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var n=e.DetermineComponentFrameRoot(),i=n[0],c=n[1];if(i&&c){var f=i.split(`
-`),v=c.split(`
-`);for(u=e=0;e<f.length&&!f[e].includes("DetermineComponentFrameRoot");)e++;for(;u<v.length&&!v[u].includes("DetermineComponentFrameRoot");)u++;if(e===f.length||u===v.length)for(e=f.length-1,u=v.length-1;1<=e&&0<=u&&f[e]!==v[u];)u--;for(;1<=e&&0<=u;e--,u--)if(f[e]!==v[u]){if(e!==1||u!==1)do if(e--,u--,0>u||f[e]!==v[u]){var S=`
-`+f[e].replace(" at new "," at ");return l.displayName&&S.includes("<anonymous>")&&(S=S.replace("<anonymous>",l.displayName)),S}while(1<=e&&0<=u);break}}}finally{Be=!1,Error.prepareStackTrace=a}return(a=l?l.displayName||l.name:"")?Zt(a):""}function Bu(l,t){switch(l.tag){case 26:case 27:case 5:return Zt(l.type);case 16:return Zt("Lazy");case 13:return l.child!==t&&t!==null?Zt("Suspense Fallback"):Zt("Suspense");case 19:return Zt("SuspenseList");case 0:case 15:return Ye(l.type,!1);case 11:return Ye(l.type.render,!1);case 1:return Ye(l.type,!0);case 31:return Zt("Activity");default:return""}}function Yu(l){try{var t="",a=null;do t+=Bu(l,a),a=l,l=l.return;while(l);return t}catch(e){return`
-Error generating stack: `+e.message+`
-`+e.stack}}var Ge=Object.prototype.hasOwnProperty,Qe=x.unstable_scheduleCallback,Xe=x.unstable_cancelCallback,ui=x.unstable_shouldYield,Gu=x.unstable_requestPaint,Zl=x.unstable_now,Ze=x.unstable_getCurrentPriorityLevel,ka=x.unstable_ImmediatePriority,Fa=x.unstable_UserBlockingPriority,A=x.unstable_NormalPriority,C=x.unstable_LowPriority,jl=x.unstable_IdlePriority,P=x.log,Al=x.unstable_setDisableYieldValue,xl=null,gl=null;function jt(l){if(typeof P=="function"&&Al(l),gl&&typeof gl.setStrictMode=="function")try{gl.setStrictMode(xl,l)}catch{}}var Bl=Math.clz32?Math.clz32:B0,j0=Math.log,q0=Math.LN2;function B0(l){return l>>>=0,l===0?32:31-(j0(l)/q0|0)|0}var Qu=256,Xu=262144,Zu=4194304;function Ua(l){var t=l&42;if(t!==0)return t;switch(l&-l){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:return l&261888;case 262144:case 524288:case 1048576:case 2097152:return l&3932160;case 4194304:case 8388608:case 16777216:case 33554432:return l&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return l}}function Lu(l,t,a){var e=l.pendingLanes;if(e===0)return 0;var u=0,n=l.suspendedLanes,i=l.pingedLanes;l=l.warmLanes;var c=e&134217727;return c!==0?(e=c&~n,e!==0?u=Ua(e):(i&=c,i!==0?u=Ua(i):a||(a=c&~l,a!==0&&(u=Ua(a))))):(c=e&~n,c!==0?u=Ua(c):i!==0?u=Ua(i):a||(a=e&~l,a!==0&&(u=Ua(a)))),u===0?0:t!==0&&t!==u&&(t&n)===0&&(n=u&-u,a=t&-t,n>=a||n===32&&(a&4194048)!==0)?t:u}function Le(l,t){return(l.pendingLanes&~(l.suspendedLanes&~l.pingedLanes)&t)===0}function Y0(l,t){switch(l){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function _f(){var l=Zu;return Zu<<=1,(Zu&62914560)===0&&(Zu=4194304),l}function ni(l){for(var t=[],a=0;31>a;a++)t.push(l);return t}function Ve(l,t){l.pendingLanes|=t,t!==268435456&&(l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0)}function G0(l,t,a,e,u,n){var i=l.pendingLanes;l.pendingLanes=a,l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0,l.expiredLanes&=a,l.entangledLanes&=a,l.errorRecoveryDisabledLanes&=a,l.shellSuspendCounter=0;var c=l.entanglements,f=l.expirationTimes,v=l.hiddenUpdates;for(a=i&~a;0<a;){var S=31-Bl(a),E=1<<S;c[S]=0,f[S]=-1;var y=v[S];if(y!==null)for(v[S]=null,S=0;S<y.length;S++){var h=y[S];h!==null&&(h.lane&=-536870913)}a&=~E}e!==0&&Of(l,e,0),n!==0&&u===0&&l.tag!==0&&(l.suspendedLanes|=n&~(i&~t))}function Of(l,t,a){l.pendingLanes|=t,l.suspendedLanes&=~t;var e=31-Bl(t);l.entangledLanes|=t,l.entanglements[e]=l.entanglements[e]|1073741824|a&261930}function xf(l,t){var a=l.entangledLanes|=t;for(l=l.entanglements;a;){var e=31-Bl(a),u=1<<e;u&t|l[e]&t&&(l[e]|=t),a&=~u}}function Mf(l,t){var a=t&-t;return a=(a&42)!==0?1:ii(a),(a&(l.suspendedLanes|t))!==0?0:a}function ii(l){switch(l){case 2:l=1;break;case 8:l=4;break;case 32:l=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:l=128;break;case 268435456:l=134217728;break;default:l=0}return l}function ci(l){return l&=-l,2<l?8<l?(l&134217727)!==0?32:268435456:8:2}function Df(){var l=O.p;return l!==0?l:(l=window.event,l===void 0?32:r0(l.type))}function Nf(l,t){var a=O.p;try{return O.p=l,t()}finally{O.p=a}}var ca=Math.random().toString(36).slice(2),Ll="__reactFiber$"+ca,et="__reactProps$"+ca,Ia="__reactContainer$"+ca,fi="__reactEvents$"+ca,Q0="__reactListeners$"+ca,X0="__reactHandles$"+ca,Uf="__reactResources$"+ca,Ke="__reactMarker$"+ca;function si(l){delete l[Ll],delete l[et],delete l[fi],delete l[Q0],delete l[X0]}function Pa(l){var t=l[Ll];if(t)return t;for(var a=l.parentNode;a;){if(t=a[Ia]||a[Ll]){if(a=t.alternate,t.child!==null||a!==null&&a.child!==null)for(l=Pd(l);l!==null;){if(a=l[Ll])return a;l=Pd(l)}return t}l=a,a=l.parentNode}return null}function le(l){if(l=l[Ll]||l[Ia]){var t=l.tag;if(t===5||t===6||t===13||t===31||t===26||t===27||t===3)return l}return null}function Je(l){var t=l.tag;if(t===5||t===26||t===27||t===6)return l.stateNode;throw Error(r(33))}function te(l){var t=l[Uf];return t||(t=l[Uf]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function Yl(l){l[Ke]=!0}var Cf=new Set,Rf={};function Ca(l,t){ae(l,t),ae(l+"Capture",t)}function ae(l,t){for(Rf[l]=t,l=0;l<t.length;l++)Cf.add(t[l])}var Z0=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),Hf={},jf={};function L0(l){return Ge.call(jf,l)?!0:Ge.call(Hf,l)?!1:Z0.test(l)?jf[l]=!0:(Hf[l]=!0,!1)}function Vu(l,t,a){if(L0(t))if(a===null)l.removeAttribute(t);else{switch(typeof a){case"undefined":case"function":case"symbol":l.removeAttribute(t);return;case"boolean":var e=t.toLowerCase().slice(0,5);if(e!=="data-"&&e!=="aria-"){l.removeAttribute(t);return}}l.setAttribute(t,""+a)}}function Ku(l,t,a){if(a===null)l.removeAttribute(t);else{switch(typeof a){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(t);return}l.setAttribute(t,""+a)}}function Lt(l,t,a,e){if(e===null)l.removeAttribute(a);else{switch(typeof e){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(a);return}l.setAttributeNS(t,a,""+e)}}function pt(l){switch(typeof l){case"bigint":case"boolean":case"number":case"string":case"undefined":return l;case"object":return l;default:return""}}function qf(l){var t=l.type;return(l=l.nodeName)&&l.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function V0(l,t,a){var e=Object.getOwnPropertyDescriptor(l.constructor.prototype,t);if(!l.hasOwnProperty(t)&&typeof e<"u"&&typeof e.get=="function"&&typeof e.set=="function"){var u=e.get,n=e.set;return Object.defineProperty(l,t,{configurable:!0,get:function(){return u.call(this)},set:function(i){a=""+i,n.call(this,i)}}),Object.defineProperty(l,t,{enumerable:e.enumerable}),{getValue:function(){return a},setValue:function(i){a=""+i},stopTracking:function(){l._valueTracker=null,delete l[t]}}}}function oi(l){if(!l._valueTracker){var t=qf(l)?"checked":"value";l._valueTracker=V0(l,t,""+l[t])}}function Bf(l){if(!l)return!1;var t=l._valueTracker;if(!t)return!0;var a=t.getValue(),e="";return l&&(e=qf(l)?l.checked?"true":"false":l.value),l=e,l!==a?(t.setValue(l),!0):!1}function Ju(l){if(l=l||(typeof document<"u"?document:void 0),typeof l>"u")return null;try{return l.activeElement||l.body}catch{return l.body}}var K0=/[\n"\\]/g;function zt(l){return l.replace(K0,function(t){return"\\"+t.charCodeAt(0).toString(16)+" "})}function di(l,t,a,e,u,n,i,c){l.name="",i!=null&&typeof i!="function"&&typeof i!="symbol"&&typeof i!="boolean"?l.type=i:l.removeAttribute("type"),t!=null?i==="number"?(t===0&&l.value===""||l.value!=t)&&(l.value=""+pt(t)):l.value!==""+pt(t)&&(l.value=""+pt(t)):i!=="submit"&&i!=="reset"||l.removeAttribute("value"),t!=null?mi(l,i,pt(t)):a!=null?mi(l,i,pt(a)):e!=null&&l.removeAttribute("value"),u==null&&n!=null&&(l.defaultChecked=!!n),u!=null&&(l.checked=u&&typeof u!="function"&&typeof u!="symbol"),c!=null&&typeof c!="function"&&typeof c!="symbol"&&typeof c!="boolean"?l.name=""+pt(c):l.removeAttribute("name")}function Yf(l,t,a,e,u,n,i,c){if(n!=null&&typeof n!="function"&&typeof n!="symbol"&&typeof n!="boolean"&&(l.type=n),t!=null||a!=null){if(!(n!=="submit"&&n!=="reset"||t!=null)){oi(l);return}a=a!=null?""+pt(a):"",t=t!=null?""+pt(t):a,c||t===l.value||(l.value=t),l.defaultValue=t}e=e??u,e=typeof e!="function"&&typeof e!="symbol"&&!!e,l.checked=c?l.checked:!!e,l.defaultChecked=!!e,i!=null&&typeof i!="function"&&typeof i!="symbol"&&typeof i!="boolean"&&(l.name=i),oi(l)}function mi(l,t,a){t==="number"&&Ju(l.ownerDocument)===l||l.defaultValue===""+a||(l.defaultValue=""+a)}function ee(l,t,a,e){if(l=l.options,t){t={};for(var u=0;u<a.length;u++)t["$"+a[u]]=!0;for(a=0;a<l.length;a++)u=t.hasOwnProperty("$"+l[a].value),l[a].selected!==u&&(l[a].selected=u),u&&e&&(l[a].defaultSelected=!0)}else{for(a=""+pt(a),t=null,u=0;u<l.length;u++){if(l[u].value===a){l[u].selected=!0,e&&(l[u].defaultSelected=!0);return}t!==null||l[u].disabled||(t=l[u])}t!==null&&(t.selected=!0)}}function Gf(l,t,a){if(t!=null&&(t=""+pt(t),t!==l.value&&(l.value=t),a==null)){l.defaultValue!==t&&(l.defaultValue=t);return}l.defaultValue=a!=null?""+pt(a):""}function Qf(l,t,a,e){if(t==null){if(e!=null){if(a!=null)throw Error(r(92));if(Pl(e)){if(1<e.length)throw Error(r(93));e=e[0]}a=e}a==null&&(a=""),t=a}a=pt(t),l.defaultValue=a,e=l.textContent,e===a&&e!==""&&e!==null&&(l.value=e),oi(l)}function ue(l,t){if(t){var a=l.firstChild;if(a&&a===l.lastChild&&a.nodeType===3){a.nodeValue=t;return}}l.textContent=t}var J0=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function Xf(l,t,a){var e=t.indexOf("--")===0;a==null||typeof a=="boolean"||a===""?e?l.setProperty(t,""):t==="float"?l.cssFloat="":l[t]="":e?l.setProperty(t,a):typeof a!="number"||a===0||J0.has(t)?t==="float"?l.cssFloat=a:l[t]=(""+a).trim():l[t]=a+"px"}function Zf(l,t,a){if(t!=null&&typeof t!="object")throw Error(r(62));if(l=l.style,a!=null){for(var e in a)!a.hasOwnProperty(e)||t!=null&&t.hasOwnProperty(e)||(e.indexOf("--")===0?l.setProperty(e,""):e==="float"?l.cssFloat="":l[e]="");for(var u in t)e=t[u],t.hasOwnProperty(u)&&a[u]!==e&&Xf(l,u,e)}else for(var n in t)t.hasOwnProperty(n)&&Xf(l,n,t[n])}function vi(l){if(l.indexOf("-")===-1)return!1;switch(l){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var w0=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),W0=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function wu(l){return W0.test(""+l)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":l}function Vt(){}var yi=null;function ri(l){return l=l.target||l.srcElement||window,l.correspondingUseElement&&(l=l.correspondingUseElement),l.nodeType===3?l.parentNode:l}var ne=null,ie=null;function Lf(l){var t=le(l);if(t&&(l=t.stateNode)){var a=l[et]||null;l:switch(l=t.stateNode,t.type){case"input":if(di(l,a.value,a.defaultValue,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name),t=a.name,a.type==="radio"&&t!=null){for(a=l;a.parentNode;)a=a.parentNode;for(a=a.querySelectorAll('input[name="'+zt(""+t)+'"][type="radio"]'),t=0;t<a.length;t++){var e=a[t];if(e!==l&&e.form===l.form){var u=e[et]||null;if(!u)throw Error(r(90));di(e,u.value,u.defaultValue,u.defaultValue,u.checked,u.defaultChecked,u.type,u.name)}}for(t=0;t<a.length;t++)e=a[t],e.form===l.form&&Bf(e)}break l;case"textarea":Gf(l,a.value,a.defaultValue);break l;case"select":t=a.value,t!=null&&ee(l,!!a.multiple,t,!1)}}}var hi=!1;function Vf(l,t,a){if(hi)return l(t,a);hi=!0;try{var e=l(t);return e}finally{if(hi=!1,(ne!==null||ie!==null)&&(jn(),ne&&(t=ne,l=ie,ie=ne=null,Lf(t),l)))for(t=0;t<l.length;t++)Lf(l[t])}}function we(l,t){var a=l.stateNode;if(a===null)return null;var e=a[et]||null;if(e===null)return null;a=e[t];l:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(e=!e.disabled)||(l=l.type,e=!(l==="button"||l==="input"||l==="select"||l==="textarea")),l=!e;break l;default:l=!1}if(l)return null;if(a&&typeof a!="function")throw Error(r(231,t,typeof a));return a}var Kt=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),gi=!1;if(Kt)try{var We={};Object.defineProperty(We,"passive",{get:function(){gi=!0}}),window.addEventListener("test",We,We),window.removeEventListener("test",We,We)}catch{gi=!1}var fa=null,Si=null,Wu=null;function Kf(){if(Wu)return Wu;var l,t=Si,a=t.length,e,u="value"in fa?fa.value:fa.textContent,n=u.length;for(l=0;l<a&&t[l]===u[l];l++);var i=a-l;for(e=1;e<=i&&t[a-e]===u[n-e];e++);return Wu=u.slice(l,1<e?1-e:void 0)}function $u(l){var t=l.keyCode;return"charCode"in l?(l=l.charCode,l===0&&t===13&&(l=13)):l=t,l===10&&(l=13),32<=l||l===13?l:0}function ku(){return!0}function Jf(){return!1}function ut(l){function t(a,e,u,n,i){this._reactName=a,this._targetInst=u,this.type=e,this.nativeEvent=n,this.target=i,this.currentTarget=null;for(var c in l)l.hasOwnProperty(c)&&(a=l[c],this[c]=a?a(n):n[c]);return this.isDefaultPrevented=(n.defaultPrevented!=null?n.defaultPrevented:n.returnValue===!1)?ku:Jf,this.isPropagationStopped=Jf,this}return R(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var a=this.nativeEvent;a&&(a.preventDefault?a.preventDefault():typeof a.returnValue!="unknown"&&(a.returnValue=!1),this.isDefaultPrevented=ku)},stopPropagation:function(){var a=this.nativeEvent;a&&(a.stopPropagation?a.stopPropagation():typeof a.cancelBubble!="unknown"&&(a.cancelBubble=!0),this.isPropagationStopped=ku)},persist:function(){},isPersistent:ku}),t}var Ra={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(l){return l.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Fu=ut(Ra),$e=R({},Ra,{view:0,detail:0}),$0=ut($e),bi,Ei,ke,Iu=R({},$e,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:zi,button:0,buttons:0,relatedTarget:function(l){return l.relatedTarget===void 0?l.fromElement===l.srcElement?l.toElement:l.fromElement:l.relatedTarget},movementX:function(l){return"movementX"in l?l.movementX:(l!==ke&&(ke&&l.type==="mousemove"?(bi=l.screenX-ke.screenX,Ei=l.screenY-ke.screenY):Ei=bi=0,ke=l),bi)},movementY:function(l){return"movementY"in l?l.movementY:Ei}}),wf=ut(Iu),k0=R({},Iu,{dataTransfer:0}),F0=ut(k0),I0=R({},$e,{relatedTarget:0}),pi=ut(I0),P0=R({},Ra,{animationName:0,elapsedTime:0,pseudoElement:0}),lm=ut(P0),tm=R({},Ra,{clipboardData:function(l){return"clipboardData"in l?l.clipboardData:window.clipboardData}}),am=ut(tm),em=R({},Ra,{data:0}),Wf=ut(em),um={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},nm={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},im={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function cm(l){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(l):(l=im[l])?!!t[l]:!1}function zi(){return cm}var fm=R({},$e,{key:function(l){if(l.key){var t=um[l.key]||l.key;if(t!=="Unidentified")return t}return l.type==="keypress"?(l=$u(l),l===13?"Enter":String.fromCharCode(l)):l.type==="keydown"||l.type==="keyup"?nm[l.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:zi,charCode:function(l){return l.type==="keypress"?$u(l):0},keyCode:function(l){return l.type==="keydown"||l.type==="keyup"?l.keyCode:0},which:function(l){return l.type==="keypress"?$u(l):l.type==="keydown"||l.type==="keyup"?l.keyCode:0}}),sm=ut(fm),om=R({},Iu,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),$f=ut(om),dm=R({},$e,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:zi}),mm=ut(dm),vm=R({},Ra,{propertyName:0,elapsedTime:0,pseudoElement:0}),ym=ut(vm),rm=R({},Iu,{deltaX:function(l){return"deltaX"in l?l.deltaX:"wheelDeltaX"in l?-l.wheelDeltaX:0},deltaY:function(l){return"deltaY"in l?l.deltaY:"wheelDeltaY"in l?-l.wheelDeltaY:"wheelDelta"in l?-l.wheelDelta:0},deltaZ:0,deltaMode:0}),hm=ut(rm),gm=R({},Ra,{newState:0,oldState:0}),Sm=ut(gm),bm=[9,13,27,32],Ti=Kt&&"CompositionEvent"in window,Fe=null;Kt&&"documentMode"in document&&(Fe=document.documentMode);var Em=Kt&&"TextEvent"in window&&!Fe,kf=Kt&&(!Ti||Fe&&8<Fe&&11>=Fe),Ff=" ",If=!1;function Pf(l,t){switch(l){case"keyup":return bm.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function ls(l){return l=l.detail,typeof l=="object"&&"data"in l?l.data:null}var ce=!1;function pm(l,t){switch(l){case"compositionend":return ls(t);case"keypress":return t.which!==32?null:(If=!0,Ff);case"textInput":return l=t.data,l===Ff&&If?null:l;default:return null}}function zm(l,t){if(ce)return l==="compositionend"||!Ti&&Pf(l,t)?(l=Kf(),Wu=Si=fa=null,ce=!1,l):null;switch(l){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return kf&&t.locale!=="ko"?null:t.data;default:return null}}var Tm={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function ts(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t==="input"?!!Tm[l.type]:t==="textarea"}function as(l,t,a,e){ne?ie?ie.push(e):ie=[e]:ne=e,t=Zn(t,"onChange"),0<t.length&&(a=new Fu("onChange","change",null,a,e),l.push({event:a,listeners:t}))}var Ie=null,Pe=null;function Am(l){Gd(l,0)}function Pu(l){var t=Je(l);if(Bf(t))return l}function es(l,t){if(l==="change")return t}var us=!1;if(Kt){var Ai;if(Kt){var _i="oninput"in document;if(!_i){var ns=document.createElement("div");ns.setAttribute("oninput","return;"),_i=typeof ns.oninput=="function"}Ai=_i}else Ai=!1;us=Ai&&(!document.documentMode||9<document.documentMode)}function is(){Ie&&(Ie.detachEvent("onpropertychange",cs),Pe=Ie=null)}function cs(l){if(l.propertyName==="value"&&Pu(Pe)){var t=[];as(t,Pe,l,ri(l)),Vf(Am,t)}}function _m(l,t,a){l==="focusin"?(is(),Ie=t,Pe=a,Ie.attachEvent("onpropertychange",cs)):l==="focusout"&&is()}function Om(l){if(l==="selectionchange"||l==="keyup"||l==="keydown")return Pu(Pe)}function xm(l,t){if(l==="click")return Pu(t)}function Mm(l,t){if(l==="input"||l==="change")return Pu(t)}function Dm(l,t){return l===t&&(l!==0||1/l===1/t)||l!==l&&t!==t}var dt=typeof Object.is=="function"?Object.is:Dm;function lu(l,t){if(dt(l,t))return!0;if(typeof l!="object"||l===null||typeof t!="object"||t===null)return!1;var a=Object.keys(l),e=Object.keys(t);if(a.length!==e.length)return!1;for(e=0;e<a.length;e++){var u=a[e];if(!Ge.call(t,u)||!dt(l[u],t[u]))return!1}return!0}function fs(l){for(;l&&l.firstChild;)l=l.firstChild;return l}function ss(l,t){var a=fs(l);l=0;for(var e;a;){if(a.nodeType===3){if(e=l+a.textContent.length,l<=t&&e>=t)return{node:a,offset:t-l};l=e}l:{for(;a;){if(a.nextSibling){a=a.nextSibling;break l}a=a.parentNode}a=void 0}a=fs(a)}}function os(l,t){return l&&t?l===t?!0:l&&l.nodeType===3?!1:t&&t.nodeType===3?os(l,t.parentNode):"contains"in l?l.contains(t):l.compareDocumentPosition?!!(l.compareDocumentPosition(t)&16):!1:!1}function ds(l){l=l!=null&&l.ownerDocument!=null&&l.ownerDocument.defaultView!=null?l.ownerDocument.defaultView:window;for(var t=Ju(l.document);t instanceof l.HTMLIFrameElement;){try{var a=typeof t.contentWindow.location.href=="string"}catch{a=!1}if(a)l=t.contentWindow;else break;t=Ju(l.document)}return t}function Oi(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t&&(t==="input"&&(l.type==="text"||l.type==="search"||l.type==="tel"||l.type==="url"||l.type==="password")||t==="textarea"||l.contentEditable==="true")}var Nm=Kt&&"documentMode"in document&&11>=document.documentMode,fe=null,xi=null,tu=null,Mi=!1;function ms(l,t,a){var e=a.window===a?a.document:a.nodeType===9?a:a.ownerDocument;Mi||fe==null||fe!==Ju(e)||(e=fe,"selectionStart"in e&&Oi(e)?e={start:e.selectionStart,end:e.selectionEnd}:(e=(e.ownerDocument&&e.ownerDocument.defaultView||window).getSelection(),e={anchorNode:e.anchorNode,anchorOffset:e.anchorOffset,focusNode:e.focusNode,focusOffset:e.focusOffset}),tu&&lu(tu,e)||(tu=e,e=Zn(xi,"onSelect"),0<e.length&&(t=new Fu("onSelect","select",null,t,a),l.push({event:t,listeners:e}),t.target=fe)))}function Ha(l,t){var a={};return a[l.toLowerCase()]=t.toLowerCase(),a["Webkit"+l]="webkit"+t,a["Moz"+l]="moz"+t,a}var se={animationend:Ha("Animation","AnimationEnd"),animationiteration:Ha("Animation","AnimationIteration"),animationstart:Ha("Animation","AnimationStart"),transitionrun:Ha("Transition","TransitionRun"),transitionstart:Ha("Transition","TransitionStart"),transitioncancel:Ha("Transition","TransitionCancel"),transitionend:Ha("Transition","TransitionEnd")},Di={},vs={};Kt&&(vs=document.createElement("div").style,"AnimationEvent"in window||(delete se.animationend.animation,delete se.animationiteration.animation,delete se.animationstart.animation),"TransitionEvent"in window||delete se.transitionend.transition);function ja(l){if(Di[l])return Di[l];if(!se[l])return l;var t=se[l],a;for(a in t)if(t.hasOwnProperty(a)&&a in vs)return Di[l]=t[a];return l}var ys=ja("animationend"),rs=ja("animationiteration"),hs=ja("animationstart"),Um=ja("transitionrun"),Cm=ja("transitionstart"),Rm=ja("transitioncancel"),gs=ja("transitionend"),Ss=new Map,Ni="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");Ni.push("scrollEnd");function Ct(l,t){Ss.set(l,t),Ca(t,[l])}var ln=typeof reportError=="function"?reportError:function(l){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof l=="object"&&l!==null&&typeof l.message=="string"?String(l.message):String(l),error:l});if(!window.dispatchEvent(t))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",l);return}console.error(l)},Tt=[],oe=0,Ui=0;function tn(){for(var l=oe,t=Ui=oe=0;t<l;){var a=Tt[t];Tt[t++]=null;var e=Tt[t];Tt[t++]=null;var u=Tt[t];Tt[t++]=null;var n=Tt[t];if(Tt[t++]=null,e!==null&&u!==null){var i=e.pending;i===null?u.next=u:(u.next=i.next,i.next=u),e.pending=u}n!==0&&bs(a,u,n)}}function an(l,t,a,e){Tt[oe++]=l,Tt[oe++]=t,Tt[oe++]=a,Tt[oe++]=e,Ui|=e,l.lanes|=e,l=l.alternate,l!==null&&(l.lanes|=e)}function Ci(l,t,a,e){return an(l,t,a,e),en(l)}function qa(l,t){return an(l,null,null,t),en(l)}function bs(l,t,a){l.lanes|=a;var e=l.alternate;e!==null&&(e.lanes|=a);for(var u=!1,n=l.return;n!==null;)n.childLanes|=a,e=n.alternate,e!==null&&(e.childLanes|=a),n.tag===22&&(l=n.stateNode,l===null||l._visibility&1||(u=!0)),l=n,n=n.return;return l.tag===3?(n=l.stateNode,u&&t!==null&&(u=31-Bl(a),l=n.hiddenUpdates,e=l[u],e===null?l[u]=[t]:e.push(t),t.lane=a|536870912),n):null}function en(l){if(50<Tu)throw Tu=0,Xc=null,Error(r(185));for(var t=l.return;t!==null;)l=t,t=l.return;return l.tag===3?l.stateNode:null}var de={};function Hm(l,t,a,e){this.tag=l,this.key=a,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=e,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function mt(l,t,a,e){return new Hm(l,t,a,e)}function Ri(l){return l=l.prototype,!(!l||!l.isReactComponent)}function Jt(l,t){var a=l.alternate;return a===null?(a=mt(l.tag,t,l.key,l.mode),a.elementType=l.elementType,a.type=l.type,a.stateNode=l.stateNode,a.alternate=l,l.alternate=a):(a.pendingProps=t,a.type=l.type,a.flags=0,a.subtreeFlags=0,a.deletions=null),a.flags=l.flags&65011712,a.childLanes=l.childLanes,a.lanes=l.lanes,a.child=l.child,a.memoizedProps=l.memoizedProps,a.memoizedState=l.memoizedState,a.updateQueue=l.updateQueue,t=l.dependencies,a.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},a.sibling=l.sibling,a.index=l.index,a.ref=l.ref,a.refCleanup=l.refCleanup,a}function Es(l,t){l.flags&=65011714;var a=l.alternate;return a===null?(l.childLanes=0,l.lanes=t,l.child=null,l.subtreeFlags=0,l.memoizedProps=null,l.memoizedState=null,l.updateQueue=null,l.dependencies=null,l.stateNode=null):(l.childLanes=a.childLanes,l.lanes=a.lanes,l.child=a.child,l.subtreeFlags=0,l.deletions=null,l.memoizedProps=a.memoizedProps,l.memoizedState=a.memoizedState,l.updateQueue=a.updateQueue,l.type=a.type,t=a.dependencies,l.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext}),l}function un(l,t,a,e,u,n){var i=0;if(e=l,typeof l=="function")Ri(l)&&(i=1);else if(typeof l=="string")i=Gv(l,a,D.current)?26:l==="html"||l==="head"||l==="body"?27:5;else l:switch(l){case ot:return l=mt(31,a,t,u),l.elementType=ot,l.lanes=n,l;case Ql:return Ba(a.children,u,n,t);case Ut:i=8,u|=24;break;case Il:return l=mt(12,a,t,u|2),l.elementType=Il,l.lanes=n,l;case bt:return l=mt(13,a,t,u),l.elementType=bt,l.lanes=n,l;case Xl:return l=mt(19,a,t,u),l.elementType=Xl,l.lanes=n,l;default:if(typeof l=="object"&&l!==null)switch(l.$$typeof){case Hl:i=10;break l;case St:i=9;break l;case tt:i=11;break l;case K:i=14;break l;case $l:i=16,e=null;break l}i=29,a=Error(r(130,l===null?"null":typeof l,"")),e=null}return t=mt(i,a,t,u),t.elementType=l,t.type=e,t.lanes=n,t}function Ba(l,t,a,e){return l=mt(7,l,e,t),l.lanes=a,l}function Hi(l,t,a){return l=mt(6,l,null,t),l.lanes=a,l}function ps(l){var t=mt(18,null,null,0);return t.stateNode=l,t}function ji(l,t,a){return t=mt(4,l.children!==null?l.children:[],l.key,t),t.lanes=a,t.stateNode={containerInfo:l.containerInfo,pendingChildren:null,implementation:l.implementation},t}var zs=new WeakMap;function At(l,t){if(typeof l=="object"&&l!==null){var a=zs.get(l);return a!==void 0?a:(t={value:l,source:t,stack:Yu(t)},zs.set(l,t),t)}return{value:l,source:t,stack:Yu(t)}}var me=[],ve=0,nn=null,au=0,_t=[],Ot=0,sa=null,qt=1,Bt="";function wt(l,t){me[ve++]=au,me[ve++]=nn,nn=l,au=t}function Ts(l,t,a){_t[Ot++]=qt,_t[Ot++]=Bt,_t[Ot++]=sa,sa=l;var e=qt;l=Bt;var u=32-Bl(e)-1;e&=~(1<<u),a+=1;var n=32-Bl(t)+u;if(30<n){var i=u-u%5;n=(e&(1<<i)-1).toString(32),e>>=i,u-=i,qt=1<<32-Bl(t)+u|a<<u|e,Bt=n+l}else qt=1<<n|a<<u|e,Bt=l}function qi(l){l.return!==null&&(wt(l,1),Ts(l,1,0))}function Bi(l){for(;l===nn;)nn=me[--ve],me[ve]=null,au=me[--ve],me[ve]=null;for(;l===sa;)sa=_t[--Ot],_t[Ot]=null,Bt=_t[--Ot],_t[Ot]=null,qt=_t[--Ot],_t[Ot]=null}function As(l,t){_t[Ot++]=qt,_t[Ot++]=Bt,_t[Ot++]=sa,qt=t.id,Bt=t.overflow,sa=l}var Vl=null,Sl=null,F=!1,oa=null,xt=!1,Yi=Error(r(519));function da(l){var t=Error(r(418,1<arguments.length&&arguments[1]!==void 0&&arguments[1]?"text":"HTML",""));throw eu(At(t,l)),Yi}function _s(l){var t=l.stateNode,a=l.type,e=l.memoizedProps;switch(t[Ll]=l,t[et]=e,a){case"dialog":w("cancel",t),w("close",t);break;case"iframe":case"object":case"embed":w("load",t);break;case"video":case"audio":for(a=0;a<_u.length;a++)w(_u[a],t);break;case"source":w("error",t);break;case"img":case"image":case"link":w("error",t),w("load",t);break;case"details":w("toggle",t);break;case"input":w("invalid",t),Yf(t,e.value,e.defaultValue,e.checked,e.defaultChecked,e.type,e.name,!0);break;case"select":w("invalid",t);break;case"textarea":w("invalid",t),Qf(t,e.value,e.defaultValue,e.children)}a=e.children,typeof a!="string"&&typeof a!="number"&&typeof a!="bigint"||t.textContent===""+a||e.suppressHydrationWarning===!0||Ld(t.textContent,a)?(e.popover!=null&&(w("beforetoggle",t),w("toggle",t)),e.onScroll!=null&&w("scroll",t),e.onScrollEnd!=null&&w("scrollend",t),e.onClick!=null&&(t.onclick=Vt),t=!0):t=!1,t||da(l,!0)}function Os(l){for(Vl=l.return;Vl;)switch(Vl.tag){case 5:case 31:case 13:xt=!1;return;case 27:case 3:xt=!0;return;default:Vl=Vl.return}}function ye(l){if(l!==Vl)return!1;if(!F)return Os(l),F=!0,!1;var t=l.tag,a;if((a=t!==3&&t!==27)&&((a=t===5)&&(a=l.type,a=!(a!=="form"&&a!=="button")||af(l.type,l.memoizedProps)),a=!a),a&&Sl&&da(l),Os(l),t===13){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(r(317));Sl=Id(l)}else if(t===31){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(r(317));Sl=Id(l)}else t===27?(t=Sl,_a(l.type)?(l=ff,ff=null,Sl=l):Sl=t):Sl=Vl?Dt(l.stateNode.nextSibling):null;return!0}function Ya(){Sl=Vl=null,F=!1}function Gi(){var l=oa;return l!==null&&(ft===null?ft=l:ft.push.apply(ft,l),oa=null),l}function eu(l){oa===null?oa=[l]:oa.push(l)}var Qi=o(null),Ga=null,Wt=null;function ma(l,t,a){_(Qi,t._currentValue),t._currentValue=a}function $t(l){l._currentValue=Qi.current,p(Qi)}function Xi(l,t,a){for(;l!==null;){var e=l.alternate;if((l.childLanes&t)!==t?(l.childLanes|=t,e!==null&&(e.childLanes|=t)):e!==null&&(e.childLanes&t)!==t&&(e.childLanes|=t),l===a)break;l=l.return}}function Zi(l,t,a,e){var u=l.child;for(u!==null&&(u.return=l);u!==null;){var n=u.dependencies;if(n!==null){var i=u.child;n=n.firstContext;l:for(;n!==null;){var c=n;n=u;for(var f=0;f<t.length;f++)if(c.context===t[f]){n.lanes|=a,c=n.alternate,c!==null&&(c.lanes|=a),Xi(n.return,a,l),e||(i=null);break l}n=c.next}}else if(u.tag===18){if(i=u.return,i===null)throw Error(r(341));i.lanes|=a,n=i.alternate,n!==null&&(n.lanes|=a),Xi(i,a,l),i=null}else i=u.child;if(i!==null)i.return=u;else for(i=u;i!==null;){if(i===l){i=null;break}if(u=i.sibling,u!==null){u.return=i.return,i=u;break}i=i.return}u=i}}function re(l,t,a,e){l=null;for(var u=t,n=!1;u!==null;){if(!n){if((u.flags&524288)!==0)n=!0;else if((u.flags&262144)!==0)break}if(u.tag===10){var i=u.alternate;if(i===null)throw Error(r(387));if(i=i.memoizedProps,i!==null){var c=u.type;dt(u.pendingProps.value,i.value)||(l!==null?l.push(c):l=[c])}}else if(u===tl.current){if(i=u.alternate,i===null)throw Error(r(387));i.memoizedState.memoizedState!==u.memoizedState.memoizedState&&(l!==null?l.push(Nu):l=[Nu])}u=u.return}l!==null&&Zi(t,l,a,e),t.flags|=262144}function cn(l){for(l=l.firstContext;l!==null;){if(!dt(l.context._currentValue,l.memoizedValue))return!0;l=l.next}return!1}function Qa(l){Ga=l,Wt=null,l=l.dependencies,l!==null&&(l.firstContext=null)}function Kl(l){return xs(Ga,l)}function fn(l,t){return Ga===null&&Qa(l),xs(l,t)}function xs(l,t){var a=t._currentValue;if(t={context:t,memoizedValue:a,next:null},Wt===null){if(l===null)throw Error(r(308));Wt=t,l.dependencies={lanes:0,firstContext:t},l.flags|=524288}else Wt=Wt.next=t;return a}var jm=typeof AbortController<"u"?AbortController:function(){var l=[],t=this.signal={aborted:!1,addEventListener:function(a,e){l.push(e)}};this.abort=function(){t.aborted=!0,l.forEach(function(a){return a()})}},qm=x.unstable_scheduleCallback,Bm=x.unstable_NormalPriority,Nl={$$typeof:Hl,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function Li(){return{controller:new jm,data:new Map,refCount:0}}function uu(l){l.refCount--,l.refCount===0&&qm(Bm,function(){l.controller.abort()})}var nu=null,Vi=0,he=0,ge=null;function Ym(l,t){if(nu===null){var a=nu=[];Vi=0,he=wc(),ge={status:"pending",value:void 0,then:function(e){a.push(e)}}}return Vi++,t.then(Ms,Ms),t}function Ms(){if(--Vi===0&&nu!==null){ge!==null&&(ge.status="fulfilled");var l=nu;nu=null,he=0,ge=null;for(var t=0;t<l.length;t++)(0,l[t])()}}function Gm(l,t){var a=[],e={status:"pending",value:null,reason:null,then:function(u){a.push(u)}};return l.then(function(){e.status="fulfilled",e.value=t;for(var u=0;u<a.length;u++)(0,a[u])(t)},function(u){for(e.status="rejected",e.reason=u,u=0;u<a.length;u++)(0,a[u])(void 0)}),e}var Ds=g.S;g.S=function(l,t){vd=Zl(),typeof t=="object"&&t!==null&&typeof t.then=="function"&&Ym(l,t),Ds!==null&&Ds(l,t)};var Xa=o(null);function Ki(){var l=Xa.current;return l!==null?l:yl.pooledCache}function sn(l,t){t===null?_(Xa,Xa.current):_(Xa,t.pool)}function Ns(){var l=Ki();return l===null?null:{parent:Nl._currentValue,pool:l}}var Se=Error(r(460)),Ji=Error(r(474)),on=Error(r(542)),dn={then:function(){}};function Us(l){return l=l.status,l==="fulfilled"||l==="rejected"}function Cs(l,t,a){switch(a=l[a],a===void 0?l.push(t):a!==t&&(t.then(Vt,Vt),t=a),t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,Hs(l),l;default:if(typeof t.status=="string")t.then(Vt,Vt);else{if(l=yl,l!==null&&100<l.shellSuspendCounter)throw Error(r(482));l=t,l.status="pending",l.then(function(e){if(t.status==="pending"){var u=t;u.status="fulfilled",u.value=e}},function(e){if(t.status==="pending"){var u=t;u.status="rejected",u.reason=e}})}switch(t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,Hs(l),l}throw La=t,Se}}function Za(l){try{var t=l._init;return t(l._payload)}catch(a){throw a!==null&&typeof a=="object"&&typeof a.then=="function"?(La=a,Se):a}}var La=null;function Rs(){if(La===null)throw Error(r(459));var l=La;return La=null,l}function Hs(l){if(l===Se||l===on)throw Error(r(483))}var be=null,iu=0;function mn(l){var t=iu;return iu+=1,be===null&&(be=[]),Cs(be,l,t)}function cu(l,t){t=t.props.ref,l.ref=t!==void 0?t:null}function vn(l,t){throw t.$$typeof===nl?Error(r(525)):(l=Object.prototype.toString.call(t),Error(r(31,l==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":l)))}function js(l){function t(d,s){if(l){var m=d.deletions;m===null?(d.deletions=[s],d.flags|=16):m.push(s)}}function a(d,s){if(!l)return null;for(;s!==null;)t(d,s),s=s.sibling;return null}function e(d){for(var s=new Map;d!==null;)d.key!==null?s.set(d.key,d):s.set(d.index,d),d=d.sibling;return s}function u(d,s){return d=Jt(d,s),d.index=0,d.sibling=null,d}function n(d,s,m){return d.index=m,l?(m=d.alternate,m!==null?(m=m.index,m<s?(d.flags|=67108866,s):m):(d.flags|=67108866,s)):(d.flags|=1048576,s)}function i(d){return l&&d.alternate===null&&(d.flags|=67108866),d}function c(d,s,m,b){return s===null||s.tag!==6?(s=Hi(m,d.mode,b),s.return=d,s):(s=u(s,m),s.return=d,s)}function f(d,s,m,b){var H=m.type;return H===Ql?S(d,s,m.props.children,b,m.key):s!==null&&(s.elementType===H||typeof H=="object"&&H!==null&&H.$$typeof===$l&&Za(H)===s.type)?(s=u(s,m.props),cu(s,m),s.return=d,s):(s=un(m.type,m.key,m.props,null,d.mode,b),cu(s,m),s.return=d,s)}function v(d,s,m,b){return s===null||s.tag!==4||s.stateNode.containerInfo!==m.containerInfo||s.stateNode.implementation!==m.implementation?(s=ji(m,d.mode,b),s.return=d,s):(s=u(s,m.children||[]),s.return=d,s)}function S(d,s,m,b,H){return s===null||s.tag!==7?(s=Ba(m,d.mode,b,H),s.return=d,s):(s=u(s,m),s.return=d,s)}function E(d,s,m){if(typeof s=="string"&&s!==""||typeof s=="number"||typeof s=="bigint")return s=Hi(""+s,d.mode,m),s.return=d,s;if(typeof s=="object"&&s!==null){switch(s.$$typeof){case Fl:return m=un(s.type,s.key,s.props,null,d.mode,m),cu(m,s),m.return=d,m;case Wl:return s=ji(s,d.mode,m),s.return=d,s;case $l:return s=Za(s),E(d,s,m)}if(Pl(s)||zl(s))return s=Ba(s,d.mode,m,null),s.return=d,s;if(typeof s.then=="function")return E(d,mn(s),m);if(s.$$typeof===Hl)return E(d,fn(d,s),m);vn(d,s)}return null}function y(d,s,m,b){var H=s!==null?s.key:null;if(typeof m=="string"&&m!==""||typeof m=="number"||typeof m=="bigint")return H!==null?null:c(d,s,""+m,b);if(typeof m=="object"&&m!==null){switch(m.$$typeof){case Fl:return m.key===H?f(d,s,m,b):null;case Wl:return m.key===H?v(d,s,m,b):null;case $l:return m=Za(m),y(d,s,m,b)}if(Pl(m)||zl(m))return H!==null?null:S(d,s,m,b,null);if(typeof m.then=="function")return y(d,s,mn(m),b);if(m.$$typeof===Hl)return y(d,s,fn(d,m),b);vn(d,m)}return null}function h(d,s,m,b,H){if(typeof b=="string"&&b!==""||typeof b=="number"||typeof b=="bigint")return d=d.get(m)||null,c(s,d,""+b,H);if(typeof b=="object"&&b!==null){switch(b.$$typeof){case Fl:return d=d.get(b.key===null?m:b.key)||null,f(s,d,b,H);case Wl:return d=d.get(b.key===null?m:b.key)||null,v(s,d,b,H);case $l:return b=Za(b),h(d,s,m,b,H)}if(Pl(b)||zl(b))return d=d.get(m)||null,S(s,d,b,H,null);if(typeof b.then=="function")return h(d,s,m,mn(b),H);if(b.$$typeof===Hl)return h(d,s,m,fn(s,b),H);vn(s,b)}return null}function M(d,s,m,b){for(var H=null,al=null,N=s,Z=s=0,$=null;N!==null&&Z<m.length;Z++){N.index>Z?($=N,N=null):$=N.sibling;var el=y(d,N,m[Z],b);if(el===null){N===null&&(N=$);break}l&&N&&el.alternate===null&&t(d,N),s=n(el,s,Z),al===null?H=el:al.sibling=el,al=el,N=$}if(Z===m.length)return a(d,N),F&&wt(d,Z),H;if(N===null){for(;Z<m.length;Z++)N=E(d,m[Z],b),N!==null&&(s=n(N,s,Z),al===null?H=N:al.sibling=N,al=N);return F&&wt(d,Z),H}for(N=e(N);Z<m.length;Z++)$=h(N,d,Z,m[Z],b),$!==null&&(l&&$.alternate!==null&&N.delete($.key===null?Z:$.key),s=n($,s,Z),al===null?H=$:al.sibling=$,al=$);return l&&N.forEach(function(Na){return t(d,Na)}),F&&wt(d,Z),H}function q(d,s,m,b){if(m==null)throw Error(r(151));for(var H=null,al=null,N=s,Z=s=0,$=null,el=m.next();N!==null&&!el.done;Z++,el=m.next()){N.index>Z?($=N,N=null):$=N.sibling;var Na=y(d,N,el.value,b);if(Na===null){N===null&&(N=$);break}l&&N&&Na.alternate===null&&t(d,N),s=n(Na,s,Z),al===null?H=Na:al.sibling=Na,al=Na,N=$}if(el.done)return a(d,N),F&&wt(d,Z),H;if(N===null){for(;!el.done;Z++,el=m.next())el=E(d,el.value,b),el!==null&&(s=n(el,s,Z),al===null?H=el:al.sibling=el,al=el);return F&&wt(d,Z),H}for(N=e(N);!el.done;Z++,el=m.next())el=h(N,d,Z,el.value,b),el!==null&&(l&&el.alternate!==null&&N.delete(el.key===null?Z:el.key),s=n(el,s,Z),al===null?H=el:al.sibling=el,al=el);return l&&N.forEach(function(kv){return t(d,kv)}),F&&wt(d,Z),H}function vl(d,s,m,b){if(typeof m=="object"&&m!==null&&m.type===Ql&&m.key===null&&(m=m.props.children),typeof m=="object"&&m!==null){switch(m.$$typeof){case Fl:l:{for(var H=m.key;s!==null;){if(s.key===H){if(H=m.type,H===Ql){if(s.tag===7){a(d,s.sibling),b=u(s,m.props.children),b.return=d,d=b;break l}}else if(s.elementType===H||typeof H=="object"&&H!==null&&H.$$typeof===$l&&Za(H)===s.type){a(d,s.sibling),b=u(s,m.props),cu(b,m),b.return=d,d=b;break l}a(d,s);break}else t(d,s);s=s.sibling}m.type===Ql?(b=Ba(m.props.children,d.mode,b,m.key),b.return=d,d=b):(b=un(m.type,m.key,m.props,null,d.mode,b),cu(b,m),b.return=d,d=b)}return i(d);case Wl:l:{for(H=m.key;s!==null;){if(s.key===H)if(s.tag===4&&s.stateNode.containerInfo===m.containerInfo&&s.stateNode.implementation===m.implementation){a(d,s.sibling),b=u(s,m.children||[]),b.return=d,d=b;break l}else{a(d,s);break}else t(d,s);s=s.sibling}b=ji(m,d.mode,b),b.return=d,d=b}return i(d);case $l:return m=Za(m),vl(d,s,m,b)}if(Pl(m))return M(d,s,m,b);if(zl(m)){if(H=zl(m),typeof H!="function")throw Error(r(150));return m=H.call(m),q(d,s,m,b)}if(typeof m.then=="function")return vl(d,s,mn(m),b);if(m.$$typeof===Hl)return vl(d,s,fn(d,m),b);vn(d,m)}return typeof m=="string"&&m!==""||typeof m=="number"||typeof m=="bigint"?(m=""+m,s!==null&&s.tag===6?(a(d,s.sibling),b=u(s,m),b.return=d,d=b):(a(d,s),b=Hi(m,d.mode,b),b.return=d,d=b),i(d)):a(d,s)}return function(d,s,m,b){try{iu=0;var H=vl(d,s,m,b);return be=null,H}catch(N){if(N===Se||N===on)throw N;var al=mt(29,N,null,d.mode);return al.lanes=b,al.return=d,al}finally{}}}var Va=js(!0),qs=js(!1),va=!1;function wi(l){l.updateQueue={baseState:l.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function Wi(l,t){l=l.updateQueue,t.updateQueue===l&&(t.updateQueue={baseState:l.baseState,firstBaseUpdate:l.firstBaseUpdate,lastBaseUpdate:l.lastBaseUpdate,shared:l.shared,callbacks:null})}function ya(l){return{lane:l,tag:0,payload:null,callback:null,next:null}}function ra(l,t,a){var e=l.updateQueue;if(e===null)return null;if(e=e.shared,(ul&2)!==0){var u=e.pending;return u===null?t.next=t:(t.next=u.next,u.next=t),e.pending=t,t=en(l),bs(l,null,a),t}return an(l,e,t,a),en(l)}function fu(l,t,a){if(t=t.updateQueue,t!==null&&(t=t.shared,(a&4194048)!==0)){var e=t.lanes;e&=l.pendingLanes,a|=e,t.lanes=a,xf(l,a)}}function $i(l,t){var a=l.updateQueue,e=l.alternate;if(e!==null&&(e=e.updateQueue,a===e)){var u=null,n=null;if(a=a.firstBaseUpdate,a!==null){do{var i={lane:a.lane,tag:a.tag,payload:a.payload,callback:null,next:null};n===null?u=n=i:n=n.next=i,a=a.next}while(a!==null);n===null?u=n=t:n=n.next=t}else u=n=t;a={baseState:e.baseState,firstBaseUpdate:u,lastBaseUpdate:n,shared:e.shared,callbacks:e.callbacks},l.updateQueue=a;return}l=a.lastBaseUpdate,l===null?a.firstBaseUpdate=t:l.next=t,a.lastBaseUpdate=t}var ki=!1;function su(){if(ki){var l=ge;if(l!==null)throw l}}function ou(l,t,a,e){ki=!1;var u=l.updateQueue;va=!1;var n=u.firstBaseUpdate,i=u.lastBaseUpdate,c=u.shared.pending;if(c!==null){u.shared.pending=null;var f=c,v=f.next;f.next=null,i===null?n=v:i.next=v,i=f;var S=l.alternate;S!==null&&(S=S.updateQueue,c=S.lastBaseUpdate,c!==i&&(c===null?S.firstBaseUpdate=v:c.next=v,S.lastBaseUpdate=f))}if(n!==null){var E=u.baseState;i=0,S=v=f=null,c=n;do{var y=c.lane&-536870913,h=y!==c.lane;if(h?(W&y)===y:(e&y)===y){y!==0&&y===he&&(ki=!0),S!==null&&(S=S.next={lane:0,tag:c.tag,payload:c.payload,callback:null,next:null});l:{var M=l,q=c;y=t;var vl=a;switch(q.tag){case 1:if(M=q.payload,typeof M=="function"){E=M.call(vl,E,y);break l}E=M;break l;case 3:M.flags=M.flags&-65537|128;case 0:if(M=q.payload,y=typeof M=="function"?M.call(vl,E,y):M,y==null)break l;E=R({},E,y);break l;case 2:va=!0}}y=c.callback,y!==null&&(l.flags|=64,h&&(l.flags|=8192),h=u.callbacks,h===null?u.callbacks=[y]:h.push(y))}else h={lane:y,tag:c.tag,payload:c.payload,callback:c.callback,next:null},S===null?(v=S=h,f=E):S=S.next=h,i|=y;if(c=c.next,c===null){if(c=u.shared.pending,c===null)break;h=c,c=h.next,h.next=null,u.lastBaseUpdate=h,u.shared.pending=null}}while(!0);S===null&&(f=E),u.baseState=f,u.firstBaseUpdate=v,u.lastBaseUpdate=S,n===null&&(u.shared.lanes=0),Ea|=i,l.lanes=i,l.memoizedState=E}}function Bs(l,t){if(typeof l!="function")throw Error(r(191,l));l.call(t)}function Ys(l,t){var a=l.callbacks;if(a!==null)for(l.callbacks=null,l=0;l<a.length;l++)Bs(a[l],t)}var Ee=o(null),yn=o(0);function Gs(l,t){l=ua,_(yn,l),_(Ee,t),ua=l|t.baseLanes}function Fi(){_(yn,ua),_(Ee,Ee.current)}function Ii(){ua=yn.current,p(Ee),p(yn)}var vt=o(null),Mt=null;function ha(l){var t=l.alternate;_(Ml,Ml.current&1),_(vt,l),Mt===null&&(t===null||Ee.current!==null||t.memoizedState!==null)&&(Mt=l)}function Pi(l){_(Ml,Ml.current),_(vt,l),Mt===null&&(Mt=l)}function Qs(l){l.tag===22?(_(Ml,Ml.current),_(vt,l),Mt===null&&(Mt=l)):ga()}function ga(){_(Ml,Ml.current),_(vt,vt.current)}function yt(l){p(vt),Mt===l&&(Mt=null),p(Ml)}var Ml=o(0);function rn(l){for(var t=l;t!==null;){if(t.tag===13){var a=t.memoizedState;if(a!==null&&(a=a.dehydrated,a===null||nf(a)||cf(a)))return t}else if(t.tag===19&&(t.memoizedProps.revealOrder==="forwards"||t.memoizedProps.revealOrder==="backwards"||t.memoizedProps.revealOrder==="unstable_legacy-backwards"||t.memoizedProps.revealOrder==="together")){if((t.flags&128)!==0)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var kt=0,X=null,dl=null,Ul=null,hn=!1,pe=!1,Ka=!1,gn=0,du=0,ze=null,Qm=0;function _l(){throw Error(r(321))}function lc(l,t){if(t===null)return!1;for(var a=0;a<t.length&&a<l.length;a++)if(!dt(l[a],t[a]))return!1;return!0}function tc(l,t,a,e,u,n){return kt=n,X=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,g.H=l===null||l.memoizedState===null?Ao:hc,Ka=!1,n=a(e,u),Ka=!1,pe&&(n=Zs(t,a,e,u)),Xs(l),n}function Xs(l){g.H=yu;var t=dl!==null&&dl.next!==null;if(kt=0,Ul=dl=X=null,hn=!1,du=0,ze=null,t)throw Error(r(300));l===null||Cl||(l=l.dependencies,l!==null&&cn(l)&&(Cl=!0))}function Zs(l,t,a,e){X=l;var u=0;do{if(pe&&(ze=null),du=0,pe=!1,25<=u)throw Error(r(301));if(u+=1,Ul=dl=null,l.updateQueue!=null){var n=l.updateQueue;n.lastEffect=null,n.events=null,n.stores=null,n.memoCache!=null&&(n.memoCache.index=0)}g.H=_o,n=t(a,e)}while(pe);return n}function Xm(){var l=g.H,t=l.useState()[0];return t=typeof t.then=="function"?mu(t):t,l=l.useState()[0],(dl!==null?dl.memoizedState:null)!==l&&(X.flags|=1024),t}function ac(){var l=gn!==0;return gn=0,l}function ec(l,t,a){t.updateQueue=l.updateQueue,t.flags&=-2053,l.lanes&=~a}function uc(l){if(hn){for(l=l.memoizedState;l!==null;){var t=l.queue;t!==null&&(t.pending=null),l=l.next}hn=!1}kt=0,Ul=dl=X=null,pe=!1,du=gn=0,ze=null}function lt(){var l={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return Ul===null?X.memoizedState=Ul=l:Ul=Ul.next=l,Ul}function Dl(){if(dl===null){var l=X.alternate;l=l!==null?l.memoizedState:null}else l=dl.next;var t=Ul===null?X.memoizedState:Ul.next;if(t!==null)Ul=t,dl=l;else{if(l===null)throw X.alternate===null?Error(r(467)):Error(r(310));dl=l,l={memoizedState:dl.memoizedState,baseState:dl.baseState,baseQueue:dl.baseQueue,queue:dl.queue,next:null},Ul===null?X.memoizedState=Ul=l:Ul=Ul.next=l}return Ul}function Sn(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function mu(l){var t=du;return du+=1,ze===null&&(ze=[]),l=Cs(ze,l,t),t=X,(Ul===null?t.memoizedState:Ul.next)===null&&(t=t.alternate,g.H=t===null||t.memoizedState===null?Ao:hc),l}function bn(l){if(l!==null&&typeof l=="object"){if(typeof l.then=="function")return mu(l);if(l.$$typeof===Hl)return Kl(l)}throw Error(r(438,String(l)))}function nc(l){var t=null,a=X.updateQueue;if(a!==null&&(t=a.memoCache),t==null){var e=X.alternate;e!==null&&(e=e.updateQueue,e!==null&&(e=e.memoCache,e!=null&&(t={data:e.data.map(function(u){return u.slice()}),index:0})))}if(t==null&&(t={data:[],index:0}),a===null&&(a=Sn(),X.updateQueue=a),a.memoCache=t,a=t.data[t.index],a===void 0)for(a=t.data[t.index]=Array(l),e=0;e<l;e++)a[e]=Qt;return t.index++,a}function Ft(l,t){return typeof t=="function"?t(l):t}function En(l){var t=Dl();return ic(t,dl,l)}function ic(l,t,a){var e=l.queue;if(e===null)throw Error(r(311));e.lastRenderedReducer=a;var u=l.baseQueue,n=e.pending;if(n!==null){if(u!==null){var i=u.next;u.next=n.next,n.next=i}t.baseQueue=u=n,e.pending=null}if(n=l.baseState,u===null)l.memoizedState=n;else{t=u.next;var c=i=null,f=null,v=t,S=!1;do{var E=v.lane&-536870913;if(E!==v.lane?(W&E)===E:(kt&E)===E){var y=v.revertLane;if(y===0)f!==null&&(f=f.next={lane:0,revertLane:0,gesture:null,action:v.action,hasEagerState:v.hasEagerState,eagerState:v.eagerState,next:null}),E===he&&(S=!0);else if((kt&y)===y){v=v.next,y===he&&(S=!0);continue}else E={lane:0,revertLane:v.revertLane,gesture:null,action:v.action,hasEagerState:v.hasEagerState,eagerState:v.eagerState,next:null},f===null?(c=f=E,i=n):f=f.next=E,X.lanes|=y,Ea|=y;E=v.action,Ka&&a(n,E),n=v.hasEagerState?v.eagerState:a(n,E)}else y={lane:E,revertLane:v.revertLane,gesture:v.gesture,action:v.action,hasEagerState:v.hasEagerState,eagerState:v.eagerState,next:null},f===null?(c=f=y,i=n):f=f.next=y,X.lanes|=E,Ea|=E;v=v.next}while(v!==null&&v!==t);if(f===null?i=n:f.next=c,!dt(n,l.memoizedState)&&(Cl=!0,S&&(a=ge,a!==null)))throw a;l.memoizedState=n,l.baseState=i,l.baseQueue=f,e.lastRenderedState=n}return u===null&&(e.lanes=0),[l.memoizedState,e.dispatch]}function cc(l){var t=Dl(),a=t.queue;if(a===null)throw Error(r(311));a.lastRenderedReducer=l;var e=a.dispatch,u=a.pending,n=t.memoizedState;if(u!==null){a.pending=null;var i=u=u.next;do n=l(n,i.action),i=i.next;while(i!==u);dt(n,t.memoizedState)||(Cl=!0),t.memoizedState=n,t.baseQueue===null&&(t.baseState=n),a.lastRenderedState=n}return[n,e]}function Ls(l,t,a){var e=X,u=Dl(),n=F;if(n){if(a===void 0)throw Error(r(407));a=a()}else a=t();var i=!dt((dl||u).memoizedState,a);if(i&&(u.memoizedState=a,Cl=!0),u=u.queue,oc(Js.bind(null,e,u,l),[l]),u.getSnapshot!==t||i||Ul!==null&&Ul.memoizedState.tag&1){if(e.flags|=2048,Te(9,{destroy:void 0},Ks.bind(null,e,u,a,t),null),yl===null)throw Error(r(349));n||(kt&127)!==0||Vs(e,t,a)}return a}function Vs(l,t,a){l.flags|=16384,l={getSnapshot:t,value:a},t=X.updateQueue,t===null?(t=Sn(),X.updateQueue=t,t.stores=[l]):(a=t.stores,a===null?t.stores=[l]:a.push(l))}function Ks(l,t,a,e){t.value=a,t.getSnapshot=e,ws(t)&&Ws(l)}function Js(l,t,a){return a(function(){ws(t)&&Ws(l)})}function ws(l){var t=l.getSnapshot;l=l.value;try{var a=t();return!dt(l,a)}catch{return!0}}function Ws(l){var t=qa(l,2);t!==null&&st(t,l,2)}function fc(l){var t=lt();if(typeof l=="function"){var a=l;if(l=a(),Ka){jt(!0);try{a()}finally{jt(!1)}}}return t.memoizedState=t.baseState=l,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Ft,lastRenderedState:l},t}function $s(l,t,a,e){return l.baseState=a,ic(l,dl,typeof e=="function"?e:Ft)}function Zm(l,t,a,e,u){if(Tn(l))throw Error(r(485));if(l=t.action,l!==null){var n={payload:u,action:l,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(i){n.listeners.push(i)}};g.T!==null?a(!0):n.isTransition=!1,e(n),a=t.pending,a===null?(n.next=t.pending=n,ks(t,n)):(n.next=a.next,t.pending=a.next=n)}}function ks(l,t){var a=t.action,e=t.payload,u=l.state;if(t.isTransition){var n=g.T,i={};g.T=i;try{var c=a(u,e),f=g.S;f!==null&&f(i,c),Fs(l,t,c)}catch(v){sc(l,t,v)}finally{n!==null&&i.types!==null&&(n.types=i.types),g.T=n}}else try{n=a(u,e),Fs(l,t,n)}catch(v){sc(l,t,v)}}function Fs(l,t,a){a!==null&&typeof a=="object"&&typeof a.then=="function"?a.then(function(e){Is(l,t,e)},function(e){return sc(l,t,e)}):Is(l,t,a)}function Is(l,t,a){t.status="fulfilled",t.value=a,Ps(t),l.state=a,t=l.pending,t!==null&&(a=t.next,a===t?l.pending=null:(a=a.next,t.next=a,ks(l,a)))}function sc(l,t,a){var e=l.pending;if(l.pending=null,e!==null){e=e.next;do t.status="rejected",t.reason=a,Ps(t),t=t.next;while(t!==e)}l.action=null}function Ps(l){l=l.listeners;for(var t=0;t<l.length;t++)(0,l[t])()}function lo(l,t){return t}function to(l,t){if(F){var a=yl.formState;if(a!==null){l:{var e=X;if(F){if(Sl){t:{for(var u=Sl,n=xt;u.nodeType!==8;){if(!n){u=null;break t}if(u=Dt(u.nextSibling),u===null){u=null;break t}}n=u.data,u=n==="F!"||n==="F"?u:null}if(u){Sl=Dt(u.nextSibling),e=u.data==="F!";break l}}da(e)}e=!1}e&&(t=a[0])}}return a=lt(),a.memoizedState=a.baseState=t,e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:lo,lastRenderedState:t},a.queue=e,a=po.bind(null,X,e),e.dispatch=a,e=fc(!1),n=rc.bind(null,X,!1,e.queue),e=lt(),u={state:t,dispatch:null,action:l,pending:null},e.queue=u,a=Zm.bind(null,X,u,n,a),u.dispatch=a,e.memoizedState=l,[t,a,!1]}function ao(l){var t=Dl();return eo(t,dl,l)}function eo(l,t,a){if(t=ic(l,t,lo)[0],l=En(Ft)[0],typeof t=="object"&&t!==null&&typeof t.then=="function")try{var e=mu(t)}catch(i){throw i===Se?on:i}else e=t;t=Dl();var u=t.queue,n=u.dispatch;return a!==t.memoizedState&&(X.flags|=2048,Te(9,{destroy:void 0},Lm.bind(null,u,a),null)),[e,n,l]}function Lm(l,t){l.action=t}function uo(l){var t=Dl(),a=dl;if(a!==null)return eo(t,a,l);Dl(),t=t.memoizedState,a=Dl();var e=a.queue.dispatch;return a.memoizedState=l,[t,e,!1]}function Te(l,t,a,e){return l={tag:l,create:a,deps:e,inst:t,next:null},t=X.updateQueue,t===null&&(t=Sn(),X.updateQueue=t),a=t.lastEffect,a===null?t.lastEffect=l.next=l:(e=a.next,a.next=l,l.next=e,t.lastEffect=l),l}function no(){return Dl().memoizedState}function pn(l,t,a,e){var u=lt();X.flags|=l,u.memoizedState=Te(1|t,{destroy:void 0},a,e===void 0?null:e)}function zn(l,t,a,e){var u=Dl();e=e===void 0?null:e;var n=u.memoizedState.inst;dl!==null&&e!==null&&lc(e,dl.memoizedState.deps)?u.memoizedState=Te(t,n,a,e):(X.flags|=l,u.memoizedState=Te(1|t,n,a,e))}function io(l,t){pn(8390656,8,l,t)}function oc(l,t){zn(2048,8,l,t)}function Vm(l){X.flags|=4;var t=X.updateQueue;if(t===null)t=Sn(),X.updateQueue=t,t.events=[l];else{var a=t.events;a===null?t.events=[l]:a.push(l)}}function co(l){var t=Dl().memoizedState;return Vm({ref:t,nextImpl:l}),function(){if((ul&2)!==0)throw Error(r(440));return t.impl.apply(void 0,arguments)}}function fo(l,t){return zn(4,2,l,t)}function so(l,t){return zn(4,4,l,t)}function oo(l,t){if(typeof t=="function"){l=l();var a=t(l);return function(){typeof a=="function"?a():t(null)}}if(t!=null)return l=l(),t.current=l,function(){t.current=null}}function mo(l,t,a){a=a!=null?a.concat([l]):null,zn(4,4,oo.bind(null,t,l),a)}function dc(){}function vo(l,t){var a=Dl();t=t===void 0?null:t;var e=a.memoizedState;return t!==null&&lc(t,e[1])?e[0]:(a.memoizedState=[l,t],l)}function yo(l,t){var a=Dl();t=t===void 0?null:t;var e=a.memoizedState;if(t!==null&&lc(t,e[1]))return e[0];if(e=l(),Ka){jt(!0);try{l()}finally{jt(!1)}}return a.memoizedState=[e,t],e}function mc(l,t,a){return a===void 0||(kt&1073741824)!==0&&(W&261930)===0?l.memoizedState=t:(l.memoizedState=a,l=rd(),X.lanes|=l,Ea|=l,a)}function ro(l,t,a,e){return dt(a,t)?a:Ee.current!==null?(l=mc(l,a,e),dt(l,t)||(Cl=!0),l):(kt&42)===0||(kt&1073741824)!==0&&(W&261930)===0?(Cl=!0,l.memoizedState=a):(l=rd(),X.lanes|=l,Ea|=l,t)}function ho(l,t,a,e,u){var n=O.p;O.p=n!==0&&8>n?n:8;var i=g.T,c={};g.T=c,rc(l,!1,t,a);try{var f=u(),v=g.S;if(v!==null&&v(c,f),f!==null&&typeof f=="object"&&typeof f.then=="function"){var S=Gm(f,e);vu(l,t,S,gt(l))}else vu(l,t,e,gt(l))}catch(E){vu(l,t,{then:function(){},status:"rejected",reason:E},gt())}finally{O.p=n,i!==null&&c.types!==null&&(i.types=c.types),g.T=i}}function Km(){}function vc(l,t,a,e){if(l.tag!==5)throw Error(r(476));var u=go(l).queue;ho(l,u,t,j,a===null?Km:function(){return So(l),a(e)})}function go(l){var t=l.memoizedState;if(t!==null)return t;t={memoizedState:j,baseState:j,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Ft,lastRenderedState:j},next:null};var a={};return t.next={memoizedState:a,baseState:a,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Ft,lastRenderedState:a},next:null},l.memoizedState=t,l=l.alternate,l!==null&&(l.memoizedState=t),t}function So(l){var t=go(l);t.next===null&&(t=l.alternate.memoizedState),vu(l,t.next.queue,{},gt())}function yc(){return Kl(Nu)}function bo(){return Dl().memoizedState}function Eo(){return Dl().memoizedState}function Jm(l){for(var t=l.return;t!==null;){switch(t.tag){case 24:case 3:var a=gt();l=ya(a);var e=ra(t,l,a);e!==null&&(st(e,t,a),fu(e,t,a)),t={cache:Li()},l.payload=t;return}t=t.return}}function wm(l,t,a){var e=gt();a={lane:e,revertLane:0,gesture:null,action:a,hasEagerState:!1,eagerState:null,next:null},Tn(l)?zo(t,a):(a=Ci(l,t,a,e),a!==null&&(st(a,l,e),To(a,t,e)))}function po(l,t,a){var e=gt();vu(l,t,a,e)}function vu(l,t,a,e){var u={lane:e,revertLane:0,gesture:null,action:a,hasEagerState:!1,eagerState:null,next:null};if(Tn(l))zo(t,u);else{var n=l.alternate;if(l.lanes===0&&(n===null||n.lanes===0)&&(n=t.lastRenderedReducer,n!==null))try{var i=t.lastRenderedState,c=n(i,a);if(u.hasEagerState=!0,u.eagerState=c,dt(c,i))return an(l,t,u,0),yl===null&&tn(),!1}catch{}finally{}if(a=Ci(l,t,u,e),a!==null)return st(a,l,e),To(a,t,e),!0}return!1}function rc(l,t,a,e){if(e={lane:2,revertLane:wc(),gesture:null,action:e,hasEagerState:!1,eagerState:null,next:null},Tn(l)){if(t)throw Error(r(479))}else t=Ci(l,a,e,2),t!==null&&st(t,l,2)}function Tn(l){var t=l.alternate;return l===X||t!==null&&t===X}function zo(l,t){pe=hn=!0;var a=l.pending;a===null?t.next=t:(t.next=a.next,a.next=t),l.pending=t}function To(l,t,a){if((a&4194048)!==0){var e=t.lanes;e&=l.pendingLanes,a|=e,t.lanes=a,xf(l,a)}}var yu={readContext:Kl,use:bn,useCallback:_l,useContext:_l,useEffect:_l,useImperativeHandle:_l,useLayoutEffect:_l,useInsertionEffect:_l,useMemo:_l,useReducer:_l,useRef:_l,useState:_l,useDebugValue:_l,useDeferredValue:_l,useTransition:_l,useSyncExternalStore:_l,useId:_l,useHostTransitionStatus:_l,useFormState:_l,useActionState:_l,useOptimistic:_l,useMemoCache:_l,useCacheRefresh:_l};yu.useEffectEvent=_l;var Ao={readContext:Kl,use:bn,useCallback:function(l,t){return lt().memoizedState=[l,t===void 0?null:t],l},useContext:Kl,useEffect:io,useImperativeHandle:function(l,t,a){a=a!=null?a.concat([l]):null,pn(4194308,4,oo.bind(null,t,l),a)},useLayoutEffect:function(l,t){return pn(4194308,4,l,t)},useInsertionEffect:function(l,t){pn(4,2,l,t)},useMemo:function(l,t){var a=lt();t=t===void 0?null:t;var e=l();if(Ka){jt(!0);try{l()}finally{jt(!1)}}return a.memoizedState=[e,t],e},useReducer:function(l,t,a){var e=lt();if(a!==void 0){var u=a(t);if(Ka){jt(!0);try{a(t)}finally{jt(!1)}}}else u=t;return e.memoizedState=e.baseState=u,l={pending:null,lanes:0,dispatch:null,lastRenderedReducer:l,lastRenderedState:u},e.queue=l,l=l.dispatch=wm.bind(null,X,l),[e.memoizedState,l]},useRef:function(l){var t=lt();return l={current:l},t.memoizedState=l},useState:function(l){l=fc(l);var t=l.queue,a=po.bind(null,X,t);return t.dispatch=a,[l.memoizedState,a]},useDebugValue:dc,useDeferredValue:function(l,t){var a=lt();return mc(a,l,t)},useTransition:function(){var l=fc(!1);return l=ho.bind(null,X,l.queue,!0,!1),lt().memoizedState=l,[!1,l]},useSyncExternalStore:function(l,t,a){var e=X,u=lt();if(F){if(a===void 0)throw Error(r(407));a=a()}else{if(a=t(),yl===null)throw Error(r(349));(W&127)!==0||Vs(e,t,a)}u.memoizedState=a;var n={value:a,getSnapshot:t};return u.queue=n,io(Js.bind(null,e,n,l),[l]),e.flags|=2048,Te(9,{destroy:void 0},Ks.bind(null,e,n,a,t),null),a},useId:function(){var l=lt(),t=yl.identifierPrefix;if(F){var a=Bt,e=qt;a=(e&~(1<<32-Bl(e)-1)).toString(32)+a,t="_"+t+"R_"+a,a=gn++,0<a&&(t+="H"+a.toString(32)),t+="_"}else a=Qm++,t="_"+t+"r_"+a.toString(32)+"_";return l.memoizedState=t},useHostTransitionStatus:yc,useFormState:to,useActionState:to,useOptimistic:function(l){var t=lt();t.memoizedState=t.baseState=l;var a={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=a,t=rc.bind(null,X,!0,a),a.dispatch=t,[l,t]},useMemoCache:nc,useCacheRefresh:function(){return lt().memoizedState=Jm.bind(null,X)},useEffectEvent:function(l){var t=lt(),a={impl:l};return t.memoizedState=a,function(){if((ul&2)!==0)throw Error(r(440));return a.impl.apply(void 0,arguments)}}},hc={readContext:Kl,use:bn,useCallback:vo,useContext:Kl,useEffect:oc,useImperativeHandle:mo,useInsertionEffect:fo,useLayoutEffect:so,useMemo:yo,useReducer:En,useRef:no,useState:function(){return En(Ft)},useDebugValue:dc,useDeferredValue:function(l,t){var a=Dl();return ro(a,dl.memoizedState,l,t)},useTransition:function(){var l=En(Ft)[0],t=Dl().memoizedState;return[typeof l=="boolean"?l:mu(l),t]},useSyncExternalStore:Ls,useId:bo,useHostTransitionStatus:yc,useFormState:ao,useActionState:ao,useOptimistic:function(l,t){var a=Dl();return $s(a,dl,l,t)},useMemoCache:nc,useCacheRefresh:Eo};hc.useEffectEvent=co;var _o={readContext:Kl,use:bn,useCallback:vo,useContext:Kl,useEffect:oc,useImperativeHandle:mo,useInsertionEffect:fo,useLayoutEffect:so,useMemo:yo,useReducer:cc,useRef:no,useState:function(){return cc(Ft)},useDebugValue:dc,useDeferredValue:function(l,t){var a=Dl();return dl===null?mc(a,l,t):ro(a,dl.memoizedState,l,t)},useTransition:function(){var l=cc(Ft)[0],t=Dl().memoizedState;return[typeof l=="boolean"?l:mu(l),t]},useSyncExternalStore:Ls,useId:bo,useHostTransitionStatus:yc,useFormState:uo,useActionState:uo,useOptimistic:function(l,t){var a=Dl();return dl!==null?$s(a,dl,l,t):(a.baseState=l,[l,a.queue.dispatch])},useMemoCache:nc,useCacheRefresh:Eo};_o.useEffectEvent=co;function gc(l,t,a,e){t=l.memoizedState,a=a(e,t),a=a==null?t:R({},t,a),l.memoizedState=a,l.lanes===0&&(l.updateQueue.baseState=a)}var Sc={enqueueSetState:function(l,t,a){l=l._reactInternals;var e=gt(),u=ya(e);u.payload=t,a!=null&&(u.callback=a),t=ra(l,u,e),t!==null&&(st(t,l,e),fu(t,l,e))},enqueueReplaceState:function(l,t,a){l=l._reactInternals;var e=gt(),u=ya(e);u.tag=1,u.payload=t,a!=null&&(u.callback=a),t=ra(l,u,e),t!==null&&(st(t,l,e),fu(t,l,e))},enqueueForceUpdate:function(l,t){l=l._reactInternals;var a=gt(),e=ya(a);e.tag=2,t!=null&&(e.callback=t),t=ra(l,e,a),t!==null&&(st(t,l,a),fu(t,l,a))}};function Oo(l,t,a,e,u,n,i){return l=l.stateNode,typeof l.shouldComponentUpdate=="function"?l.shouldComponentUpdate(e,n,i):t.prototype&&t.prototype.isPureReactComponent?!lu(a,e)||!lu(u,n):!0}function xo(l,t,a,e){l=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(a,e),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(a,e),t.state!==l&&Sc.enqueueReplaceState(t,t.state,null)}function Ja(l,t){var a=t;if("ref"in t){a={};for(var e in t)e!=="ref"&&(a[e]=t[e])}if(l=l.defaultProps){a===t&&(a=R({},a));for(var u in l)a[u]===void 0&&(a[u]=l[u])}return a}function Mo(l){ln(l)}function Do(l){console.error(l)}function No(l){ln(l)}function An(l,t){try{var a=l.onUncaughtError;a(t.value,{componentStack:t.stack})}catch(e){setTimeout(function(){throw e})}}function Uo(l,t,a){try{var e=l.onCaughtError;e(a.value,{componentStack:a.stack,errorBoundary:t.tag===1?t.stateNode:null})}catch(u){setTimeout(function(){throw u})}}function bc(l,t,a){return a=ya(a),a.tag=3,a.payload={element:null},a.callback=function(){An(l,t)},a}function Co(l){return l=ya(l),l.tag=3,l}function Ro(l,t,a,e){var u=a.type.getDerivedStateFromError;if(typeof u=="function"){var n=e.value;l.payload=function(){return u(n)},l.callback=function(){Uo(t,a,e)}}var i=a.stateNode;i!==null&&typeof i.componentDidCatch=="function"&&(l.callback=function(){Uo(t,a,e),typeof u!="function"&&(pa===null?pa=new Set([this]):pa.add(this));var c=e.stack;this.componentDidCatch(e.value,{componentStack:c!==null?c:""})})}function Wm(l,t,a,e,u){if(a.flags|=32768,e!==null&&typeof e=="object"&&typeof e.then=="function"){if(t=a.alternate,t!==null&&re(t,a,u,!0),a=vt.current,a!==null){switch(a.tag){case 31:case 13:return Mt===null?qn():a.alternate===null&&Ol===0&&(Ol=3),a.flags&=-257,a.flags|=65536,a.lanes=u,e===dn?a.flags|=16384:(t=a.updateQueue,t===null?a.updateQueue=new Set([e]):t.add(e),Vc(l,e,u)),!1;case 22:return a.flags|=65536,e===dn?a.flags|=16384:(t=a.updateQueue,t===null?(t={transitions:null,markerInstances:null,retryQueue:new Set([e])},a.updateQueue=t):(a=t.retryQueue,a===null?t.retryQueue=new Set([e]):a.add(e)),Vc(l,e,u)),!1}throw Error(r(435,a.tag))}return Vc(l,e,u),qn(),!1}if(F)return t=vt.current,t!==null?((t.flags&65536)===0&&(t.flags|=256),t.flags|=65536,t.lanes=u,e!==Yi&&(l=Error(r(422),{cause:e}),eu(At(l,a)))):(e!==Yi&&(t=Error(r(423),{cause:e}),eu(At(t,a))),l=l.current.alternate,l.flags|=65536,u&=-u,l.lanes|=u,e=At(e,a),u=bc(l.stateNode,e,u),$i(l,u),Ol!==4&&(Ol=2)),!1;var n=Error(r(520),{cause:e});if(n=At(n,a),zu===null?zu=[n]:zu.push(n),Ol!==4&&(Ol=2),t===null)return!0;e=At(e,a),a=t;do{switch(a.tag){case 3:return a.flags|=65536,l=u&-u,a.lanes|=l,l=bc(a.stateNode,e,l),$i(a,l),!1;case 1:if(t=a.type,n=a.stateNode,(a.flags&128)===0&&(typeof t.getDerivedStateFromError=="function"||n!==null&&typeof n.componentDidCatch=="function"&&(pa===null||!pa.has(n))))return a.flags|=65536,u&=-u,a.lanes|=u,u=Co(u),Ro(u,l,a,e),$i(a,u),!1}a=a.return}while(a!==null);return!1}var Ec=Error(r(461)),Cl=!1;function Jl(l,t,a,e){t.child=l===null?qs(t,null,a,e):Va(t,l.child,a,e)}function Ho(l,t,a,e,u){a=a.render;var n=t.ref;if("ref"in e){var i={};for(var c in e)c!=="ref"&&(i[c]=e[c])}else i=e;return Qa(t),e=tc(l,t,a,i,n,u),c=ac(),l!==null&&!Cl?(ec(l,t,u),It(l,t,u)):(F&&c&&qi(t),t.flags|=1,Jl(l,t,e,u),t.child)}function jo(l,t,a,e,u){if(l===null){var n=a.type;return typeof n=="function"&&!Ri(n)&&n.defaultProps===void 0&&a.compare===null?(t.tag=15,t.type=n,qo(l,t,n,e,u)):(l=un(a.type,null,e,t,t.mode,u),l.ref=t.ref,l.return=t,t.child=l)}if(n=l.child,!Mc(l,u)){var i=n.memoizedProps;if(a=a.compare,a=a!==null?a:lu,a(i,e)&&l.ref===t.ref)return It(l,t,u)}return t.flags|=1,l=Jt(n,e),l.ref=t.ref,l.return=t,t.child=l}function qo(l,t,a,e,u){if(l!==null){var n=l.memoizedProps;if(lu(n,e)&&l.ref===t.ref)if(Cl=!1,t.pendingProps=e=n,Mc(l,u))(l.flags&131072)!==0&&(Cl=!0);else return t.lanes=l.lanes,It(l,t,u)}return pc(l,t,a,e,u)}function Bo(l,t,a,e){var u=e.children,n=l!==null?l.memoizedState:null;if(l===null&&t.stateNode===null&&(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),e.mode==="hidden"){if((t.flags&128)!==0){if(n=n!==null?n.baseLanes|a:a,l!==null){for(e=t.child=l.child,u=0;e!==null;)u=u|e.lanes|e.childLanes,e=e.sibling;e=u&~n}else e=0,t.child=null;return Yo(l,t,n,a,e)}if((a&536870912)!==0)t.memoizedState={baseLanes:0,cachePool:null},l!==null&&sn(t,n!==null?n.cachePool:null),n!==null?Gs(t,n):Fi(),Qs(t);else return e=t.lanes=536870912,Yo(l,t,n!==null?n.baseLanes|a:a,a,e)}else n!==null?(sn(t,n.cachePool),Gs(t,n),ga(),t.memoizedState=null):(l!==null&&sn(t,null),Fi(),ga());return Jl(l,t,u,a),t.child}function ru(l,t){return l!==null&&l.tag===22||t.stateNode!==null||(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),t.sibling}function Yo(l,t,a,e,u){var n=Ki();return n=n===null?null:{parent:Nl._currentValue,pool:n},t.memoizedState={baseLanes:a,cachePool:n},l!==null&&sn(t,null),Fi(),Qs(t),l!==null&&re(l,t,e,!0),t.childLanes=u,null}function _n(l,t){return t=xn({mode:t.mode,children:t.children},l.mode),t.ref=l.ref,l.child=t,t.return=l,t}function Go(l,t,a){return Va(t,l.child,null,a),l=_n(t,t.pendingProps),l.flags|=2,yt(t),t.memoizedState=null,l}function $m(l,t,a){var e=t.pendingProps,u=(t.flags&128)!==0;if(t.flags&=-129,l===null){if(F){if(e.mode==="hidden")return l=_n(t,e),t.lanes=536870912,ru(null,l);if(Pi(t),(l=Sl)?(l=Fd(l,xt),l=l!==null&&l.data==="&"?l:null,l!==null&&(t.memoizedState={dehydrated:l,treeContext:sa!==null?{id:qt,overflow:Bt}:null,retryLane:536870912,hydrationErrors:null},a=ps(l),a.return=t,t.child=a,Vl=t,Sl=null)):l=null,l===null)throw da(t);return t.lanes=536870912,null}return _n(t,e)}var n=l.memoizedState;if(n!==null){var i=n.dehydrated;if(Pi(t),u)if(t.flags&256)t.flags&=-257,t=Go(l,t,a);else if(t.memoizedState!==null)t.child=l.child,t.flags|=128,t=null;else throw Error(r(558));else if(Cl||re(l,t,a,!1),u=(a&l.childLanes)!==0,Cl||u){if(e=yl,e!==null&&(i=Mf(e,a),i!==0&&i!==n.retryLane))throw n.retryLane=i,qa(l,i),st(e,l,i),Ec;qn(),t=Go(l,t,a)}else l=n.treeContext,Sl=Dt(i.nextSibling),Vl=t,F=!0,oa=null,xt=!1,l!==null&&As(t,l),t=_n(t,e),t.flags|=4096;return t}return l=Jt(l.child,{mode:e.mode,children:e.children}),l.ref=t.ref,t.child=l,l.return=t,l}function On(l,t){var a=t.ref;if(a===null)l!==null&&l.ref!==null&&(t.flags|=4194816);else{if(typeof a!="function"&&typeof a!="object")throw Error(r(284));(l===null||l.ref!==a)&&(t.flags|=4194816)}}function pc(l,t,a,e,u){return Qa(t),a=tc(l,t,a,e,void 0,u),e=ac(),l!==null&&!Cl?(ec(l,t,u),It(l,t,u)):(F&&e&&qi(t),t.flags|=1,Jl(l,t,a,u),t.child)}function Qo(l,t,a,e,u,n){return Qa(t),t.updateQueue=null,a=Zs(t,e,a,u),Xs(l),e=ac(),l!==null&&!Cl?(ec(l,t,n),It(l,t,n)):(F&&e&&qi(t),t.flags|=1,Jl(l,t,a,n),t.child)}function Xo(l,t,a,e,u){if(Qa(t),t.stateNode===null){var n=de,i=a.contextType;typeof i=="object"&&i!==null&&(n=Kl(i)),n=new a(e,n),t.memoizedState=n.state!==null&&n.state!==void 0?n.state:null,n.updater=Sc,t.stateNode=n,n._reactInternals=t,n=t.stateNode,n.props=e,n.state=t.memoizedState,n.refs={},wi(t),i=a.contextType,n.context=typeof i=="object"&&i!==null?Kl(i):de,n.state=t.memoizedState,i=a.getDerivedStateFromProps,typeof i=="function"&&(gc(t,a,i,e),n.state=t.memoizedState),typeof a.getDerivedStateFromProps=="function"||typeof n.getSnapshotBeforeUpdate=="function"||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(i=n.state,typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount(),i!==n.state&&Sc.enqueueReplaceState(n,n.state,null),ou(t,e,n,u),su(),n.state=t.memoizedState),typeof n.componentDidMount=="function"&&(t.flags|=4194308),e=!0}else if(l===null){n=t.stateNode;var c=t.memoizedProps,f=Ja(a,c);n.props=f;var v=n.context,S=a.contextType;i=de,typeof S=="object"&&S!==null&&(i=Kl(S));var E=a.getDerivedStateFromProps;S=typeof E=="function"||typeof n.getSnapshotBeforeUpdate=="function",c=t.pendingProps!==c,S||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(c||v!==i)&&xo(t,n,e,i),va=!1;var y=t.memoizedState;n.state=y,ou(t,e,n,u),su(),v=t.memoizedState,c||y!==v||va?(typeof E=="function"&&(gc(t,a,E,e),v=t.memoizedState),(f=va||Oo(t,a,f,e,y,v,i))?(S||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount()),typeof n.componentDidMount=="function"&&(t.flags|=4194308)):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=e,t.memoizedState=v),n.props=e,n.state=v,n.context=i,e=f):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),e=!1)}else{n=t.stateNode,Wi(l,t),i=t.memoizedProps,S=Ja(a,i),n.props=S,E=t.pendingProps,y=n.context,v=a.contextType,f=de,typeof v=="object"&&v!==null&&(f=Kl(v)),c=a.getDerivedStateFromProps,(v=typeof c=="function"||typeof n.getSnapshotBeforeUpdate=="function")||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(i!==E||y!==f)&&xo(t,n,e,f),va=!1,y=t.memoizedState,n.state=y,ou(t,e,n,u),su();var h=t.memoizedState;i!==E||y!==h||va||l!==null&&l.dependencies!==null&&cn(l.dependencies)?(typeof c=="function"&&(gc(t,a,c,e),h=t.memoizedState),(S=va||Oo(t,a,S,e,y,h,f)||l!==null&&l.dependencies!==null&&cn(l.dependencies))?(v||typeof n.UNSAFE_componentWillUpdate!="function"&&typeof n.componentWillUpdate!="function"||(typeof n.componentWillUpdate=="function"&&n.componentWillUpdate(e,h,f),typeof n.UNSAFE_componentWillUpdate=="function"&&n.UNSAFE_componentWillUpdate(e,h,f)),typeof n.componentDidUpdate=="function"&&(t.flags|=4),typeof n.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof n.componentDidUpdate!="function"||i===l.memoizedProps&&y===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||i===l.memoizedProps&&y===l.memoizedState||(t.flags|=1024),t.memoizedProps=e,t.memoizedState=h),n.props=e,n.state=h,n.context=f,e=S):(typeof n.componentDidUpdate!="function"||i===l.memoizedProps&&y===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||i===l.memoizedProps&&y===l.memoizedState||(t.flags|=1024),e=!1)}return n=e,On(l,t),e=(t.flags&128)!==0,n||e?(n=t.stateNode,a=e&&typeof a.getDerivedStateFromError!="function"?null:n.render(),t.flags|=1,l!==null&&e?(t.child=Va(t,l.child,null,u),t.child=Va(t,null,a,u)):Jl(l,t,a,u),t.memoizedState=n.state,l=t.child):l=It(l,t,u),l}function Zo(l,t,a,e){return Ya(),t.flags|=256,Jl(l,t,a,e),t.child}var zc={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function Tc(l){return{baseLanes:l,cachePool:Ns()}}function Ac(l,t,a){return l=l!==null?l.childLanes&~a:0,t&&(l|=ht),l}function Lo(l,t,a){var e=t.pendingProps,u=!1,n=(t.flags&128)!==0,i;if((i=n)||(i=l!==null&&l.memoizedState===null?!1:(Ml.current&2)!==0),i&&(u=!0,t.flags&=-129),i=(t.flags&32)!==0,t.flags&=-33,l===null){if(F){if(u?ha(t):ga(),(l=Sl)?(l=Fd(l,xt),l=l!==null&&l.data!=="&"?l:null,l!==null&&(t.memoizedState={dehydrated:l,treeContext:sa!==null?{id:qt,overflow:Bt}:null,retryLane:536870912,hydrationErrors:null},a=ps(l),a.return=t,t.child=a,Vl=t,Sl=null)):l=null,l===null)throw da(t);return cf(l)?t.lanes=32:t.lanes=536870912,null}var c=e.children;return e=e.fallback,u?(ga(),u=t.mode,c=xn({mode:"hidden",children:c},u),e=Ba(e,u,a,null),c.return=t,e.return=t,c.sibling=e,t.child=c,e=t.child,e.memoizedState=Tc(a),e.childLanes=Ac(l,i,a),t.memoizedState=zc,ru(null,e)):(ha(t),_c(t,c))}var f=l.memoizedState;if(f!==null&&(c=f.dehydrated,c!==null)){if(n)t.flags&256?(ha(t),t.flags&=-257,t=Oc(l,t,a)):t.memoizedState!==null?(ga(),t.child=l.child,t.flags|=128,t=null):(ga(),c=e.fallback,u=t.mode,e=xn({mode:"visible",children:e.children},u),c=Ba(c,u,a,null),c.flags|=2,e.return=t,c.return=t,e.sibling=c,t.child=e,Va(t,l.child,null,a),e=t.child,e.memoizedState=Tc(a),e.childLanes=Ac(l,i,a),t.memoizedState=zc,t=ru(null,e));else if(ha(t),cf(c)){if(i=c.nextSibling&&c.nextSibling.dataset,i)var v=i.dgst;i=v,e=Error(r(419)),e.stack="",e.digest=i,eu({value:e,source:null,stack:null}),t=Oc(l,t,a)}else if(Cl||re(l,t,a,!1),i=(a&l.childLanes)!==0,Cl||i){if(i=yl,i!==null&&(e=Mf(i,a),e!==0&&e!==f.retryLane))throw f.retryLane=e,qa(l,e),st(i,l,e),Ec;nf(c)||qn(),t=Oc(l,t,a)}else nf(c)?(t.flags|=192,t.child=l.child,t=null):(l=f.treeContext,Sl=Dt(c.nextSibling),Vl=t,F=!0,oa=null,xt=!1,l!==null&&As(t,l),t=_c(t,e.children),t.flags|=4096);return t}return u?(ga(),c=e.fallback,u=t.mode,f=l.child,v=f.sibling,e=Jt(f,{mode:"hidden",children:e.children}),e.subtreeFlags=f.subtreeFlags&65011712,v!==null?c=Jt(v,c):(c=Ba(c,u,a,null),c.flags|=2),c.return=t,e.return=t,e.sibling=c,t.child=e,ru(null,e),e=t.child,c=l.child.memoizedState,c===null?c=Tc(a):(u=c.cachePool,u!==null?(f=Nl._currentValue,u=u.parent!==f?{parent:f,pool:f}:u):u=Ns(),c={baseLanes:c.baseLanes|a,cachePool:u}),e.memoizedState=c,e.childLanes=Ac(l,i,a),t.memoizedState=zc,ru(l.child,e)):(ha(t),a=l.child,l=a.sibling,a=Jt(a,{mode:"visible",children:e.children}),a.return=t,a.sibling=null,l!==null&&(i=t.deletions,i===null?(t.deletions=[l],t.flags|=16):i.push(l)),t.child=a,t.memoizedState=null,a)}function _c(l,t){return t=xn({mode:"visible",children:t},l.mode),t.return=l,l.child=t}function xn(l,t){return l=mt(22,l,null,t),l.lanes=0,l}function Oc(l,t,a){return Va(t,l.child,null,a),l=_c(t,t.pendingProps.children),l.flags|=2,t.memoizedState=null,l}function Vo(l,t,a){l.lanes|=t;var e=l.alternate;e!==null&&(e.lanes|=t),Xi(l.return,t,a)}function xc(l,t,a,e,u,n){var i=l.memoizedState;i===null?l.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:e,tail:a,tailMode:u,treeForkCount:n}:(i.isBackwards=t,i.rendering=null,i.renderingStartTime=0,i.last=e,i.tail=a,i.tailMode=u,i.treeForkCount=n)}function Ko(l,t,a){var e=t.pendingProps,u=e.revealOrder,n=e.tail;e=e.children;var i=Ml.current,c=(i&2)!==0;if(c?(i=i&1|2,t.flags|=128):i&=1,_(Ml,i),Jl(l,t,e,a),e=F?au:0,!c&&l!==null&&(l.flags&128)!==0)l:for(l=t.child;l!==null;){if(l.tag===13)l.memoizedState!==null&&Vo(l,a,t);else if(l.tag===19)Vo(l,a,t);else if(l.child!==null){l.child.return=l,l=l.child;continue}if(l===t)break l;for(;l.sibling===null;){if(l.return===null||l.return===t)break l;l=l.return}l.sibling.return=l.return,l=l.sibling}switch(u){case"forwards":for(a=t.child,u=null;a!==null;)l=a.alternate,l!==null&&rn(l)===null&&(u=a),a=a.sibling;a=u,a===null?(u=t.child,t.child=null):(u=a.sibling,a.sibling=null),xc(t,!1,u,a,n,e);break;case"backwards":case"unstable_legacy-backwards":for(a=null,u=t.child,t.child=null;u!==null;){if(l=u.alternate,l!==null&&rn(l)===null){t.child=u;break}l=u.sibling,u.sibling=a,a=u,u=l}xc(t,!0,a,null,n,e);break;case"together":xc(t,!1,null,null,void 0,e);break;default:t.memoizedState=null}return t.child}function It(l,t,a){if(l!==null&&(t.dependencies=l.dependencies),Ea|=t.lanes,(a&t.childLanes)===0)if(l!==null){if(re(l,t,a,!1),(a&t.childLanes)===0)return null}else return null;if(l!==null&&t.child!==l.child)throw Error(r(153));if(t.child!==null){for(l=t.child,a=Jt(l,l.pendingProps),t.child=a,a.return=t;l.sibling!==null;)l=l.sibling,a=a.sibling=Jt(l,l.pendingProps),a.return=t;a.sibling=null}return t.child}function Mc(l,t){return(l.lanes&t)!==0?!0:(l=l.dependencies,!!(l!==null&&cn(l)))}function km(l,t,a){switch(t.tag){case 3:Tl(t,t.stateNode.containerInfo),ma(t,Nl,l.memoizedState.cache),Ya();break;case 27:case 5:ol(t);break;case 4:Tl(t,t.stateNode.containerInfo);break;case 10:ma(t,t.type,t.memoizedProps.value);break;case 31:if(t.memoizedState!==null)return t.flags|=128,Pi(t),null;break;case 13:var e=t.memoizedState;if(e!==null)return e.dehydrated!==null?(ha(t),t.flags|=128,null):(a&t.child.childLanes)!==0?Lo(l,t,a):(ha(t),l=It(l,t,a),l!==null?l.sibling:null);ha(t);break;case 19:var u=(l.flags&128)!==0;if(e=(a&t.childLanes)!==0,e||(re(l,t,a,!1),e=(a&t.childLanes)!==0),u){if(e)return Ko(l,t,a);t.flags|=128}if(u=t.memoizedState,u!==null&&(u.rendering=null,u.tail=null,u.lastEffect=null),_(Ml,Ml.current),e)break;return null;case 22:return t.lanes=0,Bo(l,t,a,t.pendingProps);case 24:ma(t,Nl,l.memoizedState.cache)}return It(l,t,a)}function Jo(l,t,a){if(l!==null)if(l.memoizedProps!==t.pendingProps)Cl=!0;else{if(!Mc(l,a)&&(t.flags&128)===0)return Cl=!1,km(l,t,a);Cl=(l.flags&131072)!==0}else Cl=!1,F&&(t.flags&1048576)!==0&&Ts(t,au,t.index);switch(t.lanes=0,t.tag){case 16:l:{var e=t.pendingProps;if(l=Za(t.elementType),t.type=l,typeof l=="function")Ri(l)?(e=Ja(l,e),t.tag=1,t=Xo(null,t,l,e,a)):(t.tag=0,t=pc(null,t,l,e,a));else{if(l!=null){var u=l.$$typeof;if(u===tt){t.tag=11,t=Ho(null,t,l,e,a);break l}else if(u===K){t.tag=14,t=jo(null,t,l,e,a);break l}}throw t=at(l)||l,Error(r(306,t,""))}}return t;case 0:return pc(l,t,t.type,t.pendingProps,a);case 1:return e=t.type,u=Ja(e,t.pendingProps),Xo(l,t,e,u,a);case 3:l:{if(Tl(t,t.stateNode.containerInfo),l===null)throw Error(r(387));e=t.pendingProps;var n=t.memoizedState;u=n.element,Wi(l,t),ou(t,e,null,a);var i=t.memoizedState;if(e=i.cache,ma(t,Nl,e),e!==n.cache&&Zi(t,[Nl],a,!0),su(),e=i.element,n.isDehydrated)if(n={element:e,isDehydrated:!1,cache:i.cache},t.updateQueue.baseState=n,t.memoizedState=n,t.flags&256){t=Zo(l,t,e,a);break l}else if(e!==u){u=At(Error(r(424)),t),eu(u),t=Zo(l,t,e,a);break l}else{switch(l=t.stateNode.containerInfo,l.nodeType){case 9:l=l.body;break;default:l=l.nodeName==="HTML"?l.ownerDocument.body:l}for(Sl=Dt(l.firstChild),Vl=t,F=!0,oa=null,xt=!0,a=qs(t,null,e,a),t.child=a;a;)a.flags=a.flags&-3|4096,a=a.sibling}else{if(Ya(),e===u){t=It(l,t,a);break l}Jl(l,t,e,a)}t=t.child}return t;case 26:return On(l,t),l===null?(a=e0(t.type,null,t.pendingProps,null))?t.memoizedState=a:F||(a=t.type,l=t.pendingProps,e=Ln(L.current).createElement(a),e[Ll]=t,e[et]=l,wl(e,a,l),Yl(e),t.stateNode=e):t.memoizedState=e0(t.type,l.memoizedProps,t.pendingProps,l.memoizedState),null;case 27:return ol(t),l===null&&F&&(e=t.stateNode=l0(t.type,t.pendingProps,L.current),Vl=t,xt=!0,u=Sl,_a(t.type)?(ff=u,Sl=Dt(e.firstChild)):Sl=u),Jl(l,t,t.pendingProps.children,a),On(l,t),l===null&&(t.flags|=4194304),t.child;case 5:return l===null&&F&&((u=e=Sl)&&(e=Ov(e,t.type,t.pendingProps,xt),e!==null?(t.stateNode=e,Vl=t,Sl=Dt(e.firstChild),xt=!1,u=!0):u=!1),u||da(t)),ol(t),u=t.type,n=t.pendingProps,i=l!==null?l.memoizedProps:null,e=n.children,af(u,n)?e=null:i!==null&&af(u,i)&&(t.flags|=32),t.memoizedState!==null&&(u=tc(l,t,Xm,null,null,a),Nu._currentValue=u),On(l,t),Jl(l,t,e,a),t.child;case 6:return l===null&&F&&((l=a=Sl)&&(a=xv(a,t.pendingProps,xt),a!==null?(t.stateNode=a,Vl=t,Sl=null,l=!0):l=!1),l||da(t)),null;case 13:return Lo(l,t,a);case 4:return Tl(t,t.stateNode.containerInfo),e=t.pendingProps,l===null?t.child=Va(t,null,e,a):Jl(l,t,e,a),t.child;case 11:return Ho(l,t,t.type,t.pendingProps,a);case 7:return Jl(l,t,t.pendingProps,a),t.child;case 8:return Jl(l,t,t.pendingProps.children,a),t.child;case 12:return Jl(l,t,t.pendingProps.children,a),t.child;case 10:return e=t.pendingProps,ma(t,t.type,e.value),Jl(l,t,e.children,a),t.child;case 9:return u=t.type._context,e=t.pendingProps.children,Qa(t),u=Kl(u),e=e(u),t.flags|=1,Jl(l,t,e,a),t.child;case 14:return jo(l,t,t.type,t.pendingProps,a);case 15:return qo(l,t,t.type,t.pendingProps,a);case 19:return Ko(l,t,a);case 31:return $m(l,t,a);case 22:return Bo(l,t,a,t.pendingProps);case 24:return Qa(t),e=Kl(Nl),l===null?(u=Ki(),u===null&&(u=yl,n=Li(),u.pooledCache=n,n.refCount++,n!==null&&(u.pooledCacheLanes|=a),u=n),t.memoizedState={parent:e,cache:u},wi(t),ma(t,Nl,u)):((l.lanes&a)!==0&&(Wi(l,t),ou(t,null,null,a),su()),u=l.memoizedState,n=t.memoizedState,u.parent!==e?(u={parent:e,cache:e},t.memoizedState=u,t.lanes===0&&(t.memoizedState=t.updateQueue.baseState=u),ma(t,Nl,e)):(e=n.cache,ma(t,Nl,e),e!==u.cache&&Zi(t,[Nl],a,!0))),Jl(l,t,t.pendingProps.children,a),t.child;case 29:throw t.pendingProps}throw Error(r(156,t.tag))}function Pt(l){l.flags|=4}function Dc(l,t,a,e,u){if((t=(l.mode&32)!==0)&&(t=!1),t){if(l.flags|=16777216,(u&335544128)===u)if(l.stateNode.complete)l.flags|=8192;else if(bd())l.flags|=8192;else throw La=dn,Ji}else l.flags&=-16777217}function wo(l,t){if(t.type!=="stylesheet"||(t.state.loading&4)!==0)l.flags&=-16777217;else if(l.flags|=16777216,!f0(t))if(bd())l.flags|=8192;else throw La=dn,Ji}function Mn(l,t){t!==null&&(l.flags|=4),l.flags&16384&&(t=l.tag!==22?_f():536870912,l.lanes|=t,xe|=t)}function hu(l,t){if(!F)switch(l.tailMode){case"hidden":t=l.tail;for(var a=null;t!==null;)t.alternate!==null&&(a=t),t=t.sibling;a===null?l.tail=null:a.sibling=null;break;case"collapsed":a=l.tail;for(var e=null;a!==null;)a.alternate!==null&&(e=a),a=a.sibling;e===null?t||l.tail===null?l.tail=null:l.tail.sibling=null:e.sibling=null}}function bl(l){var t=l.alternate!==null&&l.alternate.child===l.child,a=0,e=0;if(t)for(var u=l.child;u!==null;)a|=u.lanes|u.childLanes,e|=u.subtreeFlags&65011712,e|=u.flags&65011712,u.return=l,u=u.sibling;else for(u=l.child;u!==null;)a|=u.lanes|u.childLanes,e|=u.subtreeFlags,e|=u.flags,u.return=l,u=u.sibling;return l.subtreeFlags|=e,l.childLanes=a,t}function Fm(l,t,a){var e=t.pendingProps;switch(Bi(t),t.tag){case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return bl(t),null;case 1:return bl(t),null;case 3:return a=t.stateNode,e=null,l!==null&&(e=l.memoizedState.cache),t.memoizedState.cache!==e&&(t.flags|=2048),$t(Nl),hl(),a.pendingContext&&(a.context=a.pendingContext,a.pendingContext=null),(l===null||l.child===null)&&(ye(t)?Pt(t):l===null||l.memoizedState.isDehydrated&&(t.flags&256)===0||(t.flags|=1024,Gi())),bl(t),null;case 26:var u=t.type,n=t.memoizedState;return l===null?(Pt(t),n!==null?(bl(t),wo(t,n)):(bl(t),Dc(t,u,null,e,a))):n?n!==l.memoizedState?(Pt(t),bl(t),wo(t,n)):(bl(t),t.flags&=-16777217):(l=l.memoizedProps,l!==e&&Pt(t),bl(t),Dc(t,u,l,e,a)),null;case 27:if($a(t),a=L.current,u=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==e&&Pt(t);else{if(!e){if(t.stateNode===null)throw Error(r(166));return bl(t),null}l=D.current,ye(t)?_s(t):(l=l0(u,e,a),t.stateNode=l,Pt(t))}return bl(t),null;case 5:if($a(t),u=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==e&&Pt(t);else{if(!e){if(t.stateNode===null)throw Error(r(166));return bl(t),null}if(n=D.current,ye(t))_s(t);else{var i=Ln(L.current);switch(n){case 1:n=i.createElementNS("http://www.w3.org/2000/svg",u);break;case 2:n=i.createElementNS("http://www.w3.org/1998/Math/MathML",u);break;default:switch(u){case"svg":n=i.createElementNS("http://www.w3.org/2000/svg",u);break;case"math":n=i.createElementNS("http://www.w3.org/1998/Math/MathML",u);break;case"script":n=i.createElement("div"),n.innerHTML="<script><\/script>",n=n.removeChild(n.firstChild);break;case"select":n=typeof e.is=="string"?i.createElement("select",{is:e.is}):i.createElement("select"),e.multiple?n.multiple=!0:e.size&&(n.size=e.size);break;default:n=typeof e.is=="string"?i.createElement(u,{is:e.is}):i.createElement(u)}}n[Ll]=t,n[et]=e;l:for(i=t.child;i!==null;){if(i.tag===5||i.tag===6)n.appendChild(i.stateNode);else if(i.tag!==4&&i.tag!==27&&i.child!==null){i.child.return=i,i=i.child;continue}if(i===t)break l;for(;i.sibling===null;){if(i.return===null||i.return===t)break l;i=i.return}i.sibling.return=i.return,i=i.sibling}t.stateNode=n;l:switch(wl(n,u,e),u){case"button":case"input":case"select":case"textarea":e=!!e.autoFocus;break l;case"img":e=!0;break l;default:e=!1}e&&Pt(t)}}return bl(t),Dc(t,t.type,l===null?null:l.memoizedProps,t.pendingProps,a),null;case 6:if(l&&t.stateNode!=null)l.memoizedProps!==e&&Pt(t);else{if(typeof e!="string"&&t.stateNode===null)throw Error(r(166));if(l=L.current,ye(t)){if(l=t.stateNode,a=t.memoizedProps,e=null,u=Vl,u!==null)switch(u.tag){case 27:case 5:e=u.memoizedProps}l[Ll]=t,l=!!(l.nodeValue===a||e!==null&&e.suppressHydrationWarning===!0||Ld(l.nodeValue,a)),l||da(t,!0)}else l=Ln(l).createTextNode(e),l[Ll]=t,t.stateNode=l}return bl(t),null;case 31:if(a=t.memoizedState,l===null||l.memoizedState!==null){if(e=ye(t),a!==null){if(l===null){if(!e)throw Error(r(318));if(l=t.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(r(557));l[Ll]=t}else Ya(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;bl(t),l=!1}else a=Gi(),l!==null&&l.memoizedState!==null&&(l.memoizedState.hydrationErrors=a),l=!0;if(!l)return t.flags&256?(yt(t),t):(yt(t),null);if((t.flags&128)!==0)throw Error(r(558))}return bl(t),null;case 13:if(e=t.memoizedState,l===null||l.memoizedState!==null&&l.memoizedState.dehydrated!==null){if(u=ye(t),e!==null&&e.dehydrated!==null){if(l===null){if(!u)throw Error(r(318));if(u=t.memoizedState,u=u!==null?u.dehydrated:null,!u)throw Error(r(317));u[Ll]=t}else Ya(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;bl(t),u=!1}else u=Gi(),l!==null&&l.memoizedState!==null&&(l.memoizedState.hydrationErrors=u),u=!0;if(!u)return t.flags&256?(yt(t),t):(yt(t),null)}return yt(t),(t.flags&128)!==0?(t.lanes=a,t):(a=e!==null,l=l!==null&&l.memoizedState!==null,a&&(e=t.child,u=null,e.alternate!==null&&e.alternate.memoizedState!==null&&e.alternate.memoizedState.cachePool!==null&&(u=e.alternate.memoizedState.cachePool.pool),n=null,e.memoizedState!==null&&e.memoizedState.cachePool!==null&&(n=e.memoizedState.cachePool.pool),n!==u&&(e.flags|=2048)),a!==l&&a&&(t.child.flags|=8192),Mn(t,t.updateQueue),bl(t),null);case 4:return hl(),l===null&&Fc(t.stateNode.containerInfo),bl(t),null;case 10:return $t(t.type),bl(t),null;case 19:if(p(Ml),e=t.memoizedState,e===null)return bl(t),null;if(u=(t.flags&128)!==0,n=e.rendering,n===null)if(u)hu(e,!1);else{if(Ol!==0||l!==null&&(l.flags&128)!==0)for(l=t.child;l!==null;){if(n=rn(l),n!==null){for(t.flags|=128,hu(e,!1),l=n.updateQueue,t.updateQueue=l,Mn(t,l),t.subtreeFlags=0,l=a,a=t.child;a!==null;)Es(a,l),a=a.sibling;return _(Ml,Ml.current&1|2),F&&wt(t,e.treeForkCount),t.child}l=l.sibling}e.tail!==null&&Zl()>Rn&&(t.flags|=128,u=!0,hu(e,!1),t.lanes=4194304)}else{if(!u)if(l=rn(n),l!==null){if(t.flags|=128,u=!0,l=l.updateQueue,t.updateQueue=l,Mn(t,l),hu(e,!0),e.tail===null&&e.tailMode==="hidden"&&!n.alternate&&!F)return bl(t),null}else 2*Zl()-e.renderingStartTime>Rn&&a!==536870912&&(t.flags|=128,u=!0,hu(e,!1),t.lanes=4194304);e.isBackwards?(n.sibling=t.child,t.child=n):(l=e.last,l!==null?l.sibling=n:t.child=n,e.last=n)}return e.tail!==null?(l=e.tail,e.rendering=l,e.tail=l.sibling,e.renderingStartTime=Zl(),l.sibling=null,a=Ml.current,_(Ml,u?a&1|2:a&1),F&&wt(t,e.treeForkCount),l):(bl(t),null);case 22:case 23:return yt(t),Ii(),e=t.memoizedState!==null,l!==null?l.memoizedState!==null!==e&&(t.flags|=8192):e&&(t.flags|=8192),e?(a&536870912)!==0&&(t.flags&128)===0&&(bl(t),t.subtreeFlags&6&&(t.flags|=8192)):bl(t),a=t.updateQueue,a!==null&&Mn(t,a.retryQueue),a=null,l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(a=l.memoizedState.cachePool.pool),e=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(e=t.memoizedState.cachePool.pool),e!==a&&(t.flags|=2048),l!==null&&p(Xa),null;case 24:return a=null,l!==null&&(a=l.memoizedState.cache),t.memoizedState.cache!==a&&(t.flags|=2048),$t(Nl),bl(t),null;case 25:return null;case 30:return null}throw Error(r(156,t.tag))}function Im(l,t){switch(Bi(t),t.tag){case 1:return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 3:return $t(Nl),hl(),l=t.flags,(l&65536)!==0&&(l&128)===0?(t.flags=l&-65537|128,t):null;case 26:case 27:case 5:return $a(t),null;case 31:if(t.memoizedState!==null){if(yt(t),t.alternate===null)throw Error(r(340));Ya()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 13:if(yt(t),l=t.memoizedState,l!==null&&l.dehydrated!==null){if(t.alternate===null)throw Error(r(340));Ya()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 19:return p(Ml),null;case 4:return hl(),null;case 10:return $t(t.type),null;case 22:case 23:return yt(t),Ii(),l!==null&&p(Xa),l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 24:return $t(Nl),null;case 25:return null;default:return null}}function Wo(l,t){switch(Bi(t),t.tag){case 3:$t(Nl),hl();break;case 26:case 27:case 5:$a(t);break;case 4:hl();break;case 31:t.memoizedState!==null&&yt(t);break;case 13:yt(t);break;case 19:p(Ml);break;case 10:$t(t.type);break;case 22:case 23:yt(t),Ii(),l!==null&&p(Xa);break;case 24:$t(Nl)}}function gu(l,t){try{var a=t.updateQueue,e=a!==null?a.lastEffect:null;if(e!==null){var u=e.next;a=u;do{if((a.tag&l)===l){e=void 0;var n=a.create,i=a.inst;e=n(),i.destroy=e}a=a.next}while(a!==u)}}catch(c){fl(t,t.return,c)}}function Sa(l,t,a){try{var e=t.updateQueue,u=e!==null?e.lastEffect:null;if(u!==null){var n=u.next;e=n;do{if((e.tag&l)===l){var i=e.inst,c=i.destroy;if(c!==void 0){i.destroy=void 0,u=t;var f=a,v=c;try{v()}catch(S){fl(u,f,S)}}}e=e.next}while(e!==n)}}catch(S){fl(t,t.return,S)}}function $o(l){var t=l.updateQueue;if(t!==null){var a=l.stateNode;try{Ys(t,a)}catch(e){fl(l,l.return,e)}}}function ko(l,t,a){a.props=Ja(l.type,l.memoizedProps),a.state=l.memoizedState;try{a.componentWillUnmount()}catch(e){fl(l,t,e)}}function Su(l,t){try{var a=l.ref;if(a!==null){switch(l.tag){case 26:case 27:case 5:var e=l.stateNode;break;case 30:e=l.stateNode;break;default:e=l.stateNode}typeof a=="function"?l.refCleanup=a(e):a.current=e}}catch(u){fl(l,t,u)}}function Yt(l,t){var a=l.ref,e=l.refCleanup;if(a!==null)if(typeof e=="function")try{e()}catch(u){fl(l,t,u)}finally{l.refCleanup=null,l=l.alternate,l!=null&&(l.refCleanup=null)}else if(typeof a=="function")try{a(null)}catch(u){fl(l,t,u)}else a.current=null}function Fo(l){var t=l.type,a=l.memoizedProps,e=l.stateNode;try{l:switch(t){case"button":case"input":case"select":case"textarea":a.autoFocus&&e.focus();break l;case"img":a.src?e.src=a.src:a.srcSet&&(e.srcset=a.srcSet)}}catch(u){fl(l,l.return,u)}}function Nc(l,t,a){try{var e=l.stateNode;Ev(e,l.type,a,t),e[et]=t}catch(u){fl(l,l.return,u)}}function Io(l){return l.tag===5||l.tag===3||l.tag===26||l.tag===27&&_a(l.type)||l.tag===4}function Uc(l){l:for(;;){for(;l.sibling===null;){if(l.return===null||Io(l.return))return null;l=l.return}for(l.sibling.return=l.return,l=l.sibling;l.tag!==5&&l.tag!==6&&l.tag!==18;){if(l.tag===27&&_a(l.type)||l.flags&2||l.child===null||l.tag===4)continue l;l.child.return=l,l=l.child}if(!(l.flags&2))return l.stateNode}}function Cc(l,t,a){var e=l.tag;if(e===5||e===6)l=l.stateNode,t?(a.nodeType===9?a.body:a.nodeName==="HTML"?a.ownerDocument.body:a).insertBefore(l,t):(t=a.nodeType===9?a.body:a.nodeName==="HTML"?a.ownerDocument.body:a,t.appendChild(l),a=a._reactRootContainer,a!=null||t.onclick!==null||(t.onclick=Vt));else if(e!==4&&(e===27&&_a(l.type)&&(a=l.stateNode,t=null),l=l.child,l!==null))for(Cc(l,t,a),l=l.sibling;l!==null;)Cc(l,t,a),l=l.sibling}function Dn(l,t,a){var e=l.tag;if(e===5||e===6)l=l.stateNode,t?a.insertBefore(l,t):a.appendChild(l);else if(e!==4&&(e===27&&_a(l.type)&&(a=l.stateNode),l=l.child,l!==null))for(Dn(l,t,a),l=l.sibling;l!==null;)Dn(l,t,a),l=l.sibling}function Po(l){var t=l.stateNode,a=l.memoizedProps;try{for(var e=l.type,u=t.attributes;u.length;)t.removeAttributeNode(u[0]);wl(t,e,a),t[Ll]=l,t[et]=a}catch(n){fl(l,l.return,n)}}var la=!1,Rl=!1,Rc=!1,ld=typeof WeakSet=="function"?WeakSet:Set,Gl=null;function Pm(l,t){if(l=l.containerInfo,lf=kn,l=ds(l),Oi(l)){if("selectionStart"in l)var a={start:l.selectionStart,end:l.selectionEnd};else l:{a=(a=l.ownerDocument)&&a.defaultView||window;var e=a.getSelection&&a.getSelection();if(e&&e.rangeCount!==0){a=e.anchorNode;var u=e.anchorOffset,n=e.focusNode;e=e.focusOffset;try{a.nodeType,n.nodeType}catch{a=null;break l}var i=0,c=-1,f=-1,v=0,S=0,E=l,y=null;t:for(;;){for(var h;E!==a||u!==0&&E.nodeType!==3||(c=i+u),E!==n||e!==0&&E.nodeType!==3||(f=i+e),E.nodeType===3&&(i+=E.nodeValue.length),(h=E.firstChild)!==null;)y=E,E=h;for(;;){if(E===l)break t;if(y===a&&++v===u&&(c=i),y===n&&++S===e&&(f=i),(h=E.nextSibling)!==null)break;E=y,y=E.parentNode}E=h}a=c===-1||f===-1?null:{start:c,end:f}}else a=null}a=a||{start:0,end:0}}else a=null;for(tf={focusedElem:l,selectionRange:a},kn=!1,Gl=t;Gl!==null;)if(t=Gl,l=t.child,(t.subtreeFlags&1028)!==0&&l!==null)l.return=t,Gl=l;else for(;Gl!==null;){switch(t=Gl,n=t.alternate,l=t.flags,t.tag){case 0:if((l&4)!==0&&(l=t.updateQueue,l=l!==null?l.events:null,l!==null))for(a=0;a<l.length;a++)u=l[a],u.ref.impl=u.nextImpl;break;case 11:case 15:break;case 1:if((l&1024)!==0&&n!==null){l=void 0,a=t,u=n.memoizedProps,n=n.memoizedState,e=a.stateNode;try{var M=Ja(a.type,u);l=e.getSnapshotBeforeUpdate(M,n),e.__reactInternalSnapshotBeforeUpdate=l}catch(q){fl(a,a.return,q)}}break;case 3:if((l&1024)!==0){if(l=t.stateNode.containerInfo,a=l.nodeType,a===9)uf(l);else if(a===1)switch(l.nodeName){case"HEAD":case"HTML":case"BODY":uf(l);break;default:l.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((l&1024)!==0)throw Error(r(163))}if(l=t.sibling,l!==null){l.return=t.return,Gl=l;break}Gl=t.return}}function td(l,t,a){var e=a.flags;switch(a.tag){case 0:case 11:case 15:aa(l,a),e&4&&gu(5,a);break;case 1:if(aa(l,a),e&4)if(l=a.stateNode,t===null)try{l.componentDidMount()}catch(i){fl(a,a.return,i)}else{var u=Ja(a.type,t.memoizedProps);t=t.memoizedState;try{l.componentDidUpdate(u,t,l.__reactInternalSnapshotBeforeUpdate)}catch(i){fl(a,a.return,i)}}e&64&&$o(a),e&512&&Su(a,a.return);break;case 3:if(aa(l,a),e&64&&(l=a.updateQueue,l!==null)){if(t=null,a.child!==null)switch(a.child.tag){case 27:case 5:t=a.child.stateNode;break;case 1:t=a.child.stateNode}try{Ys(l,t)}catch(i){fl(a,a.return,i)}}break;case 27:t===null&&e&4&&Po(a);case 26:case 5:aa(l,a),t===null&&e&4&&Fo(a),e&512&&Su(a,a.return);break;case 12:aa(l,a);break;case 31:aa(l,a),e&4&&ud(l,a);break;case 13:aa(l,a),e&4&&nd(l,a),e&64&&(l=a.memoizedState,l!==null&&(l=l.dehydrated,l!==null&&(a=fv.bind(null,a),Mv(l,a))));break;case 22:if(e=a.memoizedState!==null||la,!e){t=t!==null&&t.memoizedState!==null||Rl,u=la;var n=Rl;la=e,(Rl=t)&&!n?ea(l,a,(a.subtreeFlags&8772)!==0):aa(l,a),la=u,Rl=n}break;case 30:break;default:aa(l,a)}}function ad(l){var t=l.alternate;t!==null&&(l.alternate=null,ad(t)),l.child=null,l.deletions=null,l.sibling=null,l.tag===5&&(t=l.stateNode,t!==null&&si(t)),l.stateNode=null,l.return=null,l.dependencies=null,l.memoizedProps=null,l.memoizedState=null,l.pendingProps=null,l.stateNode=null,l.updateQueue=null}var El=null,nt=!1;function ta(l,t,a){for(a=a.child;a!==null;)ed(l,t,a),a=a.sibling}function ed(l,t,a){if(gl&&typeof gl.onCommitFiberUnmount=="function")try{gl.onCommitFiberUnmount(xl,a)}catch{}switch(a.tag){case 26:Rl||Yt(a,t),ta(l,t,a),a.memoizedState?a.memoizedState.count--:a.stateNode&&(a=a.stateNode,a.parentNode.removeChild(a));break;case 27:Rl||Yt(a,t);var e=El,u=nt;_a(a.type)&&(El=a.stateNode,nt=!1),ta(l,t,a),xu(a.stateNode),El=e,nt=u;break;case 5:Rl||Yt(a,t);case 6:if(e=El,u=nt,El=null,ta(l,t,a),El=e,nt=u,El!==null)if(nt)try{(El.nodeType===9?El.body:El.nodeName==="HTML"?El.ownerDocument.body:El).removeChild(a.stateNode)}catch(n){fl(a,t,n)}else try{El.removeChild(a.stateNode)}catch(n){fl(a,t,n)}break;case 18:El!==null&&(nt?(l=El,$d(l.nodeType===9?l.body:l.nodeName==="HTML"?l.ownerDocument.body:l,a.stateNode),je(l)):$d(El,a.stateNode));break;case 4:e=El,u=nt,El=a.stateNode.containerInfo,nt=!0,ta(l,t,a),El=e,nt=u;break;case 0:case 11:case 14:case 15:Sa(2,a,t),Rl||Sa(4,a,t),ta(l,t,a);break;case 1:Rl||(Yt(a,t),e=a.stateNode,typeof e.componentWillUnmount=="function"&&ko(a,t,e)),ta(l,t,a);break;case 21:ta(l,t,a);break;case 22:Rl=(e=Rl)||a.memoizedState!==null,ta(l,t,a),Rl=e;break;default:ta(l,t,a)}}function ud(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null))){l=l.dehydrated;try{je(l)}catch(a){fl(t,t.return,a)}}}function nd(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null&&(l=l.dehydrated,l!==null))))try{je(l)}catch(a){fl(t,t.return,a)}}function lv(l){switch(l.tag){case 31:case 13:case 19:var t=l.stateNode;return t===null&&(t=l.stateNode=new ld),t;case 22:return l=l.stateNode,t=l._retryCache,t===null&&(t=l._retryCache=new ld),t;default:throw Error(r(435,l.tag))}}function Nn(l,t){var a=lv(l);t.forEach(function(e){if(!a.has(e)){a.add(e);var u=sv.bind(null,l,e);e.then(u,u)}})}function it(l,t){var a=t.deletions;if(a!==null)for(var e=0;e<a.length;e++){var u=a[e],n=l,i=t,c=i;l:for(;c!==null;){switch(c.tag){case 27:if(_a(c.type)){El=c.stateNode,nt=!1;break l}break;case 5:El=c.stateNode,nt=!1;break l;case 3:case 4:El=c.stateNode.containerInfo,nt=!0;break l}c=c.return}if(El===null)throw Error(r(160));ed(n,i,u),El=null,nt=!1,n=u.alternate,n!==null&&(n.return=null),u.return=null}if(t.subtreeFlags&13886)for(t=t.child;t!==null;)id(t,l),t=t.sibling}var Rt=null;function id(l,t){var a=l.alternate,e=l.flags;switch(l.tag){case 0:case 11:case 14:case 15:it(t,l),ct(l),e&4&&(Sa(3,l,l.return),gu(3,l),Sa(5,l,l.return));break;case 1:it(t,l),ct(l),e&512&&(Rl||a===null||Yt(a,a.return)),e&64&&la&&(l=l.updateQueue,l!==null&&(e=l.callbacks,e!==null&&(a=l.shared.hiddenCallbacks,l.shared.hiddenCallbacks=a===null?e:a.concat(e))));break;case 26:var u=Rt;if(it(t,l),ct(l),e&512&&(Rl||a===null||Yt(a,a.return)),e&4){var n=a!==null?a.memoizedState:null;if(e=l.memoizedState,a===null)if(e===null)if(l.stateNode===null){l:{e=l.type,a=l.memoizedProps,u=u.ownerDocument||u;t:switch(e){case"title":n=u.getElementsByTagName("title")[0],(!n||n[Ke]||n[Ll]||n.namespaceURI==="http://www.w3.org/2000/svg"||n.hasAttribute("itemprop"))&&(n=u.createElement(e),u.head.insertBefore(n,u.querySelector("head > title"))),wl(n,e,a),n[Ll]=l,Yl(n),e=n;break l;case"link":var i=i0("link","href",u).get(e+(a.href||""));if(i){for(var c=0;c<i.length;c++)if(n=i[c],n.getAttribute("href")===(a.href==null||a.href===""?null:a.href)&&n.getAttribute("rel")===(a.rel==null?null:a.rel)&&n.getAttribute("title")===(a.title==null?null:a.title)&&n.getAttribute("crossorigin")===(a.crossOrigin==null?null:a.crossOrigin)){i.splice(c,1);break t}}n=u.createElement(e),wl(n,e,a),u.head.appendChild(n);break;case"meta":if(i=i0("meta","content",u).get(e+(a.content||""))){for(c=0;c<i.length;c++)if(n=i[c],n.getAttribute("content")===(a.content==null?null:""+a.content)&&n.getAttribute("name")===(a.name==null?null:a.name)&&n.getAttribute("property")===(a.property==null?null:a.property)&&n.getAttribute("http-equiv")===(a.httpEquiv==null?null:a.httpEquiv)&&n.getAttribute("charset")===(a.charSet==null?null:a.charSet)){i.splice(c,1);break t}}n=u.createElement(e),wl(n,e,a),u.head.appendChild(n);break;default:throw Error(r(468,e))}n[Ll]=l,Yl(n),e=n}l.stateNode=e}else c0(u,l.type,l.stateNode);else l.stateNode=n0(u,e,l.memoizedProps);else n!==e?(n===null?a.stateNode!==null&&(a=a.stateNode,a.parentNode.removeChild(a)):n.count--,e===null?c0(u,l.type,l.stateNode):n0(u,e,l.memoizedProps)):e===null&&l.stateNode!==null&&Nc(l,l.memoizedProps,a.memoizedProps)}break;case 27:it(t,l),ct(l),e&512&&(Rl||a===null||Yt(a,a.return)),a!==null&&e&4&&Nc(l,l.memoizedProps,a.memoizedProps);break;case 5:if(it(t,l),ct(l),e&512&&(Rl||a===null||Yt(a,a.return)),l.flags&32){u=l.stateNode;try{ue(u,"")}catch(M){fl(l,l.return,M)}}e&4&&l.stateNode!=null&&(u=l.memoizedProps,Nc(l,u,a!==null?a.memoizedProps:u)),e&1024&&(Rc=!0);break;case 6:if(it(t,l),ct(l),e&4){if(l.stateNode===null)throw Error(r(162));e=l.memoizedProps,a=l.stateNode;try{a.nodeValue=e}catch(M){fl(l,l.return,M)}}break;case 3:if(Jn=null,u=Rt,Rt=Vn(t.containerInfo),it(t,l),Rt=u,ct(l),e&4&&a!==null&&a.memoizedState.isDehydrated)try{je(t.containerInfo)}catch(M){fl(l,l.return,M)}Rc&&(Rc=!1,cd(l));break;case 4:e=Rt,Rt=Vn(l.stateNode.containerInfo),it(t,l),ct(l),Rt=e;break;case 12:it(t,l),ct(l);break;case 31:it(t,l),ct(l),e&4&&(e=l.updateQueue,e!==null&&(l.updateQueue=null,Nn(l,e)));break;case 13:it(t,l),ct(l),l.child.flags&8192&&l.memoizedState!==null!=(a!==null&&a.memoizedState!==null)&&(Cn=Zl()),e&4&&(e=l.updateQueue,e!==null&&(l.updateQueue=null,Nn(l,e)));break;case 22:u=l.memoizedState!==null;var f=a!==null&&a.memoizedState!==null,v=la,S=Rl;if(la=v||u,Rl=S||f,it(t,l),Rl=S,la=v,ct(l),e&8192)l:for(t=l.stateNode,t._visibility=u?t._visibility&-2:t._visibility|1,u&&(a===null||f||la||Rl||wa(l)),a=null,t=l;;){if(t.tag===5||t.tag===26){if(a===null){f=a=t;try{if(n=f.stateNode,u)i=n.style,typeof i.setProperty=="function"?i.setProperty("display","none","important"):i.display="none";else{c=f.stateNode;var E=f.memoizedProps.style,y=E!=null&&E.hasOwnProperty("display")?E.display:null;c.style.display=y==null||typeof y=="boolean"?"":(""+y).trim()}}catch(M){fl(f,f.return,M)}}}else if(t.tag===6){if(a===null){f=t;try{f.stateNode.nodeValue=u?"":f.memoizedProps}catch(M){fl(f,f.return,M)}}}else if(t.tag===18){if(a===null){f=t;try{var h=f.stateNode;u?kd(h,!0):kd(f.stateNode,!1)}catch(M){fl(f,f.return,M)}}}else if((t.tag!==22&&t.tag!==23||t.memoizedState===null||t===l)&&t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break l;for(;t.sibling===null;){if(t.return===null||t.return===l)break l;a===t&&(a=null),t=t.return}a===t&&(a=null),t.sibling.return=t.return,t=t.sibling}e&4&&(e=l.updateQueue,e!==null&&(a=e.retryQueue,a!==null&&(e.retryQueue=null,Nn(l,a))));break;case 19:it(t,l),ct(l),e&4&&(e=l.updateQueue,e!==null&&(l.updateQueue=null,Nn(l,e)));break;case 30:break;case 21:break;default:it(t,l),ct(l)}}function ct(l){var t=l.flags;if(t&2){try{for(var a,e=l.return;e!==null;){if(Io(e)){a=e;break}e=e.return}if(a==null)throw Error(r(160));switch(a.tag){case 27:var u=a.stateNode,n=Uc(l);Dn(l,n,u);break;case 5:var i=a.stateNode;a.flags&32&&(ue(i,""),a.flags&=-33);var c=Uc(l);Dn(l,c,i);break;case 3:case 4:var f=a.stateNode.containerInfo,v=Uc(l);Cc(l,v,f);break;default:throw Error(r(161))}}catch(S){fl(l,l.return,S)}l.flags&=-3}t&4096&&(l.flags&=-4097)}function cd(l){if(l.subtreeFlags&1024)for(l=l.child;l!==null;){var t=l;cd(t),t.tag===5&&t.flags&1024&&t.stateNode.reset(),l=l.sibling}}function aa(l,t){if(t.subtreeFlags&8772)for(t=t.child;t!==null;)td(l,t.alternate,t),t=t.sibling}function wa(l){for(l=l.child;l!==null;){var t=l;switch(t.tag){case 0:case 11:case 14:case 15:Sa(4,t,t.return),wa(t);break;case 1:Yt(t,t.return);var a=t.stateNode;typeof a.componentWillUnmount=="function"&&ko(t,t.return,a),wa(t);break;case 27:xu(t.stateNode);case 26:case 5:Yt(t,t.return),wa(t);break;case 22:t.memoizedState===null&&wa(t);break;case 30:wa(t);break;default:wa(t)}l=l.sibling}}function ea(l,t,a){for(a=a&&(t.subtreeFlags&8772)!==0,t=t.child;t!==null;){var e=t.alternate,u=l,n=t,i=n.flags;switch(n.tag){case 0:case 11:case 15:ea(u,n,a),gu(4,n);break;case 1:if(ea(u,n,a),e=n,u=e.stateNode,typeof u.componentDidMount=="function")try{u.componentDidMount()}catch(v){fl(e,e.return,v)}if(e=n,u=e.updateQueue,u!==null){var c=e.stateNode;try{var f=u.shared.hiddenCallbacks;if(f!==null)for(u.shared.hiddenCallbacks=null,u=0;u<f.length;u++)Bs(f[u],c)}catch(v){fl(e,e.return,v)}}a&&i&64&&$o(n),Su(n,n.return);break;case 27:Po(n);case 26:case 5:ea(u,n,a),a&&e===null&&i&4&&Fo(n),Su(n,n.return);break;case 12:ea(u,n,a);break;case 31:ea(u,n,a),a&&i&4&&ud(u,n);break;case 13:ea(u,n,a),a&&i&4&&nd(u,n);break;case 22:n.memoizedState===null&&ea(u,n,a),Su(n,n.return);break;case 30:break;default:ea(u,n,a)}t=t.sibling}}function Hc(l,t){var a=null;l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(a=l.memoizedState.cachePool.pool),l=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(l=t.memoizedState.cachePool.pool),l!==a&&(l!=null&&l.refCount++,a!=null&&uu(a))}function jc(l,t){l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&uu(l))}function Ht(l,t,a,e){if(t.subtreeFlags&10256)for(t=t.child;t!==null;)fd(l,t,a,e),t=t.sibling}function fd(l,t,a,e){var u=t.flags;switch(t.tag){case 0:case 11:case 15:Ht(l,t,a,e),u&2048&&gu(9,t);break;case 1:Ht(l,t,a,e);break;case 3:Ht(l,t,a,e),u&2048&&(l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&uu(l)));break;case 12:if(u&2048){Ht(l,t,a,e),l=t.stateNode;try{var n=t.memoizedProps,i=n.id,c=n.onPostCommit;typeof c=="function"&&c(i,t.alternate===null?"mount":"update",l.passiveEffectDuration,-0)}catch(f){fl(t,t.return,f)}}else Ht(l,t,a,e);break;case 31:Ht(l,t,a,e);break;case 13:Ht(l,t,a,e);break;case 23:break;case 22:n=t.stateNode,i=t.alternate,t.memoizedState!==null?n._visibility&2?Ht(l,t,a,e):bu(l,t):n._visibility&2?Ht(l,t,a,e):(n._visibility|=2,Ae(l,t,a,e,(t.subtreeFlags&10256)!==0||!1)),u&2048&&Hc(i,t);break;case 24:Ht(l,t,a,e),u&2048&&jc(t.alternate,t);break;default:Ht(l,t,a,e)}}function Ae(l,t,a,e,u){for(u=u&&((t.subtreeFlags&10256)!==0||!1),t=t.child;t!==null;){var n=l,i=t,c=a,f=e,v=i.flags;switch(i.tag){case 0:case 11:case 15:Ae(n,i,c,f,u),gu(8,i);break;case 23:break;case 22:var S=i.stateNode;i.memoizedState!==null?S._visibility&2?Ae(n,i,c,f,u):bu(n,i):(S._visibility|=2,Ae(n,i,c,f,u)),u&&v&2048&&Hc(i.alternate,i);break;case 24:Ae(n,i,c,f,u),u&&v&2048&&jc(i.alternate,i);break;default:Ae(n,i,c,f,u)}t=t.sibling}}function bu(l,t){if(t.subtreeFlags&10256)for(t=t.child;t!==null;){var a=l,e=t,u=e.flags;switch(e.tag){case 22:bu(a,e),u&2048&&Hc(e.alternate,e);break;case 24:bu(a,e),u&2048&&jc(e.alternate,e);break;default:bu(a,e)}t=t.sibling}}var Eu=8192;function _e(l,t,a){if(l.subtreeFlags&Eu)for(l=l.child;l!==null;)sd(l,t,a),l=l.sibling}function sd(l,t,a){switch(l.tag){case 26:_e(l,t,a),l.flags&Eu&&l.memoizedState!==null&&Qv(a,Rt,l.memoizedState,l.memoizedProps);break;case 5:_e(l,t,a);break;case 3:case 4:var e=Rt;Rt=Vn(l.stateNode.containerInfo),_e(l,t,a),Rt=e;break;case 22:l.memoizedState===null&&(e=l.alternate,e!==null&&e.memoizedState!==null?(e=Eu,Eu=16777216,_e(l,t,a),Eu=e):_e(l,t,a));break;default:_e(l,t,a)}}function od(l){var t=l.alternate;if(t!==null&&(l=t.child,l!==null)){t.child=null;do t=l.sibling,l.sibling=null,l=t;while(l!==null)}}function pu(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var a=0;a<t.length;a++){var e=t[a];Gl=e,md(e,l)}od(l)}if(l.subtreeFlags&10256)for(l=l.child;l!==null;)dd(l),l=l.sibling}function dd(l){switch(l.tag){case 0:case 11:case 15:pu(l),l.flags&2048&&Sa(9,l,l.return);break;case 3:pu(l);break;case 12:pu(l);break;case 22:var t=l.stateNode;l.memoizedState!==null&&t._visibility&2&&(l.return===null||l.return.tag!==13)?(t._visibility&=-3,Un(l)):pu(l);break;default:pu(l)}}function Un(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var a=0;a<t.length;a++){var e=t[a];Gl=e,md(e,l)}od(l)}for(l=l.child;l!==null;){switch(t=l,t.tag){case 0:case 11:case 15:Sa(8,t,t.return),Un(t);break;case 22:a=t.stateNode,a._visibility&2&&(a._visibility&=-3,Un(t));break;default:Un(t)}l=l.sibling}}function md(l,t){for(;Gl!==null;){var a=Gl;switch(a.tag){case 0:case 11:case 15:Sa(8,a,t);break;case 23:case 22:if(a.memoizedState!==null&&a.memoizedState.cachePool!==null){var e=a.memoizedState.cachePool.pool;e!=null&&e.refCount++}break;case 24:uu(a.memoizedState.cache)}if(e=a.child,e!==null)e.return=a,Gl=e;else l:for(a=l;Gl!==null;){e=Gl;var u=e.sibling,n=e.return;if(ad(e),e===a){Gl=null;break l}if(u!==null){u.return=n,Gl=u;break l}Gl=n}}}var tv={getCacheForType:function(l){var t=Kl(Nl),a=t.data.get(l);return a===void 0&&(a=l(),t.data.set(l,a)),a},cacheSignal:function(){return Kl(Nl).controller.signal}},av=typeof WeakMap=="function"?WeakMap:Map,ul=0,yl=null,J=null,W=0,cl=0,rt=null,ba=!1,Oe=!1,qc=!1,ua=0,Ol=0,Ea=0,Wa=0,Bc=0,ht=0,xe=0,zu=null,ft=null,Yc=!1,Cn=0,vd=0,Rn=1/0,Hn=null,pa=null,ql=0,za=null,Me=null,na=0,Gc=0,Qc=null,yd=null,Tu=0,Xc=null;function gt(){return(ul&2)!==0&&W!==0?W&-W:g.T!==null?wc():Df()}function rd(){if(ht===0)if((W&536870912)===0||F){var l=Xu;Xu<<=1,(Xu&3932160)===0&&(Xu=262144),ht=l}else ht=536870912;return l=vt.current,l!==null&&(l.flags|=32),ht}function st(l,t,a){(l===yl&&(cl===2||cl===9)||l.cancelPendingCommit!==null)&&(De(l,0),Ta(l,W,ht,!1)),Ve(l,a),((ul&2)===0||l!==yl)&&(l===yl&&((ul&2)===0&&(Wa|=a),Ol===4&&Ta(l,W,ht,!1)),Gt(l))}function hd(l,t,a){if((ul&6)!==0)throw Error(r(327));var e=!a&&(t&127)===0&&(t&l.expiredLanes)===0||Le(l,t),u=e?nv(l,t):Lc(l,t,!0),n=e;do{if(u===0){Oe&&!e&&Ta(l,t,0,!1);break}else{if(a=l.current.alternate,n&&!ev(a)){u=Lc(l,t,!1),n=!1;continue}if(u===2){if(n=t,l.errorRecoveryDisabledLanes&n)var i=0;else i=l.pendingLanes&-536870913,i=i!==0?i:i&536870912?536870912:0;if(i!==0){t=i;l:{var c=l;u=zu;var f=c.current.memoizedState.isDehydrated;if(f&&(De(c,i).flags|=256),i=Lc(c,i,!1),i!==2){if(qc&&!f){c.errorRecoveryDisabledLanes|=n,Wa|=n,u=4;break l}n=ft,ft=u,n!==null&&(ft===null?ft=n:ft.push.apply(ft,n))}u=i}if(n=!1,u!==2)continue}}if(u===1){De(l,0),Ta(l,t,0,!0);break}l:{switch(e=l,n=u,n){case 0:case 1:throw Error(r(345));case 4:if((t&4194048)!==t)break;case 6:Ta(e,t,ht,!ba);break l;case 2:ft=null;break;case 3:case 5:break;default:throw Error(r(329))}if((t&62914560)===t&&(u=Cn+300-Zl(),10<u)){if(Ta(e,t,ht,!ba),Lu(e,0,!0)!==0)break l;na=t,e.timeoutHandle=wd(gd.bind(null,e,a,ft,Hn,Yc,t,ht,Wa,xe,ba,n,"Throttled",-0,0),u);break l}gd(e,a,ft,Hn,Yc,t,ht,Wa,xe,ba,n,null,-0,0)}}break}while(!0);Gt(l)}function gd(l,t,a,e,u,n,i,c,f,v,S,E,y,h){if(l.timeoutHandle=-1,E=t.subtreeFlags,E&8192||(E&16785408)===16785408){E={stylesheets:null,count:0,imgCount:0,imgBytes:0,suspenseyImages:[],waitingForImages:!0,waitingForViewTransition:!1,unsuspend:Vt},sd(t,n,E);var M=(n&62914560)===n?Cn-Zl():(n&4194048)===n?vd-Zl():0;if(M=Xv(E,M),M!==null){na=n,l.cancelPendingCommit=M(_d.bind(null,l,t,n,a,e,u,i,c,f,S,E,null,y,h)),Ta(l,n,i,!v);return}}_d(l,t,n,a,e,u,i,c,f)}function ev(l){for(var t=l;;){var a=t.tag;if((a===0||a===11||a===15)&&t.flags&16384&&(a=t.updateQueue,a!==null&&(a=a.stores,a!==null)))for(var e=0;e<a.length;e++){var u=a[e],n=u.getSnapshot;u=u.value;try{if(!dt(n(),u))return!1}catch{return!1}}if(a=t.child,t.subtreeFlags&16384&&a!==null)a.return=t,t=a;else{if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function Ta(l,t,a,e){t&=~Bc,t&=~Wa,l.suspendedLanes|=t,l.pingedLanes&=~t,e&&(l.warmLanes|=t),e=l.expirationTimes;for(var u=t;0<u;){var n=31-Bl(u),i=1<<n;e[n]=-1,u&=~i}a!==0&&Of(l,a,t)}function jn(){return(ul&6)===0?(Au(0),!1):!0}function Zc(){if(J!==null){if(cl===0)var l=J.return;else l=J,Wt=Ga=null,uc(l),be=null,iu=0,l=J;for(;l!==null;)Wo(l.alternate,l),l=l.return;J=null}}function De(l,t){var a=l.timeoutHandle;a!==-1&&(l.timeoutHandle=-1,Tv(a)),a=l.cancelPendingCommit,a!==null&&(l.cancelPendingCommit=null,a()),na=0,Zc(),yl=l,J=a=Jt(l.current,null),W=t,cl=0,rt=null,ba=!1,Oe=Le(l,t),qc=!1,xe=ht=Bc=Wa=Ea=Ol=0,ft=zu=null,Yc=!1,(t&8)!==0&&(t|=t&32);var e=l.entangledLanes;if(e!==0)for(l=l.entanglements,e&=t;0<e;){var u=31-Bl(e),n=1<<u;t|=l[u],e&=~n}return ua=t,tn(),a}function Sd(l,t){X=null,g.H=yu,t===Se||t===on?(t=Rs(),cl=3):t===Ji?(t=Rs(),cl=4):cl=t===Ec?8:t!==null&&typeof t=="object"&&typeof t.then=="function"?6:1,rt=t,J===null&&(Ol=1,An(l,At(t,l.current)))}function bd(){var l=vt.current;return l===null?!0:(W&4194048)===W?Mt===null:(W&62914560)===W||(W&536870912)!==0?l===Mt:!1}function Ed(){var l=g.H;return g.H=yu,l===null?yu:l}function pd(){var l=g.A;return g.A=tv,l}function qn(){Ol=4,ba||(W&4194048)!==W&&vt.current!==null||(Oe=!0),(Ea&134217727)===0&&(Wa&134217727)===0||yl===null||Ta(yl,W,ht,!1)}function Lc(l,t,a){var e=ul;ul|=2;var u=Ed(),n=pd();(yl!==l||W!==t)&&(Hn=null,De(l,t)),t=!1;var i=Ol;l:do try{if(cl!==0&&J!==null){var c=J,f=rt;switch(cl){case 8:Zc(),i=6;break l;case 3:case 2:case 9:case 6:vt.current===null&&(t=!0);var v=cl;if(cl=0,rt=null,Ne(l,c,f,v),a&&Oe){i=0;break l}break;default:v=cl,cl=0,rt=null,Ne(l,c,f,v)}}uv(),i=Ol;break}catch(S){Sd(l,S)}while(!0);return t&&l.shellSuspendCounter++,Wt=Ga=null,ul=e,g.H=u,g.A=n,J===null&&(yl=null,W=0,tn()),i}function uv(){for(;J!==null;)zd(J)}function nv(l,t){var a=ul;ul|=2;var e=Ed(),u=pd();yl!==l||W!==t?(Hn=null,Rn=Zl()+500,De(l,t)):Oe=Le(l,t);l:do try{if(cl!==0&&J!==null){t=J;var n=rt;t:switch(cl){case 1:cl=0,rt=null,Ne(l,t,n,1);break;case 2:case 9:if(Us(n)){cl=0,rt=null,Td(t);break}t=function(){cl!==2&&cl!==9||yl!==l||(cl=7),Gt(l)},n.then(t,t);break l;case 3:cl=7;break l;case 4:cl=5;break l;case 7:Us(n)?(cl=0,rt=null,Td(t)):(cl=0,rt=null,Ne(l,t,n,7));break;case 5:var i=null;switch(J.tag){case 26:i=J.memoizedState;case 5:case 27:var c=J;if(i?f0(i):c.stateNode.complete){cl=0,rt=null;var f=c.sibling;if(f!==null)J=f;else{var v=c.return;v!==null?(J=v,Bn(v)):J=null}break t}}cl=0,rt=null,Ne(l,t,n,5);break;case 6:cl=0,rt=null,Ne(l,t,n,6);break;case 8:Zc(),Ol=6;break l;default:throw Error(r(462))}}iv();break}catch(S){Sd(l,S)}while(!0);return Wt=Ga=null,g.H=e,g.A=u,ul=a,J!==null?0:(yl=null,W=0,tn(),Ol)}function iv(){for(;J!==null&&!ui();)zd(J)}function zd(l){var t=Jo(l.alternate,l,ua);l.memoizedProps=l.pendingProps,t===null?Bn(l):J=t}function Td(l){var t=l,a=t.alternate;switch(t.tag){case 15:case 0:t=Qo(a,t,t.pendingProps,t.type,void 0,W);break;case 11:t=Qo(a,t,t.pendingProps,t.type.render,t.ref,W);break;case 5:uc(t);default:Wo(a,t),t=J=Es(t,ua),t=Jo(a,t,ua)}l.memoizedProps=l.pendingProps,t===null?Bn(l):J=t}function Ne(l,t,a,e){Wt=Ga=null,uc(t),be=null,iu=0;var u=t.return;try{if(Wm(l,u,t,a,W)){Ol=1,An(l,At(a,l.current)),J=null;return}}catch(n){if(u!==null)throw J=u,n;Ol=1,An(l,At(a,l.current)),J=null;return}t.flags&32768?(F||e===1?l=!0:Oe||(W&536870912)!==0?l=!1:(ba=l=!0,(e===2||e===9||e===3||e===6)&&(e=vt.current,e!==null&&e.tag===13&&(e.flags|=16384))),Ad(t,l)):Bn(t)}function Bn(l){var t=l;do{if((t.flags&32768)!==0){Ad(t,ba);return}l=t.return;var a=Fm(t.alternate,t,ua);if(a!==null){J=a;return}if(t=t.sibling,t!==null){J=t;return}J=t=l}while(t!==null);Ol===0&&(Ol=5)}function Ad(l,t){do{var a=Im(l.alternate,l);if(a!==null){a.flags&=32767,J=a;return}if(a=l.return,a!==null&&(a.flags|=32768,a.subtreeFlags=0,a.deletions=null),!t&&(l=l.sibling,l!==null)){J=l;return}J=l=a}while(l!==null);Ol=6,J=null}function _d(l,t,a,e,u,n,i,c,f){l.cancelPendingCommit=null;do Yn();while(ql!==0);if((ul&6)!==0)throw Error(r(327));if(t!==null){if(t===l.current)throw Error(r(177));if(n=t.lanes|t.childLanes,n|=Ui,G0(l,a,n,i,c,f),l===yl&&(J=yl=null,W=0),Me=t,za=l,na=a,Gc=n,Qc=u,yd=e,(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?(l.callbackNode=null,l.callbackPriority=0,ov(A,function(){return Nd(),null})):(l.callbackNode=null,l.callbackPriority=0),e=(t.flags&13878)!==0,(t.subtreeFlags&13878)!==0||e){e=g.T,g.T=null,u=O.p,O.p=2,i=ul,ul|=4;try{Pm(l,t,a)}finally{ul=i,O.p=u,g.T=e}}ql=1,Od(),xd(),Md()}}function Od(){if(ql===1){ql=0;var l=za,t=Me,a=(t.flags&13878)!==0;if((t.subtreeFlags&13878)!==0||a){a=g.T,g.T=null;var e=O.p;O.p=2;var u=ul;ul|=4;try{id(t,l);var n=tf,i=ds(l.containerInfo),c=n.focusedElem,f=n.selectionRange;if(i!==c&&c&&c.ownerDocument&&os(c.ownerDocument.documentElement,c)){if(f!==null&&Oi(c)){var v=f.start,S=f.end;if(S===void 0&&(S=v),"selectionStart"in c)c.selectionStart=v,c.selectionEnd=Math.min(S,c.value.length);else{var E=c.ownerDocument||document,y=E&&E.defaultView||window;if(y.getSelection){var h=y.getSelection(),M=c.textContent.length,q=Math.min(f.start,M),vl=f.end===void 0?q:Math.min(f.end,M);!h.extend&&q>vl&&(i=vl,vl=q,q=i);var d=ss(c,q),s=ss(c,vl);if(d&&s&&(h.rangeCount!==1||h.anchorNode!==d.node||h.anchorOffset!==d.offset||h.focusNode!==s.node||h.focusOffset!==s.offset)){var m=E.createRange();m.setStart(d.node,d.offset),h.removeAllRanges(),q>vl?(h.addRange(m),h.extend(s.node,s.offset)):(m.setEnd(s.node,s.offset),h.addRange(m))}}}}for(E=[],h=c;h=h.parentNode;)h.nodeType===1&&E.push({element:h,left:h.scrollLeft,top:h.scrollTop});for(typeof c.focus=="function"&&c.focus(),c=0;c<E.length;c++){var b=E[c];b.element.scrollLeft=b.left,b.element.scrollTop=b.top}}kn=!!lf,tf=lf=null}finally{ul=u,O.p=e,g.T=a}}l.current=t,ql=2}}function xd(){if(ql===2){ql=0;var l=za,t=Me,a=(t.flags&8772)!==0;if((t.subtreeFlags&8772)!==0||a){a=g.T,g.T=null;var e=O.p;O.p=2;var u=ul;ul|=4;try{td(l,t.alternate,t)}finally{ul=u,O.p=e,g.T=a}}ql=3}}function Md(){if(ql===4||ql===3){ql=0,Gu();var l=za,t=Me,a=na,e=yd;(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?ql=5:(ql=0,Me=za=null,Dd(l,l.pendingLanes));var u=l.pendingLanes;if(u===0&&(pa=null),ci(a),t=t.stateNode,gl&&typeof gl.onCommitFiberRoot=="function")try{gl.onCommitFiberRoot(xl,t,void 0,(t.current.flags&128)===128)}catch{}if(e!==null){t=g.T,u=O.p,O.p=2,g.T=null;try{for(var n=l.onRecoverableError,i=0;i<e.length;i++){var c=e[i];n(c.value,{componentStack:c.stack})}}finally{g.T=t,O.p=u}}(na&3)!==0&&Yn(),Gt(l),u=l.pendingLanes,(a&261930)!==0&&(u&42)!==0?l===Xc?Tu++:(Tu=0,Xc=l):Tu=0,Au(0)}}function Dd(l,t){(l.pooledCacheLanes&=t)===0&&(t=l.pooledCache,t!=null&&(l.pooledCache=null,uu(t)))}function Yn(){return Od(),xd(),Md(),Nd()}function Nd(){if(ql!==5)return!1;var l=za,t=Gc;Gc=0;var a=ci(na),e=g.T,u=O.p;try{O.p=32>a?32:a,g.T=null,a=Qc,Qc=null;var n=za,i=na;if(ql=0,Me=za=null,na=0,(ul&6)!==0)throw Error(r(331));var c=ul;if(ul|=4,dd(n.current),fd(n,n.current,i,a),ul=c,Au(0,!1),gl&&typeof gl.onPostCommitFiberRoot=="function")try{gl.onPostCommitFiberRoot(xl,n)}catch{}return!0}finally{O.p=u,g.T=e,Dd(l,t)}}function Ud(l,t,a){t=At(a,t),t=bc(l.stateNode,t,2),l=ra(l,t,2),l!==null&&(Ve(l,2),Gt(l))}function fl(l,t,a){if(l.tag===3)Ud(l,l,a);else for(;t!==null;){if(t.tag===3){Ud(t,l,a);break}else if(t.tag===1){var e=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof e.componentDidCatch=="function"&&(pa===null||!pa.has(e))){l=At(a,l),a=Co(2),e=ra(t,a,2),e!==null&&(Ro(a,e,t,l),Ve(e,2),Gt(e));break}}t=t.return}}function Vc(l,t,a){var e=l.pingCache;if(e===null){e=l.pingCache=new av;var u=new Set;e.set(t,u)}else u=e.get(t),u===void 0&&(u=new Set,e.set(t,u));u.has(a)||(qc=!0,u.add(a),l=cv.bind(null,l,t,a),t.then(l,l))}function cv(l,t,a){var e=l.pingCache;e!==null&&e.delete(t),l.pingedLanes|=l.suspendedLanes&a,l.warmLanes&=~a,yl===l&&(W&a)===a&&(Ol===4||Ol===3&&(W&62914560)===W&&300>Zl()-Cn?(ul&2)===0&&De(l,0):Bc|=a,xe===W&&(xe=0)),Gt(l)}function Cd(l,t){t===0&&(t=_f()),l=qa(l,t),l!==null&&(Ve(l,t),Gt(l))}function fv(l){var t=l.memoizedState,a=0;t!==null&&(a=t.retryLane),Cd(l,a)}function sv(l,t){var a=0;switch(l.tag){case 31:case 13:var e=l.stateNode,u=l.memoizedState;u!==null&&(a=u.retryLane);break;case 19:e=l.stateNode;break;case 22:e=l.stateNode._retryCache;break;default:throw Error(r(314))}e!==null&&e.delete(t),Cd(l,a)}function ov(l,t){return Qe(l,t)}var Gn=null,Ue=null,Kc=!1,Qn=!1,Jc=!1,Aa=0;function Gt(l){l!==Ue&&l.next===null&&(Ue===null?Gn=Ue=l:Ue=Ue.next=l),Qn=!0,Kc||(Kc=!0,mv())}function Au(l,t){if(!Jc&&Qn){Jc=!0;do for(var a=!1,e=Gn;e!==null;){if(l!==0){var u=e.pendingLanes;if(u===0)var n=0;else{var i=e.suspendedLanes,c=e.pingedLanes;n=(1<<31-Bl(42|l)+1)-1,n&=u&~(i&~c),n=n&201326741?n&201326741|1:n?n|2:0}n!==0&&(a=!0,qd(e,n))}else n=W,n=Lu(e,e===yl?n:0,e.cancelPendingCommit!==null||e.timeoutHandle!==-1),(n&3)===0||Le(e,n)||(a=!0,qd(e,n));e=e.next}while(a);Jc=!1}}function dv(){Rd()}function Rd(){Qn=Kc=!1;var l=0;Aa!==0&&zv()&&(l=Aa);for(var t=Zl(),a=null,e=Gn;e!==null;){var u=e.next,n=Hd(e,t);n===0?(e.next=null,a===null?Gn=u:a.next=u,u===null&&(Ue=a)):(a=e,(l!==0||(n&3)!==0)&&(Qn=!0)),e=u}ql!==0&&ql!==5||Au(l),Aa!==0&&(Aa=0)}function Hd(l,t){for(var a=l.suspendedLanes,e=l.pingedLanes,u=l.expirationTimes,n=l.pendingLanes&-62914561;0<n;){var i=31-Bl(n),c=1<<i,f=u[i];f===-1?((c&a)===0||(c&e)!==0)&&(u[i]=Y0(c,t)):f<=t&&(l.expiredLanes|=c),n&=~c}if(t=yl,a=W,a=Lu(l,l===t?a:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),e=l.callbackNode,a===0||l===t&&(cl===2||cl===9)||l.cancelPendingCommit!==null)return e!==null&&e!==null&&Xe(e),l.callbackNode=null,l.callbackPriority=0;if((a&3)===0||Le(l,a)){if(t=a&-a,t===l.callbackPriority)return t;switch(e!==null&&Xe(e),ci(a)){case 2:case 8:a=Fa;break;case 32:a=A;break;case 268435456:a=jl;break;default:a=A}return e=jd.bind(null,l),a=Qe(a,e),l.callbackPriority=t,l.callbackNode=a,t}return e!==null&&e!==null&&Xe(e),l.callbackPriority=2,l.callbackNode=null,2}function jd(l,t){if(ql!==0&&ql!==5)return l.callbackNode=null,l.callbackPriority=0,null;var a=l.callbackNode;if(Yn()&&l.callbackNode!==a)return null;var e=W;return e=Lu(l,l===yl?e:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),e===0?null:(hd(l,e,t),Hd(l,Zl()),l.callbackNode!=null&&l.callbackNode===a?jd.bind(null,l):null)}function qd(l,t){if(Yn())return null;hd(l,t,!0)}function mv(){Av(function(){(ul&6)!==0?Qe(ka,dv):Rd()})}function wc(){if(Aa===0){var l=he;l===0&&(l=Qu,Qu<<=1,(Qu&261888)===0&&(Qu=256)),Aa=l}return Aa}function Bd(l){return l==null||typeof l=="symbol"||typeof l=="boolean"?null:typeof l=="function"?l:wu(""+l)}function Yd(l,t){var a=t.ownerDocument.createElement("input");return a.name=t.name,a.value=t.value,l.id&&a.setAttribute("form",l.id),t.parentNode.insertBefore(a,t),l=new FormData(l),a.parentNode.removeChild(a),l}function vv(l,t,a,e,u){if(t==="submit"&&a&&a.stateNode===u){var n=Bd((u[et]||null).action),i=e.submitter;i&&(t=(t=i[et]||null)?Bd(t.formAction):i.getAttribute("formAction"),t!==null&&(n=t,i=null));var c=new Fu("action","action",null,e,u);l.push({event:c,listeners:[{instance:null,listener:function(){if(e.defaultPrevented){if(Aa!==0){var f=i?Yd(u,i):new FormData(u);vc(a,{pending:!0,data:f,method:u.method,action:n},null,f)}}else typeof n=="function"&&(c.preventDefault(),f=i?Yd(u,i):new FormData(u),vc(a,{pending:!0,data:f,method:u.method,action:n},n,f))},currentTarget:u}]})}}for(var Wc=0;Wc<Ni.length;Wc++){var $c=Ni[Wc],yv=$c.toLowerCase(),rv=$c[0].toUpperCase()+$c.slice(1);Ct(yv,"on"+rv)}Ct(ys,"onAnimationEnd"),Ct(rs,"onAnimationIteration"),Ct(hs,"onAnimationStart"),Ct("dblclick","onDoubleClick"),Ct("focusin","onFocus"),Ct("focusout","onBlur"),Ct(Um,"onTransitionRun"),Ct(Cm,"onTransitionStart"),Ct(Rm,"onTransitionCancel"),Ct(gs,"onTransitionEnd"),ae("onMouseEnter",["mouseout","mouseover"]),ae("onMouseLeave",["mouseout","mouseover"]),ae("onPointerEnter",["pointerout","pointerover"]),ae("onPointerLeave",["pointerout","pointerover"]),Ca("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),Ca("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),Ca("onBeforeInput",["compositionend","keypress","textInput","paste"]),Ca("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),Ca("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),Ca("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var _u="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),hv=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(_u));function Gd(l,t){t=(t&4)!==0;for(var a=0;a<l.length;a++){var e=l[a],u=e.event;e=e.listeners;l:{var n=void 0;if(t)for(var i=e.length-1;0<=i;i--){var c=e[i],f=c.instance,v=c.currentTarget;if(c=c.listener,f!==n&&u.isPropagationStopped())break l;n=c,u.currentTarget=v;try{n(u)}catch(S){ln(S)}u.currentTarget=null,n=f}else for(i=0;i<e.length;i++){if(c=e[i],f=c.instance,v=c.currentTarget,c=c.listener,f!==n&&u.isPropagationStopped())break l;n=c,u.currentTarget=v;try{n(u)}catch(S){ln(S)}u.currentTarget=null,n=f}}}}function w(l,t){var a=t[fi];a===void 0&&(a=t[fi]=new Set);var e=l+"__bubble";a.has(e)||(Qd(t,l,2,!1),a.add(e))}function kc(l,t,a){var e=0;t&&(e|=4),Qd(a,l,e,t)}var Xn="_reactListening"+Math.random().toString(36).slice(2);function Fc(l){if(!l[Xn]){l[Xn]=!0,Cf.forEach(function(a){a!=="selectionchange"&&(hv.has(a)||kc(a,!1,l),kc(a,!0,l))});var t=l.nodeType===9?l:l.ownerDocument;t===null||t[Xn]||(t[Xn]=!0,kc("selectionchange",!1,t))}}function Qd(l,t,a,e){switch(r0(t)){case 2:var u=Vv;break;case 8:u=Kv;break;default:u=vf}a=u.bind(null,t,a,l),u=void 0,!gi||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(u=!0),e?u!==void 0?l.addEventListener(t,a,{capture:!0,passive:u}):l.addEventListener(t,a,!0):u!==void 0?l.addEventListener(t,a,{passive:u}):l.addEventListener(t,a,!1)}function Ic(l,t,a,e,u){var n=e;if((t&1)===0&&(t&2)===0&&e!==null)l:for(;;){if(e===null)return;var i=e.tag;if(i===3||i===4){var c=e.stateNode.containerInfo;if(c===u)break;if(i===4)for(i=e.return;i!==null;){var f=i.tag;if((f===3||f===4)&&i.stateNode.containerInfo===u)return;i=i.return}for(;c!==null;){if(i=Pa(c),i===null)return;if(f=i.tag,f===5||f===6||f===26||f===27){e=n=i;continue l}c=c.parentNode}}e=e.return}Vf(function(){var v=n,S=ri(a),E=[];l:{var y=Ss.get(l);if(y!==void 0){var h=Fu,M=l;switch(l){case"keypress":if($u(a)===0)break l;case"keydown":case"keyup":h=sm;break;case"focusin":M="focus",h=pi;break;case"focusout":M="blur",h=pi;break;case"beforeblur":case"afterblur":h=pi;break;case"click":if(a.button===2)break l;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":h=wf;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":h=F0;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":h=mm;break;case ys:case rs:case hs:h=lm;break;case gs:h=ym;break;case"scroll":case"scrollend":h=$0;break;case"wheel":h=hm;break;case"copy":case"cut":case"paste":h=am;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":h=$f;break;case"toggle":case"beforetoggle":h=Sm}var q=(t&4)!==0,vl=!q&&(l==="scroll"||l==="scrollend"),d=q?y!==null?y+"Capture":null:y;q=[];for(var s=v,m;s!==null;){var b=s;if(m=b.stateNode,b=b.tag,b!==5&&b!==26&&b!==27||m===null||d===null||(b=we(s,d),b!=null&&q.push(Ou(s,b,m))),vl)break;s=s.return}0<q.length&&(y=new h(y,M,null,a,S),E.push({event:y,listeners:q}))}}if((t&7)===0){l:{if(y=l==="mouseover"||l==="pointerover",h=l==="mouseout"||l==="pointerout",y&&a!==yi&&(M=a.relatedTarget||a.fromElement)&&(Pa(M)||M[Ia]))break l;if((h||y)&&(y=S.window===S?S:(y=S.ownerDocument)?y.defaultView||y.parentWindow:window,h?(M=a.relatedTarget||a.toElement,h=v,M=M?Pa(M):null,M!==null&&(vl=k(M),q=M.tag,M!==vl||q!==5&&q!==27&&q!==6)&&(M=null)):(h=null,M=v),h!==M)){if(q=wf,b="onMouseLeave",d="onMouseEnter",s="mouse",(l==="pointerout"||l==="pointerover")&&(q=$f,b="onPointerLeave",d="onPointerEnter",s="pointer"),vl=h==null?y:Je(h),m=M==null?y:Je(M),y=new q(b,s+"leave",h,a,S),y.target=vl,y.relatedTarget=m,b=null,Pa(S)===v&&(q=new q(d,s+"enter",M,a,S),q.target=m,q.relatedTarget=vl,b=q),vl=b,h&&M)t:{for(q=gv,d=h,s=M,m=0,b=d;b;b=q(b))m++;b=0;for(var H=s;H;H=q(H))b++;for(;0<m-b;)d=q(d),m--;for(;0<b-m;)s=q(s),b--;for(;m--;){if(d===s||s!==null&&d===s.alternate){q=d;break t}d=q(d),s=q(s)}q=null}else q=null;h!==null&&Xd(E,y,h,q,!1),M!==null&&vl!==null&&Xd(E,vl,M,q,!0)}}l:{if(y=v?Je(v):window,h=y.nodeName&&y.nodeName.toLowerCase(),h==="select"||h==="input"&&y.type==="file")var al=es;else if(ts(y))if(us)al=Mm;else{al=Om;var N=_m}else h=y.nodeName,!h||h.toLowerCase()!=="input"||y.type!=="checkbox"&&y.type!=="radio"?v&&vi(v.elementType)&&(al=es):al=xm;if(al&&(al=al(l,v))){as(E,al,a,S);break l}N&&N(l,y,v),l==="focusout"&&v&&y.type==="number"&&v.memoizedProps.value!=null&&mi(y,"number",y.value)}switch(N=v?Je(v):window,l){case"focusin":(ts(N)||N.contentEditable==="true")&&(fe=N,xi=v,tu=null);break;case"focusout":tu=xi=fe=null;break;case"mousedown":Mi=!0;break;case"contextmenu":case"mouseup":case"dragend":Mi=!1,ms(E,a,S);break;case"selectionchange":if(Nm)break;case"keydown":case"keyup":ms(E,a,S)}var Z;if(Ti)l:{switch(l){case"compositionstart":var $="onCompositionStart";break l;case"compositionend":$="onCompositionEnd";break l;case"compositionupdate":$="onCompositionUpdate";break l}$=void 0}else ce?Pf(l,a)&&($="onCompositionEnd"):l==="keydown"&&a.keyCode===229&&($="onCompositionStart");$&&(kf&&a.locale!=="ko"&&(ce||$!=="onCompositionStart"?$==="onCompositionEnd"&&ce&&(Z=Kf()):(fa=S,Si="value"in fa?fa.value:fa.textContent,ce=!0)),N=Zn(v,$),0<N.length&&($=new Wf($,l,null,a,S),E.push({event:$,listeners:N}),Z?$.data=Z:(Z=ls(a),Z!==null&&($.data=Z)))),(Z=Em?pm(l,a):zm(l,a))&&($=Zn(v,"onBeforeInput"),0<$.length&&(N=new Wf("onBeforeInput","beforeinput",null,a,S),E.push({event:N,listeners:$}),N.data=Z)),vv(E,l,v,a,S)}Gd(E,t)})}function Ou(l,t,a){return{instance:l,listener:t,currentTarget:a}}function Zn(l,t){for(var a=t+"Capture",e=[];l!==null;){var u=l,n=u.stateNode;if(u=u.tag,u!==5&&u!==26&&u!==27||n===null||(u=we(l,a),u!=null&&e.unshift(Ou(l,u,n)),u=we(l,t),u!=null&&e.push(Ou(l,u,n))),l.tag===3)return e;l=l.return}return[]}function gv(l){if(l===null)return null;do l=l.return;while(l&&l.tag!==5&&l.tag!==27);return l||null}function Xd(l,t,a,e,u){for(var n=t._reactName,i=[];a!==null&&a!==e;){var c=a,f=c.alternate,v=c.stateNode;if(c=c.tag,f!==null&&f===e)break;c!==5&&c!==26&&c!==27||v===null||(f=v,u?(v=we(a,n),v!=null&&i.unshift(Ou(a,v,f))):u||(v=we(a,n),v!=null&&i.push(Ou(a,v,f)))),a=a.return}i.length!==0&&l.push({event:t,listeners:i})}var Sv=/\r\n?/g,bv=/\u0000|\uFFFD/g;function Zd(l){return(typeof l=="string"?l:""+l).replace(Sv,`
-`).replace(bv,"")}function Ld(l,t){return t=Zd(t),Zd(l)===t}function ml(l,t,a,e,u,n){switch(a){case"children":typeof e=="string"?t==="body"||t==="textarea"&&e===""||ue(l,e):(typeof e=="number"||typeof e=="bigint")&&t!=="body"&&ue(l,""+e);break;case"className":Ku(l,"class",e);break;case"tabIndex":Ku(l,"tabindex",e);break;case"dir":case"role":case"viewBox":case"width":case"height":Ku(l,a,e);break;case"style":Zf(l,e,n);break;case"data":if(t!=="object"){Ku(l,"data",e);break}case"src":case"href":if(e===""&&(t!=="a"||a!=="href")){l.removeAttribute(a);break}if(e==null||typeof e=="function"||typeof e=="symbol"||typeof e=="boolean"){l.removeAttribute(a);break}e=wu(""+e),l.setAttribute(a,e);break;case"action":case"formAction":if(typeof e=="function"){l.setAttribute(a,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(a==="formAction"?(t!=="input"&&ml(l,t,"name",u.name,u,null),ml(l,t,"formEncType",u.formEncType,u,null),ml(l,t,"formMethod",u.formMethod,u,null),ml(l,t,"formTarget",u.formTarget,u,null)):(ml(l,t,"encType",u.encType,u,null),ml(l,t,"method",u.method,u,null),ml(l,t,"target",u.target,u,null)));if(e==null||typeof e=="symbol"||typeof e=="boolean"){l.removeAttribute(a);break}e=wu(""+e),l.setAttribute(a,e);break;case"onClick":e!=null&&(l.onclick=Vt);break;case"onScroll":e!=null&&w("scroll",l);break;case"onScrollEnd":e!=null&&w("scrollend",l);break;case"dangerouslySetInnerHTML":if(e!=null){if(typeof e!="object"||!("__html"in e))throw Error(r(61));if(a=e.__html,a!=null){if(u.children!=null)throw Error(r(60));l.innerHTML=a}}break;case"multiple":l.multiple=e&&typeof e!="function"&&typeof e!="symbol";break;case"muted":l.muted=e&&typeof e!="function"&&typeof e!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(e==null||typeof e=="function"||typeof e=="boolean"||typeof e=="symbol"){l.removeAttribute("xlink:href");break}a=wu(""+e),l.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",a);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":e!=null&&typeof e!="function"&&typeof e!="symbol"?l.setAttribute(a,""+e):l.removeAttribute(a);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":e&&typeof e!="function"&&typeof e!="symbol"?l.setAttribute(a,""):l.removeAttribute(a);break;case"capture":case"download":e===!0?l.setAttribute(a,""):e!==!1&&e!=null&&typeof e!="function"&&typeof e!="symbol"?l.setAttribute(a,e):l.removeAttribute(a);break;case"cols":case"rows":case"size":case"span":e!=null&&typeof e!="function"&&typeof e!="symbol"&&!isNaN(e)&&1<=e?l.setAttribute(a,e):l.removeAttribute(a);break;case"rowSpan":case"start":e==null||typeof e=="function"||typeof e=="symbol"||isNaN(e)?l.removeAttribute(a):l.setAttribute(a,e);break;case"popover":w("beforetoggle",l),w("toggle",l),Vu(l,"popover",e);break;case"xlinkActuate":Lt(l,"http://www.w3.org/1999/xlink","xlink:actuate",e);break;case"xlinkArcrole":Lt(l,"http://www.w3.org/1999/xlink","xlink:arcrole",e);break;case"xlinkRole":Lt(l,"http://www.w3.org/1999/xlink","xlink:role",e);break;case"xlinkShow":Lt(l,"http://www.w3.org/1999/xlink","xlink:show",e);break;case"xlinkTitle":Lt(l,"http://www.w3.org/1999/xlink","xlink:title",e);break;case"xlinkType":Lt(l,"http://www.w3.org/1999/xlink","xlink:type",e);break;case"xmlBase":Lt(l,"http://www.w3.org/XML/1998/namespace","xml:base",e);break;case"xmlLang":Lt(l,"http://www.w3.org/XML/1998/namespace","xml:lang",e);break;case"xmlSpace":Lt(l,"http://www.w3.org/XML/1998/namespace","xml:space",e);break;case"is":Vu(l,"is",e);break;case"innerText":case"textContent":break;default:(!(2<a.length)||a[0]!=="o"&&a[0]!=="O"||a[1]!=="n"&&a[1]!=="N")&&(a=w0.get(a)||a,Vu(l,a,e))}}function Pc(l,t,a,e,u,n){switch(a){case"style":Zf(l,e,n);break;case"dangerouslySetInnerHTML":if(e!=null){if(typeof e!="object"||!("__html"in e))throw Error(r(61));if(a=e.__html,a!=null){if(u.children!=null)throw Error(r(60));l.innerHTML=a}}break;case"children":typeof e=="string"?ue(l,e):(typeof e=="number"||typeof e=="bigint")&&ue(l,""+e);break;case"onScroll":e!=null&&w("scroll",l);break;case"onScrollEnd":e!=null&&w("scrollend",l);break;case"onClick":e!=null&&(l.onclick=Vt);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!Rf.hasOwnProperty(a))l:{if(a[0]==="o"&&a[1]==="n"&&(u=a.endsWith("Capture"),t=a.slice(2,u?a.length-7:void 0),n=l[et]||null,n=n!=null?n[a]:null,typeof n=="function"&&l.removeEventListener(t,n,u),typeof e=="function")){typeof n!="function"&&n!==null&&(a in l?l[a]=null:l.hasAttribute(a)&&l.removeAttribute(a)),l.addEventListener(t,e,u);break l}a in l?l[a]=e:e===!0?l.setAttribute(a,""):Vu(l,a,e)}}}function wl(l,t,a){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":w("error",l),w("load",l);var e=!1,u=!1,n;for(n in a)if(a.hasOwnProperty(n)){var i=a[n];if(i!=null)switch(n){case"src":e=!0;break;case"srcSet":u=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(r(137,t));default:ml(l,t,n,i,a,null)}}u&&ml(l,t,"srcSet",a.srcSet,a,null),e&&ml(l,t,"src",a.src,a,null);return;case"input":w("invalid",l);var c=n=i=u=null,f=null,v=null;for(e in a)if(a.hasOwnProperty(e)){var S=a[e];if(S!=null)switch(e){case"name":u=S;break;case"type":i=S;break;case"checked":f=S;break;case"defaultChecked":v=S;break;case"value":n=S;break;case"defaultValue":c=S;break;case"children":case"dangerouslySetInnerHTML":if(S!=null)throw Error(r(137,t));break;default:ml(l,t,e,S,a,null)}}Yf(l,n,c,f,v,i,u,!1);return;case"select":w("invalid",l),e=i=n=null;for(u in a)if(a.hasOwnProperty(u)&&(c=a[u],c!=null))switch(u){case"value":n=c;break;case"defaultValue":i=c;break;case"multiple":e=c;default:ml(l,t,u,c,a,null)}t=n,a=i,l.multiple=!!e,t!=null?ee(l,!!e,t,!1):a!=null&&ee(l,!!e,a,!0);return;case"textarea":w("invalid",l),n=u=e=null;for(i in a)if(a.hasOwnProperty(i)&&(c=a[i],c!=null))switch(i){case"value":e=c;break;case"defaultValue":u=c;break;case"children":n=c;break;case"dangerouslySetInnerHTML":if(c!=null)throw Error(r(91));break;default:ml(l,t,i,c,a,null)}Qf(l,e,u,n);return;case"option":for(f in a)if(a.hasOwnProperty(f)&&(e=a[f],e!=null))switch(f){case"selected":l.selected=e&&typeof e!="function"&&typeof e!="symbol";break;default:ml(l,t,f,e,a,null)}return;case"dialog":w("beforetoggle",l),w("toggle",l),w("cancel",l),w("close",l);break;case"iframe":case"object":w("load",l);break;case"video":case"audio":for(e=0;e<_u.length;e++)w(_u[e],l);break;case"image":w("error",l),w("load",l);break;case"details":w("toggle",l);break;case"embed":case"source":case"link":w("error",l),w("load",l);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(v in a)if(a.hasOwnProperty(v)&&(e=a[v],e!=null))switch(v){case"children":case"dangerouslySetInnerHTML":throw Error(r(137,t));default:ml(l,t,v,e,a,null)}return;default:if(vi(t)){for(S in a)a.hasOwnProperty(S)&&(e=a[S],e!==void 0&&Pc(l,t,S,e,a,void 0));return}}for(c in a)a.hasOwnProperty(c)&&(e=a[c],e!=null&&ml(l,t,c,e,a,null))}function Ev(l,t,a,e){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var u=null,n=null,i=null,c=null,f=null,v=null,S=null;for(h in a){var E=a[h];if(a.hasOwnProperty(h)&&E!=null)switch(h){case"checked":break;case"value":break;case"defaultValue":f=E;default:e.hasOwnProperty(h)||ml(l,t,h,null,e,E)}}for(var y in e){var h=e[y];if(E=a[y],e.hasOwnProperty(y)&&(h!=null||E!=null))switch(y){case"type":n=h;break;case"name":u=h;break;case"checked":v=h;break;case"defaultChecked":S=h;break;case"value":i=h;break;case"defaultValue":c=h;break;case"children":case"dangerouslySetInnerHTML":if(h!=null)throw Error(r(137,t));break;default:h!==E&&ml(l,t,y,h,e,E)}}di(l,i,c,f,v,S,n,u);return;case"select":h=i=c=y=null;for(n in a)if(f=a[n],a.hasOwnProperty(n)&&f!=null)switch(n){case"value":break;case"multiple":h=f;default:e.hasOwnProperty(n)||ml(l,t,n,null,e,f)}for(u in e)if(n=e[u],f=a[u],e.hasOwnProperty(u)&&(n!=null||f!=null))switch(u){case"value":y=n;break;case"defaultValue":c=n;break;case"multiple":i=n;default:n!==f&&ml(l,t,u,n,e,f)}t=c,a=i,e=h,y!=null?ee(l,!!a,y,!1):!!e!=!!a&&(t!=null?ee(l,!!a,t,!0):ee(l,!!a,a?[]:"",!1));return;case"textarea":h=y=null;for(c in a)if(u=a[c],a.hasOwnProperty(c)&&u!=null&&!e.hasOwnProperty(c))switch(c){case"value":break;case"children":break;default:ml(l,t,c,null,e,u)}for(i in e)if(u=e[i],n=a[i],e.hasOwnProperty(i)&&(u!=null||n!=null))switch(i){case"value":y=u;break;case"defaultValue":h=u;break;case"children":break;case"dangerouslySetInnerHTML":if(u!=null)throw Error(r(91));break;default:u!==n&&ml(l,t,i,u,e,n)}Gf(l,y,h);return;case"option":for(var M in a)if(y=a[M],a.hasOwnProperty(M)&&y!=null&&!e.hasOwnProperty(M))switch(M){case"selected":l.selected=!1;break;default:ml(l,t,M,null,e,y)}for(f in e)if(y=e[f],h=a[f],e.hasOwnProperty(f)&&y!==h&&(y!=null||h!=null))switch(f){case"selected":l.selected=y&&typeof y!="function"&&typeof y!="symbol";break;default:ml(l,t,f,y,e,h)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var q in a)y=a[q],a.hasOwnProperty(q)&&y!=null&&!e.hasOwnProperty(q)&&ml(l,t,q,null,e,y);for(v in e)if(y=e[v],h=a[v],e.hasOwnProperty(v)&&y!==h&&(y!=null||h!=null))switch(v){case"children":case"dangerouslySetInnerHTML":if(y!=null)throw Error(r(137,t));break;default:ml(l,t,v,y,e,h)}return;default:if(vi(t)){for(var vl in a)y=a[vl],a.hasOwnProperty(vl)&&y!==void 0&&!e.hasOwnProperty(vl)&&Pc(l,t,vl,void 0,e,y);for(S in e)y=e[S],h=a[S],!e.hasOwnProperty(S)||y===h||y===void 0&&h===void 0||Pc(l,t,S,y,e,h);return}}for(var d in a)y=a[d],a.hasOwnProperty(d)&&y!=null&&!e.hasOwnProperty(d)&&ml(l,t,d,null,e,y);for(E in e)y=e[E],h=a[E],!e.hasOwnProperty(E)||y===h||y==null&&h==null||ml(l,t,E,y,e,h)}function Vd(l){switch(l){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function pv(){if(typeof performance.getEntriesByType=="function"){for(var l=0,t=0,a=performance.getEntriesByType("resource"),e=0;e<a.length;e++){var u=a[e],n=u.transferSize,i=u.initiatorType,c=u.duration;if(n&&c&&Vd(i)){for(i=0,c=u.responseEnd,e+=1;e<a.length;e++){var f=a[e],v=f.startTime;if(v>c)break;var S=f.transferSize,E=f.initiatorType;S&&Vd(E)&&(f=f.responseEnd,i+=S*(f<c?1:(c-v)/(f-v)))}if(--e,t+=8*(n+i)/(u.duration/1e3),l++,10<l)break}}if(0<l)return t/l/1e6}return navigator.connection&&(l=navigator.connection.downlink,typeof l=="number")?l:5}var lf=null,tf=null;function Ln(l){return l.nodeType===9?l:l.ownerDocument}function Kd(l){switch(l){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function Jd(l,t){if(l===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return l===1&&t==="foreignObject"?0:l}function af(l,t){return l==="textarea"||l==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var ef=null;function zv(){var l=window.event;return l&&l.type==="popstate"?l===ef?!1:(ef=l,!0):(ef=null,!1)}var wd=typeof setTimeout=="function"?setTimeout:void 0,Tv=typeof clearTimeout=="function"?clearTimeout:void 0,Wd=typeof Promise=="function"?Promise:void 0,Av=typeof queueMicrotask=="function"?queueMicrotask:typeof Wd<"u"?function(l){return Wd.resolve(null).then(l).catch(_v)}:wd;function _v(l){setTimeout(function(){throw l})}function _a(l){return l==="head"}function $d(l,t){var a=t,e=0;do{var u=a.nextSibling;if(l.removeChild(a),u&&u.nodeType===8)if(a=u.data,a==="/$"||a==="/&"){if(e===0){l.removeChild(u),je(t);return}e--}else if(a==="$"||a==="$?"||a==="$~"||a==="$!"||a==="&")e++;else if(a==="html")xu(l.ownerDocument.documentElement);else if(a==="head"){a=l.ownerDocument.head,xu(a);for(var n=a.firstChild;n;){var i=n.nextSibling,c=n.nodeName;n[Ke]||c==="SCRIPT"||c==="STYLE"||c==="LINK"&&n.rel.toLowerCase()==="stylesheet"||a.removeChild(n),n=i}}else a==="body"&&xu(l.ownerDocument.body);a=u}while(a);je(t)}function kd(l,t){var a=l;l=0;do{var e=a.nextSibling;if(a.nodeType===1?t?(a._stashedDisplay=a.style.display,a.style.display="none"):(a.style.display=a._stashedDisplay||"",a.getAttribute("style")===""&&a.removeAttribute("style")):a.nodeType===3&&(t?(a._stashedText=a.nodeValue,a.nodeValue=""):a.nodeValue=a._stashedText||""),e&&e.nodeType===8)if(a=e.data,a==="/$"){if(l===0)break;l--}else a!=="$"&&a!=="$?"&&a!=="$~"&&a!=="$!"||l++;a=e}while(a)}function uf(l){var t=l.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var a=t;switch(t=t.nextSibling,a.nodeName){case"HTML":case"HEAD":case"BODY":uf(a),si(a);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(a.rel.toLowerCase()==="stylesheet")continue}l.removeChild(a)}}function Ov(l,t,a,e){for(;l.nodeType===1;){var u=a;if(l.nodeName.toLowerCase()!==t.toLowerCase()){if(!e&&(l.nodeName!=="INPUT"||l.type!=="hidden"))break}else if(e){if(!l[Ke])switch(t){case"meta":if(!l.hasAttribute("itemprop"))break;return l;case"link":if(n=l.getAttribute("rel"),n==="stylesheet"&&l.hasAttribute("data-precedence"))break;if(n!==u.rel||l.getAttribute("href")!==(u.href==null||u.href===""?null:u.href)||l.getAttribute("crossorigin")!==(u.crossOrigin==null?null:u.crossOrigin)||l.getAttribute("title")!==(u.title==null?null:u.title))break;return l;case"style":if(l.hasAttribute("data-precedence"))break;return l;case"script":if(n=l.getAttribute("src"),(n!==(u.src==null?null:u.src)||l.getAttribute("type")!==(u.type==null?null:u.type)||l.getAttribute("crossorigin")!==(u.crossOrigin==null?null:u.crossOrigin))&&n&&l.hasAttribute("async")&&!l.hasAttribute("itemprop"))break;return l;default:return l}}else if(t==="input"&&l.type==="hidden"){var n=u.name==null?null:""+u.name;if(u.type==="hidden"&&l.getAttribute("name")===n)return l}else return l;if(l=Dt(l.nextSibling),l===null)break}return null}function xv(l,t,a){if(t==="")return null;for(;l.nodeType!==3;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!a||(l=Dt(l.nextSibling),l===null))return null;return l}function Fd(l,t){for(;l.nodeType!==8;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!t||(l=Dt(l.nextSibling),l===null))return null;return l}function nf(l){return l.data==="$?"||l.data==="$~"}function cf(l){return l.data==="$!"||l.data==="$?"&&l.ownerDocument.readyState!=="loading"}function Mv(l,t){var a=l.ownerDocument;if(l.data==="$~")l._reactRetry=t;else if(l.data!=="$?"||a.readyState!=="loading")t();else{var e=function(){t(),a.removeEventListener("DOMContentLoaded",e)};a.addEventListener("DOMContentLoaded",e),l._reactRetry=e}}function Dt(l){for(;l!=null;l=l.nextSibling){var t=l.nodeType;if(t===1||t===3)break;if(t===8){if(t=l.data,t==="$"||t==="$!"||t==="$?"||t==="$~"||t==="&"||t==="F!"||t==="F")break;if(t==="/$"||t==="/&")return null}}return l}var ff=null;function Id(l){l=l.nextSibling;for(var t=0;l;){if(l.nodeType===8){var a=l.data;if(a==="/$"||a==="/&"){if(t===0)return Dt(l.nextSibling);t--}else a!=="$"&&a!=="$!"&&a!=="$?"&&a!=="$~"&&a!=="&"||t++}l=l.nextSibling}return null}function Pd(l){l=l.previousSibling;for(var t=0;l;){if(l.nodeType===8){var a=l.data;if(a==="$"||a==="$!"||a==="$?"||a==="$~"||a==="&"){if(t===0)return l;t--}else a!=="/$"&&a!=="/&"||t++}l=l.previousSibling}return null}function l0(l,t,a){switch(t=Ln(a),l){case"html":if(l=t.documentElement,!l)throw Error(r(452));return l;case"head":if(l=t.head,!l)throw Error(r(453));return l;case"body":if(l=t.body,!l)throw Error(r(454));return l;default:throw Error(r(451))}}function xu(l){for(var t=l.attributes;t.length;)l.removeAttributeNode(t[0]);si(l)}var Nt=new Map,t0=new Set;function Vn(l){return typeof l.getRootNode=="function"?l.getRootNode():l.nodeType===9?l:l.ownerDocument}var ia=O.d;O.d={f:Dv,r:Nv,D:Uv,C:Cv,L:Rv,m:Hv,X:qv,S:jv,M:Bv};function Dv(){var l=ia.f(),t=jn();return l||t}function Nv(l){var t=le(l);t!==null&&t.tag===5&&t.type==="form"?So(t):ia.r(l)}var Ce=typeof document>"u"?null:document;function a0(l,t,a){var e=Ce;if(e&&typeof t=="string"&&t){var u=zt(t);u='link[rel="'+l+'"][href="'+u+'"]',typeof a=="string"&&(u+='[crossorigin="'+a+'"]'),t0.has(u)||(t0.add(u),l={rel:l,crossOrigin:a,href:t},e.querySelector(u)===null&&(t=e.createElement("link"),wl(t,"link",l),Yl(t),e.head.appendChild(t)))}}function Uv(l){ia.D(l),a0("dns-prefetch",l,null)}function Cv(l,t){ia.C(l,t),a0("preconnect",l,t)}function Rv(l,t,a){ia.L(l,t,a);var e=Ce;if(e&&l&&t){var u='link[rel="preload"][as="'+zt(t)+'"]';t==="image"&&a&&a.imageSrcSet?(u+='[imagesrcset="'+zt(a.imageSrcSet)+'"]',typeof a.imageSizes=="string"&&(u+='[imagesizes="'+zt(a.imageSizes)+'"]')):u+='[href="'+zt(l)+'"]';var n=u;switch(t){case"style":n=Re(l);break;case"script":n=He(l)}Nt.has(n)||(l=R({rel:"preload",href:t==="image"&&a&&a.imageSrcSet?void 0:l,as:t},a),Nt.set(n,l),e.querySelector(u)!==null||t==="style"&&e.querySelector(Mu(n))||t==="script"&&e.querySelector(Du(n))||(t=e.createElement("link"),wl(t,"link",l),Yl(t),e.head.appendChild(t)))}}function Hv(l,t){ia.m(l,t);var a=Ce;if(a&&l){var e=t&&typeof t.as=="string"?t.as:"script",u='link[rel="modulepreload"][as="'+zt(e)+'"][href="'+zt(l)+'"]',n=u;switch(e){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=He(l)}if(!Nt.has(n)&&(l=R({rel:"modulepreload",href:l},t),Nt.set(n,l),a.querySelector(u)===null)){switch(e){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(a.querySelector(Du(n)))return}e=a.createElement("link"),wl(e,"link",l),Yl(e),a.head.appendChild(e)}}}function jv(l,t,a){ia.S(l,t,a);var e=Ce;if(e&&l){var u=te(e).hoistableStyles,n=Re(l);t=t||"default";var i=u.get(n);if(!i){var c={loading:0,preload:null};if(i=e.querySelector(Mu(n)))c.loading=5;else{l=R({rel:"stylesheet",href:l,"data-precedence":t},a),(a=Nt.get(n))&&sf(l,a);var f=i=e.createElement("link");Yl(f),wl(f,"link",l),f._p=new Promise(function(v,S){f.onload=v,f.onerror=S}),f.addEventListener("load",function(){c.loading|=1}),f.addEventListener("error",function(){c.loading|=2}),c.loading|=4,Kn(i,t,e)}i={type:"stylesheet",instance:i,count:1,state:c},u.set(n,i)}}}function qv(l,t){ia.X(l,t);var a=Ce;if(a&&l){var e=te(a).hoistableScripts,u=He(l),n=e.get(u);n||(n=a.querySelector(Du(u)),n||(l=R({src:l,async:!0},t),(t=Nt.get(u))&&of(l,t),n=a.createElement("script"),Yl(n),wl(n,"link",l),a.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},e.set(u,n))}}function Bv(l,t){ia.M(l,t);var a=Ce;if(a&&l){var e=te(a).hoistableScripts,u=He(l),n=e.get(u);n||(n=a.querySelector(Du(u)),n||(l=R({src:l,async:!0,type:"module"},t),(t=Nt.get(u))&&of(l,t),n=a.createElement("script"),Yl(n),wl(n,"link",l),a.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},e.set(u,n))}}function e0(l,t,a,e){var u=(u=L.current)?Vn(u):null;if(!u)throw Error(r(446));switch(l){case"meta":case"title":return null;case"style":return typeof a.precedence=="string"&&typeof a.href=="string"?(t=Re(a.href),a=te(u).hoistableStyles,e=a.get(t),e||(e={type:"style",instance:null,count:0,state:null},a.set(t,e)),e):{type:"void",instance:null,count:0,state:null};case"link":if(a.rel==="stylesheet"&&typeof a.href=="string"&&typeof a.precedence=="string"){l=Re(a.href);var n=te(u).hoistableStyles,i=n.get(l);if(i||(u=u.ownerDocument||u,i={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(l,i),(n=u.querySelector(Mu(l)))&&!n._p&&(i.instance=n,i.state.loading=5),Nt.has(l)||(a={rel:"preload",as:"style",href:a.href,crossOrigin:a.crossOrigin,integrity:a.integrity,media:a.media,hrefLang:a.hrefLang,referrerPolicy:a.referrerPolicy},Nt.set(l,a),n||Yv(u,l,a,i.state))),t&&e===null)throw Error(r(528,""));return i}if(t&&e!==null)throw Error(r(529,""));return null;case"script":return t=a.async,a=a.src,typeof a=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=He(a),a=te(u).hoistableScripts,e=a.get(t),e||(e={type:"script",instance:null,count:0,state:null},a.set(t,e)),e):{type:"void",instance:null,count:0,state:null};default:throw Error(r(444,l))}}function Re(l){return'href="'+zt(l)+'"'}function Mu(l){return'link[rel="stylesheet"]['+l+"]"}function u0(l){return R({},l,{"data-precedence":l.precedence,precedence:null})}function Yv(l,t,a,e){l.querySelector('link[rel="preload"][as="style"]['+t+"]")?e.loading=1:(t=l.createElement("link"),e.preload=t,t.addEventListener("load",function(){return e.loading|=1}),t.addEventListener("error",function(){return e.loading|=2}),wl(t,"link",a),Yl(t),l.head.appendChild(t))}function He(l){return'[src="'+zt(l)+'"]'}function Du(l){return"script[async]"+l}function n0(l,t,a){if(t.count++,t.instance===null)switch(t.type){case"style":var e=l.querySelector('style[data-href~="'+zt(a.href)+'"]');if(e)return t.instance=e,Yl(e),e;var u=R({},a,{"data-href":a.href,"data-precedence":a.precedence,href:null,precedence:null});return e=(l.ownerDocument||l).createElement("style"),Yl(e),wl(e,"style",u),Kn(e,a.precedence,l),t.instance=e;case"stylesheet":u=Re(a.href);var n=l.querySelector(Mu(u));if(n)return t.state.loading|=4,t.instance=n,Yl(n),n;e=u0(a),(u=Nt.get(u))&&sf(e,u),n=(l.ownerDocument||l).createElement("link"),Yl(n);var i=n;return i._p=new Promise(function(c,f){i.onload=c,i.onerror=f}),wl(n,"link",e),t.state.loading|=4,Kn(n,a.precedence,l),t.instance=n;case"script":return n=He(a.src),(u=l.querySelector(Du(n)))?(t.instance=u,Yl(u),u):(e=a,(u=Nt.get(n))&&(e=R({},a),of(e,u)),l=l.ownerDocument||l,u=l.createElement("script"),Yl(u),wl(u,"link",e),l.head.appendChild(u),t.instance=u);case"void":return null;default:throw Error(r(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(e=t.instance,t.state.loading|=4,Kn(e,a.precedence,l));return t.instance}function Kn(l,t,a){for(var e=a.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),u=e.length?e[e.length-1]:null,n=u,i=0;i<e.length;i++){var c=e[i];if(c.dataset.precedence===t)n=c;else if(n!==u)break}n?n.parentNode.insertBefore(l,n.nextSibling):(t=a.nodeType===9?a.head:a,t.insertBefore(l,t.firstChild))}function sf(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.title==null&&(l.title=t.title)}function of(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.integrity==null&&(l.integrity=t.integrity)}var Jn=null;function i0(l,t,a){if(Jn===null){var e=new Map,u=Jn=new Map;u.set(a,e)}else u=Jn,e=u.get(a),e||(e=new Map,u.set(a,e));if(e.has(l))return e;for(e.set(l,null),a=a.getElementsByTagName(l),u=0;u<a.length;u++){var n=a[u];if(!(n[Ke]||n[Ll]||l==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var i=n.getAttribute(t)||"";i=l+i;var c=e.get(i);c?c.push(n):e.set(i,[n])}}return e}function c0(l,t,a){l=l.ownerDocument||l,l.head.insertBefore(a,t==="title"?l.querySelector("head > title"):null)}function Gv(l,t,a){if(a===1||t.itemProp!=null)return!1;switch(l){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;switch(t.rel){case"stylesheet":return l=t.disabled,typeof t.precedence=="string"&&l==null;default:return!0}case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function f0(l){return!(l.type==="stylesheet"&&(l.state.loading&3)===0)}function Qv(l,t,a,e){if(a.type==="stylesheet"&&(typeof e.media!="string"||matchMedia(e.media).matches!==!1)&&(a.state.loading&4)===0){if(a.instance===null){var u=Re(e.href),n=t.querySelector(Mu(u));if(n){t=n._p,t!==null&&typeof t=="object"&&typeof t.then=="function"&&(l.count++,l=wn.bind(l),t.then(l,l)),a.state.loading|=4,a.instance=n,Yl(n);return}n=t.ownerDocument||t,e=u0(e),(u=Nt.get(u))&&sf(e,u),n=n.createElement("link"),Yl(n);var i=n;i._p=new Promise(function(c,f){i.onload=c,i.onerror=f}),wl(n,"link",e),a.instance=n}l.stylesheets===null&&(l.stylesheets=new Map),l.stylesheets.set(a,t),(t=a.state.preload)&&(a.state.loading&3)===0&&(l.count++,a=wn.bind(l),t.addEventListener("load",a),t.addEventListener("error",a))}}var df=0;function Xv(l,t){return l.stylesheets&&l.count===0&&$n(l,l.stylesheets),0<l.count||0<l.imgCount?function(a){var e=setTimeout(function(){if(l.stylesheets&&$n(l,l.stylesheets),l.unsuspend){var n=l.unsuspend;l.unsuspend=null,n()}},6e4+t);0<l.imgBytes&&df===0&&(df=62500*pv());var u=setTimeout(function(){if(l.waitingForImages=!1,l.count===0&&(l.stylesheets&&$n(l,l.stylesheets),l.unsuspend)){var n=l.unsuspend;l.unsuspend=null,n()}},(l.imgBytes>df?50:800)+t);return l.unsuspend=a,function(){l.unsuspend=null,clearTimeout(e),clearTimeout(u)}}:null}function wn(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)$n(this,this.stylesheets);else if(this.unsuspend){var l=this.unsuspend;this.unsuspend=null,l()}}}var Wn=null;function $n(l,t){l.stylesheets=null,l.unsuspend!==null&&(l.count++,Wn=new Map,t.forEach(Zv,l),Wn=null,wn.call(l))}function Zv(l,t){if(!(t.state.loading&4)){var a=Wn.get(l);if(a)var e=a.get(null);else{a=new Map,Wn.set(l,a);for(var u=l.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<u.length;n++){var i=u[n];(i.nodeName==="LINK"||i.getAttribute("media")!=="not all")&&(a.set(i.dataset.precedence,i),e=i)}e&&a.set(null,e)}u=t.instance,i=u.getAttribute("data-precedence"),n=a.get(i)||e,n===e&&a.set(null,u),a.set(i,u),this.count++,e=wn.bind(this),u.addEventListener("load",e),u.addEventListener("error",e),n?n.parentNode.insertBefore(u,n.nextSibling):(l=l.nodeType===9?l.head:l,l.insertBefore(u,l.firstChild)),t.state.loading|=4}}var Nu={$$typeof:Hl,Provider:null,Consumer:null,_currentValue:j,_currentValue2:j,_threadCount:0};function Lv(l,t,a,e,u,n,i,c,f){this.tag=1,this.containerInfo=l,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=ni(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=ni(0),this.hiddenUpdates=ni(null),this.identifierPrefix=e,this.onUncaughtError=u,this.onCaughtError=n,this.onRecoverableError=i,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=f,this.incompleteTransitions=new Map}function s0(l,t,a,e,u,n,i,c,f,v,S,E){return l=new Lv(l,t,a,i,f,v,S,E,c),t=1,n===!0&&(t|=24),n=mt(3,null,null,t),l.current=n,n.stateNode=l,t=Li(),t.refCount++,l.pooledCache=t,t.refCount++,n.memoizedState={element:e,isDehydrated:a,cache:t},wi(n),l}function o0(l){return l?(l=de,l):de}function d0(l,t,a,e,u,n){u=o0(u),e.context===null?e.context=u:e.pendingContext=u,e=ya(t),e.payload={element:a},n=n===void 0?null:n,n!==null&&(e.callback=n),a=ra(l,e,t),a!==null&&(st(a,l,t),fu(a,l,t))}function m0(l,t){if(l=l.memoizedState,l!==null&&l.dehydrated!==null){var a=l.retryLane;l.retryLane=a!==0&&a<t?a:t}}function mf(l,t){m0(l,t),(l=l.alternate)&&m0(l,t)}function v0(l){if(l.tag===13||l.tag===31){var t=qa(l,67108864);t!==null&&st(t,l,67108864),mf(l,67108864)}}function y0(l){if(l.tag===13||l.tag===31){var t=gt();t=ii(t);var a=qa(l,t);a!==null&&st(a,l,t),mf(l,t)}}var kn=!0;function Vv(l,t,a,e){var u=g.T;g.T=null;var n=O.p;try{O.p=2,vf(l,t,a,e)}finally{O.p=n,g.T=u}}function Kv(l,t,a,e){var u=g.T;g.T=null;var n=O.p;try{O.p=8,vf(l,t,a,e)}finally{O.p=n,g.T=u}}function vf(l,t,a,e){if(kn){var u=yf(e);if(u===null)Ic(l,t,e,Fn,a),h0(l,e);else if(wv(u,l,t,a,e))e.stopPropagation();else if(h0(l,e),t&4&&-1<Jv.indexOf(l)){for(;u!==null;){var n=le(u);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var i=Ua(n.pendingLanes);if(i!==0){var c=n;for(c.pendingLanes|=2,c.entangledLanes|=2;i;){var f=1<<31-Bl(i);c.entanglements[1]|=f,i&=~f}Gt(n),(ul&6)===0&&(Rn=Zl()+500,Au(0))}}break;case 31:case 13:c=qa(n,2),c!==null&&st(c,n,2),jn(),mf(n,2)}if(n=yf(e),n===null&&Ic(l,t,e,Fn,a),n===u)break;u=n}u!==null&&e.stopPropagation()}else Ic(l,t,e,null,a)}}function yf(l){return l=ri(l),rf(l)}var Fn=null;function rf(l){if(Fn=null,l=Pa(l),l!==null){var t=k(l);if(t===null)l=null;else{var a=t.tag;if(a===13){if(l=pl(t),l!==null)return l;l=null}else if(a===31){if(l=rl(t),l!==null)return l;l=null}else if(a===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;l=null}else t!==l&&(l=null)}}return Fn=l,null}function r0(l){switch(l){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Ze()){case ka:return 2;case Fa:return 8;case A:case C:return 32;case jl:return 268435456;default:return 32}default:return 32}}var hf=!1,Oa=null,xa=null,Ma=null,Uu=new Map,Cu=new Map,Da=[],Jv="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function h0(l,t){switch(l){case"focusin":case"focusout":Oa=null;break;case"dragenter":case"dragleave":xa=null;break;case"mouseover":case"mouseout":Ma=null;break;case"pointerover":case"pointerout":Uu.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Cu.delete(t.pointerId)}}function Ru(l,t,a,e,u,n){return l===null||l.nativeEvent!==n?(l={blockedOn:t,domEventName:a,eventSystemFlags:e,nativeEvent:n,targetContainers:[u]},t!==null&&(t=le(t),t!==null&&v0(t)),l):(l.eventSystemFlags|=e,t=l.targetContainers,u!==null&&t.indexOf(u)===-1&&t.push(u),l)}function wv(l,t,a,e,u){switch(t){case"focusin":return Oa=Ru(Oa,l,t,a,e,u),!0;case"dragenter":return xa=Ru(xa,l,t,a,e,u),!0;case"mouseover":return Ma=Ru(Ma,l,t,a,e,u),!0;case"pointerover":var n=u.pointerId;return Uu.set(n,Ru(Uu.get(n)||null,l,t,a,e,u)),!0;case"gotpointercapture":return n=u.pointerId,Cu.set(n,Ru(Cu.get(n)||null,l,t,a,e,u)),!0}return!1}function g0(l){var t=Pa(l.target);if(t!==null){var a=k(t);if(a!==null){if(t=a.tag,t===13){if(t=pl(a),t!==null){l.blockedOn=t,Nf(l.priority,function(){y0(a)});return}}else if(t===31){if(t=rl(a),t!==null){l.blockedOn=t,Nf(l.priority,function(){y0(a)});return}}else if(t===3&&a.stateNode.current.memoizedState.isDehydrated){l.blockedOn=a.tag===3?a.stateNode.containerInfo:null;return}}}l.blockedOn=null}function In(l){if(l.blockedOn!==null)return!1;for(var t=l.targetContainers;0<t.length;){var a=yf(l.nativeEvent);if(a===null){a=l.nativeEvent;var e=new a.constructor(a.type,a);yi=e,a.target.dispatchEvent(e),yi=null}else return t=le(a),t!==null&&v0(t),l.blockedOn=a,!1;t.shift()}return!0}function S0(l,t,a){In(l)&&a.delete(t)}function Wv(){hf=!1,Oa!==null&&In(Oa)&&(Oa=null),xa!==null&&In(xa)&&(xa=null),Ma!==null&&In(Ma)&&(Ma=null),Uu.forEach(S0),Cu.forEach(S0)}function Pn(l,t){l.blockedOn===t&&(l.blockedOn=null,hf||(hf=!0,x.unstable_scheduleCallback(x.unstable_NormalPriority,Wv)))}var li=null;function b0(l){li!==l&&(li=l,x.unstable_scheduleCallback(x.unstable_NormalPriority,function(){li===l&&(li=null);for(var t=0;t<l.length;t+=3){var a=l[t],e=l[t+1],u=l[t+2];if(typeof e!="function"){if(rf(e||a)===null)continue;break}var n=le(a);n!==null&&(l.splice(t,3),t-=3,vc(n,{pending:!0,data:u,method:a.method,action:e},e,u))}}))}function je(l){function t(f){return Pn(f,l)}Oa!==null&&Pn(Oa,l),xa!==null&&Pn(xa,l),Ma!==null&&Pn(Ma,l),Uu.forEach(t),Cu.forEach(t);for(var a=0;a<Da.length;a++){var e=Da[a];e.blockedOn===l&&(e.blockedOn=null)}for(;0<Da.length&&(a=Da[0],a.blockedOn===null);)g0(a),a.blockedOn===null&&Da.shift();if(a=(l.ownerDocument||l).$$reactFormReplay,a!=null)for(e=0;e<a.length;e+=3){var u=a[e],n=a[e+1],i=u[et]||null;if(typeof n=="function")i||b0(a);else if(i){var c=null;if(n&&n.hasAttribute("formAction")){if(u=n,i=n[et]||null)c=i.formAction;else if(rf(u)!==null)continue}else c=i.action;typeof c=="function"?a[e+1]=c:(a.splice(e,3),e-=3),b0(a)}}}function E0(){function l(n){n.canIntercept&&n.info==="react-transition"&&n.intercept({handler:function(){return new Promise(function(i){return u=i})},focusReset:"manual",scroll:"manual"})}function t(){u!==null&&(u(),u=null),e||setTimeout(a,20)}function a(){if(!e&&!navigation.transition){var n=navigation.currentEntry;n&&n.url!=null&&navigation.navigate(n.url,{state:n.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var e=!1,u=null;return navigation.addEventListener("navigate",l),navigation.addEventListener("navigatesuccess",t),navigation.addEventListener("navigateerror",t),setTimeout(a,100),function(){e=!0,navigation.removeEventListener("navigate",l),navigation.removeEventListener("navigatesuccess",t),navigation.removeEventListener("navigateerror",t),u!==null&&(u(),u=null)}}}function gf(l){this._internalRoot=l}ti.prototype.render=gf.prototype.render=function(l){var t=this._internalRoot;if(t===null)throw Error(r(409));var a=t.current,e=gt();d0(a,e,l,t,null,null)},ti.prototype.unmount=gf.prototype.unmount=function(){var l=this._internalRoot;if(l!==null){this._internalRoot=null;var t=l.containerInfo;d0(l.current,2,null,l,null,null),jn(),t[Ia]=null}};function ti(l){this._internalRoot=l}ti.prototype.unstable_scheduleHydration=function(l){if(l){var t=Df();l={blockedOn:null,target:l,priority:t};for(var a=0;a<Da.length&&t!==0&&t<Da[a].priority;a++);Da.splice(a,0,l),a===0&&g0(l)}};var p0=sl.version;if(p0!=="19.2.4")throw Error(r(527,p0,"19.2.4"));O.findDOMNode=function(l){var t=l._reactInternals;if(t===void 0)throw typeof l.render=="function"?Error(r(188)):(l=Object.keys(l).join(","),Error(r(268,l)));return l=z(t),l=l!==null?I(l):null,l=l===null?null:l.stateNode,l};var $v={bundleType:0,version:"19.2.4",rendererPackageName:"react-dom",currentDispatcherRef:g,reconcilerVersion:"19.2.4"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var ai=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!ai.isDisabled&&ai.supportsFiber)try{xl=ai.inject($v),gl=ai}catch{}}return ju.createRoot=function(l,t){if(!Q(l))throw Error(r(299));var a=!1,e="",u=Mo,n=Do,i=No;return t!=null&&(t.unstable_strictMode===!0&&(a=!0),t.identifierPrefix!==void 0&&(e=t.identifierPrefix),t.onUncaughtError!==void 0&&(u=t.onUncaughtError),t.onCaughtError!==void 0&&(n=t.onCaughtError),t.onRecoverableError!==void 0&&(i=t.onRecoverableError)),t=s0(l,1,!1,null,null,a,e,null,u,n,i,E0),l[Ia]=t.current,Fc(l),new gf(t)},ju.hydrateRoot=function(l,t,a){if(!Q(l))throw Error(r(299));var e=!1,u="",n=Mo,i=Do,c=No,f=null;return a!=null&&(a.unstable_strictMode===!0&&(e=!0),a.identifierPrefix!==void 0&&(u=a.identifierPrefix),a.onUncaughtError!==void 0&&(n=a.onUncaughtError),a.onCaughtError!==void 0&&(i=a.onCaughtError),a.onRecoverableError!==void 0&&(c=a.onRecoverableError),a.formState!==void 0&&(f=a.formState)),t=s0(l,1,!0,t,a??null,e,u,f,n,i,c,E0),t.context=o0(null),a=t.current,e=gt(),e=ii(e),u=ya(e),u.callback=null,ra(a,u,e),a=e,t.current.lanes=a,Ve(t,a),Gt(t),l[Ia]=t.current,Fc(l),new ti(t)},ju.version="19.2.4",ju}var U0;function ny(){if(U0)return Ef.exports;U0=1;function x(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(x)}catch(sl){console.error(sl)}}return x(),Ef.exports=uy(),Ef.exports}var iy=ny();const C0="disconnected";function cy(x,sl){switch(sl.type){case"CONNECT_REQUESTED":return"connecting";case"CONNECTED":return"connected";case"DISCONNECTED":return"disconnected";case"RECONNECT_REQUESTED":return"reconnecting";case"CONNECTION_ERROR":return"error";default:return x}}function fy(x){switch(x){case"connecting":return"接続中";case"connected":return"接続済み";case"disconnected":return"切断";case"reconnecting":return"再接続中";case"error":return"エラー";default:return"不明"}}function R0(x){return x<=767?"mobile":x<=1023?"tablet":"desktop"}function sy(){return typeof window>"u"?"desktop":R0(window.innerWidth)}function ei(){return`${Date.now()}-${Math.random().toString(36).slice(2)}`}function oy(){const[x,sl]=V.useState(sy),[B,r]=V.useReducer(cy,C0),[Q,k]=V.useState(!1),[pl,rl]=V.useState([]),[U,z]=V.useState(""),[I,R]=V.useState([]),[nl,Fl]=V.useState(!1),[Wl,Ql]=V.useState(0),[Ut,Il]=V.useState(0),[St,Hl]=V.useState("idle"),[tt,bt]=V.useState(0),[Xl,K]=V.useState([]),[$l,ot]=V.useState([]),[Qt,Et]=V.useState(!0),[zl,Xt]=V.useState({proactivity:!1,affectiveDialog:!1}),[at,Pl]=V.useState({proactivity:!1,affectiveDialog:!1}),[g,O]=V.useState({proactivity:!1,affectiveDialog:!1}),[j,ll]=V.useState("idle"),[il,o]=V.useState("proactivity=false&affective_dialog=false"),[p,_]=V.useState(!1),[D,Y]=V.useState(!1),L=V.useRef(C0),tl=V.useRef(null),Tl=V.useRef(null),hl=V.useRef(null),ol=V.useCallback((A,C,jl,P="standard")=>{const Al={id:ei(),timestamp:new Date().toISOString(),summary:C,category:A,kind:P,detail:JSON.stringify(jl)};K(xl=>[Al,...xl].slice(0,100))},[]),$a=V.useCallback(A=>{ot(C=>C.includes(A)?C.filter(jl=>jl!==A):[...C,A])},[]);V.useEffect(()=>{const A=()=>{sl(R0(window.innerWidth))};return window.addEventListener("resize",A),()=>window.removeEventListener("resize",A)},[]),V.useEffect(()=>{const A=()=>{nl&&Ql(C=>C+1)};return window.addEventListener("mock-audio-chunk",A),()=>window.removeEventListener("mock-audio-chunk",A)},[nl]),V.useEffect(()=>()=>{const A=hl.current;A&&A.getTracks().forEach(C=>C.stop())},[]),V.useEffect(()=>{if(B!=="connecting"&&B!=="reconnecting")return;const A=window.setTimeout(()=>{r({type:"CONNECTED"})},400);return()=>window.clearTimeout(A)},[B]),V.useEffect(()=>{const A=L.current;A!==B&&(A==="connecting"&&B==="connected"&&(rl(C=>[...C,"接続開始"]),ol("notification","接続済み",{phase:"initial"})),A==="reconnecting"&&B==="connected"&&(rl(C=>[...C,"再接続に成功"]),ol("notification","再接続に成功",{phase:"recover"})),A==="reconnecting"&&B==="connected"&&j==="applying"&&(Pl(zl),ll("idle"),rl(C=>[...C,"設定変更を反映しました"]),ol("notification","RunConfig反映完了",{proactivity:zl.proactivity,affectiveDialog:zl.affectiveDialog})),L.current=B)},[ol,B,zl,j]),V.useEffect(()=>{if(!Q)return;const A=window.setTimeout(()=>{r({type:"RECONNECT_REQUESTED"}),rl(C=>[...C,"再接続を試行中"]),ol("notification","再接続試行",{scheduled:!0}),k(!1)},1e3);return()=>window.clearTimeout(A)},[ol,Q]),V.useEffect(()=>{const A=tl.current;A&&(A.scrollTop=A.scrollHeight)},[I]),V.useEffect(()=>{const A=C=>{const P=C.detail;if(P){if(P.kind==="text"){const Al=P.text.trim();if(!Al)return;if(P.role==="agent"&&Tl.current&&P.partial){const gl=Tl.current;R(jt=>jt.map(Bl=>Bl.id===gl?{...Bl,content:`${Bl.content}${Al}`,status:"partial"}:Bl)),ol("conversation","エージェント応答更新",{partial:!0});return}const xl=ei();R(gl=>[...gl,{id:xl,role:P.role,content:Al,status:P.partial?"partial":"complete"}]),P.role==="agent"&&(Tl.current=P.partial?xl:null),ol("conversation","会話イベント受信",{role:P.role,partial:P.partial});return}if(P.kind==="audioOutput"){Il(Al=>Al+1),Hl("playing"),ol("conversation","音声出力受信",{chunkSize:P.chunkSize},"audio");return}if(P.kind==="turnComplete"){const Al=Tl.current;if(!Al)return;R(xl=>xl.map(gl=>gl.id===Al?{...gl,status:"complete"}:gl)),Tl.current=null,ol("conversation","ターン完了",{kind:"turnComplete"});return}if(P.kind==="runConfigApplyResult"){if(P.status==="applied"){Pl(P.effective),O(P.effective),ll("idle"),rl(xl=>[...xl,"設定変更を反映しました"]),ol("notification","RunConfig反映完了",{status:P.status,effective:P.effective});return}const Al=g.proactivity||g.affectiveDialog?g:{proactivity:!1,affectiveDialog:!1};Pl(Al),ll("idle"),rl(xl=>[...xl,`設定反映に失敗: ${P.reason??"unsupported"}`]),ol("notification","RunConfig反映失敗",{status:P.status,reason:P.reason,fallback:Al});return}if(P.kind==="error"){r({type:"CONNECTION_ERROR"}),rl(Al=>[...Al,`WebSocketエラー: ${P.message}`]),ol("notification","WebSocketエラー",{message:P.message}),k(!0);return}if(P.kind==="interrupted"){const Al=Tl.current;Al&&(R(xl=>xl.map(gl=>gl.id===Al?{...gl,status:"interrupted"}:gl)),Tl.current=null),Hl(xl=>xl==="playing"?"interrupted":xl),ol("notification","中断イベント",{kind:"interrupted"})}}};return window.addEventListener("mock-stream-event",A),()=>window.removeEventListener("mock-stream-event",A)},[ol,g]);const qe=()=>{r({type:"CONNECT_REQUESTED"}),ol("notification","接続開始要求",{source:"ui"})},qu=()=>{r({type:"DISCONNECTED"}),k(!0),rl(A=>[...A,"切断"]),ol("notification","切断",{reconnectScheduled:!0})},Zt=()=>{const A=U.trim();A&&(R(C=>[...C,{id:ei(),role:"user",content:A,status:"complete"}]),ol("conversation","テキスト送信",{text:A}),z(""))},Be=A=>{A.preventDefault(),Zt()},Ye=()=>{Fl(A=>!A)},Bu=()=>{const A=hl.current;A&&(A.getTracks().forEach(C=>C.stop()),hl.current=null),_(!1),Y(!1)},Yu=async()=>{try{if(!navigator.mediaDevices||!navigator.mediaDevices.getUserMedia)throw new Error("カメラ未対応");const A=await navigator.mediaDevices.getUserMedia({video:!0});hl.current=A,_(!0),Y(!0),ol("notification","カメラプレビュー開始",{status:"opened"})}catch(A){_(!1),Y(!1);const C=A instanceof Error?A.message:"unknown";rl(jl=>[...jl,`カメラ利用に失敗: ${C}`]),ol("notification","カメラ利用失敗",{message:C})}},Ge=()=>{R(A=>[...A,{id:ei(),role:"user",content:"[画像を送信しました]",status:"complete"}]),bt(A=>A+1),ol("conversation","画像送信",{placeholder:!0}),Bu()},Qe=()=>{Et(A=>!A)},Xe=()=>{K([]),ot([])},ui=A=>{const C=new URLSearchParams({proactivity:String(A.proactivity),affective_dialog:String(A.affectiveDialog)}).toString();o(C),ll("applying"),rl(jl=>[...jl,"設定変更を反映中"]),ol("notification","RunConfig変更要求",{proactivity:A.proactivity,affective_dialog:A.affectiveDialog,query:C}),r({type:"RECONNECT_REQUESTED"})},Gu=A=>{Xt(C=>{const jl={...C,[A]:!C[A]};return B==="connected"||B==="reconnecting"?ui(jl):o(new URLSearchParams({proactivity:String(jl.proactivity),affective_dialog:String(jl.affectiveDialog)}).toString()),jl})},Zl=()=>T.jsxs(T.Fragment,{children:[T.jsxs("p",{className:"mt-2 text-xs text-slate-300",children:["上流音声チャンク: ",T.jsx("span",{"data-testid":"audio-upstream-chunk-count",children:Wl})]}),T.jsxs("p",{className:"mt-1 text-xs text-slate-300",children:["下流音声チャンク: ",T.jsx("span",{"data-testid":"audio-downstream-chunk-count",children:Ut})]}),T.jsxs("p",{className:"mt-1 text-xs text-slate-300",children:["音声再生状態:"," ",T.jsxs("span",{"data-testid":"audio-playback-state",children:[St==="idle"&&"待機中",St==="playing"&&"再生中",St==="interrupted"&&"中断"]})]}),T.jsxs("p",{className:"mt-1 text-xs text-slate-300",children:["画像上流送信数: ",T.jsx("span",{"data-testid":"image-upstream-count",children:tt})]})]}),Ze=()=>{const A=Qt?Xl:Xl.filter(C=>C.kind!=="audio");return T.jsxs(T.Fragment,{children:[T.jsxs("div",{className:"mt-3 flex items-center justify-between gap-3 border-t border-slate-700/70 pt-3",children:[T.jsxs("label",{className:"flex items-center gap-2 text-xs text-slate-300",children:[T.jsx("input",{type:"checkbox",checked:Qt,onChange:Qe}),"音声イベントを表示"]}),T.jsx("button",{type:"button",className:"rounded bg-slate-700 px-2 py-1 text-xs text-slate-100",onClick:Xe,children:"ログをクリア"})]}),T.jsx("ul",{"data-testid":"event-log-list",className:"mt-3 space-y-2",children:A.map(C=>{const jl=$l.includes(C.id),P=C.kind==="audio"?"audio":C.category,Al=C.kind==="audio"?"text-cyan-300":C.category==="notification"?"text-amber-300":"text-slate-300";return T.jsxs("li",{"data-testid":"event-log-item",className:"rounded border border-slate-700 bg-slate-900/80 p-2 text-xs",children:[T.jsxs("p",{"data-testid":`event-log-item-${P}`,className:Al,children:["[",P,"] ",C.summary]}),T.jsx("p",{className:"mt-1 text-slate-500",children:C.timestamp}),T.jsx("button",{type:"button",className:"mt-1 rounded bg-slate-700 px-2 py-1 text-slate-100",onClick:()=>$a(C.id),children:jl?"詳細を閉じる":"詳細を開く"}),jl&&T.jsx("pre",{"data-testid":"event-log-detail",className:"mt-2 overflow-x-auto rounded bg-slate-800 p-2 text-[11px] text-slate-200",children:C.detail})]},C.id)})})]})},ka=A=>T.jsxs("section",{"aria-label":"connection",role:"region",className:A,children:[T.jsxs("div",{className:"flex items-center justify-between gap-2",children:[T.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100",children:"接続状態"}),T.jsx("span",{"data-testid":"connection-state",className:"rounded-full bg-emerald-950/70 px-2 py-1 text-xs text-emerald-300",children:fy(B)})]}),B==="disconnected"&&Q&&T.jsx("p",{className:"mt-2 text-sm text-amber-300",children:"再接続予定"}),B==="error"&&Q&&T.jsx("p",{"data-testid":"recovery-status-banner",className:"mt-2 text-sm text-amber-300",children:"自動回復を試行中"}),T.jsxs("div",{className:"mt-3 flex flex-wrap gap-2",children:[(B==="disconnected"||B==="error")&&T.jsx("button",{type:"button",className:"rounded-md bg-emerald-500 px-3 py-2 text-xs font-semibold text-slate-900 transition-colors hover:bg-emerald-400",onClick:qe,children:"接続開始"}),B==="connected"&&T.jsx("button",{type:"button",className:"rounded-md bg-slate-700 px-3 py-2 text-xs font-semibold text-slate-100 transition-colors hover:bg-slate-600",onClick:qu,children:"切断"})]}),T.jsxs("div",{className:"mt-4 rounded-xl border border-slate-700 bg-slate-900/70 p-3",children:[T.jsx("p",{className:"text-xs font-semibold tracking-wide text-slate-300",children:"RUN_CONFIG"}),T.jsxs("label",{className:"mt-2 flex items-center gap-2 text-sm text-slate-200",children:[T.jsx("input",{type:"checkbox",checked:zl.proactivity,onChange:()=>Gu("proactivity"),disabled:j==="applying"}),"Proactivity"]}),T.jsxs("label",{className:"mt-1 flex items-center gap-2 text-sm text-slate-200",children:[T.jsx("input",{type:"checkbox",checked:zl.affectiveDialog,onChange:()=>Gu("affectiveDialog"),disabled:j==="applying"}),"Affective Dialog"]}),T.jsx("p",{"data-testid":"run-config-status",className:"mt-2 text-xs text-slate-400",children:j==="applying"?"反映中":"待機"}),T.jsx("p",{"data-testid":"run-config-query",className:"mt-1 text-xs text-slate-500",children:il}),T.jsxs("p",{"data-testid":"run-config-effective",className:"mt-1 text-xs text-slate-400",children:["effective: proactivity=",String(at.proactivity),", affectiveDialog=",String(at.affectiveDialog)]}),T.jsx("p",{"data-testid":"run-config-drift",className:"mt-1 text-xs text-slate-400",children:zl.proactivity===at.proactivity&&zl.affectiveDialog===at.affectiveDialog?"一致":"不一致"})]})]}),Fa=A=>T.jsxs("section",{"aria-label":"conversation",role:"region",className:A,children:[T.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100",children:"stream_transcript"}),T.jsxs("ul",{ref:tl,"data-testid":"conversation-log",className:"mt-3 max-h-72 space-y-2 overflow-y-auto rounded-xl border border-slate-700 bg-slate-950/60 p-3",children:[I.length===0&&T.jsx("li",{className:"text-sm text-slate-500",children:"メッセージはまだありません"}),I.map(C=>T.jsxs("li",{"data-testid":`conversation-message-${C.role}`,className:`rounded px-3 py-2 text-sm ${C.role==="user"?"bg-slate-800 text-slate-100":C.status==="interrupted"?"bg-rose-950/60 text-rose-100":"bg-emerald-950/40 text-emerald-100"}`,children:[T.jsx("p",{children:C.content}),T.jsx("p",{className:"mt-1 text-xs text-slate-400",children:C.status})]},C.id))]})]});return T.jsxs("main",{className:"min-h-screen bg-[#0B0E13] text-slate-100","data-layout":x,children:[T.jsxs("header",{className:"border-b border-slate-800 bg-[#0F141C] px-4 py-4",children:[T.jsx("h1",{className:"text-3xl font-semibold leading-none [font-family:Oswald,sans-serif]",children:"Real-time Voice AI Agent"}),T.jsx("p",{className:"mt-1 text-xs text-slate-400 [font-family:'JetBrains_Mono',monospace]",children:"bidi streaming audio for text, voice, and image inputs"}),T.jsx("p",{"data-testid":"layout-mode",className:"mt-1 text-xs text-slate-500",children:x})]}),x==="desktop"&&T.jsxs("div",{className:"grid grid-cols-[260px_1fr_280px] gap-4 p-4",children:[ka("rounded-2xl border border-slate-800 bg-[#111821] p-4"),Fa("rounded-2xl border border-slate-800 bg-[#111821] p-4"),T.jsxs("section",{"aria-label":"event-console",role:"region",className:"rounded-2xl border border-slate-800 bg-[#111821] p-4",children:[T.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100",children:"voice_activity"}),Zl(),Ze()]})]}),x==="tablet"&&T.jsxs("div",{className:"grid grid-cols-1 gap-4 p-4",children:[ka("rounded-2xl border border-slate-800 bg-[#111821] p-4"),Fa("rounded-2xl border border-slate-800 bg-[#111821] p-4"),T.jsxs("section",{"aria-label":"event-console",role:"region",className:"rounded-2xl border border-slate-800 bg-[#111821] p-4",children:[T.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100",children:"voice_activity"}),Zl(),Ze()]})]}),x==="mobile"&&T.jsxs("div",{className:"flex flex-col gap-3 p-3",children:[ka("rounded-2xl border border-slate-800 bg-[#111821] p-3"),Fa("rounded-2xl border border-slate-800 bg-[#111821] p-3"),T.jsxs("section",{"aria-label":"event-console",role:"region",className:"rounded-2xl border border-slate-800 bg-[#111821] p-3",children:[T.jsx("p",{className:"text-sm font-semibold tracking-wide text-slate-100",children:"voice_activity"}),Zl(),Ze()]})]}),T.jsxs("section",{"aria-label":"input-controls",role:"region",className:"sticky bottom-0 border-t border-slate-800 bg-[#0F141C] p-4",children:[T.jsxs("form",{className:"flex flex-wrap items-center gap-2",onSubmit:Be,children:[T.jsx("label",{htmlFor:"text-input",className:"sr-only",children:"テキスト入力"}),T.jsx("input",{id:"text-input",type:"text",value:U,onChange:A=>z(A.target.value),className:"min-w-[200px] flex-1 rounded-xl border border-slate-700 bg-slate-800 px-3 py-2 text-sm text-slate-100 placeholder:text-slate-500",placeholder:"メッセージを入力"}),T.jsx("button",{type:"submit",className:"rounded-xl bg-[#FF7A3D] px-4 py-2 text-sm font-semibold text-slate-950",children:"送信"}),T.jsx("button",{type:"button",className:"rounded-xl bg-[#00D4AA] px-4 py-2 text-sm font-semibold text-slate-950",onClick:Ye,children:nl?"音声停止":"音声開始"}),T.jsx("button",{type:"button",className:"rounded-xl bg-slate-700 px-3 py-2 text-sm text-white",onClick:Yu,children:"画像送信"})]}),nl&&T.jsx("p",{"data-testid":"voice-input-state",className:"mt-2 text-sm text-emerald-300",children:"音声入力中"}),T.jsx("p",{"data-testid":"camera-state",className:"mt-1 text-sm text-slate-400",children:D?"利用中":"未使用"})]}),p&&T.jsx("section",{role:"dialog","aria-label":"camera-preview",className:"fixed inset-0 z-10 flex items-center justify-center bg-black/60 p-4",children:T.jsxs("div",{className:"w-full max-w-md rounded-2xl border border-slate-700 bg-[#121821] p-4",children:[T.jsx("p",{className:"text-xl font-semibold [font-family:Oswald,sans-serif]",children:"Camera Preview"}),T.jsx("p",{className:"mt-2 text-sm text-slate-300",children:"プレビュー準備完了"}),T.jsxs("div",{className:"mt-4 flex gap-2",children:[T.jsx("button",{type:"button",className:"rounded-xl bg-[#FF7A3D] px-3 py-2 text-sm font-semibold text-slate-900",onClick:Ge,children:"画像を送信"}),T.jsx("button",{type:"button",className:"rounded-xl bg-slate-700 px-3 py-2 text-sm text-white",onClick:Bu,children:"キャンセル"})]})]})}),T.jsxs("section",{"aria-label":"system-notices",role:"region",className:"border-t border-slate-800 bg-[#0F141C] p-3",children:[T.jsx("p",{className:"text-sm font-medium text-slate-200",children:"システム通知"}),T.jsx("ul",{"data-testid":"system-notices",className:"mt-1 list-disc pl-5 text-sm text-slate-300",children:pl.map((A,C)=>T.jsx("li",{"data-testid":"system-notice-item",className:"system-notice-item rounded border-l-2 border-amber-400 bg-amber-950/30 px-2 py-1",children:A},`${A}-${C}`))})]})]})}function dy(){return{connection:"disconnected",conversation:[],notices:[],eventLog:[]}}const my=V.createContext(null);function vy({children:x}){const[sl]=V.useState(dy()),B=V.useMemo(()=>sl,[sl]);return T.jsx(my.Provider,{value:B,children:x})}const H0=document.getElementById("root");if(!H0)throw new Error("Root element #root not found");iy.createRoot(H0).render(T.jsx(V.StrictMode,{children:T.jsx(vy,{children:T.jsx(oy,{})})}));
@@ -0,0 +1 @@
+"""Streaming helpers for the bidi-workshop WebSocket endpoint."""
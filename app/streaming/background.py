@@ -0,0 +1,48 @@
+"""Per-session background tasks that must not block the upstream loop."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class SessionTaskGroup:
+    """Tracks a bounded number of asyncio tasks owned by one WebSocket session.
+
+    ``start`` refuses new work once ``max_tasks`` are in flight instead of
+    queueing it, and ``cancel_all`` is called when the socket closes so
+    results are never pushed to a dead connection.
+    """
+
+    def __init__(self, name: str, max_tasks: int) -> None:
+        self._name = name
+        self._max_tasks = max_tasks
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def active(self) -> int:
+        return len(self._tasks)
+
+    def start(self, func: Callable[..., Awaitable[Any]], *args: Any) -> bool:
+        if len(self._tasks) >= self._max_tasks:
+            return False
+        task = asyncio.create_task(func(*args), name=f"{self._name}-{len(self._tasks)}")
+        self._tasks.add(task)
+        task.add_done_callback(self._on_done)
+        return True
+
+    async def cancel_all(self) -> None:
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.error("[%s] Background task failed: %s", self._name, error)
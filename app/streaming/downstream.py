@@ -0,0 +1,337 @@
+"""Per-connection downstream profile: event filtering, partial coalescing
+and serialization.
+
+Clients negotiate what they receive with query parameters on ``/ws``:
+
+- ``events``: comma-separated kinds to forward (default: all of
+  ``EVENT_KINDS``). Parts and fields of other kinds are removed and events
+  left with nothing to say are not sent. Errors are always forwarded.
+  Unknown kinds are logged and ignored; if none of the requested kinds is
+  known, all kinds are forwarded.
+- ``fields=lean``: send only the fields the web client reads, serialized
+  straight from the event attributes instead of through pydantic.
+- ``partial_ms``: merge consecutive partial transcription deltas for up to
+  this many milliseconds into one message.
+"""
+
+import asyncio
+import base64
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+from google.adk.events import Event
+from google.genai import types
+
+from . import metrics
+from .frames import ENVELOPE_FIELDS
+
+logger = logging.getLogger(__name__)
+
+FIELDS_FULL = "full"
+FIELDS_LEAN = "lean"
+MAX_PARTIAL_WINDOW_MS = 1000
+
+EVENT_KINDS = frozenset(
+    {
+        "audio",
+        "text",
+        "image",
+        "tool",
+        "input",
+        "output",
+        "partial",
+        "turn",
+        "usage",
+        "resumption",
+    }
+)
+_FIELD_KINDS = {
+    "input_transcription": "input",
+    "output_transcription": "output",
+    "turn_complete": "turn",
+    "interrupted": "turn",
+    "usage_metadata": "usage",
+    "live_session_resumption_update": "resumption",
+}
+_TRANSCRIPTION_FIELDS = ("input_transcription", "output_transcription")
+# Custom metadata describes an event; on its own it is not worth a message.
+_METADATA_ONLY_FIELDS = ENVELOPE_FIELDS | {"custom_metadata"}
+
+# Fields written by encode_lean() itself, and envelope fields it leaves out.
+_LEAN_FIELDS = frozenset(
+    {
+        "author",
+        "partial",
+        "turn_complete",
+        "interrupted",
+        "input_transcription",
+        "output_transcription",
+        "content",
+        "error_code",
+        "error_message",
+        "custom_metadata",
+    }
+)
+_LEAN_DROPPED = frozenset(
+    {
+        "model_version",
+        "invocation_id",
+        "actions",
+        "node_info",
+        "branch",
+        "id",
+        "timestamp",
+        "live_session_id",
+    }
+)
+# json.dumps() with non-default options builds a new encoder on every call.
+_dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+_LEAN_PASSTHROUGH = frozenset(Event.model_fields) - _LEAN_FIELDS - _LEAN_DROPPED
+
+
+def _part_kind(part: types.Part) -> str:
+    blob = part.inline_data
+    if blob is not None:
+        return "audio" if (blob.mime_type or "").startswith("audio/") else "image"
+    if part.text is not None:
+        return "text"
+    return "tool"
+
+
+def _partial_transcription(event: Event) -> Optional[str]:
+    """Field name of an unfinished transcription delta, if that is all the event carries."""
+    if not event.partial or event.content or event.turn_complete or event.interrupted:
+        return None
+    found = None
+    for name in _TRANSCRIPTION_FIELDS:
+        transcription = getattr(event, name)
+        if transcription is None:
+            continue
+        if found is not None or transcription.finished:
+            return None
+        found = name
+    return found
+
+
+def _has_payload(event: Event) -> bool:
+    """Whether anything besides envelope fields and custom metadata is left."""
+    if event.content and event.content.parts:
+        return True
+    return any(
+        getattr(event, name) is not None
+        for name in event.model_fields_set - _METADATA_ONLY_FIELDS
+    )
+
+
+def _is_audio_only(event: Event) -> bool:
+    """Audio chunks may overtake a pending delta; nothing else that orders a turn may."""
+    content = event.content
+    if not content or not content.parts or event.turn_complete or event.interrupted:
+        return False
+    if event.input_transcription is not None or event.output_transcription is not None:
+        return False
+    return all(_part_kind(part) == "audio" for part in content.parts)
+
+
+def _encode_transcription(transcription: types.Transcription) -> dict[str, Any]:
+    encoded: dict[str, Any] = {}
+    if transcription.text is not None:
+        encoded["text"] = transcription.text
+    if transcription.finished is not None:
+        encoded["finished"] = transcription.finished
+    return encoded
+
+
+def _encode_part(part: types.Part) -> str:
+    blob = part.inline_data
+    if blob is not None and part.text is None and blob.data is not None:
+        # Base64 never needs JSON escaping, so splice it in rather than have
+        # json.dumps() scan the whole payload.
+        return '{"inlineData":{"mimeType":%s,"data":"%s"}}' % (
+            _dumps(blob.mime_type),
+            base64.b64encode(blob.data).decode("ascii"),
+        )
+    if part.text is not None and blob is None and part.function_call is None:
+        encoded: dict[str, Any] = {"text": part.text}
+        if part.thought:
+            encoded["thought"] = True
+        return _dumps(encoded)
+    return _dumps(part.model_dump(mode="json", exclude_none=True, by_alias=True))
+
+
+def encode_lean(event: Event) -> str:
+    """Serializes the fields the web client reads, bypassing pydantic for common shapes.
+
+    Inline data is standard base64 (as accepted by ``atob()``) rather than
+    the URL-safe alphabet pydantic uses.
+    """
+    payload: dict[str, Any] = {"author": event.author}
+    if event.partial is not None:
+        payload["partial"] = event.partial
+    if event.turn_complete is not None:
+        payload["turnComplete"] = event.turn_complete
+    if event.interrupted is not None:
+        payload["interrupted"] = event.interrupted
+    if event.input_transcription is not None:
+        payload["inputTranscription"] = _encode_transcription(event.input_transcription)
+    if event.output_transcription is not None:
+        payload["outputTranscription"] = _encode_transcription(event.output_transcription)
+    if event.error_code is not None:
+        payload["errorCode"] = event.error_code
+    if event.error_message is not None:
+        payload["errorMessage"] = event.error_message
+    if event.custom_metadata is not None:
+        payload["customMetadata"] = event.custom_metadata
+    rare = {
+        name
+        for name in _LEAN_PASSTHROUGH & event.model_fields_set
+        if getattr(event, name) is not None
+    }
+    if rare:
+        payload.update(
+            event.model_dump(mode="json", include=rare, exclude_none=True, by_alias=True)
+        )
+    encoded = _dumps(payload)
+    content = event.content
+    if content is None:
+        return encoded
+    members = []
+    if content.role is not None:
+        members.append('"role":' + _dumps(content.role))
+    if content.parts is not None:
+        members.append('"parts":[' + ",".join(map(_encode_part, content.parts)) + "]")
+    return encoded[:-1] + ',"content":{' + ",".join(members) + "}}"
+
+
+def encode_full(event: Event) -> str:
+    return event.model_dump_json(exclude_none=True, by_alias=True)
+
+
+@dataclass(frozen=True)
+class DownstreamProfile:
+    kinds: frozenset[str] = EVENT_KINDS
+    lean: bool = False
+    partial_window_ms: int = 0
+
+    @classmethod
+    def from_query(
+        cls, events: Optional[str], fields: str, partial_ms: int
+    ) -> "DownstreamProfile":
+        kinds = EVENT_KINDS
+        if events:
+            requested = frozenset(kind.strip() for kind in events.split(",") if kind.strip())
+            unknown = requested - EVENT_KINDS
+            if unknown:
+                logger.warning("Ignoring unknown event kinds: %s", ", ".join(sorted(unknown)))
+            kinds = (requested & EVENT_KINDS) or EVENT_KINDS
+        return cls(
+            kinds=kinds,
+            lean=fields == FIELDS_LEAN,
+            partial_window_ms=max(0, min(partial_ms, MAX_PARTIAL_WINDOW_MS)),
+        )
+
+    def encode(self, event: Event) -> str:
+        return encode_lean(event) if self.lean else encode_full(event)
+
+    def filter(self, event: Event) -> Optional[Event]:
+        """Removes parts and fields of unwanted kinds; None if nothing is left."""
+        kinds = self.kinds
+        if kinds == EVENT_KINDS:
+            return event
+        updates: dict[str, Any] = {}
+        for name, kind in _FIELD_KINDS.items():
+            if kind not in kinds and getattr(event, name) is not None:
+                updates[name] = None
+        if "partial" not in kinds and event.partial:
+            for name in _TRANSCRIPTION_FIELDS:
+                transcription = getattr(event, name)
+                if transcription is not None and not transcription.finished:
+                    updates[name] = None
+        content = event.content
+        if content is not None and content.parts:
+            kept = [part for part in content.parts if _part_kind(part) in kinds]
+            if len(kept) != len(content.parts):
+                updates["content"] = content.model_copy(update={"parts": kept}) if kept else None
+        if not updates:
+            return event
+        filtered = event.model_copy(update=updates)
+        if _has_payload(filtered):
+            return filtered
+        metrics.DOWNSTREAM_EVENTS_FILTERED.inc()
+        return None
+
+
+class PartialCoalescer:
+    """Merges partial transcription deltas that arrive within one window.
+
+    Only events that carry nothing but an unfinished input or output
+    transcription are held back; their texts are concatenated, which is
+    what clients do with consecutive deltas anyway. Audio-only events pass
+    straight through, and any other event flushes the pending delta first
+    so turn boundaries keep their order.
+    """
+
+    def __init__(self, window_ms: int) -> None:
+        self._window = window_ms / 1000
+        self._pending: Optional[Event] = None
+        self._field = ""
+        self._texts: list[str] = []
+        self._deadline = 0.0
+        self._closed = False
+
+    def push(self, event: Event) -> list[Event]:
+        """Returns the events to send now, in order."""
+        if self._window <= 0:
+            return [event]
+        field = _partial_transcription(event)
+        if field is None:
+            if _is_audio_only(event):
+                return [event]
+            pending = self.flush()
+            return [pending, event] if pending is not None else [event]
+
+        ready: list[Event] = []
+        if self._pending is not None and field != self._field:
+            ready.append(self.flush())
+        text = getattr(event, field).text or ""
+        if self._pending is None:
+            self._pending = event
+            self._field = field
+            self._texts = [text]
+            self._deadline = time.monotonic() + self._window
+        else:
+            self._texts.append(text)
+            metrics.DOWNSTREAM_PARTIALS_COALESCED.inc()
+        return ready
+
+    def flush(self) -> Optional[Event]:
+        pending = self._pending
+        if pending is None:
+            return None
+        self._pending = None
+        if len(self._texts) > 1:
+            merged = types.Transcription(text="".join(self._texts), finished=False)
+            pending = pending.model_copy(update={self._field: merged})
+        self._texts = []
+        return pending
+
+    async def run_flusher(self, send: Callable[[Event], Awaitable[None]]) -> None:
+        """Sends a pending delta once its window has passed without other events."""
+        if self._window <= 0:
+            return
+        while not self._closed:
+            if self._pending is None:
+                await asyncio.sleep(self._window)
+                continue
+            delay = self._deadline - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            elif (pending := self.flush()) is not None:
+                await send(pending)
+
+    def close(self) -> None:
+        self._closed = True
+
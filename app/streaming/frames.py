@@ -0,0 +1,151 @@
+"""Binary WebSocket framing for audio and image payloads.
+
+In binary mode each downstream audio ``inline_data`` part is sent as its own
+binary frame instead of base64 inside the JSON event, and clients that
+negotiate framed uploads use the same layout for audio and camera frames::
+
+    0      1      2          4            8            12
+    +------+------+----------+------------+------------+-----------+---------+
+    | ver  | kind | mime_len | rate (u32) | turn (u32) | mime type | payload |
+    +------+------+----------+------------+------------+-----------+---------+
+
+All integers are big-endian. ``kind`` is 1 for audio and 2 for images;
+``rate`` and ``turn`` are 0 when they do not apply. Downstream, only the
+non-audio remainder of the event is sent as JSON, and audio-only events
+produce no JSON message at all.
+"""
+
+import re
+import struct
+from typing import Optional
+
+from google.adk.events import Event
+from google.genai import types
+
+FRAME_VERSION = 1
+FRAME_KIND_AUDIO = 1
+FRAME_KIND_IMAGE = 2
+FRAME_HEADER = struct.Struct("!BBHII")
+DEFAULT_OUTPUT_RATE = 24000
+
+# Event fields that are always populated and carry no information on their
+# own once the audio parts are moved to binary frames.
+ENVELOPE_FIELDS = frozenset(
+    {
+        "model_version",
+        "content",
+        "partial",
+        "invocation_id",
+        "author",
+        "actions",
+        "node_info",
+        "branch",
+        "id",
+        "timestamp",
+        "live_session_id",
+    }
+)
+_RATE_PATTERN = re.compile(r"rate=(\d+)")
+
+
+def parse_pcm_rate(mime_type: str, fallback: int = DEFAULT_OUTPUT_RATE) -> int:
+    match = _RATE_PATTERN.search(mime_type)
+    return int(match.group(1)) if match else fallback
+
+
+def encode_audio_frame(data: bytes, mime_type: str, turn_id: int) -> bytes:
+    mime_bytes = mime_type.encode("ascii")
+    header = FRAME_HEADER.pack(
+        FRAME_VERSION,
+        FRAME_KIND_AUDIO,
+        len(mime_bytes),
+        parse_pcm_rate(mime_type),
+        turn_id & 0xFFFFFFFF,
+    )
+    return b"".join((header, mime_bytes, data))
+
+
+def decode_frame(message: bytes) -> tuple[int, str, bytes]:
+    """Returns ``(kind, mime_type, payload)`` of a framed upload."""
+    if len(message) < FRAME_HEADER.size:
+        raise ValueError("binary frame shorter than header")
+    version, kind, mime_len, _rate, _turn = FRAME_HEADER.unpack_from(message)
+    if version != FRAME_VERSION:
+        raise ValueError(f"unsupported frame version: {version}")
+    payload_start = FRAME_HEADER.size + mime_len
+    if len(message) < payload_start:
+        raise ValueError("binary frame shorter than mime type")
+    mime_type = message[FRAME_HEADER.size:payload_start].decode("ascii")
+    return kind, mime_type, message[payload_start:]
+
+
+def _is_audio_part(part: types.Part) -> bool:
+    blob = part.inline_data
+    return bool(
+        blob is not None
+        and blob.data
+        and blob.mime_type
+        and blob.mime_type.startswith("audio/")
+    )
+
+
+def event_has_metadata(event: Event) -> bool:
+    """Whether an event carries anything beyond its envelope fields."""
+    if event.content and event.content.parts:
+        return True
+    for name in type(event).model_fields:
+        if name in ENVELOPE_FIELDS:
+            continue
+        if getattr(event, name) is not None:
+            return True
+    return False
+
+
+def strip_audio(event: Event) -> Event:
+    """Returns a copy of ``event`` without its audio parts."""
+    content = event.content
+    remaining = [part for part in content.parts if not _is_audio_part(part)]
+    stripped = content.model_copy(update={"parts": remaining}) if remaining else None
+    return event.model_copy(update={"content": stripped})
+
+
+def event_has_audio(event: Event) -> bool:
+    content = event.content
+    return bool(content and content.parts and any(_is_audio_part(p) for p in content.parts))
+
+
+class BinaryAudioEncoder:
+    """Splits ADK events into binary audio frames and a JSON remainder.
+
+    One encoder is created per WebSocket connection so the turn counter
+    follows the conversation: it advances after ``turn_complete`` or
+    ``interrupted`` so the client can drop stale audio on barge-in.
+    """
+
+    def __init__(self) -> None:
+        self._turn_id = 0
+
+    @property
+    def turn_id(self) -> int:
+        return self._turn_id
+
+    def split(self, event: Event) -> tuple[list[bytes], Optional[Event]]:
+        """Returns the audio frames and the event left to send as JSON, if any."""
+        frames: list[bytes] = []
+        metadata_event = event
+
+        if event_has_audio(event):
+            for part in event.content.parts:
+                if _is_audio_part(part):
+                    blob = part.inline_data
+                    frames.append(
+                        encode_audio_frame(blob.data, blob.mime_type, self._turn_id)
+                    )
+            metadata_event = strip_audio(event)
+
+        if frames and not event_has_metadata(metadata_event):
+            metadata_event = None
+
+        if event.turn_complete or event.interrupted:
+            self._turn_id += 1
+        return frames, metadata_event
@@ -0,0 +1,159 @@
+"""Camera frame preprocessing before frames reach the Live model.
+
+Frames are rate limited per session, near-duplicates of the previously sent
+frame are dropped, and the rest are downsized and re-encoded as JPEG.
+Resizing and perceptual duplicate detection need Pillow; without it frames
+are forwarded unchanged and only exact duplicates are detected.
+"""
+
+import asyncio
+import hashlib
+import io
+import os
+import time
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from . import metrics
+
+try:
+    from PIL import Image, UnidentifiedImageError
+except ImportError:  # Pillow is optional
+    Image = None
+
+OUTPUT_MIME_TYPE = "image/jpeg"
+HASH_SIZE = 8
+
+
+@dataclass(frozen=True)
+class ImagePreprocessConfig:
+    max_dimension: int = 768
+    jpeg_quality: int = 75
+    max_fps: float = 1.0
+    duplicate_threshold: int = 4
+
+    @classmethod
+    def from_env(cls) -> "ImagePreprocessConfig":
+        return cls(
+            max_dimension=int(os.getenv("CAMERA_MAX_DIMENSION", cls.max_dimension)),
+            jpeg_quality=int(os.getenv("CAMERA_JPEG_QUALITY", cls.jpeg_quality)),
+            max_fps=float(os.getenv("CAMERA_MAX_FPS", cls.max_fps)),
+            duplicate_threshold=int(
+                os.getenv("CAMERA_DUPLICATE_THRESHOLD", cls.duplicate_threshold)
+            ),
+        )
+
+
+def _difference_hash(image: "Image.Image") -> int:
+    small = image.convert("L").resize((HASH_SIZE + 1, HASH_SIZE))
+    pixels = small.tobytes()
+    value = 0
+    for row in range(HASH_SIZE):
+        offset = row * (HASH_SIZE + 1)
+        for col in range(HASH_SIZE):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+class FramePreprocessor:
+    """Per-session camera frame filter.
+
+    ``process`` returns the bytes and mime type to forward, or ``None`` when
+    the frame is dropped. Decoding and re-encoding run in a worker thread,
+    which keeps the event loop free for other sessions; the caller still
+    has to run ``process`` off its own receive loop (see ``main.py``) for
+    this session's audio to keep flowing. With Pillow installed, frames
+    that do not decode or exceed its decompression-bomb limit are dropped;
+    without it, frames are forwarded as-is and only exact repeats dropped.
+    """
+
+    def __init__(self, config: ImagePreprocessConfig) -> None:
+        self._config = config
+        self._min_interval = 1 / config.max_fps if config.max_fps > 0 else 0.0
+        self._last_sent = float("-inf")
+        self._last_fingerprint: Optional[Union[int, bytes]] = None
+        self.received = 0
+        self.sent = 0
+        self.dropped_rate = 0
+        self.dropped_duplicate = 0
+        self.dropped_busy = 0
+        self.dropped_invalid = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "received": self.received,
+            "sent": self.sent,
+            "droppedRate": self.dropped_rate,
+            "droppedDuplicate": self.dropped_duplicate,
+            "droppedBusy": self.dropped_busy,
+            "droppedInvalid": self.dropped_invalid,
+            "bytesIn": self.bytes_in,
+            "bytesOut": self.bytes_out,
+        }
+
+    def drop_busy(self, data: bytes) -> None:
+        """Records a frame skipped because the previous one is still being processed."""
+        self.received += 1
+        self.bytes_in += len(data)
+        self.dropped_busy += 1
+        metrics.CAMERA_FRAMES_BUSY_DROPPED.inc()
+
+    async def process(self, data: bytes, mime_type: str) -> Optional[tuple[bytes, str]]:
+        self.received += 1
+        self.bytes_in += len(data)
+        now = time.monotonic()
+        if now - self._last_sent < self._min_interval:
+            self.dropped_rate += 1
+            metrics.CAMERA_FRAMES_RATE_DROPPED.inc()
+            return None
+
+        prepared = await asyncio.to_thread(self._prepare, data, mime_type)
+        if prepared is None:
+            self.dropped_invalid += 1
+            metrics.CAMERA_FRAMES_INVALID_DROPPED.inc()
+            return None
+        fingerprint, output = prepared
+        if self._is_duplicate(fingerprint):
+            self.dropped_duplicate += 1
+            metrics.CAMERA_FRAMES_DUPLICATE_DROPPED.inc()
+            return None
+
+        self._last_sent = now
+        self._last_fingerprint = fingerprint
+        self.sent += 1
+        self.bytes_out += len(output[0])
+        return output
+
+    def _is_duplicate(self, fingerprint: Union[int, bytes]) -> bool:
+        previous = self._last_fingerprint
+        if previous is None or type(previous) is not type(fingerprint):
+            return False
+        if isinstance(fingerprint, bytes):
+            return fingerprint == previous
+        return bin(fingerprint ^ previous).count("1") <= self._config.duplicate_threshold
+
+    def _prepare(
+        self, data: bytes, mime_type: str
+    ) -> Optional[tuple[Union[int, bytes], tuple[bytes, str]]]:
+        if Image is None:
+            return hashlib.sha1(data).digest(), (data, mime_type)
+        try:
+            image = Image.open(io.BytesIO(data))
+            image.load()
+        except (Image.DecompressionBombError, UnidentifiedImageError, OSError):
+            return None
+
+        fingerprint = _difference_hash(image)
+        max_dimension = self._config.max_dimension
+        if max(image.size) > max_dimension:
+            image.thumbnail((max_dimension, max_dimension))
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        buffer = io.BytesIO()
+        image.save(buffer, format="JPEG", quality=self._config.jpeg_quality)
+        encoded = buffer.getvalue()
+        if mime_type == OUTPUT_MIME_TYPE and len(encoded) >= len(data):
+            return fingerprint, (data, mime_type)
+        return fingerprint, (encoded, OUTPUT_MIME_TYPE)
@@ -0,0 +1,194 @@
+"""Upstream audio ingest: coalescing, bounded buffering and backpressure.
+
+Browsers tend to push many tiny PCM chunks. ``AudioIngest`` joins chunks
+shorter than one frame until they add up to at least a frame before they
+reach ``LiveRequestQueue.send_realtime``; chunks that are already a frame or
+longer are forwarded whole, never split. It also caps how much audio a
+single session may hold while the queue is busy.
+"""
+
+import asyncio
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+
+from google.adk.agents.live_request_queue import LiveRequestQueue
+from google.genai import types
+
+from . import metrics
+
+POLICY_DROP = "drop"
+POLICY_PAUSE = "pause"
+INPUT_SAMPLE_RATE = 16000
+BYTES_PER_SAMPLE = 2
+
+
+def queue_depth(queue: LiveRequestQueue) -> int:
+    """Number of requests waiting in a LiveRequestQueue."""
+    inner = getattr(queue, "_queue", None)
+    return inner.qsize() if inner is not None else 0
+
+
+@dataclass(frozen=True)
+class IngestConfig:
+    frame_ms: int = 40
+    max_buffer_ms: int = 2000
+    max_queue_depth: int = 50
+    policy: str = POLICY_DROP
+    sample_rate: int = INPUT_SAMPLE_RATE
+
+    @property
+    def frame_bytes(self) -> int:
+        return self.sample_rate * BYTES_PER_SAMPLE * self.frame_ms // 1000
+
+    @property
+    def max_buffer_bytes(self) -> int:
+        return self.sample_rate * BYTES_PER_SAMPLE * self.max_buffer_ms // 1000
+
+    @property
+    def mime_type(self) -> str:
+        return f"audio/pcm;rate={self.sample_rate}"
+
+    @classmethod
+    def from_env(cls) -> "IngestConfig":
+        policy = os.getenv("AUDIO_INGEST_POLICY", POLICY_DROP).lower()
+        if policy not in (POLICY_DROP, POLICY_PAUSE):
+            raise ValueError(f"unknown AUDIO_INGEST_POLICY: {policy}")
+        config = cls(
+            frame_ms=int(os.getenv("AUDIO_INGEST_FRAME_MS", cls.frame_ms)),
+            max_buffer_ms=int(os.getenv("AUDIO_INGEST_MAX_BUFFER_MS", cls.max_buffer_ms)),
+            max_queue_depth=int(
+                os.getenv("AUDIO_INGEST_MAX_QUEUE_DEPTH", cls.max_queue_depth)
+            ),
+            policy=policy,
+        )
+        if config.frame_bytes <= 0:
+            raise ValueError(f"AUDIO_INGEST_FRAME_MS must be positive: {config.frame_ms}")
+        if config.max_buffer_ms < config.frame_ms:
+            raise ValueError(
+                "AUDIO_INGEST_MAX_BUFFER_MS must be at least AUDIO_INGEST_FRAME_MS: "
+                f"{config.max_buffer_ms} < {config.frame_ms}"
+            )
+        if config.max_queue_depth <= 0:
+            raise ValueError(
+                f"AUDIO_INGEST_MAX_QUEUE_DEPTH must be positive: {config.max_queue_depth}"
+            )
+        return config
+
+
+class AudioIngest:
+    """Per-session audio buffer in front of a LiveRequestQueue.
+
+    Frames are forwarded while the queue holds fewer than ``max_queue_depth``
+    requests. Beyond that they wait here, up to ``max_buffer_bytes``; past
+    that bound the ``drop`` policy discards the oldest audio and the
+    ``pause`` policy stops reading from the socket until the queue drains.
+    """
+
+    def __init__(self, queue: LiveRequestQueue, config: IngestConfig) -> None:
+        self._queue = queue
+        self._config = config
+        self._partial = bytearray()
+        self._pending: deque[bytes] = deque()
+        self._pending_bytes = 0
+        self._last_push = time.monotonic()
+        self._closed = False
+        self.received_bytes = 0
+        self.sent_frames = 0
+        self.dropped_bytes = 0
+        self.pauses = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return queue_depth(self._queue)
+
+    @property
+    def buffered_bytes(self) -> int:
+        return len(self._partial) + self._pending_bytes
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "queueDepth": self.queue_depth,
+            "bufferedBytes": self.buffered_bytes,
+            "receivedBytes": self.received_bytes,
+            "sentFrames": self.sent_frames,
+            "droppedBytes": self.dropped_bytes,
+            "pauses": self.pauses,
+        }
+
+    async def push(self, data: bytes) -> None:
+        self.received_bytes += len(data)
+        if self._closed:
+            # Nobody consumes the queue any more; don't let it grow.
+            self.dropped_bytes += len(data)
+            metrics.UPSTREAM_DROPPED_BYTES.inc(len(data))
+            return
+        self._last_push = time.monotonic()
+        if len(data) >= self._config.frame_bytes:
+            # Splitting would only add messages; keep earlier audio first.
+            self.flush()
+            self._enqueue(bytes(data))
+        else:
+            self._partial += data
+            if len(self._partial) >= self._config.frame_bytes:
+                self.flush()
+        self._drain()
+
+        if self.buffered_bytes <= self._config.max_buffer_bytes:
+            return
+        if self._config.policy == POLICY_PAUSE:
+            self.pauses += 1
+            await self._wait_for_capacity()
+        else:
+            self._drop_oldest()
+
+    def flush(self) -> None:
+        """Forward any partial frame, e.g. before a text turn or when idle."""
+        if self._partial:
+            self._enqueue(bytes(self._partial))
+            self._partial.clear()
+        self._drain()
+
+    async def run_flusher(self) -> None:
+        """Flush partial frames after a frame of silence and retry pending ones."""
+        interval = self._config.frame_ms / 1000
+        while not self._closed:
+            await asyncio.sleep(interval)
+            if self._partial and time.monotonic() - self._last_push >= interval:
+                self.flush()
+            else:
+                self._drain()
+
+    def close(self) -> None:
+        """Stops forwarding; also releases a ``push()`` paused by backpressure."""
+        self._closed = True
+
+    def _enqueue(self, frame: bytes) -> None:
+        self._pending.append(frame)
+        self._pending_bytes += len(frame)
+
+    def _drain(self) -> None:
+        while self._pending and self.queue_depth < self._config.max_queue_depth:
+            frame = self._pending.popleft()
+            self._pending_bytes -= len(frame)
+            self._queue.send_realtime(
+                types.Blob(mime_type=self._config.mime_type, data=frame)
+            )
+            self.sent_frames += 1
+
+    def _drop_oldest(self) -> None:
+        while self._pending and self.buffered_bytes > self._config.max_buffer_bytes:
+            frame = self._pending.popleft()
+            self._pending_bytes -= len(frame)
+            self.dropped_bytes += len(frame)
+            metrics.UPSTREAM_DROPPED_BYTES.inc(len(frame))
+
+    async def _wait_for_capacity(self) -> None:
+        interval = self._config.frame_ms / 1000
+        while (
+            not self._closed
+            and self.buffered_bytes > self._config.max_buffer_bytes
+        ):
+            await asyncio.sleep(interval)
+            self._drain()
@@ -0,0 +1,53 @@
+"""Logging for the streaming endpoint.
+
+Records are handed to a background thread through a ``QueueHandler`` so the
+event loop never blocks on stdout. ``LOG_LEVEL`` controls verbosity and
+per-message debug logs are sampled every ``LOG_SAMPLE_EVERY`` messages.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+LOGGER_NAMES = ("bidi-workshop", "streaming", "my_agent")
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+_listener = None
+
+
+def configure_logging() -> None:
+    global _listener
+    if _listener is not None:
+        return
+    level = os.getenv("LOG_LEVEL", "INFO").upper()
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    _listener = QueueListener(records, stream_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
+    for name in LOGGER_NAMES:
+        logger = logging.getLogger(name)
+        logger.setLevel(level)
+        logger.addHandler(QueueHandler(records))
+        logger.propagate = False
+
+
+class LogSampler:
+    """Returns True once every ``every`` calls, starting with the first."""
+
+    def __init__(self, every: int) -> None:
+        self._every = max(1, every)
+        self._count = 0
+
+    def __call__(self) -> bool:
+        sampled = self._count % self._every == 0
+        self._count += 1
+        return sampled
+
+
+def sample_every() -> int:
+    return int(os.getenv("LOG_SAMPLE_EVERY", "100"))
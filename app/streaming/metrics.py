@@ -0,0 +1,332 @@
+"""Process-wide streaming metrics in the Prometheus text format.
+
+A deliberately small registry: updates are plain attribute arithmetic on the
+event loop, so the WebSocket hot path never takes a lock or allocates label
+tuples. Label children are resolved once at import time. Misuse fails
+loudly: a labelled metric must be updated through ``labels()`` with one
+value per label name, and label values are escaped when rendered.
+"""
+
+import bisect
+import math
+import time
+from typing import Callable, Iterable, Optional
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Value:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+        self._default = None if self.labelnames else self.labels()
+
+    def labels(self, *values: str):
+        if len(values) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {len(values)} value(s)"
+            )
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = self._new_child()
+        return child
+
+    def _new_child(self):
+        return _Value()
+
+    def _unlabelled(self):
+        default = self._default
+        if default is None:
+            raise ValueError(f"{self.name} has labels {self.labelnames}; use labels() to update it")
+        return default
+
+    def render(self) -> list[str]:
+        documentation = self.documentation.replace("\\", "\\\\").replace("\n", "\\n")
+        lines = [f"# HELP {self.name} {documentation}", f"# TYPE {self.name} {self.kind}"]
+        for key, child in self._children.items():
+            lines.extend(self._render_child(key, child))
+        return lines
+
+    def _render_child(self, key: tuple[str, ...], child) -> list[str]:
+        labels = _format_labels(self.labelnames, key)
+        return [f"{self.name}{labels} {_format_value(child.value)}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._function: Optional[Callable[[], float]] = None
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabelled().inc(amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Computes the value at scrape time instead of on every update."""
+        self._unlabelled()
+        self._function = function
+
+    def render(self) -> list[str]:
+        if self._function is not None:
+            self._default.set(self._function())
+        return super().render()
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._unlabelled().dec(amount)
+
+    def set(self, value: float) -> None:
+        self._unlabelled().set(value)
+
+
+class _HistogramValue:
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        buckets: Iterable[float],
+        labelnames: Iterable[str] = (),
+    ) -> None:
+        self._bounds = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramValue(self._bounds)
+
+    def observe(self, value: float) -> None:
+        self._unlabelled().observe(value)
+
+    def _render_child(self, key: tuple[str, ...], child) -> list[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip((*self._bounds, math.inf), child.counts):
+            cumulative += count
+            labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+        lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: list[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0)
+IMAGE_BUCKETS = (0.5, 1.0, 2.0, 4.0, 6.0, 8.0, 12.0, 20.0, 30.0)
+
+ACTIVE_SESSIONS = REGISTRY.register(
+    Gauge("adk_active_sessions", "WebSocket sessions currently connected.")
+)
+SESSIONS = REGISTRY.register(Counter("adk_sessions_total", "WebSocket sessions accepted."))
+UPSTREAM_MESSAGES = REGISTRY.register(
+    Counter("adk_upstream_messages_total", "Messages received from clients.", ["kind"])
+)
+UPSTREAM_BYTES = REGISTRY.register(
+    Counter("adk_upstream_bytes_total", "Payload bytes received from clients.", ["kind"])
+)
+UPSTREAM_DROPPED_BYTES = REGISTRY.register(
+    Counter(
+        "adk_upstream_audio_dropped_bytes_total",
+        "Audio bytes discarded by the ingest buffer.",
+    )
+)
+CAMERA_FRAMES_DROPPED = REGISTRY.register(
+    Counter("adk_camera_frames_dropped_total", "Camera frames not forwarded.", ["reason"])
+)
+DOWNSTREAM_MESSAGES = REGISTRY.register(
+    Counter("adk_downstream_messages_total", "Messages sent to clients.", ["kind"])
+)
+DOWNSTREAM_BYTES = REGISTRY.register(
+    Counter(
+        "adk_downstream_bytes_total",
+        "Payload size sent to clients (characters for text frames).",
+        ["kind"],
+    )
+)
+DOWNSTREAM_EVENTS_SKIPPED = REGISTRY.register(
+    Counter(
+        "adk_downstream_events_skipped_total",
+        "run_live() events not sent as their own message.",
+        ["reason"],
+    )
+)
+QUEUE_DEPTH = REGISTRY.register(
+    Gauge("adk_live_request_queue_depth", "Requests waiting in all LiveRequestQueues.")
+)
+QUEUE_DEPTH_MAX = REGISTRY.register(
+    Gauge("adk_live_request_queue_depth_max", "Deepest LiveRequestQueue right now.")
+)
+TIME_TO_FIRST_AUDIO = REGISTRY.register(
+    Histogram(
+        "adk_time_to_first_audio_seconds",
+        "From the end of user input to the first model audio of a turn.",
+        LATENCY_BUCKETS,
+    )
+)
+IMAGE_CACHE_HITS = REGISTRY.register(
+    Counter("adk_image_cache_hits_total", "Image requests served from memory.")
+)
+IMAGE_CACHE_DISK_HITS = REGISTRY.register(
+    Counter("adk_image_cache_disk_hits_total", "Image requests served from the disk tier.")
+)
+IMAGE_CACHE_MISSES = REGISTRY.register(
+    Counter("adk_image_cache_misses_total", "Image requests that called the model.")
+)
+IMAGE_CACHE_SHARED = REGISTRY.register(
+    Counter(
+        "adk_image_cache_shared_total",
+        "Image requests that joined an in-flight generation for the same prompt.",
+    )
+)
+IMAGE_CACHE_BYTES = REGISTRY.register(
+    Gauge("adk_image_cache_bytes", "Size of the in-memory image cache.")
+)
+IMAGE_CACHE_DISK_BYTES = REGISTRY.register(
+    Gauge("adk_image_cache_disk_bytes", "Size of the on-disk image cache.")
+)
+IMAGE_GENERATION = REGISTRY.register(
+    Histogram("adk_image_generation_seconds", "Image generation latency.", IMAGE_BUCKETS)
+)
+ERRORS = REGISTRY.register(Counter("adk_errors_total", "Errors by stage.", ["stage"]))
+STORED_SESSIONS = REGISTRY.register(
+    Gauge("adk_session_store_sessions", "Sessions held in memory by the session service.")
+)
+STORED_SESSION_BYTES = REGISTRY.register(
+    Gauge("adk_session_store_bytes", "Estimated size of sessions held in memory.")
+)
+LIVE_SESSION_START = REGISTRY.register(
+    Histogram(
+        "adk_live_session_start_seconds",
+        "From WebSocket accept to the first run_live() event.",
+        LATENCY_BUCKETS,
+        ["mode"],
+    )
+)
+RESUMPTIONS = REGISTRY.register(
+    Counter("adk_live_resumptions_total", "Live session resumption attempts.", ["result"])
+)
+RESUMPTION_HANDLES = REGISTRY.register(
+    Gauge("adk_live_resumption_handles", "Resumption handles currently kept.")
+)
+SESSION_EVICTIONS = REGISTRY.register(
+    Counter("adk_session_store_evictions_total", "Sessions evicted from memory.")
+)
+
+UPSTREAM_AUDIO_MESSAGES = UPSTREAM_MESSAGES.labels("audio")
+UPSTREAM_AUDIO_BYTES = UPSTREAM_BYTES.labels("audio")
+UPSTREAM_TEXT_MESSAGES = UPSTREAM_MESSAGES.labels("text")
+UPSTREAM_TEXT_BYTES = UPSTREAM_BYTES.labels("text")
+UPSTREAM_IMAGE_MESSAGES = UPSTREAM_MESSAGES.labels("image")
+UPSTREAM_IMAGE_BYTES = UPSTREAM_BYTES.labels("image")
+CAMERA_FRAMES_RATE_DROPPED = CAMERA_FRAMES_DROPPED.labels("rate")
+CAMERA_FRAMES_DUPLICATE_DROPPED = CAMERA_FRAMES_DROPPED.labels("duplicate")
+CAMERA_FRAMES_BUSY_DROPPED = CAMERA_FRAMES_DROPPED.labels("busy")
+CAMERA_FRAMES_INVALID_DROPPED = CAMERA_FRAMES_DROPPED.labels("invalid")
+RESUMPTIONS_SUCCEEDED = RESUMPTIONS.labels("success")
+RESUMPTIONS_FAILED = RESUMPTIONS.labels("failure")
+DOWNSTREAM_JSON_MESSAGES = DOWNSTREAM_MESSAGES.labels("json")
+DOWNSTREAM_JSON_BYTES = DOWNSTREAM_BYTES.labels("json")
+DOWNSTREAM_BINARY_MESSAGES = DOWNSTREAM_MESSAGES.labels("binary")
+DOWNSTREAM_BINARY_BYTES = DOWNSTREAM_BYTES.labels("binary")
+DOWNSTREAM_EVENTS_FILTERED = DOWNSTREAM_EVENTS_SKIPPED.labels("filtered")
+DOWNSTREAM_PARTIALS_COALESCED = DOWNSTREAM_EVENTS_SKIPPED.labels("coalesced")
+
+
+class TurnTimer:
+    """Measures time-to-first-audio for each turn of one session.
+
+    The clock restarts on every user input of a turn (a text message or an
+    input transcription delta), so it measures from the end of the user's
+    input to the first model audio. ``turn_complete`` or ``interrupted``
+    resets it for the next turn.
+    """
+
+    def __init__(self) -> None:
+        self._started: Optional[float] = None
+        self._audio_seen = False
+
+    def user_input(self) -> None:
+        if not self._audio_seen:
+            self._started = time.monotonic()
+
+    def model_audio(self) -> None:
+        if self._started is not None:
+            TIME_TO_FIRST_AUDIO.observe(time.monotonic() - self._started)
+            self._started = None
+        self._audio_seen = True
+
+    def end_turn(self) -> None:
+        self._started = None
+        self._audio_seen = False
@@ -0,0 +1,72 @@
+"""Live API session resumption handles kept across WebSocket reconnects."""
+
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from google.adk.events import Event
+
+
+@dataclass
+class _Entry:
+    handle: str
+    expires_at: Optional[float] = None
+
+
+def resumption_handle(event: Event) -> Optional[str]:
+    """New resumable handle carried by an event, if any."""
+    update = event.live_session_resumption_update
+    if update is None or not update.new_handle or update.resumable is False:
+        return None
+    return update.new_handle
+
+
+class ResumptionStore:
+    """Latest resumption handle per ``(user_id, session_id)``.
+
+    Handles are kept indefinitely while a client is connected and for
+    ``grace_seconds`` after it disconnects, so a client that reconnects
+    quickly resumes the same Live session instead of paying a cold start.
+    """
+
+    def __init__(self, grace_seconds: float) -> None:
+        self._grace_seconds = grace_seconds
+        self._entries: dict[tuple[str, str], _Entry] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def handle_for(self, user_id: str, session_id: str) -> Optional[str]:
+        self._purge()
+        entry = self._entries.get((user_id, session_id))
+        if entry is None:
+            return None
+        entry.expires_at = None
+        return entry.handle
+
+    def update(self, user_id: str, session_id: str, handle: str) -> None:
+        """Stores a newer handle; an entry already counting down keeps its expiry."""
+        entry = self._entries.get((user_id, session_id))
+        if entry is None:
+            self._entries[(user_id, session_id)] = _Entry(handle)
+        else:
+            entry.handle = handle
+
+    def disconnected(self, user_id: str, session_id: str) -> None:
+        entry = self._entries.get((user_id, session_id))
+        if entry is not None:
+            entry.expires_at = time.monotonic() + self._grace_seconds
+        self._purge()
+
+    def discard(self, user_id: str, session_id: str) -> None:
+        self._entries.pop((user_id, session_id), None)
+
+    def _purge(self) -> None:
+        now = time.monotonic()
+        expired = [
+            key
+            for key, entry in self._entries.items()
+            if entry.expires_at is not None and entry.expires_at <= now
+        ]
+        for key in expired:
+            del self._entries[key]
@@ -0,0 +1 @@
+"""Static asset serving for the bidi-workshop PWA."""
@@ -0,0 +1,174 @@
+"""Cache-friendly serving of the built frontend in app/static.
+
+``frontend/scripts/precompress-static.mjs`` writes ``.br``/``.gz`` variants
+next to the compressible files Vite emits (and removes outdated ones); both
+classes here pick the best variant the client accepts instead of
+compressing per request. A variant older than its source is ignored, so a
+hand edit to the source is served as-is rather than shadowed by a stale
+copy.
+
+- ``PrecompressedStaticFiles`` serves ``/static``. Vite only emits
+  content-hashed names under ``assets/``, so those are cached as immutable;
+  everything else is revalidated with its ETag.
+- ``EntryFile`` keeps a small, unhashed entry file (index.html,
+  service-worker.js, the manifest) in memory with a content-hash ETag and
+  reloads it when the file on disk changes.
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+from pathlib import Path
+from typing import Optional
+
+from starlette.datastructures import Headers
+from starlette.requests import Request
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+HASHED_PREFIX = "assets/"
+# Preferred first; only br and gzip variants are produced at build time.
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def accepted_encodings(accept_encoding: Optional[str]) -> set[str]:
+    """Content codings listed in Accept-Encoding with a non-zero q value."""
+    accepted = set()
+    for item in (accept_encoding or "").split(","):
+        name, *params = item.strip().split(";")
+        quality = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name and quality > 0:
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+def _fresh_variant(path: str, source_stat: os.stat_result) -> Optional[os.stat_result]:
+    """Stat of a compressed variant, or None if it is missing or older than its source."""
+    try:
+        variant_stat = os.stat(path)
+    except OSError:
+        return None
+    if variant_stat.st_mtime_ns < source_stat.st_mtime_ns:
+        return None
+    return variant_stat
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """``StaticFiles`` that prefers precompressed variants and sets Cache-Control."""
+
+    def file_response(
+        self,
+        full_path: "os.PathLike[str] | str",
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        relative = os.path.relpath(full_path, self.directory).replace(os.sep, "/")
+        headers = {
+            "Cache-Control": IMMUTABLE if relative.startswith(HASHED_PREFIX) else REVALIDATE,
+            "Vary": "Accept-Encoding",
+        }
+        media_type = mimetypes.guess_type(str(full_path))[0] or "text/plain"
+        served_path, served_stat = full_path, stat_result
+        accepted = accepted_encodings(request_headers.get("accept-encoding"))
+        for encoding, suffix in ENCODINGS:
+            if encoding not in accepted:
+                continue
+            variant_stat = _fresh_variant(f"{full_path}{suffix}", stat_result)
+            if variant_stat is None:
+                continue
+            served_path, served_stat = f"{full_path}{suffix}", variant_stat
+            headers["Content-Encoding"] = encoding
+            break
+
+        response = FileResponse(
+            served_path,
+            status_code=status_code,
+            stat_result=served_stat,
+            media_type=media_type,
+            headers=headers,
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+class EntryFile:
+    """An unhashed entry file held in memory with its compressed variants."""
+
+    def __init__(
+        self,
+        path: Path,
+        media_type: Optional[str] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> None:
+        self._path = path
+        self._media_type = media_type or mimetypes.guess_type(path.name)[0] or "text/plain"
+        self._headers = headers or {}
+        self._version: tuple = ()
+        self._bodies: dict[str, bytes] = {}
+        self._etag = ""
+
+    def response(self, request: Request) -> Response:
+        self._reload_if_changed()
+        accepted = accepted_encodings(request.headers.get("accept-encoding"))
+        encoding = next(
+            (name for name, _ in ENCODINGS if name in accepted and name in self._bodies), ""
+        )
+        etag = f'"{self._etag}-{encoding}"' if encoding else f'"{self._etag}"'
+        headers = {
+            **self._headers,
+            "Cache-Control": REVALIDATE,
+            "ETag": etag,
+            "Vary": "Accept-Encoding",
+        }
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return Response(self._bodies[encoding], media_type=self._media_type, headers=headers)
+
+    def _reload_if_changed(self) -> None:
+        source_stat = self._path.stat()
+        variants = {}
+        for encoding, suffix in ENCODINGS:
+            variant_path = f"{self._path}{suffix}"
+            variant_stat = _fresh_variant(variant_path, source_stat)
+            if variant_stat is not None:
+                variants[encoding] = (variant_path, variant_stat.st_mtime_ns)
+        version = (source_stat.st_mtime_ns, source_stat.st_size, tuple(variants.items()))
+        if version == self._version:
+            return
+        body = self._path.read_bytes()
+        bodies = {"": body}
+        for encoding, (variant_path, _) in variants.items():
+            try:
+                bodies[encoding] = Path(variant_path).read_bytes()
+            except OSError:
+                pass
+        if "gzip" not in bodies:
+            compressed = gzip.compress(body, compresslevel=9, mtime=0)
+            if len(compressed) < len(body):
+                bodies["gzip"] = compressed
+        self._bodies = bodies
+        self._etag = hashlib.sha256(body).hexdigest()[:16]
+        self._version = version
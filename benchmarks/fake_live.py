@@ -0,0 +1,240 @@
+"""Offline stand-ins for the ADK runner and the image agent.
+
+``FakeLiveRunner.run_live`` consumes the LiveRequestQueue like the real
+runner and emits scripted turns (input/output transcription, 24 kHz audio at
+real-time pace, turn completion). Every downstream event carries a
+``time.time_ns()`` stamp so the client can measure event-to-socket latency:
+in the first 8 bytes of audio payloads, and in ``custom_metadata`` otherwise.
+Each upstream audio chunk starts with ``UPSTREAM_MARKER`` and a stamp (see
+``upstream_chunk``); the runner finds every marker in the audio it dequeues,
+however the server grouped the chunks, which is how upstream-to-queue
+latency is measured.
+
+A cold ``run_live`` waits ``Script.setup_ms`` before the first event to
+model Live session setup. Every turn issues a session resumption handle;
+passing a known handle in ``run_config.session_resumption`` skips the setup
+delay, and an unknown one fails the connection like an expired handle would.
+"""
+
+import asyncio
+import base64
+import itertools
+import struct
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+
+from google.adk.agents.live_request_queue import LiveRequestQueue
+from google.adk.events import Event
+from google.adk.sessions import BaseSessionService
+from google.genai import types
+
+STAMP = struct.Struct("!Q")
+STAMP_KEY = "benchTs"
+# PCM silence is all zeros, so this never occurs in the audio by accident.
+UPSTREAM_MARKER = b"\xffbenchts"
+OUTPUT_MIME_TYPE = "audio/pcm;rate=24000"
+OUTPUT_BYTES_PER_MS = 48
+# A 1x1 transparent PNG
+STUB_IMAGE = base64.b64encode(
+    bytes.fromhex(
+        "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+        "1f15c4890000000d49444154789c6360000002000100e221bc330000000049454e44ae426082"
+    )
+).decode("utf-8")
+
+
+def stamp_now() -> int:
+    return time.time_ns()
+
+
+def elapsed_ms(stamp: int) -> float:
+    return (time.time_ns() - stamp) / 1_000_000
+
+
+def upstream_chunk(chunk_bytes: int) -> bytes:
+    """A chunk of PCM silence that starts with the marker and a send stamp."""
+    head = UPSTREAM_MARKER + STAMP.pack(stamp_now())
+    return head + bytes(max(0, chunk_bytes - len(head)))
+
+
+@dataclass(frozen=True)
+class Script:
+    turn_ms: int = 3000
+    pause_ms: int = 1500
+    audio_chunk_ms: int = 40
+    partials_per_turn: int = 6
+    setup_ms: int = 0
+
+
+class FakeLiveRunner:
+    """Drop-in for ``Runner.run_live`` that never talks to a model.
+
+    Like the real runner, non-partial events are appended to the session
+    when a session service is given, so session storage cost is included.
+    """
+
+    def __init__(
+        self,
+        script: Script,
+        app_name: str = "",
+        session_service: Optional[BaseSessionService] = None,
+    ) -> None:
+        self._script = script
+        self._app_name = app_name
+        self._session_service = session_service
+        self.upstream_latencies_ms: list[float] = []
+        self.upstream_bytes = 0
+        self.upstream_requests = 0
+        self.events_emitted = 0
+        self.active_sessions = 0
+        self.cold_starts = 0
+        self.resumed_starts = 0
+        self.failed_resumptions = 0
+        self._handles: set[str] = set()
+        self._handle_ids = itertools.count()
+
+    def stats(self) -> dict:
+        return {
+            "upstreamLatenciesMs": self.upstream_latencies_ms,
+            "upstreamBytes": self.upstream_bytes,
+            "upstreamRequests": self.upstream_requests,
+            "eventsEmitted": self.events_emitted,
+            "activeSessions": self.active_sessions,
+            "coldStarts": self.cold_starts,
+            "resumedStarts": self.resumed_starts,
+            "failedResumptions": self.failed_resumptions,
+        }
+
+    async def run_live(
+        self,
+        *,
+        user_id: str,
+        session_id: str,
+        live_request_queue: LiveRequestQueue,
+        run_config=None,
+        **_: object,
+    ) -> AsyncIterator[Event]:
+        resumption = getattr(run_config, "session_resumption", None)
+        handle = resumption.handle if resumption is not None else None
+        if handle:
+            if handle not in self._handles:
+                self.failed_resumptions += 1
+                raise ValueError(f"unknown resumption handle {handle!r}")
+            self.resumed_starts += 1
+        else:
+            self.cold_starts += 1
+            await asyncio.sleep(self._script.setup_ms / 1000)
+        self.active_sessions += 1
+        consumer = asyncio.create_task(self._consume(live_request_queue))
+        session = None
+        if self._session_service is not None:
+            session = await self._session_service.get_session(
+                app_name=self._app_name, user_id=user_id, session_id=session_id
+            )
+        try:
+            yield self._resumption_update()
+            while not consumer.done():
+                async for event in self._turn():
+                    if consumer.done():
+                        return
+                    if session is not None and not event.partial:
+                        await self._session_service.append_event(session, event)
+                    self.events_emitted += 1
+                    yield event
+                yield self._resumption_update()
+                await asyncio.sleep(self._script.pause_ms / 1000)
+        finally:
+            consumer.cancel()
+            self.active_sessions -= 1
+
+    def _resumption_update(self) -> Event:
+        handle = f"fake-handle-{next(self._handle_ids)}"
+        self._handles.add(handle)
+        return Event(
+            author="fake_live",
+            live_session_resumption_update=types.LiveServerSessionResumptionUpdate(
+                new_handle=handle, resumable=True
+            ),
+        )
+
+    async def _consume(self, queue: LiveRequestQueue) -> None:
+        while True:
+            request = await queue.get()
+            if request.close:
+                return
+            self.upstream_requests += 1
+            blob = request.blob
+            if blob is None or not blob.data or not blob.mime_type.startswith("audio/"):
+                continue
+            self.upstream_bytes += len(blob.data)
+            self._record_stamps(blob.data)
+
+    def _record_stamps(self, data: bytes) -> None:
+        offset = data.find(UPSTREAM_MARKER)
+        while offset != -1:
+            stamp_at = offset + len(UPSTREAM_MARKER)
+            if stamp_at + STAMP.size > len(data):
+                return
+            (stamp,) = STAMP.unpack_from(data, stamp_at)
+            latency = elapsed_ms(stamp)
+            if 0 <= latency < 60_000:
+                self.upstream_latencies_ms.append(latency)
+            offset = data.find(UPSTREAM_MARKER, stamp_at + STAMP.size)
+
+    async def _turn(self) -> AsyncIterator[Event]:
+        script = self._script
+        yield Event(
+            author="fake_live",
+            input_transcription=types.Transcription(text="hello there", finished=True),
+            custom_metadata={STAMP_KEY: stamp_now()},
+        )
+        chunks = max(1, script.turn_ms // script.audio_chunk_ms)
+        partial_every = max(1, chunks // max(1, script.partials_per_turn))
+        chunk_bytes = script.audio_chunk_ms * OUTPUT_BYTES_PER_MS
+        started = time.monotonic()
+        for index in range(chunks):
+            payload = STAMP.pack(stamp_now()) + bytes(chunk_bytes - STAMP.size)
+            yield Event(
+                author="fake_live",
+                content=types.Content(
+                    role="model",
+                    parts=[
+                        types.Part(
+                            inline_data=types.Blob(
+                                mime_type=OUTPUT_MIME_TYPE, data=payload
+                            )
+                        )
+                    ],
+                ),
+            )
+            if index % partial_every == 0:
+                yield Event(
+                    author="fake_live",
+                    partial=True,
+                    output_transcription=types.Transcription(
+                        text=f"word {index}", finished=False
+                    ),
+                    custom_metadata={STAMP_KEY: stamp_now()},
+                )
+            # Pace audio in real time, correcting for drift.
+            target = started + (index + 1) * script.audio_chunk_ms / 1000
+            await asyncio.sleep(max(0.0, target - time.monotonic()))
+        yield Event(
+            author="fake_live",
+            turn_complete=True,
+            custom_metadata={STAMP_KEY: stamp_now()},
+        )
+
+
+class StubImageAgent:
+    """Replaces ``ImageGenerationAgent`` with a fixed delay and a tiny PNG."""
+
+    def __init__(self, delay_s: float) -> None:
+        self._delay_s = delay_s
+        self.cache = None
+
+    async def generate_image(self, prompt: str, executor=None) -> tuple[str, str]:
+        # Occupy a worker thread like the real blocking API call.
+        await asyncio.get_running_loop().run_in_executor(executor, time.sleep, self._delay_s)
+        return STUB_IMAGE, "image/png"
@@ -0,0 +1,379 @@
+"""Offline load test for the /ws/{user_id}/{session_id} endpoint.
+
+Starts ``app/main.py`` in a subprocess with ``runner`` and ``image_agent``
+replaced by the stand-ins from ``fake_live``, then drives N simulated
+WebSocket clients that stream PCM at real-time pace.
+
+Usage:
+    python benchmarks/load_test.py --sessions 50 --duration 30
+    python benchmarks/load_test.py --sessions 20 --audio binary --json
+    python benchmarks/load_test.py --sessions 20 --reconnect-every 5
+    python benchmarks/load_test.py --sessions 20 --fields lean --partial-ms 200
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import math
+import os
+import resource
+import subprocess
+import sys
+import time
+import urllib.parse
+import urllib.request
+from pathlib import Path
+from typing import Optional
+
+import websockets
+
+BENCH_DIR = Path(__file__).resolve().parent
+APP_DIR = BENCH_DIR.parent / "app"
+sys.path.insert(0, str(BENCH_DIR))
+
+from fake_live import STAMP, STAMP_KEY, elapsed_ms, upstream_chunk  # noqa: E402
+
+INPUT_BYTES_PER_MS = 32
+FRAME_HEADER_SIZE = 12
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def without_nan(value):
+    """NaN (no samples) is not valid JSON; report it as null."""
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, dict):
+        return {key: without_nan(item) for key, item in value.items()}
+    return value
+
+
+def current_rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # ru_maxrss is the peak, in KiB on Linux and bytes on macOS.
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def serve(args: argparse.Namespace) -> None:
+    """Runs the app with the fake runner; invoked in the server subprocess."""
+    import uvicorn
+
+    # Never reach Google APIs from the benchmark.
+    os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = "FALSE"
+    os.environ.setdefault("GOOGLE_API_KEY", "offline-benchmark")
+    sys.path.insert(0, str(APP_DIR))
+    import main
+    from fake_live import FakeLiveRunner, Script, StubImageAgent
+
+    fake_runner = FakeLiveRunner(
+        Script(
+            turn_ms=args.turn_ms,
+            pause_ms=args.pause_ms,
+            partials_per_turn=args.partials_per_turn,
+            setup_ms=args.setup_ms,
+        ),
+        app_name=main.APP_NAME,
+        session_service=main.session_service,
+    )
+    main.runner = fake_runner
+    main.image_agent = StubImageAgent(args.image_delay)
+
+    @main.app.get("/bench/stats")
+    async def bench_stats():
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return {
+            **fake_runner.stats(),
+            "cpuSeconds": usage.ru_utime + usage.ru_stime,
+            "rssBytes": current_rss_bytes(),
+        }
+
+    uvicorn.run(main.app, host="127.0.0.1", port=args.port, log_level="warning")
+
+
+class ClientStats:
+    def __init__(self) -> None:
+        self.event_latencies_ms: list[float] = []
+        self.audio_latencies_ms: list[float] = []
+        self.messages = 0
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        self.images = 0
+        self.errors = 0
+        self.cold_first_message_ms: list[float] = []
+        self.reconnect_first_message_ms: list[float] = []
+
+
+def record_text(stats: ClientStats, text: str) -> None:
+    event = json.loads(text)
+    if event.get("author") == "image_agent":
+        stats.images += 1
+        return
+    stamp = (event.get("customMetadata") or {}).get(STAMP_KEY)
+    if stamp is not None:
+        stats.event_latencies_ms.append(elapsed_ms(stamp))
+    for part in (event.get("content") or {}).get("parts", []):
+        inline = part.get("inlineData") or {}
+        if inline.get("mimeType", "").startswith("audio/") and inline.get("data"):
+            # ADK serializes bytes as URL-safe base64.
+            head = base64.urlsafe_b64decode(inline["data"][:12])
+            stats.audio_latencies_ms.append(elapsed_ms(STAMP.unpack_from(head)[0]))
+
+
+def record_binary(stats: ClientStats, data: bytes) -> None:
+    mime_len = int.from_bytes(data[2:4], "big")
+    payload_start = FRAME_HEADER_SIZE + mime_len
+    stats.audio_latencies_ms.append(
+        elapsed_ms(STAMP.unpack_from(data, payload_start)[0])
+    )
+
+
+async def run_client(
+    index: int, args: argparse.Namespace, stats: ClientStats, stop: asyncio.Event
+) -> None:
+    # Reconnects reuse the session id so the server can resume the Live session.
+    query = urllib.parse.urlencode(
+        {"audio": args.audio, "fields": args.fields, "partial_ms": args.partial_ms}
+        | ({"events": args.events} if args.events else {})
+    )
+    url = f"ws://127.0.0.1:{args.port}/ws/bench-{index}/session-{index}?{query}"
+    reconnect = False
+    while not stop.is_set():
+        deadline = time.monotonic() + args.reconnect_every if args.reconnect_every else None
+        try:
+            await run_connection(index, url, args, stats, stop, reconnect, deadline)
+        except (OSError, ValueError, KeyError, websockets.WebSocketException) as error:
+            print(f"client {index} failed: {error!r}", file=sys.stderr)
+            stats.errors += 1
+            return
+        reconnect = True
+
+
+async def run_connection(
+    index: int,
+    url: str,
+    args: argparse.Namespace,
+    stats: ClientStats,
+    stop: asyncio.Event,
+    reconnect: bool,
+    deadline: Optional[float],
+) -> None:
+    chunk_bytes = args.chunk_ms * INPUT_BYTES_PER_MS
+    connecting = time.monotonic()
+    first_message = (
+        stats.reconnect_first_message_ms if reconnect else stats.cold_first_message_ms
+    )
+    async with websockets.connect(url, max_size=None) as websocket:
+
+        async def receive() -> None:
+            awaiting_first = True
+            async for message in websocket:
+                if awaiting_first:
+                    awaiting_first = False
+                    first_message.append((time.monotonic() - connecting) * 1000)
+                stats.messages += 1
+                stats.bytes_received += len(message)
+                if isinstance(message, bytes):
+                    record_binary(stats, message)
+                else:
+                    record_text(stats, message)
+
+        async def send() -> None:
+            started = time.monotonic()
+            sent = 0
+            next_image = started + args.image_every if args.image_every else None
+            while not stop.is_set() and (deadline is None or time.monotonic() < deadline):
+                chunk = upstream_chunk(chunk_bytes)
+                await websocket.send(chunk)
+                stats.bytes_sent += len(chunk)
+                sent += 1
+                now = time.monotonic()
+                if next_image is not None and now >= next_image:
+                    await websocket.send(
+                        json.dumps({"type": "text", "text": f"image: bench {index}"})
+                    )
+                    next_image = now + args.image_every
+                target = started + sent * args.chunk_ms / 1000
+                await asyncio.sleep(max(0.0, target - time.monotonic()))
+
+        receiver = asyncio.create_task(receive())
+        await send()
+        if receiver.done():
+            receiver.result()
+        receiver.cancel()
+
+
+def fetch_stats(port: int) -> dict:
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/bench/stats") as response:
+        return json.loads(response.read())
+
+
+def wait_for_server(port: int, timeout_s: float = 30.0) -> dict:
+    deadline = time.monotonic() + timeout_s
+    while True:
+        try:
+            return fetch_stats(port)
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.2)
+
+
+async def drive(args: argparse.Namespace) -> dict:
+    stats = [ClientStats() for _ in range(args.sessions)]
+    stop = asyncio.Event()
+    clients = []
+    for index in range(args.sessions):
+        clients.append(asyncio.create_task(run_client(index, args, stats[index], stop)))
+        if args.ramp:
+            await asyncio.sleep(args.ramp / args.sessions)
+    await asyncio.sleep(args.duration)
+    stop.set()
+    await asyncio.gather(*clients)
+
+    merged = ClientStats()
+    for item in stats:
+        merged.event_latencies_ms += item.event_latencies_ms
+        merged.audio_latencies_ms += item.audio_latencies_ms
+        merged.messages += item.messages
+        merged.bytes_received += item.bytes_received
+        merged.bytes_sent += item.bytes_sent
+        merged.images += item.images
+        merged.errors += item.errors
+        merged.cold_first_message_ms += item.cold_first_message_ms
+        merged.reconnect_first_message_ms += item.reconnect_first_message_ms
+    return vars(merged)
+
+
+def report(args: argparse.Namespace, before: dict, after: dict, clients: dict) -> dict:
+    duration = args.duration + args.ramp
+    sessions = args.sessions
+    upstream = after["upstreamLatenciesMs"][len(before["upstreamLatenciesMs"]):]
+    cpu_seconds = after["cpuSeconds"] - before["cpuSeconds"]
+    resumed = after["resumedStarts"] - before["resumedStarts"]
+    attempts = resumed + after["failedResumptions"] - before["failedResumptions"]
+    return {
+        "sessions": sessions,
+        "durationS": duration,
+        "audioMode": args.audio,
+        "fields": args.fields,
+        "partialMs": args.partial_ms,
+        "events": args.events or "all",
+        "upstreamToQueueMs": {"p50": percentile(upstream, 0.5), "p99": percentile(upstream, 0.99)},
+        "eventToSocketMs": {
+            "p50": percentile(clients["event_latencies_ms"], 0.5),
+            "p99": percentile(clients["event_latencies_ms"], 0.99),
+        },
+        "audioToSocketMs": {
+            "p50": percentile(clients["audio_latencies_ms"], 0.5),
+            "p99": percentile(clients["audio_latencies_ms"], 0.99),
+        },
+        "upstreamBytesPerS": clients["bytes_sent"] / duration,
+        "downstreamBytesPerS": clients["bytes_received"] / duration,
+        "downstreamMessagesPerS": clients["messages"] / duration,
+        "coldFirstMessageMs": {
+            "p50": percentile(clients["cold_first_message_ms"], 0.5),
+            "p99": percentile(clients["cold_first_message_ms"], 0.99),
+        },
+        "reconnectFirstMessageMs": {
+            "p50": percentile(clients["reconnect_first_message_ms"], 0.5),
+            "p99": percentile(clients["reconnect_first_message_ms"], 0.99),
+        },
+        "reconnects": len(clients["reconnect_first_message_ms"]),
+        "resumeSuccessRate": resumed / attempts if attempts else float("nan"),
+        "imagesReceived": clients["images"],
+        "clientErrors": clients["errors"],
+        "serverCpuPercent": 100 * cpu_seconds / duration,
+        "serverCpuPercentPerSession": 100 * cpu_seconds / duration / sessions,
+        "serverRssBytes": after["rssBytes"],
+        "serverRssBytesPerSession": (after["rssBytes"] - before["rssBytes"]) / sessions,
+    }
+
+
+def print_report(result: dict) -> None:
+    print(
+        f"sessions={result['sessions']} duration={result['durationS']}s audio={result['audioMode']}"
+        f" fields={result['fields']} partial_ms={result['partialMs']} events={result['events']}"
+    )
+    for key in (
+        "upstreamToQueueMs",
+        "eventToSocketMs",
+        "audioToSocketMs",
+        "coldFirstMessageMs",
+        "reconnectFirstMessageMs",
+    ):
+        print(f"  {key:<28} p50={result[key]['p50']:8.2f}  p99={result[key]['p99']:8.2f}")
+    print(f"  {'upstream KiB/s':<28} {result['upstreamBytesPerS'] / 1024:10.1f}")
+    print(f"  {'downstream KiB/s':<28} {result['downstreamBytesPerS'] / 1024:10.1f}")
+    print(f"  {'downstream msg/s':<28} {result['downstreamMessagesPerS']:10.1f}")
+    print(f"  {'server CPU %':<28} {result['serverCpuPercent']:10.1f}")
+    print(f"  {'server CPU % / session':<28} {result['serverCpuPercentPerSession']:10.2f}")
+    print(f"  {'server RSS MiB':<28} {result['serverRssBytes'] / 2**20:10.1f}")
+    print(f"  {'server RSS KiB / session':<28} {result['serverRssBytesPerSession'] / 1024:10.1f}")
+    print(f"  {'reconnects':<28} {result['reconnects']:10d}")
+    print(f"  {'resume success rate':<28} {result['resumeSuccessRate']:10.2f}")
+    print(f"  {'images received':<28} {result['imagesReceived']:10d}")
+    print(f"  {'client errors':<28} {result['clientErrors']:10d}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds at full load")
+    parser.add_argument("--ramp", type=float, default=2.0, help="seconds to connect all clients")
+    parser.add_argument("--audio", choices=("json", "binary"), default="json")
+    parser.add_argument("--fields", choices=("full", "lean"), default="full")
+    parser.add_argument("--partial-ms", type=int, default=0, help="partial transcription coalescing window")
+    parser.add_argument("--events", default="", help="comma-separated event kinds to receive (default: all)")
+    parser.add_argument("--chunk-ms", type=int, default=128, help="client PCM chunk length (the PWA sends 128 ms)")
+    parser.add_argument("--turn-ms", type=int, default=3000)
+    parser.add_argument("--pause-ms", type=int, default=1500)
+    parser.add_argument("--image-every", type=float, default=0.0, help="seconds between image prompts per client (0 = off)")
+    parser.add_argument("--partials-per-turn", type=int, default=6, help="partial output transcription events per turn")
+    parser.add_argument("--setup-ms", type=int, default=500, help="fake Live session setup time on cold start")
+    parser.add_argument("--reconnect-every", type=float, default=0.0, help="seconds between client reconnects (0 = off)")
+    parser.add_argument("--image-delay", type=float, default=2.0, help="stub image generation time")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.serve:
+        serve(args)
+        return
+
+    server = subprocess.Popen(
+        [sys.executable, __file__, "--serve", *sys.argv[1:]],
+        stdout=subprocess.DEVNULL,
+        cwd=APP_DIR,
+    )
+    try:
+        before = wait_for_server(args.port)
+        clients = asyncio.run(drive(args))
+        after = fetch_stats(args.port)
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+    result = report(args, before, after, clients)
+    if args.json:
+        print(json.dumps(without_nan(result), indent=2, allow_nan=False))
+    else:
+        print_report(result)
+
+
+if __name__ == "__main__":
+    main()
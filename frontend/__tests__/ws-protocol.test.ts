@@ -0,0 +1,45 @@
+import { describe, expect, it } from "vitest";
+
+import { buildWebSocketUrl, decodeAudioFrame } from "../src/connection/ws-protocol";
+
+function encodeAudioFrame(mimeType: string, rate: number, turn: number, pcm: number[]): ArrayBuffer {
+  const mime = new TextEncoder().encode(mimeType);
+  const buffer = new ArrayBuffer(12 + mime.length + pcm.length);
+  const view = new DataView(buffer);
+  view.setUint8(0, 1);
+  view.setUint8(1, 1);
+  view.setUint16(2, mime.length);
+  view.setUint32(4, rate);
+  view.setUint32(8, turn);
+  new Uint8Array(buffer, 12, mime.length).set(mime);
+  new Uint8Array(buffer, 12 + mime.length).set(pcm);
+  return buffer;
+}
+
+describe("buildWebSocketUrl", () => {
+  it("opts into binary audio and lean fields", () => {
+    expect(buildWebSocketUrl({ protocol: "https:", host: "example.com" }, "u", "s")).toBe(
+      "wss://example.com/ws/u/s?audio=binary&fields=lean"
+    );
+  });
+});
+
+describe("decodeAudioFrame", () => {
+  it("reads the header, mime type and PCM payload", () => {
+    const frame = decodeAudioFrame(encodeAudioFrame("audio/pcm;rate=24000", 24000, 3, [1, 2, 3, 4]));
+
+    expect(frame?.mimeType).toBe("audio/pcm;rate=24000");
+    expect(frame?.sampleRate).toBe(24000);
+    expect(frame?.turn).toBe(3);
+    expect(Array.from(new Uint8Array(frame?.pcm ?? new ArrayBuffer(0)))).toEqual([1, 2, 3, 4]);
+  });
+
+  it("rejects truncated frames and other kinds", () => {
+    const image = encodeAudioFrame("image/jpeg", 0, 0, [1]);
+    new DataView(image).setUint8(1, 2);
+
+    expect(decodeAudioFrame(new ArrayBuffer(4))).toBeNull();
+    expect(decodeAudioFrame(encodeAudioFrame("audio/pcm", 24000, 0, []).slice(0, 14))).toBeNull();
+    expect(decodeAudioFrame(image)).toBeNull();
+  });
+});
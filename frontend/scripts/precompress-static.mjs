@@ -0,0 +1,135 @@
+// Post-build step for app/static: prunes hashed bundles the current build no
+// longer emits and writes .br/.gz variants next to the compressible files it
+// did emit, so FastAPI can serve them without compressing per request.
+// Hand-maintained files (service-worker.js, the manifest, icons) are left
+// alone and get no variants, so an edit to them can never be shadowed by a
+// stale compressed copy.
+//
+// Vite passes the emitted file names (see vite.config.ts). Run standalone,
+// the emitted set is recovered by following references from index.html
+// through the files under assets/.
+//
+// Usage: node scripts/precompress-static.mjs [staticDir]   (default: ../app/static)
+import { existsSync, readdirSync, readFileSync, rmSync, statSync, writeFileSync } from "node:fs";
+import { dirname, extname, join, relative, resolve } from "node:path";
+import { fileURLToPath } from "node:url";
+import { brotliCompressSync, constants, gzipSync } from "node:zlib";
+
+const COMPRESSIBLE = new Set([".js", ".css", ".html", ".svg", ".webmanifest", ".json"]);
+const VARIANTS = [
+  [".br", (data) => brotliCompressSync(data, { params: { [constants.BROTLI_PARAM_QUALITY]: 11 } })],
+  [".gz", (data) => gzipSync(data, { level: 9 })]
+];
+// Not worth a variant below this size or if it saves less than 10%.
+const MIN_BYTES = 1024;
+const MIN_RATIO = 0.9;
+const ASSETS_PREFIX = "assets/";
+
+function walk(dir) {
+  if (!existsSync(dir)) {
+    return [];
+  }
+  return readdirSync(dir, { withFileTypes: true }).flatMap((entry) => {
+    const path = join(dir, entry.name);
+    return entry.isDirectory() ? walk(path) : [path];
+  });
+}
+
+function isVariant(path) {
+  return VARIANTS.some(([suffix]) => path.endsWith(suffix));
+}
+
+function relativeName(staticDir, path) {
+  return relative(staticDir, path).split("\\").join("/");
+}
+
+// Files under assets/ reachable from index.html. Hashed names are unique, so
+// a file counts as referenced when its base name appears in a kept file
+// (import specifiers, CSS url() and lazy chunk names alike).
+export function referencedAssets(staticDir) {
+  const assets = walk(join(staticDir, ASSETS_PREFIX))
+    .filter((path) => !isVariant(path))
+    .map((path) => relativeName(staticDir, path));
+  const emitted = new Set(["index.html"]);
+  const queue = ["index.html"];
+  while (queue.length > 0) {
+    const name = queue.pop();
+    if (!COMPRESSIBLE.has(extname(name))) {
+      continue;
+    }
+    const text = readFileSync(join(staticDir, name), "utf8");
+    for (const asset of assets) {
+      if (!emitted.has(asset) && text.includes(asset.slice(ASSETS_PREFIX.length))) {
+        emitted.add(asset);
+        queue.push(asset);
+      }
+    }
+  }
+  return emitted;
+}
+
+export function pruneStaleAssets(staticDir, emitted) {
+  const removed = [];
+  for (const path of walk(join(staticDir, ASSETS_PREFIX))) {
+    const source = isVariant(path) ? path.slice(0, -3) : path;
+    if (!emitted.has(relativeName(staticDir, source))) {
+      rmSync(path);
+      removed.push(path);
+    }
+  }
+  return removed;
+}
+
+export function precompressStatic(staticDir, emitted) {
+  const files = walk(staticDir);
+  const present = new Set(files);
+  const written = [];
+  for (const path of files) {
+    if (isVariant(path)) {
+      const source = path.slice(0, -3);
+      if (!present.has(source) || !emitted.has(relativeName(staticDir, source))) {
+        rmSync(path);
+      }
+      continue;
+    }
+    if (!emitted.has(relativeName(staticDir, path))) {
+      continue;
+    }
+    const stale = (suffix) => {
+      const variant = path + suffix;
+      if (present.has(variant)) {
+        rmSync(variant);
+      }
+    };
+    const stat = statSync(path);
+    if (!COMPRESSIBLE.has(extname(path)) || stat.size < MIN_BYTES) {
+      VARIANTS.forEach(([suffix]) => stale(suffix));
+      continue;
+    }
+    const data = readFileSync(path);
+    for (const [suffix, compress] of VARIANTS) {
+      const compressed = compress(data);
+      if (compressed.length > data.length * MIN_RATIO) {
+        stale(suffix);
+        continue;
+      }
+      writeFileSync(path + suffix, compressed);
+      written.push(path + suffix);
+    }
+  }
+  return written;
+}
+
+// emittedFiles: output file names relative to staticDir, e.g. the keys of
+// the bundle Vite passes to writeBundle.
+export function finalizeStatic(staticDir, emittedFiles) {
+  const emitted = emittedFiles ? new Set(emittedFiles) : referencedAssets(staticDir);
+  const removed = pruneStaleAssets(staticDir, emitted);
+  const written = precompressStatic(staticDir, emitted);
+  console.log(`static: pruned ${removed.length} stale files, wrote ${written.length} compressed variants`);
+}
+
+if (process.argv[1] === fileURLToPath(import.meta.url)) {
+  const here = dirname(fileURLToPath(import.meta.url));
+  finalizeStatic(resolve(process.argv[2] ?? join(here, "../../app/static")));
+}
@@ -5,6 +5,7 @@ import {
   getConnectionStateLabel,
   initialConnectionState
 } from "./connection/connection-state-machine";
+import { buildWebSocketUrl, decodeAudioFrame } from "./connection/ws-protocol";
 
 type LayoutMode = "desktop" | "tablet" | "mobile";
 type ConversationMessage = {
@@ -112,11 +113,6 @@ function isJsdomRuntime(): boolean {
   return typeof navigator !== "undefined" && /jsdom/i.test(navigator.userAgent);
 }
 
-function buildWebSocketUrl(userId: string, sessionId: string): string {
-  const protocol = window.location.protocol === "https:" ? "wss:" : "ws:";
-  return `${protocol}//${window.location.host}/ws/${userId}/${sessionId}`;
-}
-
 function decodeBase64ToArrayBuffer(base64: string): ArrayBuffer {
   const binary = window.atob(base64);
   const bytes = new Uint8Array(binary.length);
@@ -251,7 +247,7 @@ export function App(): JSX.Element {
   }, []);
 
   const playPcmAudioChunk = useCallback(
-    (base64Data: string, mimeType?: string): void => {
+    (rawBuffer: ArrayBuffer, mimeType?: string): void => {
       try {
         const sampleRate = parsePcmRate(mimeType, 24000);
         if (!audioOutputContextRef.current || audioOutputContextRef.current.sampleRate !== sampleRate) {
@@ -264,7 +260,6 @@ export function App(): JSX.Element {
           return;
         }
 
-        const rawBuffer = decodeBase64ToArrayBuffer(base64Data);
         const view = new DataView(rawBuffer);
         const sampleCount = Math.floor(view.byteLength / 2);
         const floatSamples = new Float32Array(sampleCount);
@@ -330,7 +325,7 @@ export function App(): JSX.Element {
             });
           }
           if (inlineData.mimeType?.startsWith("audio/pcm") && inlineData.data) {
-            playPcmAudioChunk(inlineData.data, inlineData.mimeType);
+            playPcmAudioChunk(decodeBase64ToArrayBuffer(inlineData.data), inlineData.mimeType);
             emitMockStreamEvent({
               kind: "audioOutput",
               chunkSize: inlineData.data.length
@@ -365,6 +360,22 @@ export function App(): JSX.Element {
     [emitMockStreamEvent, playPcmAudioChunk, resetAudioOutputPipeline]
   );
 
+  const handleAudioFrame = useCallback(
+    (buffer: ArrayBuffer): void => {
+      const frame = decodeAudioFrame(buffer);
+      if (!frame) {
+        appendEventLog("notification", "不明なバイナリフレーム", { size: buffer.byteLength });
+        return;
+      }
+      playPcmAudioChunk(frame.pcm, frame.mimeType);
+      emitMockStreamEvent({
+        kind: "audioOutput",
+        chunkSize: frame.pcm.byteLength
+      });
+    },
+    [appendEventLog, emitMockStreamEvent, playPcmAudioChunk]
+  );
+
   const openWebSocketConnection = useCallback((): void => {
       if (!liveModeEnabled) {
         return;
@@ -374,7 +385,7 @@ export function App(): JSX.Element {
       }
 
       isManualSocketCloseRef.current = false;
-      const ws = new WebSocket(buildWebSocketUrl(userIdRef.current, sessionIdRef.current));
+      const ws = new WebSocket(buildWebSocketUrl(window.location, userIdRef.current, sessionIdRef.current));
       ws.binaryType = "arraybuffer";
       websocketRef.current = ws;
 
@@ -382,9 +393,11 @@ export function App(): JSX.Element {
         dispatchConnectionEvent({ type: "CONNECTED" });
       };
 
-      ws.onmessage = (event: MessageEvent<string>) => {
+      ws.onmessage = (event: MessageEvent<string | ArrayBuffer>) => {
         if (typeof event.data === "string") {
           handleAdkMessage(event.data);
+        } else if (event.data instanceof ArrayBuffer) {
+          handleAudioFrame(event.data);
         }
       };
 
@@ -402,7 +415,7 @@ export function App(): JSX.Element {
         setReconnectScheduled(true);
       };
     },
-    [emitMockStreamEvent, handleAdkMessage, liveModeEnabled, stopAudioInputCapture]
+    [emitMockStreamEvent, handleAdkMessage, handleAudioFrame, liveModeEnabled, stopAudioInputCapture]
   );
 
   const closeWebSocketConnection = useCallback((): void => {
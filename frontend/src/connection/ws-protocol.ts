@@ -0,0 +1,44 @@
+// Downstream protocol negotiated with /ws (see app/streaming/frames.py and
+// app/streaming/downstream.py): output audio arrives as binary frames and
+// JSON events carry only the fields this client reads.
+export const WEBSOCKET_QUERY = "audio=binary&fields=lean";
+
+const FRAME_HEADER_BYTES = 12;
+const FRAME_VERSION = 1;
+const FRAME_KIND_AUDIO = 1;
+
+export type AudioFrame = {
+  mimeType: string;
+  sampleRate: number;
+  turn: number;
+  pcm: ArrayBuffer;
+};
+
+export function buildWebSocketUrl(location: Pick<Location, "protocol" | "host">, userId: string, sessionId: string): string {
+  const protocol = location.protocol === "https:" ? "wss:" : "ws:";
+  return `${protocol}//${location.host}/ws/${userId}/${sessionId}?${WEBSOCKET_QUERY}`;
+}
+
+// Header (big-endian): version u8, kind u8, mime length u16, rate u32, turn u32,
+// then the mime type and the PCM payload. Returns null for anything else.
+export function decodeAudioFrame(buffer: ArrayBuffer): AudioFrame | null {
+  if (buffer.byteLength < FRAME_HEADER_BYTES) {
+    return null;
+  }
+  const view = new DataView(buffer);
+  if (view.getUint8(0) !== FRAME_VERSION || view.getUint8(1) !== FRAME_KIND_AUDIO) {
+    return null;
+  }
+  const mimeLength = view.getUint16(2);
+  const payloadStart = FRAME_HEADER_BYTES + mimeLength;
+  if (buffer.byteLength < payloadStart) {
+    return null;
+  }
+  const mimeType = new TextDecoder("ascii").decode(new Uint8Array(buffer, FRAME_HEADER_BYTES, mimeLength));
+  return {
+    mimeType,
+    sampleRate: view.getUint32(4),
+    turn: view.getUint32(8),
+    pcm: buffer.slice(payloadStart)
+  };
+}
@@ -1,13 +1,30 @@
+import { fileURLToPath } from "node:url";
 import tailwindcss from "@tailwindcss/vite";
 import react from "@vitejs/plugin-react";
-import { defineConfig } from "vite";
+import { defineConfig, type Plugin } from "vite";
+import { finalizeStatic } from "./scripts/precompress-static.mjs";
+
+const staticDir = fileURLToPath(new URL("../app/static", import.meta.url));
+
+// emptyOutDir is off to keep service-worker.js and the icons, so hashed
+// bundles this build did not emit are pruned here and .br/.gz variants are
+// written for FastAPI.
+function finalizeStaticPlugin(): Plugin {
+  return {
+    name: "finalize-static",
+    apply: "build",
+    writeBundle(_options, bundle) {
+      finalizeStatic(staticDir, Object.keys(bundle));
+    }
+  };
+}
 
 export default defineConfig(({ command }) => ({
   // FastAPI serves static files under /static, so production asset URLs must be prefixed.
   base: command === "build" ? "/static/" : "/",
-  plugins: [react(), tailwindcss()],
+  plugins: [react(), tailwindcss(), finalizeStaticPlugin()],
   build: {
-    outDir: "../app/static/",
+    outDir: staticDir,
     emptyOutDir: false
   },
   test: {
@@ -0,0 +1,141 @@
+import asyncio
+import base64
+import json
+
+from google.adk.events import Event
+from google.genai import types
+
+from streaming.downstream import (
+    EVENT_KINDS,
+    DownstreamProfile,
+    PartialCoalescer,
+    encode_full,
+    encode_lean,
+)
+
+AUDIO = types.Part(inline_data=types.Blob(mime_type="audio/pcm;rate=24000", data=b"\x01\x02\xff"))
+
+
+def delta(text: str, field: str = "output_transcription") -> Event:
+    return Event(
+        author="agent",
+        partial=True,
+        **{field: types.Transcription(text=text, finished=False)},
+    )
+
+
+def audio() -> Event:
+    return Event(author="agent", content=types.Content(role="model", parts=[AUDIO]))
+
+
+def turn_complete() -> Event:
+    return Event(author="agent", turn_complete=True)
+
+
+def transcript(events: list[Event]) -> list[str]:
+    names = []
+    for event in events:
+        if event.output_transcription is not None:
+            names.append("out:" + event.output_transcription.text)
+        elif event.input_transcription is not None:
+            names.append("in:" + event.input_transcription.text)
+        elif event.turn_complete:
+            names.append("turn")
+        else:
+            names.append("audio")
+    return names
+
+
+def test_from_query_defaults_and_unknown_kinds():
+    assert DownstreamProfile.from_query(None, "full", 0).kinds == EVENT_KINDS
+    assert DownstreamProfile.from_query("bogus", "full", 0).kinds == EVENT_KINDS
+    profile = DownstreamProfile.from_query("audio, bogus,turn", "lean", 5000)
+    assert profile.kinds == {"audio", "turn"}
+    assert profile.lean
+    assert profile.partial_window_ms == 1000
+
+
+def test_filter_removes_unwanted_parts_and_drops_empty_events():
+    profile = DownstreamProfile.from_query("text,turn", "full", 0)
+    mixed = Event(
+        author="agent",
+        content=types.Content(role="model", parts=[AUDIO, types.Part(text="hi")]),
+    )
+    kept = profile.filter(mixed)
+    assert [part.text for part in kept.content.parts] == ["hi"]
+    assert profile.filter(audio()) is None
+    assert profile.filter(turn_complete()) is not None
+
+
+def test_filter_drops_partial_deltas_but_keeps_finished_transcriptions():
+    profile = DownstreamProfile.from_query("output", "full", 0)
+    assert profile.filter(delta("he")) is None
+    finished = Event(
+        author="agent",
+        output_transcription=types.Transcription(text="hello", finished=True),
+        custom_metadata={"k": "v"},
+    )
+    assert profile.filter(finished) is finished
+
+
+def test_coalescer_merges_deltas_and_keeps_turn_order():
+    coalescer = PartialCoalescer(window_ms=1000)
+    sent = []
+    for event in (delta("he"), delta("llo"), audio(), delta(" there"), turn_complete()):
+        sent += coalescer.push(event)
+    # Audio overtakes the pending delta; the turn boundary flushes it first.
+    assert transcript(sent) == ["audio", "out:hello there", "turn"]
+    assert coalescer.flush() is None
+
+
+def test_coalescer_flushes_when_the_transcription_field_changes():
+    coalescer = PartialCoalescer(window_ms=1000)
+    sent = []
+    for event in (delta("a"), delta("b"), delta("x", "input_transcription")):
+        sent += coalescer.push(event)
+    assert transcript(sent) == ["out:ab"]
+    assert transcript([coalescer.flush()]) == ["in:x"]
+
+
+def test_coalescer_is_a_passthrough_without_a_window():
+    coalescer = PartialCoalescer(window_ms=0)
+    assert transcript(coalescer.push(delta("a"))) == ["out:a"]
+
+
+def test_run_flusher_sends_a_pending_delta_after_the_window():
+    async def scenario():
+        coalescer = PartialCoalescer(window_ms=50)
+        sent = []
+
+        async def send(event):
+            sent.append(event)
+
+        flusher = asyncio.create_task(coalescer.run_flusher(send))
+        coalescer.push(delta("a"))
+        coalescer.push(delta("b"))
+        await asyncio.sleep(0.02)
+        before = list(sent)
+        await asyncio.sleep(0.1)
+        coalescer.close()
+        await asyncio.wait_for(flusher, 1)
+        return before, sent
+
+    before, sent = asyncio.run(scenario())
+    assert before == []
+    assert transcript(sent) == ["out:ab"]
+
+
+def test_lean_encoding_uses_standard_base64_and_matches_full_fields():
+    event = Event(
+        author="agent",
+        turn_complete=True,
+        content=types.Content(role="model", parts=[AUDIO, types.Part(text="hi")]),
+    )
+    lean = json.loads(encode_lean(event))
+    full = json.loads(encode_full(event))
+    assert lean["content"]["parts"][0]["inlineData"]["data"] == base64.b64encode(
+        b"\x01\x02\xff"
+    ).decode()
+    assert lean["content"]["parts"][1] == full["content"]["parts"][1]
+    assert lean["turnComplete"] is True
+    assert "invocationId" not in lean
@@ -0,0 +1,121 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from my_agent.image_cache import ImageCache, cache_key
+
+
+def slow_create(calls: list, delay: float = 0.1, value: str = "data"):
+    def create():
+        calls.append(threading.current_thread().name)
+        time.sleep(delay)
+        return value, "image/png"
+
+    return create
+
+
+def test_cache_key_ignores_case_and_whitespace():
+    assert cache_key("A  cat\n", "model", {}) == cache_key("a cat", "model", {})
+    assert cache_key("a cat", "model", {}) != cache_key("a dog", "model", {})
+
+
+def test_concurrent_requests_share_one_call():
+    async def scenario():
+        cache = ImageCache(max_bytes=1024)
+        calls = []
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = await asyncio.gather(
+                *(cache.get_or_create("k", slow_create(calls), executor) for _ in range(5))
+            )
+        return cache, calls, results
+
+    cache, calls, results = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert results == [("data", "image/png")] * 5
+    stats = cache.stats()
+    assert stats["misses"] == 1
+    assert stats["shared"] == 4
+
+
+def test_waiters_do_not_hold_executor_threads():
+    async def scenario():
+        cache = ImageCache(max_bytes=1024)
+        calls = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            started = time.monotonic()
+            await asyncio.gather(
+                *(cache.get_or_create("same", slow_create(calls, 0.3), executor) for _ in range(4)),
+                cache.get_or_create("other", slow_create(calls, 0.3), executor),
+            )
+            return time.monotonic() - started
+
+    # Duplicates wait on the event loop, so the other key gets the second worker.
+    assert asyncio.run(scenario()) < 0.55
+
+
+def test_cancelled_waiter_does_not_cancel_the_shared_call():
+    async def scenario():
+        cache = ImageCache(max_bytes=1024)
+        calls = []
+        first = asyncio.ensure_future(cache.get_or_create("k", slow_create(calls, 0.2)))
+        second = asyncio.ensure_future(cache.get_or_create("k", slow_create(calls, 0.2)))
+        await asyncio.sleep(0.05)
+        first.cancel()
+        result = await second
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        # The result was cached even though the caller that started it left.
+        again = await cache.get_or_create("k", slow_create(calls))
+        return calls, result, again, cache
+
+    calls, result, again, cache = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert result == again == ("data", "image/png")
+    assert cache.stats()["hits"] == 1
+
+
+def test_failures_are_not_cached():
+    async def scenario():
+        cache = ImageCache(max_bytes=1024)
+
+        def fail():
+            raise RuntimeError("quota")
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_create("k", fail)
+        return await cache.get_or_create("k", lambda: ("data", "image/png"))
+
+    assert asyncio.run(scenario()) == ("data", "image/png")
+
+
+def test_memory_tier_evicts_least_recently_used():
+    async def scenario():
+        cache = ImageCache(max_bytes=10)
+        for key in ("a", "b", "a", "c"):
+            await cache.get_or_create(key, lambda: ("xxxx", "image/png"))
+        return cache
+
+    cache = asyncio.run(scenario())
+    assert cache.size == 8
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_disk_tier_survives_restart_and_stays_bounded(tmp_path):
+    async def fill(cache, keys):
+        for key in keys:
+            await cache.get_or_create(key, lambda: ("x" * 100, "image/png"))
+
+    first = ImageCache(max_bytes=1024, directory=tmp_path, max_disk_bytes=400)
+    asyncio.run(fill(first, ["a", "b", "c", "d"]))
+    assert first.disk_size <= 400
+    assert len(list(tmp_path.glob("*.json"))) == first.stats()["diskEntries"]
+
+    second = ImageCache(max_bytes=1024, directory=tmp_path, max_disk_bytes=400)
+    calls = []
+    asyncio.run(second.get_or_create("d", slow_create(calls, 0)))
+    assert calls == []
+    assert second.stats()["diskHits"] == 1
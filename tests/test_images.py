@@ -0,0 +1,81 @@
+import asyncio
+import io
+
+import pytest
+
+from streaming import images
+from streaming.images import OUTPUT_MIME_TYPE, FramePreprocessor, ImagePreprocessConfig
+
+Image = pytest.importorskip("PIL.Image")
+ImageDraw = pytest.importorskip("PIL.ImageDraw")
+
+UNLIMITED = ImagePreprocessConfig(max_fps=0)
+
+
+def png(size=(64, 64), pattern: int = 0) -> bytes:
+    image = Image.new("RGB", size, "white")
+    draw = ImageDraw.Draw(image)
+    width, height = size
+    if pattern == 0:
+        draw.rectangle((0, 0, width // 2, height), fill="black")
+    else:
+        draw.rectangle((width // 2, 0, width, height), fill="black")
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def process(frames: FramePreprocessor, data: bytes, mime_type: str = "image/png"):
+    return asyncio.run(frames.process(data, mime_type))
+
+
+def test_frames_are_downsized_and_reencoded_as_jpeg():
+    frames = FramePreprocessor(ImagePreprocessConfig(max_dimension=32, max_fps=0))
+    data, mime_type = process(frames, png((128, 64)))
+    assert mime_type == OUTPUT_MIME_TYPE
+    assert Image.open(io.BytesIO(data)).size == (32, 16)
+    assert frames.stats()["sent"] == 1
+
+
+def test_frames_over_the_rate_limit_are_dropped(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(images.time, "monotonic", lambda: now[0])
+    frames = FramePreprocessor(ImagePreprocessConfig(max_fps=2))
+    assert process(frames, png(pattern=0)) is not None
+    now[0] += 0.2
+    assert process(frames, png(pattern=1)) is None
+    now[0] += 0.4
+    assert process(frames, png(pattern=1)) is not None
+    assert frames.stats()["droppedRate"] == 1
+
+
+def test_near_duplicate_frames_are_dropped():
+    frames = FramePreprocessor(UNLIMITED)
+    assert process(frames, png(pattern=0)) is not None
+    # Same picture, different size and encoding.
+    assert process(frames, png((96, 96), pattern=0)) is None
+    assert process(frames, png(pattern=1)) is not None
+    assert frames.stats()["droppedDuplicate"] == 1
+
+
+def test_undecodable_frames_are_dropped_as_invalid():
+    frames = FramePreprocessor(UNLIMITED)
+    assert process(frames, b"not an image at all", "image/jpeg") is None
+    stats = frames.stats()
+    assert stats["droppedInvalid"] == 1
+    assert stats["sent"] == 0
+
+
+def test_decompression_bombs_are_dropped_as_invalid(monkeypatch):
+    monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 100)
+    frames = FramePreprocessor(UNLIMITED)
+    assert process(frames, png((64, 64))) is None
+    assert frames.stats()["droppedInvalid"] == 1
+
+
+def test_without_pillow_only_exact_repeats_are_dropped(monkeypatch):
+    monkeypatch.setattr(images, "Image", None)
+    frames = FramePreprocessor(UNLIMITED)
+    assert process(frames, b"frame-1", "image/jpeg") == (b"frame-1", "image/jpeg")
+    assert process(frames, b"frame-1", "image/jpeg") is None
+    assert process(frames, b"frame-2", "image/jpeg") == (b"frame-2", "image/jpeg")
@@ -0,0 +1,116 @@
+import asyncio
+
+from google.adk.agents.live_request_queue import LiveRequestQueue
+
+from streaming.ingest import POLICY_DROP, POLICY_PAUSE, AudioIngest, IngestConfig
+
+# 16 kHz, 16-bit mono
+BYTES_PER_MS = 32
+
+
+def chunk(ms: int, fill: int = 0) -> bytes:
+    return bytes([fill]) * (ms * BYTES_PER_MS)
+
+
+def sent_blobs(queue: LiveRequestQueue) -> list[bytes]:
+    blobs = []
+    while not queue._queue.empty():
+        blobs.append(queue._queue.get_nowait().blob.data)
+    return blobs
+
+
+def test_tiny_chunks_are_joined_into_frames():
+    async def scenario():
+        queue = LiveRequestQueue()
+        ingest = AudioIngest(queue, IngestConfig(frame_ms=40))
+        for _ in range(10):
+            await ingest.push(chunk(10))
+        return sent_blobs(queue), ingest
+
+    blobs, ingest = asyncio.run(scenario())
+    assert [len(blob) for blob in blobs] == [40 * BYTES_PER_MS] * 2
+    assert ingest.buffered_bytes == 20 * BYTES_PER_MS
+
+
+def test_chunks_of_a_frame_or_more_are_forwarded_whole():
+    async def scenario():
+        queue = LiveRequestQueue()
+        ingest = AudioIngest(queue, IngestConfig(frame_ms=40))
+        for index in range(10):
+            await ingest.push(chunk(128, index))
+        return sent_blobs(queue), ingest
+
+    blobs, ingest = asyncio.run(scenario())
+    assert blobs == [chunk(128, index) for index in range(10)]
+    assert ingest.buffered_bytes == 0
+    assert ingest.sent_frames == 10
+
+
+def test_pending_tiny_audio_goes_out_before_a_large_chunk():
+    async def scenario():
+        queue = LiveRequestQueue()
+        ingest = AudioIngest(queue, IngestConfig(frame_ms=40))
+        await ingest.push(chunk(10, 1))
+        await ingest.push(chunk(128, 2))
+        return sent_blobs(queue)
+
+    assert asyncio.run(scenario()) == [chunk(10, 1), chunk(128, 2)]
+
+
+def test_flush_forwards_partial_frame():
+    async def scenario():
+        queue = LiveRequestQueue()
+        ingest = AudioIngest(queue, IngestConfig(frame_ms=40))
+        await ingest.push(chunk(10))
+        before = sent_blobs(queue)
+        ingest.flush()
+        return before, sent_blobs(queue)
+
+    before, after = asyncio.run(scenario())
+    assert before == []
+    assert after == [chunk(10)]
+
+
+def test_drop_policy_discards_oldest_audio_when_queue_is_full():
+    async def scenario():
+        queue = LiveRequestQueue()
+        config = IngestConfig(
+            frame_ms=40, max_buffer_ms=100, max_queue_depth=1, policy=POLICY_DROP
+        )
+        ingest = AudioIngest(queue, config)
+        for index in range(5):
+            await ingest.push(chunk(40, index))
+        return sent_blobs(queue), ingest
+
+    blobs, ingest = asyncio.run(scenario())
+    # One frame fits in the queue; two more fit in the 100 ms buffer.
+    assert blobs == [chunk(40, 0)]
+    assert ingest.dropped_bytes == 2 * 40 * BYTES_PER_MS
+    assert ingest.buffered_bytes == 2 * 40 * BYTES_PER_MS
+
+
+def test_pause_policy_waits_for_the_queue_and_close_releases_it():
+    async def scenario():
+        queue = LiveRequestQueue()
+        config = IngestConfig(
+            frame_ms=40, max_buffer_ms=40, max_queue_depth=1, policy=POLICY_PAUSE
+        )
+        ingest = AudioIngest(queue, config)
+        await ingest.push(chunk(40, 0))
+        await ingest.push(chunk(40, 1))
+        paused = asyncio.create_task(ingest.push(chunk(40, 2)))
+        await asyncio.sleep(0.1)
+        assert not paused.done()
+        assert sent_blobs(queue) == [chunk(40, 0)]
+        # The queue drained: the pending frame goes out and push() returns.
+        await asyncio.wait_for(paused, 1)
+        blocked = asyncio.create_task(ingest.push(chunk(40, 3)))
+        await asyncio.sleep(0.1)
+        assert not blocked.done()
+        ingest.close()
+        await asyncio.wait_for(blocked, 1)
+        return ingest
+
+    ingest = asyncio.run(scenario())
+    assert ingest.pauses == 2
+    assert ingest.dropped_bytes == 0
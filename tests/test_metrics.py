@@ -0,0 +1,65 @@
+import pytest
+
+from streaming.metrics import Counter, Gauge, Histogram, Registry
+
+
+def render(*metrics) -> list[str]:
+    registry = Registry()
+    for metric in metrics:
+        registry.register(metric)
+    return registry.render().splitlines()
+
+
+def test_unlabelled_metrics_render_their_values():
+    counter = Counter("c_total", "A counter.")
+    gauge = Gauge("g", "A gauge.")
+    counter.inc()
+    counter.inc(2)
+    gauge.set(5)
+    gauge.dec()
+    lines = render(counter, gauge)
+    assert "c_total 3" in lines
+    assert "g 4" in lines
+
+
+def test_labelled_metrics_must_be_updated_through_labels():
+    counter = Counter("c_total", "A counter.", ["reason"])
+    histogram = Histogram("h_seconds", "A histogram.", [1.0], ["mode"])
+    with pytest.raises(ValueError, match="labels"):
+        counter.inc()
+    with pytest.raises(ValueError, match="labels"):
+        histogram.observe(0.5)
+    with pytest.raises(ValueError, match="labels"):
+        Gauge("g", "A gauge.", ["kind"]).set_function(lambda: 1)
+    with pytest.raises(ValueError, match="expects labels"):
+        counter.labels("a", "b")
+    with pytest.raises(ValueError, match="expects labels"):
+        Counter("u_total", "Unlabelled.").labels("a")
+
+
+def test_label_values_and_help_are_escaped():
+    counter = Counter("c_total", 'Help with \\ and\nnewline.', ["reason"])
+    counter.labels('say "hi"\\\n').inc()
+    lines = render(counter)
+    assert lines[0] == "# HELP c_total Help with \\\\ and\\nnewline."
+    assert lines[2] == 'c_total{reason="say \\"hi\\"\\\\\\n"} 1'
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("h_seconds", "A histogram.", [0.5, 1.0], ["mode"])
+    child = histogram.labels("cold")
+    for value in (0.2, 0.7, 3.0):
+        child.observe(value)
+    lines = render(histogram)
+    assert 'h_seconds_bucket{mode="cold",le="0.5"} 1' in lines
+    assert 'h_seconds_bucket{mode="cold",le="1"} 2' in lines
+    assert 'h_seconds_bucket{mode="cold",le="+Inf"} 3' in lines
+    assert 'h_seconds_count{mode="cold"} 3' in lines
+
+
+def test_gauge_function_is_read_at_scrape_time():
+    value = [1]
+    gauge = Gauge("g", "A gauge.")
+    gauge.set_function(lambda: value[0])
+    value[0] = 7
+    assert "g 7" in render(gauge)
@@ -0,0 +1,29 @@
+import time
+
+from streaming.resumption import ResumptionStore
+
+
+def test_update_after_disconnect_keeps_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    store = ResumptionStore(grace_seconds=30)
+    store.update("user", "session", "first")
+    store.disconnected("user", "session")
+    # A handle that arrives after the client left must not live forever.
+    store.update("user", "session", "late")
+    now[0] += 31
+    assert store.handle_for("user", "session") is None
+    assert len(store) == 0
+
+
+def test_reconnect_within_grace_returns_latest_handle(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    store = ResumptionStore(grace_seconds=30)
+    store.update("user", "session", "first")
+    store.update("user", "session", "second")
+    store.disconnected("user", "session")
+    now[0] += 10
+    assert store.handle_for("user", "session") == "second"
+    now[0] += 60
+    assert store.handle_for("user", "session") == "second"
@@ -0,0 +1,81 @@
+import importlib
+import json
+
+import pytest
+from starlette.testclient import TestClient
+
+from fake_live import FakeLiveRunner, Script
+
+
+class RecordingRunner(FakeLiveRunner):
+    """Records the resumption handle each run_live() call was given."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.requested_handles: list = []
+
+    def run_live(self, *, run_config=None, **kwargs):
+        resumption = getattr(run_config, "session_resumption", None)
+        self.requested_handles.append(resumption.handle if resumption else None)
+        return super().run_live(run_config=run_config, **kwargs)
+
+
+@pytest.fixture
+def app_main(monkeypatch):
+    # Never reach Google APIs from the tests.
+    monkeypatch.setenv("GOOGLE_GENAI_USE_VERTEXAI", "FALSE")
+    monkeypatch.setenv("GOOGLE_API_KEY", "offline-test")
+    main = importlib.import_module("main")
+    runner = RecordingRunner(
+        Script(turn_ms=200, pause_ms=100),
+        app_name=main.APP_NAME,
+        session_service=main.session_service,
+    )
+    monkeypatch.setattr(main, "runner", runner)
+    return main, runner
+
+
+def failed_resumptions(main) -> float:
+    prefix = 'adk_live_resumptions_total{result="failure"} '
+    for line in main.metrics.REGISTRY.render().splitlines():
+        if line.startswith(prefix):
+            return float(line[len(prefix):])
+    return 0.0
+
+
+def receive_handle(websocket) -> str:
+    while True:
+        message = websocket.receive()
+        if message.get("text") is None:
+            continue
+        update = json.loads(message["text"]).get("liveSessionResumptionUpdate")
+        if update and update.get("newHandle"):
+            return update["newHandle"]
+
+
+def test_reconnect_resumes_with_the_stored_handle(app_main):
+    main, runner = app_main
+    client = TestClient(main.app)
+    with client.websocket_connect("/ws/user/resume-1") as websocket:
+        handle = receive_handle(websocket)
+    with client.websocket_connect("/ws/user/resume-1") as websocket:
+        receive_handle(websocket)
+
+    assert runner.requested_handles == [None, handle]
+    assert runner.cold_starts == 1
+    assert runner.resumed_starts == 1
+
+
+def test_unknown_handle_falls_back_to_a_cold_start(app_main):
+    main, runner = app_main
+    main.resumption_store.update("user", "resume-2", "expired-handle")
+    failures = failed_resumptions(main)
+    client = TestClient(main.app)
+    with client.websocket_connect("/ws/user/resume-2") as websocket:
+        handle = receive_handle(websocket)
+
+    assert runner.requested_handles == ["expired-handle", None]
+    assert runner.failed_resumptions == 1
+    assert runner.cold_starts == 1
+    assert failed_resumptions(main) == failures + 1
+    assert main.resumption_store.handle_for("user", "resume-2") == handle
@@ -0,0 +1,118 @@
+import asyncio
+
+from google.adk.events import Event
+from google.genai import types
+
+from session_store.bounded import BoundedSessionService
+from session_store.sqlite import SqliteBackedSessionService
+
+APP = "app"
+USER = "user"
+
+
+def text_event(text: str) -> Event:
+    return Event(
+        author="user",
+        invocation_id="inv",
+        content=types.Content(role="user", parts=[types.Part(text=text)]),
+    )
+
+
+def audio_event(*, with_transcription: bool = False) -> Event:
+    blob = types.Blob(mime_type="audio/pcm;rate=24000", data=b"\x00" * 4800)
+    return Event(
+        author="agent",
+        invocation_id="inv",
+        content=types.Content(role="model", parts=[types.Part(inline_data=blob)]),
+        output_transcription=(
+            types.Transcription(text="hello", finished=True) if with_transcription else None
+        ),
+    )
+
+
+async def add_session(service, session_id: str, *texts: str) -> None:
+    session = await service.create_session(app_name=APP, user_id=USER, session_id=session_id)
+    for text in texts:
+        await service.append_event(session, text_event(text))
+
+
+def test_least_recently_used_session_is_evicted_over_budget():
+    async def scenario():
+        service = BoundedSessionService(ttl_seconds=3600, max_bytes=3000)
+        await add_session(service, "old", "x" * 1000)
+        await add_session(service, "new", "y" * 1000)
+        await add_session(service, "newest", "z" * 1000)
+        assert await service.get_session(app_name=APP, user_id=USER, session_id="old") is None
+        assert await service.get_session(app_name=APP, user_id=USER, session_id="newest")
+        assert service.evictions >= 1
+        assert service.total_bytes <= 3000
+
+    asyncio.run(scenario())
+
+
+def test_pinned_session_is_not_evicted():
+    async def scenario():
+        service = BoundedSessionService(ttl_seconds=3600, max_bytes=2000)
+        await add_session(service, "pinned", "x" * 1000)
+        service.acquire(app_name=APP, user_id=USER, session_id="pinned")
+        await add_session(service, "other", "y" * 1000)
+        await add_session(service, "another", "z" * 1000)
+        assert await service.get_session(app_name=APP, user_id=USER, session_id="pinned")
+
+    asyncio.run(scenario())
+
+
+def test_audio_only_events_are_not_kept_in_history():
+    async def scenario():
+        service = BoundedSessionService(ttl_seconds=3600, max_bytes=1 << 20)
+        session = await service.create_session(app_name=APP, user_id=USER, session_id="s")
+        await service.append_event(session, audio_event())
+        await service.append_event(session, audio_event(with_transcription=True))
+        stored = await service.get_session(app_name=APP, user_id=USER, session_id="s")
+        assert len(stored.events) == 1
+        kept = stored.events[0]
+        assert kept.output_transcription.text == "hello"
+        assert not (kept.content and kept.content.parts)
+
+    asyncio.run(scenario())
+
+
+def test_sqlite_sessions_reload_after_restart(tmp_path):
+    db_path = str(tmp_path / "sessions.db")
+
+    async def write():
+        service = SqliteBackedSessionService(db_path, ttl_seconds=3600, max_bytes=1 << 20)
+        await add_session(service, "s", "first", "second")
+        await service.close()
+
+    async def read():
+        service = SqliteBackedSessionService(db_path, ttl_seconds=3600, max_bytes=1 << 20)
+        session = await service.get_session(app_name=APP, user_id=USER, session_id="s")
+        listed = await service.list_sessions(app_name=APP, user_id=USER)
+        await service.close()
+        return session, listed
+
+    asyncio.run(write())
+    session, listed = asyncio.run(read())
+    assert [event.content.parts[0].text for event in session.events] == ["first", "second"]
+    assert [s.id for s in listed.sessions] == ["s"]
+
+
+def test_sqlite_loads_session_larger_than_memory_budget(tmp_path):
+    db_path = str(tmp_path / "sessions.db")
+
+    async def write():
+        service = SqliteBackedSessionService(db_path, ttl_seconds=3600, max_bytes=1 << 20)
+        await add_session(service, "big", "x" * 5000)
+        await service.close()
+
+    async def reopen():
+        service = SqliteBackedSessionService(db_path, ttl_seconds=3600, max_bytes=1000)
+        session = await service.get_session(app_name=APP, user_id=USER, session_id="big")
+        await service.close()
+        return session
+
+    asyncio.run(write())
+    session = asyncio.run(reopen())
+    assert session is not None
+    assert len(session.events) == 1
@@ -0,0 +1,101 @@
+import gzip
+import os
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount, Route
+from starlette.testclient import TestClient
+
+from web.static import IMMUTABLE, REVALIDATE, EntryFile, PrecompressedStaticFiles, accepted_encodings
+
+SCRIPT = b"console.log('hello');\n" * 200
+BR = {"accept-encoding": "gzip, br"}
+
+
+def write(path, data: bytes, mtime_ns: int):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    source = tmp_path / "assets" / "index-abc.js"
+    write(source, SCRIPT, 2_000_000_000_000_000_000)
+    write(source.with_name("index-abc.js.br"), b"br-bytes", 2_000_000_000_000_000_000)
+    write(source.with_name("index-abc.js.gz"), gzip.compress(SCRIPT), 2_000_000_000_000_000_000)
+    write(tmp_path / "service-worker.js", SCRIPT, 2_000_000_000_000_000_000)
+    return tmp_path
+
+
+@pytest.fixture
+def client(static_dir):
+    entry = EntryFile(static_dir / "service-worker.js", "application/javascript")
+    app = Starlette(
+        routes=[
+            Route("/service-worker.js", lambda request: entry.response(request)),
+            Mount("/static", PrecompressedStaticFiles(directory=static_dir)),
+        ]
+    )
+    return TestClient(app)
+
+
+def test_accepted_encodings_honours_q_values():
+    assert accepted_encodings("gzip;q=0, br;q=0.5, identity") == {"br", "identity"}
+    assert accepted_encodings(None) == set()
+
+
+def test_hashed_assets_prefer_brotli_and_are_immutable(client):
+    response = client.get("/static/assets/index-abc.js", headers=BR)
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["cache-control"] == IMMUTABLE
+    assert response.headers["vary"] == "Accept-Encoding"
+
+    gzipped = client.get("/static/assets/index-abc.js", headers={"accept-encoding": "gzip"})
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.content == SCRIPT
+
+    plain = client.get("/static/assets/index-abc.js", headers={"accept-encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.content == SCRIPT
+
+
+def test_variant_older_than_its_source_is_ignored(client, static_dir):
+    os.utime(static_dir / "assets" / "index-abc.js.br", ns=(1, 1))
+    response = client.get("/static/assets/index-abc.js", headers=BR)
+    assert response.headers["content-encoding"] == "gzip"
+
+
+def test_static_files_answer_304_for_a_matching_etag(client):
+    first = client.get("/static/assets/index-abc.js", headers=BR)
+    again = client.get(
+        "/static/assets/index-abc.js", headers={**BR, "if-none-match": first.headers["etag"]}
+    )
+    assert again.status_code == 304
+
+
+def test_entry_file_is_revalidated_and_compressed_in_memory(client):
+    response = client.get("/service-worker.js", headers=BR)
+    assert response.headers["cache-control"] == REVALIDATE
+    # No variant on disk: gzip is produced in memory.
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == SCRIPT
+    etag = response.headers["etag"]
+    assert client.get("/service-worker.js", headers={**BR, "if-none-match": etag}).status_code == 304
+    # The identity body has its own ETag.
+    plain = client.get(
+        "/service-worker.js", headers={"accept-encoding": "identity", "if-none-match": etag}
+    )
+    assert plain.status_code == 200
+
+
+def test_entry_file_reloads_on_change_and_skips_stale_variants(client, static_dir):
+    sw = static_dir / "service-worker.js"
+    before = client.get("/service-worker.js", headers=BR).headers["etag"]
+    write(sw.with_name("service-worker.js.br"), b"stale", 1)
+    write(sw, SCRIPT + b"// edited\n", 2_000_000_000_000_000_001)
+
+    response = client.get("/service-worker.js", headers=BR)
+    assert response.headers["etag"] != before
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content.endswith(b"// edited\n")